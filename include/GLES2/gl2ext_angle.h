@@ -652,6 +652,14 @@ GL_APICALL void GL_APIENTRY glMultiDrawElementsInstancedANGLE (GLenum mode, cons
 #endif
 #endif /* GL_ANGLE_multi_draw */
 
+#ifndef GL_ANGLE_batch_commands
+#define GL_ANGLE_batch_commands 1
+typedef void (GL_APIENTRYP PFNGLBATCHCOMMANDSANGLEPROC) (GLsizei size, const GLuint64 *commands);
+#ifdef GL_GLEXT_PROTOTYPES
+GL_APICALL void GL_APIENTRY glBatchCommandsANGLE (GLsizei size, const GLuint64 *commands);
+#endif
+#endif /* GL_ANGLE_batch_commands */
+
 #ifndef GL_CHROMIUM_bind_uniform_location
 #define GL_CHROMIUM_bind_uniform_location 1
 typedef void (GL_APIENTRYP PFNGLBINDUNIFORMLOCATIONCHROMIUMPROC)(GLuint program, GLint location, const GLchar *name);
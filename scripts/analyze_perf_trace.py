@@ -0,0 +1,274 @@
+#!/usr/bin/python2
+#
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# analyze_perf_trace.py:
+#   Summarizes the trace events that angle_perftests writes with --enable-trace. The trace is
+#   read in chunks and each event is parsed on its own, so that huge traces don't have to fit in
+#   memory. Prints the total and self time of each event name, how long the CPU and GPU threads
+#   were busy at the same time, and the percentiles of the frame times, measured between the
+#   begin events of --frame-event. With a second trace, prints the differences between the two.
+
+import argparse
+import collections
+import json
+import os
+import re
+import sys
+
+import perf_test_runner
+
+default_frame_event = 'egl::Surface::swap'
+frame_percentiles = [50, 90, 99]
+
+# The characters that change the nesting of the JSON text.
+json_token_pattern = re.compile(r'[{}\[\]"\\]')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(os.path.basename(sys.argv[0]))
+    parser.add_argument('trace', help='trace written by angle_perftests --enable-trace')
+    parser.add_argument('other_trace', nargs='?', help='trace to compare the first one with')
+    parser.add_argument('--frame-event', default=default_frame_event,
+                        help='event starting each frame. (default: %s)' % default_frame_event)
+    parser.add_argument('-s', '--sort', choices=['self', 'total', 'count'], default='self',
+                        help='order of the events. (default: self)')
+    parser.add_argument('-n', '--top', type=int, default=30,
+                        help='number of events to print, 0 for all. (default: 30)')
+    return parser.parse_args()
+
+
+# Yields the objects of the trace that have a phase, without parsing the rest of the file.
+def iter_trace_events(path, chunk_size=1 << 20):
+    containers = []
+    in_string = False
+    event_chunks = None
+
+    # The position in the chunk of the character escaped by a backslash.
+    escaped_position = None
+
+    with open(path) as trace_file:
+        for chunk in iter(lambda: trace_file.read(chunk_size), ''):
+            event_start = 0 if event_chunks is not None else None
+            for token in json_token_pattern.finditer(chunk):
+                if token.start() == escaped_position:
+                    continue
+                char = token.group()
+                if char == '\\':
+                    escaped_position = token.end() if in_string else None
+                    continue
+                if char == '"':
+                    in_string = not in_string
+                    continue
+                if in_string:
+                    continue
+
+                if char in '{[':
+                    # Events are the objects in the array of the root object, or in the root
+                    # array.
+                    if char == '{' and containers[-1:] == ['['] and len(containers) <= 2:
+                        event_chunks = []
+                        event_start = token.start()
+                    containers.append(char)
+                    continue
+
+                containers.pop()
+                if char == '}' and event_chunks is not None and containers[-1:] == ['['] and \
+                        len(containers) <= 2:
+                    event_chunks.append(chunk[event_start:token.end()])
+                    event = json.loads(''.join(event_chunks))
+                    event_chunks = None
+                    if 'ph' in event:
+                        yield event
+
+            if escaped_position is not None:
+                escaped_position -= len(chunk)
+            if event_chunks is not None:
+                event_chunks.append(chunk[event_start:])
+
+
+class TraceSummary:
+    """Times of the events of a trace, in microseconds."""
+
+    def __init__(self):
+        self.total = collections.defaultdict(float)
+        self.self_time = collections.defaultdict(float)
+        self.count = collections.defaultdict(int)
+        self.busy = collections.defaultdict(list)
+        self.frame_starts = []
+
+    def add_event(self, name, thread, begin, end, child_time, nested):
+        duration = end - begin
+        self.total[name] += duration
+        self.self_time[name] += duration - child_time
+        self.count[name] += 1
+        if not nested:
+            self.busy[thread].append((begin, end))
+
+    def get_frame_times(self):
+        starts = sorted(self.frame_starts)
+        return [end - begin for begin, end in zip(starts, starts[1:])]
+
+    def get_busy_time(self, thread):
+        return sum(end - begin for begin, end in merge_intervals(self.busy[thread]))
+
+    def get_overlap_time(self):
+        return intersect_time(merge_intervals(self.busy['CPU']), merge_intervals(self.busy['GPU']))
+
+
+def merge_intervals(intervals):
+    merged = []
+    for begin, end in sorted(intervals):
+        if merged and begin <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((begin, end))
+    return merged
+
+
+def intersect_time(a, b):
+    overlap = 0.0
+    a_index = 0
+    b_index = 0
+    while a_index < len(a) and b_index < len(b):
+        overlap += max(0.0, min(a[a_index][1], b[b_index][1]) - max(a[a_index][0], b[b_index][0]))
+        if a[a_index][1] < b[b_index][1]:
+            a_index += 1
+        else:
+            b_index += 1
+    return overlap
+
+
+def summarize_trace(path, frame_event):
+    summary = TraceSummary()
+
+    # The open begin events of each thread, as [name, begin, child time].
+    stacks = collections.defaultdict(list)
+    for event in iter_trace_events(path):
+        phase = event['ph']
+        thread = str(event.get('tid', ''))
+        timestamp = float(event.get('ts', 0))
+        stack = stacks[thread]
+
+        if phase == 'B':
+            stack.append([event.get('name', ''), timestamp, 0.0])
+            if event.get('name') == frame_event and thread != 'GPU':
+                summary.frame_starts.append(timestamp)
+        elif phase == 'E' and stack:
+            name, begin, child_time = stack.pop()
+            summary.add_event(name, thread, begin, timestamp, child_time, bool(stack))
+            if stack:
+                stack[-1][2] += timestamp - begin
+        elif phase == 'X':
+            duration = float(event.get('dur', 0))
+            summary.add_event(event.get('name', ''), thread, timestamp, timestamp + duration, 0.0,
+                              False)
+
+    return summary
+
+
+def format_ms(microseconds):
+    return '%.3f' % (microseconds / 1000.0)
+
+
+def format_delta(before, after):
+    if before == 0:
+        return ''
+    return '%+.2f%%' % ((float(after) / before - 1.0) * 100.0)
+
+
+def get_frame_stats(summary):
+    frame_times = sorted(summary.get_frame_times())
+    if not frame_times:
+        return []
+    stats = [('frames', len(frame_times) + 1, str),
+             ('mean frame time ms', perf_test_runner.mean(frame_times), format_ms)]
+    for fraction in frame_percentiles:
+        stats.append(('p%d frame time ms' % fraction,
+                      perf_test_runner.percentile(frame_times, fraction / 100.0), format_ms))
+    stats.append(('max frame time ms', frame_times[-1], format_ms))
+    return stats
+
+
+def get_thread_stats(summary):
+    cpu_busy = summary.get_busy_time('CPU')
+    gpu_busy = summary.get_busy_time('GPU')
+    overlap = summary.get_overlap_time()
+    stats = [('CPU busy ms', cpu_busy, format_ms), ('GPU busy ms', gpu_busy, format_ms),
+             ('CPU/GPU overlap ms', overlap, format_ms)]
+    if gpu_busy > 0:
+        stats.append(('GPU busy while CPU busy', overlap / gpu_busy * 100.0, lambda value: '%.1f%%' % value))
+    return stats
+
+
+def get_ordered_names(summary, sort, top):
+    keys = {'self': summary.self_time, 'total': summary.total, 'count': summary.count}[sort]
+    names = sorted(keys, key=lambda name: keys[name], reverse=True)
+    return names[:top] if top else names
+
+
+def print_summary(summary, args):
+    rows = [[name, str(summary.count[name]), format_ms(summary.total[name]),
+             format_ms(summary.self_time[name])]
+            for name in get_ordered_names(summary, args.sort, args.top)]
+    perf_test_runner.print_table(['event', 'count', 'total ms', 'self ms'], rows)
+
+    print('')
+    stats = get_thread_stats(summary) + get_frame_stats(summary)
+    perf_test_runner.print_table(['statistic', 'value'],
+                                 [[name, format_value(value)] for name, value, format_value in stats])
+
+
+def print_diff(summary, other, args):
+    names = get_ordered_names(summary, args.sort, 0)
+    names += [name for name in get_ordered_names(other, args.sort, 0) if name not in summary.count]
+
+    # Show the events that changed the most first.
+    def change(name):
+        return abs(other.self_time[name] - summary.self_time[name])
+
+    names = sorted(names, key=change, reverse=True)
+    if args.top:
+        names = names[:args.top]
+
+    rows = []
+    for name in names:
+        rows.append([name, str(summary.count[name]), str(other.count[name]),
+                     format_ms(summary.self_time[name]), format_ms(other.self_time[name]),
+                     format_delta(summary.self_time[name], other.self_time[name]),
+                     format_ms(summary.total[name]), format_ms(other.total[name]),
+                     format_delta(summary.total[name], other.total[name])])
+    perf_test_runner.print_table(['event', 'count A', 'count B', 'self ms A', 'self ms B',
+                                  'self delta', 'total ms A', 'total ms B', 'total delta'], rows)
+
+    print('')
+    stats = get_thread_stats(summary) + get_frame_stats(summary)
+    other_stats = dict((name, value) for name, value, format_value in
+                       get_thread_stats(other) + get_frame_stats(other))
+    rows = []
+    for name, value, format_value in stats:
+        if name in other_stats:
+            rows.append([name, format_value(value), format_value(other_stats[name]),
+                         format_delta(value, other_stats[name])])
+    perf_test_runner.print_table(['statistic', 'A', 'B', 'delta'], rows)
+
+
+def main():
+    args = parse_args()
+    for path in [args.trace, args.other_trace]:
+        if path and not os.path.exists(path):
+            print('Cannot find %s!' % path)
+            return 1
+
+    summary = summarize_trace(args.trace, args.frame_event)
+    if args.other_trace:
+        print_diff(summary, summarize_trace(args.other_trace, args.frame_event), args)
+    else:
+        print_summary(summary, args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
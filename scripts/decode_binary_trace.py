@@ -0,0 +1,134 @@
+#!/usr/bin/python2
+#
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# decode_binary_trace.py:
+#   Prints the GL calls of a binary trace written by an angle_enable_binary_trace build. See
+#   src/libGLESv2/binary_trace.h for the file format. The parameters are named and formatted from
+#   gl.xml and gl_angle_ext.xml.
+
+import argparse
+import os
+import struct
+import sys
+
+import registry_xml
+
+magic = 0x52544241
+version = 1
+
+signed_types = ["GLclampx", "GLfixed", "GLint", "GLint64", "GLintptr", "GLshort", "GLsizei",
+                "GLsizeiptr"]
+hex_types = ["GLbitfield", "GLclampx", "GLenum", "GLfixed"]
+float_types = ["GLclampf", "GLfloat"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(os.path.basename(sys.argv[0]))
+    parser.add_argument('trace_file', help='trace written to ANGLE_BINARY_TRACE_FILE')
+    parser.add_argument('-t', '--thread', type=int, help='only print the calls of this thread')
+    parser.add_argument('-e', '--entry-point', action='append', default=[],
+                        help='only print the calls of this entry point, e.g. DrawArrays')
+    return parser.parse_args()
+
+
+class Reader:
+    def __init__(self, data):
+        self.data = data
+        self.position = 0
+
+    def done(self):
+        return self.position >= len(self.data)
+
+    def read(self, fmt):
+        values = struct.unpack_from('<' + fmt, self.data, self.position)
+        self.position += struct.calcsize('<' + fmt)
+        return values
+
+    def read_string(self):
+        end = self.data.index('\0', self.position)
+        string = self.data[self.position:end]
+        self.position = end + 1
+        return string
+
+
+# Returns the parameters of each command as (name, type, is_pointer) tuples.
+def get_command_params():
+    xml = registry_xml.RegistryXML('gl.xml', 'gl_angle_ext.xml')
+    command_params = {}
+    for command in xml.all_commands:
+        name = command.find('proto/name').text
+        params = []
+        for param in command.findall('param'):
+            text = ''.join(param.itertext())
+            ptype = param.find('ptype')
+            params.append((param.find('name').text, ptype.text if ptype is not None else 'void',
+                           '*' in text))
+        command_params[name] = params
+    return command_params
+
+
+def format_param(value, param_type, is_pointer):
+    if is_pointer:
+        return '0x%016x' % value
+    if param_type in float_types:
+        return '%f' % struct.unpack('<f', struct.pack('<I', value & 0xFFFFFFFF))[0]
+    if param_type in hex_types:
+        return '0x%X' % (value & 0xFFFFFFFF)
+    if param_type in signed_types:
+        return '%d' % (value - (1 << 64) if value >= 1 << 63 else value)
+    return '%u' % value
+
+
+def format_call(entry_point, params, command_params):
+    known_params = command_params.get('gl' + entry_point)
+    if known_params is None or len(known_params) != len(params):
+        return '%s(%s)' % (entry_point, ', '.join(['0x%x' % value for value in params]))
+
+    formatted = ['%s = %s' % (name, format_param(value, param_type, is_pointer))
+                 for value, (name, param_type, is_pointer) in zip(params, known_params)]
+    return 'gl%s(%s)' % (entry_point, ', '.join(formatted))
+
+
+def main():
+    args = parse_args()
+
+    with open(args.trace_file, 'rb') as trace_file:
+        reader = Reader(trace_file.read())
+
+    file_magic, file_version, entry_point_count = reader.read('III')
+    if file_magic != magic or file_version != version:
+        print('%s is not a binary trace of a supported version' % args.trace_file)
+        return 1
+
+    entry_point_names = [reader.read_string() for index in range(entry_point_count)]
+    command_params = get_command_params()
+
+    # Merge the calls of all the threads in time order.
+    calls = []
+    while not reader.done():
+        thread_index, record_count = reader.read('II')
+        for record in range(record_count):
+            entry_point, param_count, time_ns = reader.read('HHQ')
+            params = reader.read('%dQ' % param_count)
+            calls.append((time_ns, thread_index, entry_point_names[entry_point], params))
+
+    if not calls:
+        return 0
+
+    calls.sort()
+    start_ns = calls[0][0]
+    for time_ns, thread_index, entry_point, params in calls:
+        if args.thread is not None and thread_index != args.thread:
+            continue
+        if args.entry_point and entry_point not in args.entry_point:
+            continue
+        print('%14.6f ms [thread %d] %s' % ((time_ns - start_ns) * 1e-6, thread_index,
+                                            format_call(entry_point, params, command_params)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/python2
+#
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# detect_perf_regressions.py:
+#   Finds the commits that changed the perf test results stored by
+#   perf_test_runner.py. The results of each host, test, back-end and metric
+#   form a series ordered by commit date. Each series is split recursively at
+#   the commit where the results before and after differ the most, according
+#   to a Mann-Whitney U test, which is a change point when the difference is
+#   significant and larger than --threshold. Increases are regressions, since
+#   the perf tests report costs such as times per step. Returns 1 when a
+#   regression is found in the last --recent commits of a series. The
+#   environment keys that differ between the commits around a change point,
+#   like the kernel or the cpufreq governor, are listed since they may explain
+#   it better than the commit. The results of A/B comparisons are skipped,
+#   since the binaries of both sides are usually built at the same commit.
+
+import argparse
+import collections
+import fnmatch
+import json
+import os
+import sys
+
+import perf_test_runner
+
+# Scales of the time units to nanoseconds, since the perf tests switch from ns to us per iteration
+# for slow tests.
+unit_scales = {'ns': 1.0, 'us': 1e3, 'ms': 1e6, 's': 1e9}
+
+# The environment stored by perf_test_runner.py that is compared around the change points. The load
+# average changes with every run.
+environment_keys = ['kernel', 'governor', 'turbo', 'gpu_drivers', 'gl_driver', 'vulkan_drivers']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(os.path.basename(sys.argv[0]))
+    parser.add_argument('results', nargs='?', default=perf_test_runner.default_results,
+                        help='results of perf_test_runner.py. (default: %s)' %
+                        perf_test_runner.default_results)
+    parser.add_argument('-t', '--test', action='append', default=[],
+                        help='only check the tests matching this pattern, e.g. DrawCallPerf*')
+    parser.add_argument('-m', '--metric', action='append', default=[],
+                        help='only check this metric, e.g. wall_time')
+    parser.add_argument('--higher-is-better', action='append', default=[],
+                        help='metric for which decreases are regressions')
+    parser.add_argument('--threshold', type=float, default=2.0,
+                        help='smallest change of the mean to report, in %%. (default: 2)')
+    parser.add_argument('--p-value', type=float, default=0.001,
+                        help='largest Mann-Whitney p-value of a change point. (default: 0.001)')
+    parser.add_argument('--min-commits', type=int, default=1,
+                        help='fewest commits on each side of a change point. (default: 1)')
+    parser.add_argument('--recent', type=int, default=0,
+                        help='only fail for regressions in the last commits of each series, '
+                        '0 for all commits. (default: 0)')
+    return parser.parse_args()
+
+
+# Returns the values of each commit of each series, with the commits in date order, and the last
+# environment of each host and commit.
+def load_series(results_path, args):
+    series = collections.defaultdict(collections.OrderedDict)
+    commit_order = {}
+    environments = {}
+    with open(results_path) as results_file:
+        for line in results_file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'ab' in record:
+                continue
+            if args.test and not any(fnmatch.fnmatch(record['test'], test) for test in args.test):
+                continue
+            if args.metric and record['metric'] not in args.metric:
+                continue
+
+            scale = unit_scales.get(record.get('units'), 1.0)
+            key = (record['host'], record['test'], record['backend'], record['metric'])
+            commit = record['commit']
+            series[key].setdefault(commit, []).extend(value * scale for value in record['values'])
+            commit_order.setdefault(commit, (record['commit_date'], record['time']))
+            if 'environment' in record:
+                environments[(record['host'], commit)] = record['environment']
+
+    return dict((key, sorted(commits.items(), key=lambda item: commit_order[item[0]]))
+                for key, commits in series.items()), environments
+
+
+def get_environment_changes(environments, host, before, after):
+    before_environment = environments.get((host, before))
+    after_environment = environments.get((host, after))
+    if before_environment is None or after_environment is None:
+        return ''
+    return ','.join(key for key in environment_keys
+                    if before_environment.get(key) != after_environment.get(key))
+
+
+def pool(commits, start, end):
+    return [value for commit, values in commits[start:end] for value in values]
+
+
+# Adds the change points of commits[start:end] as (index, delta, p-value) tuples.
+def find_change_points(commits, start, end, args, change_points):
+    best = None
+    for split in range(start + args.min_commits, end - args.min_commits + 1):
+        p_value = perf_test_runner.mann_whitney_p_value(
+            pool(commits, start, split), pool(commits, split, end))
+        if best is None or p_value < best[0]:
+            best = (p_value, split)
+
+    if best is None or best[0] >= args.p_value:
+        return
+
+    p_value, split = best
+    delta = perf_test_runner.relative_delta(pool(commits, start, split), pool(commits, split, end))
+    if abs(delta) >= args.threshold:
+        change_points.append((split, delta, p_value))
+
+    find_change_points(commits, start, split, args, change_points)
+    find_change_points(commits, split, end, args, change_points)
+
+
+def main():
+    args = parse_args()
+    if not os.path.exists(args.results):
+        print('Cannot find %s!' % args.results)
+        return 1
+
+    rows = []
+    regressions = 0
+    series, environments = load_series(args.results, args)
+    for key, commits in sorted(series.items()):
+        host, test_name, backend, metric = key
+        change_points = []
+        find_change_points(commits, 0, len(commits), args, change_points)
+
+        for index, delta, p_value in sorted(change_points):
+            regression = delta < 0 if metric in args.higher_is_better else delta > 0
+            recent = args.recent == 0 or index >= len(commits) - args.recent
+            if regression and recent:
+                regressions += 1
+            rows.append([
+                host.split('/')[0], test_name, backend, metric, commits[index - 1][0],
+                commits[index][0], '%+.2f%%' % delta, '%.6f' % p_value,
+                'regression' if regression else 'improvement',
+                get_environment_changes(environments, host, commits[index - 1][0],
+                                        commits[index][0])
+            ])
+
+    if not rows:
+        print('No change points found.')
+        return 0
+
+    perf_test_runner.print_table(
+        ['host', 'test', 'backend', 'metric', 'before', 'after', 'delta', 'p-value', 'result',
+         'environment'], rows)
+    print('')
+    print('%d regression%s found.' % (regressions, '' if regressions == 1 else 's'))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
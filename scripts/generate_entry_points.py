@@ -10,6 +10,7 @@
 
 import sys, os, pprint, json
 from datetime import date
+import argparse
 import registry_xml
 
 # List of GLES1 extensions for which we don't need to add Context.h decls.
@@ -91,12 +92,49 @@ namespace gl
 {{
 enum class EntryPoint
 {{
-{entry_points_list}
+{entry_points_list},
+
+    EnumCount
 }};
+
+const char *GetEntryPointName(EntryPoint entryPoint);
 }}  // namespace gl
 #endif  // LIBGLESV2_ENTRY_POINTS_ENUM_AUTOGEN_H_
 """
 
+template_entry_points_enum_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_enum_autogen.cpp:
+//   Names of the GLES entry points.
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#include <stddef.h>
+
+namespace gl
+{{
+namespace
+{{
+constexpr const char *kEntryPointNames[] = {{
+{entry_point_names}
+}};
+}}  // anonymous namespace
+
+const char *GetEntryPointName(EntryPoint entryPoint)
+{{
+    static_assert(sizeof(kEntryPointNames) / sizeof(kEntryPointNames[0]) ==
+                      static_cast<size_t>(EntryPoint::EnumCount),
+                  "Mismatched entry point names");
+    return kEntryPointNames[static_cast<size_t>(entryPoint)];
+}}
+}}  // namespace gl
+"""
+
 template_libgles_entry_point_source = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -116,15 +154,17 @@ template_entry_point_decl = """ANGLE_EXPORT {return_type}GL_APIENTRY {name}{expl
 
 template_entry_point_def = """{return_type}GL_APIENTRY {name}{explicit_context_suffix}({explicit_context_param}{explicit_context_comma}{params})
 {{
-    ANGLE_SCOPED_GLOBAL_LOCK();
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::{name});
+    {scoped_global_lock}();
     {event_comment}EVENT("({format_params})"{comma_if_needed}{pass_params});
+    ANGLE_BINARY_TRACE(EntryPoint::{name}{comma_if_needed}{trace_params});
 
     Context *context = {context_getter};
     if (context)
     {{{assert_explicit_context}{packed_gl_enum_conversions}
         if (context->skipValidation() || Validate{name}({validate_params}))
         {{
-            {return_if_needed}context->{name_lower_no_suffix}({internal_params});
+            {context_call}
         }}
     }}
 {default_return_if_needed}}}
@@ -242,6 +282,9 @@ template_sources_includes = """#include "libGLESv2/entry_points_gles_{}_autogen.
 #include "libANGLE/Context.h"
 #include "libANGLE/Context.inl.h"
 #include "libANGLE/validationES{}{}.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 """
@@ -250,6 +293,278 @@ template_event_comment = """// Don't run an EVENT() macro on the EXT_debug_marke
     // It can interfere with the debug events being set by the caller.
     // """
 
+template_capture_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_gles_autogen.h:
+//   Record the GLES calls into a capture file, for builds with angle_enable_capture.
+
+#ifndef LIBGLESV2_CAPTURE_GLES_AUTOGEN_H_
+#define LIBGLESV2_CAPTURE_GLES_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{{
+class CaptureWriter;
+class Context;
+{prototypes}
+}}  // namespace gl
+
+#endif  // LIBGLESV2_CAPTURE_GLES_AUTOGEN_H_
+"""
+
+template_capture_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_gles_autogen.cpp:
+//   Record the GLES calls into a capture file, for builds with angle_enable_capture.
+
+#include "libGLESv2/api_capture.h"
+
+#if defined(ANGLE_ENABLE_CAPTURE)
+
+namespace gl
+{{
+{functions}
+}}  // namespace gl
+
+#endif  // defined(ANGLE_ENABLE_CAPTURE)
+"""
+
+template_capture_proto = "void Capture{name}(CaptureWriter *writer, const Context *context{params});"
+
+template_capture_function = """void Capture{name}(CaptureWriter *writer, const Context *context{params})
+{{
+    writer->writeCall(EntryPoint::{name});{statements}
+}}
+"""
+
+template_replay_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay_autogen.h:
+//   Replays the GLES calls read from a capture file.
+
+#ifndef TESTS_TEST_UTILS_CAPTURE_REPLAY_AUTOGEN_H_
+#define TESTS_TEST_UTILS_CAPTURE_REPLAY_AUTOGEN_H_
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace angle
+{{
+class CaptureReader;
+
+// Reads the parameters of a call to entryPoint and makes the call with the loaded GLES entry
+// points. Returns false without making the call when the parameters can't be read, e.g. from a
+// truncated file.
+bool ReplayCall(gl::EntryPoint entryPoint, CaptureReader *reader);
+}}  // namespace angle
+
+#endif  // TESTS_TEST_UTILS_CAPTURE_REPLAY_AUTOGEN_H_
+"""
+
+template_replay_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay_autogen.cpp:
+//   Replays the GLES calls read from a capture file.
+
+#include "test_utils/capture_replay_autogen.h"
+
+#include "common/debug.h"
+#include "test_utils/capture_reader.h"
+#include "util/gles_loader_autogen.h"
+
+namespace angle
+{{
+bool ReplayCall(gl::EntryPoint entryPoint, CaptureReader *reader)
+{{
+    switch (entryPoint)
+    {{
+{cases}
+        default:
+            return false;
+    }}
+}}
+}}  // namespace angle
+"""
+
+template_replay_case = """        case gl::EntryPoint::{name}:
+        {{{statements}
+            if (reader->failed())
+            {{
+                return false;
+            }}
+            {call};
+            return true;
+        }}"""
+
+template_batch_header = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_gles_batch_autogen.h:
+//   Decodes the commands submitted with glBatchCommandsANGLE.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_GLES_BATCH_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_GLES_BATCH_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{{
+class Context;
+
+// Makes the calls encoded in commands, as described in extensions/ANGLE_batch_commands.txt. Stops
+// at the first command that can't be decoded, after generating a GL error.
+void DecodeBatchCommands(Context *context, GLsizei size, const GLuint64 *commands);
+}}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_GLES_BATCH_AUTOGEN_H_
+"""
+
+template_batch_source = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {data_source_name}.
+//
+// Copyright {year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_gles_batch_autogen.cpp:
+//   Decodes the commands submitted with glBatchCommandsANGLE.
+
+#include "libGLESv2/entry_points_gles_batch_autogen.h"
+
+#include "common/mathutil.h"
+#include "libANGLE/Context.h"
+#include "libANGLE/Context.inl.h"
+#include "libANGLE/ErrorStrings.h"
+#include "libANGLE/validationES1.h"
+#include "libANGLE/validationES2.h"
+#include "libANGLE/validationES3.h"
+#include "libANGLE/validationES31.h"
+#include "libANGLE/validationESEXT.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace gl
+{{
+namespace
+{{
+// The number of words of each command: the entry point followed by one word per parameter. The
+// entry points that can't be batched have no size.
+constexpr uint8_t kBatchCommandSizes[] = {{
+{command_sizes}
+}};
+static_assert(ArraySize(kBatchCommandSizes) == static_cast<size_t>(EntryPoint::EnumCount),
+              "kBatchCommandSizes must have an entry per entry point");
+
+void DecodeBatchCommand(Context *context, EntryPoint entryPoint, const GLuint64 *args)
+{{
+    switch (entryPoint)
+    {{
+{cases}
+        default:
+            UNREACHABLE();
+            break;
+    }}
+}}
+}}  // anonymous namespace
+
+void DecodeBatchCommands(Context *context, GLsizei size, const GLuint64 *commands)
+{{
+    const GLuint64 *command = commands;
+    const GLuint64 *end     = commands + size;
+    while (command < end)
+    {{
+        // Commands after one that loses the context fail as separate calls would.
+        if (ANGLE_UNLIKELY(context->isContextLost()))
+        {{
+            context->handleError(GL_OUT_OF_MEMORY, err::kContextLost, __FILE__, ANGLE_FUNCTION,
+                                 __LINE__);
+            return;
+        }}
+
+        size_t commandSize =
+            command[0] < ArraySize(kBatchCommandSizes) ? kBatchCommandSizes[command[0]] : 0;
+        if (commandSize == 0)
+        {{
+            context->validationError(GL_INVALID_ENUM, err::kInvalidBatchCommand);
+            return;
+        }}
+
+        if (static_cast<size_t>(end - command) < commandSize)
+        {{
+            context->validationError(GL_INVALID_VALUE, err::kTruncatedBatchCommand);
+            return;
+        }}
+
+        DecodeBatchCommand(context, static_cast<EntryPoint>(command[0]), command + 1);
+        command += commandSize;
+    }}
+}}
+}}  // namespace gl
+"""
+
+template_batch_case = """        case EntryPoint::{name}:
+        {{{param_decls}{packed_gl_enum_conversions}
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::{name});
+            ANGLE_BINARY_TRACE(EntryPoint::{name}{comma_if_needed}{trace_params});
+            if (context->skipValidation() || Validate{name}({validate_params}))
+            {{
+                {context_call}
+            }}
+            break;
+        }}"""
+
+# How the scalar parameters are stored in capture files. See common/capture_format.h.
+capture_param_types = {
+    "GLbitfield": "uint32_t",
+    "GLboolean": "uint8_t",
+    "GLclampx": "int32_t",
+    "GLenum": "uint32_t",
+    "GLfixed": "int32_t",
+    "GLfloat": "float",
+    "GLint": "int32_t",
+    "GLintptr": "int64_t",
+    "GLshort": "int16_t",
+    "GLsizei": "int32_t",
+    "GLsizeiptr": "int64_t",
+    "GLubyte": "uint8_t",
+    "GLuint": "uint32_t",
+    "GLuint64": "uint64_t",
+}
+
+# Element counts for the COMPSIZE() lengths in gl.xml that are simple functions of the other
+# parameters, besides the ones that are a single count parameter. No parameter name takes more than
+# four values.
+capture_compsize_counts = {
+    "COMPSIZE(buffer)": "buffer == GL_COLOR ? 4 : 1",
+    "COMPSIZE(pname)": "4",
+}
+
 template_validation_proto = "bool Validate%s(%s);"
 
 template_windows_def_file = """; GENERATED FILE - DO NOT EDIT.
@@ -357,6 +672,39 @@ def get_context_getter_function(cmd_name, is_explicit_context):
             return "GetGlobalContext()"
     return "GetValidGlobalContext()"
 
+# Entry points implemented in libGLESv2 rather than by a Context method. They aren't captured
+# themselves, the calls they make are.
+libgles_context_calls = {
+    "glBatchCommandsANGLE": "DecodeBatchCommands(context, {internal_params});",
+}
+
+# The successful calls are recorded after they are made, so the capture can include the returned
+# GLsync objects. See ANGLE_CAPTURE in api_capture.h.
+template_context_call_void = """context->{name_lower_no_suffix}({internal_params});
+{indent}ANGLE_CAPTURE({name}, {capture_params});"""
+
+template_context_call_return = """{return_type} returnValue = context->{name_lower_no_suffix}({internal_params});
+{indent}ANGLE_CAPTURE({name}, {capture_params}, returnValue);
+{indent}return returnValue;"""
+
+def format_context_call(cmd_name, return_type, name_lower_no_suffix, internal_params, params,
+                        indent):
+    if cmd_name in libgles_context_calls:
+        return libgles_context_calls[cmd_name].format(internal_params = ", ".join(internal_params))
+
+    template = template_context_call_void if return_type.strip() == "void" \
+        else template_context_call_return
+    return template.format(
+        name = cmd_name[2:],
+        return_type = return_type.strip(),
+        name_lower_no_suffix = name_lower_no_suffix,
+        internal_params = ", ".join(internal_params),
+        capture_params = ", ".join(["context"] + [just_the_name(param) for param in params]),
+        indent = indent)
+
+# Set by --elide-global-lock. See ANGLE_SCOPED_ELIDABLE_GLOBAL_LOCK in global_state.h.
+elide_global_lock = False
+
 def format_entry_point_def(cmd_name, proto, params, is_explicit_context):
     packed_gl_enums = cmd_packed_gl_enums.get(cmd_name, {})
     internal_params = [just_the_name_packed(param, packed_gl_enums) for param in params]
@@ -388,13 +736,17 @@ def format_entry_point_def(cmd_name, proto, params, is_explicit_context):
         internal_params = ", ".join(internal_params),
         packed_gl_enum_conversions = "".join(packed_gl_enum_conversions),
         pass_params = ", ".join(pass_params),
+        trace_params = ", ".join([just_the_name(param) for param in params]),
         comma_if_needed = ", " if len(params) > 0 else "",
         validate_params = ", ".join(["context"] + internal_params),
         format_params = ", ".join(format_params),
-        return_if_needed = "" if default_return == "" else "return ",
+        context_call = format_context_call(cmd_name, return_type, name_lower_no_suffix,
+                                           internal_params, params, " " * 12),
         default_return_if_needed = "" if default_return == "" else "\n    return " + default_return + ";\n",
         context_getter = get_context_getter_function(cmd_name, is_explicit_context),
         event_comment = event_comment,
+        scoped_global_lock = "ANGLE_SCOPED_ELIDABLE_GLOBAL_LOCK" if elide_global_lock
+            else "ANGLE_SCOPED_GLOBAL_LOCK",
         explicit_context_suffix = "ContextANGLE" if is_explicit_context else "",
         explicit_context_param = "GLeglContext ctx" if is_explicit_context else "",
         explicit_context_comma = ", " if is_explicit_context and len(params) > 0 else "",
@@ -439,6 +791,233 @@ def format_validation_proto(cmd_name, params):
     internal_params = get_internal_params(cmd_name, ["Context *context"] + params)
     return template_validation_proto % (cmd_name[2:], internal_params)
 
+def get_pointee_type(param_type):
+    pointee = param_type[:param_type.rfind("*")].strip()
+    if "*" in pointee:
+        # Only drop the const of the pointer itself, as in "const void *const*".
+        if pointee.endswith("const"):
+            pointee = pointee[:-len("const")].strip()
+        return pointee
+    if pointee.startswith("const "):
+        pointee = pointee[len("const "):]
+    return pointee
+
+def get_capture_size(param_type, length):
+    pointee = get_pointee_type(param_type)
+    if pointee in ["void", "GLvoid"]:
+        return "static_cast<size_t>(%s)" % length
+    return "static_cast<size_t>(%s) * sizeof(%s)" % (length, pointee)
+
+# Returns the statement that writes a parameter to a capture file, and the declaration that reads
+# it back for the replay.
+def get_capture_param(cmd_name, param, param_names):
+    param_text = "".join(param.itertext())
+    param_type = just_the_type(param_text).strip()
+    name = just_the_name(param_text)
+    length = param.attrib.get("len")
+
+    if "*" not in param_type:
+        if param_type in capture_param_types:
+            capture_type = capture_param_types[param_type]
+            return ("writer->writeParam<%s>(%s);" % (capture_type, name),
+                    "%s %s = static_cast<%s>(reader->readParam<%s>());" %
+                    (param_type, name, param_type, capture_type))
+        if param_type == "GLsync":
+            return ("writer->writeSync(%s);" % name, "GLsync %s = reader->readSync();" % name)
+        if param_type == "GLeglImageOES":
+            return ("writer->writeParam<uint64_t>(reinterpret_cast<uintptr_t>(%s));" % name,
+                    "GLeglImageOES %s = reinterpret_cast<GLeglImageOES>(" % name +
+                    "static_cast<uintptr_t>(reader->readParam<uint64_t>()));")
+        # Callbacks can't be replayed.
+        return ("", "%s %s = nullptr;" % (param_type, name))
+
+    is_input = param_type.startswith("const")
+    pointee = get_pointee_type(param_type)
+    read_input = "%s %s = reader->readClientMemory<%s>();" % (param_type, name, pointee)
+    read_output = "%s %s = reader->readOutputPointer<%s>();" % (param_type, name, pointee)
+
+    if length not in capture_compsize_counts and length and length.startswith("COMPSIZE"):
+        length_params = length[len("COMPSIZE("):-1].split(",")
+        # gl_angle_ext.xml calls the drawcount of the multi draw entry points primcount.
+        if length_params == ["primcount"] and "drawcount" in param_names:
+            length_params = ["drawcount"]
+        if len(length_params) == 1 and length_params[0] in param_names and \
+                length_params[0] != name:
+            length = length_params[0]
+            length_params = None
+    else:
+        length_params = None
+
+    if "GLchar" in param_type and is_input:
+        if param_type.endswith("*const*"):
+            lengths = "length" if "length" in param_names else "nullptr"
+            return ("writer->writeStrings(%s, %s, %s);" % (length, name, lengths),
+                    "%s %s = reader->readStrings();" % (param_type, name))
+        if length in param_names:
+            return ("writer->writeString(%s, %s);" % (name, length), read_input)
+        return ("writer->writeString(%s);" % name, read_input)
+
+    if not is_input and name in ["pixels", "data"] and ("ReadPixels" in cmd_name or
+                                                        "ReadnPixels" in cmd_name):
+        return ("writer->writePackPixels(context, %s, format, type, width, height);" % name,
+                read_output)
+
+    if length_params and length_params[:2] == ["format", "type"]:
+        depth = length_params[4] if len(length_params) > 4 else "1"
+        return ("writer->writeUnpackPixels(context, %s, %s, %s);" %
+                (name, ", ".join(length_params[:4] + [depth]),
+                 "true" if len(length_params) > 4 else "false"), read_input)
+
+    if length_params == ["count", "type"]:
+        return ("writer->writeIndices(context, %s, count, type);" % name, read_input)
+
+    if length_params and length_params[-1] == "stride":
+        return ("writer->writeVertexPointer(context, %s);" % name, read_input)
+
+    if name == "indirect":
+        return ("writer->writeBufferOffset(%s);" % name, read_input)
+
+    if length in capture_compsize_counts:
+        length = capture_compsize_counts[length]
+    elif length is None and "dataSize" in param_names:
+        length = "dataSize"
+    elif length is None and "bufSize" in param_names:
+        length = "bufSize"
+    elif length_params is not None:
+        length = None
+
+    if not is_input:
+        size = "0" if length is None else get_capture_size(param_type, length)
+        return ("writer->writeOutputPointer(%s, %s);" % (name, size), read_output)
+
+    # Arrays of pointers other than strings would need their own capture.
+    if length is None or "*" in pointee:
+        return ("writer->writeNullPointer();", read_input)
+
+    size = get_capture_size(param_type, length)
+    if "Tex" in cmd_name and "Image" in cmd_name:
+        return ("writer->writeUnpackData(context, %s, %s);" % (name, size), read_input)
+    return ("writer->writeClientMemory(%s, %s);" % (name, size), read_input)
+
+def format_capture_function(cmd_name, proto, params, param_elems):
+    return_type = proto[:-len(cmd_name)].strip()
+    param_names = [just_the_name(param) for param in params]
+    capture_params = params + ([make_param(return_type, "returnValue")]
+                               if return_type != "void" else [])
+    statements = []
+    replay_statements = []
+    for param in param_elems:
+        capture, replay = get_capture_param(cmd_name, param, param_names)
+        if capture:
+            statements.append(capture)
+        replay_statements.append(replay)
+
+    call = "%s(%s)" % (cmd_name, ", ".join(param_names))
+    if return_type == "GLsync":
+        statements.append("writer->writeSync(returnValue);")
+        call = "reader->mapSync(%s)" % call
+
+    comma = ", " if len(capture_params) > 0 else ""
+    proto = template_capture_proto.format(
+        name = cmd_name[2:],
+        params = comma + ", ".join(capture_params))
+    function = template_capture_function.format(
+        name = cmd_name[2:],
+        params = comma + ", ".join(capture_params),
+        statements = "".join(["\n    " + statement for statement in statements]))
+    replay_case = template_replay_case.format(
+        name = cmd_name[2:],
+        statements = "".join(["\n            " + statement for statement in replay_statements]),
+        call = call)
+    return proto, function, replay_case
+
+def get_capture_functions(all_commands, cmd_names):
+    protos = []
+    functions = []
+    replay_cases = []
+
+    for command in all_commands:
+        proto = command.find('proto')
+        cmd_name = proto.find('name').text
+
+        if cmd_name not in cmd_names or cmd_name in libgles_context_calls:
+            continue
+
+        param_text = ["".join(param.itertext()) for param in command.findall('param')]
+        proto_text = "".join(proto.itertext())
+        proto, function, replay_case = format_capture_function(cmd_name, proto_text, param_text,
+                                                               command.findall('param'))
+        protos.append(proto)
+        functions.append(function)
+        replay_cases.append(replay_case)
+
+    return protos, functions, replay_cases
+
+# Each parameter of a batched command takes a GLuint64 word. Floats are stored as their bits in
+# the low 32 bits of the word, and pointers and handles as their address.
+def get_batch_param_decl(param, index):
+    param_type = just_the_type(param).strip()
+    word = "args[%d]" % index
+    if param_type == "GLfloat":
+        value = "bitCast<GLfloat>(static_cast<uint32_t>(%s))" % word
+    elif "*" in param_type or param_type in reinterpret_cast_to_dict:
+        value = "reinterpret_cast<%s>(static_cast<uintptr_t>(%s))" % (param_type, word)
+    else:
+        value = "static_cast<%s>(%s)" % (param_type, word)
+    return "%s = %s;" % (param, value)
+
+def format_batch_case(cmd_name, proto, params):
+    packed_gl_enums = cmd_packed_gl_enums.get(cmd_name, {})
+    internal_params = [just_the_name_packed(param, packed_gl_enums) for param in params]
+    packed_gl_enum_conversions = []
+    for param in params:
+        name = just_the_name(param)
+        if name in packed_gl_enums:
+            internal_type = packed_gl_enums[name]
+            packed_gl_enum_conversions += ["\n            " + internal_type + " " + name +
+                                           "Packed = FromGLenum<" + internal_type + ">(" + name +
+                                           ");"]
+
+    name_lower_no_suffix = cmd_name[2:3].lower() + cmd_name[3:]
+    for suffix in strip_suffixes:
+        if name_lower_no_suffix.endswith(suffix):
+            name_lower_no_suffix = name_lower_no_suffix[0:-len(suffix)]
+
+    return template_batch_case.format(
+        name = cmd_name[2:],
+        param_decls = "".join(["\n            " + get_batch_param_decl(param, index)
+                               for index, param in enumerate(params)]),
+        packed_gl_enum_conversions = "".join(packed_gl_enum_conversions),
+        trace_params = ", ".join([just_the_name(param) for param in params]),
+        comma_if_needed = ", " if len(params) > 0 else "",
+        validate_params = ", ".join(["context"] + internal_params),
+        context_call = format_context_call(cmd_name, "void", name_lower_no_suffix,
+                                           internal_params, params, " " * 16))
+
+# Returns the decoding of each command that can be batched, and the number of words of each
+# command by name. Commands that return a value can't be batched since there is no way to return
+# it.
+def get_batch_cases(all_commands, cmd_names):
+    cases = []
+    command_sizes = {}
+
+    for command in all_commands:
+        proto = command.find('proto')
+        cmd_name = proto.find('name').text
+
+        if cmd_name not in cmd_names or cmd_name in libgles_context_calls:
+            continue
+
+        proto_text = "".join(proto.itertext())
+        if proto_text[:-len(cmd_name)].strip() != "void":
+            continue
+
+        param_text = ["".join(param.itertext()) for param in command.findall('param')]
+        cases.append(format_batch_case(cmd_name, proto_text, param_text))
+        command_sizes[cmd_name[2:]] = len(param_text) + 1
+
+    return cases, command_sizes
+
 def path_to(folder, file):
     return os.path.join(script_relative(".."), "src", folder, file)
 
@@ -673,8 +1252,15 @@ def get_egl_exports():
 
 def main():
 
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--elide-global-lock', action='store_true',
+                        help='Skip the global lock in the GL entry points while a single context is '
+                        'used from a single thread, in builds with angle_elide_global_lock')
+    parser.add_argument('auto_script_command', nargs='?', default='')
+    args = parser.parse_args()
+
     # auto_script parameters.
-    if len(sys.argv) > 1:
+    if args.auto_script_command != '':
         inputs = [
             'egl.xml',
             'egl_angle_ext.xml',
@@ -690,6 +1276,9 @@ def main():
             '../src/libANGLE/validationES31_autogen.h',
             '../src/libANGLE/validationES3_autogen.h',
             '../src/libANGLE/validationESEXT_autogen.h',
+            '../src/libGLESv2/capture_gles_autogen.cpp',
+            '../src/libGLESv2/capture_gles_autogen.h',
+            '../src/libGLESv2/entry_points_enum_autogen.cpp',
             '../src/libGLESv2/entry_points_enum_autogen.h',
             '../src/libGLESv2/entry_points_gles_1_0_autogen.cpp',
             '../src/libGLESv2/entry_points_gles_1_0_autogen.h',
@@ -699,21 +1288,28 @@ def main():
             '../src/libGLESv2/entry_points_gles_3_0_autogen.h',
             '../src/libGLESv2/entry_points_gles_3_1_autogen.cpp',
             '../src/libGLESv2/entry_points_gles_3_1_autogen.h',
+            '../src/libGLESv2/entry_points_gles_batch_autogen.cpp',
+            '../src/libGLESv2/entry_points_gles_batch_autogen.h',
             '../src/libGLESv2/entry_points_gles_ext_autogen.cpp',
             '../src/libGLESv2/entry_points_gles_ext_autogen.h',
             '../src/libGLESv2/libGLESv2_autogen.cpp',
             '../src/libGLESv2/libGLESv2_autogen.def',
+            '../src/tests/test_utils/capture_replay_autogen.cpp',
+            '../src/tests/test_utils/capture_replay_autogen.h',
         ]
 
-        if sys.argv[1] == 'inputs':
+        if args.auto_script_command == 'inputs':
             print ','.join(inputs)
-        elif sys.argv[1] == 'outputs':
+        elif args.auto_script_command == 'outputs':
             print ','.join(outputs)
         else:
             print('Invalid script parameters')
             return 1
         return 0
 
+    global elide_global_lock
+    elide_global_lock = args.elide_global_lock
+
     gles1decls = {}
 
     gles1decls['core'] = []
@@ -877,6 +1473,7 @@ def main():
 
     source_includes = template_sources_includes.format("ext", "EXT", "")
     source_includes += """
+    #include "libGLESv2/entry_points_gles_batch_autogen.h"
     #include "libANGLE/validationES1.h"
     #include "libANGLE/validationES2.h"
     #include "libANGLE/validationES3.h"
@@ -894,8 +1491,50 @@ def main():
 
     write_context_api_decls("1_0", context_gles_header, gles1decls)
 
+    capture_protos, capture_functions, replay_cases = get_capture_functions(
+        xml.all_commands, xml.all_cmd_names.get_all_commands())
+
+    for template, path, key, items in [
+            (template_capture_header, path_to("libGLESv2", "capture_gles_autogen.h"),
+             "prototypes", capture_protos),
+            (template_capture_source, path_to("libGLESv2", "capture_gles_autogen.cpp"),
+             "functions", capture_functions),
+            (template_replay_header,
+             path_to(os.path.join("tests", "test_utils"), "capture_replay_autogen.h"), None, []),
+            (template_replay_source,
+             path_to(os.path.join("tests", "test_utils"), "capture_replay_autogen.cpp"), "cases",
+             replay_cases)]:
+        format_args = {
+            "script_name": os.path.basename(sys.argv[0]),
+            "data_source_name": "gl.xml and gl_angle_ext.xml",
+            "year": date.today().year,
+        }
+        if key:
+            format_args[key] = "\n".join(items)
+
+        with open(path, "w") as out:
+            out.write(template.format(**format_args))
+            out.close()
+
     sorted_cmd_names = ["Invalid"] + [cmd[2:] for cmd in sorted(xml.all_cmd_names.get_all_commands())]
 
+    batch_cases, batch_command_sizes = get_batch_cases(
+        xml.all_commands, xml.all_cmd_names.get_all_commands())
+
+    for template, suffix in [(template_batch_header, "h"), (template_batch_source, "cpp")]:
+        content = template.format(
+            script_name = os.path.basename(sys.argv[0]),
+            data_source_name = "gl.xml and gl_angle_ext.xml",
+            year = date.today().year,
+            command_sizes = "\n".join(["    %d,  // %s" % (batch_command_sizes.get(cmd, 0), cmd)
+                                       for cmd in sorted_cmd_names]),
+            cases = "\n".join(batch_cases))
+
+        path = path_to("libGLESv2", "entry_points_gles_batch_autogen.%s" % suffix)
+        with open(path, "w") as out:
+            out.write(content)
+            out.close()
+
     entry_points_enum = template_entry_points_enum_header.format(
         script_name = os.path.basename(sys.argv[0]),
         data_source_name = "gl.xml and gl_angle_ext.xml",
@@ -907,6 +1546,17 @@ def main():
         out.write(entry_points_enum)
         out.close()
 
+    entry_points_enum_source = template_entry_points_enum_source.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = "gl.xml and gl_angle_ext.xml",
+        year = date.today().year,
+        entry_point_names = "\n".join(["    \"" + cmd + "\"," for cmd in sorted_cmd_names]))
+
+    entry_points_enum_source_path = path_to("libGLESv2", "entry_points_enum_autogen.cpp")
+    with open(entry_points_enum_source_path, "w") as out:
+        out.write(entry_points_enum_source)
+        out.close()
+
     source_includes = """
     #include "angle_gl.h"
 
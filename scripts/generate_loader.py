@@ -12,7 +12,8 @@ import sys, os, pprint, json
 from datetime import date
 import registry_xml
 
-def write_header(data_source_name, all_cmds, api, preamble, path, lib, ns = "", prefix = None, export = ""):
+def write_header(data_source_name, all_cmds, api, preamble, path, lib, ns = "", prefix = None, export = "",
+                 lazy = False):
     file_name = "%s_loader_autogen.h" % api
     header_path = registry_xml.path_to(path, file_name)
     def pre(cmd):
@@ -21,6 +22,7 @@ def write_header(data_source_name, all_cmds, api, preamble, path, lib, ns = "",
         return prefix + cmd[len(api):]
     with open(header_path, "w") as out:
         var_protos = ["%sextern PFN%sPROC %s%s;" % (export, cmd.upper(), ns, pre(cmd)) for cmd in all_cmds]
+        lazy_decl = template_lazy_loader_h.format(export = export, api_upper = api.upper()) if lazy else ""
         loader_header = template_loader_h.format(
             script_name = os.path.basename(sys.argv[0]),
             data_source_name = data_source_name,
@@ -30,12 +32,16 @@ def write_header(data_source_name, all_cmds, api, preamble, path, lib, ns = "",
             api_lower = api,
             preamble = preamble,
             export = export,
+            lazy_decl = lazy_decl,
             lib = lib.upper())
 
         out.write(loader_header)
         out.close()
 
-def write_source(data_source_name, all_cmds, api, path, ns = "", prefix = None, export = ""):
+# With lazy_cmds, also writes a lazy loader, which gives the commands in lazy_cmds a stub that
+# loads them on their first call, and loads the others right away.
+def write_source(data_source_name, all_cmds, api, path, ns = "", prefix = None, export = "",
+                 lazy_cmds = None):
     file_name = "%s_loader_autogen.cpp" % api
     source_path = registry_xml.path_to(path, file_name)
     def pre(cmd):
@@ -46,15 +52,31 @@ def write_source(data_source_name, all_cmds, api, path, ns = "", prefix = None,
     with open(source_path, "w") as out:
         var_defs = ["%sPFN%sPROC %s%s;" % (export, cmd.upper(), ns, pre(cmd)) for cmd in all_cmds]
 
-        setter = "    %s%s = reinterpret_cast<PFN%sPROC>(loadProc(\"%s\"));"
-        setters = [setter % (ns, pre(cmd), cmd.upper(), pre(cmd)) for cmd in all_cmds]
+        proc_names = ["    \"%s\"," % pre(cmd) for cmd in all_cmds]
+        proc_addresses = ["    reinterpret_cast<GenericProc *>(&%s%s)," % (ns, pre(cmd)) for cmd in all_cmds]
+
+        lazy_includes = ""
+        lazy_loader = ""
+        lazy_load = ""
+        if lazy_cmds is not None:
+            lazy_includes = "\n#include <stdio.h>\n#include <stdlib.h>\n\n#include <atomic>"
+            lazy_stub = "    reinterpret_cast<GenericProc>(&LazyProc<%d, PFN%sPROC>::Stub),"
+            lazy_stubs = [lazy_stub % (index, cmd.upper()) if cmd in lazy_cmds else "    nullptr,"
+                          for index, cmd in enumerate(all_cmds)]
+            lazy_loader = template_lazy_loader_cpp.format(lazy_stubs = "\n".join(lazy_stubs))
+            lazy_load = template_lazy_load_cpp.format(api_upper = api.upper())
 
         loader_source = template_loader_cpp.format(
             script_name = os.path.basename(sys.argv[0]),
             data_source_name = data_source_name,
             year = date.today().year,
             function_pointers = "\n".join(var_defs),
-            set_pointers = "\n".join(setters),
+            proc_count = len(all_cmds),
+            proc_names = "\n".join(proc_names),
+            proc_addresses = "\n".join(proc_addresses),
+            lazy_includes = lazy_includes,
+            lazy_loader = lazy_loader,
+            lazy_load = lazy_load,
             api_upper = api.upper(),
             api_lower = api)
 
@@ -101,6 +123,9 @@ def gen_gl_loader():
 
         xml.AddCommands(feature_name, annotation)
 
+    # Tests check whether extension functions were found, so only the core ones are loaded lazily.
+    core_cmds = set(xml.all_cmd_names.get_all_commands())
+
     xml.AddExtensionCommands(registry_xml.supported_extensions, ['gles2', 'gles1'])
 
     all_cmds = xml.all_cmd_names.get_all_commands()
@@ -110,8 +135,9 @@ def gen_gl_loader():
 
     path = os.path.join("..", "util")
     ex = "ANGLE_UTIL_EXPORT "
-    write_header(data_source_name, all_cmds, "gles", util_gles_preamble, path, "UTIL", export=ex)
-    write_source(data_source_name, all_cmds, "gles", path, export=ex)
+    write_header(data_source_name, all_cmds, "gles", util_gles_preamble, path, "UTIL", export=ex,
+                 lazy=True)
+    write_source(data_source_name, all_cmds, "gles", path, export=ex, lazy_cmds=core_cmds)
 
 def gen_egl_loader():
 
@@ -126,14 +152,17 @@ def gen_egl_loader():
 
         xml.AddCommands(feature_name, annotation)
 
+    core_cmds = set(xml.all_cmd_names.get_all_commands())
+
     xml.AddExtensionCommands(registry_xml.supported_egl_extensions, ['egl'])
 
     all_cmds = xml.all_cmd_names.get_all_commands()
 
     path = os.path.join("..", "util")
     ex = "ANGLE_UTIL_EXPORT "
-    write_header(data_source_name, all_cmds, "egl", util_egl_preamble, path, "UTIL", export=ex)
-    write_source(data_source_name, all_cmds, "egl", path, export=ex)
+    write_header(data_source_name, all_cmds, "egl", util_egl_preamble, path, "UTIL", export=ex,
+                 lazy=True)
+    write_source(data_source_name, all_cmds, "egl", path, export=ex, lazy_cmds=core_cmds)
 
 def gen_wgl_loader():
 
@@ -246,7 +275,7 @@ namespace angle
 {{
 using GenericProc = void (*)();
 using LoadProc = GenericProc (KHRONOS_APIENTRY *)(const char *);
-{export}void Load{api_upper}(LoadProc loadProc);
+{export}void Load{api_upper}(LoadProc loadProc);{lazy_decl}
 }}  // namespace angle
     
 #endif  // {lib}_{api_upper}_LOADER_AUTOGEN_H_
@@ -264,15 +293,102 @@ template_loader_cpp = """// GENERATED FILE - DO NOT EDIT.
 
 #include "{api_lower}_loader_autogen.h"
 
+#include <stddef.h>{lazy_includes}
+
 {function_pointers}
 
 namespace angle
 {{
+namespace
+{{
+constexpr size_t kProcCount = {proc_count};
+
+constexpr const char *kProcNames[kProcCount] = {{
+{proc_names}
+}};
+
+GenericProc *const kProcs[kProcCount] = {{
+{proc_addresses}
+}};
+{lazy_loader}}}  // anonymous namespace
+
 void Load{api_upper}(LoadProc loadProc)
 {{
-{set_pointers}
+    for (size_t index = 0; index < kProcCount; ++index)
+    {{
+        *kProcs[index] = loadProc(kProcNames[index]);
+    }}
+}}
+{lazy_load}}}  // namespace angle
+"""
+
+template_lazy_loader_h = """
+
+// Makes each core function load itself with loadProc on its first call instead. Extension functions
+// are loaded right away, so that they are null when loadProc doesn't find them.
+{export}void Load{api_upper}Lazy(LoadProc loadProc);"""
+
+# The stubs of the lazy loader load their function on their first call and pass the calls on.
+template_lazy_loader_cpp = """
+LoadProc gLazyLoadProc = nullptr;
+
+// The functions loaded by the stubs. The stubs stay in the function pointers, which other threads
+// read without synchronization, so the loaded functions are kept in atomic slots instead.
+std::atomic<GenericProc> gLazyProcSlots[kProcCount];
+
+GenericProc LoadLazyProc(size_t index)
+{{
+    GenericProc proc = gLazyProcSlots[index].load(std::memory_order_acquire);
+    if (proc)
+    {{
+        return proc;
+    }}
+
+    // Threads that load the same function at the same time store the same pointer.
+    proc = gLazyLoadProc(kProcNames[index]);
+    if (!proc)
+    {{
+        fprintf(stderr, "Failed to load %s.\\n", kProcNames[index]);
+        abort();
+    }}
+    gLazyProcSlots[index].store(proc, std::memory_order_release);
+    return proc;
+}}
+
+template <size_t Index, typename ProcT>
+struct LazyProc;
+
+template <size_t Index, typename ReturnT, typename... ParamsT>
+struct LazyProc<Index, ReturnT(KHRONOS_APIENTRY *)(ParamsT...)>
+{{
+    static ReturnT KHRONOS_APIENTRY Stub(ParamsT... params)
+    {{
+        using ProcT = ReturnT(KHRONOS_APIENTRY *)(ParamsT...);
+        return reinterpret_cast<ProcT>(LoadLazyProc(Index))(params...);
+    }}
+}};
+
+// The stubs of the core functions, and null for the extension functions.
+const GenericProc kLazyProcs[kProcCount] = {{
+{lazy_stubs}
+}};
+"""
+
+template_lazy_load_cpp = """
+void Load{api_upper}Lazy(LoadProc loadProc)
+{{
+    // loadProc may load from another library than the last time.
+    for (std::atomic<GenericProc> &slot : gLazyProcSlots)
+    {{
+        slot.store(nullptr, std::memory_order_relaxed);
+    }}
+
+    gLazyLoadProc = loadProc;
+    for (size_t index = 0; index < kProcCount; ++index)
+    {{
+        *kProcs[index] = kLazyProcs[index] ? kLazyProcs[index] : loadProc(kProcNames[index]);
+    }}
 }}
-}}  // namespace angle
 """
 
 if __name__ == '__main__':
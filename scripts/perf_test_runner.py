@@ -9,25 +9,146 @@
 #   tests in an infinite batch, printing out the mean and coefficient of
 #   variation of the population continuously.
 #
+#   Several tests, or gtest filter patterns such as DrawCallPerf*.Run/*_null,
+#   can be given. They're calibrated once and run in a single process per
+#   experiment, each with its own number of steps, and a summary table of the
+#   tests is printed at the end.
+#
+#   The calibrated steps are cached in a JSON file by the hash of the
+#   angle_perftests binary, the host and the test, so later runs of the same
+#   binary skip the calibration. The steps of a test are calibrated again
+#   when its variation exceeds --recalibration-variation.
+#
+#   With --sweep, the tests of the null back-ends, which only use the CPU,
+#   run in parallel, each in its own process pinned to its own core. The
+#   cores of /sys/devices/system/cpu/isolated are used when there are, else
+#   one CPU of each physical core but the first. The other tests still run
+#   one after the other.
+#
+#   All the metrics the tests print are parsed, such as wall_time, gpu_time
+#   and the custom metrics of some tests. The summary shows the mean, min,
+#   p50, p90 and p99 of each, and --output writes it to a CSV or JSON file.
+#   --metric selects the metric the per-run lines, the A/B comparison and
+#   --ci-width use.
+#
+#   The results are appended to a JSONL file, one line per binary, test and
+#   metric with the commit of the binary. detect_perf_regressions.py finds
+#   the regressions in this history. The results of --ab are tagged with the
+#   side of their binary, since A and B are often built at the same commit.
+#
+#   The environment is captured before the tests run and stored with the
+#   results: the kernel, the cpufreq governor, the turbo state, the load
+#   average, the GPU kernel drivers and the GL and Vulkan drivers, e.g. the
+#   Mesa version, from glxinfo and vulkaninfo. The script warns when the
+#   environment makes the results noisy. With --pin-governor, the cpufreq
+#   governor is set to performance for the run, when the script is allowed
+#   to.
+#
+#   With --ci-width, the experiments stop early: a test stops running once
+#   the confidence interval of its mean, or of the A/B delta, is narrower
+#   than the given percentage, and all tests stop when --time-budget would
+#   be exceeded. The summary shows how many samples each test needed.
+#
+#   With --ab, compares two angle_perftests binaries instead. The runs of
+#   the two binaries are interleaved in a random order so that thermal and
+#   frequency drift affects both equally, and the difference of the means
+#   is reported with a bootstrap confidence interval and the p-value of a
+#   Mann-Whitney U test.
+#
 
+import argparse
+import atexit
+import collections
+import csv
 import glob
+import hashlib
+import json
+import math
+import multiprocessing
+import multiprocessing.pool
+import random
 import subprocess
 import sys
 import os
+import platform
+import Queue
 import re
+import tempfile
+import time
 
 base_path = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 # Look for a [Rr]elease build.
 perftests_paths = glob.glob('out/*elease*')
-metric = 'wall_time'
+default_metric = 'wall_time'
+summary_percentiles = [50, 90, 99]
+
+# The lines perf_test::PrintResult prints, e.g. *RESULT DrawCallPerfBenchmark_gl: wall_time= 4.2 ns
+result_pattern = re.compile(r'\*?RESULT [^:]*: (\S+)= (\[[^\]]*\]|\{[^}]*\}|\S+) ?(.*)')
 max_experiments = 10
 
+# Used by the adaptive stopping rule of --ci-width.
+max_adaptive_experiments = 1000
+min_adaptive_experiments = 3
+default_time_budget = 600
+
+# Where the calibrated steps are cached, and how many binaries are kept per host.
+default_calibration_cache = os.path.join(os.path.expanduser('~'), '.angle_perf_calibration.json')
+calibration_cache_binaries = 10
+max_calibration_variation = 10.0
+
+default_results = os.path.join(os.path.expanduser('~'), '.angle_perf_results.jsonl')
+
+# Used by the environment checks.
+max_load_average = 0.5
+gpu_kernel_modules = ['amdgpu', 'i915', 'nouveau', 'nvidia', 'radeon']
+
+# Used by the A/B comparison.
+bootstrap_iterations = 10000
+confidence_level = 0.95
+
 binary_name = 'angle_perftests'
 if sys.platform == 'win32':
     binary_name += '.exe'
 
-scores = []
+if sys.platform == 'win32':
+    default_test_name = 'DrawCallPerfBenchmark.Run/d3d11_null'
+else:
+    default_test_name = 'DrawCallPerfBenchmark.Run/gl'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(os.path.basename(sys.argv[0]))
+    parser.add_argument('tests', nargs='*', default=[default_test_name],
+                        help='test names or gtest filter patterns. (default: %s)' % default_test_name)
+    parser.add_argument('--ab', nargs=2, metavar=('BINARY_A', 'BINARY_B'),
+                        help='compare two %s binaries, with A as the baseline' % binary_name)
+    parser.add_argument('-m', '--metric', default=default_metric,
+                        help='metric to print, compare and stop on. (default: %s)' % default_metric)
+    parser.add_argument('-o', '--output',
+                        help='CSV or JSON file, by extension, to write the summary of each test and metric to')
+    parser.add_argument('-n', '--experiments', type=int,
+                        help='number of runs of each binary, or the most with --ci-width. (default: %d, %d with --ci-width)' % (max_experiments, max_adaptive_experiments))
+    parser.add_argument('--ci-width', type=float,
+                        help='stop running a test once the confidence interval of its mean, or of the A/B delta, is narrower than this %%')
+    parser.add_argument('--time-budget', type=float, default=default_time_budget,
+                        help='seconds after which --ci-width stops running the tests. (default: %d)' % default_time_budget)
+    parser.add_argument('--seed', type=int, help='seed of the run order and the bootstrap')
+    parser.add_argument('--calibration-cache', default=default_calibration_cache,
+                        help='file caching the calibrated steps, empty to disable the cache. (default: %s)' % default_calibration_cache)
+    parser.add_argument('--recalibrate', action='store_true',
+                        help='calibrate the steps again, ignoring the cache')
+    parser.add_argument('--recalibration-variation', type=float, default=max_calibration_variation,
+                        help='variation in %% above which the steps of a test are calibrated again on the next run. (default: %.0f)' % max_calibration_variation)
+    parser.add_argument('--sweep', action='store_true',
+                        help='run the null back-end tests in parallel on pinned cores')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='most null back-end tests to run at once with --sweep. (default: one per core)')
+    parser.add_argument('--pin-governor', action='store_true',
+                        help='set the cpufreq governor to performance during the run, on Linux')
+    parser.add_argument('--results', default=default_results,
+                        help='JSONL file the results are appended to, empty to not store them. (default: %s)' % default_results)
+    return parser.parse_args()
 
 # Danke to http://stackoverflow.com/a/27758326
 def mean(data):
@@ -67,73 +188,763 @@ def truncated_cov(data, n):
     """Compute a truncated coefficient of variation, n is truncation size"""
     return coefficient_of_variation(truncated_list(data, n))
 
-# Find most recent binary
-newest_binary = None
-newest_mtime = None
+def percentile(sorted_data, fraction):
+    """Return the value at fraction of sorted data, interpolating between neighbours."""
+    position = fraction * (len(sorted_data) - 1)
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(sorted_data) - 1)
+    return sorted_data[lower] + (sorted_data[upper] - sorted_data[lower]) * (position - lower)
 
-for path in perftests_paths:
-    binary_path = os.path.join(base_path, path, binary_name)
-    if os.path.exists(binary_path):
-        binary_mtime = os.path.getmtime(binary_path)
-        if (newest_binary is None) or (binary_mtime > newest_mtime):
-            newest_binary = binary_path
-            newest_mtime = binary_mtime
+def relative_delta(baseline, data):
+    """Return the difference of the means of data and baseline, as a percentage of baseline."""
+    return (mean(data) / mean(baseline) - 1.0) * 100.0
 
-perftests_path = newest_binary
+def bootstrap_interval(samples, statistic, rng):
+    """Compute the confidence interval of statistic of the samples by resampling each of them."""
+    values = []
+    for iteration in range(bootstrap_iterations):
+        values.append(statistic(*[[rng.choice(sample) for value in sample] for sample in samples]))
+    values.sort()
+    tail = (1.0 - confidence_level) / 2.0
+    return percentile(values, tail), percentile(values, 1.0 - tail)
 
-if perftests_path == None or not os.path.exists(perftests_path):
-    print('Cannot find Release %s!' % binary_name)
-    sys.exit(1)
+def bootstrap_delta_interval(baseline, data, rng):
+    """Compute the confidence interval of relative_delta by resampling both samples."""
+    return bootstrap_interval([baseline, data], relative_delta, rng)
 
-if sys.platform == 'win32':
-    test_name = 'DrawCallPerfBenchmark.Run/d3d11_null'
-else:
-    test_name = 'DrawCallPerfBenchmark.Run/gl'
+def interval_width(samples, rng):
+    """Return the width in % of the confidence interval the adaptive stopping rule uses.
+
+    That's the interval of the mean relative to the mean for one sample, and the interval of
+    relative_delta for two."""
+    if len(samples) == 1:
+        low, high = bootstrap_interval(samples, mean, rng)
+        return (high - low) / mean(samples[0]) * 100.0
+    low, high = bootstrap_delta_interval(samples[0], samples[1], rng)
+    return high - low
+
+def mann_whitney_p_value(a, b):
+    """Return the two-sided p-value of the Mann-Whitney U test of a and b.
+
+    Uses the normal approximation of U with a correction for ties, which is
+    reasonable from about 8 values per sample."""
+    values = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    n = len(values)
+
+    # Rank the values, giving tied values the mean of their ranks.
+    rank_sum_a = 0.0
+    tie_correction = 0.0
+    start = 0
+    while start < n:
+        end = start
+        while end + 1 < n and values[end + 1][0] == values[start][0]:
+            end += 1
+        rank = (start + end) / 2.0 + 1.0
+        tied = end - start + 1
+        tie_correction += tied ** 3 - tied
+        rank_sum_a += rank * sum(1 for value in values[start:end + 1] if value[1] == 0)
+        start = end + 1
+
+    n_a = len(a)
+    n_b = len(b)
+    u = rank_sum_a - n_a * (n_a + 1) / 2.0
+    mean_u = n_a * n_b / 2.0
+    variance_u = n_a * n_b / 12.0 * ((n + 1) - tie_correction / (n * (n - 1)))
+    if variance_u <= 0:
+        return 1.0
+
+    # Continuity correction.
+    z = max(abs(u - mean_u) - 0.5, 0.0) / math.sqrt(variance_u)
+    return math.erfc(z / math.sqrt(2.0))
+
+def find_newest_binary():
+    """Return the most recent binary of the release builds, or None."""
+    newest_binary = None
+    newest_mtime = None
+
+    for path in perftests_paths:
+        binary_path = os.path.join(base_path, path, binary_name)
+        if os.path.exists(binary_path):
+            binary_mtime = os.path.getmtime(binary_path)
+            if (newest_binary is None) or (binary_mtime > newest_mtime):
+                newest_binary = binary_path
+                newest_mtime = binary_mtime
+
+    return newest_binary
+
+def hash_file(path):
+    """Return the SHA-1 of the content of a file."""
+    sha = hashlib.sha1()
+    with open(path, 'rb') as in_file:
+        for chunk in iter(lambda: in_file.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def host_fingerprint():
+    """Return a string identifying the host and its CPU."""
+    cpu = platform.processor()
+    if os.path.exists('/proc/cpuinfo'):
+        with open('/proc/cpuinfo') as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith('model name'):
+                    cpu = line.split(':', 1)[1].strip()
+                    break
+    return '%s/%s/%s/%d' % (platform.node(), platform.platform(), cpu, multiprocessing.cpu_count())
+
+def read_file(path):
+    """Return the stripped content of a file, or None when it can't be read."""
+    try:
+        with open(path) as in_file:
+            return in_file.read().strip()
+    except (IOError, OSError):
+        return None
+
+def get_governor_paths():
+    return sorted(glob.glob('/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_governor'))
+
+def pin_governor():
+    """Set the cpufreq governor of all CPUs to performance, until the script exits."""
+    for governor_path in get_governor_paths():
+        governor = read_file(governor_path)
+        if governor == 'performance':
+            continue
+        try:
+            with open(governor_path, 'w') as governor_file:
+                governor_file.write('performance')
+        except (IOError, OSError) as error:
+            print("Warning: cannot set the cpufreq governor, it's still %s: %s" % (governor, error))
+            return
+
+        def restore_governor(governor_path=governor_path, governor=governor):
+            with open(governor_path, 'w') as governor_file:
+                governor_file.write(governor)
+        atexit.register(restore_governor)
+
+def capture_environment():
+    """Return what of the state of the host affects the results."""
+    environment = collections.OrderedDict()
+    environment['kernel'] = '%s %s' % (platform.release(), platform.version())
+    environment['load_average'] = list(os.getloadavg()) if hasattr(os, 'getloadavg') else None
+
+    governors = set(read_file(governor_path) for governor_path in get_governor_paths())
+    environment['governor'] = ','.join(sorted(governor for governor in governors if governor)) or None
+
+    # intel_pstate has its own switch, the other cpufreq drivers may have boost.
+    no_turbo = read_file('/sys/devices/system/cpu/intel_pstate/no_turbo')
+    boost = read_file('/sys/devices/system/cpu/cpufreq/boost')
+    if no_turbo is not None:
+        environment['turbo'] = 'off' if no_turbo == '1' else 'on'
+    elif boost is not None:
+        environment['turbo'] = 'on' if boost == '1' else 'off'
+    else:
+        environment['turbo'] = None
+
+    # The in-tree modules have no version of their own, they change with the kernel.
+    drivers = collections.OrderedDict()
+    for module in gpu_kernel_modules:
+        if os.path.exists('/sys/module/%s' % module):
+            drivers[module] = read_file('/sys/module/%s/version' % module) or 'in-tree'
+    nvidia_version = read_file('/proc/driver/nvidia/version')
+    if nvidia_version:
+        drivers['nvidia'] = nvidia_version.splitlines()[0]
+    environment['gpu_drivers'] = drivers
+    environment['gl_driver'] = get_gl_driver()
+    environment['vulkan_drivers'] = get_vulkan_drivers()
+    return environment
+
+def get_command_output(command):
+    """Return the output of a command, or None when it can't run or fails."""
+    try:
+        with open(os.devnull, 'w') as devnull:
+            return subprocess.check_output(command, stderr=devnull)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def get_gl_driver():
+    """Return the renderer and versions of the native GL driver, e.g. of Mesa, from glxinfo."""
+    output = get_command_output(['glxinfo', '-B'])
+    if output is None:
+        return None
+    driver = collections.OrderedDict()
+    for line in output.splitlines():
+        key, _, value = line.partition(':')
+        key = key.strip()
+        if key in ['OpenGL renderer string', 'OpenGL version string',
+                   'OpenGL core profile version string', 'OpenGL ES profile version string']:
+            driver[key[len('OpenGL '):-len(' string')]] = value.strip()
+    return driver
+
+def get_vulkan_drivers():
+    """Return the name and version of the Vulkan driver of each GPU, from vulkaninfo."""
+    output = get_command_output(['vulkaninfo', '--summary'])
+    if output is None:
+        return None
+    # The properties of each device follow a 'GPU0:' line.
+    drivers = []
+    for line in output.splitlines():
+        if re.match(r'^GPU\d+:$', line.strip()):
+            drivers.append(collections.OrderedDict())
+            continue
+        key, _, value = line.partition('=')
+        key = key.strip()
+        if key in ['deviceName', 'driverName', 'driverInfo', 'driverVersion'] and drivers:
+            drivers[-1][key] = value.strip()
+    return drivers
+
+def check_environment(environment):
+    """Print the environment, and warnings about what of it makes the results noisy."""
+    for key, value in environment.items():
+        print('%s: %s' % (key, json.dumps(value) if isinstance(value, (dict, list)) else value))
+
+    load_average = environment['load_average']
+    if load_average and load_average[0] > max_load_average:
+        print("Warning: the load average is %.2f, other processes will disturb the results." % load_average[0])
+    if environment['governor'] and environment['governor'] != 'performance':
+        print("Warning: the cpufreq governor is %s, the CPU frequency will change during the run. Use --pin-governor as root to set it to performance." % environment['governor'])
+    if environment['turbo'] == 'on':
+        print("Warning: turbo is on, the CPU frequency will depend on its temperature.")
+
+class CalibrationCache:
+    """Steps of each test, by host and by hash of the binary that was calibrated."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path) as cache_file:
+                self.entries = json.load(cache_file)
+        self.host = self.entries.setdefault(host_fingerprint(), {})
+        self.binary_hashes = {}
+
+    def get_binary(self, perftests_path):
+        if perftests_path not in self.binary_hashes:
+            self.binary_hashes[perftests_path] = hash_file(perftests_path)
+        binary = self.host.setdefault(self.binary_hashes[perftests_path], {'tests': {}})
+        binary['time'] = time.time()
+        return binary['tests']
+
+    def save(self):
+        # Only keep the most recently used binaries.
+        binaries = sorted(self.host.items(), key=lambda item: item[1]['time'], reverse=True)
+        for binary_hash, binary in binaries[calibration_cache_binaries:]:
+            del self.host[binary_hash]
+
+        with open(self.path, 'w') as cache_file:
+            json.dump(self.entries, cache_file, indent=1, sort_keys=True)
+
+def list_tests(perftests_path, tests):
+    """Return the names of the tests matching the filter, without running them."""
+    output = subprocess.check_output([perftests_path, '--gtest_filter=' + ':'.join(tests), '--gtest_list_tests'])
+    test_names = []
+    test_case = ''
+    for line in output.splitlines():
+        # Each test case is followed by its indented tests, with comments after a '#'.
+        name = line.split('#')[0].strip()
+        if not name:
+            continue
+        if line.startswith(' '):
+            test_names.append(test_case + name)
+        else:
+            test_case = name
+    return test_names
+
+def parse_cpu_list(cpu_list):
+    """Return the CPUs of a list in the format of sysfs, e.g. 0-3,8."""
+    cpus = []
+    for cpu_range in cpu_list.strip().split(','):
+        if cpu_range:
+            bounds = cpu_range.split('-')
+            cpus += range(int(bounds[0]), int(bounds[-1]) + 1)
+    return cpus
+
+def get_isolated_cpus():
+    """Return the CPUs the parallel tests are pinned to, one per physical core."""
+    isolated_path = '/sys/devices/system/cpu/isolated'
+    if os.path.exists(isolated_path):
+        with open(isolated_path) as isolated_file:
+            isolated = parse_cpu_list(isolated_file.read())
+        if isolated:
+            return isolated
 
-if len(sys.argv) >= 2:
-    test_name = sys.argv[1]
+    # Skip the hyperthreads of a core, and the first core, which is left to the system.
+    cores = collections.OrderedDict()
+    for cpu in range(multiprocessing.cpu_count()):
+        siblings_path = '/sys/devices/system/cpu/cpu%d/topology/thread_siblings_list' % cpu
+        siblings = str(cpu)
+        if os.path.exists(siblings_path):
+            with open(siblings_path) as siblings_file:
+                siblings = siblings_file.read().strip()
+        cores.setdefault(siblings, cpu)
+    return cores.values()[1:] or cores.values()
 
-print('Using test executable: ' + perftests_path)
-print('Test name: ' + test_name)
+def pinned_command(command, cpu):
+    """Return the command running on the CPU only, when there is one."""
+    if cpu is None or not sys.platform.startswith('linux'):
+        return command
+    return ['taskset', '--cpu-list', str(cpu)] + command
 
-def get_results(metric, extra_args=[]):
-    process = subprocess.Popen([perftests_path, '--gtest_filter=' + test_name] + extra_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def parse_result_value(value):
+    """Return the values of a result, which is a number, a [list,] or a {mean, deviation}."""
+    if value.startswith('['):
+        return [float(item) for item in value.strip('[]').split(',') if item.strip()]
+    if value.startswith('{'):
+        return [float(value.strip('{}').split(',')[0])]
+    return [float(value)]
+
+class NoResultsError(Exception):
+    """Raised when a test process prints no result, e.g. because it crashed."""
+
+    def __init__(self, output):
+        Exception.__init__(self, 'Did not find any result in the test output')
+        self.output = output
+
+def get_results(perftests_path, tests, extra_args=[], units=None, cpu=None):
+    """Run the tests in one process and return the values of each metric of each test, in run order.
+
+    The units of each metric of each test are added to units when it's given."""
+    process = subprocess.Popen(pinned_command([perftests_path, '--gtest_filter=' + ':'.join(tests)] + extra_args, cpu), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     output, err = process.communicate()
 
-    m = re.search(r'Running (\d+) tests', output)
-    if m and int(m.group(1)) > 1:
-        print("Found more than one test result in output:")
-        print(output)
-        sys.exit(3)
+    # The results follow the line gtest prints when it starts each test.
+    results = collections.OrderedDict()
+    test_name = None
+    for line in output.splitlines():
+        m = re.match(r'\[ RUN      \] (\S+)', line)
+        if m:
+            test_name = m.group(1)
+            continue
+        m = result_pattern.match(line)
+        if m and test_name:
+            metric = m.group(1)
+            test_results = results.setdefault(test_name, collections.OrderedDict())
+            test_results.setdefault(metric, []).extend(parse_result_value(m.group(2)))
+            if units is not None:
+                units.setdefault(test_name, {})[metric] = m.group(3)
+
+    # Raised rather than exiting, since the --sweep tests run in worker threads.
+    if not results:
+        raise NoResultsError(output)
+
+    return results
+
+def add_results(scores, results):
+    """Add the values of each metric of each test of results to scores."""
+    for test_name, test_results in results.items():
+        test_scores = scores.setdefault(test_name, collections.OrderedDict())
+        for metric, values in test_results.items():
+            test_scores.setdefault(metric, []).extend(values)
+
+def get_metric_scores(scores, metric):
+    """Return the values of one metric of each test."""
+    return collections.OrderedDict((test_name, test_scores.get(metric, []))
+                                   for test_name, test_scores in scores.items())
+
+def run_tests(perftests_path, tests, extra_args, units, args):
+    """Return the results of the tests, running the null back-end ones in parallel with --sweep."""
+    if not args.sweep:
+        return get_results(perftests_path, tests, extra_args, units)
+
+    parallel_tests = [test_name for test_name in tests if get_backend(test_name).endswith('_null')]
+    serial_tests = [test_name for test_name in tests if test_name not in parallel_tests]
+
+    cpus = get_isolated_cpus()
+    if args.jobs:
+        cpus = cpus[:args.jobs]
+    free_cpus = Queue.Queue()
+    for cpu in cpus:
+        free_cpus.put(cpu)
+
+    def run_pinned_test(test_name):
+        cpu = free_cpus.get()
+        try:
+            return get_results(perftests_path, [test_name], extra_args, units, cpu)
+        finally:
+            free_cpus.put(cpu)
+
+    results = collections.OrderedDict()
+    if parallel_tests:
+        pool = multiprocessing.pool.ThreadPool(len(cpus))
+        try:
+            for test_results in pool.map(run_pinned_test, parallel_tests):
+                results.update(test_results)
+        finally:
+            pool.close()
+
+    # The tests that use the GPU would disturb each other.
+    if serial_tests:
+        results.update(get_results(perftests_path, serial_tests, extra_args, units))
+    return results
+
+def calibrate(perftests_path, tests, cache=None, recalibrate=False):
+    """Return the number of steps each test runs for, from the cache when it has them."""
+    test_names = list_tests(perftests_path, tests)
+    if cache is None:
+        calibrated = {}
+    else:
+        calibrated = cache.get_binary(perftests_path)
+        if recalibrate:
+            calibrated.clear()
+
+    uncalibrated = [test_name for test_name in test_names if test_name not in calibrated]
+    if uncalibrated:
+        results = get_metric_scores(get_results(perftests_path, uncalibrated, ["--calibration"]), "steps")
+        for test_name in uncalibrated:
+            # Tests that are skipped don't print their steps, and are cached as not run.
+            calibrated[test_name] = int(results[test_name][0]) if results.get(test_name) else None
+        if cache is not None:
+            cache.save()
+
+    steps = collections.OrderedDict()
+    for test_name in test_names:
+        if calibrated[test_name] is not None:
+            steps[test_name] = calibrated[test_name]
+            print("%s: running with %d steps%s." % (test_name, steps[test_name],
+                                                  '' if test_name in uncalibrated else ' (cached)'))
+    return steps
+
+def check_calibration(perftests_path, scores, cache, max_variation):
+    """Drop the cached steps of the tests that vary too much, so they're calibrated again."""
+    if cache is None:
+        return
+    calibrated = cache.get_binary(perftests_path)
+    for test_name, test_scores in scores.items():
+        if len(test_scores) < 2 or test_name not in calibrated:
+            continue
+        variation = coefficient_of_variation(test_scores) * 100.0
+        if variation > max_variation:
+            print("%s: variation of %.2f%% is above %.2f%%, the steps will be calibrated again." %
+                  (test_name, variation, max_variation))
+            del calibrated[test_name]
+    cache.save()
+
+def write_steps_file(steps):
+    """Write the steps of each test in the format of the --steps-file argument of the tests."""
+    steps_file, steps_path = tempfile.mkstemp(prefix='angle_perftests_steps', suffix='.txt')
+    with os.fdopen(steps_file, 'w') as out_file:
+        for test_name, test_steps in steps.items():
+            out_file.write('%s %d\n' % (test_name, test_steps))
+    atexit.register(os.remove, steps_path)
+    return steps_path
+
+def get_commit_id(perftests_path):
+    """Return the commit hash and date the binary was built from."""
+    commit_header = os.path.join(os.path.dirname(perftests_path), 'gen', 'angle', 'id', 'commit.h')
+    if not os.path.exists(commit_header):
+        # Use the commit of the checkout when the build doesn't have its commit.h.
+        commit_file, commit_header = tempfile.mkstemp(prefix='angle_commit', suffix='.h')
+        os.close(commit_file)
+        atexit.register(os.remove, commit_header)
+        subprocess.call([sys.executable, os.path.join(base_path, 'src', 'commit_id.py'), 'gen',
+                         base_path, commit_header])
+
+    with open(commit_header) as commit_file:
+        defines = dict(re.findall(r'#define (\w+) "(.*)"', commit_file.read()))
+    return defines.get('ANGLE_COMMIT_HASH', 'unknown hash'), defines.get('ANGLE_COMMIT_DATE', 'unknown date')
+
+def get_backend(test_name):
+    """Return the back-end of a test from the name of its parameters, e.g. Run/vulkan_null."""
+    m = re.search(r'/(d3d11|d3d9|gles|gl|vulkan|wgl|native)(_null)?(_|$)', test_name)
+    return m.group(1) + (m.group(2) or '') if m else 'unknown'
+
+def store_results(results_path, perftests_path, scores, units, environment, ab=None):
+    """Append the scores of each test to the results file, keyed by commit, test, backend and metric.
+
+    ab is 'A' or 'B' for the binaries of an A/B comparison."""
+    commit_hash, commit_date = get_commit_id(perftests_path)
+    run_time = time.time()
+    host = host_fingerprint()
+    with open(results_path, 'a') as results_file:
+        for test_name, test_scores in scores.items():
+            for metric, values in test_scores.items():
+                record = {
+                    'time': run_time,
+                    'commit': commit_hash,
+                    'commit_date': commit_date,
+                    'host': host,
+                    'binary': perftests_path,
+                    'test': test_name,
+                    'backend': get_backend(test_name),
+                    'metric': metric,
+                    'units': units.get(test_name, {}).get(metric),
+                    'values': values,
+                    'environment': environment,
+                }
+                if ab:
+                    record['ab'] = ab
+                results_file.write(json.dumps(record, sort_keys=True) + '\n')
+    print("Results of %s at commit %s appended to %s." % (perftests_path, commit_hash, results_path))
+
+class StoppingRule:
+    """Decides which tests run in the next experiment."""
+
+    def __init__(self, tests, args, rng):
+        self.active = list(tests)
+        self.args = args
+        self.rng = rng
+        self.experiments = 0
+        self.start_time = time.time()
+        self.experiment_start_time = self.start_time
+        self.widths = {}
+        self.converged_experiments = {}
+        self.out_of_time = False
+
+    def get_tests(self):
+        """Return the tests to run in the next experiment, or none to stop."""
+        if self.experiments >= self.args.experiments:
+            return []
+        if self.args.ci_width is None:
+            return self.active
+
+        # Stop when the next experiment, lasting as long as the last one, would exceed the budget.
+        now = time.time()
+        if self.experiments and self.active and \
+                (now - self.start_time) + (now - self.experiment_start_time) > self.args.time_budget:
+            print("Stopping after %d experiments: the time budget of %ds is spent." % (self.experiments, self.args.time_budget))
+            self.out_of_time = True
+            return []
+        self.experiment_start_time = now
+        return self.active
+
+    def add_experiment(self, samples_of_test):
+        """Stop the tests whose confidence intervals are narrow enough, given their samples."""
+        self.experiments += 1
+        if self.args.ci_width is None or self.experiments < min_adaptive_experiments:
+            return
+
+        for test_name in list(self.active):
+            samples = samples_of_test(test_name)
+            if any(len(sample) < 2 for sample in samples):
+                continue
+            self.widths[test_name] = interval_width(samples, self.rng)
+            if self.widths[test_name] <= self.args.ci_width:
+                print("%s: the confidence interval is %.2f%% wide after %d experiments." % (test_name, self.widths[test_name], self.experiments))
+                self.converged_experiments[test_name] = self.experiments
+                self.active.remove(test_name)
+
+    def get_columns(self):
+        return ['ci width', 'stopped'] if self.args.ci_width is not None else []
+
+    def get_row(self, test_name):
+        """Return the width of the interval of the test and why it stopped."""
+        if self.args.ci_width is None:
+            return []
+        width = '%.2f%%' % self.widths[test_name] if test_name in self.widths else ''
+        if test_name in self.converged_experiments:
+            return [width, 'converged']
+        return [width, 'time budget' if self.out_of_time else 'max experiments']
+
+def summarize(values):
+    """Return the statistics of the summary of the values of a metric."""
+    sorted_values = sorted(values)
+    summary = collections.OrderedDict()
+    summary['samples'] = len(values)
+    summary['mean'] = mean(values)
+    summary['min'] = sorted_values[0]
+    for fraction in summary_percentiles:
+        summary['p%d' % fraction] = percentile(sorted_values, fraction / 100.0)
+    summary['variation'] = coefficient_of_variation(values) * 100.0 if len(values) > 1 else None
+    return summary
+
+def get_summary_records(perftests_path, scores, units):
+    """Return the summary of each metric of each test."""
+    records = []
+    for test_name, test_scores in scores.items():
+        for metric, values in test_scores.items():
+            if not values:
+                continue
+            record = collections.OrderedDict()
+            record['binary'] = perftests_path
+            record['test'] = test_name
+            record['metric'] = metric
+            record['units'] = units.get(test_name, {}).get(metric)
+            record.update(summarize(values))
+            records.append(record)
+    return records
+
+def write_summary(output_path, records):
+    """Write the summary records to a CSV or a JSON file."""
+    with open(output_path, 'wb' if output_path.endswith('.csv') else 'w') as output_file:
+        if output_path.endswith('.csv'):
+            writer = csv.writer(output_file)
+            writer.writerow(records[0].keys() if records else [])
+            for record in records:
+                writer.writerow(['' if value is None else value for value in record.values()])
+        else:
+            json.dump(records, output_file, indent=1)
+    print("Summary written to %s." % output_path)
+
+def format_summary_row(record):
+    """Return the cells of the summary table of a record."""
+    row = [record['test'], record['metric'], record['units'] or '', str(record['samples'])]
+    row += ['%.2f' % record[key] for key in ['mean', 'min'] + ['p%d' % fraction for fraction in summary_percentiles]]
+    row.append('%.2f%%' % record['variation'] if record['variation'] is not None else '')
+    return row
+
+def print_table(header, rows):
+    widths = [max(len(row[column]) for row in [header] + rows) for column in range(len(header))]
+    for row in [header, ['-' * width for width in widths]] + rows:
+        print('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+def run_experiments(perftests_path, args, rng, cache, environment):
+    steps = calibrate(perftests_path, args.tests, cache, args.recalibrate)
+    steps_args = ["--steps-file", write_steps_file(steps)]
+    scores = collections.OrderedDict((test_name, collections.OrderedDict()) for test_name in steps)
+    units = {}
+    stopping_rule = StoppingRule(steps.keys(), args, rng)
+
+    # Loop 'experiments' times, running all the tests in each, or until the tests are stable.
+    while stopping_rule.get_tests():
+        experiment_results = run_tests(perftests_path, stopping_rule.get_tests(), steps_args, units, args)
+
+        for test_name, experiment_scores in get_metric_scores(experiment_results, args.metric).items():
+            test_scores = list(scores.get(test_name, {}).get(args.metric, []))
+            for score in experiment_scores:
+                sys.stdout.write("%s %s: %.2f" % (test_name, args.metric, score))
+                test_scores.append(score)
+
+                if (len(test_scores) > 1):
+                    sys.stdout.write(", mean: %.2f" % mean(test_scores))
+                    sys.stdout.write(", variation: %.2f%%" % (coefficient_of_variation(test_scores) * 100.0))
+
+                if (len(test_scores) > 7):
+                    truncation_n = len(test_scores) >> 3
+                    sys.stdout.write(", truncated mean: %.2f" % truncated_mean(test_scores, truncation_n))
+                    sys.stdout.write(", variation: %.2f%%" % (truncated_cov(test_scores, truncation_n) * 100.0))
+
+                print("")
+
+        add_results(scores, experiment_results)
+        stopping_rule.add_experiment(lambda test_name: [scores[test_name].get(args.metric, [])])
+
+    print("")
+    records = get_summary_records(perftests_path, scores, units)
+    rows = []
+    for record in records:
+        row = format_summary_row(record)
+        row.insert(1, str(steps.get(record['test'], '')))
+        if record['metric'] == args.metric:
+            row += stopping_rule.get_row(record['test'])
+        else:
+            row += [''] * len(stopping_rule.get_columns())
+        rows.append(row)
+    print_table(['test', 'steps', 'metric', 'units', 'samples', 'mean', 'min'] +
+                ['p%d' % fraction for fraction in summary_percentiles] + ['variation'] +
+                stopping_rule.get_columns(), rows)
+    check_calibration(perftests_path, get_metric_scores(scores, args.metric), cache, args.recalibration_variation)
+    if args.output:
+        write_summary(args.output, records)
+    if args.results:
+        store_results(args.results, perftests_path, scores, units, environment)
+
+def compare_scores(baseline, scores, rng):
+    """Return the relative delta of the means, its confidence interval, the p-value and verdict."""
+    delta = relative_delta(baseline, scores)
+    low, high = bootstrap_delta_interval(baseline, scores, rng)
+    p_value = mann_whitney_p_value(baseline, scores)
+
+    # Lower wall_time is better, so B is slower when the whole interval is above zero.
+    significant = p_value < 1.0 - confidence_level and (low > 0 or high < 0)
+    if not significant:
+        verdict = "no significant difference"
+    elif delta > 0:
+        verdict = "regression"
+    else:
+        verdict = "improvement"
+    return delta, low, high, p_value, verdict
+
+def run_ab_experiments(binaries, args, rng, cache, environment):
+    # Both binaries run the same number of steps, calibrated on the baseline, so that they do the
+    # same work.
+    steps = calibrate(binaries[0], args.tests, cache, args.recalibrate)
+    steps_args = ["--steps-file", write_steps_file(steps)]
+    scores = [collections.OrderedDict((test_name, collections.OrderedDict()) for test_name in steps) for binary in binaries]
+    units = [{}, {}]
+    stopping_rule = StoppingRule(steps.keys(), args, rng)
+
+    while stopping_rule.get_tests():
+        # Run both binaries in each experiment, in a random order, so that drift over the
+        # experiments doesn't favor either binary.
+        order = [0, 1]
+        rng.shuffle(order)
+        tests = stopping_rule.get_tests()
+        for index in order:
+            experiment_results = run_tests(binaries[index], tests, steps_args, units[index], args)
+            add_results(scores[index], experiment_results)
+            for test_name, experiment_scores in get_metric_scores(experiment_results, args.metric).items():
+                for score in experiment_scores:
+                    print("%s %s %s: %.2f" % ('AB'[index], test_name, args.metric, score))
+
+        stopping_rule.add_experiment(lambda test_name: [scores[index][test_name].get(args.metric, []) for index in range(2)])
+
+    print("")
+    for index in range(2):
+        print("%s: %s" % ('AB'[index], binaries[index]))
+    print("")
 
-    pattern = metric + r'= ([0-9.]+)'
-    m = re.findall(pattern, output)
-    if m is None:
-        print("Did not find the metric '%s' in the test output:" % metric)
-        print(output)
-        sys.exit(1)
+    rows = []
+    metric_scores = [get_metric_scores(binary_scores, args.metric) for binary_scores in scores]
+    for test_name in metric_scores[0]:
+        baseline = metric_scores[0][test_name]
+        test_scores = metric_scores[1].get(test_name, [])
+        if len(baseline) < 2 or len(test_scores) < 2:
+            continue
+        delta, low, high, p_value, verdict = compare_scores(baseline, test_scores, rng)
+        rows.append([test_name, str(len(test_scores)), '%.2f' % mean(baseline),
+                     '%.2f' % mean(test_scores), '%+.2f%%' % delta,
+                     '[%+.2f%%, %+.2f%%]' % (low, high), '%.4f' % p_value,
+                     verdict] + stopping_rule.get_row(test_name))
+    print_table(['test', 'samples', 'A mean ' + args.metric, 'B mean ' + args.metric, 'delta',
+                 '%d%% confidence interval' % (confidence_level * 100), 'Mann-Whitney p-value',
+                 'result'] + stopping_rule.get_columns(), rows)
+    check_calibration(binaries[0], metric_scores[0], cache, args.recalibration_variation)
+    if args.output:
+        write_summary(args.output, [record for index in range(2)
+                                    for record in get_summary_records(binaries[index], scores[index], units[index])])
+    if args.results:
+        for index in range(2):
+            store_results(args.results, binaries[index], scores[index], units[index], environment,
+                          'AB'[index])
 
-    return [float(value) for value in m]
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    if args.experiments is None:
+        args.experiments = max_experiments if args.ci_width is None else max_adaptive_experiments
 
-# Calibrate the number of steps
-steps = get_results("steps", ["--calibration"])[0]
-print("running with %d steps." % steps)
+    if args.ab:
+        binaries = [os.path.abspath(binary) for binary in args.ab]
+        for binary in binaries:
+            if not os.path.exists(binary):
+                print('Cannot find %s!' % binary)
+                return 1
+    else:
+        perftests_path = find_newest_binary()
+        if perftests_path == None or not os.path.exists(perftests_path):
+            print('Cannot find Release %s!' % binary_name)
+            return 1
+        binaries = [perftests_path]
 
-# Loop 'max_experiments' times, running the tests.
-for experiment in range(max_experiments):
-    experiment_scores = get_results(metric, ["--steps", str(steps)])
+    for binary in binaries:
+        print('Using test executable: ' + binary)
+    print('Tests: ' + ', '.join(args.tests))
 
-    for score in experiment_scores:
-        sys.stdout.write("%s: %.2f" % (metric, score))
-        scores.append(score)
+    cache = CalibrationCache(args.calibration_cache) if args.calibration_cache else None
 
-        if (len(scores) > 1):
-            sys.stdout.write(", mean: %.2f" % mean(scores))
-            sys.stdout.write(", variation: %.2f%%" % (coefficient_of_variation(scores) * 100.0))
+    if args.pin_governor:
+        pin_governor()
+    environment = capture_environment()
+    check_environment(environment)
 
-        if (len(scores) > 7):
-            truncation_n = len(scores) >> 3
-            sys.stdout.write(", truncated mean: %.2f" % truncated_mean(scores, truncation_n))
-            sys.stdout.write(", variation: %.2f%%" % (truncated_cov(scores, truncation_n) * 100.0))
+    try:
+        if args.ab:
+            run_ab_experiments(binaries, args, rng, cache, environment)
+        else:
+            run_experiments(binaries[0], args, rng, cache, environment)
+    except NoResultsError as error:
+        print("%s:" % error)
+        print(error.output)
+        return 1
+    return 0
 
-        print("")
+if __name__ == '__main__':
+    sys.exit(main())
@@ -80,6 +80,8 @@ generators = {
         'src/common/gen_packed_gl_enums.py',
     'proc table':
         'src/libGLESv2/gen_proc_table.py',
+    'Vulkan device format support table':
+        'src/libANGLE/renderer/vulkan/gen_vk_device_format_support_table.py',
     'Vulkan format':
         'src/libANGLE/renderer/vulkan/gen_vk_format_table.py',
     'Vulkan mandatory format support table':
@@ -0,0 +1,209 @@
+#!/usr/bin/python2
+#
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# run_local_shards.py:
+#   Runs the shards of a gtest suite concurrently on the local machine, like trigger.py does on
+#   swarming. By default the shards are selected by GTEST_SHARD_INDEX and GTEST_TOTAL_SHARDS, as on
+#   the bots. With --split filter, the tests are listed first and each shard gets a --gtest_filter
+#   of its tests, which also works for the suites that don't support gtest sharding. The filter of
+#   a shard is split into several runs when it would exceed the command line limits. A shard that
+#   runs longer than --timeout is killed. Prints the merged results and the time of each shard.
+#   Returns 1 when a test or a shard fails.
+
+import argparse
+import multiprocessing
+import multiprocessing.pool
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+import perf_test_runner
+
+# The status lines of gtest, e.g. '[       OK ] Test.Name/ES2_D3D11 (12 ms)'.
+result_pattern = re.compile(r'^\[\s*(OK|FAILED|SKIPPED)\s*\] (\S+\.\S+)(?: \(\d+ ms\))?$')
+
+# Longest --gtest_filter argument of a run. Windows limits the whole command line to 32K
+# characters, and Linux limits each argument to 128K.
+max_filter_length = 16 * 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(os.path.basename(sys.argv[0]))
+    parser.add_argument('gn_path', help='path to GN. (e.g. out/Release)')
+    parser.add_argument('test', help='test name. (e.g. angle_end2end_tests)')
+    parser.add_argument('-s', '--shards', default=multiprocessing.cpu_count(), type=int,
+                        help='number of shards. (default: %d)' % multiprocessing.cpu_count())
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='number of shards running at once. (default: --shards)')
+    parser.add_argument('--split', choices=['env', 'filter'], default='env',
+                        help='how the tests are split: by GTEST_SHARD_INDEX or by --gtest_filter. '
+                        '(default: env)')
+    parser.add_argument('--log-dir', help='directory to write the output of each shard to')
+    parser.add_argument('--timeout', type=float, default=3600,
+                        help='seconds after which a shard is killed, 0 for none. (default: 3600)')
+    parser.add_argument('extra_args', help='extra test command line arguments', nargs='*')
+    return parser.parse_args()
+
+
+# Splits the tests matching the --gtest_filter of the extra arguments into lists of about the
+# same number of tests. Consecutive tests are spread across the shards, since the slow tests of a
+# suite are often next to each other.
+def get_shard_tests(test_path, shards, extra_args):
+    tests = ['*']
+    for arg in extra_args:
+        if arg.startswith('--gtest_filter='):
+            tests = [arg[len('--gtest_filter='):]]
+    test_names = perf_test_runner.list_tests(test_path, tests)
+    return [test_names[index::shards] for index in range(shards)]
+
+
+# Returns the filters running the tests, none of them longer than max_filter_length.
+def get_filters(test_names):
+    filters = []
+    length = 0
+    for test_name in test_names:
+        if not filters or length + len(test_name) + 1 > max_filter_length:
+            filters.append([])
+            length = 0
+        filters[-1].append(test_name)
+        length += len(test_name) + 1
+    return [':'.join(names) for names in filters]
+
+
+# Runs the command, killing it when the shard has run for longer than the timeout. Returns the
+# exit code, the output, and whether it timed out.
+def run_command(command, env, deadline):
+    process = subprocess.Popen(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    timer = None
+    if deadline is not None:
+        timer = threading.Timer(max(0.0, deadline - time.time()), process.kill)
+        timer.start()
+    output = process.communicate()[0]
+    if timer:
+        timer.cancel()
+    timed_out = deadline is not None and time.time() >= deadline and process.returncode != 0
+    return process.returncode, output, timed_out
+
+
+def run_shard(test_path, index, args, shard_tests):
+    env = os.environ.copy()
+    if shard_tests is None:
+        env['GTEST_SHARD_INDEX'] = str(index)
+        env['GTEST_TOTAL_SHARDS'] = str(args.shards)
+        commands = [[test_path] + args.extra_args]
+    else:
+        # gtest uses the last --gtest_filter.
+        commands = [[test_path] + args.extra_args + ['--gtest_filter=' + shard_filter]
+                    for shard_filter in get_filters(shard_tests)]
+
+    start_time = time.time()
+    deadline = start_time + args.timeout if args.timeout else None
+    returncode = 0
+    outputs = []
+    timed_out = False
+    for command in commands:
+        command_returncode, output, timed_out = run_command(command, env, deadline)
+        returncode = returncode or command_returncode
+        outputs.append(output)
+        if timed_out:
+            outputs.append('Shard %d timed out after %d seconds.\n' % (index, args.timeout))
+            break
+    output = ''.join(outputs)
+    duration = time.time() - start_time
+
+    if args.log_dir:
+        with open(os.path.join(args.log_dir, 'shard_%d.log' % index), 'w') as log_file:
+            log_file.write(output)
+
+    results = {'OK': set(), 'FAILED': set(), 'SKIPPED': set()}
+    for line in output.splitlines():
+        match = result_pattern.match(line.strip())
+        if match:
+            results[match.group(1)].add(match.group(2))
+    return {
+        'index': index,
+        'returncode': returncode,
+        'timed_out': timed_out,
+        'duration': duration,
+        'results': results,
+        'output': output
+    }
+
+
+def main():
+    args = parse_args()
+    test_path = os.path.join(args.gn_path, args.test)
+    if sys.platform == 'win32':
+        test_path += '.exe'
+    if not os.path.exists(test_path):
+        print('Cannot find %s!' % test_path)
+        return 1
+    if args.shards < 1:
+        print('--shards must be at least 1')
+        return 1
+    if args.log_dir and not os.path.exists(args.log_dir):
+        os.makedirs(args.log_dir)
+
+    if args.split == 'filter':
+        shard_tests = get_shard_tests(test_path, args.shards, args.extra_args)
+    else:
+        shard_tests = [None] * args.shards
+
+    # With more shards than tests, some shards have no tests.
+    indices = [index for index in range(args.shards) if shard_tests[index] != []]
+    print('Running %d shards of %s' % (len(indices), test_path))
+    start_time = time.time()
+    pool = multiprocessing.pool.ThreadPool(args.jobs or len(indices) or 1)
+    shards = pool.map(lambda index: run_shard(test_path, index, args, shard_tests[index]),
+                      indices)
+    pool.close()
+    duration = time.time() - start_time
+
+    rows = []
+    failed_tests = []
+    failed_shards = []
+    for shard in shards:
+        results = shard['results']
+        failed_tests += list(results['FAILED'])
+        # A shard that crashed or timed out may not have printed a failure.
+        if shard['timed_out'] or (shard['returncode'] != 0 and not results['FAILED']):
+            failed_shards.append(shard)
+        rows.append([
+            str(shard['index']),
+            str(len(results['OK'])),
+            str(len(results['FAILED'])),
+            str(len(results['SKIPPED'])),
+            '%.1f' % shard['duration'],
+            'timeout' if shard['timed_out'] else str(shard['returncode'])
+        ])
+
+    perf_test_runner.print_table(['shard', 'passed', 'failed', 'skipped', 'seconds', 'exit code'],
+                                 rows)
+    print('')
+
+    for shard in failed_shards:
+        if shard['timed_out']:
+            print('Shard %d timed out:' % shard['index'])
+        else:
+            print('Shard %d exited with %d:' % (shard['index'], shard['returncode']))
+        print('\n'.join(shard['output'].splitlines()[-20:]))
+        print('')
+    for test_name in sorted(failed_tests):
+        print('FAILED %s' % test_name)
+
+    passed = sum(len(shard['results']['OK']) for shard in shards)
+    skipped = sum(len(shard['results']['SKIPPED']) for shard in shards)
+    busy = sum(shard['duration'] for shard in shards)
+    print('%d passed, %d failed, %d skipped in %.1f seconds (%.1f shard seconds).' %
+          (passed, len(failed_tests), skipped, duration, busy))
+    return 1 if failed_tests or failed_shards else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
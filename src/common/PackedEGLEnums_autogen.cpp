@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by gen_packed_gl_enums.py using data from packed_egl_enums.json.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -18,205 +18,197 @@ namespace egl
 template <>
 CompositorTiming FromEGLenum<CompositorTiming>(EGLenum from)
 {
-    switch (from)
+    // The EGLenum values are dense, so use a lookup table starting at
+    // EGL_COMPOSITE_DEADLINE_ANDROID.
+    static constexpr CompositorTiming kFromEGLenum[] = {
+        CompositorTiming::CompositeDeadline,         // EGL_COMPOSITE_DEADLINE_ANDROID
+        CompositorTiming::CompositInterval,          // EGL_COMPOSITE_INTERVAL_ANDROID
+        CompositorTiming::CompositToPresentLatency,  // EGL_COMPOSITE_TO_PRESENT_LATENCY_ANDROID
+    };
+
+    EGLenum index = from - EGL_COMPOSITE_DEADLINE_ANDROID;
+    if (index >= ArraySize(kFromEGLenum))
     {
-        case EGL_COMPOSITE_DEADLINE_ANDROID:
-            return CompositorTiming::CompositeDeadline;
-        case EGL_COMPOSITE_INTERVAL_ANDROID:
-            return CompositorTiming::CompositInterval;
-        case EGL_COMPOSITE_TO_PRESENT_LATENCY_ANDROID:
-            return CompositorTiming::CompositToPresentLatency;
-        default:
-            return CompositorTiming::InvalidEnum;
+        return CompositorTiming::InvalidEnum;
     }
+    return kFromEGLenum[index];
 }
 
 EGLenum ToEGLenum(CompositorTiming from)
 {
-    switch (from)
+    static constexpr EGLenum kToEGLenum[] = {
+        EGL_COMPOSITE_DEADLINE_ANDROID,
+        EGL_COMPOSITE_INTERVAL_ANDROID,
+        EGL_COMPOSITE_TO_PRESENT_LATENCY_ANDROID,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToEGLenum))
     {
-        case CompositorTiming::CompositeDeadline:
-            return EGL_COMPOSITE_DEADLINE_ANDROID;
-        case CompositorTiming::CompositInterval:
-            return EGL_COMPOSITE_INTERVAL_ANDROID;
-        case CompositorTiming::CompositToPresentLatency:
-            return EGL_COMPOSITE_TO_PRESENT_LATENCY_ANDROID;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToEGLenum[index];
 }
 
 template <>
 MessageType FromEGLenum<MessageType>(EGLenum from)
 {
-    switch (from)
+    // The EGLenum values are dense, so use a lookup table starting at EGL_DEBUG_MSG_CRITICAL_KHR.
+    static constexpr MessageType kFromEGLenum[] = {
+        MessageType::Critical,  // EGL_DEBUG_MSG_CRITICAL_KHR
+        MessageType::Error,     // EGL_DEBUG_MSG_ERROR_KHR
+        MessageType::Warn,      // EGL_DEBUG_MSG_WARN_KHR
+        MessageType::Info,      // EGL_DEBUG_MSG_INFO_KHR
+    };
+
+    EGLenum index = from - EGL_DEBUG_MSG_CRITICAL_KHR;
+    if (index >= ArraySize(kFromEGLenum))
     {
-        case EGL_DEBUG_MSG_CRITICAL_KHR:
-            return MessageType::Critical;
-        case EGL_DEBUG_MSG_ERROR_KHR:
-            return MessageType::Error;
-        case EGL_DEBUG_MSG_WARN_KHR:
-            return MessageType::Warn;
-        case EGL_DEBUG_MSG_INFO_KHR:
-            return MessageType::Info;
-        default:
-            return MessageType::InvalidEnum;
+        return MessageType::InvalidEnum;
     }
+    return kFromEGLenum[index];
 }
 
 EGLenum ToEGLenum(MessageType from)
 {
-    switch (from)
+    static constexpr EGLenum kToEGLenum[] = {
+        EGL_DEBUG_MSG_CRITICAL_KHR,
+        EGL_DEBUG_MSG_ERROR_KHR,
+        EGL_DEBUG_MSG_WARN_KHR,
+        EGL_DEBUG_MSG_INFO_KHR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToEGLenum))
     {
-        case MessageType::Critical:
-            return EGL_DEBUG_MSG_CRITICAL_KHR;
-        case MessageType::Error:
-            return EGL_DEBUG_MSG_ERROR_KHR;
-        case MessageType::Warn:
-            return EGL_DEBUG_MSG_WARN_KHR;
-        case MessageType::Info:
-            return EGL_DEBUG_MSG_INFO_KHR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToEGLenum[index];
 }
 
 template <>
 ObjectType FromEGLenum<ObjectType>(EGLenum from)
 {
-    switch (from)
+    // The EGLenum values are dense, so use a lookup table starting at EGL_OBJECT_THREAD_KHR.
+    static constexpr ObjectType kFromEGLenum[] = {
+        ObjectType::Thread,   // EGL_OBJECT_THREAD_KHR
+        ObjectType::Display,  // EGL_OBJECT_DISPLAY_KHR
+        ObjectType::Context,  // EGL_OBJECT_CONTEXT_KHR
+        ObjectType::Surface,  // EGL_OBJECT_SURFACE_KHR
+        ObjectType::Image,    // EGL_OBJECT_IMAGE_KHR
+        ObjectType::Sync,     // EGL_OBJECT_SYNC_KHR
+        ObjectType::Stream,   // EGL_OBJECT_STREAM_KHR
+    };
+
+    EGLenum index = from - EGL_OBJECT_THREAD_KHR;
+    if (index >= ArraySize(kFromEGLenum))
     {
-        case EGL_OBJECT_THREAD_KHR:
-            return ObjectType::Thread;
-        case EGL_OBJECT_DISPLAY_KHR:
-            return ObjectType::Display;
-        case EGL_OBJECT_CONTEXT_KHR:
-            return ObjectType::Context;
-        case EGL_OBJECT_SURFACE_KHR:
-            return ObjectType::Surface;
-        case EGL_OBJECT_IMAGE_KHR:
-            return ObjectType::Image;
-        case EGL_OBJECT_SYNC_KHR:
-            return ObjectType::Sync;
-        case EGL_OBJECT_STREAM_KHR:
-            return ObjectType::Stream;
-        default:
-            return ObjectType::InvalidEnum;
+        return ObjectType::InvalidEnum;
     }
+    return kFromEGLenum[index];
 }
 
 EGLenum ToEGLenum(ObjectType from)
 {
-    switch (from)
+    static constexpr EGLenum kToEGLenum[] = {
+        EGL_OBJECT_THREAD_KHR,  EGL_OBJECT_DISPLAY_KHR, EGL_OBJECT_CONTEXT_KHR,
+        EGL_OBJECT_SURFACE_KHR, EGL_OBJECT_IMAGE_KHR,   EGL_OBJECT_SYNC_KHR,
+        EGL_OBJECT_STREAM_KHR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToEGLenum))
     {
-        case ObjectType::Thread:
-            return EGL_OBJECT_THREAD_KHR;
-        case ObjectType::Display:
-            return EGL_OBJECT_DISPLAY_KHR;
-        case ObjectType::Context:
-            return EGL_OBJECT_CONTEXT_KHR;
-        case ObjectType::Surface:
-            return EGL_OBJECT_SURFACE_KHR;
-        case ObjectType::Image:
-            return EGL_OBJECT_IMAGE_KHR;
-        case ObjectType::Sync:
-            return EGL_OBJECT_SYNC_KHR;
-        case ObjectType::Stream:
-            return EGL_OBJECT_STREAM_KHR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToEGLenum[index];
 }
 
 template <>
 TextureFormat FromEGLenum<TextureFormat>(EGLenum from)
 {
-    switch (from)
+    // The EGLenum values are dense, so use a lookup table starting at EGL_NO_TEXTURE.
+    static constexpr TextureFormat kFromEGLenum[] = {
+        TextureFormat::NoTexture,  // EGL_NO_TEXTURE
+        TextureFormat::RGB,        // EGL_TEXTURE_RGB
+        TextureFormat::RGBA,       // EGL_TEXTURE_RGBA
+    };
+
+    EGLenum index = from - EGL_NO_TEXTURE;
+    if (index >= ArraySize(kFromEGLenum))
     {
-        case EGL_NO_TEXTURE:
-            return TextureFormat::NoTexture;
-        case EGL_TEXTURE_RGB:
-            return TextureFormat::RGB;
-        case EGL_TEXTURE_RGBA:
-            return TextureFormat::RGBA;
-        default:
-            return TextureFormat::InvalidEnum;
+        return TextureFormat::InvalidEnum;
     }
+    return kFromEGLenum[index];
 }
 
 EGLenum ToEGLenum(TextureFormat from)
 {
-    switch (from)
+    static constexpr EGLenum kToEGLenum[] = {
+        EGL_NO_TEXTURE,
+        EGL_TEXTURE_RGB,
+        EGL_TEXTURE_RGBA,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToEGLenum))
     {
-        case TextureFormat::NoTexture:
-            return EGL_NO_TEXTURE;
-        case TextureFormat::RGB:
-            return EGL_TEXTURE_RGB;
-        case TextureFormat::RGBA:
-            return EGL_TEXTURE_RGBA;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToEGLenum[index];
 }
 
 template <>
 Timestamp FromEGLenum<Timestamp>(EGLenum from)
 {
-    switch (from)
+    // The EGLenum values are dense, so use a lookup table starting at
+    // EGL_REQUESTED_PRESENT_TIME_ANDROID.
+    static constexpr Timestamp kFromEGLenum[] = {
+        Timestamp::RequestedPresentTime,       // EGL_REQUESTED_PRESENT_TIME_ANDROID
+        Timestamp::RenderingCompleteTime,      // EGL_RENDERING_COMPLETE_TIME_ANDROID
+        Timestamp::CompositionLatchTime,       // EGL_COMPOSITION_LATCH_TIME_ANDROID
+        Timestamp::FirstCompositionStartTime,  // EGL_FIRST_COMPOSITION_START_TIME_ANDROID
+        Timestamp::LastCompositionStartTime,   // EGL_LAST_COMPOSITION_START_TIME_ANDROID
+        Timestamp::
+            FirstCompositionGPUFinishedTime,  // EGL_FIRST_COMPOSITION_GPU_FINISHED_TIME_ANDROID
+        Timestamp::DisplayPresentTime,        // EGL_DISPLAY_PRESENT_TIME_ANDROID
+        Timestamp::DequeueReadyTime,          // EGL_DEQUEUE_READY_TIME_ANDROID
+        Timestamp::ReadsDoneTime,             // EGL_READS_DONE_TIME_ANDROID
+    };
+
+    EGLenum index = from - EGL_REQUESTED_PRESENT_TIME_ANDROID;
+    if (index >= ArraySize(kFromEGLenum))
     {
-        case EGL_REQUESTED_PRESENT_TIME_ANDROID:
-            return Timestamp::RequestedPresentTime;
-        case EGL_RENDERING_COMPLETE_TIME_ANDROID:
-            return Timestamp::RenderingCompleteTime;
-        case EGL_COMPOSITION_LATCH_TIME_ANDROID:
-            return Timestamp::CompositionLatchTime;
-        case EGL_FIRST_COMPOSITION_START_TIME_ANDROID:
-            return Timestamp::FirstCompositionStartTime;
-        case EGL_LAST_COMPOSITION_START_TIME_ANDROID:
-            return Timestamp::LastCompositionStartTime;
-        case EGL_FIRST_COMPOSITION_GPU_FINISHED_TIME_ANDROID:
-            return Timestamp::FirstCompositionGPUFinishedTime;
-        case EGL_DISPLAY_PRESENT_TIME_ANDROID:
-            return Timestamp::DisplayPresentTime;
-        case EGL_DEQUEUE_READY_TIME_ANDROID:
-            return Timestamp::DequeueReadyTime;
-        case EGL_READS_DONE_TIME_ANDROID:
-            return Timestamp::ReadsDoneTime;
-        default:
-            return Timestamp::InvalidEnum;
+        return Timestamp::InvalidEnum;
     }
+    return kFromEGLenum[index];
 }
 
 EGLenum ToEGLenum(Timestamp from)
 {
-    switch (from)
+    static constexpr EGLenum kToEGLenum[] = {
+        EGL_REQUESTED_PRESENT_TIME_ANDROID,
+        EGL_RENDERING_COMPLETE_TIME_ANDROID,
+        EGL_COMPOSITION_LATCH_TIME_ANDROID,
+        EGL_FIRST_COMPOSITION_START_TIME_ANDROID,
+        EGL_LAST_COMPOSITION_START_TIME_ANDROID,
+        EGL_FIRST_COMPOSITION_GPU_FINISHED_TIME_ANDROID,
+        EGL_DISPLAY_PRESENT_TIME_ANDROID,
+        EGL_DEQUEUE_READY_TIME_ANDROID,
+        EGL_READS_DONE_TIME_ANDROID,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToEGLenum))
     {
-        case Timestamp::RequestedPresentTime:
-            return EGL_REQUESTED_PRESENT_TIME_ANDROID;
-        case Timestamp::RenderingCompleteTime:
-            return EGL_RENDERING_COMPLETE_TIME_ANDROID;
-        case Timestamp::CompositionLatchTime:
-            return EGL_COMPOSITION_LATCH_TIME_ANDROID;
-        case Timestamp::FirstCompositionStartTime:
-            return EGL_FIRST_COMPOSITION_START_TIME_ANDROID;
-        case Timestamp::LastCompositionStartTime:
-            return EGL_LAST_COMPOSITION_START_TIME_ANDROID;
-        case Timestamp::FirstCompositionGPUFinishedTime:
-            return EGL_FIRST_COMPOSITION_GPU_FINISHED_TIME_ANDROID;
-        case Timestamp::DisplayPresentTime:
-            return EGL_DISPLAY_PRESENT_TIME_ANDROID;
-        case Timestamp::DequeueReadyTime:
-            return EGL_DEQUEUE_READY_TIME_ANDROID;
-        case Timestamp::ReadsDoneTime:
-            return EGL_READS_DONE_TIME_ANDROID;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToEGLenum[index];
 }
 
 }  // namespace egl
@@ -0,0 +1,56 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// PackedEnums_unittest:
+//   Tests of the generated conversions between packed enums and GLenums.
+//
+
+#include <gtest/gtest.h>
+
+#include "common/PackedEnums.h"
+
+namespace gl
+{
+namespace
+{
+template <typename T>
+void CheckRoundTrip()
+{
+    for (size_t value = 0; value < static_cast<size_t>(T::EnumCount); ++value)
+    {
+        T packed = static_cast<T>(value);
+        EXPECT_EQ(packed, FromGLenum<T>(ToGLenum(packed)));
+    }
+}
+
+// Tests that converting to a GLenum and back gives the original value, both for enums that use a
+// lookup table and enums that use a switch.
+TEST(PackedEnums, RoundTrip)
+{
+    CheckRoundTrip<AlphaTestFunc>();
+    CheckRoundTrip<BufferBinding>();
+    CheckRoundTrip<BufferUsage>();
+    CheckRoundTrip<CullFaceMode>();
+    CheckRoundTrip<LogicalOperation>();
+    CheckRoundTrip<ShaderType>();
+    CheckRoundTrip<TextureType>();
+}
+
+// Tests that values outside of, or in the holes of, a lookup table are rejected.
+TEST(PackedEnums, InvalidValues)
+{
+    EXPECT_EQ(AlphaTestFunc::InvalidEnum, FromGLenum<AlphaTestFunc>(GL_NEVER - 1));
+    EXPECT_EQ(AlphaTestFunc::InvalidEnum, FromGLenum<AlphaTestFunc>(GL_ALWAYS + 1));
+    EXPECT_EQ(AlphaTestFunc::InvalidEnum, FromGLenum<AlphaTestFunc>(0));
+    EXPECT_EQ(AlphaTestFunc::InvalidEnum, FromGLenum<AlphaTestFunc>(0xFFFFFFFF));
+
+    // GL_FRONT_AND_BACK leaves a hole in the table after GL_BACK.
+    EXPECT_EQ(CullFaceMode::InvalidEnum, FromGLenum<CullFaceMode>(GL_BACK + 1));
+    EXPECT_EQ(CullFaceMode::InvalidEnum, FromGLenum<CullFaceMode>(GL_FRONT_AND_BACK + 1));
+
+    EXPECT_EQ(BufferBinding::InvalidEnum, FromGLenum<BufferBinding>(GL_NONE));
+}
+}  // anonymous namespace
+}  // namespace gl
@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by gen_packed_gl_enums.py using data from packed_gl_enums.json.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -18,53 +18,39 @@ namespace gl
 template <>
 AlphaTestFunc FromGLenum<AlphaTestFunc>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_NEVER.
+    static constexpr AlphaTestFunc kFromGLenum[] = {
+        AlphaTestFunc::Never,       // GL_NEVER
+        AlphaTestFunc::Less,        // GL_LESS
+        AlphaTestFunc::Equal,       // GL_EQUAL
+        AlphaTestFunc::Lequal,      // GL_LEQUAL
+        AlphaTestFunc::Greater,     // GL_GREATER
+        AlphaTestFunc::NotEqual,    // GL_NOTEQUAL
+        AlphaTestFunc::Gequal,      // GL_GEQUAL
+        AlphaTestFunc::AlwaysPass,  // GL_ALWAYS
+    };
+
+    GLenum index = from - GL_NEVER;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_ALWAYS:
-            return AlphaTestFunc::AlwaysPass;
-        case GL_EQUAL:
-            return AlphaTestFunc::Equal;
-        case GL_GEQUAL:
-            return AlphaTestFunc::Gequal;
-        case GL_GREATER:
-            return AlphaTestFunc::Greater;
-        case GL_LEQUAL:
-            return AlphaTestFunc::Lequal;
-        case GL_LESS:
-            return AlphaTestFunc::Less;
-        case GL_NEVER:
-            return AlphaTestFunc::Never;
-        case GL_NOTEQUAL:
-            return AlphaTestFunc::NotEqual;
-        default:
-            return AlphaTestFunc::InvalidEnum;
+        return AlphaTestFunc::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(AlphaTestFunc from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_ALWAYS, GL_EQUAL, GL_GEQUAL, GL_GREATER, GL_LEQUAL, GL_LESS, GL_NEVER, GL_NOTEQUAL,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case AlphaTestFunc::AlwaysPass:
-            return GL_ALWAYS;
-        case AlphaTestFunc::Equal:
-            return GL_EQUAL;
-        case AlphaTestFunc::Gequal:
-            return GL_GEQUAL;
-        case AlphaTestFunc::Greater:
-            return GL_GREATER;
-        case AlphaTestFunc::Lequal:
-            return GL_LEQUAL;
-        case AlphaTestFunc::Less:
-            return GL_LESS;
-        case AlphaTestFunc::Never:
-            return GL_NEVER;
-        case AlphaTestFunc::NotEqual:
-            return GL_NOTEQUAL;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -103,92 +89,62 @@ BufferBinding FromGLenum<BufferBinding>(GLenum from)
 
 GLenum ToGLenum(BufferBinding from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_ARRAY_BUFFER,          GL_ATOMIC_COUNTER_BUFFER,     GL_COPY_READ_BUFFER,
+        GL_COPY_WRITE_BUFFER,     GL_DISPATCH_INDIRECT_BUFFER,  GL_DRAW_INDIRECT_BUFFER,
+        GL_ELEMENT_ARRAY_BUFFER,  GL_PIXEL_PACK_BUFFER,         GL_PIXEL_UNPACK_BUFFER,
+        GL_SHADER_STORAGE_BUFFER, GL_TRANSFORM_FEEDBACK_BUFFER, GL_UNIFORM_BUFFER,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case BufferBinding::Array:
-            return GL_ARRAY_BUFFER;
-        case BufferBinding::AtomicCounter:
-            return GL_ATOMIC_COUNTER_BUFFER;
-        case BufferBinding::CopyRead:
-            return GL_COPY_READ_BUFFER;
-        case BufferBinding::CopyWrite:
-            return GL_COPY_WRITE_BUFFER;
-        case BufferBinding::DispatchIndirect:
-            return GL_DISPATCH_INDIRECT_BUFFER;
-        case BufferBinding::DrawIndirect:
-            return GL_DRAW_INDIRECT_BUFFER;
-        case BufferBinding::ElementArray:
-            return GL_ELEMENT_ARRAY_BUFFER;
-        case BufferBinding::PixelPack:
-            return GL_PIXEL_PACK_BUFFER;
-        case BufferBinding::PixelUnpack:
-            return GL_PIXEL_UNPACK_BUFFER;
-        case BufferBinding::ShaderStorage:
-            return GL_SHADER_STORAGE_BUFFER;
-        case BufferBinding::TransformFeedback:
-            return GL_TRANSFORM_FEEDBACK_BUFFER;
-        case BufferBinding::Uniform:
-            return GL_UNIFORM_BUFFER;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 BufferUsage FromGLenum<BufferUsage>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_STREAM_DRAW.
+    static constexpr BufferUsage kFromGLenum[] = {
+        BufferUsage::StreamDraw,  // GL_STREAM_DRAW
+        BufferUsage::StreamRead,  // GL_STREAM_READ
+        BufferUsage::StreamCopy,  // GL_STREAM_COPY
+        BufferUsage::InvalidEnum,
+        BufferUsage::StaticDraw,  // GL_STATIC_DRAW
+        BufferUsage::StaticRead,  // GL_STATIC_READ
+        BufferUsage::StaticCopy,  // GL_STATIC_COPY
+        BufferUsage::InvalidEnum,
+        BufferUsage::DynamicDraw,  // GL_DYNAMIC_DRAW
+        BufferUsage::DynamicRead,  // GL_DYNAMIC_READ
+        BufferUsage::DynamicCopy,  // GL_DYNAMIC_COPY
+    };
+
+    GLenum index = from - GL_STREAM_DRAW;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_DYNAMIC_COPY:
-            return BufferUsage::DynamicCopy;
-        case GL_DYNAMIC_DRAW:
-            return BufferUsage::DynamicDraw;
-        case GL_DYNAMIC_READ:
-            return BufferUsage::DynamicRead;
-        case GL_STATIC_COPY:
-            return BufferUsage::StaticCopy;
-        case GL_STATIC_DRAW:
-            return BufferUsage::StaticDraw;
-        case GL_STATIC_READ:
-            return BufferUsage::StaticRead;
-        case GL_STREAM_COPY:
-            return BufferUsage::StreamCopy;
-        case GL_STREAM_DRAW:
-            return BufferUsage::StreamDraw;
-        case GL_STREAM_READ:
-            return BufferUsage::StreamRead;
-        default:
-            return BufferUsage::InvalidEnum;
+        return BufferUsage::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(BufferUsage from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_DYNAMIC_COPY, GL_DYNAMIC_DRAW, GL_DYNAMIC_READ, GL_STATIC_COPY, GL_STATIC_DRAW,
+        GL_STATIC_READ,  GL_STREAM_COPY,  GL_STREAM_DRAW,  GL_STREAM_READ,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case BufferUsage::DynamicCopy:
-            return GL_DYNAMIC_COPY;
-        case BufferUsage::DynamicDraw:
-            return GL_DYNAMIC_DRAW;
-        case BufferUsage::DynamicRead:
-            return GL_DYNAMIC_READ;
-        case BufferUsage::StaticCopy:
-            return GL_STATIC_COPY;
-        case BufferUsage::StaticDraw:
-            return GL_STATIC_DRAW;
-        case BufferUsage::StaticRead:
-            return GL_STATIC_READ;
-        case BufferUsage::StreamCopy:
-            return GL_STREAM_COPY;
-        case BufferUsage::StreamDraw:
-            return GL_STREAM_DRAW;
-        case BufferUsage::StreamRead:
-            return GL_STREAM_READ;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -213,54 +169,54 @@ ClientVertexArrayType FromGLenum<ClientVertexArrayType>(GLenum from)
 
 GLenum ToGLenum(ClientVertexArrayType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_COLOR_ARRAY,         GL_NORMAL_ARRAY, GL_POINT_SIZE_ARRAY_OES,
+        GL_TEXTURE_COORD_ARRAY, GL_VERTEX_ARRAY,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case ClientVertexArrayType::Color:
-            return GL_COLOR_ARRAY;
-        case ClientVertexArrayType::Normal:
-            return GL_NORMAL_ARRAY;
-        case ClientVertexArrayType::PointSize:
-            return GL_POINT_SIZE_ARRAY_OES;
-        case ClientVertexArrayType::TextureCoord:
-            return GL_TEXTURE_COORD_ARRAY;
-        case ClientVertexArrayType::Vertex:
-            return GL_VERTEX_ARRAY;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 CullFaceMode FromGLenum<CullFaceMode>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_FRONT.
+    static constexpr CullFaceMode kFromGLenum[] = {
+        CullFaceMode::Front,  // GL_FRONT
+        CullFaceMode::Back,   // GL_BACK
+        CullFaceMode::InvalidEnum,  CullFaceMode::InvalidEnum,
+        CullFaceMode::FrontAndBack,  // GL_FRONT_AND_BACK
+    };
+
+    GLenum index = from - GL_FRONT;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_BACK:
-            return CullFaceMode::Back;
-        case GL_FRONT:
-            return CullFaceMode::Front;
-        case GL_FRONT_AND_BACK:
-            return CullFaceMode::FrontAndBack;
-        default:
-            return CullFaceMode::InvalidEnum;
+        return CullFaceMode::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(CullFaceMode from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_BACK,
+        GL_FRONT,
+        GL_FRONT_AND_BACK,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case CullFaceMode::Back:
-            return GL_BACK;
-        case CullFaceMode::Front:
-            return GL_FRONT;
-        case CullFaceMode::FrontAndBack:
-            return GL_FRONT_AND_BACK;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -285,22 +241,21 @@ FilterMode FromGLenum<FilterMode>(GLenum from)
 
 GLenum ToGLenum(FilterMode from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_NEAREST,
+        GL_LINEAR,
+        GL_NEAREST_MIPMAP_NEAREST,
+        GL_NEAREST_MIPMAP_LINEAR,
+        GL_LINEAR_MIPMAP_LINEAR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case FilterMode::Nearest:
-            return GL_NEAREST;
-        case FilterMode::Linear:
-            return GL_LINEAR;
-        case FilterMode::NearestMipmapNearest:
-            return GL_NEAREST_MIPMAP_NEAREST;
-        case FilterMode::NearestMipmapLinear:
-            return GL_NEAREST_MIPMAP_LINEAR;
-        case FilterMode::LinearMipmapLinear:
-            return GL_LINEAR_MIPMAP_LINEAR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -321,18 +276,19 @@ FogMode FromGLenum<FogMode>(GLenum from)
 
 GLenum ToGLenum(FogMode from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_EXP,
+        GL_EXP2,
+        GL_LINEAR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case FogMode::Exp:
-            return GL_EXP;
-        case FogMode::Exp2:
-            return GL_EXP2;
-        case FogMode::Linear:
-            return GL_LINEAR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -355,76 +311,86 @@ GraphicsResetStatus FromGLenum<GraphicsResetStatus>(GLenum from)
 
 GLenum ToGLenum(GraphicsResetStatus from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_NO_ERROR,
+        GL_GUILTY_CONTEXT_RESET,
+        GL_INNOCENT_CONTEXT_RESET,
+        GL_UNKNOWN_CONTEXT_RESET,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case GraphicsResetStatus::NoError:
-            return GL_NO_ERROR;
-        case GraphicsResetStatus::GuiltyContextReset:
-            return GL_GUILTY_CONTEXT_RESET;
-        case GraphicsResetStatus::InnocentContextReset:
-            return GL_INNOCENT_CONTEXT_RESET;
-        case GraphicsResetStatus::UnknownContextReset:
-            return GL_UNKNOWN_CONTEXT_RESET;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 HandleType FromGLenum<HandleType>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_HANDLE_TYPE_OPAQUE_FD_EXT.
+    static constexpr HandleType kFromGLenum[] = {
+        HandleType::OpaqueFd,  // GL_HANDLE_TYPE_OPAQUE_FD_EXT
+    };
+
+    GLenum index = from - GL_HANDLE_TYPE_OPAQUE_FD_EXT;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_HANDLE_TYPE_OPAQUE_FD_EXT:
-            return HandleType::OpaqueFd;
-        default:
-            return HandleType::InvalidEnum;
+        return HandleType::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(HandleType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_HANDLE_TYPE_OPAQUE_FD_EXT,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case HandleType::OpaqueFd:
-            return GL_HANDLE_TYPE_OPAQUE_FD_EXT;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 HintSetting FromGLenum<HintSetting>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_DONT_CARE.
+    static constexpr HintSetting kFromGLenum[] = {
+        HintSetting::DontCare,  // GL_DONT_CARE
+        HintSetting::Fastest,   // GL_FASTEST
+        HintSetting::Nicest,    // GL_NICEST
+    };
+
+    GLenum index = from - GL_DONT_CARE;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_DONT_CARE:
-            return HintSetting::DontCare;
-        case GL_FASTEST:
-            return HintSetting::Fastest;
-        case GL_NICEST:
-            return HintSetting::Nicest;
-        default:
-            return HintSetting::InvalidEnum;
+        return HintSetting::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(HintSetting from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_DONT_CARE,
+        GL_FASTEST,
+        GL_NICEST,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case HintSetting::DontCare:
-            return GL_DONT_CARE;
-        case HintSetting::Fastest:
-            return GL_FASTEST;
-        case HintSetting::Nicest:
-            return GL_NICEST;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -461,118 +427,75 @@ LightParameter FromGLenum<LightParameter>(GLenum from)
 
 GLenum ToGLenum(LightParameter from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_AMBIENT,
+        GL_AMBIENT_AND_DIFFUSE,
+        GL_CONSTANT_ATTENUATION,
+        GL_DIFFUSE,
+        GL_LINEAR_ATTENUATION,
+        GL_POSITION,
+        GL_QUADRATIC_ATTENUATION,
+        GL_SPECULAR,
+        GL_SPOT_CUTOFF,
+        GL_SPOT_DIRECTION,
+        GL_SPOT_EXPONENT,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case LightParameter::Ambient:
-            return GL_AMBIENT;
-        case LightParameter::AmbientAndDiffuse:
-            return GL_AMBIENT_AND_DIFFUSE;
-        case LightParameter::ConstantAttenuation:
-            return GL_CONSTANT_ATTENUATION;
-        case LightParameter::Diffuse:
-            return GL_DIFFUSE;
-        case LightParameter::LinearAttenuation:
-            return GL_LINEAR_ATTENUATION;
-        case LightParameter::Position:
-            return GL_POSITION;
-        case LightParameter::QuadraticAttenuation:
-            return GL_QUADRATIC_ATTENUATION;
-        case LightParameter::Specular:
-            return GL_SPECULAR;
-        case LightParameter::SpotCutoff:
-            return GL_SPOT_CUTOFF;
-        case LightParameter::SpotDirection:
-            return GL_SPOT_DIRECTION;
-        case LightParameter::SpotExponent:
-            return GL_SPOT_EXPONENT;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 LogicalOperation FromGLenum<LogicalOperation>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_CLEAR.
+    static constexpr LogicalOperation kFromGLenum[] = {
+        LogicalOperation::Clear,         // GL_CLEAR
+        LogicalOperation::And,           // GL_AND
+        LogicalOperation::AndReverse,    // GL_AND_REVERSE
+        LogicalOperation::Copy,          // GL_COPY
+        LogicalOperation::AndInverted,   // GL_AND_INVERTED
+        LogicalOperation::Noop,          // GL_NOOP
+        LogicalOperation::Xor,           // GL_XOR
+        LogicalOperation::Or,            // GL_OR
+        LogicalOperation::Nor,           // GL_NOR
+        LogicalOperation::Equiv,         // GL_EQUIV
+        LogicalOperation::Invert,        // GL_INVERT
+        LogicalOperation::OrReverse,     // GL_OR_REVERSE
+        LogicalOperation::CopyInverted,  // GL_COPY_INVERTED
+        LogicalOperation::OrInverted,    // GL_OR_INVERTED
+        LogicalOperation::Nand,          // GL_NAND
+        LogicalOperation::Set,           // GL_SET
+    };
+
+    GLenum index = from - GL_CLEAR;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_AND:
-            return LogicalOperation::And;
-        case GL_AND_INVERTED:
-            return LogicalOperation::AndInverted;
-        case GL_AND_REVERSE:
-            return LogicalOperation::AndReverse;
-        case GL_CLEAR:
-            return LogicalOperation::Clear;
-        case GL_COPY:
-            return LogicalOperation::Copy;
-        case GL_COPY_INVERTED:
-            return LogicalOperation::CopyInverted;
-        case GL_EQUIV:
-            return LogicalOperation::Equiv;
-        case GL_INVERT:
-            return LogicalOperation::Invert;
-        case GL_NAND:
-            return LogicalOperation::Nand;
-        case GL_NOOP:
-            return LogicalOperation::Noop;
-        case GL_NOR:
-            return LogicalOperation::Nor;
-        case GL_OR:
-            return LogicalOperation::Or;
-        case GL_OR_INVERTED:
-            return LogicalOperation::OrInverted;
-        case GL_OR_REVERSE:
-            return LogicalOperation::OrReverse;
-        case GL_SET:
-            return LogicalOperation::Set;
-        case GL_XOR:
-            return LogicalOperation::Xor;
-        default:
-            return LogicalOperation::InvalidEnum;
+        return LogicalOperation::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(LogicalOperation from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_AND,         GL_AND_INVERTED, GL_AND_REVERSE, GL_CLEAR, GL_COPY, GL_COPY_INVERTED,
+        GL_EQUIV,       GL_INVERT,       GL_NAND,        GL_NOOP,  GL_NOR,  GL_OR,
+        GL_OR_INVERTED, GL_OR_REVERSE,   GL_SET,         GL_XOR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case LogicalOperation::And:
-            return GL_AND;
-        case LogicalOperation::AndInverted:
-            return GL_AND_INVERTED;
-        case LogicalOperation::AndReverse:
-            return GL_AND_REVERSE;
-        case LogicalOperation::Clear:
-            return GL_CLEAR;
-        case LogicalOperation::Copy:
-            return GL_COPY;
-        case LogicalOperation::CopyInverted:
-            return GL_COPY_INVERTED;
-        case LogicalOperation::Equiv:
-            return GL_EQUIV;
-        case LogicalOperation::Invert:
-            return GL_INVERT;
-        case LogicalOperation::Nand:
-            return GL_NAND;
-        case LogicalOperation::Noop:
-            return GL_NOOP;
-        case LogicalOperation::Nor:
-            return GL_NOR;
-        case LogicalOperation::Or:
-            return GL_OR;
-        case LogicalOperation::OrInverted:
-            return GL_OR_INVERTED;
-        case LogicalOperation::OrReverse:
-            return GL_OR_REVERSE;
-        case LogicalOperation::Set:
-            return GL_SET;
-        case LogicalOperation::Xor:
-            return GL_XOR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -599,120 +522,122 @@ MaterialParameter FromGLenum<MaterialParameter>(GLenum from)
 
 GLenum ToGLenum(MaterialParameter from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_AMBIENT, GL_AMBIENT_AND_DIFFUSE, GL_DIFFUSE, GL_EMISSION, GL_SHININESS, GL_SPECULAR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case MaterialParameter::Ambient:
-            return GL_AMBIENT;
-        case MaterialParameter::AmbientAndDiffuse:
-            return GL_AMBIENT_AND_DIFFUSE;
-        case MaterialParameter::Diffuse:
-            return GL_DIFFUSE;
-        case MaterialParameter::Emission:
-            return GL_EMISSION;
-        case MaterialParameter::Shininess:
-            return GL_SHININESS;
-        case MaterialParameter::Specular:
-            return GL_SPECULAR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 MatrixType FromGLenum<MatrixType>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_MODELVIEW.
+    static constexpr MatrixType kFromGLenum[] = {
+        MatrixType::Modelview,   // GL_MODELVIEW
+        MatrixType::Projection,  // GL_PROJECTION
+        MatrixType::Texture,     // GL_TEXTURE
+    };
+
+    GLenum index = from - GL_MODELVIEW;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_MODELVIEW:
-            return MatrixType::Modelview;
-        case GL_PROJECTION:
-            return MatrixType::Projection;
-        case GL_TEXTURE:
-            return MatrixType::Texture;
-        default:
-            return MatrixType::InvalidEnum;
+        return MatrixType::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(MatrixType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_MODELVIEW,
+        GL_PROJECTION,
+        GL_TEXTURE,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case MatrixType::Modelview:
-            return GL_MODELVIEW;
-        case MatrixType::Projection:
-            return GL_PROJECTION;
-        case MatrixType::Texture:
-            return GL_TEXTURE;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 PointParameter FromGLenum<PointParameter>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_POINT_SIZE_MIN.
+    static constexpr PointParameter kFromGLenum[] = {
+        PointParameter::PointSizeMin,              // GL_POINT_SIZE_MIN
+        PointParameter::PointSizeMax,              // GL_POINT_SIZE_MAX
+        PointParameter::PointFadeThresholdSize,    // GL_POINT_FADE_THRESHOLD_SIZE
+        PointParameter::PointDistanceAttenuation,  // GL_POINT_DISTANCE_ATTENUATION
+    };
+
+    GLenum index = from - GL_POINT_SIZE_MIN;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_POINT_SIZE_MIN:
-            return PointParameter::PointSizeMin;
-        case GL_POINT_SIZE_MAX:
-            return PointParameter::PointSizeMax;
-        case GL_POINT_FADE_THRESHOLD_SIZE:
-            return PointParameter::PointFadeThresholdSize;
-        case GL_POINT_DISTANCE_ATTENUATION:
-            return PointParameter::PointDistanceAttenuation;
-        default:
-            return PointParameter::InvalidEnum;
+        return PointParameter::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(PointParameter from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_POINT_SIZE_MIN,
+        GL_POINT_SIZE_MAX,
+        GL_POINT_FADE_THRESHOLD_SIZE,
+        GL_POINT_DISTANCE_ATTENUATION,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case PointParameter::PointSizeMin:
-            return GL_POINT_SIZE_MIN;
-        case PointParameter::PointSizeMax:
-            return GL_POINT_SIZE_MAX;
-        case PointParameter::PointFadeThresholdSize:
-            return GL_POINT_FADE_THRESHOLD_SIZE;
-        case PointParameter::PointDistanceAttenuation:
-            return GL_POINT_DISTANCE_ATTENUATION;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 ProvokingVertex FromGLenum<ProvokingVertex>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_FIRST_VERTEX_CONVENTION.
+    static constexpr ProvokingVertex kFromGLenum[] = {
+        ProvokingVertex::FirstVertexConvention,  // GL_FIRST_VERTEX_CONVENTION
+        ProvokingVertex::LastVertexConvention,   // GL_LAST_VERTEX_CONVENTION
+    };
+
+    GLenum index = from - GL_FIRST_VERTEX_CONVENTION;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_FIRST_VERTEX_CONVENTION:
-            return ProvokingVertex::FirstVertexConvention;
-        case GL_LAST_VERTEX_CONVENTION:
-            return ProvokingVertex::LastVertexConvention;
-        default:
-            return ProvokingVertex::InvalidEnum;
+        return ProvokingVertex::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(ProvokingVertex from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_FIRST_VERTEX_CONVENTION,
+        GL_LAST_VERTEX_CONVENTION,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case ProvokingVertex::FirstVertexConvention:
-            return GL_FIRST_VERTEX_CONVENTION;
-        case ProvokingVertex::LastVertexConvention:
-            return GL_LAST_VERTEX_CONVENTION;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -741,26 +666,23 @@ QueryType FromGLenum<QueryType>(GLenum from)
 
 GLenum ToGLenum(QueryType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_ANY_SAMPLES_PASSED,
+        GL_ANY_SAMPLES_PASSED_CONSERVATIVE,
+        GL_COMMANDS_COMPLETED_CHROMIUM,
+        GL_PRIMITIVES_GENERATED_EXT,
+        GL_TIME_ELAPSED_EXT,
+        GL_TIMESTAMP_EXT,
+        GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case QueryType::AnySamples:
-            return GL_ANY_SAMPLES_PASSED;
-        case QueryType::AnySamplesConservative:
-            return GL_ANY_SAMPLES_PASSED_CONSERVATIVE;
-        case QueryType::CommandsCompleted:
-            return GL_COMMANDS_COMPLETED_CHROMIUM;
-        case QueryType::PrimitivesGenerated:
-            return GL_PRIMITIVES_GENERATED_EXT;
-        case QueryType::TimeElapsed:
-            return GL_TIME_ELAPSED_EXT;
-        case QueryType::Timestamp:
-            return GL_TIMESTAMP_EXT;
-        case QueryType::TransformFeedbackPrimitivesWritten:
-            return GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -783,48 +705,53 @@ ShaderType FromGLenum<ShaderType>(GLenum from)
 
 GLenum ToGLenum(ShaderType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_VERTEX_SHADER,
+        GL_FRAGMENT_SHADER,
+        GL_GEOMETRY_SHADER_EXT,
+        GL_COMPUTE_SHADER,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case ShaderType::Vertex:
-            return GL_VERTEX_SHADER;
-        case ShaderType::Fragment:
-            return GL_FRAGMENT_SHADER;
-        case ShaderType::Geometry:
-            return GL_GEOMETRY_SHADER_EXT;
-        case ShaderType::Compute:
-            return GL_COMPUTE_SHADER;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 ShadingModel FromGLenum<ShadingModel>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_FLAT.
+    static constexpr ShadingModel kFromGLenum[] = {
+        ShadingModel::Flat,    // GL_FLAT
+        ShadingModel::Smooth,  // GL_SMOOTH
+    };
+
+    GLenum index = from - GL_FLAT;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_FLAT:
-            return ShadingModel::Flat;
-        case GL_SMOOTH:
-            return ShadingModel::Smooth;
-        default:
-            return ShadingModel::InvalidEnum;
+        return ShadingModel::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(ShadingModel from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_FLAT,
+        GL_SMOOTH,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case ShadingModel::Flat:
-            return GL_FLAT;
-        case ShadingModel::Smooth:
-            return GL_SMOOTH;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -855,28 +782,18 @@ TextureCombine FromGLenum<TextureCombine>(GLenum from)
 
 GLenum ToGLenum(TextureCombine from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_ADD,         GL_ADD_SIGNED, GL_DOT3_RGB, GL_DOT3_RGBA,
+        GL_INTERPOLATE, GL_MODULATE,   GL_REPLACE,  GL_SUBTRACT,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureCombine::Add:
-            return GL_ADD;
-        case TextureCombine::AddSigned:
-            return GL_ADD_SIGNED;
-        case TextureCombine::Dot3Rgb:
-            return GL_DOT3_RGB;
-        case TextureCombine::Dot3Rgba:
-            return GL_DOT3_RGBA;
-        case TextureCombine::Interpolate:
-            return GL_INTERPOLATE;
-        case TextureCombine::Modulate:
-            return GL_MODULATE;
-        case TextureCombine::Replace:
-            return GL_REPLACE;
-        case TextureCombine::Subtract:
-            return GL_SUBTRACT;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -903,24 +820,17 @@ TextureEnvMode FromGLenum<TextureEnvMode>(GLenum from)
 
 GLenum ToGLenum(TextureEnvMode from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_ADD, GL_BLEND, GL_COMBINE, GL_DECAL, GL_MODULATE, GL_REPLACE,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureEnvMode::Add:
-            return GL_ADD;
-        case TextureEnvMode::Blend:
-            return GL_BLEND;
-        case TextureEnvMode::Combine:
-            return GL_COMBINE;
-        case TextureEnvMode::Decal:
-            return GL_DECAL;
-        case TextureEnvMode::Modulate:
-            return GL_MODULATE;
-        case TextureEnvMode::Replace:
-            return GL_REPLACE;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -973,50 +883,21 @@ TextureEnvParameter FromGLenum<TextureEnvParameter>(GLenum from)
 
 GLenum ToGLenum(TextureEnvParameter from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_TEXTURE_ENV_MODE, GL_TEXTURE_ENV_COLOR, GL_COMBINE_RGB,       GL_COMBINE_ALPHA,
+        GL_RGB_SCALE,        GL_ALPHA_SCALE,       GL_SRC0_RGB,          GL_SRC1_RGB,
+        GL_SRC2_RGB,         GL_SRC0_ALPHA,        GL_SRC1_ALPHA,        GL_SRC2_ALPHA,
+        GL_OPERAND0_RGB,     GL_OPERAND1_RGB,      GL_OPERAND2_RGB,      GL_OPERAND0_ALPHA,
+        GL_OPERAND1_ALPHA,   GL_OPERAND2_ALPHA,    GL_COORD_REPLACE_OES,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureEnvParameter::Mode:
-            return GL_TEXTURE_ENV_MODE;
-        case TextureEnvParameter::Color:
-            return GL_TEXTURE_ENV_COLOR;
-        case TextureEnvParameter::CombineRgb:
-            return GL_COMBINE_RGB;
-        case TextureEnvParameter::CombineAlpha:
-            return GL_COMBINE_ALPHA;
-        case TextureEnvParameter::RgbScale:
-            return GL_RGB_SCALE;
-        case TextureEnvParameter::AlphaScale:
-            return GL_ALPHA_SCALE;
-        case TextureEnvParameter::Src0Rgb:
-            return GL_SRC0_RGB;
-        case TextureEnvParameter::Src1Rgb:
-            return GL_SRC1_RGB;
-        case TextureEnvParameter::Src2Rgb:
-            return GL_SRC2_RGB;
-        case TextureEnvParameter::Src0Alpha:
-            return GL_SRC0_ALPHA;
-        case TextureEnvParameter::Src1Alpha:
-            return GL_SRC1_ALPHA;
-        case TextureEnvParameter::Src2Alpha:
-            return GL_SRC2_ALPHA;
-        case TextureEnvParameter::Op0Rgb:
-            return GL_OPERAND0_RGB;
-        case TextureEnvParameter::Op1Rgb:
-            return GL_OPERAND1_RGB;
-        case TextureEnvParameter::Op2Rgb:
-            return GL_OPERAND2_RGB;
-        case TextureEnvParameter::Op0Alpha:
-            return GL_OPERAND0_ALPHA;
-        case TextureEnvParameter::Op1Alpha:
-            return GL_OPERAND1_ALPHA;
-        case TextureEnvParameter::Op2Alpha:
-            return GL_OPERAND2_ALPHA;
-        case TextureEnvParameter::PointCoordReplace:
-            return GL_COORD_REPLACE_OES;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -1035,52 +916,55 @@ TextureEnvTarget FromGLenum<TextureEnvTarget>(GLenum from)
 
 GLenum ToGLenum(TextureEnvTarget from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_TEXTURE_ENV,
+        GL_POINT_SPRITE_OES,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureEnvTarget::Env:
-            return GL_TEXTURE_ENV;
-        case TextureEnvTarget::PointSprite:
-            return GL_POINT_SPRITE_OES;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
 TextureOp FromGLenum<TextureOp>(GLenum from)
 {
-    switch (from)
+    // The GLenum values are dense, so use a lookup table starting at GL_SRC_COLOR.
+    static constexpr TextureOp kFromGLenum[] = {
+        TextureOp::SrcColor,          // GL_SRC_COLOR
+        TextureOp::OneMinusSrcColor,  // GL_ONE_MINUS_SRC_COLOR
+        TextureOp::SrcAlpha,          // GL_SRC_ALPHA
+        TextureOp::OneMinusSrcAlpha,  // GL_ONE_MINUS_SRC_ALPHA
+    };
+
+    GLenum index = from - GL_SRC_COLOR;
+    if (index >= ArraySize(kFromGLenum))
     {
-        case GL_ONE_MINUS_SRC_ALPHA:
-            return TextureOp::OneMinusSrcAlpha;
-        case GL_ONE_MINUS_SRC_COLOR:
-            return TextureOp::OneMinusSrcColor;
-        case GL_SRC_ALPHA:
-            return TextureOp::SrcAlpha;
-        case GL_SRC_COLOR:
-            return TextureOp::SrcColor;
-        default:
-            return TextureOp::InvalidEnum;
+        return TextureOp::InvalidEnum;
     }
+    return kFromGLenum[index];
 }
 
 GLenum ToGLenum(TextureOp from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_ONE_MINUS_SRC_ALPHA,
+        GL_ONE_MINUS_SRC_COLOR,
+        GL_SRC_ALPHA,
+        GL_SRC_COLOR,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureOp::OneMinusSrcAlpha:
-            return GL_ONE_MINUS_SRC_ALPHA;
-        case TextureOp::OneMinusSrcColor:
-            return GL_ONE_MINUS_SRC_COLOR;
-        case TextureOp::SrcAlpha:
-            return GL_SRC_ALPHA;
-        case TextureOp::SrcColor:
-            return GL_SRC_COLOR;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -1103,20 +987,20 @@ TextureSrc FromGLenum<TextureSrc>(GLenum from)
 
 GLenum ToGLenum(TextureSrc from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_CONSTANT,
+        GL_PREVIOUS,
+        GL_PRIMARY_COLOR,
+        GL_TEXTURE,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureSrc::Constant:
-            return GL_CONSTANT;
-        case TextureSrc::Previous:
-            return GL_PREVIOUS;
-        case TextureSrc::PrimaryColor:
-            return GL_PRIMARY_COLOR;
-        case TextureSrc::Texture:
-            return GL_TEXTURE;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -1157,38 +1041,29 @@ TextureTarget FromGLenum<TextureTarget>(GLenum from)
 
 GLenum ToGLenum(TextureTarget from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_TEXTURE_2D,
+        GL_TEXTURE_2D_ARRAY,
+        GL_TEXTURE_2D_MULTISAMPLE,
+        GL_TEXTURE_2D_MULTISAMPLE_ARRAY_OES,
+        GL_TEXTURE_3D,
+        GL_TEXTURE_EXTERNAL_OES,
+        GL_TEXTURE_RECTANGLE_ANGLE,
+        GL_TEXTURE_CUBE_MAP_POSITIVE_X,
+        GL_TEXTURE_CUBE_MAP_NEGATIVE_X,
+        GL_TEXTURE_CUBE_MAP_POSITIVE_Y,
+        GL_TEXTURE_CUBE_MAP_NEGATIVE_Y,
+        GL_TEXTURE_CUBE_MAP_POSITIVE_Z,
+        GL_TEXTURE_CUBE_MAP_NEGATIVE_Z,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureTarget::_2D:
-            return GL_TEXTURE_2D;
-        case TextureTarget::_2DArray:
-            return GL_TEXTURE_2D_ARRAY;
-        case TextureTarget::_2DMultisample:
-            return GL_TEXTURE_2D_MULTISAMPLE;
-        case TextureTarget::_2DMultisampleArray:
-            return GL_TEXTURE_2D_MULTISAMPLE_ARRAY_OES;
-        case TextureTarget::_3D:
-            return GL_TEXTURE_3D;
-        case TextureTarget::External:
-            return GL_TEXTURE_EXTERNAL_OES;
-        case TextureTarget::Rectangle:
-            return GL_TEXTURE_RECTANGLE_ANGLE;
-        case TextureTarget::CubeMapPositiveX:
-            return GL_TEXTURE_CUBE_MAP_POSITIVE_X;
-        case TextureTarget::CubeMapNegativeX:
-            return GL_TEXTURE_CUBE_MAP_NEGATIVE_X;
-        case TextureTarget::CubeMapPositiveY:
-            return GL_TEXTURE_CUBE_MAP_POSITIVE_Y;
-        case TextureTarget::CubeMapNegativeY:
-            return GL_TEXTURE_CUBE_MAP_NEGATIVE_Y;
-        case TextureTarget::CubeMapPositiveZ:
-            return GL_TEXTURE_CUBE_MAP_POSITIVE_Z;
-        case TextureTarget::CubeMapNegativeZ:
-            return GL_TEXTURE_CUBE_MAP_NEGATIVE_Z;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -1219,28 +1094,24 @@ TextureType FromGLenum<TextureType>(GLenum from)
 
 GLenum ToGLenum(TextureType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_TEXTURE_2D,
+        GL_TEXTURE_2D_ARRAY,
+        GL_TEXTURE_2D_MULTISAMPLE,
+        GL_TEXTURE_2D_MULTISAMPLE_ARRAY_OES,
+        GL_TEXTURE_3D,
+        GL_TEXTURE_EXTERNAL_OES,
+        GL_TEXTURE_RECTANGLE_ANGLE,
+        GL_TEXTURE_CUBE_MAP,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case TextureType::_2D:
-            return GL_TEXTURE_2D;
-        case TextureType::_2DArray:
-            return GL_TEXTURE_2D_ARRAY;
-        case TextureType::_2DMultisample:
-            return GL_TEXTURE_2D_MULTISAMPLE;
-        case TextureType::_2DMultisampleArray:
-            return GL_TEXTURE_2D_MULTISAMPLE_ARRAY_OES;
-        case TextureType::_3D:
-            return GL_TEXTURE_3D;
-        case TextureType::External:
-            return GL_TEXTURE_EXTERNAL_OES;
-        case TextureType::Rectangle:
-            return GL_TEXTURE_RECTANGLE_ANGLE;
-        case TextureType::CubeMap:
-            return GL_TEXTURE_CUBE_MAP;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -1265,22 +1136,18 @@ VertexArrayType FromGLenum<VertexArrayType>(GLenum from)
 
 GLenum ToGLenum(VertexArrayType from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_COLOR_ARRAY,         GL_NORMAL_ARRAY, GL_POINT_SIZE_ARRAY_OES,
+        GL_TEXTURE_COORD_ARRAY, GL_VERTEX_ARRAY,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case VertexArrayType::Color:
-            return GL_COLOR_ARRAY;
-        case VertexArrayType::Normal:
-            return GL_NORMAL_ARRAY;
-        case VertexArrayType::PointSize:
-            return GL_POINT_SIZE_ARRAY_OES;
-        case VertexArrayType::TextureCoord:
-            return GL_TEXTURE_COORD_ARRAY;
-        case VertexArrayType::Vertex:
-            return GL_VERTEX_ARRAY;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 template <>
@@ -1303,20 +1170,20 @@ WrapMode FromGLenum<WrapMode>(GLenum from)
 
 GLenum ToGLenum(WrapMode from)
 {
-    switch (from)
+    static constexpr GLenum kToGLenum[] = {
+        GL_CLAMP_TO_EDGE,
+        GL_CLAMP_TO_BORDER,
+        GL_MIRRORED_REPEAT,
+        GL_REPEAT,
+    };
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kToGLenum))
     {
-        case WrapMode::ClampToEdge:
-            return GL_CLAMP_TO_EDGE;
-        case WrapMode::ClampToBorder:
-            return GL_CLAMP_TO_BORDER;
-        case WrapMode::MirroredRepeat:
-            return GL_MIRRORED_REPEAT;
-        case WrapMode::Repeat:
-            return GL_REPEAT;
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }
+    return kToGLenum[index];
 }
 
 }  // namespace gl
@@ -0,0 +1,46 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_format.h:
+//   Layout of the GL call capture files written by libGLESv2 in angle_enable_capture builds and
+//   replayed by angle_perftests.
+//
+//   A capture file starts with kCaptureMagic, kCaptureVersion and the number of entry points of
+//   the build that wrote it, each as a uint32. It is followed by one record per GL call: the
+//   gl::EntryPoint as a uint16, then the parameters in declaration order. EntryPoint::Invalid
+//   marks the end of a frame.
+//
+//   Scalar parameters are stored with a fixed size regardless of the platform: see
+//   capture_param_types in generate_entry_points.py. Pointer parameters start with a uint32:
+//    - kCaptureNullPointer for a null or uncaptured pointer,
+//    - kCaptureBufferOffset followed by a uint64 offset, when the pointer is an offset into a
+//      bound buffer,
+//    - otherwise the size in bytes of the pointed to memory. The memory itself follows for input
+//      parameters, aligned to kCaptureDataAlignment bytes from the start of the file. Output
+//      parameters only record their size, or 0 when it isn't known, so the replay can provide
+//      enough memory to write to.
+//   GLsync parameters are stored as the uint64 value of the sync at capture time.
+//   Arrays of strings are stored as a uint32 count followed by each string as a pointer
+//   parameter, including the null terminator.
+//   All values are little endian.
+
+#ifndef COMMON_CAPTURE_FORMAT_H_
+#define COMMON_CAPTURE_FORMAT_H_
+
+#include <stddef.h>
+#include <stdint.h>
+
+namespace angle
+{
+constexpr uint32_t kCaptureMagic   = 0x50414341;  // "ACAP"
+constexpr uint32_t kCaptureVersion = 1;
+
+constexpr uint32_t kCaptureNullPointer  = 0xFFFFFFFF;
+constexpr uint32_t kCaptureBufferOffset = 0xFFFFFFFE;
+
+constexpr size_t kCaptureDataAlignment = 8;
+}  // namespace angle
+
+#endif  // COMMON_CAPTURE_FORMAT_H_
@@ -7,6 +7,7 @@
 #   NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 import datetime, json, os, sys
+import xml.etree.ElementTree as etree
 from collections import namedtuple
 from collections import OrderedDict
 
@@ -19,12 +20,14 @@ Generators = [
         'output': 'PackedGLEnums',
         'namespace': 'gl',
         'enum_type': 'GLenum',
+        'registry': '../../scripts/gl.xml',
     },
     {
         'json': 'packed_egl_enums.json',
         'output': 'PackedEGLEnums',
         'namespace': 'egl',
         'enum_type': 'EGLenum',
+        'registry': '../../scripts/egl.xml',
     },
 ]
 
@@ -48,6 +51,30 @@ def load_enums(path):
     enums.sort(key=lambda enum: enum.name)
     return enums
 
+def load_registry_enum_values(path):
+    # Maps enum names to their numeric values, skipping values that aren't plain integers.
+    values = {}
+    for enum in etree.parse(path).getroot().iter('enum'):
+        if 'value' not in enum.attrib:
+            continue
+        try:
+            values.setdefault(enum.attrib['name'], int(enum.attrib['value'], 0))
+        except ValueError:
+            pass
+    return values
+
+# Returns the lowest GL value of the enum if the GL values are dense enough to replace the
+# FromGLenum switch with a lookup table, or None. Enums using values missing from the registry
+# keep the switch.
+def get_lookup_table_base(enum, registry_values):
+    if any(value.gl_name not in registry_values for value in enum.values):
+        return None
+    gl_values = [registry_values[value.gl_name] for value in enum.values]
+    span = max(gl_values) - min(gl_values) + 1
+    if span > 2 * len(gl_values):
+        return None
+    return min(gl_values)
+
 def generate_include_guard(path):
     return path.replace(".", "_").upper()
 
@@ -162,32 +189,75 @@ template <>
 
 {api_enum_name} To{api_enum_name}({enum_name} from)
 {{
-    switch (from)
+    static constexpr {api_enum_name} kTo{api_enum_name}[] = {{
+{to_glenum_values}
+    }};
+
+    size_t index = static_cast<size_t>(from);
+    if (index >= ArraySize(kTo{api_enum_name}))
     {{
-{to_glenum_cases}
-        default:
-            UNREACHABLE();
-            return 0;
+        UNREACHABLE();
+        return 0;
     }}
+    return kTo{api_enum_name}[index];
 }}
 """
 
-def write_cpp(enums, path_prefix, file_name, data_source_name, namespace, api_enum_name):
+enum_lookup_implementation_template = """
+template <>
+{enum_name} From{api_enum_name}<{enum_name}>({api_enum_name} from)
+{{
+    // The {api_enum_name} values are dense, so use a lookup table starting at {base_gl_name}.
+    static constexpr {enum_name} kFrom{api_enum_name}[] = {{
+{from_glenum_values}
+    }};
+
+    {api_enum_name} index = from - {base_gl_name};
+    if (index >= ArraySize(kFrom{api_enum_name}))
+    {{
+        return {enum_name}::InvalidEnum;
+    }}
+    return kFrom{api_enum_name}[index];
+}}
+""" + enum_implementation_template[enum_implementation_template.index('\n{api_enum_name} To'):]
+
+def write_cpp(enums, path_prefix, file_name, data_source_name, namespace, api_enum_name,
+              registry_values):
     content = ['']
 
     for enum in enums:
         from_glenum_cases = []
-        to_glenum_cases = []
+        to_glenum_values = []
         for value in enum.values:
             qualified_name = enum.name + '::' + value.name
             from_glenum_cases.append('        case ' + value.gl_name + ':\n            return ' + qualified_name + ';')
-            to_glenum_cases.append('        case ' + qualified_name + ':\n            return ' + value.gl_name + ';')
+            to_glenum_values.append('        ' + value.gl_name + ',')
 
-        content.append(enum_implementation_template.format(
+        lookup_table_base = get_lookup_table_base(enum, registry_values)
+        if lookup_table_base is None:
+            template = enum_implementation_template
+            from_glenum_values = []
+            base_gl_name = None
+        else:
+            template = enum_lookup_implementation_template
+            by_gl_value = {registry_values[value.gl_name]: value for value in enum.values}
+            span = max(by_gl_value.keys()) - lookup_table_base + 1
+            from_glenum_values = []
+            for gl_value in range(lookup_table_base, lookup_table_base + span):
+                value = by_gl_value.get(gl_value)
+                if value is None:
+                    from_glenum_values.append('        ' + enum.name + '::InvalidEnum,')
+                else:
+                    from_glenum_values.append('        ' + enum.name + '::' + value.name + ',  // ' + value.gl_name)
+            base_gl_name = by_gl_value[lookup_table_base].gl_name
+
+        content.append(template.format(
             enum_name = enum.name,
             from_glenum_cases = '\n'.join(from_glenum_cases),
+            from_glenum_values = '\n'.join(from_glenum_values),
+            base_gl_name = base_gl_name,
             max_value = str(enum.max_value),
-            to_glenum_cases = '\n'.join(to_glenum_cases),
+            to_glenum_values = '\n'.join(to_glenum_values),
             api_enum_name = api_enum_name
         ))
 
@@ -213,7 +283,7 @@ def main():
         inputs = []
         outputs = []
         for generator in Generators:
-            inputs += [generator['json']]
+            inputs += [generator['json'], generator['registry']]
             outputs += [
                 generator['output'] + '_autogen.cpp',
                 generator['output'] + '_autogen.h',
@@ -236,8 +306,10 @@ def main():
         namespace = generator['namespace']
         enum_type = generator['enum_type']
         enums = load_enums(path_prefix + json_file)
+        registry_values = load_registry_enum_values(path_prefix + generator['registry'])
         write_header(enums, path_prefix, output_file + '_autogen.h', json_file, namespace, enum_type)
-        write_cpp(enums, path_prefix, output_file + '_autogen.cpp', json_file, namespace, enum_type)
+        write_cpp(enums, path_prefix, output_file + '_autogen.cpp', json_file, namespace, enum_type,
+                  registry_values)
     return 0
 
 
@@ -6,11 +6,17 @@
 # gen_uniform_type_table.py:
 #  Code generation for OpenGL uniform type info tables.
 #  NOTE: don't run this script directly. Run scripts/run_code_generation.py.
+#
+#  With --compact, the GL type is mapped to its table index with a perfect hash instead of a
+#  switch. The hash is searched for at generation time, so it needs the values from gl.xml.
 
 from datetime import date
-
+import argparse
+import os
 import sys
 
+from gen_packed_gl_enums import load_registry_enum_values
+
 all_uniform_types = [
     "GL_NONE",
     "GL_BOOL",
@@ -93,6 +99,13 @@ texture_types = {
     "RECT": "RECTANGLE",
 }
 
+# Values of the ANGLE extension types, which aren't in gl.xml.
+angle_uniform_type_values = {
+    "GL_SAMPLER_2D_RECT_ANGLE": 0x8B63,
+}
+
+registry_path = '../../scripts/gl.xml'
+
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name}.
 //
@@ -118,7 +131,30 @@ constexpr std::array<UniformTypeInfo, {total_count}> kInfoTable =
 {uniform_type_info_data}
 }}}};
 
-size_t GetTypeInfoIndex(GLenum uniformType)
+constexpr std::array<UniformTypeHotInfo, {total_count}> kHotInfoTable =
+{{{{
+{uniform_type_hot_info_data}
+}}}};
+
+{type_info_index}
+}}  // anonymous namespace
+
+const UniformTypeInfo &GetUniformTypeInfo(GLenum uniformType)
+{{
+    ASSERT(kInfoTable[GetTypeInfoIndex(uniformType)].type == uniformType);
+    return kInfoTable[GetTypeInfoIndex(uniformType)];
+}}
+
+const UniformTypeHotInfo &GetUniformTypeHotInfo(GLenum uniformType)
+{{
+    ASSERT(kHotInfoTable[GetTypeInfoIndex(uniformType)].type == uniformType);
+    return kHotInfoTable[GetTypeInfoIndex(uniformType)];
+}}
+
+}}  // namespace gl
+"""
+
+type_index_switch_template = """size_t GetTypeInfoIndex(GLenum uniformType)
 {{
     switch (uniformType)
     {{
@@ -127,19 +163,47 @@ size_t GetTypeInfoIndex(GLenum uniformType)
             UNREACHABLE();
             return 0;
     }}
+}}"""
+
+type_index_hash_template = """// Perfect hash of the uniform types into kTypeInfoSlots. Slots without a type hold {empty_slot}.
+constexpr uint32_t kTypeHashMultiplier = {multiplier};
+constexpr uint32_t kTypeHashShift      = {shift};
+
+constexpr std::array<uint8_t, {slot_count}> kTypeInfoSlots = {{{{
+{slots}
+}}}};
+
+constexpr size_t HashUniformType(GLenum uniformType)
+{{
+    return (static_cast<uint32_t>(uniformType) * kTypeHashMultiplier) >> kTypeHashShift;
 }}
-}}  // anonymous namespace
 
-const UniformTypeInfo &GetUniformTypeInfo(GLenum uniformType)
+constexpr bool HasValidTypeInfoSlots()
 {{
-    ASSERT(kInfoTable[GetTypeInfoIndex(uniformType)].type == uniformType);
-    return kInfoTable[GetTypeInfoIndex(uniformType)];
+    for (size_t index = 0; index < kHotInfoTable.size(); ++index)
+    {{
+        if (kTypeInfoSlots[HashUniformType(kHotInfoTable[index].type)] != index)
+        {{
+            return false;
+        }}
+    }}
+    return true;
 }}
+static_assert(HasValidTypeInfoSlots(), "Uniform type hash doesn't match the GL values");
 
-}}  // namespace gl
-"""
+size_t GetTypeInfoIndex(GLenum uniformType)
+{{
+    size_t index = kTypeInfoSlots[HashUniformType(uniformType)];
+    if (index >= kHotInfoTable.size() || kHotInfoTable[index].type != uniformType)
+    {{
+        UNREACHABLE();
+        return 0;
+    }}
+    return index;
+}}"""
 
 type_info_data_template = """{{{type}, {component_type}, {texture_type}, {transposed_type}, {bool_type}, {sampler_format}, {rows}, {columns}, {components}, {component_size}, {internal_size}, {external_size}, {is_sampler}, {is_matrix}, {is_image} }}"""
+type_hot_info_data_template = """{{{type}, {components}, {component_size}, {is_sampler}}}"""
 type_index_case_template = """case {enum_value}: return {index_value};"""
 
 def cpp_bool(value):
@@ -263,20 +327,70 @@ def gen_type_info(uniform_type):
         is_matrix = get_is_matrix(uniform_type),
         is_image = get_is_image(uniform_type))
 
+def gen_type_hot_info(uniform_type):
+    return type_hot_info_data_template.format(
+        type = uniform_type,
+        components = get_components(uniform_type),
+        component_size = get_component_size(uniform_type),
+        is_sampler = get_is_sampler(uniform_type))
+
 def gen_type_index_case(index, uniform_type):
     return "case " + uniform_type + ": return " + str(index) + ";"
 
+def gen_type_index_switch():
+    uniform_type_index_cases = "\n".join([gen_type_index_case(index, uniform_type) for index, uniform_type in enumerate(all_uniform_types)])
+    return type_index_switch_template.format(uniform_type_index_cases = uniform_type_index_cases)
+
+def find_perfect_hash(values):
+    # Multiplicative hashing: the top bits of value * multiplier. Tries a fixed sequence of odd
+    # multipliers so the output is stable, growing the table until one is collision-free.
+    for bits in range(len(values).bit_length(), 11):
+        for attempt in range(1, 1 << 16):
+            multiplier = ((attempt * 0x9E3779B1) & 0xFFFFFFFF) | 1
+            slots = set(((value * multiplier) & 0xFFFFFFFF) >> (32 - bits) for value in values)
+            if len(slots) == len(values):
+                return multiplier, 32 - bits
+    raise Exception("No perfect hash found for the uniform types")
+
+def gen_type_index_hash(registry_values):
+    values = []
+    for uniform_type in all_uniform_types:
+        if uniform_type in angle_uniform_type_values:
+            values.append(angle_uniform_type_values[uniform_type])
+        else:
+            values.append(registry_values[uniform_type])
+
+    multiplier, shift = find_perfect_hash(values)
+    empty_slot = 0xFF
+    assert len(values) < empty_slot
+    slots = [empty_slot] * (1 << (32 - shift))
+    for index, value in enumerate(values):
+        slots[((value * multiplier) & 0xFFFFFFFF) >> shift] = index
+
+    return type_index_hash_template.format(
+        empty_slot = "0x%X" % empty_slot,
+        multiplier = "0x%Xu" % multiplier,
+        shift = shift,
+        slot_count = len(slots),
+        slots = ", ".join(["0x%X" % slot if slot == empty_slot else str(slot) for slot in slots]))
+
 
 def main():
 
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--compact', action='store_true',
+                        help='Index the table with a perfect hash of the GL type instead of a switch')
+    parser.add_argument('auto_script_command', nargs='?', default='')
+    args = parser.parse_args()
+
     # auto_script parameters.
-    if len(sys.argv) > 1:
-        inputs = []
+    if args.auto_script_command != '':
+        inputs = ['gen_packed_gl_enums.py', registry_path]
         outputs = ['uniform_type_info_autogen.cpp']
 
-        if sys.argv[1] == 'inputs':
+        if args.auto_script_command == 'inputs':
             print ','.join(inputs)
-        elif sys.argv[1] == 'outputs':
+        elif args.auto_script_command == 'outputs':
             print ','.join(outputs)
         else:
             print('Invalid script parameters')
@@ -284,7 +398,13 @@ def main():
         return 0
 
     uniform_type_info_data = ",\n".join([gen_type_info(uniform_type) for uniform_type in all_uniform_types])
-    uniform_type_index_cases = "\n".join([gen_type_index_case(index, uniform_type) for index, uniform_type in enumerate(all_uniform_types)])
+    uniform_type_hot_info_data = ",\n".join([gen_type_hot_info(uniform_type) for uniform_type in all_uniform_types])
+
+    if args.compact:
+        path_prefix = os.path.dirname(os.path.realpath(__file__)) + os.path.sep
+        type_info_index = gen_type_index_hash(load_registry_enum_values(path_prefix + registry_path))
+    else:
+        type_info_index = gen_type_index_switch()
 
     with open('uniform_type_info_autogen.cpp', 'wt') as out_file:
         output_cpp = template_cpp.format(
@@ -292,7 +412,8 @@ def main():
             copyright_year = date.today().year,
             total_count = len(all_uniform_types),
             uniform_type_info_data = uniform_type_info_data,
-            uniform_type_index_cases = uniform_type_index_cases)
+            uniform_type_hot_info_data = uniform_type_hot_info_data,
+            type_info_index = type_info_index)
         out_file.write(output_cpp)
         out_file.close()
     return 0
@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by gen_uniform_type_table.py.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -165,6 +165,70 @@ constexpr std::array<UniformTypeInfo, 62> kInfoTable = {
       SamplerFormat::InvalidEnum, 1, 4, 4, sizeof(GLuint), sizeof(GLuint) * 4, sizeof(GLuint) * 4,
       false, false, false}}};
 
+constexpr std::array<UniformTypeHotInfo, 62> kHotInfoTable = {
+    {{GL_NONE, 0, 0, false},
+     {GL_BOOL, 1, sizeof(GLint), false},
+     {GL_BOOL_VEC2, 2, sizeof(GLint), false},
+     {GL_BOOL_VEC3, 3, sizeof(GLint), false},
+     {GL_BOOL_VEC4, 4, sizeof(GLint), false},
+     {GL_FLOAT, 1, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT2, 4, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT2x3, 6, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT2x4, 8, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT3, 9, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT3x2, 6, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT3x4, 12, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT4, 16, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT4x2, 8, sizeof(GLfloat), false},
+     {GL_FLOAT_MAT4x3, 12, sizeof(GLfloat), false},
+     {GL_FLOAT_VEC2, 2, sizeof(GLfloat), false},
+     {GL_FLOAT_VEC3, 3, sizeof(GLfloat), false},
+     {GL_FLOAT_VEC4, 4, sizeof(GLfloat), false},
+     {GL_IMAGE_2D, 1, sizeof(GLint), false},
+     {GL_IMAGE_2D_ARRAY, 1, sizeof(GLint), false},
+     {GL_IMAGE_3D, 1, sizeof(GLint), false},
+     {GL_IMAGE_CUBE, 1, sizeof(GLint), false},
+     {GL_INT, 1, sizeof(GLint), false},
+     {GL_INT_IMAGE_2D, 1, sizeof(GLint), false},
+     {GL_INT_IMAGE_2D_ARRAY, 1, sizeof(GLint), false},
+     {GL_INT_IMAGE_3D, 1, sizeof(GLint), false},
+     {GL_INT_IMAGE_CUBE, 1, sizeof(GLint), false},
+     {GL_INT_SAMPLER_2D, 1, sizeof(GLint), true},
+     {GL_INT_SAMPLER_2D_ARRAY, 1, sizeof(GLint), true},
+     {GL_INT_SAMPLER_2D_MULTISAMPLE, 1, sizeof(GLint), true},
+     {GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY, 1, sizeof(GLint), true},
+     {GL_INT_SAMPLER_3D, 1, sizeof(GLint), true},
+     {GL_INT_SAMPLER_CUBE, 1, sizeof(GLint), true},
+     {GL_INT_VEC2, 2, sizeof(GLint), false},
+     {GL_INT_VEC3, 3, sizeof(GLint), false},
+     {GL_INT_VEC4, 4, sizeof(GLint), false},
+     {GL_SAMPLER_2D, 1, sizeof(GLint), true},
+     {GL_SAMPLER_2D_ARRAY, 1, sizeof(GLint), true},
+     {GL_SAMPLER_2D_ARRAY_SHADOW, 1, sizeof(GLint), true},
+     {GL_SAMPLER_2D_MULTISAMPLE, 1, sizeof(GLint), true},
+     {GL_SAMPLER_2D_MULTISAMPLE_ARRAY, 1, sizeof(GLint), true},
+     {GL_SAMPLER_2D_RECT_ANGLE, 1, sizeof(GLint), true},
+     {GL_SAMPLER_2D_SHADOW, 1, sizeof(GLint), true},
+     {GL_SAMPLER_3D, 1, sizeof(GLint), true},
+     {GL_SAMPLER_CUBE, 1, sizeof(GLint), true},
+     {GL_SAMPLER_CUBE_SHADOW, 1, sizeof(GLint), true},
+     {GL_SAMPLER_EXTERNAL_OES, 1, sizeof(GLint), true},
+     {GL_UNSIGNED_INT, 1, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_ATOMIC_COUNTER, 1, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_IMAGE_2D, 1, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_IMAGE_2D_ARRAY, 1, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_IMAGE_3D, 1, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_IMAGE_CUBE, 1, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_SAMPLER_2D, 1, sizeof(GLuint), true},
+     {GL_UNSIGNED_INT_SAMPLER_2D_ARRAY, 1, sizeof(GLuint), true},
+     {GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE, 1, sizeof(GLuint), true},
+     {GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY, 1, sizeof(GLuint), true},
+     {GL_UNSIGNED_INT_SAMPLER_3D, 1, sizeof(GLuint), true},
+     {GL_UNSIGNED_INT_SAMPLER_CUBE, 1, sizeof(GLuint), true},
+     {GL_UNSIGNED_INT_VEC2, 2, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_VEC3, 3, sizeof(GLuint), false},
+     {GL_UNSIGNED_INT_VEC4, 4, sizeof(GLuint), false}}};
+
 size_t GetTypeInfoIndex(GLenum uniformType)
 {
     switch (uniformType)
@@ -306,4 +370,10 @@ const UniformTypeInfo &GetUniformTypeInfo(GLenum uniformType)
     return kInfoTable[GetTypeInfoIndex(uniformType)];
 }
 
+const UniformTypeHotInfo &GetUniformTypeHotInfo(GLenum uniformType)
+{
+    ASSERT(kHotInfoTable[GetTypeInfoIndex(uniformType)].type == uniformType);
+    return kHotInfoTable[GetTypeInfoIndex(uniformType)];
+}
+
 }  // namespace gl
@@ -177,6 +177,18 @@ inline constexpr UniformTypeInfo::UniformTypeInfo(GLenum type,
 
 const UniformTypeInfo &GetUniformTypeInfo(GLenum uniformType);
 
+// The fields of UniformTypeInfo used when validating uniform updates, kept in a separate small
+// table so the lookups touch fewer cache lines.
+struct UniformTypeHotInfo
+{
+    GLenum type;
+    uint8_t componentCount;
+    uint8_t componentSize;
+    bool isSampler;
+};
+
+const UniformTypeHotInfo &GetUniformTypeHotInfo(GLenum uniformType);
+
 const char *GetGenericErrorMessage(GLenum error);
 
 unsigned int ElementTypeSize(GLenum elementType);
@@ -495,6 +495,9 @@ struct Extensions
 
     // GL_CHROMIUM_lose_context
     bool loseContextCHROMIUM = false;
+
+    // GL_ANGLE_batch_commands
+    bool batchCommands = false;
 };
 
 struct ExtensionInfo
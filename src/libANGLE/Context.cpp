@@ -3224,6 +3224,9 @@ Extensions Context::generateSupportedExtensions() const
     // GL_CHROMIUM_lose_context is implemented in the frontend
     supportedExtensions.loseContextCHROMIUM = true;
 
+    // GL_ANGLE_batch_commands is implemented in the frontend
+    supportedExtensions.batchCommands = true;
+
     return supportedExtensions;
 }
 
@@ -161,6 +161,7 @@ MSG kInvalidAccessBitsFlush = "The explicit flushing bit may only be set if the
 MSG kInvalidAccessBitsRead = "Invalid access bits when mapping buffer for reading";
 MSG kInvalidAccessBitsReadWrite = "Need to map buffer for either reading or writing.";
 MSG kInvalidAttachment = "Invalid Attachment Type.";
+MSG kInvalidBatchCommand = "Batched command is not a valid entry point or can't be batched.";
 MSG kInvalidBindBufferSize = "Invalid buffer binding size.";
 MSG kInvalidBindUniformLocation = "Location must be less than (MAX_VERTEX_UNIFORM_VECTORS + MAX_FRAGMENT_UNIFORM_VECTORS) * 4";
 MSG kInvalidBlendEquation = "Invalid blend equation.";
@@ -468,6 +469,7 @@ MSG kTransformFeedbackProgramBinary = "Cannot change program binary while progra
 MSG kTransformFeedbackTargetActive = "Target is TRANSFORM_FEEDBACK_BUFFER and transform feedback is currently active.";
 MSG kTransformFeedbackUseProgram = "Cannot change active program while transform feedback is unpaused.";
 MSG kTransformFeedbackVaryingIndexOutOfRange = "Index must be less than the transform feedback varying count in the program.";
+MSG kTruncatedBatchCommand = "Batched command is missing parameters.";
 MSG kTypeNotUnsignedShortByte = "Only UNSIGNED_SHORT and UNSIGNED_BYTE types are supported.";
 MSG kUniformBufferBoundForTransformFeedback = "It is undefined behavior to use an uniform buffer that is bound for transform feedback.";
 MSG kUniformBufferOffsetAlignment = "Offset must be multiple of value of UNIFORM_BUFFER_OFFSET_ALIGNMENT.";
@@ -44,6 +44,11 @@ void Copy32FixedTo32FVertexData(const uint8_t *input, size_t stride, size_t coun
 template <typename T, size_t inputComponentCount, size_t outputComponentCount, bool normalized>
 void CopyTo32FVertexData(const uint8_t *input, size_t stride, size_t count, uint8_t *output);
 
+// Same output as CopyTo32FVertexData, but converts tightly packed input as a single flat array,
+// which the compiler can vectorize. Other input is converted by CopyTo32FVertexData.
+template <typename T, size_t inputComponentCount, size_t outputComponentCount, bool normalized>
+void CopyTo32FVertexDataFlat(const uint8_t *input, size_t stride, size_t count, uint8_t *output);
+
 template <bool isSigned, bool normalized, bool toFloat>
 void CopyXYZ10W2ToXYZW32FVertexData(const uint8_t *input,
                                     size_t stride,
@@ -222,6 +222,64 @@ inline void CopyTo32FVertexData(const uint8_t *input, size_t stride, size_t coun
 namespace priv
 {
 
+template <typename T, bool normalized>
+inline float ConvertComponentTo32F(T value)
+{
+    typedef std::numeric_limits<T> NL;
+
+    // Must match CopyTo32FVertexData bit for bit.
+    if (normalized)
+    {
+        if (NL::is_signed)
+        {
+            const float divisor = 1.0f / (2 * static_cast<float>(NL::max()) + 1);
+            return (2 * static_cast<float>(value) + 1) * divisor;
+        }
+        else
+        {
+            return static_cast<float>(value) / NL::max();
+        }
+    }
+    else
+    {
+        return static_cast<float>(value);
+    }
+}
+
+}  // namespace priv
+
+template <typename T, size_t inputComponentCount, size_t outputComponentCount, bool normalized>
+inline void CopyTo32FVertexDataFlat(const uint8_t *input,
+                                       size_t stride,
+                                       size_t count,
+                                       uint8_t *output)
+{
+    // This would require special padding.
+    static_assert(!(inputComponentCount < 4 && outputComponentCount == 4),
+                  "An inputComponentCount less than 4 and an outputComponentCount equal to 4 "
+                  "is not supported.");
+
+    if (stride == sizeof(T) * inputComponentCount && inputComponentCount == outputComponentCount)
+    {
+        // Input and output components line up one to one, so the whole range is a flat array.
+        const T *flatInput          = reinterpret_cast<const T *>(input);
+        float *floatOutput          = reinterpret_cast<float *>(output);
+        const size_t componentCount = count * inputComponentCount;
+        for (size_t i = 0; i < componentCount; i++)
+        {
+            floatOutput[i] = priv::ConvertComponentTo32F<T, normalized>(flatInput[i]);
+        }
+        return;
+    }
+
+    // Unrolling the loop over the vertices of strided input was measured to be slower.
+    CopyTo32FVertexData<T, inputComponentCount, outputComponentCount, normalized>(input, stride,
+                                                                                  count, output);
+}
+
+namespace priv
+{
+
 template <bool isSigned, bool normalized, bool toFloat>
 static inline void CopyPackedRGB(uint32_t data, uint8_t *output)
 {
@@ -0,0 +1,111 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// copyvertex_unittest:
+//   Tests that the flat vertex conversion functions match the per-vertex ones bit for bit.
+//
+
+#include <gtest/gtest.h>
+
+#include <string.h>
+#include <vector>
+
+#include "angle_gl.h"
+#include "libANGLE/renderer/copyvertex.h"
+
+namespace rx
+{
+namespace
+{
+template <typename T, size_t InputComponentCount, size_t OutputComponentCount, bool Normalized>
+struct VertexFormat
+{
+    using Type                                    = T;
+    static constexpr size_t kInputComponentCount  = InputComponentCount;
+    static constexpr size_t kOutputComponentCount = OutputComponentCount;
+    static constexpr bool kNormalized             = Normalized;
+};
+
+template <typename Format>
+class CopyVertexFlatTest : public testing::Test
+{
+  protected:
+    using T = typename Format::Type;
+
+    // Converts count vertices with both functions and checks that they write the same floats and
+    // nothing past the last vertex.
+    void checkCopy(size_t stride, size_t count)
+    {
+        constexpr size_t kInputComponentCount  = Format::kInputComponentCount;
+        constexpr size_t kOutputComponentCount = Format::kOutputComponentCount;
+        constexpr bool kNormalized             = Format::kNormalized;
+        constexpr size_t kGuardFloats          = 4;
+
+        // Covers the whole range of T, including the extremes the normalization clamps.
+        std::vector<uint8_t> input(stride * count + sizeof(T) * kInputComponentCount);
+        uint32_t seed = 0x9E3779B9u;
+        for (uint8_t &byte : input)
+        {
+            seed = seed * 1664525u + 1013904223u;
+            byte = static_cast<uint8_t>(seed >> 24);
+        }
+
+        const size_t outputFloats = count * kOutputComponentCount + kGuardFloats;
+        std::vector<float> expected(outputFloats, -123.0f);
+        std::vector<float> actual(outputFloats, -123.0f);
+
+        CopyTo32FVertexData<T, kInputComponentCount, kOutputComponentCount, kNormalized>(
+            input.data(), stride, count, reinterpret_cast<uint8_t *>(expected.data()));
+        CopyTo32FVertexDataFlat<T, kInputComponentCount, kOutputComponentCount, kNormalized>(
+            input.data(), stride, count, reinterpret_cast<uint8_t *>(actual.data()));
+
+        ASSERT_EQ(0, memcmp(expected.data(), actual.data(), outputFloats * sizeof(float)))
+            << "stride " << stride << ", count " << count;
+    }
+};
+
+using VertexFormats = testing::Types<VertexFormat<GLbyte, 1, 1, true>,
+                                     VertexFormat<GLbyte, 4, 4, false>,
+                                     VertexFormat<GLubyte, 3, 3, true>,
+                                     VertexFormat<GLubyte, 2, 2, false>,
+                                     VertexFormat<GLshort, 2, 2, true>,
+                                     VertexFormat<GLshort, 3, 3, false>,
+                                     VertexFormat<GLushort, 4, 4, true>,
+                                     VertexFormat<GLushort, 1, 1, false>,
+                                     VertexFormat<GLshort, 2, 3, true>>;
+TYPED_TEST_SUITE(CopyVertexFlatTest, VertexFormats);
+
+// Odd counts and counts that aren't multiples of the vector widths the compiler may use.
+constexpr size_t kMaxSmallCount = 17;
+
+// Tightly packed input, converted as a flat array.
+TYPED_TEST(CopyVertexFlatTest, TightlyPacked)
+{
+    const size_t stride = sizeof(typename TypeParam::Type) * TypeParam::kInputComponentCount;
+    for (size_t count = 0; count <= kMaxSmallCount; ++count)
+    {
+        this->checkCopy(stride, count);
+    }
+    this->checkCopy(stride, 1001);
+}
+
+// Padded input, converted vertex by vertex.
+TYPED_TEST(CopyVertexFlatTest, Strided)
+{
+    const size_t componentsSize =
+        sizeof(typename TypeParam::Type) * TypeParam::kInputComponentCount;
+    for (size_t padding : {1u, 2u, 4u})
+    {
+        // Keep the components aligned.
+        const size_t stride = componentsSize + padding * sizeof(typename TypeParam::Type);
+        for (size_t count = 0; count <= kMaxSmallCount; ++count)
+        {
+            this->checkCopy(stride, count);
+        }
+        this->checkCopy(stride, 1001);
+    }
+}
+}  // anonymous namespace
+}  // namespace rx
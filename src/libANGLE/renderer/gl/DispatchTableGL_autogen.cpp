@@ -10,6 +10,7 @@
 
 #include "libANGLE/renderer/gl/DispatchTableGL_autogen.h"
 
+#include "common/debug.h"
 #include "libANGLE/Version.h"
 #include "libANGLE/renderer/gl/FunctionsGL.h"
 
@@ -17,1902 +18,11433 @@
 #    include "libANGLE/renderer/gl/null_functions.h"
 #endif  // defined(ANGLE_ENABLE_OPENGL_NULL)
 
-// Check for nullptr so extensions do not overwrite core imports.
-#define ASSIGN(NAME, FP) \
-    if (!FP)             \
-    *reinterpret_cast<void **>(&FP) = loadProcAddress(NAME)
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+#    include <algorithm>
+#    include <atomic>
+#    include <bitset>
+#    include <mutex>
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
+// The names requested later are only loaded when the earlier ones aren't found, so extensions do
+// not overwrite core imports.
+#define ASSIGN(NAME, FP) requestProc(ProcName::NAME, reinterpret_cast<void **>(&FP), false)
+#define ASSIGN_CORE(NAME, FP) requestProc(ProcName::NAME, reinterpret_cast<void **>(&FP), true)
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+// Keep the functions that FunctionsGL loaded itself.
+#    define INSTALL_LAZY(INDEX, FP, LAZY) \
+        if (core[INDEX] && !FP)           \
+        FP = &LAZY
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
+#define SAVE_PROC(INDEX, FP) (*procs)[INDEX] = reinterpret_cast<void *>(FP)
+
+#define RESTORE_PROC(INDEX, FP) FP = reinterpret_cast<decltype(FP)>(procs[INDEX])
 
 namespace rx
 {
+enum class DispatchTableGL::ProcName : uint16_t
+{
+    glActiveShaderProgram,
+    glActiveTexture,
+    glAttachShader,
+    glBeginConditionalRender,
+    glBeginQuery,
+    glBeginQueryIndexed,
+    glBeginTransformFeedback,
+    glBindAttribLocation,
+    glBindBuffer,
+    glBindBufferBase,
+    glBindBufferRange,
+    glBindBuffersBase,
+    glBindBuffersRange,
+    glBindFragDataLocation,
+    glBindFragDataLocationIndexed,
+    glBindFramebuffer,
+    glBindImageTexture,
+    glBindImageTextures,
+    glBindProgramPipeline,
+    glBindRenderbuffer,
+    glBindSampler,
+    glBindSamplers,
+    glBindTexture,
+    glBindTextureUnit,
+    glBindTextures,
+    glBindTransformFeedback,
+    glBindVertexArray,
+    glBindVertexBuffer,
+    glBindVertexBuffers,
+    glBlendBarrier,
+    glBlendColor,
+    glBlendEquation,
+    glBlendEquationSeparate,
+    glBlendEquationSeparatei,
+    glBlendEquationi,
+    glBlendFunc,
+    glBlendFuncSeparate,
+    glBlendFuncSeparatei,
+    glBlendFunci,
+    glBlitFramebuffer,
+    glBlitNamedFramebuffer,
+    glBufferData,
+    glBufferStorage,
+    glBufferSubData,
+    glCheckFramebufferStatus,
+    glCheckNamedFramebufferStatus,
+    glClampColor,
+    glClear,
+    glClearBufferData,
+    glClearBufferSubData,
+    glClearBufferfi,
+    glClearBufferfv,
+    glClearBufferiv,
+    glClearBufferuiv,
+    glClearColor,
+    glClearDepth,
+    glClearDepthf,
+    glClearNamedBufferData,
+    glClearNamedBufferSubData,
+    glClearNamedFramebufferfi,
+    glClearNamedFramebufferfv,
+    glClearNamedFramebufferiv,
+    glClearNamedFramebufferuiv,
+    glClearStencil,
+    glClearTexImage,
+    glClearTexSubImage,
+    glClientWaitSync,
+    glClipControl,
+    glColorMask,
+    glColorMaski,
+    glCompileShader,
+    glCompressedTexImage1D,
+    glCompressedTexImage2D,
+    glCompressedTexImage3D,
+    glCompressedTexSubImage1D,
+    glCompressedTexSubImage2D,
+    glCompressedTexSubImage3D,
+    glCompressedTextureSubImage1D,
+    glCompressedTextureSubImage2D,
+    glCompressedTextureSubImage3D,
+    glCopyBufferSubData,
+    glCopyImageSubData,
+    glCopyNamedBufferSubData,
+    glCopyTexImage1D,
+    glCopyTexImage2D,
+    glCopyTexSubImage1D,
+    glCopyTexSubImage2D,
+    glCopyTexSubImage3D,
+    glCopyTextureSubImage1D,
+    glCopyTextureSubImage2D,
+    glCopyTextureSubImage3D,
+    glCoverFillPathInstancedNV,
+    glCoverFillPathNV,
+    glCoverStrokePathInstancedNV,
+    glCoverStrokePathNV,
+    glCoverageModulationNV,
+    glCreateBuffers,
+    glCreateFramebuffers,
+    glCreateProgram,
+    glCreateProgramPipelines,
+    glCreateQueries,
+    glCreateRenderbuffers,
+    glCreateSamplers,
+    glCreateShader,
+    glCreateShaderProgramv,
+    glCreateTextures,
+    glCreateTransformFeedbacks,
+    glCreateVertexArrays,
+    glCullFace,
+    glDebugMessageCallback,
+    glDebugMessageControl,
+    glDebugMessageInsert,
+    glDeleteBuffers,
+    glDeleteFencesNV,
+    glDeleteFramebuffers,
+    glDeletePathsNV,
+    glDeleteProgram,
+    glDeleteProgramPipelines,
+    glDeleteQueries,
+    glDeleteRenderbuffers,
+    glDeleteSamplers,
+    glDeleteShader,
+    glDeleteSync,
+    glDeleteTextures,
+    glDeleteTransformFeedbacks,
+    glDeleteVertexArrays,
+    glDepthFunc,
+    glDepthMask,
+    glDepthRange,
+    glDepthRangeArrayv,
+    glDepthRangeIndexed,
+    glDepthRangef,
+    glDetachShader,
+    glDisable,
+    glDisableVertexArrayAttrib,
+    glDisableVertexAttribArray,
+    glDisablei,
+    glDiscardFramebufferEXT,
+    glDispatchCompute,
+    glDispatchComputeIndirect,
+    glDrawArrays,
+    glDrawArraysIndirect,
+    glDrawArraysInstanced,
+    glDrawArraysInstancedBaseInstance,
+    glDrawBuffer,
+    glDrawBuffers,
+    glDrawElements,
+    glDrawElementsBaseVertex,
+    glDrawElementsIndirect,
+    glDrawElementsInstanced,
+    glDrawElementsInstancedBaseInstance,
+    glDrawElementsInstancedBaseVertex,
+    glDrawElementsInstancedBaseVertexBaseInstance,
+    glDrawRangeElements,
+    glDrawRangeElementsBaseVertex,
+    glDrawTransformFeedback,
+    glDrawTransformFeedbackInstanced,
+    glDrawTransformFeedbackStream,
+    glDrawTransformFeedbackStreamInstanced,
+    glEGLImageTargetRenderbufferStorageOES,
+    glEGLImageTargetTexture2DOES,
+    glEnable,
+    glEnableVertexArrayAttrib,
+    glEnableVertexAttribArray,
+    glEnablei,
+    glEndConditionalRender,
+    glEndQuery,
+    glEndQueryIndexed,
+    glEndTransformFeedback,
+    glFenceSync,
+    glFinish,
+    glFinishFenceNV,
+    glFlush,
+    glFlushMappedBufferRange,
+    glFlushMappedNamedBufferRange,
+    glFramebufferParameteri,
+    glFramebufferRenderbuffer,
+    glFramebufferTexture,
+    glFramebufferTexture1D,
+    glFramebufferTexture2D,
+    glFramebufferTexture3D,
+    glFramebufferTextureLayer,
+    glFramebufferTextureMultiviewOVR,
+    glFrontFace,
+    glGenBuffers,
+    glGenFencesNV,
+    glGenFramebuffers,
+    glGenPathsNV,
+    glGenProgramPipelines,
+    glGenQueries,
+    glGenRenderbuffers,
+    glGenSamplers,
+    glGenTextures,
+    glGenTransformFeedbacks,
+    glGenVertexArrays,
+    glGenerateMipmap,
+    glGenerateTextureMipmap,
+    glGetActiveAtomicCounterBufferiv,
+    glGetActiveAttrib,
+    glGetActiveSubroutineName,
+    glGetActiveSubroutineUniformName,
+    glGetActiveSubroutineUniformiv,
+    glGetActiveUniform,
+    glGetActiveUniformBlockName,
+    glGetActiveUniformBlockiv,
+    glGetActiveUniformName,
+    glGetActiveUniformsiv,
+    glGetAttachedShaders,
+    glGetAttribLocation,
+    glGetBooleani_v,
+    glGetBooleanv,
+    glGetBufferParameteri64v,
+    glGetBufferParameteriv,
+    glGetBufferPointerv,
+    glGetBufferSubData,
+    glGetCompressedTexImage,
+    glGetCompressedTextureImage,
+    glGetCompressedTextureSubImage,
+    glGetDebugMessageLog,
+    glGetDoublei_v,
+    glGetDoublev,
+    glGetError,
+    glGetFenceivNV,
+    glGetFloati_v,
+    glGetFloatv,
+    glGetFragDataIndex,
+    glGetFragDataLocation,
+    glGetFramebufferAttachmentParameteriv,
+    glGetFramebufferParameteriv,
+    glGetGraphicsResetStatus,
+    glGetInteger64i_v,
+    glGetInteger64v,
+    glGetIntegeri_v,
+    glGetIntegerv,
+    glGetInternalformatSampleivNV,
+    glGetInternalformati64v,
+    glGetInternalformativ,
+    glGetMultisamplefv,
+    glGetNamedBufferParameteri64v,
+    glGetNamedBufferParameteriv,
+    glGetNamedBufferPointerv,
+    glGetNamedBufferSubData,
+    glGetNamedFramebufferAttachmentParameteriv,
+    glGetNamedFramebufferParameteriv,
+    glGetNamedRenderbufferParameteriv,
+    glGetObjectLabel,
+    glGetObjectPtrLabel,
+    glGetPathParameterfvNV,
+    glGetPathParameterivNV,
+    glGetPointerv,
+    glGetProgramBinary,
+    glGetProgramInfoLog,
+    glGetProgramInterfaceiv,
+    glGetProgramPipelineInfoLog,
+    glGetProgramPipelineiv,
+    glGetProgramResourceIndex,
+    glGetProgramResourceLocation,
+    glGetProgramResourceLocationIndex,
+    glGetProgramResourceName,
+    glGetProgramResourceiv,
+    glGetProgramStageiv,
+    glGetProgramiv,
+    glGetQueryBufferObjecti64v,
+    glGetQueryBufferObjectiv,
+    glGetQueryBufferObjectui64v,
+    glGetQueryBufferObjectuiv,
+    glGetQueryIndexediv,
+    glGetQueryObjecti64v,
+    glGetQueryObjectiv,
+    glGetQueryObjectui64v,
+    glGetQueryObjectuiv,
+    glGetQueryiv,
+    glGetRenderbufferParameteriv,
+    glGetSamplerParameterIiv,
+    glGetSamplerParameterIuiv,
+    glGetSamplerParameterfv,
+    glGetSamplerParameteriv,
+    glGetShaderInfoLog,
+    glGetShaderPrecisionFormat,
+    glGetShaderSource,
+    glGetShaderiv,
+    glGetString,
+    glGetStringi,
+    glGetSubroutineIndex,
+    glGetSubroutineUniformLocation,
+    glGetSynciv,
+    glGetTexImage,
+    glGetTexLevelParameterfv,
+    glGetTexLevelParameteriv,
+    glGetTexParameterIiv,
+    glGetTexParameterIuiv,
+    glGetTexParameterfv,
+    glGetTexParameteriv,
+    glGetTextureImage,
+    glGetTextureLevelParameterfv,
+    glGetTextureLevelParameteriv,
+    glGetTextureParameterIiv,
+    glGetTextureParameterIuiv,
+    glGetTextureParameterfv,
+    glGetTextureParameteriv,
+    glGetTextureSubImage,
+    glGetTransformFeedbackVarying,
+    glGetTransformFeedbacki64_v,
+    glGetTransformFeedbacki_v,
+    glGetTransformFeedbackiv,
+    glGetUniformBlockIndex,
+    glGetUniformIndices,
+    glGetUniformLocation,
+    glGetUniformSubroutineuiv,
+    glGetUniformdv,
+    glGetUniformfv,
+    glGetUniformiv,
+    glGetUniformuiv,
+    glGetVertexArrayIndexed64iv,
+    glGetVertexArrayIndexediv,
+    glGetVertexArrayiv,
+    glGetVertexAttribIiv,
+    glGetVertexAttribIuiv,
+    glGetVertexAttribLdv,
+    glGetVertexAttribPointerv,
+    glGetVertexAttribdv,
+    glGetVertexAttribfv,
+    glGetVertexAttribiv,
+    glGetnCompressedTexImage,
+    glGetnTexImage,
+    glGetnUniformdv,
+    glGetnUniformfv,
+    glGetnUniformiv,
+    glGetnUniformuiv,
+    glHint,
+    glInsertEventMarkerEXT,
+    glInvalidateBufferData,
+    glInvalidateBufferSubData,
+    glInvalidateFramebuffer,
+    glInvalidateNamedFramebufferData,
+    glInvalidateNamedFramebufferSubData,
+    glInvalidateSubFramebuffer,
+    glInvalidateTexImage,
+    glInvalidateTexSubImage,
+    glIsBuffer,
+    glIsEnabled,
+    glIsEnabledi,
+    glIsFenceNV,
+    glIsFramebuffer,
+    glIsPathNV,
+    glIsProgram,
+    glIsProgramPipeline,
+    glIsQuery,
+    glIsRenderbuffer,
+    glIsSampler,
+    glIsShader,
+    glIsSync,
+    glIsTexture,
+    glIsTransformFeedback,
+    glIsVertexArray,
+    glLineWidth,
+    glLinkProgram,
+    glLogicOp,
+    glMapBuffer,
+    glMapBufferRange,
+    glMapNamedBuffer,
+    glMapNamedBufferRange,
+    glMatrixLoadfEXT,
+    glMaxShaderCompilerThreadsARB,
+    glMaxShaderCompilerThreadsKHR,
+    glMemoryBarrier,
+    glMemoryBarrierByRegion,
+    glMinSampleShading,
+    glMultiDrawArrays,
+    glMultiDrawArraysIndirect,
+    glMultiDrawElements,
+    glMultiDrawElementsBaseVertex,
+    glMultiDrawElementsIndirect,
+    glNamedBufferData,
+    glNamedBufferStorage,
+    glNamedBufferSubData,
+    glNamedFramebufferDrawBuffer,
+    glNamedFramebufferDrawBuffers,
+    glNamedFramebufferParameteri,
+    glNamedFramebufferReadBuffer,
+    glNamedFramebufferRenderbuffer,
+    glNamedFramebufferTexture,
+    glNamedFramebufferTextureLayer,
+    glNamedRenderbufferStorage,
+    glNamedRenderbufferStorageMultisample,
+    glObjectLabel,
+    glObjectPtrLabel,
+    glPatchParameterfv,
+    glPatchParameteri,
+    glPathCommandsNV,
+    glPathParameterfNV,
+    glPathParameteriNV,
+    glPathStencilFuncNV,
+    glPauseTransformFeedback,
+    glPixelStoref,
+    glPixelStorei,
+    glPointParameterf,
+    glPointParameterfv,
+    glPointParameteri,
+    glPointParameteriv,
+    glPointSize,
+    glPolygonMode,
+    glPolygonOffset,
+    glPopDebugGroup,
+    glPopGroupMarkerEXT,
+    glPrimitiveBoundingBox,
+    glPrimitiveRestartIndex,
+    glProgramBinary,
+    glProgramParameteri,
+    glProgramPathFragmentInputGenNV,
+    glProgramUniform1d,
+    glProgramUniform1dv,
+    glProgramUniform1f,
+    glProgramUniform1fv,
+    glProgramUniform1i,
+    glProgramUniform1iv,
+    glProgramUniform1ui,
+    glProgramUniform1uiv,
+    glProgramUniform2d,
+    glProgramUniform2dv,
+    glProgramUniform2f,
+    glProgramUniform2fv,
+    glProgramUniform2i,
+    glProgramUniform2iv,
+    glProgramUniform2ui,
+    glProgramUniform2uiv,
+    glProgramUniform3d,
+    glProgramUniform3dv,
+    glProgramUniform3f,
+    glProgramUniform3fv,
+    glProgramUniform3i,
+    glProgramUniform3iv,
+    glProgramUniform3ui,
+    glProgramUniform3uiv,
+    glProgramUniform4d,
+    glProgramUniform4dv,
+    glProgramUniform4f,
+    glProgramUniform4fv,
+    glProgramUniform4i,
+    glProgramUniform4iv,
+    glProgramUniform4ui,
+    glProgramUniform4uiv,
+    glProgramUniformMatrix2dv,
+    glProgramUniformMatrix2fv,
+    glProgramUniformMatrix2x3dv,
+    glProgramUniformMatrix2x3fv,
+    glProgramUniformMatrix2x4dv,
+    glProgramUniformMatrix2x4fv,
+    glProgramUniformMatrix3dv,
+    glProgramUniformMatrix3fv,
+    glProgramUniformMatrix3x2dv,
+    glProgramUniformMatrix3x2fv,
+    glProgramUniformMatrix3x4dv,
+    glProgramUniformMatrix3x4fv,
+    glProgramUniformMatrix4dv,
+    glProgramUniformMatrix4fv,
+    glProgramUniformMatrix4x2dv,
+    glProgramUniformMatrix4x2fv,
+    glProgramUniformMatrix4x3dv,
+    glProgramUniformMatrix4x3fv,
+    glProvokingVertex,
+    glPushDebugGroup,
+    glPushGroupMarkerEXT,
+    glQueryCounter,
+    glReadBuffer,
+    glReadPixels,
+    glReadnPixels,
+    glReleaseShaderCompiler,
+    glRenderbufferStorage,
+    glRenderbufferStorageMultisample,
+    glResumeTransformFeedback,
+    glSampleCoverage,
+    glSampleMaski,
+    glSamplerParameterIiv,
+    glSamplerParameterIuiv,
+    glSamplerParameterf,
+    glSamplerParameterfv,
+    glSamplerParameteri,
+    glSamplerParameteriv,
+    glScissor,
+    glScissorArrayv,
+    glScissorIndexed,
+    glScissorIndexedv,
+    glSetFenceNV,
+    glShaderBinary,
+    glShaderSource,
+    glShaderStorageBlockBinding,
+    glStencilFillPathInstancedNV,
+    glStencilFillPathNV,
+    glStencilFunc,
+    glStencilFuncSeparate,
+    glStencilMask,
+    glStencilMaskSeparate,
+    glStencilOp,
+    glStencilOpSeparate,
+    glStencilStrokePathInstancedNV,
+    glStencilStrokePathNV,
+    glStencilThenCoverFillPathInstancedNV,
+    glStencilThenCoverFillPathNV,
+    glStencilThenCoverStrokePathInstancedNV,
+    glStencilThenCoverStrokePathNV,
+    glTestFenceNV,
+    glTexBuffer,
+    glTexBufferRange,
+    glTexImage1D,
+    glTexImage2D,
+    glTexImage2DMultisample,
+    glTexImage3D,
+    glTexImage3DMultisample,
+    glTexParameterIiv,
+    glTexParameterIuiv,
+    glTexParameterf,
+    glTexParameterfv,
+    glTexParameteri,
+    glTexParameteriv,
+    glTexStorage1D,
+    glTexStorage2D,
+    glTexStorage2DMultisample,
+    glTexStorage3D,
+    glTexStorage3DMultisample,
+    glTexSubImage1D,
+    glTexSubImage2D,
+    glTexSubImage3D,
+    glTextureBarrier,
+    glTextureBuffer,
+    glTextureBufferRange,
+    glTextureParameterIiv,
+    glTextureParameterIuiv,
+    glTextureParameterf,
+    glTextureParameterfv,
+    glTextureParameteri,
+    glTextureParameteriv,
+    glTextureStorage1D,
+    glTextureStorage2D,
+    glTextureStorage2DMultisample,
+    glTextureStorage3D,
+    glTextureStorage3DMultisample,
+    glTextureSubImage1D,
+    glTextureSubImage2D,
+    glTextureSubImage3D,
+    glTextureView,
+    glTransformFeedbackBufferBase,
+    glTransformFeedbackBufferRange,
+    glTransformFeedbackVaryings,
+    glUniform1d,
+    glUniform1dv,
+    glUniform1f,
+    glUniform1fv,
+    glUniform1i,
+    glUniform1iv,
+    glUniform1ui,
+    glUniform1uiv,
+    glUniform2d,
+    glUniform2dv,
+    glUniform2f,
+    glUniform2fv,
+    glUniform2i,
+    glUniform2iv,
+    glUniform2ui,
+    glUniform2uiv,
+    glUniform3d,
+    glUniform3dv,
+    glUniform3f,
+    glUniform3fv,
+    glUniform3i,
+    glUniform3iv,
+    glUniform3ui,
+    glUniform3uiv,
+    glUniform4d,
+    glUniform4dv,
+    glUniform4f,
+    glUniform4fv,
+    glUniform4i,
+    glUniform4iv,
+    glUniform4ui,
+    glUniform4uiv,
+    glUniformBlockBinding,
+    glUniformMatrix2dv,
+    glUniformMatrix2fv,
+    glUniformMatrix2x3dv,
+    glUniformMatrix2x3fv,
+    glUniformMatrix2x4dv,
+    glUniformMatrix2x4fv,
+    glUniformMatrix3dv,
+    glUniformMatrix3fv,
+    glUniformMatrix3x2dv,
+    glUniformMatrix3x2fv,
+    glUniformMatrix3x4dv,
+    glUniformMatrix3x4fv,
+    glUniformMatrix4dv,
+    glUniformMatrix4fv,
+    glUniformMatrix4x2dv,
+    glUniformMatrix4x2fv,
+    glUniformMatrix4x3dv,
+    glUniformMatrix4x3fv,
+    glUniformSubroutinesuiv,
+    glUnmapBuffer,
+    glUnmapNamedBuffer,
+    glUseProgram,
+    glUseProgramStages,
+    glValidateProgram,
+    glValidateProgramPipeline,
+    glVertexArrayAttribBinding,
+    glVertexArrayAttribFormat,
+    glVertexArrayAttribIFormat,
+    glVertexArrayAttribLFormat,
+    glVertexArrayBindingDivisor,
+    glVertexArrayElementBuffer,
+    glVertexArrayVertexBuffer,
+    glVertexArrayVertexBuffers,
+    glVertexAttrib1d,
+    glVertexAttrib1dv,
+    glVertexAttrib1f,
+    glVertexAttrib1fv,
+    glVertexAttrib1s,
+    glVertexAttrib1sv,
+    glVertexAttrib2d,
+    glVertexAttrib2dv,
+    glVertexAttrib2f,
+    glVertexAttrib2fv,
+    glVertexAttrib2s,
+    glVertexAttrib2sv,
+    glVertexAttrib3d,
+    glVertexAttrib3dv,
+    glVertexAttrib3f,
+    glVertexAttrib3fv,
+    glVertexAttrib3s,
+    glVertexAttrib3sv,
+    glVertexAttrib4Nbv,
+    glVertexAttrib4Niv,
+    glVertexAttrib4Nsv,
+    glVertexAttrib4Nub,
+    glVertexAttrib4Nubv,
+    glVertexAttrib4Nuiv,
+    glVertexAttrib4Nusv,
+    glVertexAttrib4bv,
+    glVertexAttrib4d,
+    glVertexAttrib4dv,
+    glVertexAttrib4f,
+    glVertexAttrib4fv,
+    glVertexAttrib4iv,
+    glVertexAttrib4s,
+    glVertexAttrib4sv,
+    glVertexAttrib4ubv,
+    glVertexAttrib4uiv,
+    glVertexAttrib4usv,
+    glVertexAttribBinding,
+    glVertexAttribDivisor,
+    glVertexAttribFormat,
+    glVertexAttribI1i,
+    glVertexAttribI1iv,
+    glVertexAttribI1ui,
+    glVertexAttribI1uiv,
+    glVertexAttribI2i,
+    glVertexAttribI2iv,
+    glVertexAttribI2ui,
+    glVertexAttribI2uiv,
+    glVertexAttribI3i,
+    glVertexAttribI3iv,
+    glVertexAttribI3ui,
+    glVertexAttribI3uiv,
+    glVertexAttribI4bv,
+    glVertexAttribI4i,
+    glVertexAttribI4iv,
+    glVertexAttribI4sv,
+    glVertexAttribI4ubv,
+    glVertexAttribI4ui,
+    glVertexAttribI4uiv,
+    glVertexAttribI4usv,
+    glVertexAttribIFormat,
+    glVertexAttribIPointer,
+    glVertexAttribL1d,
+    glVertexAttribL1dv,
+    glVertexAttribL2d,
+    glVertexAttribL2dv,
+    glVertexAttribL3d,
+    glVertexAttribL3dv,
+    glVertexAttribL4d,
+    glVertexAttribL4dv,
+    glVertexAttribLFormat,
+    glVertexAttribLPointer,
+    glVertexAttribP1ui,
+    glVertexAttribP1uiv,
+    glVertexAttribP2ui,
+    glVertexAttribP2uiv,
+    glVertexAttribP3ui,
+    glVertexAttribP3uiv,
+    glVertexAttribP4ui,
+    glVertexAttribP4uiv,
+    glVertexAttribPointer,
+    glVertexBindingDivisor,
+    glViewport,
+    glViewportArrayv,
+    glViewportIndexedf,
+    glViewportIndexedfv,
+    glWaitSync,
+    glActiveShaderProgramEXT,
+    glActiveTextureARB,
+    glBeginQueryARB,
+    glBeginQueryEXT,
+    glBeginTransformFeedbackEXT,
+    glBindAttribLocationARB,
+    glBindBufferARB,
+    glBindBufferBaseEXT,
+    glBindBufferRangeEXT,
+    glBindFragDataLocationEXT,
+    glBindFragDataLocationIndexedEXT,
+    glBindFramebufferEXT,
+    glBindImageTextureEXT,
+    glBindProgramPipelineEXT,
+    glBindRenderbufferEXT,
+    glBindTextureEXT,
+    glBindVertexArrayOES,
+    glBlendColorEXT,
+    glBlendEquationEXT,
+    glBlendEquationSeparateEXT,
+    glBlendEquationSeparateiARB,
+    glBlendEquationSeparateiEXT,
+    glBlendEquationSeparateiOES,
+    glBlendEquationiARB,
+    glBlendEquationiEXT,
+    glBlendEquationiOES,
+    glBlendFuncSeparateEXT,
+    glBlendFuncSeparateiARB,
+    glBlendFuncSeparateiEXT,
+    glBlendFuncSeparateiOES,
+    glBlendFunciARB,
+    glBlendFunciEXT,
+    glBlendFunciOES,
+    glBlitFramebufferEXT,
+    glBufferDataARB,
+    glBufferStorageEXT,
+    glBufferSubDataARB,
+    glCheckFramebufferStatusEXT,
+    glCheckNamedFramebufferStatusEXT,
+    glClampColorARB,
+    glClearDepthfOES,
+    glClearNamedBufferDataEXT,
+    glClearNamedBufferSubDataEXT,
+    glClearTexImageEXT,
+    glClearTexSubImageEXT,
+    glClipControlEXT,
+    glColorMaskiEXT,
+    glColorMaskiOES,
+    glCompileShaderARB,
+    glCompressedTexImage1DARB,
+    glCompressedTexImage2DARB,
+    glCompressedTexImage3DARB,
+    glCompressedTexImage3DOES,
+    glCompressedTexSubImage1DARB,
+    glCompressedTexSubImage2DARB,
+    glCompressedTexSubImage3DARB,
+    glCompressedTexSubImage3DOES,
+    glCompressedTextureSubImage1DEXT,
+    glCompressedTextureSubImage2DEXT,
+    glCompressedTextureSubImage3DEXT,
+    glCopyImageSubDataEXT,
+    glCopyImageSubDataOES,
+    glCopyTexImage1DEXT,
+    glCopyTexImage2DEXT,
+    glCopyTexSubImage1DEXT,
+    glCopyTexSubImage2DEXT,
+    glCopyTexSubImage3DEXT,
+    glCopyTexSubImage3DOES,
+    glCopyTextureSubImage1DEXT,
+    glCopyTextureSubImage2DEXT,
+    glCopyTextureSubImage3DEXT,
+    glCreateShaderProgramvEXT,
+    glDebugMessageCallbackARB,
+    glDebugMessageCallbackKHR,
+    glDebugMessageControlARB,
+    glDebugMessageControlKHR,
+    glDebugMessageInsertARB,
+    glDebugMessageInsertKHR,
+    glDeleteBuffersARB,
+    glDeleteFramebuffersEXT,
+    glDeleteProgramPipelinesEXT,
+    glDeleteQueriesARB,
+    glDeleteQueriesEXT,
+    glDeleteRenderbuffersEXT,
+    glDeleteTexturesEXT,
+    glDeleteVertexArraysOES,
+    glDepthRangefOES,
+    glDisableVertexArrayAttribEXT,
+    glDisableVertexAttribArrayARB,
+    glDisableiEXT,
+    glDisableiOES,
+    glDrawArraysEXT,
+    glDrawArraysInstancedARB,
+    glDrawArraysInstancedBaseInstanceEXT,
+    glDrawArraysInstancedEXT,
+    glDrawBuffersARB,
+    glDrawBuffersEXT,
+    glDrawElementsBaseVertexEXT,
+    glDrawElementsBaseVertexOES,
+    glDrawElementsInstancedARB,
+    glDrawElementsInstancedBaseInstanceEXT,
+    glDrawElementsInstancedBaseVertexBaseInstanceEXT,
+    glDrawElementsInstancedBaseVertexEXT,
+    glDrawElementsInstancedBaseVertexOES,
+    glDrawElementsInstancedEXT,
+    glDrawRangeElementsBaseVertexEXT,
+    glDrawRangeElementsBaseVertexOES,
+    glDrawRangeElementsEXT,
+    glDrawTransformFeedbackEXT,
+    glDrawTransformFeedbackInstancedEXT,
+    glEnableVertexArrayAttribEXT,
+    glEnableVertexAttribArrayARB,
+    glEnableiEXT,
+    glEnableiOES,
+    glEndQueryARB,
+    glEndQueryEXT,
+    glEndTransformFeedbackEXT,
+    glFlushMappedBufferRangeEXT,
+    glFlushMappedNamedBufferRangeEXT,
+    glFramebufferRenderbufferEXT,
+    glFramebufferTexture1DEXT,
+    glFramebufferTexture2DEXT,
+    glFramebufferTexture3DEXT,
+    glFramebufferTexture3DOES,
+    glFramebufferTextureARB,
+    glFramebufferTextureEXT,
+    glFramebufferTextureLayerARB,
+    glFramebufferTextureLayerEXT,
+    glFramebufferTextureOES,
+    glGenBuffersARB,
+    glGenFramebuffersEXT,
+    glGenProgramPipelinesEXT,
+    glGenQueriesARB,
+    glGenQueriesEXT,
+    glGenRenderbuffersEXT,
+    glGenTexturesEXT,
+    glGenVertexArraysOES,
+    glGenerateMipmapEXT,
+    glGenerateTextureMipmapEXT,
+    glGetActiveAttribARB,
+    glGetActiveUniformARB,
+    glGetAttribLocationARB,
+    glGetBufferParameterivARB,
+    glGetBufferPointervARB,
+    glGetBufferPointervOES,
+    glGetBufferSubDataARB,
+    glGetCompressedTexImageARB,
+    glGetCompressedTextureImageEXT,
+    glGetDebugMessageLogARB,
+    glGetDebugMessageLogKHR,
+    glGetDoublei_vEXT,
+    glGetFloati_vEXT,
+    glGetFloati_vOES,
+    glGetFragDataIndexEXT,
+    glGetFragDataLocationEXT,
+    glGetFramebufferAttachmentParameterivEXT,
+    glGetFramebufferParameterivEXT,
+    glGetGraphicsResetStatusARB,
+    glGetGraphicsResetStatusEXT,
+    glGetGraphicsResetStatusKHR,
+    glGetIntegeri_vEXT,
+    glGetNamedBufferParameterivEXT,
+    glGetNamedBufferPointervEXT,
+    glGetNamedBufferSubDataEXT,
+    glGetNamedFramebufferAttachmentParameterivEXT,
+    glGetNamedFramebufferParameterivEXT,
+    glGetNamedRenderbufferParameterivEXT,
+    glGetObjectLabelEXT,
+    glGetObjectLabelKHR,
+    glGetObjectPtrLabelKHR,
+    glGetPointervEXT,
+    glGetPointervKHR,
+    glGetProgramBinaryOES,
+    glGetProgramPipelineInfoLogEXT,
+    glGetProgramPipelineivEXT,
+    glGetProgramResourceLocationIndexEXT,
+    glGetProgramivARB,
+    glGetQueryObjecti64vEXT,
+    glGetQueryObjectivARB,
+    glGetQueryObjectivEXT,
+    glGetQueryObjectui64vEXT,
+    glGetQueryObjectuivARB,
+    glGetQueryObjectuivEXT,
+    glGetQueryivARB,
+    glGetQueryivEXT,
+    glGetRenderbufferParameterivEXT,
+    glGetSamplerParameterIivEXT,
+    glGetSamplerParameterIivOES,
+    glGetSamplerParameterIuivEXT,
+    glGetSamplerParameterIuivOES,
+    glGetShaderSourceARB,
+    glGetTexParameterIivEXT,
+    glGetTexParameterIivOES,
+    glGetTexParameterIuivEXT,
+    glGetTexParameterIuivOES,
+    glGetTextureImageEXT,
+    glGetTextureLevelParameterfvEXT,
+    glGetTextureLevelParameterivEXT,
+    glGetTextureParameterIivEXT,
+    glGetTextureParameterIuivEXT,
+    glGetTextureParameterfvEXT,
+    glGetTextureParameterivEXT,
+    glGetTransformFeedbackVaryingEXT,
+    glGetUniformLocationARB,
+    glGetUniformfvARB,
+    glGetUniformivARB,
+    glGetUniformuivEXT,
+    glGetVertexAttribIivEXT,
+    glGetVertexAttribIuivEXT,
+    glGetVertexAttribLdvEXT,
+    glGetVertexAttribPointervARB,
+    glGetVertexAttribdvARB,
+    glGetVertexAttribfvARB,
+    glGetVertexAttribivARB,
+    glGetnCompressedTexImageARB,
+    glGetnTexImageARB,
+    glGetnUniformdvARB,
+    glGetnUniformfvARB,
+    glGetnUniformfvEXT,
+    glGetnUniformfvKHR,
+    glGetnUniformivARB,
+    glGetnUniformivEXT,
+    glGetnUniformivKHR,
+    glGetnUniformuivARB,
+    glGetnUniformuivKHR,
+    glIsBufferARB,
+    glIsEnablediEXT,
+    glIsEnablediOES,
+    glIsFramebufferEXT,
+    glIsProgramARB,
+    glIsProgramPipelineEXT,
+    glIsQueryARB,
+    glIsQueryEXT,
+    glIsRenderbufferEXT,
+    glIsTextureEXT,
+    glIsVertexArrayOES,
+    glLinkProgramARB,
+    glMapBufferARB,
+    glMapBufferOES,
+    glMapBufferRangeEXT,
+    glMapNamedBufferEXT,
+    glMapNamedBufferRangeEXT,
+    glMemoryBarrierEXT,
+    glMinSampleShadingARB,
+    glMinSampleShadingOES,
+    glMultiDrawArraysEXT,
+    glMultiDrawArraysIndirectEXT,
+    glMultiDrawElementsBaseVertexEXT,
+    glMultiDrawElementsEXT,
+    glMultiDrawElementsIndirectEXT,
+    glNamedBufferDataEXT,
+    glNamedBufferStorageEXT,
+    glNamedBufferSubDataEXT,
+    glNamedFramebufferParameteriEXT,
+    glNamedFramebufferRenderbufferEXT,
+    glNamedFramebufferTextureEXT,
+    glNamedFramebufferTextureLayerEXT,
+    glNamedRenderbufferStorageEXT,
+    glNamedRenderbufferStorageMultisampleEXT,
+    glObjectLabelKHR,
+    glObjectPtrLabelKHR,
+    glPatchParameteriEXT,
+    glPatchParameteriOES,
+    glPointParameterfARB,
+    glPointParameterfEXT,
+    glPointParameterfvARB,
+    glPointParameterfvEXT,
+    glPolygonOffsetEXT,
+    glPopDebugGroupKHR,
+    glPrimitiveBoundingBoxARB,
+    glPrimitiveBoundingBoxEXT,
+    glPrimitiveBoundingBoxOES,
+    glProgramBinaryOES,
+    glProgramParameteriARB,
+    glProgramParameteriEXT,
+    glProgramUniform1dEXT,
+    glProgramUniform1dvEXT,
+    glProgramUniform1fEXT,
+    glProgramUniform1fvEXT,
+    glProgramUniform1iEXT,
+    glProgramUniform1ivEXT,
+    glProgramUniform1uiEXT,
+    glProgramUniform1uivEXT,
+    glProgramUniform2dEXT,
+    glProgramUniform2dvEXT,
+    glProgramUniform2fEXT,
+    glProgramUniform2fvEXT,
+    glProgramUniform2iEXT,
+    glProgramUniform2ivEXT,
+    glProgramUniform2uiEXT,
+    glProgramUniform2uivEXT,
+    glProgramUniform3dEXT,
+    glProgramUniform3dvEXT,
+    glProgramUniform3fEXT,
+    glProgramUniform3fvEXT,
+    glProgramUniform3iEXT,
+    glProgramUniform3ivEXT,
+    glProgramUniform3uiEXT,
+    glProgramUniform3uivEXT,
+    glProgramUniform4dEXT,
+    glProgramUniform4dvEXT,
+    glProgramUniform4fEXT,
+    glProgramUniform4fvEXT,
+    glProgramUniform4iEXT,
+    glProgramUniform4ivEXT,
+    glProgramUniform4uiEXT,
+    glProgramUniform4uivEXT,
+    glProgramUniformMatrix2dvEXT,
+    glProgramUniformMatrix2fvEXT,
+    glProgramUniformMatrix2x3dvEXT,
+    glProgramUniformMatrix2x3fvEXT,
+    glProgramUniformMatrix2x4dvEXT,
+    glProgramUniformMatrix2x4fvEXT,
+    glProgramUniformMatrix3dvEXT,
+    glProgramUniformMatrix3fvEXT,
+    glProgramUniformMatrix3x2dvEXT,
+    glProgramUniformMatrix3x2fvEXT,
+    glProgramUniformMatrix3x4dvEXT,
+    glProgramUniformMatrix3x4fvEXT,
+    glProgramUniformMatrix4dvEXT,
+    glProgramUniformMatrix4fvEXT,
+    glProgramUniformMatrix4x2dvEXT,
+    glProgramUniformMatrix4x2fvEXT,
+    glProgramUniformMatrix4x3dvEXT,
+    glProgramUniformMatrix4x3fvEXT,
+    glProvokingVertexEXT,
+    glPushDebugGroupKHR,
+    glQueryCounterEXT,
+    glReadnPixelsARB,
+    glReadnPixelsEXT,
+    glReadnPixelsKHR,
+    glRenderbufferStorageEXT,
+    glRenderbufferStorageMultisampleEXT,
+    glSampleCoverageARB,
+    glSamplerParameterIivEXT,
+    glSamplerParameterIivOES,
+    glSamplerParameterIuivEXT,
+    glSamplerParameterIuivOES,
+    glScissorArrayvOES,
+    glScissorIndexedOES,
+    glScissorIndexedvOES,
+    glShaderSourceARB,
+    glTexBufferARB,
+    glTexBufferEXT,
+    glTexBufferOES,
+    glTexBufferRangeEXT,
+    glTexBufferRangeOES,
+    glTexImage3DEXT,
+    glTexImage3DOES,
+    glTexParameterIivEXT,
+    glTexParameterIivOES,
+    glTexParameterIuivEXT,
+    glTexParameterIuivOES,
+    glTexStorage1DEXT,
+    glTexStorage2DEXT,
+    glTexStorage3DEXT,
+    glTexStorage3DMultisampleOES,
+    glTexSubImage1DEXT,
+    glTexSubImage2DEXT,
+    glTexSubImage3DEXT,
+    glTexSubImage3DOES,
+    glTextureBufferEXT,
+    glTextureBufferRangeEXT,
+    glTextureParameterIivEXT,
+    glTextureParameterIuivEXT,
+    glTextureParameterfEXT,
+    glTextureParameterfvEXT,
+    glTextureParameteriEXT,
+    glTextureParameterivEXT,
+    glTextureStorage1DEXT,
+    glTextureStorage2DEXT,
+    glTextureStorage2DMultisampleEXT,
+    glTextureStorage3DEXT,
+    glTextureStorage3DMultisampleEXT,
+    glTextureSubImage1DEXT,
+    glTextureSubImage2DEXT,
+    glTextureSubImage3DEXT,
+    glTextureViewEXT,
+    glTextureViewOES,
+    glTransformFeedbackVaryingsEXT,
+    glUniform1fARB,
+    glUniform1fvARB,
+    glUniform1iARB,
+    glUniform1ivARB,
+    glUniform1uiEXT,
+    glUniform1uivEXT,
+    glUniform2fARB,
+    glUniform2fvARB,
+    glUniform2iARB,
+    glUniform2ivARB,
+    glUniform2uiEXT,
+    glUniform2uivEXT,
+    glUniform3fARB,
+    glUniform3fvARB,
+    glUniform3iARB,
+    glUniform3ivARB,
+    glUniform3uiEXT,
+    glUniform3uivEXT,
+    glUniform4fARB,
+    glUniform4fvARB,
+    glUniform4iARB,
+    glUniform4ivARB,
+    glUniform4uiEXT,
+    glUniform4uivEXT,
+    glUniformMatrix2fvARB,
+    glUniformMatrix3fvARB,
+    glUniformMatrix4fvARB,
+    glUnmapBufferARB,
+    glUnmapBufferOES,
+    glUnmapNamedBufferEXT,
+    glUseProgramStagesEXT,
+    glValidateProgramARB,
+    glValidateProgramPipelineEXT,
+    glVertexAttrib1dARB,
+    glVertexAttrib1dvARB,
+    glVertexAttrib1fARB,
+    glVertexAttrib1fvARB,
+    glVertexAttrib1sARB,
+    glVertexAttrib1svARB,
+    glVertexAttrib2dARB,
+    glVertexAttrib2dvARB,
+    glVertexAttrib2fARB,
+    glVertexAttrib2fvARB,
+    glVertexAttrib2sARB,
+    glVertexAttrib2svARB,
+    glVertexAttrib3dARB,
+    glVertexAttrib3dvARB,
+    glVertexAttrib3fARB,
+    glVertexAttrib3fvARB,
+    glVertexAttrib3sARB,
+    glVertexAttrib3svARB,
+    glVertexAttrib4NbvARB,
+    glVertexAttrib4NivARB,
+    glVertexAttrib4NsvARB,
+    glVertexAttrib4NubARB,
+    glVertexAttrib4NubvARB,
+    glVertexAttrib4NuivARB,
+    glVertexAttrib4NusvARB,
+    glVertexAttrib4bvARB,
+    glVertexAttrib4dARB,
+    glVertexAttrib4dvARB,
+    glVertexAttrib4fARB,
+    glVertexAttrib4fvARB,
+    glVertexAttrib4ivARB,
+    glVertexAttrib4sARB,
+    glVertexAttrib4svARB,
+    glVertexAttrib4ubvARB,
+    glVertexAttrib4uivARB,
+    glVertexAttrib4usvARB,
+    glVertexAttribDivisorARB,
+    glVertexAttribDivisorEXT,
+    glVertexAttribI1iEXT,
+    glVertexAttribI1ivEXT,
+    glVertexAttribI1uiEXT,
+    glVertexAttribI1uivEXT,
+    glVertexAttribI2iEXT,
+    glVertexAttribI2ivEXT,
+    glVertexAttribI2uiEXT,
+    glVertexAttribI2uivEXT,
+    glVertexAttribI3iEXT,
+    glVertexAttribI3ivEXT,
+    glVertexAttribI3uiEXT,
+    glVertexAttribI3uivEXT,
+    glVertexAttribI4bvEXT,
+    glVertexAttribI4iEXT,
+    glVertexAttribI4ivEXT,
+    glVertexAttribI4svEXT,
+    glVertexAttribI4ubvEXT,
+    glVertexAttribI4uiEXT,
+    glVertexAttribI4uivEXT,
+    glVertexAttribI4usvEXT,
+    glVertexAttribIPointerEXT,
+    glVertexAttribL1dEXT,
+    glVertexAttribL1dvEXT,
+    glVertexAttribL2dEXT,
+    glVertexAttribL2dvEXT,
+    glVertexAttribL3dEXT,
+    glVertexAttribL3dvEXT,
+    glVertexAttribL4dEXT,
+    glVertexAttribL4dvEXT,
+    glVertexAttribLPointerEXT,
+    glVertexAttribPointerARB,
+    glViewportArrayvOES,
+    glViewportIndexedfOES,
+    glViewportIndexedfvOES,
+};
+
+namespace
+{
+// The names of the functions, indexed by ProcName. The first kProcCount are the names of the
+// table's functions, in the order of their indices.
+constexpr const char *kProcNames[] = {
+    "glActiveShaderProgram",
+    "glActiveTexture",
+    "glAttachShader",
+    "glBeginConditionalRender",
+    "glBeginQuery",
+    "glBeginQueryIndexed",
+    "glBeginTransformFeedback",
+    "glBindAttribLocation",
+    "glBindBuffer",
+    "glBindBufferBase",
+    "glBindBufferRange",
+    "glBindBuffersBase",
+    "glBindBuffersRange",
+    "glBindFragDataLocation",
+    "glBindFragDataLocationIndexed",
+    "glBindFramebuffer",
+    "glBindImageTexture",
+    "glBindImageTextures",
+    "glBindProgramPipeline",
+    "glBindRenderbuffer",
+    "glBindSampler",
+    "glBindSamplers",
+    "glBindTexture",
+    "glBindTextureUnit",
+    "glBindTextures",
+    "glBindTransformFeedback",
+    "glBindVertexArray",
+    "glBindVertexBuffer",
+    "glBindVertexBuffers",
+    "glBlendBarrier",
+    "glBlendColor",
+    "glBlendEquation",
+    "glBlendEquationSeparate",
+    "glBlendEquationSeparatei",
+    "glBlendEquationi",
+    "glBlendFunc",
+    "glBlendFuncSeparate",
+    "glBlendFuncSeparatei",
+    "glBlendFunci",
+    "glBlitFramebuffer",
+    "glBlitNamedFramebuffer",
+    "glBufferData",
+    "glBufferStorage",
+    "glBufferSubData",
+    "glCheckFramebufferStatus",
+    "glCheckNamedFramebufferStatus",
+    "glClampColor",
+    "glClear",
+    "glClearBufferData",
+    "glClearBufferSubData",
+    "glClearBufferfi",
+    "glClearBufferfv",
+    "glClearBufferiv",
+    "glClearBufferuiv",
+    "glClearColor",
+    "glClearDepth",
+    "glClearDepthf",
+    "glClearNamedBufferData",
+    "glClearNamedBufferSubData",
+    "glClearNamedFramebufferfi",
+    "glClearNamedFramebufferfv",
+    "glClearNamedFramebufferiv",
+    "glClearNamedFramebufferuiv",
+    "glClearStencil",
+    "glClearTexImage",
+    "glClearTexSubImage",
+    "glClientWaitSync",
+    "glClipControl",
+    "glColorMask",
+    "glColorMaski",
+    "glCompileShader",
+    "glCompressedTexImage1D",
+    "glCompressedTexImage2D",
+    "glCompressedTexImage3D",
+    "glCompressedTexSubImage1D",
+    "glCompressedTexSubImage2D",
+    "glCompressedTexSubImage3D",
+    "glCompressedTextureSubImage1D",
+    "glCompressedTextureSubImage2D",
+    "glCompressedTextureSubImage3D",
+    "glCopyBufferSubData",
+    "glCopyImageSubData",
+    "glCopyNamedBufferSubData",
+    "glCopyTexImage1D",
+    "glCopyTexImage2D",
+    "glCopyTexSubImage1D",
+    "glCopyTexSubImage2D",
+    "glCopyTexSubImage3D",
+    "glCopyTextureSubImage1D",
+    "glCopyTextureSubImage2D",
+    "glCopyTextureSubImage3D",
+    "glCoverFillPathInstancedNV",
+    "glCoverFillPathNV",
+    "glCoverStrokePathInstancedNV",
+    "glCoverStrokePathNV",
+    "glCoverageModulationNV",
+    "glCreateBuffers",
+    "glCreateFramebuffers",
+    "glCreateProgram",
+    "glCreateProgramPipelines",
+    "glCreateQueries",
+    "glCreateRenderbuffers",
+    "glCreateSamplers",
+    "glCreateShader",
+    "glCreateShaderProgramv",
+    "glCreateTextures",
+    "glCreateTransformFeedbacks",
+    "glCreateVertexArrays",
+    "glCullFace",
+    "glDebugMessageCallback",
+    "glDebugMessageControl",
+    "glDebugMessageInsert",
+    "glDeleteBuffers",
+    "glDeleteFencesNV",
+    "glDeleteFramebuffers",
+    "glDeletePathsNV",
+    "glDeleteProgram",
+    "glDeleteProgramPipelines",
+    "glDeleteQueries",
+    "glDeleteRenderbuffers",
+    "glDeleteSamplers",
+    "glDeleteShader",
+    "glDeleteSync",
+    "glDeleteTextures",
+    "glDeleteTransformFeedbacks",
+    "glDeleteVertexArrays",
+    "glDepthFunc",
+    "glDepthMask",
+    "glDepthRange",
+    "glDepthRangeArrayv",
+    "glDepthRangeIndexed",
+    "glDepthRangef",
+    "glDetachShader",
+    "glDisable",
+    "glDisableVertexArrayAttrib",
+    "glDisableVertexAttribArray",
+    "glDisablei",
+    "glDiscardFramebufferEXT",
+    "glDispatchCompute",
+    "glDispatchComputeIndirect",
+    "glDrawArrays",
+    "glDrawArraysIndirect",
+    "glDrawArraysInstanced",
+    "glDrawArraysInstancedBaseInstance",
+    "glDrawBuffer",
+    "glDrawBuffers",
+    "glDrawElements",
+    "glDrawElementsBaseVertex",
+    "glDrawElementsIndirect",
+    "glDrawElementsInstanced",
+    "glDrawElementsInstancedBaseInstance",
+    "glDrawElementsInstancedBaseVertex",
+    "glDrawElementsInstancedBaseVertexBaseInstance",
+    "glDrawRangeElements",
+    "glDrawRangeElementsBaseVertex",
+    "glDrawTransformFeedback",
+    "glDrawTransformFeedbackInstanced",
+    "glDrawTransformFeedbackStream",
+    "glDrawTransformFeedbackStreamInstanced",
+    "glEGLImageTargetRenderbufferStorageOES",
+    "glEGLImageTargetTexture2DOES",
+    "glEnable",
+    "glEnableVertexArrayAttrib",
+    "glEnableVertexAttribArray",
+    "glEnablei",
+    "glEndConditionalRender",
+    "glEndQuery",
+    "glEndQueryIndexed",
+    "glEndTransformFeedback",
+    "glFenceSync",
+    "glFinish",
+    "glFinishFenceNV",
+    "glFlush",
+    "glFlushMappedBufferRange",
+    "glFlushMappedNamedBufferRange",
+    "glFramebufferParameteri",
+    "glFramebufferRenderbuffer",
+    "glFramebufferTexture",
+    "glFramebufferTexture1D",
+    "glFramebufferTexture2D",
+    "glFramebufferTexture3D",
+    "glFramebufferTextureLayer",
+    "glFramebufferTextureMultiviewOVR",
+    "glFrontFace",
+    "glGenBuffers",
+    "glGenFencesNV",
+    "glGenFramebuffers",
+    "glGenPathsNV",
+    "glGenProgramPipelines",
+    "glGenQueries",
+    "glGenRenderbuffers",
+    "glGenSamplers",
+    "glGenTextures",
+    "glGenTransformFeedbacks",
+    "glGenVertexArrays",
+    "glGenerateMipmap",
+    "glGenerateTextureMipmap",
+    "glGetActiveAtomicCounterBufferiv",
+    "glGetActiveAttrib",
+    "glGetActiveSubroutineName",
+    "glGetActiveSubroutineUniformName",
+    "glGetActiveSubroutineUniformiv",
+    "glGetActiveUniform",
+    "glGetActiveUniformBlockName",
+    "glGetActiveUniformBlockiv",
+    "glGetActiveUniformName",
+    "glGetActiveUniformsiv",
+    "glGetAttachedShaders",
+    "glGetAttribLocation",
+    "glGetBooleani_v",
+    "glGetBooleanv",
+    "glGetBufferParameteri64v",
+    "glGetBufferParameteriv",
+    "glGetBufferPointerv",
+    "glGetBufferSubData",
+    "glGetCompressedTexImage",
+    "glGetCompressedTextureImage",
+    "glGetCompressedTextureSubImage",
+    "glGetDebugMessageLog",
+    "glGetDoublei_v",
+    "glGetDoublev",
+    "glGetError",
+    "glGetFenceivNV",
+    "glGetFloati_v",
+    "glGetFloatv",
+    "glGetFragDataIndex",
+    "glGetFragDataLocation",
+    "glGetFramebufferAttachmentParameteriv",
+    "glGetFramebufferParameteriv",
+    "glGetGraphicsResetStatus",
+    "glGetInteger64i_v",
+    "glGetInteger64v",
+    "glGetIntegeri_v",
+    "glGetIntegerv",
+    "glGetInternalformatSampleivNV",
+    "glGetInternalformati64v",
+    "glGetInternalformativ",
+    "glGetMultisamplefv",
+    "glGetNamedBufferParameteri64v",
+    "glGetNamedBufferParameteriv",
+    "glGetNamedBufferPointerv",
+    "glGetNamedBufferSubData",
+    "glGetNamedFramebufferAttachmentParameteriv",
+    "glGetNamedFramebufferParameteriv",
+    "glGetNamedRenderbufferParameteriv",
+    "glGetObjectLabel",
+    "glGetObjectPtrLabel",
+    "glGetPathParameterfvNV",
+    "glGetPathParameterivNV",
+    "glGetPointerv",
+    "glGetProgramBinary",
+    "glGetProgramInfoLog",
+    "glGetProgramInterfaceiv",
+    "glGetProgramPipelineInfoLog",
+    "glGetProgramPipelineiv",
+    "glGetProgramResourceIndex",
+    "glGetProgramResourceLocation",
+    "glGetProgramResourceLocationIndex",
+    "glGetProgramResourceName",
+    "glGetProgramResourceiv",
+    "glGetProgramStageiv",
+    "glGetProgramiv",
+    "glGetQueryBufferObjecti64v",
+    "glGetQueryBufferObjectiv",
+    "glGetQueryBufferObjectui64v",
+    "glGetQueryBufferObjectuiv",
+    "glGetQueryIndexediv",
+    "glGetQueryObjecti64v",
+    "glGetQueryObjectiv",
+    "glGetQueryObjectui64v",
+    "glGetQueryObjectuiv",
+    "glGetQueryiv",
+    "glGetRenderbufferParameteriv",
+    "glGetSamplerParameterIiv",
+    "glGetSamplerParameterIuiv",
+    "glGetSamplerParameterfv",
+    "glGetSamplerParameteriv",
+    "glGetShaderInfoLog",
+    "glGetShaderPrecisionFormat",
+    "glGetShaderSource",
+    "glGetShaderiv",
+    "glGetString",
+    "glGetStringi",
+    "glGetSubroutineIndex",
+    "glGetSubroutineUniformLocation",
+    "glGetSynciv",
+    "glGetTexImage",
+    "glGetTexLevelParameterfv",
+    "glGetTexLevelParameteriv",
+    "glGetTexParameterIiv",
+    "glGetTexParameterIuiv",
+    "glGetTexParameterfv",
+    "glGetTexParameteriv",
+    "glGetTextureImage",
+    "glGetTextureLevelParameterfv",
+    "glGetTextureLevelParameteriv",
+    "glGetTextureParameterIiv",
+    "glGetTextureParameterIuiv",
+    "glGetTextureParameterfv",
+    "glGetTextureParameteriv",
+    "glGetTextureSubImage",
+    "glGetTransformFeedbackVarying",
+    "glGetTransformFeedbacki64_v",
+    "glGetTransformFeedbacki_v",
+    "glGetTransformFeedbackiv",
+    "glGetUniformBlockIndex",
+    "glGetUniformIndices",
+    "glGetUniformLocation",
+    "glGetUniformSubroutineuiv",
+    "glGetUniformdv",
+    "glGetUniformfv",
+    "glGetUniformiv",
+    "glGetUniformuiv",
+    "glGetVertexArrayIndexed64iv",
+    "glGetVertexArrayIndexediv",
+    "glGetVertexArrayiv",
+    "glGetVertexAttribIiv",
+    "glGetVertexAttribIuiv",
+    "glGetVertexAttribLdv",
+    "glGetVertexAttribPointerv",
+    "glGetVertexAttribdv",
+    "glGetVertexAttribfv",
+    "glGetVertexAttribiv",
+    "glGetnCompressedTexImage",
+    "glGetnTexImage",
+    "glGetnUniformdv",
+    "glGetnUniformfv",
+    "glGetnUniformiv",
+    "glGetnUniformuiv",
+    "glHint",
+    "glInsertEventMarkerEXT",
+    "glInvalidateBufferData",
+    "glInvalidateBufferSubData",
+    "glInvalidateFramebuffer",
+    "glInvalidateNamedFramebufferData",
+    "glInvalidateNamedFramebufferSubData",
+    "glInvalidateSubFramebuffer",
+    "glInvalidateTexImage",
+    "glInvalidateTexSubImage",
+    "glIsBuffer",
+    "glIsEnabled",
+    "glIsEnabledi",
+    "glIsFenceNV",
+    "glIsFramebuffer",
+    "glIsPathNV",
+    "glIsProgram",
+    "glIsProgramPipeline",
+    "glIsQuery",
+    "glIsRenderbuffer",
+    "glIsSampler",
+    "glIsShader",
+    "glIsSync",
+    "glIsTexture",
+    "glIsTransformFeedback",
+    "glIsVertexArray",
+    "glLineWidth",
+    "glLinkProgram",
+    "glLogicOp",
+    "glMapBuffer",
+    "glMapBufferRange",
+    "glMapNamedBuffer",
+    "glMapNamedBufferRange",
+    "glMatrixLoadfEXT",
+    "glMaxShaderCompilerThreadsARB",
+    "glMaxShaderCompilerThreadsKHR",
+    "glMemoryBarrier",
+    "glMemoryBarrierByRegion",
+    "glMinSampleShading",
+    "glMultiDrawArrays",
+    "glMultiDrawArraysIndirect",
+    "glMultiDrawElements",
+    "glMultiDrawElementsBaseVertex",
+    "glMultiDrawElementsIndirect",
+    "glNamedBufferData",
+    "glNamedBufferStorage",
+    "glNamedBufferSubData",
+    "glNamedFramebufferDrawBuffer",
+    "glNamedFramebufferDrawBuffers",
+    "glNamedFramebufferParameteri",
+    "glNamedFramebufferReadBuffer",
+    "glNamedFramebufferRenderbuffer",
+    "glNamedFramebufferTexture",
+    "glNamedFramebufferTextureLayer",
+    "glNamedRenderbufferStorage",
+    "glNamedRenderbufferStorageMultisample",
+    "glObjectLabel",
+    "glObjectPtrLabel",
+    "glPatchParameterfv",
+    "glPatchParameteri",
+    "glPathCommandsNV",
+    "glPathParameterfNV",
+    "glPathParameteriNV",
+    "glPathStencilFuncNV",
+    "glPauseTransformFeedback",
+    "glPixelStoref",
+    "glPixelStorei",
+    "glPointParameterf",
+    "glPointParameterfv",
+    "glPointParameteri",
+    "glPointParameteriv",
+    "glPointSize",
+    "glPolygonMode",
+    "glPolygonOffset",
+    "glPopDebugGroup",
+    "glPopGroupMarkerEXT",
+    "glPrimitiveBoundingBox",
+    "glPrimitiveRestartIndex",
+    "glProgramBinary",
+    "glProgramParameteri",
+    "glProgramPathFragmentInputGenNV",
+    "glProgramUniform1d",
+    "glProgramUniform1dv",
+    "glProgramUniform1f",
+    "glProgramUniform1fv",
+    "glProgramUniform1i",
+    "glProgramUniform1iv",
+    "glProgramUniform1ui",
+    "glProgramUniform1uiv",
+    "glProgramUniform2d",
+    "glProgramUniform2dv",
+    "glProgramUniform2f",
+    "glProgramUniform2fv",
+    "glProgramUniform2i",
+    "glProgramUniform2iv",
+    "glProgramUniform2ui",
+    "glProgramUniform2uiv",
+    "glProgramUniform3d",
+    "glProgramUniform3dv",
+    "glProgramUniform3f",
+    "glProgramUniform3fv",
+    "glProgramUniform3i",
+    "glProgramUniform3iv",
+    "glProgramUniform3ui",
+    "glProgramUniform3uiv",
+    "glProgramUniform4d",
+    "glProgramUniform4dv",
+    "glProgramUniform4f",
+    "glProgramUniform4fv",
+    "glProgramUniform4i",
+    "glProgramUniform4iv",
+    "glProgramUniform4ui",
+    "glProgramUniform4uiv",
+    "glProgramUniformMatrix2dv",
+    "glProgramUniformMatrix2fv",
+    "glProgramUniformMatrix2x3dv",
+    "glProgramUniformMatrix2x3fv",
+    "glProgramUniformMatrix2x4dv",
+    "glProgramUniformMatrix2x4fv",
+    "glProgramUniformMatrix3dv",
+    "glProgramUniformMatrix3fv",
+    "glProgramUniformMatrix3x2dv",
+    "glProgramUniformMatrix3x2fv",
+    "glProgramUniformMatrix3x4dv",
+    "glProgramUniformMatrix3x4fv",
+    "glProgramUniformMatrix4dv",
+    "glProgramUniformMatrix4fv",
+    "glProgramUniformMatrix4x2dv",
+    "glProgramUniformMatrix4x2fv",
+    "glProgramUniformMatrix4x3dv",
+    "glProgramUniformMatrix4x3fv",
+    "glProvokingVertex",
+    "glPushDebugGroup",
+    "glPushGroupMarkerEXT",
+    "glQueryCounter",
+    "glReadBuffer",
+    "glReadPixels",
+    "glReadnPixels",
+    "glReleaseShaderCompiler",
+    "glRenderbufferStorage",
+    "glRenderbufferStorageMultisample",
+    "glResumeTransformFeedback",
+    "glSampleCoverage",
+    "glSampleMaski",
+    "glSamplerParameterIiv",
+    "glSamplerParameterIuiv",
+    "glSamplerParameterf",
+    "glSamplerParameterfv",
+    "glSamplerParameteri",
+    "glSamplerParameteriv",
+    "glScissor",
+    "glScissorArrayv",
+    "glScissorIndexed",
+    "glScissorIndexedv",
+    "glSetFenceNV",
+    "glShaderBinary",
+    "glShaderSource",
+    "glShaderStorageBlockBinding",
+    "glStencilFillPathInstancedNV",
+    "glStencilFillPathNV",
+    "glStencilFunc",
+    "glStencilFuncSeparate",
+    "glStencilMask",
+    "glStencilMaskSeparate",
+    "glStencilOp",
+    "glStencilOpSeparate",
+    "glStencilStrokePathInstancedNV",
+    "glStencilStrokePathNV",
+    "glStencilThenCoverFillPathInstancedNV",
+    "glStencilThenCoverFillPathNV",
+    "glStencilThenCoverStrokePathInstancedNV",
+    "glStencilThenCoverStrokePathNV",
+    "glTestFenceNV",
+    "glTexBuffer",
+    "glTexBufferRange",
+    "glTexImage1D",
+    "glTexImage2D",
+    "glTexImage2DMultisample",
+    "glTexImage3D",
+    "glTexImage3DMultisample",
+    "glTexParameterIiv",
+    "glTexParameterIuiv",
+    "glTexParameterf",
+    "glTexParameterfv",
+    "glTexParameteri",
+    "glTexParameteriv",
+    "glTexStorage1D",
+    "glTexStorage2D",
+    "glTexStorage2DMultisample",
+    "glTexStorage3D",
+    "glTexStorage3DMultisample",
+    "glTexSubImage1D",
+    "glTexSubImage2D",
+    "glTexSubImage3D",
+    "glTextureBarrier",
+    "glTextureBuffer",
+    "glTextureBufferRange",
+    "glTextureParameterIiv",
+    "glTextureParameterIuiv",
+    "glTextureParameterf",
+    "glTextureParameterfv",
+    "glTextureParameteri",
+    "glTextureParameteriv",
+    "glTextureStorage1D",
+    "glTextureStorage2D",
+    "glTextureStorage2DMultisample",
+    "glTextureStorage3D",
+    "glTextureStorage3DMultisample",
+    "glTextureSubImage1D",
+    "glTextureSubImage2D",
+    "glTextureSubImage3D",
+    "glTextureView",
+    "glTransformFeedbackBufferBase",
+    "glTransformFeedbackBufferRange",
+    "glTransformFeedbackVaryings",
+    "glUniform1d",
+    "glUniform1dv",
+    "glUniform1f",
+    "glUniform1fv",
+    "glUniform1i",
+    "glUniform1iv",
+    "glUniform1ui",
+    "glUniform1uiv",
+    "glUniform2d",
+    "glUniform2dv",
+    "glUniform2f",
+    "glUniform2fv",
+    "glUniform2i",
+    "glUniform2iv",
+    "glUniform2ui",
+    "glUniform2uiv",
+    "glUniform3d",
+    "glUniform3dv",
+    "glUniform3f",
+    "glUniform3fv",
+    "glUniform3i",
+    "glUniform3iv",
+    "glUniform3ui",
+    "glUniform3uiv",
+    "glUniform4d",
+    "glUniform4dv",
+    "glUniform4f",
+    "glUniform4fv",
+    "glUniform4i",
+    "glUniform4iv",
+    "glUniform4ui",
+    "glUniform4uiv",
+    "glUniformBlockBinding",
+    "glUniformMatrix2dv",
+    "glUniformMatrix2fv",
+    "glUniformMatrix2x3dv",
+    "glUniformMatrix2x3fv",
+    "glUniformMatrix2x4dv",
+    "glUniformMatrix2x4fv",
+    "glUniformMatrix3dv",
+    "glUniformMatrix3fv",
+    "glUniformMatrix3x2dv",
+    "glUniformMatrix3x2fv",
+    "glUniformMatrix3x4dv",
+    "glUniformMatrix3x4fv",
+    "glUniformMatrix4dv",
+    "glUniformMatrix4fv",
+    "glUniformMatrix4x2dv",
+    "glUniformMatrix4x2fv",
+    "glUniformMatrix4x3dv",
+    "glUniformMatrix4x3fv",
+    "glUniformSubroutinesuiv",
+    "glUnmapBuffer",
+    "glUnmapNamedBuffer",
+    "glUseProgram",
+    "glUseProgramStages",
+    "glValidateProgram",
+    "glValidateProgramPipeline",
+    "glVertexArrayAttribBinding",
+    "glVertexArrayAttribFormat",
+    "glVertexArrayAttribIFormat",
+    "glVertexArrayAttribLFormat",
+    "glVertexArrayBindingDivisor",
+    "glVertexArrayElementBuffer",
+    "glVertexArrayVertexBuffer",
+    "glVertexArrayVertexBuffers",
+    "glVertexAttrib1d",
+    "glVertexAttrib1dv",
+    "glVertexAttrib1f",
+    "glVertexAttrib1fv",
+    "glVertexAttrib1s",
+    "glVertexAttrib1sv",
+    "glVertexAttrib2d",
+    "glVertexAttrib2dv",
+    "glVertexAttrib2f",
+    "glVertexAttrib2fv",
+    "glVertexAttrib2s",
+    "glVertexAttrib2sv",
+    "glVertexAttrib3d",
+    "glVertexAttrib3dv",
+    "glVertexAttrib3f",
+    "glVertexAttrib3fv",
+    "glVertexAttrib3s",
+    "glVertexAttrib3sv",
+    "glVertexAttrib4Nbv",
+    "glVertexAttrib4Niv",
+    "glVertexAttrib4Nsv",
+    "glVertexAttrib4Nub",
+    "glVertexAttrib4Nubv",
+    "glVertexAttrib4Nuiv",
+    "glVertexAttrib4Nusv",
+    "glVertexAttrib4bv",
+    "glVertexAttrib4d",
+    "glVertexAttrib4dv",
+    "glVertexAttrib4f",
+    "glVertexAttrib4fv",
+    "glVertexAttrib4iv",
+    "glVertexAttrib4s",
+    "glVertexAttrib4sv",
+    "glVertexAttrib4ubv",
+    "glVertexAttrib4uiv",
+    "glVertexAttrib4usv",
+    "glVertexAttribBinding",
+    "glVertexAttribDivisor",
+    "glVertexAttribFormat",
+    "glVertexAttribI1i",
+    "glVertexAttribI1iv",
+    "glVertexAttribI1ui",
+    "glVertexAttribI1uiv",
+    "glVertexAttribI2i",
+    "glVertexAttribI2iv",
+    "glVertexAttribI2ui",
+    "glVertexAttribI2uiv",
+    "glVertexAttribI3i",
+    "glVertexAttribI3iv",
+    "glVertexAttribI3ui",
+    "glVertexAttribI3uiv",
+    "glVertexAttribI4bv",
+    "glVertexAttribI4i",
+    "glVertexAttribI4iv",
+    "glVertexAttribI4sv",
+    "glVertexAttribI4ubv",
+    "glVertexAttribI4ui",
+    "glVertexAttribI4uiv",
+    "glVertexAttribI4usv",
+    "glVertexAttribIFormat",
+    "glVertexAttribIPointer",
+    "glVertexAttribL1d",
+    "glVertexAttribL1dv",
+    "glVertexAttribL2d",
+    "glVertexAttribL2dv",
+    "glVertexAttribL3d",
+    "glVertexAttribL3dv",
+    "glVertexAttribL4d",
+    "glVertexAttribL4dv",
+    "glVertexAttribLFormat",
+    "glVertexAttribLPointer",
+    "glVertexAttribP1ui",
+    "glVertexAttribP1uiv",
+    "glVertexAttribP2ui",
+    "glVertexAttribP2uiv",
+    "glVertexAttribP3ui",
+    "glVertexAttribP3uiv",
+    "glVertexAttribP4ui",
+    "glVertexAttribP4uiv",
+    "glVertexAttribPointer",
+    "glVertexBindingDivisor",
+    "glViewport",
+    "glViewportArrayv",
+    "glViewportIndexedf",
+    "glViewportIndexedfv",
+    "glWaitSync",
+    "glActiveShaderProgramEXT",
+    "glActiveTextureARB",
+    "glBeginQueryARB",
+    "glBeginQueryEXT",
+    "glBeginTransformFeedbackEXT",
+    "glBindAttribLocationARB",
+    "glBindBufferARB",
+    "glBindBufferBaseEXT",
+    "glBindBufferRangeEXT",
+    "glBindFragDataLocationEXT",
+    "glBindFragDataLocationIndexedEXT",
+    "glBindFramebufferEXT",
+    "glBindImageTextureEXT",
+    "glBindProgramPipelineEXT",
+    "glBindRenderbufferEXT",
+    "glBindTextureEXT",
+    "glBindVertexArrayOES",
+    "glBlendColorEXT",
+    "glBlendEquationEXT",
+    "glBlendEquationSeparateEXT",
+    "glBlendEquationSeparateiARB",
+    "glBlendEquationSeparateiEXT",
+    "glBlendEquationSeparateiOES",
+    "glBlendEquationiARB",
+    "glBlendEquationiEXT",
+    "glBlendEquationiOES",
+    "glBlendFuncSeparateEXT",
+    "glBlendFuncSeparateiARB",
+    "glBlendFuncSeparateiEXT",
+    "glBlendFuncSeparateiOES",
+    "glBlendFunciARB",
+    "glBlendFunciEXT",
+    "glBlendFunciOES",
+    "glBlitFramebufferEXT",
+    "glBufferDataARB",
+    "glBufferStorageEXT",
+    "glBufferSubDataARB",
+    "glCheckFramebufferStatusEXT",
+    "glCheckNamedFramebufferStatusEXT",
+    "glClampColorARB",
+    "glClearDepthfOES",
+    "glClearNamedBufferDataEXT",
+    "glClearNamedBufferSubDataEXT",
+    "glClearTexImageEXT",
+    "glClearTexSubImageEXT",
+    "glClipControlEXT",
+    "glColorMaskiEXT",
+    "glColorMaskiOES",
+    "glCompileShaderARB",
+    "glCompressedTexImage1DARB",
+    "glCompressedTexImage2DARB",
+    "glCompressedTexImage3DARB",
+    "glCompressedTexImage3DOES",
+    "glCompressedTexSubImage1DARB",
+    "glCompressedTexSubImage2DARB",
+    "glCompressedTexSubImage3DARB",
+    "glCompressedTexSubImage3DOES",
+    "glCompressedTextureSubImage1DEXT",
+    "glCompressedTextureSubImage2DEXT",
+    "glCompressedTextureSubImage3DEXT",
+    "glCopyImageSubDataEXT",
+    "glCopyImageSubDataOES",
+    "glCopyTexImage1DEXT",
+    "glCopyTexImage2DEXT",
+    "glCopyTexSubImage1DEXT",
+    "glCopyTexSubImage2DEXT",
+    "glCopyTexSubImage3DEXT",
+    "glCopyTexSubImage3DOES",
+    "glCopyTextureSubImage1DEXT",
+    "glCopyTextureSubImage2DEXT",
+    "glCopyTextureSubImage3DEXT",
+    "glCreateShaderProgramvEXT",
+    "glDebugMessageCallbackARB",
+    "glDebugMessageCallbackKHR",
+    "glDebugMessageControlARB",
+    "glDebugMessageControlKHR",
+    "glDebugMessageInsertARB",
+    "glDebugMessageInsertKHR",
+    "glDeleteBuffersARB",
+    "glDeleteFramebuffersEXT",
+    "glDeleteProgramPipelinesEXT",
+    "glDeleteQueriesARB",
+    "glDeleteQueriesEXT",
+    "glDeleteRenderbuffersEXT",
+    "glDeleteTexturesEXT",
+    "glDeleteVertexArraysOES",
+    "glDepthRangefOES",
+    "glDisableVertexArrayAttribEXT",
+    "glDisableVertexAttribArrayARB",
+    "glDisableiEXT",
+    "glDisableiOES",
+    "glDrawArraysEXT",
+    "glDrawArraysInstancedARB",
+    "glDrawArraysInstancedBaseInstanceEXT",
+    "glDrawArraysInstancedEXT",
+    "glDrawBuffersARB",
+    "glDrawBuffersEXT",
+    "glDrawElementsBaseVertexEXT",
+    "glDrawElementsBaseVertexOES",
+    "glDrawElementsInstancedARB",
+    "glDrawElementsInstancedBaseInstanceEXT",
+    "glDrawElementsInstancedBaseVertexBaseInstanceEXT",
+    "glDrawElementsInstancedBaseVertexEXT",
+    "glDrawElementsInstancedBaseVertexOES",
+    "glDrawElementsInstancedEXT",
+    "glDrawRangeElementsBaseVertexEXT",
+    "glDrawRangeElementsBaseVertexOES",
+    "glDrawRangeElementsEXT",
+    "glDrawTransformFeedbackEXT",
+    "glDrawTransformFeedbackInstancedEXT",
+    "glEnableVertexArrayAttribEXT",
+    "glEnableVertexAttribArrayARB",
+    "glEnableiEXT",
+    "glEnableiOES",
+    "glEndQueryARB",
+    "glEndQueryEXT",
+    "glEndTransformFeedbackEXT",
+    "glFlushMappedBufferRangeEXT",
+    "glFlushMappedNamedBufferRangeEXT",
+    "glFramebufferRenderbufferEXT",
+    "glFramebufferTexture1DEXT",
+    "glFramebufferTexture2DEXT",
+    "glFramebufferTexture3DEXT",
+    "glFramebufferTexture3DOES",
+    "glFramebufferTextureARB",
+    "glFramebufferTextureEXT",
+    "glFramebufferTextureLayerARB",
+    "glFramebufferTextureLayerEXT",
+    "glFramebufferTextureOES",
+    "glGenBuffersARB",
+    "glGenFramebuffersEXT",
+    "glGenProgramPipelinesEXT",
+    "glGenQueriesARB",
+    "glGenQueriesEXT",
+    "glGenRenderbuffersEXT",
+    "glGenTexturesEXT",
+    "glGenVertexArraysOES",
+    "glGenerateMipmapEXT",
+    "glGenerateTextureMipmapEXT",
+    "glGetActiveAttribARB",
+    "glGetActiveUniformARB",
+    "glGetAttribLocationARB",
+    "glGetBufferParameterivARB",
+    "glGetBufferPointervARB",
+    "glGetBufferPointervOES",
+    "glGetBufferSubDataARB",
+    "glGetCompressedTexImageARB",
+    "glGetCompressedTextureImageEXT",
+    "glGetDebugMessageLogARB",
+    "glGetDebugMessageLogKHR",
+    "glGetDoublei_vEXT",
+    "glGetFloati_vEXT",
+    "glGetFloati_vOES",
+    "glGetFragDataIndexEXT",
+    "glGetFragDataLocationEXT",
+    "glGetFramebufferAttachmentParameterivEXT",
+    "glGetFramebufferParameterivEXT",
+    "glGetGraphicsResetStatusARB",
+    "glGetGraphicsResetStatusEXT",
+    "glGetGraphicsResetStatusKHR",
+    "glGetIntegeri_vEXT",
+    "glGetNamedBufferParameterivEXT",
+    "glGetNamedBufferPointervEXT",
+    "glGetNamedBufferSubDataEXT",
+    "glGetNamedFramebufferAttachmentParameterivEXT",
+    "glGetNamedFramebufferParameterivEXT",
+    "glGetNamedRenderbufferParameterivEXT",
+    "glGetObjectLabelEXT",
+    "glGetObjectLabelKHR",
+    "glGetObjectPtrLabelKHR",
+    "glGetPointervEXT",
+    "glGetPointervKHR",
+    "glGetProgramBinaryOES",
+    "glGetProgramPipelineInfoLogEXT",
+    "glGetProgramPipelineivEXT",
+    "glGetProgramResourceLocationIndexEXT",
+    "glGetProgramivARB",
+    "glGetQueryObjecti64vEXT",
+    "glGetQueryObjectivARB",
+    "glGetQueryObjectivEXT",
+    "glGetQueryObjectui64vEXT",
+    "glGetQueryObjectuivARB",
+    "glGetQueryObjectuivEXT",
+    "glGetQueryivARB",
+    "glGetQueryivEXT",
+    "glGetRenderbufferParameterivEXT",
+    "glGetSamplerParameterIivEXT",
+    "glGetSamplerParameterIivOES",
+    "glGetSamplerParameterIuivEXT",
+    "glGetSamplerParameterIuivOES",
+    "glGetShaderSourceARB",
+    "glGetTexParameterIivEXT",
+    "glGetTexParameterIivOES",
+    "glGetTexParameterIuivEXT",
+    "glGetTexParameterIuivOES",
+    "glGetTextureImageEXT",
+    "glGetTextureLevelParameterfvEXT",
+    "glGetTextureLevelParameterivEXT",
+    "glGetTextureParameterIivEXT",
+    "glGetTextureParameterIuivEXT",
+    "glGetTextureParameterfvEXT",
+    "glGetTextureParameterivEXT",
+    "glGetTransformFeedbackVaryingEXT",
+    "glGetUniformLocationARB",
+    "glGetUniformfvARB",
+    "glGetUniformivARB",
+    "glGetUniformuivEXT",
+    "glGetVertexAttribIivEXT",
+    "glGetVertexAttribIuivEXT",
+    "glGetVertexAttribLdvEXT",
+    "glGetVertexAttribPointervARB",
+    "glGetVertexAttribdvARB",
+    "glGetVertexAttribfvARB",
+    "glGetVertexAttribivARB",
+    "glGetnCompressedTexImageARB",
+    "glGetnTexImageARB",
+    "glGetnUniformdvARB",
+    "glGetnUniformfvARB",
+    "glGetnUniformfvEXT",
+    "glGetnUniformfvKHR",
+    "glGetnUniformivARB",
+    "glGetnUniformivEXT",
+    "glGetnUniformivKHR",
+    "glGetnUniformuivARB",
+    "glGetnUniformuivKHR",
+    "glIsBufferARB",
+    "glIsEnablediEXT",
+    "glIsEnablediOES",
+    "glIsFramebufferEXT",
+    "glIsProgramARB",
+    "glIsProgramPipelineEXT",
+    "glIsQueryARB",
+    "glIsQueryEXT",
+    "glIsRenderbufferEXT",
+    "glIsTextureEXT",
+    "glIsVertexArrayOES",
+    "glLinkProgramARB",
+    "glMapBufferARB",
+    "glMapBufferOES",
+    "glMapBufferRangeEXT",
+    "glMapNamedBufferEXT",
+    "glMapNamedBufferRangeEXT",
+    "glMemoryBarrierEXT",
+    "glMinSampleShadingARB",
+    "glMinSampleShadingOES",
+    "glMultiDrawArraysEXT",
+    "glMultiDrawArraysIndirectEXT",
+    "glMultiDrawElementsBaseVertexEXT",
+    "glMultiDrawElementsEXT",
+    "glMultiDrawElementsIndirectEXT",
+    "glNamedBufferDataEXT",
+    "glNamedBufferStorageEXT",
+    "glNamedBufferSubDataEXT",
+    "glNamedFramebufferParameteriEXT",
+    "glNamedFramebufferRenderbufferEXT",
+    "glNamedFramebufferTextureEXT",
+    "glNamedFramebufferTextureLayerEXT",
+    "glNamedRenderbufferStorageEXT",
+    "glNamedRenderbufferStorageMultisampleEXT",
+    "glObjectLabelKHR",
+    "glObjectPtrLabelKHR",
+    "glPatchParameteriEXT",
+    "glPatchParameteriOES",
+    "glPointParameterfARB",
+    "glPointParameterfEXT",
+    "glPointParameterfvARB",
+    "glPointParameterfvEXT",
+    "glPolygonOffsetEXT",
+    "glPopDebugGroupKHR",
+    "glPrimitiveBoundingBoxARB",
+    "glPrimitiveBoundingBoxEXT",
+    "glPrimitiveBoundingBoxOES",
+    "glProgramBinaryOES",
+    "glProgramParameteriARB",
+    "glProgramParameteriEXT",
+    "glProgramUniform1dEXT",
+    "glProgramUniform1dvEXT",
+    "glProgramUniform1fEXT",
+    "glProgramUniform1fvEXT",
+    "glProgramUniform1iEXT",
+    "glProgramUniform1ivEXT",
+    "glProgramUniform1uiEXT",
+    "glProgramUniform1uivEXT",
+    "glProgramUniform2dEXT",
+    "glProgramUniform2dvEXT",
+    "glProgramUniform2fEXT",
+    "glProgramUniform2fvEXT",
+    "glProgramUniform2iEXT",
+    "glProgramUniform2ivEXT",
+    "glProgramUniform2uiEXT",
+    "glProgramUniform2uivEXT",
+    "glProgramUniform3dEXT",
+    "glProgramUniform3dvEXT",
+    "glProgramUniform3fEXT",
+    "glProgramUniform3fvEXT",
+    "glProgramUniform3iEXT",
+    "glProgramUniform3ivEXT",
+    "glProgramUniform3uiEXT",
+    "glProgramUniform3uivEXT",
+    "glProgramUniform4dEXT",
+    "glProgramUniform4dvEXT",
+    "glProgramUniform4fEXT",
+    "glProgramUniform4fvEXT",
+    "glProgramUniform4iEXT",
+    "glProgramUniform4ivEXT",
+    "glProgramUniform4uiEXT",
+    "glProgramUniform4uivEXT",
+    "glProgramUniformMatrix2dvEXT",
+    "glProgramUniformMatrix2fvEXT",
+    "glProgramUniformMatrix2x3dvEXT",
+    "glProgramUniformMatrix2x3fvEXT",
+    "glProgramUniformMatrix2x4dvEXT",
+    "glProgramUniformMatrix2x4fvEXT",
+    "glProgramUniformMatrix3dvEXT",
+    "glProgramUniformMatrix3fvEXT",
+    "glProgramUniformMatrix3x2dvEXT",
+    "glProgramUniformMatrix3x2fvEXT",
+    "glProgramUniformMatrix3x4dvEXT",
+    "glProgramUniformMatrix3x4fvEXT",
+    "glProgramUniformMatrix4dvEXT",
+    "glProgramUniformMatrix4fvEXT",
+    "glProgramUniformMatrix4x2dvEXT",
+    "glProgramUniformMatrix4x2fvEXT",
+    "glProgramUniformMatrix4x3dvEXT",
+    "glProgramUniformMatrix4x3fvEXT",
+    "glProvokingVertexEXT",
+    "glPushDebugGroupKHR",
+    "glQueryCounterEXT",
+    "glReadnPixelsARB",
+    "glReadnPixelsEXT",
+    "glReadnPixelsKHR",
+    "glRenderbufferStorageEXT",
+    "glRenderbufferStorageMultisampleEXT",
+    "glSampleCoverageARB",
+    "glSamplerParameterIivEXT",
+    "glSamplerParameterIivOES",
+    "glSamplerParameterIuivEXT",
+    "glSamplerParameterIuivOES",
+    "glScissorArrayvOES",
+    "glScissorIndexedOES",
+    "glScissorIndexedvOES",
+    "glShaderSourceARB",
+    "glTexBufferARB",
+    "glTexBufferEXT",
+    "glTexBufferOES",
+    "glTexBufferRangeEXT",
+    "glTexBufferRangeOES",
+    "glTexImage3DEXT",
+    "glTexImage3DOES",
+    "glTexParameterIivEXT",
+    "glTexParameterIivOES",
+    "glTexParameterIuivEXT",
+    "glTexParameterIuivOES",
+    "glTexStorage1DEXT",
+    "glTexStorage2DEXT",
+    "glTexStorage3DEXT",
+    "glTexStorage3DMultisampleOES",
+    "glTexSubImage1DEXT",
+    "glTexSubImage2DEXT",
+    "glTexSubImage3DEXT",
+    "glTexSubImage3DOES",
+    "glTextureBufferEXT",
+    "glTextureBufferRangeEXT",
+    "glTextureParameterIivEXT",
+    "glTextureParameterIuivEXT",
+    "glTextureParameterfEXT",
+    "glTextureParameterfvEXT",
+    "glTextureParameteriEXT",
+    "glTextureParameterivEXT",
+    "glTextureStorage1DEXT",
+    "glTextureStorage2DEXT",
+    "glTextureStorage2DMultisampleEXT",
+    "glTextureStorage3DEXT",
+    "glTextureStorage3DMultisampleEXT",
+    "glTextureSubImage1DEXT",
+    "glTextureSubImage2DEXT",
+    "glTextureSubImage3DEXT",
+    "glTextureViewEXT",
+    "glTextureViewOES",
+    "glTransformFeedbackVaryingsEXT",
+    "glUniform1fARB",
+    "glUniform1fvARB",
+    "glUniform1iARB",
+    "glUniform1ivARB",
+    "glUniform1uiEXT",
+    "glUniform1uivEXT",
+    "glUniform2fARB",
+    "glUniform2fvARB",
+    "glUniform2iARB",
+    "glUniform2ivARB",
+    "glUniform2uiEXT",
+    "glUniform2uivEXT",
+    "glUniform3fARB",
+    "glUniform3fvARB",
+    "glUniform3iARB",
+    "glUniform3ivARB",
+    "glUniform3uiEXT",
+    "glUniform3uivEXT",
+    "glUniform4fARB",
+    "glUniform4fvARB",
+    "glUniform4iARB",
+    "glUniform4ivARB",
+    "glUniform4uiEXT",
+    "glUniform4uivEXT",
+    "glUniformMatrix2fvARB",
+    "glUniformMatrix3fvARB",
+    "glUniformMatrix4fvARB",
+    "glUnmapBufferARB",
+    "glUnmapBufferOES",
+    "glUnmapNamedBufferEXT",
+    "glUseProgramStagesEXT",
+    "glValidateProgramARB",
+    "glValidateProgramPipelineEXT",
+    "glVertexAttrib1dARB",
+    "glVertexAttrib1dvARB",
+    "glVertexAttrib1fARB",
+    "glVertexAttrib1fvARB",
+    "glVertexAttrib1sARB",
+    "glVertexAttrib1svARB",
+    "glVertexAttrib2dARB",
+    "glVertexAttrib2dvARB",
+    "glVertexAttrib2fARB",
+    "glVertexAttrib2fvARB",
+    "glVertexAttrib2sARB",
+    "glVertexAttrib2svARB",
+    "glVertexAttrib3dARB",
+    "glVertexAttrib3dvARB",
+    "glVertexAttrib3fARB",
+    "glVertexAttrib3fvARB",
+    "glVertexAttrib3sARB",
+    "glVertexAttrib3svARB",
+    "glVertexAttrib4NbvARB",
+    "glVertexAttrib4NivARB",
+    "glVertexAttrib4NsvARB",
+    "glVertexAttrib4NubARB",
+    "glVertexAttrib4NubvARB",
+    "glVertexAttrib4NuivARB",
+    "glVertexAttrib4NusvARB",
+    "glVertexAttrib4bvARB",
+    "glVertexAttrib4dARB",
+    "glVertexAttrib4dvARB",
+    "glVertexAttrib4fARB",
+    "glVertexAttrib4fvARB",
+    "glVertexAttrib4ivARB",
+    "glVertexAttrib4sARB",
+    "glVertexAttrib4svARB",
+    "glVertexAttrib4ubvARB",
+    "glVertexAttrib4uivARB",
+    "glVertexAttrib4usvARB",
+    "glVertexAttribDivisorARB",
+    "glVertexAttribDivisorEXT",
+    "glVertexAttribI1iEXT",
+    "glVertexAttribI1ivEXT",
+    "glVertexAttribI1uiEXT",
+    "glVertexAttribI1uivEXT",
+    "glVertexAttribI2iEXT",
+    "glVertexAttribI2ivEXT",
+    "glVertexAttribI2uiEXT",
+    "glVertexAttribI2uivEXT",
+    "glVertexAttribI3iEXT",
+    "glVertexAttribI3ivEXT",
+    "glVertexAttribI3uiEXT",
+    "glVertexAttribI3uivEXT",
+    "glVertexAttribI4bvEXT",
+    "glVertexAttribI4iEXT",
+    "glVertexAttribI4ivEXT",
+    "glVertexAttribI4svEXT",
+    "glVertexAttribI4ubvEXT",
+    "glVertexAttribI4uiEXT",
+    "glVertexAttribI4uivEXT",
+    "glVertexAttribI4usvEXT",
+    "glVertexAttribIPointerEXT",
+    "glVertexAttribL1dEXT",
+    "glVertexAttribL1dvEXT",
+    "glVertexAttribL2dEXT",
+    "glVertexAttribL2dvEXT",
+    "glVertexAttribL3dEXT",
+    "glVertexAttribL3dvEXT",
+    "glVertexAttribL4dEXT",
+    "glVertexAttribL4dvEXT",
+    "glVertexAttribLPointerEXT",
+    "glVertexAttribPointerARB",
+    "glViewportArrayvOES",
+    "glViewportIndexedfOES",
+    "glViewportIndexedfvOES",
+};
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+// The driver that the lazy entry points load from, if any table points at them. Only the tables
+// of one driver at a time are loaded lazily, the others load their functions up front.
+const void *gLazyDriver = nullptr;
+
+// The functions loaded by the lazy entry points, by index. Worker threads read the entries of the
+// tables without synchronization, so the tables keep pointing at the lazy entry points, and every
+// call to a lazily loaded function goes through its lazy entry point.
+std::atomic<void *> gLazyProcs[DispatchTableGL::kProcCount];
+
+std::mutex &GetLazyTableMutex()
+{
+    static std::mutex mutex;
+    return mutex;
+}
+
+// The tables of gLazyDriver, through which the lazy entry points load their functions.
+std::vector<DispatchTableGL *> &GetLazyTables()
+{
+    static std::vector<DispatchTableGL *> *lazyTables = new std::vector<DispatchTableGL *>;
+    return *lazyTables;
+}
+
+template <typename ProcT, size_t Index>
+ProcT LoadLazy()
+{
+    void *proc = gLazyProcs[Index].load(std::memory_order_acquire);
+    if (!proc)
+    {
+        proc = DispatchTableGL::LoadLazyProc(Index);
+    }
+    return reinterpret_cast<ProcT>(proc);
+}
+
+void INTERNAL_GL_APIENTRY glActiveShaderProgramLazy(GLuint pipeline, GLuint program)
+{
+    return LoadLazy<PFNGLACTIVESHADERPROGRAMPROC, 0>()(pipeline, program);
+}
+
+void INTERNAL_GL_APIENTRY glActiveTextureLazy(GLenum texture)
+{
+    return LoadLazy<PFNGLACTIVETEXTUREPROC, 1>()(texture);
+}
+
+void INTERNAL_GL_APIENTRY glAttachShaderLazy(GLuint program, GLuint shader)
+{
+    return LoadLazy<PFNGLATTACHSHADERPROC, 2>()(program, shader);
+}
+
+void INTERNAL_GL_APIENTRY glBeginConditionalRenderLazy(GLuint id, GLenum mode)
+{
+    return LoadLazy<PFNGLBEGINCONDITIONALRENDERPROC, 3>()(id, mode);
+}
+
+void INTERNAL_GL_APIENTRY glBeginQueryLazy(GLenum target, GLuint id)
+{
+    return LoadLazy<PFNGLBEGINQUERYPROC, 4>()(target, id);
+}
+
+void INTERNAL_GL_APIENTRY glBeginQueryIndexedLazy(GLenum target, GLuint index, GLuint id)
+{
+    return LoadLazy<PFNGLBEGINQUERYINDEXEDPROC, 5>()(target, index, id);
+}
+
+void INTERNAL_GL_APIENTRY glBeginTransformFeedbackLazy(GLenum primitiveMode)
+{
+    return LoadLazy<PFNGLBEGINTRANSFORMFEEDBACKPROC, 6>()(primitiveMode);
+}
+
+void INTERNAL_GL_APIENTRY glBindAttribLocationLazy(GLuint program, GLuint index, const GLchar *name)
+{
+    return LoadLazy<PFNGLBINDATTRIBLOCATIONPROC, 7>()(program, index, name);
+}
+
+void INTERNAL_GL_APIENTRY glBindBufferLazy(GLenum target, GLuint buffer)
+{
+    return LoadLazy<PFNGLBINDBUFFERPROC, 8>()(target, buffer);
+}
+
+void INTERNAL_GL_APIENTRY glBindBufferBaseLazy(GLenum target, GLuint index, GLuint buffer)
+{
+    return LoadLazy<PFNGLBINDBUFFERBASEPROC, 9>()(target, index, buffer);
+}
+
+void INTERNAL_GL_APIENTRY
+glBindBufferRangeLazy(GLenum target, GLuint index, GLuint buffer, GLintptr offset, GLsizeiptr size)
+{
+    return LoadLazy<PFNGLBINDBUFFERRANGEPROC, 10>()(target, index, buffer, offset, size);
+}
+
+void INTERNAL_GL_APIENTRY glBindBuffersBaseLazy(GLenum target,
+                                                GLuint first,
+                                                GLsizei count,
+                                                const GLuint *buffers)
+{
+    return LoadLazy<PFNGLBINDBUFFERSBASEPROC, 11>()(target, first, count, buffers);
+}
+
+void INTERNAL_GL_APIENTRY glBindBuffersRangeLazy(GLenum target,
+                                                 GLuint first,
+                                                 GLsizei count,
+                                                 const GLuint *buffers,
+                                                 const GLintptr *offsets,
+                                                 const GLsizeiptr *sizes)
+{
+    return LoadLazy<PFNGLBINDBUFFERSRANGEPROC, 12>()(target, first, count, buffers, offsets, sizes);
+}
+
+void INTERNAL_GL_APIENTRY glBindFragDataLocationLazy(GLuint program,
+                                                     GLuint color,
+                                                     const GLchar *name)
+{
+    return LoadLazy<PFNGLBINDFRAGDATALOCATIONPROC, 13>()(program, color, name);
+}
+
+void INTERNAL_GL_APIENTRY glBindFragDataLocationIndexedLazy(GLuint program,
+                                                            GLuint colorNumber,
+                                                            GLuint index,
+                                                            const GLchar *name)
+{
+    return LoadLazy<PFNGLBINDFRAGDATALOCATIONINDEXEDPROC, 14>()(program, colorNumber, index, name);
+}
+
+void INTERNAL_GL_APIENTRY glBindFramebufferLazy(GLenum target, GLuint framebuffer)
+{
+    return LoadLazy<PFNGLBINDFRAMEBUFFERPROC, 15>()(target, framebuffer);
+}
+
+void INTERNAL_GL_APIENTRY glBindImageTextureLazy(GLuint unit,
+                                                 GLuint texture,
+                                                 GLint level,
+                                                 GLboolean layered,
+                                                 GLint layer,
+                                                 GLenum access,
+                                                 GLenum format)
+{
+    return LoadLazy<PFNGLBINDIMAGETEXTUREPROC, 16>()(unit, texture, level, layered, layer, access,
+                                                     format);
+}
+
+void INTERNAL_GL_APIENTRY glBindImageTexturesLazy(GLuint first,
+                                                  GLsizei count,
+                                                  const GLuint *textures)
+{
+    return LoadLazy<PFNGLBINDIMAGETEXTURESPROC, 17>()(first, count, textures);
+}
+
+void INTERNAL_GL_APIENTRY glBindProgramPipelineLazy(GLuint pipeline)
+{
+    return LoadLazy<PFNGLBINDPROGRAMPIPELINEPROC, 18>()(pipeline);
+}
+
+void INTERNAL_GL_APIENTRY glBindRenderbufferLazy(GLenum target, GLuint renderbuffer)
+{
+    return LoadLazy<PFNGLBINDRENDERBUFFERPROC, 19>()(target, renderbuffer);
+}
+
+void INTERNAL_GL_APIENTRY glBindSamplerLazy(GLuint unit, GLuint sampler)
+{
+    return LoadLazy<PFNGLBINDSAMPLERPROC, 20>()(unit, sampler);
+}
+
+void INTERNAL_GL_APIENTRY glBindSamplersLazy(GLuint first, GLsizei count, const GLuint *samplers)
+{
+    return LoadLazy<PFNGLBINDSAMPLERSPROC, 21>()(first, count, samplers);
+}
+
+void INTERNAL_GL_APIENTRY glBindTextureLazy(GLenum target, GLuint texture)
+{
+    return LoadLazy<PFNGLBINDTEXTUREPROC, 22>()(target, texture);
+}
+
+void INTERNAL_GL_APIENTRY glBindTextureUnitLazy(GLuint unit, GLuint texture)
+{
+    return LoadLazy<PFNGLBINDTEXTUREUNITPROC, 23>()(unit, texture);
+}
+
+void INTERNAL_GL_APIENTRY glBindTexturesLazy(GLuint first, GLsizei count, const GLuint *textures)
+{
+    return LoadLazy<PFNGLBINDTEXTURESPROC, 24>()(first, count, textures);
+}
+
+void INTERNAL_GL_APIENTRY glBindTransformFeedbackLazy(GLenum target, GLuint id)
+{
+    return LoadLazy<PFNGLBINDTRANSFORMFEEDBACKPROC, 25>()(target, id);
+}
+
+void INTERNAL_GL_APIENTRY glBindVertexArrayLazy(GLuint array)
+{
+    return LoadLazy<PFNGLBINDVERTEXARRAYPROC, 26>()(array);
+}
+
+void INTERNAL_GL_APIENTRY glBindVertexBufferLazy(GLuint bindingindex,
+                                                 GLuint buffer,
+                                                 GLintptr offset,
+                                                 GLsizei stride)
+{
+    return LoadLazy<PFNGLBINDVERTEXBUFFERPROC, 27>()(bindingindex, buffer, offset, stride);
+}
+
+void INTERNAL_GL_APIENTRY glBindVertexBuffersLazy(GLuint first,
+                                                  GLsizei count,
+                                                  const GLuint *buffers,
+                                                  const GLintptr *offsets,
+                                                  const GLsizei *strides)
+{
+    return LoadLazy<PFNGLBINDVERTEXBUFFERSPROC, 28>()(first, count, buffers, offsets, strides);
+}
+
+void INTERNAL_GL_APIENTRY glBlendBarrierLazy()
+{
+    return LoadLazy<PFNGLBLENDBARRIERPROC, 29>()();
+}
+
+void INTERNAL_GL_APIENTRY glBlendColorLazy(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    return LoadLazy<PFNGLBLENDCOLORPROC, 30>()(red, green, blue, alpha);
+}
+
+void INTERNAL_GL_APIENTRY glBlendEquationLazy(GLenum mode)
+{
+    return LoadLazy<PFNGLBLENDEQUATIONPROC, 31>()(mode);
+}
+
+void INTERNAL_GL_APIENTRY glBlendEquationSeparateLazy(GLenum modeRGB, GLenum modeAlpha)
+{
+    return LoadLazy<PFNGLBLENDEQUATIONSEPARATEPROC, 32>()(modeRGB, modeAlpha);
+}
+
+void INTERNAL_GL_APIENTRY glBlendEquationSeparateiLazy(GLuint buf, GLenum modeRGB, GLenum modeAlpha)
+{
+    return LoadLazy<PFNGLBLENDEQUATIONSEPARATEIPROC, 33>()(buf, modeRGB, modeAlpha);
+}
+
+void INTERNAL_GL_APIENTRY glBlendEquationiLazy(GLuint buf, GLenum mode)
+{
+    return LoadLazy<PFNGLBLENDEQUATIONIPROC, 34>()(buf, mode);
+}
+
+void INTERNAL_GL_APIENTRY glBlendFuncLazy(GLenum sfactor, GLenum dfactor)
+{
+    return LoadLazy<PFNGLBLENDFUNCPROC, 35>()(sfactor, dfactor);
+}
+
+void INTERNAL_GL_APIENTRY glBlendFuncSeparateLazy(GLenum sfactorRGB,
+                                                  GLenum dfactorRGB,
+                                                  GLenum sfactorAlpha,
+                                                  GLenum dfactorAlpha)
+{
+    return LoadLazy<PFNGLBLENDFUNCSEPARATEPROC, 36>()(sfactorRGB, dfactorRGB, sfactorAlpha,
+                                                      dfactorAlpha);
+}
+
+void INTERNAL_GL_APIENTRY
+glBlendFuncSeparateiLazy(GLuint buf, GLenum srcRGB, GLenum dstRGB, GLenum srcAlpha, GLenum dstAlpha)
+{
+    return LoadLazy<PFNGLBLENDFUNCSEPARATEIPROC, 37>()(buf, srcRGB, dstRGB, srcAlpha, dstAlpha);
+}
+
+void INTERNAL_GL_APIENTRY glBlendFunciLazy(GLuint buf, GLenum src, GLenum dst)
+{
+    return LoadLazy<PFNGLBLENDFUNCIPROC, 38>()(buf, src, dst);
+}
+
+void INTERNAL_GL_APIENTRY glBlitFramebufferLazy(GLint srcX0,
+                                                GLint srcY0,
+                                                GLint srcX1,
+                                                GLint srcY1,
+                                                GLint dstX0,
+                                                GLint dstY0,
+                                                GLint dstX1,
+                                                GLint dstY1,
+                                                GLbitfield mask,
+                                                GLenum filter)
+{
+    return LoadLazy<PFNGLBLITFRAMEBUFFERPROC, 39>()(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                                                    dstY1, mask, filter);
+}
+
+void INTERNAL_GL_APIENTRY glBlitNamedFramebufferLazy(GLuint readFramebuffer,
+                                                     GLuint drawFramebuffer,
+                                                     GLint srcX0,
+                                                     GLint srcY0,
+                                                     GLint srcX1,
+                                                     GLint srcY1,
+                                                     GLint dstX0,
+                                                     GLint dstY0,
+                                                     GLint dstX1,
+                                                     GLint dstY1,
+                                                     GLbitfield mask,
+                                                     GLenum filter)
+{
+    return LoadLazy<PFNGLBLITNAMEDFRAMEBUFFERPROC, 40>()(readFramebuffer, drawFramebuffer, srcX0,
+                                                         srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                                                         dstY1, mask, filter);
+}
+
+void INTERNAL_GL_APIENTRY glBufferDataLazy(GLenum target,
+                                           GLsizeiptr size,
+                                           const void *data,
+                                           GLenum usage)
+{
+    return LoadLazy<PFNGLBUFFERDATAPROC, 41>()(target, size, data, usage);
+}
+
+void INTERNAL_GL_APIENTRY glBufferStorageLazy(GLenum target,
+                                              GLsizeiptr size,
+                                              const void *data,
+                                              GLbitfield flags)
+{
+    return LoadLazy<PFNGLBUFFERSTORAGEPROC, 42>()(target, size, data, flags);
+}
+
+void INTERNAL_GL_APIENTRY glBufferSubDataLazy(GLenum target,
+                                              GLintptr offset,
+                                              GLsizeiptr size,
+                                              const void *data)
+{
+    return LoadLazy<PFNGLBUFFERSUBDATAPROC, 43>()(target, offset, size, data);
+}
+
+GLenum INTERNAL_GL_APIENTRY glCheckFramebufferStatusLazy(GLenum target)
+{
+    return LoadLazy<PFNGLCHECKFRAMEBUFFERSTATUSPROC, 44>()(target);
+}
+
+GLenum INTERNAL_GL_APIENTRY glCheckNamedFramebufferStatusLazy(GLuint framebuffer, GLenum target)
+{
+    return LoadLazy<PFNGLCHECKNAMEDFRAMEBUFFERSTATUSPROC, 45>()(framebuffer, target);
+}
+
+void INTERNAL_GL_APIENTRY glClampColorLazy(GLenum target, GLenum clamp)
+{
+    return LoadLazy<PFNGLCLAMPCOLORPROC, 46>()(target, clamp);
+}
+
+void INTERNAL_GL_APIENTRY glClearLazy(GLbitfield mask)
+{
+    return LoadLazy<PFNGLCLEARPROC, 47>()(mask);
+}
+
+void INTERNAL_GL_APIENTRY glClearBufferDataLazy(GLenum target,
+                                                GLenum internalformat,
+                                                GLenum format,
+                                                GLenum type,
+                                                const void *data)
+{
+    return LoadLazy<PFNGLCLEARBUFFERDATAPROC, 48>()(target, internalformat, format, type, data);
+}
+
+void INTERNAL_GL_APIENTRY glClearBufferSubDataLazy(GLenum target,
+                                                   GLenum internalformat,
+                                                   GLintptr offset,
+                                                   GLsizeiptr size,
+                                                   GLenum format,
+                                                   GLenum type,
+                                                   const void *data)
+{
+    return LoadLazy<PFNGLCLEARBUFFERSUBDATAPROC, 49>()(target, internalformat, offset, size, format,
+                                                       type, data);
+}
+
+void INTERNAL_GL_APIENTRY glClearBufferfiLazy(GLenum buffer,
+                                              GLint drawbuffer,
+                                              GLfloat depth,
+                                              GLint stencil)
+{
+    return LoadLazy<PFNGLCLEARBUFFERFIPROC, 50>()(buffer, drawbuffer, depth, stencil);
+}
+
+void INTERNAL_GL_APIENTRY glClearBufferfvLazy(GLenum buffer, GLint drawbuffer, const GLfloat *value)
+{
+    return LoadLazy<PFNGLCLEARBUFFERFVPROC, 51>()(buffer, drawbuffer, value);
+}
+
+void INTERNAL_GL_APIENTRY glClearBufferivLazy(GLenum buffer, GLint drawbuffer, const GLint *value)
+{
+    return LoadLazy<PFNGLCLEARBUFFERIVPROC, 52>()(buffer, drawbuffer, value);
+}
+
+void INTERNAL_GL_APIENTRY glClearBufferuivLazy(GLenum buffer, GLint drawbuffer, const GLuint *value)
+{
+    return LoadLazy<PFNGLCLEARBUFFERUIVPROC, 53>()(buffer, drawbuffer, value);
+}
+
+void INTERNAL_GL_APIENTRY glClearColorLazy(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+{
+    return LoadLazy<PFNGLCLEARCOLORPROC, 54>()(red, green, blue, alpha);
+}
+
+void INTERNAL_GL_APIENTRY glClearDepthLazy(GLdouble depth)
+{
+    return LoadLazy<PFNGLCLEARDEPTHPROC, 55>()(depth);
+}
+
+void INTERNAL_GL_APIENTRY glClearDepthfLazy(GLfloat d)
+{
+    return LoadLazy<PFNGLCLEARDEPTHFPROC, 56>()(d);
+}
+
+void INTERNAL_GL_APIENTRY glClearNamedBufferDataLazy(GLuint buffer,
+                                                     GLenum internalformat,
+                                                     GLenum format,
+                                                     GLenum type,
+                                                     const void *data)
+{
+    return LoadLazy<PFNGLCLEARNAMEDBUFFERDATAPROC, 57>()(buffer, internalformat, format, type,
+                                                         data);
+}
+
+void INTERNAL_GL_APIENTRY glClearNamedBufferSubDataLazy(GLuint buffer,
+                                                        GLenum internalformat,
+                                                        GLintptr offset,
+                                                        GLsizeiptr size,
+                                                        GLenum format,
+                                                        GLenum type,
+                                                        const void *data)
+{
+    return LoadLazy<PFNGLCLEARNAMEDBUFFERSUBDATAPROC, 58>()(buffer, internalformat, offset, size,
+                                                            format, type, data);
+}
+
+void INTERNAL_GL_APIENTRY glClearNamedFramebufferfiLazy(GLuint framebuffer,
+                                                        GLenum buffer,
+                                                        GLint drawbuffer,
+                                                        GLfloat depth,
+                                                        GLint stencil)
+{
+    return LoadLazy<PFNGLCLEARNAMEDFRAMEBUFFERFIPROC, 59>()(framebuffer, buffer, drawbuffer, depth,
+                                                            stencil);
+}
+
+void INTERNAL_GL_APIENTRY glClearNamedFramebufferfvLazy(GLuint framebuffer,
+                                                        GLenum buffer,
+                                                        GLint drawbuffer,
+                                                        const GLfloat *value)
+{
+    return LoadLazy<PFNGLCLEARNAMEDFRAMEBUFFERFVPROC, 60>()(framebuffer, buffer, drawbuffer, value);
+}
+
+void INTERNAL_GL_APIENTRY glClearNamedFramebufferivLazy(GLuint framebuffer,
+                                                        GLenum buffer,
+                                                        GLint drawbuffer,
+                                                        const GLint *value)
+{
+    return LoadLazy<PFNGLCLEARNAMEDFRAMEBUFFERIVPROC, 61>()(framebuffer, buffer, drawbuffer, value);
+}
+
+void INTERNAL_GL_APIENTRY glClearNamedFramebufferuivLazy(GLuint framebuffer,
+                                                         GLenum buffer,
+                                                         GLint drawbuffer,
+                                                         const GLuint *value)
+{
+    return LoadLazy<PFNGLCLEARNAMEDFRAMEBUFFERUIVPROC, 62>()(framebuffer, buffer, drawbuffer,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glClearStencilLazy(GLint s)
+{
+    return LoadLazy<PFNGLCLEARSTENCILPROC, 63>()(s);
+}
+
+void INTERNAL_GL_APIENTRY
+glClearTexImageLazy(GLuint texture, GLint level, GLenum format, GLenum type, const void *data)
+{
+    return LoadLazy<PFNGLCLEARTEXIMAGEPROC, 64>()(texture, level, format, type, data);
+}
+
+void INTERNAL_GL_APIENTRY glClearTexSubImageLazy(GLuint texture,
+                                                 GLint level,
+                                                 GLint xoffset,
+                                                 GLint yoffset,
+                                                 GLint zoffset,
+                                                 GLsizei width,
+                                                 GLsizei height,
+                                                 GLsizei depth,
+                                                 GLenum format,
+                                                 GLenum type,
+                                                 const void *data)
+{
+    return LoadLazy<PFNGLCLEARTEXSUBIMAGEPROC, 65>()(texture, level, xoffset, yoffset, zoffset,
+                                                     width, height, depth, format, type, data);
+}
+
+GLenum INTERNAL_GL_APIENTRY glClientWaitSyncLazy(GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    return LoadLazy<PFNGLCLIENTWAITSYNCPROC, 66>()(sync, flags, timeout);
+}
+
+void INTERNAL_GL_APIENTRY glClipControlLazy(GLenum origin, GLenum depth)
+{
+    return LoadLazy<PFNGLCLIPCONTROLPROC, 67>()(origin, depth);
+}
+
+void INTERNAL_GL_APIENTRY glColorMaskLazy(GLboolean red,
+                                          GLboolean green,
+                                          GLboolean blue,
+                                          GLboolean alpha)
+{
+    return LoadLazy<PFNGLCOLORMASKPROC, 68>()(red, green, blue, alpha);
+}
+
+void INTERNAL_GL_APIENTRY
+glColorMaskiLazy(GLuint index, GLboolean r, GLboolean g, GLboolean b, GLboolean a)
+{
+    return LoadLazy<PFNGLCOLORMASKIPROC, 69>()(index, r, g, b, a);
+}
+
+void INTERNAL_GL_APIENTRY glCompileShaderLazy(GLuint shader)
+{
+    return LoadLazy<PFNGLCOMPILESHADERPROC, 70>()(shader);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTexImage1DLazy(GLenum target,
+                                                     GLint level,
+                                                     GLenum internalformat,
+                                                     GLsizei width,
+                                                     GLint border,
+                                                     GLsizei imageSize,
+                                                     const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXIMAGE1DPROC, 71>()(target, level, internalformat, width,
+                                                         border, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTexImage2DLazy(GLenum target,
+                                                     GLint level,
+                                                     GLenum internalformat,
+                                                     GLsizei width,
+                                                     GLsizei height,
+                                                     GLint border,
+                                                     GLsizei imageSize,
+                                                     const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXIMAGE2DPROC, 72>()(target, level, internalformat, width,
+                                                         height, border, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTexImage3DLazy(GLenum target,
+                                                     GLint level,
+                                                     GLenum internalformat,
+                                                     GLsizei width,
+                                                     GLsizei height,
+                                                     GLsizei depth,
+                                                     GLint border,
+                                                     GLsizei imageSize,
+                                                     const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXIMAGE3DPROC, 73>()(target, level, internalformat, width,
+                                                         height, depth, border, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTexSubImage1DLazy(GLenum target,
+                                                        GLint level,
+                                                        GLint xoffset,
+                                                        GLsizei width,
+                                                        GLenum format,
+                                                        GLsizei imageSize,
+                                                        const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXSUBIMAGE1DPROC, 74>()(target, level, xoffset, width, format,
+                                                            imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTexSubImage2DLazy(GLenum target,
+                                                        GLint level,
+                                                        GLint xoffset,
+                                                        GLint yoffset,
+                                                        GLsizei width,
+                                                        GLsizei height,
+                                                        GLenum format,
+                                                        GLsizei imageSize,
+                                                        const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXSUBIMAGE2DPROC, 75>()(target, level, xoffset, yoffset, width,
+                                                            height, format, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTexSubImage3DLazy(GLenum target,
+                                                        GLint level,
+                                                        GLint xoffset,
+                                                        GLint yoffset,
+                                                        GLint zoffset,
+                                                        GLsizei width,
+                                                        GLsizei height,
+                                                        GLsizei depth,
+                                                        GLenum format,
+                                                        GLsizei imageSize,
+                                                        const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXSUBIMAGE3DPROC, 76>()(
+        target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTextureSubImage1DLazy(GLuint texture,
+                                                            GLint level,
+                                                            GLint xoffset,
+                                                            GLsizei width,
+                                                            GLenum format,
+                                                            GLsizei imageSize,
+                                                            const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXTURESUBIMAGE1DPROC, 77>()(texture, level, xoffset, width,
+                                                                format, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTextureSubImage2DLazy(GLuint texture,
+                                                            GLint level,
+                                                            GLint xoffset,
+                                                            GLint yoffset,
+                                                            GLsizei width,
+                                                            GLsizei height,
+                                                            GLenum format,
+                                                            GLsizei imageSize,
+                                                            const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXTURESUBIMAGE2DPROC, 78>()(
+        texture, level, xoffset, yoffset, width, height, format, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCompressedTextureSubImage3DLazy(GLuint texture,
+                                                            GLint level,
+                                                            GLint xoffset,
+                                                            GLint yoffset,
+                                                            GLint zoffset,
+                                                            GLsizei width,
+                                                            GLsizei height,
+                                                            GLsizei depth,
+                                                            GLenum format,
+                                                            GLsizei imageSize,
+                                                            const void *data)
+{
+    return LoadLazy<PFNGLCOMPRESSEDTEXTURESUBIMAGE3DPROC, 79>()(
+        texture, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glCopyBufferSubDataLazy(GLenum readTarget,
+                                                  GLenum writeTarget,
+                                                  GLintptr readOffset,
+                                                  GLintptr writeOffset,
+                                                  GLsizeiptr size)
+{
+    return LoadLazy<PFNGLCOPYBUFFERSUBDATAPROC, 80>()(readTarget, writeTarget, readOffset,
+                                                      writeOffset, size);
+}
+
+void INTERNAL_GL_APIENTRY glCopyImageSubDataLazy(GLuint srcName,
+                                                 GLenum srcTarget,
+                                                 GLint srcLevel,
+                                                 GLint srcX,
+                                                 GLint srcY,
+                                                 GLint srcZ,
+                                                 GLuint dstName,
+                                                 GLenum dstTarget,
+                                                 GLint dstLevel,
+                                                 GLint dstX,
+                                                 GLint dstY,
+                                                 GLint dstZ,
+                                                 GLsizei srcWidth,
+                                                 GLsizei srcHeight,
+                                                 GLsizei srcDepth)
+{
+    return LoadLazy<PFNGLCOPYIMAGESUBDATAPROC, 81>()(srcName, srcTarget, srcLevel, srcX, srcY, srcZ,
+                                                     dstName, dstTarget, dstLevel, dstX, dstY, dstZ,
+                                                     srcWidth, srcHeight, srcDepth);
+}
+
+void INTERNAL_GL_APIENTRY glCopyNamedBufferSubDataLazy(GLuint readBuffer,
+                                                       GLuint writeBuffer,
+                                                       GLintptr readOffset,
+                                                       GLintptr writeOffset,
+                                                       GLsizeiptr size)
+{
+    return LoadLazy<PFNGLCOPYNAMEDBUFFERSUBDATAPROC, 82>()(readBuffer, writeBuffer, readOffset,
+                                                           writeOffset, size);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTexImage1DLazy(GLenum target,
+                                               GLint level,
+                                               GLenum internalformat,
+                                               GLint x,
+                                               GLint y,
+                                               GLsizei width,
+                                               GLint border)
+{
+    return LoadLazy<PFNGLCOPYTEXIMAGE1DPROC, 83>()(target, level, internalformat, x, y, width,
+                                                   border);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTexImage2DLazy(GLenum target,
+                                               GLint level,
+                                               GLenum internalformat,
+                                               GLint x,
+                                               GLint y,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLint border)
+{
+    return LoadLazy<PFNGLCOPYTEXIMAGE2DPROC, 84>()(target, level, internalformat, x, y, width,
+                                                   height, border);
+}
+
+void INTERNAL_GL_APIENTRY
+glCopyTexSubImage1DLazy(GLenum target, GLint level, GLint xoffset, GLint x, GLint y, GLsizei width)
+{
+    return LoadLazy<PFNGLCOPYTEXSUBIMAGE1DPROC, 85>()(target, level, xoffset, x, y, width);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTexSubImage2DLazy(GLenum target,
+                                                  GLint level,
+                                                  GLint xoffset,
+                                                  GLint yoffset,
+                                                  GLint x,
+                                                  GLint y,
+                                                  GLsizei width,
+                                                  GLsizei height)
+{
+    return LoadLazy<PFNGLCOPYTEXSUBIMAGE2DPROC, 86>()(target, level, xoffset, yoffset, x, y, width,
+                                                      height);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTexSubImage3DLazy(GLenum target,
+                                                  GLint level,
+                                                  GLint xoffset,
+                                                  GLint yoffset,
+                                                  GLint zoffset,
+                                                  GLint x,
+                                                  GLint y,
+                                                  GLsizei width,
+                                                  GLsizei height)
+{
+    return LoadLazy<PFNGLCOPYTEXSUBIMAGE3DPROC, 87>()(target, level, xoffset, yoffset, zoffset, x,
+                                                      y, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTextureSubImage1DLazy(GLuint texture,
+                                                      GLint level,
+                                                      GLint xoffset,
+                                                      GLint x,
+                                                      GLint y,
+                                                      GLsizei width)
+{
+    return LoadLazy<PFNGLCOPYTEXTURESUBIMAGE1DPROC, 88>()(texture, level, xoffset, x, y, width);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTextureSubImage2DLazy(GLuint texture,
+                                                      GLint level,
+                                                      GLint xoffset,
+                                                      GLint yoffset,
+                                                      GLint x,
+                                                      GLint y,
+                                                      GLsizei width,
+                                                      GLsizei height)
+{
+    return LoadLazy<PFNGLCOPYTEXTURESUBIMAGE2DPROC, 89>()(texture, level, xoffset, yoffset, x, y,
+                                                          width, height);
+}
+
+void INTERNAL_GL_APIENTRY glCopyTextureSubImage3DLazy(GLuint texture,
+                                                      GLint level,
+                                                      GLint xoffset,
+                                                      GLint yoffset,
+                                                      GLint zoffset,
+                                                      GLint x,
+                                                      GLint y,
+                                                      GLsizei width,
+                                                      GLsizei height)
+{
+    return LoadLazy<PFNGLCOPYTEXTURESUBIMAGE3DPROC, 90>()(texture, level, xoffset, yoffset, zoffset,
+                                                          x, y, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glCoverFillPathInstancedNVLazy(GLsizei numPaths,
+                                                         GLenum pathNameType,
+                                                         const void *paths,
+                                                         GLuint pathBase,
+                                                         GLenum coverMode,
+                                                         GLenum transformType,
+                                                         const GLfloat *transformValues)
+{
+    return LoadLazy<PFNGLCOVERFILLPATHINSTANCEDNVPROC, 91>()(
+        numPaths, pathNameType, paths, pathBase, coverMode, transformType, transformValues);
+}
+
+void INTERNAL_GL_APIENTRY glCoverFillPathNVLazy(GLuint path, GLenum coverMode)
+{
+    return LoadLazy<PFNGLCOVERFILLPATHNVPROC, 92>()(path, coverMode);
+}
+
+void INTERNAL_GL_APIENTRY glCoverStrokePathInstancedNVLazy(GLsizei numPaths,
+                                                           GLenum pathNameType,
+                                                           const void *paths,
+                                                           GLuint pathBase,
+                                                           GLenum coverMode,
+                                                           GLenum transformType,
+                                                           const GLfloat *transformValues)
+{
+    return LoadLazy<PFNGLCOVERSTROKEPATHINSTANCEDNVPROC, 93>()(
+        numPaths, pathNameType, paths, pathBase, coverMode, transformType, transformValues);
+}
+
+void INTERNAL_GL_APIENTRY glCoverStrokePathNVLazy(GLuint path, GLenum coverMode)
+{
+    return LoadLazy<PFNGLCOVERSTROKEPATHNVPROC, 94>()(path, coverMode);
+}
+
+void INTERNAL_GL_APIENTRY glCoverageModulationNVLazy(GLenum components)
+{
+    return LoadLazy<PFNGLCOVERAGEMODULATIONNVPROC, 95>()(components);
+}
+
+void INTERNAL_GL_APIENTRY glCreateBuffersLazy(GLsizei n, GLuint *buffers)
+{
+    return LoadLazy<PFNGLCREATEBUFFERSPROC, 96>()(n, buffers);
+}
+
+void INTERNAL_GL_APIENTRY glCreateFramebuffersLazy(GLsizei n, GLuint *framebuffers)
+{
+    return LoadLazy<PFNGLCREATEFRAMEBUFFERSPROC, 97>()(n, framebuffers);
+}
+
+GLuint INTERNAL_GL_APIENTRY glCreateProgramLazy()
+{
+    return LoadLazy<PFNGLCREATEPROGRAMPROC, 98>()();
+}
+
+void INTERNAL_GL_APIENTRY glCreateProgramPipelinesLazy(GLsizei n, GLuint *pipelines)
+{
+    return LoadLazy<PFNGLCREATEPROGRAMPIPELINESPROC, 99>()(n, pipelines);
+}
+
+void INTERNAL_GL_APIENTRY glCreateQueriesLazy(GLenum target, GLsizei n, GLuint *ids)
+{
+    return LoadLazy<PFNGLCREATEQUERIESPROC, 100>()(target, n, ids);
+}
+
+void INTERNAL_GL_APIENTRY glCreateRenderbuffersLazy(GLsizei n, GLuint *renderbuffers)
+{
+    return LoadLazy<PFNGLCREATERENDERBUFFERSPROC, 101>()(n, renderbuffers);
+}
+
+void INTERNAL_GL_APIENTRY glCreateSamplersLazy(GLsizei n, GLuint *samplers)
+{
+    return LoadLazy<PFNGLCREATESAMPLERSPROC, 102>()(n, samplers);
+}
+
+GLuint INTERNAL_GL_APIENTRY glCreateShaderLazy(GLenum type)
+{
+    return LoadLazy<PFNGLCREATESHADERPROC, 103>()(type);
+}
+
+GLuint INTERNAL_GL_APIENTRY glCreateShaderProgramvLazy(GLenum type,
+                                                       GLsizei count,
+                                                       const GLchar *const *strings)
+{
+    return LoadLazy<PFNGLCREATESHADERPROGRAMVPROC, 104>()(type, count, strings);
+}
+
+void INTERNAL_GL_APIENTRY glCreateTexturesLazy(GLenum target, GLsizei n, GLuint *textures)
+{
+    return LoadLazy<PFNGLCREATETEXTURESPROC, 105>()(target, n, textures);
+}
+
+void INTERNAL_GL_APIENTRY glCreateTransformFeedbacksLazy(GLsizei n, GLuint *ids)
+{
+    return LoadLazy<PFNGLCREATETRANSFORMFEEDBACKSPROC, 106>()(n, ids);
+}
+
+void INTERNAL_GL_APIENTRY glCreateVertexArraysLazy(GLsizei n, GLuint *arrays)
+{
+    return LoadLazy<PFNGLCREATEVERTEXARRAYSPROC, 107>()(n, arrays);
+}
+
+void INTERNAL_GL_APIENTRY glCullFaceLazy(GLenum mode)
+{
+    return LoadLazy<PFNGLCULLFACEPROC, 108>()(mode);
+}
+
+void INTERNAL_GL_APIENTRY glDebugMessageCallbackLazy(GLDEBUGPROC callback, const void *userParam)
+{
+    return LoadLazy<PFNGLDEBUGMESSAGECALLBACKPROC, 109>()(callback, userParam);
+}
+
+void INTERNAL_GL_APIENTRY glDebugMessageControlLazy(GLenum source,
+                                                    GLenum type,
+                                                    GLenum severity,
+                                                    GLsizei count,
+                                                    const GLuint *ids,
+                                                    GLboolean enabled)
+{
+    return LoadLazy<PFNGLDEBUGMESSAGECONTROLPROC, 110>()(source, type, severity, count, ids,
+                                                         enabled);
+}
+
+void INTERNAL_GL_APIENTRY glDebugMessageInsertLazy(GLenum source,
+                                                   GLenum type,
+                                                   GLuint id,
+                                                   GLenum severity,
+                                                   GLsizei length,
+                                                   const GLchar *buf)
+{
+    return LoadLazy<PFNGLDEBUGMESSAGEINSERTPROC, 111>()(source, type, id, severity, length, buf);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteBuffersLazy(GLsizei n, const GLuint *buffers)
+{
+    return LoadLazy<PFNGLDELETEBUFFERSPROC, 112>()(n, buffers);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteFencesNVLazy(GLsizei n, const GLuint *fences)
+{
+    return LoadLazy<PFNGLDELETEFENCESNVPROC, 113>()(n, fences);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteFramebuffersLazy(GLsizei n, const GLuint *framebuffers)
+{
+    return LoadLazy<PFNGLDELETEFRAMEBUFFERSPROC, 114>()(n, framebuffers);
+}
+
+void INTERNAL_GL_APIENTRY glDeletePathsNVLazy(GLuint path, GLsizei range)
+{
+    return LoadLazy<PFNGLDELETEPATHSNVPROC, 115>()(path, range);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteProgramLazy(GLuint program)
+{
+    return LoadLazy<PFNGLDELETEPROGRAMPROC, 116>()(program);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteProgramPipelinesLazy(GLsizei n, const GLuint *pipelines)
+{
+    return LoadLazy<PFNGLDELETEPROGRAMPIPELINESPROC, 117>()(n, pipelines);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteQueriesLazy(GLsizei n, const GLuint *ids)
+{
+    return LoadLazy<PFNGLDELETEQUERIESPROC, 118>()(n, ids);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteRenderbuffersLazy(GLsizei n, const GLuint *renderbuffers)
+{
+    return LoadLazy<PFNGLDELETERENDERBUFFERSPROC, 119>()(n, renderbuffers);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteSamplersLazy(GLsizei count, const GLuint *samplers)
+{
+    return LoadLazy<PFNGLDELETESAMPLERSPROC, 120>()(count, samplers);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteShaderLazy(GLuint shader)
+{
+    return LoadLazy<PFNGLDELETESHADERPROC, 121>()(shader);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteSyncLazy(GLsync sync)
+{
+    return LoadLazy<PFNGLDELETESYNCPROC, 122>()(sync);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteTexturesLazy(GLsizei n, const GLuint *textures)
+{
+    return LoadLazy<PFNGLDELETETEXTURESPROC, 123>()(n, textures);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteTransformFeedbacksLazy(GLsizei n, const GLuint *ids)
+{
+    return LoadLazy<PFNGLDELETETRANSFORMFEEDBACKSPROC, 124>()(n, ids);
+}
+
+void INTERNAL_GL_APIENTRY glDeleteVertexArraysLazy(GLsizei n, const GLuint *arrays)
+{
+    return LoadLazy<PFNGLDELETEVERTEXARRAYSPROC, 125>()(n, arrays);
+}
+
+void INTERNAL_GL_APIENTRY glDepthFuncLazy(GLenum func)
+{
+    return LoadLazy<PFNGLDEPTHFUNCPROC, 126>()(func);
+}
+
+void INTERNAL_GL_APIENTRY glDepthMaskLazy(GLboolean flag)
+{
+    return LoadLazy<PFNGLDEPTHMASKPROC, 127>()(flag);
+}
+
+void INTERNAL_GL_APIENTRY glDepthRangeLazy(GLdouble n, GLdouble f)
+{
+    return LoadLazy<PFNGLDEPTHRANGEPROC, 128>()(n, f);
+}
+
+void INTERNAL_GL_APIENTRY glDepthRangeArrayvLazy(GLuint first, GLsizei count, const GLdouble *v)
+{
+    return LoadLazy<PFNGLDEPTHRANGEARRAYVPROC, 129>()(first, count, v);
+}
+
+void INTERNAL_GL_APIENTRY glDepthRangeIndexedLazy(GLuint index, GLdouble n, GLdouble f)
+{
+    return LoadLazy<PFNGLDEPTHRANGEINDEXEDPROC, 130>()(index, n, f);
+}
+
+void INTERNAL_GL_APIENTRY glDepthRangefLazy(GLfloat n, GLfloat f)
+{
+    return LoadLazy<PFNGLDEPTHRANGEFPROC, 131>()(n, f);
+}
+
+void INTERNAL_GL_APIENTRY glDetachShaderLazy(GLuint program, GLuint shader)
+{
+    return LoadLazy<PFNGLDETACHSHADERPROC, 132>()(program, shader);
+}
+
+void INTERNAL_GL_APIENTRY glDisableLazy(GLenum cap)
+{
+    return LoadLazy<PFNGLDISABLEPROC, 133>()(cap);
+}
+
+void INTERNAL_GL_APIENTRY glDisableVertexArrayAttribLazy(GLuint vaobj, GLuint index)
+{
+    return LoadLazy<PFNGLDISABLEVERTEXARRAYATTRIBPROC, 134>()(vaobj, index);
+}
+
+void INTERNAL_GL_APIENTRY glDisableVertexAttribArrayLazy(GLuint index)
+{
+    return LoadLazy<PFNGLDISABLEVERTEXATTRIBARRAYPROC, 135>()(index);
+}
+
+void INTERNAL_GL_APIENTRY glDisableiLazy(GLenum target, GLuint index)
+{
+    return LoadLazy<PFNGLDISABLEIPROC, 136>()(target, index);
+}
+
+void INTERNAL_GL_APIENTRY glDiscardFramebufferEXTLazy(GLenum target,
+                                                      GLsizei numAttachments,
+                                                      const GLenum *attachments)
+{
+    return LoadLazy<PFNGLDISCARDFRAMEBUFFEREXTPROC, 137>()(target, numAttachments, attachments);
+}
+
+void INTERNAL_GL_APIENTRY glDispatchComputeLazy(GLuint num_groups_x,
+                                                GLuint num_groups_y,
+                                                GLuint num_groups_z)
+{
+    return LoadLazy<PFNGLDISPATCHCOMPUTEPROC, 138>()(num_groups_x, num_groups_y, num_groups_z);
+}
+
+void INTERNAL_GL_APIENTRY glDispatchComputeIndirectLazy(GLintptr indirect)
+{
+    return LoadLazy<PFNGLDISPATCHCOMPUTEINDIRECTPROC, 139>()(indirect);
+}
+
+void INTERNAL_GL_APIENTRY glDrawArraysLazy(GLenum mode, GLint first, GLsizei count)
+{
+    return LoadLazy<PFNGLDRAWARRAYSPROC, 140>()(mode, first, count);
+}
+
+void INTERNAL_GL_APIENTRY glDrawArraysIndirectLazy(GLenum mode, const void *indirect)
+{
+    return LoadLazy<PFNGLDRAWARRAYSINDIRECTPROC, 141>()(mode, indirect);
+}
+
+void INTERNAL_GL_APIENTRY glDrawArraysInstancedLazy(GLenum mode,
+                                                    GLint first,
+                                                    GLsizei count,
+                                                    GLsizei instancecount)
+{
+    return LoadLazy<PFNGLDRAWARRAYSINSTANCEDPROC, 142>()(mode, first, count, instancecount);
+}
+
+void INTERNAL_GL_APIENTRY glDrawArraysInstancedBaseInstanceLazy(GLenum mode,
+                                                                GLint first,
+                                                                GLsizei count,
+                                                                GLsizei instancecount,
+                                                                GLuint baseinstance)
+{
+    return LoadLazy<PFNGLDRAWARRAYSINSTANCEDBASEINSTANCEPROC, 143>()(mode, first, count,
+                                                                     instancecount, baseinstance);
+}
+
+void INTERNAL_GL_APIENTRY glDrawBufferLazy(GLenum buf)
+{
+    return LoadLazy<PFNGLDRAWBUFFERPROC, 144>()(buf);
+}
+
+void INTERNAL_GL_APIENTRY glDrawBuffersLazy(GLsizei n, const GLenum *bufs)
+{
+    return LoadLazy<PFNGLDRAWBUFFERSPROC, 145>()(n, bufs);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsLazy(GLenum mode,
+                                             GLsizei count,
+                                             GLenum type,
+                                             const void *indices)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSPROC, 146>()(mode, count, type, indices);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsBaseVertexLazy(GLenum mode,
+                                                       GLsizei count,
+                                                       GLenum type,
+                                                       const void *indices,
+                                                       GLint basevertex)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSBASEVERTEXPROC, 147>()(mode, count, type, indices, basevertex);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsIndirectLazy(GLenum mode, GLenum type, const void *indirect)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSINDIRECTPROC, 148>()(mode, type, indirect);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsInstancedLazy(GLenum mode,
+                                                      GLsizei count,
+                                                      GLenum type,
+                                                      const void *indices,
+                                                      GLsizei instancecount)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSINSTANCEDPROC, 149>()(mode, count, type, indices,
+                                                           instancecount);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsInstancedBaseInstanceLazy(GLenum mode,
+                                                                  GLsizei count,
+                                                                  GLenum type,
+                                                                  const void *indices,
+                                                                  GLsizei instancecount,
+                                                                  GLuint baseinstance)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSINSTANCEDBASEINSTANCEPROC, 150>()(mode, count, type, indices,
+                                                                       instancecount, baseinstance);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsInstancedBaseVertexLazy(GLenum mode,
+                                                                GLsizei count,
+                                                                GLenum type,
+                                                                const void *indices,
+                                                                GLsizei instancecount,
+                                                                GLint basevertex)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSINSTANCEDBASEVERTEXPROC, 151>()(mode, count, type, indices,
+                                                                     instancecount, basevertex);
+}
+
+void INTERNAL_GL_APIENTRY glDrawElementsInstancedBaseVertexBaseInstanceLazy(GLenum mode,
+                                                                            GLsizei count,
+                                                                            GLenum type,
+                                                                            const void *indices,
+                                                                            GLsizei instancecount,
+                                                                            GLint basevertex,
+                                                                            GLuint baseinstance)
+{
+    return LoadLazy<PFNGLDRAWELEMENTSINSTANCEDBASEVERTEXBASEINSTANCEPROC, 152>()(
+        mode, count, type, indices, instancecount, basevertex, baseinstance);
+}
+
+void INTERNAL_GL_APIENTRY glDrawRangeElementsLazy(GLenum mode,
+                                                  GLuint start,
+                                                  GLuint end,
+                                                  GLsizei count,
+                                                  GLenum type,
+                                                  const void *indices)
+{
+    return LoadLazy<PFNGLDRAWRANGEELEMENTSPROC, 153>()(mode, start, end, count, type, indices);
+}
+
+void INTERNAL_GL_APIENTRY glDrawRangeElementsBaseVertexLazy(GLenum mode,
+                                                            GLuint start,
+                                                            GLuint end,
+                                                            GLsizei count,
+                                                            GLenum type,
+                                                            const void *indices,
+                                                            GLint basevertex)
+{
+    return LoadLazy<PFNGLDRAWRANGEELEMENTSBASEVERTEXPROC, 154>()(mode, start, end, count, type,
+                                                                 indices, basevertex);
+}
+
+void INTERNAL_GL_APIENTRY glDrawTransformFeedbackLazy(GLenum mode, GLuint id)
+{
+    return LoadLazy<PFNGLDRAWTRANSFORMFEEDBACKPROC, 155>()(mode, id);
+}
+
+void INTERNAL_GL_APIENTRY glDrawTransformFeedbackInstancedLazy(GLenum mode,
+                                                               GLuint id,
+                                                               GLsizei instancecount)
+{
+    return LoadLazy<PFNGLDRAWTRANSFORMFEEDBACKINSTANCEDPROC, 156>()(mode, id, instancecount);
+}
+
+void INTERNAL_GL_APIENTRY glDrawTransformFeedbackStreamLazy(GLenum mode, GLuint id, GLuint stream)
+{
+    return LoadLazy<PFNGLDRAWTRANSFORMFEEDBACKSTREAMPROC, 157>()(mode, id, stream);
+}
+
+void INTERNAL_GL_APIENTRY glDrawTransformFeedbackStreamInstancedLazy(GLenum mode,
+                                                                     GLuint id,
+                                                                     GLuint stream,
+                                                                     GLsizei instancecount)
+{
+    return LoadLazy<PFNGLDRAWTRANSFORMFEEDBACKSTREAMINSTANCEDPROC, 158>()(mode, id, stream,
+                                                                          instancecount);
+}
+
+void INTERNAL_GL_APIENTRY glEGLImageTargetRenderbufferStorageOESLazy(GLenum target,
+                                                                     GLeglImageOES image)
+{
+    return LoadLazy<PFNGLEGLIMAGETARGETRENDERBUFFERSTORAGEOESPROC, 159>()(target, image);
+}
+
+void INTERNAL_GL_APIENTRY glEGLImageTargetTexture2DOESLazy(GLenum target, GLeglImageOES image)
+{
+    return LoadLazy<PFNGLEGLIMAGETARGETTEXTURE2DOESPROC, 160>()(target, image);
+}
+
+void INTERNAL_GL_APIENTRY glEnableLazy(GLenum cap)
+{
+    return LoadLazy<PFNGLENABLEPROC, 161>()(cap);
+}
+
+void INTERNAL_GL_APIENTRY glEnableVertexArrayAttribLazy(GLuint vaobj, GLuint index)
+{
+    return LoadLazy<PFNGLENABLEVERTEXARRAYATTRIBPROC, 162>()(vaobj, index);
+}
+
+void INTERNAL_GL_APIENTRY glEnableVertexAttribArrayLazy(GLuint index)
+{
+    return LoadLazy<PFNGLENABLEVERTEXATTRIBARRAYPROC, 163>()(index);
+}
+
+void INTERNAL_GL_APIENTRY glEnableiLazy(GLenum target, GLuint index)
+{
+    return LoadLazy<PFNGLENABLEIPROC, 164>()(target, index);
+}
+
+void INTERNAL_GL_APIENTRY glEndConditionalRenderLazy()
+{
+    return LoadLazy<PFNGLENDCONDITIONALRENDERPROC, 165>()();
+}
+
+void INTERNAL_GL_APIENTRY glEndQueryLazy(GLenum target)
+{
+    return LoadLazy<PFNGLENDQUERYPROC, 166>()(target);
+}
+
+void INTERNAL_GL_APIENTRY glEndQueryIndexedLazy(GLenum target, GLuint index)
+{
+    return LoadLazy<PFNGLENDQUERYINDEXEDPROC, 167>()(target, index);
+}
+
+void INTERNAL_GL_APIENTRY glEndTransformFeedbackLazy()
+{
+    return LoadLazy<PFNGLENDTRANSFORMFEEDBACKPROC, 168>()();
+}
+
+GLsync INTERNAL_GL_APIENTRY glFenceSyncLazy(GLenum condition, GLbitfield flags)
+{
+    return LoadLazy<PFNGLFENCESYNCPROC, 169>()(condition, flags);
+}
+
+void INTERNAL_GL_APIENTRY glFinishLazy()
+{
+    return LoadLazy<PFNGLFINISHPROC, 170>()();
+}
+
+void INTERNAL_GL_APIENTRY glFinishFenceNVLazy(GLuint fence)
+{
+    return LoadLazy<PFNGLFINISHFENCENVPROC, 171>()(fence);
+}
+
+void INTERNAL_GL_APIENTRY glFlushLazy()
+{
+    return LoadLazy<PFNGLFLUSHPROC, 172>()();
+}
+
+void INTERNAL_GL_APIENTRY glFlushMappedBufferRangeLazy(GLenum target,
+                                                       GLintptr offset,
+                                                       GLsizeiptr length)
+{
+    return LoadLazy<PFNGLFLUSHMAPPEDBUFFERRANGEPROC, 173>()(target, offset, length);
+}
+
+void INTERNAL_GL_APIENTRY glFlushMappedNamedBufferRangeLazy(GLuint buffer,
+                                                            GLintptr offset,
+                                                            GLsizeiptr length)
+{
+    return LoadLazy<PFNGLFLUSHMAPPEDNAMEDBUFFERRANGEPROC, 174>()(buffer, offset, length);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferParameteriLazy(GLenum target, GLenum pname, GLint param)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERPARAMETERIPROC, 175>()(target, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferRenderbufferLazy(GLenum target,
+                                                        GLenum attachment,
+                                                        GLenum renderbuffertarget,
+                                                        GLuint renderbuffer)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERRENDERBUFFERPROC, 176>()(target, attachment, renderbuffertarget,
+                                                             renderbuffer);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferTextureLazy(GLenum target,
+                                                   GLenum attachment,
+                                                   GLuint texture,
+                                                   GLint level)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERTEXTUREPROC, 177>()(target, attachment, texture, level);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferTexture1DLazy(GLenum target,
+                                                     GLenum attachment,
+                                                     GLenum textarget,
+                                                     GLuint texture,
+                                                     GLint level)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERTEXTURE1DPROC, 178>()(target, attachment, textarget, texture,
+                                                          level);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferTexture2DLazy(GLenum target,
+                                                     GLenum attachment,
+                                                     GLenum textarget,
+                                                     GLuint texture,
+                                                     GLint level)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERTEXTURE2DPROC, 179>()(target, attachment, textarget, texture,
+                                                          level);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferTexture3DLazy(GLenum target,
+                                                     GLenum attachment,
+                                                     GLenum textarget,
+                                                     GLuint texture,
+                                                     GLint level,
+                                                     GLint zoffset)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERTEXTURE3DPROC, 180>()(target, attachment, textarget, texture,
+                                                          level, zoffset);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferTextureLayerLazy(GLenum target,
+                                                        GLenum attachment,
+                                                        GLuint texture,
+                                                        GLint level,
+                                                        GLint layer)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERTEXTURELAYERPROC, 181>()(target, attachment, texture, level,
+                                                             layer);
+}
+
+void INTERNAL_GL_APIENTRY glFramebufferTextureMultiviewOVRLazy(GLenum target,
+                                                               GLenum attachment,
+                                                               GLuint texture,
+                                                               GLint level,
+                                                               GLint baseViewIndex,
+                                                               GLsizei numViews)
+{
+    return LoadLazy<PFNGLFRAMEBUFFERTEXTUREMULTIVIEWOVRPROC, 182>()(target, attachment, texture,
+                                                                    level, baseViewIndex, numViews);
+}
+
+void INTERNAL_GL_APIENTRY glFrontFaceLazy(GLenum mode)
+{
+    return LoadLazy<PFNGLFRONTFACEPROC, 183>()(mode);
+}
+
+void INTERNAL_GL_APIENTRY glGenBuffersLazy(GLsizei n, GLuint *buffers)
+{
+    return LoadLazy<PFNGLGENBUFFERSPROC, 184>()(n, buffers);
+}
+
+void INTERNAL_GL_APIENTRY glGenFencesNVLazy(GLsizei n, GLuint *fences)
+{
+    return LoadLazy<PFNGLGENFENCESNVPROC, 185>()(n, fences);
+}
+
+void INTERNAL_GL_APIENTRY glGenFramebuffersLazy(GLsizei n, GLuint *framebuffers)
+{
+    return LoadLazy<PFNGLGENFRAMEBUFFERSPROC, 186>()(n, framebuffers);
+}
+
+GLuint INTERNAL_GL_APIENTRY glGenPathsNVLazy(GLsizei range)
+{
+    return LoadLazy<PFNGLGENPATHSNVPROC, 187>()(range);
+}
+
+void INTERNAL_GL_APIENTRY glGenProgramPipelinesLazy(GLsizei n, GLuint *pipelines)
+{
+    return LoadLazy<PFNGLGENPROGRAMPIPELINESPROC, 188>()(n, pipelines);
+}
+
+void INTERNAL_GL_APIENTRY glGenQueriesLazy(GLsizei n, GLuint *ids)
+{
+    return LoadLazy<PFNGLGENQUERIESPROC, 189>()(n, ids);
+}
+
+void INTERNAL_GL_APIENTRY glGenRenderbuffersLazy(GLsizei n, GLuint *renderbuffers)
+{
+    return LoadLazy<PFNGLGENRENDERBUFFERSPROC, 190>()(n, renderbuffers);
+}
+
+void INTERNAL_GL_APIENTRY glGenSamplersLazy(GLsizei count, GLuint *samplers)
+{
+    return LoadLazy<PFNGLGENSAMPLERSPROC, 191>()(count, samplers);
+}
+
+void INTERNAL_GL_APIENTRY glGenTexturesLazy(GLsizei n, GLuint *textures)
+{
+    return LoadLazy<PFNGLGENTEXTURESPROC, 192>()(n, textures);
+}
+
+void INTERNAL_GL_APIENTRY glGenTransformFeedbacksLazy(GLsizei n, GLuint *ids)
+{
+    return LoadLazy<PFNGLGENTRANSFORMFEEDBACKSPROC, 193>()(n, ids);
+}
+
+void INTERNAL_GL_APIENTRY glGenVertexArraysLazy(GLsizei n, GLuint *arrays)
+{
+    return LoadLazy<PFNGLGENVERTEXARRAYSPROC, 194>()(n, arrays);
+}
+
+void INTERNAL_GL_APIENTRY glGenerateMipmapLazy(GLenum target)
+{
+    return LoadLazy<PFNGLGENERATEMIPMAPPROC, 195>()(target);
+}
+
+void INTERNAL_GL_APIENTRY glGenerateTextureMipmapLazy(GLuint texture)
+{
+    return LoadLazy<PFNGLGENERATETEXTUREMIPMAPPROC, 196>()(texture);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveAtomicCounterBufferivLazy(GLuint program,
+                                                               GLuint bufferIndex,
+                                                               GLenum pname,
+                                                               GLint *params)
+{
+    return LoadLazy<PFNGLGETACTIVEATOMICCOUNTERBUFFERIVPROC, 197>()(program, bufferIndex, pname,
+                                                                    params);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveAttribLazy(GLuint program,
+                                                GLuint index,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLint *size,
+                                                GLenum *type,
+                                                GLchar *name)
+{
+    return LoadLazy<PFNGLGETACTIVEATTRIBPROC, 198>()(program, index, bufSize, length, size, type,
+                                                     name);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveSubroutineNameLazy(GLuint program,
+                                                        GLenum shadertype,
+                                                        GLuint index,
+                                                        GLsizei bufsize,
+                                                        GLsizei *length,
+                                                        GLchar *name)
+{
+    return LoadLazy<PFNGLGETACTIVESUBROUTINENAMEPROC, 199>()(program, shadertype, index, bufsize,
+                                                             length, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveSubroutineUniformNameLazy(GLuint program,
+                                                               GLenum shadertype,
+                                                               GLuint index,
+                                                               GLsizei bufsize,
+                                                               GLsizei *length,
+                                                               GLchar *name)
+{
+    return LoadLazy<PFNGLGETACTIVESUBROUTINEUNIFORMNAMEPROC, 200>()(program, shadertype, index,
+                                                                    bufsize, length, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveSubroutineUniformivLazy(GLuint program,
+                                                             GLenum shadertype,
+                                                             GLuint index,
+                                                             GLenum pname,
+                                                             GLint *values)
+{
+    return LoadLazy<PFNGLGETACTIVESUBROUTINEUNIFORMIVPROC, 201>()(program, shadertype, index, pname,
+                                                                  values);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveUniformLazy(GLuint program,
+                                                 GLuint index,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *size,
+                                                 GLenum *type,
+                                                 GLchar *name)
+{
+    return LoadLazy<PFNGLGETACTIVEUNIFORMPROC, 202>()(program, index, bufSize, length, size, type,
+                                                      name);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveUniformBlockNameLazy(GLuint program,
+                                                          GLuint uniformBlockIndex,
+                                                          GLsizei bufSize,
+                                                          GLsizei *length,
+                                                          GLchar *uniformBlockName)
+{
+    return LoadLazy<PFNGLGETACTIVEUNIFORMBLOCKNAMEPROC, 203>()(program, uniformBlockIndex, bufSize,
+                                                               length, uniformBlockName);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveUniformBlockivLazy(GLuint program,
+                                                        GLuint uniformBlockIndex,
+                                                        GLenum pname,
+                                                        GLint *params)
+{
+    return LoadLazy<PFNGLGETACTIVEUNIFORMBLOCKIVPROC, 204>()(program, uniformBlockIndex, pname,
+                                                             params);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveUniformNameLazy(GLuint program,
+                                                     GLuint uniformIndex,
+                                                     GLsizei bufSize,
+                                                     GLsizei *length,
+                                                     GLchar *uniformName)
+{
+    return LoadLazy<PFNGLGETACTIVEUNIFORMNAMEPROC, 205>()(program, uniformIndex, bufSize, length,
+                                                          uniformName);
+}
+
+void INTERNAL_GL_APIENTRY glGetActiveUniformsivLazy(GLuint program,
+                                                    GLsizei uniformCount,
+                                                    const GLuint *uniformIndices,
+                                                    GLenum pname,
+                                                    GLint *params)
+{
+    return LoadLazy<PFNGLGETACTIVEUNIFORMSIVPROC, 206>()(program, uniformCount, uniformIndices,
+                                                         pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetAttachedShadersLazy(GLuint program,
+                                                   GLsizei maxCount,
+                                                   GLsizei *count,
+                                                   GLuint *shaders)
+{
+    return LoadLazy<PFNGLGETATTACHEDSHADERSPROC, 207>()(program, maxCount, count, shaders);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetAttribLocationLazy(GLuint program, const GLchar *name)
+{
+    return LoadLazy<PFNGLGETATTRIBLOCATIONPROC, 208>()(program, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetBooleani_vLazy(GLenum target, GLuint index, GLboolean *data)
+{
+    return LoadLazy<PFNGLGETBOOLEANI_VPROC, 209>()(target, index, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetBooleanvLazy(GLenum pname, GLboolean *data)
+{
+    return LoadLazy<PFNGLGETBOOLEANVPROC, 210>()(pname, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetBufferParameteri64vLazy(GLenum target, GLenum pname, GLint64 *params)
+{
+    return LoadLazy<PFNGLGETBUFFERPARAMETERI64VPROC, 211>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetBufferParameterivLazy(GLenum target, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETBUFFERPARAMETERIVPROC, 212>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetBufferPointervLazy(GLenum target, GLenum pname, void **params)
+{
+    return LoadLazy<PFNGLGETBUFFERPOINTERVPROC, 213>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetBufferSubDataLazy(GLenum target,
+                                                 GLintptr offset,
+                                                 GLsizeiptr size,
+                                                 void *data)
+{
+    return LoadLazy<PFNGLGETBUFFERSUBDATAPROC, 214>()(target, offset, size, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetCompressedTexImageLazy(GLenum target, GLint level, void *img)
+{
+    return LoadLazy<PFNGLGETCOMPRESSEDTEXIMAGEPROC, 215>()(target, level, img);
+}
+
+void INTERNAL_GL_APIENTRY glGetCompressedTextureImageLazy(GLuint texture,
+                                                          GLint level,
+                                                          GLsizei bufSize,
+                                                          void *pixels)
+{
+    return LoadLazy<PFNGLGETCOMPRESSEDTEXTUREIMAGEPROC, 216>()(texture, level, bufSize, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glGetCompressedTextureSubImageLazy(GLuint texture,
+                                                             GLint level,
+                                                             GLint xoffset,
+                                                             GLint yoffset,
+                                                             GLint zoffset,
+                                                             GLsizei width,
+                                                             GLsizei height,
+                                                             GLsizei depth,
+                                                             GLsizei bufSize,
+                                                             void *pixels)
+{
+    return LoadLazy<PFNGLGETCOMPRESSEDTEXTURESUBIMAGEPROC, 217>()(
+        texture, level, xoffset, yoffset, zoffset, width, height, depth, bufSize, pixels);
+}
+
+GLuint INTERNAL_GL_APIENTRY glGetDebugMessageLogLazy(GLuint count,
+                                                     GLsizei bufSize,
+                                                     GLenum *sources,
+                                                     GLenum *types,
+                                                     GLuint *ids,
+                                                     GLenum *severities,
+                                                     GLsizei *lengths,
+                                                     GLchar *messageLog)
+{
+    return LoadLazy<PFNGLGETDEBUGMESSAGELOGPROC, 218>()(count, bufSize, sources, types, ids,
+                                                        severities, lengths, messageLog);
+}
+
+void INTERNAL_GL_APIENTRY glGetDoublei_vLazy(GLenum target, GLuint index, GLdouble *data)
+{
+    return LoadLazy<PFNGLGETDOUBLEI_VPROC, 219>()(target, index, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetDoublevLazy(GLenum pname, GLdouble *data)
+{
+    return LoadLazy<PFNGLGETDOUBLEVPROC, 220>()(pname, data);
+}
+
+GLenum INTERNAL_GL_APIENTRY glGetErrorLazy()
+{
+    return LoadLazy<PFNGLGETERRORPROC, 221>()();
+}
+
+void INTERNAL_GL_APIENTRY glGetFenceivNVLazy(GLuint fence, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETFENCEIVNVPROC, 222>()(fence, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetFloati_vLazy(GLenum target, GLuint index, GLfloat *data)
+{
+    return LoadLazy<PFNGLGETFLOATI_VPROC, 223>()(target, index, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetFloatvLazy(GLenum pname, GLfloat *data)
+{
+    return LoadLazy<PFNGLGETFLOATVPROC, 224>()(pname, data);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetFragDataIndexLazy(GLuint program, const GLchar *name)
+{
+    return LoadLazy<PFNGLGETFRAGDATAINDEXPROC, 225>()(program, name);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetFragDataLocationLazy(GLuint program, const GLchar *name)
+{
+    return LoadLazy<PFNGLGETFRAGDATALOCATIONPROC, 226>()(program, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetFramebufferAttachmentParameterivLazy(GLenum target,
+                                                                    GLenum attachment,
+                                                                    GLenum pname,
+                                                                    GLint *params)
+{
+    return LoadLazy<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVPROC, 227>()(target, attachment, pname,
+                                                                         params);
+}
+
+void INTERNAL_GL_APIENTRY glGetFramebufferParameterivLazy(GLenum target,
+                                                          GLenum pname,
+                                                          GLint *params)
+{
+    return LoadLazy<PFNGLGETFRAMEBUFFERPARAMETERIVPROC, 228>()(target, pname, params);
+}
+
+GLenum INTERNAL_GL_APIENTRY glGetGraphicsResetStatusLazy()
+{
+    return LoadLazy<PFNGLGETGRAPHICSRESETSTATUSPROC, 229>()();
+}
+
+void INTERNAL_GL_APIENTRY glGetInteger64i_vLazy(GLenum target, GLuint index, GLint64 *data)
+{
+    return LoadLazy<PFNGLGETINTEGER64I_VPROC, 230>()(target, index, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetInteger64vLazy(GLenum pname, GLint64 *data)
+{
+    return LoadLazy<PFNGLGETINTEGER64VPROC, 231>()(pname, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetIntegeri_vLazy(GLenum target, GLuint index, GLint *data)
+{
+    return LoadLazy<PFNGLGETINTEGERI_VPROC, 232>()(target, index, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetIntegervLazy(GLenum pname, GLint *data)
+{
+    return LoadLazy<PFNGLGETINTEGERVPROC, 233>()(pname, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetInternalformatSampleivNVLazy(GLenum target,
+                                                            GLenum internalformat,
+                                                            GLsizei samples,
+                                                            GLenum pname,
+                                                            GLsizei bufSize,
+                                                            GLint *params)
+{
+    return LoadLazy<PFNGLGETINTERNALFORMATSAMPLEIVNVPROC, 234>()(target, internalformat, samples,
+                                                                 pname, bufSize, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetInternalformati64vLazy(GLenum target,
+                                                      GLenum internalformat,
+                                                      GLenum pname,
+                                                      GLsizei bufSize,
+                                                      GLint64 *params)
+{
+    return LoadLazy<PFNGLGETINTERNALFORMATI64VPROC, 235>()(target, internalformat, pname, bufSize,
+                                                           params);
+}
+
+void INTERNAL_GL_APIENTRY glGetInternalformativLazy(GLenum target,
+                                                    GLenum internalformat,
+                                                    GLenum pname,
+                                                    GLsizei bufSize,
+                                                    GLint *params)
+{
+    return LoadLazy<PFNGLGETINTERNALFORMATIVPROC, 236>()(target, internalformat, pname, bufSize,
+                                                         params);
+}
+
+void INTERNAL_GL_APIENTRY glGetMultisamplefvLazy(GLenum pname, GLuint index, GLfloat *val)
+{
+    return LoadLazy<PFNGLGETMULTISAMPLEFVPROC, 237>()(pname, index, val);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedBufferParameteri64vLazy(GLuint buffer,
+                                                            GLenum pname,
+                                                            GLint64 *params)
+{
+    return LoadLazy<PFNGLGETNAMEDBUFFERPARAMETERI64VPROC, 238>()(buffer, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedBufferParameterivLazy(GLuint buffer,
+                                                          GLenum pname,
+                                                          GLint *params)
+{
+    return LoadLazy<PFNGLGETNAMEDBUFFERPARAMETERIVPROC, 239>()(buffer, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedBufferPointervLazy(GLuint buffer, GLenum pname, void **params)
+{
+    return LoadLazy<PFNGLGETNAMEDBUFFERPOINTERVPROC, 240>()(buffer, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedBufferSubDataLazy(GLuint buffer,
+                                                      GLintptr offset,
+                                                      GLsizeiptr size,
+                                                      void *data)
+{
+    return LoadLazy<PFNGLGETNAMEDBUFFERSUBDATAPROC, 241>()(buffer, offset, size, data);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedFramebufferAttachmentParameterivLazy(GLuint framebuffer,
+                                                                         GLenum attachment,
+                                                                         GLenum pname,
+                                                                         GLint *params)
+{
+    return LoadLazy<PFNGLGETNAMEDFRAMEBUFFERATTACHMENTPARAMETERIVPROC, 242>()(
+        framebuffer, attachment, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedFramebufferParameterivLazy(GLuint framebuffer,
+                                                               GLenum pname,
+                                                               GLint *param)
+{
+    return LoadLazy<PFNGLGETNAMEDFRAMEBUFFERPARAMETERIVPROC, 243>()(framebuffer, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glGetNamedRenderbufferParameterivLazy(GLuint renderbuffer,
+                                                                GLenum pname,
+                                                                GLint *params)
+{
+    return LoadLazy<PFNGLGETNAMEDRENDERBUFFERPARAMETERIVPROC, 244>()(renderbuffer, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetObjectLabelLazy(GLenum identifier,
+                                               GLuint name,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLchar *label)
+{
+    return LoadLazy<PFNGLGETOBJECTLABELPROC, 245>()(identifier, name, bufSize, length, label);
+}
+
+void INTERNAL_GL_APIENTRY glGetObjectPtrLabelLazy(const void *ptr,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLchar *label)
+{
+    return LoadLazy<PFNGLGETOBJECTPTRLABELPROC, 246>()(ptr, bufSize, length, label);
+}
+
+void INTERNAL_GL_APIENTRY glGetPathParameterfvNVLazy(GLuint path, GLenum pname, GLfloat *value)
+{
+    return LoadLazy<PFNGLGETPATHPARAMETERFVNVPROC, 247>()(path, pname, value);
+}
+
+void INTERNAL_GL_APIENTRY glGetPathParameterivNVLazy(GLuint path, GLenum pname, GLint *value)
+{
+    return LoadLazy<PFNGLGETPATHPARAMETERIVNVPROC, 248>()(path, pname, value);
+}
+
+void INTERNAL_GL_APIENTRY glGetPointervLazy(GLenum pname, void **params)
+{
+    return LoadLazy<PFNGLGETPOINTERVPROC, 249>()(pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramBinaryLazy(GLuint program,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLenum *binaryFormat,
+                                                 void *binary)
+{
+    return LoadLazy<PFNGLGETPROGRAMBINARYPROC, 250>()(program, bufSize, length, binaryFormat,
+                                                      binary);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramInfoLogLazy(GLuint program,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLchar *infoLog)
+{
+    return LoadLazy<PFNGLGETPROGRAMINFOLOGPROC, 251>()(program, bufSize, length, infoLog);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramInterfaceivLazy(GLuint program,
+                                                      GLenum programInterface,
+                                                      GLenum pname,
+                                                      GLint *params)
+{
+    return LoadLazy<PFNGLGETPROGRAMINTERFACEIVPROC, 252>()(program, programInterface, pname,
+                                                           params);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramPipelineInfoLogLazy(GLuint pipeline,
+                                                          GLsizei bufSize,
+                                                          GLsizei *length,
+                                                          GLchar *infoLog)
+{
+    return LoadLazy<PFNGLGETPROGRAMPIPELINEINFOLOGPROC, 253>()(pipeline, bufSize, length, infoLog);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramPipelineivLazy(GLuint pipeline, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETPROGRAMPIPELINEIVPROC, 254>()(pipeline, pname, params);
+}
+
+GLuint INTERNAL_GL_APIENTRY glGetProgramResourceIndexLazy(GLuint program,
+                                                          GLenum programInterface,
+                                                          const GLchar *name)
+{
+    return LoadLazy<PFNGLGETPROGRAMRESOURCEINDEXPROC, 255>()(program, programInterface, name);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetProgramResourceLocationLazy(GLuint program,
+                                                            GLenum programInterface,
+                                                            const GLchar *name)
+{
+    return LoadLazy<PFNGLGETPROGRAMRESOURCELOCATIONPROC, 256>()(program, programInterface, name);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetProgramResourceLocationIndexLazy(GLuint program,
+                                                                 GLenum programInterface,
+                                                                 const GLchar *name)
+{
+    return LoadLazy<PFNGLGETPROGRAMRESOURCELOCATIONINDEXPROC, 257>()(program, programInterface,
+                                                                     name);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramResourceNameLazy(GLuint program,
+                                                       GLenum programInterface,
+                                                       GLuint index,
+                                                       GLsizei bufSize,
+                                                       GLsizei *length,
+                                                       GLchar *name)
+{
+    return LoadLazy<PFNGLGETPROGRAMRESOURCENAMEPROC, 258>()(program, programInterface, index,
+                                                            bufSize, length, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramResourceivLazy(GLuint program,
+                                                     GLenum programInterface,
+                                                     GLuint index,
+                                                     GLsizei propCount,
+                                                     const GLenum *props,
+                                                     GLsizei bufSize,
+                                                     GLsizei *length,
+                                                     GLint *params)
+{
+    return LoadLazy<PFNGLGETPROGRAMRESOURCEIVPROC, 259>()(
+        program, programInterface, index, propCount, props, bufSize, length, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramStageivLazy(GLuint program,
+                                                  GLenum shadertype,
+                                                  GLenum pname,
+                                                  GLint *values)
+{
+    return LoadLazy<PFNGLGETPROGRAMSTAGEIVPROC, 260>()(program, shadertype, pname, values);
+}
+
+void INTERNAL_GL_APIENTRY glGetProgramivLazy(GLuint program, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETPROGRAMIVPROC, 261>()(program, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryBufferObjecti64vLazy(GLuint id,
+                                                         GLuint buffer,
+                                                         GLenum pname,
+                                                         GLintptr offset)
+{
+    return LoadLazy<PFNGLGETQUERYBUFFEROBJECTI64VPROC, 262>()(id, buffer, pname, offset);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryBufferObjectivLazy(GLuint id,
+                                                       GLuint buffer,
+                                                       GLenum pname,
+                                                       GLintptr offset)
+{
+    return LoadLazy<PFNGLGETQUERYBUFFEROBJECTIVPROC, 263>()(id, buffer, pname, offset);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryBufferObjectui64vLazy(GLuint id,
+                                                          GLuint buffer,
+                                                          GLenum pname,
+                                                          GLintptr offset)
+{
+    return LoadLazy<PFNGLGETQUERYBUFFEROBJECTUI64VPROC, 264>()(id, buffer, pname, offset);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryBufferObjectuivLazy(GLuint id,
+                                                        GLuint buffer,
+                                                        GLenum pname,
+                                                        GLintptr offset)
+{
+    return LoadLazy<PFNGLGETQUERYBUFFEROBJECTUIVPROC, 265>()(id, buffer, pname, offset);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryIndexedivLazy(GLenum target,
+                                                  GLuint index,
+                                                  GLenum pname,
+                                                  GLint *params)
+{
+    return LoadLazy<PFNGLGETQUERYINDEXEDIVPROC, 266>()(target, index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryObjecti64vLazy(GLuint id, GLenum pname, GLint64 *params)
+{
+    return LoadLazy<PFNGLGETQUERYOBJECTI64VPROC, 267>()(id, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryObjectivLazy(GLuint id, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETQUERYOBJECTIVPROC, 268>()(id, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryObjectui64vLazy(GLuint id, GLenum pname, GLuint64 *params)
+{
+    return LoadLazy<PFNGLGETQUERYOBJECTUI64VPROC, 269>()(id, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryObjectuivLazy(GLuint id, GLenum pname, GLuint *params)
+{
+    return LoadLazy<PFNGLGETQUERYOBJECTUIVPROC, 270>()(id, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetQueryivLazy(GLenum target, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETQUERYIVPROC, 271>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetRenderbufferParameterivLazy(GLenum target,
+                                                           GLenum pname,
+                                                           GLint *params)
+{
+    return LoadLazy<PFNGLGETRENDERBUFFERPARAMETERIVPROC, 272>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetSamplerParameterIivLazy(GLuint sampler, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETSAMPLERPARAMETERIIVPROC, 273>()(sampler, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetSamplerParameterIuivLazy(GLuint sampler,
+                                                        GLenum pname,
+                                                        GLuint *params)
+{
+    return LoadLazy<PFNGLGETSAMPLERPARAMETERIUIVPROC, 274>()(sampler, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetSamplerParameterfvLazy(GLuint sampler, GLenum pname, GLfloat *params)
+{
+    return LoadLazy<PFNGLGETSAMPLERPARAMETERFVPROC, 275>()(sampler, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetSamplerParameterivLazy(GLuint sampler, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETSAMPLERPARAMETERIVPROC, 276>()(sampler, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetShaderInfoLogLazy(GLuint shader,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLchar *infoLog)
+{
+    return LoadLazy<PFNGLGETSHADERINFOLOGPROC, 277>()(shader, bufSize, length, infoLog);
+}
+
+void INTERNAL_GL_APIENTRY glGetShaderPrecisionFormatLazy(GLenum shadertype,
+                                                         GLenum precisiontype,
+                                                         GLint *range,
+                                                         GLint *precision)
+{
+    return LoadLazy<PFNGLGETSHADERPRECISIONFORMATPROC, 278>()(shadertype, precisiontype, range,
+                                                              precision);
+}
+
+void INTERNAL_GL_APIENTRY glGetShaderSourceLazy(GLuint shader,
+                                                GLsizei bufSize,
+                                                GLsizei *length,
+                                                GLchar *source)
+{
+    return LoadLazy<PFNGLGETSHADERSOURCEPROC, 279>()(shader, bufSize, length, source);
+}
+
+void INTERNAL_GL_APIENTRY glGetShaderivLazy(GLuint shader, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETSHADERIVPROC, 280>()(shader, pname, params);
+}
+
+const GLubyte *INTERNAL_GL_APIENTRY glGetStringLazy(GLenum name)
+{
+    return LoadLazy<PFNGLGETSTRINGPROC, 281>()(name);
+}
+
+const GLubyte *INTERNAL_GL_APIENTRY glGetStringiLazy(GLenum name, GLuint index)
+{
+    return LoadLazy<PFNGLGETSTRINGIPROC, 282>()(name, index);
+}
+
+GLuint INTERNAL_GL_APIENTRY glGetSubroutineIndexLazy(GLuint program,
+                                                     GLenum shadertype,
+                                                     const GLchar *name)
+{
+    return LoadLazy<PFNGLGETSUBROUTINEINDEXPROC, 283>()(program, shadertype, name);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetSubroutineUniformLocationLazy(GLuint program,
+                                                              GLenum shadertype,
+                                                              const GLchar *name)
+{
+    return LoadLazy<PFNGLGETSUBROUTINEUNIFORMLOCATIONPROC, 284>()(program, shadertype, name);
+}
+
+void INTERNAL_GL_APIENTRY
+glGetSyncivLazy(GLsync sync, GLenum pname, GLsizei bufSize, GLsizei *length, GLint *values)
+{
+    return LoadLazy<PFNGLGETSYNCIVPROC, 285>()(sync, pname, bufSize, length, values);
+}
+
+void INTERNAL_GL_APIENTRY
+glGetTexImageLazy(GLenum target, GLint level, GLenum format, GLenum type, void *pixels)
+{
+    return LoadLazy<PFNGLGETTEXIMAGEPROC, 286>()(target, level, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glGetTexLevelParameterfvLazy(GLenum target,
+                                                       GLint level,
+                                                       GLenum pname,
+                                                       GLfloat *params)
+{
+    return LoadLazy<PFNGLGETTEXLEVELPARAMETERFVPROC, 287>()(target, level, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTexLevelParameterivLazy(GLenum target,
+                                                       GLint level,
+                                                       GLenum pname,
+                                                       GLint *params)
+{
+    return LoadLazy<PFNGLGETTEXLEVELPARAMETERIVPROC, 288>()(target, level, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTexParameterIivLazy(GLenum target, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETTEXPARAMETERIIVPROC, 289>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTexParameterIuivLazy(GLenum target, GLenum pname, GLuint *params)
+{
+    return LoadLazy<PFNGLGETTEXPARAMETERIUIVPROC, 290>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTexParameterfvLazy(GLenum target, GLenum pname, GLfloat *params)
+{
+    return LoadLazy<PFNGLGETTEXPARAMETERFVPROC, 291>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTexParameterivLazy(GLenum target, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETTEXPARAMETERIVPROC, 292>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureImageLazy(GLuint texture,
+                                                GLint level,
+                                                GLenum format,
+                                                GLenum type,
+                                                GLsizei bufSize,
+                                                void *pixels)
+{
+    return LoadLazy<PFNGLGETTEXTUREIMAGEPROC, 293>()(texture, level, format, type, bufSize, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureLevelParameterfvLazy(GLuint texture,
+                                                           GLint level,
+                                                           GLenum pname,
+                                                           GLfloat *params)
+{
+    return LoadLazy<PFNGLGETTEXTURELEVELPARAMETERFVPROC, 294>()(texture, level, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureLevelParameterivLazy(GLuint texture,
+                                                           GLint level,
+                                                           GLenum pname,
+                                                           GLint *params)
+{
+    return LoadLazy<PFNGLGETTEXTURELEVELPARAMETERIVPROC, 295>()(texture, level, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureParameterIivLazy(GLuint texture, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETTEXTUREPARAMETERIIVPROC, 296>()(texture, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureParameterIuivLazy(GLuint texture,
+                                                        GLenum pname,
+                                                        GLuint *params)
+{
+    return LoadLazy<PFNGLGETTEXTUREPARAMETERIUIVPROC, 297>()(texture, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureParameterfvLazy(GLuint texture, GLenum pname, GLfloat *params)
+{
+    return LoadLazy<PFNGLGETTEXTUREPARAMETERFVPROC, 298>()(texture, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureParameterivLazy(GLuint texture, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETTEXTUREPARAMETERIVPROC, 299>()(texture, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetTextureSubImageLazy(GLuint texture,
+                                                   GLint level,
+                                                   GLint xoffset,
+                                                   GLint yoffset,
+                                                   GLint zoffset,
+                                                   GLsizei width,
+                                                   GLsizei height,
+                                                   GLsizei depth,
+                                                   GLenum format,
+                                                   GLenum type,
+                                                   GLsizei bufSize,
+                                                   void *pixels)
+{
+    return LoadLazy<PFNGLGETTEXTURESUBIMAGEPROC, 300>()(texture, level, xoffset, yoffset, zoffset,
+                                                        width, height, depth, format, type, bufSize,
+                                                        pixels);
+}
+
+void INTERNAL_GL_APIENTRY glGetTransformFeedbackVaryingLazy(GLuint program,
+                                                            GLuint index,
+                                                            GLsizei bufSize,
+                                                            GLsizei *length,
+                                                            GLsizei *size,
+                                                            GLenum *type,
+                                                            GLchar *name)
+{
+    return LoadLazy<PFNGLGETTRANSFORMFEEDBACKVARYINGPROC, 301>()(program, index, bufSize, length,
+                                                                 size, type, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetTransformFeedbacki64_vLazy(GLuint xfb,
+                                                          GLenum pname,
+                                                          GLuint index,
+                                                          GLint64 *param)
+{
+    return LoadLazy<PFNGLGETTRANSFORMFEEDBACKI64_VPROC, 302>()(xfb, pname, index, param);
+}
+
+void INTERNAL_GL_APIENTRY glGetTransformFeedbacki_vLazy(GLuint xfb,
+                                                        GLenum pname,
+                                                        GLuint index,
+                                                        GLint *param)
+{
+    return LoadLazy<PFNGLGETTRANSFORMFEEDBACKI_VPROC, 303>()(xfb, pname, index, param);
+}
+
+void INTERNAL_GL_APIENTRY glGetTransformFeedbackivLazy(GLuint xfb, GLenum pname, GLint *param)
+{
+    return LoadLazy<PFNGLGETTRANSFORMFEEDBACKIVPROC, 304>()(xfb, pname, param);
+}
+
+GLuint INTERNAL_GL_APIENTRY glGetUniformBlockIndexLazy(GLuint program,
+                                                       const GLchar *uniformBlockName)
+{
+    return LoadLazy<PFNGLGETUNIFORMBLOCKINDEXPROC, 305>()(program, uniformBlockName);
+}
+
+void INTERNAL_GL_APIENTRY glGetUniformIndicesLazy(GLuint program,
+                                                  GLsizei uniformCount,
+                                                  const GLchar *const *uniformNames,
+                                                  GLuint *uniformIndices)
+{
+    return LoadLazy<PFNGLGETUNIFORMINDICESPROC, 306>()(program, uniformCount, uniformNames,
+                                                       uniformIndices);
+}
+
+GLint INTERNAL_GL_APIENTRY glGetUniformLocationLazy(GLuint program, const GLchar *name)
+{
+    return LoadLazy<PFNGLGETUNIFORMLOCATIONPROC, 307>()(program, name);
+}
+
+void INTERNAL_GL_APIENTRY glGetUniformSubroutineuivLazy(GLenum shadertype,
+                                                        GLint location,
+                                                        GLuint *params)
+{
+    return LoadLazy<PFNGLGETUNIFORMSUBROUTINEUIVPROC, 308>()(shadertype, location, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetUniformdvLazy(GLuint program, GLint location, GLdouble *params)
+{
+    return LoadLazy<PFNGLGETUNIFORMDVPROC, 309>()(program, location, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetUniformfvLazy(GLuint program, GLint location, GLfloat *params)
+{
+    return LoadLazy<PFNGLGETUNIFORMFVPROC, 310>()(program, location, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetUniformivLazy(GLuint program, GLint location, GLint *params)
+{
+    return LoadLazy<PFNGLGETUNIFORMIVPROC, 311>()(program, location, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetUniformuivLazy(GLuint program, GLint location, GLuint *params)
+{
+    return LoadLazy<PFNGLGETUNIFORMUIVPROC, 312>()(program, location, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexArrayIndexed64ivLazy(GLuint vaobj,
+                                                          GLuint index,
+                                                          GLenum pname,
+                                                          GLint64 *param)
+{
+    return LoadLazy<PFNGLGETVERTEXARRAYINDEXED64IVPROC, 313>()(vaobj, index, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexArrayIndexedivLazy(GLuint vaobj,
+                                                        GLuint index,
+                                                        GLenum pname,
+                                                        GLint *param)
+{
+    return LoadLazy<PFNGLGETVERTEXARRAYINDEXEDIVPROC, 314>()(vaobj, index, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexArrayivLazy(GLuint vaobj, GLenum pname, GLint *param)
+{
+    return LoadLazy<PFNGLGETVERTEXARRAYIVPROC, 315>()(vaobj, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribIivLazy(GLuint index, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBIIVPROC, 316>()(index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribIuivLazy(GLuint index, GLenum pname, GLuint *params)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBIUIVPROC, 317>()(index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribLdvLazy(GLuint index, GLenum pname, GLdouble *params)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBLDVPROC, 318>()(index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribPointervLazy(GLuint index, GLenum pname, void **pointer)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBPOINTERVPROC, 319>()(index, pname, pointer);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribdvLazy(GLuint index, GLenum pname, GLdouble *params)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBDVPROC, 320>()(index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribfvLazy(GLuint index, GLenum pname, GLfloat *params)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBFVPROC, 321>()(index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetVertexAttribivLazy(GLuint index, GLenum pname, GLint *params)
+{
+    return LoadLazy<PFNGLGETVERTEXATTRIBIVPROC, 322>()(index, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetnCompressedTexImageLazy(GLenum target,
+                                                       GLint lod,
+                                                       GLsizei bufSize,
+                                                       void *pixels)
+{
+    return LoadLazy<PFNGLGETNCOMPRESSEDTEXIMAGEPROC, 323>()(target, lod, bufSize, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glGetnTexImageLazy(GLenum target,
+                                             GLint level,
+                                             GLenum format,
+                                             GLenum type,
+                                             GLsizei bufSize,
+                                             void *pixels)
+{
+    return LoadLazy<PFNGLGETNTEXIMAGEPROC, 324>()(target, level, format, type, bufSize, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glGetnUniformdvLazy(GLuint program,
+                                              GLint location,
+                                              GLsizei bufSize,
+                                              GLdouble *params)
+{
+    return LoadLazy<PFNGLGETNUNIFORMDVPROC, 325>()(program, location, bufSize, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetnUniformfvLazy(GLuint program,
+                                              GLint location,
+                                              GLsizei bufSize,
+                                              GLfloat *params)
+{
+    return LoadLazy<PFNGLGETNUNIFORMFVPROC, 326>()(program, location, bufSize, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetnUniformivLazy(GLuint program,
+                                              GLint location,
+                                              GLsizei bufSize,
+                                              GLint *params)
+{
+    return LoadLazy<PFNGLGETNUNIFORMIVPROC, 327>()(program, location, bufSize, params);
+}
+
+void INTERNAL_GL_APIENTRY glGetnUniformuivLazy(GLuint program,
+                                               GLint location,
+                                               GLsizei bufSize,
+                                               GLuint *params)
+{
+    return LoadLazy<PFNGLGETNUNIFORMUIVPROC, 328>()(program, location, bufSize, params);
+}
+
+void INTERNAL_GL_APIENTRY glHintLazy(GLenum target, GLenum mode)
+{
+    return LoadLazy<PFNGLHINTPROC, 329>()(target, mode);
+}
+
+void INTERNAL_GL_APIENTRY glInsertEventMarkerEXTLazy(GLsizei length, const GLchar *marker)
+{
+    return LoadLazy<PFNGLINSERTEVENTMARKEREXTPROC, 330>()(length, marker);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateBufferDataLazy(GLuint buffer)
+{
+    return LoadLazy<PFNGLINVALIDATEBUFFERDATAPROC, 331>()(buffer);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateBufferSubDataLazy(GLuint buffer,
+                                                        GLintptr offset,
+                                                        GLsizeiptr length)
+{
+    return LoadLazy<PFNGLINVALIDATEBUFFERSUBDATAPROC, 332>()(buffer, offset, length);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateFramebufferLazy(GLenum target,
+                                                      GLsizei numAttachments,
+                                                      const GLenum *attachments)
+{
+    return LoadLazy<PFNGLINVALIDATEFRAMEBUFFERPROC, 333>()(target, numAttachments, attachments);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateNamedFramebufferDataLazy(GLuint framebuffer,
+                                                               GLsizei numAttachments,
+                                                               const GLenum *attachments)
+{
+    return LoadLazy<PFNGLINVALIDATENAMEDFRAMEBUFFERDATAPROC, 334>()(framebuffer, numAttachments,
+                                                                    attachments);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateNamedFramebufferSubDataLazy(GLuint framebuffer,
+                                                                  GLsizei numAttachments,
+                                                                  const GLenum *attachments,
+                                                                  GLint x,
+                                                                  GLint y,
+                                                                  GLsizei width,
+                                                                  GLsizei height)
+{
+    return LoadLazy<PFNGLINVALIDATENAMEDFRAMEBUFFERSUBDATAPROC, 335>()(
+        framebuffer, numAttachments, attachments, x, y, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateSubFramebufferLazy(GLenum target,
+                                                         GLsizei numAttachments,
+                                                         const GLenum *attachments,
+                                                         GLint x,
+                                                         GLint y,
+                                                         GLsizei width,
+                                                         GLsizei height)
+{
+    return LoadLazy<PFNGLINVALIDATESUBFRAMEBUFFERPROC, 336>()(target, numAttachments, attachments,
+                                                              x, y, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateTexImageLazy(GLuint texture, GLint level)
+{
+    return LoadLazy<PFNGLINVALIDATETEXIMAGEPROC, 337>()(texture, level);
+}
+
+void INTERNAL_GL_APIENTRY glInvalidateTexSubImageLazy(GLuint texture,
+                                                      GLint level,
+                                                      GLint xoffset,
+                                                      GLint yoffset,
+                                                      GLint zoffset,
+                                                      GLsizei width,
+                                                      GLsizei height,
+                                                      GLsizei depth)
+{
+    return LoadLazy<PFNGLINVALIDATETEXSUBIMAGEPROC, 338>()(texture, level, xoffset, yoffset,
+                                                           zoffset, width, height, depth);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsBufferLazy(GLuint buffer)
+{
+    return LoadLazy<PFNGLISBUFFERPROC, 339>()(buffer);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsEnabledLazy(GLenum cap)
+{
+    return LoadLazy<PFNGLISENABLEDPROC, 340>()(cap);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsEnablediLazy(GLenum target, GLuint index)
+{
+    return LoadLazy<PFNGLISENABLEDIPROC, 341>()(target, index);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsFenceNVLazy(GLuint fence)
+{
+    return LoadLazy<PFNGLISFENCENVPROC, 342>()(fence);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsFramebufferLazy(GLuint framebuffer)
+{
+    return LoadLazy<PFNGLISFRAMEBUFFERPROC, 343>()(framebuffer);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsPathNVLazy(GLuint path)
+{
+    return LoadLazy<PFNGLISPATHNVPROC, 344>()(path);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsProgramLazy(GLuint program)
+{
+    return LoadLazy<PFNGLISPROGRAMPROC, 345>()(program);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsProgramPipelineLazy(GLuint pipeline)
+{
+    return LoadLazy<PFNGLISPROGRAMPIPELINEPROC, 346>()(pipeline);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsQueryLazy(GLuint id)
+{
+    return LoadLazy<PFNGLISQUERYPROC, 347>()(id);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsRenderbufferLazy(GLuint renderbuffer)
+{
+    return LoadLazy<PFNGLISRENDERBUFFERPROC, 348>()(renderbuffer);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsSamplerLazy(GLuint sampler)
+{
+    return LoadLazy<PFNGLISSAMPLERPROC, 349>()(sampler);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsShaderLazy(GLuint shader)
+{
+    return LoadLazy<PFNGLISSHADERPROC, 350>()(shader);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsSyncLazy(GLsync sync)
+{
+    return LoadLazy<PFNGLISSYNCPROC, 351>()(sync);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsTextureLazy(GLuint texture)
+{
+    return LoadLazy<PFNGLISTEXTUREPROC, 352>()(texture);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsTransformFeedbackLazy(GLuint id)
+{
+    return LoadLazy<PFNGLISTRANSFORMFEEDBACKPROC, 353>()(id);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glIsVertexArrayLazy(GLuint array)
+{
+    return LoadLazy<PFNGLISVERTEXARRAYPROC, 354>()(array);
+}
+
+void INTERNAL_GL_APIENTRY glLineWidthLazy(GLfloat width)
+{
+    return LoadLazy<PFNGLLINEWIDTHPROC, 355>()(width);
+}
+
+void INTERNAL_GL_APIENTRY glLinkProgramLazy(GLuint program)
+{
+    return LoadLazy<PFNGLLINKPROGRAMPROC, 356>()(program);
+}
+
+void INTERNAL_GL_APIENTRY glLogicOpLazy(GLenum opcode)
+{
+    return LoadLazy<PFNGLLOGICOPPROC, 357>()(opcode);
+}
+
+void *INTERNAL_GL_APIENTRY glMapBufferLazy(GLenum target, GLenum access)
+{
+    return LoadLazy<PFNGLMAPBUFFERPROC, 358>()(target, access);
+}
+
+void *INTERNAL_GL_APIENTRY glMapBufferRangeLazy(GLenum target,
+                                                GLintptr offset,
+                                                GLsizeiptr length,
+                                                GLbitfield access)
+{
+    return LoadLazy<PFNGLMAPBUFFERRANGEPROC, 359>()(target, offset, length, access);
+}
+
+void *INTERNAL_GL_APIENTRY glMapNamedBufferLazy(GLuint buffer, GLenum access)
+{
+    return LoadLazy<PFNGLMAPNAMEDBUFFERPROC, 360>()(buffer, access);
+}
+
+void *INTERNAL_GL_APIENTRY glMapNamedBufferRangeLazy(GLuint buffer,
+                                                     GLintptr offset,
+                                                     GLsizeiptr length,
+                                                     GLbitfield access)
+{
+    return LoadLazy<PFNGLMAPNAMEDBUFFERRANGEPROC, 361>()(buffer, offset, length, access);
+}
+
+void INTERNAL_GL_APIENTRY glMatrixLoadfEXTLazy(GLenum mode, const GLfloat *m)
+{
+    return LoadLazy<PFNGLMATRIXLOADFEXTPROC, 362>()(mode, m);
+}
+
+void INTERNAL_GL_APIENTRY glMaxShaderCompilerThreadsARBLazy(GLuint count)
+{
+    return LoadLazy<PFNGLMAXSHADERCOMPILERTHREADSARBPROC, 363>()(count);
+}
+
+void INTERNAL_GL_APIENTRY glMaxShaderCompilerThreadsKHRLazy(GLuint count)
+{
+    return LoadLazy<PFNGLMAXSHADERCOMPILERTHREADSKHRPROC, 364>()(count);
+}
+
+void INTERNAL_GL_APIENTRY glMemoryBarrierLazy(GLbitfield barriers)
+{
+    return LoadLazy<PFNGLMEMORYBARRIERPROC, 365>()(barriers);
+}
+
+void INTERNAL_GL_APIENTRY glMemoryBarrierByRegionLazy(GLbitfield barriers)
+{
+    return LoadLazy<PFNGLMEMORYBARRIERBYREGIONPROC, 366>()(barriers);
+}
+
+void INTERNAL_GL_APIENTRY glMinSampleShadingLazy(GLfloat value)
+{
+    return LoadLazy<PFNGLMINSAMPLESHADINGPROC, 367>()(value);
+}
+
+void INTERNAL_GL_APIENTRY glMultiDrawArraysLazy(GLenum mode,
+                                                const GLint *first,
+                                                const GLsizei *count,
+                                                GLsizei drawcount)
+{
+    return LoadLazy<PFNGLMULTIDRAWARRAYSPROC, 368>()(mode, first, count, drawcount);
+}
+
+void INTERNAL_GL_APIENTRY glMultiDrawArraysIndirectLazy(GLenum mode,
+                                                        const void *indirect,
+                                                        GLsizei drawcount,
+                                                        GLsizei stride)
+{
+    return LoadLazy<PFNGLMULTIDRAWARRAYSINDIRECTPROC, 369>()(mode, indirect, drawcount, stride);
+}
+
+void INTERNAL_GL_APIENTRY glMultiDrawElementsLazy(GLenum mode,
+                                                  const GLsizei *count,
+                                                  GLenum type,
+                                                  const void *const *indices,
+                                                  GLsizei drawcount)
+{
+    return LoadLazy<PFNGLMULTIDRAWELEMENTSPROC, 370>()(mode, count, type, indices, drawcount);
+}
+
+void INTERNAL_GL_APIENTRY glMultiDrawElementsBaseVertexLazy(GLenum mode,
+                                                            const GLsizei *count,
+                                                            GLenum type,
+                                                            const void *const *indices,
+                                                            GLsizei drawcount,
+                                                            const GLint *basevertex)
+{
+    return LoadLazy<PFNGLMULTIDRAWELEMENTSBASEVERTEXPROC, 371>()(mode, count, type, indices,
+                                                                 drawcount, basevertex);
+}
+
+void INTERNAL_GL_APIENTRY glMultiDrawElementsIndirectLazy(GLenum mode,
+                                                          GLenum type,
+                                                          const void *indirect,
+                                                          GLsizei drawcount,
+                                                          GLsizei stride)
+{
+    return LoadLazy<PFNGLMULTIDRAWELEMENTSINDIRECTPROC, 372>()(mode, type, indirect, drawcount,
+                                                               stride);
+}
+
+void INTERNAL_GL_APIENTRY glNamedBufferDataLazy(GLuint buffer,
+                                                GLsizeiptr size,
+                                                const void *data,
+                                                GLenum usage)
+{
+    return LoadLazy<PFNGLNAMEDBUFFERDATAPROC, 373>()(buffer, size, data, usage);
+}
+
+void INTERNAL_GL_APIENTRY glNamedBufferStorageLazy(GLuint buffer,
+                                                   GLsizeiptr size,
+                                                   const void *data,
+                                                   GLbitfield flags)
+{
+    return LoadLazy<PFNGLNAMEDBUFFERSTORAGEPROC, 374>()(buffer, size, data, flags);
+}
+
+void INTERNAL_GL_APIENTRY glNamedBufferSubDataLazy(GLuint buffer,
+                                                   GLintptr offset,
+                                                   GLsizeiptr size,
+                                                   const void *data)
+{
+    return LoadLazy<PFNGLNAMEDBUFFERSUBDATAPROC, 375>()(buffer, offset, size, data);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferDrawBufferLazy(GLuint framebuffer, GLenum buf)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERDRAWBUFFERPROC, 376>()(framebuffer, buf);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferDrawBuffersLazy(GLuint framebuffer,
+                                                            GLsizei n,
+                                                            const GLenum *bufs)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERDRAWBUFFERSPROC, 377>()(framebuffer, n, bufs);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferParameteriLazy(GLuint framebuffer,
+                                                           GLenum pname,
+                                                           GLint param)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERPARAMETERIPROC, 378>()(framebuffer, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferReadBufferLazy(GLuint framebuffer, GLenum src)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERREADBUFFERPROC, 379>()(framebuffer, src);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferRenderbufferLazy(GLuint framebuffer,
+                                                             GLenum attachment,
+                                                             GLenum renderbuffertarget,
+                                                             GLuint renderbuffer)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERRENDERBUFFERPROC, 380>()(framebuffer, attachment,
+                                                                  renderbuffertarget, renderbuffer);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferTextureLazy(GLuint framebuffer,
+                                                        GLenum attachment,
+                                                        GLuint texture,
+                                                        GLint level)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERTEXTUREPROC, 381>()(framebuffer, attachment, texture,
+                                                             level);
+}
+
+void INTERNAL_GL_APIENTRY glNamedFramebufferTextureLayerLazy(GLuint framebuffer,
+                                                             GLenum attachment,
+                                                             GLuint texture,
+                                                             GLint level,
+                                                             GLint layer)
+{
+    return LoadLazy<PFNGLNAMEDFRAMEBUFFERTEXTURELAYERPROC, 382>()(framebuffer, attachment, texture,
+                                                                  level, layer);
+}
+
+void INTERNAL_GL_APIENTRY glNamedRenderbufferStorageLazy(GLuint renderbuffer,
+                                                         GLenum internalformat,
+                                                         GLsizei width,
+                                                         GLsizei height)
+{
+    return LoadLazy<PFNGLNAMEDRENDERBUFFERSTORAGEPROC, 383>()(renderbuffer, internalformat, width,
+                                                              height);
+}
+
+void INTERNAL_GL_APIENTRY glNamedRenderbufferStorageMultisampleLazy(GLuint renderbuffer,
+                                                                    GLsizei samples,
+                                                                    GLenum internalformat,
+                                                                    GLsizei width,
+                                                                    GLsizei height)
+{
+    return LoadLazy<PFNGLNAMEDRENDERBUFFERSTORAGEMULTISAMPLEPROC, 384>()(
+        renderbuffer, samples, internalformat, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glObjectLabelLazy(GLenum identifier,
+                                            GLuint name,
+                                            GLsizei length,
+                                            const GLchar *label)
+{
+    return LoadLazy<PFNGLOBJECTLABELPROC, 385>()(identifier, name, length, label);
+}
+
+void INTERNAL_GL_APIENTRY glObjectPtrLabelLazy(const void *ptr, GLsizei length, const GLchar *label)
+{
+    return LoadLazy<PFNGLOBJECTPTRLABELPROC, 386>()(ptr, length, label);
+}
+
+void INTERNAL_GL_APIENTRY glPatchParameterfvLazy(GLenum pname, const GLfloat *values)
+{
+    return LoadLazy<PFNGLPATCHPARAMETERFVPROC, 387>()(pname, values);
+}
+
+void INTERNAL_GL_APIENTRY glPatchParameteriLazy(GLenum pname, GLint value)
+{
+    return LoadLazy<PFNGLPATCHPARAMETERIPROC, 388>()(pname, value);
+}
+
+void INTERNAL_GL_APIENTRY glPathCommandsNVLazy(GLuint path,
+                                               GLsizei numCommands,
+                                               const GLubyte *commands,
+                                               GLsizei numCoords,
+                                               GLenum coordType,
+                                               const void *coords)
+{
+    return LoadLazy<PFNGLPATHCOMMANDSNVPROC, 389>()(path, numCommands, commands, numCoords,
+                                                    coordType, coords);
+}
+
+void INTERNAL_GL_APIENTRY glPathParameterfNVLazy(GLuint path, GLenum pname, GLfloat value)
+{
+    return LoadLazy<PFNGLPATHPARAMETERFNVPROC, 390>()(path, pname, value);
+}
+
+void INTERNAL_GL_APIENTRY glPathParameteriNVLazy(GLuint path, GLenum pname, GLint value)
+{
+    return LoadLazy<PFNGLPATHPARAMETERINVPROC, 391>()(path, pname, value);
+}
+
+void INTERNAL_GL_APIENTRY glPathStencilFuncNVLazy(GLenum func, GLint ref, GLuint mask)
+{
+    return LoadLazy<PFNGLPATHSTENCILFUNCNVPROC, 392>()(func, ref, mask);
+}
+
+void INTERNAL_GL_APIENTRY glPauseTransformFeedbackLazy()
+{
+    return LoadLazy<PFNGLPAUSETRANSFORMFEEDBACKPROC, 393>()();
+}
+
+void INTERNAL_GL_APIENTRY glPixelStorefLazy(GLenum pname, GLfloat param)
+{
+    return LoadLazy<PFNGLPIXELSTOREFPROC, 394>()(pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glPixelStoreiLazy(GLenum pname, GLint param)
+{
+    return LoadLazy<PFNGLPIXELSTOREIPROC, 395>()(pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glPointParameterfLazy(GLenum pname, GLfloat param)
+{
+    return LoadLazy<PFNGLPOINTPARAMETERFPROC, 396>()(pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glPointParameterfvLazy(GLenum pname, const GLfloat *params)
+{
+    return LoadLazy<PFNGLPOINTPARAMETERFVPROC, 397>()(pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glPointParameteriLazy(GLenum pname, GLint param)
+{
+    return LoadLazy<PFNGLPOINTPARAMETERIPROC, 398>()(pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glPointParameterivLazy(GLenum pname, const GLint *params)
+{
+    return LoadLazy<PFNGLPOINTPARAMETERIVPROC, 399>()(pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glPointSizeLazy(GLfloat size)
+{
+    return LoadLazy<PFNGLPOINTSIZEPROC, 400>()(size);
+}
+
+void INTERNAL_GL_APIENTRY glPolygonModeLazy(GLenum face, GLenum mode)
+{
+    return LoadLazy<PFNGLPOLYGONMODEPROC, 401>()(face, mode);
+}
+
+void INTERNAL_GL_APIENTRY glPolygonOffsetLazy(GLfloat factor, GLfloat units)
+{
+    return LoadLazy<PFNGLPOLYGONOFFSETPROC, 402>()(factor, units);
+}
+
+void INTERNAL_GL_APIENTRY glPopDebugGroupLazy()
+{
+    return LoadLazy<PFNGLPOPDEBUGGROUPPROC, 403>()();
+}
+
+void INTERNAL_GL_APIENTRY glPopGroupMarkerEXTLazy()
+{
+    return LoadLazy<PFNGLPOPGROUPMARKEREXTPROC, 404>()();
+}
+
+void INTERNAL_GL_APIENTRY glPrimitiveBoundingBoxLazy(GLfloat minX,
+                                                     GLfloat minY,
+                                                     GLfloat minZ,
+                                                     GLfloat minW,
+                                                     GLfloat maxX,
+                                                     GLfloat maxY,
+                                                     GLfloat maxZ,
+                                                     GLfloat maxW)
+{
+    return LoadLazy<PFNGLPRIMITIVEBOUNDINGBOXPROC, 405>()(minX, minY, minZ, minW, maxX, maxY, maxZ,
+                                                          maxW);
+}
+
+void INTERNAL_GL_APIENTRY glPrimitiveRestartIndexLazy(GLuint index)
+{
+    return LoadLazy<PFNGLPRIMITIVERESTARTINDEXPROC, 406>()(index);
+}
+
+void INTERNAL_GL_APIENTRY glProgramBinaryLazy(GLuint program,
+                                              GLenum binaryFormat,
+                                              const void *binary,
+                                              GLsizei length)
+{
+    return LoadLazy<PFNGLPROGRAMBINARYPROC, 407>()(program, binaryFormat, binary, length);
+}
+
+void INTERNAL_GL_APIENTRY glProgramParameteriLazy(GLuint program, GLenum pname, GLint value)
+{
+    return LoadLazy<PFNGLPROGRAMPARAMETERIPROC, 408>()(program, pname, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramPathFragmentInputGenNVLazy(GLuint program,
+                                                              GLint location,
+                                                              GLenum genMode,
+                                                              GLint components,
+                                                              const GLfloat *coeffs)
+{
+    return LoadLazy<PFNGLPROGRAMPATHFRAGMENTINPUTGENNVPROC, 409>()(program, location, genMode,
+                                                                   components, coeffs);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1dLazy(GLuint program, GLint location, GLdouble v0)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1DPROC, 410>()(program, location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1dvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1DVPROC, 411>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1fLazy(GLuint program, GLint location, GLfloat v0)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1FPROC, 412>()(program, location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1fvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1FVPROC, 413>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1iLazy(GLuint program, GLint location, GLint v0)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1IPROC, 414>()(program, location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1ivLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1IVPROC, 415>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1uiLazy(GLuint program, GLint location, GLuint v0)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1UIPROC, 416>()(program, location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform1uivLazy(GLuint program,
+                                                   GLint location,
+                                                   GLsizei count,
+                                                   const GLuint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM1UIVPROC, 417>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2dLazy(GLuint program,
+                                                 GLint location,
+                                                 GLdouble v0,
+                                                 GLdouble v1)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2DPROC, 418>()(program, location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2dvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2DVPROC, 419>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2fLazy(GLuint program,
+                                                 GLint location,
+                                                 GLfloat v0,
+                                                 GLfloat v1)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2FPROC, 420>()(program, location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2fvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2FVPROC, 421>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2iLazy(GLuint program, GLint location, GLint v0, GLint v1)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2IPROC, 422>()(program, location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2ivLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2IVPROC, 423>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2uiLazy(GLuint program,
+                                                  GLint location,
+                                                  GLuint v0,
+                                                  GLuint v1)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2UIPROC, 424>()(program, location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform2uivLazy(GLuint program,
+                                                   GLint location,
+                                                   GLsizei count,
+                                                   const GLuint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM2UIVPROC, 425>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glProgramUniform3dLazy(GLuint program, GLint location, GLdouble v0, GLdouble v1, GLdouble v2)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3DPROC, 426>()(program, location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform3dvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3DVPROC, 427>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glProgramUniform3fLazy(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3FPROC, 428>()(program, location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform3fvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3FVPROC, 429>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glProgramUniform3iLazy(GLuint program, GLint location, GLint v0, GLint v1, GLint v2)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3IPROC, 430>()(program, location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform3ivLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3IVPROC, 431>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glProgramUniform3uiLazy(GLuint program, GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3UIPROC, 432>()(program, location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform3uivLazy(GLuint program,
+                                                   GLint location,
+                                                   GLsizei count,
+                                                   const GLuint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM3UIVPROC, 433>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform4dLazy(GLuint program,
+                                                 GLint location,
+                                                 GLdouble v0,
+                                                 GLdouble v1,
+                                                 GLdouble v2,
+                                                 GLdouble v3)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4DPROC, 434>()(program, location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform4dvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4DVPROC, 435>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform4fLazy(GLuint program,
+                                                 GLint location,
+                                                 GLfloat v0,
+                                                 GLfloat v1,
+                                                 GLfloat v2,
+                                                 GLfloat v3)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4FPROC, 436>()(program, location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform4fvLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4FVPROC, 437>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glProgramUniform4iLazy(GLuint program, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4IPROC, 438>()(program, location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform4ivLazy(GLuint program,
+                                                  GLint location,
+                                                  GLsizei count,
+                                                  const GLint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4IVPROC, 439>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glProgramUniform4uiLazy(GLuint program, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4UIPROC, 440>()(program, location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniform4uivLazy(GLuint program,
+                                                   GLint location,
+                                                   GLsizei count,
+                                                   const GLuint *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORM4UIVPROC, 441>()(program, location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix2dvLazy(GLuint program,
+                                                        GLint location,
+                                                        GLsizei count,
+                                                        GLboolean transpose,
+                                                        const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX2DVPROC, 442>()(program, location, count, transpose,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix2fvLazy(GLuint program,
+                                                        GLint location,
+                                                        GLsizei count,
+                                                        GLboolean transpose,
+                                                        const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX2FVPROC, 443>()(program, location, count, transpose,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix2x3dvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX2X3DVPROC, 444>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix2x3fvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX2X3FVPROC, 445>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix2x4dvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX2X4DVPROC, 446>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix2x4fvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX2X4FVPROC, 447>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix3dvLazy(GLuint program,
+                                                        GLint location,
+                                                        GLsizei count,
+                                                        GLboolean transpose,
+                                                        const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX3DVPROC, 448>()(program, location, count, transpose,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix3fvLazy(GLuint program,
+                                                        GLint location,
+                                                        GLsizei count,
+                                                        GLboolean transpose,
+                                                        const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX3FVPROC, 449>()(program, location, count, transpose,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix3x2dvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX3X2DVPROC, 450>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix3x2fvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX3X2FVPROC, 451>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix3x4dvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX3X4DVPROC, 452>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix3x4fvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX3X4FVPROC, 453>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix4dvLazy(GLuint program,
+                                                        GLint location,
+                                                        GLsizei count,
+                                                        GLboolean transpose,
+                                                        const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX4DVPROC, 454>()(program, location, count, transpose,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix4fvLazy(GLuint program,
+                                                        GLint location,
+                                                        GLsizei count,
+                                                        GLboolean transpose,
+                                                        const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX4FVPROC, 455>()(program, location, count, transpose,
+                                                             value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix4x2dvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX4X2DVPROC, 456>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix4x2fvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX4X2FVPROC, 457>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix4x3dvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLdouble *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX4X3DVPROC, 458>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProgramUniformMatrix4x3fvLazy(GLuint program,
+                                                          GLint location,
+                                                          GLsizei count,
+                                                          GLboolean transpose,
+                                                          const GLfloat *value)
+{
+    return LoadLazy<PFNGLPROGRAMUNIFORMMATRIX4X3FVPROC, 459>()(program, location, count, transpose,
+                                                               value);
+}
+
+void INTERNAL_GL_APIENTRY glProvokingVertexLazy(GLenum mode)
+{
+    return LoadLazy<PFNGLPROVOKINGVERTEXPROC, 460>()(mode);
+}
+
+void INTERNAL_GL_APIENTRY glPushDebugGroupLazy(GLenum source,
+                                               GLuint id,
+                                               GLsizei length,
+                                               const GLchar *message)
+{
+    return LoadLazy<PFNGLPUSHDEBUGGROUPPROC, 461>()(source, id, length, message);
+}
+
+void INTERNAL_GL_APIENTRY glPushGroupMarkerEXTLazy(GLsizei length, const GLchar *marker)
+{
+    return LoadLazy<PFNGLPUSHGROUPMARKEREXTPROC, 462>()(length, marker);
+}
+
+void INTERNAL_GL_APIENTRY glQueryCounterLazy(GLuint id, GLenum target)
+{
+    return LoadLazy<PFNGLQUERYCOUNTERPROC, 463>()(id, target);
+}
+
+void INTERNAL_GL_APIENTRY glReadBufferLazy(GLenum src)
+{
+    return LoadLazy<PFNGLREADBUFFERPROC, 464>()(src);
+}
+
+void INTERNAL_GL_APIENTRY glReadPixelsLazy(GLint x,
+                                           GLint y,
+                                           GLsizei width,
+                                           GLsizei height,
+                                           GLenum format,
+                                           GLenum type,
+                                           void *pixels)
+{
+    return LoadLazy<PFNGLREADPIXELSPROC, 465>()(x, y, width, height, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glReadnPixelsLazy(GLint x,
+                                            GLint y,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLenum format,
+                                            GLenum type,
+                                            GLsizei bufSize,
+                                            void *data)
+{
+    return LoadLazy<PFNGLREADNPIXELSPROC, 466>()(x, y, width, height, format, type, bufSize, data);
+}
+
+void INTERNAL_GL_APIENTRY glReleaseShaderCompilerLazy()
+{
+    return LoadLazy<PFNGLRELEASESHADERCOMPILERPROC, 467>()();
+}
+
+void INTERNAL_GL_APIENTRY glRenderbufferStorageLazy(GLenum target,
+                                                    GLenum internalformat,
+                                                    GLsizei width,
+                                                    GLsizei height)
+{
+    return LoadLazy<PFNGLRENDERBUFFERSTORAGEPROC, 468>()(target, internalformat, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glRenderbufferStorageMultisampleLazy(GLenum target,
+                                                               GLsizei samples,
+                                                               GLenum internalformat,
+                                                               GLsizei width,
+                                                               GLsizei height)
+{
+    return LoadLazy<PFNGLRENDERBUFFERSTORAGEMULTISAMPLEPROC, 469>()(target, samples, internalformat,
+                                                                    width, height);
+}
+
+void INTERNAL_GL_APIENTRY glResumeTransformFeedbackLazy()
+{
+    return LoadLazy<PFNGLRESUMETRANSFORMFEEDBACKPROC, 470>()();
+}
+
+void INTERNAL_GL_APIENTRY glSampleCoverageLazy(GLfloat value, GLboolean invert)
+{
+    return LoadLazy<PFNGLSAMPLECOVERAGEPROC, 471>()(value, invert);
+}
+
+void INTERNAL_GL_APIENTRY glSampleMaskiLazy(GLuint maskNumber, GLbitfield mask)
+{
+    return LoadLazy<PFNGLSAMPLEMASKIPROC, 472>()(maskNumber, mask);
+}
+
+void INTERNAL_GL_APIENTRY glSamplerParameterIivLazy(GLuint sampler,
+                                                    GLenum pname,
+                                                    const GLint *param)
+{
+    return LoadLazy<PFNGLSAMPLERPARAMETERIIVPROC, 473>()(sampler, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glSamplerParameterIuivLazy(GLuint sampler,
+                                                     GLenum pname,
+                                                     const GLuint *param)
+{
+    return LoadLazy<PFNGLSAMPLERPARAMETERIUIVPROC, 474>()(sampler, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glSamplerParameterfLazy(GLuint sampler, GLenum pname, GLfloat param)
+{
+    return LoadLazy<PFNGLSAMPLERPARAMETERFPROC, 475>()(sampler, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glSamplerParameterfvLazy(GLuint sampler,
+                                                   GLenum pname,
+                                                   const GLfloat *param)
+{
+    return LoadLazy<PFNGLSAMPLERPARAMETERFVPROC, 476>()(sampler, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glSamplerParameteriLazy(GLuint sampler, GLenum pname, GLint param)
+{
+    return LoadLazy<PFNGLSAMPLERPARAMETERIPROC, 477>()(sampler, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glSamplerParameterivLazy(GLuint sampler, GLenum pname, const GLint *param)
+{
+    return LoadLazy<PFNGLSAMPLERPARAMETERIVPROC, 478>()(sampler, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glScissorLazy(GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    return LoadLazy<PFNGLSCISSORPROC, 479>()(x, y, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glScissorArrayvLazy(GLuint first, GLsizei count, const GLint *v)
+{
+    return LoadLazy<PFNGLSCISSORARRAYVPROC, 480>()(first, count, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glScissorIndexedLazy(GLuint index, GLint left, GLint bottom, GLsizei width, GLsizei height)
+{
+    return LoadLazy<PFNGLSCISSORINDEXEDPROC, 481>()(index, left, bottom, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glScissorIndexedvLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLSCISSORINDEXEDVPROC, 482>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glSetFenceNVLazy(GLuint fence, GLenum condition)
+{
+    return LoadLazy<PFNGLSETFENCENVPROC, 483>()(fence, condition);
+}
+
+void INTERNAL_GL_APIENTRY glShaderBinaryLazy(GLsizei count,
+                                             const GLuint *shaders,
+                                             GLenum binaryformat,
+                                             const void *binary,
+                                             GLsizei length)
+{
+    return LoadLazy<PFNGLSHADERBINARYPROC, 484>()(count, shaders, binaryformat, binary, length);
+}
+
+void INTERNAL_GL_APIENTRY glShaderSourceLazy(GLuint shader,
+                                             GLsizei count,
+                                             const GLchar *const *string,
+                                             const GLint *length)
+{
+    return LoadLazy<PFNGLSHADERSOURCEPROC, 485>()(shader, count, string, length);
+}
+
+void INTERNAL_GL_APIENTRY glShaderStorageBlockBindingLazy(GLuint program,
+                                                          GLuint storageBlockIndex,
+                                                          GLuint storageBlockBinding)
+{
+    return LoadLazy<PFNGLSHADERSTORAGEBLOCKBINDINGPROC, 486>()(program, storageBlockIndex,
+                                                               storageBlockBinding);
+}
+
+void INTERNAL_GL_APIENTRY glStencilFillPathInstancedNVLazy(GLsizei numPaths,
+                                                           GLenum pathNameType,
+                                                           const void *paths,
+                                                           GLuint pathBase,
+                                                           GLenum fillMode,
+                                                           GLuint mask,
+                                                           GLenum transformType,
+                                                           const GLfloat *transformValues)
+{
+    return LoadLazy<PFNGLSTENCILFILLPATHINSTANCEDNVPROC, 487>()(
+        numPaths, pathNameType, paths, pathBase, fillMode, mask, transformType, transformValues);
+}
+
+void INTERNAL_GL_APIENTRY glStencilFillPathNVLazy(GLuint path, GLenum fillMode, GLuint mask)
+{
+    return LoadLazy<PFNGLSTENCILFILLPATHNVPROC, 488>()(path, fillMode, mask);
+}
+
+void INTERNAL_GL_APIENTRY glStencilFuncLazy(GLenum func, GLint ref, GLuint mask)
+{
+    return LoadLazy<PFNGLSTENCILFUNCPROC, 489>()(func, ref, mask);
+}
+
+void INTERNAL_GL_APIENTRY glStencilFuncSeparateLazy(GLenum face,
+                                                    GLenum func,
+                                                    GLint ref,
+                                                    GLuint mask)
+{
+    return LoadLazy<PFNGLSTENCILFUNCSEPARATEPROC, 490>()(face, func, ref, mask);
+}
+
+void INTERNAL_GL_APIENTRY glStencilMaskLazy(GLuint mask)
+{
+    return LoadLazy<PFNGLSTENCILMASKPROC, 491>()(mask);
+}
+
+void INTERNAL_GL_APIENTRY glStencilMaskSeparateLazy(GLenum face, GLuint mask)
+{
+    return LoadLazy<PFNGLSTENCILMASKSEPARATEPROC, 492>()(face, mask);
+}
+
+void INTERNAL_GL_APIENTRY glStencilOpLazy(GLenum fail, GLenum zfail, GLenum zpass)
+{
+    return LoadLazy<PFNGLSTENCILOPPROC, 493>()(fail, zfail, zpass);
+}
+
+void INTERNAL_GL_APIENTRY glStencilOpSeparateLazy(GLenum face,
+                                                  GLenum sfail,
+                                                  GLenum dpfail,
+                                                  GLenum dppass)
+{
+    return LoadLazy<PFNGLSTENCILOPSEPARATEPROC, 494>()(face, sfail, dpfail, dppass);
+}
+
+void INTERNAL_GL_APIENTRY glStencilStrokePathInstancedNVLazy(GLsizei numPaths,
+                                                             GLenum pathNameType,
+                                                             const void *paths,
+                                                             GLuint pathBase,
+                                                             GLint reference,
+                                                             GLuint mask,
+                                                             GLenum transformType,
+                                                             const GLfloat *transformValues)
+{
+    return LoadLazy<PFNGLSTENCILSTROKEPATHINSTANCEDNVPROC, 495>()(
+        numPaths, pathNameType, paths, pathBase, reference, mask, transformType, transformValues);
+}
+
+void INTERNAL_GL_APIENTRY glStencilStrokePathNVLazy(GLuint path, GLint reference, GLuint mask)
+{
+    return LoadLazy<PFNGLSTENCILSTROKEPATHNVPROC, 496>()(path, reference, mask);
+}
+
+void INTERNAL_GL_APIENTRY glStencilThenCoverFillPathInstancedNVLazy(GLsizei numPaths,
+                                                                    GLenum pathNameType,
+                                                                    const void *paths,
+                                                                    GLuint pathBase,
+                                                                    GLenum fillMode,
+                                                                    GLuint mask,
+                                                                    GLenum coverMode,
+                                                                    GLenum transformType,
+                                                                    const GLfloat *transformValues)
+{
+    return LoadLazy<PFNGLSTENCILTHENCOVERFILLPATHINSTANCEDNVPROC, 497>()(
+        numPaths, pathNameType, paths, pathBase, fillMode, mask, coverMode, transformType,
+        transformValues);
+}
+
+void INTERNAL_GL_APIENTRY glStencilThenCoverFillPathNVLazy(GLuint path,
+                                                           GLenum fillMode,
+                                                           GLuint mask,
+                                                           GLenum coverMode)
+{
+    return LoadLazy<PFNGLSTENCILTHENCOVERFILLPATHNVPROC, 498>()(path, fillMode, mask, coverMode);
+}
+
+void INTERNAL_GL_APIENTRY
+glStencilThenCoverStrokePathInstancedNVLazy(GLsizei numPaths,
+                                            GLenum pathNameType,
+                                            const void *paths,
+                                            GLuint pathBase,
+                                            GLint reference,
+                                            GLuint mask,
+                                            GLenum coverMode,
+                                            GLenum transformType,
+                                            const GLfloat *transformValues)
+{
+    return LoadLazy<PFNGLSTENCILTHENCOVERSTROKEPATHINSTANCEDNVPROC, 499>()(
+        numPaths, pathNameType, paths, pathBase, reference, mask, coverMode, transformType,
+        transformValues);
+}
+
+void INTERNAL_GL_APIENTRY glStencilThenCoverStrokePathNVLazy(GLuint path,
+                                                             GLint reference,
+                                                             GLuint mask,
+                                                             GLenum coverMode)
+{
+    return LoadLazy<PFNGLSTENCILTHENCOVERSTROKEPATHNVPROC, 500>()(path, reference, mask, coverMode);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glTestFenceNVLazy(GLuint fence)
+{
+    return LoadLazy<PFNGLTESTFENCENVPROC, 501>()(fence);
+}
+
+void INTERNAL_GL_APIENTRY glTexBufferLazy(GLenum target, GLenum internalformat, GLuint buffer)
+{
+    return LoadLazy<PFNGLTEXBUFFERPROC, 502>()(target, internalformat, buffer);
+}
+
+void INTERNAL_GL_APIENTRY glTexBufferRangeLazy(GLenum target,
+                                               GLenum internalformat,
+                                               GLuint buffer,
+                                               GLintptr offset,
+                                               GLsizeiptr size)
+{
+    return LoadLazy<PFNGLTEXBUFFERRANGEPROC, 503>()(target, internalformat, buffer, offset, size);
+}
+
+void INTERNAL_GL_APIENTRY glTexImage1DLazy(GLenum target,
+                                           GLint level,
+                                           GLint internalformat,
+                                           GLsizei width,
+                                           GLint border,
+                                           GLenum format,
+                                           GLenum type,
+                                           const void *pixels)
+{
+    return LoadLazy<PFNGLTEXIMAGE1DPROC, 504>()(target, level, internalformat, width, border,
+                                                format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTexImage2DLazy(GLenum target,
+                                           GLint level,
+                                           GLint internalformat,
+                                           GLsizei width,
+                                           GLsizei height,
+                                           GLint border,
+                                           GLenum format,
+                                           GLenum type,
+                                           const void *pixels)
+{
+    return LoadLazy<PFNGLTEXIMAGE2DPROC, 505>()(target, level, internalformat, width, height,
+                                                border, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTexImage2DMultisampleLazy(GLenum target,
+                                                      GLsizei samples,
+                                                      GLenum internalformat,
+                                                      GLsizei width,
+                                                      GLsizei height,
+                                                      GLboolean fixedsamplelocations)
+{
+    return LoadLazy<PFNGLTEXIMAGE2DMULTISAMPLEPROC, 506>()(target, samples, internalformat, width,
+                                                           height, fixedsamplelocations);
+}
+
+void INTERNAL_GL_APIENTRY glTexImage3DLazy(GLenum target,
+                                           GLint level,
+                                           GLint internalformat,
+                                           GLsizei width,
+                                           GLsizei height,
+                                           GLsizei depth,
+                                           GLint border,
+                                           GLenum format,
+                                           GLenum type,
+                                           const void *pixels)
+{
+    return LoadLazy<PFNGLTEXIMAGE3DPROC, 507>()(target, level, internalformat, width, height, depth,
+                                                border, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTexImage3DMultisampleLazy(GLenum target,
+                                                      GLsizei samples,
+                                                      GLenum internalformat,
+                                                      GLsizei width,
+                                                      GLsizei height,
+                                                      GLsizei depth,
+                                                      GLboolean fixedsamplelocations)
+{
+    return LoadLazy<PFNGLTEXIMAGE3DMULTISAMPLEPROC, 508>()(target, samples, internalformat, width,
+                                                           height, depth, fixedsamplelocations);
+}
+
+void INTERNAL_GL_APIENTRY glTexParameterIivLazy(GLenum target, GLenum pname, const GLint *params)
+{
+    return LoadLazy<PFNGLTEXPARAMETERIIVPROC, 509>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glTexParameterIuivLazy(GLenum target, GLenum pname, const GLuint *params)
+{
+    return LoadLazy<PFNGLTEXPARAMETERIUIVPROC, 510>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glTexParameterfLazy(GLenum target, GLenum pname, GLfloat param)
+{
+    return LoadLazy<PFNGLTEXPARAMETERFPROC, 511>()(target, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glTexParameterfvLazy(GLenum target, GLenum pname, const GLfloat *params)
+{
+    return LoadLazy<PFNGLTEXPARAMETERFVPROC, 512>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glTexParameteriLazy(GLenum target, GLenum pname, GLint param)
+{
+    return LoadLazy<PFNGLTEXPARAMETERIPROC, 513>()(target, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glTexParameterivLazy(GLenum target, GLenum pname, const GLint *params)
+{
+    return LoadLazy<PFNGLTEXPARAMETERIVPROC, 514>()(target, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glTexStorage1DLazy(GLenum target,
+                                             GLsizei levels,
+                                             GLenum internalformat,
+                                             GLsizei width)
+{
+    return LoadLazy<PFNGLTEXSTORAGE1DPROC, 515>()(target, levels, internalformat, width);
+}
+
+void INTERNAL_GL_APIENTRY glTexStorage2DLazy(GLenum target,
+                                             GLsizei levels,
+                                             GLenum internalformat,
+                                             GLsizei width,
+                                             GLsizei height)
+{
+    return LoadLazy<PFNGLTEXSTORAGE2DPROC, 516>()(target, levels, internalformat, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glTexStorage2DMultisampleLazy(GLenum target,
+                                                        GLsizei samples,
+                                                        GLenum internalformat,
+                                                        GLsizei width,
+                                                        GLsizei height,
+                                                        GLboolean fixedsamplelocations)
+{
+    return LoadLazy<PFNGLTEXSTORAGE2DMULTISAMPLEPROC, 517>()(target, samples, internalformat, width,
+                                                             height, fixedsamplelocations);
+}
+
+void INTERNAL_GL_APIENTRY glTexStorage3DLazy(GLenum target,
+                                             GLsizei levels,
+                                             GLenum internalformat,
+                                             GLsizei width,
+                                             GLsizei height,
+                                             GLsizei depth)
+{
+    return LoadLazy<PFNGLTEXSTORAGE3DPROC, 518>()(target, levels, internalformat, width, height,
+                                                  depth);
+}
+
+void INTERNAL_GL_APIENTRY glTexStorage3DMultisampleLazy(GLenum target,
+                                                        GLsizei samples,
+                                                        GLenum internalformat,
+                                                        GLsizei width,
+                                                        GLsizei height,
+                                                        GLsizei depth,
+                                                        GLboolean fixedsamplelocations)
+{
+    return LoadLazy<PFNGLTEXSTORAGE3DMULTISAMPLEPROC, 519>()(target, samples, internalformat, width,
+                                                             height, depth, fixedsamplelocations);
+}
+
+void INTERNAL_GL_APIENTRY glTexSubImage1DLazy(GLenum target,
+                                              GLint level,
+                                              GLint xoffset,
+                                              GLsizei width,
+                                              GLenum format,
+                                              GLenum type,
+                                              const void *pixels)
+{
+    return LoadLazy<PFNGLTEXSUBIMAGE1DPROC, 520>()(target, level, xoffset, width, format, type,
+                                                   pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTexSubImage2DLazy(GLenum target,
+                                              GLint level,
+                                              GLint xoffset,
+                                              GLint yoffset,
+                                              GLsizei width,
+                                              GLsizei height,
+                                              GLenum format,
+                                              GLenum type,
+                                              const void *pixels)
+{
+    return LoadLazy<PFNGLTEXSUBIMAGE2DPROC, 521>()(target, level, xoffset, yoffset, width, height,
+                                                   format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTexSubImage3DLazy(GLenum target,
+                                              GLint level,
+                                              GLint xoffset,
+                                              GLint yoffset,
+                                              GLint zoffset,
+                                              GLsizei width,
+                                              GLsizei height,
+                                              GLsizei depth,
+                                              GLenum format,
+                                              GLenum type,
+                                              const void *pixels)
+{
+    return LoadLazy<PFNGLTEXSUBIMAGE3DPROC, 522>()(target, level, xoffset, yoffset, zoffset, width,
+                                                   height, depth, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTextureBarrierLazy()
+{
+    return LoadLazy<PFNGLTEXTUREBARRIERPROC, 523>()();
+}
+
+void INTERNAL_GL_APIENTRY glTextureBufferLazy(GLuint texture, GLenum internalformat, GLuint buffer)
+{
+    return LoadLazy<PFNGLTEXTUREBUFFERPROC, 524>()(texture, internalformat, buffer);
+}
+
+void INTERNAL_GL_APIENTRY glTextureBufferRangeLazy(GLuint texture,
+                                                   GLenum internalformat,
+                                                   GLuint buffer,
+                                                   GLintptr offset,
+                                                   GLsizeiptr size)
+{
+    return LoadLazy<PFNGLTEXTUREBUFFERRANGEPROC, 525>()(texture, internalformat, buffer, offset,
+                                                        size);
+}
+
+void INTERNAL_GL_APIENTRY glTextureParameterIivLazy(GLuint texture,
+                                                    GLenum pname,
+                                                    const GLint *params)
+{
+    return LoadLazy<PFNGLTEXTUREPARAMETERIIVPROC, 526>()(texture, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glTextureParameterIuivLazy(GLuint texture,
+                                                     GLenum pname,
+                                                     const GLuint *params)
+{
+    return LoadLazy<PFNGLTEXTUREPARAMETERIUIVPROC, 527>()(texture, pname, params);
+}
+
+void INTERNAL_GL_APIENTRY glTextureParameterfLazy(GLuint texture, GLenum pname, GLfloat param)
+{
+    return LoadLazy<PFNGLTEXTUREPARAMETERFPROC, 528>()(texture, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glTextureParameterfvLazy(GLuint texture,
+                                                   GLenum pname,
+                                                   const GLfloat *param)
+{
+    return LoadLazy<PFNGLTEXTUREPARAMETERFVPROC, 529>()(texture, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glTextureParameteriLazy(GLuint texture, GLenum pname, GLint param)
+{
+    return LoadLazy<PFNGLTEXTUREPARAMETERIPROC, 530>()(texture, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glTextureParameterivLazy(GLuint texture, GLenum pname, const GLint *param)
+{
+    return LoadLazy<PFNGLTEXTUREPARAMETERIVPROC, 531>()(texture, pname, param);
+}
+
+void INTERNAL_GL_APIENTRY glTextureStorage1DLazy(GLuint texture,
+                                                 GLsizei levels,
+                                                 GLenum internalformat,
+                                                 GLsizei width)
+{
+    return LoadLazy<PFNGLTEXTURESTORAGE1DPROC, 532>()(texture, levels, internalformat, width);
+}
+
+void INTERNAL_GL_APIENTRY glTextureStorage2DLazy(GLuint texture,
+                                                 GLsizei levels,
+                                                 GLenum internalformat,
+                                                 GLsizei width,
+                                                 GLsizei height)
+{
+    return LoadLazy<PFNGLTEXTURESTORAGE2DPROC, 533>()(texture, levels, internalformat, width,
+                                                      height);
+}
+
+void INTERNAL_GL_APIENTRY glTextureStorage2DMultisampleLazy(GLuint texture,
+                                                            GLsizei samples,
+                                                            GLenum internalformat,
+                                                            GLsizei width,
+                                                            GLsizei height,
+                                                            GLboolean fixedsamplelocations)
+{
+    return LoadLazy<PFNGLTEXTURESTORAGE2DMULTISAMPLEPROC, 534>()(
+        texture, samples, internalformat, width, height, fixedsamplelocations);
+}
+
+void INTERNAL_GL_APIENTRY glTextureStorage3DLazy(GLuint texture,
+                                                 GLsizei levels,
+                                                 GLenum internalformat,
+                                                 GLsizei width,
+                                                 GLsizei height,
+                                                 GLsizei depth)
+{
+    return LoadLazy<PFNGLTEXTURESTORAGE3DPROC, 535>()(texture, levels, internalformat, width,
+                                                      height, depth);
+}
+
+void INTERNAL_GL_APIENTRY glTextureStorage3DMultisampleLazy(GLuint texture,
+                                                            GLsizei samples,
+                                                            GLenum internalformat,
+                                                            GLsizei width,
+                                                            GLsizei height,
+                                                            GLsizei depth,
+                                                            GLboolean fixedsamplelocations)
+{
+    return LoadLazy<PFNGLTEXTURESTORAGE3DMULTISAMPLEPROC, 536>()(
+        texture, samples, internalformat, width, height, depth, fixedsamplelocations);
+}
+
+void INTERNAL_GL_APIENTRY glTextureSubImage1DLazy(GLuint texture,
+                                                  GLint level,
+                                                  GLint xoffset,
+                                                  GLsizei width,
+                                                  GLenum format,
+                                                  GLenum type,
+                                                  const void *pixels)
+{
+    return LoadLazy<PFNGLTEXTURESUBIMAGE1DPROC, 537>()(texture, level, xoffset, width, format, type,
+                                                       pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTextureSubImage2DLazy(GLuint texture,
+                                                  GLint level,
+                                                  GLint xoffset,
+                                                  GLint yoffset,
+                                                  GLsizei width,
+                                                  GLsizei height,
+                                                  GLenum format,
+                                                  GLenum type,
+                                                  const void *pixels)
+{
+    return LoadLazy<PFNGLTEXTURESUBIMAGE2DPROC, 538>()(texture, level, xoffset, yoffset, width,
+                                                       height, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTextureSubImage3DLazy(GLuint texture,
+                                                  GLint level,
+                                                  GLint xoffset,
+                                                  GLint yoffset,
+                                                  GLint zoffset,
+                                                  GLsizei width,
+                                                  GLsizei height,
+                                                  GLsizei depth,
+                                                  GLenum format,
+                                                  GLenum type,
+                                                  const void *pixels)
+{
+    return LoadLazy<PFNGLTEXTURESUBIMAGE3DPROC, 539>()(texture, level, xoffset, yoffset, zoffset,
+                                                       width, height, depth, format, type, pixels);
+}
+
+void INTERNAL_GL_APIENTRY glTextureViewLazy(GLuint texture,
+                                            GLenum target,
+                                            GLuint origtexture,
+                                            GLenum internalformat,
+                                            GLuint minlevel,
+                                            GLuint numlevels,
+                                            GLuint minlayer,
+                                            GLuint numlayers)
+{
+    return LoadLazy<PFNGLTEXTUREVIEWPROC, 540>()(texture, target, origtexture, internalformat,
+                                                 minlevel, numlevels, minlayer, numlayers);
+}
+
+void INTERNAL_GL_APIENTRY glTransformFeedbackBufferBaseLazy(GLuint xfb, GLuint index, GLuint buffer)
+{
+    return LoadLazy<PFNGLTRANSFORMFEEDBACKBUFFERBASEPROC, 541>()(xfb, index, buffer);
+}
+
+void INTERNAL_GL_APIENTRY glTransformFeedbackBufferRangeLazy(GLuint xfb,
+                                                             GLuint index,
+                                                             GLuint buffer,
+                                                             GLintptr offset,
+                                                             GLsizeiptr size)
+{
+    return LoadLazy<PFNGLTRANSFORMFEEDBACKBUFFERRANGEPROC, 542>()(xfb, index, buffer, offset, size);
+}
+
+void INTERNAL_GL_APIENTRY glTransformFeedbackVaryingsLazy(GLuint program,
+                                                          GLsizei count,
+                                                          const GLchar *const *varyings,
+                                                          GLenum bufferMode)
+{
+    return LoadLazy<PFNGLTRANSFORMFEEDBACKVARYINGSPROC, 543>()(program, count, varyings,
+                                                               bufferMode);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1dLazy(GLint location, GLdouble x)
+{
+    return LoadLazy<PFNGLUNIFORM1DPROC, 544>()(location, x);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1dvLazy(GLint location, GLsizei count, const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORM1DVPROC, 545>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1fLazy(GLint location, GLfloat v0)
+{
+    return LoadLazy<PFNGLUNIFORM1FPROC, 546>()(location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1fvLazy(GLint location, GLsizei count, const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORM1FVPROC, 547>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1iLazy(GLint location, GLint v0)
+{
+    return LoadLazy<PFNGLUNIFORM1IPROC, 548>()(location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1ivLazy(GLint location, GLsizei count, const GLint *value)
+{
+    return LoadLazy<PFNGLUNIFORM1IVPROC, 549>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1uiLazy(GLint location, GLuint v0)
+{
+    return LoadLazy<PFNGLUNIFORM1UIPROC, 550>()(location, v0);
+}
+
+void INTERNAL_GL_APIENTRY glUniform1uivLazy(GLint location, GLsizei count, const GLuint *value)
+{
+    return LoadLazy<PFNGLUNIFORM1UIVPROC, 551>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2dLazy(GLint location, GLdouble x, GLdouble y)
+{
+    return LoadLazy<PFNGLUNIFORM2DPROC, 552>()(location, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2dvLazy(GLint location, GLsizei count, const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORM2DVPROC, 553>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2fLazy(GLint location, GLfloat v0, GLfloat v1)
+{
+    return LoadLazy<PFNGLUNIFORM2FPROC, 554>()(location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2fvLazy(GLint location, GLsizei count, const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORM2FVPROC, 555>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2iLazy(GLint location, GLint v0, GLint v1)
+{
+    return LoadLazy<PFNGLUNIFORM2IPROC, 556>()(location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2ivLazy(GLint location, GLsizei count, const GLint *value)
+{
+    return LoadLazy<PFNGLUNIFORM2IVPROC, 557>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2uiLazy(GLint location, GLuint v0, GLuint v1)
+{
+    return LoadLazy<PFNGLUNIFORM2UIPROC, 558>()(location, v0, v1);
+}
+
+void INTERNAL_GL_APIENTRY glUniform2uivLazy(GLint location, GLsizei count, const GLuint *value)
+{
+    return LoadLazy<PFNGLUNIFORM2UIVPROC, 559>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3dLazy(GLint location, GLdouble x, GLdouble y, GLdouble z)
+{
+    return LoadLazy<PFNGLUNIFORM3DPROC, 560>()(location, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3dvLazy(GLint location, GLsizei count, const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORM3DVPROC, 561>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3fLazy(GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
+{
+    return LoadLazy<PFNGLUNIFORM3FPROC, 562>()(location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3fvLazy(GLint location, GLsizei count, const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORM3FVPROC, 563>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3iLazy(GLint location, GLint v0, GLint v1, GLint v2)
+{
+    return LoadLazy<PFNGLUNIFORM3IPROC, 564>()(location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3ivLazy(GLint location, GLsizei count, const GLint *value)
+{
+    return LoadLazy<PFNGLUNIFORM3IVPROC, 565>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3uiLazy(GLint location, GLuint v0, GLuint v1, GLuint v2)
+{
+    return LoadLazy<PFNGLUNIFORM3UIPROC, 566>()(location, v0, v1, v2);
+}
+
+void INTERNAL_GL_APIENTRY glUniform3uivLazy(GLint location, GLsizei count, const GLuint *value)
+{
+    return LoadLazy<PFNGLUNIFORM3UIVPROC, 567>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glUniform4dLazy(GLint location, GLdouble x, GLdouble y, GLdouble z, GLdouble w)
+{
+    return LoadLazy<PFNGLUNIFORM4DPROC, 568>()(location, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glUniform4dvLazy(GLint location, GLsizei count, const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORM4DVPROC, 569>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glUniform4fLazy(GLint location, GLfloat v0, GLfloat v1, GLfloat v2, GLfloat v3)
+{
+    return LoadLazy<PFNGLUNIFORM4FPROC, 570>()(location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glUniform4fvLazy(GLint location, GLsizei count, const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORM4FVPROC, 571>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniform4iLazy(GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
+{
+    return LoadLazy<PFNGLUNIFORM4IPROC, 572>()(location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glUniform4ivLazy(GLint location, GLsizei count, const GLint *value)
+{
+    return LoadLazy<PFNGLUNIFORM4IVPROC, 573>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY
+glUniform4uiLazy(GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
+{
+    return LoadLazy<PFNGLUNIFORM4UIPROC, 574>()(location, v0, v1, v2, v3);
+}
+
+void INTERNAL_GL_APIENTRY glUniform4uivLazy(GLint location, GLsizei count, const GLuint *value)
+{
+    return LoadLazy<PFNGLUNIFORM4UIVPROC, 575>()(location, count, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformBlockBindingLazy(GLuint program,
+                                                    GLuint uniformBlockIndex,
+                                                    GLuint uniformBlockBinding)
+{
+    return LoadLazy<PFNGLUNIFORMBLOCKBINDINGPROC, 576>()(program, uniformBlockIndex,
+                                                         uniformBlockBinding);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix2dvLazy(GLint location,
+                                                 GLsizei count,
+                                                 GLboolean transpose,
+                                                 const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX2DVPROC, 577>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix2fvLazy(GLint location,
+                                                 GLsizei count,
+                                                 GLboolean transpose,
+                                                 const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX2FVPROC, 578>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix2x3dvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX2X3DVPROC, 579>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix2x3fvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX2X3FVPROC, 580>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix2x4dvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX2X4DVPROC, 581>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix2x4fvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX2X4FVPROC, 582>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix3dvLazy(GLint location,
+                                                 GLsizei count,
+                                                 GLboolean transpose,
+                                                 const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX3DVPROC, 583>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix3fvLazy(GLint location,
+                                                 GLsizei count,
+                                                 GLboolean transpose,
+                                                 const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX3FVPROC, 584>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix3x2dvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX3X2DVPROC, 585>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix3x2fvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX3X2FVPROC, 586>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix3x4dvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX3X4DVPROC, 587>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix3x4fvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX3X4FVPROC, 588>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix4dvLazy(GLint location,
+                                                 GLsizei count,
+                                                 GLboolean transpose,
+                                                 const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX4DVPROC, 589>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix4fvLazy(GLint location,
+                                                 GLsizei count,
+                                                 GLboolean transpose,
+                                                 const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX4FVPROC, 590>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix4x2dvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX4X2DVPROC, 591>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix4x2fvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX4X2FVPROC, 592>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix4x3dvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLdouble *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX4X3DVPROC, 593>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformMatrix4x3fvLazy(GLint location,
+                                                   GLsizei count,
+                                                   GLboolean transpose,
+                                                   const GLfloat *value)
+{
+    return LoadLazy<PFNGLUNIFORMMATRIX4X3FVPROC, 594>()(location, count, transpose, value);
+}
+
+void INTERNAL_GL_APIENTRY glUniformSubroutinesuivLazy(GLenum shadertype,
+                                                      GLsizei count,
+                                                      const GLuint *indices)
+{
+    return LoadLazy<PFNGLUNIFORMSUBROUTINESUIVPROC, 595>()(shadertype, count, indices);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glUnmapBufferLazy(GLenum target)
+{
+    return LoadLazy<PFNGLUNMAPBUFFERPROC, 596>()(target);
+}
+
+GLboolean INTERNAL_GL_APIENTRY glUnmapNamedBufferLazy(GLuint buffer)
+{
+    return LoadLazy<PFNGLUNMAPNAMEDBUFFERPROC, 597>()(buffer);
+}
+
+void INTERNAL_GL_APIENTRY glUseProgramLazy(GLuint program)
+{
+    return LoadLazy<PFNGLUSEPROGRAMPROC, 598>()(program);
+}
+
+void INTERNAL_GL_APIENTRY glUseProgramStagesLazy(GLuint pipeline, GLbitfield stages, GLuint program)
+{
+    return LoadLazy<PFNGLUSEPROGRAMSTAGESPROC, 599>()(pipeline, stages, program);
+}
+
+void INTERNAL_GL_APIENTRY glValidateProgramLazy(GLuint program)
+{
+    return LoadLazy<PFNGLVALIDATEPROGRAMPROC, 600>()(program);
+}
+
+void INTERNAL_GL_APIENTRY glValidateProgramPipelineLazy(GLuint pipeline)
+{
+    return LoadLazy<PFNGLVALIDATEPROGRAMPIPELINEPROC, 601>()(pipeline);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayAttribBindingLazy(GLuint vaobj,
+                                                         GLuint attribindex,
+                                                         GLuint bindingindex)
+{
+    return LoadLazy<PFNGLVERTEXARRAYATTRIBBINDINGPROC, 602>()(vaobj, attribindex, bindingindex);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayAttribFormatLazy(GLuint vaobj,
+                                                        GLuint attribindex,
+                                                        GLint size,
+                                                        GLenum type,
+                                                        GLboolean normalized,
+                                                        GLuint relativeoffset)
+{
+    return LoadLazy<PFNGLVERTEXARRAYATTRIBFORMATPROC, 603>()(vaobj, attribindex, size, type,
+                                                             normalized, relativeoffset);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayAttribIFormatLazy(GLuint vaobj,
+                                                         GLuint attribindex,
+                                                         GLint size,
+                                                         GLenum type,
+                                                         GLuint relativeoffset)
+{
+    return LoadLazy<PFNGLVERTEXARRAYATTRIBIFORMATPROC, 604>()(vaobj, attribindex, size, type,
+                                                              relativeoffset);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayAttribLFormatLazy(GLuint vaobj,
+                                                         GLuint attribindex,
+                                                         GLint size,
+                                                         GLenum type,
+                                                         GLuint relativeoffset)
+{
+    return LoadLazy<PFNGLVERTEXARRAYATTRIBLFORMATPROC, 605>()(vaobj, attribindex, size, type,
+                                                              relativeoffset);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayBindingDivisorLazy(GLuint vaobj,
+                                                          GLuint bindingindex,
+                                                          GLuint divisor)
+{
+    return LoadLazy<PFNGLVERTEXARRAYBINDINGDIVISORPROC, 606>()(vaobj, bindingindex, divisor);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayElementBufferLazy(GLuint vaobj, GLuint buffer)
+{
+    return LoadLazy<PFNGLVERTEXARRAYELEMENTBUFFERPROC, 607>()(vaobj, buffer);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayVertexBufferLazy(GLuint vaobj,
+                                                        GLuint bindingindex,
+                                                        GLuint buffer,
+                                                        GLintptr offset,
+                                                        GLsizei stride)
+{
+    return LoadLazy<PFNGLVERTEXARRAYVERTEXBUFFERPROC, 608>()(vaobj, bindingindex, buffer, offset,
+                                                             stride);
+}
+
+void INTERNAL_GL_APIENTRY glVertexArrayVertexBuffersLazy(GLuint vaobj,
+                                                         GLuint first,
+                                                         GLsizei count,
+                                                         const GLuint *buffers,
+                                                         const GLintptr *offsets,
+                                                         const GLsizei *strides)
+{
+    return LoadLazy<PFNGLVERTEXARRAYVERTEXBUFFERSPROC, 609>()(vaobj, first, count, buffers, offsets,
+                                                              strides);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib1dLazy(GLuint index, GLdouble x)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB1DPROC, 610>()(index, x);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib1dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB1DVPROC, 611>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib1fLazy(GLuint index, GLfloat x)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB1FPROC, 612>()(index, x);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib1fvLazy(GLuint index, const GLfloat *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB1FVPROC, 613>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib1sLazy(GLuint index, GLshort x)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB1SPROC, 614>()(index, x);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib1svLazy(GLuint index, const GLshort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB1SVPROC, 615>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib2dLazy(GLuint index, GLdouble x, GLdouble y)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB2DPROC, 616>()(index, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib2dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB2DVPROC, 617>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib2fLazy(GLuint index, GLfloat x, GLfloat y)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB2FPROC, 618>()(index, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib2fvLazy(GLuint index, const GLfloat *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB2FVPROC, 619>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib2sLazy(GLuint index, GLshort x, GLshort y)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB2SPROC, 620>()(index, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib2svLazy(GLuint index, const GLshort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB2SVPROC, 621>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib3dLazy(GLuint index, GLdouble x, GLdouble y, GLdouble z)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB3DPROC, 622>()(index, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib3dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB3DVPROC, 623>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib3fLazy(GLuint index, GLfloat x, GLfloat y, GLfloat z)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB3FPROC, 624>()(index, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib3fvLazy(GLuint index, const GLfloat *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB3FVPROC, 625>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib3sLazy(GLuint index, GLshort x, GLshort y, GLshort z)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB3SPROC, 626>()(index, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib3svLazy(GLuint index, const GLshort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB3SVPROC, 627>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4NbvLazy(GLuint index, const GLbyte *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NBVPROC, 628>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4NivLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NIVPROC, 629>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4NsvLazy(GLuint index, const GLshort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NSVPROC, 630>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glVertexAttrib4NubLazy(GLuint index, GLubyte x, GLubyte y, GLubyte z, GLubyte w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NUBPROC, 631>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4NubvLazy(GLuint index, const GLubyte *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NUBVPROC, 632>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4NuivLazy(GLuint index, const GLuint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NUIVPROC, 633>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4NusvLazy(GLuint index, const GLushort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4NUSVPROC, 634>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4bvLazy(GLuint index, const GLbyte *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4BVPROC, 635>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glVertexAttrib4dLazy(GLuint index, GLdouble x, GLdouble y, GLdouble z, GLdouble w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4DPROC, 636>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4DVPROC, 637>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glVertexAttrib4fLazy(GLuint index, GLfloat x, GLfloat y, GLfloat z, GLfloat w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4FPROC, 638>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4fvLazy(GLuint index, const GLfloat *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4FVPROC, 639>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4ivLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4IVPROC, 640>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glVertexAttrib4sLazy(GLuint index, GLshort x, GLshort y, GLshort z, GLshort w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4SPROC, 641>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4svLazy(GLuint index, const GLshort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4SVPROC, 642>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4ubvLazy(GLuint index, const GLubyte *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4UBVPROC, 643>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4uivLazy(GLuint index, const GLuint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4UIVPROC, 644>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttrib4usvLazy(GLuint index, const GLushort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIB4USVPROC, 645>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribBindingLazy(GLuint attribindex, GLuint bindingindex)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBBINDINGPROC, 646>()(attribindex, bindingindex);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribDivisorLazy(GLuint index, GLuint divisor)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBDIVISORPROC, 647>()(index, divisor);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribFormatLazy(GLuint attribindex,
+                                                   GLint size,
+                                                   GLenum type,
+                                                   GLboolean normalized,
+                                                   GLuint relativeoffset)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBFORMATPROC, 648>()(attribindex, size, type, normalized,
+                                                        relativeoffset);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI1iLazy(GLuint index, GLint x)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI1IPROC, 649>()(index, x);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI1ivLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI1IVPROC, 650>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI1uiLazy(GLuint index, GLuint x)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI1UIPROC, 651>()(index, x);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI1uivLazy(GLuint index, const GLuint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI1UIVPROC, 652>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI2iLazy(GLuint index, GLint x, GLint y)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI2IPROC, 653>()(index, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI2ivLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI2IVPROC, 654>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI2uiLazy(GLuint index, GLuint x, GLuint y)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI2UIPROC, 655>()(index, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI2uivLazy(GLuint index, const GLuint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI2UIVPROC, 656>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI3iLazy(GLuint index, GLint x, GLint y, GLint z)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI3IPROC, 657>()(index, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI3ivLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI3IVPROC, 658>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI3uiLazy(GLuint index, GLuint x, GLuint y, GLuint z)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI3UIPROC, 659>()(index, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI3uivLazy(GLuint index, const GLuint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI3UIVPROC, 660>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4bvLazy(GLuint index, const GLbyte *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4BVPROC, 661>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4iLazy(GLuint index, GLint x, GLint y, GLint z, GLint w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4IPROC, 662>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4ivLazy(GLuint index, const GLint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4IVPROC, 663>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4svLazy(GLuint index, const GLshort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4SVPROC, 664>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4ubvLazy(GLuint index, const GLubyte *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4UBVPROC, 665>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glVertexAttribI4uiLazy(GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4UIPROC, 666>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4uivLazy(GLuint index, const GLuint *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4UIVPROC, 667>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribI4usvLazy(GLuint index, const GLushort *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBI4USVPROC, 668>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribIFormatLazy(GLuint attribindex,
+                                                    GLint size,
+                                                    GLenum type,
+                                                    GLuint relativeoffset)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBIFORMATPROC, 669>()(attribindex, size, type, relativeoffset);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribIPointerLazy(GLuint index,
+                                                     GLint size,
+                                                     GLenum type,
+                                                     GLsizei stride,
+                                                     const void *pointer)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBIPOINTERPROC, 670>()(index, size, type, stride, pointer);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL1dLazy(GLuint index, GLdouble x)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL1DPROC, 671>()(index, x);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL1dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL1DVPROC, 672>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL2dLazy(GLuint index, GLdouble x, GLdouble y)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL2DPROC, 673>()(index, x, y);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL2dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL2DVPROC, 674>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL3dLazy(GLuint index, GLdouble x, GLdouble y, GLdouble z)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL3DPROC, 675>()(index, x, y, z);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL3dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL3DVPROC, 676>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glVertexAttribL4dLazy(GLuint index, GLdouble x, GLdouble y, GLdouble z, GLdouble w)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL4DPROC, 677>()(index, x, y, z, w);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribL4dvLazy(GLuint index, const GLdouble *v)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBL4DVPROC, 678>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribLFormatLazy(GLuint attribindex,
+                                                    GLint size,
+                                                    GLenum type,
+                                                    GLuint relativeoffset)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBLFORMATPROC, 679>()(attribindex, size, type, relativeoffset);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribLPointerLazy(GLuint index,
+                                                     GLint size,
+                                                     GLenum type,
+                                                     GLsizei stride,
+                                                     const void *pointer)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBLPOINTERPROC, 680>()(index, size, type, stride, pointer);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP1uiLazy(GLuint index,
+                                                 GLenum type,
+                                                 GLboolean normalized,
+                                                 GLuint value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP1UIPROC, 681>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP1uivLazy(GLuint index,
+                                                  GLenum type,
+                                                  GLboolean normalized,
+                                                  const GLuint *value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP1UIVPROC, 682>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP2uiLazy(GLuint index,
+                                                 GLenum type,
+                                                 GLboolean normalized,
+                                                 GLuint value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP2UIPROC, 683>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP2uivLazy(GLuint index,
+                                                  GLenum type,
+                                                  GLboolean normalized,
+                                                  const GLuint *value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP2UIVPROC, 684>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP3uiLazy(GLuint index,
+                                                 GLenum type,
+                                                 GLboolean normalized,
+                                                 GLuint value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP3UIPROC, 685>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP3uivLazy(GLuint index,
+                                                  GLenum type,
+                                                  GLboolean normalized,
+                                                  const GLuint *value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP3UIVPROC, 686>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP4uiLazy(GLuint index,
+                                                 GLenum type,
+                                                 GLboolean normalized,
+                                                 GLuint value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP4UIPROC, 687>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribP4uivLazy(GLuint index,
+                                                  GLenum type,
+                                                  GLboolean normalized,
+                                                  const GLuint *value)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBP4UIVPROC, 688>()(index, type, normalized, value);
+}
+
+void INTERNAL_GL_APIENTRY glVertexAttribPointerLazy(GLuint index,
+                                                    GLint size,
+                                                    GLenum type,
+                                                    GLboolean normalized,
+                                                    GLsizei stride,
+                                                    const void *pointer)
+{
+    return LoadLazy<PFNGLVERTEXATTRIBPOINTERPROC, 689>()(index, size, type, normalized, stride,
+                                                         pointer);
+}
+
+void INTERNAL_GL_APIENTRY glVertexBindingDivisorLazy(GLuint bindingindex, GLuint divisor)
+{
+    return LoadLazy<PFNGLVERTEXBINDINGDIVISORPROC, 690>()(bindingindex, divisor);
+}
+
+void INTERNAL_GL_APIENTRY glViewportLazy(GLint x, GLint y, GLsizei width, GLsizei height)
+{
+    return LoadLazy<PFNGLVIEWPORTPROC, 691>()(x, y, width, height);
+}
+
+void INTERNAL_GL_APIENTRY glViewportArrayvLazy(GLuint first, GLsizei count, const GLfloat *v)
+{
+    return LoadLazy<PFNGLVIEWPORTARRAYVPROC, 692>()(first, count, v);
+}
+
+void INTERNAL_GL_APIENTRY
+glViewportIndexedfLazy(GLuint index, GLfloat x, GLfloat y, GLfloat w, GLfloat h)
+{
+    return LoadLazy<PFNGLVIEWPORTINDEXEDFPROC, 693>()(index, x, y, w, h);
+}
+
+void INTERNAL_GL_APIENTRY glViewportIndexedfvLazy(GLuint index, const GLfloat *v)
+{
+    return LoadLazy<PFNGLVIEWPORTINDEXEDFVPROC, 694>()(index, v);
+}
+
+void INTERNAL_GL_APIENTRY glWaitSyncLazy(GLsync sync, GLbitfield flags, GLuint64 timeout)
+{
+    return LoadLazy<PFNGLWAITSYNCPROC, 695>()(sync, flags, timeout);
+}
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+}  // anonymous namespace
+
 DispatchTableGL::DispatchTableGL() = default;
 
+DispatchTableGL::~DispatchTableGL()
+{
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    std::lock_guard<std::mutex> lock(GetLazyTableMutex());
+    std::vector<DispatchTableGL *> &lazyTables = GetLazyTables();
+    auto iter = std::find(lazyTables.begin(), lazyTables.end(), this);
+    if (iter == lazyTables.end())
+    {
+        return;
+    }
+
+    lazyTables.erase(iter);
+    if (lazyTables.empty())
+    {
+        // No table points at the lazy entry points anymore, so they can load from another driver.
+        gLazyDriver = nullptr;
+        for (std::atomic<void *> &proc : gLazyProcs)
+        {
+            proc.store(nullptr, std::memory_order_relaxed);
+        }
+    }
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+}
+
+void DispatchTableGL::loadProcAddresses(const char *const *names, size_t count, void **procs) const
+{
+    for (size_t index = 0; index < count; ++index)
+    {
+        procs[index] = loadProcAddress(names[index]);
+    }
+}
+
+void DispatchTableGL::requestProc(ProcName name, void **proc, bool core)
+{
+    mRequestedProcs.push_back({proc, name, core});
+}
+
+void DispatchTableGL::loadRequestedProcs()
+{
+    // Load the first name requested for each function in one go.
+    std::vector<const char *> names;
+    std::vector<void **> procs;
+    std::vector<bool> loaded(mRequestedProcs.size(), false);
+    std::set<void **> requested;
+    for (size_t index = 0; index < mRequestedProcs.size(); ++index)
+    {
+        const RequestedProc &request = mRequestedProcs[index];
+        if (!*request.proc && requested.insert(request.proc).second)
+        {
+            names.push_back(kProcNames[static_cast<size_t>(request.name)]);
+            procs.push_back(request.proc);
+            loaded[index] = true;
+        }
+    }
+
+    std::vector<void *> results(names.size());
+    loadProcAddresses(names.data(), names.size(), results.data());
+    for (size_t index = 0; index < procs.size(); ++index)
+    {
+        *procs[index] = results[index];
+    }
+
+    // The driver didn't export some of the functions under their first name, try the others.
+    for (size_t index = 0; index < mRequestedProcs.size(); ++index)
+    {
+        const RequestedProc &request = mRequestedProcs[index];
+        if (!*request.proc && !loaded[index])
+        {
+            *request.proc = loadProcAddress(kProcNames[static_cast<size_t>(request.name)]);
+        }
+    }
+
+    mRequestedProcs.clear();
+    mRequestedProcs.shrink_to_fit();
+}
+
+void DispatchTableGL::saveProcs(Procs *procs) const
+{
+    SAVE_PROC(0, activeShaderProgram);
+    SAVE_PROC(1, activeTexture);
+    SAVE_PROC(2, attachShader);
+    SAVE_PROC(3, beginConditionalRender);
+    SAVE_PROC(4, beginQuery);
+    SAVE_PROC(5, beginQueryIndexed);
+    SAVE_PROC(6, beginTransformFeedback);
+    SAVE_PROC(7, bindAttribLocation);
+    SAVE_PROC(8, bindBuffer);
+    SAVE_PROC(9, bindBufferBase);
+    SAVE_PROC(10, bindBufferRange);
+    SAVE_PROC(11, bindBuffersBase);
+    SAVE_PROC(12, bindBuffersRange);
+    SAVE_PROC(13, bindFragDataLocation);
+    SAVE_PROC(14, bindFragDataLocationIndexed);
+    SAVE_PROC(15, bindFramebuffer);
+    SAVE_PROC(16, bindImageTexture);
+    SAVE_PROC(17, bindImageTextures);
+    SAVE_PROC(18, bindProgramPipeline);
+    SAVE_PROC(19, bindRenderbuffer);
+    SAVE_PROC(20, bindSampler);
+    SAVE_PROC(21, bindSamplers);
+    SAVE_PROC(22, bindTexture);
+    SAVE_PROC(23, bindTextureUnit);
+    SAVE_PROC(24, bindTextures);
+    SAVE_PROC(25, bindTransformFeedback);
+    SAVE_PROC(26, bindVertexArray);
+    SAVE_PROC(27, bindVertexBuffer);
+    SAVE_PROC(28, bindVertexBuffers);
+    SAVE_PROC(29, blendBarrier);
+    SAVE_PROC(30, blendColor);
+    SAVE_PROC(31, blendEquation);
+    SAVE_PROC(32, blendEquationSeparate);
+    SAVE_PROC(33, blendEquationSeparatei);
+    SAVE_PROC(34, blendEquationi);
+    SAVE_PROC(35, blendFunc);
+    SAVE_PROC(36, blendFuncSeparate);
+    SAVE_PROC(37, blendFuncSeparatei);
+    SAVE_PROC(38, blendFunci);
+    SAVE_PROC(39, blitFramebuffer);
+    SAVE_PROC(40, blitNamedFramebuffer);
+    SAVE_PROC(41, bufferData);
+    SAVE_PROC(42, bufferStorage);
+    SAVE_PROC(43, bufferSubData);
+    SAVE_PROC(44, checkFramebufferStatus);
+    SAVE_PROC(45, checkNamedFramebufferStatus);
+    SAVE_PROC(46, clampColor);
+    SAVE_PROC(47, clear);
+    SAVE_PROC(48, clearBufferData);
+    SAVE_PROC(49, clearBufferSubData);
+    SAVE_PROC(50, clearBufferfi);
+    SAVE_PROC(51, clearBufferfv);
+    SAVE_PROC(52, clearBufferiv);
+    SAVE_PROC(53, clearBufferuiv);
+    SAVE_PROC(54, clearColor);
+    SAVE_PROC(55, clearDepth);
+    SAVE_PROC(56, clearDepthf);
+    SAVE_PROC(57, clearNamedBufferData);
+    SAVE_PROC(58, clearNamedBufferSubData);
+    SAVE_PROC(59, clearNamedFramebufferfi);
+    SAVE_PROC(60, clearNamedFramebufferfv);
+    SAVE_PROC(61, clearNamedFramebufferiv);
+    SAVE_PROC(62, clearNamedFramebufferuiv);
+    SAVE_PROC(63, clearStencil);
+    SAVE_PROC(64, clearTexImage);
+    SAVE_PROC(65, clearTexSubImage);
+    SAVE_PROC(66, clientWaitSync);
+    SAVE_PROC(67, clipControl);
+    SAVE_PROC(68, colorMask);
+    SAVE_PROC(69, colorMaski);
+    SAVE_PROC(70, compileShader);
+    SAVE_PROC(71, compressedTexImage1D);
+    SAVE_PROC(72, compressedTexImage2D);
+    SAVE_PROC(73, compressedTexImage3D);
+    SAVE_PROC(74, compressedTexSubImage1D);
+    SAVE_PROC(75, compressedTexSubImage2D);
+    SAVE_PROC(76, compressedTexSubImage3D);
+    SAVE_PROC(77, compressedTextureSubImage1D);
+    SAVE_PROC(78, compressedTextureSubImage2D);
+    SAVE_PROC(79, compressedTextureSubImage3D);
+    SAVE_PROC(80, copyBufferSubData);
+    SAVE_PROC(81, copyImageSubData);
+    SAVE_PROC(82, copyNamedBufferSubData);
+    SAVE_PROC(83, copyTexImage1D);
+    SAVE_PROC(84, copyTexImage2D);
+    SAVE_PROC(85, copyTexSubImage1D);
+    SAVE_PROC(86, copyTexSubImage2D);
+    SAVE_PROC(87, copyTexSubImage3D);
+    SAVE_PROC(88, copyTextureSubImage1D);
+    SAVE_PROC(89, copyTextureSubImage2D);
+    SAVE_PROC(90, copyTextureSubImage3D);
+    SAVE_PROC(91, coverFillPathInstancedNV);
+    SAVE_PROC(92, coverFillPathNV);
+    SAVE_PROC(93, coverStrokePathInstancedNV);
+    SAVE_PROC(94, coverStrokePathNV);
+    SAVE_PROC(95, coverageModulationNV);
+    SAVE_PROC(96, createBuffers);
+    SAVE_PROC(97, createFramebuffers);
+    SAVE_PROC(98, createProgram);
+    SAVE_PROC(99, createProgramPipelines);
+    SAVE_PROC(100, createQueries);
+    SAVE_PROC(101, createRenderbuffers);
+    SAVE_PROC(102, createSamplers);
+    SAVE_PROC(103, createShader);
+    SAVE_PROC(104, createShaderProgramv);
+    SAVE_PROC(105, createTextures);
+    SAVE_PROC(106, createTransformFeedbacks);
+    SAVE_PROC(107, createVertexArrays);
+    SAVE_PROC(108, cullFace);
+    SAVE_PROC(109, debugMessageCallback);
+    SAVE_PROC(110, debugMessageControl);
+    SAVE_PROC(111, debugMessageInsert);
+    SAVE_PROC(112, deleteBuffers);
+    SAVE_PROC(113, deleteFencesNV);
+    SAVE_PROC(114, deleteFramebuffers);
+    SAVE_PROC(115, deletePathsNV);
+    SAVE_PROC(116, deleteProgram);
+    SAVE_PROC(117, deleteProgramPipelines);
+    SAVE_PROC(118, deleteQueries);
+    SAVE_PROC(119, deleteRenderbuffers);
+    SAVE_PROC(120, deleteSamplers);
+    SAVE_PROC(121, deleteShader);
+    SAVE_PROC(122, deleteSync);
+    SAVE_PROC(123, deleteTextures);
+    SAVE_PROC(124, deleteTransformFeedbacks);
+    SAVE_PROC(125, deleteVertexArrays);
+    SAVE_PROC(126, depthFunc);
+    SAVE_PROC(127, depthMask);
+    SAVE_PROC(128, depthRange);
+    SAVE_PROC(129, depthRangeArrayv);
+    SAVE_PROC(130, depthRangeIndexed);
+    SAVE_PROC(131, depthRangef);
+    SAVE_PROC(132, detachShader);
+    SAVE_PROC(133, disable);
+    SAVE_PROC(134, disableVertexArrayAttrib);
+    SAVE_PROC(135, disableVertexAttribArray);
+    SAVE_PROC(136, disablei);
+    SAVE_PROC(137, discardFramebufferEXT);
+    SAVE_PROC(138, dispatchCompute);
+    SAVE_PROC(139, dispatchComputeIndirect);
+    SAVE_PROC(140, drawArrays);
+    SAVE_PROC(141, drawArraysIndirect);
+    SAVE_PROC(142, drawArraysInstanced);
+    SAVE_PROC(143, drawArraysInstancedBaseInstance);
+    SAVE_PROC(144, drawBuffer);
+    SAVE_PROC(145, drawBuffers);
+    SAVE_PROC(146, drawElements);
+    SAVE_PROC(147, drawElementsBaseVertex);
+    SAVE_PROC(148, drawElementsIndirect);
+    SAVE_PROC(149, drawElementsInstanced);
+    SAVE_PROC(150, drawElementsInstancedBaseInstance);
+    SAVE_PROC(151, drawElementsInstancedBaseVertex);
+    SAVE_PROC(152, drawElementsInstancedBaseVertexBaseInstance);
+    SAVE_PROC(153, drawRangeElements);
+    SAVE_PROC(154, drawRangeElementsBaseVertex);
+    SAVE_PROC(155, drawTransformFeedback);
+    SAVE_PROC(156, drawTransformFeedbackInstanced);
+    SAVE_PROC(157, drawTransformFeedbackStream);
+    SAVE_PROC(158, drawTransformFeedbackStreamInstanced);
+    SAVE_PROC(159, eGLImageTargetRenderbufferStorageOES);
+    SAVE_PROC(160, eGLImageTargetTexture2DOES);
+    SAVE_PROC(161, enable);
+    SAVE_PROC(162, enableVertexArrayAttrib);
+    SAVE_PROC(163, enableVertexAttribArray);
+    SAVE_PROC(164, enablei);
+    SAVE_PROC(165, endConditionalRender);
+    SAVE_PROC(166, endQuery);
+    SAVE_PROC(167, endQueryIndexed);
+    SAVE_PROC(168, endTransformFeedback);
+    SAVE_PROC(169, fenceSync);
+    SAVE_PROC(170, finish);
+    SAVE_PROC(171, finishFenceNV);
+    SAVE_PROC(172, flush);
+    SAVE_PROC(173, flushMappedBufferRange);
+    SAVE_PROC(174, flushMappedNamedBufferRange);
+    SAVE_PROC(175, framebufferParameteri);
+    SAVE_PROC(176, framebufferRenderbuffer);
+    SAVE_PROC(177, framebufferTexture);
+    SAVE_PROC(178, framebufferTexture1D);
+    SAVE_PROC(179, framebufferTexture2D);
+    SAVE_PROC(180, framebufferTexture3D);
+    SAVE_PROC(181, framebufferTextureLayer);
+    SAVE_PROC(182, framebufferTextureMultiviewOVR);
+    SAVE_PROC(183, frontFace);
+    SAVE_PROC(184, genBuffers);
+    SAVE_PROC(185, genFencesNV);
+    SAVE_PROC(186, genFramebuffers);
+    SAVE_PROC(187, genPathsNV);
+    SAVE_PROC(188, genProgramPipelines);
+    SAVE_PROC(189, genQueries);
+    SAVE_PROC(190, genRenderbuffers);
+    SAVE_PROC(191, genSamplers);
+    SAVE_PROC(192, genTextures);
+    SAVE_PROC(193, genTransformFeedbacks);
+    SAVE_PROC(194, genVertexArrays);
+    SAVE_PROC(195, generateMipmap);
+    SAVE_PROC(196, generateTextureMipmap);
+    SAVE_PROC(197, getActiveAtomicCounterBufferiv);
+    SAVE_PROC(198, getActiveAttrib);
+    SAVE_PROC(199, getActiveSubroutineName);
+    SAVE_PROC(200, getActiveSubroutineUniformName);
+    SAVE_PROC(201, getActiveSubroutineUniformiv);
+    SAVE_PROC(202, getActiveUniform);
+    SAVE_PROC(203, getActiveUniformBlockName);
+    SAVE_PROC(204, getActiveUniformBlockiv);
+    SAVE_PROC(205, getActiveUniformName);
+    SAVE_PROC(206, getActiveUniformsiv);
+    SAVE_PROC(207, getAttachedShaders);
+    SAVE_PROC(208, getAttribLocation);
+    SAVE_PROC(209, getBooleani_v);
+    SAVE_PROC(210, getBooleanv);
+    SAVE_PROC(211, getBufferParameteri64v);
+    SAVE_PROC(212, getBufferParameteriv);
+    SAVE_PROC(213, getBufferPointerv);
+    SAVE_PROC(214, getBufferSubData);
+    SAVE_PROC(215, getCompressedTexImage);
+    SAVE_PROC(216, getCompressedTextureImage);
+    SAVE_PROC(217, getCompressedTextureSubImage);
+    SAVE_PROC(218, getDebugMessageLog);
+    SAVE_PROC(219, getDoublei_v);
+    SAVE_PROC(220, getDoublev);
+    SAVE_PROC(221, getError);
+    SAVE_PROC(222, getFenceivNV);
+    SAVE_PROC(223, getFloati_v);
+    SAVE_PROC(224, getFloatv);
+    SAVE_PROC(225, getFragDataIndex);
+    SAVE_PROC(226, getFragDataLocation);
+    SAVE_PROC(227, getFramebufferAttachmentParameteriv);
+    SAVE_PROC(228, getFramebufferParameteriv);
+    SAVE_PROC(229, getGraphicsResetStatus);
+    SAVE_PROC(230, getInteger64i_v);
+    SAVE_PROC(231, getInteger64v);
+    SAVE_PROC(232, getIntegeri_v);
+    SAVE_PROC(233, getIntegerv);
+    SAVE_PROC(234, getInternalformatSampleivNV);
+    SAVE_PROC(235, getInternalformati64v);
+    SAVE_PROC(236, getInternalformativ);
+    SAVE_PROC(237, getMultisamplefv);
+    SAVE_PROC(238, getNamedBufferParameteri64v);
+    SAVE_PROC(239, getNamedBufferParameteriv);
+    SAVE_PROC(240, getNamedBufferPointerv);
+    SAVE_PROC(241, getNamedBufferSubData);
+    SAVE_PROC(242, getNamedFramebufferAttachmentParameteriv);
+    SAVE_PROC(243, getNamedFramebufferParameteriv);
+    SAVE_PROC(244, getNamedRenderbufferParameteriv);
+    SAVE_PROC(245, getObjectLabel);
+    SAVE_PROC(246, getObjectPtrLabel);
+    SAVE_PROC(247, getPathParameterfvNV);
+    SAVE_PROC(248, getPathParameterivNV);
+    SAVE_PROC(249, getPointerv);
+    SAVE_PROC(250, getProgramBinary);
+    SAVE_PROC(251, getProgramInfoLog);
+    SAVE_PROC(252, getProgramInterfaceiv);
+    SAVE_PROC(253, getProgramPipelineInfoLog);
+    SAVE_PROC(254, getProgramPipelineiv);
+    SAVE_PROC(255, getProgramResourceIndex);
+    SAVE_PROC(256, getProgramResourceLocation);
+    SAVE_PROC(257, getProgramResourceLocationIndex);
+    SAVE_PROC(258, getProgramResourceName);
+    SAVE_PROC(259, getProgramResourceiv);
+    SAVE_PROC(260, getProgramStageiv);
+    SAVE_PROC(261, getProgramiv);
+    SAVE_PROC(262, getQueryBufferObjecti64v);
+    SAVE_PROC(263, getQueryBufferObjectiv);
+    SAVE_PROC(264, getQueryBufferObjectui64v);
+    SAVE_PROC(265, getQueryBufferObjectuiv);
+    SAVE_PROC(266, getQueryIndexediv);
+    SAVE_PROC(267, getQueryObjecti64v);
+    SAVE_PROC(268, getQueryObjectiv);
+    SAVE_PROC(269, getQueryObjectui64v);
+    SAVE_PROC(270, getQueryObjectuiv);
+    SAVE_PROC(271, getQueryiv);
+    SAVE_PROC(272, getRenderbufferParameteriv);
+    SAVE_PROC(273, getSamplerParameterIiv);
+    SAVE_PROC(274, getSamplerParameterIuiv);
+    SAVE_PROC(275, getSamplerParameterfv);
+    SAVE_PROC(276, getSamplerParameteriv);
+    SAVE_PROC(277, getShaderInfoLog);
+    SAVE_PROC(278, getShaderPrecisionFormat);
+    SAVE_PROC(279, getShaderSource);
+    SAVE_PROC(280, getShaderiv);
+    SAVE_PROC(281, getString);
+    SAVE_PROC(282, getStringi);
+    SAVE_PROC(283, getSubroutineIndex);
+    SAVE_PROC(284, getSubroutineUniformLocation);
+    SAVE_PROC(285, getSynciv);
+    SAVE_PROC(286, getTexImage);
+    SAVE_PROC(287, getTexLevelParameterfv);
+    SAVE_PROC(288, getTexLevelParameteriv);
+    SAVE_PROC(289, getTexParameterIiv);
+    SAVE_PROC(290, getTexParameterIuiv);
+    SAVE_PROC(291, getTexParameterfv);
+    SAVE_PROC(292, getTexParameteriv);
+    SAVE_PROC(293, getTextureImage);
+    SAVE_PROC(294, getTextureLevelParameterfv);
+    SAVE_PROC(295, getTextureLevelParameteriv);
+    SAVE_PROC(296, getTextureParameterIiv);
+    SAVE_PROC(297, getTextureParameterIuiv);
+    SAVE_PROC(298, getTextureParameterfv);
+    SAVE_PROC(299, getTextureParameteriv);
+    SAVE_PROC(300, getTextureSubImage);
+    SAVE_PROC(301, getTransformFeedbackVarying);
+    SAVE_PROC(302, getTransformFeedbacki64_v);
+    SAVE_PROC(303, getTransformFeedbacki_v);
+    SAVE_PROC(304, getTransformFeedbackiv);
+    SAVE_PROC(305, getUniformBlockIndex);
+    SAVE_PROC(306, getUniformIndices);
+    SAVE_PROC(307, getUniformLocation);
+    SAVE_PROC(308, getUniformSubroutineuiv);
+    SAVE_PROC(309, getUniformdv);
+    SAVE_PROC(310, getUniformfv);
+    SAVE_PROC(311, getUniformiv);
+    SAVE_PROC(312, getUniformuiv);
+    SAVE_PROC(313, getVertexArrayIndexed64iv);
+    SAVE_PROC(314, getVertexArrayIndexediv);
+    SAVE_PROC(315, getVertexArrayiv);
+    SAVE_PROC(316, getVertexAttribIiv);
+    SAVE_PROC(317, getVertexAttribIuiv);
+    SAVE_PROC(318, getVertexAttribLdv);
+    SAVE_PROC(319, getVertexAttribPointerv);
+    SAVE_PROC(320, getVertexAttribdv);
+    SAVE_PROC(321, getVertexAttribfv);
+    SAVE_PROC(322, getVertexAttribiv);
+    SAVE_PROC(323, getnCompressedTexImage);
+    SAVE_PROC(324, getnTexImage);
+    SAVE_PROC(325, getnUniformdv);
+    SAVE_PROC(326, getnUniformfv);
+    SAVE_PROC(327, getnUniformiv);
+    SAVE_PROC(328, getnUniformuiv);
+    SAVE_PROC(329, hint);
+    SAVE_PROC(330, insertEventMarkerEXT);
+    SAVE_PROC(331, invalidateBufferData);
+    SAVE_PROC(332, invalidateBufferSubData);
+    SAVE_PROC(333, invalidateFramebuffer);
+    SAVE_PROC(334, invalidateNamedFramebufferData);
+    SAVE_PROC(335, invalidateNamedFramebufferSubData);
+    SAVE_PROC(336, invalidateSubFramebuffer);
+    SAVE_PROC(337, invalidateTexImage);
+    SAVE_PROC(338, invalidateTexSubImage);
+    SAVE_PROC(339, isBuffer);
+    SAVE_PROC(340, isEnabled);
+    SAVE_PROC(341, isEnabledi);
+    SAVE_PROC(342, isFenceNV);
+    SAVE_PROC(343, isFramebuffer);
+    SAVE_PROC(344, isPathNV);
+    SAVE_PROC(345, isProgram);
+    SAVE_PROC(346, isProgramPipeline);
+    SAVE_PROC(347, isQuery);
+    SAVE_PROC(348, isRenderbuffer);
+    SAVE_PROC(349, isSampler);
+    SAVE_PROC(350, isShader);
+    SAVE_PROC(351, isSync);
+    SAVE_PROC(352, isTexture);
+    SAVE_PROC(353, isTransformFeedback);
+    SAVE_PROC(354, isVertexArray);
+    SAVE_PROC(355, lineWidth);
+    SAVE_PROC(356, linkProgram);
+    SAVE_PROC(357, logicOp);
+    SAVE_PROC(358, mapBuffer);
+    SAVE_PROC(359, mapBufferRange);
+    SAVE_PROC(360, mapNamedBuffer);
+    SAVE_PROC(361, mapNamedBufferRange);
+    SAVE_PROC(362, matrixLoadfEXT);
+    SAVE_PROC(363, maxShaderCompilerThreadsARB);
+    SAVE_PROC(364, maxShaderCompilerThreadsKHR);
+    SAVE_PROC(365, memoryBarrier);
+    SAVE_PROC(366, memoryBarrierByRegion);
+    SAVE_PROC(367, minSampleShading);
+    SAVE_PROC(368, multiDrawArrays);
+    SAVE_PROC(369, multiDrawArraysIndirect);
+    SAVE_PROC(370, multiDrawElements);
+    SAVE_PROC(371, multiDrawElementsBaseVertex);
+    SAVE_PROC(372, multiDrawElementsIndirect);
+    SAVE_PROC(373, namedBufferData);
+    SAVE_PROC(374, namedBufferStorage);
+    SAVE_PROC(375, namedBufferSubData);
+    SAVE_PROC(376, namedFramebufferDrawBuffer);
+    SAVE_PROC(377, namedFramebufferDrawBuffers);
+    SAVE_PROC(378, namedFramebufferParameteri);
+    SAVE_PROC(379, namedFramebufferReadBuffer);
+    SAVE_PROC(380, namedFramebufferRenderbuffer);
+    SAVE_PROC(381, namedFramebufferTexture);
+    SAVE_PROC(382, namedFramebufferTextureLayer);
+    SAVE_PROC(383, namedRenderbufferStorage);
+    SAVE_PROC(384, namedRenderbufferStorageMultisample);
+    SAVE_PROC(385, objectLabel);
+    SAVE_PROC(386, objectPtrLabel);
+    SAVE_PROC(387, patchParameterfv);
+    SAVE_PROC(388, patchParameteri);
+    SAVE_PROC(389, pathCommandsNV);
+    SAVE_PROC(390, pathParameterfNV);
+    SAVE_PROC(391, pathParameteriNV);
+    SAVE_PROC(392, pathStencilFuncNV);
+    SAVE_PROC(393, pauseTransformFeedback);
+    SAVE_PROC(394, pixelStoref);
+    SAVE_PROC(395, pixelStorei);
+    SAVE_PROC(396, pointParameterf);
+    SAVE_PROC(397, pointParameterfv);
+    SAVE_PROC(398, pointParameteri);
+    SAVE_PROC(399, pointParameteriv);
+    SAVE_PROC(400, pointSize);
+    SAVE_PROC(401, polygonMode);
+    SAVE_PROC(402, polygonOffset);
+    SAVE_PROC(403, popDebugGroup);
+    SAVE_PROC(404, popGroupMarkerEXT);
+    SAVE_PROC(405, primitiveBoundingBox);
+    SAVE_PROC(406, primitiveRestartIndex);
+    SAVE_PROC(407, programBinary);
+    SAVE_PROC(408, programParameteri);
+    SAVE_PROC(409, programPathFragmentInputGenNV);
+    SAVE_PROC(410, programUniform1d);
+    SAVE_PROC(411, programUniform1dv);
+    SAVE_PROC(412, programUniform1f);
+    SAVE_PROC(413, programUniform1fv);
+    SAVE_PROC(414, programUniform1i);
+    SAVE_PROC(415, programUniform1iv);
+    SAVE_PROC(416, programUniform1ui);
+    SAVE_PROC(417, programUniform1uiv);
+    SAVE_PROC(418, programUniform2d);
+    SAVE_PROC(419, programUniform2dv);
+    SAVE_PROC(420, programUniform2f);
+    SAVE_PROC(421, programUniform2fv);
+    SAVE_PROC(422, programUniform2i);
+    SAVE_PROC(423, programUniform2iv);
+    SAVE_PROC(424, programUniform2ui);
+    SAVE_PROC(425, programUniform2uiv);
+    SAVE_PROC(426, programUniform3d);
+    SAVE_PROC(427, programUniform3dv);
+    SAVE_PROC(428, programUniform3f);
+    SAVE_PROC(429, programUniform3fv);
+    SAVE_PROC(430, programUniform3i);
+    SAVE_PROC(431, programUniform3iv);
+    SAVE_PROC(432, programUniform3ui);
+    SAVE_PROC(433, programUniform3uiv);
+    SAVE_PROC(434, programUniform4d);
+    SAVE_PROC(435, programUniform4dv);
+    SAVE_PROC(436, programUniform4f);
+    SAVE_PROC(437, programUniform4fv);
+    SAVE_PROC(438, programUniform4i);
+    SAVE_PROC(439, programUniform4iv);
+    SAVE_PROC(440, programUniform4ui);
+    SAVE_PROC(441, programUniform4uiv);
+    SAVE_PROC(442, programUniformMatrix2dv);
+    SAVE_PROC(443, programUniformMatrix2fv);
+    SAVE_PROC(444, programUniformMatrix2x3dv);
+    SAVE_PROC(445, programUniformMatrix2x3fv);
+    SAVE_PROC(446, programUniformMatrix2x4dv);
+    SAVE_PROC(447, programUniformMatrix2x4fv);
+    SAVE_PROC(448, programUniformMatrix3dv);
+    SAVE_PROC(449, programUniformMatrix3fv);
+    SAVE_PROC(450, programUniformMatrix3x2dv);
+    SAVE_PROC(451, programUniformMatrix3x2fv);
+    SAVE_PROC(452, programUniformMatrix3x4dv);
+    SAVE_PROC(453, programUniformMatrix3x4fv);
+    SAVE_PROC(454, programUniformMatrix4dv);
+    SAVE_PROC(455, programUniformMatrix4fv);
+    SAVE_PROC(456, programUniformMatrix4x2dv);
+    SAVE_PROC(457, programUniformMatrix4x2fv);
+    SAVE_PROC(458, programUniformMatrix4x3dv);
+    SAVE_PROC(459, programUniformMatrix4x3fv);
+    SAVE_PROC(460, provokingVertex);
+    SAVE_PROC(461, pushDebugGroup);
+    SAVE_PROC(462, pushGroupMarkerEXT);
+    SAVE_PROC(463, queryCounter);
+    SAVE_PROC(464, readBuffer);
+    SAVE_PROC(465, readPixels);
+    SAVE_PROC(466, readnPixels);
+    SAVE_PROC(467, releaseShaderCompiler);
+    SAVE_PROC(468, renderbufferStorage);
+    SAVE_PROC(469, renderbufferStorageMultisample);
+    SAVE_PROC(470, resumeTransformFeedback);
+    SAVE_PROC(471, sampleCoverage);
+    SAVE_PROC(472, sampleMaski);
+    SAVE_PROC(473, samplerParameterIiv);
+    SAVE_PROC(474, samplerParameterIuiv);
+    SAVE_PROC(475, samplerParameterf);
+    SAVE_PROC(476, samplerParameterfv);
+    SAVE_PROC(477, samplerParameteri);
+    SAVE_PROC(478, samplerParameteriv);
+    SAVE_PROC(479, scissor);
+    SAVE_PROC(480, scissorArrayv);
+    SAVE_PROC(481, scissorIndexed);
+    SAVE_PROC(482, scissorIndexedv);
+    SAVE_PROC(483, setFenceNV);
+    SAVE_PROC(484, shaderBinary);
+    SAVE_PROC(485, shaderSource);
+    SAVE_PROC(486, shaderStorageBlockBinding);
+    SAVE_PROC(487, stencilFillPathInstancedNV);
+    SAVE_PROC(488, stencilFillPathNV);
+    SAVE_PROC(489, stencilFunc);
+    SAVE_PROC(490, stencilFuncSeparate);
+    SAVE_PROC(491, stencilMask);
+    SAVE_PROC(492, stencilMaskSeparate);
+    SAVE_PROC(493, stencilOp);
+    SAVE_PROC(494, stencilOpSeparate);
+    SAVE_PROC(495, stencilStrokePathInstancedNV);
+    SAVE_PROC(496, stencilStrokePathNV);
+    SAVE_PROC(497, stencilThenCoverFillPathInstancedNV);
+    SAVE_PROC(498, stencilThenCoverFillPathNV);
+    SAVE_PROC(499, stencilThenCoverStrokePathInstancedNV);
+    SAVE_PROC(500, stencilThenCoverStrokePathNV);
+    SAVE_PROC(501, testFenceNV);
+    SAVE_PROC(502, texBuffer);
+    SAVE_PROC(503, texBufferRange);
+    SAVE_PROC(504, texImage1D);
+    SAVE_PROC(505, texImage2D);
+    SAVE_PROC(506, texImage2DMultisample);
+    SAVE_PROC(507, texImage3D);
+    SAVE_PROC(508, texImage3DMultisample);
+    SAVE_PROC(509, texParameterIiv);
+    SAVE_PROC(510, texParameterIuiv);
+    SAVE_PROC(511, texParameterf);
+    SAVE_PROC(512, texParameterfv);
+    SAVE_PROC(513, texParameteri);
+    SAVE_PROC(514, texParameteriv);
+    SAVE_PROC(515, texStorage1D);
+    SAVE_PROC(516, texStorage2D);
+    SAVE_PROC(517, texStorage2DMultisample);
+    SAVE_PROC(518, texStorage3D);
+    SAVE_PROC(519, texStorage3DMultisample);
+    SAVE_PROC(520, texSubImage1D);
+    SAVE_PROC(521, texSubImage2D);
+    SAVE_PROC(522, texSubImage3D);
+    SAVE_PROC(523, textureBarrier);
+    SAVE_PROC(524, textureBuffer);
+    SAVE_PROC(525, textureBufferRange);
+    SAVE_PROC(526, textureParameterIiv);
+    SAVE_PROC(527, textureParameterIuiv);
+    SAVE_PROC(528, textureParameterf);
+    SAVE_PROC(529, textureParameterfv);
+    SAVE_PROC(530, textureParameteri);
+    SAVE_PROC(531, textureParameteriv);
+    SAVE_PROC(532, textureStorage1D);
+    SAVE_PROC(533, textureStorage2D);
+    SAVE_PROC(534, textureStorage2DMultisample);
+    SAVE_PROC(535, textureStorage3D);
+    SAVE_PROC(536, textureStorage3DMultisample);
+    SAVE_PROC(537, textureSubImage1D);
+    SAVE_PROC(538, textureSubImage2D);
+    SAVE_PROC(539, textureSubImage3D);
+    SAVE_PROC(540, textureView);
+    SAVE_PROC(541, transformFeedbackBufferBase);
+    SAVE_PROC(542, transformFeedbackBufferRange);
+    SAVE_PROC(543, transformFeedbackVaryings);
+    SAVE_PROC(544, uniform1d);
+    SAVE_PROC(545, uniform1dv);
+    SAVE_PROC(546, uniform1f);
+    SAVE_PROC(547, uniform1fv);
+    SAVE_PROC(548, uniform1i);
+    SAVE_PROC(549, uniform1iv);
+    SAVE_PROC(550, uniform1ui);
+    SAVE_PROC(551, uniform1uiv);
+    SAVE_PROC(552, uniform2d);
+    SAVE_PROC(553, uniform2dv);
+    SAVE_PROC(554, uniform2f);
+    SAVE_PROC(555, uniform2fv);
+    SAVE_PROC(556, uniform2i);
+    SAVE_PROC(557, uniform2iv);
+    SAVE_PROC(558, uniform2ui);
+    SAVE_PROC(559, uniform2uiv);
+    SAVE_PROC(560, uniform3d);
+    SAVE_PROC(561, uniform3dv);
+    SAVE_PROC(562, uniform3f);
+    SAVE_PROC(563, uniform3fv);
+    SAVE_PROC(564, uniform3i);
+    SAVE_PROC(565, uniform3iv);
+    SAVE_PROC(566, uniform3ui);
+    SAVE_PROC(567, uniform3uiv);
+    SAVE_PROC(568, uniform4d);
+    SAVE_PROC(569, uniform4dv);
+    SAVE_PROC(570, uniform4f);
+    SAVE_PROC(571, uniform4fv);
+    SAVE_PROC(572, uniform4i);
+    SAVE_PROC(573, uniform4iv);
+    SAVE_PROC(574, uniform4ui);
+    SAVE_PROC(575, uniform4uiv);
+    SAVE_PROC(576, uniformBlockBinding);
+    SAVE_PROC(577, uniformMatrix2dv);
+    SAVE_PROC(578, uniformMatrix2fv);
+    SAVE_PROC(579, uniformMatrix2x3dv);
+    SAVE_PROC(580, uniformMatrix2x3fv);
+    SAVE_PROC(581, uniformMatrix2x4dv);
+    SAVE_PROC(582, uniformMatrix2x4fv);
+    SAVE_PROC(583, uniformMatrix3dv);
+    SAVE_PROC(584, uniformMatrix3fv);
+    SAVE_PROC(585, uniformMatrix3x2dv);
+    SAVE_PROC(586, uniformMatrix3x2fv);
+    SAVE_PROC(587, uniformMatrix3x4dv);
+    SAVE_PROC(588, uniformMatrix3x4fv);
+    SAVE_PROC(589, uniformMatrix4dv);
+    SAVE_PROC(590, uniformMatrix4fv);
+    SAVE_PROC(591, uniformMatrix4x2dv);
+    SAVE_PROC(592, uniformMatrix4x2fv);
+    SAVE_PROC(593, uniformMatrix4x3dv);
+    SAVE_PROC(594, uniformMatrix4x3fv);
+    SAVE_PROC(595, uniformSubroutinesuiv);
+    SAVE_PROC(596, unmapBuffer);
+    SAVE_PROC(597, unmapNamedBuffer);
+    SAVE_PROC(598, useProgram);
+    SAVE_PROC(599, useProgramStages);
+    SAVE_PROC(600, validateProgram);
+    SAVE_PROC(601, validateProgramPipeline);
+    SAVE_PROC(602, vertexArrayAttribBinding);
+    SAVE_PROC(603, vertexArrayAttribFormat);
+    SAVE_PROC(604, vertexArrayAttribIFormat);
+    SAVE_PROC(605, vertexArrayAttribLFormat);
+    SAVE_PROC(606, vertexArrayBindingDivisor);
+    SAVE_PROC(607, vertexArrayElementBuffer);
+    SAVE_PROC(608, vertexArrayVertexBuffer);
+    SAVE_PROC(609, vertexArrayVertexBuffers);
+    SAVE_PROC(610, vertexAttrib1d);
+    SAVE_PROC(611, vertexAttrib1dv);
+    SAVE_PROC(612, vertexAttrib1f);
+    SAVE_PROC(613, vertexAttrib1fv);
+    SAVE_PROC(614, vertexAttrib1s);
+    SAVE_PROC(615, vertexAttrib1sv);
+    SAVE_PROC(616, vertexAttrib2d);
+    SAVE_PROC(617, vertexAttrib2dv);
+    SAVE_PROC(618, vertexAttrib2f);
+    SAVE_PROC(619, vertexAttrib2fv);
+    SAVE_PROC(620, vertexAttrib2s);
+    SAVE_PROC(621, vertexAttrib2sv);
+    SAVE_PROC(622, vertexAttrib3d);
+    SAVE_PROC(623, vertexAttrib3dv);
+    SAVE_PROC(624, vertexAttrib3f);
+    SAVE_PROC(625, vertexAttrib3fv);
+    SAVE_PROC(626, vertexAttrib3s);
+    SAVE_PROC(627, vertexAttrib3sv);
+    SAVE_PROC(628, vertexAttrib4Nbv);
+    SAVE_PROC(629, vertexAttrib4Niv);
+    SAVE_PROC(630, vertexAttrib4Nsv);
+    SAVE_PROC(631, vertexAttrib4Nub);
+    SAVE_PROC(632, vertexAttrib4Nubv);
+    SAVE_PROC(633, vertexAttrib4Nuiv);
+    SAVE_PROC(634, vertexAttrib4Nusv);
+    SAVE_PROC(635, vertexAttrib4bv);
+    SAVE_PROC(636, vertexAttrib4d);
+    SAVE_PROC(637, vertexAttrib4dv);
+    SAVE_PROC(638, vertexAttrib4f);
+    SAVE_PROC(639, vertexAttrib4fv);
+    SAVE_PROC(640, vertexAttrib4iv);
+    SAVE_PROC(641, vertexAttrib4s);
+    SAVE_PROC(642, vertexAttrib4sv);
+    SAVE_PROC(643, vertexAttrib4ubv);
+    SAVE_PROC(644, vertexAttrib4uiv);
+    SAVE_PROC(645, vertexAttrib4usv);
+    SAVE_PROC(646, vertexAttribBinding);
+    SAVE_PROC(647, vertexAttribDivisor);
+    SAVE_PROC(648, vertexAttribFormat);
+    SAVE_PROC(649, vertexAttribI1i);
+    SAVE_PROC(650, vertexAttribI1iv);
+    SAVE_PROC(651, vertexAttribI1ui);
+    SAVE_PROC(652, vertexAttribI1uiv);
+    SAVE_PROC(653, vertexAttribI2i);
+    SAVE_PROC(654, vertexAttribI2iv);
+    SAVE_PROC(655, vertexAttribI2ui);
+    SAVE_PROC(656, vertexAttribI2uiv);
+    SAVE_PROC(657, vertexAttribI3i);
+    SAVE_PROC(658, vertexAttribI3iv);
+    SAVE_PROC(659, vertexAttribI3ui);
+    SAVE_PROC(660, vertexAttribI3uiv);
+    SAVE_PROC(661, vertexAttribI4bv);
+    SAVE_PROC(662, vertexAttribI4i);
+    SAVE_PROC(663, vertexAttribI4iv);
+    SAVE_PROC(664, vertexAttribI4sv);
+    SAVE_PROC(665, vertexAttribI4ubv);
+    SAVE_PROC(666, vertexAttribI4ui);
+    SAVE_PROC(667, vertexAttribI4uiv);
+    SAVE_PROC(668, vertexAttribI4usv);
+    SAVE_PROC(669, vertexAttribIFormat);
+    SAVE_PROC(670, vertexAttribIPointer);
+    SAVE_PROC(671, vertexAttribL1d);
+    SAVE_PROC(672, vertexAttribL1dv);
+    SAVE_PROC(673, vertexAttribL2d);
+    SAVE_PROC(674, vertexAttribL2dv);
+    SAVE_PROC(675, vertexAttribL3d);
+    SAVE_PROC(676, vertexAttribL3dv);
+    SAVE_PROC(677, vertexAttribL4d);
+    SAVE_PROC(678, vertexAttribL4dv);
+    SAVE_PROC(679, vertexAttribLFormat);
+    SAVE_PROC(680, vertexAttribLPointer);
+    SAVE_PROC(681, vertexAttribP1ui);
+    SAVE_PROC(682, vertexAttribP1uiv);
+    SAVE_PROC(683, vertexAttribP2ui);
+    SAVE_PROC(684, vertexAttribP2uiv);
+    SAVE_PROC(685, vertexAttribP3ui);
+    SAVE_PROC(686, vertexAttribP3uiv);
+    SAVE_PROC(687, vertexAttribP4ui);
+    SAVE_PROC(688, vertexAttribP4uiv);
+    SAVE_PROC(689, vertexAttribPointer);
+    SAVE_PROC(690, vertexBindingDivisor);
+    SAVE_PROC(691, viewport);
+    SAVE_PROC(692, viewportArrayv);
+    SAVE_PROC(693, viewportIndexedf);
+    SAVE_PROC(694, viewportIndexedfv);
+    SAVE_PROC(695, waitSync);
+}
+
+void DispatchTableGL::restoreProcs(const Procs &procs)
+{
+    RESTORE_PROC(0, activeShaderProgram);
+    RESTORE_PROC(1, activeTexture);
+    RESTORE_PROC(2, attachShader);
+    RESTORE_PROC(3, beginConditionalRender);
+    RESTORE_PROC(4, beginQuery);
+    RESTORE_PROC(5, beginQueryIndexed);
+    RESTORE_PROC(6, beginTransformFeedback);
+    RESTORE_PROC(7, bindAttribLocation);
+    RESTORE_PROC(8, bindBuffer);
+    RESTORE_PROC(9, bindBufferBase);
+    RESTORE_PROC(10, bindBufferRange);
+    RESTORE_PROC(11, bindBuffersBase);
+    RESTORE_PROC(12, bindBuffersRange);
+    RESTORE_PROC(13, bindFragDataLocation);
+    RESTORE_PROC(14, bindFragDataLocationIndexed);
+    RESTORE_PROC(15, bindFramebuffer);
+    RESTORE_PROC(16, bindImageTexture);
+    RESTORE_PROC(17, bindImageTextures);
+    RESTORE_PROC(18, bindProgramPipeline);
+    RESTORE_PROC(19, bindRenderbuffer);
+    RESTORE_PROC(20, bindSampler);
+    RESTORE_PROC(21, bindSamplers);
+    RESTORE_PROC(22, bindTexture);
+    RESTORE_PROC(23, bindTextureUnit);
+    RESTORE_PROC(24, bindTextures);
+    RESTORE_PROC(25, bindTransformFeedback);
+    RESTORE_PROC(26, bindVertexArray);
+    RESTORE_PROC(27, bindVertexBuffer);
+    RESTORE_PROC(28, bindVertexBuffers);
+    RESTORE_PROC(29, blendBarrier);
+    RESTORE_PROC(30, blendColor);
+    RESTORE_PROC(31, blendEquation);
+    RESTORE_PROC(32, blendEquationSeparate);
+    RESTORE_PROC(33, blendEquationSeparatei);
+    RESTORE_PROC(34, blendEquationi);
+    RESTORE_PROC(35, blendFunc);
+    RESTORE_PROC(36, blendFuncSeparate);
+    RESTORE_PROC(37, blendFuncSeparatei);
+    RESTORE_PROC(38, blendFunci);
+    RESTORE_PROC(39, blitFramebuffer);
+    RESTORE_PROC(40, blitNamedFramebuffer);
+    RESTORE_PROC(41, bufferData);
+    RESTORE_PROC(42, bufferStorage);
+    RESTORE_PROC(43, bufferSubData);
+    RESTORE_PROC(44, checkFramebufferStatus);
+    RESTORE_PROC(45, checkNamedFramebufferStatus);
+    RESTORE_PROC(46, clampColor);
+    RESTORE_PROC(47, clear);
+    RESTORE_PROC(48, clearBufferData);
+    RESTORE_PROC(49, clearBufferSubData);
+    RESTORE_PROC(50, clearBufferfi);
+    RESTORE_PROC(51, clearBufferfv);
+    RESTORE_PROC(52, clearBufferiv);
+    RESTORE_PROC(53, clearBufferuiv);
+    RESTORE_PROC(54, clearColor);
+    RESTORE_PROC(55, clearDepth);
+    RESTORE_PROC(56, clearDepthf);
+    RESTORE_PROC(57, clearNamedBufferData);
+    RESTORE_PROC(58, clearNamedBufferSubData);
+    RESTORE_PROC(59, clearNamedFramebufferfi);
+    RESTORE_PROC(60, clearNamedFramebufferfv);
+    RESTORE_PROC(61, clearNamedFramebufferiv);
+    RESTORE_PROC(62, clearNamedFramebufferuiv);
+    RESTORE_PROC(63, clearStencil);
+    RESTORE_PROC(64, clearTexImage);
+    RESTORE_PROC(65, clearTexSubImage);
+    RESTORE_PROC(66, clientWaitSync);
+    RESTORE_PROC(67, clipControl);
+    RESTORE_PROC(68, colorMask);
+    RESTORE_PROC(69, colorMaski);
+    RESTORE_PROC(70, compileShader);
+    RESTORE_PROC(71, compressedTexImage1D);
+    RESTORE_PROC(72, compressedTexImage2D);
+    RESTORE_PROC(73, compressedTexImage3D);
+    RESTORE_PROC(74, compressedTexSubImage1D);
+    RESTORE_PROC(75, compressedTexSubImage2D);
+    RESTORE_PROC(76, compressedTexSubImage3D);
+    RESTORE_PROC(77, compressedTextureSubImage1D);
+    RESTORE_PROC(78, compressedTextureSubImage2D);
+    RESTORE_PROC(79, compressedTextureSubImage3D);
+    RESTORE_PROC(80, copyBufferSubData);
+    RESTORE_PROC(81, copyImageSubData);
+    RESTORE_PROC(82, copyNamedBufferSubData);
+    RESTORE_PROC(83, copyTexImage1D);
+    RESTORE_PROC(84, copyTexImage2D);
+    RESTORE_PROC(85, copyTexSubImage1D);
+    RESTORE_PROC(86, copyTexSubImage2D);
+    RESTORE_PROC(87, copyTexSubImage3D);
+    RESTORE_PROC(88, copyTextureSubImage1D);
+    RESTORE_PROC(89, copyTextureSubImage2D);
+    RESTORE_PROC(90, copyTextureSubImage3D);
+    RESTORE_PROC(91, coverFillPathInstancedNV);
+    RESTORE_PROC(92, coverFillPathNV);
+    RESTORE_PROC(93, coverStrokePathInstancedNV);
+    RESTORE_PROC(94, coverStrokePathNV);
+    RESTORE_PROC(95, coverageModulationNV);
+    RESTORE_PROC(96, createBuffers);
+    RESTORE_PROC(97, createFramebuffers);
+    RESTORE_PROC(98, createProgram);
+    RESTORE_PROC(99, createProgramPipelines);
+    RESTORE_PROC(100, createQueries);
+    RESTORE_PROC(101, createRenderbuffers);
+    RESTORE_PROC(102, createSamplers);
+    RESTORE_PROC(103, createShader);
+    RESTORE_PROC(104, createShaderProgramv);
+    RESTORE_PROC(105, createTextures);
+    RESTORE_PROC(106, createTransformFeedbacks);
+    RESTORE_PROC(107, createVertexArrays);
+    RESTORE_PROC(108, cullFace);
+    RESTORE_PROC(109, debugMessageCallback);
+    RESTORE_PROC(110, debugMessageControl);
+    RESTORE_PROC(111, debugMessageInsert);
+    RESTORE_PROC(112, deleteBuffers);
+    RESTORE_PROC(113, deleteFencesNV);
+    RESTORE_PROC(114, deleteFramebuffers);
+    RESTORE_PROC(115, deletePathsNV);
+    RESTORE_PROC(116, deleteProgram);
+    RESTORE_PROC(117, deleteProgramPipelines);
+    RESTORE_PROC(118, deleteQueries);
+    RESTORE_PROC(119, deleteRenderbuffers);
+    RESTORE_PROC(120, deleteSamplers);
+    RESTORE_PROC(121, deleteShader);
+    RESTORE_PROC(122, deleteSync);
+    RESTORE_PROC(123, deleteTextures);
+    RESTORE_PROC(124, deleteTransformFeedbacks);
+    RESTORE_PROC(125, deleteVertexArrays);
+    RESTORE_PROC(126, depthFunc);
+    RESTORE_PROC(127, depthMask);
+    RESTORE_PROC(128, depthRange);
+    RESTORE_PROC(129, depthRangeArrayv);
+    RESTORE_PROC(130, depthRangeIndexed);
+    RESTORE_PROC(131, depthRangef);
+    RESTORE_PROC(132, detachShader);
+    RESTORE_PROC(133, disable);
+    RESTORE_PROC(134, disableVertexArrayAttrib);
+    RESTORE_PROC(135, disableVertexAttribArray);
+    RESTORE_PROC(136, disablei);
+    RESTORE_PROC(137, discardFramebufferEXT);
+    RESTORE_PROC(138, dispatchCompute);
+    RESTORE_PROC(139, dispatchComputeIndirect);
+    RESTORE_PROC(140, drawArrays);
+    RESTORE_PROC(141, drawArraysIndirect);
+    RESTORE_PROC(142, drawArraysInstanced);
+    RESTORE_PROC(143, drawArraysInstancedBaseInstance);
+    RESTORE_PROC(144, drawBuffer);
+    RESTORE_PROC(145, drawBuffers);
+    RESTORE_PROC(146, drawElements);
+    RESTORE_PROC(147, drawElementsBaseVertex);
+    RESTORE_PROC(148, drawElementsIndirect);
+    RESTORE_PROC(149, drawElementsInstanced);
+    RESTORE_PROC(150, drawElementsInstancedBaseInstance);
+    RESTORE_PROC(151, drawElementsInstancedBaseVertex);
+    RESTORE_PROC(152, drawElementsInstancedBaseVertexBaseInstance);
+    RESTORE_PROC(153, drawRangeElements);
+    RESTORE_PROC(154, drawRangeElementsBaseVertex);
+    RESTORE_PROC(155, drawTransformFeedback);
+    RESTORE_PROC(156, drawTransformFeedbackInstanced);
+    RESTORE_PROC(157, drawTransformFeedbackStream);
+    RESTORE_PROC(158, drawTransformFeedbackStreamInstanced);
+    RESTORE_PROC(159, eGLImageTargetRenderbufferStorageOES);
+    RESTORE_PROC(160, eGLImageTargetTexture2DOES);
+    RESTORE_PROC(161, enable);
+    RESTORE_PROC(162, enableVertexArrayAttrib);
+    RESTORE_PROC(163, enableVertexAttribArray);
+    RESTORE_PROC(164, enablei);
+    RESTORE_PROC(165, endConditionalRender);
+    RESTORE_PROC(166, endQuery);
+    RESTORE_PROC(167, endQueryIndexed);
+    RESTORE_PROC(168, endTransformFeedback);
+    RESTORE_PROC(169, fenceSync);
+    RESTORE_PROC(170, finish);
+    RESTORE_PROC(171, finishFenceNV);
+    RESTORE_PROC(172, flush);
+    RESTORE_PROC(173, flushMappedBufferRange);
+    RESTORE_PROC(174, flushMappedNamedBufferRange);
+    RESTORE_PROC(175, framebufferParameteri);
+    RESTORE_PROC(176, framebufferRenderbuffer);
+    RESTORE_PROC(177, framebufferTexture);
+    RESTORE_PROC(178, framebufferTexture1D);
+    RESTORE_PROC(179, framebufferTexture2D);
+    RESTORE_PROC(180, framebufferTexture3D);
+    RESTORE_PROC(181, framebufferTextureLayer);
+    RESTORE_PROC(182, framebufferTextureMultiviewOVR);
+    RESTORE_PROC(183, frontFace);
+    RESTORE_PROC(184, genBuffers);
+    RESTORE_PROC(185, genFencesNV);
+    RESTORE_PROC(186, genFramebuffers);
+    RESTORE_PROC(187, genPathsNV);
+    RESTORE_PROC(188, genProgramPipelines);
+    RESTORE_PROC(189, genQueries);
+    RESTORE_PROC(190, genRenderbuffers);
+    RESTORE_PROC(191, genSamplers);
+    RESTORE_PROC(192, genTextures);
+    RESTORE_PROC(193, genTransformFeedbacks);
+    RESTORE_PROC(194, genVertexArrays);
+    RESTORE_PROC(195, generateMipmap);
+    RESTORE_PROC(196, generateTextureMipmap);
+    RESTORE_PROC(197, getActiveAtomicCounterBufferiv);
+    RESTORE_PROC(198, getActiveAttrib);
+    RESTORE_PROC(199, getActiveSubroutineName);
+    RESTORE_PROC(200, getActiveSubroutineUniformName);
+    RESTORE_PROC(201, getActiveSubroutineUniformiv);
+    RESTORE_PROC(202, getActiveUniform);
+    RESTORE_PROC(203, getActiveUniformBlockName);
+    RESTORE_PROC(204, getActiveUniformBlockiv);
+    RESTORE_PROC(205, getActiveUniformName);
+    RESTORE_PROC(206, getActiveUniformsiv);
+    RESTORE_PROC(207, getAttachedShaders);
+    RESTORE_PROC(208, getAttribLocation);
+    RESTORE_PROC(209, getBooleani_v);
+    RESTORE_PROC(210, getBooleanv);
+    RESTORE_PROC(211, getBufferParameteri64v);
+    RESTORE_PROC(212, getBufferParameteriv);
+    RESTORE_PROC(213, getBufferPointerv);
+    RESTORE_PROC(214, getBufferSubData);
+    RESTORE_PROC(215, getCompressedTexImage);
+    RESTORE_PROC(216, getCompressedTextureImage);
+    RESTORE_PROC(217, getCompressedTextureSubImage);
+    RESTORE_PROC(218, getDebugMessageLog);
+    RESTORE_PROC(219, getDoublei_v);
+    RESTORE_PROC(220, getDoublev);
+    RESTORE_PROC(221, getError);
+    RESTORE_PROC(222, getFenceivNV);
+    RESTORE_PROC(223, getFloati_v);
+    RESTORE_PROC(224, getFloatv);
+    RESTORE_PROC(225, getFragDataIndex);
+    RESTORE_PROC(226, getFragDataLocation);
+    RESTORE_PROC(227, getFramebufferAttachmentParameteriv);
+    RESTORE_PROC(228, getFramebufferParameteriv);
+    RESTORE_PROC(229, getGraphicsResetStatus);
+    RESTORE_PROC(230, getInteger64i_v);
+    RESTORE_PROC(231, getInteger64v);
+    RESTORE_PROC(232, getIntegeri_v);
+    RESTORE_PROC(233, getIntegerv);
+    RESTORE_PROC(234, getInternalformatSampleivNV);
+    RESTORE_PROC(235, getInternalformati64v);
+    RESTORE_PROC(236, getInternalformativ);
+    RESTORE_PROC(237, getMultisamplefv);
+    RESTORE_PROC(238, getNamedBufferParameteri64v);
+    RESTORE_PROC(239, getNamedBufferParameteriv);
+    RESTORE_PROC(240, getNamedBufferPointerv);
+    RESTORE_PROC(241, getNamedBufferSubData);
+    RESTORE_PROC(242, getNamedFramebufferAttachmentParameteriv);
+    RESTORE_PROC(243, getNamedFramebufferParameteriv);
+    RESTORE_PROC(244, getNamedRenderbufferParameteriv);
+    RESTORE_PROC(245, getObjectLabel);
+    RESTORE_PROC(246, getObjectPtrLabel);
+    RESTORE_PROC(247, getPathParameterfvNV);
+    RESTORE_PROC(248, getPathParameterivNV);
+    RESTORE_PROC(249, getPointerv);
+    RESTORE_PROC(250, getProgramBinary);
+    RESTORE_PROC(251, getProgramInfoLog);
+    RESTORE_PROC(252, getProgramInterfaceiv);
+    RESTORE_PROC(253, getProgramPipelineInfoLog);
+    RESTORE_PROC(254, getProgramPipelineiv);
+    RESTORE_PROC(255, getProgramResourceIndex);
+    RESTORE_PROC(256, getProgramResourceLocation);
+    RESTORE_PROC(257, getProgramResourceLocationIndex);
+    RESTORE_PROC(258, getProgramResourceName);
+    RESTORE_PROC(259, getProgramResourceiv);
+    RESTORE_PROC(260, getProgramStageiv);
+    RESTORE_PROC(261, getProgramiv);
+    RESTORE_PROC(262, getQueryBufferObjecti64v);
+    RESTORE_PROC(263, getQueryBufferObjectiv);
+    RESTORE_PROC(264, getQueryBufferObjectui64v);
+    RESTORE_PROC(265, getQueryBufferObjectuiv);
+    RESTORE_PROC(266, getQueryIndexediv);
+    RESTORE_PROC(267, getQueryObjecti64v);
+    RESTORE_PROC(268, getQueryObjectiv);
+    RESTORE_PROC(269, getQueryObjectui64v);
+    RESTORE_PROC(270, getQueryObjectuiv);
+    RESTORE_PROC(271, getQueryiv);
+    RESTORE_PROC(272, getRenderbufferParameteriv);
+    RESTORE_PROC(273, getSamplerParameterIiv);
+    RESTORE_PROC(274, getSamplerParameterIuiv);
+    RESTORE_PROC(275, getSamplerParameterfv);
+    RESTORE_PROC(276, getSamplerParameteriv);
+    RESTORE_PROC(277, getShaderInfoLog);
+    RESTORE_PROC(278, getShaderPrecisionFormat);
+    RESTORE_PROC(279, getShaderSource);
+    RESTORE_PROC(280, getShaderiv);
+    RESTORE_PROC(281, getString);
+    RESTORE_PROC(282, getStringi);
+    RESTORE_PROC(283, getSubroutineIndex);
+    RESTORE_PROC(284, getSubroutineUniformLocation);
+    RESTORE_PROC(285, getSynciv);
+    RESTORE_PROC(286, getTexImage);
+    RESTORE_PROC(287, getTexLevelParameterfv);
+    RESTORE_PROC(288, getTexLevelParameteriv);
+    RESTORE_PROC(289, getTexParameterIiv);
+    RESTORE_PROC(290, getTexParameterIuiv);
+    RESTORE_PROC(291, getTexParameterfv);
+    RESTORE_PROC(292, getTexParameteriv);
+    RESTORE_PROC(293, getTextureImage);
+    RESTORE_PROC(294, getTextureLevelParameterfv);
+    RESTORE_PROC(295, getTextureLevelParameteriv);
+    RESTORE_PROC(296, getTextureParameterIiv);
+    RESTORE_PROC(297, getTextureParameterIuiv);
+    RESTORE_PROC(298, getTextureParameterfv);
+    RESTORE_PROC(299, getTextureParameteriv);
+    RESTORE_PROC(300, getTextureSubImage);
+    RESTORE_PROC(301, getTransformFeedbackVarying);
+    RESTORE_PROC(302, getTransformFeedbacki64_v);
+    RESTORE_PROC(303, getTransformFeedbacki_v);
+    RESTORE_PROC(304, getTransformFeedbackiv);
+    RESTORE_PROC(305, getUniformBlockIndex);
+    RESTORE_PROC(306, getUniformIndices);
+    RESTORE_PROC(307, getUniformLocation);
+    RESTORE_PROC(308, getUniformSubroutineuiv);
+    RESTORE_PROC(309, getUniformdv);
+    RESTORE_PROC(310, getUniformfv);
+    RESTORE_PROC(311, getUniformiv);
+    RESTORE_PROC(312, getUniformuiv);
+    RESTORE_PROC(313, getVertexArrayIndexed64iv);
+    RESTORE_PROC(314, getVertexArrayIndexediv);
+    RESTORE_PROC(315, getVertexArrayiv);
+    RESTORE_PROC(316, getVertexAttribIiv);
+    RESTORE_PROC(317, getVertexAttribIuiv);
+    RESTORE_PROC(318, getVertexAttribLdv);
+    RESTORE_PROC(319, getVertexAttribPointerv);
+    RESTORE_PROC(320, getVertexAttribdv);
+    RESTORE_PROC(321, getVertexAttribfv);
+    RESTORE_PROC(322, getVertexAttribiv);
+    RESTORE_PROC(323, getnCompressedTexImage);
+    RESTORE_PROC(324, getnTexImage);
+    RESTORE_PROC(325, getnUniformdv);
+    RESTORE_PROC(326, getnUniformfv);
+    RESTORE_PROC(327, getnUniformiv);
+    RESTORE_PROC(328, getnUniformuiv);
+    RESTORE_PROC(329, hint);
+    RESTORE_PROC(330, insertEventMarkerEXT);
+    RESTORE_PROC(331, invalidateBufferData);
+    RESTORE_PROC(332, invalidateBufferSubData);
+    RESTORE_PROC(333, invalidateFramebuffer);
+    RESTORE_PROC(334, invalidateNamedFramebufferData);
+    RESTORE_PROC(335, invalidateNamedFramebufferSubData);
+    RESTORE_PROC(336, invalidateSubFramebuffer);
+    RESTORE_PROC(337, invalidateTexImage);
+    RESTORE_PROC(338, invalidateTexSubImage);
+    RESTORE_PROC(339, isBuffer);
+    RESTORE_PROC(340, isEnabled);
+    RESTORE_PROC(341, isEnabledi);
+    RESTORE_PROC(342, isFenceNV);
+    RESTORE_PROC(343, isFramebuffer);
+    RESTORE_PROC(344, isPathNV);
+    RESTORE_PROC(345, isProgram);
+    RESTORE_PROC(346, isProgramPipeline);
+    RESTORE_PROC(347, isQuery);
+    RESTORE_PROC(348, isRenderbuffer);
+    RESTORE_PROC(349, isSampler);
+    RESTORE_PROC(350, isShader);
+    RESTORE_PROC(351, isSync);
+    RESTORE_PROC(352, isTexture);
+    RESTORE_PROC(353, isTransformFeedback);
+    RESTORE_PROC(354, isVertexArray);
+    RESTORE_PROC(355, lineWidth);
+    RESTORE_PROC(356, linkProgram);
+    RESTORE_PROC(357, logicOp);
+    RESTORE_PROC(358, mapBuffer);
+    RESTORE_PROC(359, mapBufferRange);
+    RESTORE_PROC(360, mapNamedBuffer);
+    RESTORE_PROC(361, mapNamedBufferRange);
+    RESTORE_PROC(362, matrixLoadfEXT);
+    RESTORE_PROC(363, maxShaderCompilerThreadsARB);
+    RESTORE_PROC(364, maxShaderCompilerThreadsKHR);
+    RESTORE_PROC(365, memoryBarrier);
+    RESTORE_PROC(366, memoryBarrierByRegion);
+    RESTORE_PROC(367, minSampleShading);
+    RESTORE_PROC(368, multiDrawArrays);
+    RESTORE_PROC(369, multiDrawArraysIndirect);
+    RESTORE_PROC(370, multiDrawElements);
+    RESTORE_PROC(371, multiDrawElementsBaseVertex);
+    RESTORE_PROC(372, multiDrawElementsIndirect);
+    RESTORE_PROC(373, namedBufferData);
+    RESTORE_PROC(374, namedBufferStorage);
+    RESTORE_PROC(375, namedBufferSubData);
+    RESTORE_PROC(376, namedFramebufferDrawBuffer);
+    RESTORE_PROC(377, namedFramebufferDrawBuffers);
+    RESTORE_PROC(378, namedFramebufferParameteri);
+    RESTORE_PROC(379, namedFramebufferReadBuffer);
+    RESTORE_PROC(380, namedFramebufferRenderbuffer);
+    RESTORE_PROC(381, namedFramebufferTexture);
+    RESTORE_PROC(382, namedFramebufferTextureLayer);
+    RESTORE_PROC(383, namedRenderbufferStorage);
+    RESTORE_PROC(384, namedRenderbufferStorageMultisample);
+    RESTORE_PROC(385, objectLabel);
+    RESTORE_PROC(386, objectPtrLabel);
+    RESTORE_PROC(387, patchParameterfv);
+    RESTORE_PROC(388, patchParameteri);
+    RESTORE_PROC(389, pathCommandsNV);
+    RESTORE_PROC(390, pathParameterfNV);
+    RESTORE_PROC(391, pathParameteriNV);
+    RESTORE_PROC(392, pathStencilFuncNV);
+    RESTORE_PROC(393, pauseTransformFeedback);
+    RESTORE_PROC(394, pixelStoref);
+    RESTORE_PROC(395, pixelStorei);
+    RESTORE_PROC(396, pointParameterf);
+    RESTORE_PROC(397, pointParameterfv);
+    RESTORE_PROC(398, pointParameteri);
+    RESTORE_PROC(399, pointParameteriv);
+    RESTORE_PROC(400, pointSize);
+    RESTORE_PROC(401, polygonMode);
+    RESTORE_PROC(402, polygonOffset);
+    RESTORE_PROC(403, popDebugGroup);
+    RESTORE_PROC(404, popGroupMarkerEXT);
+    RESTORE_PROC(405, primitiveBoundingBox);
+    RESTORE_PROC(406, primitiveRestartIndex);
+    RESTORE_PROC(407, programBinary);
+    RESTORE_PROC(408, programParameteri);
+    RESTORE_PROC(409, programPathFragmentInputGenNV);
+    RESTORE_PROC(410, programUniform1d);
+    RESTORE_PROC(411, programUniform1dv);
+    RESTORE_PROC(412, programUniform1f);
+    RESTORE_PROC(413, programUniform1fv);
+    RESTORE_PROC(414, programUniform1i);
+    RESTORE_PROC(415, programUniform1iv);
+    RESTORE_PROC(416, programUniform1ui);
+    RESTORE_PROC(417, programUniform1uiv);
+    RESTORE_PROC(418, programUniform2d);
+    RESTORE_PROC(419, programUniform2dv);
+    RESTORE_PROC(420, programUniform2f);
+    RESTORE_PROC(421, programUniform2fv);
+    RESTORE_PROC(422, programUniform2i);
+    RESTORE_PROC(423, programUniform2iv);
+    RESTORE_PROC(424, programUniform2ui);
+    RESTORE_PROC(425, programUniform2uiv);
+    RESTORE_PROC(426, programUniform3d);
+    RESTORE_PROC(427, programUniform3dv);
+    RESTORE_PROC(428, programUniform3f);
+    RESTORE_PROC(429, programUniform3fv);
+    RESTORE_PROC(430, programUniform3i);
+    RESTORE_PROC(431, programUniform3iv);
+    RESTORE_PROC(432, programUniform3ui);
+    RESTORE_PROC(433, programUniform3uiv);
+    RESTORE_PROC(434, programUniform4d);
+    RESTORE_PROC(435, programUniform4dv);
+    RESTORE_PROC(436, programUniform4f);
+    RESTORE_PROC(437, programUniform4fv);
+    RESTORE_PROC(438, programUniform4i);
+    RESTORE_PROC(439, programUniform4iv);
+    RESTORE_PROC(440, programUniform4ui);
+    RESTORE_PROC(441, programUniform4uiv);
+    RESTORE_PROC(442, programUniformMatrix2dv);
+    RESTORE_PROC(443, programUniformMatrix2fv);
+    RESTORE_PROC(444, programUniformMatrix2x3dv);
+    RESTORE_PROC(445, programUniformMatrix2x3fv);
+    RESTORE_PROC(446, programUniformMatrix2x4dv);
+    RESTORE_PROC(447, programUniformMatrix2x4fv);
+    RESTORE_PROC(448, programUniformMatrix3dv);
+    RESTORE_PROC(449, programUniformMatrix3fv);
+    RESTORE_PROC(450, programUniformMatrix3x2dv);
+    RESTORE_PROC(451, programUniformMatrix3x2fv);
+    RESTORE_PROC(452, programUniformMatrix3x4dv);
+    RESTORE_PROC(453, programUniformMatrix3x4fv);
+    RESTORE_PROC(454, programUniformMatrix4dv);
+    RESTORE_PROC(455, programUniformMatrix4fv);
+    RESTORE_PROC(456, programUniformMatrix4x2dv);
+    RESTORE_PROC(457, programUniformMatrix4x2fv);
+    RESTORE_PROC(458, programUniformMatrix4x3dv);
+    RESTORE_PROC(459, programUniformMatrix4x3fv);
+    RESTORE_PROC(460, provokingVertex);
+    RESTORE_PROC(461, pushDebugGroup);
+    RESTORE_PROC(462, pushGroupMarkerEXT);
+    RESTORE_PROC(463, queryCounter);
+    RESTORE_PROC(464, readBuffer);
+    RESTORE_PROC(465, readPixels);
+    RESTORE_PROC(466, readnPixels);
+    RESTORE_PROC(467, releaseShaderCompiler);
+    RESTORE_PROC(468, renderbufferStorage);
+    RESTORE_PROC(469, renderbufferStorageMultisample);
+    RESTORE_PROC(470, resumeTransformFeedback);
+    RESTORE_PROC(471, sampleCoverage);
+    RESTORE_PROC(472, sampleMaski);
+    RESTORE_PROC(473, samplerParameterIiv);
+    RESTORE_PROC(474, samplerParameterIuiv);
+    RESTORE_PROC(475, samplerParameterf);
+    RESTORE_PROC(476, samplerParameterfv);
+    RESTORE_PROC(477, samplerParameteri);
+    RESTORE_PROC(478, samplerParameteriv);
+    RESTORE_PROC(479, scissor);
+    RESTORE_PROC(480, scissorArrayv);
+    RESTORE_PROC(481, scissorIndexed);
+    RESTORE_PROC(482, scissorIndexedv);
+    RESTORE_PROC(483, setFenceNV);
+    RESTORE_PROC(484, shaderBinary);
+    RESTORE_PROC(485, shaderSource);
+    RESTORE_PROC(486, shaderStorageBlockBinding);
+    RESTORE_PROC(487, stencilFillPathInstancedNV);
+    RESTORE_PROC(488, stencilFillPathNV);
+    RESTORE_PROC(489, stencilFunc);
+    RESTORE_PROC(490, stencilFuncSeparate);
+    RESTORE_PROC(491, stencilMask);
+    RESTORE_PROC(492, stencilMaskSeparate);
+    RESTORE_PROC(493, stencilOp);
+    RESTORE_PROC(494, stencilOpSeparate);
+    RESTORE_PROC(495, stencilStrokePathInstancedNV);
+    RESTORE_PROC(496, stencilStrokePathNV);
+    RESTORE_PROC(497, stencilThenCoverFillPathInstancedNV);
+    RESTORE_PROC(498, stencilThenCoverFillPathNV);
+    RESTORE_PROC(499, stencilThenCoverStrokePathInstancedNV);
+    RESTORE_PROC(500, stencilThenCoverStrokePathNV);
+    RESTORE_PROC(501, testFenceNV);
+    RESTORE_PROC(502, texBuffer);
+    RESTORE_PROC(503, texBufferRange);
+    RESTORE_PROC(504, texImage1D);
+    RESTORE_PROC(505, texImage2D);
+    RESTORE_PROC(506, texImage2DMultisample);
+    RESTORE_PROC(507, texImage3D);
+    RESTORE_PROC(508, texImage3DMultisample);
+    RESTORE_PROC(509, texParameterIiv);
+    RESTORE_PROC(510, texParameterIuiv);
+    RESTORE_PROC(511, texParameterf);
+    RESTORE_PROC(512, texParameterfv);
+    RESTORE_PROC(513, texParameteri);
+    RESTORE_PROC(514, texParameteriv);
+    RESTORE_PROC(515, texStorage1D);
+    RESTORE_PROC(516, texStorage2D);
+    RESTORE_PROC(517, texStorage2DMultisample);
+    RESTORE_PROC(518, texStorage3D);
+    RESTORE_PROC(519, texStorage3DMultisample);
+    RESTORE_PROC(520, texSubImage1D);
+    RESTORE_PROC(521, texSubImage2D);
+    RESTORE_PROC(522, texSubImage3D);
+    RESTORE_PROC(523, textureBarrier);
+    RESTORE_PROC(524, textureBuffer);
+    RESTORE_PROC(525, textureBufferRange);
+    RESTORE_PROC(526, textureParameterIiv);
+    RESTORE_PROC(527, textureParameterIuiv);
+    RESTORE_PROC(528, textureParameterf);
+    RESTORE_PROC(529, textureParameterfv);
+    RESTORE_PROC(530, textureParameteri);
+    RESTORE_PROC(531, textureParameteriv);
+    RESTORE_PROC(532, textureStorage1D);
+    RESTORE_PROC(533, textureStorage2D);
+    RESTORE_PROC(534, textureStorage2DMultisample);
+    RESTORE_PROC(535, textureStorage3D);
+    RESTORE_PROC(536, textureStorage3DMultisample);
+    RESTORE_PROC(537, textureSubImage1D);
+    RESTORE_PROC(538, textureSubImage2D);
+    RESTORE_PROC(539, textureSubImage3D);
+    RESTORE_PROC(540, textureView);
+    RESTORE_PROC(541, transformFeedbackBufferBase);
+    RESTORE_PROC(542, transformFeedbackBufferRange);
+    RESTORE_PROC(543, transformFeedbackVaryings);
+    RESTORE_PROC(544, uniform1d);
+    RESTORE_PROC(545, uniform1dv);
+    RESTORE_PROC(546, uniform1f);
+    RESTORE_PROC(547, uniform1fv);
+    RESTORE_PROC(548, uniform1i);
+    RESTORE_PROC(549, uniform1iv);
+    RESTORE_PROC(550, uniform1ui);
+    RESTORE_PROC(551, uniform1uiv);
+    RESTORE_PROC(552, uniform2d);
+    RESTORE_PROC(553, uniform2dv);
+    RESTORE_PROC(554, uniform2f);
+    RESTORE_PROC(555, uniform2fv);
+    RESTORE_PROC(556, uniform2i);
+    RESTORE_PROC(557, uniform2iv);
+    RESTORE_PROC(558, uniform2ui);
+    RESTORE_PROC(559, uniform2uiv);
+    RESTORE_PROC(560, uniform3d);
+    RESTORE_PROC(561, uniform3dv);
+    RESTORE_PROC(562, uniform3f);
+    RESTORE_PROC(563, uniform3fv);
+    RESTORE_PROC(564, uniform3i);
+    RESTORE_PROC(565, uniform3iv);
+    RESTORE_PROC(566, uniform3ui);
+    RESTORE_PROC(567, uniform3uiv);
+    RESTORE_PROC(568, uniform4d);
+    RESTORE_PROC(569, uniform4dv);
+    RESTORE_PROC(570, uniform4f);
+    RESTORE_PROC(571, uniform4fv);
+    RESTORE_PROC(572, uniform4i);
+    RESTORE_PROC(573, uniform4iv);
+    RESTORE_PROC(574, uniform4ui);
+    RESTORE_PROC(575, uniform4uiv);
+    RESTORE_PROC(576, uniformBlockBinding);
+    RESTORE_PROC(577, uniformMatrix2dv);
+    RESTORE_PROC(578, uniformMatrix2fv);
+    RESTORE_PROC(579, uniformMatrix2x3dv);
+    RESTORE_PROC(580, uniformMatrix2x3fv);
+    RESTORE_PROC(581, uniformMatrix2x4dv);
+    RESTORE_PROC(582, uniformMatrix2x4fv);
+    RESTORE_PROC(583, uniformMatrix3dv);
+    RESTORE_PROC(584, uniformMatrix3fv);
+    RESTORE_PROC(585, uniformMatrix3x2dv);
+    RESTORE_PROC(586, uniformMatrix3x2fv);
+    RESTORE_PROC(587, uniformMatrix3x4dv);
+    RESTORE_PROC(588, uniformMatrix3x4fv);
+    RESTORE_PROC(589, uniformMatrix4dv);
+    RESTORE_PROC(590, uniformMatrix4fv);
+    RESTORE_PROC(591, uniformMatrix4x2dv);
+    RESTORE_PROC(592, uniformMatrix4x2fv);
+    RESTORE_PROC(593, uniformMatrix4x3dv);
+    RESTORE_PROC(594, uniformMatrix4x3fv);
+    RESTORE_PROC(595, uniformSubroutinesuiv);
+    RESTORE_PROC(596, unmapBuffer);
+    RESTORE_PROC(597, unmapNamedBuffer);
+    RESTORE_PROC(598, useProgram);
+    RESTORE_PROC(599, useProgramStages);
+    RESTORE_PROC(600, validateProgram);
+    RESTORE_PROC(601, validateProgramPipeline);
+    RESTORE_PROC(602, vertexArrayAttribBinding);
+    RESTORE_PROC(603, vertexArrayAttribFormat);
+    RESTORE_PROC(604, vertexArrayAttribIFormat);
+    RESTORE_PROC(605, vertexArrayAttribLFormat);
+    RESTORE_PROC(606, vertexArrayBindingDivisor);
+    RESTORE_PROC(607, vertexArrayElementBuffer);
+    RESTORE_PROC(608, vertexArrayVertexBuffer);
+    RESTORE_PROC(609, vertexArrayVertexBuffers);
+    RESTORE_PROC(610, vertexAttrib1d);
+    RESTORE_PROC(611, vertexAttrib1dv);
+    RESTORE_PROC(612, vertexAttrib1f);
+    RESTORE_PROC(613, vertexAttrib1fv);
+    RESTORE_PROC(614, vertexAttrib1s);
+    RESTORE_PROC(615, vertexAttrib1sv);
+    RESTORE_PROC(616, vertexAttrib2d);
+    RESTORE_PROC(617, vertexAttrib2dv);
+    RESTORE_PROC(618, vertexAttrib2f);
+    RESTORE_PROC(619, vertexAttrib2fv);
+    RESTORE_PROC(620, vertexAttrib2s);
+    RESTORE_PROC(621, vertexAttrib2sv);
+    RESTORE_PROC(622, vertexAttrib3d);
+    RESTORE_PROC(623, vertexAttrib3dv);
+    RESTORE_PROC(624, vertexAttrib3f);
+    RESTORE_PROC(625, vertexAttrib3fv);
+    RESTORE_PROC(626, vertexAttrib3s);
+    RESTORE_PROC(627, vertexAttrib3sv);
+    RESTORE_PROC(628, vertexAttrib4Nbv);
+    RESTORE_PROC(629, vertexAttrib4Niv);
+    RESTORE_PROC(630, vertexAttrib4Nsv);
+    RESTORE_PROC(631, vertexAttrib4Nub);
+    RESTORE_PROC(632, vertexAttrib4Nubv);
+    RESTORE_PROC(633, vertexAttrib4Nuiv);
+    RESTORE_PROC(634, vertexAttrib4Nusv);
+    RESTORE_PROC(635, vertexAttrib4bv);
+    RESTORE_PROC(636, vertexAttrib4d);
+    RESTORE_PROC(637, vertexAttrib4dv);
+    RESTORE_PROC(638, vertexAttrib4f);
+    RESTORE_PROC(639, vertexAttrib4fv);
+    RESTORE_PROC(640, vertexAttrib4iv);
+    RESTORE_PROC(641, vertexAttrib4s);
+    RESTORE_PROC(642, vertexAttrib4sv);
+    RESTORE_PROC(643, vertexAttrib4ubv);
+    RESTORE_PROC(644, vertexAttrib4uiv);
+    RESTORE_PROC(645, vertexAttrib4usv);
+    RESTORE_PROC(646, vertexAttribBinding);
+    RESTORE_PROC(647, vertexAttribDivisor);
+    RESTORE_PROC(648, vertexAttribFormat);
+    RESTORE_PROC(649, vertexAttribI1i);
+    RESTORE_PROC(650, vertexAttribI1iv);
+    RESTORE_PROC(651, vertexAttribI1ui);
+    RESTORE_PROC(652, vertexAttribI1uiv);
+    RESTORE_PROC(653, vertexAttribI2i);
+    RESTORE_PROC(654, vertexAttribI2iv);
+    RESTORE_PROC(655, vertexAttribI2ui);
+    RESTORE_PROC(656, vertexAttribI2uiv);
+    RESTORE_PROC(657, vertexAttribI3i);
+    RESTORE_PROC(658, vertexAttribI3iv);
+    RESTORE_PROC(659, vertexAttribI3ui);
+    RESTORE_PROC(660, vertexAttribI3uiv);
+    RESTORE_PROC(661, vertexAttribI4bv);
+    RESTORE_PROC(662, vertexAttribI4i);
+    RESTORE_PROC(663, vertexAttribI4iv);
+    RESTORE_PROC(664, vertexAttribI4sv);
+    RESTORE_PROC(665, vertexAttribI4ubv);
+    RESTORE_PROC(666, vertexAttribI4ui);
+    RESTORE_PROC(667, vertexAttribI4uiv);
+    RESTORE_PROC(668, vertexAttribI4usv);
+    RESTORE_PROC(669, vertexAttribIFormat);
+    RESTORE_PROC(670, vertexAttribIPointer);
+    RESTORE_PROC(671, vertexAttribL1d);
+    RESTORE_PROC(672, vertexAttribL1dv);
+    RESTORE_PROC(673, vertexAttribL2d);
+    RESTORE_PROC(674, vertexAttribL2dv);
+    RESTORE_PROC(675, vertexAttribL3d);
+    RESTORE_PROC(676, vertexAttribL3dv);
+    RESTORE_PROC(677, vertexAttribL4d);
+    RESTORE_PROC(678, vertexAttribL4dv);
+    RESTORE_PROC(679, vertexAttribLFormat);
+    RESTORE_PROC(680, vertexAttribLPointer);
+    RESTORE_PROC(681, vertexAttribP1ui);
+    RESTORE_PROC(682, vertexAttribP1uiv);
+    RESTORE_PROC(683, vertexAttribP2ui);
+    RESTORE_PROC(684, vertexAttribP2uiv);
+    RESTORE_PROC(685, vertexAttribP3ui);
+    RESTORE_PROC(686, vertexAttribP3uiv);
+    RESTORE_PROC(687, vertexAttribP4ui);
+    RESTORE_PROC(688, vertexAttribP4uiv);
+    RESTORE_PROC(689, vertexAttribPointer);
+    RESTORE_PROC(690, vertexBindingDivisor);
+    RESTORE_PROC(691, viewport);
+    RESTORE_PROC(692, viewportArrayv);
+    RESTORE_PROC(693, viewportIndexedf);
+    RESTORE_PROC(694, viewportIndexedfv);
+    RESTORE_PROC(695, waitSync);
+}
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+void *DispatchTableGL::LoadLazyProc(size_t index)
+{
+    std::lock_guard<std::mutex> lock(GetLazyTableMutex());
+    void *proc = gLazyProcs[index].load(std::memory_order_relaxed);
+    if (proc)
+    {
+        // Another thread loaded it first.
+        return proc;
+    }
+
+    const std::vector<DispatchTableGL *> &lazyTables = GetLazyTables();
+    if (lazyTables.empty())
+    {
+        ERR() << "GL function called after its dispatch table was destroyed.";
+        ANGLE_CRASH();
+    }
+
+    // The version requires the function under its core name, and the tables of the driver all
+    // load the same function for it.
+    const char *name = kProcNames[index];
+    proc             = lazyTables.front()->loadProcAddress(name);
+    if (!proc)
+    {
+        ERR() << "Could not load " << name << ", which the GL version requires.";
+        ANGLE_CRASH();
+    }
+
+    gLazyProcs[index].store(proc, std::memory_order_release);
+    return proc;
+}
+
+bool DispatchTableGL::addLazyTable(const void *driver)
+{
+    std::lock_guard<std::mutex> lock(GetLazyTableMutex());
+    if (!driver || (gLazyDriver && gLazyDriver != driver))
+    {
+        return false;
+    }
+
+    gLazyDriver = driver;
+    GetLazyTables().push_back(this);
+    return true;
+}
+
+void DispatchTableGL::installLazyProcs()
+{
+    // The version requests each of its functions under the name whose ProcName is the index of
+    // the function.
+    std::bitset<kProcCount> core;
+    for (const RequestedProc &request : mRequestedProcs)
+    {
+        if (request.core)
+        {
+            core.set(static_cast<size_t>(request.name));
+        }
+    }
+
+    INSTALL_LAZY(0, activeShaderProgram, glActiveShaderProgramLazy);
+    INSTALL_LAZY(1, activeTexture, glActiveTextureLazy);
+    INSTALL_LAZY(2, attachShader, glAttachShaderLazy);
+    INSTALL_LAZY(3, beginConditionalRender, glBeginConditionalRenderLazy);
+    INSTALL_LAZY(4, beginQuery, glBeginQueryLazy);
+    INSTALL_LAZY(5, beginQueryIndexed, glBeginQueryIndexedLazy);
+    INSTALL_LAZY(6, beginTransformFeedback, glBeginTransformFeedbackLazy);
+    INSTALL_LAZY(7, bindAttribLocation, glBindAttribLocationLazy);
+    INSTALL_LAZY(8, bindBuffer, glBindBufferLazy);
+    INSTALL_LAZY(9, bindBufferBase, glBindBufferBaseLazy);
+    INSTALL_LAZY(10, bindBufferRange, glBindBufferRangeLazy);
+    INSTALL_LAZY(11, bindBuffersBase, glBindBuffersBaseLazy);
+    INSTALL_LAZY(12, bindBuffersRange, glBindBuffersRangeLazy);
+    INSTALL_LAZY(13, bindFragDataLocation, glBindFragDataLocationLazy);
+    INSTALL_LAZY(14, bindFragDataLocationIndexed, glBindFragDataLocationIndexedLazy);
+    INSTALL_LAZY(15, bindFramebuffer, glBindFramebufferLazy);
+    INSTALL_LAZY(16, bindImageTexture, glBindImageTextureLazy);
+    INSTALL_LAZY(17, bindImageTextures, glBindImageTexturesLazy);
+    INSTALL_LAZY(18, bindProgramPipeline, glBindProgramPipelineLazy);
+    INSTALL_LAZY(19, bindRenderbuffer, glBindRenderbufferLazy);
+    INSTALL_LAZY(20, bindSampler, glBindSamplerLazy);
+    INSTALL_LAZY(21, bindSamplers, glBindSamplersLazy);
+    INSTALL_LAZY(22, bindTexture, glBindTextureLazy);
+    INSTALL_LAZY(23, bindTextureUnit, glBindTextureUnitLazy);
+    INSTALL_LAZY(24, bindTextures, glBindTexturesLazy);
+    INSTALL_LAZY(25, bindTransformFeedback, glBindTransformFeedbackLazy);
+    INSTALL_LAZY(26, bindVertexArray, glBindVertexArrayLazy);
+    INSTALL_LAZY(27, bindVertexBuffer, glBindVertexBufferLazy);
+    INSTALL_LAZY(28, bindVertexBuffers, glBindVertexBuffersLazy);
+    INSTALL_LAZY(29, blendBarrier, glBlendBarrierLazy);
+    INSTALL_LAZY(30, blendColor, glBlendColorLazy);
+    INSTALL_LAZY(31, blendEquation, glBlendEquationLazy);
+    INSTALL_LAZY(32, blendEquationSeparate, glBlendEquationSeparateLazy);
+    INSTALL_LAZY(33, blendEquationSeparatei, glBlendEquationSeparateiLazy);
+    INSTALL_LAZY(34, blendEquationi, glBlendEquationiLazy);
+    INSTALL_LAZY(35, blendFunc, glBlendFuncLazy);
+    INSTALL_LAZY(36, blendFuncSeparate, glBlendFuncSeparateLazy);
+    INSTALL_LAZY(37, blendFuncSeparatei, glBlendFuncSeparateiLazy);
+    INSTALL_LAZY(38, blendFunci, glBlendFunciLazy);
+    INSTALL_LAZY(39, blitFramebuffer, glBlitFramebufferLazy);
+    INSTALL_LAZY(40, blitNamedFramebuffer, glBlitNamedFramebufferLazy);
+    INSTALL_LAZY(41, bufferData, glBufferDataLazy);
+    INSTALL_LAZY(42, bufferStorage, glBufferStorageLazy);
+    INSTALL_LAZY(43, bufferSubData, glBufferSubDataLazy);
+    INSTALL_LAZY(44, checkFramebufferStatus, glCheckFramebufferStatusLazy);
+    INSTALL_LAZY(45, checkNamedFramebufferStatus, glCheckNamedFramebufferStatusLazy);
+    INSTALL_LAZY(46, clampColor, glClampColorLazy);
+    INSTALL_LAZY(47, clear, glClearLazy);
+    INSTALL_LAZY(48, clearBufferData, glClearBufferDataLazy);
+    INSTALL_LAZY(49, clearBufferSubData, glClearBufferSubDataLazy);
+    INSTALL_LAZY(50, clearBufferfi, glClearBufferfiLazy);
+    INSTALL_LAZY(51, clearBufferfv, glClearBufferfvLazy);
+    INSTALL_LAZY(52, clearBufferiv, glClearBufferivLazy);
+    INSTALL_LAZY(53, clearBufferuiv, glClearBufferuivLazy);
+    INSTALL_LAZY(54, clearColor, glClearColorLazy);
+    INSTALL_LAZY(55, clearDepth, glClearDepthLazy);
+    INSTALL_LAZY(56, clearDepthf, glClearDepthfLazy);
+    INSTALL_LAZY(57, clearNamedBufferData, glClearNamedBufferDataLazy);
+    INSTALL_LAZY(58, clearNamedBufferSubData, glClearNamedBufferSubDataLazy);
+    INSTALL_LAZY(59, clearNamedFramebufferfi, glClearNamedFramebufferfiLazy);
+    INSTALL_LAZY(60, clearNamedFramebufferfv, glClearNamedFramebufferfvLazy);
+    INSTALL_LAZY(61, clearNamedFramebufferiv, glClearNamedFramebufferivLazy);
+    INSTALL_LAZY(62, clearNamedFramebufferuiv, glClearNamedFramebufferuivLazy);
+    INSTALL_LAZY(63, clearStencil, glClearStencilLazy);
+    INSTALL_LAZY(64, clearTexImage, glClearTexImageLazy);
+    INSTALL_LAZY(65, clearTexSubImage, glClearTexSubImageLazy);
+    INSTALL_LAZY(66, clientWaitSync, glClientWaitSyncLazy);
+    INSTALL_LAZY(67, clipControl, glClipControlLazy);
+    INSTALL_LAZY(68, colorMask, glColorMaskLazy);
+    INSTALL_LAZY(69, colorMaski, glColorMaskiLazy);
+    INSTALL_LAZY(70, compileShader, glCompileShaderLazy);
+    INSTALL_LAZY(71, compressedTexImage1D, glCompressedTexImage1DLazy);
+    INSTALL_LAZY(72, compressedTexImage2D, glCompressedTexImage2DLazy);
+    INSTALL_LAZY(73, compressedTexImage3D, glCompressedTexImage3DLazy);
+    INSTALL_LAZY(74, compressedTexSubImage1D, glCompressedTexSubImage1DLazy);
+    INSTALL_LAZY(75, compressedTexSubImage2D, glCompressedTexSubImage2DLazy);
+    INSTALL_LAZY(76, compressedTexSubImage3D, glCompressedTexSubImage3DLazy);
+    INSTALL_LAZY(77, compressedTextureSubImage1D, glCompressedTextureSubImage1DLazy);
+    INSTALL_LAZY(78, compressedTextureSubImage2D, glCompressedTextureSubImage2DLazy);
+    INSTALL_LAZY(79, compressedTextureSubImage3D, glCompressedTextureSubImage3DLazy);
+    INSTALL_LAZY(80, copyBufferSubData, glCopyBufferSubDataLazy);
+    INSTALL_LAZY(81, copyImageSubData, glCopyImageSubDataLazy);
+    INSTALL_LAZY(82, copyNamedBufferSubData, glCopyNamedBufferSubDataLazy);
+    INSTALL_LAZY(83, copyTexImage1D, glCopyTexImage1DLazy);
+    INSTALL_LAZY(84, copyTexImage2D, glCopyTexImage2DLazy);
+    INSTALL_LAZY(85, copyTexSubImage1D, glCopyTexSubImage1DLazy);
+    INSTALL_LAZY(86, copyTexSubImage2D, glCopyTexSubImage2DLazy);
+    INSTALL_LAZY(87, copyTexSubImage3D, glCopyTexSubImage3DLazy);
+    INSTALL_LAZY(88, copyTextureSubImage1D, glCopyTextureSubImage1DLazy);
+    INSTALL_LAZY(89, copyTextureSubImage2D, glCopyTextureSubImage2DLazy);
+    INSTALL_LAZY(90, copyTextureSubImage3D, glCopyTextureSubImage3DLazy);
+    INSTALL_LAZY(91, coverFillPathInstancedNV, glCoverFillPathInstancedNVLazy);
+    INSTALL_LAZY(92, coverFillPathNV, glCoverFillPathNVLazy);
+    INSTALL_LAZY(93, coverStrokePathInstancedNV, glCoverStrokePathInstancedNVLazy);
+    INSTALL_LAZY(94, coverStrokePathNV, glCoverStrokePathNVLazy);
+    INSTALL_LAZY(95, coverageModulationNV, glCoverageModulationNVLazy);
+    INSTALL_LAZY(96, createBuffers, glCreateBuffersLazy);
+    INSTALL_LAZY(97, createFramebuffers, glCreateFramebuffersLazy);
+    INSTALL_LAZY(98, createProgram, glCreateProgramLazy);
+    INSTALL_LAZY(99, createProgramPipelines, glCreateProgramPipelinesLazy);
+    INSTALL_LAZY(100, createQueries, glCreateQueriesLazy);
+    INSTALL_LAZY(101, createRenderbuffers, glCreateRenderbuffersLazy);
+    INSTALL_LAZY(102, createSamplers, glCreateSamplersLazy);
+    INSTALL_LAZY(103, createShader, glCreateShaderLazy);
+    INSTALL_LAZY(104, createShaderProgramv, glCreateShaderProgramvLazy);
+    INSTALL_LAZY(105, createTextures, glCreateTexturesLazy);
+    INSTALL_LAZY(106, createTransformFeedbacks, glCreateTransformFeedbacksLazy);
+    INSTALL_LAZY(107, createVertexArrays, glCreateVertexArraysLazy);
+    INSTALL_LAZY(108, cullFace, glCullFaceLazy);
+    INSTALL_LAZY(109, debugMessageCallback, glDebugMessageCallbackLazy);
+    INSTALL_LAZY(110, debugMessageControl, glDebugMessageControlLazy);
+    INSTALL_LAZY(111, debugMessageInsert, glDebugMessageInsertLazy);
+    INSTALL_LAZY(112, deleteBuffers, glDeleteBuffersLazy);
+    INSTALL_LAZY(113, deleteFencesNV, glDeleteFencesNVLazy);
+    INSTALL_LAZY(114, deleteFramebuffers, glDeleteFramebuffersLazy);
+    INSTALL_LAZY(115, deletePathsNV, glDeletePathsNVLazy);
+    INSTALL_LAZY(116, deleteProgram, glDeleteProgramLazy);
+    INSTALL_LAZY(117, deleteProgramPipelines, glDeleteProgramPipelinesLazy);
+    INSTALL_LAZY(118, deleteQueries, glDeleteQueriesLazy);
+    INSTALL_LAZY(119, deleteRenderbuffers, glDeleteRenderbuffersLazy);
+    INSTALL_LAZY(120, deleteSamplers, glDeleteSamplersLazy);
+    INSTALL_LAZY(121, deleteShader, glDeleteShaderLazy);
+    INSTALL_LAZY(122, deleteSync, glDeleteSyncLazy);
+    INSTALL_LAZY(123, deleteTextures, glDeleteTexturesLazy);
+    INSTALL_LAZY(124, deleteTransformFeedbacks, glDeleteTransformFeedbacksLazy);
+    INSTALL_LAZY(125, deleteVertexArrays, glDeleteVertexArraysLazy);
+    INSTALL_LAZY(126, depthFunc, glDepthFuncLazy);
+    INSTALL_LAZY(127, depthMask, glDepthMaskLazy);
+    INSTALL_LAZY(128, depthRange, glDepthRangeLazy);
+    INSTALL_LAZY(129, depthRangeArrayv, glDepthRangeArrayvLazy);
+    INSTALL_LAZY(130, depthRangeIndexed, glDepthRangeIndexedLazy);
+    INSTALL_LAZY(131, depthRangef, glDepthRangefLazy);
+    INSTALL_LAZY(132, detachShader, glDetachShaderLazy);
+    INSTALL_LAZY(133, disable, glDisableLazy);
+    INSTALL_LAZY(134, disableVertexArrayAttrib, glDisableVertexArrayAttribLazy);
+    INSTALL_LAZY(135, disableVertexAttribArray, glDisableVertexAttribArrayLazy);
+    INSTALL_LAZY(136, disablei, glDisableiLazy);
+    INSTALL_LAZY(137, discardFramebufferEXT, glDiscardFramebufferEXTLazy);
+    INSTALL_LAZY(138, dispatchCompute, glDispatchComputeLazy);
+    INSTALL_LAZY(139, dispatchComputeIndirect, glDispatchComputeIndirectLazy);
+    INSTALL_LAZY(140, drawArrays, glDrawArraysLazy);
+    INSTALL_LAZY(141, drawArraysIndirect, glDrawArraysIndirectLazy);
+    INSTALL_LAZY(142, drawArraysInstanced, glDrawArraysInstancedLazy);
+    INSTALL_LAZY(143, drawArraysInstancedBaseInstance, glDrawArraysInstancedBaseInstanceLazy);
+    INSTALL_LAZY(144, drawBuffer, glDrawBufferLazy);
+    INSTALL_LAZY(145, drawBuffers, glDrawBuffersLazy);
+    INSTALL_LAZY(146, drawElements, glDrawElementsLazy);
+    INSTALL_LAZY(147, drawElementsBaseVertex, glDrawElementsBaseVertexLazy);
+    INSTALL_LAZY(148, drawElementsIndirect, glDrawElementsIndirectLazy);
+    INSTALL_LAZY(149, drawElementsInstanced, glDrawElementsInstancedLazy);
+    INSTALL_LAZY(150, drawElementsInstancedBaseInstance, glDrawElementsInstancedBaseInstanceLazy);
+    INSTALL_LAZY(151, drawElementsInstancedBaseVertex, glDrawElementsInstancedBaseVertexLazy);
+    INSTALL_LAZY(152, drawElementsInstancedBaseVertexBaseInstance,
+                 glDrawElementsInstancedBaseVertexBaseInstanceLazy);
+    INSTALL_LAZY(153, drawRangeElements, glDrawRangeElementsLazy);
+    INSTALL_LAZY(154, drawRangeElementsBaseVertex, glDrawRangeElementsBaseVertexLazy);
+    INSTALL_LAZY(155, drawTransformFeedback, glDrawTransformFeedbackLazy);
+    INSTALL_LAZY(156, drawTransformFeedbackInstanced, glDrawTransformFeedbackInstancedLazy);
+    INSTALL_LAZY(157, drawTransformFeedbackStream, glDrawTransformFeedbackStreamLazy);
+    INSTALL_LAZY(158, drawTransformFeedbackStreamInstanced,
+                 glDrawTransformFeedbackStreamInstancedLazy);
+    INSTALL_LAZY(159, eGLImageTargetRenderbufferStorageOES,
+                 glEGLImageTargetRenderbufferStorageOESLazy);
+    INSTALL_LAZY(160, eGLImageTargetTexture2DOES, glEGLImageTargetTexture2DOESLazy);
+    INSTALL_LAZY(161, enable, glEnableLazy);
+    INSTALL_LAZY(162, enableVertexArrayAttrib, glEnableVertexArrayAttribLazy);
+    INSTALL_LAZY(163, enableVertexAttribArray, glEnableVertexAttribArrayLazy);
+    INSTALL_LAZY(164, enablei, glEnableiLazy);
+    INSTALL_LAZY(165, endConditionalRender, glEndConditionalRenderLazy);
+    INSTALL_LAZY(166, endQuery, glEndQueryLazy);
+    INSTALL_LAZY(167, endQueryIndexed, glEndQueryIndexedLazy);
+    INSTALL_LAZY(168, endTransformFeedback, glEndTransformFeedbackLazy);
+    INSTALL_LAZY(169, fenceSync, glFenceSyncLazy);
+    INSTALL_LAZY(170, finish, glFinishLazy);
+    INSTALL_LAZY(171, finishFenceNV, glFinishFenceNVLazy);
+    INSTALL_LAZY(172, flush, glFlushLazy);
+    INSTALL_LAZY(173, flushMappedBufferRange, glFlushMappedBufferRangeLazy);
+    INSTALL_LAZY(174, flushMappedNamedBufferRange, glFlushMappedNamedBufferRangeLazy);
+    INSTALL_LAZY(175, framebufferParameteri, glFramebufferParameteriLazy);
+    INSTALL_LAZY(176, framebufferRenderbuffer, glFramebufferRenderbufferLazy);
+    INSTALL_LAZY(177, framebufferTexture, glFramebufferTextureLazy);
+    INSTALL_LAZY(178, framebufferTexture1D, glFramebufferTexture1DLazy);
+    INSTALL_LAZY(179, framebufferTexture2D, glFramebufferTexture2DLazy);
+    INSTALL_LAZY(180, framebufferTexture3D, glFramebufferTexture3DLazy);
+    INSTALL_LAZY(181, framebufferTextureLayer, glFramebufferTextureLayerLazy);
+    INSTALL_LAZY(182, framebufferTextureMultiviewOVR, glFramebufferTextureMultiviewOVRLazy);
+    INSTALL_LAZY(183, frontFace, glFrontFaceLazy);
+    INSTALL_LAZY(184, genBuffers, glGenBuffersLazy);
+    INSTALL_LAZY(185, genFencesNV, glGenFencesNVLazy);
+    INSTALL_LAZY(186, genFramebuffers, glGenFramebuffersLazy);
+    INSTALL_LAZY(187, genPathsNV, glGenPathsNVLazy);
+    INSTALL_LAZY(188, genProgramPipelines, glGenProgramPipelinesLazy);
+    INSTALL_LAZY(189, genQueries, glGenQueriesLazy);
+    INSTALL_LAZY(190, genRenderbuffers, glGenRenderbuffersLazy);
+    INSTALL_LAZY(191, genSamplers, glGenSamplersLazy);
+    INSTALL_LAZY(192, genTextures, glGenTexturesLazy);
+    INSTALL_LAZY(193, genTransformFeedbacks, glGenTransformFeedbacksLazy);
+    INSTALL_LAZY(194, genVertexArrays, glGenVertexArraysLazy);
+    INSTALL_LAZY(195, generateMipmap, glGenerateMipmapLazy);
+    INSTALL_LAZY(196, generateTextureMipmap, glGenerateTextureMipmapLazy);
+    INSTALL_LAZY(197, getActiveAtomicCounterBufferiv, glGetActiveAtomicCounterBufferivLazy);
+    INSTALL_LAZY(198, getActiveAttrib, glGetActiveAttribLazy);
+    INSTALL_LAZY(199, getActiveSubroutineName, glGetActiveSubroutineNameLazy);
+    INSTALL_LAZY(200, getActiveSubroutineUniformName, glGetActiveSubroutineUniformNameLazy);
+    INSTALL_LAZY(201, getActiveSubroutineUniformiv, glGetActiveSubroutineUniformivLazy);
+    INSTALL_LAZY(202, getActiveUniform, glGetActiveUniformLazy);
+    INSTALL_LAZY(203, getActiveUniformBlockName, glGetActiveUniformBlockNameLazy);
+    INSTALL_LAZY(204, getActiveUniformBlockiv, glGetActiveUniformBlockivLazy);
+    INSTALL_LAZY(205, getActiveUniformName, glGetActiveUniformNameLazy);
+    INSTALL_LAZY(206, getActiveUniformsiv, glGetActiveUniformsivLazy);
+    INSTALL_LAZY(207, getAttachedShaders, glGetAttachedShadersLazy);
+    INSTALL_LAZY(208, getAttribLocation, glGetAttribLocationLazy);
+    INSTALL_LAZY(209, getBooleani_v, glGetBooleani_vLazy);
+    INSTALL_LAZY(210, getBooleanv, glGetBooleanvLazy);
+    INSTALL_LAZY(211, getBufferParameteri64v, glGetBufferParameteri64vLazy);
+    INSTALL_LAZY(212, getBufferParameteriv, glGetBufferParameterivLazy);
+    INSTALL_LAZY(213, getBufferPointerv, glGetBufferPointervLazy);
+    INSTALL_LAZY(214, getBufferSubData, glGetBufferSubDataLazy);
+    INSTALL_LAZY(215, getCompressedTexImage, glGetCompressedTexImageLazy);
+    INSTALL_LAZY(216, getCompressedTextureImage, glGetCompressedTextureImageLazy);
+    INSTALL_LAZY(217, getCompressedTextureSubImage, glGetCompressedTextureSubImageLazy);
+    INSTALL_LAZY(218, getDebugMessageLog, glGetDebugMessageLogLazy);
+    INSTALL_LAZY(219, getDoublei_v, glGetDoublei_vLazy);
+    INSTALL_LAZY(220, getDoublev, glGetDoublevLazy);
+    INSTALL_LAZY(221, getError, glGetErrorLazy);
+    INSTALL_LAZY(222, getFenceivNV, glGetFenceivNVLazy);
+    INSTALL_LAZY(223, getFloati_v, glGetFloati_vLazy);
+    INSTALL_LAZY(224, getFloatv, glGetFloatvLazy);
+    INSTALL_LAZY(225, getFragDataIndex, glGetFragDataIndexLazy);
+    INSTALL_LAZY(226, getFragDataLocation, glGetFragDataLocationLazy);
+    INSTALL_LAZY(227, getFramebufferAttachmentParameteriv,
+                 glGetFramebufferAttachmentParameterivLazy);
+    INSTALL_LAZY(228, getFramebufferParameteriv, glGetFramebufferParameterivLazy);
+    INSTALL_LAZY(229, getGraphicsResetStatus, glGetGraphicsResetStatusLazy);
+    INSTALL_LAZY(230, getInteger64i_v, glGetInteger64i_vLazy);
+    INSTALL_LAZY(231, getInteger64v, glGetInteger64vLazy);
+    INSTALL_LAZY(232, getIntegeri_v, glGetIntegeri_vLazy);
+    INSTALL_LAZY(233, getIntegerv, glGetIntegervLazy);
+    INSTALL_LAZY(234, getInternalformatSampleivNV, glGetInternalformatSampleivNVLazy);
+    INSTALL_LAZY(235, getInternalformati64v, glGetInternalformati64vLazy);
+    INSTALL_LAZY(236, getInternalformativ, glGetInternalformativLazy);
+    INSTALL_LAZY(237, getMultisamplefv, glGetMultisamplefvLazy);
+    INSTALL_LAZY(238, getNamedBufferParameteri64v, glGetNamedBufferParameteri64vLazy);
+    INSTALL_LAZY(239, getNamedBufferParameteriv, glGetNamedBufferParameterivLazy);
+    INSTALL_LAZY(240, getNamedBufferPointerv, glGetNamedBufferPointervLazy);
+    INSTALL_LAZY(241, getNamedBufferSubData, glGetNamedBufferSubDataLazy);
+    INSTALL_LAZY(242, getNamedFramebufferAttachmentParameteriv,
+                 glGetNamedFramebufferAttachmentParameterivLazy);
+    INSTALL_LAZY(243, getNamedFramebufferParameteriv, glGetNamedFramebufferParameterivLazy);
+    INSTALL_LAZY(244, getNamedRenderbufferParameteriv, glGetNamedRenderbufferParameterivLazy);
+    INSTALL_LAZY(245, getObjectLabel, glGetObjectLabelLazy);
+    INSTALL_LAZY(246, getObjectPtrLabel, glGetObjectPtrLabelLazy);
+    INSTALL_LAZY(247, getPathParameterfvNV, glGetPathParameterfvNVLazy);
+    INSTALL_LAZY(248, getPathParameterivNV, glGetPathParameterivNVLazy);
+    INSTALL_LAZY(249, getPointerv, glGetPointervLazy);
+    INSTALL_LAZY(250, getProgramBinary, glGetProgramBinaryLazy);
+    INSTALL_LAZY(251, getProgramInfoLog, glGetProgramInfoLogLazy);
+    INSTALL_LAZY(252, getProgramInterfaceiv, glGetProgramInterfaceivLazy);
+    INSTALL_LAZY(253, getProgramPipelineInfoLog, glGetProgramPipelineInfoLogLazy);
+    INSTALL_LAZY(254, getProgramPipelineiv, glGetProgramPipelineivLazy);
+    INSTALL_LAZY(255, getProgramResourceIndex, glGetProgramResourceIndexLazy);
+    INSTALL_LAZY(256, getProgramResourceLocation, glGetProgramResourceLocationLazy);
+    INSTALL_LAZY(257, getProgramResourceLocationIndex, glGetProgramResourceLocationIndexLazy);
+    INSTALL_LAZY(258, getProgramResourceName, glGetProgramResourceNameLazy);
+    INSTALL_LAZY(259, getProgramResourceiv, glGetProgramResourceivLazy);
+    INSTALL_LAZY(260, getProgramStageiv, glGetProgramStageivLazy);
+    INSTALL_LAZY(261, getProgramiv, glGetProgramivLazy);
+    INSTALL_LAZY(262, getQueryBufferObjecti64v, glGetQueryBufferObjecti64vLazy);
+    INSTALL_LAZY(263, getQueryBufferObjectiv, glGetQueryBufferObjectivLazy);
+    INSTALL_LAZY(264, getQueryBufferObjectui64v, glGetQueryBufferObjectui64vLazy);
+    INSTALL_LAZY(265, getQueryBufferObjectuiv, glGetQueryBufferObjectuivLazy);
+    INSTALL_LAZY(266, getQueryIndexediv, glGetQueryIndexedivLazy);
+    INSTALL_LAZY(267, getQueryObjecti64v, glGetQueryObjecti64vLazy);
+    INSTALL_LAZY(268, getQueryObjectiv, glGetQueryObjectivLazy);
+    INSTALL_LAZY(269, getQueryObjectui64v, glGetQueryObjectui64vLazy);
+    INSTALL_LAZY(270, getQueryObjectuiv, glGetQueryObjectuivLazy);
+    INSTALL_LAZY(271, getQueryiv, glGetQueryivLazy);
+    INSTALL_LAZY(272, getRenderbufferParameteriv, glGetRenderbufferParameterivLazy);
+    INSTALL_LAZY(273, getSamplerParameterIiv, glGetSamplerParameterIivLazy);
+    INSTALL_LAZY(274, getSamplerParameterIuiv, glGetSamplerParameterIuivLazy);
+    INSTALL_LAZY(275, getSamplerParameterfv, glGetSamplerParameterfvLazy);
+    INSTALL_LAZY(276, getSamplerParameteriv, glGetSamplerParameterivLazy);
+    INSTALL_LAZY(277, getShaderInfoLog, glGetShaderInfoLogLazy);
+    INSTALL_LAZY(278, getShaderPrecisionFormat, glGetShaderPrecisionFormatLazy);
+    INSTALL_LAZY(279, getShaderSource, glGetShaderSourceLazy);
+    INSTALL_LAZY(280, getShaderiv, glGetShaderivLazy);
+    INSTALL_LAZY(281, getString, glGetStringLazy);
+    INSTALL_LAZY(282, getStringi, glGetStringiLazy);
+    INSTALL_LAZY(283, getSubroutineIndex, glGetSubroutineIndexLazy);
+    INSTALL_LAZY(284, getSubroutineUniformLocation, glGetSubroutineUniformLocationLazy);
+    INSTALL_LAZY(285, getSynciv, glGetSyncivLazy);
+    INSTALL_LAZY(286, getTexImage, glGetTexImageLazy);
+    INSTALL_LAZY(287, getTexLevelParameterfv, glGetTexLevelParameterfvLazy);
+    INSTALL_LAZY(288, getTexLevelParameteriv, glGetTexLevelParameterivLazy);
+    INSTALL_LAZY(289, getTexParameterIiv, glGetTexParameterIivLazy);
+    INSTALL_LAZY(290, getTexParameterIuiv, glGetTexParameterIuivLazy);
+    INSTALL_LAZY(291, getTexParameterfv, glGetTexParameterfvLazy);
+    INSTALL_LAZY(292, getTexParameteriv, glGetTexParameterivLazy);
+    INSTALL_LAZY(293, getTextureImage, glGetTextureImageLazy);
+    INSTALL_LAZY(294, getTextureLevelParameterfv, glGetTextureLevelParameterfvLazy);
+    INSTALL_LAZY(295, getTextureLevelParameteriv, glGetTextureLevelParameterivLazy);
+    INSTALL_LAZY(296, getTextureParameterIiv, glGetTextureParameterIivLazy);
+    INSTALL_LAZY(297, getTextureParameterIuiv, glGetTextureParameterIuivLazy);
+    INSTALL_LAZY(298, getTextureParameterfv, glGetTextureParameterfvLazy);
+    INSTALL_LAZY(299, getTextureParameteriv, glGetTextureParameterivLazy);
+    INSTALL_LAZY(300, getTextureSubImage, glGetTextureSubImageLazy);
+    INSTALL_LAZY(301, getTransformFeedbackVarying, glGetTransformFeedbackVaryingLazy);
+    INSTALL_LAZY(302, getTransformFeedbacki64_v, glGetTransformFeedbacki64_vLazy);
+    INSTALL_LAZY(303, getTransformFeedbacki_v, glGetTransformFeedbacki_vLazy);
+    INSTALL_LAZY(304, getTransformFeedbackiv, glGetTransformFeedbackivLazy);
+    INSTALL_LAZY(305, getUniformBlockIndex, glGetUniformBlockIndexLazy);
+    INSTALL_LAZY(306, getUniformIndices, glGetUniformIndicesLazy);
+    INSTALL_LAZY(307, getUniformLocation, glGetUniformLocationLazy);
+    INSTALL_LAZY(308, getUniformSubroutineuiv, glGetUniformSubroutineuivLazy);
+    INSTALL_LAZY(309, getUniformdv, glGetUniformdvLazy);
+    INSTALL_LAZY(310, getUniformfv, glGetUniformfvLazy);
+    INSTALL_LAZY(311, getUniformiv, glGetUniformivLazy);
+    INSTALL_LAZY(312, getUniformuiv, glGetUniformuivLazy);
+    INSTALL_LAZY(313, getVertexArrayIndexed64iv, glGetVertexArrayIndexed64ivLazy);
+    INSTALL_LAZY(314, getVertexArrayIndexediv, glGetVertexArrayIndexedivLazy);
+    INSTALL_LAZY(315, getVertexArrayiv, glGetVertexArrayivLazy);
+    INSTALL_LAZY(316, getVertexAttribIiv, glGetVertexAttribIivLazy);
+    INSTALL_LAZY(317, getVertexAttribIuiv, glGetVertexAttribIuivLazy);
+    INSTALL_LAZY(318, getVertexAttribLdv, glGetVertexAttribLdvLazy);
+    INSTALL_LAZY(319, getVertexAttribPointerv, glGetVertexAttribPointervLazy);
+    INSTALL_LAZY(320, getVertexAttribdv, glGetVertexAttribdvLazy);
+    INSTALL_LAZY(321, getVertexAttribfv, glGetVertexAttribfvLazy);
+    INSTALL_LAZY(322, getVertexAttribiv, glGetVertexAttribivLazy);
+    INSTALL_LAZY(323, getnCompressedTexImage, glGetnCompressedTexImageLazy);
+    INSTALL_LAZY(324, getnTexImage, glGetnTexImageLazy);
+    INSTALL_LAZY(325, getnUniformdv, glGetnUniformdvLazy);
+    INSTALL_LAZY(326, getnUniformfv, glGetnUniformfvLazy);
+    INSTALL_LAZY(327, getnUniformiv, glGetnUniformivLazy);
+    INSTALL_LAZY(328, getnUniformuiv, glGetnUniformuivLazy);
+    INSTALL_LAZY(329, hint, glHintLazy);
+    INSTALL_LAZY(330, insertEventMarkerEXT, glInsertEventMarkerEXTLazy);
+    INSTALL_LAZY(331, invalidateBufferData, glInvalidateBufferDataLazy);
+    INSTALL_LAZY(332, invalidateBufferSubData, glInvalidateBufferSubDataLazy);
+    INSTALL_LAZY(333, invalidateFramebuffer, glInvalidateFramebufferLazy);
+    INSTALL_LAZY(334, invalidateNamedFramebufferData, glInvalidateNamedFramebufferDataLazy);
+    INSTALL_LAZY(335, invalidateNamedFramebufferSubData, glInvalidateNamedFramebufferSubDataLazy);
+    INSTALL_LAZY(336, invalidateSubFramebuffer, glInvalidateSubFramebufferLazy);
+    INSTALL_LAZY(337, invalidateTexImage, glInvalidateTexImageLazy);
+    INSTALL_LAZY(338, invalidateTexSubImage, glInvalidateTexSubImageLazy);
+    INSTALL_LAZY(339, isBuffer, glIsBufferLazy);
+    INSTALL_LAZY(340, isEnabled, glIsEnabledLazy);
+    INSTALL_LAZY(341, isEnabledi, glIsEnablediLazy);
+    INSTALL_LAZY(342, isFenceNV, glIsFenceNVLazy);
+    INSTALL_LAZY(343, isFramebuffer, glIsFramebufferLazy);
+    INSTALL_LAZY(344, isPathNV, glIsPathNVLazy);
+    INSTALL_LAZY(345, isProgram, glIsProgramLazy);
+    INSTALL_LAZY(346, isProgramPipeline, glIsProgramPipelineLazy);
+    INSTALL_LAZY(347, isQuery, glIsQueryLazy);
+    INSTALL_LAZY(348, isRenderbuffer, glIsRenderbufferLazy);
+    INSTALL_LAZY(349, isSampler, glIsSamplerLazy);
+    INSTALL_LAZY(350, isShader, glIsShaderLazy);
+    INSTALL_LAZY(351, isSync, glIsSyncLazy);
+    INSTALL_LAZY(352, isTexture, glIsTextureLazy);
+    INSTALL_LAZY(353, isTransformFeedback, glIsTransformFeedbackLazy);
+    INSTALL_LAZY(354, isVertexArray, glIsVertexArrayLazy);
+    INSTALL_LAZY(355, lineWidth, glLineWidthLazy);
+    INSTALL_LAZY(356, linkProgram, glLinkProgramLazy);
+    INSTALL_LAZY(357, logicOp, glLogicOpLazy);
+    INSTALL_LAZY(358, mapBuffer, glMapBufferLazy);
+    INSTALL_LAZY(359, mapBufferRange, glMapBufferRangeLazy);
+    INSTALL_LAZY(360, mapNamedBuffer, glMapNamedBufferLazy);
+    INSTALL_LAZY(361, mapNamedBufferRange, glMapNamedBufferRangeLazy);
+    INSTALL_LAZY(362, matrixLoadfEXT, glMatrixLoadfEXTLazy);
+    INSTALL_LAZY(363, maxShaderCompilerThreadsARB, glMaxShaderCompilerThreadsARBLazy);
+    INSTALL_LAZY(364, maxShaderCompilerThreadsKHR, glMaxShaderCompilerThreadsKHRLazy);
+    INSTALL_LAZY(365, memoryBarrier, glMemoryBarrierLazy);
+    INSTALL_LAZY(366, memoryBarrierByRegion, glMemoryBarrierByRegionLazy);
+    INSTALL_LAZY(367, minSampleShading, glMinSampleShadingLazy);
+    INSTALL_LAZY(368, multiDrawArrays, glMultiDrawArraysLazy);
+    INSTALL_LAZY(369, multiDrawArraysIndirect, glMultiDrawArraysIndirectLazy);
+    INSTALL_LAZY(370, multiDrawElements, glMultiDrawElementsLazy);
+    INSTALL_LAZY(371, multiDrawElementsBaseVertex, glMultiDrawElementsBaseVertexLazy);
+    INSTALL_LAZY(372, multiDrawElementsIndirect, glMultiDrawElementsIndirectLazy);
+    INSTALL_LAZY(373, namedBufferData, glNamedBufferDataLazy);
+    INSTALL_LAZY(374, namedBufferStorage, glNamedBufferStorageLazy);
+    INSTALL_LAZY(375, namedBufferSubData, glNamedBufferSubDataLazy);
+    INSTALL_LAZY(376, namedFramebufferDrawBuffer, glNamedFramebufferDrawBufferLazy);
+    INSTALL_LAZY(377, namedFramebufferDrawBuffers, glNamedFramebufferDrawBuffersLazy);
+    INSTALL_LAZY(378, namedFramebufferParameteri, glNamedFramebufferParameteriLazy);
+    INSTALL_LAZY(379, namedFramebufferReadBuffer, glNamedFramebufferReadBufferLazy);
+    INSTALL_LAZY(380, namedFramebufferRenderbuffer, glNamedFramebufferRenderbufferLazy);
+    INSTALL_LAZY(381, namedFramebufferTexture, glNamedFramebufferTextureLazy);
+    INSTALL_LAZY(382, namedFramebufferTextureLayer, glNamedFramebufferTextureLayerLazy);
+    INSTALL_LAZY(383, namedRenderbufferStorage, glNamedRenderbufferStorageLazy);
+    INSTALL_LAZY(384, namedRenderbufferStorageMultisample,
+                 glNamedRenderbufferStorageMultisampleLazy);
+    INSTALL_LAZY(385, objectLabel, glObjectLabelLazy);
+    INSTALL_LAZY(386, objectPtrLabel, glObjectPtrLabelLazy);
+    INSTALL_LAZY(387, patchParameterfv, glPatchParameterfvLazy);
+    INSTALL_LAZY(388, patchParameteri, glPatchParameteriLazy);
+    INSTALL_LAZY(389, pathCommandsNV, glPathCommandsNVLazy);
+    INSTALL_LAZY(390, pathParameterfNV, glPathParameterfNVLazy);
+    INSTALL_LAZY(391, pathParameteriNV, glPathParameteriNVLazy);
+    INSTALL_LAZY(392, pathStencilFuncNV, glPathStencilFuncNVLazy);
+    INSTALL_LAZY(393, pauseTransformFeedback, glPauseTransformFeedbackLazy);
+    INSTALL_LAZY(394, pixelStoref, glPixelStorefLazy);
+    INSTALL_LAZY(395, pixelStorei, glPixelStoreiLazy);
+    INSTALL_LAZY(396, pointParameterf, glPointParameterfLazy);
+    INSTALL_LAZY(397, pointParameterfv, glPointParameterfvLazy);
+    INSTALL_LAZY(398, pointParameteri, glPointParameteriLazy);
+    INSTALL_LAZY(399, pointParameteriv, glPointParameterivLazy);
+    INSTALL_LAZY(400, pointSize, glPointSizeLazy);
+    INSTALL_LAZY(401, polygonMode, glPolygonModeLazy);
+    INSTALL_LAZY(402, polygonOffset, glPolygonOffsetLazy);
+    INSTALL_LAZY(403, popDebugGroup, glPopDebugGroupLazy);
+    INSTALL_LAZY(404, popGroupMarkerEXT, glPopGroupMarkerEXTLazy);
+    INSTALL_LAZY(405, primitiveBoundingBox, glPrimitiveBoundingBoxLazy);
+    INSTALL_LAZY(406, primitiveRestartIndex, glPrimitiveRestartIndexLazy);
+    INSTALL_LAZY(407, programBinary, glProgramBinaryLazy);
+    INSTALL_LAZY(408, programParameteri, glProgramParameteriLazy);
+    INSTALL_LAZY(409, programPathFragmentInputGenNV, glProgramPathFragmentInputGenNVLazy);
+    INSTALL_LAZY(410, programUniform1d, glProgramUniform1dLazy);
+    INSTALL_LAZY(411, programUniform1dv, glProgramUniform1dvLazy);
+    INSTALL_LAZY(412, programUniform1f, glProgramUniform1fLazy);
+    INSTALL_LAZY(413, programUniform1fv, glProgramUniform1fvLazy);
+    INSTALL_LAZY(414, programUniform1i, glProgramUniform1iLazy);
+    INSTALL_LAZY(415, programUniform1iv, glProgramUniform1ivLazy);
+    INSTALL_LAZY(416, programUniform1ui, glProgramUniform1uiLazy);
+    INSTALL_LAZY(417, programUniform1uiv, glProgramUniform1uivLazy);
+    INSTALL_LAZY(418, programUniform2d, glProgramUniform2dLazy);
+    INSTALL_LAZY(419, programUniform2dv, glProgramUniform2dvLazy);
+    INSTALL_LAZY(420, programUniform2f, glProgramUniform2fLazy);
+    INSTALL_LAZY(421, programUniform2fv, glProgramUniform2fvLazy);
+    INSTALL_LAZY(422, programUniform2i, glProgramUniform2iLazy);
+    INSTALL_LAZY(423, programUniform2iv, glProgramUniform2ivLazy);
+    INSTALL_LAZY(424, programUniform2ui, glProgramUniform2uiLazy);
+    INSTALL_LAZY(425, programUniform2uiv, glProgramUniform2uivLazy);
+    INSTALL_LAZY(426, programUniform3d, glProgramUniform3dLazy);
+    INSTALL_LAZY(427, programUniform3dv, glProgramUniform3dvLazy);
+    INSTALL_LAZY(428, programUniform3f, glProgramUniform3fLazy);
+    INSTALL_LAZY(429, programUniform3fv, glProgramUniform3fvLazy);
+    INSTALL_LAZY(430, programUniform3i, glProgramUniform3iLazy);
+    INSTALL_LAZY(431, programUniform3iv, glProgramUniform3ivLazy);
+    INSTALL_LAZY(432, programUniform3ui, glProgramUniform3uiLazy);
+    INSTALL_LAZY(433, programUniform3uiv, glProgramUniform3uivLazy);
+    INSTALL_LAZY(434, programUniform4d, glProgramUniform4dLazy);
+    INSTALL_LAZY(435, programUniform4dv, glProgramUniform4dvLazy);
+    INSTALL_LAZY(436, programUniform4f, glProgramUniform4fLazy);
+    INSTALL_LAZY(437, programUniform4fv, glProgramUniform4fvLazy);
+    INSTALL_LAZY(438, programUniform4i, glProgramUniform4iLazy);
+    INSTALL_LAZY(439, programUniform4iv, glProgramUniform4ivLazy);
+    INSTALL_LAZY(440, programUniform4ui, glProgramUniform4uiLazy);
+    INSTALL_LAZY(441, programUniform4uiv, glProgramUniform4uivLazy);
+    INSTALL_LAZY(442, programUniformMatrix2dv, glProgramUniformMatrix2dvLazy);
+    INSTALL_LAZY(443, programUniformMatrix2fv, glProgramUniformMatrix2fvLazy);
+    INSTALL_LAZY(444, programUniformMatrix2x3dv, glProgramUniformMatrix2x3dvLazy);
+    INSTALL_LAZY(445, programUniformMatrix2x3fv, glProgramUniformMatrix2x3fvLazy);
+    INSTALL_LAZY(446, programUniformMatrix2x4dv, glProgramUniformMatrix2x4dvLazy);
+    INSTALL_LAZY(447, programUniformMatrix2x4fv, glProgramUniformMatrix2x4fvLazy);
+    INSTALL_LAZY(448, programUniformMatrix3dv, glProgramUniformMatrix3dvLazy);
+    INSTALL_LAZY(449, programUniformMatrix3fv, glProgramUniformMatrix3fvLazy);
+    INSTALL_LAZY(450, programUniformMatrix3x2dv, glProgramUniformMatrix3x2dvLazy);
+    INSTALL_LAZY(451, programUniformMatrix3x2fv, glProgramUniformMatrix3x2fvLazy);
+    INSTALL_LAZY(452, programUniformMatrix3x4dv, glProgramUniformMatrix3x4dvLazy);
+    INSTALL_LAZY(453, programUniformMatrix3x4fv, glProgramUniformMatrix3x4fvLazy);
+    INSTALL_LAZY(454, programUniformMatrix4dv, glProgramUniformMatrix4dvLazy);
+    INSTALL_LAZY(455, programUniformMatrix4fv, glProgramUniformMatrix4fvLazy);
+    INSTALL_LAZY(456, programUniformMatrix4x2dv, glProgramUniformMatrix4x2dvLazy);
+    INSTALL_LAZY(457, programUniformMatrix4x2fv, glProgramUniformMatrix4x2fvLazy);
+    INSTALL_LAZY(458, programUniformMatrix4x3dv, glProgramUniformMatrix4x3dvLazy);
+    INSTALL_LAZY(459, programUniformMatrix4x3fv, glProgramUniformMatrix4x3fvLazy);
+    INSTALL_LAZY(460, provokingVertex, glProvokingVertexLazy);
+    INSTALL_LAZY(461, pushDebugGroup, glPushDebugGroupLazy);
+    INSTALL_LAZY(462, pushGroupMarkerEXT, glPushGroupMarkerEXTLazy);
+    INSTALL_LAZY(463, queryCounter, glQueryCounterLazy);
+    INSTALL_LAZY(464, readBuffer, glReadBufferLazy);
+    INSTALL_LAZY(465, readPixels, glReadPixelsLazy);
+    INSTALL_LAZY(466, readnPixels, glReadnPixelsLazy);
+    INSTALL_LAZY(467, releaseShaderCompiler, glReleaseShaderCompilerLazy);
+    INSTALL_LAZY(468, renderbufferStorage, glRenderbufferStorageLazy);
+    INSTALL_LAZY(469, renderbufferStorageMultisample, glRenderbufferStorageMultisampleLazy);
+    INSTALL_LAZY(470, resumeTransformFeedback, glResumeTransformFeedbackLazy);
+    INSTALL_LAZY(471, sampleCoverage, glSampleCoverageLazy);
+    INSTALL_LAZY(472, sampleMaski, glSampleMaskiLazy);
+    INSTALL_LAZY(473, samplerParameterIiv, glSamplerParameterIivLazy);
+    INSTALL_LAZY(474, samplerParameterIuiv, glSamplerParameterIuivLazy);
+    INSTALL_LAZY(475, samplerParameterf, glSamplerParameterfLazy);
+    INSTALL_LAZY(476, samplerParameterfv, glSamplerParameterfvLazy);
+    INSTALL_LAZY(477, samplerParameteri, glSamplerParameteriLazy);
+    INSTALL_LAZY(478, samplerParameteriv, glSamplerParameterivLazy);
+    INSTALL_LAZY(479, scissor, glScissorLazy);
+    INSTALL_LAZY(480, scissorArrayv, glScissorArrayvLazy);
+    INSTALL_LAZY(481, scissorIndexed, glScissorIndexedLazy);
+    INSTALL_LAZY(482, scissorIndexedv, glScissorIndexedvLazy);
+    INSTALL_LAZY(483, setFenceNV, glSetFenceNVLazy);
+    INSTALL_LAZY(484, shaderBinary, glShaderBinaryLazy);
+    INSTALL_LAZY(485, shaderSource, glShaderSourceLazy);
+    INSTALL_LAZY(486, shaderStorageBlockBinding, glShaderStorageBlockBindingLazy);
+    INSTALL_LAZY(487, stencilFillPathInstancedNV, glStencilFillPathInstancedNVLazy);
+    INSTALL_LAZY(488, stencilFillPathNV, glStencilFillPathNVLazy);
+    INSTALL_LAZY(489, stencilFunc, glStencilFuncLazy);
+    INSTALL_LAZY(490, stencilFuncSeparate, glStencilFuncSeparateLazy);
+    INSTALL_LAZY(491, stencilMask, glStencilMaskLazy);
+    INSTALL_LAZY(492, stencilMaskSeparate, glStencilMaskSeparateLazy);
+    INSTALL_LAZY(493, stencilOp, glStencilOpLazy);
+    INSTALL_LAZY(494, stencilOpSeparate, glStencilOpSeparateLazy);
+    INSTALL_LAZY(495, stencilStrokePathInstancedNV, glStencilStrokePathInstancedNVLazy);
+    INSTALL_LAZY(496, stencilStrokePathNV, glStencilStrokePathNVLazy);
+    INSTALL_LAZY(497, stencilThenCoverFillPathInstancedNV,
+                 glStencilThenCoverFillPathInstancedNVLazy);
+    INSTALL_LAZY(498, stencilThenCoverFillPathNV, glStencilThenCoverFillPathNVLazy);
+    INSTALL_LAZY(499, stencilThenCoverStrokePathInstancedNV,
+                 glStencilThenCoverStrokePathInstancedNVLazy);
+    INSTALL_LAZY(500, stencilThenCoverStrokePathNV, glStencilThenCoverStrokePathNVLazy);
+    INSTALL_LAZY(501, testFenceNV, glTestFenceNVLazy);
+    INSTALL_LAZY(502, texBuffer, glTexBufferLazy);
+    INSTALL_LAZY(503, texBufferRange, glTexBufferRangeLazy);
+    INSTALL_LAZY(504, texImage1D, glTexImage1DLazy);
+    INSTALL_LAZY(505, texImage2D, glTexImage2DLazy);
+    INSTALL_LAZY(506, texImage2DMultisample, glTexImage2DMultisampleLazy);
+    INSTALL_LAZY(507, texImage3D, glTexImage3DLazy);
+    INSTALL_LAZY(508, texImage3DMultisample, glTexImage3DMultisampleLazy);
+    INSTALL_LAZY(509, texParameterIiv, glTexParameterIivLazy);
+    INSTALL_LAZY(510, texParameterIuiv, glTexParameterIuivLazy);
+    INSTALL_LAZY(511, texParameterf, glTexParameterfLazy);
+    INSTALL_LAZY(512, texParameterfv, glTexParameterfvLazy);
+    INSTALL_LAZY(513, texParameteri, glTexParameteriLazy);
+    INSTALL_LAZY(514, texParameteriv, glTexParameterivLazy);
+    INSTALL_LAZY(515, texStorage1D, glTexStorage1DLazy);
+    INSTALL_LAZY(516, texStorage2D, glTexStorage2DLazy);
+    INSTALL_LAZY(517, texStorage2DMultisample, glTexStorage2DMultisampleLazy);
+    INSTALL_LAZY(518, texStorage3D, glTexStorage3DLazy);
+    INSTALL_LAZY(519, texStorage3DMultisample, glTexStorage3DMultisampleLazy);
+    INSTALL_LAZY(520, texSubImage1D, glTexSubImage1DLazy);
+    INSTALL_LAZY(521, texSubImage2D, glTexSubImage2DLazy);
+    INSTALL_LAZY(522, texSubImage3D, glTexSubImage3DLazy);
+    INSTALL_LAZY(523, textureBarrier, glTextureBarrierLazy);
+    INSTALL_LAZY(524, textureBuffer, glTextureBufferLazy);
+    INSTALL_LAZY(525, textureBufferRange, glTextureBufferRangeLazy);
+    INSTALL_LAZY(526, textureParameterIiv, glTextureParameterIivLazy);
+    INSTALL_LAZY(527, textureParameterIuiv, glTextureParameterIuivLazy);
+    INSTALL_LAZY(528, textureParameterf, glTextureParameterfLazy);
+    INSTALL_LAZY(529, textureParameterfv, glTextureParameterfvLazy);
+    INSTALL_LAZY(530, textureParameteri, glTextureParameteriLazy);
+    INSTALL_LAZY(531, textureParameteriv, glTextureParameterivLazy);
+    INSTALL_LAZY(532, textureStorage1D, glTextureStorage1DLazy);
+    INSTALL_LAZY(533, textureStorage2D, glTextureStorage2DLazy);
+    INSTALL_LAZY(534, textureStorage2DMultisample, glTextureStorage2DMultisampleLazy);
+    INSTALL_LAZY(535, textureStorage3D, glTextureStorage3DLazy);
+    INSTALL_LAZY(536, textureStorage3DMultisample, glTextureStorage3DMultisampleLazy);
+    INSTALL_LAZY(537, textureSubImage1D, glTextureSubImage1DLazy);
+    INSTALL_LAZY(538, textureSubImage2D, glTextureSubImage2DLazy);
+    INSTALL_LAZY(539, textureSubImage3D, glTextureSubImage3DLazy);
+    INSTALL_LAZY(540, textureView, glTextureViewLazy);
+    INSTALL_LAZY(541, transformFeedbackBufferBase, glTransformFeedbackBufferBaseLazy);
+    INSTALL_LAZY(542, transformFeedbackBufferRange, glTransformFeedbackBufferRangeLazy);
+    INSTALL_LAZY(543, transformFeedbackVaryings, glTransformFeedbackVaryingsLazy);
+    INSTALL_LAZY(544, uniform1d, glUniform1dLazy);
+    INSTALL_LAZY(545, uniform1dv, glUniform1dvLazy);
+    INSTALL_LAZY(546, uniform1f, glUniform1fLazy);
+    INSTALL_LAZY(547, uniform1fv, glUniform1fvLazy);
+    INSTALL_LAZY(548, uniform1i, glUniform1iLazy);
+    INSTALL_LAZY(549, uniform1iv, glUniform1ivLazy);
+    INSTALL_LAZY(550, uniform1ui, glUniform1uiLazy);
+    INSTALL_LAZY(551, uniform1uiv, glUniform1uivLazy);
+    INSTALL_LAZY(552, uniform2d, glUniform2dLazy);
+    INSTALL_LAZY(553, uniform2dv, glUniform2dvLazy);
+    INSTALL_LAZY(554, uniform2f, glUniform2fLazy);
+    INSTALL_LAZY(555, uniform2fv, glUniform2fvLazy);
+    INSTALL_LAZY(556, uniform2i, glUniform2iLazy);
+    INSTALL_LAZY(557, uniform2iv, glUniform2ivLazy);
+    INSTALL_LAZY(558, uniform2ui, glUniform2uiLazy);
+    INSTALL_LAZY(559, uniform2uiv, glUniform2uivLazy);
+    INSTALL_LAZY(560, uniform3d, glUniform3dLazy);
+    INSTALL_LAZY(561, uniform3dv, glUniform3dvLazy);
+    INSTALL_LAZY(562, uniform3f, glUniform3fLazy);
+    INSTALL_LAZY(563, uniform3fv, glUniform3fvLazy);
+    INSTALL_LAZY(564, uniform3i, glUniform3iLazy);
+    INSTALL_LAZY(565, uniform3iv, glUniform3ivLazy);
+    INSTALL_LAZY(566, uniform3ui, glUniform3uiLazy);
+    INSTALL_LAZY(567, uniform3uiv, glUniform3uivLazy);
+    INSTALL_LAZY(568, uniform4d, glUniform4dLazy);
+    INSTALL_LAZY(569, uniform4dv, glUniform4dvLazy);
+    INSTALL_LAZY(570, uniform4f, glUniform4fLazy);
+    INSTALL_LAZY(571, uniform4fv, glUniform4fvLazy);
+    INSTALL_LAZY(572, uniform4i, glUniform4iLazy);
+    INSTALL_LAZY(573, uniform4iv, glUniform4ivLazy);
+    INSTALL_LAZY(574, uniform4ui, glUniform4uiLazy);
+    INSTALL_LAZY(575, uniform4uiv, glUniform4uivLazy);
+    INSTALL_LAZY(576, uniformBlockBinding, glUniformBlockBindingLazy);
+    INSTALL_LAZY(577, uniformMatrix2dv, glUniformMatrix2dvLazy);
+    INSTALL_LAZY(578, uniformMatrix2fv, glUniformMatrix2fvLazy);
+    INSTALL_LAZY(579, uniformMatrix2x3dv, glUniformMatrix2x3dvLazy);
+    INSTALL_LAZY(580, uniformMatrix2x3fv, glUniformMatrix2x3fvLazy);
+    INSTALL_LAZY(581, uniformMatrix2x4dv, glUniformMatrix2x4dvLazy);
+    INSTALL_LAZY(582, uniformMatrix2x4fv, glUniformMatrix2x4fvLazy);
+    INSTALL_LAZY(583, uniformMatrix3dv, glUniformMatrix3dvLazy);
+    INSTALL_LAZY(584, uniformMatrix3fv, glUniformMatrix3fvLazy);
+    INSTALL_LAZY(585, uniformMatrix3x2dv, glUniformMatrix3x2dvLazy);
+    INSTALL_LAZY(586, uniformMatrix3x2fv, glUniformMatrix3x2fvLazy);
+    INSTALL_LAZY(587, uniformMatrix3x4dv, glUniformMatrix3x4dvLazy);
+    INSTALL_LAZY(588, uniformMatrix3x4fv, glUniformMatrix3x4fvLazy);
+    INSTALL_LAZY(589, uniformMatrix4dv, glUniformMatrix4dvLazy);
+    INSTALL_LAZY(590, uniformMatrix4fv, glUniformMatrix4fvLazy);
+    INSTALL_LAZY(591, uniformMatrix4x2dv, glUniformMatrix4x2dvLazy);
+    INSTALL_LAZY(592, uniformMatrix4x2fv, glUniformMatrix4x2fvLazy);
+    INSTALL_LAZY(593, uniformMatrix4x3dv, glUniformMatrix4x3dvLazy);
+    INSTALL_LAZY(594, uniformMatrix4x3fv, glUniformMatrix4x3fvLazy);
+    INSTALL_LAZY(595, uniformSubroutinesuiv, glUniformSubroutinesuivLazy);
+    INSTALL_LAZY(596, unmapBuffer, glUnmapBufferLazy);
+    INSTALL_LAZY(597, unmapNamedBuffer, glUnmapNamedBufferLazy);
+    INSTALL_LAZY(598, useProgram, glUseProgramLazy);
+    INSTALL_LAZY(599, useProgramStages, glUseProgramStagesLazy);
+    INSTALL_LAZY(600, validateProgram, glValidateProgramLazy);
+    INSTALL_LAZY(601, validateProgramPipeline, glValidateProgramPipelineLazy);
+    INSTALL_LAZY(602, vertexArrayAttribBinding, glVertexArrayAttribBindingLazy);
+    INSTALL_LAZY(603, vertexArrayAttribFormat, glVertexArrayAttribFormatLazy);
+    INSTALL_LAZY(604, vertexArrayAttribIFormat, glVertexArrayAttribIFormatLazy);
+    INSTALL_LAZY(605, vertexArrayAttribLFormat, glVertexArrayAttribLFormatLazy);
+    INSTALL_LAZY(606, vertexArrayBindingDivisor, glVertexArrayBindingDivisorLazy);
+    INSTALL_LAZY(607, vertexArrayElementBuffer, glVertexArrayElementBufferLazy);
+    INSTALL_LAZY(608, vertexArrayVertexBuffer, glVertexArrayVertexBufferLazy);
+    INSTALL_LAZY(609, vertexArrayVertexBuffers, glVertexArrayVertexBuffersLazy);
+    INSTALL_LAZY(610, vertexAttrib1d, glVertexAttrib1dLazy);
+    INSTALL_LAZY(611, vertexAttrib1dv, glVertexAttrib1dvLazy);
+    INSTALL_LAZY(612, vertexAttrib1f, glVertexAttrib1fLazy);
+    INSTALL_LAZY(613, vertexAttrib1fv, glVertexAttrib1fvLazy);
+    INSTALL_LAZY(614, vertexAttrib1s, glVertexAttrib1sLazy);
+    INSTALL_LAZY(615, vertexAttrib1sv, glVertexAttrib1svLazy);
+    INSTALL_LAZY(616, vertexAttrib2d, glVertexAttrib2dLazy);
+    INSTALL_LAZY(617, vertexAttrib2dv, glVertexAttrib2dvLazy);
+    INSTALL_LAZY(618, vertexAttrib2f, glVertexAttrib2fLazy);
+    INSTALL_LAZY(619, vertexAttrib2fv, glVertexAttrib2fvLazy);
+    INSTALL_LAZY(620, vertexAttrib2s, glVertexAttrib2sLazy);
+    INSTALL_LAZY(621, vertexAttrib2sv, glVertexAttrib2svLazy);
+    INSTALL_LAZY(622, vertexAttrib3d, glVertexAttrib3dLazy);
+    INSTALL_LAZY(623, vertexAttrib3dv, glVertexAttrib3dvLazy);
+    INSTALL_LAZY(624, vertexAttrib3f, glVertexAttrib3fLazy);
+    INSTALL_LAZY(625, vertexAttrib3fv, glVertexAttrib3fvLazy);
+    INSTALL_LAZY(626, vertexAttrib3s, glVertexAttrib3sLazy);
+    INSTALL_LAZY(627, vertexAttrib3sv, glVertexAttrib3svLazy);
+    INSTALL_LAZY(628, vertexAttrib4Nbv, glVertexAttrib4NbvLazy);
+    INSTALL_LAZY(629, vertexAttrib4Niv, glVertexAttrib4NivLazy);
+    INSTALL_LAZY(630, vertexAttrib4Nsv, glVertexAttrib4NsvLazy);
+    INSTALL_LAZY(631, vertexAttrib4Nub, glVertexAttrib4NubLazy);
+    INSTALL_LAZY(632, vertexAttrib4Nubv, glVertexAttrib4NubvLazy);
+    INSTALL_LAZY(633, vertexAttrib4Nuiv, glVertexAttrib4NuivLazy);
+    INSTALL_LAZY(634, vertexAttrib4Nusv, glVertexAttrib4NusvLazy);
+    INSTALL_LAZY(635, vertexAttrib4bv, glVertexAttrib4bvLazy);
+    INSTALL_LAZY(636, vertexAttrib4d, glVertexAttrib4dLazy);
+    INSTALL_LAZY(637, vertexAttrib4dv, glVertexAttrib4dvLazy);
+    INSTALL_LAZY(638, vertexAttrib4f, glVertexAttrib4fLazy);
+    INSTALL_LAZY(639, vertexAttrib4fv, glVertexAttrib4fvLazy);
+    INSTALL_LAZY(640, vertexAttrib4iv, glVertexAttrib4ivLazy);
+    INSTALL_LAZY(641, vertexAttrib4s, glVertexAttrib4sLazy);
+    INSTALL_LAZY(642, vertexAttrib4sv, glVertexAttrib4svLazy);
+    INSTALL_LAZY(643, vertexAttrib4ubv, glVertexAttrib4ubvLazy);
+    INSTALL_LAZY(644, vertexAttrib4uiv, glVertexAttrib4uivLazy);
+    INSTALL_LAZY(645, vertexAttrib4usv, glVertexAttrib4usvLazy);
+    INSTALL_LAZY(646, vertexAttribBinding, glVertexAttribBindingLazy);
+    INSTALL_LAZY(647, vertexAttribDivisor, glVertexAttribDivisorLazy);
+    INSTALL_LAZY(648, vertexAttribFormat, glVertexAttribFormatLazy);
+    INSTALL_LAZY(649, vertexAttribI1i, glVertexAttribI1iLazy);
+    INSTALL_LAZY(650, vertexAttribI1iv, glVertexAttribI1ivLazy);
+    INSTALL_LAZY(651, vertexAttribI1ui, glVertexAttribI1uiLazy);
+    INSTALL_LAZY(652, vertexAttribI1uiv, glVertexAttribI1uivLazy);
+    INSTALL_LAZY(653, vertexAttribI2i, glVertexAttribI2iLazy);
+    INSTALL_LAZY(654, vertexAttribI2iv, glVertexAttribI2ivLazy);
+    INSTALL_LAZY(655, vertexAttribI2ui, glVertexAttribI2uiLazy);
+    INSTALL_LAZY(656, vertexAttribI2uiv, glVertexAttribI2uivLazy);
+    INSTALL_LAZY(657, vertexAttribI3i, glVertexAttribI3iLazy);
+    INSTALL_LAZY(658, vertexAttribI3iv, glVertexAttribI3ivLazy);
+    INSTALL_LAZY(659, vertexAttribI3ui, glVertexAttribI3uiLazy);
+    INSTALL_LAZY(660, vertexAttribI3uiv, glVertexAttribI3uivLazy);
+    INSTALL_LAZY(661, vertexAttribI4bv, glVertexAttribI4bvLazy);
+    INSTALL_LAZY(662, vertexAttribI4i, glVertexAttribI4iLazy);
+    INSTALL_LAZY(663, vertexAttribI4iv, glVertexAttribI4ivLazy);
+    INSTALL_LAZY(664, vertexAttribI4sv, glVertexAttribI4svLazy);
+    INSTALL_LAZY(665, vertexAttribI4ubv, glVertexAttribI4ubvLazy);
+    INSTALL_LAZY(666, vertexAttribI4ui, glVertexAttribI4uiLazy);
+    INSTALL_LAZY(667, vertexAttribI4uiv, glVertexAttribI4uivLazy);
+    INSTALL_LAZY(668, vertexAttribI4usv, glVertexAttribI4usvLazy);
+    INSTALL_LAZY(669, vertexAttribIFormat, glVertexAttribIFormatLazy);
+    INSTALL_LAZY(670, vertexAttribIPointer, glVertexAttribIPointerLazy);
+    INSTALL_LAZY(671, vertexAttribL1d, glVertexAttribL1dLazy);
+    INSTALL_LAZY(672, vertexAttribL1dv, glVertexAttribL1dvLazy);
+    INSTALL_LAZY(673, vertexAttribL2d, glVertexAttribL2dLazy);
+    INSTALL_LAZY(674, vertexAttribL2dv, glVertexAttribL2dvLazy);
+    INSTALL_LAZY(675, vertexAttribL3d, glVertexAttribL3dLazy);
+    INSTALL_LAZY(676, vertexAttribL3dv, glVertexAttribL3dvLazy);
+    INSTALL_LAZY(677, vertexAttribL4d, glVertexAttribL4dLazy);
+    INSTALL_LAZY(678, vertexAttribL4dv, glVertexAttribL4dvLazy);
+    INSTALL_LAZY(679, vertexAttribLFormat, glVertexAttribLFormatLazy);
+    INSTALL_LAZY(680, vertexAttribLPointer, glVertexAttribLPointerLazy);
+    INSTALL_LAZY(681, vertexAttribP1ui, glVertexAttribP1uiLazy);
+    INSTALL_LAZY(682, vertexAttribP1uiv, glVertexAttribP1uivLazy);
+    INSTALL_LAZY(683, vertexAttribP2ui, glVertexAttribP2uiLazy);
+    INSTALL_LAZY(684, vertexAttribP2uiv, glVertexAttribP2uivLazy);
+    INSTALL_LAZY(685, vertexAttribP3ui, glVertexAttribP3uiLazy);
+    INSTALL_LAZY(686, vertexAttribP3uiv, glVertexAttribP3uivLazy);
+    INSTALL_LAZY(687, vertexAttribP4ui, glVertexAttribP4uiLazy);
+    INSTALL_LAZY(688, vertexAttribP4uiv, glVertexAttribP4uivLazy);
+    INSTALL_LAZY(689, vertexAttribPointer, glVertexAttribPointerLazy);
+    INSTALL_LAZY(690, vertexBindingDivisor, glVertexBindingDivisorLazy);
+    INSTALL_LAZY(691, viewport, glViewportLazy);
+    INSTALL_LAZY(692, viewportArrayv, glViewportArrayvLazy);
+    INSTALL_LAZY(693, viewportIndexedf, glViewportIndexedfLazy);
+    INSTALL_LAZY(694, viewportIndexedfv, glViewportIndexedfvLazy);
+    INSTALL_LAZY(695, waitSync, glWaitSyncLazy);
+}
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
 void DispatchTableGL::initProcsDesktopGL(const gl::Version &version,
                                          const std::set<std::string> &extensions)
 {
     if (version >= gl::Version(1, 0))
     {
-        ASSIGN("glBlendFunc", blendFunc);
-        ASSIGN("glClear", clear);
-        ASSIGN("glClearColor", clearColor);
-        ASSIGN("glClearDepth", clearDepth);
-        ASSIGN("glClearStencil", clearStencil);
-        ASSIGN("glColorMask", colorMask);
-        ASSIGN("glCullFace", cullFace);
-        ASSIGN("glDepthFunc", depthFunc);
-        ASSIGN("glDepthMask", depthMask);
-        ASSIGN("glDepthRange", depthRange);
-        ASSIGN("glDisable", disable);
-        ASSIGN("glDrawBuffer", drawBuffer);
-        ASSIGN("glEnable", enable);
-        ASSIGN("glFinish", finish);
-        ASSIGN("glFlush", flush);
-        ASSIGN("glFrontFace", frontFace);
-        ASSIGN("glGetBooleanv", getBooleanv);
-        ASSIGN("glGetDoublev", getDoublev);
-        ASSIGN("glGetError", getError);
-        ASSIGN("glGetFloatv", getFloatv);
-        ASSIGN("glGetIntegerv", getIntegerv);
-        ASSIGN("glGetString", getString);
-        ASSIGN("glGetTexImage", getTexImage);
-        ASSIGN("glGetTexLevelParameterfv", getTexLevelParameterfv);
-        ASSIGN("glGetTexLevelParameteriv", getTexLevelParameteriv);
-        ASSIGN("glGetTexParameterfv", getTexParameterfv);
-        ASSIGN("glGetTexParameteriv", getTexParameteriv);
-        ASSIGN("glHint", hint);
-        ASSIGN("glIsEnabled", isEnabled);
-        ASSIGN("glLineWidth", lineWidth);
-        ASSIGN("glLogicOp", logicOp);
-        ASSIGN("glPixelStoref", pixelStoref);
-        ASSIGN("glPixelStorei", pixelStorei);
-        ASSIGN("glPointSize", pointSize);
-        ASSIGN("glPolygonMode", polygonMode);
-        ASSIGN("glReadBuffer", readBuffer);
-        ASSIGN("glReadPixels", readPixels);
-        ASSIGN("glScissor", scissor);
-        ASSIGN("glStencilFunc", stencilFunc);
-        ASSIGN("glStencilMask", stencilMask);
-        ASSIGN("glStencilOp", stencilOp);
-        ASSIGN("glTexImage1D", texImage1D);
-        ASSIGN("glTexImage2D", texImage2D);
-        ASSIGN("glTexParameterf", texParameterf);
-        ASSIGN("glTexParameterfv", texParameterfv);
-        ASSIGN("glTexParameteri", texParameteri);
-        ASSIGN("glTexParameteriv", texParameteriv);
-        ASSIGN("glViewport", viewport);
+        ASSIGN_CORE(glBlendFunc, blendFunc);
+        ASSIGN_CORE(glClear, clear);
+        ASSIGN_CORE(glClearColor, clearColor);
+        ASSIGN_CORE(glClearDepth, clearDepth);
+        ASSIGN_CORE(glClearStencil, clearStencil);
+        ASSIGN_CORE(glColorMask, colorMask);
+        ASSIGN_CORE(glCullFace, cullFace);
+        ASSIGN_CORE(glDepthFunc, depthFunc);
+        ASSIGN_CORE(glDepthMask, depthMask);
+        ASSIGN_CORE(glDepthRange, depthRange);
+        ASSIGN_CORE(glDisable, disable);
+        ASSIGN_CORE(glDrawBuffer, drawBuffer);
+        ASSIGN_CORE(glEnable, enable);
+        ASSIGN_CORE(glFinish, finish);
+        ASSIGN_CORE(glFlush, flush);
+        ASSIGN_CORE(glFrontFace, frontFace);
+        ASSIGN_CORE(glGetBooleanv, getBooleanv);
+        ASSIGN_CORE(glGetDoublev, getDoublev);
+        ASSIGN_CORE(glGetError, getError);
+        ASSIGN_CORE(glGetFloatv, getFloatv);
+        ASSIGN_CORE(glGetIntegerv, getIntegerv);
+        ASSIGN_CORE(glGetString, getString);
+        ASSIGN_CORE(glGetTexImage, getTexImage);
+        ASSIGN_CORE(glGetTexLevelParameterfv, getTexLevelParameterfv);
+        ASSIGN_CORE(glGetTexLevelParameteriv, getTexLevelParameteriv);
+        ASSIGN_CORE(glGetTexParameterfv, getTexParameterfv);
+        ASSIGN_CORE(glGetTexParameteriv, getTexParameteriv);
+        ASSIGN_CORE(glHint, hint);
+        ASSIGN_CORE(glIsEnabled, isEnabled);
+        ASSIGN_CORE(glLineWidth, lineWidth);
+        ASSIGN_CORE(glLogicOp, logicOp);
+        ASSIGN_CORE(glPixelStoref, pixelStoref);
+        ASSIGN_CORE(glPixelStorei, pixelStorei);
+        ASSIGN_CORE(glPointSize, pointSize);
+        ASSIGN_CORE(glPolygonMode, polygonMode);
+        ASSIGN_CORE(glReadBuffer, readBuffer);
+        ASSIGN_CORE(glReadPixels, readPixels);
+        ASSIGN_CORE(glScissor, scissor);
+        ASSIGN_CORE(glStencilFunc, stencilFunc);
+        ASSIGN_CORE(glStencilMask, stencilMask);
+        ASSIGN_CORE(glStencilOp, stencilOp);
+        ASSIGN_CORE(glTexImage1D, texImage1D);
+        ASSIGN_CORE(glTexImage2D, texImage2D);
+        ASSIGN_CORE(glTexParameterf, texParameterf);
+        ASSIGN_CORE(glTexParameterfv, texParameterfv);
+        ASSIGN_CORE(glTexParameteri, texParameteri);
+        ASSIGN_CORE(glTexParameteriv, texParameteriv);
+        ASSIGN_CORE(glViewport, viewport);
     }
 
     if (version >= gl::Version(1, 1))
     {
-        ASSIGN("glBindTexture", bindTexture);
-        ASSIGN("glCopyTexImage1D", copyTexImage1D);
-        ASSIGN("glCopyTexImage2D", copyTexImage2D);
-        ASSIGN("glCopyTexSubImage1D", copyTexSubImage1D);
-        ASSIGN("glCopyTexSubImage2D", copyTexSubImage2D);
-        ASSIGN("glDeleteTextures", deleteTextures);
-        ASSIGN("glDrawArrays", drawArrays);
-        ASSIGN("glDrawElements", drawElements);
-        ASSIGN("glGenTextures", genTextures);
-        ASSIGN("glIsTexture", isTexture);
-        ASSIGN("glPolygonOffset", polygonOffset);
-        ASSIGN("glTexSubImage1D", texSubImage1D);
-        ASSIGN("glTexSubImage2D", texSubImage2D);
+        ASSIGN_CORE(glBindTexture, bindTexture);
+        ASSIGN_CORE(glCopyTexImage1D, copyTexImage1D);
+        ASSIGN_CORE(glCopyTexImage2D, copyTexImage2D);
+        ASSIGN_CORE(glCopyTexSubImage1D, copyTexSubImage1D);
+        ASSIGN_CORE(glCopyTexSubImage2D, copyTexSubImage2D);
+        ASSIGN_CORE(glDeleteTextures, deleteTextures);
+        ASSIGN_CORE(glDrawArrays, drawArrays);
+        ASSIGN_CORE(glDrawElements, drawElements);
+        ASSIGN_CORE(glGenTextures, genTextures);
+        ASSIGN_CORE(glIsTexture, isTexture);
+        ASSIGN_CORE(glPolygonOffset, polygonOffset);
+        ASSIGN_CORE(glTexSubImage1D, texSubImage1D);
+        ASSIGN_CORE(glTexSubImage2D, texSubImage2D);
     }
 
     if (version >= gl::Version(1, 2))
     {
-        ASSIGN("glCopyTexSubImage3D", copyTexSubImage3D);
-        ASSIGN("glDrawRangeElements", drawRangeElements);
-        ASSIGN("glTexImage3D", texImage3D);
-        ASSIGN("glTexSubImage3D", texSubImage3D);
+        ASSIGN_CORE(glCopyTexSubImage3D, copyTexSubImage3D);
+        ASSIGN_CORE(glDrawRangeElements, drawRangeElements);
+        ASSIGN_CORE(glTexImage3D, texImage3D);
+        ASSIGN_CORE(glTexSubImage3D, texSubImage3D);
     }
 
     if (version >= gl::Version(1, 3))
     {
-        ASSIGN("glActiveTexture", activeTexture);
-        ASSIGN("glCompressedTexImage1D", compressedTexImage1D);
-        ASSIGN("glCompressedTexImage2D", compressedTexImage2D);
-        ASSIGN("glCompressedTexImage3D", compressedTexImage3D);
-        ASSIGN("glCompressedTexSubImage1D", compressedTexSubImage1D);
-        ASSIGN("glCompressedTexSubImage2D", compressedTexSubImage2D);
-        ASSIGN("glCompressedTexSubImage3D", compressedTexSubImage3D);
-        ASSIGN("glGetCompressedTexImage", getCompressedTexImage);
-        ASSIGN("glSampleCoverage", sampleCoverage);
+        ASSIGN_CORE(glActiveTexture, activeTexture);
+        ASSIGN_CORE(glCompressedTexImage1D, compressedTexImage1D);
+        ASSIGN_CORE(glCompressedTexImage2D, compressedTexImage2D);
+        ASSIGN_CORE(glCompressedTexImage3D, compressedTexImage3D);
+        ASSIGN_CORE(glCompressedTexSubImage1D, compressedTexSubImage1D);
+        ASSIGN_CORE(glCompressedTexSubImage2D, compressedTexSubImage2D);
+        ASSIGN_CORE(glCompressedTexSubImage3D, compressedTexSubImage3D);
+        ASSIGN_CORE(glGetCompressedTexImage, getCompressedTexImage);
+        ASSIGN_CORE(glSampleCoverage, sampleCoverage);
     }
 
     if (version >= gl::Version(1, 4))
     {
-        ASSIGN("glBlendColor", blendColor);
-        ASSIGN("glBlendEquation", blendEquation);
-        ASSIGN("glBlendFuncSeparate", blendFuncSeparate);
-        ASSIGN("glMultiDrawArrays", multiDrawArrays);
-        ASSIGN("glMultiDrawElements", multiDrawElements);
-        ASSIGN("glPointParameterf", pointParameterf);
-        ASSIGN("glPointParameterfv", pointParameterfv);
-        ASSIGN("glPointParameteri", pointParameteri);
-        ASSIGN("glPointParameteriv", pointParameteriv);
+        ASSIGN_CORE(glBlendColor, blendColor);
+        ASSIGN_CORE(glBlendEquation, blendEquation);
+        ASSIGN_CORE(glBlendFuncSeparate, blendFuncSeparate);
+        ASSIGN_CORE(glMultiDrawArrays, multiDrawArrays);
+        ASSIGN_CORE(glMultiDrawElements, multiDrawElements);
+        ASSIGN_CORE(glPointParameterf, pointParameterf);
+        ASSIGN_CORE(glPointParameterfv, pointParameterfv);
+        ASSIGN_CORE(glPointParameteri, pointParameteri);
+        ASSIGN_CORE(glPointParameteriv, pointParameteriv);
     }
 
     if (version >= gl::Version(1, 5))
     {
-        ASSIGN("glBeginQuery", beginQuery);
-        ASSIGN("glBindBuffer", bindBuffer);
-        ASSIGN("glBufferData", bufferData);
-        ASSIGN("glBufferSubData", bufferSubData);
-        ASSIGN("glDeleteBuffers", deleteBuffers);
-        ASSIGN("glDeleteQueries", deleteQueries);
-        ASSIGN("glEndQuery", endQuery);
-        ASSIGN("glGenBuffers", genBuffers);
-        ASSIGN("glGenQueries", genQueries);
-        ASSIGN("glGetBufferParameteriv", getBufferParameteriv);
-        ASSIGN("glGetBufferPointerv", getBufferPointerv);
-        ASSIGN("glGetBufferSubData", getBufferSubData);
-        ASSIGN("glGetQueryObjectiv", getQueryObjectiv);
-        ASSIGN("glGetQueryObjectuiv", getQueryObjectuiv);
-        ASSIGN("glGetQueryiv", getQueryiv);
-        ASSIGN("glIsBuffer", isBuffer);
-        ASSIGN("glIsQuery", isQuery);
-        ASSIGN("glMapBuffer", mapBuffer);
-        ASSIGN("glUnmapBuffer", unmapBuffer);
+        ASSIGN_CORE(glBeginQuery, beginQuery);
+        ASSIGN_CORE(glBindBuffer, bindBuffer);
+        ASSIGN_CORE(glBufferData, bufferData);
+        ASSIGN_CORE(glBufferSubData, bufferSubData);
+        ASSIGN_CORE(glDeleteBuffers, deleteBuffers);
+        ASSIGN_CORE(glDeleteQueries, deleteQueries);
+        ASSIGN_CORE(glEndQuery, endQuery);
+        ASSIGN_CORE(glGenBuffers, genBuffers);
+        ASSIGN_CORE(glGenQueries, genQueries);
+        ASSIGN_CORE(glGetBufferParameteriv, getBufferParameteriv);
+        ASSIGN_CORE(glGetBufferPointerv, getBufferPointerv);
+        ASSIGN_CORE(glGetBufferSubData, getBufferSubData);
+        ASSIGN_CORE(glGetQueryObjectiv, getQueryObjectiv);
+        ASSIGN_CORE(glGetQueryObjectuiv, getQueryObjectuiv);
+        ASSIGN_CORE(glGetQueryiv, getQueryiv);
+        ASSIGN_CORE(glIsBuffer, isBuffer);
+        ASSIGN_CORE(glIsQuery, isQuery);
+        ASSIGN_CORE(glMapBuffer, mapBuffer);
+        ASSIGN_CORE(glUnmapBuffer, unmapBuffer);
     }
 
     if (version >= gl::Version(2, 0))
     {
-        ASSIGN("glAttachShader", attachShader);
-        ASSIGN("glBindAttribLocation", bindAttribLocation);
-        ASSIGN("glBlendEquationSeparate", blendEquationSeparate);
-        ASSIGN("glCompileShader", compileShader);
-        ASSIGN("glCreateProgram", createProgram);
-        ASSIGN("glCreateShader", createShader);
-        ASSIGN("glDeleteProgram", deleteProgram);
-        ASSIGN("glDeleteShader", deleteShader);
-        ASSIGN("glDetachShader", detachShader);
-        ASSIGN("glDisableVertexAttribArray", disableVertexAttribArray);
-        ASSIGN("glDrawBuffers", drawBuffers);
-        ASSIGN("glEnableVertexAttribArray", enableVertexAttribArray);
-        ASSIGN("glGetActiveAttrib", getActiveAttrib);
-        ASSIGN("glGetActiveUniform", getActiveUniform);
-        ASSIGN("glGetAttachedShaders", getAttachedShaders);
-        ASSIGN("glGetAttribLocation", getAttribLocation);
-        ASSIGN("glGetProgramInfoLog", getProgramInfoLog);
-        ASSIGN("glGetProgramiv", getProgramiv);
-        ASSIGN("glGetShaderInfoLog", getShaderInfoLog);
-        ASSIGN("glGetShaderSource", getShaderSource);
-        ASSIGN("glGetShaderiv", getShaderiv);
-        ASSIGN("glGetUniformLocation", getUniformLocation);
-        ASSIGN("glGetUniformfv", getUniformfv);
-        ASSIGN("glGetUniformiv", getUniformiv);
-        ASSIGN("glGetVertexAttribPointerv", getVertexAttribPointerv);
-        ASSIGN("glGetVertexAttribdv", getVertexAttribdv);
-        ASSIGN("glGetVertexAttribfv", getVertexAttribfv);
-        ASSIGN("glGetVertexAttribiv", getVertexAttribiv);
-        ASSIGN("glIsProgram", isProgram);
-        ASSIGN("glIsShader", isShader);
-        ASSIGN("glLinkProgram", linkProgram);
-        ASSIGN("glShaderSource", shaderSource);
-        ASSIGN("glStencilFuncSeparate", stencilFuncSeparate);
-        ASSIGN("glStencilMaskSeparate", stencilMaskSeparate);
-        ASSIGN("glStencilOpSeparate", stencilOpSeparate);
-        ASSIGN("glUniform1f", uniform1f);
-        ASSIGN("glUniform1fv", uniform1fv);
-        ASSIGN("glUniform1i", uniform1i);
-        ASSIGN("glUniform1iv", uniform1iv);
-        ASSIGN("glUniform2f", uniform2f);
-        ASSIGN("glUniform2fv", uniform2fv);
-        ASSIGN("glUniform2i", uniform2i);
-        ASSIGN("glUniform2iv", uniform2iv);
-        ASSIGN("glUniform3f", uniform3f);
-        ASSIGN("glUniform3fv", uniform3fv);
-        ASSIGN("glUniform3i", uniform3i);
-        ASSIGN("glUniform3iv", uniform3iv);
-        ASSIGN("glUniform4f", uniform4f);
-        ASSIGN("glUniform4fv", uniform4fv);
-        ASSIGN("glUniform4i", uniform4i);
-        ASSIGN("glUniform4iv", uniform4iv);
-        ASSIGN("glUniformMatrix2fv", uniformMatrix2fv);
-        ASSIGN("glUniformMatrix3fv", uniformMatrix3fv);
-        ASSIGN("glUniformMatrix4fv", uniformMatrix4fv);
-        ASSIGN("glUseProgram", useProgram);
-        ASSIGN("glValidateProgram", validateProgram);
-        ASSIGN("glVertexAttrib1d", vertexAttrib1d);
-        ASSIGN("glVertexAttrib1dv", vertexAttrib1dv);
-        ASSIGN("glVertexAttrib1f", vertexAttrib1f);
-        ASSIGN("glVertexAttrib1fv", vertexAttrib1fv);
-        ASSIGN("glVertexAttrib1s", vertexAttrib1s);
-        ASSIGN("glVertexAttrib1sv", vertexAttrib1sv);
-        ASSIGN("glVertexAttrib2d", vertexAttrib2d);
-        ASSIGN("glVertexAttrib2dv", vertexAttrib2dv);
-        ASSIGN("glVertexAttrib2f", vertexAttrib2f);
-        ASSIGN("glVertexAttrib2fv", vertexAttrib2fv);
-        ASSIGN("glVertexAttrib2s", vertexAttrib2s);
-        ASSIGN("glVertexAttrib2sv", vertexAttrib2sv);
-        ASSIGN("glVertexAttrib3d", vertexAttrib3d);
-        ASSIGN("glVertexAttrib3dv", vertexAttrib3dv);
-        ASSIGN("glVertexAttrib3f", vertexAttrib3f);
-        ASSIGN("glVertexAttrib3fv", vertexAttrib3fv);
-        ASSIGN("glVertexAttrib3s", vertexAttrib3s);
-        ASSIGN("glVertexAttrib3sv", vertexAttrib3sv);
-        ASSIGN("glVertexAttrib4Nbv", vertexAttrib4Nbv);
-        ASSIGN("glVertexAttrib4Niv", vertexAttrib4Niv);
-        ASSIGN("glVertexAttrib4Nsv", vertexAttrib4Nsv);
-        ASSIGN("glVertexAttrib4Nub", vertexAttrib4Nub);
-        ASSIGN("glVertexAttrib4Nubv", vertexAttrib4Nubv);
-        ASSIGN("glVertexAttrib4Nuiv", vertexAttrib4Nuiv);
-        ASSIGN("glVertexAttrib4Nusv", vertexAttrib4Nusv);
-        ASSIGN("glVertexAttrib4bv", vertexAttrib4bv);
-        ASSIGN("glVertexAttrib4d", vertexAttrib4d);
-        ASSIGN("glVertexAttrib4dv", vertexAttrib4dv);
-        ASSIGN("glVertexAttrib4f", vertexAttrib4f);
-        ASSIGN("glVertexAttrib4fv", vertexAttrib4fv);
-        ASSIGN("glVertexAttrib4iv", vertexAttrib4iv);
-        ASSIGN("glVertexAttrib4s", vertexAttrib4s);
-        ASSIGN("glVertexAttrib4sv", vertexAttrib4sv);
-        ASSIGN("glVertexAttrib4ubv", vertexAttrib4ubv);
-        ASSIGN("glVertexAttrib4uiv", vertexAttrib4uiv);
-        ASSIGN("glVertexAttrib4usv", vertexAttrib4usv);
-        ASSIGN("glVertexAttribPointer", vertexAttribPointer);
+        ASSIGN_CORE(glAttachShader, attachShader);
+        ASSIGN_CORE(glBindAttribLocation, bindAttribLocation);
+        ASSIGN_CORE(glBlendEquationSeparate, blendEquationSeparate);
+        ASSIGN_CORE(glCompileShader, compileShader);
+        ASSIGN_CORE(glCreateProgram, createProgram);
+        ASSIGN_CORE(glCreateShader, createShader);
+        ASSIGN_CORE(glDeleteProgram, deleteProgram);
+        ASSIGN_CORE(glDeleteShader, deleteShader);
+        ASSIGN_CORE(glDetachShader, detachShader);
+        ASSIGN_CORE(glDisableVertexAttribArray, disableVertexAttribArray);
+        ASSIGN_CORE(glDrawBuffers, drawBuffers);
+        ASSIGN_CORE(glEnableVertexAttribArray, enableVertexAttribArray);
+        ASSIGN_CORE(glGetActiveAttrib, getActiveAttrib);
+        ASSIGN_CORE(glGetActiveUniform, getActiveUniform);
+        ASSIGN_CORE(glGetAttachedShaders, getAttachedShaders);
+        ASSIGN_CORE(glGetAttribLocation, getAttribLocation);
+        ASSIGN_CORE(glGetProgramInfoLog, getProgramInfoLog);
+        ASSIGN_CORE(glGetProgramiv, getProgramiv);
+        ASSIGN_CORE(glGetShaderInfoLog, getShaderInfoLog);
+        ASSIGN_CORE(glGetShaderSource, getShaderSource);
+        ASSIGN_CORE(glGetShaderiv, getShaderiv);
+        ASSIGN_CORE(glGetUniformLocation, getUniformLocation);
+        ASSIGN_CORE(glGetUniformfv, getUniformfv);
+        ASSIGN_CORE(glGetUniformiv, getUniformiv);
+        ASSIGN_CORE(glGetVertexAttribPointerv, getVertexAttribPointerv);
+        ASSIGN_CORE(glGetVertexAttribdv, getVertexAttribdv);
+        ASSIGN_CORE(glGetVertexAttribfv, getVertexAttribfv);
+        ASSIGN_CORE(glGetVertexAttribiv, getVertexAttribiv);
+        ASSIGN_CORE(glIsProgram, isProgram);
+        ASSIGN_CORE(glIsShader, isShader);
+        ASSIGN_CORE(glLinkProgram, linkProgram);
+        ASSIGN_CORE(glShaderSource, shaderSource);
+        ASSIGN_CORE(glStencilFuncSeparate, stencilFuncSeparate);
+        ASSIGN_CORE(glStencilMaskSeparate, stencilMaskSeparate);
+        ASSIGN_CORE(glStencilOpSeparate, stencilOpSeparate);
+        ASSIGN_CORE(glUniform1f, uniform1f);
+        ASSIGN_CORE(glUniform1fv, uniform1fv);
+        ASSIGN_CORE(glUniform1i, uniform1i);
+        ASSIGN_CORE(glUniform1iv, uniform1iv);
+        ASSIGN_CORE(glUniform2f, uniform2f);
+        ASSIGN_CORE(glUniform2fv, uniform2fv);
+        ASSIGN_CORE(glUniform2i, uniform2i);
+        ASSIGN_CORE(glUniform2iv, uniform2iv);
+        ASSIGN_CORE(glUniform3f, uniform3f);
+        ASSIGN_CORE(glUniform3fv, uniform3fv);
+        ASSIGN_CORE(glUniform3i, uniform3i);
+        ASSIGN_CORE(glUniform3iv, uniform3iv);
+        ASSIGN_CORE(glUniform4f, uniform4f);
+        ASSIGN_CORE(glUniform4fv, uniform4fv);
+        ASSIGN_CORE(glUniform4i, uniform4i);
+        ASSIGN_CORE(glUniform4iv, uniform4iv);
+        ASSIGN_CORE(glUniformMatrix2fv, uniformMatrix2fv);
+        ASSIGN_CORE(glUniformMatrix3fv, uniformMatrix3fv);
+        ASSIGN_CORE(glUniformMatrix4fv, uniformMatrix4fv);
+        ASSIGN_CORE(glUseProgram, useProgram);
+        ASSIGN_CORE(glValidateProgram, validateProgram);
+        ASSIGN_CORE(glVertexAttrib1d, vertexAttrib1d);
+        ASSIGN_CORE(glVertexAttrib1dv, vertexAttrib1dv);
+        ASSIGN_CORE(glVertexAttrib1f, vertexAttrib1f);
+        ASSIGN_CORE(glVertexAttrib1fv, vertexAttrib1fv);
+        ASSIGN_CORE(glVertexAttrib1s, vertexAttrib1s);
+        ASSIGN_CORE(glVertexAttrib1sv, vertexAttrib1sv);
+        ASSIGN_CORE(glVertexAttrib2d, vertexAttrib2d);
+        ASSIGN_CORE(glVertexAttrib2dv, vertexAttrib2dv);
+        ASSIGN_CORE(glVertexAttrib2f, vertexAttrib2f);
+        ASSIGN_CORE(glVertexAttrib2fv, vertexAttrib2fv);
+        ASSIGN_CORE(glVertexAttrib2s, vertexAttrib2s);
+        ASSIGN_CORE(glVertexAttrib2sv, vertexAttrib2sv);
+        ASSIGN_CORE(glVertexAttrib3d, vertexAttrib3d);
+        ASSIGN_CORE(glVertexAttrib3dv, vertexAttrib3dv);
+        ASSIGN_CORE(glVertexAttrib3f, vertexAttrib3f);
+        ASSIGN_CORE(glVertexAttrib3fv, vertexAttrib3fv);
+        ASSIGN_CORE(glVertexAttrib3s, vertexAttrib3s);
+        ASSIGN_CORE(glVertexAttrib3sv, vertexAttrib3sv);
+        ASSIGN_CORE(glVertexAttrib4Nbv, vertexAttrib4Nbv);
+        ASSIGN_CORE(glVertexAttrib4Niv, vertexAttrib4Niv);
+        ASSIGN_CORE(glVertexAttrib4Nsv, vertexAttrib4Nsv);
+        ASSIGN_CORE(glVertexAttrib4Nub, vertexAttrib4Nub);
+        ASSIGN_CORE(glVertexAttrib4Nubv, vertexAttrib4Nubv);
+        ASSIGN_CORE(glVertexAttrib4Nuiv, vertexAttrib4Nuiv);
+        ASSIGN_CORE(glVertexAttrib4Nusv, vertexAttrib4Nusv);
+        ASSIGN_CORE(glVertexAttrib4bv, vertexAttrib4bv);
+        ASSIGN_CORE(glVertexAttrib4d, vertexAttrib4d);
+        ASSIGN_CORE(glVertexAttrib4dv, vertexAttrib4dv);
+        ASSIGN_CORE(glVertexAttrib4f, vertexAttrib4f);
+        ASSIGN_CORE(glVertexAttrib4fv, vertexAttrib4fv);
+        ASSIGN_CORE(glVertexAttrib4iv, vertexAttrib4iv);
+        ASSIGN_CORE(glVertexAttrib4s, vertexAttrib4s);
+        ASSIGN_CORE(glVertexAttrib4sv, vertexAttrib4sv);
+        ASSIGN_CORE(glVertexAttrib4ubv, vertexAttrib4ubv);
+        ASSIGN_CORE(glVertexAttrib4uiv, vertexAttrib4uiv);
+        ASSIGN_CORE(glVertexAttrib4usv, vertexAttrib4usv);
+        ASSIGN_CORE(glVertexAttribPointer, vertexAttribPointer);
     }
 
     if (version >= gl::Version(2, 1))
     {
-        ASSIGN("glUniformMatrix2x3fv", uniformMatrix2x3fv);
-        ASSIGN("glUniformMatrix2x4fv", uniformMatrix2x4fv);
-        ASSIGN("glUniformMatrix3x2fv", uniformMatrix3x2fv);
-        ASSIGN("glUniformMatrix3x4fv", uniformMatrix3x4fv);
-        ASSIGN("glUniformMatrix4x2fv", uniformMatrix4x2fv);
-        ASSIGN("glUniformMatrix4x3fv", uniformMatrix4x3fv);
+        ASSIGN_CORE(glUniformMatrix2x3fv, uniformMatrix2x3fv);
+        ASSIGN_CORE(glUniformMatrix2x4fv, uniformMatrix2x4fv);
+        ASSIGN_CORE(glUniformMatrix3x2fv, uniformMatrix3x2fv);
+        ASSIGN_CORE(glUniformMatrix3x4fv, uniformMatrix3x4fv);
+        ASSIGN_CORE(glUniformMatrix4x2fv, uniformMatrix4x2fv);
+        ASSIGN_CORE(glUniformMatrix4x3fv, uniformMatrix4x3fv);
     }
 
     if (version >= gl::Version(3, 0))
     {
-        ASSIGN("glBeginConditionalRender", beginConditionalRender);
-        ASSIGN("glBeginTransformFeedback", beginTransformFeedback);
-        ASSIGN("glBindBufferBase", bindBufferBase);
-        ASSIGN("glBindBufferRange", bindBufferRange);
-        ASSIGN("glBindFragDataLocation", bindFragDataLocation);
-        ASSIGN("glBindFramebuffer", bindFramebuffer);
-        ASSIGN("glBindRenderbuffer", bindRenderbuffer);
-        ASSIGN("glBindVertexArray", bindVertexArray);
-        ASSIGN("glBlitFramebuffer", blitFramebuffer);
-        ASSIGN("glCheckFramebufferStatus", checkFramebufferStatus);
-        ASSIGN("glClampColor", clampColor);
-        ASSIGN("glClearBufferfi", clearBufferfi);
-        ASSIGN("glClearBufferfv", clearBufferfv);
-        ASSIGN("glClearBufferiv", clearBufferiv);
-        ASSIGN("glClearBufferuiv", clearBufferuiv);
-        ASSIGN("glColorMaski", colorMaski);
-        ASSIGN("glDeleteFramebuffers", deleteFramebuffers);
-        ASSIGN("glDeleteRenderbuffers", deleteRenderbuffers);
-        ASSIGN("glDeleteVertexArrays", deleteVertexArrays);
-        ASSIGN("glDisablei", disablei);
-        ASSIGN("glEnablei", enablei);
-        ASSIGN("glEndConditionalRender", endConditionalRender);
-        ASSIGN("glEndTransformFeedback", endTransformFeedback);
-        ASSIGN("glFlushMappedBufferRange", flushMappedBufferRange);
-        ASSIGN("glFramebufferRenderbuffer", framebufferRenderbuffer);
-        ASSIGN("glFramebufferTexture1D", framebufferTexture1D);
-        ASSIGN("glFramebufferTexture2D", framebufferTexture2D);
-        ASSIGN("glFramebufferTexture3D", framebufferTexture3D);
-        ASSIGN("glFramebufferTextureLayer", framebufferTextureLayer);
-        ASSIGN("glGenFramebuffers", genFramebuffers);
-        ASSIGN("glGenRenderbuffers", genRenderbuffers);
-        ASSIGN("glGenVertexArrays", genVertexArrays);
-        ASSIGN("glGenerateMipmap", generateMipmap);
-        ASSIGN("glGetBooleani_v", getBooleani_v);
-        ASSIGN("glGetFragDataLocation", getFragDataLocation);
-        ASSIGN("glGetFramebufferAttachmentParameteriv", getFramebufferAttachmentParameteriv);
-        ASSIGN("glGetIntegeri_v", getIntegeri_v);
-        ASSIGN("glGetRenderbufferParameteriv", getRenderbufferParameteriv);
-        ASSIGN("glGetStringi", getStringi);
-        ASSIGN("glGetTexParameterIiv", getTexParameterIiv);
-        ASSIGN("glGetTexParameterIuiv", getTexParameterIuiv);
-        ASSIGN("glGetTransformFeedbackVarying", getTransformFeedbackVarying);
-        ASSIGN("glGetUniformuiv", getUniformuiv);
-        ASSIGN("glGetVertexAttribIiv", getVertexAttribIiv);
-        ASSIGN("glGetVertexAttribIuiv", getVertexAttribIuiv);
-        ASSIGN("glIsEnabledi", isEnabledi);
-        ASSIGN("glIsFramebuffer", isFramebuffer);
-        ASSIGN("glIsRenderbuffer", isRenderbuffer);
-        ASSIGN("glIsVertexArray", isVertexArray);
-        ASSIGN("glMapBufferRange", mapBufferRange);
-        ASSIGN("glRenderbufferStorage", renderbufferStorage);
-        ASSIGN("glRenderbufferStorageMultisample", renderbufferStorageMultisample);
-        ASSIGN("glTexParameterIiv", texParameterIiv);
-        ASSIGN("glTexParameterIuiv", texParameterIuiv);
-        ASSIGN("glTransformFeedbackVaryings", transformFeedbackVaryings);
-        ASSIGN("glUniform1ui", uniform1ui);
-        ASSIGN("glUniform1uiv", uniform1uiv);
-        ASSIGN("glUniform2ui", uniform2ui);
-        ASSIGN("glUniform2uiv", uniform2uiv);
-        ASSIGN("glUniform3ui", uniform3ui);
-        ASSIGN("glUniform3uiv", uniform3uiv);
-        ASSIGN("glUniform4ui", uniform4ui);
-        ASSIGN("glUniform4uiv", uniform4uiv);
-        ASSIGN("glVertexAttribI1i", vertexAttribI1i);
-        ASSIGN("glVertexAttribI1iv", vertexAttribI1iv);
-        ASSIGN("glVertexAttribI1ui", vertexAttribI1ui);
-        ASSIGN("glVertexAttribI1uiv", vertexAttribI1uiv);
-        ASSIGN("glVertexAttribI2i", vertexAttribI2i);
-        ASSIGN("glVertexAttribI2iv", vertexAttribI2iv);
-        ASSIGN("glVertexAttribI2ui", vertexAttribI2ui);
-        ASSIGN("glVertexAttribI2uiv", vertexAttribI2uiv);
-        ASSIGN("glVertexAttribI3i", vertexAttribI3i);
-        ASSIGN("glVertexAttribI3iv", vertexAttribI3iv);
-        ASSIGN("glVertexAttribI3ui", vertexAttribI3ui);
-        ASSIGN("glVertexAttribI3uiv", vertexAttribI3uiv);
-        ASSIGN("glVertexAttribI4bv", vertexAttribI4bv);
-        ASSIGN("glVertexAttribI4i", vertexAttribI4i);
-        ASSIGN("glVertexAttribI4iv", vertexAttribI4iv);
-        ASSIGN("glVertexAttribI4sv", vertexAttribI4sv);
-        ASSIGN("glVertexAttribI4ubv", vertexAttribI4ubv);
-        ASSIGN("glVertexAttribI4ui", vertexAttribI4ui);
-        ASSIGN("glVertexAttribI4uiv", vertexAttribI4uiv);
-        ASSIGN("glVertexAttribI4usv", vertexAttribI4usv);
-        ASSIGN("glVertexAttribIPointer", vertexAttribIPointer);
+        ASSIGN_CORE(glBeginConditionalRender, beginConditionalRender);
+        ASSIGN_CORE(glBeginTransformFeedback, beginTransformFeedback);
+        ASSIGN_CORE(glBindBufferBase, bindBufferBase);
+        ASSIGN_CORE(glBindBufferRange, bindBufferRange);
+        ASSIGN_CORE(glBindFragDataLocation, bindFragDataLocation);
+        ASSIGN_CORE(glBindFramebuffer, bindFramebuffer);
+        ASSIGN_CORE(glBindRenderbuffer, bindRenderbuffer);
+        ASSIGN_CORE(glBindVertexArray, bindVertexArray);
+        ASSIGN_CORE(glBlitFramebuffer, blitFramebuffer);
+        ASSIGN_CORE(glCheckFramebufferStatus, checkFramebufferStatus);
+        ASSIGN_CORE(glClampColor, clampColor);
+        ASSIGN_CORE(glClearBufferfi, clearBufferfi);
+        ASSIGN_CORE(glClearBufferfv, clearBufferfv);
+        ASSIGN_CORE(glClearBufferiv, clearBufferiv);
+        ASSIGN_CORE(glClearBufferuiv, clearBufferuiv);
+        ASSIGN_CORE(glColorMaski, colorMaski);
+        ASSIGN_CORE(glDeleteFramebuffers, deleteFramebuffers);
+        ASSIGN_CORE(glDeleteRenderbuffers, deleteRenderbuffers);
+        ASSIGN_CORE(glDeleteVertexArrays, deleteVertexArrays);
+        ASSIGN_CORE(glDisablei, disablei);
+        ASSIGN_CORE(glEnablei, enablei);
+        ASSIGN_CORE(glEndConditionalRender, endConditionalRender);
+        ASSIGN_CORE(glEndTransformFeedback, endTransformFeedback);
+        ASSIGN_CORE(glFlushMappedBufferRange, flushMappedBufferRange);
+        ASSIGN_CORE(glFramebufferRenderbuffer, framebufferRenderbuffer);
+        ASSIGN_CORE(glFramebufferTexture1D, framebufferTexture1D);
+        ASSIGN_CORE(glFramebufferTexture2D, framebufferTexture2D);
+        ASSIGN_CORE(glFramebufferTexture3D, framebufferTexture3D);
+        ASSIGN_CORE(glFramebufferTextureLayer, framebufferTextureLayer);
+        ASSIGN_CORE(glGenFramebuffers, genFramebuffers);
+        ASSIGN_CORE(glGenRenderbuffers, genRenderbuffers);
+        ASSIGN_CORE(glGenVertexArrays, genVertexArrays);
+        ASSIGN_CORE(glGenerateMipmap, generateMipmap);
+        ASSIGN_CORE(glGetBooleani_v, getBooleani_v);
+        ASSIGN_CORE(glGetFragDataLocation, getFragDataLocation);
+        ASSIGN_CORE(glGetFramebufferAttachmentParameteriv, getFramebufferAttachmentParameteriv);
+        ASSIGN_CORE(glGetIntegeri_v, getIntegeri_v);
+        ASSIGN_CORE(glGetRenderbufferParameteriv, getRenderbufferParameteriv);
+        ASSIGN_CORE(glGetStringi, getStringi);
+        ASSIGN_CORE(glGetTexParameterIiv, getTexParameterIiv);
+        ASSIGN_CORE(glGetTexParameterIuiv, getTexParameterIuiv);
+        ASSIGN_CORE(glGetTransformFeedbackVarying, getTransformFeedbackVarying);
+        ASSIGN_CORE(glGetUniformuiv, getUniformuiv);
+        ASSIGN_CORE(glGetVertexAttribIiv, getVertexAttribIiv);
+        ASSIGN_CORE(glGetVertexAttribIuiv, getVertexAttribIuiv);
+        ASSIGN_CORE(glIsEnabledi, isEnabledi);
+        ASSIGN_CORE(glIsFramebuffer, isFramebuffer);
+        ASSIGN_CORE(glIsRenderbuffer, isRenderbuffer);
+        ASSIGN_CORE(glIsVertexArray, isVertexArray);
+        ASSIGN_CORE(glMapBufferRange, mapBufferRange);
+        ASSIGN_CORE(glRenderbufferStorage, renderbufferStorage);
+        ASSIGN_CORE(glRenderbufferStorageMultisample, renderbufferStorageMultisample);
+        ASSIGN_CORE(glTexParameterIiv, texParameterIiv);
+        ASSIGN_CORE(glTexParameterIuiv, texParameterIuiv);
+        ASSIGN_CORE(glTransformFeedbackVaryings, transformFeedbackVaryings);
+        ASSIGN_CORE(glUniform1ui, uniform1ui);
+        ASSIGN_CORE(glUniform1uiv, uniform1uiv);
+        ASSIGN_CORE(glUniform2ui, uniform2ui);
+        ASSIGN_CORE(glUniform2uiv, uniform2uiv);
+        ASSIGN_CORE(glUniform3ui, uniform3ui);
+        ASSIGN_CORE(glUniform3uiv, uniform3uiv);
+        ASSIGN_CORE(glUniform4ui, uniform4ui);
+        ASSIGN_CORE(glUniform4uiv, uniform4uiv);
+        ASSIGN_CORE(glVertexAttribI1i, vertexAttribI1i);
+        ASSIGN_CORE(glVertexAttribI1iv, vertexAttribI1iv);
+        ASSIGN_CORE(glVertexAttribI1ui, vertexAttribI1ui);
+        ASSIGN_CORE(glVertexAttribI1uiv, vertexAttribI1uiv);
+        ASSIGN_CORE(glVertexAttribI2i, vertexAttribI2i);
+        ASSIGN_CORE(glVertexAttribI2iv, vertexAttribI2iv);
+        ASSIGN_CORE(glVertexAttribI2ui, vertexAttribI2ui);
+        ASSIGN_CORE(glVertexAttribI2uiv, vertexAttribI2uiv);
+        ASSIGN_CORE(glVertexAttribI3i, vertexAttribI3i);
+        ASSIGN_CORE(glVertexAttribI3iv, vertexAttribI3iv);
+        ASSIGN_CORE(glVertexAttribI3ui, vertexAttribI3ui);
+        ASSIGN_CORE(glVertexAttribI3uiv, vertexAttribI3uiv);
+        ASSIGN_CORE(glVertexAttribI4bv, vertexAttribI4bv);
+        ASSIGN_CORE(glVertexAttribI4i, vertexAttribI4i);
+        ASSIGN_CORE(glVertexAttribI4iv, vertexAttribI4iv);
+        ASSIGN_CORE(glVertexAttribI4sv, vertexAttribI4sv);
+        ASSIGN_CORE(glVertexAttribI4ubv, vertexAttribI4ubv);
+        ASSIGN_CORE(glVertexAttribI4ui, vertexAttribI4ui);
+        ASSIGN_CORE(glVertexAttribI4uiv, vertexAttribI4uiv);
+        ASSIGN_CORE(glVertexAttribI4usv, vertexAttribI4usv);
+        ASSIGN_CORE(glVertexAttribIPointer, vertexAttribIPointer);
     }
 
     if (version >= gl::Version(3, 1))
     {
-        ASSIGN("glCopyBufferSubData", copyBufferSubData);
-        ASSIGN("glDrawArraysInstanced", drawArraysInstanced);
-        ASSIGN("glDrawElementsInstanced", drawElementsInstanced);
-        ASSIGN("glGetActiveUniformBlockName", getActiveUniformBlockName);
-        ASSIGN("glGetActiveUniformBlockiv", getActiveUniformBlockiv);
-        ASSIGN("glGetActiveUniformName", getActiveUniformName);
-        ASSIGN("glGetActiveUniformsiv", getActiveUniformsiv);
-        ASSIGN("glGetUniformBlockIndex", getUniformBlockIndex);
-        ASSIGN("glGetUniformIndices", getUniformIndices);
-        ASSIGN("glPrimitiveRestartIndex", primitiveRestartIndex);
-        ASSIGN("glTexBuffer", texBuffer);
-        ASSIGN("glUniformBlockBinding", uniformBlockBinding);
+        ASSIGN_CORE(glCopyBufferSubData, copyBufferSubData);
+        ASSIGN_CORE(glDrawArraysInstanced, drawArraysInstanced);
+        ASSIGN_CORE(glDrawElementsInstanced, drawElementsInstanced);
+        ASSIGN_CORE(glGetActiveUniformBlockName, getActiveUniformBlockName);
+        ASSIGN_CORE(glGetActiveUniformBlockiv, getActiveUniformBlockiv);
+        ASSIGN_CORE(glGetActiveUniformName, getActiveUniformName);
+        ASSIGN_CORE(glGetActiveUniformsiv, getActiveUniformsiv);
+        ASSIGN_CORE(glGetUniformBlockIndex, getUniformBlockIndex);
+        ASSIGN_CORE(glGetUniformIndices, getUniformIndices);
+        ASSIGN_CORE(glPrimitiveRestartIndex, primitiveRestartIndex);
+        ASSIGN_CORE(glTexBuffer, texBuffer);
+        ASSIGN_CORE(glUniformBlockBinding, uniformBlockBinding);
     }
 
     if (version >= gl::Version(3, 2))
     {
-        ASSIGN("glClientWaitSync", clientWaitSync);
-        ASSIGN("glDeleteSync", deleteSync);
-        ASSIGN("glDrawElementsBaseVertex", drawElementsBaseVertex);
-        ASSIGN("glDrawElementsInstancedBaseVertex", drawElementsInstancedBaseVertex);
-        ASSIGN("glDrawRangeElementsBaseVertex", drawRangeElementsBaseVertex);
-        ASSIGN("glFenceSync", fenceSync);
-        ASSIGN("glFramebufferTexture", framebufferTexture);
-        ASSIGN("glGetBufferParameteri64v", getBufferParameteri64v);
-        ASSIGN("glGetInteger64i_v", getInteger64i_v);
-        ASSIGN("glGetInteger64v", getInteger64v);
-        ASSIGN("glGetMultisamplefv", getMultisamplefv);
-        ASSIGN("glGetSynciv", getSynciv);
-        ASSIGN("glIsSync", isSync);
-        ASSIGN("glMultiDrawElementsBaseVertex", multiDrawElementsBaseVertex);
-        ASSIGN("glProvokingVertex", provokingVertex);
-        ASSIGN("glSampleMaski", sampleMaski);
-        ASSIGN("glTexImage2DMultisample", texImage2DMultisample);
-        ASSIGN("glTexImage3DMultisample", texImage3DMultisample);
-        ASSIGN("glWaitSync", waitSync);
+        ASSIGN_CORE(glClientWaitSync, clientWaitSync);
+        ASSIGN_CORE(glDeleteSync, deleteSync);
+        ASSIGN_CORE(glDrawElementsBaseVertex, drawElementsBaseVertex);
+        ASSIGN_CORE(glDrawElementsInstancedBaseVertex, drawElementsInstancedBaseVertex);
+        ASSIGN_CORE(glDrawRangeElementsBaseVertex, drawRangeElementsBaseVertex);
+        ASSIGN_CORE(glFenceSync, fenceSync);
+        ASSIGN_CORE(glFramebufferTexture, framebufferTexture);
+        ASSIGN_CORE(glGetBufferParameteri64v, getBufferParameteri64v);
+        ASSIGN_CORE(glGetInteger64i_v, getInteger64i_v);
+        ASSIGN_CORE(glGetInteger64v, getInteger64v);
+        ASSIGN_CORE(glGetMultisamplefv, getMultisamplefv);
+        ASSIGN_CORE(glGetSynciv, getSynciv);
+        ASSIGN_CORE(glIsSync, isSync);
+        ASSIGN_CORE(glMultiDrawElementsBaseVertex, multiDrawElementsBaseVertex);
+        ASSIGN_CORE(glProvokingVertex, provokingVertex);
+        ASSIGN_CORE(glSampleMaski, sampleMaski);
+        ASSIGN_CORE(glTexImage2DMultisample, texImage2DMultisample);
+        ASSIGN_CORE(glTexImage3DMultisample, texImage3DMultisample);
+        ASSIGN_CORE(glWaitSync, waitSync);
     }
 
     if (version >= gl::Version(3, 3))
     {
-        ASSIGN("glBindFragDataLocationIndexed", bindFragDataLocationIndexed);
-        ASSIGN("glBindSampler", bindSampler);
-        ASSIGN("glDeleteSamplers", deleteSamplers);
-        ASSIGN("glGenSamplers", genSamplers);
-        ASSIGN("glGetFragDataIndex", getFragDataIndex);
-        ASSIGN("glGetQueryObjecti64v", getQueryObjecti64v);
-        ASSIGN("glGetQueryObjectui64v", getQueryObjectui64v);
-        ASSIGN("glGetSamplerParameterIiv", getSamplerParameterIiv);
-        ASSIGN("glGetSamplerParameterIuiv", getSamplerParameterIuiv);
-        ASSIGN("glGetSamplerParameterfv", getSamplerParameterfv);
-        ASSIGN("glGetSamplerParameteriv", getSamplerParameteriv);
-        ASSIGN("glIsSampler", isSampler);
-        ASSIGN("glQueryCounter", queryCounter);
-        ASSIGN("glSamplerParameterIiv", samplerParameterIiv);
-        ASSIGN("glSamplerParameterIuiv", samplerParameterIuiv);
-        ASSIGN("glSamplerParameterf", samplerParameterf);
-        ASSIGN("glSamplerParameterfv", samplerParameterfv);
-        ASSIGN("glSamplerParameteri", samplerParameteri);
-        ASSIGN("glSamplerParameteriv", samplerParameteriv);
-        ASSIGN("glVertexAttribDivisor", vertexAttribDivisor);
-        ASSIGN("glVertexAttribP1ui", vertexAttribP1ui);
-        ASSIGN("glVertexAttribP1uiv", vertexAttribP1uiv);
-        ASSIGN("glVertexAttribP2ui", vertexAttribP2ui);
-        ASSIGN("glVertexAttribP2uiv", vertexAttribP2uiv);
-        ASSIGN("glVertexAttribP3ui", vertexAttribP3ui);
-        ASSIGN("glVertexAttribP3uiv", vertexAttribP3uiv);
-        ASSIGN("glVertexAttribP4ui", vertexAttribP4ui);
-        ASSIGN("glVertexAttribP4uiv", vertexAttribP4uiv);
+        ASSIGN_CORE(glBindFragDataLocationIndexed, bindFragDataLocationIndexed);
+        ASSIGN_CORE(glBindSampler, bindSampler);
+        ASSIGN_CORE(glDeleteSamplers, deleteSamplers);
+        ASSIGN_CORE(glGenSamplers, genSamplers);
+        ASSIGN_CORE(glGetFragDataIndex, getFragDataIndex);
+        ASSIGN_CORE(glGetQueryObjecti64v, getQueryObjecti64v);
+        ASSIGN_CORE(glGetQueryObjectui64v, getQueryObjectui64v);
+        ASSIGN_CORE(glGetSamplerParameterIiv, getSamplerParameterIiv);
+        ASSIGN_CORE(glGetSamplerParameterIuiv, getSamplerParameterIuiv);
+        ASSIGN_CORE(glGetSamplerParameterfv, getSamplerParameterfv);
+        ASSIGN_CORE(glGetSamplerParameteriv, getSamplerParameteriv);
+        ASSIGN_CORE(glIsSampler, isSampler);
+        ASSIGN_CORE(glQueryCounter, queryCounter);
+        ASSIGN_CORE(glSamplerParameterIiv, samplerParameterIiv);
+        ASSIGN_CORE(glSamplerParameterIuiv, samplerParameterIuiv);
+        ASSIGN_CORE(glSamplerParameterf, samplerParameterf);
+        ASSIGN_CORE(glSamplerParameterfv, samplerParameterfv);
+        ASSIGN_CORE(glSamplerParameteri, samplerParameteri);
+        ASSIGN_CORE(glSamplerParameteriv, samplerParameteriv);
+        ASSIGN_CORE(glVertexAttribDivisor, vertexAttribDivisor);
+        ASSIGN_CORE(glVertexAttribP1ui, vertexAttribP1ui);
+        ASSIGN_CORE(glVertexAttribP1uiv, vertexAttribP1uiv);
+        ASSIGN_CORE(glVertexAttribP2ui, vertexAttribP2ui);
+        ASSIGN_CORE(glVertexAttribP2uiv, vertexAttribP2uiv);
+        ASSIGN_CORE(glVertexAttribP3ui, vertexAttribP3ui);
+        ASSIGN_CORE(glVertexAttribP3uiv, vertexAttribP3uiv);
+        ASSIGN_CORE(glVertexAttribP4ui, vertexAttribP4ui);
+        ASSIGN_CORE(glVertexAttribP4uiv, vertexAttribP4uiv);
     }
 
     if (version >= gl::Version(4, 0))
     {
-        ASSIGN("glBeginQueryIndexed", beginQueryIndexed);
-        ASSIGN("glBindTransformFeedback", bindTransformFeedback);
-        ASSIGN("glBlendEquationSeparatei", blendEquationSeparatei);
-        ASSIGN("glBlendEquationi", blendEquationi);
-        ASSIGN("glBlendFuncSeparatei", blendFuncSeparatei);
-        ASSIGN("glBlendFunci", blendFunci);
-        ASSIGN("glDeleteTransformFeedbacks", deleteTransformFeedbacks);
-        ASSIGN("glDrawArraysIndirect", drawArraysIndirect);
-        ASSIGN("glDrawElementsIndirect", drawElementsIndirect);
-        ASSIGN("glDrawTransformFeedback", drawTransformFeedback);
-        ASSIGN("glDrawTransformFeedbackStream", drawTransformFeedbackStream);
-        ASSIGN("glEndQueryIndexed", endQueryIndexed);
-        ASSIGN("glGenTransformFeedbacks", genTransformFeedbacks);
-        ASSIGN("glGetActiveSubroutineName", getActiveSubroutineName);
-        ASSIGN("glGetActiveSubroutineUniformName", getActiveSubroutineUniformName);
-        ASSIGN("glGetActiveSubroutineUniformiv", getActiveSubroutineUniformiv);
-        ASSIGN("glGetProgramStageiv", getProgramStageiv);
-        ASSIGN("glGetQueryIndexediv", getQueryIndexediv);
-        ASSIGN("glGetSubroutineIndex", getSubroutineIndex);
-        ASSIGN("glGetSubroutineUniformLocation", getSubroutineUniformLocation);
-        ASSIGN("glGetUniformSubroutineuiv", getUniformSubroutineuiv);
-        ASSIGN("glGetUniformdv", getUniformdv);
-        ASSIGN("glIsTransformFeedback", isTransformFeedback);
-        ASSIGN("glMinSampleShading", minSampleShading);
-        ASSIGN("glPatchParameterfv", patchParameterfv);
-        ASSIGN("glPatchParameteri", patchParameteri);
-        ASSIGN("glPauseTransformFeedback", pauseTransformFeedback);
-        ASSIGN("glResumeTransformFeedback", resumeTransformFeedback);
-        ASSIGN("glUniform1d", uniform1d);
-        ASSIGN("glUniform1dv", uniform1dv);
-        ASSIGN("glUniform2d", uniform2d);
-        ASSIGN("glUniform2dv", uniform2dv);
-        ASSIGN("glUniform3d", uniform3d);
-        ASSIGN("glUniform3dv", uniform3dv);
-        ASSIGN("glUniform4d", uniform4d);
-        ASSIGN("glUniform4dv", uniform4dv);
-        ASSIGN("glUniformMatrix2dv", uniformMatrix2dv);
-        ASSIGN("glUniformMatrix2x3dv", uniformMatrix2x3dv);
-        ASSIGN("glUniformMatrix2x4dv", uniformMatrix2x4dv);
-        ASSIGN("glUniformMatrix3dv", uniformMatrix3dv);
-        ASSIGN("glUniformMatrix3x2dv", uniformMatrix3x2dv);
-        ASSIGN("glUniformMatrix3x4dv", uniformMatrix3x4dv);
-        ASSIGN("glUniformMatrix4dv", uniformMatrix4dv);
-        ASSIGN("glUniformMatrix4x2dv", uniformMatrix4x2dv);
-        ASSIGN("glUniformMatrix4x3dv", uniformMatrix4x3dv);
-        ASSIGN("glUniformSubroutinesuiv", uniformSubroutinesuiv);
+        ASSIGN_CORE(glBeginQueryIndexed, beginQueryIndexed);
+        ASSIGN_CORE(glBindTransformFeedback, bindTransformFeedback);
+        ASSIGN_CORE(glBlendEquationSeparatei, blendEquationSeparatei);
+        ASSIGN_CORE(glBlendEquationi, blendEquationi);
+        ASSIGN_CORE(glBlendFuncSeparatei, blendFuncSeparatei);
+        ASSIGN_CORE(glBlendFunci, blendFunci);
+        ASSIGN_CORE(glDeleteTransformFeedbacks, deleteTransformFeedbacks);
+        ASSIGN_CORE(glDrawArraysIndirect, drawArraysIndirect);
+        ASSIGN_CORE(glDrawElementsIndirect, drawElementsIndirect);
+        ASSIGN_CORE(glDrawTransformFeedback, drawTransformFeedback);
+        ASSIGN_CORE(glDrawTransformFeedbackStream, drawTransformFeedbackStream);
+        ASSIGN_CORE(glEndQueryIndexed, endQueryIndexed);
+        ASSIGN_CORE(glGenTransformFeedbacks, genTransformFeedbacks);
+        ASSIGN_CORE(glGetActiveSubroutineName, getActiveSubroutineName);
+        ASSIGN_CORE(glGetActiveSubroutineUniformName, getActiveSubroutineUniformName);
+        ASSIGN_CORE(glGetActiveSubroutineUniformiv, getActiveSubroutineUniformiv);
+        ASSIGN_CORE(glGetProgramStageiv, getProgramStageiv);
+        ASSIGN_CORE(glGetQueryIndexediv, getQueryIndexediv);
+        ASSIGN_CORE(glGetSubroutineIndex, getSubroutineIndex);
+        ASSIGN_CORE(glGetSubroutineUniformLocation, getSubroutineUniformLocation);
+        ASSIGN_CORE(glGetUniformSubroutineuiv, getUniformSubroutineuiv);
+        ASSIGN_CORE(glGetUniformdv, getUniformdv);
+        ASSIGN_CORE(glIsTransformFeedback, isTransformFeedback);
+        ASSIGN_CORE(glMinSampleShading, minSampleShading);
+        ASSIGN_CORE(glPatchParameterfv, patchParameterfv);
+        ASSIGN_CORE(glPatchParameteri, patchParameteri);
+        ASSIGN_CORE(glPauseTransformFeedback, pauseTransformFeedback);
+        ASSIGN_CORE(glResumeTransformFeedback, resumeTransformFeedback);
+        ASSIGN_CORE(glUniform1d, uniform1d);
+        ASSIGN_CORE(glUniform1dv, uniform1dv);
+        ASSIGN_CORE(glUniform2d, uniform2d);
+        ASSIGN_CORE(glUniform2dv, uniform2dv);
+        ASSIGN_CORE(glUniform3d, uniform3d);
+        ASSIGN_CORE(glUniform3dv, uniform3dv);
+        ASSIGN_CORE(glUniform4d, uniform4d);
+        ASSIGN_CORE(glUniform4dv, uniform4dv);
+        ASSIGN_CORE(glUniformMatrix2dv, uniformMatrix2dv);
+        ASSIGN_CORE(glUniformMatrix2x3dv, uniformMatrix2x3dv);
+        ASSIGN_CORE(glUniformMatrix2x4dv, uniformMatrix2x4dv);
+        ASSIGN_CORE(glUniformMatrix3dv, uniformMatrix3dv);
+        ASSIGN_CORE(glUniformMatrix3x2dv, uniformMatrix3x2dv);
+        ASSIGN_CORE(glUniformMatrix3x4dv, uniformMatrix3x4dv);
+        ASSIGN_CORE(glUniformMatrix4dv, uniformMatrix4dv);
+        ASSIGN_CORE(glUniformMatrix4x2dv, uniformMatrix4x2dv);
+        ASSIGN_CORE(glUniformMatrix4x3dv, uniformMatrix4x3dv);
+        ASSIGN_CORE(glUniformSubroutinesuiv, uniformSubroutinesuiv);
     }
 
     if (version >= gl::Version(4, 1))
     {
-        ASSIGN("glActiveShaderProgram", activeShaderProgram);
-        ASSIGN("glBindProgramPipeline", bindProgramPipeline);
-        ASSIGN("glClearDepthf", clearDepthf);
-        ASSIGN("glCreateShaderProgramv", createShaderProgramv);
-        ASSIGN("glDeleteProgramPipelines", deleteProgramPipelines);
-        ASSIGN("glDepthRangeArrayv", depthRangeArrayv);
-        ASSIGN("glDepthRangeIndexed", depthRangeIndexed);
-        ASSIGN("glDepthRangef", depthRangef);
-        ASSIGN("glGenProgramPipelines", genProgramPipelines);
-        ASSIGN("glGetDoublei_v", getDoublei_v);
-        ASSIGN("glGetFloati_v", getFloati_v);
-        ASSIGN("glGetProgramBinary", getProgramBinary);
-        ASSIGN("glGetProgramPipelineInfoLog", getProgramPipelineInfoLog);
-        ASSIGN("glGetProgramPipelineiv", getProgramPipelineiv);
-        ASSIGN("glGetShaderPrecisionFormat", getShaderPrecisionFormat);
-        ASSIGN("glGetVertexAttribLdv", getVertexAttribLdv);
-        ASSIGN("glIsProgramPipeline", isProgramPipeline);
-        ASSIGN("glProgramBinary", programBinary);
-        ASSIGN("glProgramParameteri", programParameteri);
-        ASSIGN("glProgramUniform1d", programUniform1d);
-        ASSIGN("glProgramUniform1dv", programUniform1dv);
-        ASSIGN("glProgramUniform1f", programUniform1f);
-        ASSIGN("glProgramUniform1fv", programUniform1fv);
-        ASSIGN("glProgramUniform1i", programUniform1i);
-        ASSIGN("glProgramUniform1iv", programUniform1iv);
-        ASSIGN("glProgramUniform1ui", programUniform1ui);
-        ASSIGN("glProgramUniform1uiv", programUniform1uiv);
-        ASSIGN("glProgramUniform2d", programUniform2d);
-        ASSIGN("glProgramUniform2dv", programUniform2dv);
-        ASSIGN("glProgramUniform2f", programUniform2f);
-        ASSIGN("glProgramUniform2fv", programUniform2fv);
-        ASSIGN("glProgramUniform2i", programUniform2i);
-        ASSIGN("glProgramUniform2iv", programUniform2iv);
-        ASSIGN("glProgramUniform2ui", programUniform2ui);
-        ASSIGN("glProgramUniform2uiv", programUniform2uiv);
-        ASSIGN("glProgramUniform3d", programUniform3d);
-        ASSIGN("glProgramUniform3dv", programUniform3dv);
-        ASSIGN("glProgramUniform3f", programUniform3f);
-        ASSIGN("glProgramUniform3fv", programUniform3fv);
-        ASSIGN("glProgramUniform3i", programUniform3i);
-        ASSIGN("glProgramUniform3iv", programUniform3iv);
-        ASSIGN("glProgramUniform3ui", programUniform3ui);
-        ASSIGN("glProgramUniform3uiv", programUniform3uiv);
-        ASSIGN("glProgramUniform4d", programUniform4d);
-        ASSIGN("glProgramUniform4dv", programUniform4dv);
-        ASSIGN("glProgramUniform4f", programUniform4f);
-        ASSIGN("glProgramUniform4fv", programUniform4fv);
-        ASSIGN("glProgramUniform4i", programUniform4i);
-        ASSIGN("glProgramUniform4iv", programUniform4iv);
-        ASSIGN("glProgramUniform4ui", programUniform4ui);
-        ASSIGN("glProgramUniform4uiv", programUniform4uiv);
-        ASSIGN("glProgramUniformMatrix2dv", programUniformMatrix2dv);
-        ASSIGN("glProgramUniformMatrix2fv", programUniformMatrix2fv);
-        ASSIGN("glProgramUniformMatrix2x3dv", programUniformMatrix2x3dv);
-        ASSIGN("glProgramUniformMatrix2x3fv", programUniformMatrix2x3fv);
-        ASSIGN("glProgramUniformMatrix2x4dv", programUniformMatrix2x4dv);
-        ASSIGN("glProgramUniformMatrix2x4fv", programUniformMatrix2x4fv);
-        ASSIGN("glProgramUniformMatrix3dv", programUniformMatrix3dv);
-        ASSIGN("glProgramUniformMatrix3fv", programUniformMatrix3fv);
-        ASSIGN("glProgramUniformMatrix3x2dv", programUniformMatrix3x2dv);
-        ASSIGN("glProgramUniformMatrix3x2fv", programUniformMatrix3x2fv);
-        ASSIGN("glProgramUniformMatrix3x4dv", programUniformMatrix3x4dv);
-        ASSIGN("glProgramUniformMatrix3x4fv", programUniformMatrix3x4fv);
-        ASSIGN("glProgramUniformMatrix4dv", programUniformMatrix4dv);
-        ASSIGN("glProgramUniformMatrix4fv", programUniformMatrix4fv);
-        ASSIGN("glProgramUniformMatrix4x2dv", programUniformMatrix4x2dv);
-        ASSIGN("glProgramUniformMatrix4x2fv", programUniformMatrix4x2fv);
-        ASSIGN("glProgramUniformMatrix4x3dv", programUniformMatrix4x3dv);
-        ASSIGN("glProgramUniformMatrix4x3fv", programUniformMatrix4x3fv);
-        ASSIGN("glReleaseShaderCompiler", releaseShaderCompiler);
-        ASSIGN("glScissorArrayv", scissorArrayv);
-        ASSIGN("glScissorIndexed", scissorIndexed);
-        ASSIGN("glScissorIndexedv", scissorIndexedv);
-        ASSIGN("glShaderBinary", shaderBinary);
-        ASSIGN("glUseProgramStages", useProgramStages);
-        ASSIGN("glValidateProgramPipeline", validateProgramPipeline);
-        ASSIGN("glVertexAttribL1d", vertexAttribL1d);
-        ASSIGN("glVertexAttribL1dv", vertexAttribL1dv);
-        ASSIGN("glVertexAttribL2d", vertexAttribL2d);
-        ASSIGN("glVertexAttribL2dv", vertexAttribL2dv);
-        ASSIGN("glVertexAttribL3d", vertexAttribL3d);
-        ASSIGN("glVertexAttribL3dv", vertexAttribL3dv);
-        ASSIGN("glVertexAttribL4d", vertexAttribL4d);
-        ASSIGN("glVertexAttribL4dv", vertexAttribL4dv);
-        ASSIGN("glVertexAttribLPointer", vertexAttribLPointer);
-        ASSIGN("glViewportArrayv", viewportArrayv);
-        ASSIGN("glViewportIndexedf", viewportIndexedf);
-        ASSIGN("glViewportIndexedfv", viewportIndexedfv);
+        ASSIGN_CORE(glActiveShaderProgram, activeShaderProgram);
+        ASSIGN_CORE(glBindProgramPipeline, bindProgramPipeline);
+        ASSIGN_CORE(glClearDepthf, clearDepthf);
+        ASSIGN_CORE(glCreateShaderProgramv, createShaderProgramv);
+        ASSIGN_CORE(glDeleteProgramPipelines, deleteProgramPipelines);
+        ASSIGN_CORE(glDepthRangeArrayv, depthRangeArrayv);
+        ASSIGN_CORE(glDepthRangeIndexed, depthRangeIndexed);
+        ASSIGN_CORE(glDepthRangef, depthRangef);
+        ASSIGN_CORE(glGenProgramPipelines, genProgramPipelines);
+        ASSIGN_CORE(glGetDoublei_v, getDoublei_v);
+        ASSIGN_CORE(glGetFloati_v, getFloati_v);
+        ASSIGN_CORE(glGetProgramBinary, getProgramBinary);
+        ASSIGN_CORE(glGetProgramPipelineInfoLog, getProgramPipelineInfoLog);
+        ASSIGN_CORE(glGetProgramPipelineiv, getProgramPipelineiv);
+        ASSIGN_CORE(glGetShaderPrecisionFormat, getShaderPrecisionFormat);
+        ASSIGN_CORE(glGetVertexAttribLdv, getVertexAttribLdv);
+        ASSIGN_CORE(glIsProgramPipeline, isProgramPipeline);
+        ASSIGN_CORE(glProgramBinary, programBinary);
+        ASSIGN_CORE(glProgramParameteri, programParameteri);
+        ASSIGN_CORE(glProgramUniform1d, programUniform1d);
+        ASSIGN_CORE(glProgramUniform1dv, programUniform1dv);
+        ASSIGN_CORE(glProgramUniform1f, programUniform1f);
+        ASSIGN_CORE(glProgramUniform1fv, programUniform1fv);
+        ASSIGN_CORE(glProgramUniform1i, programUniform1i);
+        ASSIGN_CORE(glProgramUniform1iv, programUniform1iv);
+        ASSIGN_CORE(glProgramUniform1ui, programUniform1ui);
+        ASSIGN_CORE(glProgramUniform1uiv, programUniform1uiv);
+        ASSIGN_CORE(glProgramUniform2d, programUniform2d);
+        ASSIGN_CORE(glProgramUniform2dv, programUniform2dv);
+        ASSIGN_CORE(glProgramUniform2f, programUniform2f);
+        ASSIGN_CORE(glProgramUniform2fv, programUniform2fv);
+        ASSIGN_CORE(glProgramUniform2i, programUniform2i);
+        ASSIGN_CORE(glProgramUniform2iv, programUniform2iv);
+        ASSIGN_CORE(glProgramUniform2ui, programUniform2ui);
+        ASSIGN_CORE(glProgramUniform2uiv, programUniform2uiv);
+        ASSIGN_CORE(glProgramUniform3d, programUniform3d);
+        ASSIGN_CORE(glProgramUniform3dv, programUniform3dv);
+        ASSIGN_CORE(glProgramUniform3f, programUniform3f);
+        ASSIGN_CORE(glProgramUniform3fv, programUniform3fv);
+        ASSIGN_CORE(glProgramUniform3i, programUniform3i);
+        ASSIGN_CORE(glProgramUniform3iv, programUniform3iv);
+        ASSIGN_CORE(glProgramUniform3ui, programUniform3ui);
+        ASSIGN_CORE(glProgramUniform3uiv, programUniform3uiv);
+        ASSIGN_CORE(glProgramUniform4d, programUniform4d);
+        ASSIGN_CORE(glProgramUniform4dv, programUniform4dv);
+        ASSIGN_CORE(glProgramUniform4f, programUniform4f);
+        ASSIGN_CORE(glProgramUniform4fv, programUniform4fv);
+        ASSIGN_CORE(glProgramUniform4i, programUniform4i);
+        ASSIGN_CORE(glProgramUniform4iv, programUniform4iv);
+        ASSIGN_CORE(glProgramUniform4ui, programUniform4ui);
+        ASSIGN_CORE(glProgramUniform4uiv, programUniform4uiv);
+        ASSIGN_CORE(glProgramUniformMatrix2dv, programUniformMatrix2dv);
+        ASSIGN_CORE(glProgramUniformMatrix2fv, programUniformMatrix2fv);
+        ASSIGN_CORE(glProgramUniformMatrix2x3dv, programUniformMatrix2x3dv);
+        ASSIGN_CORE(glProgramUniformMatrix2x3fv, programUniformMatrix2x3fv);
+        ASSIGN_CORE(glProgramUniformMatrix2x4dv, programUniformMatrix2x4dv);
+        ASSIGN_CORE(glProgramUniformMatrix2x4fv, programUniformMatrix2x4fv);
+        ASSIGN_CORE(glProgramUniformMatrix3dv, programUniformMatrix3dv);
+        ASSIGN_CORE(glProgramUniformMatrix3fv, programUniformMatrix3fv);
+        ASSIGN_CORE(glProgramUniformMatrix3x2dv, programUniformMatrix3x2dv);
+        ASSIGN_CORE(glProgramUniformMatrix3x2fv, programUniformMatrix3x2fv);
+        ASSIGN_CORE(glProgramUniformMatrix3x4dv, programUniformMatrix3x4dv);
+        ASSIGN_CORE(glProgramUniformMatrix3x4fv, programUniformMatrix3x4fv);
+        ASSIGN_CORE(glProgramUniformMatrix4dv, programUniformMatrix4dv);
+        ASSIGN_CORE(glProgramUniformMatrix4fv, programUniformMatrix4fv);
+        ASSIGN_CORE(glProgramUniformMatrix4x2dv, programUniformMatrix4x2dv);
+        ASSIGN_CORE(glProgramUniformMatrix4x2fv, programUniformMatrix4x2fv);
+        ASSIGN_CORE(glProgramUniformMatrix4x3dv, programUniformMatrix4x3dv);
+        ASSIGN_CORE(glProgramUniformMatrix4x3fv, programUniformMatrix4x3fv);
+        ASSIGN_CORE(glReleaseShaderCompiler, releaseShaderCompiler);
+        ASSIGN_CORE(glScissorArrayv, scissorArrayv);
+        ASSIGN_CORE(glScissorIndexed, scissorIndexed);
+        ASSIGN_CORE(glScissorIndexedv, scissorIndexedv);
+        ASSIGN_CORE(glShaderBinary, shaderBinary);
+        ASSIGN_CORE(glUseProgramStages, useProgramStages);
+        ASSIGN_CORE(glValidateProgramPipeline, validateProgramPipeline);
+        ASSIGN_CORE(glVertexAttribL1d, vertexAttribL1d);
+        ASSIGN_CORE(glVertexAttribL1dv, vertexAttribL1dv);
+        ASSIGN_CORE(glVertexAttribL2d, vertexAttribL2d);
+        ASSIGN_CORE(glVertexAttribL2dv, vertexAttribL2dv);
+        ASSIGN_CORE(glVertexAttribL3d, vertexAttribL3d);
+        ASSIGN_CORE(glVertexAttribL3dv, vertexAttribL3dv);
+        ASSIGN_CORE(glVertexAttribL4d, vertexAttribL4d);
+        ASSIGN_CORE(glVertexAttribL4dv, vertexAttribL4dv);
+        ASSIGN_CORE(glVertexAttribLPointer, vertexAttribLPointer);
+        ASSIGN_CORE(glViewportArrayv, viewportArrayv);
+        ASSIGN_CORE(glViewportIndexedf, viewportIndexedf);
+        ASSIGN_CORE(glViewportIndexedfv, viewportIndexedfv);
     }
 
     if (version >= gl::Version(4, 2))
     {
-        ASSIGN("glBindImageTexture", bindImageTexture);
-        ASSIGN("glDrawArraysInstancedBaseInstance", drawArraysInstancedBaseInstance);
-        ASSIGN("glDrawElementsInstancedBaseInstance", drawElementsInstancedBaseInstance);
-        ASSIGN("glDrawElementsInstancedBaseVertexBaseInstance",
-               drawElementsInstancedBaseVertexBaseInstance);
-        ASSIGN("glDrawTransformFeedbackInstanced", drawTransformFeedbackInstanced);
-        ASSIGN("glDrawTransformFeedbackStreamInstanced", drawTransformFeedbackStreamInstanced);
-        ASSIGN("glGetActiveAtomicCounterBufferiv", getActiveAtomicCounterBufferiv);
-        ASSIGN("glGetInternalformativ", getInternalformativ);
-        ASSIGN("glMemoryBarrier", memoryBarrier);
-        ASSIGN("glTexStorage1D", texStorage1D);
-        ASSIGN("glTexStorage2D", texStorage2D);
-        ASSIGN("glTexStorage3D", texStorage3D);
+        ASSIGN_CORE(glBindImageTexture, bindImageTexture);
+        ASSIGN_CORE(glDrawArraysInstancedBaseInstance, drawArraysInstancedBaseInstance);
+        ASSIGN_CORE(glDrawElementsInstancedBaseInstance, drawElementsInstancedBaseInstance);
+        ASSIGN_CORE(glDrawElementsInstancedBaseVertexBaseInstance,
+                    drawElementsInstancedBaseVertexBaseInstance);
+        ASSIGN_CORE(glDrawTransformFeedbackInstanced, drawTransformFeedbackInstanced);
+        ASSIGN_CORE(glDrawTransformFeedbackStreamInstanced, drawTransformFeedbackStreamInstanced);
+        ASSIGN_CORE(glGetActiveAtomicCounterBufferiv, getActiveAtomicCounterBufferiv);
+        ASSIGN_CORE(glGetInternalformativ, getInternalformativ);
+        ASSIGN_CORE(glMemoryBarrier, memoryBarrier);
+        ASSIGN_CORE(glTexStorage1D, texStorage1D);
+        ASSIGN_CORE(glTexStorage2D, texStorage2D);
+        ASSIGN_CORE(glTexStorage3D, texStorage3D);
     }
 
     if (version >= gl::Version(4, 3))
     {
-        ASSIGN("glBindVertexBuffer", bindVertexBuffer);
-        ASSIGN("glClearBufferData", clearBufferData);
-        ASSIGN("glClearBufferSubData", clearBufferSubData);
-        ASSIGN("glCopyImageSubData", copyImageSubData);
-        ASSIGN("glDebugMessageCallback", debugMessageCallback);
-        ASSIGN("glDebugMessageControl", debugMessageControl);
-        ASSIGN("glDebugMessageInsert", debugMessageInsert);
-        ASSIGN("glDispatchCompute", dispatchCompute);
-        ASSIGN("glDispatchComputeIndirect", dispatchComputeIndirect);
-        ASSIGN("glFramebufferParameteri", framebufferParameteri);
-        ASSIGN("glGetDebugMessageLog", getDebugMessageLog);
-        ASSIGN("glGetFramebufferParameteriv", getFramebufferParameteriv);
-        ASSIGN("glGetInternalformati64v", getInternalformati64v);
-        ASSIGN("glGetObjectLabel", getObjectLabel);
-        ASSIGN("glGetObjectPtrLabel", getObjectPtrLabel);
-        ASSIGN("glGetPointerv", getPointerv);
-        ASSIGN("glGetProgramInterfaceiv", getProgramInterfaceiv);
-        ASSIGN("glGetProgramResourceIndex", getProgramResourceIndex);
-        ASSIGN("glGetProgramResourceLocation", getProgramResourceLocation);
-        ASSIGN("glGetProgramResourceLocationIndex", getProgramResourceLocationIndex);
-        ASSIGN("glGetProgramResourceName", getProgramResourceName);
-        ASSIGN("glGetProgramResourceiv", getProgramResourceiv);
-        ASSIGN("glInvalidateBufferData", invalidateBufferData);
-        ASSIGN("glInvalidateBufferSubData", invalidateBufferSubData);
-        ASSIGN("glInvalidateFramebuffer", invalidateFramebuffer);
-        ASSIGN("glInvalidateSubFramebuffer", invalidateSubFramebuffer);
-        ASSIGN("glInvalidateTexImage", invalidateTexImage);
-        ASSIGN("glInvalidateTexSubImage", invalidateTexSubImage);
-        ASSIGN("glMultiDrawArraysIndirect", multiDrawArraysIndirect);
-        ASSIGN("glMultiDrawElementsIndirect", multiDrawElementsIndirect);
-        ASSIGN("glObjectLabel", objectLabel);
-        ASSIGN("glObjectPtrLabel", objectPtrLabel);
-        ASSIGN("glPopDebugGroup", popDebugGroup);
-        ASSIGN("glPushDebugGroup", pushDebugGroup);
-        ASSIGN("glShaderStorageBlockBinding", shaderStorageBlockBinding);
-        ASSIGN("glTexBufferRange", texBufferRange);
-        ASSIGN("glTexStorage2DMultisample", texStorage2DMultisample);
-        ASSIGN("glTexStorage3DMultisample", texStorage3DMultisample);
-        ASSIGN("glTextureView", textureView);
-        ASSIGN("glVertexAttribBinding", vertexAttribBinding);
-        ASSIGN("glVertexAttribFormat", vertexAttribFormat);
-        ASSIGN("glVertexAttribIFormat", vertexAttribIFormat);
-        ASSIGN("glVertexAttribLFormat", vertexAttribLFormat);
-        ASSIGN("glVertexBindingDivisor", vertexBindingDivisor);
+        ASSIGN_CORE(glBindVertexBuffer, bindVertexBuffer);
+        ASSIGN_CORE(glClearBufferData, clearBufferData);
+        ASSIGN_CORE(glClearBufferSubData, clearBufferSubData);
+        ASSIGN_CORE(glCopyImageSubData, copyImageSubData);
+        ASSIGN_CORE(glDebugMessageCallback, debugMessageCallback);
+        ASSIGN_CORE(glDebugMessageControl, debugMessageControl);
+        ASSIGN_CORE(glDebugMessageInsert, debugMessageInsert);
+        ASSIGN_CORE(glDispatchCompute, dispatchCompute);
+        ASSIGN_CORE(glDispatchComputeIndirect, dispatchComputeIndirect);
+        ASSIGN_CORE(glFramebufferParameteri, framebufferParameteri);
+        ASSIGN_CORE(glGetDebugMessageLog, getDebugMessageLog);
+        ASSIGN_CORE(glGetFramebufferParameteriv, getFramebufferParameteriv);
+        ASSIGN_CORE(glGetInternalformati64v, getInternalformati64v);
+        ASSIGN_CORE(glGetObjectLabel, getObjectLabel);
+        ASSIGN_CORE(glGetObjectPtrLabel, getObjectPtrLabel);
+        ASSIGN_CORE(glGetPointerv, getPointerv);
+        ASSIGN_CORE(glGetProgramInterfaceiv, getProgramInterfaceiv);
+        ASSIGN_CORE(glGetProgramResourceIndex, getProgramResourceIndex);
+        ASSIGN_CORE(glGetProgramResourceLocation, getProgramResourceLocation);
+        ASSIGN_CORE(glGetProgramResourceLocationIndex, getProgramResourceLocationIndex);
+        ASSIGN_CORE(glGetProgramResourceName, getProgramResourceName);
+        ASSIGN_CORE(glGetProgramResourceiv, getProgramResourceiv);
+        ASSIGN_CORE(glInvalidateBufferData, invalidateBufferData);
+        ASSIGN_CORE(glInvalidateBufferSubData, invalidateBufferSubData);
+        ASSIGN_CORE(glInvalidateFramebuffer, invalidateFramebuffer);
+        ASSIGN_CORE(glInvalidateSubFramebuffer, invalidateSubFramebuffer);
+        ASSIGN_CORE(glInvalidateTexImage, invalidateTexImage);
+        ASSIGN_CORE(glInvalidateTexSubImage, invalidateTexSubImage);
+        ASSIGN_CORE(glMultiDrawArraysIndirect, multiDrawArraysIndirect);
+        ASSIGN_CORE(glMultiDrawElementsIndirect, multiDrawElementsIndirect);
+        ASSIGN_CORE(glObjectLabel, objectLabel);
+        ASSIGN_CORE(glObjectPtrLabel, objectPtrLabel);
+        ASSIGN_CORE(glPopDebugGroup, popDebugGroup);
+        ASSIGN_CORE(glPushDebugGroup, pushDebugGroup);
+        ASSIGN_CORE(glShaderStorageBlockBinding, shaderStorageBlockBinding);
+        ASSIGN_CORE(glTexBufferRange, texBufferRange);
+        ASSIGN_CORE(glTexStorage2DMultisample, texStorage2DMultisample);
+        ASSIGN_CORE(glTexStorage3DMultisample, texStorage3DMultisample);
+        ASSIGN_CORE(glTextureView, textureView);
+        ASSIGN_CORE(glVertexAttribBinding, vertexAttribBinding);
+        ASSIGN_CORE(glVertexAttribFormat, vertexAttribFormat);
+        ASSIGN_CORE(glVertexAttribIFormat, vertexAttribIFormat);
+        ASSIGN_CORE(glVertexAttribLFormat, vertexAttribLFormat);
+        ASSIGN_CORE(glVertexBindingDivisor, vertexBindingDivisor);
     }
 
     if (version >= gl::Version(4, 4))
     {
-        ASSIGN("glBindBuffersBase", bindBuffersBase);
-        ASSIGN("glBindBuffersRange", bindBuffersRange);
-        ASSIGN("glBindImageTextures", bindImageTextures);
-        ASSIGN("glBindSamplers", bindSamplers);
-        ASSIGN("glBindTextures", bindTextures);
-        ASSIGN("glBindVertexBuffers", bindVertexBuffers);
-        ASSIGN("glBufferStorage", bufferStorage);
-        ASSIGN("glClearTexImage", clearTexImage);
-        ASSIGN("glClearTexSubImage", clearTexSubImage);
+        ASSIGN_CORE(glBindBuffersBase, bindBuffersBase);
+        ASSIGN_CORE(glBindBuffersRange, bindBuffersRange);
+        ASSIGN_CORE(glBindImageTextures, bindImageTextures);
+        ASSIGN_CORE(glBindSamplers, bindSamplers);
+        ASSIGN_CORE(glBindTextures, bindTextures);
+        ASSIGN_CORE(glBindVertexBuffers, bindVertexBuffers);
+        ASSIGN_CORE(glBufferStorage, bufferStorage);
+        ASSIGN_CORE(glClearTexImage, clearTexImage);
+        ASSIGN_CORE(glClearTexSubImage, clearTexSubImage);
     }
 
     if (version >= gl::Version(4, 5))
     {
-        ASSIGN("glBindTextureUnit", bindTextureUnit);
-        ASSIGN("glBlitNamedFramebuffer", blitNamedFramebuffer);
-        ASSIGN("glCheckNamedFramebufferStatus", checkNamedFramebufferStatus);
-        ASSIGN("glClearNamedBufferData", clearNamedBufferData);
-        ASSIGN("glClearNamedBufferSubData", clearNamedBufferSubData);
-        ASSIGN("glClearNamedFramebufferfi", clearNamedFramebufferfi);
-        ASSIGN("glClearNamedFramebufferfv", clearNamedFramebufferfv);
-        ASSIGN("glClearNamedFramebufferiv", clearNamedFramebufferiv);
-        ASSIGN("glClearNamedFramebufferuiv", clearNamedFramebufferuiv);
-        ASSIGN("glClipControl", clipControl);
-        ASSIGN("glCompressedTextureSubImage1D", compressedTextureSubImage1D);
-        ASSIGN("glCompressedTextureSubImage2D", compressedTextureSubImage2D);
-        ASSIGN("glCompressedTextureSubImage3D", compressedTextureSubImage3D);
-        ASSIGN("glCopyNamedBufferSubData", copyNamedBufferSubData);
-        ASSIGN("glCopyTextureSubImage1D", copyTextureSubImage1D);
-        ASSIGN("glCopyTextureSubImage2D", copyTextureSubImage2D);
-        ASSIGN("glCopyTextureSubImage3D", copyTextureSubImage3D);
-        ASSIGN("glCreateBuffers", createBuffers);
-        ASSIGN("glCreateFramebuffers", createFramebuffers);
-        ASSIGN("glCreateProgramPipelines", createProgramPipelines);
-        ASSIGN("glCreateQueries", createQueries);
-        ASSIGN("glCreateRenderbuffers", createRenderbuffers);
-        ASSIGN("glCreateSamplers", createSamplers);
-        ASSIGN("glCreateTextures", createTextures);
-        ASSIGN("glCreateTransformFeedbacks", createTransformFeedbacks);
-        ASSIGN("glCreateVertexArrays", createVertexArrays);
-        ASSIGN("glDisableVertexArrayAttrib", disableVertexArrayAttrib);
-        ASSIGN("glEnableVertexArrayAttrib", enableVertexArrayAttrib);
-        ASSIGN("glFlushMappedNamedBufferRange", flushMappedNamedBufferRange);
-        ASSIGN("glGenerateTextureMipmap", generateTextureMipmap);
-        ASSIGN("glGetCompressedTextureImage", getCompressedTextureImage);
-        ASSIGN("glGetCompressedTextureSubImage", getCompressedTextureSubImage);
-        ASSIGN("glGetGraphicsResetStatus", getGraphicsResetStatus);
-        ASSIGN("glGetNamedBufferParameteri64v", getNamedBufferParameteri64v);
-        ASSIGN("glGetNamedBufferParameteriv", getNamedBufferParameteriv);
-        ASSIGN("glGetNamedBufferPointerv", getNamedBufferPointerv);
-        ASSIGN("glGetNamedBufferSubData", getNamedBufferSubData);
-        ASSIGN("glGetNamedFramebufferAttachmentParameteriv",
-               getNamedFramebufferAttachmentParameteriv);
-        ASSIGN("glGetNamedFramebufferParameteriv", getNamedFramebufferParameteriv);
-        ASSIGN("glGetNamedRenderbufferParameteriv", getNamedRenderbufferParameteriv);
-        ASSIGN("glGetQueryBufferObjecti64v", getQueryBufferObjecti64v);
-        ASSIGN("glGetQueryBufferObjectiv", getQueryBufferObjectiv);
-        ASSIGN("glGetQueryBufferObjectui64v", getQueryBufferObjectui64v);
-        ASSIGN("glGetQueryBufferObjectuiv", getQueryBufferObjectuiv);
-        ASSIGN("glGetTextureImage", getTextureImage);
-        ASSIGN("glGetTextureLevelParameterfv", getTextureLevelParameterfv);
-        ASSIGN("glGetTextureLevelParameteriv", getTextureLevelParameteriv);
-        ASSIGN("glGetTextureParameterIiv", getTextureParameterIiv);
-        ASSIGN("glGetTextureParameterIuiv", getTextureParameterIuiv);
-        ASSIGN("glGetTextureParameterfv", getTextureParameterfv);
-        ASSIGN("glGetTextureParameteriv", getTextureParameteriv);
-        ASSIGN("glGetTextureSubImage", getTextureSubImage);
-        ASSIGN("glGetTransformFeedbacki64_v", getTransformFeedbacki64_v);
-        ASSIGN("glGetTransformFeedbacki_v", getTransformFeedbacki_v);
-        ASSIGN("glGetTransformFeedbackiv", getTransformFeedbackiv);
-        ASSIGN("glGetVertexArrayIndexed64iv", getVertexArrayIndexed64iv);
-        ASSIGN("glGetVertexArrayIndexediv", getVertexArrayIndexediv);
-        ASSIGN("glGetVertexArrayiv", getVertexArrayiv);
-        ASSIGN("glGetnCompressedTexImage", getnCompressedTexImage);
-        ASSIGN("glGetnTexImage", getnTexImage);
-        ASSIGN("glGetnUniformdv", getnUniformdv);
-        ASSIGN("glGetnUniformfv", getnUniformfv);
-        ASSIGN("glGetnUniformiv", getnUniformiv);
-        ASSIGN("glGetnUniformuiv", getnUniformuiv);
-        ASSIGN("glInvalidateNamedFramebufferData", invalidateNamedFramebufferData);
-        ASSIGN("glInvalidateNamedFramebufferSubData", invalidateNamedFramebufferSubData);
-        ASSIGN("glMapNamedBuffer", mapNamedBuffer);
-        ASSIGN("glMapNamedBufferRange", mapNamedBufferRange);
-        ASSIGN("glMemoryBarrierByRegion", memoryBarrierByRegion);
-        ASSIGN("glNamedBufferData", namedBufferData);
-        ASSIGN("glNamedBufferStorage", namedBufferStorage);
-        ASSIGN("glNamedBufferSubData", namedBufferSubData);
-        ASSIGN("glNamedFramebufferDrawBuffer", namedFramebufferDrawBuffer);
-        ASSIGN("glNamedFramebufferDrawBuffers", namedFramebufferDrawBuffers);
-        ASSIGN("glNamedFramebufferParameteri", namedFramebufferParameteri);
-        ASSIGN("glNamedFramebufferReadBuffer", namedFramebufferReadBuffer);
-        ASSIGN("glNamedFramebufferRenderbuffer", namedFramebufferRenderbuffer);
-        ASSIGN("glNamedFramebufferTexture", namedFramebufferTexture);
-        ASSIGN("glNamedFramebufferTextureLayer", namedFramebufferTextureLayer);
-        ASSIGN("glNamedRenderbufferStorage", namedRenderbufferStorage);
-        ASSIGN("glNamedRenderbufferStorageMultisample", namedRenderbufferStorageMultisample);
-        ASSIGN("glReadnPixels", readnPixels);
-        ASSIGN("glTextureBarrier", textureBarrier);
-        ASSIGN("glTextureBuffer", textureBuffer);
-        ASSIGN("glTextureBufferRange", textureBufferRange);
-        ASSIGN("glTextureParameterIiv", textureParameterIiv);
-        ASSIGN("glTextureParameterIuiv", textureParameterIuiv);
-        ASSIGN("glTextureParameterf", textureParameterf);
-        ASSIGN("glTextureParameterfv", textureParameterfv);
-        ASSIGN("glTextureParameteri", textureParameteri);
-        ASSIGN("glTextureParameteriv", textureParameteriv);
-        ASSIGN("glTextureStorage1D", textureStorage1D);
-        ASSIGN("glTextureStorage2D", textureStorage2D);
-        ASSIGN("glTextureStorage2DMultisample", textureStorage2DMultisample);
-        ASSIGN("glTextureStorage3D", textureStorage3D);
-        ASSIGN("glTextureStorage3DMultisample", textureStorage3DMultisample);
-        ASSIGN("glTextureSubImage1D", textureSubImage1D);
-        ASSIGN("glTextureSubImage2D", textureSubImage2D);
-        ASSIGN("glTextureSubImage3D", textureSubImage3D);
-        ASSIGN("glTransformFeedbackBufferBase", transformFeedbackBufferBase);
-        ASSIGN("glTransformFeedbackBufferRange", transformFeedbackBufferRange);
-        ASSIGN("glUnmapNamedBuffer", unmapNamedBuffer);
-        ASSIGN("glVertexArrayAttribBinding", vertexArrayAttribBinding);
-        ASSIGN("glVertexArrayAttribFormat", vertexArrayAttribFormat);
-        ASSIGN("glVertexArrayAttribIFormat", vertexArrayAttribIFormat);
-        ASSIGN("glVertexArrayAttribLFormat", vertexArrayAttribLFormat);
-        ASSIGN("glVertexArrayBindingDivisor", vertexArrayBindingDivisor);
-        ASSIGN("glVertexArrayElementBuffer", vertexArrayElementBuffer);
-        ASSIGN("glVertexArrayVertexBuffer", vertexArrayVertexBuffer);
-        ASSIGN("glVertexArrayVertexBuffers", vertexArrayVertexBuffers);
+        ASSIGN_CORE(glBindTextureUnit, bindTextureUnit);
+        ASSIGN_CORE(glBlitNamedFramebuffer, blitNamedFramebuffer);
+        ASSIGN_CORE(glCheckNamedFramebufferStatus, checkNamedFramebufferStatus);
+        ASSIGN_CORE(glClearNamedBufferData, clearNamedBufferData);
+        ASSIGN_CORE(glClearNamedBufferSubData, clearNamedBufferSubData);
+        ASSIGN_CORE(glClearNamedFramebufferfi, clearNamedFramebufferfi);
+        ASSIGN_CORE(glClearNamedFramebufferfv, clearNamedFramebufferfv);
+        ASSIGN_CORE(glClearNamedFramebufferiv, clearNamedFramebufferiv);
+        ASSIGN_CORE(glClearNamedFramebufferuiv, clearNamedFramebufferuiv);
+        ASSIGN_CORE(glClipControl, clipControl);
+        ASSIGN_CORE(glCompressedTextureSubImage1D, compressedTextureSubImage1D);
+        ASSIGN_CORE(glCompressedTextureSubImage2D, compressedTextureSubImage2D);
+        ASSIGN_CORE(glCompressedTextureSubImage3D, compressedTextureSubImage3D);
+        ASSIGN_CORE(glCopyNamedBufferSubData, copyNamedBufferSubData);
+        ASSIGN_CORE(glCopyTextureSubImage1D, copyTextureSubImage1D);
+        ASSIGN_CORE(glCopyTextureSubImage2D, copyTextureSubImage2D);
+        ASSIGN_CORE(glCopyTextureSubImage3D, copyTextureSubImage3D);
+        ASSIGN_CORE(glCreateBuffers, createBuffers);
+        ASSIGN_CORE(glCreateFramebuffers, createFramebuffers);
+        ASSIGN_CORE(glCreateProgramPipelines, createProgramPipelines);
+        ASSIGN_CORE(glCreateQueries, createQueries);
+        ASSIGN_CORE(glCreateRenderbuffers, createRenderbuffers);
+        ASSIGN_CORE(glCreateSamplers, createSamplers);
+        ASSIGN_CORE(glCreateTextures, createTextures);
+        ASSIGN_CORE(glCreateTransformFeedbacks, createTransformFeedbacks);
+        ASSIGN_CORE(glCreateVertexArrays, createVertexArrays);
+        ASSIGN_CORE(glDisableVertexArrayAttrib, disableVertexArrayAttrib);
+        ASSIGN_CORE(glEnableVertexArrayAttrib, enableVertexArrayAttrib);
+        ASSIGN_CORE(glFlushMappedNamedBufferRange, flushMappedNamedBufferRange);
+        ASSIGN_CORE(glGenerateTextureMipmap, generateTextureMipmap);
+        ASSIGN_CORE(glGetCompressedTextureImage, getCompressedTextureImage);
+        ASSIGN_CORE(glGetCompressedTextureSubImage, getCompressedTextureSubImage);
+        ASSIGN_CORE(glGetGraphicsResetStatus, getGraphicsResetStatus);
+        ASSIGN_CORE(glGetNamedBufferParameteri64v, getNamedBufferParameteri64v);
+        ASSIGN_CORE(glGetNamedBufferParameteriv, getNamedBufferParameteriv);
+        ASSIGN_CORE(glGetNamedBufferPointerv, getNamedBufferPointerv);
+        ASSIGN_CORE(glGetNamedBufferSubData, getNamedBufferSubData);
+        ASSIGN_CORE(glGetNamedFramebufferAttachmentParameteriv,
+                    getNamedFramebufferAttachmentParameteriv);
+        ASSIGN_CORE(glGetNamedFramebufferParameteriv, getNamedFramebufferParameteriv);
+        ASSIGN_CORE(glGetNamedRenderbufferParameteriv, getNamedRenderbufferParameteriv);
+        ASSIGN_CORE(glGetQueryBufferObjecti64v, getQueryBufferObjecti64v);
+        ASSIGN_CORE(glGetQueryBufferObjectiv, getQueryBufferObjectiv);
+        ASSIGN_CORE(glGetQueryBufferObjectui64v, getQueryBufferObjectui64v);
+        ASSIGN_CORE(glGetQueryBufferObjectuiv, getQueryBufferObjectuiv);
+        ASSIGN_CORE(glGetTextureImage, getTextureImage);
+        ASSIGN_CORE(glGetTextureLevelParameterfv, getTextureLevelParameterfv);
+        ASSIGN_CORE(glGetTextureLevelParameteriv, getTextureLevelParameteriv);
+        ASSIGN_CORE(glGetTextureParameterIiv, getTextureParameterIiv);
+        ASSIGN_CORE(glGetTextureParameterIuiv, getTextureParameterIuiv);
+        ASSIGN_CORE(glGetTextureParameterfv, getTextureParameterfv);
+        ASSIGN_CORE(glGetTextureParameteriv, getTextureParameteriv);
+        ASSIGN_CORE(glGetTextureSubImage, getTextureSubImage);
+        ASSIGN_CORE(glGetTransformFeedbacki64_v, getTransformFeedbacki64_v);
+        ASSIGN_CORE(glGetTransformFeedbacki_v, getTransformFeedbacki_v);
+        ASSIGN_CORE(glGetTransformFeedbackiv, getTransformFeedbackiv);
+        ASSIGN_CORE(glGetVertexArrayIndexed64iv, getVertexArrayIndexed64iv);
+        ASSIGN_CORE(glGetVertexArrayIndexediv, getVertexArrayIndexediv);
+        ASSIGN_CORE(glGetVertexArrayiv, getVertexArrayiv);
+        ASSIGN_CORE(glGetnCompressedTexImage, getnCompressedTexImage);
+        ASSIGN_CORE(glGetnTexImage, getnTexImage);
+        ASSIGN_CORE(glGetnUniformdv, getnUniformdv);
+        ASSIGN_CORE(glGetnUniformfv, getnUniformfv);
+        ASSIGN_CORE(glGetnUniformiv, getnUniformiv);
+        ASSIGN_CORE(glGetnUniformuiv, getnUniformuiv);
+        ASSIGN_CORE(glInvalidateNamedFramebufferData, invalidateNamedFramebufferData);
+        ASSIGN_CORE(glInvalidateNamedFramebufferSubData, invalidateNamedFramebufferSubData);
+        ASSIGN_CORE(glMapNamedBuffer, mapNamedBuffer);
+        ASSIGN_CORE(glMapNamedBufferRange, mapNamedBufferRange);
+        ASSIGN_CORE(glMemoryBarrierByRegion, memoryBarrierByRegion);
+        ASSIGN_CORE(glNamedBufferData, namedBufferData);
+        ASSIGN_CORE(glNamedBufferStorage, namedBufferStorage);
+        ASSIGN_CORE(glNamedBufferSubData, namedBufferSubData);
+        ASSIGN_CORE(glNamedFramebufferDrawBuffer, namedFramebufferDrawBuffer);
+        ASSIGN_CORE(glNamedFramebufferDrawBuffers, namedFramebufferDrawBuffers);
+        ASSIGN_CORE(glNamedFramebufferParameteri, namedFramebufferParameteri);
+        ASSIGN_CORE(glNamedFramebufferReadBuffer, namedFramebufferReadBuffer);
+        ASSIGN_CORE(glNamedFramebufferRenderbuffer, namedFramebufferRenderbuffer);
+        ASSIGN_CORE(glNamedFramebufferTexture, namedFramebufferTexture);
+        ASSIGN_CORE(glNamedFramebufferTextureLayer, namedFramebufferTextureLayer);
+        ASSIGN_CORE(glNamedRenderbufferStorage, namedRenderbufferStorage);
+        ASSIGN_CORE(glNamedRenderbufferStorageMultisample, namedRenderbufferStorageMultisample);
+        ASSIGN_CORE(glReadnPixels, readnPixels);
+        ASSIGN_CORE(glTextureBarrier, textureBarrier);
+        ASSIGN_CORE(glTextureBuffer, textureBuffer);
+        ASSIGN_CORE(glTextureBufferRange, textureBufferRange);
+        ASSIGN_CORE(glTextureParameterIiv, textureParameterIiv);
+        ASSIGN_CORE(glTextureParameterIuiv, textureParameterIuiv);
+        ASSIGN_CORE(glTextureParameterf, textureParameterf);
+        ASSIGN_CORE(glTextureParameterfv, textureParameterfv);
+        ASSIGN_CORE(glTextureParameteri, textureParameteri);
+        ASSIGN_CORE(glTextureParameteriv, textureParameteriv);
+        ASSIGN_CORE(glTextureStorage1D, textureStorage1D);
+        ASSIGN_CORE(glTextureStorage2D, textureStorage2D);
+        ASSIGN_CORE(glTextureStorage2DMultisample, textureStorage2DMultisample);
+        ASSIGN_CORE(glTextureStorage3D, textureStorage3D);
+        ASSIGN_CORE(glTextureStorage3DMultisample, textureStorage3DMultisample);
+        ASSIGN_CORE(glTextureSubImage1D, textureSubImage1D);
+        ASSIGN_CORE(glTextureSubImage2D, textureSubImage2D);
+        ASSIGN_CORE(glTextureSubImage3D, textureSubImage3D);
+        ASSIGN_CORE(glTransformFeedbackBufferBase, transformFeedbackBufferBase);
+        ASSIGN_CORE(glTransformFeedbackBufferRange, transformFeedbackBufferRange);
+        ASSIGN_CORE(glUnmapNamedBuffer, unmapNamedBuffer);
+        ASSIGN_CORE(glVertexArrayAttribBinding, vertexArrayAttribBinding);
+        ASSIGN_CORE(glVertexArrayAttribFormat, vertexArrayAttribFormat);
+        ASSIGN_CORE(glVertexArrayAttribIFormat, vertexArrayAttribIFormat);
+        ASSIGN_CORE(glVertexArrayAttribLFormat, vertexArrayAttribLFormat);
+        ASSIGN_CORE(glVertexArrayBindingDivisor, vertexArrayBindingDivisor);
+        ASSIGN_CORE(glVertexArrayElementBuffer, vertexArrayElementBuffer);
+        ASSIGN_CORE(glVertexArrayVertexBuffer, vertexArrayVertexBuffer);
+        ASSIGN_CORE(glVertexArrayVertexBuffers, vertexArrayVertexBuffers);
     }
 
     if (extensions.count("GL_ARB_ES2_compatibility") != 0)
     {
-        ASSIGN("glClearDepthf", clearDepthf);
-        ASSIGN("glDepthRangef", depthRangef);
-        ASSIGN("glGetShaderPrecisionFormat", getShaderPrecisionFormat);
-        ASSIGN("glReleaseShaderCompiler", releaseShaderCompiler);
-        ASSIGN("glShaderBinary", shaderBinary);
+        ASSIGN(glClearDepthf, clearDepthf);
+        ASSIGN(glDepthRangef, depthRangef);
+        ASSIGN(glGetShaderPrecisionFormat, getShaderPrecisionFormat);
+        ASSIGN(glReleaseShaderCompiler, releaseShaderCompiler);
+        ASSIGN(glShaderBinary, shaderBinary);
     }
 
     if (extensions.count("GL_ARB_ES3_1_compatibility") != 0)
     {
-        ASSIGN("glMemoryBarrierByRegion", memoryBarrierByRegion);
+        ASSIGN(glMemoryBarrierByRegion, memoryBarrierByRegion);
     }
 
     if (extensions.count("GL_ARB_ES3_2_compatibility") != 0)
     {
-        ASSIGN("glPrimitiveBoundingBoxARB", primitiveBoundingBox);
+        ASSIGN(glPrimitiveBoundingBoxARB, primitiveBoundingBox);
     }
 
     if (extensions.count("GL_ARB_base_instance") != 0)
     {
-        ASSIGN("glDrawArraysInstancedBaseInstance", drawArraysInstancedBaseInstance);
-        ASSIGN("glDrawElementsInstancedBaseInstance", drawElementsInstancedBaseInstance);
-        ASSIGN("glDrawElementsInstancedBaseVertexBaseInstance",
+        ASSIGN(glDrawArraysInstancedBaseInstance, drawArraysInstancedBaseInstance);
+        ASSIGN(glDrawElementsInstancedBaseInstance, drawElementsInstancedBaseInstance);
+        ASSIGN(glDrawElementsInstancedBaseVertexBaseInstance,
                drawElementsInstancedBaseVertexBaseInstance);
     }
 
     if (extensions.count("GL_ARB_blend_func_extended") != 0)
     {
-        ASSIGN("glBindFragDataLocationIndexed", bindFragDataLocationIndexed);
-        ASSIGN("glGetFragDataIndex", getFragDataIndex);
+        ASSIGN(glBindFragDataLocationIndexed, bindFragDataLocationIndexed);
+        ASSIGN(glGetFragDataIndex, getFragDataIndex);
     }
 
     if (extensions.count("GL_ARB_buffer_storage") != 0)
     {
-        ASSIGN("glBufferStorage", bufferStorage);
+        ASSIGN(glBufferStorage, bufferStorage);
     }
 
     if (extensions.count("GL_ARB_clear_buffer_object") != 0)
     {
-        ASSIGN("glClearBufferData", clearBufferData);
-        ASSIGN("glClearBufferSubData", clearBufferSubData);
+        ASSIGN(glClearBufferData, clearBufferData);
+        ASSIGN(glClearBufferSubData, clearBufferSubData);
     }
 
     if (extensions.count("GL_ARB_clear_texture") != 0)
     {
-        ASSIGN("glClearTexImage", clearTexImage);
-        ASSIGN("glClearTexSubImage", clearTexSubImage);
+        ASSIGN(glClearTexImage, clearTexImage);
+        ASSIGN(glClearTexSubImage, clearTexSubImage);
     }
 
     if (extensions.count("GL_ARB_clip_control") != 0)
     {
-        ASSIGN("glClipControl", clipControl);
+        ASSIGN(glClipControl, clipControl);
     }
 
     if (extensions.count("GL_ARB_color_buffer_float") != 0)
     {
-        ASSIGN("glClampColorARB", clampColor);
+        ASSIGN(glClampColorARB, clampColor);
     }
 
     if (extensions.count("GL_ARB_compute_shader") != 0)
     {
-        ASSIGN("glDispatchCompute", dispatchCompute);
-        ASSIGN("glDispatchComputeIndirect", dispatchComputeIndirect);
+        ASSIGN(glDispatchCompute, dispatchCompute);
+        ASSIGN(glDispatchComputeIndirect, dispatchComputeIndirect);
     }
 
     if (extensions.count("GL_ARB_copy_buffer") != 0)
     {
-        ASSIGN("glCopyBufferSubData", copyBufferSubData);
+        ASSIGN(glCopyBufferSubData, copyBufferSubData);
     }
 
     if (extensions.count("GL_ARB_copy_image") != 0)
     {
-        ASSIGN("glCopyImageSubData", copyImageSubData);
+        ASSIGN(glCopyImageSubData, copyImageSubData);
     }
 
     if (extensions.count("GL_ARB_debug_output") != 0)
     {
-        ASSIGN("glDebugMessageCallbackARB", debugMessageCallback);
-        ASSIGN("glDebugMessageControlARB", debugMessageControl);
-        ASSIGN("glDebugMessageInsertARB", debugMessageInsert);
-        ASSIGN("glGetDebugMessageLogARB", getDebugMessageLog);
+        ASSIGN(glDebugMessageCallbackARB, debugMessageCallback);
+        ASSIGN(glDebugMessageControlARB, debugMessageControl);
+        ASSIGN(glDebugMessageInsertARB, debugMessageInsert);
+        ASSIGN(glGetDebugMessageLogARB, getDebugMessageLog);
     }
 
     if (extensions.count("GL_ARB_direct_state_access") != 0)
     {
-        ASSIGN("glBindTextureUnit", bindTextureUnit);
-        ASSIGN("glBlitNamedFramebuffer", blitNamedFramebuffer);
-        ASSIGN("glCheckNamedFramebufferStatus", checkNamedFramebufferStatus);
-        ASSIGN("glClearNamedBufferData", clearNamedBufferData);
-        ASSIGN("glClearNamedBufferSubData", clearNamedBufferSubData);
-        ASSIGN("glClearNamedFramebufferfi", clearNamedFramebufferfi);
-        ASSIGN("glClearNamedFramebufferfv", clearNamedFramebufferfv);
-        ASSIGN("glClearNamedFramebufferiv", clearNamedFramebufferiv);
-        ASSIGN("glClearNamedFramebufferuiv", clearNamedFramebufferuiv);
-        ASSIGN("glCompressedTextureSubImage1D", compressedTextureSubImage1D);
-        ASSIGN("glCompressedTextureSubImage2D", compressedTextureSubImage2D);
-        ASSIGN("glCompressedTextureSubImage3D", compressedTextureSubImage3D);
-        ASSIGN("glCopyNamedBufferSubData", copyNamedBufferSubData);
-        ASSIGN("glCopyTextureSubImage1D", copyTextureSubImage1D);
-        ASSIGN("glCopyTextureSubImage2D", copyTextureSubImage2D);
-        ASSIGN("glCopyTextureSubImage3D", copyTextureSubImage3D);
-        ASSIGN("glCreateBuffers", createBuffers);
-        ASSIGN("glCreateFramebuffers", createFramebuffers);
-        ASSIGN("glCreateProgramPipelines", createProgramPipelines);
-        ASSIGN("glCreateQueries", createQueries);
-        ASSIGN("glCreateRenderbuffers", createRenderbuffers);
-        ASSIGN("glCreateSamplers", createSamplers);
-        ASSIGN("glCreateTextures", createTextures);
-        ASSIGN("glCreateTransformFeedbacks", createTransformFeedbacks);
-        ASSIGN("glCreateVertexArrays", createVertexArrays);
-        ASSIGN("glDisableVertexArrayAttrib", disableVertexArrayAttrib);
-        ASSIGN("glEnableVertexArrayAttrib", enableVertexArrayAttrib);
-        ASSIGN("glFlushMappedNamedBufferRange", flushMappedNamedBufferRange);
-        ASSIGN("glGenerateTextureMipmap", generateTextureMipmap);
-        ASSIGN("glGetCompressedTextureImage", getCompressedTextureImage);
-        ASSIGN("glGetNamedBufferParameteri64v", getNamedBufferParameteri64v);
-        ASSIGN("glGetNamedBufferParameteriv", getNamedBufferParameteriv);
-        ASSIGN("glGetNamedBufferPointerv", getNamedBufferPointerv);
-        ASSIGN("glGetNamedBufferSubData", getNamedBufferSubData);
-        ASSIGN("glGetNamedFramebufferAttachmentParameteriv",
+        ASSIGN(glBindTextureUnit, bindTextureUnit);
+        ASSIGN(glBlitNamedFramebuffer, blitNamedFramebuffer);
+        ASSIGN(glCheckNamedFramebufferStatus, checkNamedFramebufferStatus);
+        ASSIGN(glClearNamedBufferData, clearNamedBufferData);
+        ASSIGN(glClearNamedBufferSubData, clearNamedBufferSubData);
+        ASSIGN(glClearNamedFramebufferfi, clearNamedFramebufferfi);
+        ASSIGN(glClearNamedFramebufferfv, clearNamedFramebufferfv);
+        ASSIGN(glClearNamedFramebufferiv, clearNamedFramebufferiv);
+        ASSIGN(glClearNamedFramebufferuiv, clearNamedFramebufferuiv);
+        ASSIGN(glCompressedTextureSubImage1D, compressedTextureSubImage1D);
+        ASSIGN(glCompressedTextureSubImage2D, compressedTextureSubImage2D);
+        ASSIGN(glCompressedTextureSubImage3D, compressedTextureSubImage3D);
+        ASSIGN(glCopyNamedBufferSubData, copyNamedBufferSubData);
+        ASSIGN(glCopyTextureSubImage1D, copyTextureSubImage1D);
+        ASSIGN(glCopyTextureSubImage2D, copyTextureSubImage2D);
+        ASSIGN(glCopyTextureSubImage3D, copyTextureSubImage3D);
+        ASSIGN(glCreateBuffers, createBuffers);
+        ASSIGN(glCreateFramebuffers, createFramebuffers);
+        ASSIGN(glCreateProgramPipelines, createProgramPipelines);
+        ASSIGN(glCreateQueries, createQueries);
+        ASSIGN(glCreateRenderbuffers, createRenderbuffers);
+        ASSIGN(glCreateSamplers, createSamplers);
+        ASSIGN(glCreateTextures, createTextures);
+        ASSIGN(glCreateTransformFeedbacks, createTransformFeedbacks);
+        ASSIGN(glCreateVertexArrays, createVertexArrays);
+        ASSIGN(glDisableVertexArrayAttrib, disableVertexArrayAttrib);
+        ASSIGN(glEnableVertexArrayAttrib, enableVertexArrayAttrib);
+        ASSIGN(glFlushMappedNamedBufferRange, flushMappedNamedBufferRange);
+        ASSIGN(glGenerateTextureMipmap, generateTextureMipmap);
+        ASSIGN(glGetCompressedTextureImage, getCompressedTextureImage);
+        ASSIGN(glGetNamedBufferParameteri64v, getNamedBufferParameteri64v);
+        ASSIGN(glGetNamedBufferParameteriv, getNamedBufferParameteriv);
+        ASSIGN(glGetNamedBufferPointerv, getNamedBufferPointerv);
+        ASSIGN(glGetNamedBufferSubData, getNamedBufferSubData);
+        ASSIGN(glGetNamedFramebufferAttachmentParameteriv,
                getNamedFramebufferAttachmentParameteriv);
-        ASSIGN("glGetNamedFramebufferParameteriv", getNamedFramebufferParameteriv);
-        ASSIGN("glGetNamedRenderbufferParameteriv", getNamedRenderbufferParameteriv);
-        ASSIGN("glGetQueryBufferObjecti64v", getQueryBufferObjecti64v);
-        ASSIGN("glGetQueryBufferObjectiv", getQueryBufferObjectiv);
-        ASSIGN("glGetQueryBufferObjectui64v", getQueryBufferObjectui64v);
-        ASSIGN("glGetQueryBufferObjectuiv", getQueryBufferObjectuiv);
-        ASSIGN("glGetTextureImage", getTextureImage);
-        ASSIGN("glGetTextureLevelParameterfv", getTextureLevelParameterfv);
-        ASSIGN("glGetTextureLevelParameteriv", getTextureLevelParameteriv);
-        ASSIGN("glGetTextureParameterIiv", getTextureParameterIiv);
-        ASSIGN("glGetTextureParameterIuiv", getTextureParameterIuiv);
-        ASSIGN("glGetTextureParameterfv", getTextureParameterfv);
-        ASSIGN("glGetTextureParameteriv", getTextureParameteriv);
-        ASSIGN("glGetTransformFeedbacki64_v", getTransformFeedbacki64_v);
-        ASSIGN("glGetTransformFeedbacki_v", getTransformFeedbacki_v);
-        ASSIGN("glGetTransformFeedbackiv", getTransformFeedbackiv);
-        ASSIGN("glGetVertexArrayIndexed64iv", getVertexArrayIndexed64iv);
-        ASSIGN("glGetVertexArrayIndexediv", getVertexArrayIndexediv);
-        ASSIGN("glGetVertexArrayiv", getVertexArrayiv);
-        ASSIGN("glInvalidateNamedFramebufferData", invalidateNamedFramebufferData);
-        ASSIGN("glInvalidateNamedFramebufferSubData", invalidateNamedFramebufferSubData);
-        ASSIGN("glMapNamedBuffer", mapNamedBuffer);
-        ASSIGN("glMapNamedBufferRange", mapNamedBufferRange);
-        ASSIGN("glNamedBufferData", namedBufferData);
-        ASSIGN("glNamedBufferStorage", namedBufferStorage);
-        ASSIGN("glNamedBufferSubData", namedBufferSubData);
-        ASSIGN("glNamedFramebufferDrawBuffer", namedFramebufferDrawBuffer);
-        ASSIGN("glNamedFramebufferDrawBuffers", namedFramebufferDrawBuffers);
-        ASSIGN("glNamedFramebufferParameteri", namedFramebufferParameteri);
-        ASSIGN("glNamedFramebufferReadBuffer", namedFramebufferReadBuffer);
-        ASSIGN("glNamedFramebufferRenderbuffer", namedFramebufferRenderbuffer);
-        ASSIGN("glNamedFramebufferTexture", namedFramebufferTexture);
-        ASSIGN("glNamedFramebufferTextureLayer", namedFramebufferTextureLayer);
-        ASSIGN("glNamedRenderbufferStorage", namedRenderbufferStorage);
-        ASSIGN("glNamedRenderbufferStorageMultisample", namedRenderbufferStorageMultisample);
-        ASSIGN("glTextureBuffer", textureBuffer);
-        ASSIGN("glTextureBufferRange", textureBufferRange);
-        ASSIGN("glTextureParameterIiv", textureParameterIiv);
-        ASSIGN("glTextureParameterIuiv", textureParameterIuiv);
-        ASSIGN("glTextureParameterf", textureParameterf);
-        ASSIGN("glTextureParameterfv", textureParameterfv);
-        ASSIGN("glTextureParameteri", textureParameteri);
-        ASSIGN("glTextureParameteriv", textureParameteriv);
-        ASSIGN("glTextureStorage1D", textureStorage1D);
-        ASSIGN("glTextureStorage2D", textureStorage2D);
-        ASSIGN("glTextureStorage2DMultisample", textureStorage2DMultisample);
-        ASSIGN("glTextureStorage3D", textureStorage3D);
-        ASSIGN("glTextureStorage3DMultisample", textureStorage3DMultisample);
-        ASSIGN("glTextureSubImage1D", textureSubImage1D);
-        ASSIGN("glTextureSubImage2D", textureSubImage2D);
-        ASSIGN("glTextureSubImage3D", textureSubImage3D);
-        ASSIGN("glTransformFeedbackBufferBase", transformFeedbackBufferBase);
-        ASSIGN("glTransformFeedbackBufferRange", transformFeedbackBufferRange);
-        ASSIGN("glUnmapNamedBuffer", unmapNamedBuffer);
-        ASSIGN("glVertexArrayAttribBinding", vertexArrayAttribBinding);
-        ASSIGN("glVertexArrayAttribFormat", vertexArrayAttribFormat);
-        ASSIGN("glVertexArrayAttribIFormat", vertexArrayAttribIFormat);
-        ASSIGN("glVertexArrayAttribLFormat", vertexArrayAttribLFormat);
-        ASSIGN("glVertexArrayBindingDivisor", vertexArrayBindingDivisor);
-        ASSIGN("glVertexArrayElementBuffer", vertexArrayElementBuffer);
-        ASSIGN("glVertexArrayVertexBuffer", vertexArrayVertexBuffer);
-        ASSIGN("glVertexArrayVertexBuffers", vertexArrayVertexBuffers);
+        ASSIGN(glGetNamedFramebufferParameteriv, getNamedFramebufferParameteriv);
+        ASSIGN(glGetNamedRenderbufferParameteriv, getNamedRenderbufferParameteriv);
+        ASSIGN(glGetQueryBufferObjecti64v, getQueryBufferObjecti64v);
+        ASSIGN(glGetQueryBufferObjectiv, getQueryBufferObjectiv);
+        ASSIGN(glGetQueryBufferObjectui64v, getQueryBufferObjectui64v);
+        ASSIGN(glGetQueryBufferObjectuiv, getQueryBufferObjectuiv);
+        ASSIGN(glGetTextureImage, getTextureImage);
+        ASSIGN(glGetTextureLevelParameterfv, getTextureLevelParameterfv);
+        ASSIGN(glGetTextureLevelParameteriv, getTextureLevelParameteriv);
+        ASSIGN(glGetTextureParameterIiv, getTextureParameterIiv);
+        ASSIGN(glGetTextureParameterIuiv, getTextureParameterIuiv);
+        ASSIGN(glGetTextureParameterfv, getTextureParameterfv);
+        ASSIGN(glGetTextureParameteriv, getTextureParameteriv);
+        ASSIGN(glGetTransformFeedbacki64_v, getTransformFeedbacki64_v);
+        ASSIGN(glGetTransformFeedbacki_v, getTransformFeedbacki_v);
+        ASSIGN(glGetTransformFeedbackiv, getTransformFeedbackiv);
+        ASSIGN(glGetVertexArrayIndexed64iv, getVertexArrayIndexed64iv);
+        ASSIGN(glGetVertexArrayIndexediv, getVertexArrayIndexediv);
+        ASSIGN(glGetVertexArrayiv, getVertexArrayiv);
+        ASSIGN(glInvalidateNamedFramebufferData, invalidateNamedFramebufferData);
+        ASSIGN(glInvalidateNamedFramebufferSubData, invalidateNamedFramebufferSubData);
+        ASSIGN(glMapNamedBuffer, mapNamedBuffer);
+        ASSIGN(glMapNamedBufferRange, mapNamedBufferRange);
+        ASSIGN(glNamedBufferData, namedBufferData);
+        ASSIGN(glNamedBufferStorage, namedBufferStorage);
+        ASSIGN(glNamedBufferSubData, namedBufferSubData);
+        ASSIGN(glNamedFramebufferDrawBuffer, namedFramebufferDrawBuffer);
+        ASSIGN(glNamedFramebufferDrawBuffers, namedFramebufferDrawBuffers);
+        ASSIGN(glNamedFramebufferParameteri, namedFramebufferParameteri);
+        ASSIGN(glNamedFramebufferReadBuffer, namedFramebufferReadBuffer);
+        ASSIGN(glNamedFramebufferRenderbuffer, namedFramebufferRenderbuffer);
+        ASSIGN(glNamedFramebufferTexture, namedFramebufferTexture);
+        ASSIGN(glNamedFramebufferTextureLayer, namedFramebufferTextureLayer);
+        ASSIGN(glNamedRenderbufferStorage, namedRenderbufferStorage);
+        ASSIGN(glNamedRenderbufferStorageMultisample, namedRenderbufferStorageMultisample);
+        ASSIGN(glTextureBuffer, textureBuffer);
+        ASSIGN(glTextureBufferRange, textureBufferRange);
+        ASSIGN(glTextureParameterIiv, textureParameterIiv);
+        ASSIGN(glTextureParameterIuiv, textureParameterIuiv);
+        ASSIGN(glTextureParameterf, textureParameterf);
+        ASSIGN(glTextureParameterfv, textureParameterfv);
+        ASSIGN(glTextureParameteri, textureParameteri);
+        ASSIGN(glTextureParameteriv, textureParameteriv);
+        ASSIGN(glTextureStorage1D, textureStorage1D);
+        ASSIGN(glTextureStorage2D, textureStorage2D);
+        ASSIGN(glTextureStorage2DMultisample, textureStorage2DMultisample);
+        ASSIGN(glTextureStorage3D, textureStorage3D);
+        ASSIGN(glTextureStorage3DMultisample, textureStorage3DMultisample);
+        ASSIGN(glTextureSubImage1D, textureSubImage1D);
+        ASSIGN(glTextureSubImage2D, textureSubImage2D);
+        ASSIGN(glTextureSubImage3D, textureSubImage3D);
+        ASSIGN(glTransformFeedbackBufferBase, transformFeedbackBufferBase);
+        ASSIGN(glTransformFeedbackBufferRange, transformFeedbackBufferRange);
+        ASSIGN(glUnmapNamedBuffer, unmapNamedBuffer);
+        ASSIGN(glVertexArrayAttribBinding, vertexArrayAttribBinding);
+        ASSIGN(glVertexArrayAttribFormat, vertexArrayAttribFormat);
+        ASSIGN(glVertexArrayAttribIFormat, vertexArrayAttribIFormat);
+        ASSIGN(glVertexArrayAttribLFormat, vertexArrayAttribLFormat);
+        ASSIGN(glVertexArrayBindingDivisor, vertexArrayBindingDivisor);
+        ASSIGN(glVertexArrayElementBuffer, vertexArrayElementBuffer);
+        ASSIGN(glVertexArrayVertexBuffer, vertexArrayVertexBuffer);
+        ASSIGN(glVertexArrayVertexBuffers, vertexArrayVertexBuffers);
     }
 
     if (extensions.count("GL_ARB_draw_buffers") != 0)
     {
-        ASSIGN("glDrawBuffersARB", drawBuffers);
+        ASSIGN(glDrawBuffersARB, drawBuffers);
     }
 
     if (extensions.count("GL_ARB_draw_buffers_blend") != 0)
     {
-        ASSIGN("glBlendEquationSeparateiARB", blendEquationSeparatei);
-        ASSIGN("glBlendEquationiARB", blendEquationi);
-        ASSIGN("glBlendFuncSeparateiARB", blendFuncSeparatei);
-        ASSIGN("glBlendFunciARB", blendFunci);
+        ASSIGN(glBlendEquationSeparateiARB, blendEquationSeparatei);
+        ASSIGN(glBlendEquationiARB, blendEquationi);
+        ASSIGN(glBlendFuncSeparateiARB, blendFuncSeparatei);
+        ASSIGN(glBlendFunciARB, blendFunci);
     }
 
     if (extensions.count("GL_ARB_draw_elements_base_vertex") != 0)
     {
-        ASSIGN("glDrawElementsBaseVertex", drawElementsBaseVertex);
-        ASSIGN("glDrawElementsInstancedBaseVertex", drawElementsInstancedBaseVertex);
-        ASSIGN("glDrawRangeElementsBaseVertex", drawRangeElementsBaseVertex);
-        ASSIGN("glMultiDrawElementsBaseVertex", multiDrawElementsBaseVertex);
+        ASSIGN(glDrawElementsBaseVertex, drawElementsBaseVertex);
+        ASSIGN(glDrawElementsInstancedBaseVertex, drawElementsInstancedBaseVertex);
+        ASSIGN(glDrawRangeElementsBaseVertex, drawRangeElementsBaseVertex);
+        ASSIGN(glMultiDrawElementsBaseVertex, multiDrawElementsBaseVertex);
     }
 
     if (extensions.count("GL_ARB_draw_indirect") != 0)
     {
-        ASSIGN("glDrawArraysIndirect", drawArraysIndirect);
-        ASSIGN("glDrawElementsIndirect", drawElementsIndirect);
+        ASSIGN(glDrawArraysIndirect, drawArraysIndirect);
+        ASSIGN(glDrawElementsIndirect, drawElementsIndirect);
     }
 
     if (extensions.count("GL_ARB_draw_instanced") != 0)
     {
-        ASSIGN("glDrawArraysInstancedARB", drawArraysInstanced);
-        ASSIGN("glDrawElementsInstancedARB", drawElementsInstanced);
+        ASSIGN(glDrawArraysInstancedARB, drawArraysInstanced);
+        ASSIGN(glDrawElementsInstancedARB, drawElementsInstanced);
     }
 
     if (extensions.count("GL_ARB_fragment_program") != 0)
     {
-        ASSIGN("glGetProgramivARB", getProgramiv);
-        ASSIGN("glIsProgramARB", isProgram);
+        ASSIGN(glGetProgramivARB, getProgramiv);
+        ASSIGN(glIsProgramARB, isProgram);
     }
 
     if (extensions.count("GL_ARB_framebuffer_no_attachments") != 0)
     {
-        ASSIGN("glFramebufferParameteri", framebufferParameteri);
-        ASSIGN("glGetFramebufferParameteriv", getFramebufferParameteriv);
+        ASSIGN(glFramebufferParameteri, framebufferParameteri);
+        ASSIGN(glGetFramebufferParameteriv, getFramebufferParameteriv);
     }
 
     if (extensions.count("GL_ARB_framebuffer_object") != 0)
     {
-        ASSIGN("glBindFramebuffer", bindFramebuffer);
-        ASSIGN("glBindRenderbuffer", bindRenderbuffer);
-        ASSIGN("glBlitFramebuffer", blitFramebuffer);
-        ASSIGN("glCheckFramebufferStatus", checkFramebufferStatus);
-        ASSIGN("glDeleteFramebuffers", deleteFramebuffers);
-        ASSIGN("glDeleteRenderbuffers", deleteRenderbuffers);
-        ASSIGN("glFramebufferRenderbuffer", framebufferRenderbuffer);
-        ASSIGN("glFramebufferTexture1D", framebufferTexture1D);
-        ASSIGN("glFramebufferTexture2D", framebufferTexture2D);
-        ASSIGN("glFramebufferTexture3D", framebufferTexture3D);
-        ASSIGN("glFramebufferTextureLayer", framebufferTextureLayer);
-        ASSIGN("glGenFramebuffers", genFramebuffers);
-        ASSIGN("glGenRenderbuffers", genRenderbuffers);
-        ASSIGN("glGenerateMipmap", generateMipmap);
-        ASSIGN("glGetFramebufferAttachmentParameteriv", getFramebufferAttachmentParameteriv);
-        ASSIGN("glGetRenderbufferParameteriv", getRenderbufferParameteriv);
-        ASSIGN("glIsFramebuffer", isFramebuffer);
-        ASSIGN("glIsRenderbuffer", isRenderbuffer);
-        ASSIGN("glRenderbufferStorage", renderbufferStorage);
-        ASSIGN("glRenderbufferStorageMultisample", renderbufferStorageMultisample);
+        ASSIGN(glBindFramebuffer, bindFramebuffer);
+        ASSIGN(glBindRenderbuffer, bindRenderbuffer);
+        ASSIGN(glBlitFramebuffer, blitFramebuffer);
+        ASSIGN(glCheckFramebufferStatus, checkFramebufferStatus);
+        ASSIGN(glDeleteFramebuffers, deleteFramebuffers);
+        ASSIGN(glDeleteRenderbuffers, deleteRenderbuffers);
+        ASSIGN(glFramebufferRenderbuffer, framebufferRenderbuffer);
+        ASSIGN(glFramebufferTexture1D, framebufferTexture1D);
+        ASSIGN(glFramebufferTexture2D, framebufferTexture2D);
+        ASSIGN(glFramebufferTexture3D, framebufferTexture3D);
+        ASSIGN(glFramebufferTextureLayer, framebufferTextureLayer);
+        ASSIGN(glGenFramebuffers, genFramebuffers);
+        ASSIGN(glGenRenderbuffers, genRenderbuffers);
+        ASSIGN(glGenerateMipmap, generateMipmap);
+        ASSIGN(glGetFramebufferAttachmentParameteriv, getFramebufferAttachmentParameteriv);
+        ASSIGN(glGetRenderbufferParameteriv, getRenderbufferParameteriv);
+        ASSIGN(glIsFramebuffer, isFramebuffer);
+        ASSIGN(glIsRenderbuffer, isRenderbuffer);
+        ASSIGN(glRenderbufferStorage, renderbufferStorage);
+        ASSIGN(glRenderbufferStorageMultisample, renderbufferStorageMultisample);
     }
 
     if (extensions.count("GL_ARB_geometry_shader4") != 0)
     {
-        ASSIGN("glFramebufferTextureARB", framebufferTexture);
-        ASSIGN("glFramebufferTextureLayerARB", framebufferTextureLayer);
-        ASSIGN("glProgramParameteriARB", programParameteri);
+        ASSIGN(glFramebufferTextureARB, framebufferTexture);
+        ASSIGN(glFramebufferTextureLayerARB, framebufferTextureLayer);
+        ASSIGN(glProgramParameteriARB, programParameteri);
     }
 
     if (extensions.count("GL_ARB_get_program_binary") != 0)
     {
-        ASSIGN("glGetProgramBinary", getProgramBinary);
-        ASSIGN("glProgramBinary", programBinary);
-        ASSIGN("glProgramParameteri", programParameteri);
+        ASSIGN(glGetProgramBinary, getProgramBinary);
+        ASSIGN(glProgramBinary, programBinary);
+        ASSIGN(glProgramParameteri, programParameteri);
     }
 
     if (extensions.count("GL_ARB_get_texture_sub_image") != 0)
     {
-        ASSIGN("glGetCompressedTextureSubImage", getCompressedTextureSubImage);
-        ASSIGN("glGetTextureSubImage", getTextureSubImage);
+        ASSIGN(glGetCompressedTextureSubImage, getCompressedTextureSubImage);
+        ASSIGN(glGetTextureSubImage, getTextureSubImage);
     }
 
     if (extensions.count("GL_ARB_gpu_shader_fp64") != 0)
     {
-        ASSIGN("glGetUniformdv", getUniformdv);
-        ASSIGN("glUniform1d", uniform1d);
-        ASSIGN("glUniform1dv", uniform1dv);
-        ASSIGN("glUniform2d", uniform2d);
-        ASSIGN("glUniform2dv", uniform2dv);
-        ASSIGN("glUniform3d", uniform3d);
-        ASSIGN("glUniform3dv", uniform3dv);
-        ASSIGN("glUniform4d", uniform4d);
-        ASSIGN("glUniform4dv", uniform4dv);
-        ASSIGN("glUniformMatrix2dv", uniformMatrix2dv);
-        ASSIGN("glUniformMatrix2x3dv", uniformMatrix2x3dv);
-        ASSIGN("glUniformMatrix2x4dv", uniformMatrix2x4dv);
-        ASSIGN("glUniformMatrix3dv", uniformMatrix3dv);
-        ASSIGN("glUniformMatrix3x2dv", uniformMatrix3x2dv);
-        ASSIGN("glUniformMatrix3x4dv", uniformMatrix3x4dv);
-        ASSIGN("glUniformMatrix4dv", uniformMatrix4dv);
-        ASSIGN("glUniformMatrix4x2dv", uniformMatrix4x2dv);
-        ASSIGN("glUniformMatrix4x3dv", uniformMatrix4x3dv);
+        ASSIGN(glGetUniformdv, getUniformdv);
+        ASSIGN(glUniform1d, uniform1d);
+        ASSIGN(glUniform1dv, uniform1dv);
+        ASSIGN(glUniform2d, uniform2d);
+        ASSIGN(glUniform2dv, uniform2dv);
+        ASSIGN(glUniform3d, uniform3d);
+        ASSIGN(glUniform3dv, uniform3dv);
+        ASSIGN(glUniform4d, uniform4d);
+        ASSIGN(glUniform4dv, uniform4dv);
+        ASSIGN(glUniformMatrix2dv, uniformMatrix2dv);
+        ASSIGN(glUniformMatrix2x3dv, uniformMatrix2x3dv);
+        ASSIGN(glUniformMatrix2x4dv, uniformMatrix2x4dv);
+        ASSIGN(glUniformMatrix3dv, uniformMatrix3dv);
+        ASSIGN(glUniformMatrix3x2dv, uniformMatrix3x2dv);
+        ASSIGN(glUniformMatrix3x4dv, uniformMatrix3x4dv);
+        ASSIGN(glUniformMatrix4dv, uniformMatrix4dv);
+        ASSIGN(glUniformMatrix4x2dv, uniformMatrix4x2dv);
+        ASSIGN(glUniformMatrix4x3dv, uniformMatrix4x3dv);
     }
 
     if (extensions.count("GL_ARB_imaging") != 0)
     {
-        ASSIGN("glBlendColor", blendColor);
-        ASSIGN("glBlendEquation", blendEquation);
+        ASSIGN(glBlendColor, blendColor);
+        ASSIGN(glBlendEquation, blendEquation);
     }
 
     if (extensions.count("GL_ARB_instanced_arrays") != 0)
     {
-        ASSIGN("glVertexAttribDivisorARB", vertexAttribDivisor);
+        ASSIGN(glVertexAttribDivisorARB, vertexAttribDivisor);
     }
 
     if (extensions.count("GL_ARB_internalformat_query") != 0)
     {
-        ASSIGN("glGetInternalformativ", getInternalformativ);
+        ASSIGN(glGetInternalformativ, getInternalformativ);
     }
 
     if (extensions.count("GL_ARB_internalformat_query2") != 0)
     {
-        ASSIGN("glGetInternalformati64v", getInternalformati64v);
+        ASSIGN(glGetInternalformati64v, getInternalformati64v);
     }
 
     if (extensions.count("GL_ARB_invalidate_subdata") != 0)
     {
-        ASSIGN("glInvalidateBufferData", invalidateBufferData);
-        ASSIGN("glInvalidateBufferSubData", invalidateBufferSubData);
-        ASSIGN("glInvalidateFramebuffer", invalidateFramebuffer);
-        ASSIGN("glInvalidateSubFramebuffer", invalidateSubFramebuffer);
-        ASSIGN("glInvalidateTexImage", invalidateTexImage);
-        ASSIGN("glInvalidateTexSubImage", invalidateTexSubImage);
+        ASSIGN(glInvalidateBufferData, invalidateBufferData);
+        ASSIGN(glInvalidateBufferSubData, invalidateBufferSubData);
+        ASSIGN(glInvalidateFramebuffer, invalidateFramebuffer);
+        ASSIGN(glInvalidateSubFramebuffer, invalidateSubFramebuffer);
+        ASSIGN(glInvalidateTexImage, invalidateTexImage);
+        ASSIGN(glInvalidateTexSubImage, invalidateTexSubImage);
     }
 
     if (extensions.count("GL_ARB_map_buffer_range") != 0)
     {
-        ASSIGN("glFlushMappedBufferRange", flushMappedBufferRange);
-        ASSIGN("glMapBufferRange", mapBufferRange);
+        ASSIGN(glFlushMappedBufferRange, flushMappedBufferRange);
+        ASSIGN(glMapBufferRange, mapBufferRange);
     }
 
     if (extensions.count("GL_ARB_multi_bind") != 0)
     {
-        ASSIGN("glBindBuffersBase", bindBuffersBase);
-        ASSIGN("glBindBuffersRange", bindBuffersRange);
-        ASSIGN("glBindImageTextures", bindImageTextures);
-        ASSIGN("glBindSamplers", bindSamplers);
-        ASSIGN("glBindTextures", bindTextures);
-        ASSIGN("glBindVertexBuffers", bindVertexBuffers);
+        ASSIGN(glBindBuffersBase, bindBuffersBase);
+        ASSIGN(glBindBuffersRange, bindBuffersRange);
+        ASSIGN(glBindImageTextures, bindImageTextures);
+        ASSIGN(glBindSamplers, bindSamplers);
+        ASSIGN(glBindTextures, bindTextures);
+        ASSIGN(glBindVertexBuffers, bindVertexBuffers);
     }
 
     if (extensions.count("GL_ARB_multi_draw_indirect") != 0)
     {
-        ASSIGN("glMultiDrawArraysIndirect", multiDrawArraysIndirect);
-        ASSIGN("glMultiDrawElementsIndirect", multiDrawElementsIndirect);
+        ASSIGN(glMultiDrawArraysIndirect, multiDrawArraysIndirect);
+        ASSIGN(glMultiDrawElementsIndirect, multiDrawElementsIndirect);
     }
 
     if (extensions.count("GL_ARB_multisample") != 0)
     {
-        ASSIGN("glSampleCoverageARB", sampleCoverage);
+        ASSIGN(glSampleCoverageARB, sampleCoverage);
     }
 
     if (extensions.count("GL_ARB_multitexture") != 0)
     {
-        ASSIGN("glActiveTextureARB", activeTexture);
+        ASSIGN(glActiveTextureARB, activeTexture);
     }
 
     if (extensions.count("GL_ARB_occlusion_query") != 0)
     {
-        ASSIGN("glBeginQueryARB", beginQuery);
-        ASSIGN("glDeleteQueriesARB", deleteQueries);
-        ASSIGN("glEndQueryARB", endQuery);
-        ASSIGN("glGenQueriesARB", genQueries);
-        ASSIGN("glGetQueryObjectivARB", getQueryObjectiv);
-        ASSIGN("glGetQueryObjectuivARB", getQueryObjectuiv);
-        ASSIGN("glGetQueryivARB", getQueryiv);
-        ASSIGN("glIsQueryARB", isQuery);
+        ASSIGN(glBeginQueryARB, beginQuery);
+        ASSIGN(glDeleteQueriesARB, deleteQueries);
+        ASSIGN(glEndQueryARB, endQuery);
+        ASSIGN(glGenQueriesARB, genQueries);
+        ASSIGN(glGetQueryObjectivARB, getQueryObjectiv);
+        ASSIGN(glGetQueryObjectuivARB, getQueryObjectuiv);
+        ASSIGN(glGetQueryivARB, getQueryiv);
+        ASSIGN(glIsQueryARB, isQuery);
     }
 
     if (extensions.count("GL_ARB_parallel_shader_compile") != 0)
     {
-        ASSIGN("glMaxShaderCompilerThreadsARB", maxShaderCompilerThreadsARB);
+        ASSIGN(glMaxShaderCompilerThreadsARB, maxShaderCompilerThreadsARB);
     }
 
     if (extensions.count("GL_ARB_point_parameters") != 0)
     {
-        ASSIGN("glPointParameterfARB", pointParameterf);
-        ASSIGN("glPointParameterfvARB", pointParameterfv);
+        ASSIGN(glPointParameterfARB, pointParameterf);
+        ASSIGN(glPointParameterfvARB, pointParameterfv);
     }
 
     if (extensions.count("GL_ARB_program_interface_query") != 0)
     {
-        ASSIGN("glGetProgramInterfaceiv", getProgramInterfaceiv);
-        ASSIGN("glGetProgramResourceIndex", getProgramResourceIndex);
-        ASSIGN("glGetProgramResourceLocation", getProgramResourceLocation);
-        ASSIGN("glGetProgramResourceLocationIndex", getProgramResourceLocationIndex);
-        ASSIGN("glGetProgramResourceName", getProgramResourceName);
-        ASSIGN("glGetProgramResourceiv", getProgramResourceiv);
+        ASSIGN(glGetProgramInterfaceiv, getProgramInterfaceiv);
+        ASSIGN(glGetProgramResourceIndex, getProgramResourceIndex);
+        ASSIGN(glGetProgramResourceLocation, getProgramResourceLocation);
+        ASSIGN(glGetProgramResourceLocationIndex, getProgramResourceLocationIndex);
+        ASSIGN(glGetProgramResourceName, getProgramResourceName);
+        ASSIGN(glGetProgramResourceiv, getProgramResourceiv);
     }
 
     if (extensions.count("GL_ARB_provoking_vertex") != 0)
     {
-        ASSIGN("glProvokingVertex", provokingVertex);
+        ASSIGN(glProvokingVertex, provokingVertex);
     }
 
     if (extensions.count("GL_ARB_robustness") != 0)
     {
-        ASSIGN("glGetGraphicsResetStatusARB", getGraphicsResetStatus);
-        ASSIGN("glGetnCompressedTexImageARB", getnCompressedTexImage);
-        ASSIGN("glGetnTexImageARB", getnTexImage);
-        ASSIGN("glGetnUniformdvARB", getnUniformdv);
-        ASSIGN("glGetnUniformfvARB", getnUniformfv);
-        ASSIGN("glGetnUniformivARB", getnUniformiv);
-        ASSIGN("glGetnUniformuivARB", getnUniformuiv);
-        ASSIGN("glReadnPixelsARB", readnPixels);
+        ASSIGN(glGetGraphicsResetStatusARB, getGraphicsResetStatus);
+        ASSIGN(glGetnCompressedTexImageARB, getnCompressedTexImage);
+        ASSIGN(glGetnTexImageARB, getnTexImage);
+        ASSIGN(glGetnUniformdvARB, getnUniformdv);
+        ASSIGN(glGetnUniformfvARB, getnUniformfv);
+        ASSIGN(glGetnUniformivARB, getnUniformiv);
+        ASSIGN(glGetnUniformuivARB, getnUniformuiv);
+        ASSIGN(glReadnPixelsARB, readnPixels);
     }
 
     if (extensions.count("GL_ARB_sample_shading") != 0)
     {
-        ASSIGN("glMinSampleShadingARB", minSampleShading);
+        ASSIGN(glMinSampleShadingARB, minSampleShading);
     }
 
     if (extensions.count("GL_ARB_sampler_objects") != 0)
     {
-        ASSIGN("glBindSampler", bindSampler);
-        ASSIGN("glDeleteSamplers", deleteSamplers);
-        ASSIGN("glGenSamplers", genSamplers);
-        ASSIGN("glGetSamplerParameterIiv", getSamplerParameterIiv);
-        ASSIGN("glGetSamplerParameterIuiv", getSamplerParameterIuiv);
-        ASSIGN("glGetSamplerParameterfv", getSamplerParameterfv);
-        ASSIGN("glGetSamplerParameteriv", getSamplerParameteriv);
-        ASSIGN("glIsSampler", isSampler);
-        ASSIGN("glSamplerParameterIiv", samplerParameterIiv);
-        ASSIGN("glSamplerParameterIuiv", samplerParameterIuiv);
-        ASSIGN("glSamplerParameterf", samplerParameterf);
-        ASSIGN("glSamplerParameterfv", samplerParameterfv);
-        ASSIGN("glSamplerParameteri", samplerParameteri);
-        ASSIGN("glSamplerParameteriv", samplerParameteriv);
+        ASSIGN(glBindSampler, bindSampler);
+        ASSIGN(glDeleteSamplers, deleteSamplers);
+        ASSIGN(glGenSamplers, genSamplers);
+        ASSIGN(glGetSamplerParameterIiv, getSamplerParameterIiv);
+        ASSIGN(glGetSamplerParameterIuiv, getSamplerParameterIuiv);
+        ASSIGN(glGetSamplerParameterfv, getSamplerParameterfv);
+        ASSIGN(glGetSamplerParameteriv, getSamplerParameteriv);
+        ASSIGN(glIsSampler, isSampler);
+        ASSIGN(glSamplerParameterIiv, samplerParameterIiv);
+        ASSIGN(glSamplerParameterIuiv, samplerParameterIuiv);
+        ASSIGN(glSamplerParameterf, samplerParameterf);
+        ASSIGN(glSamplerParameterfv, samplerParameterfv);
+        ASSIGN(glSamplerParameteri, samplerParameteri);
+        ASSIGN(glSamplerParameteriv, samplerParameteriv);
     }
 
     if (extensions.count("GL_ARB_separate_shader_objects") != 0)
     {
-        ASSIGN("glActiveShaderProgram", activeShaderProgram);
-        ASSIGN("glBindProgramPipeline", bindProgramPipeline);
-        ASSIGN("glCreateShaderProgramv", createShaderProgramv);
-        ASSIGN("glDeleteProgramPipelines", deleteProgramPipelines);
-        ASSIGN("glGenProgramPipelines", genProgramPipelines);
-        ASSIGN("glGetProgramPipelineInfoLog", getProgramPipelineInfoLog);
-        ASSIGN("glGetProgramPipelineiv", getProgramPipelineiv);
-        ASSIGN("glIsProgramPipeline", isProgramPipeline);
-        ASSIGN("glProgramParameteri", programParameteri);
-        ASSIGN("glProgramUniform1d", programUniform1d);
-        ASSIGN("glProgramUniform1dv", programUniform1dv);
-        ASSIGN("glProgramUniform1f", programUniform1f);
-        ASSIGN("glProgramUniform1fv", programUniform1fv);
-        ASSIGN("glProgramUniform1i", programUniform1i);
-        ASSIGN("glProgramUniform1iv", programUniform1iv);
-        ASSIGN("glProgramUniform1ui", programUniform1ui);
-        ASSIGN("glProgramUniform1uiv", programUniform1uiv);
-        ASSIGN("glProgramUniform2d", programUniform2d);
-        ASSIGN("glProgramUniform2dv", programUniform2dv);
-        ASSIGN("glProgramUniform2f", programUniform2f);
-        ASSIGN("glProgramUniform2fv", programUniform2fv);
-        ASSIGN("glProgramUniform2i", programUniform2i);
-        ASSIGN("glProgramUniform2iv", programUniform2iv);
-        ASSIGN("glProgramUniform2ui", programUniform2ui);
-        ASSIGN("glProgramUniform2uiv", programUniform2uiv);
-        ASSIGN("glProgramUniform3d", programUniform3d);
-        ASSIGN("glProgramUniform3dv", programUniform3dv);
-        ASSIGN("glProgramUniform3f", programUniform3f);
-        ASSIGN("glProgramUniform3fv", programUniform3fv);
-        ASSIGN("glProgramUniform3i", programUniform3i);
-        ASSIGN("glProgramUniform3iv", programUniform3iv);
-        ASSIGN("glProgramUniform3ui", programUniform3ui);
-        ASSIGN("glProgramUniform3uiv", programUniform3uiv);
-        ASSIGN("glProgramUniform4d", programUniform4d);
-        ASSIGN("glProgramUniform4dv", programUniform4dv);
-        ASSIGN("glProgramUniform4f", programUniform4f);
-        ASSIGN("glProgramUniform4fv", programUniform4fv);
-        ASSIGN("glProgramUniform4i", programUniform4i);
-        ASSIGN("glProgramUniform4iv", programUniform4iv);
-        ASSIGN("glProgramUniform4ui", programUniform4ui);
-        ASSIGN("glProgramUniform4uiv", programUniform4uiv);
-        ASSIGN("glProgramUniformMatrix2dv", programUniformMatrix2dv);
-        ASSIGN("glProgramUniformMatrix2fv", programUniformMatrix2fv);
-        ASSIGN("glProgramUniformMatrix2x3dv", programUniformMatrix2x3dv);
-        ASSIGN("glProgramUniformMatrix2x3fv", programUniformMatrix2x3fv);
-        ASSIGN("glProgramUniformMatrix2x4dv", programUniformMatrix2x4dv);
-        ASSIGN("glProgramUniformMatrix2x4fv", programUniformMatrix2x4fv);
-        ASSIGN("glProgramUniformMatrix3dv", programUniformMatrix3dv);
-        ASSIGN("glProgramUniformMatrix3fv", programUniformMatrix3fv);
-        ASSIGN("glProgramUniformMatrix3x2dv", programUniformMatrix3x2dv);
-        ASSIGN("glProgramUniformMatrix3x2fv", programUniformMatrix3x2fv);
-        ASSIGN("glProgramUniformMatrix3x4dv", programUniformMatrix3x4dv);
-        ASSIGN("glProgramUniformMatrix3x4fv", programUniformMatrix3x4fv);
-        ASSIGN("glProgramUniformMatrix4dv", programUniformMatrix4dv);
-        ASSIGN("glProgramUniformMatrix4fv", programUniformMatrix4fv);
-        ASSIGN("glProgramUniformMatrix4x2dv", programUniformMatrix4x2dv);
-        ASSIGN("glProgramUniformMatrix4x2fv", programUniformMatrix4x2fv);
-        ASSIGN("glProgramUniformMatrix4x3dv", programUniformMatrix4x3dv);
-        ASSIGN("glProgramUniformMatrix4x3fv", programUniformMatrix4x3fv);
-        ASSIGN("glUseProgramStages", useProgramStages);
-        ASSIGN("glValidateProgramPipeline", validateProgramPipeline);
+        ASSIGN(glActiveShaderProgram, activeShaderProgram);
+        ASSIGN(glBindProgramPipeline, bindProgramPipeline);
+        ASSIGN(glCreateShaderProgramv, createShaderProgramv);
+        ASSIGN(glDeleteProgramPipelines, deleteProgramPipelines);
+        ASSIGN(glGenProgramPipelines, genProgramPipelines);
+        ASSIGN(glGetProgramPipelineInfoLog, getProgramPipelineInfoLog);
+        ASSIGN(glGetProgramPipelineiv, getProgramPipelineiv);
+        ASSIGN(glIsProgramPipeline, isProgramPipeline);
+        ASSIGN(glProgramParameteri, programParameteri);
+        ASSIGN(glProgramUniform1d, programUniform1d);
+        ASSIGN(glProgramUniform1dv, programUniform1dv);
+        ASSIGN(glProgramUniform1f, programUniform1f);
+        ASSIGN(glProgramUniform1fv, programUniform1fv);
+        ASSIGN(glProgramUniform1i, programUniform1i);
+        ASSIGN(glProgramUniform1iv, programUniform1iv);
+        ASSIGN(glProgramUniform1ui, programUniform1ui);
+        ASSIGN(glProgramUniform1uiv, programUniform1uiv);
+        ASSIGN(glProgramUniform2d, programUniform2d);
+        ASSIGN(glProgramUniform2dv, programUniform2dv);
+        ASSIGN(glProgramUniform2f, programUniform2f);
+        ASSIGN(glProgramUniform2fv, programUniform2fv);
+        ASSIGN(glProgramUniform2i, programUniform2i);
+        ASSIGN(glProgramUniform2iv, programUniform2iv);
+        ASSIGN(glProgramUniform2ui, programUniform2ui);
+        ASSIGN(glProgramUniform2uiv, programUniform2uiv);
+        ASSIGN(glProgramUniform3d, programUniform3d);
+        ASSIGN(glProgramUniform3dv, programUniform3dv);
+        ASSIGN(glProgramUniform3f, programUniform3f);
+        ASSIGN(glProgramUniform3fv, programUniform3fv);
+        ASSIGN(glProgramUniform3i, programUniform3i);
+        ASSIGN(glProgramUniform3iv, programUniform3iv);
+        ASSIGN(glProgramUniform3ui, programUniform3ui);
+        ASSIGN(glProgramUniform3uiv, programUniform3uiv);
+        ASSIGN(glProgramUniform4d, programUniform4d);
+        ASSIGN(glProgramUniform4dv, programUniform4dv);
+        ASSIGN(glProgramUniform4f, programUniform4f);
+        ASSIGN(glProgramUniform4fv, programUniform4fv);
+        ASSIGN(glProgramUniform4i, programUniform4i);
+        ASSIGN(glProgramUniform4iv, programUniform4iv);
+        ASSIGN(glProgramUniform4ui, programUniform4ui);
+        ASSIGN(glProgramUniform4uiv, programUniform4uiv);
+        ASSIGN(glProgramUniformMatrix2dv, programUniformMatrix2dv);
+        ASSIGN(glProgramUniformMatrix2fv, programUniformMatrix2fv);
+        ASSIGN(glProgramUniformMatrix2x3dv, programUniformMatrix2x3dv);
+        ASSIGN(glProgramUniformMatrix2x3fv, programUniformMatrix2x3fv);
+        ASSIGN(glProgramUniformMatrix2x4dv, programUniformMatrix2x4dv);
+        ASSIGN(glProgramUniformMatrix2x4fv, programUniformMatrix2x4fv);
+        ASSIGN(glProgramUniformMatrix3dv, programUniformMatrix3dv);
+        ASSIGN(glProgramUniformMatrix3fv, programUniformMatrix3fv);
+        ASSIGN(glProgramUniformMatrix3x2dv, programUniformMatrix3x2dv);
+        ASSIGN(glProgramUniformMatrix3x2fv, programUniformMatrix3x2fv);
+        ASSIGN(glProgramUniformMatrix3x4dv, programUniformMatrix3x4dv);
+        ASSIGN(glProgramUniformMatrix3x4fv, programUniformMatrix3x4fv);
+        ASSIGN(glProgramUniformMatrix4dv, programUniformMatrix4dv);
+        ASSIGN(glProgramUniformMatrix4fv, programUniformMatrix4fv);
+        ASSIGN(glProgramUniformMatrix4x2dv, programUniformMatrix4x2dv);
+        ASSIGN(glProgramUniformMatrix4x2fv, programUniformMatrix4x2fv);
+        ASSIGN(glProgramUniformMatrix4x3dv, programUniformMatrix4x3dv);
+        ASSIGN(glProgramUniformMatrix4x3fv, programUniformMatrix4x3fv);
+        ASSIGN(glUseProgramStages, useProgramStages);
+        ASSIGN(glValidateProgramPipeline, validateProgramPipeline);
     }
 
     if (extensions.count("GL_ARB_shader_atomic_counters") != 0)
     {
-        ASSIGN("glGetActiveAtomicCounterBufferiv", getActiveAtomicCounterBufferiv);
+        ASSIGN(glGetActiveAtomicCounterBufferiv, getActiveAtomicCounterBufferiv);
     }
 
     if (extensions.count("GL_ARB_shader_image_load_store") != 0)
     {
-        ASSIGN("glBindImageTexture", bindImageTexture);
-        ASSIGN("glMemoryBarrier", memoryBarrier);
+        ASSIGN(glBindImageTexture, bindImageTexture);
+        ASSIGN(glMemoryBarrier, memoryBarrier);
     }
 
     if (extensions.count("GL_ARB_shader_objects") != 0)
     {
-        ASSIGN("glCompileShaderARB", compileShader);
-        ASSIGN("glGetActiveUniformARB", getActiveUniform);
-        ASSIGN("glGetShaderSourceARB", getShaderSource);
-        ASSIGN("glGetUniformLocationARB", getUniformLocation);
-        ASSIGN("glGetUniformfvARB", getUniformfv);
-        ASSIGN("glGetUniformivARB", getUniformiv);
-        ASSIGN("glLinkProgramARB", linkProgram);
-        ASSIGN("glShaderSourceARB", shaderSource);
-        ASSIGN("glUniform1fARB", uniform1f);
-        ASSIGN("glUniform1fvARB", uniform1fv);
-        ASSIGN("glUniform1iARB", uniform1i);
-        ASSIGN("glUniform1ivARB", uniform1iv);
-        ASSIGN("glUniform2fARB", uniform2f);
-        ASSIGN("glUniform2fvARB", uniform2fv);
-        ASSIGN("glUniform2iARB", uniform2i);
-        ASSIGN("glUniform2ivARB", uniform2iv);
-        ASSIGN("glUniform3fARB", uniform3f);
-        ASSIGN("glUniform3fvARB", uniform3fv);
-        ASSIGN("glUniform3iARB", uniform3i);
-        ASSIGN("glUniform3ivARB", uniform3iv);
-        ASSIGN("glUniform4fARB", uniform4f);
-        ASSIGN("glUniform4fvARB", uniform4fv);
-        ASSIGN("glUniform4iARB", uniform4i);
-        ASSIGN("glUniform4ivARB", uniform4iv);
-        ASSIGN("glUniformMatrix2fvARB", uniformMatrix2fv);
-        ASSIGN("glUniformMatrix3fvARB", uniformMatrix3fv);
-        ASSIGN("glUniformMatrix4fvARB", uniformMatrix4fv);
-        ASSIGN("glValidateProgramARB", validateProgram);
+        ASSIGN(glCompileShaderARB, compileShader);
+        ASSIGN(glGetActiveUniformARB, getActiveUniform);
+        ASSIGN(glGetShaderSourceARB, getShaderSource);
+        ASSIGN(glGetUniformLocationARB, getUniformLocation);
+        ASSIGN(glGetUniformfvARB, getUniformfv);
+        ASSIGN(glGetUniformivARB, getUniformiv);
+        ASSIGN(glLinkProgramARB, linkProgram);
+        ASSIGN(glShaderSourceARB, shaderSource);
+        ASSIGN(glUniform1fARB, uniform1f);
+        ASSIGN(glUniform1fvARB, uniform1fv);
+        ASSIGN(glUniform1iARB, uniform1i);
+        ASSIGN(glUniform1ivARB, uniform1iv);
+        ASSIGN(glUniform2fARB, uniform2f);
+        ASSIGN(glUniform2fvARB, uniform2fv);
+        ASSIGN(glUniform2iARB, uniform2i);
+        ASSIGN(glUniform2ivARB, uniform2iv);
+        ASSIGN(glUniform3fARB, uniform3f);
+        ASSIGN(glUniform3fvARB, uniform3fv);
+        ASSIGN(glUniform3iARB, uniform3i);
+        ASSIGN(glUniform3ivARB, uniform3iv);
+        ASSIGN(glUniform4fARB, uniform4f);
+        ASSIGN(glUniform4fvARB, uniform4fv);
+        ASSIGN(glUniform4iARB, uniform4i);
+        ASSIGN(glUniform4ivARB, uniform4iv);
+        ASSIGN(glUniformMatrix2fvARB, uniformMatrix2fv);
+        ASSIGN(glUniformMatrix3fvARB, uniformMatrix3fv);
+        ASSIGN(glUniformMatrix4fvARB, uniformMatrix4fv);
+        ASSIGN(glValidateProgramARB, validateProgram);
     }
 
     if (extensions.count("GL_ARB_shader_storage_buffer_object") != 0)
     {
-        ASSIGN("glShaderStorageBlockBinding", shaderStorageBlockBinding);
+        ASSIGN(glShaderStorageBlockBinding, shaderStorageBlockBinding);
     }
 
     if (extensions.count("GL_ARB_shader_subroutine") != 0)
     {
-        ASSIGN("glGetActiveSubroutineName", getActiveSubroutineName);
-        ASSIGN("glGetActiveSubroutineUniformName", getActiveSubroutineUniformName);
-        ASSIGN("glGetActiveSubroutineUniformiv", getActiveSubroutineUniformiv);
-        ASSIGN("glGetProgramStageiv", getProgramStageiv);
-        ASSIGN("glGetSubroutineIndex", getSubroutineIndex);
-        ASSIGN("glGetSubroutineUniformLocation", getSubroutineUniformLocation);
-        ASSIGN("glGetUniformSubroutineuiv", getUniformSubroutineuiv);
-        ASSIGN("glUniformSubroutinesuiv", uniformSubroutinesuiv);
+        ASSIGN(glGetActiveSubroutineName, getActiveSubroutineName);
+        ASSIGN(glGetActiveSubroutineUniformName, getActiveSubroutineUniformName);
+        ASSIGN(glGetActiveSubroutineUniformiv, getActiveSubroutineUniformiv);
+        ASSIGN(glGetProgramStageiv, getProgramStageiv);
+        ASSIGN(glGetSubroutineIndex, getSubroutineIndex);
+        ASSIGN(glGetSubroutineUniformLocation, getSubroutineUniformLocation);
+        ASSIGN(glGetUniformSubroutineuiv, getUniformSubroutineuiv);
+        ASSIGN(glUniformSubroutinesuiv, uniformSubroutinesuiv);
     }
 
     if (extensions.count("GL_ARB_sync") != 0)
     {
-        ASSIGN("glClientWaitSync", clientWaitSync);
-        ASSIGN("glDeleteSync", deleteSync);
-        ASSIGN("glFenceSync", fenceSync);
-        ASSIGN("glGetInteger64v", getInteger64v);
-        ASSIGN("glGetSynciv", getSynciv);
-        ASSIGN("glIsSync", isSync);
-        ASSIGN("glWaitSync", waitSync);
+        ASSIGN(glClientWaitSync, clientWaitSync);
+        ASSIGN(glDeleteSync, deleteSync);
+        ASSIGN(glFenceSync, fenceSync);
+        ASSIGN(glGetInteger64v, getInteger64v);
+        ASSIGN(glGetSynciv, getSynciv);
+        ASSIGN(glIsSync, isSync);
+        ASSIGN(glWaitSync, waitSync);
     }
 
     if (extensions.count("GL_ARB_tessellation_shader") != 0)
     {
-        ASSIGN("glPatchParameterfv", patchParameterfv);
-        ASSIGN("glPatchParameteri", patchParameteri);
+        ASSIGN(glPatchParameterfv, patchParameterfv);
+        ASSIGN(glPatchParameteri, patchParameteri);
     }
 
     if (extensions.count("GL_ARB_texture_barrier") != 0)
     {
-        ASSIGN("glTextureBarrier", textureBarrier);
+        ASSIGN(glTextureBarrier, textureBarrier);
     }
 
     if (extensions.count("GL_ARB_texture_buffer_object") != 0)
     {
-        ASSIGN("glTexBufferARB", texBuffer);
+        ASSIGN(glTexBufferARB, texBuffer);
     }
 
     if (extensions.count("GL_ARB_texture_buffer_range") != 0)
     {
-        ASSIGN("glTexBufferRange", texBufferRange);
+        ASSIGN(glTexBufferRange, texBufferRange);
     }
 
     if (extensions.count("GL_ARB_texture_compression") != 0)
     {
-        ASSIGN("glCompressedTexImage1DARB", compressedTexImage1D);
-        ASSIGN("glCompressedTexImage2DARB", compressedTexImage2D);
-        ASSIGN("glCompressedTexImage3DARB", compressedTexImage3D);
-        ASSIGN("glCompressedTexSubImage1DARB", compressedTexSubImage1D);
-        ASSIGN("glCompressedTexSubImage2DARB", compressedTexSubImage2D);
-        ASSIGN("glCompressedTexSubImage3DARB", compressedTexSubImage3D);
-        ASSIGN("glGetCompressedTexImageARB", getCompressedTexImage);
+        ASSIGN(glCompressedTexImage1DARB, compressedTexImage1D);
+        ASSIGN(glCompressedTexImage2DARB, compressedTexImage2D);
+        ASSIGN(glCompressedTexImage3DARB, compressedTexImage3D);
+        ASSIGN(glCompressedTexSubImage1DARB, compressedTexSubImage1D);
+        ASSIGN(glCompressedTexSubImage2DARB, compressedTexSubImage2D);
+        ASSIGN(glCompressedTexSubImage3DARB, compressedTexSubImage3D);
+        ASSIGN(glGetCompressedTexImageARB, getCompressedTexImage);
     }
 
     if (extensions.count("GL_ARB_texture_multisample") != 0)
     {
-        ASSIGN("glGetMultisamplefv", getMultisamplefv);
-        ASSIGN("glSampleMaski", sampleMaski);
-        ASSIGN("glTexImage2DMultisample", texImage2DMultisample);
-        ASSIGN("glTexImage3DMultisample", texImage3DMultisample);
+        ASSIGN(glGetMultisamplefv, getMultisamplefv);
+        ASSIGN(glSampleMaski, sampleMaski);
+        ASSIGN(glTexImage2DMultisample, texImage2DMultisample);
+        ASSIGN(glTexImage3DMultisample, texImage3DMultisample);
     }
 
     if (extensions.count("GL_ARB_texture_storage") != 0)
     {
-        ASSIGN("glTexStorage1D", texStorage1D);
-        ASSIGN("glTexStorage2D", texStorage2D);
-        ASSIGN("glTexStorage3D", texStorage3D);
+        ASSIGN(glTexStorage1D, texStorage1D);
+        ASSIGN(glTexStorage2D, texStorage2D);
+        ASSIGN(glTexStorage3D, texStorage3D);
     }
 
     if (extensions.count("GL_ARB_texture_storage_multisample") != 0)
     {
-        ASSIGN("glTexStorage2DMultisample", texStorage2DMultisample);
-        ASSIGN("glTexStorage3DMultisample", texStorage3DMultisample);
+        ASSIGN(glTexStorage2DMultisample, texStorage2DMultisample);
+        ASSIGN(glTexStorage3DMultisample, texStorage3DMultisample);
     }
 
     if (extensions.count("GL_ARB_texture_view") != 0)
     {
-        ASSIGN("glTextureView", textureView);
+        ASSIGN(glTextureView, textureView);
     }
 
     if (extensions.count("GL_ARB_timer_query") != 0)
     {
-        ASSIGN("glGetQueryObjecti64v", getQueryObjecti64v);
-        ASSIGN("glGetQueryObjectui64v", getQueryObjectui64v);
-        ASSIGN("glQueryCounter", queryCounter);
+        ASSIGN(glGetQueryObjecti64v, getQueryObjecti64v);
+        ASSIGN(glGetQueryObjectui64v, getQueryObjectui64v);
+        ASSIGN(glQueryCounter, queryCounter);
     }
 
     if (extensions.count("GL_ARB_transform_feedback2") != 0)
     {
-        ASSIGN("glBindTransformFeedback", bindTransformFeedback);
-        ASSIGN("glDeleteTransformFeedbacks", deleteTransformFeedbacks);
-        ASSIGN("glDrawTransformFeedback", drawTransformFeedback);
-        ASSIGN("glGenTransformFeedbacks", genTransformFeedbacks);
-        ASSIGN("glIsTransformFeedback", isTransformFeedback);
-        ASSIGN("glPauseTransformFeedback", pauseTransformFeedback);
-        ASSIGN("glResumeTransformFeedback", resumeTransformFeedback);
+        ASSIGN(glBindTransformFeedback, bindTransformFeedback);
+        ASSIGN(glDeleteTransformFeedbacks, deleteTransformFeedbacks);
+        ASSIGN(glDrawTransformFeedback, drawTransformFeedback);
+        ASSIGN(glGenTransformFeedbacks, genTransformFeedbacks);
+        ASSIGN(glIsTransformFeedback, isTransformFeedback);
+        ASSIGN(glPauseTransformFeedback, pauseTransformFeedback);
+        ASSIGN(glResumeTransformFeedback, resumeTransformFeedback);
     }
 
     if (extensions.count("GL_ARB_transform_feedback3") != 0)
     {
-        ASSIGN("glBeginQueryIndexed", beginQueryIndexed);
-        ASSIGN("glDrawTransformFeedbackStream", drawTransformFeedbackStream);
-        ASSIGN("glEndQueryIndexed", endQueryIndexed);
-        ASSIGN("glGetQueryIndexediv", getQueryIndexediv);
+        ASSIGN(glBeginQueryIndexed, beginQueryIndexed);
+        ASSIGN(glDrawTransformFeedbackStream, drawTransformFeedbackStream);
+        ASSIGN(glEndQueryIndexed, endQueryIndexed);
+        ASSIGN(glGetQueryIndexediv, getQueryIndexediv);
     }
 
     if (extensions.count("GL_ARB_transform_feedback_instanced") != 0)
     {
-        ASSIGN("glDrawTransformFeedbackInstanced", drawTransformFeedbackInstanced);
-        ASSIGN("glDrawTransformFeedbackStreamInstanced", drawTransformFeedbackStreamInstanced);
+        ASSIGN(glDrawTransformFeedbackInstanced, drawTransformFeedbackInstanced);
+        ASSIGN(glDrawTransformFeedbackStreamInstanced, drawTransformFeedbackStreamInstanced);
     }
 
     if (extensions.count("GL_ARB_uniform_buffer_object") != 0)
     {
-        ASSIGN("glBindBufferBase", bindBufferBase);
-        ASSIGN("glBindBufferRange", bindBufferRange);
-        ASSIGN("glGetActiveUniformBlockName", getActiveUniformBlockName);
-        ASSIGN("glGetActiveUniformBlockiv", getActiveUniformBlockiv);
-        ASSIGN("glGetActiveUniformName", getActiveUniformName);
-        ASSIGN("glGetActiveUniformsiv", getActiveUniformsiv);
-        ASSIGN("glGetIntegeri_v", getIntegeri_v);
-        ASSIGN("glGetUniformBlockIndex", getUniformBlockIndex);
-        ASSIGN("glGetUniformIndices", getUniformIndices);
-        ASSIGN("glUniformBlockBinding", uniformBlockBinding);
+        ASSIGN(glBindBufferBase, bindBufferBase);
+        ASSIGN(glBindBufferRange, bindBufferRange);
+        ASSIGN(glGetActiveUniformBlockName, getActiveUniformBlockName);
+        ASSIGN(glGetActiveUniformBlockiv, getActiveUniformBlockiv);
+        ASSIGN(glGetActiveUniformName, getActiveUniformName);
+        ASSIGN(glGetActiveUniformsiv, getActiveUniformsiv);
+        ASSIGN(glGetIntegeri_v, getIntegeri_v);
+        ASSIGN(glGetUniformBlockIndex, getUniformBlockIndex);
+        ASSIGN(glGetUniformIndices, getUniformIndices);
+        ASSIGN(glUniformBlockBinding, uniformBlockBinding);
     }
 
     if (extensions.count("GL_ARB_vertex_array_object") != 0)
     {
-        ASSIGN("glBindVertexArray", bindVertexArray);
-        ASSIGN("glDeleteVertexArrays", deleteVertexArrays);
-        ASSIGN("glGenVertexArrays", genVertexArrays);
-        ASSIGN("glIsVertexArray", isVertexArray);
+        ASSIGN(glBindVertexArray, bindVertexArray);
+        ASSIGN(glDeleteVertexArrays, deleteVertexArrays);
+        ASSIGN(glGenVertexArrays, genVertexArrays);
+        ASSIGN(glIsVertexArray, isVertexArray);
     }
 
     if (extensions.count("GL_ARB_vertex_attrib_64bit") != 0)
     {
-        ASSIGN("glGetVertexAttribLdv", getVertexAttribLdv);
-        ASSIGN("glVertexAttribL1d", vertexAttribL1d);
-        ASSIGN("glVertexAttribL1dv", vertexAttribL1dv);
-        ASSIGN("glVertexAttribL2d", vertexAttribL2d);
-        ASSIGN("glVertexAttribL2dv", vertexAttribL2dv);
-        ASSIGN("glVertexAttribL3d", vertexAttribL3d);
-        ASSIGN("glVertexAttribL3dv", vertexAttribL3dv);
-        ASSIGN("glVertexAttribL4d", vertexAttribL4d);
-        ASSIGN("glVertexAttribL4dv", vertexAttribL4dv);
-        ASSIGN("glVertexAttribLPointer", vertexAttribLPointer);
+        ASSIGN(glGetVertexAttribLdv, getVertexAttribLdv);
+        ASSIGN(glVertexAttribL1d, vertexAttribL1d);
+        ASSIGN(glVertexAttribL1dv, vertexAttribL1dv);
+        ASSIGN(glVertexAttribL2d, vertexAttribL2d);
+        ASSIGN(glVertexAttribL2dv, vertexAttribL2dv);
+        ASSIGN(glVertexAttribL3d, vertexAttribL3d);
+        ASSIGN(glVertexAttribL3dv, vertexAttribL3dv);
+        ASSIGN(glVertexAttribL4d, vertexAttribL4d);
+        ASSIGN(glVertexAttribL4dv, vertexAttribL4dv);
+        ASSIGN(glVertexAttribLPointer, vertexAttribLPointer);
     }
 
     if (extensions.count("GL_ARB_vertex_attrib_binding") != 0)
     {
-        ASSIGN("glBindVertexBuffer", bindVertexBuffer);
-        ASSIGN("glVertexAttribBinding", vertexAttribBinding);
-        ASSIGN("glVertexAttribFormat", vertexAttribFormat);
-        ASSIGN("glVertexAttribIFormat", vertexAttribIFormat);
-        ASSIGN("glVertexAttribLFormat", vertexAttribLFormat);
-        ASSIGN("glVertexBindingDivisor", vertexBindingDivisor);
+        ASSIGN(glBindVertexBuffer, bindVertexBuffer);
+        ASSIGN(glVertexAttribBinding, vertexAttribBinding);
+        ASSIGN(glVertexAttribFormat, vertexAttribFormat);
+        ASSIGN(glVertexAttribIFormat, vertexAttribIFormat);
+        ASSIGN(glVertexAttribLFormat, vertexAttribLFormat);
+        ASSIGN(glVertexBindingDivisor, vertexBindingDivisor);
     }
 
     if (extensions.count("GL_ARB_vertex_buffer_object") != 0)
     {
-        ASSIGN("glBindBufferARB", bindBuffer);
-        ASSIGN("glBufferDataARB", bufferData);
-        ASSIGN("glBufferSubDataARB", bufferSubData);
-        ASSIGN("glDeleteBuffersARB", deleteBuffers);
-        ASSIGN("glGenBuffersARB", genBuffers);
-        ASSIGN("glGetBufferParameterivARB", getBufferParameteriv);
-        ASSIGN("glGetBufferPointervARB", getBufferPointerv);
-        ASSIGN("glGetBufferSubDataARB", getBufferSubData);
-        ASSIGN("glIsBufferARB", isBuffer);
-        ASSIGN("glMapBufferARB", mapBuffer);
-        ASSIGN("glUnmapBufferARB", unmapBuffer);
+        ASSIGN(glBindBufferARB, bindBuffer);
+        ASSIGN(glBufferDataARB, bufferData);
+        ASSIGN(glBufferSubDataARB, bufferSubData);
+        ASSIGN(glDeleteBuffersARB, deleteBuffers);
+        ASSIGN(glGenBuffersARB, genBuffers);
+        ASSIGN(glGetBufferParameterivARB, getBufferParameteriv);
+        ASSIGN(glGetBufferPointervARB, getBufferPointerv);
+        ASSIGN(glGetBufferSubDataARB, getBufferSubData);
+        ASSIGN(glIsBufferARB, isBuffer);
+        ASSIGN(glMapBufferARB, mapBuffer);
+        ASSIGN(glUnmapBufferARB, unmapBuffer);
     }
 
     if (extensions.count("GL_ARB_vertex_program") != 0)
     {
-        ASSIGN("glDisableVertexAttribArrayARB", disableVertexAttribArray);
-        ASSIGN("glEnableVertexAttribArrayARB", enableVertexAttribArray);
-        ASSIGN("glGetProgramivARB", getProgramiv);
-        ASSIGN("glGetVertexAttribPointervARB", getVertexAttribPointerv);
-        ASSIGN("glGetVertexAttribdvARB", getVertexAttribdv);
-        ASSIGN("glGetVertexAttribfvARB", getVertexAttribfv);
-        ASSIGN("glGetVertexAttribivARB", getVertexAttribiv);
-        ASSIGN("glIsProgramARB", isProgram);
-        ASSIGN("glVertexAttrib1dARB", vertexAttrib1d);
-        ASSIGN("glVertexAttrib1dvARB", vertexAttrib1dv);
-        ASSIGN("glVertexAttrib1fARB", vertexAttrib1f);
-        ASSIGN("glVertexAttrib1fvARB", vertexAttrib1fv);
-        ASSIGN("glVertexAttrib1sARB", vertexAttrib1s);
-        ASSIGN("glVertexAttrib1svARB", vertexAttrib1sv);
-        ASSIGN("glVertexAttrib2dARB", vertexAttrib2d);
-        ASSIGN("glVertexAttrib2dvARB", vertexAttrib2dv);
-        ASSIGN("glVertexAttrib2fARB", vertexAttrib2f);
-        ASSIGN("glVertexAttrib2fvARB", vertexAttrib2fv);
-        ASSIGN("glVertexAttrib2sARB", vertexAttrib2s);
-        ASSIGN("glVertexAttrib2svARB", vertexAttrib2sv);
-        ASSIGN("glVertexAttrib3dARB", vertexAttrib3d);
-        ASSIGN("glVertexAttrib3dvARB", vertexAttrib3dv);
-        ASSIGN("glVertexAttrib3fARB", vertexAttrib3f);
-        ASSIGN("glVertexAttrib3fvARB", vertexAttrib3fv);
-        ASSIGN("glVertexAttrib3sARB", vertexAttrib3s);
-        ASSIGN("glVertexAttrib3svARB", vertexAttrib3sv);
-        ASSIGN("glVertexAttrib4NbvARB", vertexAttrib4Nbv);
-        ASSIGN("glVertexAttrib4NivARB", vertexAttrib4Niv);
-        ASSIGN("glVertexAttrib4NsvARB", vertexAttrib4Nsv);
-        ASSIGN("glVertexAttrib4NubARB", vertexAttrib4Nub);
-        ASSIGN("glVertexAttrib4NubvARB", vertexAttrib4Nubv);
-        ASSIGN("glVertexAttrib4NuivARB", vertexAttrib4Nuiv);
-        ASSIGN("glVertexAttrib4NusvARB", vertexAttrib4Nusv);
-        ASSIGN("glVertexAttrib4bvARB", vertexAttrib4bv);
-        ASSIGN("glVertexAttrib4dARB", vertexAttrib4d);
-        ASSIGN("glVertexAttrib4dvARB", vertexAttrib4dv);
-        ASSIGN("glVertexAttrib4fARB", vertexAttrib4f);
-        ASSIGN("glVertexAttrib4fvARB", vertexAttrib4fv);
-        ASSIGN("glVertexAttrib4ivARB", vertexAttrib4iv);
-        ASSIGN("glVertexAttrib4sARB", vertexAttrib4s);
-        ASSIGN("glVertexAttrib4svARB", vertexAttrib4sv);
-        ASSIGN("glVertexAttrib4ubvARB", vertexAttrib4ubv);
-        ASSIGN("glVertexAttrib4uivARB", vertexAttrib4uiv);
-        ASSIGN("glVertexAttrib4usvARB", vertexAttrib4usv);
-        ASSIGN("glVertexAttribPointerARB", vertexAttribPointer);
+        ASSIGN(glDisableVertexAttribArrayARB, disableVertexAttribArray);
+        ASSIGN(glEnableVertexAttribArrayARB, enableVertexAttribArray);
+        ASSIGN(glGetProgramivARB, getProgramiv);
+        ASSIGN(glGetVertexAttribPointervARB, getVertexAttribPointerv);
+        ASSIGN(glGetVertexAttribdvARB, getVertexAttribdv);
+        ASSIGN(glGetVertexAttribfvARB, getVertexAttribfv);
+        ASSIGN(glGetVertexAttribivARB, getVertexAttribiv);
+        ASSIGN(glIsProgramARB, isProgram);
+        ASSIGN(glVertexAttrib1dARB, vertexAttrib1d);
+        ASSIGN(glVertexAttrib1dvARB, vertexAttrib1dv);
+        ASSIGN(glVertexAttrib1fARB, vertexAttrib1f);
+        ASSIGN(glVertexAttrib1fvARB, vertexAttrib1fv);
+        ASSIGN(glVertexAttrib1sARB, vertexAttrib1s);
+        ASSIGN(glVertexAttrib1svARB, vertexAttrib1sv);
+        ASSIGN(glVertexAttrib2dARB, vertexAttrib2d);
+        ASSIGN(glVertexAttrib2dvARB, vertexAttrib2dv);
+        ASSIGN(glVertexAttrib2fARB, vertexAttrib2f);
+        ASSIGN(glVertexAttrib2fvARB, vertexAttrib2fv);
+        ASSIGN(glVertexAttrib2sARB, vertexAttrib2s);
+        ASSIGN(glVertexAttrib2svARB, vertexAttrib2sv);
+        ASSIGN(glVertexAttrib3dARB, vertexAttrib3d);
+        ASSIGN(glVertexAttrib3dvARB, vertexAttrib3dv);
+        ASSIGN(glVertexAttrib3fARB, vertexAttrib3f);
+        ASSIGN(glVertexAttrib3fvARB, vertexAttrib3fv);
+        ASSIGN(glVertexAttrib3sARB, vertexAttrib3s);
+        ASSIGN(glVertexAttrib3svARB, vertexAttrib3sv);
+        ASSIGN(glVertexAttrib4NbvARB, vertexAttrib4Nbv);
+        ASSIGN(glVertexAttrib4NivARB, vertexAttrib4Niv);
+        ASSIGN(glVertexAttrib4NsvARB, vertexAttrib4Nsv);
+        ASSIGN(glVertexAttrib4NubARB, vertexAttrib4Nub);
+        ASSIGN(glVertexAttrib4NubvARB, vertexAttrib4Nubv);
+        ASSIGN(glVertexAttrib4NuivARB, vertexAttrib4Nuiv);
+        ASSIGN(glVertexAttrib4NusvARB, vertexAttrib4Nusv);
+        ASSIGN(glVertexAttrib4bvARB, vertexAttrib4bv);
+        ASSIGN(glVertexAttrib4dARB, vertexAttrib4d);
+        ASSIGN(glVertexAttrib4dvARB, vertexAttrib4dv);
+        ASSIGN(glVertexAttrib4fARB, vertexAttrib4f);
+        ASSIGN(glVertexAttrib4fvARB, vertexAttrib4fv);
+        ASSIGN(glVertexAttrib4ivARB, vertexAttrib4iv);
+        ASSIGN(glVertexAttrib4sARB, vertexAttrib4s);
+        ASSIGN(glVertexAttrib4svARB, vertexAttrib4sv);
+        ASSIGN(glVertexAttrib4ubvARB, vertexAttrib4ubv);
+        ASSIGN(glVertexAttrib4uivARB, vertexAttrib4uiv);
+        ASSIGN(glVertexAttrib4usvARB, vertexAttrib4usv);
+        ASSIGN(glVertexAttribPointerARB, vertexAttribPointer);
     }
 
     if (extensions.count("GL_ARB_vertex_shader") != 0)
     {
-        ASSIGN("glBindAttribLocationARB", bindAttribLocation);
-        ASSIGN("glDisableVertexAttribArrayARB", disableVertexAttribArray);
-        ASSIGN("glEnableVertexAttribArrayARB", enableVertexAttribArray);
-        ASSIGN("glGetActiveAttribARB", getActiveAttrib);
-        ASSIGN("glGetAttribLocationARB", getAttribLocation);
-        ASSIGN("glGetVertexAttribPointervARB", getVertexAttribPointerv);
-        ASSIGN("glGetVertexAttribdvARB", getVertexAttribdv);
-        ASSIGN("glGetVertexAttribfvARB", getVertexAttribfv);
-        ASSIGN("glGetVertexAttribivARB", getVertexAttribiv);
-        ASSIGN("glVertexAttrib1dARB", vertexAttrib1d);
-        ASSIGN("glVertexAttrib1dvARB", vertexAttrib1dv);
-        ASSIGN("glVertexAttrib1fARB", vertexAttrib1f);
-        ASSIGN("glVertexAttrib1fvARB", vertexAttrib1fv);
-        ASSIGN("glVertexAttrib1sARB", vertexAttrib1s);
-        ASSIGN("glVertexAttrib1svARB", vertexAttrib1sv);
-        ASSIGN("glVertexAttrib2dARB", vertexAttrib2d);
-        ASSIGN("glVertexAttrib2dvARB", vertexAttrib2dv);
-        ASSIGN("glVertexAttrib2fARB", vertexAttrib2f);
-        ASSIGN("glVertexAttrib2fvARB", vertexAttrib2fv);
-        ASSIGN("glVertexAttrib2sARB", vertexAttrib2s);
-        ASSIGN("glVertexAttrib2svARB", vertexAttrib2sv);
-        ASSIGN("glVertexAttrib3dARB", vertexAttrib3d);
-        ASSIGN("glVertexAttrib3dvARB", vertexAttrib3dv);
-        ASSIGN("glVertexAttrib3fARB", vertexAttrib3f);
-        ASSIGN("glVertexAttrib3fvARB", vertexAttrib3fv);
-        ASSIGN("glVertexAttrib3sARB", vertexAttrib3s);
-        ASSIGN("glVertexAttrib3svARB", vertexAttrib3sv);
-        ASSIGN("glVertexAttrib4NbvARB", vertexAttrib4Nbv);
-        ASSIGN("glVertexAttrib4NivARB", vertexAttrib4Niv);
-        ASSIGN("glVertexAttrib4NsvARB", vertexAttrib4Nsv);
-        ASSIGN("glVertexAttrib4NubARB", vertexAttrib4Nub);
-        ASSIGN("glVertexAttrib4NubvARB", vertexAttrib4Nubv);
-        ASSIGN("glVertexAttrib4NuivARB", vertexAttrib4Nuiv);
-        ASSIGN("glVertexAttrib4NusvARB", vertexAttrib4Nusv);
-        ASSIGN("glVertexAttrib4bvARB", vertexAttrib4bv);
-        ASSIGN("glVertexAttrib4dARB", vertexAttrib4d);
-        ASSIGN("glVertexAttrib4dvARB", vertexAttrib4dv);
-        ASSIGN("glVertexAttrib4fARB", vertexAttrib4f);
-        ASSIGN("glVertexAttrib4fvARB", vertexAttrib4fv);
-        ASSIGN("glVertexAttrib4ivARB", vertexAttrib4iv);
-        ASSIGN("glVertexAttrib4sARB", vertexAttrib4s);
-        ASSIGN("glVertexAttrib4svARB", vertexAttrib4sv);
-        ASSIGN("glVertexAttrib4ubvARB", vertexAttrib4ubv);
-        ASSIGN("glVertexAttrib4uivARB", vertexAttrib4uiv);
-        ASSIGN("glVertexAttrib4usvARB", vertexAttrib4usv);
-        ASSIGN("glVertexAttribPointerARB", vertexAttribPointer);
+        ASSIGN(glBindAttribLocationARB, bindAttribLocation);
+        ASSIGN(glDisableVertexAttribArrayARB, disableVertexAttribArray);
+        ASSIGN(glEnableVertexAttribArrayARB, enableVertexAttribArray);
+        ASSIGN(glGetActiveAttribARB, getActiveAttrib);
+        ASSIGN(glGetAttribLocationARB, getAttribLocation);
+        ASSIGN(glGetVertexAttribPointervARB, getVertexAttribPointerv);
+        ASSIGN(glGetVertexAttribdvARB, getVertexAttribdv);
+        ASSIGN(glGetVertexAttribfvARB, getVertexAttribfv);
+        ASSIGN(glGetVertexAttribivARB, getVertexAttribiv);
+        ASSIGN(glVertexAttrib1dARB, vertexAttrib1d);
+        ASSIGN(glVertexAttrib1dvARB, vertexAttrib1dv);
+        ASSIGN(glVertexAttrib1fARB, vertexAttrib1f);
+        ASSIGN(glVertexAttrib1fvARB, vertexAttrib1fv);
+        ASSIGN(glVertexAttrib1sARB, vertexAttrib1s);
+        ASSIGN(glVertexAttrib1svARB, vertexAttrib1sv);
+        ASSIGN(glVertexAttrib2dARB, vertexAttrib2d);
+        ASSIGN(glVertexAttrib2dvARB, vertexAttrib2dv);
+        ASSIGN(glVertexAttrib2fARB, vertexAttrib2f);
+        ASSIGN(glVertexAttrib2fvARB, vertexAttrib2fv);
+        ASSIGN(glVertexAttrib2sARB, vertexAttrib2s);
+        ASSIGN(glVertexAttrib2svARB, vertexAttrib2sv);
+        ASSIGN(glVertexAttrib3dARB, vertexAttrib3d);
+        ASSIGN(glVertexAttrib3dvARB, vertexAttrib3dv);
+        ASSIGN(glVertexAttrib3fARB, vertexAttrib3f);
+        ASSIGN(glVertexAttrib3fvARB, vertexAttrib3fv);
+        ASSIGN(glVertexAttrib3sARB, vertexAttrib3s);
+        ASSIGN(glVertexAttrib3svARB, vertexAttrib3sv);
+        ASSIGN(glVertexAttrib4NbvARB, vertexAttrib4Nbv);
+        ASSIGN(glVertexAttrib4NivARB, vertexAttrib4Niv);
+        ASSIGN(glVertexAttrib4NsvARB, vertexAttrib4Nsv);
+        ASSIGN(glVertexAttrib4NubARB, vertexAttrib4Nub);
+        ASSIGN(glVertexAttrib4NubvARB, vertexAttrib4Nubv);
+        ASSIGN(glVertexAttrib4NuivARB, vertexAttrib4Nuiv);
+        ASSIGN(glVertexAttrib4NusvARB, vertexAttrib4Nusv);
+        ASSIGN(glVertexAttrib4bvARB, vertexAttrib4bv);
+        ASSIGN(glVertexAttrib4dARB, vertexAttrib4d);
+        ASSIGN(glVertexAttrib4dvARB, vertexAttrib4dv);
+        ASSIGN(glVertexAttrib4fARB, vertexAttrib4f);
+        ASSIGN(glVertexAttrib4fvARB, vertexAttrib4fv);
+        ASSIGN(glVertexAttrib4ivARB, vertexAttrib4iv);
+        ASSIGN(glVertexAttrib4sARB, vertexAttrib4s);
+        ASSIGN(glVertexAttrib4svARB, vertexAttrib4sv);
+        ASSIGN(glVertexAttrib4ubvARB, vertexAttrib4ubv);
+        ASSIGN(glVertexAttrib4uivARB, vertexAttrib4uiv);
+        ASSIGN(glVertexAttrib4usvARB, vertexAttrib4usv);
+        ASSIGN(glVertexAttribPointerARB, vertexAttribPointer);
     }
 
     if (extensions.count("GL_ARB_vertex_type_2_10_10_10_rev") != 0)
     {
-        ASSIGN("glVertexAttribP1ui", vertexAttribP1ui);
-        ASSIGN("glVertexAttribP1uiv", vertexAttribP1uiv);
-        ASSIGN("glVertexAttribP2ui", vertexAttribP2ui);
-        ASSIGN("glVertexAttribP2uiv", vertexAttribP2uiv);
-        ASSIGN("glVertexAttribP3ui", vertexAttribP3ui);
-        ASSIGN("glVertexAttribP3uiv", vertexAttribP3uiv);
-        ASSIGN("glVertexAttribP4ui", vertexAttribP4ui);
-        ASSIGN("glVertexAttribP4uiv", vertexAttribP4uiv);
+        ASSIGN(glVertexAttribP1ui, vertexAttribP1ui);
+        ASSIGN(glVertexAttribP1uiv, vertexAttribP1uiv);
+        ASSIGN(glVertexAttribP2ui, vertexAttribP2ui);
+        ASSIGN(glVertexAttribP2uiv, vertexAttribP2uiv);
+        ASSIGN(glVertexAttribP3ui, vertexAttribP3ui);
+        ASSIGN(glVertexAttribP3uiv, vertexAttribP3uiv);
+        ASSIGN(glVertexAttribP4ui, vertexAttribP4ui);
+        ASSIGN(glVertexAttribP4uiv, vertexAttribP4uiv);
     }
 
     if (extensions.count("GL_ARB_viewport_array") != 0)
     {
-        ASSIGN("glDepthRangeArrayv", depthRangeArrayv);
-        ASSIGN("glDepthRangeIndexed", depthRangeIndexed);
-        ASSIGN("glGetDoublei_v", getDoublei_v);
-        ASSIGN("glGetFloati_v", getFloati_v);
-        ASSIGN("glScissorArrayv", scissorArrayv);
-        ASSIGN("glScissorIndexed", scissorIndexed);
-        ASSIGN("glScissorIndexedv", scissorIndexedv);
-        ASSIGN("glViewportArrayv", viewportArrayv);
-        ASSIGN("glViewportIndexedf", viewportIndexedf);
-        ASSIGN("glViewportIndexedfv", viewportIndexedfv);
+        ASSIGN(glDepthRangeArrayv, depthRangeArrayv);
+        ASSIGN(glDepthRangeIndexed, depthRangeIndexed);
+        ASSIGN(glGetDoublei_v, getDoublei_v);
+        ASSIGN(glGetFloati_v, getFloati_v);
+        ASSIGN(glScissorArrayv, scissorArrayv);
+        ASSIGN(glScissorIndexed, scissorIndexed);
+        ASSIGN(glScissorIndexedv, scissorIndexedv);
+        ASSIGN(glViewportArrayv, viewportArrayv);
+        ASSIGN(glViewportIndexedf, viewportIndexedf);
+        ASSIGN(glViewportIndexedfv, viewportIndexedfv);
     }
 
     if (extensions.count("GL_EXT_blend_color") != 0)
     {
-        ASSIGN("glBlendColorEXT", blendColor);
+        ASSIGN(glBlendColorEXT, blendColor);
     }
 
     if (extensions.count("GL_EXT_blend_equation_separate") != 0)
     {
-        ASSIGN("glBlendEquationSeparateEXT", blendEquationSeparate);
+        ASSIGN(glBlendEquationSeparateEXT, blendEquationSeparate);
     }
 
     if (extensions.count("GL_EXT_blend_func_separate") != 0)
     {
-        ASSIGN("glBlendFuncSeparateEXT", blendFuncSeparate);
+        ASSIGN(glBlendFuncSeparateEXT, blendFuncSeparate);
     }
 
     if (extensions.count("GL_EXT_copy_texture") != 0)
     {
-        ASSIGN("glCopyTexImage1DEXT", copyTexImage1D);
-        ASSIGN("glCopyTexImage2DEXT", copyTexImage2D);
-        ASSIGN("glCopyTexSubImage1DEXT", copyTexSubImage1D);
-        ASSIGN("glCopyTexSubImage2DEXT", copyTexSubImage2D);
-        ASSIGN("glCopyTexSubImage3DEXT", copyTexSubImage3D);
+        ASSIGN(glCopyTexImage1DEXT, copyTexImage1D);
+        ASSIGN(glCopyTexImage2DEXT, copyTexImage2D);
+        ASSIGN(glCopyTexSubImage1DEXT, copyTexSubImage1D);
+        ASSIGN(glCopyTexSubImage2DEXT, copyTexSubImage2D);
+        ASSIGN(glCopyTexSubImage3DEXT, copyTexSubImage3D);
     }
 
     if (extensions.count("GL_EXT_direct_state_access") != 0)
     {
-        ASSIGN("glCheckNamedFramebufferStatusEXT", checkNamedFramebufferStatus);
-        ASSIGN("glClearNamedBufferDataEXT", clearNamedBufferData);
-        ASSIGN("glClearNamedBufferSubDataEXT", clearNamedBufferSubData);
-        ASSIGN("glCompressedTextureSubImage1DEXT", compressedTextureSubImage1D);
-        ASSIGN("glCompressedTextureSubImage2DEXT", compressedTextureSubImage2D);
-        ASSIGN("glCompressedTextureSubImage3DEXT", compressedTextureSubImage3D);
-        ASSIGN("glCopyTextureSubImage1DEXT", copyTextureSubImage1D);
-        ASSIGN("glCopyTextureSubImage2DEXT", copyTextureSubImage2D);
-        ASSIGN("glCopyTextureSubImage3DEXT", copyTextureSubImage3D);
-        ASSIGN("glDisableVertexArrayAttribEXT", disableVertexArrayAttrib);
-        ASSIGN("glEnableVertexArrayAttribEXT", enableVertexArrayAttrib);
-        ASSIGN("glFlushMappedNamedBufferRangeEXT", flushMappedNamedBufferRange);
-        ASSIGN("glGenerateTextureMipmapEXT", generateTextureMipmap);
-        ASSIGN("glGetCompressedTextureImageEXT", getCompressedTextureImage);
-        ASSIGN("glGetDoublei_vEXT", getDoublei_v);
-        ASSIGN("glGetFloati_vEXT", getFloati_v);
-        ASSIGN("glGetFramebufferParameterivEXT", getFramebufferParameteriv);
-        ASSIGN("glGetNamedBufferParameterivEXT", getNamedBufferParameteriv);
-        ASSIGN("glGetNamedBufferPointervEXT", getNamedBufferPointerv);
-        ASSIGN("glGetNamedBufferSubDataEXT", getNamedBufferSubData);
-        ASSIGN("glGetNamedFramebufferAttachmentParameterivEXT",
+        ASSIGN(glCheckNamedFramebufferStatusEXT, checkNamedFramebufferStatus);
+        ASSIGN(glClearNamedBufferDataEXT, clearNamedBufferData);
+        ASSIGN(glClearNamedBufferSubDataEXT, clearNamedBufferSubData);
+        ASSIGN(glCompressedTextureSubImage1DEXT, compressedTextureSubImage1D);
+        ASSIGN(glCompressedTextureSubImage2DEXT, compressedTextureSubImage2D);
+        ASSIGN(glCompressedTextureSubImage3DEXT, compressedTextureSubImage3D);
+        ASSIGN(glCopyTextureSubImage1DEXT, copyTextureSubImage1D);
+        ASSIGN(glCopyTextureSubImage2DEXT, copyTextureSubImage2D);
+        ASSIGN(glCopyTextureSubImage3DEXT, copyTextureSubImage3D);
+        ASSIGN(glDisableVertexArrayAttribEXT, disableVertexArrayAttrib);
+        ASSIGN(glEnableVertexArrayAttribEXT, enableVertexArrayAttrib);
+        ASSIGN(glFlushMappedNamedBufferRangeEXT, flushMappedNamedBufferRange);
+        ASSIGN(glGenerateTextureMipmapEXT, generateTextureMipmap);
+        ASSIGN(glGetCompressedTextureImageEXT, getCompressedTextureImage);
+        ASSIGN(glGetDoublei_vEXT, getDoublei_v);
+        ASSIGN(glGetFloati_vEXT, getFloati_v);
+        ASSIGN(glGetFramebufferParameterivEXT, getFramebufferParameteriv);
+        ASSIGN(glGetNamedBufferParameterivEXT, getNamedBufferParameteriv);
+        ASSIGN(glGetNamedBufferPointervEXT, getNamedBufferPointerv);
+        ASSIGN(glGetNamedBufferSubDataEXT, getNamedBufferSubData);
+        ASSIGN(glGetNamedFramebufferAttachmentParameterivEXT,
                getNamedFramebufferAttachmentParameteriv);
-        ASSIGN("glGetNamedFramebufferParameterivEXT", getNamedFramebufferParameteriv);
-        ASSIGN("glGetNamedRenderbufferParameterivEXT", getNamedRenderbufferParameteriv);
-        ASSIGN("glGetTextureImageEXT", getTextureImage);
-        ASSIGN("glGetTextureLevelParameterfvEXT", getTextureLevelParameterfv);
-        ASSIGN("glGetTextureLevelParameterivEXT", getTextureLevelParameteriv);
-        ASSIGN("glGetTextureParameterIivEXT", getTextureParameterIiv);
-        ASSIGN("glGetTextureParameterIuivEXT", getTextureParameterIuiv);
-        ASSIGN("glGetTextureParameterfvEXT", getTextureParameterfv);
-        ASSIGN("glGetTextureParameterivEXT", getTextureParameteriv);
-        ASSIGN("glMapNamedBufferEXT", mapNamedBuffer);
-        ASSIGN("glMapNamedBufferRangeEXT", mapNamedBufferRange);
-        ASSIGN("glNamedBufferDataEXT", namedBufferData);
-        ASSIGN("glNamedBufferStorageEXT", namedBufferStorage);
-        ASSIGN("glNamedBufferSubDataEXT", namedBufferSubData);
-        ASSIGN("glNamedFramebufferParameteriEXT", namedFramebufferParameteri);
-        ASSIGN("glNamedFramebufferRenderbufferEXT", namedFramebufferRenderbuffer);
-        ASSIGN("glNamedFramebufferTextureEXT", namedFramebufferTexture);
-        ASSIGN("glNamedFramebufferTextureLayerEXT", namedFramebufferTextureLayer);
-        ASSIGN("glNamedRenderbufferStorageEXT", namedRenderbufferStorage);
-        ASSIGN("glNamedRenderbufferStorageMultisampleEXT", namedRenderbufferStorageMultisample);
-        ASSIGN("glProgramUniform1dEXT", programUniform1d);
-        ASSIGN("glProgramUniform1dvEXT", programUniform1dv);
-        ASSIGN("glProgramUniform2dEXT", programUniform2d);
-        ASSIGN("glProgramUniform2dvEXT", programUniform2dv);
-        ASSIGN("glProgramUniform3dEXT", programUniform3d);
-        ASSIGN("glProgramUniform3dvEXT", programUniform3dv);
-        ASSIGN("glProgramUniform4dEXT", programUniform4d);
-        ASSIGN("glProgramUniform4dvEXT", programUniform4dv);
-        ASSIGN("glProgramUniformMatrix2dvEXT", programUniformMatrix2dv);
-        ASSIGN("glProgramUniformMatrix2x3dvEXT", programUniformMatrix2x3dv);
-        ASSIGN("glProgramUniformMatrix2x4dvEXT", programUniformMatrix2x4dv);
-        ASSIGN("glProgramUniformMatrix3dvEXT", programUniformMatrix3dv);
-        ASSIGN("glProgramUniformMatrix3x2dvEXT", programUniformMatrix3x2dv);
-        ASSIGN("glProgramUniformMatrix3x4dvEXT", programUniformMatrix3x4dv);
-        ASSIGN("glProgramUniformMatrix4dvEXT", programUniformMatrix4dv);
-        ASSIGN("glProgramUniformMatrix4x2dvEXT", programUniformMatrix4x2dv);
-        ASSIGN("glProgramUniformMatrix4x3dvEXT", programUniformMatrix4x3dv);
-        ASSIGN("glTextureBufferEXT", textureBuffer);
-        ASSIGN("glTextureBufferRangeEXT", textureBufferRange);
-        ASSIGN("glTextureParameterIivEXT", textureParameterIiv);
-        ASSIGN("glTextureParameterIuivEXT", textureParameterIuiv);
-        ASSIGN("glTextureParameterfEXT", textureParameterf);
-        ASSIGN("glTextureParameterfvEXT", textureParameterfv);
-        ASSIGN("glTextureParameteriEXT", textureParameteri);
-        ASSIGN("glTextureParameterivEXT", textureParameteriv);
-        ASSIGN("glTextureStorage1DEXT", textureStorage1D);
-        ASSIGN("glTextureStorage2DEXT", textureStorage2D);
-        ASSIGN("glTextureStorage2DMultisampleEXT", textureStorage2DMultisample);
-        ASSIGN("glTextureStorage3DEXT", textureStorage3D);
-        ASSIGN("glTextureStorage3DMultisampleEXT", textureStorage3DMultisample);
-        ASSIGN("glTextureSubImage1DEXT", textureSubImage1D);
-        ASSIGN("glTextureSubImage2DEXT", textureSubImage2D);
-        ASSIGN("glTextureSubImage3DEXT", textureSubImage3D);
-        ASSIGN("glUnmapNamedBufferEXT", unmapNamedBuffer);
+        ASSIGN(glGetNamedFramebufferParameterivEXT, getNamedFramebufferParameteriv);
+        ASSIGN(glGetNamedRenderbufferParameterivEXT, getNamedRenderbufferParameteriv);
+        ASSIGN(glGetTextureImageEXT, getTextureImage);
+        ASSIGN(glGetTextureLevelParameterfvEXT, getTextureLevelParameterfv);
+        ASSIGN(glGetTextureLevelParameterivEXT, getTextureLevelParameteriv);
+        ASSIGN(glGetTextureParameterIivEXT, getTextureParameterIiv);
+        ASSIGN(glGetTextureParameterIuivEXT, getTextureParameterIuiv);
+        ASSIGN(glGetTextureParameterfvEXT, getTextureParameterfv);
+        ASSIGN(glGetTextureParameterivEXT, getTextureParameteriv);
+        ASSIGN(glMapNamedBufferEXT, mapNamedBuffer);
+        ASSIGN(glMapNamedBufferRangeEXT, mapNamedBufferRange);
+        ASSIGN(glNamedBufferDataEXT, namedBufferData);
+        ASSIGN(glNamedBufferStorageEXT, namedBufferStorage);
+        ASSIGN(glNamedBufferSubDataEXT, namedBufferSubData);
+        ASSIGN(glNamedFramebufferParameteriEXT, namedFramebufferParameteri);
+        ASSIGN(glNamedFramebufferRenderbufferEXT, namedFramebufferRenderbuffer);
+        ASSIGN(glNamedFramebufferTextureEXT, namedFramebufferTexture);
+        ASSIGN(glNamedFramebufferTextureLayerEXT, namedFramebufferTextureLayer);
+        ASSIGN(glNamedRenderbufferStorageEXT, namedRenderbufferStorage);
+        ASSIGN(glNamedRenderbufferStorageMultisampleEXT, namedRenderbufferStorageMultisample);
+        ASSIGN(glProgramUniform1dEXT, programUniform1d);
+        ASSIGN(glProgramUniform1dvEXT, programUniform1dv);
+        ASSIGN(glProgramUniform2dEXT, programUniform2d);
+        ASSIGN(glProgramUniform2dvEXT, programUniform2dv);
+        ASSIGN(glProgramUniform3dEXT, programUniform3d);
+        ASSIGN(glProgramUniform3dvEXT, programUniform3dv);
+        ASSIGN(glProgramUniform4dEXT, programUniform4d);
+        ASSIGN(glProgramUniform4dvEXT, programUniform4dv);
+        ASSIGN(glProgramUniformMatrix2dvEXT, programUniformMatrix2dv);
+        ASSIGN(glProgramUniformMatrix2x3dvEXT, programUniformMatrix2x3dv);
+        ASSIGN(glProgramUniformMatrix2x4dvEXT, programUniformMatrix2x4dv);
+        ASSIGN(glProgramUniformMatrix3dvEXT, programUniformMatrix3dv);
+        ASSIGN(glProgramUniformMatrix3x2dvEXT, programUniformMatrix3x2dv);
+        ASSIGN(glProgramUniformMatrix3x4dvEXT, programUniformMatrix3x4dv);
+        ASSIGN(glProgramUniformMatrix4dvEXT, programUniformMatrix4dv);
+        ASSIGN(glProgramUniformMatrix4x2dvEXT, programUniformMatrix4x2dv);
+        ASSIGN(glProgramUniformMatrix4x3dvEXT, programUniformMatrix4x3dv);
+        ASSIGN(glTextureBufferEXT, textureBuffer);
+        ASSIGN(glTextureBufferRangeEXT, textureBufferRange);
+        ASSIGN(glTextureParameterIivEXT, textureParameterIiv);
+        ASSIGN(glTextureParameterIuivEXT, textureParameterIuiv);
+        ASSIGN(glTextureParameterfEXT, textureParameterf);
+        ASSIGN(glTextureParameterfvEXT, textureParameterfv);
+        ASSIGN(glTextureParameteriEXT, textureParameteri);
+        ASSIGN(glTextureParameterivEXT, textureParameteriv);
+        ASSIGN(glTextureStorage1DEXT, textureStorage1D);
+        ASSIGN(glTextureStorage2DEXT, textureStorage2D);
+        ASSIGN(glTextureStorage2DMultisampleEXT, textureStorage2DMultisample);
+        ASSIGN(glTextureStorage3DEXT, textureStorage3D);
+        ASSIGN(glTextureStorage3DMultisampleEXT, textureStorage3DMultisample);
+        ASSIGN(glTextureSubImage1DEXT, textureSubImage1D);
+        ASSIGN(glTextureSubImage2DEXT, textureSubImage2D);
+        ASSIGN(glTextureSubImage3DEXT, textureSubImage3D);
+        ASSIGN(glUnmapNamedBufferEXT, unmapNamedBuffer);
     }
 
     if (extensions.count("GL_EXT_draw_range_elements") != 0)
     {
-        ASSIGN("glDrawRangeElementsEXT", drawRangeElements);
+        ASSIGN(glDrawRangeElementsEXT, drawRangeElements);
     }
 
     if (extensions.count("GL_EXT_framebuffer_blit") != 0)
     {
-        ASSIGN("glBlitFramebufferEXT", blitFramebuffer);
+        ASSIGN(glBlitFramebufferEXT, blitFramebuffer);
     }
 
     if (extensions.count("GL_EXT_framebuffer_multisample") != 0)
     {
-        ASSIGN("glRenderbufferStorageMultisampleEXT", renderbufferStorageMultisample);
+        ASSIGN(glRenderbufferStorageMultisampleEXT, renderbufferStorageMultisample);
     }
 
     if (extensions.count("GL_EXT_framebuffer_object") != 0)
     {
-        ASSIGN("glBindFramebufferEXT", bindFramebuffer);
-        ASSIGN("glBindRenderbufferEXT", bindRenderbuffer);
-        ASSIGN("glCheckFramebufferStatusEXT", checkFramebufferStatus);
-        ASSIGN("glDeleteFramebuffersEXT", deleteFramebuffers);
-        ASSIGN("glDeleteRenderbuffersEXT", deleteRenderbuffers);
-        ASSIGN("glFramebufferRenderbufferEXT", framebufferRenderbuffer);
-        ASSIGN("glFramebufferTexture1DEXT", framebufferTexture1D);
-        ASSIGN("glFramebufferTexture2DEXT", framebufferTexture2D);
-        ASSIGN("glFramebufferTexture3DEXT", framebufferTexture3D);
-        ASSIGN("glGenFramebuffersEXT", genFramebuffers);
-        ASSIGN("glGenRenderbuffersEXT", genRenderbuffers);
-        ASSIGN("glGenerateMipmapEXT", generateMipmap);
-        ASSIGN("glGetFramebufferAttachmentParameterivEXT", getFramebufferAttachmentParameteriv);
-        ASSIGN("glGetRenderbufferParameterivEXT", getRenderbufferParameteriv);
-        ASSIGN("glIsFramebufferEXT", isFramebuffer);
-        ASSIGN("glIsRenderbufferEXT", isRenderbuffer);
-        ASSIGN("glRenderbufferStorageEXT", renderbufferStorage);
+        ASSIGN(glBindFramebufferEXT, bindFramebuffer);
+        ASSIGN(glBindRenderbufferEXT, bindRenderbuffer);
+        ASSIGN(glCheckFramebufferStatusEXT, checkFramebufferStatus);
+        ASSIGN(glDeleteFramebuffersEXT, deleteFramebuffers);
+        ASSIGN(glDeleteRenderbuffersEXT, deleteRenderbuffers);
+        ASSIGN(glFramebufferRenderbufferEXT, framebufferRenderbuffer);
+        ASSIGN(glFramebufferTexture1DEXT, framebufferTexture1D);
+        ASSIGN(glFramebufferTexture2DEXT, framebufferTexture2D);
+        ASSIGN(glFramebufferTexture3DEXT, framebufferTexture3D);
+        ASSIGN(glGenFramebuffersEXT, genFramebuffers);
+        ASSIGN(glGenRenderbuffersEXT, genRenderbuffers);
+        ASSIGN(glGenerateMipmapEXT, generateMipmap);
+        ASSIGN(glGetFramebufferAttachmentParameterivEXT, getFramebufferAttachmentParameteriv);
+        ASSIGN(glGetRenderbufferParameterivEXT, getRenderbufferParameteriv);
+        ASSIGN(glIsFramebufferEXT, isFramebuffer);
+        ASSIGN(glIsRenderbufferEXT, isRenderbuffer);
+        ASSIGN(glRenderbufferStorageEXT, renderbufferStorage);
     }
 
     if (extensions.count("GL_EXT_gpu_shader4") != 0)
     {
-        ASSIGN("glBindFragDataLocationEXT", bindFragDataLocation);
-        ASSIGN("glGetFragDataLocationEXT", getFragDataLocation);
-        ASSIGN("glGetUniformuivEXT", getUniformuiv);
-        ASSIGN("glUniform1uiEXT", uniform1ui);
-        ASSIGN("glUniform1uivEXT", uniform1uiv);
-        ASSIGN("glUniform2uiEXT", uniform2ui);
-        ASSIGN("glUniform2uivEXT", uniform2uiv);
-        ASSIGN("glUniform3uiEXT", uniform3ui);
-        ASSIGN("glUniform3uivEXT", uniform3uiv);
-        ASSIGN("glUniform4uiEXT", uniform4ui);
-        ASSIGN("glUniform4uivEXT", uniform4uiv);
+        ASSIGN(glBindFragDataLocationEXT, bindFragDataLocation);
+        ASSIGN(glGetFragDataLocationEXT, getFragDataLocation);
+        ASSIGN(glGetUniformuivEXT, getUniformuiv);
+        ASSIGN(glUniform1uiEXT, uniform1ui);
+        ASSIGN(glUniform1uivEXT, uniform1uiv);
+        ASSIGN(glUniform2uiEXT, uniform2ui);
+        ASSIGN(glUniform2uivEXT, uniform2uiv);
+        ASSIGN(glUniform3uiEXT, uniform3ui);
+        ASSIGN(glUniform3uivEXT, uniform3uiv);
+        ASSIGN(glUniform4uiEXT, uniform4ui);
+        ASSIGN(glUniform4uivEXT, uniform4uiv);
     }
 
     if (extensions.count("GL_EXT_point_parameters") != 0)
     {
-        ASSIGN("glPointParameterfEXT", pointParameterf);
-        ASSIGN("glPointParameterfvEXT", pointParameterfv);
+        ASSIGN(glPointParameterfEXT, pointParameterf);
+        ASSIGN(glPointParameterfvEXT, pointParameterfv);
     }
 
     if (extensions.count("GL_EXT_polygon_offset") != 0)
     {
-        ASSIGN("glPolygonOffsetEXT", polygonOffset);
+        ASSIGN(glPolygonOffsetEXT, polygonOffset);
     }
 
     if (extensions.count("GL_EXT_provoking_vertex") != 0)
     {
-        ASSIGN("glProvokingVertexEXT", provokingVertex);
+        ASSIGN(glProvokingVertexEXT, provokingVertex);
     }
 
     if (extensions.count("GL_EXT_shader_image_load_store") != 0)
     {
-        ASSIGN("glBindImageTextureEXT", bindImageTexture);
-        ASSIGN("glMemoryBarrierEXT", memoryBarrier);
+        ASSIGN(glBindImageTextureEXT, bindImageTexture);
+        ASSIGN(glMemoryBarrierEXT, memoryBarrier);
     }
 
     if (extensions.count("GL_EXT_subtexture") != 0)
     {
-        ASSIGN("glTexSubImage1DEXT", texSubImage1D);
-        ASSIGN("glTexSubImage2DEXT", texSubImage2D);
+        ASSIGN(glTexSubImage1DEXT, texSubImage1D);
+        ASSIGN(glTexSubImage2DEXT, texSubImage2D);
     }
 
     if (extensions.count("GL_EXT_texture3D") != 0)
     {
-        ASSIGN("glTexImage3DEXT", texImage3D);
-        ASSIGN("glTexSubImage3DEXT", texSubImage3D);
+        ASSIGN(glTexImage3DEXT, texImage3D);
+        ASSIGN(glTexSubImage3DEXT, texSubImage3D);
     }
 
     if (extensions.count("GL_EXT_texture_array") != 0)
     {
-        ASSIGN("glFramebufferTextureLayerEXT", framebufferTextureLayer);
+        ASSIGN(glFramebufferTextureLayerEXT, framebufferTextureLayer);
     }
 
     if (extensions.count("GL_EXT_texture_buffer_object") != 0)
     {
-        ASSIGN("glTexBufferEXT", texBuffer);
+        ASSIGN(glTexBufferEXT, texBuffer);
     }
 
     if (extensions.count("GL_EXT_texture_integer") != 0)
     {
-        ASSIGN("glGetTexParameterIivEXT", getTexParameterIiv);
-        ASSIGN("glGetTexParameterIuivEXT", getTexParameterIuiv);
-        ASSIGN("glTexParameterIivEXT", texParameterIiv);
-        ASSIGN("glTexParameterIuivEXT", texParameterIuiv);
+        ASSIGN(glGetTexParameterIivEXT, getTexParameterIiv);
+        ASSIGN(glGetTexParameterIuivEXT, getTexParameterIuiv);
+        ASSIGN(glTexParameterIivEXT, texParameterIiv);
+        ASSIGN(glTexParameterIuivEXT, texParameterIuiv);
     }
 
     if (extensions.count("GL_EXT_texture_object") != 0)
     {
-        ASSIGN("glBindTextureEXT", bindTexture);
-        ASSIGN("glDeleteTexturesEXT", deleteTextures);
-        ASSIGN("glGenTexturesEXT", genTextures);
-        ASSIGN("glIsTextureEXT", isTexture);
+        ASSIGN(glBindTextureEXT, bindTexture);
+        ASSIGN(glDeleteTexturesEXT, deleteTextures);
+        ASSIGN(glGenTexturesEXT, genTextures);
+        ASSIGN(glIsTextureEXT, isTexture);
     }
 
     if (extensions.count("GL_EXT_timer_query") != 0)
     {
-        ASSIGN("glGetQueryObjecti64vEXT", getQueryObjecti64v);
-        ASSIGN("glGetQueryObjectui64vEXT", getQueryObjectui64v);
+        ASSIGN(glGetQueryObjecti64vEXT, getQueryObjecti64v);
+        ASSIGN(glGetQueryObjectui64vEXT, getQueryObjectui64v);
     }
 
     if (extensions.count("GL_EXT_transform_feedback") != 0)
     {
-        ASSIGN("glBeginTransformFeedbackEXT", beginTransformFeedback);
-        ASSIGN("glBindBufferBaseEXT", bindBufferBase);
-        ASSIGN("glBindBufferRangeEXT", bindBufferRange);
-        ASSIGN("glEndTransformFeedbackEXT", endTransformFeedback);
-        ASSIGN("glGetTransformFeedbackVaryingEXT", getTransformFeedbackVarying);
-        ASSIGN("glTransformFeedbackVaryingsEXT", transformFeedbackVaryings);
+        ASSIGN(glBeginTransformFeedbackEXT, beginTransformFeedback);
+        ASSIGN(glBindBufferBaseEXT, bindBufferBase);
+        ASSIGN(glBindBufferRangeEXT, bindBufferRange);
+        ASSIGN(glEndTransformFeedbackEXT, endTransformFeedback);
+        ASSIGN(glGetTransformFeedbackVaryingEXT, getTransformFeedbackVarying);
+        ASSIGN(glTransformFeedbackVaryingsEXT, transformFeedbackVaryings);
     }
 
     if (extensions.count("GL_EXT_vertex_array") != 0)
     {
-        ASSIGN("glDrawArraysEXT", drawArrays);
-        ASSIGN("glGetPointervEXT", getPointerv);
+        ASSIGN(glDrawArraysEXT, drawArrays);
+        ASSIGN(glGetPointervEXT, getPointerv);
     }
 
     if (extensions.count("GL_EXT_vertex_attrib_64bit") != 0)
     {
-        ASSIGN("glGetVertexAttribLdvEXT", getVertexAttribLdv);
-        ASSIGN("glVertexAttribL1dEXT", vertexAttribL1d);
-        ASSIGN("glVertexAttribL1dvEXT", vertexAttribL1dv);
-        ASSIGN("glVertexAttribL2dEXT", vertexAttribL2d);
-        ASSIGN("glVertexAttribL2dvEXT", vertexAttribL2dv);
-        ASSIGN("glVertexAttribL3dEXT", vertexAttribL3d);
-        ASSIGN("glVertexAttribL3dvEXT", vertexAttribL3dv);
-        ASSIGN("glVertexAttribL4dEXT", vertexAttribL4d);
-        ASSIGN("glVertexAttribL4dvEXT", vertexAttribL4dv);
-        ASSIGN("glVertexAttribLPointerEXT", vertexAttribLPointer);
+        ASSIGN(glGetVertexAttribLdvEXT, getVertexAttribLdv);
+        ASSIGN(glVertexAttribL1dEXT, vertexAttribL1d);
+        ASSIGN(glVertexAttribL1dvEXT, vertexAttribL1dv);
+        ASSIGN(glVertexAttribL2dEXT, vertexAttribL2d);
+        ASSIGN(glVertexAttribL2dvEXT, vertexAttribL2dv);
+        ASSIGN(glVertexAttribL3dEXT, vertexAttribL3d);
+        ASSIGN(glVertexAttribL3dvEXT, vertexAttribL3dv);
+        ASSIGN(glVertexAttribL4dEXT, vertexAttribL4d);
+        ASSIGN(glVertexAttribL4dvEXT, vertexAttribL4dv);
+        ASSIGN(glVertexAttribLPointerEXT, vertexAttribLPointer);
     }
 
     if (extensions.count("GL_KHR_debug") != 0)
     {
-        ASSIGN("glDebugMessageCallback", debugMessageCallback);
-        ASSIGN("glDebugMessageControl", debugMessageControl);
-        ASSIGN("glDebugMessageInsert", debugMessageInsert);
-        ASSIGN("glGetDebugMessageLog", getDebugMessageLog);
-        ASSIGN("glGetObjectLabel", getObjectLabel);
-        ASSIGN("glGetObjectPtrLabel", getObjectPtrLabel);
-        ASSIGN("glGetPointerv", getPointerv);
-        ASSIGN("glObjectLabel", objectLabel);
-        ASSIGN("glObjectPtrLabel", objectPtrLabel);
-        ASSIGN("glPopDebugGroup", popDebugGroup);
-        ASSIGN("glPushDebugGroup", pushDebugGroup);
+        ASSIGN(glDebugMessageCallback, debugMessageCallback);
+        ASSIGN(glDebugMessageControl, debugMessageControl);
+        ASSIGN(glDebugMessageInsert, debugMessageInsert);
+        ASSIGN(glGetDebugMessageLog, getDebugMessageLog);
+        ASSIGN(glGetObjectLabel, getObjectLabel);
+        ASSIGN(glGetObjectPtrLabel, getObjectPtrLabel);
+        ASSIGN(glGetPointerv, getPointerv);
+        ASSIGN(glObjectLabel, objectLabel);
+        ASSIGN(glObjectPtrLabel, objectPtrLabel);
+        ASSIGN(glPopDebugGroup, popDebugGroup);
+        ASSIGN(glPushDebugGroup, pushDebugGroup);
     }
 
     if (extensions.count("GL_KHR_robustness") != 0)
     {
-        ASSIGN("glGetGraphicsResetStatus", getGraphicsResetStatus);
-        ASSIGN("glGetnUniformfv", getnUniformfv);
-        ASSIGN("glGetnUniformiv", getnUniformiv);
-        ASSIGN("glGetnUniformuiv", getnUniformuiv);
-        ASSIGN("glReadnPixels", readnPixels);
+        ASSIGN(glGetGraphicsResetStatus, getGraphicsResetStatus);
+        ASSIGN(glGetnUniformfv, getnUniformfv);
+        ASSIGN(glGetnUniformiv, getnUniformiv);
+        ASSIGN(glGetnUniformuiv, getnUniformuiv);
+        ASSIGN(glReadnPixels, readnPixels);
     }
 
     if (extensions.count("GL_NV_geometry_program4") != 0)
     {
-        ASSIGN("glFramebufferTextureEXT", framebufferTexture);
-        ASSIGN("glFramebufferTextureLayerEXT", framebufferTextureLayer);
+        ASSIGN(glFramebufferTextureEXT, framebufferTexture);
+        ASSIGN(glFramebufferTextureLayerEXT, framebufferTextureLayer);
     }
 
     if (extensions.count("GL_NV_vertex_program4") != 0)
     {
-        ASSIGN("glGetVertexAttribIivEXT", getVertexAttribIiv);
-        ASSIGN("glGetVertexAttribIuivEXT", getVertexAttribIuiv);
-        ASSIGN("glVertexAttribI1iEXT", vertexAttribI1i);
-        ASSIGN("glVertexAttribI1ivEXT", vertexAttribI1iv);
-        ASSIGN("glVertexAttribI1uiEXT", vertexAttribI1ui);
-        ASSIGN("glVertexAttribI1uivEXT", vertexAttribI1uiv);
-        ASSIGN("glVertexAttribI2iEXT", vertexAttribI2i);
-        ASSIGN("glVertexAttribI2ivEXT", vertexAttribI2iv);
-        ASSIGN("glVertexAttribI2uiEXT", vertexAttribI2ui);
-        ASSIGN("glVertexAttribI2uivEXT", vertexAttribI2uiv);
-        ASSIGN("glVertexAttribI3iEXT", vertexAttribI3i);
-        ASSIGN("glVertexAttribI3ivEXT", vertexAttribI3iv);
-        ASSIGN("glVertexAttribI3uiEXT", vertexAttribI3ui);
-        ASSIGN("glVertexAttribI3uivEXT", vertexAttribI3uiv);
-        ASSIGN("glVertexAttribI4bvEXT", vertexAttribI4bv);
-        ASSIGN("glVertexAttribI4iEXT", vertexAttribI4i);
-        ASSIGN("glVertexAttribI4ivEXT", vertexAttribI4iv);
-        ASSIGN("glVertexAttribI4svEXT", vertexAttribI4sv);
-        ASSIGN("glVertexAttribI4ubvEXT", vertexAttribI4ubv);
-        ASSIGN("glVertexAttribI4uiEXT", vertexAttribI4ui);
-        ASSIGN("glVertexAttribI4uivEXT", vertexAttribI4uiv);
-        ASSIGN("glVertexAttribI4usvEXT", vertexAttribI4usv);
-        ASSIGN("glVertexAttribIPointerEXT", vertexAttribIPointer);
+        ASSIGN(glGetVertexAttribIivEXT, getVertexAttribIiv);
+        ASSIGN(glGetVertexAttribIuivEXT, getVertexAttribIuiv);
+        ASSIGN(glVertexAttribI1iEXT, vertexAttribI1i);
+        ASSIGN(glVertexAttribI1ivEXT, vertexAttribI1iv);
+        ASSIGN(glVertexAttribI1uiEXT, vertexAttribI1ui);
+        ASSIGN(glVertexAttribI1uivEXT, vertexAttribI1uiv);
+        ASSIGN(glVertexAttribI2iEXT, vertexAttribI2i);
+        ASSIGN(glVertexAttribI2ivEXT, vertexAttribI2iv);
+        ASSIGN(glVertexAttribI2uiEXT, vertexAttribI2ui);
+        ASSIGN(glVertexAttribI2uivEXT, vertexAttribI2uiv);
+        ASSIGN(glVertexAttribI3iEXT, vertexAttribI3i);
+        ASSIGN(glVertexAttribI3ivEXT, vertexAttribI3iv);
+        ASSIGN(glVertexAttribI3uiEXT, vertexAttribI3ui);
+        ASSIGN(glVertexAttribI3uivEXT, vertexAttribI3uiv);
+        ASSIGN(glVertexAttribI4bvEXT, vertexAttribI4bv);
+        ASSIGN(glVertexAttribI4iEXT, vertexAttribI4i);
+        ASSIGN(glVertexAttribI4ivEXT, vertexAttribI4iv);
+        ASSIGN(glVertexAttribI4svEXT, vertexAttribI4sv);
+        ASSIGN(glVertexAttribI4ubvEXT, vertexAttribI4ubv);
+        ASSIGN(glVertexAttribI4uiEXT, vertexAttribI4ui);
+        ASSIGN(glVertexAttribI4uivEXT, vertexAttribI4uiv);
+        ASSIGN(glVertexAttribI4usvEXT, vertexAttribI4usv);
+        ASSIGN(glVertexAttribIPointerEXT, vertexAttribIPointer);
     }
 
     if (extensions.count("GL_OES_single_precision") != 0)
     {
-        ASSIGN("glClearDepthfOES", clearDepthf);
-        ASSIGN("glDepthRangefOES", depthRangef);
+        ASSIGN(glClearDepthfOES, clearDepthf);
+        ASSIGN(glDepthRangefOES, depthRangef);
     }
 }
 
@@ -1921,706 +11453,706 @@ void DispatchTableGL::initProcsGLES(const gl::Version &version,
 {
     if (version >= gl::Version(2, 0))
     {
-        ASSIGN("glActiveTexture", activeTexture);
-        ASSIGN("glAttachShader", attachShader);
-        ASSIGN("glBindAttribLocation", bindAttribLocation);
-        ASSIGN("glBindBuffer", bindBuffer);
-        ASSIGN("glBindFramebuffer", bindFramebuffer);
-        ASSIGN("glBindRenderbuffer", bindRenderbuffer);
-        ASSIGN("glBindTexture", bindTexture);
-        ASSIGN("glBlendColor", blendColor);
-        ASSIGN("glBlendEquation", blendEquation);
-        ASSIGN("glBlendEquationSeparate", blendEquationSeparate);
-        ASSIGN("glBlendFunc", blendFunc);
-        ASSIGN("glBlendFuncSeparate", blendFuncSeparate);
-        ASSIGN("glBufferData", bufferData);
-        ASSIGN("glBufferSubData", bufferSubData);
-        ASSIGN("glCheckFramebufferStatus", checkFramebufferStatus);
-        ASSIGN("glClear", clear);
-        ASSIGN("glClearColor", clearColor);
-        ASSIGN("glClearDepthf", clearDepthf);
-        ASSIGN("glClearStencil", clearStencil);
-        ASSIGN("glColorMask", colorMask);
-        ASSIGN("glCompileShader", compileShader);
-        ASSIGN("glCompressedTexImage2D", compressedTexImage2D);
-        ASSIGN("glCompressedTexSubImage2D", compressedTexSubImage2D);
-        ASSIGN("glCopyTexImage2D", copyTexImage2D);
-        ASSIGN("glCopyTexSubImage2D", copyTexSubImage2D);
-        ASSIGN("glCreateProgram", createProgram);
-        ASSIGN("glCreateShader", createShader);
-        ASSIGN("glCullFace", cullFace);
-        ASSIGN("glDeleteBuffers", deleteBuffers);
-        ASSIGN("glDeleteFramebuffers", deleteFramebuffers);
-        ASSIGN("glDeleteProgram", deleteProgram);
-        ASSIGN("glDeleteRenderbuffers", deleteRenderbuffers);
-        ASSIGN("glDeleteShader", deleteShader);
-        ASSIGN("glDeleteTextures", deleteTextures);
-        ASSIGN("glDepthFunc", depthFunc);
-        ASSIGN("glDepthMask", depthMask);
-        ASSIGN("glDepthRangef", depthRangef);
-        ASSIGN("glDetachShader", detachShader);
-        ASSIGN("glDisable", disable);
-        ASSIGN("glDisableVertexAttribArray", disableVertexAttribArray);
-        ASSIGN("glDrawArrays", drawArrays);
-        ASSIGN("glDrawElements", drawElements);
-        ASSIGN("glEnable", enable);
-        ASSIGN("glEnableVertexAttribArray", enableVertexAttribArray);
-        ASSIGN("glFinish", finish);
-        ASSIGN("glFlush", flush);
-        ASSIGN("glFramebufferRenderbuffer", framebufferRenderbuffer);
-        ASSIGN("glFramebufferTexture2D", framebufferTexture2D);
-        ASSIGN("glFrontFace", frontFace);
-        ASSIGN("glGenBuffers", genBuffers);
-        ASSIGN("glGenFramebuffers", genFramebuffers);
-        ASSIGN("glGenRenderbuffers", genRenderbuffers);
-        ASSIGN("glGenTextures", genTextures);
-        ASSIGN("glGenerateMipmap", generateMipmap);
-        ASSIGN("glGetActiveAttrib", getActiveAttrib);
-        ASSIGN("glGetActiveUniform", getActiveUniform);
-        ASSIGN("glGetAttachedShaders", getAttachedShaders);
-        ASSIGN("glGetAttribLocation", getAttribLocation);
-        ASSIGN("glGetBooleanv", getBooleanv);
-        ASSIGN("glGetBufferParameteriv", getBufferParameteriv);
-        ASSIGN("glGetError", getError);
-        ASSIGN("glGetFloatv", getFloatv);
-        ASSIGN("glGetFramebufferAttachmentParameteriv", getFramebufferAttachmentParameteriv);
-        ASSIGN("glGetIntegerv", getIntegerv);
-        ASSIGN("glGetProgramInfoLog", getProgramInfoLog);
-        ASSIGN("glGetProgramiv", getProgramiv);
-        ASSIGN("glGetRenderbufferParameteriv", getRenderbufferParameteriv);
-        ASSIGN("glGetShaderInfoLog", getShaderInfoLog);
-        ASSIGN("glGetShaderPrecisionFormat", getShaderPrecisionFormat);
-        ASSIGN("glGetShaderSource", getShaderSource);
-        ASSIGN("glGetShaderiv", getShaderiv);
-        ASSIGN("glGetString", getString);
-        ASSIGN("glGetTexParameterfv", getTexParameterfv);
-        ASSIGN("glGetTexParameteriv", getTexParameteriv);
-        ASSIGN("glGetUniformLocation", getUniformLocation);
-        ASSIGN("glGetUniformfv", getUniformfv);
-        ASSIGN("glGetUniformiv", getUniformiv);
-        ASSIGN("glGetVertexAttribPointerv", getVertexAttribPointerv);
-        ASSIGN("glGetVertexAttribfv", getVertexAttribfv);
-        ASSIGN("glGetVertexAttribiv", getVertexAttribiv);
-        ASSIGN("glHint", hint);
-        ASSIGN("glIsBuffer", isBuffer);
-        ASSIGN("glIsEnabled", isEnabled);
-        ASSIGN("glIsFramebuffer", isFramebuffer);
-        ASSIGN("glIsProgram", isProgram);
-        ASSIGN("glIsRenderbuffer", isRenderbuffer);
-        ASSIGN("glIsShader", isShader);
-        ASSIGN("glIsTexture", isTexture);
-        ASSIGN("glLineWidth", lineWidth);
-        ASSIGN("glLinkProgram", linkProgram);
-        ASSIGN("glPixelStorei", pixelStorei);
-        ASSIGN("glPolygonOffset", polygonOffset);
-        ASSIGN("glReadPixels", readPixels);
-        ASSIGN("glReleaseShaderCompiler", releaseShaderCompiler);
-        ASSIGN("glRenderbufferStorage", renderbufferStorage);
-        ASSIGN("glSampleCoverage", sampleCoverage);
-        ASSIGN("glScissor", scissor);
-        ASSIGN("glShaderBinary", shaderBinary);
-        ASSIGN("glShaderSource", shaderSource);
-        ASSIGN("glStencilFunc", stencilFunc);
-        ASSIGN("glStencilFuncSeparate", stencilFuncSeparate);
-        ASSIGN("glStencilMask", stencilMask);
-        ASSIGN("glStencilMaskSeparate", stencilMaskSeparate);
-        ASSIGN("glStencilOp", stencilOp);
-        ASSIGN("glStencilOpSeparate", stencilOpSeparate);
-        ASSIGN("glTexImage2D", texImage2D);
-        ASSIGN("glTexParameterf", texParameterf);
-        ASSIGN("glTexParameterfv", texParameterfv);
-        ASSIGN("glTexParameteri", texParameteri);
-        ASSIGN("glTexParameteriv", texParameteriv);
-        ASSIGN("glTexSubImage2D", texSubImage2D);
-        ASSIGN("glUniform1f", uniform1f);
-        ASSIGN("glUniform1fv", uniform1fv);
-        ASSIGN("glUniform1i", uniform1i);
-        ASSIGN("glUniform1iv", uniform1iv);
-        ASSIGN("glUniform2f", uniform2f);
-        ASSIGN("glUniform2fv", uniform2fv);
-        ASSIGN("glUniform2i", uniform2i);
-        ASSIGN("glUniform2iv", uniform2iv);
-        ASSIGN("glUniform3f", uniform3f);
-        ASSIGN("glUniform3fv", uniform3fv);
-        ASSIGN("glUniform3i", uniform3i);
-        ASSIGN("glUniform3iv", uniform3iv);
-        ASSIGN("glUniform4f", uniform4f);
-        ASSIGN("glUniform4fv", uniform4fv);
-        ASSIGN("glUniform4i", uniform4i);
-        ASSIGN("glUniform4iv", uniform4iv);
-        ASSIGN("glUniformMatrix2fv", uniformMatrix2fv);
-        ASSIGN("glUniformMatrix3fv", uniformMatrix3fv);
-        ASSIGN("glUniformMatrix4fv", uniformMatrix4fv);
-        ASSIGN("glUseProgram", useProgram);
-        ASSIGN("glValidateProgram", validateProgram);
-        ASSIGN("glVertexAttrib1f", vertexAttrib1f);
-        ASSIGN("glVertexAttrib1fv", vertexAttrib1fv);
-        ASSIGN("glVertexAttrib2f", vertexAttrib2f);
-        ASSIGN("glVertexAttrib2fv", vertexAttrib2fv);
-        ASSIGN("glVertexAttrib3f", vertexAttrib3f);
-        ASSIGN("glVertexAttrib3fv", vertexAttrib3fv);
-        ASSIGN("glVertexAttrib4f", vertexAttrib4f);
-        ASSIGN("glVertexAttrib4fv", vertexAttrib4fv);
-        ASSIGN("glVertexAttribPointer", vertexAttribPointer);
-        ASSIGN("glViewport", viewport);
+        ASSIGN_CORE(glActiveTexture, activeTexture);
+        ASSIGN_CORE(glAttachShader, attachShader);
+        ASSIGN_CORE(glBindAttribLocation, bindAttribLocation);
+        ASSIGN_CORE(glBindBuffer, bindBuffer);
+        ASSIGN_CORE(glBindFramebuffer, bindFramebuffer);
+        ASSIGN_CORE(glBindRenderbuffer, bindRenderbuffer);
+        ASSIGN_CORE(glBindTexture, bindTexture);
+        ASSIGN_CORE(glBlendColor, blendColor);
+        ASSIGN_CORE(glBlendEquation, blendEquation);
+        ASSIGN_CORE(glBlendEquationSeparate, blendEquationSeparate);
+        ASSIGN_CORE(glBlendFunc, blendFunc);
+        ASSIGN_CORE(glBlendFuncSeparate, blendFuncSeparate);
+        ASSIGN_CORE(glBufferData, bufferData);
+        ASSIGN_CORE(glBufferSubData, bufferSubData);
+        ASSIGN_CORE(glCheckFramebufferStatus, checkFramebufferStatus);
+        ASSIGN_CORE(glClear, clear);
+        ASSIGN_CORE(glClearColor, clearColor);
+        ASSIGN_CORE(glClearDepthf, clearDepthf);
+        ASSIGN_CORE(glClearStencil, clearStencil);
+        ASSIGN_CORE(glColorMask, colorMask);
+        ASSIGN_CORE(glCompileShader, compileShader);
+        ASSIGN_CORE(glCompressedTexImage2D, compressedTexImage2D);
+        ASSIGN_CORE(glCompressedTexSubImage2D, compressedTexSubImage2D);
+        ASSIGN_CORE(glCopyTexImage2D, copyTexImage2D);
+        ASSIGN_CORE(glCopyTexSubImage2D, copyTexSubImage2D);
+        ASSIGN_CORE(glCreateProgram, createProgram);
+        ASSIGN_CORE(glCreateShader, createShader);
+        ASSIGN_CORE(glCullFace, cullFace);
+        ASSIGN_CORE(glDeleteBuffers, deleteBuffers);
+        ASSIGN_CORE(glDeleteFramebuffers, deleteFramebuffers);
+        ASSIGN_CORE(glDeleteProgram, deleteProgram);
+        ASSIGN_CORE(glDeleteRenderbuffers, deleteRenderbuffers);
+        ASSIGN_CORE(glDeleteShader, deleteShader);
+        ASSIGN_CORE(glDeleteTextures, deleteTextures);
+        ASSIGN_CORE(glDepthFunc, depthFunc);
+        ASSIGN_CORE(glDepthMask, depthMask);
+        ASSIGN_CORE(glDepthRangef, depthRangef);
+        ASSIGN_CORE(glDetachShader, detachShader);
+        ASSIGN_CORE(glDisable, disable);
+        ASSIGN_CORE(glDisableVertexAttribArray, disableVertexAttribArray);
+        ASSIGN_CORE(glDrawArrays, drawArrays);
+        ASSIGN_CORE(glDrawElements, drawElements);
+        ASSIGN_CORE(glEnable, enable);
+        ASSIGN_CORE(glEnableVertexAttribArray, enableVertexAttribArray);
+        ASSIGN_CORE(glFinish, finish);
+        ASSIGN_CORE(glFlush, flush);
+        ASSIGN_CORE(glFramebufferRenderbuffer, framebufferRenderbuffer);
+        ASSIGN_CORE(glFramebufferTexture2D, framebufferTexture2D);
+        ASSIGN_CORE(glFrontFace, frontFace);
+        ASSIGN_CORE(glGenBuffers, genBuffers);
+        ASSIGN_CORE(glGenFramebuffers, genFramebuffers);
+        ASSIGN_CORE(glGenRenderbuffers, genRenderbuffers);
+        ASSIGN_CORE(glGenTextures, genTextures);
+        ASSIGN_CORE(glGenerateMipmap, generateMipmap);
+        ASSIGN_CORE(glGetActiveAttrib, getActiveAttrib);
+        ASSIGN_CORE(glGetActiveUniform, getActiveUniform);
+        ASSIGN_CORE(glGetAttachedShaders, getAttachedShaders);
+        ASSIGN_CORE(glGetAttribLocation, getAttribLocation);
+        ASSIGN_CORE(glGetBooleanv, getBooleanv);
+        ASSIGN_CORE(glGetBufferParameteriv, getBufferParameteriv);
+        ASSIGN_CORE(glGetError, getError);
+        ASSIGN_CORE(glGetFloatv, getFloatv);
+        ASSIGN_CORE(glGetFramebufferAttachmentParameteriv, getFramebufferAttachmentParameteriv);
+        ASSIGN_CORE(glGetIntegerv, getIntegerv);
+        ASSIGN_CORE(glGetProgramInfoLog, getProgramInfoLog);
+        ASSIGN_CORE(glGetProgramiv, getProgramiv);
+        ASSIGN_CORE(glGetRenderbufferParameteriv, getRenderbufferParameteriv);
+        ASSIGN_CORE(glGetShaderInfoLog, getShaderInfoLog);
+        ASSIGN_CORE(glGetShaderPrecisionFormat, getShaderPrecisionFormat);
+        ASSIGN_CORE(glGetShaderSource, getShaderSource);
+        ASSIGN_CORE(glGetShaderiv, getShaderiv);
+        ASSIGN_CORE(glGetString, getString);
+        ASSIGN_CORE(glGetTexParameterfv, getTexParameterfv);
+        ASSIGN_CORE(glGetTexParameteriv, getTexParameteriv);
+        ASSIGN_CORE(glGetUniformLocation, getUniformLocation);
+        ASSIGN_CORE(glGetUniformfv, getUniformfv);
+        ASSIGN_CORE(glGetUniformiv, getUniformiv);
+        ASSIGN_CORE(glGetVertexAttribPointerv, getVertexAttribPointerv);
+        ASSIGN_CORE(glGetVertexAttribfv, getVertexAttribfv);
+        ASSIGN_CORE(glGetVertexAttribiv, getVertexAttribiv);
+        ASSIGN_CORE(glHint, hint);
+        ASSIGN_CORE(glIsBuffer, isBuffer);
+        ASSIGN_CORE(glIsEnabled, isEnabled);
+        ASSIGN_CORE(glIsFramebuffer, isFramebuffer);
+        ASSIGN_CORE(glIsProgram, isProgram);
+        ASSIGN_CORE(glIsRenderbuffer, isRenderbuffer);
+        ASSIGN_CORE(glIsShader, isShader);
+        ASSIGN_CORE(glIsTexture, isTexture);
+        ASSIGN_CORE(glLineWidth, lineWidth);
+        ASSIGN_CORE(glLinkProgram, linkProgram);
+        ASSIGN_CORE(glPixelStorei, pixelStorei);
+        ASSIGN_CORE(glPolygonOffset, polygonOffset);
+        ASSIGN_CORE(glReadPixels, readPixels);
+        ASSIGN_CORE(glReleaseShaderCompiler, releaseShaderCompiler);
+        ASSIGN_CORE(glRenderbufferStorage, renderbufferStorage);
+        ASSIGN_CORE(glSampleCoverage, sampleCoverage);
+        ASSIGN_CORE(glScissor, scissor);
+        ASSIGN_CORE(glShaderBinary, shaderBinary);
+        ASSIGN_CORE(glShaderSource, shaderSource);
+        ASSIGN_CORE(glStencilFunc, stencilFunc);
+        ASSIGN_CORE(glStencilFuncSeparate, stencilFuncSeparate);
+        ASSIGN_CORE(glStencilMask, stencilMask);
+        ASSIGN_CORE(glStencilMaskSeparate, stencilMaskSeparate);
+        ASSIGN_CORE(glStencilOp, stencilOp);
+        ASSIGN_CORE(glStencilOpSeparate, stencilOpSeparate);
+        ASSIGN_CORE(glTexImage2D, texImage2D);
+        ASSIGN_CORE(glTexParameterf, texParameterf);
+        ASSIGN_CORE(glTexParameterfv, texParameterfv);
+        ASSIGN_CORE(glTexParameteri, texParameteri);
+        ASSIGN_CORE(glTexParameteriv, texParameteriv);
+        ASSIGN_CORE(glTexSubImage2D, texSubImage2D);
+        ASSIGN_CORE(glUniform1f, uniform1f);
+        ASSIGN_CORE(glUniform1fv, uniform1fv);
+        ASSIGN_CORE(glUniform1i, uniform1i);
+        ASSIGN_CORE(glUniform1iv, uniform1iv);
+        ASSIGN_CORE(glUniform2f, uniform2f);
+        ASSIGN_CORE(glUniform2fv, uniform2fv);
+        ASSIGN_CORE(glUniform2i, uniform2i);
+        ASSIGN_CORE(glUniform2iv, uniform2iv);
+        ASSIGN_CORE(glUniform3f, uniform3f);
+        ASSIGN_CORE(glUniform3fv, uniform3fv);
+        ASSIGN_CORE(glUniform3i, uniform3i);
+        ASSIGN_CORE(glUniform3iv, uniform3iv);
+        ASSIGN_CORE(glUniform4f, uniform4f);
+        ASSIGN_CORE(glUniform4fv, uniform4fv);
+        ASSIGN_CORE(glUniform4i, uniform4i);
+        ASSIGN_CORE(glUniform4iv, uniform4iv);
+        ASSIGN_CORE(glUniformMatrix2fv, uniformMatrix2fv);
+        ASSIGN_CORE(glUniformMatrix3fv, uniformMatrix3fv);
+        ASSIGN_CORE(glUniformMatrix4fv, uniformMatrix4fv);
+        ASSIGN_CORE(glUseProgram, useProgram);
+        ASSIGN_CORE(glValidateProgram, validateProgram);
+        ASSIGN_CORE(glVertexAttrib1f, vertexAttrib1f);
+        ASSIGN_CORE(glVertexAttrib1fv, vertexAttrib1fv);
+        ASSIGN_CORE(glVertexAttrib2f, vertexAttrib2f);
+        ASSIGN_CORE(glVertexAttrib2fv, vertexAttrib2fv);
+        ASSIGN_CORE(glVertexAttrib3f, vertexAttrib3f);
+        ASSIGN_CORE(glVertexAttrib3fv, vertexAttrib3fv);
+        ASSIGN_CORE(glVertexAttrib4f, vertexAttrib4f);
+        ASSIGN_CORE(glVertexAttrib4fv, vertexAttrib4fv);
+        ASSIGN_CORE(glVertexAttribPointer, vertexAttribPointer);
+        ASSIGN_CORE(glViewport, viewport);
     }
 
     if (version >= gl::Version(3, 0))
     {
-        ASSIGN("glBeginQuery", beginQuery);
-        ASSIGN("glBeginTransformFeedback", beginTransformFeedback);
-        ASSIGN("glBindBufferBase", bindBufferBase);
-        ASSIGN("glBindBufferRange", bindBufferRange);
-        ASSIGN("glBindSampler", bindSampler);
-        ASSIGN("glBindTransformFeedback", bindTransformFeedback);
-        ASSIGN("glBindVertexArray", bindVertexArray);
-        ASSIGN("glBlitFramebuffer", blitFramebuffer);
-        ASSIGN("glClearBufferfi", clearBufferfi);
-        ASSIGN("glClearBufferfv", clearBufferfv);
-        ASSIGN("glClearBufferiv", clearBufferiv);
-        ASSIGN("glClearBufferuiv", clearBufferuiv);
-        ASSIGN("glClientWaitSync", clientWaitSync);
-        ASSIGN("glCompressedTexImage3D", compressedTexImage3D);
-        ASSIGN("glCompressedTexSubImage3D", compressedTexSubImage3D);
-        ASSIGN("glCopyBufferSubData", copyBufferSubData);
-        ASSIGN("glCopyTexSubImage3D", copyTexSubImage3D);
-        ASSIGN("glDeleteQueries", deleteQueries);
-        ASSIGN("glDeleteSamplers", deleteSamplers);
-        ASSIGN("glDeleteSync", deleteSync);
-        ASSIGN("glDeleteTransformFeedbacks", deleteTransformFeedbacks);
-        ASSIGN("glDeleteVertexArrays", deleteVertexArrays);
-        ASSIGN("glDrawArraysInstanced", drawArraysInstanced);
-        ASSIGN("glDrawBuffers", drawBuffers);
-        ASSIGN("glDrawElementsInstanced", drawElementsInstanced);
-        ASSIGN("glDrawRangeElements", drawRangeElements);
-        ASSIGN("glEndQuery", endQuery);
-        ASSIGN("glEndTransformFeedback", endTransformFeedback);
-        ASSIGN("glFenceSync", fenceSync);
-        ASSIGN("glFlushMappedBufferRange", flushMappedBufferRange);
-        ASSIGN("glFramebufferTextureLayer", framebufferTextureLayer);
-        ASSIGN("glGenQueries", genQueries);
-        ASSIGN("glGenSamplers", genSamplers);
-        ASSIGN("glGenTransformFeedbacks", genTransformFeedbacks);
-        ASSIGN("glGenVertexArrays", genVertexArrays);
-        ASSIGN("glGetActiveUniformBlockName", getActiveUniformBlockName);
-        ASSIGN("glGetActiveUniformBlockiv", getActiveUniformBlockiv);
-        ASSIGN("glGetActiveUniformsiv", getActiveUniformsiv);
-        ASSIGN("glGetBufferParameteri64v", getBufferParameteri64v);
-        ASSIGN("glGetBufferPointerv", getBufferPointerv);
-        ASSIGN("glGetFragDataLocation", getFragDataLocation);
-        ASSIGN("glGetInteger64i_v", getInteger64i_v);
-        ASSIGN("glGetInteger64v", getInteger64v);
-        ASSIGN("glGetIntegeri_v", getIntegeri_v);
-        ASSIGN("glGetInternalformativ", getInternalformativ);
-        ASSIGN("glGetProgramBinary", getProgramBinary);
-        ASSIGN("glGetQueryObjectuiv", getQueryObjectuiv);
-        ASSIGN("glGetQueryiv", getQueryiv);
-        ASSIGN("glGetSamplerParameterfv", getSamplerParameterfv);
-        ASSIGN("glGetSamplerParameteriv", getSamplerParameteriv);
-        ASSIGN("glGetStringi", getStringi);
-        ASSIGN("glGetSynciv", getSynciv);
-        ASSIGN("glGetTransformFeedbackVarying", getTransformFeedbackVarying);
-        ASSIGN("glGetUniformBlockIndex", getUniformBlockIndex);
-        ASSIGN("glGetUniformIndices", getUniformIndices);
-        ASSIGN("glGetUniformuiv", getUniformuiv);
-        ASSIGN("glGetVertexAttribIiv", getVertexAttribIiv);
-        ASSIGN("glGetVertexAttribIuiv", getVertexAttribIuiv);
-        ASSIGN("glInvalidateFramebuffer", invalidateFramebuffer);
-        ASSIGN("glInvalidateSubFramebuffer", invalidateSubFramebuffer);
-        ASSIGN("glIsQuery", isQuery);
-        ASSIGN("glIsSampler", isSampler);
-        ASSIGN("glIsSync", isSync);
-        ASSIGN("glIsTransformFeedback", isTransformFeedback);
-        ASSIGN("glIsVertexArray", isVertexArray);
-        ASSIGN("glMapBufferRange", mapBufferRange);
-        ASSIGN("glPauseTransformFeedback", pauseTransformFeedback);
-        ASSIGN("glProgramBinary", programBinary);
-        ASSIGN("glProgramParameteri", programParameteri);
-        ASSIGN("glReadBuffer", readBuffer);
-        ASSIGN("glRenderbufferStorageMultisample", renderbufferStorageMultisample);
-        ASSIGN("glResumeTransformFeedback", resumeTransformFeedback);
-        ASSIGN("glSamplerParameterf", samplerParameterf);
-        ASSIGN("glSamplerParameterfv", samplerParameterfv);
-        ASSIGN("glSamplerParameteri", samplerParameteri);
-        ASSIGN("glSamplerParameteriv", samplerParameteriv);
-        ASSIGN("glTexImage3D", texImage3D);
-        ASSIGN("glTexStorage2D", texStorage2D);
-        ASSIGN("glTexStorage3D", texStorage3D);
-        ASSIGN("glTexSubImage3D", texSubImage3D);
-        ASSIGN("glTransformFeedbackVaryings", transformFeedbackVaryings);
-        ASSIGN("glUniform1ui", uniform1ui);
-        ASSIGN("glUniform1uiv", uniform1uiv);
-        ASSIGN("glUniform2ui", uniform2ui);
-        ASSIGN("glUniform2uiv", uniform2uiv);
-        ASSIGN("glUniform3ui", uniform3ui);
-        ASSIGN("glUniform3uiv", uniform3uiv);
-        ASSIGN("glUniform4ui", uniform4ui);
-        ASSIGN("glUniform4uiv", uniform4uiv);
-        ASSIGN("glUniformBlockBinding", uniformBlockBinding);
-        ASSIGN("glUniformMatrix2x3fv", uniformMatrix2x3fv);
-        ASSIGN("glUniformMatrix2x4fv", uniformMatrix2x4fv);
-        ASSIGN("glUniformMatrix3x2fv", uniformMatrix3x2fv);
-        ASSIGN("glUniformMatrix3x4fv", uniformMatrix3x4fv);
-        ASSIGN("glUniformMatrix4x2fv", uniformMatrix4x2fv);
-        ASSIGN("glUniformMatrix4x3fv", uniformMatrix4x3fv);
-        ASSIGN("glUnmapBuffer", unmapBuffer);
-        ASSIGN("glVertexAttribDivisor", vertexAttribDivisor);
-        ASSIGN("glVertexAttribI4i", vertexAttribI4i);
-        ASSIGN("glVertexAttribI4iv", vertexAttribI4iv);
-        ASSIGN("glVertexAttribI4ui", vertexAttribI4ui);
-        ASSIGN("glVertexAttribI4uiv", vertexAttribI4uiv);
-        ASSIGN("glVertexAttribIPointer", vertexAttribIPointer);
-        ASSIGN("glWaitSync", waitSync);
+        ASSIGN_CORE(glBeginQuery, beginQuery);
+        ASSIGN_CORE(glBeginTransformFeedback, beginTransformFeedback);
+        ASSIGN_CORE(glBindBufferBase, bindBufferBase);
+        ASSIGN_CORE(glBindBufferRange, bindBufferRange);
+        ASSIGN_CORE(glBindSampler, bindSampler);
+        ASSIGN_CORE(glBindTransformFeedback, bindTransformFeedback);
+        ASSIGN_CORE(glBindVertexArray, bindVertexArray);
+        ASSIGN_CORE(glBlitFramebuffer, blitFramebuffer);
+        ASSIGN_CORE(glClearBufferfi, clearBufferfi);
+        ASSIGN_CORE(glClearBufferfv, clearBufferfv);
+        ASSIGN_CORE(glClearBufferiv, clearBufferiv);
+        ASSIGN_CORE(glClearBufferuiv, clearBufferuiv);
+        ASSIGN_CORE(glClientWaitSync, clientWaitSync);
+        ASSIGN_CORE(glCompressedTexImage3D, compressedTexImage3D);
+        ASSIGN_CORE(glCompressedTexSubImage3D, compressedTexSubImage3D);
+        ASSIGN_CORE(glCopyBufferSubData, copyBufferSubData);
+        ASSIGN_CORE(glCopyTexSubImage3D, copyTexSubImage3D);
+        ASSIGN_CORE(glDeleteQueries, deleteQueries);
+        ASSIGN_CORE(glDeleteSamplers, deleteSamplers);
+        ASSIGN_CORE(glDeleteSync, deleteSync);
+        ASSIGN_CORE(glDeleteTransformFeedbacks, deleteTransformFeedbacks);
+        ASSIGN_CORE(glDeleteVertexArrays, deleteVertexArrays);
+        ASSIGN_CORE(glDrawArraysInstanced, drawArraysInstanced);
+        ASSIGN_CORE(glDrawBuffers, drawBuffers);
+        ASSIGN_CORE(glDrawElementsInstanced, drawElementsInstanced);
+        ASSIGN_CORE(glDrawRangeElements, drawRangeElements);
+        ASSIGN_CORE(glEndQuery, endQuery);
+        ASSIGN_CORE(glEndTransformFeedback, endTransformFeedback);
+        ASSIGN_CORE(glFenceSync, fenceSync);
+        ASSIGN_CORE(glFlushMappedBufferRange, flushMappedBufferRange);
+        ASSIGN_CORE(glFramebufferTextureLayer, framebufferTextureLayer);
+        ASSIGN_CORE(glGenQueries, genQueries);
+        ASSIGN_CORE(glGenSamplers, genSamplers);
+        ASSIGN_CORE(glGenTransformFeedbacks, genTransformFeedbacks);
+        ASSIGN_CORE(glGenVertexArrays, genVertexArrays);
+        ASSIGN_CORE(glGetActiveUniformBlockName, getActiveUniformBlockName);
+        ASSIGN_CORE(glGetActiveUniformBlockiv, getActiveUniformBlockiv);
+        ASSIGN_CORE(glGetActiveUniformsiv, getActiveUniformsiv);
+        ASSIGN_CORE(glGetBufferParameteri64v, getBufferParameteri64v);
+        ASSIGN_CORE(glGetBufferPointerv, getBufferPointerv);
+        ASSIGN_CORE(glGetFragDataLocation, getFragDataLocation);
+        ASSIGN_CORE(glGetInteger64i_v, getInteger64i_v);
+        ASSIGN_CORE(glGetInteger64v, getInteger64v);
+        ASSIGN_CORE(glGetIntegeri_v, getIntegeri_v);
+        ASSIGN_CORE(glGetInternalformativ, getInternalformativ);
+        ASSIGN_CORE(glGetProgramBinary, getProgramBinary);
+        ASSIGN_CORE(glGetQueryObjectuiv, getQueryObjectuiv);
+        ASSIGN_CORE(glGetQueryiv, getQueryiv);
+        ASSIGN_CORE(glGetSamplerParameterfv, getSamplerParameterfv);
+        ASSIGN_CORE(glGetSamplerParameteriv, getSamplerParameteriv);
+        ASSIGN_CORE(glGetStringi, getStringi);
+        ASSIGN_CORE(glGetSynciv, getSynciv);
+        ASSIGN_CORE(glGetTransformFeedbackVarying, getTransformFeedbackVarying);
+        ASSIGN_CORE(glGetUniformBlockIndex, getUniformBlockIndex);
+        ASSIGN_CORE(glGetUniformIndices, getUniformIndices);
+        ASSIGN_CORE(glGetUniformuiv, getUniformuiv);
+        ASSIGN_CORE(glGetVertexAttribIiv, getVertexAttribIiv);
+        ASSIGN_CORE(glGetVertexAttribIuiv, getVertexAttribIuiv);
+        ASSIGN_CORE(glInvalidateFramebuffer, invalidateFramebuffer);
+        ASSIGN_CORE(glInvalidateSubFramebuffer, invalidateSubFramebuffer);
+        ASSIGN_CORE(glIsQuery, isQuery);
+        ASSIGN_CORE(glIsSampler, isSampler);
+        ASSIGN_CORE(glIsSync, isSync);
+        ASSIGN_CORE(glIsTransformFeedback, isTransformFeedback);
+        ASSIGN_CORE(glIsVertexArray, isVertexArray);
+        ASSIGN_CORE(glMapBufferRange, mapBufferRange);
+        ASSIGN_CORE(glPauseTransformFeedback, pauseTransformFeedback);
+        ASSIGN_CORE(glProgramBinary, programBinary);
+        ASSIGN_CORE(glProgramParameteri, programParameteri);
+        ASSIGN_CORE(glReadBuffer, readBuffer);
+        ASSIGN_CORE(glRenderbufferStorageMultisample, renderbufferStorageMultisample);
+        ASSIGN_CORE(glResumeTransformFeedback, resumeTransformFeedback);
+        ASSIGN_CORE(glSamplerParameterf, samplerParameterf);
+        ASSIGN_CORE(glSamplerParameterfv, samplerParameterfv);
+        ASSIGN_CORE(glSamplerParameteri, samplerParameteri);
+        ASSIGN_CORE(glSamplerParameteriv, samplerParameteriv);
+        ASSIGN_CORE(glTexImage3D, texImage3D);
+        ASSIGN_CORE(glTexStorage2D, texStorage2D);
+        ASSIGN_CORE(glTexStorage3D, texStorage3D);
+        ASSIGN_CORE(glTexSubImage3D, texSubImage3D);
+        ASSIGN_CORE(glTransformFeedbackVaryings, transformFeedbackVaryings);
+        ASSIGN_CORE(glUniform1ui, uniform1ui);
+        ASSIGN_CORE(glUniform1uiv, uniform1uiv);
+        ASSIGN_CORE(glUniform2ui, uniform2ui);
+        ASSIGN_CORE(glUniform2uiv, uniform2uiv);
+        ASSIGN_CORE(glUniform3ui, uniform3ui);
+        ASSIGN_CORE(glUniform3uiv, uniform3uiv);
+        ASSIGN_CORE(glUniform4ui, uniform4ui);
+        ASSIGN_CORE(glUniform4uiv, uniform4uiv);
+        ASSIGN_CORE(glUniformBlockBinding, uniformBlockBinding);
+        ASSIGN_CORE(glUniformMatrix2x3fv, uniformMatrix2x3fv);
+        ASSIGN_CORE(glUniformMatrix2x4fv, uniformMatrix2x4fv);
+        ASSIGN_CORE(glUniformMatrix3x2fv, uniformMatrix3x2fv);
+        ASSIGN_CORE(glUniformMatrix3x4fv, uniformMatrix3x4fv);
+        ASSIGN_CORE(glUniformMatrix4x2fv, uniformMatrix4x2fv);
+        ASSIGN_CORE(glUniformMatrix4x3fv, uniformMatrix4x3fv);
+        ASSIGN_CORE(glUnmapBuffer, unmapBuffer);
+        ASSIGN_CORE(glVertexAttribDivisor, vertexAttribDivisor);
+        ASSIGN_CORE(glVertexAttribI4i, vertexAttribI4i);
+        ASSIGN_CORE(glVertexAttribI4iv, vertexAttribI4iv);
+        ASSIGN_CORE(glVertexAttribI4ui, vertexAttribI4ui);
+        ASSIGN_CORE(glVertexAttribI4uiv, vertexAttribI4uiv);
+        ASSIGN_CORE(glVertexAttribIPointer, vertexAttribIPointer);
+        ASSIGN_CORE(glWaitSync, waitSync);
     }
 
     if (version >= gl::Version(3, 1))
     {
-        ASSIGN("glActiveShaderProgram", activeShaderProgram);
-        ASSIGN("glBindImageTexture", bindImageTexture);
-        ASSIGN("glBindProgramPipeline", bindProgramPipeline);
-        ASSIGN("glBindVertexBuffer", bindVertexBuffer);
-        ASSIGN("glCreateShaderProgramv", createShaderProgramv);
-        ASSIGN("glDeleteProgramPipelines", deleteProgramPipelines);
-        ASSIGN("glDispatchCompute", dispatchCompute);
-        ASSIGN("glDispatchComputeIndirect", dispatchComputeIndirect);
-        ASSIGN("glDrawArraysIndirect", drawArraysIndirect);
-        ASSIGN("glDrawElementsIndirect", drawElementsIndirect);
-        ASSIGN("glFramebufferParameteri", framebufferParameteri);
-        ASSIGN("glGenProgramPipelines", genProgramPipelines);
-        ASSIGN("glGetBooleani_v", getBooleani_v);
-        ASSIGN("glGetFramebufferParameteriv", getFramebufferParameteriv);
-        ASSIGN("glGetMultisamplefv", getMultisamplefv);
-        ASSIGN("glGetProgramInterfaceiv", getProgramInterfaceiv);
-        ASSIGN("glGetProgramPipelineInfoLog", getProgramPipelineInfoLog);
-        ASSIGN("glGetProgramPipelineiv", getProgramPipelineiv);
-        ASSIGN("glGetProgramResourceIndex", getProgramResourceIndex);
-        ASSIGN("glGetProgramResourceLocation", getProgramResourceLocation);
-        ASSIGN("glGetProgramResourceName", getProgramResourceName);
-        ASSIGN("glGetProgramResourceiv", getProgramResourceiv);
-        ASSIGN("glGetTexLevelParameterfv", getTexLevelParameterfv);
-        ASSIGN("glGetTexLevelParameteriv", getTexLevelParameteriv);
-        ASSIGN("glIsProgramPipeline", isProgramPipeline);
-        ASSIGN("glMemoryBarrier", memoryBarrier);
-        ASSIGN("glMemoryBarrierByRegion", memoryBarrierByRegion);
-        ASSIGN("glProgramUniform1f", programUniform1f);
-        ASSIGN("glProgramUniform1fv", programUniform1fv);
-        ASSIGN("glProgramUniform1i", programUniform1i);
-        ASSIGN("glProgramUniform1iv", programUniform1iv);
-        ASSIGN("glProgramUniform1ui", programUniform1ui);
-        ASSIGN("glProgramUniform1uiv", programUniform1uiv);
-        ASSIGN("glProgramUniform2f", programUniform2f);
-        ASSIGN("glProgramUniform2fv", programUniform2fv);
-        ASSIGN("glProgramUniform2i", programUniform2i);
-        ASSIGN("glProgramUniform2iv", programUniform2iv);
-        ASSIGN("glProgramUniform2ui", programUniform2ui);
-        ASSIGN("glProgramUniform2uiv", programUniform2uiv);
-        ASSIGN("glProgramUniform3f", programUniform3f);
-        ASSIGN("glProgramUniform3fv", programUniform3fv);
-        ASSIGN("glProgramUniform3i", programUniform3i);
-        ASSIGN("glProgramUniform3iv", programUniform3iv);
-        ASSIGN("glProgramUniform3ui", programUniform3ui);
-        ASSIGN("glProgramUniform3uiv", programUniform3uiv);
-        ASSIGN("glProgramUniform4f", programUniform4f);
-        ASSIGN("glProgramUniform4fv", programUniform4fv);
-        ASSIGN("glProgramUniform4i", programUniform4i);
-        ASSIGN("glProgramUniform4iv", programUniform4iv);
-        ASSIGN("glProgramUniform4ui", programUniform4ui);
-        ASSIGN("glProgramUniform4uiv", programUniform4uiv);
-        ASSIGN("glProgramUniformMatrix2fv", programUniformMatrix2fv);
-        ASSIGN("glProgramUniformMatrix2x3fv", programUniformMatrix2x3fv);
-        ASSIGN("glProgramUniformMatrix2x4fv", programUniformMatrix2x4fv);
-        ASSIGN("glProgramUniformMatrix3fv", programUniformMatrix3fv);
-        ASSIGN("glProgramUniformMatrix3x2fv", programUniformMatrix3x2fv);
-        ASSIGN("glProgramUniformMatrix3x4fv", programUniformMatrix3x4fv);
-        ASSIGN("glProgramUniformMatrix4fv", programUniformMatrix4fv);
-        ASSIGN("glProgramUniformMatrix4x2fv", programUniformMatrix4x2fv);
-        ASSIGN("glProgramUniformMatrix4x3fv", programUniformMatrix4x3fv);
-        ASSIGN("glSampleMaski", sampleMaski);
-        ASSIGN("glTexStorage2DMultisample", texStorage2DMultisample);
-        ASSIGN("glUseProgramStages", useProgramStages);
-        ASSIGN("glValidateProgramPipeline", validateProgramPipeline);
-        ASSIGN("glVertexAttribBinding", vertexAttribBinding);
-        ASSIGN("glVertexAttribFormat", vertexAttribFormat);
-        ASSIGN("glVertexAttribIFormat", vertexAttribIFormat);
-        ASSIGN("glVertexBindingDivisor", vertexBindingDivisor);
+        ASSIGN_CORE(glActiveShaderProgram, activeShaderProgram);
+        ASSIGN_CORE(glBindImageTexture, bindImageTexture);
+        ASSIGN_CORE(glBindProgramPipeline, bindProgramPipeline);
+        ASSIGN_CORE(glBindVertexBuffer, bindVertexBuffer);
+        ASSIGN_CORE(glCreateShaderProgramv, createShaderProgramv);
+        ASSIGN_CORE(glDeleteProgramPipelines, deleteProgramPipelines);
+        ASSIGN_CORE(glDispatchCompute, dispatchCompute);
+        ASSIGN_CORE(glDispatchComputeIndirect, dispatchComputeIndirect);
+        ASSIGN_CORE(glDrawArraysIndirect, drawArraysIndirect);
+        ASSIGN_CORE(glDrawElementsIndirect, drawElementsIndirect);
+        ASSIGN_CORE(glFramebufferParameteri, framebufferParameteri);
+        ASSIGN_CORE(glGenProgramPipelines, genProgramPipelines);
+        ASSIGN_CORE(glGetBooleani_v, getBooleani_v);
+        ASSIGN_CORE(glGetFramebufferParameteriv, getFramebufferParameteriv);
+        ASSIGN_CORE(glGetMultisamplefv, getMultisamplefv);
+        ASSIGN_CORE(glGetProgramInterfaceiv, getProgramInterfaceiv);
+        ASSIGN_CORE(glGetProgramPipelineInfoLog, getProgramPipelineInfoLog);
+        ASSIGN_CORE(glGetProgramPipelineiv, getProgramPipelineiv);
+        ASSIGN_CORE(glGetProgramResourceIndex, getProgramResourceIndex);
+        ASSIGN_CORE(glGetProgramResourceLocation, getProgramResourceLocation);
+        ASSIGN_CORE(glGetProgramResourceName, getProgramResourceName);
+        ASSIGN_CORE(glGetProgramResourceiv, getProgramResourceiv);
+        ASSIGN_CORE(glGetTexLevelParameterfv, getTexLevelParameterfv);
+        ASSIGN_CORE(glGetTexLevelParameteriv, getTexLevelParameteriv);
+        ASSIGN_CORE(glIsProgramPipeline, isProgramPipeline);
+        ASSIGN_CORE(glMemoryBarrier, memoryBarrier);
+        ASSIGN_CORE(glMemoryBarrierByRegion, memoryBarrierByRegion);
+        ASSIGN_CORE(glProgramUniform1f, programUniform1f);
+        ASSIGN_CORE(glProgramUniform1fv, programUniform1fv);
+        ASSIGN_CORE(glProgramUniform1i, programUniform1i);
+        ASSIGN_CORE(glProgramUniform1iv, programUniform1iv);
+        ASSIGN_CORE(glProgramUniform1ui, programUniform1ui);
+        ASSIGN_CORE(glProgramUniform1uiv, programUniform1uiv);
+        ASSIGN_CORE(glProgramUniform2f, programUniform2f);
+        ASSIGN_CORE(glProgramUniform2fv, programUniform2fv);
+        ASSIGN_CORE(glProgramUniform2i, programUniform2i);
+        ASSIGN_CORE(glProgramUniform2iv, programUniform2iv);
+        ASSIGN_CORE(glProgramUniform2ui, programUniform2ui);
+        ASSIGN_CORE(glProgramUniform2uiv, programUniform2uiv);
+        ASSIGN_CORE(glProgramUniform3f, programUniform3f);
+        ASSIGN_CORE(glProgramUniform3fv, programUniform3fv);
+        ASSIGN_CORE(glProgramUniform3i, programUniform3i);
+        ASSIGN_CORE(glProgramUniform3iv, programUniform3iv);
+        ASSIGN_CORE(glProgramUniform3ui, programUniform3ui);
+        ASSIGN_CORE(glProgramUniform3uiv, programUniform3uiv);
+        ASSIGN_CORE(glProgramUniform4f, programUniform4f);
+        ASSIGN_CORE(glProgramUniform4fv, programUniform4fv);
+        ASSIGN_CORE(glProgramUniform4i, programUniform4i);
+        ASSIGN_CORE(glProgramUniform4iv, programUniform4iv);
+        ASSIGN_CORE(glProgramUniform4ui, programUniform4ui);
+        ASSIGN_CORE(glProgramUniform4uiv, programUniform4uiv);
+        ASSIGN_CORE(glProgramUniformMatrix2fv, programUniformMatrix2fv);
+        ASSIGN_CORE(glProgramUniformMatrix2x3fv, programUniformMatrix2x3fv);
+        ASSIGN_CORE(glProgramUniformMatrix2x4fv, programUniformMatrix2x4fv);
+        ASSIGN_CORE(glProgramUniformMatrix3fv, programUniformMatrix3fv);
+        ASSIGN_CORE(glProgramUniformMatrix3x2fv, programUniformMatrix3x2fv);
+        ASSIGN_CORE(glProgramUniformMatrix3x4fv, programUniformMatrix3x4fv);
+        ASSIGN_CORE(glProgramUniformMatrix4fv, programUniformMatrix4fv);
+        ASSIGN_CORE(glProgramUniformMatrix4x2fv, programUniformMatrix4x2fv);
+        ASSIGN_CORE(glProgramUniformMatrix4x3fv, programUniformMatrix4x3fv);
+        ASSIGN_CORE(glSampleMaski, sampleMaski);
+        ASSIGN_CORE(glTexStorage2DMultisample, texStorage2DMultisample);
+        ASSIGN_CORE(glUseProgramStages, useProgramStages);
+        ASSIGN_CORE(glValidateProgramPipeline, validateProgramPipeline);
+        ASSIGN_CORE(glVertexAttribBinding, vertexAttribBinding);
+        ASSIGN_CORE(glVertexAttribFormat, vertexAttribFormat);
+        ASSIGN_CORE(glVertexAttribIFormat, vertexAttribIFormat);
+        ASSIGN_CORE(glVertexBindingDivisor, vertexBindingDivisor);
     }
 
     if (version >= gl::Version(3, 2))
     {
-        ASSIGN("glBlendBarrier", blendBarrier);
-        ASSIGN("glBlendEquationSeparatei", blendEquationSeparatei);
-        ASSIGN("glBlendEquationi", blendEquationi);
-        ASSIGN("glBlendFuncSeparatei", blendFuncSeparatei);
-        ASSIGN("glBlendFunci", blendFunci);
-        ASSIGN("glColorMaski", colorMaski);
-        ASSIGN("glCopyImageSubData", copyImageSubData);
-        ASSIGN("glDebugMessageCallback", debugMessageCallback);
-        ASSIGN("glDebugMessageControl", debugMessageControl);
-        ASSIGN("glDebugMessageInsert", debugMessageInsert);
-        ASSIGN("glDisablei", disablei);
-        ASSIGN("glDrawElementsBaseVertex", drawElementsBaseVertex);
-        ASSIGN("glDrawElementsInstancedBaseVertex", drawElementsInstancedBaseVertex);
-        ASSIGN("glDrawRangeElementsBaseVertex", drawRangeElementsBaseVertex);
-        ASSIGN("glEnablei", enablei);
-        ASSIGN("glFramebufferTexture", framebufferTexture);
-        ASSIGN("glGetDebugMessageLog", getDebugMessageLog);
-        ASSIGN("glGetGraphicsResetStatus", getGraphicsResetStatus);
-        ASSIGN("glGetObjectLabel", getObjectLabel);
-        ASSIGN("glGetObjectPtrLabel", getObjectPtrLabel);
-        ASSIGN("glGetPointerv", getPointerv);
-        ASSIGN("glGetSamplerParameterIiv", getSamplerParameterIiv);
-        ASSIGN("glGetSamplerParameterIuiv", getSamplerParameterIuiv);
-        ASSIGN("glGetTexParameterIiv", getTexParameterIiv);
-        ASSIGN("glGetTexParameterIuiv", getTexParameterIuiv);
-        ASSIGN("glGetnUniformfv", getnUniformfv);
-        ASSIGN("glGetnUniformiv", getnUniformiv);
-        ASSIGN("glGetnUniformuiv", getnUniformuiv);
-        ASSIGN("glIsEnabledi", isEnabledi);
-        ASSIGN("glMinSampleShading", minSampleShading);
-        ASSIGN("glObjectLabel", objectLabel);
-        ASSIGN("glObjectPtrLabel", objectPtrLabel);
-        ASSIGN("glPatchParameteri", patchParameteri);
-        ASSIGN("glPopDebugGroup", popDebugGroup);
-        ASSIGN("glPrimitiveBoundingBox", primitiveBoundingBox);
-        ASSIGN("glPushDebugGroup", pushDebugGroup);
-        ASSIGN("glReadnPixels", readnPixels);
-        ASSIGN("glSamplerParameterIiv", samplerParameterIiv);
-        ASSIGN("glSamplerParameterIuiv", samplerParameterIuiv);
-        ASSIGN("glTexBuffer", texBuffer);
-        ASSIGN("glTexBufferRange", texBufferRange);
-        ASSIGN("glTexParameterIiv", texParameterIiv);
-        ASSIGN("glTexParameterIuiv", texParameterIuiv);
-        ASSIGN("glTexStorage3DMultisample", texStorage3DMultisample);
+        ASSIGN_CORE(glBlendBarrier, blendBarrier);
+        ASSIGN_CORE(glBlendEquationSeparatei, blendEquationSeparatei);
+        ASSIGN_CORE(glBlendEquationi, blendEquationi);
+        ASSIGN_CORE(glBlendFuncSeparatei, blendFuncSeparatei);
+        ASSIGN_CORE(glBlendFunci, blendFunci);
+        ASSIGN_CORE(glColorMaski, colorMaski);
+        ASSIGN_CORE(glCopyImageSubData, copyImageSubData);
+        ASSIGN_CORE(glDebugMessageCallback, debugMessageCallback);
+        ASSIGN_CORE(glDebugMessageControl, debugMessageControl);
+        ASSIGN_CORE(glDebugMessageInsert, debugMessageInsert);
+        ASSIGN_CORE(glDisablei, disablei);
+        ASSIGN_CORE(glDrawElementsBaseVertex, drawElementsBaseVertex);
+        ASSIGN_CORE(glDrawElementsInstancedBaseVertex, drawElementsInstancedBaseVertex);
+        ASSIGN_CORE(glDrawRangeElementsBaseVertex, drawRangeElementsBaseVertex);
+        ASSIGN_CORE(glEnablei, enablei);
+        ASSIGN_CORE(glFramebufferTexture, framebufferTexture);
+        ASSIGN_CORE(glGetDebugMessageLog, getDebugMessageLog);
+        ASSIGN_CORE(glGetGraphicsResetStatus, getGraphicsResetStatus);
+        ASSIGN_CORE(glGetObjectLabel, getObjectLabel);
+        ASSIGN_CORE(glGetObjectPtrLabel, getObjectPtrLabel);
+        ASSIGN_CORE(glGetPointerv, getPointerv);
+        ASSIGN_CORE(glGetSamplerParameterIiv, getSamplerParameterIiv);
+        ASSIGN_CORE(glGetSamplerParameterIuiv, getSamplerParameterIuiv);
+        ASSIGN_CORE(glGetTexParameterIiv, getTexParameterIiv);
+        ASSIGN_CORE(glGetTexParameterIuiv, getTexParameterIuiv);
+        ASSIGN_CORE(glGetnUniformfv, getnUniformfv);
+        ASSIGN_CORE(glGetnUniformiv, getnUniformiv);
+        ASSIGN_CORE(glGetnUniformuiv, getnUniformuiv);
+        ASSIGN_CORE(glIsEnabledi, isEnabledi);
+        ASSIGN_CORE(glMinSampleShading, minSampleShading);
+        ASSIGN_CORE(glObjectLabel, objectLabel);
+        ASSIGN_CORE(glObjectPtrLabel, objectPtrLabel);
+        ASSIGN_CORE(glPatchParameteri, patchParameteri);
+        ASSIGN_CORE(glPopDebugGroup, popDebugGroup);
+        ASSIGN_CORE(glPrimitiveBoundingBox, primitiveBoundingBox);
+        ASSIGN_CORE(glPushDebugGroup, pushDebugGroup);
+        ASSIGN_CORE(glReadnPixels, readnPixels);
+        ASSIGN_CORE(glSamplerParameterIiv, samplerParameterIiv);
+        ASSIGN_CORE(glSamplerParameterIuiv, samplerParameterIuiv);
+        ASSIGN_CORE(glTexBuffer, texBuffer);
+        ASSIGN_CORE(glTexBufferRange, texBufferRange);
+        ASSIGN_CORE(glTexParameterIiv, texParameterIiv);
+        ASSIGN_CORE(glTexParameterIuiv, texParameterIuiv);
+        ASSIGN_CORE(glTexStorage3DMultisample, texStorage3DMultisample);
     }
 
     if (extensions.count("GL_EXT_base_instance") != 0)
     {
-        ASSIGN("glDrawArraysInstancedBaseInstanceEXT", drawArraysInstancedBaseInstance);
-        ASSIGN("glDrawElementsInstancedBaseInstanceEXT", drawElementsInstancedBaseInstance);
-        ASSIGN("glDrawElementsInstancedBaseVertexBaseInstanceEXT",
+        ASSIGN(glDrawArraysInstancedBaseInstanceEXT, drawArraysInstancedBaseInstance);
+        ASSIGN(glDrawElementsInstancedBaseInstanceEXT, drawElementsInstancedBaseInstance);
+        ASSIGN(glDrawElementsInstancedBaseVertexBaseInstanceEXT,
                drawElementsInstancedBaseVertexBaseInstance);
     }
 
     if (extensions.count("GL_EXT_blend_func_extended") != 0)
     {
-        ASSIGN("glBindFragDataLocationEXT", bindFragDataLocation);
-        ASSIGN("glBindFragDataLocationIndexedEXT", bindFragDataLocationIndexed);
-        ASSIGN("glGetFragDataIndexEXT", getFragDataIndex);
-        ASSIGN("glGetProgramResourceLocationIndexEXT", getProgramResourceLocationIndex);
+        ASSIGN(glBindFragDataLocationEXT, bindFragDataLocation);
+        ASSIGN(glBindFragDataLocationIndexedEXT, bindFragDataLocationIndexed);
+        ASSIGN(glGetFragDataIndexEXT, getFragDataIndex);
+        ASSIGN(glGetProgramResourceLocationIndexEXT, getProgramResourceLocationIndex);
     }
 
     if (extensions.count("GL_EXT_buffer_storage") != 0)
     {
-        ASSIGN("glBufferStorageEXT", bufferStorage);
+        ASSIGN(glBufferStorageEXT, bufferStorage);
     }
 
     if (extensions.count("GL_EXT_clear_texture") != 0)
     {
-        ASSIGN("glClearTexImageEXT", clearTexImage);
-        ASSIGN("glClearTexSubImageEXT", clearTexSubImage);
+        ASSIGN(glClearTexImageEXT, clearTexImage);
+        ASSIGN(glClearTexSubImageEXT, clearTexSubImage);
     }
 
     if (extensions.count("GL_EXT_clip_control") != 0)
     {
-        ASSIGN("glClipControlEXT", clipControl);
+        ASSIGN(glClipControlEXT, clipControl);
     }
 
     if (extensions.count("GL_EXT_copy_image") != 0)
     {
-        ASSIGN("glCopyImageSubDataEXT", copyImageSubData);
+        ASSIGN(glCopyImageSubDataEXT, copyImageSubData);
     }
 
     if (extensions.count("GL_EXT_discard_framebuffer") != 0)
     {
-        ASSIGN("glDiscardFramebufferEXT", discardFramebufferEXT);
+        ASSIGN(glDiscardFramebufferEXT, discardFramebufferEXT);
     }
 
     if (extensions.count("GL_EXT_disjoint_timer_query") != 0)
     {
-        ASSIGN("glBeginQueryEXT", beginQuery);
-        ASSIGN("glDeleteQueriesEXT", deleteQueries);
-        ASSIGN("glEndQueryEXT", endQuery);
-        ASSIGN("glGenQueriesEXT", genQueries);
-        ASSIGN("glGetQueryObjecti64vEXT", getQueryObjecti64v);
-        ASSIGN("glGetQueryObjectivEXT", getQueryObjectiv);
-        ASSIGN("glGetQueryObjectui64vEXT", getQueryObjectui64v);
-        ASSIGN("glGetQueryObjectuivEXT", getQueryObjectuiv);
-        ASSIGN("glGetQueryivEXT", getQueryiv);
-        ASSIGN("glIsQueryEXT", isQuery);
-        ASSIGN("glQueryCounterEXT", queryCounter);
+        ASSIGN(glBeginQueryEXT, beginQuery);
+        ASSIGN(glDeleteQueriesEXT, deleteQueries);
+        ASSIGN(glEndQueryEXT, endQuery);
+        ASSIGN(glGenQueriesEXT, genQueries);
+        ASSIGN(glGetQueryObjecti64vEXT, getQueryObjecti64v);
+        ASSIGN(glGetQueryObjectivEXT, getQueryObjectiv);
+        ASSIGN(glGetQueryObjectui64vEXT, getQueryObjectui64v);
+        ASSIGN(glGetQueryObjectuivEXT, getQueryObjectuiv);
+        ASSIGN(glGetQueryivEXT, getQueryiv);
+        ASSIGN(glIsQueryEXT, isQuery);
+        ASSIGN(glQueryCounterEXT, queryCounter);
     }
 
     if (extensions.count("GL_EXT_draw_buffers") != 0)
     {
-        ASSIGN("glDrawBuffersEXT", drawBuffers);
+        ASSIGN(glDrawBuffersEXT, drawBuffers);
     }
 
     if (extensions.count("GL_EXT_draw_buffers_indexed") != 0)
     {
-        ASSIGN("glBlendEquationSeparateiEXT", blendEquationSeparatei);
-        ASSIGN("glBlendEquationiEXT", blendEquationi);
-        ASSIGN("glBlendFuncSeparateiEXT", blendFuncSeparatei);
-        ASSIGN("glBlendFunciEXT", blendFunci);
-        ASSIGN("glColorMaskiEXT", colorMaski);
-        ASSIGN("glDisableiEXT", disablei);
-        ASSIGN("glEnableiEXT", enablei);
-        ASSIGN("glIsEnablediEXT", isEnabledi);
+        ASSIGN(glBlendEquationSeparateiEXT, blendEquationSeparatei);
+        ASSIGN(glBlendEquationiEXT, blendEquationi);
+        ASSIGN(glBlendFuncSeparateiEXT, blendFuncSeparatei);
+        ASSIGN(glBlendFunciEXT, blendFunci);
+        ASSIGN(glColorMaskiEXT, colorMaski);
+        ASSIGN(glDisableiEXT, disablei);
+        ASSIGN(glEnableiEXT, enablei);
+        ASSIGN(glIsEnablediEXT, isEnabledi);
     }
 
     if (extensions.count("GL_EXT_draw_elements_base_vertex") != 0)
     {
-        ASSIGN("glDrawElementsBaseVertexEXT", drawElementsBaseVertex);
-        ASSIGN("glDrawElementsInstancedBaseVertexEXT", drawElementsInstancedBaseVertex);
-        ASSIGN("glDrawRangeElementsBaseVertexEXT", drawRangeElementsBaseVertex);
-        ASSIGN("glMultiDrawElementsBaseVertexEXT", multiDrawElementsBaseVertex);
+        ASSIGN(glDrawElementsBaseVertexEXT, drawElementsBaseVertex);
+        ASSIGN(glDrawElementsInstancedBaseVertexEXT, drawElementsInstancedBaseVertex);
+        ASSIGN(glDrawRangeElementsBaseVertexEXT, drawRangeElementsBaseVertex);
+        ASSIGN(glMultiDrawElementsBaseVertexEXT, multiDrawElementsBaseVertex);
     }
 
     if (extensions.count("GL_EXT_draw_transform_feedback") != 0)
     {
-        ASSIGN("glDrawTransformFeedbackEXT", drawTransformFeedback);
-        ASSIGN("glDrawTransformFeedbackInstancedEXT", drawTransformFeedbackInstanced);
+        ASSIGN(glDrawTransformFeedbackEXT, drawTransformFeedback);
+        ASSIGN(glDrawTransformFeedbackInstancedEXT, drawTransformFeedbackInstanced);
     }
 
     if (extensions.count("GL_EXT_geometry_shader") != 0)
     {
-        ASSIGN("glFramebufferTextureEXT", framebufferTexture);
+        ASSIGN(glFramebufferTextureEXT, framebufferTexture);
     }
 
     if (extensions.count("GL_EXT_instanced_arrays") != 0)
     {
-        ASSIGN("glVertexAttribDivisorEXT", vertexAttribDivisor);
+        ASSIGN(glVertexAttribDivisorEXT, vertexAttribDivisor);
     }
 
     if (extensions.count("GL_EXT_map_buffer_range") != 0)
     {
-        ASSIGN("glFlushMappedBufferRangeEXT", flushMappedBufferRange);
-        ASSIGN("glMapBufferRangeEXT", mapBufferRange);
+        ASSIGN(glFlushMappedBufferRangeEXT, flushMappedBufferRange);
+        ASSIGN(glMapBufferRangeEXT, mapBufferRange);
     }
 
     if (extensions.count("GL_EXT_multi_draw_indirect") != 0)
     {
-        ASSIGN("glMultiDrawArraysIndirectEXT", multiDrawArraysIndirect);
-        ASSIGN("glMultiDrawElementsIndirectEXT", multiDrawElementsIndirect);
+        ASSIGN(glMultiDrawArraysIndirectEXT, multiDrawArraysIndirect);
+        ASSIGN(glMultiDrawElementsIndirectEXT, multiDrawElementsIndirect);
     }
 
     if (extensions.count("GL_EXT_multisampled_render_to_texture") != 0)
     {
-        ASSIGN("glRenderbufferStorageMultisampleEXT", renderbufferStorageMultisample);
+        ASSIGN(glRenderbufferStorageMultisampleEXT, renderbufferStorageMultisample);
     }
 
     if (extensions.count("GL_EXT_multiview_draw_buffers") != 0)
     {
-        ASSIGN("glGetIntegeri_vEXT", getIntegeri_v);
+        ASSIGN(glGetIntegeri_vEXT, getIntegeri_v);
     }
 
     if (extensions.count("GL_EXT_occlusion_query_boolean") != 0)
     {
-        ASSIGN("glBeginQueryEXT", beginQuery);
-        ASSIGN("glDeleteQueriesEXT", deleteQueries);
-        ASSIGN("glEndQueryEXT", endQuery);
-        ASSIGN("glGenQueriesEXT", genQueries);
-        ASSIGN("glGetQueryObjectuivEXT", getQueryObjectuiv);
-        ASSIGN("glGetQueryivEXT", getQueryiv);
-        ASSIGN("glIsQueryEXT", isQuery);
+        ASSIGN(glBeginQueryEXT, beginQuery);
+        ASSIGN(glDeleteQueriesEXT, deleteQueries);
+        ASSIGN(glEndQueryEXT, endQuery);
+        ASSIGN(glGenQueriesEXT, genQueries);
+        ASSIGN(glGetQueryObjectuivEXT, getQueryObjectuiv);
+        ASSIGN(glGetQueryivEXT, getQueryiv);
+        ASSIGN(glIsQueryEXT, isQuery);
     }
 
     if (extensions.count("GL_EXT_primitive_bounding_box") != 0)
     {
-        ASSIGN("glPrimitiveBoundingBoxEXT", primitiveBoundingBox);
+        ASSIGN(glPrimitiveBoundingBoxEXT, primitiveBoundingBox);
     }
 
     if (extensions.count("GL_EXT_robustness") != 0)
     {
-        ASSIGN("glGetGraphicsResetStatusEXT", getGraphicsResetStatus);
-        ASSIGN("glGetnUniformfvEXT", getnUniformfv);
-        ASSIGN("glGetnUniformivEXT", getnUniformiv);
-        ASSIGN("glReadnPixelsEXT", readnPixels);
+        ASSIGN(glGetGraphicsResetStatusEXT, getGraphicsResetStatus);
+        ASSIGN(glGetnUniformfvEXT, getnUniformfv);
+        ASSIGN(glGetnUniformivEXT, getnUniformiv);
+        ASSIGN(glReadnPixelsEXT, readnPixels);
     }
 
     if (extensions.count("GL_EXT_tessellation_shader") != 0)
     {
-        ASSIGN("glPatchParameteriEXT", patchParameteri);
+        ASSIGN(glPatchParameteriEXT, patchParameteri);
     }
 
     if (extensions.count("GL_EXT_texture_border_clamp") != 0)
     {
-        ASSIGN("glGetSamplerParameterIivEXT", getSamplerParameterIiv);
-        ASSIGN("glGetSamplerParameterIuivEXT", getSamplerParameterIuiv);
-        ASSIGN("glGetTexParameterIivEXT", getTexParameterIiv);
-        ASSIGN("glGetTexParameterIuivEXT", getTexParameterIuiv);
-        ASSIGN("glSamplerParameterIivEXT", samplerParameterIiv);
-        ASSIGN("glSamplerParameterIuivEXT", samplerParameterIuiv);
-        ASSIGN("glTexParameterIivEXT", texParameterIiv);
-        ASSIGN("glTexParameterIuivEXT", texParameterIuiv);
+        ASSIGN(glGetSamplerParameterIivEXT, getSamplerParameterIiv);
+        ASSIGN(glGetSamplerParameterIuivEXT, getSamplerParameterIuiv);
+        ASSIGN(glGetTexParameterIivEXT, getTexParameterIiv);
+        ASSIGN(glGetTexParameterIuivEXT, getTexParameterIuiv);
+        ASSIGN(glSamplerParameterIivEXT, samplerParameterIiv);
+        ASSIGN(glSamplerParameterIuivEXT, samplerParameterIuiv);
+        ASSIGN(glTexParameterIivEXT, texParameterIiv);
+        ASSIGN(glTexParameterIuivEXT, texParameterIuiv);
     }
 
     if (extensions.count("GL_EXT_texture_buffer") != 0)
     {
-        ASSIGN("glTexBufferEXT", texBuffer);
-        ASSIGN("glTexBufferRangeEXT", texBufferRange);
+        ASSIGN(glTexBufferEXT, texBuffer);
+        ASSIGN(glTexBufferRangeEXT, texBufferRange);
     }
 
     if (extensions.count("GL_EXT_texture_storage") != 0)
     {
-        ASSIGN("glTexStorage1DEXT", texStorage1D);
-        ASSIGN("glTexStorage2DEXT", texStorage2D);
-        ASSIGN("glTexStorage3DEXT", texStorage3D);
-        ASSIGN("glTextureStorage1DEXT", textureStorage1D);
-        ASSIGN("glTextureStorage2DEXT", textureStorage2D);
-        ASSIGN("glTextureStorage3DEXT", textureStorage3D);
+        ASSIGN(glTexStorage1DEXT, texStorage1D);
+        ASSIGN(glTexStorage2DEXT, texStorage2D);
+        ASSIGN(glTexStorage3DEXT, texStorage3D);
+        ASSIGN(glTextureStorage1DEXT, textureStorage1D);
+        ASSIGN(glTextureStorage2DEXT, textureStorage2D);
+        ASSIGN(glTextureStorage3DEXT, textureStorage3D);
     }
 
     if (extensions.count("GL_EXT_texture_view") != 0)
     {
-        ASSIGN("glTextureViewEXT", textureView);
+        ASSIGN(glTextureViewEXT, textureView);
     }
 
     if (extensions.count("GL_KHR_debug") != 0)
     {
-        ASSIGN("glDebugMessageCallbackKHR", debugMessageCallback);
-        ASSIGN("glDebugMessageControlKHR", debugMessageControl);
-        ASSIGN("glDebugMessageInsertKHR", debugMessageInsert);
-        ASSIGN("glGetDebugMessageLogKHR", getDebugMessageLog);
-        ASSIGN("glGetObjectLabelKHR", getObjectLabel);
-        ASSIGN("glGetObjectPtrLabelKHR", getObjectPtrLabel);
-        ASSIGN("glGetPointervKHR", getPointerv);
-        ASSIGN("glObjectLabelKHR", objectLabel);
-        ASSIGN("glObjectPtrLabelKHR", objectPtrLabel);
-        ASSIGN("glPopDebugGroupKHR", popDebugGroup);
-        ASSIGN("glPushDebugGroupKHR", pushDebugGroup);
+        ASSIGN(glDebugMessageCallbackKHR, debugMessageCallback);
+        ASSIGN(glDebugMessageControlKHR, debugMessageControl);
+        ASSIGN(glDebugMessageInsertKHR, debugMessageInsert);
+        ASSIGN(glGetDebugMessageLogKHR, getDebugMessageLog);
+        ASSIGN(glGetObjectLabelKHR, getObjectLabel);
+        ASSIGN(glGetObjectPtrLabelKHR, getObjectPtrLabel);
+        ASSIGN(glGetPointervKHR, getPointerv);
+        ASSIGN(glObjectLabelKHR, objectLabel);
+        ASSIGN(glObjectPtrLabelKHR, objectPtrLabel);
+        ASSIGN(glPopDebugGroupKHR, popDebugGroup);
+        ASSIGN(glPushDebugGroupKHR, pushDebugGroup);
     }
 
     if (extensions.count("GL_KHR_robustness") != 0)
     {
-        ASSIGN("glGetGraphicsResetStatusKHR", getGraphicsResetStatus);
-        ASSIGN("glGetnUniformfvKHR", getnUniformfv);
-        ASSIGN("glGetnUniformivKHR", getnUniformiv);
-        ASSIGN("glGetnUniformuivKHR", getnUniformuiv);
-        ASSIGN("glReadnPixelsKHR", readnPixels);
+        ASSIGN(glGetGraphicsResetStatusKHR, getGraphicsResetStatus);
+        ASSIGN(glGetnUniformfvKHR, getnUniformfv);
+        ASSIGN(glGetnUniformivKHR, getnUniformiv);
+        ASSIGN(glGetnUniformuivKHR, getnUniformuiv);
+        ASSIGN(glReadnPixelsKHR, readnPixels);
     }
 
     if (extensions.count("GL_OES_EGL_image") != 0)
     {
-        ASSIGN("glEGLImageTargetRenderbufferStorageOES", eGLImageTargetRenderbufferStorageOES);
-        ASSIGN("glEGLImageTargetTexture2DOES", eGLImageTargetTexture2DOES);
+        ASSIGN(glEGLImageTargetRenderbufferStorageOES, eGLImageTargetRenderbufferStorageOES);
+        ASSIGN(glEGLImageTargetTexture2DOES, eGLImageTargetTexture2DOES);
     }
 
     if (extensions.count("GL_OES_copy_image") != 0)
     {
-        ASSIGN("glCopyImageSubDataOES", copyImageSubData);
+        ASSIGN(glCopyImageSubDataOES, copyImageSubData);
     }
 
     if (extensions.count("GL_OES_draw_buffers_indexed") != 0)
     {
-        ASSIGN("glBlendEquationSeparateiOES", blendEquationSeparatei);
-        ASSIGN("glBlendEquationiOES", blendEquationi);
-        ASSIGN("glBlendFuncSeparateiOES", blendFuncSeparatei);
-        ASSIGN("glBlendFunciOES", blendFunci);
-        ASSIGN("glColorMaskiOES", colorMaski);
-        ASSIGN("glDisableiOES", disablei);
-        ASSIGN("glEnableiOES", enablei);
-        ASSIGN("glIsEnablediOES", isEnabledi);
+        ASSIGN(glBlendEquationSeparateiOES, blendEquationSeparatei);
+        ASSIGN(glBlendEquationiOES, blendEquationi);
+        ASSIGN(glBlendFuncSeparateiOES, blendFuncSeparatei);
+        ASSIGN(glBlendFunciOES, blendFunci);
+        ASSIGN(glColorMaskiOES, colorMaski);
+        ASSIGN(glDisableiOES, disablei);
+        ASSIGN(glEnableiOES, enablei);
+        ASSIGN(glIsEnablediOES, isEnabledi);
     }
 
     if (extensions.count("GL_OES_draw_elements_base_vertex") != 0)
     {
-        ASSIGN("glDrawElementsBaseVertexOES", drawElementsBaseVertex);
-        ASSIGN("glDrawElementsInstancedBaseVertexOES", drawElementsInstancedBaseVertex);
-        ASSIGN("glDrawRangeElementsBaseVertexOES", drawRangeElementsBaseVertex);
-        ASSIGN("glMultiDrawElementsBaseVertexEXT", multiDrawElementsBaseVertex);
+        ASSIGN(glDrawElementsBaseVertexOES, drawElementsBaseVertex);
+        ASSIGN(glDrawElementsInstancedBaseVertexOES, drawElementsInstancedBaseVertex);
+        ASSIGN(glDrawRangeElementsBaseVertexOES, drawRangeElementsBaseVertex);
+        ASSIGN(glMultiDrawElementsBaseVertexEXT, multiDrawElementsBaseVertex);
     }
 
     if (extensions.count("GL_OES_geometry_shader") != 0)
     {
-        ASSIGN("glFramebufferTextureOES", framebufferTexture);
+        ASSIGN(glFramebufferTextureOES, framebufferTexture);
     }
 
     if (extensions.count("GL_OES_get_program_binary") != 0)
     {
-        ASSIGN("glGetProgramBinaryOES", getProgramBinary);
-        ASSIGN("glProgramBinaryOES", programBinary);
+        ASSIGN(glGetProgramBinaryOES, getProgramBinary);
+        ASSIGN(glProgramBinaryOES, programBinary);
     }
 
     if (extensions.count("GL_OES_mapbuffer") != 0)
     {
-        ASSIGN("glGetBufferPointervOES", getBufferPointerv);
-        ASSIGN("glMapBufferOES", mapBuffer);
-        ASSIGN("glUnmapBufferOES", unmapBuffer);
+        ASSIGN(glGetBufferPointervOES, getBufferPointerv);
+        ASSIGN(glMapBufferOES, mapBuffer);
+        ASSIGN(glUnmapBufferOES, unmapBuffer);
     }
 
     if (extensions.count("GL_OES_primitive_bounding_box") != 0)
     {
-        ASSIGN("glPrimitiveBoundingBoxOES", primitiveBoundingBox);
+        ASSIGN(glPrimitiveBoundingBoxOES, primitiveBoundingBox);
     }
 
     if (extensions.count("GL_OES_sample_shading") != 0)
     {
-        ASSIGN("glMinSampleShadingOES", minSampleShading);
+        ASSIGN(glMinSampleShadingOES, minSampleShading);
     }
 
     if (extensions.count("GL_OES_tessellation_shader") != 0)
     {
-        ASSIGN("glPatchParameteriOES", patchParameteri);
+        ASSIGN(glPatchParameteriOES, patchParameteri);
     }
 
     if (extensions.count("GL_OES_texture_3D") != 0)
     {
-        ASSIGN("glCompressedTexImage3DOES", compressedTexImage3D);
-        ASSIGN("glCompressedTexSubImage3DOES", compressedTexSubImage3D);
-        ASSIGN("glCopyTexSubImage3DOES", copyTexSubImage3D);
-        ASSIGN("glFramebufferTexture3DOES", framebufferTexture3D);
-        ASSIGN("glTexImage3DOES", texImage3D);
-        ASSIGN("glTexSubImage3DOES", texSubImage3D);
+        ASSIGN(glCompressedTexImage3DOES, compressedTexImage3D);
+        ASSIGN(glCompressedTexSubImage3DOES, compressedTexSubImage3D);
+        ASSIGN(glCopyTexSubImage3DOES, copyTexSubImage3D);
+        ASSIGN(glFramebufferTexture3DOES, framebufferTexture3D);
+        ASSIGN(glTexImage3DOES, texImage3D);
+        ASSIGN(glTexSubImage3DOES, texSubImage3D);
     }
 
     if (extensions.count("GL_OES_texture_border_clamp") != 0)
     {
-        ASSIGN("glGetSamplerParameterIivOES", getSamplerParameterIiv);
-        ASSIGN("glGetSamplerParameterIuivOES", getSamplerParameterIuiv);
-        ASSIGN("glGetTexParameterIivOES", getTexParameterIiv);
-        ASSIGN("glGetTexParameterIuivOES", getTexParameterIuiv);
-        ASSIGN("glSamplerParameterIivOES", samplerParameterIiv);
-        ASSIGN("glSamplerParameterIuivOES", samplerParameterIuiv);
-        ASSIGN("glTexParameterIivOES", texParameterIiv);
-        ASSIGN("glTexParameterIuivOES", texParameterIuiv);
+        ASSIGN(glGetSamplerParameterIivOES, getSamplerParameterIiv);
+        ASSIGN(glGetSamplerParameterIuivOES, getSamplerParameterIuiv);
+        ASSIGN(glGetTexParameterIivOES, getTexParameterIiv);
+        ASSIGN(glGetTexParameterIuivOES, getTexParameterIuiv);
+        ASSIGN(glSamplerParameterIivOES, samplerParameterIiv);
+        ASSIGN(glSamplerParameterIuivOES, samplerParameterIuiv);
+        ASSIGN(glTexParameterIivOES, texParameterIiv);
+        ASSIGN(glTexParameterIuivOES, texParameterIuiv);
     }
 
     if (extensions.count("GL_OES_texture_buffer") != 0)
     {
-        ASSIGN("glTexBufferOES", texBuffer);
-        ASSIGN("glTexBufferRangeOES", texBufferRange);
+        ASSIGN(glTexBufferOES, texBuffer);
+        ASSIGN(glTexBufferRangeOES, texBufferRange);
     }
 
     if (extensions.count("GL_OES_texture_storage_multisample_2d_array") != 0)
     {
-        ASSIGN("glTexStorage3DMultisampleOES", texStorage3DMultisample);
+        ASSIGN(glTexStorage3DMultisampleOES, texStorage3DMultisample);
     }
 
     if (extensions.count("GL_OES_texture_view") != 0)
     {
-        ASSIGN("glTextureViewOES", textureView);
+        ASSIGN(glTextureViewOES, textureView);
     }
 
     if (extensions.count("GL_OES_vertex_array_object") != 0)
     {
-        ASSIGN("glBindVertexArrayOES", bindVertexArray);
-        ASSIGN("glDeleteVertexArraysOES", deleteVertexArrays);
-        ASSIGN("glGenVertexArraysOES", genVertexArrays);
-        ASSIGN("glIsVertexArrayOES", isVertexArray);
+        ASSIGN(glBindVertexArrayOES, bindVertexArray);
+        ASSIGN(glDeleteVertexArraysOES, deleteVertexArrays);
+        ASSIGN(glGenVertexArraysOES, genVertexArrays);
+        ASSIGN(glIsVertexArrayOES, isVertexArray);
     }
 
     if (extensions.count("GL_OES_viewport_array") != 0)
     {
-        ASSIGN("glDisableiOES", disablei);
-        ASSIGN("glEnableiOES", enablei);
-        ASSIGN("glGetFloati_vOES", getFloati_v);
-        ASSIGN("glIsEnablediOES", isEnabledi);
-        ASSIGN("glScissorArrayvOES", scissorArrayv);
-        ASSIGN("glScissorIndexedOES", scissorIndexed);
-        ASSIGN("glScissorIndexedvOES", scissorIndexedv);
-        ASSIGN("glViewportArrayvOES", viewportArrayv);
-        ASSIGN("glViewportIndexedfOES", viewportIndexedf);
-        ASSIGN("glViewportIndexedfvOES", viewportIndexedfv);
+        ASSIGN(glDisableiOES, disablei);
+        ASSIGN(glEnableiOES, enablei);
+        ASSIGN(glGetFloati_vOES, getFloati_v);
+        ASSIGN(glIsEnablediOES, isEnabledi);
+        ASSIGN(glScissorArrayvOES, scissorArrayv);
+        ASSIGN(glScissorIndexedOES, scissorIndexed);
+        ASSIGN(glScissorIndexedvOES, scissorIndexedv);
+        ASSIGN(glViewportArrayvOES, viewportArrayv);
+        ASSIGN(glViewportIndexedfOES, viewportIndexedf);
+        ASSIGN(glViewportIndexedfvOES, viewportIndexedfv);
     }
 }
 
@@ -2628,138 +12160,138 @@ void DispatchTableGL::initProcsSharedExtensions(const std::set<std::string> &ext
 {
     if (extensions.count("GL_EXT_blend_minmax") != 0)
     {
-        ASSIGN("glBlendEquationEXT", blendEquation);
+        ASSIGN(glBlendEquationEXT, blendEquation);
     }
 
     if (extensions.count("GL_EXT_debug_label") != 0)
     {
-        ASSIGN("glGetObjectLabelEXT", getObjectLabel);
+        ASSIGN(glGetObjectLabelEXT, getObjectLabel);
     }
 
     if (extensions.count("GL_EXT_debug_marker") != 0)
     {
-        ASSIGN("glInsertEventMarkerEXT", insertEventMarkerEXT);
-        ASSIGN("glPopGroupMarkerEXT", popGroupMarkerEXT);
-        ASSIGN("glPushGroupMarkerEXT", pushGroupMarkerEXT);
+        ASSIGN(glInsertEventMarkerEXT, insertEventMarkerEXT);
+        ASSIGN(glPopGroupMarkerEXT, popGroupMarkerEXT);
+        ASSIGN(glPushGroupMarkerEXT, pushGroupMarkerEXT);
     }
 
     if (extensions.count("GL_EXT_draw_instanced") != 0)
     {
-        ASSIGN("glDrawArraysInstancedEXT", drawArraysInstanced);
-        ASSIGN("glDrawElementsInstancedEXT", drawElementsInstanced);
+        ASSIGN(glDrawArraysInstancedEXT, drawArraysInstanced);
+        ASSIGN(glDrawElementsInstancedEXT, drawElementsInstanced);
     }
 
     if (extensions.count("GL_EXT_multi_draw_arrays") != 0)
     {
-        ASSIGN("glMultiDrawArraysEXT", multiDrawArrays);
-        ASSIGN("glMultiDrawElementsEXT", multiDrawElements);
+        ASSIGN(glMultiDrawArraysEXT, multiDrawArrays);
+        ASSIGN(glMultiDrawElementsEXT, multiDrawElements);
     }
 
     if (extensions.count("GL_EXT_separate_shader_objects") != 0)
     {
-        ASSIGN("glActiveShaderProgramEXT", activeShaderProgram);
-        ASSIGN("glBindProgramPipelineEXT", bindProgramPipeline);
-        ASSIGN("glCreateShaderProgramvEXT", createShaderProgramv);
-        ASSIGN("glDeleteProgramPipelinesEXT", deleteProgramPipelines);
-        ASSIGN("glGenProgramPipelinesEXT", genProgramPipelines);
-        ASSIGN("glGetProgramPipelineInfoLogEXT", getProgramPipelineInfoLog);
-        ASSIGN("glGetProgramPipelineivEXT", getProgramPipelineiv);
-        ASSIGN("glIsProgramPipelineEXT", isProgramPipeline);
-        ASSIGN("glProgramParameteriEXT", programParameteri);
-        ASSIGN("glProgramUniform1fEXT", programUniform1f);
-        ASSIGN("glProgramUniform1fvEXT", programUniform1fv);
-        ASSIGN("glProgramUniform1iEXT", programUniform1i);
-        ASSIGN("glProgramUniform1ivEXT", programUniform1iv);
-        ASSIGN("glProgramUniform1uiEXT", programUniform1ui);
-        ASSIGN("glProgramUniform1uivEXT", programUniform1uiv);
-        ASSIGN("glProgramUniform2fEXT", programUniform2f);
-        ASSIGN("glProgramUniform2fvEXT", programUniform2fv);
-        ASSIGN("glProgramUniform2iEXT", programUniform2i);
-        ASSIGN("glProgramUniform2ivEXT", programUniform2iv);
-        ASSIGN("glProgramUniform2uiEXT", programUniform2ui);
-        ASSIGN("glProgramUniform2uivEXT", programUniform2uiv);
-        ASSIGN("glProgramUniform3fEXT", programUniform3f);
-        ASSIGN("glProgramUniform3fvEXT", programUniform3fv);
-        ASSIGN("glProgramUniform3iEXT", programUniform3i);
-        ASSIGN("glProgramUniform3ivEXT", programUniform3iv);
-        ASSIGN("glProgramUniform3uiEXT", programUniform3ui);
-        ASSIGN("glProgramUniform3uivEXT", programUniform3uiv);
-        ASSIGN("glProgramUniform4fEXT", programUniform4f);
-        ASSIGN("glProgramUniform4fvEXT", programUniform4fv);
-        ASSIGN("glProgramUniform4iEXT", programUniform4i);
-        ASSIGN("glProgramUniform4ivEXT", programUniform4iv);
-        ASSIGN("glProgramUniform4uiEXT", programUniform4ui);
-        ASSIGN("glProgramUniform4uivEXT", programUniform4uiv);
-        ASSIGN("glProgramUniformMatrix2fvEXT", programUniformMatrix2fv);
-        ASSIGN("glProgramUniformMatrix2x3fvEXT", programUniformMatrix2x3fv);
-        ASSIGN("glProgramUniformMatrix2x4fvEXT", programUniformMatrix2x4fv);
-        ASSIGN("glProgramUniformMatrix3fvEXT", programUniformMatrix3fv);
-        ASSIGN("glProgramUniformMatrix3x2fvEXT", programUniformMatrix3x2fv);
-        ASSIGN("glProgramUniformMatrix3x4fvEXT", programUniformMatrix3x4fv);
-        ASSIGN("glProgramUniformMatrix4fvEXT", programUniformMatrix4fv);
-        ASSIGN("glProgramUniformMatrix4fvEXT", programUniformMatrix4fv);
-        ASSIGN("glProgramUniformMatrix4x2fvEXT", programUniformMatrix4x2fv);
-        ASSIGN("glProgramUniformMatrix4x3fvEXT", programUniformMatrix4x3fv);
-        ASSIGN("glUseProgramStagesEXT", useProgramStages);
-        ASSIGN("glValidateProgramPipelineEXT", validateProgramPipeline);
+        ASSIGN(glActiveShaderProgramEXT, activeShaderProgram);
+        ASSIGN(glBindProgramPipelineEXT, bindProgramPipeline);
+        ASSIGN(glCreateShaderProgramvEXT, createShaderProgramv);
+        ASSIGN(glDeleteProgramPipelinesEXT, deleteProgramPipelines);
+        ASSIGN(glGenProgramPipelinesEXT, genProgramPipelines);
+        ASSIGN(glGetProgramPipelineInfoLogEXT, getProgramPipelineInfoLog);
+        ASSIGN(glGetProgramPipelineivEXT, getProgramPipelineiv);
+        ASSIGN(glIsProgramPipelineEXT, isProgramPipeline);
+        ASSIGN(glProgramParameteriEXT, programParameteri);
+        ASSIGN(glProgramUniform1fEXT, programUniform1f);
+        ASSIGN(glProgramUniform1fvEXT, programUniform1fv);
+        ASSIGN(glProgramUniform1iEXT, programUniform1i);
+        ASSIGN(glProgramUniform1ivEXT, programUniform1iv);
+        ASSIGN(glProgramUniform1uiEXT, programUniform1ui);
+        ASSIGN(glProgramUniform1uivEXT, programUniform1uiv);
+        ASSIGN(glProgramUniform2fEXT, programUniform2f);
+        ASSIGN(glProgramUniform2fvEXT, programUniform2fv);
+        ASSIGN(glProgramUniform2iEXT, programUniform2i);
+        ASSIGN(glProgramUniform2ivEXT, programUniform2iv);
+        ASSIGN(glProgramUniform2uiEXT, programUniform2ui);
+        ASSIGN(glProgramUniform2uivEXT, programUniform2uiv);
+        ASSIGN(glProgramUniform3fEXT, programUniform3f);
+        ASSIGN(glProgramUniform3fvEXT, programUniform3fv);
+        ASSIGN(glProgramUniform3iEXT, programUniform3i);
+        ASSIGN(glProgramUniform3ivEXT, programUniform3iv);
+        ASSIGN(glProgramUniform3uiEXT, programUniform3ui);
+        ASSIGN(glProgramUniform3uivEXT, programUniform3uiv);
+        ASSIGN(glProgramUniform4fEXT, programUniform4f);
+        ASSIGN(glProgramUniform4fvEXT, programUniform4fv);
+        ASSIGN(glProgramUniform4iEXT, programUniform4i);
+        ASSIGN(glProgramUniform4ivEXT, programUniform4iv);
+        ASSIGN(glProgramUniform4uiEXT, programUniform4ui);
+        ASSIGN(glProgramUniform4uivEXT, programUniform4uiv);
+        ASSIGN(glProgramUniformMatrix2fvEXT, programUniformMatrix2fv);
+        ASSIGN(glProgramUniformMatrix2x3fvEXT, programUniformMatrix2x3fv);
+        ASSIGN(glProgramUniformMatrix2x4fvEXT, programUniformMatrix2x4fv);
+        ASSIGN(glProgramUniformMatrix3fvEXT, programUniformMatrix3fv);
+        ASSIGN(glProgramUniformMatrix3x2fvEXT, programUniformMatrix3x2fv);
+        ASSIGN(glProgramUniformMatrix3x4fvEXT, programUniformMatrix3x4fv);
+        ASSIGN(glProgramUniformMatrix4fvEXT, programUniformMatrix4fv);
+        ASSIGN(glProgramUniformMatrix4fvEXT, programUniformMatrix4fv);
+        ASSIGN(glProgramUniformMatrix4x2fvEXT, programUniformMatrix4x2fv);
+        ASSIGN(glProgramUniformMatrix4x3fvEXT, programUniformMatrix4x3fv);
+        ASSIGN(glUseProgramStagesEXT, useProgramStages);
+        ASSIGN(glValidateProgramPipelineEXT, validateProgramPipeline);
     }
 
     if (extensions.count("GL_KHR_parallel_shader_compile") != 0)
     {
-        ASSIGN("glMaxShaderCompilerThreadsKHR", maxShaderCompilerThreadsKHR);
+        ASSIGN(glMaxShaderCompilerThreadsKHR, maxShaderCompilerThreadsKHR);
     }
 
     if (extensions.count("GL_NV_fence") != 0)
     {
-        ASSIGN("glDeleteFencesNV", deleteFencesNV);
-        ASSIGN("glFinishFenceNV", finishFenceNV);
-        ASSIGN("glGenFencesNV", genFencesNV);
-        ASSIGN("glGetFenceivNV", getFenceivNV);
-        ASSIGN("glIsFenceNV", isFenceNV);
-        ASSIGN("glSetFenceNV", setFenceNV);
-        ASSIGN("glTestFenceNV", testFenceNV);
+        ASSIGN(glDeleteFencesNV, deleteFencesNV);
+        ASSIGN(glFinishFenceNV, finishFenceNV);
+        ASSIGN(glGenFencesNV, genFencesNV);
+        ASSIGN(glGetFenceivNV, getFenceivNV);
+        ASSIGN(glIsFenceNV, isFenceNV);
+        ASSIGN(glSetFenceNV, setFenceNV);
+        ASSIGN(glTestFenceNV, testFenceNV);
     }
 
     if (extensions.count("GL_NV_framebuffer_mixed_samples") != 0)
     {
-        ASSIGN("glCoverageModulationNV", coverageModulationNV);
+        ASSIGN(glCoverageModulationNV, coverageModulationNV);
     }
 
     if (extensions.count("GL_NV_internalformat_sample_query") != 0)
     {
-        ASSIGN("glGetInternalformatSampleivNV", getInternalformatSampleivNV);
+        ASSIGN(glGetInternalformatSampleivNV, getInternalformatSampleivNV);
     }
 
     if (extensions.count("GL_NV_path_rendering") != 0)
     {
-        ASSIGN("glCoverFillPathInstancedNV", coverFillPathInstancedNV);
-        ASSIGN("glCoverFillPathNV", coverFillPathNV);
-        ASSIGN("glCoverStrokePathInstancedNV", coverStrokePathInstancedNV);
-        ASSIGN("glCoverStrokePathNV", coverStrokePathNV);
-        ASSIGN("glDeletePathsNV", deletePathsNV);
-        ASSIGN("glGenPathsNV", genPathsNV);
-        ASSIGN("glGetPathParameterfvNV", getPathParameterfvNV);
-        ASSIGN("glGetPathParameterivNV", getPathParameterivNV);
-        ASSIGN("glIsPathNV", isPathNV);
-        ASSIGN("glMatrixLoadfEXT", matrixLoadfEXT);
-        ASSIGN("glPathCommandsNV", pathCommandsNV);
-        ASSIGN("glPathParameterfNV", pathParameterfNV);
-        ASSIGN("glPathParameteriNV", pathParameteriNV);
-        ASSIGN("glPathStencilFuncNV", pathStencilFuncNV);
-        ASSIGN("glProgramPathFragmentInputGenNV", programPathFragmentInputGenNV);
-        ASSIGN("glStencilFillPathInstancedNV", stencilFillPathInstancedNV);
-        ASSIGN("glStencilFillPathNV", stencilFillPathNV);
-        ASSIGN("glStencilStrokePathInstancedNV", stencilStrokePathInstancedNV);
-        ASSIGN("glStencilStrokePathNV", stencilStrokePathNV);
-        ASSIGN("glStencilThenCoverFillPathInstancedNV", stencilThenCoverFillPathInstancedNV);
-        ASSIGN("glStencilThenCoverFillPathNV", stencilThenCoverFillPathNV);
-        ASSIGN("glStencilThenCoverStrokePathInstancedNV", stencilThenCoverStrokePathInstancedNV);
-        ASSIGN("glStencilThenCoverStrokePathNV", stencilThenCoverStrokePathNV);
+        ASSIGN(glCoverFillPathInstancedNV, coverFillPathInstancedNV);
+        ASSIGN(glCoverFillPathNV, coverFillPathNV);
+        ASSIGN(glCoverStrokePathInstancedNV, coverStrokePathInstancedNV);
+        ASSIGN(glCoverStrokePathNV, coverStrokePathNV);
+        ASSIGN(glDeletePathsNV, deletePathsNV);
+        ASSIGN(glGenPathsNV, genPathsNV);
+        ASSIGN(glGetPathParameterfvNV, getPathParameterfvNV);
+        ASSIGN(glGetPathParameterivNV, getPathParameterivNV);
+        ASSIGN(glIsPathNV, isPathNV);
+        ASSIGN(glMatrixLoadfEXT, matrixLoadfEXT);
+        ASSIGN(glPathCommandsNV, pathCommandsNV);
+        ASSIGN(glPathParameterfNV, pathParameterfNV);
+        ASSIGN(glPathParameteriNV, pathParameteriNV);
+        ASSIGN(glPathStencilFuncNV, pathStencilFuncNV);
+        ASSIGN(glProgramPathFragmentInputGenNV, programPathFragmentInputGenNV);
+        ASSIGN(glStencilFillPathInstancedNV, stencilFillPathInstancedNV);
+        ASSIGN(glStencilFillPathNV, stencilFillPathNV);
+        ASSIGN(glStencilStrokePathInstancedNV, stencilStrokePathInstancedNV);
+        ASSIGN(glStencilStrokePathNV, stencilStrokePathNV);
+        ASSIGN(glStencilThenCoverFillPathInstancedNV, stencilThenCoverFillPathInstancedNV);
+        ASSIGN(glStencilThenCoverFillPathNV, stencilThenCoverFillPathNV);
+        ASSIGN(glStencilThenCoverStrokePathInstancedNV, stencilThenCoverStrokePathInstancedNV);
+        ASSIGN(glStencilThenCoverStrokePathNV, stencilThenCoverStrokePathNV);
     }
 
     if (extensions.count("GL_OVR_multiview") != 0)
     {
-        ASSIGN("glFramebufferTextureMultiviewOVR", framebufferTextureMultiviewOVR);
+        ASSIGN(glFramebufferTextureMultiviewOVR, framebufferTextureMultiviewOVR);
     }
 }
 
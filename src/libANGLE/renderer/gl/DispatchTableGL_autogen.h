@@ -14,7 +14,10 @@
 #include "common/angleutils.h"
 #include "libANGLE/renderer/gl/functionsgl_typedefs.h"
 
+#include <array>
+#include <cstdint>
 #include <set>
+#include <vector>
 
 namespace gl
 {
@@ -781,21 +784,73 @@ class DispatchTableGL : angle::NonCopyable
     // clang-format on
 
     DispatchTableGL();
-    virtual ~DispatchTableGL() = default;
+    virtual ~DispatchTableGL();
+
+    // The loaded functions of a table, in the order of their names.
+    static constexpr size_t kProcCount = 696;
+    using Procs                        = std::array<void *, kProcCount>;
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    // Called by the lazy entry point of the function at index, in the order of their names, to
+    // load the function on its first call.
+    static void *LoadLazyProc(size_t index);
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
 
   protected:
     virtual void *loadProcAddress(const std::string &function) const = 0;
 
+    // Loads the function of each name into procs. The back-ends override it to resolve all the
+    // names through their library handle, without building a std::string for each.
+    virtual void loadProcAddresses(const char *const *names, size_t count, void **procs) const;
+
+    // Request the functions of the version and extensions. loadRequestedProcs loads them.
     void initProcsDesktopGL(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsGLES(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsSharedExtensions(const std::set<std::string> &extensions);
 
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    // Lets the lazy entry points load their functions through this table, unless they already
+    // load them from another driver. Returns whether they do. Tables without a driver are never
+    // loaded lazily.
+    bool addLazyTable(const void *driver);
+
+    // Points the requested functions of the version at lazy entry points, which load them on
+    // their first call.
+    void installLazyProcs();
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
+    // Loads the requested functions that are still null, all at once.
+    void loadRequestedProcs();
+
+    // Copy the loaded functions to or from procs, so that tables that load the same driver can
+    // share them.
+    void saveProcs(Procs *procs) const;
+    void restoreProcs(const Procs &procs);
+
 #if defined(ANGLE_ENABLE_OPENGL_NULL)
     void initProcsDesktopGLNULL(const gl::Version &version,
                                 const std::set<std::string> &extensions);
     void initProcsGLESNULL(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsSharedExtensionsNULL(const std::set<std::string> &extensions);
 #endif  // defined(ANGLE_ENABLE_OPENGL_NULL)
+
+  private:
+    // Indexes the generated table of the names that the functions are loaded from.
+    enum class ProcName : uint16_t;
+
+    struct RequestedProc
+    {
+        void **proc;
+        ProcName name;
+        // Whether the version requires the function. Only these are loaded lazily, so that the
+        // extension functions the driver doesn't export stay null.
+        bool core;
+    };
+
+    void requestProc(ProcName name, void **proc, bool core);
+
+    // In the order they were requested.
+    std::vector<RequestedProc> mRequestedProcs;
 };
 
 }  // namespace rx
@@ -9,9 +9,14 @@
 #include "libANGLE/renderer/gl/FunctionsGL.h"
 
 #include <algorithm>
+#include <functional>
+#include <map>
+#include <mutex>
+#include <tuple>
 
 #include "common/string_utils.h"
 #include "libANGLE/AttributeMap.h"
+#include "libANGLE/histogram_macros.h"
 #include "libANGLE/renderer/gl/renderergl_utils.h"
 
 namespace rx
@@ -93,6 +98,50 @@ static void INTERNAL_GL_APIENTRY DummyGetShaderiv(GLuint program, GLenum pname,
 }
 #endif  // defined(ANGLE_ENABLE_OPENGL_NULL)
 
+namespace
+{
+// Identifies the functions loaded by a table. Tables with the same key load the same functions.
+struct SharedProcsKey
+{
+    bool operator<(const SharedProcsKey &other) const
+    {
+        return std::tie(driver, extensionsHash, standard, version, vendor, renderer, extensions) <
+               std::tie(other.driver, other.extensionsHash, other.standard, other.version,
+                        other.vendor, other.renderer, other.extensions);
+    }
+
+    const void *driver    = nullptr;
+    size_t extensionsHash = 0;
+    StandardGL standard   = STANDARD_GL_DESKTOP;
+    gl::Version version;
+    std::string vendor;
+    std::string renderer;
+    std::vector<std::string> extensions;
+};
+
+// The tables only keep a weak reference, the snapshot is freed when the last table that uses it
+// is.
+using SharedProcsMap = std::map<SharedProcsKey, std::weak_ptr<const DispatchTableGL::Procs>>;
+
+std::string GetString(PFNGLGETSTRINGPROC getStringFunction, GLenum name)
+{
+    const char *value = reinterpret_cast<const char *>(getStringFunction(name));
+    return value ? value : "";
+}
+
+std::mutex &GetSharedProcsMutex()
+{
+    static std::mutex mutex;
+    return mutex;
+}
+
+SharedProcsMap &GetSharedProcs()
+{
+    static SharedProcsMap *sharedProcs = new SharedProcsMap;
+    return *sharedProcs;
+}
+}  // anonymous namespace
+
 #define ASSIGN(NAME, FP) *reinterpret_cast<void **>(&FP) = loadProcAddress(NAME)
 
 FunctionsGL::FunctionsGL() : version(), standard(), extensions() {}
@@ -130,6 +179,7 @@ void FunctionsGL::initialize(const egl::AttributeMap &displayAttributes)
     // version.
 
     // Load the entry points
+    SCOPED_ANGLE_HISTOGRAM_TIMER("GPU.ANGLE.FunctionsGLLoadProcsMS");
 
 #if defined(ANGLE_ENABLE_OPENGL_NULL)
     EGLint deviceType =
@@ -146,17 +196,6 @@ void FunctionsGL::initialize(const egl::AttributeMap &displayAttributes)
             {
                 getIntegerv(GL_CONTEXT_PROFILE_MASK, &profile);
             }
-
-#if defined(ANGLE_ENABLE_OPENGL_NULL)
-            if (deviceType == EGL_PLATFORM_ANGLE_DEVICE_TYPE_NULL_ANGLE)
-            {
-                initProcsDesktopGLNULL(version, extensionSet);
-            }
-            else
-#endif  // defined(ANGLE_ENABLE_GL_NULL)
-            {
-                initProcsDesktopGL(version, extensionSet);
-            }
             break;
         }
 
@@ -164,17 +203,6 @@ void FunctionsGL::initialize(const egl::AttributeMap &displayAttributes)
         {
             // No profiles in GLES
             profile = 0;
-
-#if defined(ANGLE_ENABLE_OPENGL_NULL)
-            if (deviceType == EGL_PLATFORM_ANGLE_DEVICE_TYPE_NULL_ANGLE)
-            {
-                initProcsGLESNULL(version, extensionSet);
-            }
-            else
-#endif  // defined(ANGLE_ENABLE_GL_NULL)
-            {
-                initProcsGLES(version, extensionSet);
-            }
             break;
         }
 
@@ -186,14 +214,100 @@ void FunctionsGL::initialize(const egl::AttributeMap &displayAttributes)
 #if defined(ANGLE_ENABLE_OPENGL_NULL)
     if (deviceType == EGL_PLATFORM_ANGLE_DEVICE_TYPE_NULL_ANGLE)
     {
+        if (standard == STANDARD_GL_DESKTOP)
+        {
+            initProcsDesktopGLNULL(version, extensionSet);
+        }
+        else
+        {
+            initProcsGLESNULL(version, extensionSet);
+        }
         initProcsSharedExtensionsNULL(extensionSet);
         initializeDummyFunctionsForNULLDriver(extensionSet);
     }
     else
 #endif  // defined(ANGLE_ENABLE_OPENGL_NULL)
     {
-        initProcsSharedExtensions(extensionSet);
+        initializeProcs(extensionSet);
+    }
+}
+
+void FunctionsGL::initializeProcs(const std::set<std::string> &extensionSet)
+{
+    const void *driver = getDriverHandle();
+
+    SharedProcsKey key;
+    if (driver)
+    {
+        key.driver   = driver;
+        key.standard = standard;
+        key.version  = version;
+        key.vendor   = GetString(getString, GL_VENDOR);
+        key.renderer = GetString(getString, GL_RENDERER);
+        key.extensions.assign(extensionSet.begin(), extensionSet.end());
+        for (const std::string &extension : key.extensions)
+        {
+            key.extensionsHash = key.extensionsHash * 31 + std::hash<std::string>()(extension);
+        }
     }
+
+    // Hold the lock while loading, so the displays that start together load the driver once.
+    std::lock_guard<std::mutex> lock(GetSharedProcsMutex());
+    SharedProcsMap &sharedProcs = GetSharedProcs();
+    if (driver)
+    {
+        auto iter = sharedProcs.find(key);
+        if (iter != sharedProcs.end())
+        {
+            mSharedProcs = iter->second.lock();
+            if (mSharedProcs)
+            {
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+                // The shared functions may point at lazy entry points, which can then load through
+                // this table too.
+                addLazyTable(driver);
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+                restoreProcs(*mSharedProcs);
+                return;
+            }
+        }
+    }
+
+    if (standard == STANDARD_GL_DESKTOP)
+    {
+        initProcsDesktopGL(version, extensionSet);
+    }
+    else
+    {
+        initProcsGLES(version, extensionSet);
+    }
+    initProcsSharedExtensions(extensionSet);
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    if (addLazyTable(driver))
+    {
+        installLazyProcs();
+    }
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+    loadRequestedProcs();
+
+    if (driver)
+    {
+        // Forget the snapshots that no table uses anymore.
+        for (auto iter = sharedProcs.begin(); iter != sharedProcs.end();)
+        {
+            iter = iter->second.expired() ? sharedProcs.erase(iter) : std::next(iter);
+        }
+
+        std::shared_ptr<Procs> procs = std::make_shared<Procs>();
+        saveProcs(procs.get());
+        mSharedProcs     = procs;
+        sharedProcs[key] = procs;
+    }
+}
+
+const void *FunctionsGL::getDriverHandle() const
+{
+    return nullptr;
 }
 
 bool FunctionsGL::isAtLeastGL(const gl::Version &glVersion) const
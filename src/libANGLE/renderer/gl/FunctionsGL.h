@@ -9,6 +9,8 @@
 #ifndef LIBANGLE_RENDERER_GL_FUNCTIONSGL_H_
 #define LIBANGLE_RENDERER_GL_FUNCTIONSGL_H_
 
+#include <memory>
+
 #include "common/debug.h"
 #include "libANGLE/Version.h"
 #include "libANGLE/renderer/gl/DispatchTableGL_autogen.h"
@@ -52,9 +54,17 @@ class FunctionsGL : public DispatchTableGL
     bool hasGLExtension(const std::string &ext) const;
     bool hasGLESExtension(const std::string &ext) const;
 
+  protected:
+    // Identifies the native library the functions are loaded from. The tables of the same library,
+    // version and extensions share the functions they load. Returns nullptr to not share them.
+    virtual const void *getDriverHandle() const;
+
   private:
     void *loadProcAddress(const std::string &function) const override = 0;
+    void initializeProcs(const std::set<std::string> &extensionSet);
     void initializeDummyFunctionsForNULLDriver(const std::set<std::string> &extensionSet);
+
+    std::shared_ptr<const Procs> mSharedProcs;
 };
 
 }  // namespace rx
@@ -41,11 +41,21 @@ class FunctionsGLCGL : public FunctionsGL
     ~FunctionsGLCGL() override { dlclose(mDylibHandle); }
 
   private:
+    const void *getDriverHandle() const override { return mDylibHandle; }
+
     void *loadProcAddress(const std::string &function) const override
     {
         return dlsym(mDylibHandle, function.c_str());
     }
 
+    void loadProcAddresses(const char *const *names, size_t count, void **procs) const override
+    {
+        for (size_t index = 0; index < count; ++index)
+        {
+            procs[index] = dlsym(mDylibHandle, names[index]);
+        }
+    }
+
     void *mDylibHandle;
 };
 
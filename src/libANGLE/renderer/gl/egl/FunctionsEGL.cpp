@@ -269,11 +269,25 @@ class FunctionsGLEGL : public FunctionsGL
     ~FunctionsGLEGL() override {}
 
   private:
+    const void *getDriverHandle() const override
+    {
+        // The address of eglGetProcAddress identifies the native EGL library.
+        return mEGL.getProcAddress("eglGetProcAddress");
+    }
+
     void *loadProcAddress(const std::string &function) const override
     {
         return mEGL.getProcAddress(function.c_str());
     }
 
+    void loadProcAddresses(const char *const *names, size_t count, void **procs) const override
+    {
+        for (size_t index = 0; index < count; ++index)
+        {
+            procs[index] = mEGL.getProcAddress(names[index]);
+        }
+    }
+
     const FunctionsEGL &mEGL;
 };
 
@@ -41,7 +41,10 @@ dispatch_table_header_template = """// GENERATED FILE - DO NOT EDIT.
 #include "common/angleutils.h"
 #include "libANGLE/renderer/gl/functionsgl_typedefs.h"
 
+#include <array>
+#include <cstdint>
 #include <set>
+#include <vector>
 
 namespace gl
 {{
@@ -58,20 +61,72 @@ class DispatchTableGL : angle::NonCopyable
   // clang-format on
 
   DispatchTableGL();
-  virtual ~DispatchTableGL() = default;
+  virtual ~DispatchTableGL();
+
+    // The loaded functions of a table, in the order of their names.
+    static constexpr size_t kProcCount = {proc_count};
+    using Procs = std::array<void *, kProcCount>;
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    // Called by the lazy entry point of the function at index, in the order of their names, to
+    // load the function on its first call.
+    static void *LoadLazyProc(size_t index);
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
 
   protected:
     virtual void *loadProcAddress(const std::string &function) const = 0;
 
+    // Loads the function of each name into procs. The back-ends override it to resolve all the
+    // names through their library handle, without building a std::string for each.
+    virtual void loadProcAddresses(const char *const *names, size_t count, void **procs) const;
+
+    // Request the functions of the version and extensions. loadRequestedProcs loads them.
     void initProcsDesktopGL(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsGLES(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsSharedExtensions(const std::set<std::string> &extensions);
 
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    // Lets the lazy entry points load their functions through this table, unless they already
+    // load them from another driver. Returns whether they do. Tables without a driver are never
+    // loaded lazily.
+    bool addLazyTable(const void *driver);
+
+    // Points the requested functions of the version at lazy entry points, which load them on
+    // their first call.
+    void installLazyProcs();
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
+    // Loads the requested functions that are still null, all at once.
+    void loadRequestedProcs();
+
+    // Copy the loaded functions to or from procs, so that tables that load the same driver can
+    // share them.
+    void saveProcs(Procs *procs) const;
+    void restoreProcs(const Procs &procs);
+
 #if defined(ANGLE_ENABLE_OPENGL_NULL)
     void initProcsDesktopGLNULL(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsGLESNULL(const gl::Version &version, const std::set<std::string> &extensions);
     void initProcsSharedExtensionsNULL(const std::set<std::string> &extensions);
 #endif  // defined(ANGLE_ENABLE_OPENGL_NULL)
+
+  private:
+    // Indexes the generated table of the names that the functions are loaded from.
+    enum class ProcName : uint16_t;
+
+    struct RequestedProc
+    {{
+        void **proc;
+        ProcName name;
+        // Whether the version requires the function. Only these are loaded lazily, so that the
+        // extension functions the driver doesn't export stay null.
+        bool core;
+    }};
+
+    void requestProc(ProcName name, void **proc, bool core);
+
+    // In the order they were requested.
+    std::vector<RequestedProc> mRequestedProcs;
 }};
 
 }}  // namespace rx
@@ -98,6 +153,7 @@ dispatch_table_source_template = """// GENERATED FILE - DO NOT EDIT.
 
 #include "libANGLE/renderer/gl/DispatchTableGL_autogen.h"
 
+#include "common/debug.h"
 #include "libANGLE/Version.h"
 #include "libANGLE/renderer/gl/FunctionsGL.h"
 
@@ -105,13 +161,230 @@ dispatch_table_source_template = """// GENERATED FILE - DO NOT EDIT.
 #include "libANGLE/renderer/gl/null_functions.h"
 #endif  // defined(ANGLE_ENABLE_OPENGL_NULL)
 
-// Check for nullptr so extensions do not overwrite core imports.
-#define ASSIGN(NAME, FP) if (!FP) *reinterpret_cast<void **>(&FP) = loadProcAddress(NAME)
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+#include <algorithm>
+#include <atomic>
+#include <bitset>
+#include <mutex>
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
+// The names requested later are only loaded when the earlier ones aren't found, so extensions do
+// not overwrite core imports.
+#define ASSIGN(NAME, FP) requestProc(ProcName::NAME, reinterpret_cast<void **>(&FP), false)
+#define ASSIGN_CORE(NAME, FP) requestProc(ProcName::NAME, reinterpret_cast<void **>(&FP), true)
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+// Keep the functions that FunctionsGL loaded itself.
+#define INSTALL_LAZY(INDEX, FP, LAZY) if (core[INDEX] && !FP) FP = &LAZY
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
+#define SAVE_PROC(INDEX, FP) (*procs)[INDEX] = reinterpret_cast<void *>(FP)
+
+#define RESTORE_PROC(INDEX, FP) FP = reinterpret_cast<decltype(FP)>(procs[INDEX])
 
 namespace rx
 {{
+enum class DispatchTableGL::ProcName : uint16_t
+{{
+{proc_name_enums}
+}};
+
+namespace
+{{
+// The names of the functions, indexed by ProcName. The first kProcCount are the names of the
+// table's functions, in the order of their indices.
+constexpr const char *kProcNames[] = {{
+{proc_names}
+}};
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+// The driver that the lazy entry points load from, if any table points at them. Only the tables
+// of one driver at a time are loaded lazily, the others load their functions up front.
+const void *gLazyDriver = nullptr;
+
+// The functions loaded by the lazy entry points, by index. Worker threads read the entries of the
+// tables without synchronization, so the tables keep pointing at the lazy entry points, and every
+// call to a lazily loaded function goes through its lazy entry point.
+std::atomic<void *> gLazyProcs[DispatchTableGL::kProcCount];
+
+std::mutex &GetLazyTableMutex()
+{{
+    static std::mutex mutex;
+    return mutex;
+}}
+
+// The tables of gLazyDriver, through which the lazy entry points load their functions.
+std::vector<DispatchTableGL *> &GetLazyTables()
+{{
+    static std::vector<DispatchTableGL *> *lazyTables = new std::vector<DispatchTableGL *>;
+    return *lazyTables;
+}}
+
+template <typename ProcT, size_t Index>
+ProcT LoadLazy()
+{{
+    void *proc = gLazyProcs[Index].load(std::memory_order_acquire);
+    if (!proc)
+    {{
+        proc = DispatchTableGL::LoadLazyProc(Index);
+    }}
+    return reinterpret_cast<ProcT>(proc);
+}}
+
+{lazy_functions}
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+}}  // anonymous namespace
+
 DispatchTableGL::DispatchTableGL() = default;
 
+DispatchTableGL::~DispatchTableGL()
+{{
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+    std::lock_guard<std::mutex> lock(GetLazyTableMutex());
+    std::vector<DispatchTableGL *> &lazyTables = GetLazyTables();
+    auto iter = std::find(lazyTables.begin(), lazyTables.end(), this);
+    if (iter == lazyTables.end())
+    {{
+        return;
+    }}
+
+    lazyTables.erase(iter);
+    if (lazyTables.empty())
+    {{
+        // No table points at the lazy entry points anymore, so they can load from another driver.
+        gLazyDriver = nullptr;
+        for (std::atomic<void *> &proc : gLazyProcs)
+        {{
+            proc.store(nullptr, std::memory_order_relaxed);
+        }}
+    }}
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+}}
+
+void DispatchTableGL::loadProcAddresses(const char *const *names, size_t count, void **procs) const
+{{
+    for (size_t index = 0; index < count; ++index)
+    {{
+        procs[index] = loadProcAddress(names[index]);
+    }}
+}}
+
+void DispatchTableGL::requestProc(ProcName name, void **proc, bool core)
+{{
+    mRequestedProcs.push_back({{proc, name, core}});
+}}
+
+void DispatchTableGL::loadRequestedProcs()
+{{
+    // Load the first name requested for each function in one go.
+    std::vector<const char *> names;
+    std::vector<void **> procs;
+    std::vector<bool> loaded(mRequestedProcs.size(), false);
+    std::set<void **> requested;
+    for (size_t index = 0; index < mRequestedProcs.size(); ++index)
+    {{
+        const RequestedProc &request = mRequestedProcs[index];
+        if (!*request.proc && requested.insert(request.proc).second)
+        {{
+            names.push_back(kProcNames[static_cast<size_t>(request.name)]);
+            procs.push_back(request.proc);
+            loaded[index] = true;
+        }}
+    }}
+
+    std::vector<void *> results(names.size());
+    loadProcAddresses(names.data(), names.size(), results.data());
+    for (size_t index = 0; index < procs.size(); ++index)
+    {{
+        *procs[index] = results[index];
+    }}
+
+    // The driver didn't export some of the functions under their first name, try the others.
+    for (size_t index = 0; index < mRequestedProcs.size(); ++index)
+    {{
+        const RequestedProc &request = mRequestedProcs[index];
+        if (!*request.proc && !loaded[index])
+        {{
+            *request.proc = loadProcAddress(kProcNames[static_cast<size_t>(request.name)]);
+        }}
+    }}
+
+    mRequestedProcs.clear();
+    mRequestedProcs.shrink_to_fit();
+}}
+
+void DispatchTableGL::saveProcs(Procs *procs) const
+{{
+{save_procs}
+}}
+
+void DispatchTableGL::restoreProcs(const Procs &procs)
+{{
+{restore_procs}
+}}
+
+#if defined(ANGLE_GL_LAZY_DISPATCH)
+void *DispatchTableGL::LoadLazyProc(size_t index)
+{{
+    std::lock_guard<std::mutex> lock(GetLazyTableMutex());
+    void *proc = gLazyProcs[index].load(std::memory_order_relaxed);
+    if (proc)
+    {{
+        // Another thread loaded it first.
+        return proc;
+    }}
+
+    const std::vector<DispatchTableGL *> &lazyTables = GetLazyTables();
+    if (lazyTables.empty())
+    {{
+        ERR() << "GL function called after its dispatch table was destroyed.";
+        ANGLE_CRASH();
+    }}
+
+    // The version requires the function under its core name, and the tables of the driver all
+    // load the same function for it.
+    const char *name = kProcNames[index];
+    proc             = lazyTables.front()->loadProcAddress(name);
+    if (!proc)
+    {{
+        ERR() << "Could not load " << name << ", which the GL version requires.";
+        ANGLE_CRASH();
+    }}
+
+    gLazyProcs[index].store(proc, std::memory_order_release);
+    return proc;
+}}
+
+bool DispatchTableGL::addLazyTable(const void *driver)
+{{
+    std::lock_guard<std::mutex> lock(GetLazyTableMutex());
+    if (!driver || (gLazyDriver && gLazyDriver != driver))
+    {{
+        return false;
+    }}
+
+    gLazyDriver = driver;
+    GetLazyTables().push_back(this);
+    return true;
+}}
+
+void DispatchTableGL::installLazyProcs()
+{{
+    // The version requests each of its functions under the name whose ProcName is the index of
+    // the function.
+    std::bitset<kProcCount> core;
+    for (const RequestedProc &request : mRequestedProcs)
+    {{
+        if (request.core)
+        {{
+            core.set(static_cast<size_t>(request.name));
+        }}
+    }}
+
+{lazy_installs}
+}}
+#endif  // defined(ANGLE_GL_LAZY_DISPATCH)
+
 void DispatchTableGL::initProcsDesktopGL(const gl::Version &version, const std::set<std::string> &extensions)
 {{
 {gl_data}
@@ -155,13 +428,13 @@ void DispatchTableGL::initProcsSharedExtensionsNULL(const std::set<std::string>
 }}  // namespace rx
 """
 
-def format_assign_ep(entry_point, ep):
-    return '        ASSIGN("' + ep + '", ' + first_lower(entry_point[2:]) + ');'
+def format_assign_ep(entry_point, ep, macro = 'ASSIGN'):
+    return '        ' + macro + '(' + ep + ', ' + first_lower(entry_point[2:]) + ');'
 
 def format_requirements_lines(required, entry_points):
     major, minor = required
     lines = ['    if (version >= gl::Version(' + major + ', ' + minor + '))', '    {']
-    lines += [format_assign_ep(entry_point, entry_point) for entry_point in sorted(entry_points)]
+    lines += [format_assign_ep(entry_point, entry_point, 'ASSIGN_CORE') for entry_point in sorted(entry_points)]
     lines += ['    }']
     return '\n'.join(lines)
 
@@ -172,7 +445,7 @@ def format_extension_requirements_lines(extension, entry_points, api):
     return '\n'.join(lines)
 
 def assign_null_line(line):
-    m = re.match(r'        ASSIGN\("gl.*", (.+)\);', line)
+    m = re.match(r'        ASSIGN(?:_CORE)?\(gl\w+, (.+)\);', line)
     if m:
         name = m.group(1)
         return '        ' + name + ' = &gl' + name[0].upper() + name[1:] + 'NULL;'
@@ -188,6 +461,12 @@ def nullify(data):
 def format_param(param):
     return "".join(param.itertext())
 
+# Entry point that loads the function it stands in for on its first call, and passes the call on.
+lazy_function_template = """{return_type}INTERNAL_GL_APIENTRY {name}Lazy({params})
+{{
+    return LoadLazy<PFN{upper_name}PROC, {index}>()({args});
+}}"""
+
 null_functions_header_template = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name} and gl.xml.
 //
@@ -390,6 +669,7 @@ def main():
         data_source_name = data_source_name,
         year = date.today().year,
         file_name = dispatch_header_path,
+        proc_count = len(all_entry_points),
         table_data = "\n\n".join(table_data))
 
     with open(dispatch_header_path, "w") as out:
@@ -415,30 +695,12 @@ def main():
     for extension, entry_points in sorted(both_extension_requirements.iteritems()):
         both_extensions_data.append(format_extension_requirements_lines(extension, entry_points, "gles2|gl"))
 
-    dispatch_table_source = dispatch_table_source_template.format(
-        script_name = os.path.basename(sys.argv[0]),
-        data_source_name = data_source_name,
-        year = date.today().year,
-        file_name = dispatch_source_path,
-        gl_data = "\n\n".join(gl_data),
-        gl_extensions_data = "\n\n".join(gl_extensions_data),
-        gles2_data = "\n\n".join(gles2_data),
-        gles2_extensions_data = "\n\n".join(gles2_extensions_data),
-        both_extensions_data = "\n\n".join(both_extensions_data),
-        gl_null_data = "\n\n".join(nullify(gl_data)),
-        gl_null_extensions_data = "\n\n".join(nullify(gl_extensions_data)),
-        gles2_null_data = "\n\n".join(nullify(gles2_data)),
-        gles2_null_extensions_data = "\n\n".join(nullify(gles2_extensions_data)),
-        both_null_extensions_data = "\n\n".join(nullify(both_extensions_data)))
-
-    with open(dispatch_source_path, "w") as out:
-        out.write(dispatch_table_source)
-
-    # Generate the NULL/stub entry points.
-    # Process the whole set of commands
+    # Process the whole set of commands for the NULL/stub and lazy entry points.
 
     command_defs = {}
     command_decls = {}
+    lazy_defs = {}
+    proc_indices = {entry_point: index for index, entry_point in enumerate(sorted(all_entry_points))}
 
     for command in xml_root.findall('commands/command'):
         proto = command.find('proto')
@@ -459,6 +721,58 @@ def main():
 
         command_defs[command_name] = entry
 
+        if command_name in proc_indices:
+            lazy_defs[command_name] = lazy_function_template.format(
+                return_type = return_type,
+                name = command_name,
+                params = ', '.join(param_text),
+                upper_name = command_name.upper(),
+                index = proc_indices[command_name],
+                args = ', '.join([param.find('name').text for param in command.findall('param')]))
+
+    lazy_functions = [lazy_defs[entry_point] for entry_point in sorted(all_entry_points)]
+    lazy_installs = ['    INSTALL_LAZY(%d, %s, %sLazy);' % (index, first_lower(entry_point[2:]), entry_point)
+                     for index, entry_point in enumerate(sorted(all_entry_points))]
+
+    # The functions of the table come first, so that their ProcName is their index.
+    proc_names = sorted(all_entry_points)
+    extension_names = set()
+    for requirements in [gl_extension_requirements, gles2_extension_requirements,
+                         both_extension_requirements]:
+        for entry_points in requirements.values():
+            extension_names.update([ep for entry_point, ep in entry_points])
+    proc_names += sorted(extension_names - set(proc_names))
+    proc_name_enums = ['    %s,' % name for name in proc_names]
+
+    members = [first_lower(entry_point[2:]) for entry_point in sorted(all_entry_points)]
+    save_procs = ['    SAVE_PROC(%d, %s);' % (index, member) for index, member in enumerate(members)]
+    restore_procs = ['    RESTORE_PROC(%d, %s);' % (index, member) for index, member in enumerate(members)]
+
+    dispatch_table_source = dispatch_table_source_template.format(
+        script_name = os.path.basename(sys.argv[0]),
+        data_source_name = data_source_name,
+        year = date.today().year,
+        file_name = dispatch_source_path,
+        gl_data = "\n\n".join(gl_data),
+        gl_extensions_data = "\n\n".join(gl_extensions_data),
+        gles2_data = "\n\n".join(gles2_data),
+        gles2_extensions_data = "\n\n".join(gles2_extensions_data),
+        both_extensions_data = "\n\n".join(both_extensions_data),
+        gl_null_data = "\n\n".join(nullify(gl_data)),
+        gl_null_extensions_data = "\n\n".join(nullify(gl_extensions_data)),
+        gles2_null_data = "\n\n".join(nullify(gles2_data)),
+        gles2_null_extensions_data = "\n\n".join(nullify(gles2_extensions_data)),
+        both_null_extensions_data = "\n\n".join(nullify(both_extensions_data)),
+        proc_name_enums = "\n".join(proc_name_enums),
+        proc_names = "\n".join(['    "%s",' % name for name in proc_names]),
+        lazy_functions = "\n\n".join(lazy_functions),
+        lazy_installs = "\n".join(lazy_installs),
+        save_procs = "\n".join(save_procs),
+        restore_procs = "\n".join(restore_procs))
+
+    with open(dispatch_source_path, "w") as out:
+        out.write(dispatch_table_source)
+
     null_decls = [command_decls[entry_point] for entry_point in sorted(all_entry_points)]
     null_stubs = [command_defs[entry_point] for entry_point in sorted(all_entry_points)]
 
@@ -55,11 +55,24 @@ class FunctionsGLGLX : public FunctionsGL
     ~FunctionsGLGLX() override {}
 
   private:
+    const void *getDriverHandle() const override
+    {
+        return reinterpret_cast<const void *>(mGetProc);
+    }
+
     void *loadProcAddress(const std::string &function) const override
     {
         return reinterpret_cast<void *>(mGetProc(function.c_str()));
     }
 
+    void loadProcAddresses(const char *const *names, size_t count, void **procs) const override
+    {
+        for (size_t index = 0; index < count; ++index)
+        {
+            procs[index] = reinterpret_cast<void *>(mGetProc(names[index]));
+        }
+    }
+
     PFNGETPROCPROC mGetProc;
 };
 
@@ -74,6 +74,8 @@ class FunctionsGLWindows : public FunctionsGL
     ~FunctionsGLWindows() override {}
 
   private:
+    const void *getDriverHandle() const override { return mOpenGLModule; }
+
     void *loadProcAddress(const std::string &function) const override
     {
         void *proc = reinterpret_cast<void *>(mGetProcAddressWGL(function.c_str()));
@@ -84,6 +86,19 @@ class FunctionsGLWindows : public FunctionsGL
         return proc;
     }
 
+    void loadProcAddresses(const char *const *names, size_t count, void **procs) const override
+    {
+        for (size_t index = 0; index < count; ++index)
+        {
+            procs[index] = reinterpret_cast<void *>(mGetProcAddressWGL(names[index]));
+            if (!procs[index])
+            {
+                procs[index] =
+                    reinterpret_cast<void *>(GetProcAddress(mOpenGLModule, names[index]));
+            }
+        }
+    }
+
     HMODULE mOpenGLModule;
     PFNWGLGETPROCADDRESSPROC mGetProcAddressWGL;
 };
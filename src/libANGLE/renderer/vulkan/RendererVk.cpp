@@ -826,6 +826,26 @@ angle::Result RendererVk::initialize(DisplayVk *displayVk,
     ChoosePhysicalDevice(physicalDevices, mEnableMockICD, &mPhysicalDevice,
                          &mPhysicalDeviceProperties);
 
+    // Seed the format properties cache with the captured support of known devices, so those
+    // formats never need to be queried from the driver.
+    const vk::KnownDeviceFormatSupport *knownFormatSupport = vk::GetKnownDeviceFormatSupport(
+        mPhysicalDeviceProperties.vendorID, mPhysicalDeviceProperties.deviceID,
+        mPhysicalDeviceProperties.driverVersion);
+    if (knownFormatSupport)
+    {
+        for (size_t formatIndex = 0; formatIndex < knownFormatSupport->formatCount; ++formatIndex)
+        {
+            // Only the core formats index mFormatProperties. The generator skips the others, but
+            // the table must not be trusted to index it.
+            const vk::DeviceFormatProperties &known = knownFormatSupport->formats[formatIndex];
+            if (static_cast<uint32_t>(known.format) >= vk::kNumVkFormats)
+            {
+                continue;
+            }
+            mFormatProperties[known.format] = known.properties;
+        }
+    }
+
     vkGetPhysicalDeviceFeatures(mPhysicalDevice, &mPhysicalDeviceFeatures);
 
     // Ensure we can find a graphics queue family.
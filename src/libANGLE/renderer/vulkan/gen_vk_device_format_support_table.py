@@ -0,0 +1,207 @@
+#!/usr/bin/python
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# gen_vk_device_format_support_table.py:
+#  Code generation for the format support of known Vulkan devices. See device_profiles/ for the
+#  data source. To add a device, capture "vulkaninfo --json" on it and run:
+#
+#    gen_vk_device_format_support_table.py --ingest <capture.json> [<capture.json> ...]
+#
+#  then run scripts/run_code_generation.py.
+#  NOTE: don't run this script directly to generate the table. Run scripts/run_code_generation.py.
+
+from datetime import date
+import argparse
+import glob
+import os
+import sys
+
+import vk_device_profile
+
+template_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {input_file_name}
+//
+// Copyright {copyright_year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// {out_file_name}:
+//   Captured format support of known Vulkan devices and drivers.
+
+#include "libANGLE/renderer/vulkan/vk_format_utils.h"
+
+namespace rx
+{{
+
+namespace vk
+{{
+
+namespace
+{{
+{device_format_data}
+
+constexpr std::array<KnownDeviceFormatSupport, {num_devices}> kKnownDevices = {{{{
+{device_data}
+}}}};
+}}  // anonymous namespace
+
+const KnownDeviceFormatSupport *GetKnownDeviceFormatSupport(uint32_t vendorID,
+                                                            uint32_t deviceID,
+                                                            uint32_t driverVersion)
+{{
+    const KnownDeviceFormatSupport *vendorMatch = nullptr;
+    for (const KnownDeviceFormatSupport &device : kKnownDevices)
+    {{
+        if (device.vendorID != vendorID || device.driverVersion != driverVersion)
+        {{
+            continue;
+        }}
+        if (device.deviceID == deviceID)
+        {{
+            return &device;
+        }}
+        if (device.deviceID == 0)
+        {{
+            vendorMatch = &device;
+        }}
+    }}
+    return vendorMatch;
+}}
+
+}}  // namespace vk
+
+}}  // namespace rx
+"""
+
+template_device_formats = """// {device}
+constexpr DeviceFormatProperties {formats_name}[] = {{
+{format_data}
+}};
+"""
+
+template_format_property = """{{{vk_format}, {{{linear_features}, {optimal_features}, {buffer_features}}}}},"""
+
+template_device = """{{{vendor_id}, {device_id}, {driver_version}, {formats_name}, ArraySize({formats_name})}},"""
+
+
+def profile_file_name(profile):
+    return '%04x_%04x_%08x.json' % (profile['vendorID'], profile['deviceID'],
+                                    profile['driverVersion'])
+
+
+def ingest(captures, profiles_dir, vk_xml_path, by_vendor):
+    vk_format_names = vk_device_profile.load_vk_format_names(vk_xml_path)
+
+    # Group the captures by the key they are matched with at runtime.
+    groups = {}
+    for capture in captures:
+        profile = vk_device_profile.load_vulkaninfo_json(capture, vk_format_names)
+        if by_vendor:
+            profile['deviceID'] = 0
+        groups.setdefault(profile_file_name(profile), []).append(profile)
+
+    if not os.path.isdir(profiles_dir):
+        os.makedirs(profiles_dir)
+
+    for file_name, profiles in sorted(groups.iteritems()):
+        path = os.path.join(profiles_dir, file_name)
+        if os.path.exists(path):
+            profiles.append(vk_device_profile.load_device_profile(path))
+        merged = vk_device_profile.merge_device_profiles(profiles)
+        if by_vendor:
+            merged['device'] = 'Vendor 0x%04x, driver 0x%08x' % (merged['vendorID'],
+                                                                 merged['driverVersion'])
+        vk_device_profile.save_device_profile(path, merged)
+        print('Wrote %s (%d formats)' % (path, len(merged['formats'])))
+
+
+def gen_device(index, profile, core_vk_formats):
+    # The runtime indexes its format tables with the VkFormat, so formats outside of the core range
+    # can't be seeded.
+    for vk_format in sorted(set(profile['formats']) - core_vk_formats):
+        print('Skipping %s of %s: not a core format' % (vk_format, profile['device']))
+    formats_name = 'kDevice%dFormats' % index
+    format_data = [
+        template_format_property.format(
+            vk_format=vk_format,
+            linear_features=vk_device_profile.features_to_cpp(properties['linearTilingFeatures']),
+            optimal_features=vk_device_profile.features_to_cpp(
+                properties['optimalTilingFeatures']),
+            buffer_features=vk_device_profile.features_to_cpp(properties['bufferFeatures']))
+        for vk_format, properties in sorted(profile['formats'].iteritems())
+        if vk_format in core_vk_formats
+    ]
+    device_formats = template_device_formats.format(
+        device=profile['device'], formats_name=formats_name, format_data="\n".join(format_data))
+    device = template_device.format(
+        vendor_id='0x%04X' % profile['vendorID'],
+        device_id='0x%04X' % profile['deviceID'],
+        driver_version='0x%08X' % profile['driverVersion'],
+        formats_name=formats_name)
+    return device_formats, device
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ingest', nargs='+', metavar='CAPTURE',
+                        help='Merge "vulkaninfo --json" captures into device_profiles/')
+    parser.add_argument('--by-vendor', action='store_true',
+                        help='With --ingest, merge captures per vendor and driver version '
+                        'instead of per device')
+    parser.add_argument('--vk-xml', default='../../../../third_party/vulkan-headers/src/registry/vk.xml',
+                        help='vk.xml used to name the formats in the captures')
+    parser.add_argument('auto_script_command', nargs='?', default='')
+    args = parser.parse_args()
+
+    profiles_dir = 'device_profiles'
+    out_file_name = 'vk_device_format_support_table_autogen.cpp'
+    profile_files = sorted(glob.glob(os.path.join(profiles_dir, '*.json')))
+
+    # auto_script parameters.
+    if args.auto_script_command != '':
+        inputs = ['vk_device_profile.py', args.vk_xml] + profile_files
+        outputs = [out_file_name]
+
+        if args.auto_script_command == 'inputs':
+            print ','.join(inputs)
+        elif args.auto_script_command == 'outputs':
+            print ','.join(outputs)
+        else:
+            print('Invalid script parameters')
+            return 1
+        return 0
+
+    if args.ingest:
+        ingest(args.ingest, profiles_dir, args.vk_xml, args.by_vendor)
+        return 0
+
+    core_vk_formats = set(vk_device_profile.load_vk_format_names(args.vk_xml).values())
+    device_format_data = []
+    device_data = []
+    for index, profile_file in enumerate(profile_files):
+        device_formats, device = gen_device(index,
+                                            vk_device_profile.load_device_profile(profile_file),
+                                            core_vk_formats)
+        device_format_data.append(device_formats)
+        device_data.append(device)
+
+    output_cpp = template_table_autogen_cpp.format(
+        copyright_year = date.today().year,
+        device_format_data = "\n".join(device_format_data),
+        num_devices = len(device_data),
+        device_data = "\n".join(device_data),
+        script_name = __file__,
+        out_file_name = out_file_name,
+        input_file_name = os.path.join(profiles_dir, '*.json'))
+
+    with open(out_file_name, 'wt') as out_file:
+        out_file.write(output_cpp)
+        out_file.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,7 @@
 #  NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 from datetime import date
+import argparse
 import json
 import math
 import pprint
@@ -17,6 +18,7 @@ import sys
 
 sys.path.append('..')
 import angle_format
+import vk_device_profile
 
 template_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {input_file_name}
@@ -97,91 +99,237 @@ initBufferFallback(renderer, kInfo, ArraySize(kInfo));
 }}"""
 
 
+template_compact_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {input_file_name}{profile_note}
+//
+// Copyright {copyright_year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// {out_file_name}:
+//   Queries for full Vulkan format information based on GL format.
+//   Compact variant: the fallback chains are stored in a table indexed by angle::FormatID.
+
+#include "libANGLE/renderer/vulkan/vk_format_utils.h"
+
+#include "image_util/copyimage.h"
+#include "image_util/generatemip.h"
+#include "image_util/loadimage.h"
+
+using namespace angle;
+
+namespace rx
+{{
+
+namespace vk
+{{
+
+namespace
+{{
+{chain_data}
+
+constexpr FormatInitInfo kFormatInitInfoTable[] = {{
+{format_init_data}
+}};
+
+static_assert(ArraySize(kFormatInitInfoTable) == kNumANGLEFormats,
+              "kFormatInitInfoTable must have an entry for every angle::FormatID");
+}}  // anonymous namespace
+
+void Format::initialize(RendererVk *renderer,
+                        const angle::Format &angleFormat)
+{{
+    initFromTable(renderer, kFormatInitInfoTable[static_cast<size_t>(angleFormat.id)]);
+}}
+
+}}  // namespace vk
+
+}}  // namespace rx
+"""
+
+compact_image_chain_template = """constexpr ImageFormatInitInfo kImage{format_id}[] = {{{image_list}}};"""
+
+compact_buffer_chain_template = """constexpr BufferFormatInitInfo kBuffer{format_id}[] = {{{buffer_list}}};"""
+
+compact_format_entry_template = """/* {format_id} */ {{{internal_format}, {image_chain}, {num_images}, {buffer_chain}, {num_buffers}}},"""
+
+
 def is_packed(format_id):
     return "true" if "_PACK" in format_id else "false"
 
 
+def is_implemented(angle, vk_json_data):
+    return angle != 'NONE' and (angle in vk_json_data["map"] or
+                                angle in vk_json_data["overrides"] or
+                                angle in vk_json_data["fallbacks"])
+
+
+def get_format_chain(angle, type, vk_json_data):
+    vk_map = vk_json_data["map"]
+    format = vk_json_data["overrides"].get(angle, {}).get(type, angle)
+    if format not in vk_map:
+        return []
+    fallbacks = vk_json_data["fallbacks"].get(format, {}).get(type, [])
+    if not isinstance(fallbacks, list):
+        fallbacks = [fallbacks]
+    return [format] + fallbacks
+
+
+def resolve_format_chain(chain, type, vk_map, device_formats):
+    # Resolves a fallback chain against a device profile, the same way
+    # Format::initImageFallback/initBufferFallback would at runtime. The chain is kept intact if
+    # the profile doesn't know about one of the formats that would need to be probed.
+    has_support = (vk_device_profile.has_full_texture_format_support if type == "image" else
+                   vk_device_profile.has_full_buffer_format_support)
+    for format in chain[:-1]:
+        properties = device_formats.get(vk_map[format])
+        if properties is None:
+            return chain
+        if has_support(properties):
+            return [format]
+    return chain[-1:]
+
+
+def image_args(internal_format, format, vk_map):
+    return dict(
+        image="angle::FormatID::" + format,
+        vk_image_format=vk_map[format],
+        image_initializer=angle_format.get_internal_format_initializer(
+            internal_format, format))
+
+
+def buffer_args(angle, format, vk_map):
+    return dict(
+        buffer="angle::FormatID::" + format,
+        vk_buffer_format=vk_map[format],
+        vk_buffer_format_is_packed=is_packed(vk_map[format]),
+        vertex_load_function=angle_format.get_vertex_copy_function(
+            angle, format),
+        vertex_load_converts='false' if angle_format.is_vertex_copy_identity(
+            angle, format) else 'true',
+    )
+
+
 def gen_format_case(angle, internal_format, vk_json_data):
     vk_map = vk_json_data["map"]
-    vk_overrides = vk_json_data["overrides"]
-    vk_fallbacks = vk_json_data["fallbacks"]
     args = dict(
         format_id=angle,
         internal_format=internal_format,
         image_template="",
         buffer_template="")
 
-    if ((angle not in vk_map) and (angle not in vk_overrides) and
-          (angle not in vk_fallbacks)) or angle == 'NONE':
+    if not is_implemented(angle, vk_json_data):
         return empty_format_entry_template.format(**args)
 
-    def get_formats(format, type):
-        format = vk_overrides.get(format, {}).get(type, format)
-        if format not in vk_map:
-            return []
-        fallbacks = vk_fallbacks.get(format, {}).get(type, [])
-        if not isinstance(fallbacks, list):
-            fallbacks = [fallbacks]
-        return [format] + fallbacks
-
-    def image_args(format):
-        return dict(
-            image="angle::FormatID::" + format,
-            vk_image_format=vk_map[format],
-            image_initializer=angle_format.get_internal_format_initializer(
-                internal_format, format))
-
-    def buffer_args(format):
-        return dict(
-            buffer="angle::FormatID::" + format,
-            vk_buffer_format=vk_map[format],
-            vk_buffer_format_is_packed=is_packed(vk_map[format]),
-            vertex_load_function=angle_format.get_vertex_copy_function(
-                angle, format),
-            vertex_load_converts='false' if angle == format else 'true',
-        )
-
-    images = get_formats(angle, "image")
+    images = get_format_chain(angle, "image", vk_json_data)
     if len(images) == 1:
         args.update(image_template=image_basic_template)
-        args.update(image_args(images[0]))
+        args.update(image_args(internal_format, images[0], vk_map))
     elif len(images) > 1:
         args.update(
             image_template=image_fallback_template,
             image_list=", ".join(
-                image_struct_template.format(**image_args(i))
+                image_struct_template.format(**image_args(internal_format, i, vk_map))
                 for i in images))
 
-    buffers = get_formats(angle, "buffer")
+    buffers = get_format_chain(angle, "buffer", vk_json_data)
     if len(buffers) == 1:
         args.update(buffer_template=buffer_basic_template)
-        args.update(buffer_args(buffers[0]))
+        args.update(buffer_args(angle, buffers[0], vk_map))
     elif len(buffers) > 1:
         args.update(
             buffer_template=buffer_fallback_template,
             buffer_list=", ".join(
-                buffer_struct_template.format(**buffer_args(i)) for i in buffers))
+                buffer_struct_template.format(**buffer_args(angle, i, vk_map)) for i in buffers))
 
     return format_entry_template.format(**args).format(**args)
 
 
+def gen_compact_format_entry(angle, internal_format, vk_json_data, device_formats):
+    # Returns the chain array declarations and the kFormatInitInfoTable entry for one format.
+    vk_map = vk_json_data["map"]
+    args = dict(
+        format_id=angle,
+        internal_format=internal_format,
+        image_chain="nullptr",
+        num_images=0,
+        buffer_chain="nullptr",
+        num_buffers=0)
+    chains = []
+
+    if not is_implemented(angle, vk_json_data):
+        args.update(internal_format="GL_NONE")
+        return chains, compact_format_entry_template.format(**args)
+
+    images = get_format_chain(angle, "image", vk_json_data)
+    if device_formats is not None and len(images) > 1:
+        images = resolve_format_chain(images, "image", vk_map, device_formats)
+    if len(images) > 0:
+        args.update(image_chain="kImage" + angle, num_images=len(images))
+        chains.append(compact_image_chain_template.format(
+            format_id=angle,
+            image_list=", ".join(
+                image_struct_template.format(**image_args(internal_format, i, vk_map))
+                for i in images)))
+
+    buffers = get_format_chain(angle, "buffer", vk_json_data)
+    if device_formats is not None and len(buffers) > 1:
+        buffers = resolve_format_chain(buffers, "buffer", vk_map, device_formats)
+    if len(buffers) > 0:
+        args.update(buffer_chain="kBuffer" + angle, num_buffers=len(buffers))
+        chains.append(compact_buffer_chain_template.format(
+            format_id=angle,
+            buffer_list=", ".join(
+                buffer_struct_template.format(**buffer_args(angle, i, vk_map))
+                for i in buffers)))
+
+    return chains, compact_format_entry_template.format(**args)
+
+
+def gen_compact_table(angle_to_gl, vk_json_data, device_profile):
+    device_formats = None
+    if device_profile is not None:
+        device_formats = vk_device_profile.load_device_profile(device_profile)['formats']
+
+    # Entries must follow the angle::FormatID order, which puts NONE first.
+    format_ids = ['NONE'] + sorted(angle for angle in angle_to_gl if angle != 'NONE')
+    chain_data = []
+    format_init_data = []
+    for angle in format_ids:
+        chains, entry = gen_compact_format_entry(angle, angle_to_gl[angle], vk_json_data,
+                                                 device_formats)
+        chain_data += chains
+        format_init_data.append(entry)
+
+    return "\n".join(chain_data), "\n".join(format_init_data)
+
+
 def main():
 
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--compact', help='Emit the format table as a constexpr array indexed by '
+                        'angle::FormatID instead of a switch', action='store_true')
+    parser.add_argument('--device-profile', help='Device profile JSON used to resolve fallback '
+                        'formats at build time (implies --compact). See vk_device_profile.py')
+    parser.add_argument('auto_script_command', nargs='?', default='')
+    args = parser.parse_args()
+
     input_file_name = 'vk_format_map.json'
     out_file_name = 'vk_format_table_autogen.cpp'
 
     # auto_script parameters.
-    if len(sys.argv) > 1:
+    if args.auto_script_command != '':
         inputs = [
             '../angle_format.py',
             '../angle_format_map.json',
+            'vk_device_profile.py',
             input_file_name
         ]
         outputs = [out_file_name]
 
-        if sys.argv[1] == 'inputs':
+        if args.auto_script_command == 'inputs':
             print ','.join(inputs)
-        elif sys.argv[1] == 'outputs':
+        elif args.auto_script_command == 'outputs':
             print ','.join(outputs)
         else:
             print('Invalid script parameters')
@@ -190,15 +338,31 @@ def main():
 
     angle_to_gl = angle_format.load_inverse_table(os.path.join('..', 'angle_format_map.json'))
     vk_json_data = angle_format.load_json(input_file_name)
-    vk_cases = [gen_format_case(angle, gl, vk_json_data)
-               for angle, gl in sorted(angle_to_gl.iteritems())]
-
-    output_cpp = template_table_autogen_cpp.format(
-        copyright_year = date.today().year,
-        format_case_data = "\n".join(vk_cases),
-        script_name = __file__,
-        out_file_name = out_file_name,
-        input_file_name = input_file_name)
+
+    if args.compact or args.device_profile:
+        chain_data, format_init_data = gen_compact_table(angle_to_gl, vk_json_data,
+                                                         args.device_profile)
+        profile_note = ''
+        if args.device_profile:
+            profile_note = ' and device profile ' + os.path.basename(args.device_profile)
+        output_cpp = template_compact_table_autogen_cpp.format(
+            copyright_year = date.today().year,
+            chain_data = chain_data,
+            format_init_data = format_init_data,
+            script_name = __file__,
+            out_file_name = out_file_name,
+            input_file_name = input_file_name,
+            profile_note = profile_note)
+    else:
+        vk_cases = [gen_format_case(angle, gl, vk_json_data)
+                   for angle, gl in sorted(angle_to_gl.iteritems())]
+
+        output_cpp = template_table_autogen_cpp.format(
+            copyright_year = date.today().year,
+            format_case_data = "\n".join(vk_cases),
+            script_name = __file__,
+            out_file_name = out_file_name,
+            input_file_name = input_file_name)
 
     with open(out_file_name, 'wt') as out_file:
         out_file.write(output_cpp)
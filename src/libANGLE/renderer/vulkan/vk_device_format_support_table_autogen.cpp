@@ -0,0 +1,52 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by gen_vk_device_format_support_table.py using data from device_profiles/*.json
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// vk_device_format_support_table_autogen.cpp:
+//   Captured format support of known Vulkan devices and drivers.
+
+#include "libANGLE/renderer/vulkan/vk_format_utils.h"
+
+namespace rx
+{
+
+namespace vk
+{
+
+namespace
+{
+
+constexpr std::array<KnownDeviceFormatSupport, 0> kKnownDevices = {{
+
+}};
+}  // anonymous namespace
+
+const KnownDeviceFormatSupport *GetKnownDeviceFormatSupport(uint32_t vendorID,
+                                                            uint32_t deviceID,
+                                                            uint32_t driverVersion)
+{
+    const KnownDeviceFormatSupport *vendorMatch = nullptr;
+    for (const KnownDeviceFormatSupport &device : kKnownDevices)
+    {
+        if (device.vendorID != vendorID || device.driverVersion != driverVersion)
+        {
+            continue;
+        }
+        if (device.deviceID == deviceID)
+        {
+            return &device;
+        }
+        if (device.deviceID == 0)
+        {
+            vendorMatch = &device;
+        }
+    }
+    return vendorMatch;
+}
+
+}  // namespace vk
+
+}  // namespace rx
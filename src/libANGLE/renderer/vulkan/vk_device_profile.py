@@ -0,0 +1,174 @@
+#!/usr/bin/python
+# Copyright 2019 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# vk_device_profile.py:
+#  Utils for device profiles: JSON dumps of vkGetPhysicalDeviceFormatProperties results that let
+#  the format table generators resolve format support at build time.
+#
+#  A device profile looks like:
+#
+#  {
+#      "device": "<free-form device and driver description>",
+#      "vendorID": 4318,
+#      "deviceID": 7298,
+#      "driverVersion": 1753432064,
+#      "formats": {
+#          "VK_FORMAT_R8_UNORM": {
+#              "linearTilingFeatures": ["VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT", ...],
+#              "optimalTilingFeatures": 4611,
+#              "bufferFeatures": ["VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT"]
+#          },
+#          ...
+#      }
+#  }
+#
+#  Feature sets can be given either as lists of VkFormatFeatureFlagBits names or as raw masks.
+#  Formats missing from "formats" are treated as unknown, not as unsupported. The IDs are optional
+#  and only used to match the profile to a device at runtime. A deviceID of 0 matches every device
+#  of the vendor that runs the same driver version.
+
+import json
+import xml.etree.ElementTree as etree
+
+# VkFormatFeatureFlagBits from the Vulkan 1.0 core specification.
+vk_format_feature_bits = {
+    'VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT': 0x00000001,
+    'VK_FORMAT_FEATURE_STORAGE_IMAGE_BIT': 0x00000002,
+    'VK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT': 0x00000004,
+    'VK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT': 0x00000008,
+    'VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT': 0x00000010,
+    'VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT': 0x00000020,
+    'VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT': 0x00000040,
+    'VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT': 0x00000080,
+    'VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT': 0x00000100,
+    'VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT': 0x00000200,
+    'VK_FORMAT_FEATURE_BLIT_SRC_BIT': 0x00000400,
+    'VK_FORMAT_FEATURE_BLIT_DST_BIT': 0x00000800,
+    'VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT': 0x00001000,
+}
+
+feature_kinds = ['linearTilingFeatures', 'optimalTilingFeatures', 'bufferFeatures']
+
+
+def parse_features(features):
+    if isinstance(features, (int, long)):
+        return features
+    mask = 0
+    for name in features:
+        if name not in vk_format_feature_bits:
+            raise ValueError('Unknown format feature: ' + name)
+        mask |= vk_format_feature_bits[name]
+    return mask
+
+
+def feature_names(mask):
+    return [name for name, bit in sorted(vk_format_feature_bits.iteritems(), key=lambda x: x[1])
+            if mask & bit]
+
+
+def features_to_json(mask):
+    # Features outside of the known bits are kept as a raw mask so nothing is lost.
+    names = feature_names(mask)
+    return names if parse_features(names) == mask else mask
+
+
+def features_to_cpp(mask):
+    terms = feature_names(mask)
+    unknown_bits = mask & ~parse_features(terms)
+    if unknown_bits:
+        terms.append('0x%X' % unknown_bits)
+    return ' | '.join(terms) if terms else '0'
+
+
+def parse_format_properties(properties):
+    return {kind: parse_features(properties.get(kind, 0)) for kind in feature_kinds}
+
+
+def load_device_profile(path):
+    with open(path) as profile_file:
+        profile = json.loads(profile_file.read())
+    return {
+        'device': profile.get('device', path),
+        'vendorID': profile.get('vendorID', 0),
+        'deviceID': profile.get('deviceID', 0),
+        'driverVersion': profile.get('driverVersion', 0),
+        'formats': {vk_format: parse_format_properties(properties)
+                    for vk_format, properties in profile['formats'].iteritems()},
+    }
+
+
+def save_device_profile(path, profile):
+    formats = {}
+    for vk_format, properties in profile['formats'].iteritems():
+        formats[vk_format] = {kind: features_to_json(properties[kind]) for kind in feature_kinds}
+    output = dict(profile, formats=formats)
+    with open(path, 'wt') as profile_file:
+        profile_file.write(json.dumps(output, indent=4, sort_keys=True, separators=(',', ': ')))
+        profile_file.write('\n')
+
+
+def load_vk_format_names(vk_xml_path):
+    # Maps the core VkFormat values to their enum names. Only the values in [0, kNumVkFormats) can
+    # index the format tables, so the formats of extensions, like the YCbCr formats from
+    # 1000156000 on, are left out.
+    root = etree.parse(vk_xml_path).getroot()
+    format_enums = root.findall(".//enums[@name='VkFormat']/enum")
+    vk_format_names = {}
+    for format_enum in format_enums:
+        value = int(format_enum.attrib['value'])
+        if 0 <= value < len(format_enums):
+            vk_format_names[value] = format_enum.attrib['name']
+    return vk_format_names
+
+
+def load_vulkaninfo_json(path, vk_format_names):
+    # Reads the output of "vulkaninfo --json", which follows the devsim 1.0.0 schema.
+    with open(path) as capture_file:
+        capture = json.loads(capture_file.read())
+    device_properties = capture['VkPhysicalDeviceProperties']
+    formats = {}
+    for properties in capture.get('ArrayOfVkFormatProperties', []):
+        format_id = properties['formatID']
+        if format_id not in vk_format_names:
+            continue
+        formats[vk_format_names[format_id]] = parse_format_properties(properties)
+    return {
+        'device': device_properties['deviceName'],
+        'vendorID': device_properties['vendorID'],
+        'deviceID': device_properties['deviceID'],
+        'driverVersion': device_properties['driverVersion'],
+        'formats': formats,
+    }
+
+
+def merge_device_profiles(profiles):
+    # Only keeps the features every capture agrees on. A format missing from any capture is
+    # dropped, so it is queried from the driver at runtime.
+    merged = dict(profiles[0])
+    common_formats = set(profiles[0]['formats'])
+    for profile in profiles[1:]:
+        common_formats &= set(profile['formats'])
+    merged['formats'] = {}
+    for vk_format in common_formats:
+        merged['formats'][vk_format] = {
+            kind: reduce(lambda mask, profile: mask & profile['formats'][vk_format][kind],
+                         profiles, -1)
+            for kind in feature_kinds}
+    return merged
+
+
+# These mirror HasFullTextureFormatSupport and HasFullBufferFormatSupport in vk_format_utils.cpp.
+def has_full_texture_format_support(properties):
+    bits_color = (vk_format_feature_bits['VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT'] |
+                  vk_format_feature_bits['VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT'] |
+                  vk_format_feature_bits['VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT'])
+    bits_depth = vk_format_feature_bits['VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT']
+    optimal = properties['optimalTilingFeatures']
+    return (optimal & bits_color) == bits_color or (optimal & bits_depth) == bits_depth
+
+
+def has_full_buffer_format_support(properties):
+    bits = vk_format_feature_bits['VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT']
+    return (properties['bufferFeatures'] & bits) == bits
@@ -980,7 +980,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16A16_SNORM, VK_FORMAT_R16G16B16A16_SNORM, false,
                      CopyNativeVertexData<GLshort, 4, 4, 0>, false},
                     {angle::FormatID::R32G32B32A32_FLOAT, VK_FORMAT_R32G32B32A32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 4, 4, true>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 4, 4, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -995,7 +995,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16A16_SSCALED, VK_FORMAT_R16G16B16A16_SSCALED, false,
                      CopyNativeVertexData<GLshort, 4, 4, 0>, false},
                     {angle::FormatID::R32G32B32A32_FLOAT, VK_FORMAT_R32G32B32A32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 4, 4, false>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 4, 4, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1022,7 +1022,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16A16_UNORM, VK_FORMAT_R16G16B16A16_UNORM, false,
                      CopyNativeVertexData<GLushort, 4, 4, 0>, false},
                     {angle::FormatID::R32G32B32A32_FLOAT, VK_FORMAT_R32G32B32A32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 4, 4, true>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 4, 4, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1037,7 +1037,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16A16_USCALED, VK_FORMAT_R16G16B16A16_USCALED, false,
                      CopyNativeVertexData<GLushort, 4, 4, 0>, false},
                     {angle::FormatID::R32G32B32A32_FLOAT, VK_FORMAT_R32G32B32A32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 4, 4, false>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 4, 4, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1076,7 +1076,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16_SNORM, VK_FORMAT_R16G16B16_SNORM, false,
                      CopyNativeVertexData<GLshort, 3, 3, 0>, false},
                     {angle::FormatID::R32G32B32_FLOAT, VK_FORMAT_R32G32B32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 3, 3, true>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 3, 3, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1091,7 +1091,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16_SSCALED, VK_FORMAT_R16G16B16_SSCALED, false,
                      CopyNativeVertexData<GLshort, 3, 3, 0>, false},
                     {angle::FormatID::R32G32B32_FLOAT, VK_FORMAT_R32G32B32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 3, 3, false>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 3, 3, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1118,7 +1118,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16_UNORM, VK_FORMAT_R16G16B16_UNORM, false,
                      CopyNativeVertexData<GLushort, 3, 3, 0>, false},
                     {angle::FormatID::R32G32B32_FLOAT, VK_FORMAT_R32G32B32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 3, 3, true>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 3, 3, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1133,7 +1133,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16B16_USCALED, VK_FORMAT_R16G16B16_USCALED, false,
                      CopyNativeVertexData<GLushort, 3, 3, 0>, false},
                     {angle::FormatID::R32G32B32_FLOAT, VK_FORMAT_R32G32B32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 3, 3, false>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 3, 3, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1172,7 +1172,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16_SNORM, VK_FORMAT_R16G16_SNORM, false,
                      CopyNativeVertexData<GLshort, 2, 2, 0>, false},
                     {angle::FormatID::R32G32_FLOAT, VK_FORMAT_R32G32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 2, 2, true>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 2, 2, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1187,7 +1187,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16_SSCALED, VK_FORMAT_R16G16_SSCALED, false,
                      CopyNativeVertexData<GLshort, 2, 2, 0>, false},
                     {angle::FormatID::R32G32_FLOAT, VK_FORMAT_R32G32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 2, 2, false>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 2, 2, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1214,7 +1214,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16_UNORM, VK_FORMAT_R16G16_UNORM, false,
                      CopyNativeVertexData<GLushort, 2, 2, 0>, false},
                     {angle::FormatID::R32G32_FLOAT, VK_FORMAT_R32G32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 2, 2, true>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 2, 2, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1229,7 +1229,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16G16_USCALED, VK_FORMAT_R16G16_USCALED, false,
                      CopyNativeVertexData<GLushort, 2, 2, 0>, false},
                     {angle::FormatID::R32G32_FLOAT, VK_FORMAT_R32G32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 2, 2, false>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 2, 2, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1268,7 +1268,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16_SNORM, VK_FORMAT_R16_SNORM, false,
                      CopyNativeVertexData<GLshort, 1, 1, 0>, false},
                     {angle::FormatID::R32_FLOAT, VK_FORMAT_R32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 1, 1, true>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 1, 1, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1283,7 +1283,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16_SSCALED, VK_FORMAT_R16_SSCALED, false,
                      CopyNativeVertexData<GLshort, 1, 1, 0>, false},
                     {angle::FormatID::R32_FLOAT, VK_FORMAT_R32_SFLOAT, false,
-                     CopyTo32FVertexData<GLshort, 1, 1, false>, true}};
+                     CopyTo32FVertexDataFlat<GLshort, 1, 1, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1310,7 +1310,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16_UNORM, VK_FORMAT_R16_UNORM, false,
                      CopyNativeVertexData<GLushort, 1, 1, 0>, false},
                     {angle::FormatID::R32_FLOAT, VK_FORMAT_R32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 1, 1, true>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 1, 1, true>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -1325,7 +1325,7 @@ void Format::initialize(RendererVk *renderer, const angle::Format &angleFormat)
                     {angle::FormatID::R16_USCALED, VK_FORMAT_R16_USCALED, false,
                      CopyNativeVertexData<GLushort, 1, 1, 0>, false},
                     {angle::FormatID::R32_FLOAT, VK_FORMAT_R32_SFLOAT, false,
-                     CopyTo32FVertexData<GLushort, 1, 1, false>, true}};
+                     CopyTo32FVertexDataFlat<GLushort, 1, 1, false>, true}};
                 initBufferFallback(renderer, kInfo, ArraySize(kInfo));
             }
             break;
@@ -140,6 +140,35 @@ void Format::initBufferFallback(RendererVk *renderer, const BufferFormatInitInfo
     vertexLoadRequiresConversion = info[i].vertexLoadRequiresConversion;
 }
 
+void Format::initFromTable(RendererVk *renderer, const FormatInitInfo &info)
+{
+    internalFormat = info.internalFormat;
+
+    if (info.numImageInfo == 1)
+    {
+        imageFormatID            = info.imageInfo[0].format;
+        vkImageFormat            = info.imageInfo[0].vkFormat;
+        imageInitializerFunction = info.imageInfo[0].initializer;
+    }
+    else if (info.numImageInfo > 1)
+    {
+        initImageFallback(renderer, info.imageInfo, info.numImageInfo);
+    }
+
+    if (info.numBufferInfo == 1)
+    {
+        bufferFormatID               = info.bufferInfo[0].format;
+        vkBufferFormat               = info.bufferInfo[0].vkFormat;
+        vkBufferFormatIsPacked       = info.bufferInfo[0].vkFormatIsPacked;
+        vertexLoadFunction           = info.bufferInfo[0].vertexLoadFunction;
+        vertexLoadRequiresConversion = info.bufferInfo[0].vertexLoadRequiresConversion;
+    }
+    else if (info.numBufferInfo > 1)
+    {
+        initBufferFallback(renderer, info.bufferInfo, info.numBufferInfo);
+    }
+}
+
 size_t Format::getImageCopyBufferAlignment() const
 {
     // vkCmdCopyBufferToImage must have an offset that is a multiple of 4 as well as a multiple
@@ -50,6 +50,17 @@ struct BufferFormatInitInfo final
     bool vertexLoadRequiresConversion;
 };
 
+// Used by the compact format table (gen_vk_format_table.py --compact). Chains with more than one
+// entry are probed at runtime, in order, like initImageFallback/initBufferFallback.
+struct FormatInitInfo final
+{
+    GLenum internalFormat;
+    const ImageFormatInitInfo *imageInfo;
+    int numImageInfo;
+    const BufferFormatInitInfo *bufferInfo;
+    int numBufferInfo;
+};
+
 struct Format final : private angle::NonCopyable
 {
     Format();
@@ -83,6 +94,7 @@ struct Format final : private angle::NonCopyable
     // These are used in the format table init.
     void initImageFallback(RendererVk *renderer, const ImageFormatInitInfo *info, int numInfo);
     void initBufferFallback(RendererVk *renderer, const BufferFormatInitInfo *info, int numInfo);
+    void initFromTable(RendererVk *renderer, const FormatInitInfo &info);
 
     angle::FormatID angleFormatID;
     GLenum internalFormat;
@@ -138,6 +150,29 @@ class FormatTable final : angle::NonCopyable
 // initialized to 0.
 const VkFormatProperties &GetMandatoryFormatSupport(VkFormat vkFormat);
 
+struct DeviceFormatProperties final
+{
+    VkFormat format;
+    VkFormatProperties properties;
+};
+
+// Format properties captured on a known device and driver. See
+// gen_vk_device_format_support_table.py. A deviceID of 0 matches all devices of the vendor.
+struct KnownDeviceFormatSupport final
+{
+    uint32_t vendorID;
+    uint32_t deviceID;
+    uint32_t driverVersion;
+    const DeviceFormatProperties *formats;
+    size_t formatCount;
+};
+
+// Returns the captured format properties of the device, or nullptr if the device and driver are not
+// known. This is an auto-generated function in vk_device_format_support_table_autogen.cpp.
+const KnownDeviceFormatSupport *GetKnownDeviceFormatSupport(uint32_t vendorID,
+                                                            uint32_t deviceID,
+                                                            uint32_t driverVersion);
+
 VkImageUsageFlags GetMaximalImageUsageFlags(RendererVk *renderer, VkFormat format);
 
 }  // namespace vk
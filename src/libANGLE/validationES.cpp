@@ -2135,7 +2135,7 @@ bool ValidateUniform1ivValue(Context *context,
         return true;
     }
 
-    if (IsSamplerType(uniformType))
+    if (GetUniformTypeHotInfo(uniformType).isSampler)
     {
         // Check that the values are in range.
         const GLint max = context->getCaps().maxCombinedTextureImageUnits;
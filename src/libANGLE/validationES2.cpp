@@ -6941,6 +6941,24 @@ bool ValidateProvokingVertexANGLE(Context *context, ProvokingVertex modePacked)
     return true;
 }
 
+bool ValidateBatchCommandsANGLE(Context *context, GLsizei size, const GLuint64 *commands)
+{
+    if (!context->getExtensions().batchCommands)
+    {
+        context->validationError(GL_INVALID_OPERATION, kExtensionNotEnabled);
+        return false;
+    }
+
+    if (size < 0)
+    {
+        context->validationError(GL_INVALID_VALUE, kNegativeSize);
+        return false;
+    }
+
+    // The commands themselves are validated as they are decoded.
+    return true;
+}
+
 void RecordBindTextureTypeError(Context *context, TextureType target)
 {
     ASSERT(!context->getStateCache().isValidBindTextureType(target));
@@ -17,6 +17,9 @@ namespace gl
 {
 class Context;
 
+// GL_ANGLE_batch_commands
+bool ValidateBatchCommandsANGLE(Context *context, GLsizei size, const GLuint64 *commands);
+
 // GL_ANGLE_copy_texture_3d
 bool ValidateCopyTexture3DANGLE(Context *context,
                                 GLuint sourceId,
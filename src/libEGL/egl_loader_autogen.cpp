@@ -10,6 +10,8 @@
 
 #include "egl_loader_autogen.h"
 
+#include <stddef.h>
+
 PFNEGLCHOOSECONFIGPROC EGL_ChooseConfig;
 PFNEGLCOPYBUFFERSPROC EGL_CopyBuffers;
 PFNEGLCREATECONTEXTPROC EGL_CreateContext;
@@ -101,149 +103,198 @@ PFNEGLSTREAMCONSUMERGLTEXTUREEXTERNALATTRIBSNVPROC EGL_StreamConsumerGLTextureEx
 
 namespace angle
 {
+namespace
+{
+constexpr size_t kProcCount = 88;
+
+constexpr const char *kProcNames[kProcCount] = {
+    "EGL_ChooseConfig",
+    "EGL_CopyBuffers",
+    "EGL_CreateContext",
+    "EGL_CreatePbufferSurface",
+    "EGL_CreatePixmapSurface",
+    "EGL_CreateWindowSurface",
+    "EGL_DestroyContext",
+    "EGL_DestroySurface",
+    "EGL_GetConfigAttrib",
+    "EGL_GetConfigs",
+    "EGL_GetCurrentDisplay",
+    "EGL_GetCurrentSurface",
+    "EGL_GetDisplay",
+    "EGL_GetError",
+    "EGL_GetProcAddress",
+    "EGL_Initialize",
+    "EGL_MakeCurrent",
+    "EGL_QueryContext",
+    "EGL_QueryString",
+    "EGL_QuerySurface",
+    "EGL_SwapBuffers",
+    "EGL_Terminate",
+    "EGL_WaitGL",
+    "EGL_WaitNative",
+    "EGL_BindTexImage",
+    "EGL_ReleaseTexImage",
+    "EGL_SurfaceAttrib",
+    "EGL_SwapInterval",
+    "EGL_BindAPI",
+    "EGL_QueryAPI",
+    "EGL_CreatePbufferFromClientBuffer",
+    "EGL_ReleaseThread",
+    "EGL_WaitClient",
+    "EGL_GetCurrentContext",
+    "EGL_CreateSync",
+    "EGL_DestroySync",
+    "EGL_ClientWaitSync",
+    "EGL_GetSyncAttrib",
+    "EGL_CreateImage",
+    "EGL_DestroyImage",
+    "EGL_GetPlatformDisplay",
+    "EGL_CreatePlatformWindowSurface",
+    "EGL_CreatePlatformPixmapSurface",
+    "EGL_WaitSync",
+    "EGL_SetBlobCacheFuncsANDROID",
+    "EGL_GetCompositorTimingANDROID",
+    "EGL_GetCompositorTimingSupportedANDROID",
+    "EGL_GetFrameTimestampSupportedANDROID",
+    "EGL_GetFrameTimestampsANDROID",
+    "EGL_GetNextFrameIdANDROID",
+    "EGL_PresentationTimeANDROID",
+    "EGL_CreateDeviceANGLE",
+    "EGL_ReleaseDeviceANGLE",
+    "EGL_ProgramCacheGetAttribANGLE",
+    "EGL_ProgramCachePopulateANGLE",
+    "EGL_ProgramCacheQueryANGLE",
+    "EGL_ProgramCacheResizeANGLE",
+    "EGL_QuerySurfacePointerANGLE",
+    "EGL_CreateStreamProducerD3DTextureANGLE",
+    "EGL_StreamPostD3DTextureANGLE",
+    "EGL_GetSyncValuesCHROMIUM",
+    "EGL_QueryDeviceAttribEXT",
+    "EGL_QueryDeviceStringEXT",
+    "EGL_QueryDisplayAttribEXT",
+    "EGL_CreatePlatformPixmapSurfaceEXT",
+    "EGL_CreatePlatformWindowSurfaceEXT",
+    "EGL_GetPlatformDisplayEXT",
+    "EGL_DebugMessageControlKHR",
+    "EGL_LabelObjectKHR",
+    "EGL_QueryDebugKHR",
+    "EGL_ClientWaitSyncKHR",
+    "EGL_CreateSyncKHR",
+    "EGL_DestroySyncKHR",
+    "EGL_GetSyncAttribKHR",
+    "EGL_CreateImageKHR",
+    "EGL_DestroyImageKHR",
+    "EGL_CreateStreamKHR",
+    "EGL_DestroyStreamKHR",
+    "EGL_QueryStreamKHR",
+    "EGL_QueryStreamu64KHR",
+    "EGL_StreamAttribKHR",
+    "EGL_StreamConsumerAcquireKHR",
+    "EGL_StreamConsumerGLTextureExternalKHR",
+    "EGL_StreamConsumerReleaseKHR",
+    "EGL_SwapBuffersWithDamageKHR",
+    "EGL_WaitSyncKHR",
+    "EGL_PostSubBufferNV",
+    "EGL_StreamConsumerGLTextureExternalAttribsNV",
+};
+
+GenericProc *const kProcs[kProcCount] = {
+    reinterpret_cast<GenericProc *>(&EGL_ChooseConfig),
+    reinterpret_cast<GenericProc *>(&EGL_CopyBuffers),
+    reinterpret_cast<GenericProc *>(&EGL_CreateContext),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePbufferSurface),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePixmapSurface),
+    reinterpret_cast<GenericProc *>(&EGL_CreateWindowSurface),
+    reinterpret_cast<GenericProc *>(&EGL_DestroyContext),
+    reinterpret_cast<GenericProc *>(&EGL_DestroySurface),
+    reinterpret_cast<GenericProc *>(&EGL_GetConfigAttrib),
+    reinterpret_cast<GenericProc *>(&EGL_GetConfigs),
+    reinterpret_cast<GenericProc *>(&EGL_GetCurrentDisplay),
+    reinterpret_cast<GenericProc *>(&EGL_GetCurrentSurface),
+    reinterpret_cast<GenericProc *>(&EGL_GetDisplay),
+    reinterpret_cast<GenericProc *>(&EGL_GetError),
+    reinterpret_cast<GenericProc *>(&EGL_GetProcAddress),
+    reinterpret_cast<GenericProc *>(&EGL_Initialize),
+    reinterpret_cast<GenericProc *>(&EGL_MakeCurrent),
+    reinterpret_cast<GenericProc *>(&EGL_QueryContext),
+    reinterpret_cast<GenericProc *>(&EGL_QueryString),
+    reinterpret_cast<GenericProc *>(&EGL_QuerySurface),
+    reinterpret_cast<GenericProc *>(&EGL_SwapBuffers),
+    reinterpret_cast<GenericProc *>(&EGL_Terminate),
+    reinterpret_cast<GenericProc *>(&EGL_WaitGL),
+    reinterpret_cast<GenericProc *>(&EGL_WaitNative),
+    reinterpret_cast<GenericProc *>(&EGL_BindTexImage),
+    reinterpret_cast<GenericProc *>(&EGL_ReleaseTexImage),
+    reinterpret_cast<GenericProc *>(&EGL_SurfaceAttrib),
+    reinterpret_cast<GenericProc *>(&EGL_SwapInterval),
+    reinterpret_cast<GenericProc *>(&EGL_BindAPI),
+    reinterpret_cast<GenericProc *>(&EGL_QueryAPI),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePbufferFromClientBuffer),
+    reinterpret_cast<GenericProc *>(&EGL_ReleaseThread),
+    reinterpret_cast<GenericProc *>(&EGL_WaitClient),
+    reinterpret_cast<GenericProc *>(&EGL_GetCurrentContext),
+    reinterpret_cast<GenericProc *>(&EGL_CreateSync),
+    reinterpret_cast<GenericProc *>(&EGL_DestroySync),
+    reinterpret_cast<GenericProc *>(&EGL_ClientWaitSync),
+    reinterpret_cast<GenericProc *>(&EGL_GetSyncAttrib),
+    reinterpret_cast<GenericProc *>(&EGL_CreateImage),
+    reinterpret_cast<GenericProc *>(&EGL_DestroyImage),
+    reinterpret_cast<GenericProc *>(&EGL_GetPlatformDisplay),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePlatformWindowSurface),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePlatformPixmapSurface),
+    reinterpret_cast<GenericProc *>(&EGL_WaitSync),
+    reinterpret_cast<GenericProc *>(&EGL_SetBlobCacheFuncsANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_GetCompositorTimingANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_GetCompositorTimingSupportedANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_GetFrameTimestampSupportedANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_GetFrameTimestampsANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_GetNextFrameIdANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_PresentationTimeANDROID),
+    reinterpret_cast<GenericProc *>(&EGL_CreateDeviceANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_ReleaseDeviceANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_ProgramCacheGetAttribANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_ProgramCachePopulateANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_ProgramCacheQueryANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_ProgramCacheResizeANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_QuerySurfacePointerANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_CreateStreamProducerD3DTextureANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_StreamPostD3DTextureANGLE),
+    reinterpret_cast<GenericProc *>(&EGL_GetSyncValuesCHROMIUM),
+    reinterpret_cast<GenericProc *>(&EGL_QueryDeviceAttribEXT),
+    reinterpret_cast<GenericProc *>(&EGL_QueryDeviceStringEXT),
+    reinterpret_cast<GenericProc *>(&EGL_QueryDisplayAttribEXT),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePlatformPixmapSurfaceEXT),
+    reinterpret_cast<GenericProc *>(&EGL_CreatePlatformWindowSurfaceEXT),
+    reinterpret_cast<GenericProc *>(&EGL_GetPlatformDisplayEXT),
+    reinterpret_cast<GenericProc *>(&EGL_DebugMessageControlKHR),
+    reinterpret_cast<GenericProc *>(&EGL_LabelObjectKHR),
+    reinterpret_cast<GenericProc *>(&EGL_QueryDebugKHR),
+    reinterpret_cast<GenericProc *>(&EGL_ClientWaitSyncKHR),
+    reinterpret_cast<GenericProc *>(&EGL_CreateSyncKHR),
+    reinterpret_cast<GenericProc *>(&EGL_DestroySyncKHR),
+    reinterpret_cast<GenericProc *>(&EGL_GetSyncAttribKHR),
+    reinterpret_cast<GenericProc *>(&EGL_CreateImageKHR),
+    reinterpret_cast<GenericProc *>(&EGL_DestroyImageKHR),
+    reinterpret_cast<GenericProc *>(&EGL_CreateStreamKHR),
+    reinterpret_cast<GenericProc *>(&EGL_DestroyStreamKHR),
+    reinterpret_cast<GenericProc *>(&EGL_QueryStreamKHR),
+    reinterpret_cast<GenericProc *>(&EGL_QueryStreamu64KHR),
+    reinterpret_cast<GenericProc *>(&EGL_StreamAttribKHR),
+    reinterpret_cast<GenericProc *>(&EGL_StreamConsumerAcquireKHR),
+    reinterpret_cast<GenericProc *>(&EGL_StreamConsumerGLTextureExternalKHR),
+    reinterpret_cast<GenericProc *>(&EGL_StreamConsumerReleaseKHR),
+    reinterpret_cast<GenericProc *>(&EGL_SwapBuffersWithDamageKHR),
+    reinterpret_cast<GenericProc *>(&EGL_WaitSyncKHR),
+    reinterpret_cast<GenericProc *>(&EGL_PostSubBufferNV),
+    reinterpret_cast<GenericProc *>(&EGL_StreamConsumerGLTextureExternalAttribsNV),
+};
+}  // anonymous namespace
+
 void LoadEGL(LoadProc loadProc)
 {
-    EGL_ChooseConfig  = reinterpret_cast<PFNEGLCHOOSECONFIGPROC>(loadProc("EGL_ChooseConfig"));
-    EGL_CopyBuffers   = reinterpret_cast<PFNEGLCOPYBUFFERSPROC>(loadProc("EGL_CopyBuffers"));
-    EGL_CreateContext = reinterpret_cast<PFNEGLCREATECONTEXTPROC>(loadProc("EGL_CreateContext"));
-    EGL_CreatePbufferSurface =
-        reinterpret_cast<PFNEGLCREATEPBUFFERSURFACEPROC>(loadProc("EGL_CreatePbufferSurface"));
-    EGL_CreatePixmapSurface =
-        reinterpret_cast<PFNEGLCREATEPIXMAPSURFACEPROC>(loadProc("EGL_CreatePixmapSurface"));
-    EGL_CreateWindowSurface =
-        reinterpret_cast<PFNEGLCREATEWINDOWSURFACEPROC>(loadProc("EGL_CreateWindowSurface"));
-    EGL_DestroyContext = reinterpret_cast<PFNEGLDESTROYCONTEXTPROC>(loadProc("EGL_DestroyContext"));
-    EGL_DestroySurface = reinterpret_cast<PFNEGLDESTROYSURFACEPROC>(loadProc("EGL_DestroySurface"));
-    EGL_GetConfigAttrib =
-        reinterpret_cast<PFNEGLGETCONFIGATTRIBPROC>(loadProc("EGL_GetConfigAttrib"));
-    EGL_GetConfigs = reinterpret_cast<PFNEGLGETCONFIGSPROC>(loadProc("EGL_GetConfigs"));
-    EGL_GetCurrentDisplay =
-        reinterpret_cast<PFNEGLGETCURRENTDISPLAYPROC>(loadProc("EGL_GetCurrentDisplay"));
-    EGL_GetCurrentSurface =
-        reinterpret_cast<PFNEGLGETCURRENTSURFACEPROC>(loadProc("EGL_GetCurrentSurface"));
-    EGL_GetDisplay     = reinterpret_cast<PFNEGLGETDISPLAYPROC>(loadProc("EGL_GetDisplay"));
-    EGL_GetError       = reinterpret_cast<PFNEGLGETERRORPROC>(loadProc("EGL_GetError"));
-    EGL_GetProcAddress = reinterpret_cast<PFNEGLGETPROCADDRESSPROC>(loadProc("EGL_GetProcAddress"));
-    EGL_Initialize     = reinterpret_cast<PFNEGLINITIALIZEPROC>(loadProc("EGL_Initialize"));
-    EGL_MakeCurrent    = reinterpret_cast<PFNEGLMAKECURRENTPROC>(loadProc("EGL_MakeCurrent"));
-    EGL_QueryContext   = reinterpret_cast<PFNEGLQUERYCONTEXTPROC>(loadProc("EGL_QueryContext"));
-    EGL_QueryString    = reinterpret_cast<PFNEGLQUERYSTRINGPROC>(loadProc("EGL_QueryString"));
-    EGL_QuerySurface   = reinterpret_cast<PFNEGLQUERYSURFACEPROC>(loadProc("EGL_QuerySurface"));
-    EGL_SwapBuffers    = reinterpret_cast<PFNEGLSWAPBUFFERSPROC>(loadProc("EGL_SwapBuffers"));
-    EGL_Terminate      = reinterpret_cast<PFNEGLTERMINATEPROC>(loadProc("EGL_Terminate"));
-    EGL_WaitGL         = reinterpret_cast<PFNEGLWAITGLPROC>(loadProc("EGL_WaitGL"));
-    EGL_WaitNative     = reinterpret_cast<PFNEGLWAITNATIVEPROC>(loadProc("EGL_WaitNative"));
-    EGL_BindTexImage   = reinterpret_cast<PFNEGLBINDTEXIMAGEPROC>(loadProc("EGL_BindTexImage"));
-    EGL_ReleaseTexImage =
-        reinterpret_cast<PFNEGLRELEASETEXIMAGEPROC>(loadProc("EGL_ReleaseTexImage"));
-    EGL_SurfaceAttrib = reinterpret_cast<PFNEGLSURFACEATTRIBPROC>(loadProc("EGL_SurfaceAttrib"));
-    EGL_SwapInterval  = reinterpret_cast<PFNEGLSWAPINTERVALPROC>(loadProc("EGL_SwapInterval"));
-    EGL_BindAPI       = reinterpret_cast<PFNEGLBINDAPIPROC>(loadProc("EGL_BindAPI"));
-    EGL_QueryAPI      = reinterpret_cast<PFNEGLQUERYAPIPROC>(loadProc("EGL_QueryAPI"));
-    EGL_CreatePbufferFromClientBuffer = reinterpret_cast<PFNEGLCREATEPBUFFERFROMCLIENTBUFFERPROC>(
-        loadProc("EGL_CreatePbufferFromClientBuffer"));
-    EGL_ReleaseThread = reinterpret_cast<PFNEGLRELEASETHREADPROC>(loadProc("EGL_ReleaseThread"));
-    EGL_WaitClient    = reinterpret_cast<PFNEGLWAITCLIENTPROC>(loadProc("EGL_WaitClient"));
-    EGL_GetCurrentContext =
-        reinterpret_cast<PFNEGLGETCURRENTCONTEXTPROC>(loadProc("EGL_GetCurrentContext"));
-    EGL_CreateSync     = reinterpret_cast<PFNEGLCREATESYNCPROC>(loadProc("EGL_CreateSync"));
-    EGL_DestroySync    = reinterpret_cast<PFNEGLDESTROYSYNCPROC>(loadProc("EGL_DestroySync"));
-    EGL_ClientWaitSync = reinterpret_cast<PFNEGLCLIENTWAITSYNCPROC>(loadProc("EGL_ClientWaitSync"));
-    EGL_GetSyncAttrib  = reinterpret_cast<PFNEGLGETSYNCATTRIBPROC>(loadProc("EGL_GetSyncAttrib"));
-    EGL_CreateImage    = reinterpret_cast<PFNEGLCREATEIMAGEPROC>(loadProc("EGL_CreateImage"));
-    EGL_DestroyImage   = reinterpret_cast<PFNEGLDESTROYIMAGEPROC>(loadProc("EGL_DestroyImage"));
-    EGL_GetPlatformDisplay =
-        reinterpret_cast<PFNEGLGETPLATFORMDISPLAYPROC>(loadProc("EGL_GetPlatformDisplay"));
-    EGL_CreatePlatformWindowSurface = reinterpret_cast<PFNEGLCREATEPLATFORMWINDOWSURFACEPROC>(
-        loadProc("EGL_CreatePlatformWindowSurface"));
-    EGL_CreatePlatformPixmapSurface = reinterpret_cast<PFNEGLCREATEPLATFORMPIXMAPSURFACEPROC>(
-        loadProc("EGL_CreatePlatformPixmapSurface"));
-    EGL_WaitSync                 = reinterpret_cast<PFNEGLWAITSYNCPROC>(loadProc("EGL_WaitSync"));
-    EGL_SetBlobCacheFuncsANDROID = reinterpret_cast<PFNEGLSETBLOBCACHEFUNCSANDROIDPROC>(
-        loadProc("EGL_SetBlobCacheFuncsANDROID"));
-    EGL_GetCompositorTimingANDROID = reinterpret_cast<PFNEGLGETCOMPOSITORTIMINGANDROIDPROC>(
-        loadProc("EGL_GetCompositorTimingANDROID"));
-    EGL_GetCompositorTimingSupportedANDROID =
-        reinterpret_cast<PFNEGLGETCOMPOSITORTIMINGSUPPORTEDANDROIDPROC>(
-            loadProc("EGL_GetCompositorTimingSupportedANDROID"));
-    EGL_GetFrameTimestampSupportedANDROID =
-        reinterpret_cast<PFNEGLGETFRAMETIMESTAMPSUPPORTEDANDROIDPROC>(
-            loadProc("EGL_GetFrameTimestampSupportedANDROID"));
-    EGL_GetFrameTimestampsANDROID = reinterpret_cast<PFNEGLGETFRAMETIMESTAMPSANDROIDPROC>(
-        loadProc("EGL_GetFrameTimestampsANDROID"));
-    EGL_GetNextFrameIdANDROID =
-        reinterpret_cast<PFNEGLGETNEXTFRAMEIDANDROIDPROC>(loadProc("EGL_GetNextFrameIdANDROID"));
-    EGL_PresentationTimeANDROID = reinterpret_cast<PFNEGLPRESENTATIONTIMEANDROIDPROC>(
-        loadProc("EGL_PresentationTimeANDROID"));
-    EGL_CreateDeviceANGLE =
-        reinterpret_cast<PFNEGLCREATEDEVICEANGLEPROC>(loadProc("EGL_CreateDeviceANGLE"));
-    EGL_ReleaseDeviceANGLE =
-        reinterpret_cast<PFNEGLRELEASEDEVICEANGLEPROC>(loadProc("EGL_ReleaseDeviceANGLE"));
-    EGL_ProgramCacheGetAttribANGLE = reinterpret_cast<PFNEGLPROGRAMCACHEGETATTRIBANGLEPROC>(
-        loadProc("EGL_ProgramCacheGetAttribANGLE"));
-    EGL_ProgramCachePopulateANGLE = reinterpret_cast<PFNEGLPROGRAMCACHEPOPULATEANGLEPROC>(
-        loadProc("EGL_ProgramCachePopulateANGLE"));
-    EGL_ProgramCacheQueryANGLE =
-        reinterpret_cast<PFNEGLPROGRAMCACHEQUERYANGLEPROC>(loadProc("EGL_ProgramCacheQueryANGLE"));
-    EGL_ProgramCacheResizeANGLE = reinterpret_cast<PFNEGLPROGRAMCACHERESIZEANGLEPROC>(
-        loadProc("EGL_ProgramCacheResizeANGLE"));
-    EGL_QuerySurfacePointerANGLE = reinterpret_cast<PFNEGLQUERYSURFACEPOINTERANGLEPROC>(
-        loadProc("EGL_QuerySurfacePointerANGLE"));
-    EGL_CreateStreamProducerD3DTextureANGLE =
-        reinterpret_cast<PFNEGLCREATESTREAMPRODUCERD3DTEXTUREANGLEPROC>(
-            loadProc("EGL_CreateStreamProducerD3DTextureANGLE"));
-    EGL_StreamPostD3DTextureANGLE = reinterpret_cast<PFNEGLSTREAMPOSTD3DTEXTUREANGLEPROC>(
-        loadProc("EGL_StreamPostD3DTextureANGLE"));
-    EGL_GetSyncValuesCHROMIUM =
-        reinterpret_cast<PFNEGLGETSYNCVALUESCHROMIUMPROC>(loadProc("EGL_GetSyncValuesCHROMIUM"));
-    EGL_QueryDeviceAttribEXT =
-        reinterpret_cast<PFNEGLQUERYDEVICEATTRIBEXTPROC>(loadProc("EGL_QueryDeviceAttribEXT"));
-    EGL_QueryDeviceStringEXT =
-        reinterpret_cast<PFNEGLQUERYDEVICESTRINGEXTPROC>(loadProc("EGL_QueryDeviceStringEXT"));
-    EGL_QueryDisplayAttribEXT =
-        reinterpret_cast<PFNEGLQUERYDISPLAYATTRIBEXTPROC>(loadProc("EGL_QueryDisplayAttribEXT"));
-    EGL_CreatePlatformPixmapSurfaceEXT = reinterpret_cast<PFNEGLCREATEPLATFORMPIXMAPSURFACEEXTPROC>(
-        loadProc("EGL_CreatePlatformPixmapSurfaceEXT"));
-    EGL_CreatePlatformWindowSurfaceEXT = reinterpret_cast<PFNEGLCREATEPLATFORMWINDOWSURFACEEXTPROC>(
-        loadProc("EGL_CreatePlatformWindowSurfaceEXT"));
-    EGL_GetPlatformDisplayEXT =
-        reinterpret_cast<PFNEGLGETPLATFORMDISPLAYEXTPROC>(loadProc("EGL_GetPlatformDisplayEXT"));
-    EGL_DebugMessageControlKHR =
-        reinterpret_cast<PFNEGLDEBUGMESSAGECONTROLKHRPROC>(loadProc("EGL_DebugMessageControlKHR"));
-    EGL_LabelObjectKHR = reinterpret_cast<PFNEGLLABELOBJECTKHRPROC>(loadProc("EGL_LabelObjectKHR"));
-    EGL_QueryDebugKHR  = reinterpret_cast<PFNEGLQUERYDEBUGKHRPROC>(loadProc("EGL_QueryDebugKHR"));
-    EGL_ClientWaitSyncKHR =
-        reinterpret_cast<PFNEGLCLIENTWAITSYNCKHRPROC>(loadProc("EGL_ClientWaitSyncKHR"));
-    EGL_CreateSyncKHR  = reinterpret_cast<PFNEGLCREATESYNCKHRPROC>(loadProc("EGL_CreateSyncKHR"));
-    EGL_DestroySyncKHR = reinterpret_cast<PFNEGLDESTROYSYNCKHRPROC>(loadProc("EGL_DestroySyncKHR"));
-    EGL_GetSyncAttribKHR =
-        reinterpret_cast<PFNEGLGETSYNCATTRIBKHRPROC>(loadProc("EGL_GetSyncAttribKHR"));
-    EGL_CreateImageKHR = reinterpret_cast<PFNEGLCREATEIMAGEKHRPROC>(loadProc("EGL_CreateImageKHR"));
-    EGL_DestroyImageKHR =
-        reinterpret_cast<PFNEGLDESTROYIMAGEKHRPROC>(loadProc("EGL_DestroyImageKHR"));
-    EGL_CreateStreamKHR =
-        reinterpret_cast<PFNEGLCREATESTREAMKHRPROC>(loadProc("EGL_CreateStreamKHR"));
-    EGL_DestroyStreamKHR =
-        reinterpret_cast<PFNEGLDESTROYSTREAMKHRPROC>(loadProc("EGL_DestroyStreamKHR"));
-    EGL_QueryStreamKHR = reinterpret_cast<PFNEGLQUERYSTREAMKHRPROC>(loadProc("EGL_QueryStreamKHR"));
-    EGL_QueryStreamu64KHR =
-        reinterpret_cast<PFNEGLQUERYSTREAMU64KHRPROC>(loadProc("EGL_QueryStreamu64KHR"));
-    EGL_StreamAttribKHR =
-        reinterpret_cast<PFNEGLSTREAMATTRIBKHRPROC>(loadProc("EGL_StreamAttribKHR"));
-    EGL_StreamConsumerAcquireKHR = reinterpret_cast<PFNEGLSTREAMCONSUMERACQUIREKHRPROC>(
-        loadProc("EGL_StreamConsumerAcquireKHR"));
-    EGL_StreamConsumerGLTextureExternalKHR =
-        reinterpret_cast<PFNEGLSTREAMCONSUMERGLTEXTUREEXTERNALKHRPROC>(
-            loadProc("EGL_StreamConsumerGLTextureExternalKHR"));
-    EGL_StreamConsumerReleaseKHR = reinterpret_cast<PFNEGLSTREAMCONSUMERRELEASEKHRPROC>(
-        loadProc("EGL_StreamConsumerReleaseKHR"));
-    EGL_SwapBuffersWithDamageKHR = reinterpret_cast<PFNEGLSWAPBUFFERSWITHDAMAGEKHRPROC>(
-        loadProc("EGL_SwapBuffersWithDamageKHR"));
-    EGL_WaitSyncKHR = reinterpret_cast<PFNEGLWAITSYNCKHRPROC>(loadProc("EGL_WaitSyncKHR"));
-    EGL_PostSubBufferNV =
-        reinterpret_cast<PFNEGLPOSTSUBBUFFERNVPROC>(loadProc("EGL_PostSubBufferNV"));
-    EGL_StreamConsumerGLTextureExternalAttribsNV =
-        reinterpret_cast<PFNEGLSTREAMCONSUMERGLTEXTUREEXTERNALATTRIBSNVPROC>(
-            loadProc("EGL_StreamConsumerGLTextureExternalAttribsNV"));
+    for (size_t index = 0; index < kProcCount; ++index)
+    {
+        *kProcs[index] = loadProc(kProcNames[index]);
+    }
 }
 }  // namespace angle
@@ -0,0 +1,273 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// api_capture.cpp:
+//   Implements the writing of GL call capture files.
+
+#include "libGLESv2/api_capture.h"
+
+#if defined(ANGLE_ENABLE_CAPTURE)
+
+#    include <string.h>
+#    include <algorithm>
+#    include <memory>
+
+#    include "common/PackedEnums.h"
+#    include "common/capture_format.h"
+#    include "common/system_utils.h"
+#    include "common/utilities.h"
+#    include "libANGLE/Context.h"
+#    include "libANGLE/formatutils.h"
+
+namespace gl
+{
+namespace
+{
+// The buffered calls are written out at the end of each frame, or once they reach this size.
+constexpr size_t kFlushSize = 1024 * 1024;
+
+std::unique_ptr<CaptureWriter> CreateCaptureWriter()
+{
+    std::string path = angle::GetEnvironmentVar("ANGLE_CAPTURE_FILE");
+    if (path.empty())
+    {
+        return nullptr;
+    }
+
+    FILE *file = fopen(path.c_str(), "wb");
+    if (!file)
+    {
+        ERR() << "Failed to open capture file " << path;
+        return nullptr;
+    }
+
+    return std::unique_ptr<CaptureWriter>(new CaptureWriter(file));
+}
+
+bool IsBufferBound(const Context *context, BufferBinding binding)
+{
+    return context->getState().getTargetBuffer(binding) != nullptr;
+}
+}  // anonymous namespace
+
+CaptureWriter::CaptureWriter(FILE *file) : mFile(file), mFlushedSize(0)
+{
+    mBuffer.reserve(kFlushSize);
+    writeParam<uint32_t>(angle::kCaptureMagic);
+    writeParam<uint32_t>(angle::kCaptureVersion);
+    writeParam<uint32_t>(static_cast<uint32_t>(EntryPoint::EnumCount));
+}
+
+CaptureWriter::~CaptureWriter()
+{
+    flush();
+    fclose(mFile);
+}
+
+void CaptureWriter::writeCall(EntryPoint entryPoint)
+{
+    if (mBuffer.size() >= kFlushSize)
+    {
+        flush();
+    }
+    writeParam<uint16_t>(static_cast<uint16_t>(entryPoint));
+}
+
+void CaptureWriter::writeFrameEnd()
+{
+    writeParam<uint16_t>(static_cast<uint16_t>(EntryPoint::Invalid));
+    flush();
+}
+
+void CaptureWriter::writeSync(GLsync sync)
+{
+    writeParam<uint64_t>(reinterpret_cast<uintptr_t>(sync));
+}
+
+void CaptureWriter::writeNullPointer()
+{
+    writeParam<uint32_t>(angle::kCaptureNullPointer);
+}
+
+void CaptureWriter::writeBufferOffset(const void *offset)
+{
+    writeParam<uint32_t>(angle::kCaptureBufferOffset);
+    writeParam<uint64_t>(reinterpret_cast<uintptr_t>(offset));
+}
+
+void CaptureWriter::writeClientMemory(const void *data, size_t size)
+{
+    if (!data || size >= angle::kCaptureBufferOffset)
+    {
+        writeNullPointer();
+        return;
+    }
+
+    writeParam<uint32_t>(static_cast<uint32_t>(size));
+    alignData();
+    write(data, size);
+}
+
+void CaptureWriter::writeOutputPointer(const void *pointer, size_t size)
+{
+    if (!pointer)
+    {
+        writeNullPointer();
+        return;
+    }
+
+    size_t clampedSize = std::min<size_t>(size, angle::kCaptureBufferOffset - 1);
+    writeParam<uint32_t>(static_cast<uint32_t>(clampedSize));
+}
+
+void CaptureWriter::writeString(const GLchar *string, GLsizei length)
+{
+    if (!string)
+    {
+        writeNullPointer();
+        return;
+    }
+
+    // The replay reads strings in place, so they are always stored with a null terminator.
+    size_t size = length < 0 ? strlen(string) : static_cast<size_t>(length);
+    writeParam<uint32_t>(static_cast<uint32_t>(size + 1));
+    alignData();
+    write(string, size);
+    mBuffer.push_back(0);
+}
+
+void CaptureWriter::writeStrings(GLsizei count, const GLchar *const *strings, const GLint *lengths)
+{
+    writeParam<uint32_t>(static_cast<uint32_t>(count));
+    for (GLsizei index = 0; index < count; ++index)
+    {
+        writeString(strings[index], lengths ? lengths[index] : -1);
+    }
+}
+
+void CaptureWriter::writeIndices(const Context *context,
+                                 const void *indices,
+                                 GLsizei count,
+                                 GLenum type)
+{
+    if (IsBufferBound(context, BufferBinding::ElementArray))
+    {
+        writeBufferOffset(indices);
+        return;
+    }
+
+    writeClientMemory(indices, static_cast<size_t>(count) * ElementTypeSize(type));
+}
+
+void CaptureWriter::writeVertexPointer(const Context *context, const void *pointer)
+{
+    if (IsBufferBound(context, BufferBinding::Array))
+    {
+        writeBufferOffset(pointer);
+        return;
+    }
+
+    // Client side arrays are only read at draw time, so their contents can't be captured here.
+    writeNullPointer();
+}
+
+void CaptureWriter::writeUnpackData(const Context *context, const void *data, size_t size)
+{
+    if (IsBufferBound(context, BufferBinding::PixelUnpack))
+    {
+        writeBufferOffset(data);
+        return;
+    }
+
+    writeClientMemory(data, size);
+}
+
+void CaptureWriter::writeUnpackPixels(const Context *context,
+                                      const void *pixels,
+                                      GLenum format,
+                                      GLenum type,
+                                      GLsizei width,
+                                      GLsizei height,
+                                      GLsizei depth,
+                                      bool is3D)
+{
+    if (IsBufferBound(context, BufferBinding::PixelUnpack))
+    {
+        writeBufferOffset(pixels);
+        return;
+    }
+
+    const InternalFormat &formatInfo = GetInternalFormatInfo(format, type);
+    const PixelUnpackState &unpack   = context->getState().getUnpackState();
+    GLuint endByte                   = 0;
+    if (!formatInfo.computePackUnpackEndByte(type, Extents(width, height, depth), unpack, is3D,
+                                             &endByte))
+    {
+        writeNullPointer();
+        return;
+    }
+
+    writeClientMemory(pixels, endByte);
+}
+
+void CaptureWriter::writePackPixels(const Context *context,
+                                    void *pixels,
+                                    GLenum format,
+                                    GLenum type,
+                                    GLsizei width,
+                                    GLsizei height)
+{
+    if (IsBufferBound(context, BufferBinding::PixelPack))
+    {
+        writeBufferOffset(pixels);
+        return;
+    }
+
+    const InternalFormat &formatInfo = GetInternalFormatInfo(format, type);
+    const PixelPackState &pack       = context->getState().getPackState();
+    GLuint endByte                   = 0;
+    if (!formatInfo.computePackUnpackEndByte(type, Extents(width, height, 1), pack, false,
+                                             &endByte))
+    {
+        endByte = 0;
+    }
+
+    writeOutputPointer(pixels, endByte);
+}
+
+void CaptureWriter::flush()
+{
+    if (mBuffer.empty())
+    {
+        return;
+    }
+
+    fwrite(mBuffer.data(), 1, mBuffer.size(), mFile);
+    fflush(mFile);
+    mFlushedSize += mBuffer.size();
+    mBuffer.clear();
+}
+
+void CaptureWriter::alignData()
+{
+    size_t offset  = mFlushedSize + mBuffer.size();
+    size_t padding = rx::roundUp(offset, angle::kCaptureDataAlignment) - offset;
+    mBuffer.insert(mBuffer.end(), padding, 0);
+}
+
+void CaptureWriter::write(const void *data, size_t size)
+{
+    const uint8_t *bytes = static_cast<const uint8_t *>(data);
+    mBuffer.insert(mBuffer.end(), bytes, bytes + size);
+}
+
+CaptureWriter *GetCaptureWriter()
+{
+    static std::unique_ptr<CaptureWriter> captureWriter = CreateCaptureWriter();
+    return captureWriter.get();
+}
+}  // namespace gl
+
+#endif  // defined(ANGLE_ENABLE_CAPTURE)
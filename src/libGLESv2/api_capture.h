@@ -0,0 +1,120 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// api_capture.h:
+//   Records the GL calls of an application, for builds with angle_enable_capture. The generated
+//   entry points record each successful call with ANGLE_CAPTURE into the file named by
+//   ANGLE_CAPTURE_FILE, in the format described in common/capture_format.h. The file can be
+//   replayed with the CaptureReplay perf test.
+//
+//   Captures are meant to be replayed by ANGLE on a fresh context: object names aren't remapped,
+//   and only the calls made through the GL entry points are recorded. Client side vertex arrays,
+//   writes to mapped buffers and EGL images aren't captured.
+
+#ifndef LIBGLESV2_API_CAPTURE_H_
+#define LIBGLESV2_API_CAPTURE_H_
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#if defined(ANGLE_ENABLE_CAPTURE)
+
+#    include <stdio.h>
+#    include <vector>
+
+#    include "angle_gl.h"
+#    include "common/angleutils.h"
+
+namespace gl
+{
+class Context;
+
+class CaptureWriter final : angle::NonCopyable
+{
+  public:
+    explicit CaptureWriter(FILE *file);
+    ~CaptureWriter();
+
+    void writeCall(EntryPoint entryPoint);
+    void writeFrameEnd();
+
+    template <typename T>
+    void writeParam(T value)
+    {
+        write(&value, sizeof(T));
+    }
+
+    void writeSync(GLsync sync);
+
+    // Pointer parameters. See common/capture_format.h.
+    void writeNullPointer();
+    void writeBufferOffset(const void *offset);
+    void writeClientMemory(const void *data, size_t size);
+    void writeOutputPointer(const void *pointer, size_t size);
+
+    // Strings that are null terminated when length is negative.
+    void writeString(const GLchar *string, GLsizei length = -1);
+    void writeStrings(GLsizei count, const GLchar *const *strings, const GLint *lengths);
+
+    // Pointers that are offsets into a buffer when one is bound to the matching target.
+    void writeIndices(const Context *context, const void *indices, GLsizei count, GLenum type);
+    void writeVertexPointer(const Context *context, const void *pointer);
+    void writeUnpackData(const Context *context, const void *data, size_t size);
+    void writeUnpackPixels(const Context *context,
+                           const void *pixels,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei width,
+                           GLsizei height,
+                           GLsizei depth,
+                           bool is3D);
+    void writePackPixels(const Context *context,
+                         void *pixels,
+                         GLenum format,
+                         GLenum type,
+                         GLsizei width,
+                         GLsizei height);
+
+    void flush();
+
+  private:
+    void alignData();
+    void write(const void *data, size_t size);
+
+    FILE *mFile;
+    std::vector<uint8_t> mBuffer;
+    size_t mFlushedSize;
+};
+
+// Returns the writer of the file named by ANGLE_CAPTURE_FILE, or nullptr when it isn't set.
+CaptureWriter *GetCaptureWriter();
+}  // namespace gl
+
+#    include "libGLESv2/capture_gles_autogen.h"
+
+#    define ANGLE_CAPTURE(Func, ...)                                   \
+        do                                                             \
+        {                                                              \
+            gl::CaptureWriter *captureWriter = gl::GetCaptureWriter(); \
+            if (captureWriter)                                         \
+            {                                                          \
+                gl::Capture##Func(captureWriter, __VA_ARGS__);         \
+            }                                                          \
+        } while (0)
+
+#    define ANGLE_CAPTURE_FRAME_END()                                  \
+        do                                                             \
+        {                                                              \
+            gl::CaptureWriter *captureWriter = gl::GetCaptureWriter(); \
+            if (captureWriter)                                         \
+            {                                                          \
+                captureWriter->writeFrameEnd();                        \
+            }                                                          \
+        } while (0)
+#else
+#    define ANGLE_CAPTURE(Func, ...)
+#    define ANGLE_CAPTURE_FRAME_END()
+#endif  // defined(ANGLE_ENABLE_CAPTURE)
+
+#endif  // LIBGLESV2_API_CAPTURE_H_
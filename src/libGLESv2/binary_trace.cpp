@@ -0,0 +1,173 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// binary_trace.cpp:
+//   Implements the per thread ring buffers of the binary GL call trace.
+
+#include "libGLESv2/binary_trace.h"
+
+#if defined(ANGLE_ENABLE_BINARY_TRACE)
+
+#    include <stdio.h>
+#    include <string.h>
+#    include <algorithm>
+#    include <array>
+#    include <atomic>
+#    include <chrono>
+#    include <cstdlib>
+#    include <mutex>
+#    include <vector>
+
+#    include "common/angleutils.h"
+#    include "common/system_utils.h"
+#    include "common/tls.h"
+
+namespace gl
+{
+struct BinaryTraceRecord
+{
+    uint64_t timeNs;
+    uint16_t entryPoint;
+    uint16_t paramCount;
+    uint64_t params[kBinaryTraceMaxParams];
+};
+
+// Only the owning thread writes to a buffer. The records are read at exit.
+class BinaryTraceBuffer final : angle::NonCopyable
+{
+  public:
+    explicit BinaryTraceBuffer(uint32_t threadIndex) : mThreadIndex(threadIndex), mCount(0) {}
+
+    void record(EntryPoint entryPoint, const uint64_t *params, size_t paramCount)
+    {
+        uint64_t count            = mCount.load(std::memory_order_relaxed);
+        BinaryTraceRecord &record = mRecords[count % kBinaryTraceRecordsPerThread];
+
+        record.timeNs =
+            static_cast<uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(
+                                      std::chrono::steady_clock::now().time_since_epoch())
+                                      .count());
+        record.entryPoint = static_cast<uint16_t>(entryPoint);
+        record.paramCount = static_cast<uint16_t>(paramCount);
+        memcpy(record.params, params, paramCount * sizeof(uint64_t));
+
+        mCount.store(count + 1, std::memory_order_release);
+    }
+
+    void write(FILE *file) const
+    {
+        uint64_t count       = mCount.load(std::memory_order_acquire);
+        uint32_t recordCount = static_cast<uint32_t>(
+            std::min<uint64_t>(count, static_cast<uint64_t>(kBinaryTraceRecordsPerThread)));
+
+        fwrite(&mThreadIndex, sizeof(mThreadIndex), 1, file);
+        fwrite(&recordCount, sizeof(recordCount), 1, file);
+        for (uint64_t index = count - recordCount; index < count; ++index)
+        {
+            const BinaryTraceRecord &record = mRecords[index % kBinaryTraceRecordsPerThread];
+            fwrite(&record.entryPoint, sizeof(record.entryPoint), 1, file);
+            fwrite(&record.paramCount, sizeof(record.paramCount), 1, file);
+            fwrite(&record.timeNs, sizeof(record.timeNs), 1, file);
+            fwrite(record.params, sizeof(uint64_t), record.paramCount, file);
+        }
+    }
+
+  private:
+    uint32_t mThreadIndex;
+    std::atomic<uint64_t> mCount;
+    std::array<BinaryTraceRecord, kBinaryTraceRecordsPerThread> mRecords;
+};
+
+namespace
+{
+// The buffers outlive their threads, so the calls of the threads that exited are written too.
+std::mutex &GetBuffersMutex()
+{
+    static std::mutex mutex;
+    return mutex;
+}
+
+std::vector<BinaryTraceBuffer *> &GetBuffers()
+{
+    static std::vector<BinaryTraceBuffer *> *buffers = new std::vector<BinaryTraceBuffer *>;
+    return *buffers;
+}
+
+const std::string &GetTracePath()
+{
+    static std::string *path = new std::string(angle::GetEnvironmentVar("ANGLE_BINARY_TRACE_FILE"));
+    return *path;
+}
+
+void WriteBinaryTraceAtExit()
+{
+    FILE *file = fopen(GetTracePath().c_str(), "wb");
+    if (!file)
+    {
+        return;
+    }
+
+    uint32_t entryPointCount = static_cast<uint32_t>(EntryPoint::EnumCount);
+    const uint32_t header[]  = {kBinaryTraceMagic, kBinaryTraceVersion, entryPointCount};
+    fwrite(header, sizeof(header), 1, file);
+    for (uint32_t index = 0; index < entryPointCount; ++index)
+    {
+        const char *name = GetEntryPointName(static_cast<EntryPoint>(index));
+        fwrite(name, 1, strlen(name) + 1, file);
+    }
+
+    std::lock_guard<std::mutex> lock(GetBuffersMutex());
+    for (const BinaryTraceBuffer *buffer : GetBuffers())
+    {
+        buffer->write(file);
+    }
+    fclose(file);
+}
+
+TLSIndex CreateBufferTLSIndex()
+{
+    if (GetTracePath().empty())
+    {
+        return TLS_INVALID_INDEX;
+    }
+
+    std::atexit(WriteBinaryTraceAtExit);
+    return CreateTLSIndex();
+}
+
+BinaryTraceBuffer *CreateThreadBuffer(TLSIndex bufferTLS)
+{
+    std::lock_guard<std::mutex> lock(GetBuffersMutex());
+    std::vector<BinaryTraceBuffer *> &buffers = GetBuffers();
+
+    BinaryTraceBuffer *buffer = new BinaryTraceBuffer(static_cast<uint32_t>(buffers.size()));
+    buffers.push_back(buffer);
+    SetTLSValue(bufferTLS, buffer);
+    return buffer;
+}
+}  // anonymous namespace
+
+BinaryTraceBuffer *GetBinaryTraceBuffer()
+{
+    static const TLSIndex bufferTLS = CreateBufferTLSIndex();
+    if (ANGLE_LIKELY(bufferTLS == TLS_INVALID_INDEX))
+    {
+        return nullptr;
+    }
+
+    BinaryTraceBuffer *buffer = static_cast<BinaryTraceBuffer *>(GetTLSValue(bufferTLS));
+    return buffer ? buffer : CreateThreadBuffer(bufferTLS);
+}
+
+void RecordBinaryTraceCall(BinaryTraceBuffer *buffer,
+                           EntryPoint entryPoint,
+                           const uint64_t *params,
+                           size_t paramCount)
+{
+    buffer->record(entryPoint, params, paramCount);
+}
+}  // namespace gl
+
+#endif  // defined(ANGLE_ENABLE_BINARY_TRACE)
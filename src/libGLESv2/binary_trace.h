@@ -0,0 +1,98 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// binary_trace.h:
+//   Low overhead tracing of the GL calls, for builds with angle_enable_binary_trace. The generated
+//   entry points record each call with ANGLE_BINARY_TRACE as its gl::EntryPoint and raw parameter
+//   values into a ring buffer of the calling thread, which keeps the last
+//   kBinaryTraceRecordsPerThread calls. Nothing is formatted while tracing: when the
+//   ANGLE_BINARY_TRACE_FILE environment variable is set, the buffers are written to that file at
+//   exit, and scripts/decode_binary_trace.py prints them. Calls aren't recorded when the variable
+//   isn't set.
+//
+//   The file starts with kBinaryTraceMagic, kBinaryTraceVersion and the number of entry points,
+//   each as a uint32, followed by the null terminated name of each entry point. Then for each
+//   thread, a uint32 index of the thread and a uint32 number of records, followed by the records
+//   from oldest to newest: the gl::EntryPoint as a uint16, the number of parameters as a uint16,
+//   the time of the call in nanoseconds as a uint64, then one uint64 per parameter in declaration
+//   order. Integer and enumerant parameters are extended to 64 bits, floating-point parameters
+//   are stored as the bits of their value in the low 32 bits, and pointer parameters as their
+//   address. All values are little endian.
+
+#ifndef LIBGLESV2_BINARY_TRACE_H_
+#define LIBGLESV2_BINARY_TRACE_H_
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#if defined(ANGLE_ENABLE_BINARY_TRACE)
+
+#    include <stdint.h>
+#    include <type_traits>
+
+#    include "angle_gl.h"
+#    include "common/mathutil.h"
+#    include "common/platform.h"
+
+namespace gl
+{
+constexpr uint32_t kBinaryTraceMagic   = 0x52544241;  // "ABTR"
+constexpr uint32_t kBinaryTraceVersion = 1;
+
+// glCopySubTexture3DANGLE has the most parameters.
+constexpr size_t kBinaryTraceMaxParams        = 17;
+constexpr size_t kBinaryTraceRecordsPerThread = 4096;
+
+class BinaryTraceBuffer;
+
+// Returns the buffer of the calling thread, or nullptr when tracing is off.
+BinaryTraceBuffer *GetBinaryTraceBuffer();
+
+void RecordBinaryTraceCall(BinaryTraceBuffer *buffer,
+                           EntryPoint entryPoint,
+                           const uint64_t *params,
+                           size_t paramCount);
+
+inline uint64_t BinaryTraceParam(GLfloat value)
+{
+    return bitCast<uint32_t>(value);
+}
+
+template <typename T>
+uint64_t BinaryTraceParam(T *value)
+{
+    return static_cast<uint64_t>(reinterpret_cast<uintptr_t>(value));
+}
+
+template <typename T>
+uint64_t BinaryTraceParam(T value)
+{
+    static_assert(std::is_integral<T>::value || std::is_enum<T>::value,
+                  "Unexpected parameter type");
+    return static_cast<uint64_t>(value);
+}
+
+template <typename... ParamsT>
+void TraceBinaryCall(EntryPoint entryPoint, ParamsT... params)
+{
+    static_assert(sizeof...(ParamsT) <= kBinaryTraceMaxParams, "Too many parameters to trace");
+
+    BinaryTraceBuffer *buffer = GetBinaryTraceBuffer();
+    if (ANGLE_LIKELY(!buffer))
+    {
+        return;
+    }
+
+    // The extra value avoids a zero sized array for the calls without parameters.
+    const uint64_t values[] = {BinaryTraceParam(params)..., 0};
+    RecordBinaryTraceCall(buffer, entryPoint, values, sizeof...(ParamsT));
+}
+}  // namespace gl
+
+#    define ANGLE_BINARY_TRACE(...) gl::TraceBinaryCall(__VA_ARGS__)
+#else
+#    define ANGLE_BINARY_TRACE(...)
+#endif  // defined(ANGLE_ENABLE_BINARY_TRACE)
+
+#endif  // LIBGLESV2_BINARY_TRACE_H_
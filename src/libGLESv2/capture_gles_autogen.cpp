@@ -0,0 +1,8195 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_gles_autogen.cpp:
+//   Record the GLES calls into a capture file, for builds with angle_enable_capture.
+
+#include "libGLESv2/api_capture.h"
+
+#if defined(ANGLE_ENABLE_CAPTURE)
+
+namespace gl
+{
+void CaptureActiveShaderProgram(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint pipeline,
+                                GLuint program)
+{
+    writer->writeCall(EntryPoint::ActiveShaderProgram);
+    writer->writeParam<uint32_t>(pipeline);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureActiveTexture(CaptureWriter *writer, const Context *context, GLenum texture)
+{
+    writer->writeCall(EntryPoint::ActiveTexture);
+    writer->writeParam<uint32_t>(texture);
+}
+
+void CaptureAlphaFunc(CaptureWriter *writer, const Context *context, GLenum func, GLfloat ref)
+{
+    writer->writeCall(EntryPoint::AlphaFunc);
+    writer->writeParam<uint32_t>(func);
+    writer->writeParam<float>(ref);
+}
+
+void CaptureAlphaFuncx(CaptureWriter *writer, const Context *context, GLenum func, GLfixed ref)
+{
+    writer->writeCall(EntryPoint::AlphaFuncx);
+    writer->writeParam<uint32_t>(func);
+    writer->writeParam<int32_t>(ref);
+}
+
+void CaptureAttachShader(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLuint shader)
+{
+    writer->writeCall(EntryPoint::AttachShader);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(shader);
+}
+
+void CaptureBeginQuery(CaptureWriter *writer, const Context *context, GLenum target, GLuint id)
+{
+    writer->writeCall(EntryPoint::BeginQuery);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(id);
+}
+
+void CaptureBeginQueryEXT(CaptureWriter *writer, const Context *context, GLenum target, GLuint id)
+{
+    writer->writeCall(EntryPoint::BeginQueryEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(id);
+}
+
+void CaptureBeginTransformFeedback(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum primitiveMode)
+{
+    writer->writeCall(EntryPoint::BeginTransformFeedback);
+    writer->writeParam<uint32_t>(primitiveMode);
+}
+
+void CaptureBindAttribLocation(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLuint index,
+                               const GLchar *name)
+{
+    writer->writeCall(EntryPoint::BindAttribLocation);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(index);
+    writer->writeString(name);
+}
+
+void CaptureBindBuffer(CaptureWriter *writer, const Context *context, GLenum target, GLuint buffer)
+{
+    writer->writeCall(EntryPoint::BindBuffer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(buffer);
+}
+
+void CaptureBindBufferBase(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLuint index,
+                           GLuint buffer)
+{
+    writer->writeCall(EntryPoint::BindBufferBase);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(buffer);
+}
+
+void CaptureBindBufferRange(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLuint buffer,
+                            GLintptr offset,
+                            GLsizeiptr size)
+{
+    writer->writeCall(EntryPoint::BindBufferRange);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(buffer);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int64_t>(size);
+}
+
+void CaptureBindFragDataLocationEXT(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLuint color,
+                                    const GLchar *name)
+{
+    writer->writeCall(EntryPoint::BindFragDataLocationEXT);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(color);
+    writer->writeString(name);
+}
+
+void CaptureBindFragDataLocationIndexedEXT(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint program,
+                                           GLuint colorNumber,
+                                           GLuint index,
+                                           const GLchar *name)
+{
+    writer->writeCall(EntryPoint::BindFragDataLocationIndexedEXT);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(colorNumber);
+    writer->writeParam<uint32_t>(index);
+    writer->writeString(name);
+}
+
+void CaptureBindFramebuffer(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLuint framebuffer)
+{
+    writer->writeCall(EntryPoint::BindFramebuffer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(framebuffer);
+}
+
+void CaptureBindFramebufferOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLuint framebuffer)
+{
+    writer->writeCall(EntryPoint::BindFramebufferOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(framebuffer);
+}
+
+void CaptureBindImageTexture(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint unit,
+                             GLuint texture,
+                             GLint level,
+                             GLboolean layered,
+                             GLint layer,
+                             GLenum access,
+                             GLenum format)
+{
+    writer->writeCall(EntryPoint::BindImageTexture);
+    writer->writeParam<uint32_t>(unit);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint8_t>(layered);
+    writer->writeParam<int32_t>(layer);
+    writer->writeParam<uint32_t>(access);
+    writer->writeParam<uint32_t>(format);
+}
+
+void CaptureBindProgramPipeline(CaptureWriter *writer, const Context *context, GLuint pipeline)
+{
+    writer->writeCall(EntryPoint::BindProgramPipeline);
+    writer->writeParam<uint32_t>(pipeline);
+}
+
+void CaptureBindRenderbuffer(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum target,
+                             GLuint renderbuffer)
+{
+    writer->writeCall(EntryPoint::BindRenderbuffer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(renderbuffer);
+}
+
+void CaptureBindRenderbufferOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLuint renderbuffer)
+{
+    writer->writeCall(EntryPoint::BindRenderbufferOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(renderbuffer);
+}
+
+void CaptureBindSampler(CaptureWriter *writer, const Context *context, GLuint unit, GLuint sampler)
+{
+    writer->writeCall(EntryPoint::BindSampler);
+    writer->writeParam<uint32_t>(unit);
+    writer->writeParam<uint32_t>(sampler);
+}
+
+void CaptureBindTexture(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLuint texture)
+{
+    writer->writeCall(EntryPoint::BindTexture);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(texture);
+}
+
+void CaptureBindTransformFeedback(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLuint id)
+{
+    writer->writeCall(EntryPoint::BindTransformFeedback);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(id);
+}
+
+void CaptureBindVertexArray(CaptureWriter *writer, const Context *context, GLuint array)
+{
+    writer->writeCall(EntryPoint::BindVertexArray);
+    writer->writeParam<uint32_t>(array);
+}
+
+void CaptureBindVertexArrayOES(CaptureWriter *writer, const Context *context, GLuint array)
+{
+    writer->writeCall(EntryPoint::BindVertexArrayOES);
+    writer->writeParam<uint32_t>(array);
+}
+
+void CaptureBindVertexBuffer(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint bindingindex,
+                             GLuint buffer,
+                             GLintptr offset,
+                             GLsizei stride)
+{
+    writer->writeCall(EntryPoint::BindVertexBuffer);
+    writer->writeParam<uint32_t>(bindingindex);
+    writer->writeParam<uint32_t>(buffer);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int32_t>(stride);
+}
+
+void CaptureBlendColor(CaptureWriter *writer,
+                       const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha)
+{
+    writer->writeCall(EntryPoint::BlendColor);
+    writer->writeParam<float>(red);
+    writer->writeParam<float>(green);
+    writer->writeParam<float>(blue);
+    writer->writeParam<float>(alpha);
+}
+
+void CaptureBlendEquation(CaptureWriter *writer, const Context *context, GLenum mode)
+{
+    writer->writeCall(EntryPoint::BlendEquation);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureBlendEquationSeparate(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum modeRGB,
+                                  GLenum modeAlpha)
+{
+    writer->writeCall(EntryPoint::BlendEquationSeparate);
+    writer->writeParam<uint32_t>(modeRGB);
+    writer->writeParam<uint32_t>(modeAlpha);
+}
+
+void CaptureBlendFunc(CaptureWriter *writer, const Context *context, GLenum sfactor, GLenum dfactor)
+{
+    writer->writeCall(EntryPoint::BlendFunc);
+    writer->writeParam<uint32_t>(sfactor);
+    writer->writeParam<uint32_t>(dfactor);
+}
+
+void CaptureBlendFuncSeparate(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum sfactorRGB,
+                              GLenum dfactorRGB,
+                              GLenum sfactorAlpha,
+                              GLenum dfactorAlpha)
+{
+    writer->writeCall(EntryPoint::BlendFuncSeparate);
+    writer->writeParam<uint32_t>(sfactorRGB);
+    writer->writeParam<uint32_t>(dfactorRGB);
+    writer->writeParam<uint32_t>(sfactorAlpha);
+    writer->writeParam<uint32_t>(dfactorAlpha);
+}
+
+void CaptureBlitFramebuffer(CaptureWriter *writer,
+                            const Context *context,
+                            GLint srcX0,
+                            GLint srcY0,
+                            GLint srcX1,
+                            GLint srcY1,
+                            GLint dstX0,
+                            GLint dstY0,
+                            GLint dstX1,
+                            GLint dstY1,
+                            GLbitfield mask,
+                            GLenum filter)
+{
+    writer->writeCall(EntryPoint::BlitFramebuffer);
+    writer->writeParam<int32_t>(srcX0);
+    writer->writeParam<int32_t>(srcY0);
+    writer->writeParam<int32_t>(srcX1);
+    writer->writeParam<int32_t>(srcY1);
+    writer->writeParam<int32_t>(dstX0);
+    writer->writeParam<int32_t>(dstY0);
+    writer->writeParam<int32_t>(dstX1);
+    writer->writeParam<int32_t>(dstY1);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(filter);
+}
+
+void CaptureBlitFramebufferANGLE(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLint srcX0,
+                                 GLint srcY0,
+                                 GLint srcX1,
+                                 GLint srcY1,
+                                 GLint dstX0,
+                                 GLint dstY0,
+                                 GLint dstX1,
+                                 GLint dstY1,
+                                 GLbitfield mask,
+                                 GLenum filter)
+{
+    writer->writeCall(EntryPoint::BlitFramebufferANGLE);
+    writer->writeParam<int32_t>(srcX0);
+    writer->writeParam<int32_t>(srcY0);
+    writer->writeParam<int32_t>(srcX1);
+    writer->writeParam<int32_t>(srcY1);
+    writer->writeParam<int32_t>(dstX0);
+    writer->writeParam<int32_t>(dstY0);
+    writer->writeParam<int32_t>(dstX1);
+    writer->writeParam<int32_t>(dstY1);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(filter);
+}
+
+void CaptureBufferData(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLsizeiptr size,
+                       const void *data,
+                       GLenum usage)
+{
+    writer->writeCall(EntryPoint::BufferData);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(size);
+    writer->writeClientMemory(data, static_cast<size_t>(size));
+    writer->writeParam<uint32_t>(usage);
+}
+
+void CaptureBufferStorageMemEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLsizeiptr size,
+                                GLuint memory,
+                                GLuint64 offset)
+{
+    writer->writeCall(EntryPoint::BufferStorageMemEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(size);
+    writer->writeParam<uint32_t>(memory);
+    writer->writeParam<uint64_t>(offset);
+}
+
+void CaptureBufferSubData(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLintptr offset,
+                          GLsizeiptr size,
+                          const void *data)
+{
+    writer->writeCall(EntryPoint::BufferSubData);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int64_t>(size);
+    writer->writeClientMemory(data, static_cast<size_t>(size));
+}
+
+void CaptureCheckFramebufferStatus(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum returnValue)
+{
+    writer->writeCall(EntryPoint::CheckFramebufferStatus);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureCheckFramebufferStatusOES(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum returnValue)
+{
+    writer->writeCall(EntryPoint::CheckFramebufferStatusOES);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureClear(CaptureWriter *writer, const Context *context, GLbitfield mask)
+{
+    writer->writeCall(EntryPoint::Clear);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureClearBufferfi(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          GLfloat depth,
+                          GLint stencil)
+{
+    writer->writeCall(EntryPoint::ClearBufferfi);
+    writer->writeParam<uint32_t>(buffer);
+    writer->writeParam<int32_t>(drawbuffer);
+    writer->writeParam<float>(depth);
+    writer->writeParam<int32_t>(stencil);
+}
+
+void CaptureClearBufferfv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ClearBufferfv);
+    writer->writeParam<uint32_t>(buffer);
+    writer->writeParam<int32_t>(drawbuffer);
+    writer->writeClientMemory(value,
+                              static_cast<size_t>(buffer == GL_COLOR ? 4 : 1) * sizeof(GLfloat));
+}
+
+void CaptureClearBufferiv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLint *value)
+{
+    writer->writeCall(EntryPoint::ClearBufferiv);
+    writer->writeParam<uint32_t>(buffer);
+    writer->writeParam<int32_t>(drawbuffer);
+    writer->writeClientMemory(value,
+                              static_cast<size_t>(buffer == GL_COLOR ? 4 : 1) * sizeof(GLint));
+}
+
+void CaptureClearBufferuiv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum buffer,
+                           GLint drawbuffer,
+                           const GLuint *value)
+{
+    writer->writeCall(EntryPoint::ClearBufferuiv);
+    writer->writeParam<uint32_t>(buffer);
+    writer->writeParam<int32_t>(drawbuffer);
+    writer->writeClientMemory(value,
+                              static_cast<size_t>(buffer == GL_COLOR ? 4 : 1) * sizeof(GLuint));
+}
+
+void CaptureClearColor(CaptureWriter *writer,
+                       const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha)
+{
+    writer->writeCall(EntryPoint::ClearColor);
+    writer->writeParam<float>(red);
+    writer->writeParam<float>(green);
+    writer->writeParam<float>(blue);
+    writer->writeParam<float>(alpha);
+}
+
+void CaptureClearColorx(CaptureWriter *writer,
+                        const Context *context,
+                        GLfixed red,
+                        GLfixed green,
+                        GLfixed blue,
+                        GLfixed alpha)
+{
+    writer->writeCall(EntryPoint::ClearColorx);
+    writer->writeParam<int32_t>(red);
+    writer->writeParam<int32_t>(green);
+    writer->writeParam<int32_t>(blue);
+    writer->writeParam<int32_t>(alpha);
+}
+
+void CaptureClearDepthf(CaptureWriter *writer, const Context *context, GLfloat d)
+{
+    writer->writeCall(EntryPoint::ClearDepthf);
+    writer->writeParam<float>(d);
+}
+
+void CaptureClearDepthx(CaptureWriter *writer, const Context *context, GLfixed depth)
+{
+    writer->writeCall(EntryPoint::ClearDepthx);
+    writer->writeParam<int32_t>(depth);
+}
+
+void CaptureClearStencil(CaptureWriter *writer, const Context *context, GLint s)
+{
+    writer->writeCall(EntryPoint::ClearStencil);
+    writer->writeParam<int32_t>(s);
+}
+
+void CaptureClientActiveTexture(CaptureWriter *writer, const Context *context, GLenum texture)
+{
+    writer->writeCall(EntryPoint::ClientActiveTexture);
+    writer->writeParam<uint32_t>(texture);
+}
+
+void CaptureClientWaitSync(CaptureWriter *writer,
+                           const Context *context,
+                           GLsync sync,
+                           GLbitfield flags,
+                           GLuint64 timeout,
+                           GLenum returnValue)
+{
+    writer->writeCall(EntryPoint::ClientWaitSync);
+    writer->writeSync(sync);
+    writer->writeParam<uint32_t>(flags);
+    writer->writeParam<uint64_t>(timeout);
+}
+
+void CaptureClipPlanef(CaptureWriter *writer, const Context *context, GLenum p, const GLfloat *eqn)
+{
+    writer->writeCall(EntryPoint::ClipPlanef);
+    writer->writeParam<uint32_t>(p);
+    writer->writeClientMemory(eqn, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureClipPlanex(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum plane,
+                       const GLfixed *equation)
+{
+    writer->writeCall(EntryPoint::ClipPlanex);
+    writer->writeParam<uint32_t>(plane);
+    writer->writeClientMemory(equation, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureColor4f(CaptureWriter *writer,
+                    const Context *context,
+                    GLfloat red,
+                    GLfloat green,
+                    GLfloat blue,
+                    GLfloat alpha)
+{
+    writer->writeCall(EntryPoint::Color4f);
+    writer->writeParam<float>(red);
+    writer->writeParam<float>(green);
+    writer->writeParam<float>(blue);
+    writer->writeParam<float>(alpha);
+}
+
+void CaptureColor4ub(CaptureWriter *writer,
+                     const Context *context,
+                     GLubyte red,
+                     GLubyte green,
+                     GLubyte blue,
+                     GLubyte alpha)
+{
+    writer->writeCall(EntryPoint::Color4ub);
+    writer->writeParam<uint8_t>(red);
+    writer->writeParam<uint8_t>(green);
+    writer->writeParam<uint8_t>(blue);
+    writer->writeParam<uint8_t>(alpha);
+}
+
+void CaptureColor4x(CaptureWriter *writer,
+                    const Context *context,
+                    GLfixed red,
+                    GLfixed green,
+                    GLfixed blue,
+                    GLfixed alpha)
+{
+    writer->writeCall(EntryPoint::Color4x);
+    writer->writeParam<int32_t>(red);
+    writer->writeParam<int32_t>(green);
+    writer->writeParam<int32_t>(blue);
+    writer->writeParam<int32_t>(alpha);
+}
+
+void CaptureColorMask(CaptureWriter *writer,
+                      const Context *context,
+                      GLboolean red,
+                      GLboolean green,
+                      GLboolean blue,
+                      GLboolean alpha)
+{
+    writer->writeCall(EntryPoint::ColorMask);
+    writer->writeParam<uint8_t>(red);
+    writer->writeParam<uint8_t>(green);
+    writer->writeParam<uint8_t>(blue);
+    writer->writeParam<uint8_t>(alpha);
+}
+
+void CaptureColorPointer(CaptureWriter *writer,
+                         const Context *context,
+                         GLint size,
+                         GLenum type,
+                         GLsizei stride,
+                         const void *pointer)
+{
+    writer->writeCall(EntryPoint::ColorPointer);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureCompileShader(CaptureWriter *writer, const Context *context, GLuint shader)
+{
+    writer->writeCall(EntryPoint::CompileShader);
+    writer->writeParam<uint32_t>(shader);
+}
+
+void CaptureCompressedTexImage2D(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexImage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(imageSize));
+}
+
+void CaptureCompressedTexImage3D(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexImage3D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(imageSize));
+}
+
+void CaptureCompressedTexSubImage2D(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexSubImage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(imageSize));
+}
+
+void CaptureCompressedTexSubImage3D(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexSubImage3D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(zoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(imageSize));
+}
+
+void CaptureCopyBufferSubData(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum readTarget,
+                              GLenum writeTarget,
+                              GLintptr readOffset,
+                              GLintptr writeOffset,
+                              GLsizeiptr size)
+{
+    writer->writeCall(EntryPoint::CopyBufferSubData);
+    writer->writeParam<uint32_t>(readTarget);
+    writer->writeParam<uint32_t>(writeTarget);
+    writer->writeParam<int64_t>(readOffset);
+    writer->writeParam<int64_t>(writeOffset);
+    writer->writeParam<int64_t>(size);
+}
+
+void CaptureCopyTexImage2D(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLenum internalformat,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border)
+{
+    writer->writeCall(EntryPoint::CopyTexImage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(border);
+}
+
+void CaptureCopyTexSubImage2D(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height)
+{
+    writer->writeCall(EntryPoint::CopyTexSubImage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureCopyTexSubImage3D(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height)
+{
+    writer->writeCall(EntryPoint::CopyTexSubImage3D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(zoffset);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureCreateMemoryObjectsEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   GLuint *memoryObjects)
+{
+    writer->writeCall(EntryPoint::CreateMemoryObjectsEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(memoryObjects, 0);
+}
+
+void CaptureCreateProgram(CaptureWriter *writer, const Context *context, GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::CreateProgram);
+}
+
+void CaptureCreateShader(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum type,
+                         GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::CreateShader);
+    writer->writeParam<uint32_t>(type);
+}
+
+void CaptureCreateShaderProgramv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum type,
+                                 GLsizei count,
+                                 const GLchar *const *strings,
+                                 GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::CreateShaderProgramv);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(count);
+    writer->writeStrings(count, strings, nullptr);
+}
+
+void CaptureCullFace(CaptureWriter *writer, const Context *context, GLenum mode)
+{
+    writer->writeCall(EntryPoint::CullFace);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureCurrentPaletteMatrixOES(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint matrixpaletteindex)
+{
+    writer->writeCall(EntryPoint::CurrentPaletteMatrixOES);
+    writer->writeParam<uint32_t>(matrixpaletteindex);
+}
+
+void CaptureDebugMessageCallbackKHR(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLDEBUGPROCKHR callback,
+                                    const void *userParam)
+{
+    writer->writeCall(EntryPoint::DebugMessageCallbackKHR);
+    writer->writeNullPointer();
+}
+
+void CaptureDebugMessageControlKHR(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum source,
+                                   GLenum type,
+                                   GLenum severity,
+                                   GLsizei count,
+                                   const GLuint *ids,
+                                   GLboolean enabled)
+{
+    writer->writeCall(EntryPoint::DebugMessageControlKHR);
+    writer->writeParam<uint32_t>(source);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<uint32_t>(severity);
+    writer->writeParam<int32_t>(count);
+    writer->writeNullPointer();
+    writer->writeParam<uint8_t>(enabled);
+}
+
+void CaptureDebugMessageInsertKHR(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum source,
+                                  GLenum type,
+                                  GLuint id,
+                                  GLenum severity,
+                                  GLsizei length,
+                                  const GLchar *buf)
+{
+    writer->writeCall(EntryPoint::DebugMessageInsertKHR);
+    writer->writeParam<uint32_t>(source);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(severity);
+    writer->writeParam<int32_t>(length);
+    writer->writeString(buf);
+}
+
+void CaptureDeleteBuffers(CaptureWriter *writer,
+                          const Context *context,
+                          GLsizei n,
+                          const GLuint *buffers)
+{
+    writer->writeCall(EntryPoint::DeleteBuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(buffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteFencesNV(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei n,
+                           const GLuint *fences)
+{
+    writer->writeCall(EntryPoint::DeleteFencesNV);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(fences, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteFramebuffers(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               const GLuint *framebuffers)
+{
+    writer->writeCall(EntryPoint::DeleteFramebuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(framebuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteFramebuffersOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLsizei n,
+                                  const GLuint *framebuffers)
+{
+    writer->writeCall(EntryPoint::DeleteFramebuffersOES);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(framebuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteMemoryObjectsEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   const GLuint *memoryObjects)
+{
+    writer->writeCall(EntryPoint::DeleteMemoryObjectsEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(memoryObjects, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteProgram(CaptureWriter *writer, const Context *context, GLuint program)
+{
+    writer->writeCall(EntryPoint::DeleteProgram);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureDeleteProgramPipelines(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   const GLuint *pipelines)
+{
+    writer->writeCall(EntryPoint::DeleteProgramPipelines);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(pipelines, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteQueries(CaptureWriter *writer,
+                          const Context *context,
+                          GLsizei n,
+                          const GLuint *ids)
+{
+    writer->writeCall(EntryPoint::DeleteQueries);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(ids, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteQueriesEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei n,
+                             const GLuint *ids)
+{
+    writer->writeCall(EntryPoint::DeleteQueriesEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(ids, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteRenderbuffers(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                const GLuint *renderbuffers)
+{
+    writer->writeCall(EntryPoint::DeleteRenderbuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(renderbuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteRenderbuffersOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   const GLuint *renderbuffers)
+{
+    writer->writeCall(EntryPoint::DeleteRenderbuffersOES);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(renderbuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteSamplers(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei count,
+                           const GLuint *samplers)
+{
+    writer->writeCall(EntryPoint::DeleteSamplers);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(samplers, static_cast<size_t>(count) * sizeof(GLuint));
+}
+
+void CaptureDeleteSemaphoresEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                const GLuint *semaphores)
+{
+    writer->writeCall(EntryPoint::DeleteSemaphoresEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(semaphores, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteShader(CaptureWriter *writer, const Context *context, GLuint shader)
+{
+    writer->writeCall(EntryPoint::DeleteShader);
+    writer->writeParam<uint32_t>(shader);
+}
+
+void CaptureDeleteSync(CaptureWriter *writer, const Context *context, GLsync sync)
+{
+    writer->writeCall(EntryPoint::DeleteSync);
+    writer->writeSync(sync);
+}
+
+void CaptureDeleteTextures(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei n,
+                           const GLuint *textures)
+{
+    writer->writeCall(EntryPoint::DeleteTextures);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(textures, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteTransformFeedbacks(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLsizei n,
+                                     const GLuint *ids)
+{
+    writer->writeCall(EntryPoint::DeleteTransformFeedbacks);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(ids, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteVertexArrays(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               const GLuint *arrays)
+{
+    writer->writeCall(EntryPoint::DeleteVertexArrays);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(arrays, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDeleteVertexArraysOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLsizei n,
+                                  const GLuint *arrays)
+{
+    writer->writeCall(EntryPoint::DeleteVertexArraysOES);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(arrays, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureDepthFunc(CaptureWriter *writer, const Context *context, GLenum func)
+{
+    writer->writeCall(EntryPoint::DepthFunc);
+    writer->writeParam<uint32_t>(func);
+}
+
+void CaptureDepthMask(CaptureWriter *writer, const Context *context, GLboolean flag)
+{
+    writer->writeCall(EntryPoint::DepthMask);
+    writer->writeParam<uint8_t>(flag);
+}
+
+void CaptureDepthRangef(CaptureWriter *writer, const Context *context, GLfloat n, GLfloat f)
+{
+    writer->writeCall(EntryPoint::DepthRangef);
+    writer->writeParam<float>(n);
+    writer->writeParam<float>(f);
+}
+
+void CaptureDepthRangex(CaptureWriter *writer, const Context *context, GLfixed n, GLfixed f)
+{
+    writer->writeCall(EntryPoint::DepthRangex);
+    writer->writeParam<int32_t>(n);
+    writer->writeParam<int32_t>(f);
+}
+
+void CaptureDetachShader(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLuint shader)
+{
+    writer->writeCall(EntryPoint::DetachShader);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(shader);
+}
+
+void CaptureDisable(CaptureWriter *writer, const Context *context, GLenum cap)
+{
+    writer->writeCall(EntryPoint::Disable);
+    writer->writeParam<uint32_t>(cap);
+}
+
+void CaptureDisableClientState(CaptureWriter *writer, const Context *context, GLenum array)
+{
+    writer->writeCall(EntryPoint::DisableClientState);
+    writer->writeParam<uint32_t>(array);
+}
+
+void CaptureDisableVertexAttribArray(CaptureWriter *writer, const Context *context, GLuint index)
+{
+    writer->writeCall(EntryPoint::DisableVertexAttribArray);
+    writer->writeParam<uint32_t>(index);
+}
+
+void CaptureDiscardFramebufferEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments)
+{
+    writer->writeCall(EntryPoint::DiscardFramebufferEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(numAttachments);
+    writer->writeClientMemory(attachments, static_cast<size_t>(numAttachments) * sizeof(GLenum));
+}
+
+void CaptureDispatchCompute(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint num_groups_x,
+                            GLuint num_groups_y,
+                            GLuint num_groups_z)
+{
+    writer->writeCall(EntryPoint::DispatchCompute);
+    writer->writeParam<uint32_t>(num_groups_x);
+    writer->writeParam<uint32_t>(num_groups_y);
+    writer->writeParam<uint32_t>(num_groups_z);
+}
+
+void CaptureDispatchComputeIndirect(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLintptr indirect)
+{
+    writer->writeCall(EntryPoint::DispatchComputeIndirect);
+    writer->writeParam<int64_t>(indirect);
+}
+
+void CaptureDrawArrays(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum mode,
+                       GLint first,
+                       GLsizei count)
+{
+    writer->writeCall(EntryPoint::DrawArrays);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(first);
+    writer->writeParam<int32_t>(count);
+}
+
+void CaptureDrawArraysIndirect(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum mode,
+                               const void *indirect)
+{
+    writer->writeCall(EntryPoint::DrawArraysIndirect);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeBufferOffset(indirect);
+}
+
+void CaptureDrawArraysInstanced(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum mode,
+                                GLint first,
+                                GLsizei count,
+                                GLsizei instancecount)
+{
+    writer->writeCall(EntryPoint::DrawArraysInstanced);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(first);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<int32_t>(instancecount);
+}
+
+void CaptureDrawArraysInstancedANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum mode,
+                                     GLint first,
+                                     GLsizei count,
+                                     GLsizei primcount)
+{
+    writer->writeCall(EntryPoint::DrawArraysInstancedANGLE);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(first);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<int32_t>(primcount);
+}
+
+void CaptureDrawArraysInstancedEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum mode,
+                                   GLint start,
+                                   GLsizei count,
+                                   GLsizei primcount)
+{
+    writer->writeCall(EntryPoint::DrawArraysInstancedEXT);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(start);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<int32_t>(primcount);
+}
+
+void CaptureDrawBuffers(CaptureWriter *writer,
+                        const Context *context,
+                        GLsizei n,
+                        const GLenum *bufs)
+{
+    writer->writeCall(EntryPoint::DrawBuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(bufs, static_cast<size_t>(n) * sizeof(GLenum));
+}
+
+void CaptureDrawBuffersEXT(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei n,
+                           const GLenum *bufs)
+{
+    writer->writeCall(EntryPoint::DrawBuffersEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeClientMemory(bufs, static_cast<size_t>(n) * sizeof(GLenum));
+}
+
+void CaptureDrawElements(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum mode,
+                         GLsizei count,
+                         GLenum type,
+                         const void *indices)
+{
+    writer->writeCall(EntryPoint::DrawElements);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint32_t>(type);
+    writer->writeIndices(context, indices, count, type);
+}
+
+void CaptureDrawElementsIndirect(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum mode,
+                                 GLenum type,
+                                 const void *indirect)
+{
+    writer->writeCall(EntryPoint::DrawElementsIndirect);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<uint32_t>(type);
+    writer->writeBufferOffset(indirect);
+}
+
+void CaptureDrawElementsInstanced(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum mode,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices,
+                                  GLsizei instancecount)
+{
+    writer->writeCall(EntryPoint::DrawElementsInstanced);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint32_t>(type);
+    writer->writeIndices(context, indices, count, type);
+    writer->writeParam<int32_t>(instancecount);
+}
+
+void CaptureDrawElementsInstancedANGLE(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount)
+{
+    writer->writeCall(EntryPoint::DrawElementsInstancedANGLE);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint32_t>(type);
+    writer->writeIndices(context, indices, count, type);
+    writer->writeParam<int32_t>(primcount);
+}
+
+void CaptureDrawElementsInstancedEXT(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum mode,
+                                     GLsizei count,
+                                     GLenum type,
+                                     const void *indices,
+                                     GLsizei primcount)
+{
+    writer->writeCall(EntryPoint::DrawElementsInstancedEXT);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint32_t>(type);
+    writer->writeIndices(context, indices, count, type);
+    writer->writeParam<int32_t>(primcount);
+}
+
+void CaptureDrawRangeElements(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum mode,
+                              GLuint start,
+                              GLuint end,
+                              GLsizei count,
+                              GLenum type,
+                              const void *indices)
+{
+    writer->writeCall(EntryPoint::DrawRangeElements);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeParam<uint32_t>(start);
+    writer->writeParam<uint32_t>(end);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint32_t>(type);
+    writer->writeIndices(context, indices, count, type);
+}
+
+void CaptureDrawTexfOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLfloat x,
+                        GLfloat y,
+                        GLfloat z,
+                        GLfloat width,
+                        GLfloat height)
+{
+    writer->writeCall(EntryPoint::DrawTexfOES);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+    writer->writeParam<float>(z);
+    writer->writeParam<float>(width);
+    writer->writeParam<float>(height);
+}
+
+void CaptureDrawTexfvOES(CaptureWriter *writer, const Context *context, const GLfloat *coords)
+{
+    writer->writeCall(EntryPoint::DrawTexfvOES);
+    writer->writeClientMemory(coords, static_cast<size_t>(5) * sizeof(GLfloat));
+}
+
+void CaptureDrawTexiOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLint x,
+                        GLint y,
+                        GLint z,
+                        GLint width,
+                        GLint height)
+{
+    writer->writeCall(EntryPoint::DrawTexiOES);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureDrawTexivOES(CaptureWriter *writer, const Context *context, const GLint *coords)
+{
+    writer->writeCall(EntryPoint::DrawTexivOES);
+    writer->writeClientMemory(coords, static_cast<size_t>(5) * sizeof(GLint));
+}
+
+void CaptureDrawTexsOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLshort x,
+                        GLshort y,
+                        GLshort z,
+                        GLshort width,
+                        GLshort height)
+{
+    writer->writeCall(EntryPoint::DrawTexsOES);
+    writer->writeParam<int16_t>(x);
+    writer->writeParam<int16_t>(y);
+    writer->writeParam<int16_t>(z);
+    writer->writeParam<int16_t>(width);
+    writer->writeParam<int16_t>(height);
+}
+
+void CaptureDrawTexsvOES(CaptureWriter *writer, const Context *context, const GLshort *coords)
+{
+    writer->writeCall(EntryPoint::DrawTexsvOES);
+    writer->writeClientMemory(coords, static_cast<size_t>(5) * sizeof(GLshort));
+}
+
+void CaptureDrawTexxOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLfixed x,
+                        GLfixed y,
+                        GLfixed z,
+                        GLfixed width,
+                        GLfixed height)
+{
+    writer->writeCall(EntryPoint::DrawTexxOES);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureDrawTexxvOES(CaptureWriter *writer, const Context *context, const GLfixed *coords)
+{
+    writer->writeCall(EntryPoint::DrawTexxvOES);
+    writer->writeClientMemory(coords, static_cast<size_t>(5) * sizeof(GLfixed));
+}
+
+void CaptureEGLImageTargetRenderbufferStorageOES(CaptureWriter *writer,
+                                                 const Context *context,
+                                                 GLenum target,
+                                                 GLeglImageOES image)
+{
+    writer->writeCall(EntryPoint::EGLImageTargetRenderbufferStorageOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint64_t>(reinterpret_cast<uintptr_t>(image));
+}
+
+void CaptureEGLImageTargetTexture2DOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLeglImageOES image)
+{
+    writer->writeCall(EntryPoint::EGLImageTargetTexture2DOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint64_t>(reinterpret_cast<uintptr_t>(image));
+}
+
+void CaptureEnable(CaptureWriter *writer, const Context *context, GLenum cap)
+{
+    writer->writeCall(EntryPoint::Enable);
+    writer->writeParam<uint32_t>(cap);
+}
+
+void CaptureEnableClientState(CaptureWriter *writer, const Context *context, GLenum array)
+{
+    writer->writeCall(EntryPoint::EnableClientState);
+    writer->writeParam<uint32_t>(array);
+}
+
+void CaptureEnableVertexAttribArray(CaptureWriter *writer, const Context *context, GLuint index)
+{
+    writer->writeCall(EntryPoint::EnableVertexAttribArray);
+    writer->writeParam<uint32_t>(index);
+}
+
+void CaptureEndQuery(CaptureWriter *writer, const Context *context, GLenum target)
+{
+    writer->writeCall(EntryPoint::EndQuery);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureEndQueryEXT(CaptureWriter *writer, const Context *context, GLenum target)
+{
+    writer->writeCall(EntryPoint::EndQueryEXT);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureEndTransformFeedback(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::EndTransformFeedback);
+}
+
+void CaptureFenceSync(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum condition,
+                      GLbitfield flags,
+                      GLsync returnValue)
+{
+    writer->writeCall(EntryPoint::FenceSync);
+    writer->writeParam<uint32_t>(condition);
+    writer->writeParam<uint32_t>(flags);
+    writer->writeSync(returnValue);
+}
+
+void CaptureFinish(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::Finish);
+}
+
+void CaptureFinishFenceNV(CaptureWriter *writer, const Context *context, GLuint fence)
+{
+    writer->writeCall(EntryPoint::FinishFenceNV);
+    writer->writeParam<uint32_t>(fence);
+}
+
+void CaptureFlush(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::Flush);
+}
+
+void CaptureFlushMappedBufferRange(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length)
+{
+    writer->writeCall(EntryPoint::FlushMappedBufferRange);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int64_t>(length);
+}
+
+void CaptureFlushMappedBufferRangeEXT(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLintptr offset,
+                                      GLsizeiptr length)
+{
+    writer->writeCall(EntryPoint::FlushMappedBufferRangeEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int64_t>(length);
+}
+
+void CaptureFogf(CaptureWriter *writer, const Context *context, GLenum pname, GLfloat param)
+{
+    writer->writeCall(EntryPoint::Fogf);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureFogfv(CaptureWriter *writer,
+                  const Context *context,
+                  GLenum pname,
+                  const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::Fogfv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureFogx(CaptureWriter *writer, const Context *context, GLenum pname, GLfixed param)
+{
+    writer->writeCall(EntryPoint::Fogx);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureFogxv(CaptureWriter *writer, const Context *context, GLenum pname, const GLfixed *param)
+{
+    writer->writeCall(EntryPoint::Fogxv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureFramebufferParameteri(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLint param)
+{
+    writer->writeCall(EntryPoint::FramebufferParameteri);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureFramebufferRenderbuffer(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum renderbuffertarget,
+                                    GLuint renderbuffer)
+{
+    writer->writeCall(EntryPoint::FramebufferRenderbuffer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(renderbuffertarget);
+    writer->writeParam<uint32_t>(renderbuffer);
+}
+
+void CaptureFramebufferRenderbufferOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLenum attachment,
+                                       GLenum renderbuffertarget,
+                                       GLuint renderbuffer)
+{
+    writer->writeCall(EntryPoint::FramebufferRenderbufferOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(renderbuffertarget);
+    writer->writeParam<uint32_t>(renderbuffer);
+}
+
+void CaptureFramebufferTexture2D(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLenum attachment,
+                                 GLenum textarget,
+                                 GLuint texture,
+                                 GLint level)
+{
+    writer->writeCall(EntryPoint::FramebufferTexture2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(textarget);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(level);
+}
+
+void CaptureFramebufferTexture2DOES(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum textarget,
+                                    GLuint texture,
+                                    GLint level)
+{
+    writer->writeCall(EntryPoint::FramebufferTexture2DOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(textarget);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(level);
+}
+
+void CaptureFramebufferTextureEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level)
+{
+    writer->writeCall(EntryPoint::FramebufferTextureEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(level);
+}
+
+void CaptureFramebufferTextureLayer(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level,
+                                    GLint layer)
+{
+    writer->writeCall(EntryPoint::FramebufferTextureLayer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(layer);
+}
+
+void CaptureFramebufferTextureMultiviewOVR(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLuint texture,
+                                           GLint level,
+                                           GLint baseViewIndex,
+                                           GLsizei numViews)
+{
+    writer->writeCall(EntryPoint::FramebufferTextureMultiviewOVR);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(baseViewIndex);
+    writer->writeParam<int32_t>(numViews);
+}
+
+void CaptureFrontFace(CaptureWriter *writer, const Context *context, GLenum mode)
+{
+    writer->writeCall(EntryPoint::FrontFace);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureFrustumf(CaptureWriter *writer,
+                     const Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f)
+{
+    writer->writeCall(EntryPoint::Frustumf);
+    writer->writeParam<float>(l);
+    writer->writeParam<float>(r);
+    writer->writeParam<float>(b);
+    writer->writeParam<float>(t);
+    writer->writeParam<float>(n);
+    writer->writeParam<float>(f);
+}
+
+void CaptureFrustumx(CaptureWriter *writer,
+                     const Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f)
+{
+    writer->writeCall(EntryPoint::Frustumx);
+    writer->writeParam<int32_t>(l);
+    writer->writeParam<int32_t>(r);
+    writer->writeParam<int32_t>(b);
+    writer->writeParam<int32_t>(t);
+    writer->writeParam<int32_t>(n);
+    writer->writeParam<int32_t>(f);
+}
+
+void CaptureGenBuffers(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *buffers)
+{
+    writer->writeCall(EntryPoint::GenBuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(buffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenFencesNV(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *fences)
+{
+    writer->writeCall(EntryPoint::GenFencesNV);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(fences, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenFramebuffers(CaptureWriter *writer,
+                            const Context *context,
+                            GLsizei n,
+                            GLuint *framebuffers)
+{
+    writer->writeCall(EntryPoint::GenFramebuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(framebuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenFramebuffersOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               GLuint *framebuffers)
+{
+    writer->writeCall(EntryPoint::GenFramebuffersOES);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(framebuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenProgramPipelines(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                GLuint *pipelines)
+{
+    writer->writeCall(EntryPoint::GenProgramPipelines);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(pipelines, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenQueries(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *ids)
+{
+    writer->writeCall(EntryPoint::GenQueries);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(ids, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenQueriesEXT(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *ids)
+{
+    writer->writeCall(EntryPoint::GenQueriesEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(ids, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenRenderbuffers(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei n,
+                             GLuint *renderbuffers)
+{
+    writer->writeCall(EntryPoint::GenRenderbuffers);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(renderbuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenRenderbuffersOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                GLuint *renderbuffers)
+{
+    writer->writeCall(EntryPoint::GenRenderbuffersOES);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(renderbuffers, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenSamplers(CaptureWriter *writer,
+                        const Context *context,
+                        GLsizei count,
+                        GLuint *samplers)
+{
+    writer->writeCall(EntryPoint::GenSamplers);
+    writer->writeParam<int32_t>(count);
+    writer->writeOutputPointer(samplers, static_cast<size_t>(count) * sizeof(GLuint));
+}
+
+void CaptureGenSemaphoresEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei n,
+                             GLuint *semaphores)
+{
+    writer->writeCall(EntryPoint::GenSemaphoresEXT);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(semaphores, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenTextures(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *textures)
+{
+    writer->writeCall(EntryPoint::GenTextures);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(textures, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenTransformFeedbacks(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLsizei n,
+                                  GLuint *ids)
+{
+    writer->writeCall(EntryPoint::GenTransformFeedbacks);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(ids, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenVertexArrays(CaptureWriter *writer,
+                            const Context *context,
+                            GLsizei n,
+                            GLuint *arrays)
+{
+    writer->writeCall(EntryPoint::GenVertexArrays);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(arrays, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenVertexArraysOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               GLuint *arrays)
+{
+    writer->writeCall(EntryPoint::GenVertexArraysOES);
+    writer->writeParam<int32_t>(n);
+    writer->writeOutputPointer(arrays, static_cast<size_t>(n) * sizeof(GLuint));
+}
+
+void CaptureGenerateMipmap(CaptureWriter *writer, const Context *context, GLenum target)
+{
+    writer->writeCall(EntryPoint::GenerateMipmap);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureGenerateMipmapOES(CaptureWriter *writer, const Context *context, GLenum target)
+{
+    writer->writeCall(EntryPoint::GenerateMipmapOES);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureGetActiveAttrib(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint program,
+                            GLuint index,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLint *size,
+                            GLenum *type,
+                            GLchar *name)
+{
+    writer->writeCall(EntryPoint::GetActiveAttrib);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(size, static_cast<size_t>(1) * sizeof(GLint));
+    writer->writeOutputPointer(type, static_cast<size_t>(1) * sizeof(GLenum));
+    writer->writeOutputPointer(name, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetActiveUniform(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLuint index,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLint *size,
+                             GLenum *type,
+                             GLchar *name)
+{
+    writer->writeCall(EntryPoint::GetActiveUniform);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(size, static_cast<size_t>(1) * sizeof(GLint));
+    writer->writeOutputPointer(type, static_cast<size_t>(1) * sizeof(GLenum));
+    writer->writeOutputPointer(name, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetActiveUniformBlockName(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *uniformBlockName)
+{
+    writer->writeCall(EntryPoint::GetActiveUniformBlockName);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(uniformBlockIndex);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(uniformBlockName, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetActiveUniformBlockiv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLenum pname,
+                                    GLint *params)
+{
+    writer->writeCall(EntryPoint::GetActiveUniformBlockiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(uniformBlockIndex);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetActiveUniformsiv(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLuint *uniformIndices,
+                                GLenum pname,
+                                GLint *params)
+{
+    writer->writeCall(EntryPoint::GetActiveUniformsiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(uniformCount);
+    writer->writeClientMemory(uniformIndices, static_cast<size_t>(uniformCount) * sizeof(GLuint));
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetAttachedShaders(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLsizei maxCount,
+                               GLsizei *count,
+                               GLuint *shaders)
+{
+    writer->writeCall(EntryPoint::GetAttachedShaders);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(maxCount);
+    writer->writeOutputPointer(count, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(shaders, static_cast<size_t>(maxCount) * sizeof(GLuint));
+}
+
+void CaptureGetAttribLocation(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              const GLchar *name,
+                              GLint returnValue)
+{
+    writer->writeCall(EntryPoint::GetAttribLocation);
+    writer->writeParam<uint32_t>(program);
+    writer->writeString(name);
+}
+
+void CaptureGetBooleani_v(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLuint index,
+                          GLboolean *data)
+{
+    writer->writeCall(EntryPoint::GetBooleani_v);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeOutputPointer(data, static_cast<size_t>(target) * sizeof(GLboolean));
+}
+
+void CaptureGetBooleanv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum pname,
+                        GLboolean *data)
+{
+    writer->writeCall(EntryPoint::GetBooleanv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(data, static_cast<size_t>(4) * sizeof(GLboolean));
+}
+
+void CaptureGetBufferParameteri64v(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLint64 *params)
+{
+    writer->writeCall(EntryPoint::GetBufferParameteri64v);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint64));
+}
+
+void CaptureGetBufferParameteriv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLenum pname,
+                                 GLint *params)
+{
+    writer->writeCall(EntryPoint::GetBufferParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetBufferPointerv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              void **params)
+{
+    writer->writeCall(EntryPoint::GetBufferPointerv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(1) * sizeof(void *));
+}
+
+void CaptureGetBufferPointervOES(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLenum pname,
+                                 void **params)
+{
+    writer->writeCall(EntryPoint::GetBufferPointervOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetClipPlanef(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum plane,
+                          GLfloat *equation)
+{
+    writer->writeCall(EntryPoint::GetClipPlanef);
+    writer->writeParam<uint32_t>(plane);
+    writer->writeOutputPointer(equation, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetClipPlanex(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum plane,
+                          GLfixed *equation)
+{
+    writer->writeCall(EntryPoint::GetClipPlanex);
+    writer->writeParam<uint32_t>(plane);
+    writer->writeOutputPointer(equation, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureGetDebugMessageLogKHR(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint count,
+                                  GLsizei bufSize,
+                                  GLenum *sources,
+                                  GLenum *types,
+                                  GLuint *ids,
+                                  GLenum *severities,
+                                  GLsizei *lengths,
+                                  GLchar *messageLog,
+                                  GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::GetDebugMessageLogKHR);
+    writer->writeParam<uint32_t>(count);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(sources, static_cast<size_t>(count) * sizeof(GLenum));
+    writer->writeOutputPointer(types, static_cast<size_t>(count) * sizeof(GLenum));
+    writer->writeOutputPointer(ids, static_cast<size_t>(count) * sizeof(GLuint));
+    writer->writeOutputPointer(severities, static_cast<size_t>(count) * sizeof(GLenum));
+    writer->writeOutputPointer(lengths, static_cast<size_t>(count) * sizeof(GLsizei));
+    writer->writeOutputPointer(messageLog, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetError(CaptureWriter *writer, const Context *context, GLenum returnValue)
+{
+    writer->writeCall(EntryPoint::GetError);
+}
+
+void CaptureGetFenceivNV(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint fence,
+                         GLenum pname,
+                         GLint *params)
+{
+    writer->writeCall(EntryPoint::GetFenceivNV);
+    writer->writeParam<uint32_t>(fence);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetFixedv(CaptureWriter *writer, const Context *context, GLenum pname, GLfixed *params)
+{
+    writer->writeCall(EntryPoint::GetFixedv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetFloatv(CaptureWriter *writer, const Context *context, GLenum pname, GLfloat *data)
+{
+    writer->writeCall(EntryPoint::GetFloatv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(data, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetFragDataIndexEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                const GLchar *name,
+                                GLint returnValue)
+{
+    writer->writeCall(EntryPoint::GetFragDataIndexEXT);
+    writer->writeParam<uint32_t>(program);
+    writer->writeString(name);
+}
+
+void CaptureGetFragDataLocation(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                const GLchar *name,
+                                GLint returnValue)
+{
+    writer->writeCall(EntryPoint::GetFragDataLocation);
+    writer->writeParam<uint32_t>(program);
+    writer->writeString(name);
+}
+
+void CaptureGetFramebufferAttachmentParameteriv(CaptureWriter *writer,
+                                                const Context *context,
+                                                GLenum target,
+                                                GLenum attachment,
+                                                GLenum pname,
+                                                GLint *params)
+{
+    writer->writeCall(EntryPoint::GetFramebufferAttachmentParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetFramebufferAttachmentParameterivOES(CaptureWriter *writer,
+                                                   const Context *context,
+                                                   GLenum target,
+                                                   GLenum attachment,
+                                                   GLenum pname,
+                                                   GLint *params)
+{
+    writer->writeCall(EntryPoint::GetFramebufferAttachmentParameterivOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetFramebufferParameteriv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLint *params)
+{
+    writer->writeCall(EntryPoint::GetFramebufferParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetGraphicsResetStatusEXT(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum returnValue)
+{
+    writer->writeCall(EntryPoint::GetGraphicsResetStatusEXT);
+}
+
+void CaptureGetInteger64i_v(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLint64 *data)
+{
+    writer->writeCall(EntryPoint::GetInteger64i_v);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeOutputPointer(data, static_cast<size_t>(target) * sizeof(GLint64));
+}
+
+void CaptureGetInteger64v(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum pname,
+                          GLint64 *data)
+{
+    writer->writeCall(EntryPoint::GetInteger64v);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(data, static_cast<size_t>(4) * sizeof(GLint64));
+}
+
+void CaptureGetIntegeri_v(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLuint index,
+                          GLint *data)
+{
+    writer->writeCall(EntryPoint::GetIntegeri_v);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeOutputPointer(data, static_cast<size_t>(target) * sizeof(GLint));
+}
+
+void CaptureGetIntegerv(CaptureWriter *writer, const Context *context, GLenum pname, GLint *data)
+{
+    writer->writeCall(EntryPoint::GetIntegerv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(data, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetInternalformativ(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLenum pname,
+                                GLsizei bufSize,
+                                GLint *params)
+{
+    writer->writeCall(EntryPoint::GetInternalformativ);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetLightfv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum light,
+                       GLenum pname,
+                       GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetLightfv);
+    writer->writeParam<uint32_t>(light);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetLightxv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum light,
+                       GLenum pname,
+                       GLfixed *params)
+{
+    writer->writeCall(EntryPoint::GetLightxv);
+    writer->writeParam<uint32_t>(light);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureGetMaterialfv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum face,
+                          GLenum pname,
+                          GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetMaterialfv);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetMaterialxv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum face,
+                          GLenum pname,
+                          GLfixed *params)
+{
+    writer->writeCall(EntryPoint::GetMaterialxv);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureGetMemoryObjectParameterivEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint memoryObject,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    writer->writeCall(EntryPoint::GetMemoryObjectParameterivEXT);
+    writer->writeParam<uint32_t>(memoryObject);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetMultisamplefv(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum pname,
+                             GLuint index,
+                             GLfloat *val)
+{
+    writer->writeCall(EntryPoint::GetMultisamplefv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<uint32_t>(index);
+    writer->writeOutputPointer(val, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetObjectLabelKHR(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum identifier,
+                              GLuint name,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *label)
+{
+    writer->writeCall(EntryPoint::GetObjectLabelKHR);
+    writer->writeParam<uint32_t>(identifier);
+    writer->writeParam<uint32_t>(name);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(label, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetObjectPtrLabelKHR(CaptureWriter *writer,
+                                 const Context *context,
+                                 const void *ptr,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *label)
+{
+    writer->writeCall(EntryPoint::GetObjectPtrLabelKHR);
+    writer->writeClientMemory(ptr, static_cast<size_t>(bufSize));
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(label, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetPointerv(CaptureWriter *writer, const Context *context, GLenum pname, void **params)
+{
+    writer->writeCall(EntryPoint::GetPointerv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(1) * sizeof(void *));
+}
+
+void CaptureGetPointervKHR(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum pname,
+                           void **params)
+{
+    writer->writeCall(EntryPoint::GetPointervKHR);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetProgramBinary(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLenum *binaryFormat,
+                             void *binary)
+{
+    writer->writeCall(EntryPoint::GetProgramBinary);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(binaryFormat, static_cast<size_t>(1) * sizeof(GLenum));
+    writer->writeOutputPointer(binary, static_cast<size_t>(bufSize));
+}
+
+void CaptureGetProgramBinaryOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLenum *binaryFormat,
+                                void *binary)
+{
+    writer->writeCall(EntryPoint::GetProgramBinaryOES);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(binaryFormat, static_cast<size_t>(1) * sizeof(GLenum));
+    writer->writeOutputPointer(binary, static_cast<size_t>(bufSize));
+}
+
+void CaptureGetProgramInfoLog(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *infoLog)
+{
+    writer->writeCall(EntryPoint::GetProgramInfoLog);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(infoLog, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetProgramInterfaceiv(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint program,
+                                  GLenum programInterface,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    writer->writeCall(EntryPoint::GetProgramInterfaceiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetProgramPipelineInfoLog(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint pipeline,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *infoLog)
+{
+    writer->writeCall(EntryPoint::GetProgramPipelineInfoLog);
+    writer->writeParam<uint32_t>(pipeline);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(infoLog, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetProgramPipelineiv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint pipeline,
+                                 GLenum pname,
+                                 GLint *params)
+{
+    writer->writeCall(EntryPoint::GetProgramPipelineiv);
+    writer->writeParam<uint32_t>(pipeline);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetProgramResourceIndex(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLenum programInterface,
+                                    const GLchar *name,
+                                    GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::GetProgramResourceIndex);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeString(name);
+}
+
+void CaptureGetProgramResourceLocation(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint program,
+                                       GLenum programInterface,
+                                       const GLchar *name,
+                                       GLint returnValue)
+{
+    writer->writeCall(EntryPoint::GetProgramResourceLocation);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeString(name);
+}
+
+void CaptureGetProgramResourceLocationIndexEXT(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint program,
+                                               GLenum programInterface,
+                                               const GLchar *name,
+                                               GLint returnValue)
+{
+    writer->writeCall(EntryPoint::GetProgramResourceLocationIndexEXT);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeString(name);
+}
+
+void CaptureGetProgramResourceName(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *name)
+{
+    writer->writeCall(EntryPoint::GetProgramResourceName);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(name, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetProgramResourceiv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint program,
+                                 GLenum programInterface,
+                                 GLuint index,
+                                 GLsizei propCount,
+                                 const GLenum *props,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *params)
+{
+    writer->writeCall(EntryPoint::GetProgramResourceiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(propCount);
+    writer->writeClientMemory(props, static_cast<size_t>(propCount) * sizeof(GLenum));
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetProgramiv(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLenum pname,
+                         GLint *params)
+{
+    writer->writeCall(EntryPoint::GetProgramiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetQueryObjecti64vEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint id,
+                                  GLenum pname,
+                                  GLint64 *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjecti64vEXT);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint64));
+}
+
+void CaptureGetQueryObjectivEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint id,
+                                GLenum pname,
+                                GLint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectivEXT);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetQueryObjectui64vEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint id,
+                                   GLenum pname,
+                                   GLuint64 *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectui64vEXT);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLuint64));
+}
+
+void CaptureGetQueryObjectuiv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint id,
+                              GLenum pname,
+                              GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectuiv);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureGetQueryObjectuivEXT(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint id,
+                                 GLenum pname,
+                                 GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectuivEXT);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureGetQueryiv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLenum pname,
+                       GLint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryiv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetQueryivEXT(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryivEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetRenderbufferParameteriv(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLint *params)
+{
+    writer->writeCall(EntryPoint::GetRenderbufferParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetRenderbufferParameterivOES(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params)
+{
+    writer->writeCall(EntryPoint::GetRenderbufferParameterivOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetSamplerParameterIivOES(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      GLint *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterIivOES);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetSamplerParameterIuivOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterIuivOES);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureGetSamplerParameterfv(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterfv);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetSamplerParameteriv(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameteriv);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetSemaphoreParameterui64vEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint semaphore,
+                                          GLenum pname,
+                                          GLuint64 *params)
+{
+    writer->writeCall(EntryPoint::GetSemaphoreParameterui64vEXT);
+    writer->writeParam<uint32_t>(semaphore);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetShaderInfoLog(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint shader,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLchar *infoLog)
+{
+    writer->writeCall(EntryPoint::GetShaderInfoLog);
+    writer->writeParam<uint32_t>(shader);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(infoLog, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetShaderPrecisionFormat(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum shadertype,
+                                     GLenum precisiontype,
+                                     GLint *range,
+                                     GLint *precision)
+{
+    writer->writeCall(EntryPoint::GetShaderPrecisionFormat);
+    writer->writeParam<uint32_t>(shadertype);
+    writer->writeParam<uint32_t>(precisiontype);
+    writer->writeOutputPointer(range, static_cast<size_t>(2) * sizeof(GLint));
+    writer->writeOutputPointer(precision, static_cast<size_t>(1) * sizeof(GLint));
+}
+
+void CaptureGetShaderSource(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint shader,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLchar *source)
+{
+    writer->writeCall(EntryPoint::GetShaderSource);
+    writer->writeParam<uint32_t>(shader);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(source, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetShaderiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLuint shader,
+                        GLenum pname,
+                        GLint *params)
+{
+    writer->writeCall(EntryPoint::GetShaderiv);
+    writer->writeParam<uint32_t>(shader);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetString(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum name,
+                      const GLubyte *returnValue)
+{
+    writer->writeCall(EntryPoint::GetString);
+    writer->writeParam<uint32_t>(name);
+}
+
+void CaptureGetStringi(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum name,
+                       GLuint index,
+                       const GLubyte *returnValue)
+{
+    writer->writeCall(EntryPoint::GetStringi);
+    writer->writeParam<uint32_t>(name);
+    writer->writeParam<uint32_t>(index);
+}
+
+void CaptureGetSynciv(CaptureWriter *writer,
+                      const Context *context,
+                      GLsync sync,
+                      GLenum pname,
+                      GLsizei bufSize,
+                      GLsizei *length,
+                      GLint *values)
+{
+    writer->writeCall(EntryPoint::GetSynciv);
+    writer->writeSync(sync);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(values, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetTexEnvfv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLenum pname,
+                        GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexEnvfv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetTexEnviv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLenum pname,
+                        GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexEnviv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetTexEnvxv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLenum pname,
+                        GLfixed *params)
+{
+    writer->writeCall(EntryPoint::GetTexEnvxv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureGetTexGenfvOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum coord,
+                           GLenum pname,
+                           GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexGenfvOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetTexGenivOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum coord,
+                           GLenum pname,
+                           GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexGenivOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetTexGenxvOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum coord,
+                           GLenum pname,
+                           GLfixed *params)
+{
+    writer->writeCall(EntryPoint::GetTexGenxvOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureGetTexLevelParameterfv(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexLevelParameterfv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetTexLevelParameteriv(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexLevelParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetTexParameterIivOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterIivOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetTexParameterIuivOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterIuivOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureGetTexParameterfv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterfv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetTexParameteriv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetTexParameterxv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              GLfixed *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterxv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureGetTransformFeedbackVarying(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint program,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLsizei *size,
+                                        GLenum *type,
+                                        GLchar *name)
+{
+    writer->writeCall(EntryPoint::GetTransformFeedbackVarying);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(size, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(type, static_cast<size_t>(1) * sizeof(GLenum));
+    writer->writeOutputPointer(name, static_cast<size_t>(bufSize) * sizeof(GLchar));
+}
+
+void CaptureGetTranslatedShaderSourceANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint shader,
+                                           GLsizei bufsize,
+                                           GLsizei *length,
+                                           GLchar *source)
+{
+    writer->writeCall(EntryPoint::GetTranslatedShaderSourceANGLE);
+    writer->writeParam<uint32_t>(shader);
+    writer->writeParam<int32_t>(bufsize);
+    writer->writeOutputPointer(length, static_cast<size_t>(1) * sizeof(GLsizei));
+    writer->writeOutputPointer(source, 0);
+}
+
+void CaptureGetUniformBlockIndex(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint program,
+                                 const GLchar *uniformBlockName,
+                                 GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::GetUniformBlockIndex);
+    writer->writeParam<uint32_t>(program);
+    writer->writeString(uniformBlockName);
+}
+
+void CaptureGetUniformIndices(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLsizei uniformCount,
+                              const GLchar *const *uniformNames,
+                              GLuint *uniformIndices)
+{
+    writer->writeCall(EntryPoint::GetUniformIndices);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(uniformCount);
+    writer->writeStrings(uniformCount, uniformNames, nullptr);
+    writer->writeOutputPointer(uniformIndices, static_cast<size_t>(uniformCount) * sizeof(GLuint));
+}
+
+void CaptureGetUniformLocation(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               const GLchar *name,
+                               GLint returnValue)
+{
+    writer->writeCall(EntryPoint::GetUniformLocation);
+    writer->writeParam<uint32_t>(program);
+    writer->writeString(name);
+}
+
+void CaptureGetUniformfv(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLint location,
+                         GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetUniformfv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetUniformiv(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLint location,
+                         GLint *params)
+{
+    writer->writeCall(EntryPoint::GetUniformiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetUniformuiv(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint program,
+                          GLint location,
+                          GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetUniformuiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetUnsignedBytevEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum pname,
+                                GLubyte *data)
+{
+    writer->writeCall(EntryPoint::GetUnsignedBytevEXT);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(data, static_cast<size_t>(4) * sizeof(GLubyte));
+}
+
+void CaptureGetUnsignedBytei_vEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLuint index,
+                                  GLubyte *data)
+{
+    writer->writeCall(EntryPoint::GetUnsignedBytei_vEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeOutputPointer(data, static_cast<size_t>(target) * sizeof(GLubyte));
+}
+
+void CaptureGetVertexAttribIiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint index,
+                               GLenum pname,
+                               GLint *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribIiv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(1) * sizeof(GLint));
+}
+
+void CaptureGetVertexAttribIuiv(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint index,
+                                GLenum pname,
+                                GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribIuiv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(1) * sizeof(GLuint));
+}
+
+void CaptureGetVertexAttribPointerv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint index,
+                                    GLenum pname,
+                                    void **pointer)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribPointerv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(pointer, static_cast<size_t>(1) * sizeof(void *));
+}
+
+void CaptureGetVertexAttribfv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint index,
+                              GLenum pname,
+                              GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribfv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureGetVertexAttribiv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint index,
+                              GLenum pname,
+                              GLint *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribiv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureGetnUniformfvEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetnUniformfvEXT);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetnUniformivEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLint *params)
+{
+    writer->writeCall(EntryPoint::GetnUniformivEXT);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureHint(CaptureWriter *writer, const Context *context, GLenum target, GLenum mode)
+{
+    writer->writeCall(EntryPoint::Hint);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureImportMemoryFdEXT(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint memory,
+                              GLuint64 size,
+                              GLenum handleType,
+                              GLint fd)
+{
+    writer->writeCall(EntryPoint::ImportMemoryFdEXT);
+    writer->writeParam<uint32_t>(memory);
+    writer->writeParam<uint64_t>(size);
+    writer->writeParam<uint32_t>(handleType);
+    writer->writeParam<int32_t>(fd);
+}
+
+void CaptureImportSemaphoreFdEXT(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint semaphore,
+                                 GLenum handleType,
+                                 GLint fd)
+{
+    writer->writeCall(EntryPoint::ImportSemaphoreFdEXT);
+    writer->writeParam<uint32_t>(semaphore);
+    writer->writeParam<uint32_t>(handleType);
+    writer->writeParam<int32_t>(fd);
+}
+
+void CaptureInsertEventMarkerEXT(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLsizei length,
+                                 const GLchar *marker)
+{
+    writer->writeCall(EntryPoint::InsertEventMarkerEXT);
+    writer->writeParam<int32_t>(length);
+    writer->writeString(marker);
+}
+
+void CaptureInvalidateFramebuffer(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments)
+{
+    writer->writeCall(EntryPoint::InvalidateFramebuffer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(numAttachments);
+    writer->writeClientMemory(attachments, static_cast<size_t>(numAttachments) * sizeof(GLenum));
+}
+
+void CaptureInvalidateSubFramebuffer(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLsizei numAttachments,
+                                     const GLenum *attachments,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height)
+{
+    writer->writeCall(EntryPoint::InvalidateSubFramebuffer);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(numAttachments);
+    writer->writeClientMemory(attachments, static_cast<size_t>(numAttachments) * sizeof(GLenum));
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureIsBuffer(CaptureWriter *writer,
+                     const Context *context,
+                     GLuint buffer,
+                     GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsBuffer);
+    writer->writeParam<uint32_t>(buffer);
+}
+
+void CaptureIsEnabled(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum cap,
+                      GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsEnabled);
+    writer->writeParam<uint32_t>(cap);
+}
+
+void CaptureIsFenceNV(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint fence,
+                      GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsFenceNV);
+    writer->writeParam<uint32_t>(fence);
+}
+
+void CaptureIsFramebuffer(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint framebuffer,
+                          GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsFramebuffer);
+    writer->writeParam<uint32_t>(framebuffer);
+}
+
+void CaptureIsFramebufferOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint framebuffer,
+                             GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsFramebufferOES);
+    writer->writeParam<uint32_t>(framebuffer);
+}
+
+void CaptureIsMemoryObjectEXT(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint memoryObject,
+                              GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsMemoryObjectEXT);
+    writer->writeParam<uint32_t>(memoryObject);
+}
+
+void CaptureIsProgram(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint program,
+                      GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsProgram);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureIsProgramPipeline(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint pipeline,
+                              GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsProgramPipeline);
+    writer->writeParam<uint32_t>(pipeline);
+}
+
+void CaptureIsQuery(CaptureWriter *writer, const Context *context, GLuint id, GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsQuery);
+    writer->writeParam<uint32_t>(id);
+}
+
+void CaptureIsQueryEXT(CaptureWriter *writer,
+                       const Context *context,
+                       GLuint id,
+                       GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsQueryEXT);
+    writer->writeParam<uint32_t>(id);
+}
+
+void CaptureIsRenderbuffer(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint renderbuffer,
+                           GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsRenderbuffer);
+    writer->writeParam<uint32_t>(renderbuffer);
+}
+
+void CaptureIsRenderbufferOES(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint renderbuffer,
+                              GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsRenderbufferOES);
+    writer->writeParam<uint32_t>(renderbuffer);
+}
+
+void CaptureIsSemaphoreEXT(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint semaphore,
+                           GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsSemaphoreEXT);
+    writer->writeParam<uint32_t>(semaphore);
+}
+
+void CaptureIsSampler(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint sampler,
+                      GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsSampler);
+    writer->writeParam<uint32_t>(sampler);
+}
+
+void CaptureIsShader(CaptureWriter *writer,
+                     const Context *context,
+                     GLuint shader,
+                     GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsShader);
+    writer->writeParam<uint32_t>(shader);
+}
+
+void CaptureIsSync(CaptureWriter *writer,
+                   const Context *context,
+                   GLsync sync,
+                   GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsSync);
+    writer->writeSync(sync);
+}
+
+void CaptureIsTexture(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint texture,
+                      GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsTexture);
+    writer->writeParam<uint32_t>(texture);
+}
+
+void CaptureIsTransformFeedback(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint id,
+                                GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsTransformFeedback);
+    writer->writeParam<uint32_t>(id);
+}
+
+void CaptureIsVertexArray(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint array,
+                          GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsVertexArray);
+    writer->writeParam<uint32_t>(array);
+}
+
+void CaptureIsVertexArrayOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint array,
+                             GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsVertexArrayOES);
+    writer->writeParam<uint32_t>(array);
+}
+
+void CaptureLightModelf(CaptureWriter *writer, const Context *context, GLenum pname, GLfloat param)
+{
+    writer->writeCall(EntryPoint::LightModelf);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureLightModelfv(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum pname,
+                         const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::LightModelfv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureLightModelx(CaptureWriter *writer, const Context *context, GLenum pname, GLfixed param)
+{
+    writer->writeCall(EntryPoint::LightModelx);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureLightModelxv(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum pname,
+                         const GLfixed *param)
+{
+    writer->writeCall(EntryPoint::LightModelxv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureLightf(CaptureWriter *writer,
+                   const Context *context,
+                   GLenum light,
+                   GLenum pname,
+                   GLfloat param)
+{
+    writer->writeCall(EntryPoint::Lightf);
+    writer->writeParam<uint32_t>(light);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureLightfv(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum light,
+                    GLenum pname,
+                    const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::Lightfv);
+    writer->writeParam<uint32_t>(light);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureLightx(CaptureWriter *writer,
+                   const Context *context,
+                   GLenum light,
+                   GLenum pname,
+                   GLfixed param)
+{
+    writer->writeCall(EntryPoint::Lightx);
+    writer->writeParam<uint32_t>(light);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureLightxv(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum light,
+                    GLenum pname,
+                    const GLfixed *params)
+{
+    writer->writeCall(EntryPoint::Lightxv);
+    writer->writeParam<uint32_t>(light);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureLineWidth(CaptureWriter *writer, const Context *context, GLfloat width)
+{
+    writer->writeCall(EntryPoint::LineWidth);
+    writer->writeParam<float>(width);
+}
+
+void CaptureLineWidthx(CaptureWriter *writer, const Context *context, GLfixed width)
+{
+    writer->writeCall(EntryPoint::LineWidthx);
+    writer->writeParam<int32_t>(width);
+}
+
+void CaptureLinkProgram(CaptureWriter *writer, const Context *context, GLuint program)
+{
+    writer->writeCall(EntryPoint::LinkProgram);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureLoadIdentity(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::LoadIdentity);
+}
+
+void CaptureLoadMatrixf(CaptureWriter *writer, const Context *context, const GLfloat *m)
+{
+    writer->writeCall(EntryPoint::LoadMatrixf);
+    writer->writeClientMemory(m, static_cast<size_t>(16) * sizeof(GLfloat));
+}
+
+void CaptureLoadMatrixx(CaptureWriter *writer, const Context *context, const GLfixed *m)
+{
+    writer->writeCall(EntryPoint::LoadMatrixx);
+    writer->writeClientMemory(m, static_cast<size_t>(16) * sizeof(GLfixed));
+}
+
+void CaptureLoadPaletteFromModelViewMatrixOES(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::LoadPaletteFromModelViewMatrixOES);
+}
+
+void CaptureLogicOp(CaptureWriter *writer, const Context *context, GLenum opcode)
+{
+    writer->writeCall(EntryPoint::LogicOp);
+    writer->writeParam<uint32_t>(opcode);
+}
+
+void CaptureMapBufferOES(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum target,
+                         GLenum access,
+                         void *returnValue)
+{
+    writer->writeCall(EntryPoint::MapBufferOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(access);
+}
+
+void CaptureMapBufferRange(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLintptr offset,
+                           GLsizeiptr length,
+                           GLbitfield access,
+                           void *returnValue)
+{
+    writer->writeCall(EntryPoint::MapBufferRange);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int64_t>(length);
+    writer->writeParam<uint32_t>(access);
+}
+
+void CaptureMapBufferRangeEXT(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLintptr offset,
+                              GLsizeiptr length,
+                              GLbitfield access,
+                              void *returnValue)
+{
+    writer->writeCall(EntryPoint::MapBufferRangeEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int64_t>(offset);
+    writer->writeParam<int64_t>(length);
+    writer->writeParam<uint32_t>(access);
+}
+
+void CaptureMaterialf(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum face,
+                      GLenum pname,
+                      GLfloat param)
+{
+    writer->writeCall(EntryPoint::Materialf);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureMaterialfv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum face,
+                       GLenum pname,
+                       const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::Materialfv);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureMaterialx(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum face,
+                      GLenum pname,
+                      GLfixed param)
+{
+    writer->writeCall(EntryPoint::Materialx);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureMaterialxv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum face,
+                       GLenum pname,
+                       const GLfixed *param)
+{
+    writer->writeCall(EntryPoint::Materialxv);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureMatrixIndexPointerOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLint size,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer)
+{
+    writer->writeCall(EntryPoint::MatrixIndexPointerOES);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureMatrixMode(CaptureWriter *writer, const Context *context, GLenum mode)
+{
+    writer->writeCall(EntryPoint::MatrixMode);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureMaxShaderCompilerThreadsKHR(CaptureWriter *writer, const Context *context, GLuint count)
+{
+    writer->writeCall(EntryPoint::MaxShaderCompilerThreadsKHR);
+    writer->writeParam<uint32_t>(count);
+}
+
+void CaptureMemoryBarrier(CaptureWriter *writer, const Context *context, GLbitfield barriers)
+{
+    writer->writeCall(EntryPoint::MemoryBarrier);
+    writer->writeParam<uint32_t>(barriers);
+}
+
+void CaptureMemoryBarrierByRegion(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLbitfield barriers)
+{
+    writer->writeCall(EntryPoint::MemoryBarrierByRegion);
+    writer->writeParam<uint32_t>(barriers);
+}
+
+void CaptureMemoryObjectParameterivEXT(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint memoryObject,
+                                       GLenum pname,
+                                       const GLint *params)
+{
+    writer->writeCall(EntryPoint::MemoryObjectParameterivEXT);
+    writer->writeParam<uint32_t>(memoryObject);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeNullPointer();
+}
+
+void CaptureMultMatrixf(CaptureWriter *writer, const Context *context, const GLfloat *m)
+{
+    writer->writeCall(EntryPoint::MultMatrixf);
+    writer->writeClientMemory(m, static_cast<size_t>(16) * sizeof(GLfloat));
+}
+
+void CaptureMultMatrixx(CaptureWriter *writer, const Context *context, const GLfixed *m)
+{
+    writer->writeCall(EntryPoint::MultMatrixx);
+    writer->writeClientMemory(m, static_cast<size_t>(16) * sizeof(GLfixed));
+}
+
+void CaptureMultiTexCoord4f(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLfloat s,
+                            GLfloat t,
+                            GLfloat r,
+                            GLfloat q)
+{
+    writer->writeCall(EntryPoint::MultiTexCoord4f);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<float>(s);
+    writer->writeParam<float>(t);
+    writer->writeParam<float>(r);
+    writer->writeParam<float>(q);
+}
+
+void CaptureMultiTexCoord4x(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum texture,
+                            GLfixed s,
+                            GLfixed t,
+                            GLfixed r,
+                            GLfixed q)
+{
+    writer->writeCall(EntryPoint::MultiTexCoord4x);
+    writer->writeParam<uint32_t>(texture);
+    writer->writeParam<int32_t>(s);
+    writer->writeParam<int32_t>(t);
+    writer->writeParam<int32_t>(r);
+    writer->writeParam<int32_t>(q);
+}
+
+void CaptureNormal3f(CaptureWriter *writer,
+                     const Context *context,
+                     GLfloat nx,
+                     GLfloat ny,
+                     GLfloat nz)
+{
+    writer->writeCall(EntryPoint::Normal3f);
+    writer->writeParam<float>(nx);
+    writer->writeParam<float>(ny);
+    writer->writeParam<float>(nz);
+}
+
+void CaptureNormal3x(CaptureWriter *writer,
+                     const Context *context,
+                     GLfixed nx,
+                     GLfixed ny,
+                     GLfixed nz)
+{
+    writer->writeCall(EntryPoint::Normal3x);
+    writer->writeParam<int32_t>(nx);
+    writer->writeParam<int32_t>(ny);
+    writer->writeParam<int32_t>(nz);
+}
+
+void CaptureNormalPointer(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer)
+{
+    writer->writeCall(EntryPoint::NormalPointer);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureObjectLabelKHR(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum identifier,
+                           GLuint name,
+                           GLsizei length,
+                           const GLchar *label)
+{
+    writer->writeCall(EntryPoint::ObjectLabelKHR);
+    writer->writeParam<uint32_t>(identifier);
+    writer->writeParam<uint32_t>(name);
+    writer->writeParam<int32_t>(length);
+    writer->writeString(label);
+}
+
+void CaptureObjectPtrLabelKHR(CaptureWriter *writer,
+                              const Context *context,
+                              const void *ptr,
+                              GLsizei length,
+                              const GLchar *label)
+{
+    writer->writeCall(EntryPoint::ObjectPtrLabelKHR);
+    writer->writeNullPointer();
+    writer->writeParam<int32_t>(length);
+    writer->writeString(label);
+}
+
+void CaptureOrthof(CaptureWriter *writer,
+                   const Context *context,
+                   GLfloat l,
+                   GLfloat r,
+                   GLfloat b,
+                   GLfloat t,
+                   GLfloat n,
+                   GLfloat f)
+{
+    writer->writeCall(EntryPoint::Orthof);
+    writer->writeParam<float>(l);
+    writer->writeParam<float>(r);
+    writer->writeParam<float>(b);
+    writer->writeParam<float>(t);
+    writer->writeParam<float>(n);
+    writer->writeParam<float>(f);
+}
+
+void CaptureOrthox(CaptureWriter *writer,
+                   const Context *context,
+                   GLfixed l,
+                   GLfixed r,
+                   GLfixed b,
+                   GLfixed t,
+                   GLfixed n,
+                   GLfixed f)
+{
+    writer->writeCall(EntryPoint::Orthox);
+    writer->writeParam<int32_t>(l);
+    writer->writeParam<int32_t>(r);
+    writer->writeParam<int32_t>(b);
+    writer->writeParam<int32_t>(t);
+    writer->writeParam<int32_t>(n);
+    writer->writeParam<int32_t>(f);
+}
+
+void CapturePauseTransformFeedback(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::PauseTransformFeedback);
+}
+
+void CapturePixelStorei(CaptureWriter *writer, const Context *context, GLenum pname, GLint param)
+{
+    writer->writeCall(EntryPoint::PixelStorei);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CapturePointParameterf(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum pname,
+                            GLfloat param)
+{
+    writer->writeCall(EntryPoint::PointParameterf);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CapturePointParameterfv(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum pname,
+                             const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::PointParameterfv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CapturePointParameterx(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum pname,
+                            GLfixed param)
+{
+    writer->writeCall(EntryPoint::PointParameterx);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CapturePointParameterxv(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum pname,
+                             const GLfixed *params)
+{
+    writer->writeCall(EntryPoint::PointParameterxv);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CapturePointSize(CaptureWriter *writer, const Context *context, GLfloat size)
+{
+    writer->writeCall(EntryPoint::PointSize);
+    writer->writeParam<float>(size);
+}
+
+void CapturePointSizePointerOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum type,
+                                GLsizei stride,
+                                const void *pointer)
+{
+    writer->writeCall(EntryPoint::PointSizePointerOES);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CapturePointSizex(CaptureWriter *writer, const Context *context, GLfixed size)
+{
+    writer->writeCall(EntryPoint::PointSizex);
+    writer->writeParam<int32_t>(size);
+}
+
+void CapturePolygonOffset(CaptureWriter *writer,
+                          const Context *context,
+                          GLfloat factor,
+                          GLfloat units)
+{
+    writer->writeCall(EntryPoint::PolygonOffset);
+    writer->writeParam<float>(factor);
+    writer->writeParam<float>(units);
+}
+
+void CapturePolygonOffsetx(CaptureWriter *writer,
+                           const Context *context,
+                           GLfixed factor,
+                           GLfixed units)
+{
+    writer->writeCall(EntryPoint::PolygonOffsetx);
+    writer->writeParam<int32_t>(factor);
+    writer->writeParam<int32_t>(units);
+}
+
+void CapturePopDebugGroupKHR(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::PopDebugGroupKHR);
+}
+
+void CapturePopGroupMarkerEXT(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::PopGroupMarkerEXT);
+}
+
+void CapturePopMatrix(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::PopMatrix);
+}
+
+void CaptureProgramBinary(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint program,
+                          GLenum binaryFormat,
+                          const void *binary,
+                          GLsizei length)
+{
+    writer->writeCall(EntryPoint::ProgramBinary);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(binaryFormat);
+    writer->writeClientMemory(binary, static_cast<size_t>(length));
+    writer->writeParam<int32_t>(length);
+}
+
+void CaptureProgramBinaryOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLenum binaryFormat,
+                             const void *binary,
+                             GLint length)
+{
+    writer->writeCall(EntryPoint::ProgramBinaryOES);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(binaryFormat);
+    writer->writeClientMemory(binary, static_cast<size_t>(length));
+    writer->writeParam<int32_t>(length);
+}
+
+void CaptureProgramParameteri(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLenum pname,
+                              GLint value)
+{
+    writer->writeCall(EntryPoint::ProgramParameteri);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(value);
+}
+
+void CaptureProgramUniform1f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0)
+{
+    writer->writeCall(EntryPoint::ProgramUniform1f);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+}
+
+void CaptureProgramUniform1fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform1fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniform1i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0)
+{
+    writer->writeCall(EntryPoint::ProgramUniform1i);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+}
+
+void CaptureProgramUniform1iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform1iv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count) * sizeof(GLint));
+}
+
+void CaptureProgramUniform1ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0)
+{
+    writer->writeCall(EntryPoint::ProgramUniform1ui);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+}
+
+void CaptureProgramUniform1uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform1uiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count) * sizeof(GLuint));
+}
+
+void CaptureProgramUniform2f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1)
+{
+    writer->writeCall(EntryPoint::ProgramUniform2f);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+    writer->writeParam<float>(v1);
+}
+
+void CaptureProgramUniform2fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform2fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 2) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniform2i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1)
+{
+    writer->writeCall(EntryPoint::ProgramUniform2i);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+    writer->writeParam<int32_t>(v1);
+}
+
+void CaptureProgramUniform2iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform2iv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 2) * sizeof(GLint));
+}
+
+void CaptureProgramUniform2ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1)
+{
+    writer->writeCall(EntryPoint::ProgramUniform2ui);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+    writer->writeParam<uint32_t>(v1);
+}
+
+void CaptureProgramUniform2uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform2uiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 2) * sizeof(GLuint));
+}
+
+void CaptureProgramUniform3f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2)
+{
+    writer->writeCall(EntryPoint::ProgramUniform3f);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+    writer->writeParam<float>(v1);
+    writer->writeParam<float>(v2);
+}
+
+void CaptureProgramUniform3fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform3fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 3) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniform3i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2)
+{
+    writer->writeCall(EntryPoint::ProgramUniform3i);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+    writer->writeParam<int32_t>(v1);
+    writer->writeParam<int32_t>(v2);
+}
+
+void CaptureProgramUniform3iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform3iv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 3) * sizeof(GLint));
+}
+
+void CaptureProgramUniform3ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2)
+{
+    writer->writeCall(EntryPoint::ProgramUniform3ui);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+    writer->writeParam<uint32_t>(v1);
+    writer->writeParam<uint32_t>(v2);
+}
+
+void CaptureProgramUniform3uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform3uiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 3) * sizeof(GLuint));
+}
+
+void CaptureProgramUniform4f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2,
+                             GLfloat v3)
+{
+    writer->writeCall(EntryPoint::ProgramUniform4f);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+    writer->writeParam<float>(v1);
+    writer->writeParam<float>(v2);
+    writer->writeParam<float>(v3);
+}
+
+void CaptureProgramUniform4fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform4fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniform4i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2,
+                             GLint v3)
+{
+    writer->writeCall(EntryPoint::ProgramUniform4i);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+    writer->writeParam<int32_t>(v1);
+    writer->writeParam<int32_t>(v2);
+    writer->writeParam<int32_t>(v3);
+}
+
+void CaptureProgramUniform4iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform4iv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLint));
+}
+
+void CaptureProgramUniform4ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2,
+                              GLuint v3)
+{
+    writer->writeCall(EntryPoint::ProgramUniform4ui);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+    writer->writeParam<uint32_t>(v1);
+    writer->writeParam<uint32_t>(v2);
+    writer->writeParam<uint32_t>(v3);
+}
+
+void CaptureProgramUniform4uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniform4uiv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLuint));
+}
+
+void CaptureProgramUniformMatrix2fv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix2fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix2x3fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix2x3fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 6) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix2x4fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix2x4fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 8) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix3fv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix3fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 9) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix3x2fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix3x2fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 6) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix3x4fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix3x4fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 12) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix4fv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix4fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 16) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix4x2fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix4x2fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 8) * sizeof(GLfloat));
+}
+
+void CaptureProgramUniformMatrix4x3fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::ProgramUniformMatrix4x3fv);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 12) * sizeof(GLfloat));
+}
+
+void CapturePushDebugGroupKHR(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum source,
+                              GLuint id,
+                              GLsizei length,
+                              const GLchar *message)
+{
+    writer->writeCall(EntryPoint::PushDebugGroupKHR);
+    writer->writeParam<uint32_t>(source);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<int32_t>(length);
+    writer->writeString(message);
+}
+
+void CapturePushGroupMarkerEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei length,
+                               const GLchar *marker)
+{
+    writer->writeCall(EntryPoint::PushGroupMarkerEXT);
+    writer->writeParam<int32_t>(length);
+    writer->writeString(marker);
+}
+
+void CapturePushMatrix(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::PushMatrix);
+}
+
+void CaptureQueryCounterEXT(CaptureWriter *writer, const Context *context, GLuint id, GLenum target)
+{
+    writer->writeCall(EntryPoint::QueryCounterEXT);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureQueryMatrixxOES(CaptureWriter *writer,
+                            const Context *context,
+                            GLfixed *mantissa,
+                            GLint *exponent,
+                            GLbitfield returnValue)
+{
+    writer->writeCall(EntryPoint::QueryMatrixxOES);
+    writer->writeOutputPointer(mantissa, static_cast<size_t>(16) * sizeof(GLfixed));
+    writer->writeOutputPointer(exponent, static_cast<size_t>(16) * sizeof(GLint));
+}
+
+void CaptureReadBuffer(CaptureWriter *writer, const Context *context, GLenum src)
+{
+    writer->writeCall(EntryPoint::ReadBuffer);
+    writer->writeParam<uint32_t>(src);
+}
+
+void CaptureReadPixels(CaptureWriter *writer,
+                       const Context *context,
+                       GLint x,
+                       GLint y,
+                       GLsizei width,
+                       GLsizei height,
+                       GLenum format,
+                       GLenum type,
+                       void *pixels)
+{
+    writer->writeCall(EntryPoint::ReadPixels);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writePackPixels(context, pixels, format, type, width, height);
+}
+
+void CaptureReadnPixelsEXT(CaptureWriter *writer,
+                           const Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei bufSize,
+                           void *data)
+{
+    writer->writeCall(EntryPoint::ReadnPixelsEXT);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writePackPixels(context, data, format, type, width, height);
+}
+
+void CaptureReleaseShaderCompiler(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::ReleaseShaderCompiler);
+}
+
+void CaptureRenderbufferStorage(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height)
+{
+    writer->writeCall(EntryPoint::RenderbufferStorage);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureRenderbufferStorageMultisample(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height)
+{
+    writer->writeCall(EntryPoint::RenderbufferStorageMultisample);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureRenderbufferStorageMultisampleANGLE(CaptureWriter *writer,
+                                                const Context *context,
+                                                GLenum target,
+                                                GLsizei samples,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height)
+{
+    writer->writeCall(EntryPoint::RenderbufferStorageMultisampleANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureRenderbufferStorageOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height)
+{
+    writer->writeCall(EntryPoint::RenderbufferStorageOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureResumeTransformFeedback(CaptureWriter *writer, const Context *context)
+{
+    writer->writeCall(EntryPoint::ResumeTransformFeedback);
+}
+
+void CaptureRotatef(CaptureWriter *writer,
+                    const Context *context,
+                    GLfloat angle,
+                    GLfloat x,
+                    GLfloat y,
+                    GLfloat z)
+{
+    writer->writeCall(EntryPoint::Rotatef);
+    writer->writeParam<float>(angle);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+    writer->writeParam<float>(z);
+}
+
+void CaptureRotatex(CaptureWriter *writer,
+                    const Context *context,
+                    GLfixed angle,
+                    GLfixed x,
+                    GLfixed y,
+                    GLfixed z)
+{
+    writer->writeCall(EntryPoint::Rotatex);
+    writer->writeParam<int32_t>(angle);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+}
+
+void CaptureSampleCoverage(CaptureWriter *writer,
+                           const Context *context,
+                           GLfloat value,
+                           GLboolean invert)
+{
+    writer->writeCall(EntryPoint::SampleCoverage);
+    writer->writeParam<float>(value);
+    writer->writeParam<uint8_t>(invert);
+}
+
+void CaptureSampleCoveragex(CaptureWriter *writer,
+                            const Context *context,
+                            GLclampx value,
+                            GLboolean invert)
+{
+    writer->writeCall(EntryPoint::SampleCoveragex);
+    writer->writeParam<int32_t>(value);
+    writer->writeParam<uint8_t>(invert);
+}
+
+void CaptureSampleMaski(CaptureWriter *writer,
+                        const Context *context,
+                        GLuint maskNumber,
+                        GLbitfield mask)
+{
+    writer->writeCall(EntryPoint::SampleMaski);
+    writer->writeParam<uint32_t>(maskNumber);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureSamplerParameterIivOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterIivOES);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureSamplerParameterIuivOES(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint sampler,
+                                    GLenum pname,
+                                    const GLuint *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterIuivOES);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureSamplerParameterf(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint sampler,
+                              GLenum pname,
+                              GLfloat param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterf);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureSamplerParameterfv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLfloat *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterfv);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureSamplerParameteri(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint sampler,
+                              GLenum pname,
+                              GLint param)
+{
+    writer->writeCall(EntryPoint::SamplerParameteri);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureSamplerParameteriv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLint *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameteriv);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(param, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureScalef(CaptureWriter *writer, const Context *context, GLfloat x, GLfloat y, GLfloat z)
+{
+    writer->writeCall(EntryPoint::Scalef);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+    writer->writeParam<float>(z);
+}
+
+void CaptureScalex(CaptureWriter *writer, const Context *context, GLfixed x, GLfixed y, GLfixed z)
+{
+    writer->writeCall(EntryPoint::Scalex);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+}
+
+void CaptureScissor(CaptureWriter *writer,
+                    const Context *context,
+                    GLint x,
+                    GLint y,
+                    GLsizei width,
+                    GLsizei height)
+{
+    writer->writeCall(EntryPoint::Scissor);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureSemaphoreParameterui64vEXT(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint semaphore,
+                                       GLenum pname,
+                                       const GLuint64 *params)
+{
+    writer->writeCall(EntryPoint::SemaphoreParameterui64vEXT);
+    writer->writeParam<uint32_t>(semaphore);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeNullPointer();
+}
+
+void CaptureSetFenceNV(CaptureWriter *writer,
+                       const Context *context,
+                       GLuint fence,
+                       GLenum condition)
+{
+    writer->writeCall(EntryPoint::SetFenceNV);
+    writer->writeParam<uint32_t>(fence);
+    writer->writeParam<uint32_t>(condition);
+}
+
+void CaptureShadeModel(CaptureWriter *writer, const Context *context, GLenum mode)
+{
+    writer->writeCall(EntryPoint::ShadeModel);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureShaderBinary(CaptureWriter *writer,
+                         const Context *context,
+                         GLsizei count,
+                         const GLuint *shaders,
+                         GLenum binaryformat,
+                         const void *binary,
+                         GLsizei length)
+{
+    writer->writeCall(EntryPoint::ShaderBinary);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(shaders, static_cast<size_t>(count) * sizeof(GLuint));
+    writer->writeParam<uint32_t>(binaryformat);
+    writer->writeClientMemory(binary, static_cast<size_t>(length));
+    writer->writeParam<int32_t>(length);
+}
+
+void CaptureShaderSource(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint shader,
+                         GLsizei count,
+                         const GLchar *const *string,
+                         const GLint *length)
+{
+    writer->writeCall(EntryPoint::ShaderSource);
+    writer->writeParam<uint32_t>(shader);
+    writer->writeParam<int32_t>(count);
+    writer->writeStrings(count, string, length);
+    writer->writeClientMemory(length, static_cast<size_t>(count) * sizeof(GLint));
+}
+
+void CaptureSignalSemaphoreEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *dstLayouts)
+{
+    writer->writeCall(EntryPoint::SignalSemaphoreEXT);
+    writer->writeParam<uint32_t>(semaphore);
+    writer->writeParam<uint32_t>(numBufferBarriers);
+    writer->writeClientMemory(buffers, static_cast<size_t>(numBufferBarriers) * sizeof(GLuint));
+    writer->writeParam<uint32_t>(numTextureBarriers);
+    writer->writeClientMemory(textures, static_cast<size_t>(numTextureBarriers) * sizeof(GLuint));
+    writer->writeClientMemory(dstLayouts, static_cast<size_t>(numTextureBarriers) * sizeof(GLenum));
+}
+
+void CaptureStencilFunc(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum func,
+                        GLint ref,
+                        GLuint mask)
+{
+    writer->writeCall(EntryPoint::StencilFunc);
+    writer->writeParam<uint32_t>(func);
+    writer->writeParam<int32_t>(ref);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureStencilFuncSeparate(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum face,
+                                GLenum func,
+                                GLint ref,
+                                GLuint mask)
+{
+    writer->writeCall(EntryPoint::StencilFuncSeparate);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(func);
+    writer->writeParam<int32_t>(ref);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureStencilMask(CaptureWriter *writer, const Context *context, GLuint mask)
+{
+    writer->writeCall(EntryPoint::StencilMask);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureStencilMaskSeparate(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum face,
+                                GLuint mask)
+{
+    writer->writeCall(EntryPoint::StencilMaskSeparate);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureStencilOp(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum fail,
+                      GLenum zfail,
+                      GLenum zpass)
+{
+    writer->writeCall(EntryPoint::StencilOp);
+    writer->writeParam<uint32_t>(fail);
+    writer->writeParam<uint32_t>(zfail);
+    writer->writeParam<uint32_t>(zpass);
+}
+
+void CaptureStencilOpSeparate(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum face,
+                              GLenum sfail,
+                              GLenum dpfail,
+                              GLenum dppass)
+{
+    writer->writeCall(EntryPoint::StencilOpSeparate);
+    writer->writeParam<uint32_t>(face);
+    writer->writeParam<uint32_t>(sfail);
+    writer->writeParam<uint32_t>(dpfail);
+    writer->writeParam<uint32_t>(dppass);
+}
+
+void CaptureTestFenceNV(CaptureWriter *writer,
+                        const Context *context,
+                        GLuint fence,
+                        GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::TestFenceNV);
+    writer->writeParam<uint32_t>(fence);
+}
+
+void CaptureTexCoordPointer(CaptureWriter *writer,
+                            const Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer)
+{
+    writer->writeCall(EntryPoint::TexCoordPointer);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureTexEnvf(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum target,
+                    GLenum pname,
+                    GLfloat param)
+{
+    writer->writeCall(EntryPoint::TexEnvf);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureTexEnvfv(CaptureWriter *writer,
+                     const Context *context,
+                     GLenum target,
+                     GLenum pname,
+                     const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::TexEnvfv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureTexEnvi(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum target,
+                    GLenum pname,
+                    GLint param)
+{
+    writer->writeCall(EntryPoint::TexEnvi);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureTexEnviv(CaptureWriter *writer,
+                     const Context *context,
+                     GLenum target,
+                     GLenum pname,
+                     const GLint *params)
+{
+    writer->writeCall(EntryPoint::TexEnviv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureTexEnvx(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum target,
+                    GLenum pname,
+                    GLfixed param)
+{
+    writer->writeCall(EntryPoint::TexEnvx);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureTexEnvxv(CaptureWriter *writer,
+                     const Context *context,
+                     GLenum target,
+                     GLenum pname,
+                     const GLfixed *params)
+{
+    writer->writeCall(EntryPoint::TexEnvxv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureTexGenfOES(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum coord,
+                       GLenum pname,
+                       GLfloat param)
+{
+    writer->writeCall(EntryPoint::TexGenfOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureTexGenfvOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum coord,
+                        GLenum pname,
+                        const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::TexGenfvOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureTexGeniOES(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum coord,
+                       GLenum pname,
+                       GLint param)
+{
+    writer->writeCall(EntryPoint::TexGeniOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureTexGenivOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum coord,
+                        GLenum pname,
+                        const GLint *params)
+{
+    writer->writeCall(EntryPoint::TexGenivOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureTexGenxOES(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum coord,
+                       GLenum pname,
+                       GLfixed param)
+{
+    writer->writeCall(EntryPoint::TexGenxOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureTexGenxvOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum coord,
+                        GLenum pname,
+                        const GLfixed *params)
+{
+    writer->writeCall(EntryPoint::TexGenxvOES);
+    writer->writeParam<uint32_t>(coord);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureTexImage2D(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexImage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeUnpackPixels(context, pixels, format, type, width, height, 1, false);
+}
+
+void CaptureTexImage3D(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexImage3D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeUnpackPixels(context, pixels, format, type, width, height, depth, true);
+}
+
+void CaptureTexParameterIivOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLenum pname,
+                               const GLint *params)
+{
+    writer->writeCall(EntryPoint::TexParameterIivOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureTexParameterIuivOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLenum pname,
+                                const GLuint *params)
+{
+    writer->writeCall(EntryPoint::TexParameterIuivOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureTexParameterf(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLfloat param)
+{
+    writer->writeCall(EntryPoint::TexParameterf);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(param);
+}
+
+void CaptureTexParameterfv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::TexParameterfv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureTexParameteri(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLint param)
+{
+    writer->writeCall(EntryPoint::TexParameteri);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureTexParameteriv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLint *params)
+{
+    writer->writeCall(EntryPoint::TexParameteriv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureTexParameterx(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLfixed param)
+{
+    writer->writeCall(EntryPoint::TexParameterx);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(param);
+}
+
+void CaptureTexParameterxv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfixed *params)
+{
+    writer->writeCall(EntryPoint::TexParameterxv);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeClientMemory(params, static_cast<size_t>(4) * sizeof(GLfixed));
+}
+
+void CaptureTexStorage1DEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width)
+{
+    writer->writeCall(EntryPoint::TexStorage1DEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+}
+
+void CaptureTexStorage2D(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height)
+{
+    writer->writeCall(EntryPoint::TexStorage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureTexStorage2DEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height)
+{
+    writer->writeCall(EntryPoint::TexStorage2DEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureTexStorage2DMultisample(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLsizei samples,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLboolean fixedsamplelocations)
+{
+    writer->writeCall(EntryPoint::TexStorage2DMultisample);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint8_t>(fixedsamplelocations);
+}
+
+void CaptureTexStorage3D(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth)
+{
+    writer->writeCall(EntryPoint::TexStorage3D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+}
+
+void CaptureTexStorage3DEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth)
+{
+    writer->writeCall(EntryPoint::TexStorage3DEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+}
+
+void CaptureTexStorage3DMultisampleOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLsizei samples,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLboolean fixedsamplelocations)
+{
+    writer->writeCall(EntryPoint::TexStorage3DMultisampleOES);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint8_t>(fixedsamplelocations);
+}
+
+void CaptureTexStorageMem2DEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLuint memory,
+                               GLuint64 offset)
+{
+    writer->writeCall(EntryPoint::TexStorageMem2DEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalFormat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(memory);
+    writer->writeParam<uint64_t>(offset);
+}
+
+void CaptureTexStorageMem2DMultisampleEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset)
+{
+    writer->writeCall(EntryPoint::TexStorageMem2DMultisampleEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalFormat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint8_t>(fixedSampleLocations);
+    writer->writeParam<uint32_t>(memory);
+    writer->writeParam<uint64_t>(offset);
+}
+
+void CaptureTexStorageMem3DEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLsizei depth,
+                               GLuint memory,
+                               GLuint64 offset)
+{
+    writer->writeCall(EntryPoint::TexStorageMem3DEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(levels);
+    writer->writeParam<uint32_t>(internalFormat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint32_t>(memory);
+    writer->writeParam<uint64_t>(offset);
+}
+
+void CaptureTexStorageMem3DMultisampleEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLsizei depth,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset)
+{
+    writer->writeCall(EntryPoint::TexStorageMem3DMultisampleEXT);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalFormat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint8_t>(fixedSampleLocations);
+    writer->writeParam<uint32_t>(memory);
+    writer->writeParam<uint64_t>(offset);
+}
+
+void CaptureTexSubImage2D(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexSubImage2D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeUnpackPixels(context, pixels, format, type, width, height, 1, false);
+}
+
+void CaptureTexSubImage3D(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLint zoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLsizei depth,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexSubImage3D);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(zoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeUnpackPixels(context, pixels, format, type, width, height, depth, true);
+}
+
+void CaptureTransformFeedbackVaryings(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLsizei count,
+                                      const GLchar *const *varyings,
+                                      GLenum bufferMode)
+{
+    writer->writeCall(EntryPoint::TransformFeedbackVaryings);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(count);
+    writer->writeStrings(count, varyings, nullptr);
+    writer->writeParam<uint32_t>(bufferMode);
+}
+
+void CaptureTranslatef(CaptureWriter *writer,
+                       const Context *context,
+                       GLfloat x,
+                       GLfloat y,
+                       GLfloat z)
+{
+    writer->writeCall(EntryPoint::Translatef);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+    writer->writeParam<float>(z);
+}
+
+void CaptureTranslatex(CaptureWriter *writer,
+                       const Context *context,
+                       GLfixed x,
+                       GLfixed y,
+                       GLfixed z)
+{
+    writer->writeCall(EntryPoint::Translatex);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+}
+
+void CaptureUniform1f(CaptureWriter *writer, const Context *context, GLint location, GLfloat v0)
+{
+    writer->writeCall(EntryPoint::Uniform1f);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+}
+
+void CaptureUniform1fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::Uniform1fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 1) * sizeof(GLfloat));
+}
+
+void CaptureUniform1i(CaptureWriter *writer, const Context *context, GLint location, GLint v0)
+{
+    writer->writeCall(EntryPoint::Uniform1i);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+}
+
+void CaptureUniform1iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value)
+{
+    writer->writeCall(EntryPoint::Uniform1iv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 1) * sizeof(GLint));
+}
+
+void CaptureUniform1ui(CaptureWriter *writer, const Context *context, GLint location, GLuint v0)
+{
+    writer->writeCall(EntryPoint::Uniform1ui);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+}
+
+void CaptureUniform1uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value)
+{
+    writer->writeCall(EntryPoint::Uniform1uiv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 1) * sizeof(GLuint));
+}
+
+void CaptureUniform2f(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1)
+{
+    writer->writeCall(EntryPoint::Uniform2f);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+    writer->writeParam<float>(v1);
+}
+
+void CaptureUniform2fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::Uniform2fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 2) * sizeof(GLfloat));
+}
+
+void CaptureUniform2i(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1)
+{
+    writer->writeCall(EntryPoint::Uniform2i);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+    writer->writeParam<int32_t>(v1);
+}
+
+void CaptureUniform2iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value)
+{
+    writer->writeCall(EntryPoint::Uniform2iv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 2) * sizeof(GLint));
+}
+
+void CaptureUniform2ui(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1)
+{
+    writer->writeCall(EntryPoint::Uniform2ui);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+    writer->writeParam<uint32_t>(v1);
+}
+
+void CaptureUniform2uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value)
+{
+    writer->writeCall(EntryPoint::Uniform2uiv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 2) * sizeof(GLuint));
+}
+
+void CaptureUniform3f(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2)
+{
+    writer->writeCall(EntryPoint::Uniform3f);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+    writer->writeParam<float>(v1);
+    writer->writeParam<float>(v2);
+}
+
+void CaptureUniform3fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::Uniform3fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 3) * sizeof(GLfloat));
+}
+
+void CaptureUniform3i(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1,
+                      GLint v2)
+{
+    writer->writeCall(EntryPoint::Uniform3i);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+    writer->writeParam<int32_t>(v1);
+    writer->writeParam<int32_t>(v2);
+}
+
+void CaptureUniform3iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value)
+{
+    writer->writeCall(EntryPoint::Uniform3iv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 3) * sizeof(GLint));
+}
+
+void CaptureUniform3ui(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1,
+                       GLuint v2)
+{
+    writer->writeCall(EntryPoint::Uniform3ui);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+    writer->writeParam<uint32_t>(v1);
+    writer->writeParam<uint32_t>(v2);
+}
+
+void CaptureUniform3uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value)
+{
+    writer->writeCall(EntryPoint::Uniform3uiv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 3) * sizeof(GLuint));
+}
+
+void CaptureUniform4f(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2,
+                      GLfloat v3)
+{
+    writer->writeCall(EntryPoint::Uniform4f);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<float>(v0);
+    writer->writeParam<float>(v1);
+    writer->writeParam<float>(v2);
+    writer->writeParam<float>(v3);
+}
+
+void CaptureUniform4fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::Uniform4fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLfloat));
+}
+
+void CaptureUniform4i(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1,
+                      GLint v2,
+                      GLint v3)
+{
+    writer->writeCall(EntryPoint::Uniform4i);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(v0);
+    writer->writeParam<int32_t>(v1);
+    writer->writeParam<int32_t>(v2);
+    writer->writeParam<int32_t>(v3);
+}
+
+void CaptureUniform4iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value)
+{
+    writer->writeCall(EntryPoint::Uniform4iv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLint));
+}
+
+void CaptureUniform4ui(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1,
+                       GLuint v2,
+                       GLuint v3)
+{
+    writer->writeCall(EntryPoint::Uniform4ui);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(v0);
+    writer->writeParam<uint32_t>(v1);
+    writer->writeParam<uint32_t>(v2);
+    writer->writeParam<uint32_t>(v3);
+}
+
+void CaptureUniform4uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value)
+{
+    writer->writeCall(EntryPoint::Uniform4uiv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLuint));
+}
+
+void CaptureUniformBlockBinding(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                GLuint uniformBlockIndex,
+                                GLuint uniformBlockBinding)
+{
+    writer->writeCall(EntryPoint::UniformBlockBinding);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(uniformBlockIndex);
+    writer->writeParam<uint32_t>(uniformBlockBinding);
+}
+
+void CaptureUniformMatrix2fv(CaptureWriter *writer,
+                             const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix2fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 4) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix2x3fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix2x3fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 6) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix2x4fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix2x4fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 8) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix3fv(CaptureWriter *writer,
+                             const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix3fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 9) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix3x2fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix3x2fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 6) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix3x4fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix3x4fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 12) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix4fv(CaptureWriter *writer,
+                             const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix4fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 16) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix4x2fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix4x2fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 8) * sizeof(GLfloat));
+}
+
+void CaptureUniformMatrix4x3fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value)
+{
+    writer->writeCall(EntryPoint::UniformMatrix4x3fv);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(count);
+    writer->writeParam<uint8_t>(transpose);
+    writer->writeClientMemory(value, static_cast<size_t>(count * 12) * sizeof(GLfloat));
+}
+
+void CaptureUnmapBuffer(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::UnmapBuffer);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureUnmapBufferOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::UnmapBufferOES);
+    writer->writeParam<uint32_t>(target);
+}
+
+void CaptureUseProgram(CaptureWriter *writer, const Context *context, GLuint program)
+{
+    writer->writeCall(EntryPoint::UseProgram);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureUseProgramStages(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint pipeline,
+                             GLbitfield stages,
+                             GLuint program)
+{
+    writer->writeCall(EntryPoint::UseProgramStages);
+    writer->writeParam<uint32_t>(pipeline);
+    writer->writeParam<uint32_t>(stages);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureValidateProgram(CaptureWriter *writer, const Context *context, GLuint program)
+{
+    writer->writeCall(EntryPoint::ValidateProgram);
+    writer->writeParam<uint32_t>(program);
+}
+
+void CaptureValidateProgramPipeline(CaptureWriter *writer, const Context *context, GLuint pipeline)
+{
+    writer->writeCall(EntryPoint::ValidateProgramPipeline);
+    writer->writeParam<uint32_t>(pipeline);
+}
+
+void CaptureVertexAttrib1f(CaptureWriter *writer, const Context *context, GLuint index, GLfloat x)
+{
+    writer->writeCall(EntryPoint::VertexAttrib1f);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<float>(x);
+}
+
+void CaptureVertexAttrib1fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v)
+{
+    writer->writeCall(EntryPoint::VertexAttrib1fv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeClientMemory(v, static_cast<size_t>(1) * sizeof(GLfloat));
+}
+
+void CaptureVertexAttrib2f(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y)
+{
+    writer->writeCall(EntryPoint::VertexAttrib2f);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+}
+
+void CaptureVertexAttrib2fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v)
+{
+    writer->writeCall(EntryPoint::VertexAttrib2fv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeClientMemory(v, static_cast<size_t>(2) * sizeof(GLfloat));
+}
+
+void CaptureVertexAttrib3f(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z)
+{
+    writer->writeCall(EntryPoint::VertexAttrib3f);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+    writer->writeParam<float>(z);
+}
+
+void CaptureVertexAttrib3fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v)
+{
+    writer->writeCall(EntryPoint::VertexAttrib3fv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeClientMemory(v, static_cast<size_t>(3) * sizeof(GLfloat));
+}
+
+void CaptureVertexAttrib4f(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z,
+                           GLfloat w)
+{
+    writer->writeCall(EntryPoint::VertexAttrib4f);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<float>(x);
+    writer->writeParam<float>(y);
+    writer->writeParam<float>(z);
+    writer->writeParam<float>(w);
+}
+
+void CaptureVertexAttrib4fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v)
+{
+    writer->writeCall(EntryPoint::VertexAttrib4fv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeClientMemory(v, static_cast<size_t>(4) * sizeof(GLfloat));
+}
+
+void CaptureVertexAttribBinding(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint attribindex,
+                                GLuint bindingindex)
+{
+    writer->writeCall(EntryPoint::VertexAttribBinding);
+    writer->writeParam<uint32_t>(attribindex);
+    writer->writeParam<uint32_t>(bindingindex);
+}
+
+void CaptureVertexAttribDivisor(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint index,
+                                GLuint divisor)
+{
+    writer->writeCall(EntryPoint::VertexAttribDivisor);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(divisor);
+}
+
+void CaptureVertexAttribDivisorANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint index,
+                                     GLuint divisor)
+{
+    writer->writeCall(EntryPoint::VertexAttribDivisorANGLE);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(divisor);
+}
+
+void CaptureVertexAttribDivisorEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint index,
+                                   GLuint divisor)
+{
+    writer->writeCall(EntryPoint::VertexAttribDivisorEXT);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(divisor);
+}
+
+void CaptureVertexAttribFormat(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint attribindex,
+                               GLint size,
+                               GLenum type,
+                               GLboolean normalized,
+                               GLuint relativeoffset)
+{
+    writer->writeCall(EntryPoint::VertexAttribFormat);
+    writer->writeParam<uint32_t>(attribindex);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<uint8_t>(normalized);
+    writer->writeParam<uint32_t>(relativeoffset);
+}
+
+void CaptureVertexAttribI4i(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            GLint x,
+                            GLint y,
+                            GLint z,
+                            GLint w)
+{
+    writer->writeCall(EntryPoint::VertexAttribI4i);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+    writer->writeParam<int32_t>(w);
+}
+
+void CaptureVertexAttribI4iv(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint index,
+                             const GLint *v)
+{
+    writer->writeCall(EntryPoint::VertexAttribI4iv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeClientMemory(v, static_cast<size_t>(4) * sizeof(GLint));
+}
+
+void CaptureVertexAttribI4ui(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint index,
+                             GLuint x,
+                             GLuint y,
+                             GLuint z,
+                             GLuint w)
+{
+    writer->writeCall(EntryPoint::VertexAttribI4ui);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(x);
+    writer->writeParam<uint32_t>(y);
+    writer->writeParam<uint32_t>(z);
+    writer->writeParam<uint32_t>(w);
+}
+
+void CaptureVertexAttribI4uiv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint index,
+                              const GLuint *v)
+{
+    writer->writeCall(EntryPoint::VertexAttribI4uiv);
+    writer->writeParam<uint32_t>(index);
+    writer->writeClientMemory(v, static_cast<size_t>(4) * sizeof(GLuint));
+}
+
+void CaptureVertexAttribIFormat(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint attribindex,
+                                GLint size,
+                                GLenum type,
+                                GLuint relativeoffset)
+{
+    writer->writeCall(EntryPoint::VertexAttribIFormat);
+    writer->writeParam<uint32_t>(attribindex);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<uint32_t>(relativeoffset);
+}
+
+void CaptureVertexAttribIPointer(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint index,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer)
+{
+    writer->writeCall(EntryPoint::VertexAttribIPointer);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureVertexAttribPointer(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint index,
+                                GLint size,
+                                GLenum type,
+                                GLboolean normalized,
+                                GLsizei stride,
+                                const void *pointer)
+{
+    writer->writeCall(EntryPoint::VertexAttribPointer);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<uint8_t>(normalized);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureVertexBindingDivisor(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint bindingindex,
+                                 GLuint divisor)
+{
+    writer->writeCall(EntryPoint::VertexBindingDivisor);
+    writer->writeParam<uint32_t>(bindingindex);
+    writer->writeParam<uint32_t>(divisor);
+}
+
+void CaptureVertexPointer(CaptureWriter *writer,
+                          const Context *context,
+                          GLint size,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer)
+{
+    writer->writeCall(EntryPoint::VertexPointer);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureViewport(CaptureWriter *writer,
+                     const Context *context,
+                     GLint x,
+                     GLint y,
+                     GLsizei width,
+                     GLsizei height)
+{
+    writer->writeCall(EntryPoint::Viewport);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+}
+
+void CaptureWaitSemaphoreEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint semaphore,
+                             GLuint numBufferBarriers,
+                             const GLuint *buffers,
+                             GLuint numTextureBarriers,
+                             const GLuint *textures,
+                             const GLenum *srcLayouts)
+{
+    writer->writeCall(EntryPoint::WaitSemaphoreEXT);
+    writer->writeParam<uint32_t>(semaphore);
+    writer->writeParam<uint32_t>(numBufferBarriers);
+    writer->writeClientMemory(buffers, static_cast<size_t>(numBufferBarriers) * sizeof(GLuint));
+    writer->writeParam<uint32_t>(numTextureBarriers);
+    writer->writeClientMemory(textures, static_cast<size_t>(numTextureBarriers) * sizeof(GLuint));
+    writer->writeClientMemory(srcLayouts, static_cast<size_t>(numTextureBarriers) * sizeof(GLenum));
+}
+
+void CaptureWaitSync(CaptureWriter *writer,
+                     const Context *context,
+                     GLsync sync,
+                     GLbitfield flags,
+                     GLuint64 timeout)
+{
+    writer->writeCall(EntryPoint::WaitSync);
+    writer->writeSync(sync);
+    writer->writeParam<uint32_t>(flags);
+    writer->writeParam<uint64_t>(timeout);
+}
+
+void CaptureWeightPointerOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer)
+{
+    writer->writeCall(EntryPoint::WeightPointerOES);
+    writer->writeParam<int32_t>(size);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(stride);
+    writer->writeVertexPointer(context, pointer);
+}
+
+void CaptureBindUniformLocationCHROMIUM(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        const GLchar *name)
+{
+    writer->writeCall(EntryPoint::BindUniformLocationCHROMIUM);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeString(name);
+}
+
+void CaptureCoverageModulationCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum components)
+{
+    writer->writeCall(EntryPoint::CoverageModulationCHROMIUM);
+    writer->writeParam<uint32_t>(components);
+}
+
+void CaptureMatrixLoadfCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum matrixMode,
+                                const GLfloat *matrix)
+{
+    writer->writeCall(EntryPoint::MatrixLoadfCHROMIUM);
+    writer->writeParam<uint32_t>(matrixMode);
+    writer->writeNullPointer();
+}
+
+void CaptureMatrixLoadIdentityCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum matrixMode)
+{
+    writer->writeCall(EntryPoint::MatrixLoadIdentityCHROMIUM);
+    writer->writeParam<uint32_t>(matrixMode);
+}
+
+void CaptureGenPathsCHROMIUM(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei range,
+                             GLuint returnValue)
+{
+    writer->writeCall(EntryPoint::GenPathsCHROMIUM);
+    writer->writeParam<int32_t>(range);
+}
+
+void CaptureDeletePathsCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint first,
+                                GLsizei range)
+{
+    writer->writeCall(EntryPoint::DeletePathsCHROMIUM);
+    writer->writeParam<uint32_t>(first);
+    writer->writeParam<int32_t>(range);
+}
+
+void CaptureIsPathCHROMIUM(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint path,
+                           GLboolean returnValue)
+{
+    writer->writeCall(EntryPoint::IsPathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+}
+
+void CapturePathCommandsCHROMIUM(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint path,
+                                 GLsizei numCommands,
+                                 const GLubyte *commands,
+                                 GLsizei numCoords,
+                                 GLenum coordType,
+                                 const void *coords)
+{
+    writer->writeCall(EntryPoint::PathCommandsCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<int32_t>(numCommands);
+    writer->writeNullPointer();
+    writer->writeParam<int32_t>(numCoords);
+    writer->writeParam<uint32_t>(coordType);
+    writer->writeNullPointer();
+}
+
+void CapturePathParameterfCHROMIUM(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint path,
+                                   GLenum pname,
+                                   GLfloat value)
+{
+    writer->writeCall(EntryPoint::PathParameterfCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<float>(value);
+}
+
+void CapturePathParameteriCHROMIUM(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint path,
+                                   GLenum pname,
+                                   GLint value)
+{
+    writer->writeCall(EntryPoint::PathParameteriCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(value);
+}
+
+void CaptureGetPathParameterfvCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLfloat *value)
+{
+    writer->writeCall(EntryPoint::GetPathParameterfvCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(value, 0);
+}
+
+void CaptureGetPathParameterivCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLint *value)
+{
+    writer->writeCall(EntryPoint::GetPathParameterivCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(value, 0);
+}
+
+void CapturePathStencilFuncCHROMIUM(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum func,
+                                    GLint ref,
+                                    GLuint mask)
+{
+    writer->writeCall(EntryPoint::PathStencilFuncCHROMIUM);
+    writer->writeParam<uint32_t>(func);
+    writer->writeParam<int32_t>(ref);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureStencilFillPathCHROMIUM(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint path,
+                                    GLenum fillMode,
+                                    GLuint mask)
+{
+    writer->writeCall(EntryPoint::StencilFillPathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(fillMode);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureStencilStrokePathCHROMIUM(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint path,
+                                      GLint reference,
+                                      GLuint mask)
+{
+    writer->writeCall(EntryPoint::StencilStrokePathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<int32_t>(reference);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureCoverFillPathCHROMIUM(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint path,
+                                  GLenum coverMode)
+{
+    writer->writeCall(EntryPoint::CoverFillPathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(coverMode);
+}
+
+void CaptureCoverStrokePathCHROMIUM(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint path,
+                                    GLenum coverMode)
+{
+    writer->writeCall(EntryPoint::CoverStrokePathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(coverMode);
+}
+
+void CaptureStencilThenCoverFillPathCHROMIUM(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint path,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum coverMode)
+{
+    writer->writeCall(EntryPoint::StencilThenCoverFillPathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<uint32_t>(fillMode);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(coverMode);
+}
+
+void CaptureStencilThenCoverStrokePathCHROMIUM(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint path,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum coverMode)
+{
+    writer->writeCall(EntryPoint::StencilThenCoverStrokePathCHROMIUM);
+    writer->writeParam<uint32_t>(path);
+    writer->writeParam<int32_t>(reference);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(coverMode);
+}
+
+void CaptureCoverFillPathInstancedCHROMIUM(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLsizei numPath,
+                                           GLenum pathNameType,
+                                           const void *paths,
+                                           GLuint pathBase,
+                                           GLenum coverMode,
+                                           GLenum transformType,
+                                           const GLfloat *transformValues)
+{
+    writer->writeCall(EntryPoint::CoverFillPathInstancedCHROMIUM);
+    writer->writeParam<int32_t>(numPath);
+    writer->writeParam<uint32_t>(pathNameType);
+    writer->writeNullPointer();
+    writer->writeParam<uint32_t>(pathBase);
+    writer->writeParam<uint32_t>(coverMode);
+    writer->writeParam<uint32_t>(transformType);
+    writer->writeNullPointer();
+}
+
+void CaptureCoverStrokePathInstancedCHROMIUM(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    writer->writeCall(EntryPoint::CoverStrokePathInstancedCHROMIUM);
+    writer->writeParam<int32_t>(numPath);
+    writer->writeParam<uint32_t>(pathNameType);
+    writer->writeNullPointer();
+    writer->writeParam<uint32_t>(pathBase);
+    writer->writeParam<uint32_t>(coverMode);
+    writer->writeParam<uint32_t>(transformType);
+    writer->writeNullPointer();
+}
+
+void CaptureStencilStrokePathInstancedCHROMIUM(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues)
+{
+    writer->writeCall(EntryPoint::StencilStrokePathInstancedCHROMIUM);
+    writer->writeParam<int32_t>(numPath);
+    writer->writeParam<uint32_t>(pathNameType);
+    writer->writeNullPointer();
+    writer->writeParam<uint32_t>(pathBase);
+    writer->writeParam<int32_t>(reference);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(transformType);
+    writer->writeNullPointer();
+}
+
+void CaptureStencilFillPathInstancedCHROMIUM(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLsizei numPaths,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues)
+{
+    writer->writeCall(EntryPoint::StencilFillPathInstancedCHROMIUM);
+    writer->writeParam<int32_t>(numPaths);
+    writer->writeParam<uint32_t>(pathNameType);
+    writer->writeNullPointer();
+    writer->writeParam<uint32_t>(pathBase);
+    writer->writeParam<uint32_t>(fillMode);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(transformType);
+    writer->writeNullPointer();
+}
+
+void CaptureStencilThenCoverFillPathInstancedCHROMIUM(CaptureWriter *writer,
+                                                      const Context *context,
+                                                      GLsizei numPaths,
+                                                      GLenum pathNameType,
+                                                      const void *paths,
+                                                      GLuint pathBase,
+                                                      GLenum fillMode,
+                                                      GLuint mask,
+                                                      GLenum coverMode,
+                                                      GLenum transformType,
+                                                      const GLfloat *transformValues)
+{
+    writer->writeCall(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM);
+    writer->writeParam<int32_t>(numPaths);
+    writer->writeParam<uint32_t>(pathNameType);
+    writer->writeNullPointer();
+    writer->writeParam<uint32_t>(pathBase);
+    writer->writeParam<uint32_t>(fillMode);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(coverMode);
+    writer->writeParam<uint32_t>(transformType);
+    writer->writeNullPointer();
+}
+
+void CaptureStencilThenCoverStrokePathInstancedCHROMIUM(CaptureWriter *writer,
+                                                        const Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLint reference,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues)
+{
+    writer->writeCall(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM);
+    writer->writeParam<int32_t>(numPaths);
+    writer->writeParam<uint32_t>(pathNameType);
+    writer->writeNullPointer();
+    writer->writeParam<uint32_t>(pathBase);
+    writer->writeParam<int32_t>(reference);
+    writer->writeParam<uint32_t>(mask);
+    writer->writeParam<uint32_t>(coverMode);
+    writer->writeParam<uint32_t>(transformType);
+    writer->writeNullPointer();
+}
+
+void CaptureBindFragmentInputLocationCHROMIUM(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLuint programs,
+                                              GLint location,
+                                              const GLchar *name)
+{
+    writer->writeCall(EntryPoint::BindFragmentInputLocationCHROMIUM);
+    writer->writeParam<uint32_t>(programs);
+    writer->writeParam<int32_t>(location);
+    writer->writeString(name);
+}
+
+void CaptureProgramPathFragmentInputGenCHROMIUM(CaptureWriter *writer,
+                                                const Context *context,
+                                                GLuint program,
+                                                GLint location,
+                                                GLenum genMode,
+                                                GLint components,
+                                                const GLfloat *coeffs)
+{
+    writer->writeCall(EntryPoint::ProgramPathFragmentInputGenCHROMIUM);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<uint32_t>(genMode);
+    writer->writeParam<int32_t>(components);
+    writer->writeNullPointer();
+}
+
+void CaptureCopyTextureCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint sourceId,
+                                GLint sourceLevel,
+                                GLenum destTarget,
+                                GLuint destId,
+                                GLint destLevel,
+                                GLint internalFormat,
+                                GLenum destType,
+                                GLboolean unpackFlipY,
+                                GLboolean unpackPremultiplyAlpha,
+                                GLboolean unpackUnmultiplyAlpha)
+{
+    writer->writeCall(EntryPoint::CopyTextureCHROMIUM);
+    writer->writeParam<uint32_t>(sourceId);
+    writer->writeParam<int32_t>(sourceLevel);
+    writer->writeParam<uint32_t>(destTarget);
+    writer->writeParam<uint32_t>(destId);
+    writer->writeParam<int32_t>(destLevel);
+    writer->writeParam<int32_t>(internalFormat);
+    writer->writeParam<uint32_t>(destType);
+    writer->writeParam<uint8_t>(unpackFlipY);
+    writer->writeParam<uint8_t>(unpackPremultiplyAlpha);
+    writer->writeParam<uint8_t>(unpackUnmultiplyAlpha);
+}
+
+void CaptureCopySubTextureCHROMIUM(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint xoffset,
+                                   GLint yoffset,
+                                   GLint x,
+                                   GLint y,
+                                   GLint width,
+                                   GLint height,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha)
+{
+    writer->writeCall(EntryPoint::CopySubTextureCHROMIUM);
+    writer->writeParam<uint32_t>(sourceId);
+    writer->writeParam<int32_t>(sourceLevel);
+    writer->writeParam<uint32_t>(destTarget);
+    writer->writeParam<uint32_t>(destId);
+    writer->writeParam<int32_t>(destLevel);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint8_t>(unpackFlipY);
+    writer->writeParam<uint8_t>(unpackPremultiplyAlpha);
+    writer->writeParam<uint8_t>(unpackUnmultiplyAlpha);
+}
+
+void CaptureCompressedCopyTextureCHROMIUM(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint sourceId,
+                                          GLuint destId)
+{
+    writer->writeCall(EntryPoint::CompressedCopyTextureCHROMIUM);
+    writer->writeParam<uint32_t>(sourceId);
+    writer->writeParam<uint32_t>(destId);
+}
+
+void CaptureRequestExtensionANGLE(CaptureWriter *writer, const Context *context, const GLchar *name)
+{
+    writer->writeCall(EntryPoint::RequestExtensionANGLE);
+    writer->writeString(name);
+}
+
+void CaptureGetBooleanvRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLboolean *params)
+{
+    writer->writeCall(EntryPoint::GetBooleanvRobustANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLboolean));
+}
+
+void CaptureGetBufferParameterivRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params)
+{
+    writer->writeCall(EntryPoint::GetBufferParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetFloatvRobustANGLE(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum pname,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetFloatvRobustANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetFramebufferAttachmentParameterivRobustANGLE(CaptureWriter *writer,
+                                                           const Context *context,
+                                                           GLenum target,
+                                                           GLenum attachment,
+                                                           GLenum pname,
+                                                           GLsizei bufSize,
+                                                           GLsizei *length,
+                                                           GLint *params)
+{
+    writer->writeCall(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(attachment);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetIntegervRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *data)
+{
+    writer->writeCall(EntryPoint::GetIntegervRobustANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(data, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetProgramivRobustANGLE(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    writer->writeCall(EntryPoint::GetProgramivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetRenderbufferParameterivRobustANGLE(CaptureWriter *writer,
+                                                  const Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params)
+{
+    writer->writeCall(EntryPoint::GetRenderbufferParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetShaderivRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint shader,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params)
+{
+    writer->writeCall(EntryPoint::GetShaderivRobustANGLE);
+    writer->writeParam<uint32_t>(shader);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetTexParameterfvRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterfvRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetTexParameterivRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetUniformfvRobustANGLE(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetUniformfvRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetUniformivRobustANGLE(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params)
+{
+    writer->writeCall(EntryPoint::GetUniformivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetVertexAttribfvRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribfvRobustANGLE);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetVertexAttribivRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribivRobustANGLE);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetVertexAttribPointervRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               void **pointer)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribPointervRobustANGLE);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(pointer, static_cast<size_t>(bufSize) * sizeof(void *));
+}
+
+void CaptureReadPixelsRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLsizei *columns,
+                                  GLsizei *rows,
+                                  void *pixels)
+{
+    writer->writeCall(EntryPoint::ReadPixelsRobustANGLE);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(columns, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(rows, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writePackPixels(context, pixels, format, type, width, height);
+}
+
+void CaptureTexImage2DRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexImage2DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeUnpackData(context, pixels, static_cast<size_t>(bufSize));
+}
+
+void CaptureTexParameterfvRobustANGLE(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLfloat *params)
+{
+    writer->writeCall(EntryPoint::TexParameterfvRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureTexParameterivRobustANGLE(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLint *params)
+{
+    writer->writeCall(EntryPoint::TexParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureTexSubImage2DRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexSubImage2DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeUnpackData(context, pixels, static_cast<size_t>(bufSize));
+}
+
+void CaptureTexImage3DRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLsizei depth,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexImage3DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeUnpackData(context, pixels, static_cast<size_t>(bufSize));
+}
+
+void CaptureTexSubImage3DRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint zoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels)
+{
+    writer->writeCall(EntryPoint::TexSubImage3DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(zoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeUnpackData(context, pixels, static_cast<size_t>(bufSize));
+}
+
+void CaptureCompressedTexImage2DRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexImage2DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeParam<int32_t>(dataSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(dataSize));
+}
+
+void CaptureCompressedTexSubImage2DRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLsizei xoffset,
+                                               GLsizei yoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexSubImage2DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeParam<int32_t>(dataSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(dataSize));
+}
+
+void CaptureCompressedTexImage3DRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexImage3DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<int32_t>(border);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeParam<int32_t>(dataSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(dataSize));
+}
+
+void CaptureCompressedTexSubImage3DRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLint xoffset,
+                                               GLint yoffset,
+                                               GLint zoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLsizei depth,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data)
+{
+    writer->writeCall(EntryPoint::CompressedTexSubImage3DRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(zoffset);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<int32_t>(imageSize);
+    writer->writeParam<int32_t>(dataSize);
+    writer->writeUnpackData(context, data, static_cast<size_t>(dataSize));
+}
+
+void CaptureGetQueryivRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetQueryObjectuivRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLuint id,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectuivRobustANGLE);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureGetBufferPointervRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         void **params)
+{
+    writer->writeCall(EntryPoint::GetBufferPointervRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(void *));
+}
+
+void CaptureGetIntegeri_vRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data)
+{
+    writer->writeCall(EntryPoint::GetIntegeri_vRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(data, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetInternalformativRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLenum internalformat,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params)
+{
+    writer->writeCall(EntryPoint::GetInternalformativRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetVertexAttribIivRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint index,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribIivRobustANGLE);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetVertexAttribIuivRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetVertexAttribIuivRobustANGLE);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureGetUniformuivRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetUniformuivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureGetActiveUniformBlockivRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint program,
+                                               GLuint uniformBlockIndex,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params)
+{
+    writer->writeCall(EntryPoint::GetActiveUniformBlockivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(uniformBlockIndex);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetInteger64vRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint64 *data)
+{
+    writer->writeCall(EntryPoint::GetInteger64vRobustANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(data, static_cast<size_t>(bufSize) * sizeof(GLint64));
+}
+
+void CaptureGetInteger64i_vRobustANGLE(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data)
+{
+    writer->writeCall(EntryPoint::GetInteger64i_vRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(data, static_cast<size_t>(bufSize) * sizeof(GLint64));
+}
+
+void CaptureGetBufferParameteri64vRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params)
+{
+    writer->writeCall(EntryPoint::GetBufferParameteri64vRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint64));
+}
+
+void CaptureSamplerParameterivRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint sampler,
+                                          GLuint pname,
+                                          GLsizei bufSize,
+                                          const GLint *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(param, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureSamplerParameterfvRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterfvRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(param, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetSamplerParameterivRobustANGLE(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetSamplerParameterfvRobustANGLE(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterfvRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetFramebufferParameterivRobustANGLE(CaptureWriter *writer,
+                                                 const Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params)
+{
+    writer->writeCall(EntryPoint::GetFramebufferParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetProgramInterfaceivRobustANGLE(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint program,
+                                             GLenum programInterface,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params)
+{
+    writer->writeCall(EntryPoint::GetProgramInterfaceivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<uint32_t>(programInterface);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetBooleani_vRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *data)
+{
+    writer->writeCall(EntryPoint::GetBooleani_vRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(data, static_cast<size_t>(bufSize) * sizeof(GLboolean));
+}
+
+void CaptureGetMultisamplefvRobustANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum pname,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *val)
+{
+    writer->writeCall(EntryPoint::GetMultisamplefvRobustANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<uint32_t>(index);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(val, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetTexLevelParameterivRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexLevelParameterivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetTexLevelParameterfvRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexLevelParameterfvRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetPointervRobustANGLERobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              void **params)
+{
+    writer->writeCall(EntryPoint::GetPointervRobustANGLERobustANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(void *));
+}
+
+void CaptureReadnPixelsRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLenum format,
+                                   GLenum type,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLsizei *columns,
+                                   GLsizei *rows,
+                                   void *data)
+{
+    writer->writeCall(EntryPoint::ReadnPixelsRobustANGLE);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint32_t>(format);
+    writer->writeParam<uint32_t>(type);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(columns, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(rows, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writePackPixels(context, data, format, type, width, height);
+}
+
+void CaptureGetnUniformfvRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetnUniformfvRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLfloat));
+}
+
+void CaptureGetnUniformivRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params)
+{
+    writer->writeCall(EntryPoint::GetnUniformivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetnUniformuivRobustANGLE(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetnUniformuivRobustANGLE);
+    writer->writeParam<uint32_t>(program);
+    writer->writeParam<int32_t>(location);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureTexParameterIivRobustANGLE(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       const GLint *params)
+{
+    writer->writeCall(EntryPoint::TexParameterIivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureTexParameterIuivRobustANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLuint *params)
+{
+    writer->writeCall(EntryPoint::TexParameterIuivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureGetTexParameterIivRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterIivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetTexParameterIuivRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetTexParameterIuivRobustANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureSamplerParameterIivRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterIivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(param, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureSamplerParameterIuivRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *param)
+{
+    writer->writeCall(EntryPoint::SamplerParameterIuivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeClientMemory(param, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureGetSamplerParameterIivRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterIivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetSamplerParameterIuivRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params)
+{
+    writer->writeCall(EntryPoint::GetSamplerParameterIuivRobustANGLE);
+    writer->writeParam<uint32_t>(sampler);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint));
+}
+
+void CaptureGetQueryObjectivRobustANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint id,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectivRobustANGLE);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint));
+}
+
+void CaptureGetQueryObjecti64vRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint64 *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjecti64vRobustANGLE);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLint64));
+}
+
+void CaptureGetQueryObjectui64vRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint64 *params)
+{
+    writer->writeCall(EntryPoint::GetQueryObjectui64vRobustANGLE);
+    writer->writeParam<uint32_t>(id);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<int32_t>(bufSize);
+    writer->writeOutputPointer(length, static_cast<size_t>(bufSize) * sizeof(GLsizei));
+    writer->writeOutputPointer(params, static_cast<size_t>(bufSize) * sizeof(GLuint64));
+}
+
+void CaptureCopyTexture3DANGLE(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint sourceId,
+                               GLint sourceLevel,
+                               GLenum destTarget,
+                               GLuint destId,
+                               GLint destLevel,
+                               GLint internalFormat,
+                               GLenum destType,
+                               GLboolean unpackFlipY,
+                               GLboolean unpackPremultiplyAlpha,
+                               GLboolean unpackUnmultiplyAlpha)
+{
+    writer->writeCall(EntryPoint::CopyTexture3DANGLE);
+    writer->writeParam<uint32_t>(sourceId);
+    writer->writeParam<int32_t>(sourceLevel);
+    writer->writeParam<uint32_t>(destTarget);
+    writer->writeParam<uint32_t>(destId);
+    writer->writeParam<int32_t>(destLevel);
+    writer->writeParam<int32_t>(internalFormat);
+    writer->writeParam<uint32_t>(destType);
+    writer->writeParam<uint8_t>(unpackFlipY);
+    writer->writeParam<uint8_t>(unpackPremultiplyAlpha);
+    writer->writeParam<uint8_t>(unpackUnmultiplyAlpha);
+}
+
+void CaptureCopySubTexture3DANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLint z,
+                                  GLint width,
+                                  GLint height,
+                                  GLint depth,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha)
+{
+    writer->writeCall(EntryPoint::CopySubTexture3DANGLE);
+    writer->writeParam<uint32_t>(sourceId);
+    writer->writeParam<int32_t>(sourceLevel);
+    writer->writeParam<uint32_t>(destTarget);
+    writer->writeParam<uint32_t>(destId);
+    writer->writeParam<int32_t>(destLevel);
+    writer->writeParam<int32_t>(xoffset);
+    writer->writeParam<int32_t>(yoffset);
+    writer->writeParam<int32_t>(zoffset);
+    writer->writeParam<int32_t>(x);
+    writer->writeParam<int32_t>(y);
+    writer->writeParam<int32_t>(z);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<int32_t>(depth);
+    writer->writeParam<uint8_t>(unpackFlipY);
+    writer->writeParam<uint8_t>(unpackPremultiplyAlpha);
+    writer->writeParam<uint8_t>(unpackUnmultiplyAlpha);
+}
+
+void CaptureTexStorage2DMultisampleANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLboolean fixedsamplelocations)
+{
+    writer->writeCall(EntryPoint::TexStorage2DMultisampleANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(samples);
+    writer->writeParam<uint32_t>(internalformat);
+    writer->writeParam<int32_t>(width);
+    writer->writeParam<int32_t>(height);
+    writer->writeParam<uint8_t>(fixedsamplelocations);
+}
+
+void CaptureGetTexLevelParameterivANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLint *params)
+{
+    writer->writeCall(EntryPoint::GetTexLevelParameterivANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureGetTexLevelParameterfvANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLfloat *params)
+{
+    writer->writeCall(EntryPoint::GetTexLevelParameterfvANGLE);
+    writer->writeParam<uint32_t>(target);
+    writer->writeParam<int32_t>(level);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeOutputPointer(params, 0);
+}
+
+void CaptureMultiDrawArraysANGLE(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum mode,
+                                 const GLint *firsts,
+                                 const GLsizei *counts,
+                                 GLsizei drawcount)
+{
+    writer->writeCall(EntryPoint::MultiDrawArraysANGLE);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeClientMemory(firsts, static_cast<size_t>(drawcount) * sizeof(GLint));
+    writer->writeClientMemory(counts, static_cast<size_t>(drawcount) * sizeof(GLsizei));
+    writer->writeParam<int32_t>(drawcount);
+}
+
+void CaptureMultiDrawArraysInstancedANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          const GLsizei *instanceCounts,
+                                          GLsizei drawcount)
+{
+    writer->writeCall(EntryPoint::MultiDrawArraysInstancedANGLE);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeClientMemory(firsts, static_cast<size_t>(drawcount) * sizeof(GLint));
+    writer->writeClientMemory(counts, static_cast<size_t>(drawcount) * sizeof(GLsizei));
+    writer->writeClientMemory(instanceCounts, static_cast<size_t>(drawcount) * sizeof(GLsizei));
+    writer->writeParam<int32_t>(drawcount);
+}
+
+void CaptureMultiDrawElementsANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum mode,
+                                   const GLsizei *counts,
+                                   GLenum type,
+                                   const GLvoid *const *indices,
+                                   GLsizei drawcount)
+{
+    writer->writeCall(EntryPoint::MultiDrawElementsANGLE);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeClientMemory(counts, static_cast<size_t>(drawcount) * sizeof(GLsizei));
+    writer->writeParam<uint32_t>(type);
+    writer->writeNullPointer();
+    writer->writeParam<int32_t>(drawcount);
+}
+
+void CaptureMultiDrawElementsInstancedANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum mode,
+                                            const GLsizei *counts,
+                                            GLenum type,
+                                            const GLvoid *const *indices,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount)
+{
+    writer->writeCall(EntryPoint::MultiDrawElementsInstancedANGLE);
+    writer->writeParam<uint32_t>(mode);
+    writer->writeClientMemory(counts, static_cast<size_t>(drawcount) * sizeof(GLsizei));
+    writer->writeParam<uint32_t>(type);
+    writer->writeNullPointer();
+    writer->writeClientMemory(instanceCounts, static_cast<size_t>(drawcount) * sizeof(GLsizei));
+    writer->writeParam<int32_t>(drawcount);
+}
+
+void CaptureGetMultisamplefvANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum pname,
+                                  GLuint index,
+                                  GLfloat *val)
+{
+    writer->writeCall(EntryPoint::GetMultisamplefvANGLE);
+    writer->writeParam<uint32_t>(pname);
+    writer->writeParam<uint32_t>(index);
+    writer->writeOutputPointer(val, 0);
+}
+
+void CaptureSampleMaskiANGLE(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint maskNumber,
+                             GLbitfield mask)
+{
+    writer->writeCall(EntryPoint::SampleMaskiANGLE);
+    writer->writeParam<uint32_t>(maskNumber);
+    writer->writeParam<uint32_t>(mask);
+}
+
+void CaptureProvokingVertexANGLE(CaptureWriter *writer, const Context *context, GLenum mode)
+{
+    writer->writeCall(EntryPoint::ProvokingVertexANGLE);
+    writer->writeParam<uint32_t>(mode);
+}
+
+void CaptureLoseContextCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum current,
+                                GLenum other)
+{
+    writer->writeCall(EntryPoint::LoseContextCHROMIUM);
+    writer->writeParam<uint32_t>(current);
+    writer->writeParam<uint32_t>(other);
+}
+
+}  // namespace gl
+
+#endif  // defined(ANGLE_ENABLE_CAPTURE)
@@ -0,0 +1,3389 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_gles_autogen.h:
+//   Record the GLES calls into a capture file, for builds with angle_enable_capture.
+
+#ifndef LIBGLESV2_CAPTURE_GLES_AUTOGEN_H_
+#define LIBGLESV2_CAPTURE_GLES_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{
+class CaptureWriter;
+class Context;
+void CaptureActiveShaderProgram(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint pipeline,
+                                GLuint program);
+void CaptureActiveTexture(CaptureWriter *writer, const Context *context, GLenum texture);
+void CaptureAlphaFunc(CaptureWriter *writer, const Context *context, GLenum func, GLfloat ref);
+void CaptureAlphaFuncx(CaptureWriter *writer, const Context *context, GLenum func, GLfixed ref);
+void CaptureAttachShader(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLuint shader);
+void CaptureBeginQuery(CaptureWriter *writer, const Context *context, GLenum target, GLuint id);
+void CaptureBeginQueryEXT(CaptureWriter *writer, const Context *context, GLenum target, GLuint id);
+void CaptureBeginTransformFeedback(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum primitiveMode);
+void CaptureBindAttribLocation(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLuint index,
+                               const GLchar *name);
+void CaptureBindBuffer(CaptureWriter *writer, const Context *context, GLenum target, GLuint buffer);
+void CaptureBindBufferBase(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLuint index,
+                           GLuint buffer);
+void CaptureBindBufferRange(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLuint buffer,
+                            GLintptr offset,
+                            GLsizeiptr size);
+void CaptureBindFragDataLocationEXT(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLuint color,
+                                    const GLchar *name);
+void CaptureBindFragDataLocationIndexedEXT(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint program,
+                                           GLuint colorNumber,
+                                           GLuint index,
+                                           const GLchar *name);
+void CaptureBindFramebuffer(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLuint framebuffer);
+void CaptureBindFramebufferOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLuint framebuffer);
+void CaptureBindImageTexture(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint unit,
+                             GLuint texture,
+                             GLint level,
+                             GLboolean layered,
+                             GLint layer,
+                             GLenum access,
+                             GLenum format);
+void CaptureBindProgramPipeline(CaptureWriter *writer, const Context *context, GLuint pipeline);
+void CaptureBindRenderbuffer(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum target,
+                             GLuint renderbuffer);
+void CaptureBindRenderbufferOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLuint renderbuffer);
+void CaptureBindSampler(CaptureWriter *writer, const Context *context, GLuint unit, GLuint sampler);
+void CaptureBindTexture(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLuint texture);
+void CaptureBindTransformFeedback(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLuint id);
+void CaptureBindVertexArray(CaptureWriter *writer, const Context *context, GLuint array);
+void CaptureBindVertexArrayOES(CaptureWriter *writer, const Context *context, GLuint array);
+void CaptureBindVertexBuffer(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint bindingindex,
+                             GLuint buffer,
+                             GLintptr offset,
+                             GLsizei stride);
+void CaptureBlendColor(CaptureWriter *writer,
+                       const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha);
+void CaptureBlendEquation(CaptureWriter *writer, const Context *context, GLenum mode);
+void CaptureBlendEquationSeparate(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum modeRGB,
+                                  GLenum modeAlpha);
+void CaptureBlendFunc(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum sfactor,
+                      GLenum dfactor);
+void CaptureBlendFuncSeparate(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum sfactorRGB,
+                              GLenum dfactorRGB,
+                              GLenum sfactorAlpha,
+                              GLenum dfactorAlpha);
+void CaptureBlitFramebuffer(CaptureWriter *writer,
+                            const Context *context,
+                            GLint srcX0,
+                            GLint srcY0,
+                            GLint srcX1,
+                            GLint srcY1,
+                            GLint dstX0,
+                            GLint dstY0,
+                            GLint dstX1,
+                            GLint dstY1,
+                            GLbitfield mask,
+                            GLenum filter);
+void CaptureBlitFramebufferANGLE(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLint srcX0,
+                                 GLint srcY0,
+                                 GLint srcX1,
+                                 GLint srcY1,
+                                 GLint dstX0,
+                                 GLint dstY0,
+                                 GLint dstX1,
+                                 GLint dstY1,
+                                 GLbitfield mask,
+                                 GLenum filter);
+void CaptureBufferData(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLsizeiptr size,
+                       const void *data,
+                       GLenum usage);
+void CaptureBufferStorageMemEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLsizeiptr size,
+                                GLuint memory,
+                                GLuint64 offset);
+void CaptureBufferSubData(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLintptr offset,
+                          GLsizeiptr size,
+                          const void *data);
+void CaptureCheckFramebufferStatus(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum returnValue);
+void CaptureCheckFramebufferStatusOES(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum returnValue);
+void CaptureClear(CaptureWriter *writer, const Context *context, GLbitfield mask);
+void CaptureClearBufferfi(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          GLfloat depth,
+                          GLint stencil);
+void CaptureClearBufferfv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLfloat *value);
+void CaptureClearBufferiv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum buffer,
+                          GLint drawbuffer,
+                          const GLint *value);
+void CaptureClearBufferuiv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum buffer,
+                           GLint drawbuffer,
+                           const GLuint *value);
+void CaptureClearColor(CaptureWriter *writer,
+                       const Context *context,
+                       GLfloat red,
+                       GLfloat green,
+                       GLfloat blue,
+                       GLfloat alpha);
+void CaptureClearColorx(CaptureWriter *writer,
+                        const Context *context,
+                        GLfixed red,
+                        GLfixed green,
+                        GLfixed blue,
+                        GLfixed alpha);
+void CaptureClearDepthf(CaptureWriter *writer, const Context *context, GLfloat d);
+void CaptureClearDepthx(CaptureWriter *writer, const Context *context, GLfixed depth);
+void CaptureClearStencil(CaptureWriter *writer, const Context *context, GLint s);
+void CaptureClientActiveTexture(CaptureWriter *writer, const Context *context, GLenum texture);
+void CaptureClientWaitSync(CaptureWriter *writer,
+                           const Context *context,
+                           GLsync sync,
+                           GLbitfield flags,
+                           GLuint64 timeout,
+                           GLenum returnValue);
+void CaptureClipPlanef(CaptureWriter *writer, const Context *context, GLenum p, const GLfloat *eqn);
+void CaptureClipPlanex(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum plane,
+                       const GLfixed *equation);
+void CaptureColor4f(CaptureWriter *writer,
+                    const Context *context,
+                    GLfloat red,
+                    GLfloat green,
+                    GLfloat blue,
+                    GLfloat alpha);
+void CaptureColor4ub(CaptureWriter *writer,
+                     const Context *context,
+                     GLubyte red,
+                     GLubyte green,
+                     GLubyte blue,
+                     GLubyte alpha);
+void CaptureColor4x(CaptureWriter *writer,
+                    const Context *context,
+                    GLfixed red,
+                    GLfixed green,
+                    GLfixed blue,
+                    GLfixed alpha);
+void CaptureColorMask(CaptureWriter *writer,
+                      const Context *context,
+                      GLboolean red,
+                      GLboolean green,
+                      GLboolean blue,
+                      GLboolean alpha);
+void CaptureColorPointer(CaptureWriter *writer,
+                         const Context *context,
+                         GLint size,
+                         GLenum type,
+                         GLsizei stride,
+                         const void *pointer);
+void CaptureCompileShader(CaptureWriter *writer, const Context *context, GLuint shader);
+void CaptureCompressedTexImage2D(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data);
+void CaptureCompressedTexImage3D(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLint level,
+                                 GLenum internalformat,
+                                 GLsizei width,
+                                 GLsizei height,
+                                 GLsizei depth,
+                                 GLint border,
+                                 GLsizei imageSize,
+                                 const void *data);
+void CaptureCompressedTexSubImage2D(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data);
+void CaptureCompressedTexSubImage3D(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLint level,
+                                    GLint xoffset,
+                                    GLint yoffset,
+                                    GLint zoffset,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLsizei depth,
+                                    GLenum format,
+                                    GLsizei imageSize,
+                                    const void *data);
+void CaptureCopyBufferSubData(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum readTarget,
+                              GLenum writeTarget,
+                              GLintptr readOffset,
+                              GLintptr writeOffset,
+                              GLsizeiptr size);
+void CaptureCopyTexImage2D(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLint level,
+                           GLenum internalformat,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLint border);
+void CaptureCopyTexSubImage2D(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height);
+void CaptureCopyTexSubImage3D(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLint level,
+                              GLint xoffset,
+                              GLint yoffset,
+                              GLint zoffset,
+                              GLint x,
+                              GLint y,
+                              GLsizei width,
+                              GLsizei height);
+void CaptureCreateMemoryObjectsEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   GLuint *memoryObjects);
+void CaptureCreateProgram(CaptureWriter *writer, const Context *context, GLuint returnValue);
+void CaptureCreateShader(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum type,
+                         GLuint returnValue);
+void CaptureCreateShaderProgramv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum type,
+                                 GLsizei count,
+                                 const GLchar *const *strings,
+                                 GLuint returnValue);
+void CaptureCullFace(CaptureWriter *writer, const Context *context, GLenum mode);
+void CaptureCurrentPaletteMatrixOES(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint matrixpaletteindex);
+void CaptureDebugMessageCallbackKHR(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLDEBUGPROCKHR callback,
+                                    const void *userParam);
+void CaptureDebugMessageControlKHR(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum source,
+                                   GLenum type,
+                                   GLenum severity,
+                                   GLsizei count,
+                                   const GLuint *ids,
+                                   GLboolean enabled);
+void CaptureDebugMessageInsertKHR(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum source,
+                                  GLenum type,
+                                  GLuint id,
+                                  GLenum severity,
+                                  GLsizei length,
+                                  const GLchar *buf);
+void CaptureDeleteBuffers(CaptureWriter *writer,
+                          const Context *context,
+                          GLsizei n,
+                          const GLuint *buffers);
+void CaptureDeleteFencesNV(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei n,
+                           const GLuint *fences);
+void CaptureDeleteFramebuffers(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               const GLuint *framebuffers);
+void CaptureDeleteFramebuffersOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLsizei n,
+                                  const GLuint *framebuffers);
+void CaptureDeleteMemoryObjectsEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   const GLuint *memoryObjects);
+void CaptureDeleteProgram(CaptureWriter *writer, const Context *context, GLuint program);
+void CaptureDeleteProgramPipelines(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   const GLuint *pipelines);
+void CaptureDeleteQueries(CaptureWriter *writer,
+                          const Context *context,
+                          GLsizei n,
+                          const GLuint *ids);
+void CaptureDeleteQueriesEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei n,
+                             const GLuint *ids);
+void CaptureDeleteRenderbuffers(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                const GLuint *renderbuffers);
+void CaptureDeleteRenderbuffersOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLsizei n,
+                                   const GLuint *renderbuffers);
+void CaptureDeleteSamplers(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei count,
+                           const GLuint *samplers);
+void CaptureDeleteSemaphoresEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                const GLuint *semaphores);
+void CaptureDeleteShader(CaptureWriter *writer, const Context *context, GLuint shader);
+void CaptureDeleteSync(CaptureWriter *writer, const Context *context, GLsync sync);
+void CaptureDeleteTextures(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei n,
+                           const GLuint *textures);
+void CaptureDeleteTransformFeedbacks(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLsizei n,
+                                     const GLuint *ids);
+void CaptureDeleteVertexArrays(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               const GLuint *arrays);
+void CaptureDeleteVertexArraysOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLsizei n,
+                                  const GLuint *arrays);
+void CaptureDepthFunc(CaptureWriter *writer, const Context *context, GLenum func);
+void CaptureDepthMask(CaptureWriter *writer, const Context *context, GLboolean flag);
+void CaptureDepthRangef(CaptureWriter *writer, const Context *context, GLfloat n, GLfloat f);
+void CaptureDepthRangex(CaptureWriter *writer, const Context *context, GLfixed n, GLfixed f);
+void CaptureDetachShader(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLuint shader);
+void CaptureDisable(CaptureWriter *writer, const Context *context, GLenum cap);
+void CaptureDisableClientState(CaptureWriter *writer, const Context *context, GLenum array);
+void CaptureDisableVertexAttribArray(CaptureWriter *writer, const Context *context, GLuint index);
+void CaptureDiscardFramebufferEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments);
+void CaptureDispatchCompute(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint num_groups_x,
+                            GLuint num_groups_y,
+                            GLuint num_groups_z);
+void CaptureDispatchComputeIndirect(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLintptr indirect);
+void CaptureDrawArrays(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum mode,
+                       GLint first,
+                       GLsizei count);
+void CaptureDrawArraysIndirect(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum mode,
+                               const void *indirect);
+void CaptureDrawArraysInstanced(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum mode,
+                                GLint first,
+                                GLsizei count,
+                                GLsizei instancecount);
+void CaptureDrawArraysInstancedANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum mode,
+                                     GLint first,
+                                     GLsizei count,
+                                     GLsizei primcount);
+void CaptureDrawArraysInstancedEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum mode,
+                                   GLint start,
+                                   GLsizei count,
+                                   GLsizei primcount);
+void CaptureDrawBuffers(CaptureWriter *writer,
+                        const Context *context,
+                        GLsizei n,
+                        const GLenum *bufs);
+void CaptureDrawBuffersEXT(CaptureWriter *writer,
+                           const Context *context,
+                           GLsizei n,
+                           const GLenum *bufs);
+void CaptureDrawElements(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum mode,
+                         GLsizei count,
+                         GLenum type,
+                         const void *indices);
+void CaptureDrawElementsIndirect(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum mode,
+                                 GLenum type,
+                                 const void *indirect);
+void CaptureDrawElementsInstanced(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum mode,
+                                  GLsizei count,
+                                  GLenum type,
+                                  const void *indices,
+                                  GLsizei instancecount);
+void CaptureDrawElementsInstancedANGLE(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum mode,
+                                       GLsizei count,
+                                       GLenum type,
+                                       const void *indices,
+                                       GLsizei primcount);
+void CaptureDrawElementsInstancedEXT(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum mode,
+                                     GLsizei count,
+                                     GLenum type,
+                                     const void *indices,
+                                     GLsizei primcount);
+void CaptureDrawRangeElements(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum mode,
+                              GLuint start,
+                              GLuint end,
+                              GLsizei count,
+                              GLenum type,
+                              const void *indices);
+void CaptureDrawTexfOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLfloat x,
+                        GLfloat y,
+                        GLfloat z,
+                        GLfloat width,
+                        GLfloat height);
+void CaptureDrawTexfvOES(CaptureWriter *writer, const Context *context, const GLfloat *coords);
+void CaptureDrawTexiOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLint x,
+                        GLint y,
+                        GLint z,
+                        GLint width,
+                        GLint height);
+void CaptureDrawTexivOES(CaptureWriter *writer, const Context *context, const GLint *coords);
+void CaptureDrawTexsOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLshort x,
+                        GLshort y,
+                        GLshort z,
+                        GLshort width,
+                        GLshort height);
+void CaptureDrawTexsvOES(CaptureWriter *writer, const Context *context, const GLshort *coords);
+void CaptureDrawTexxOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLfixed x,
+                        GLfixed y,
+                        GLfixed z,
+                        GLfixed width,
+                        GLfixed height);
+void CaptureDrawTexxvOES(CaptureWriter *writer, const Context *context, const GLfixed *coords);
+void CaptureEGLImageTargetRenderbufferStorageOES(CaptureWriter *writer,
+                                                 const Context *context,
+                                                 GLenum target,
+                                                 GLeglImageOES image);
+void CaptureEGLImageTargetTexture2DOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLeglImageOES image);
+void CaptureEnable(CaptureWriter *writer, const Context *context, GLenum cap);
+void CaptureEnableClientState(CaptureWriter *writer, const Context *context, GLenum array);
+void CaptureEnableVertexAttribArray(CaptureWriter *writer, const Context *context, GLuint index);
+void CaptureEndQuery(CaptureWriter *writer, const Context *context, GLenum target);
+void CaptureEndQueryEXT(CaptureWriter *writer, const Context *context, GLenum target);
+void CaptureEndTransformFeedback(CaptureWriter *writer, const Context *context);
+void CaptureFenceSync(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum condition,
+                      GLbitfield flags,
+                      GLsync returnValue);
+void CaptureFinish(CaptureWriter *writer, const Context *context);
+void CaptureFinishFenceNV(CaptureWriter *writer, const Context *context, GLuint fence);
+void CaptureFlush(CaptureWriter *writer, const Context *context);
+void CaptureFlushMappedBufferRange(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLintptr offset,
+                                   GLsizeiptr length);
+void CaptureFlushMappedBufferRangeEXT(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLintptr offset,
+                                      GLsizeiptr length);
+void CaptureFogf(CaptureWriter *writer, const Context *context, GLenum pname, GLfloat param);
+void CaptureFogfv(CaptureWriter *writer,
+                  const Context *context,
+                  GLenum pname,
+                  const GLfloat *params);
+void CaptureFogx(CaptureWriter *writer, const Context *context, GLenum pname, GLfixed param);
+void CaptureFogxv(CaptureWriter *writer,
+                  const Context *context,
+                  GLenum pname,
+                  const GLfixed *param);
+void CaptureFramebufferParameteri(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLint param);
+void CaptureFramebufferRenderbuffer(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum renderbuffertarget,
+                                    GLuint renderbuffer);
+void CaptureFramebufferRenderbufferOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLenum attachment,
+                                       GLenum renderbuffertarget,
+                                       GLuint renderbuffer);
+void CaptureFramebufferTexture2D(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLenum attachment,
+                                 GLenum textarget,
+                                 GLuint texture,
+                                 GLint level);
+void CaptureFramebufferTexture2DOES(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLenum textarget,
+                                    GLuint texture,
+                                    GLint level);
+void CaptureFramebufferTextureEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum attachment,
+                                  GLuint texture,
+                                  GLint level);
+void CaptureFramebufferTextureLayer(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLenum attachment,
+                                    GLuint texture,
+                                    GLint level,
+                                    GLint layer);
+void CaptureFramebufferTextureMultiviewOVR(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLenum attachment,
+                                           GLuint texture,
+                                           GLint level,
+                                           GLint baseViewIndex,
+                                           GLsizei numViews);
+void CaptureFrontFace(CaptureWriter *writer, const Context *context, GLenum mode);
+void CaptureFrustumf(CaptureWriter *writer,
+                     const Context *context,
+                     GLfloat l,
+                     GLfloat r,
+                     GLfloat b,
+                     GLfloat t,
+                     GLfloat n,
+                     GLfloat f);
+void CaptureFrustumx(CaptureWriter *writer,
+                     const Context *context,
+                     GLfixed l,
+                     GLfixed r,
+                     GLfixed b,
+                     GLfixed t,
+                     GLfixed n,
+                     GLfixed f);
+void CaptureGenBuffers(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *buffers);
+void CaptureGenFencesNV(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *fences);
+void CaptureGenFramebuffers(CaptureWriter *writer,
+                            const Context *context,
+                            GLsizei n,
+                            GLuint *framebuffers);
+void CaptureGenFramebuffersOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               GLuint *framebuffers);
+void CaptureGenProgramPipelines(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                GLuint *pipelines);
+void CaptureGenQueries(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *ids);
+void CaptureGenQueriesEXT(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *ids);
+void CaptureGenRenderbuffers(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei n,
+                             GLuint *renderbuffers);
+void CaptureGenRenderbuffersOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLsizei n,
+                                GLuint *renderbuffers);
+void CaptureGenSamplers(CaptureWriter *writer,
+                        const Context *context,
+                        GLsizei count,
+                        GLuint *samplers);
+void CaptureGenSemaphoresEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei n,
+                             GLuint *semaphores);
+void CaptureGenTextures(CaptureWriter *writer, const Context *context, GLsizei n, GLuint *textures);
+void CaptureGenTransformFeedbacks(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLsizei n,
+                                  GLuint *ids);
+void CaptureGenVertexArrays(CaptureWriter *writer,
+                            const Context *context,
+                            GLsizei n,
+                            GLuint *arrays);
+void CaptureGenVertexArraysOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei n,
+                               GLuint *arrays);
+void CaptureGenerateMipmap(CaptureWriter *writer, const Context *context, GLenum target);
+void CaptureGenerateMipmapOES(CaptureWriter *writer, const Context *context, GLenum target);
+void CaptureGetActiveAttrib(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint program,
+                            GLuint index,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLint *size,
+                            GLenum *type,
+                            GLchar *name);
+void CaptureGetActiveUniform(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLuint index,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLint *size,
+                             GLenum *type,
+                             GLchar *name);
+void CaptureGetActiveUniformBlockName(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLuint uniformBlockIndex,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *uniformBlockName);
+void CaptureGetActiveUniformBlockiv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLuint uniformBlockIndex,
+                                    GLenum pname,
+                                    GLint *params);
+void CaptureGetActiveUniformsiv(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                GLsizei uniformCount,
+                                const GLuint *uniformIndices,
+                                GLenum pname,
+                                GLint *params);
+void CaptureGetAttachedShaders(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLsizei maxCount,
+                               GLsizei *count,
+                               GLuint *shaders);
+void CaptureGetAttribLocation(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              const GLchar *name,
+                              GLint returnValue);
+void CaptureGetBooleani_v(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLuint index,
+                          GLboolean *data);
+void CaptureGetBooleanv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum pname,
+                        GLboolean *data);
+void CaptureGetBufferParameteri64v(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLint64 *params);
+void CaptureGetBufferParameteriv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLenum pname,
+                                 GLint *params);
+void CaptureGetBufferPointerv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              void **params);
+void CaptureGetBufferPointervOES(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum target,
+                                 GLenum pname,
+                                 void **params);
+void CaptureGetClipPlanef(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum plane,
+                          GLfloat *equation);
+void CaptureGetClipPlanex(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum plane,
+                          GLfixed *equation);
+void CaptureGetDebugMessageLogKHR(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint count,
+                                  GLsizei bufSize,
+                                  GLenum *sources,
+                                  GLenum *types,
+                                  GLuint *ids,
+                                  GLenum *severities,
+                                  GLsizei *lengths,
+                                  GLchar *messageLog,
+                                  GLuint returnValue);
+void CaptureGetError(CaptureWriter *writer, const Context *context, GLenum returnValue);
+void CaptureGetFenceivNV(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint fence,
+                         GLenum pname,
+                         GLint *params);
+void CaptureGetFixedv(CaptureWriter *writer, const Context *context, GLenum pname, GLfixed *params);
+void CaptureGetFloatv(CaptureWriter *writer, const Context *context, GLenum pname, GLfloat *data);
+void CaptureGetFragDataIndexEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                const GLchar *name,
+                                GLint returnValue);
+void CaptureGetFragDataLocation(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                const GLchar *name,
+                                GLint returnValue);
+void CaptureGetFramebufferAttachmentParameteriv(CaptureWriter *writer,
+                                                const Context *context,
+                                                GLenum target,
+                                                GLenum attachment,
+                                                GLenum pname,
+                                                GLint *params);
+void CaptureGetFramebufferAttachmentParameterivOES(CaptureWriter *writer,
+                                                   const Context *context,
+                                                   GLenum target,
+                                                   GLenum attachment,
+                                                   GLenum pname,
+                                                   GLint *params);
+void CaptureGetFramebufferParameteriv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLint *params);
+void CaptureGetGraphicsResetStatusEXT(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum returnValue);
+void CaptureGetInteger64i_v(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLuint index,
+                            GLint64 *data);
+void CaptureGetInteger64v(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum pname,
+                          GLint64 *data);
+void CaptureGetIntegeri_v(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLuint index,
+                          GLint *data);
+void CaptureGetIntegerv(CaptureWriter *writer, const Context *context, GLenum pname, GLint *data);
+void CaptureGetInternalformativ(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLenum pname,
+                                GLsizei bufSize,
+                                GLint *params);
+void CaptureGetLightfv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum light,
+                       GLenum pname,
+                       GLfloat *params);
+void CaptureGetLightxv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum light,
+                       GLenum pname,
+                       GLfixed *params);
+void CaptureGetMaterialfv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum face,
+                          GLenum pname,
+                          GLfloat *params);
+void CaptureGetMaterialxv(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum face,
+                          GLenum pname,
+                          GLfixed *params);
+void CaptureGetMemoryObjectParameterivEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint memoryObject,
+                                          GLenum pname,
+                                          GLint *params);
+void CaptureGetMultisamplefv(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum pname,
+                             GLuint index,
+                             GLfloat *val);
+void CaptureGetObjectLabelKHR(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum identifier,
+                              GLuint name,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *label);
+void CaptureGetObjectPtrLabelKHR(CaptureWriter *writer,
+                                 const Context *context,
+                                 const void *ptr,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLchar *label);
+void CaptureGetPointerv(CaptureWriter *writer, const Context *context, GLenum pname, void **params);
+void CaptureGetPointervKHR(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum pname,
+                           void **params);
+void CaptureGetProgramBinary(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLenum *binaryFormat,
+                             void *binary);
+void CaptureGetProgramBinaryOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                GLsizei bufSize,
+                                GLsizei *length,
+                                GLenum *binaryFormat,
+                                void *binary);
+void CaptureGetProgramInfoLog(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLsizei bufSize,
+                              GLsizei *length,
+                              GLchar *infoLog);
+void CaptureGetProgramInterfaceiv(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint program,
+                                  GLenum programInterface,
+                                  GLenum pname,
+                                  GLint *params);
+void CaptureGetProgramPipelineInfoLog(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint pipeline,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLchar *infoLog);
+void CaptureGetProgramPipelineiv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint pipeline,
+                                 GLenum pname,
+                                 GLint *params);
+void CaptureGetProgramResourceIndex(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLenum programInterface,
+                                    const GLchar *name,
+                                    GLuint returnValue);
+void CaptureGetProgramResourceLocation(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint program,
+                                       GLenum programInterface,
+                                       const GLchar *name,
+                                       GLint returnValue);
+void CaptureGetProgramResourceLocationIndexEXT(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint program,
+                                               GLenum programInterface,
+                                               const GLchar *name,
+                                               GLint returnValue);
+void CaptureGetProgramResourceName(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint program,
+                                   GLenum programInterface,
+                                   GLuint index,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLchar *name);
+void CaptureGetProgramResourceiv(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint program,
+                                 GLenum programInterface,
+                                 GLuint index,
+                                 GLsizei propCount,
+                                 const GLenum *props,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLint *params);
+void CaptureGetProgramiv(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLenum pname,
+                         GLint *params);
+void CaptureGetQueryObjecti64vEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint id,
+                                  GLenum pname,
+                                  GLint64 *params);
+void CaptureGetQueryObjectivEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint id,
+                                GLenum pname,
+                                GLint *params);
+void CaptureGetQueryObjectui64vEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint id,
+                                   GLenum pname,
+                                   GLuint64 *params);
+void CaptureGetQueryObjectuiv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint id,
+                              GLenum pname,
+                              GLuint *params);
+void CaptureGetQueryObjectuivEXT(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint id,
+                                 GLenum pname,
+                                 GLuint *params);
+void CaptureGetQueryiv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLenum pname,
+                       GLint *params);
+void CaptureGetQueryivEXT(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLint *params);
+void CaptureGetRenderbufferParameteriv(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLint *params);
+void CaptureGetRenderbufferParameterivOES(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLint *params);
+void CaptureGetSamplerParameterIivOES(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint sampler,
+                                      GLenum pname,
+                                      GLint *params);
+void CaptureGetSamplerParameterIuivOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint sampler,
+                                       GLenum pname,
+                                       GLuint *params);
+void CaptureGetSamplerParameterfv(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLfloat *params);
+void CaptureGetSamplerParameteriv(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint sampler,
+                                  GLenum pname,
+                                  GLint *params);
+void CaptureGetSemaphoreParameterui64vEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint semaphore,
+                                          GLenum pname,
+                                          GLuint64 *params);
+void CaptureGetShaderInfoLog(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint shader,
+                             GLsizei bufSize,
+                             GLsizei *length,
+                             GLchar *infoLog);
+void CaptureGetShaderPrecisionFormat(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum shadertype,
+                                     GLenum precisiontype,
+                                     GLint *range,
+                                     GLint *precision);
+void CaptureGetShaderSource(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint shader,
+                            GLsizei bufSize,
+                            GLsizei *length,
+                            GLchar *source);
+void CaptureGetShaderiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLuint shader,
+                        GLenum pname,
+                        GLint *params);
+void CaptureGetString(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum name,
+                      const GLubyte *returnValue);
+void CaptureGetStringi(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum name,
+                       GLuint index,
+                       const GLubyte *returnValue);
+void CaptureGetSynciv(CaptureWriter *writer,
+                      const Context *context,
+                      GLsync sync,
+                      GLenum pname,
+                      GLsizei bufSize,
+                      GLsizei *length,
+                      GLint *values);
+void CaptureGetTexEnvfv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLenum pname,
+                        GLfloat *params);
+void CaptureGetTexEnviv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLenum pname,
+                        GLint *params);
+void CaptureGetTexEnvxv(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLenum pname,
+                        GLfixed *params);
+void CaptureGetTexGenfvOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum coord,
+                           GLenum pname,
+                           GLfloat *params);
+void CaptureGetTexGenivOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum coord,
+                           GLenum pname,
+                           GLint *params);
+void CaptureGetTexGenxvOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum coord,
+                           GLenum pname,
+                           GLfixed *params);
+void CaptureGetTexLevelParameterfv(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLfloat *params);
+void CaptureGetTexLevelParameteriv(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLint level,
+                                   GLenum pname,
+                                   GLint *params);
+void CaptureGetTexParameterIivOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLint *params);
+void CaptureGetTexParameterIuivOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum pname,
+                                   GLuint *params);
+void CaptureGetTexParameterfv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              GLfloat *params);
+void CaptureGetTexParameteriv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              GLint *params);
+void CaptureGetTexParameterxv(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLenum pname,
+                              GLfixed *params);
+void CaptureGetTransformFeedbackVarying(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint program,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLsizei *size,
+                                        GLenum *type,
+                                        GLchar *name);
+void CaptureGetTranslatedShaderSourceANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint shader,
+                                           GLsizei bufsize,
+                                           GLsizei *length,
+                                           GLchar *source);
+void CaptureGetUniformBlockIndex(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint program,
+                                 const GLchar *uniformBlockName,
+                                 GLuint returnValue);
+void CaptureGetUniformIndices(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLsizei uniformCount,
+                              const GLchar *const *uniformNames,
+                              GLuint *uniformIndices);
+void CaptureGetUniformLocation(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               const GLchar *name,
+                               GLint returnValue);
+void CaptureGetUniformfv(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLint location,
+                         GLfloat *params);
+void CaptureGetUniformiv(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint program,
+                         GLint location,
+                         GLint *params);
+void CaptureGetUniformuiv(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint program,
+                          GLint location,
+                          GLuint *params);
+void CaptureGetUnsignedBytevEXT(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum pname,
+                                GLubyte *data);
+void CaptureGetUnsignedBytei_vEXT(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLuint index,
+                                  GLubyte *data);
+void CaptureGetVertexAttribIiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint index,
+                               GLenum pname,
+                               GLint *params);
+void CaptureGetVertexAttribIuiv(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint index,
+                                GLenum pname,
+                                GLuint *params);
+void CaptureGetVertexAttribPointerv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint index,
+                                    GLenum pname,
+                                    void **pointer);
+void CaptureGetVertexAttribfv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint index,
+                              GLenum pname,
+                              GLfloat *params);
+void CaptureGetVertexAttribiv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint index,
+                              GLenum pname,
+                              GLint *params);
+void CaptureGetnUniformfvEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLfloat *params);
+void CaptureGetnUniformivEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLsizei bufSize,
+                             GLint *params);
+void CaptureHint(CaptureWriter *writer, const Context *context, GLenum target, GLenum mode);
+void CaptureImportMemoryFdEXT(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint memory,
+                              GLuint64 size,
+                              GLenum handleType,
+                              GLint fd);
+void CaptureImportSemaphoreFdEXT(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint semaphore,
+                                 GLenum handleType,
+                                 GLint fd);
+void CaptureInsertEventMarkerEXT(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLsizei length,
+                                 const GLchar *marker);
+void CaptureInvalidateFramebuffer(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLsizei numAttachments,
+                                  const GLenum *attachments);
+void CaptureInvalidateSubFramebuffer(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLsizei numAttachments,
+                                     const GLenum *attachments,
+                                     GLint x,
+                                     GLint y,
+                                     GLsizei width,
+                                     GLsizei height);
+void CaptureIsBuffer(CaptureWriter *writer,
+                     const Context *context,
+                     GLuint buffer,
+                     GLboolean returnValue);
+void CaptureIsEnabled(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum cap,
+                      GLboolean returnValue);
+void CaptureIsFenceNV(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint fence,
+                      GLboolean returnValue);
+void CaptureIsFramebuffer(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint framebuffer,
+                          GLboolean returnValue);
+void CaptureIsFramebufferOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint framebuffer,
+                             GLboolean returnValue);
+void CaptureIsMemoryObjectEXT(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint memoryObject,
+                              GLboolean returnValue);
+void CaptureIsProgram(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint program,
+                      GLboolean returnValue);
+void CaptureIsProgramPipeline(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint pipeline,
+                              GLboolean returnValue);
+void CaptureIsQuery(CaptureWriter *writer,
+                    const Context *context,
+                    GLuint id,
+                    GLboolean returnValue);
+void CaptureIsQueryEXT(CaptureWriter *writer,
+                       const Context *context,
+                       GLuint id,
+                       GLboolean returnValue);
+void CaptureIsRenderbuffer(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint renderbuffer,
+                           GLboolean returnValue);
+void CaptureIsRenderbufferOES(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint renderbuffer,
+                              GLboolean returnValue);
+void CaptureIsSemaphoreEXT(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint semaphore,
+                           GLboolean returnValue);
+void CaptureIsSampler(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint sampler,
+                      GLboolean returnValue);
+void CaptureIsShader(CaptureWriter *writer,
+                     const Context *context,
+                     GLuint shader,
+                     GLboolean returnValue);
+void CaptureIsSync(CaptureWriter *writer,
+                   const Context *context,
+                   GLsync sync,
+                   GLboolean returnValue);
+void CaptureIsTexture(CaptureWriter *writer,
+                      const Context *context,
+                      GLuint texture,
+                      GLboolean returnValue);
+void CaptureIsTransformFeedback(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint id,
+                                GLboolean returnValue);
+void CaptureIsVertexArray(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint array,
+                          GLboolean returnValue);
+void CaptureIsVertexArrayOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint array,
+                             GLboolean returnValue);
+void CaptureLightModelf(CaptureWriter *writer, const Context *context, GLenum pname, GLfloat param);
+void CaptureLightModelfv(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum pname,
+                         const GLfloat *params);
+void CaptureLightModelx(CaptureWriter *writer, const Context *context, GLenum pname, GLfixed param);
+void CaptureLightModelxv(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum pname,
+                         const GLfixed *param);
+void CaptureLightf(CaptureWriter *writer,
+                   const Context *context,
+                   GLenum light,
+                   GLenum pname,
+                   GLfloat param);
+void CaptureLightfv(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum light,
+                    GLenum pname,
+                    const GLfloat *params);
+void CaptureLightx(CaptureWriter *writer,
+                   const Context *context,
+                   GLenum light,
+                   GLenum pname,
+                   GLfixed param);
+void CaptureLightxv(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum light,
+                    GLenum pname,
+                    const GLfixed *params);
+void CaptureLineWidth(CaptureWriter *writer, const Context *context, GLfloat width);
+void CaptureLineWidthx(CaptureWriter *writer, const Context *context, GLfixed width);
+void CaptureLinkProgram(CaptureWriter *writer, const Context *context, GLuint program);
+void CaptureLoadIdentity(CaptureWriter *writer, const Context *context);
+void CaptureLoadMatrixf(CaptureWriter *writer, const Context *context, const GLfloat *m);
+void CaptureLoadMatrixx(CaptureWriter *writer, const Context *context, const GLfixed *m);
+void CaptureLoadPaletteFromModelViewMatrixOES(CaptureWriter *writer, const Context *context);
+void CaptureLogicOp(CaptureWriter *writer, const Context *context, GLenum opcode);
+void CaptureMapBufferOES(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum target,
+                         GLenum access,
+                         void *returnValue);
+void CaptureMapBufferRange(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLintptr offset,
+                           GLsizeiptr length,
+                           GLbitfield access,
+                           void *returnValue);
+void CaptureMapBufferRangeEXT(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum target,
+                              GLintptr offset,
+                              GLsizeiptr length,
+                              GLbitfield access,
+                              void *returnValue);
+void CaptureMaterialf(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum face,
+                      GLenum pname,
+                      GLfloat param);
+void CaptureMaterialfv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum face,
+                       GLenum pname,
+                       const GLfloat *params);
+void CaptureMaterialx(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum face,
+                      GLenum pname,
+                      GLfixed param);
+void CaptureMaterialxv(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum face,
+                       GLenum pname,
+                       const GLfixed *param);
+void CaptureMatrixIndexPointerOES(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLint size,
+                                  GLenum type,
+                                  GLsizei stride,
+                                  const void *pointer);
+void CaptureMatrixMode(CaptureWriter *writer, const Context *context, GLenum mode);
+void CaptureMaxShaderCompilerThreadsKHR(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint count);
+void CaptureMemoryBarrier(CaptureWriter *writer, const Context *context, GLbitfield barriers);
+void CaptureMemoryBarrierByRegion(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLbitfield barriers);
+void CaptureMemoryObjectParameterivEXT(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint memoryObject,
+                                       GLenum pname,
+                                       const GLint *params);
+void CaptureMultMatrixf(CaptureWriter *writer, const Context *context, const GLfloat *m);
+void CaptureMultMatrixx(CaptureWriter *writer, const Context *context, const GLfixed *m);
+void CaptureMultiTexCoord4f(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLfloat s,
+                            GLfloat t,
+                            GLfloat r,
+                            GLfloat q);
+void CaptureMultiTexCoord4x(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum texture,
+                            GLfixed s,
+                            GLfixed t,
+                            GLfixed r,
+                            GLfixed q);
+void CaptureNormal3f(CaptureWriter *writer,
+                     const Context *context,
+                     GLfloat nx,
+                     GLfloat ny,
+                     GLfloat nz);
+void CaptureNormal3x(CaptureWriter *writer,
+                     const Context *context,
+                     GLfixed nx,
+                     GLfixed ny,
+                     GLfixed nz);
+void CaptureNormalPointer(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer);
+void CaptureObjectLabelKHR(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum identifier,
+                           GLuint name,
+                           GLsizei length,
+                           const GLchar *label);
+void CaptureObjectPtrLabelKHR(CaptureWriter *writer,
+                              const Context *context,
+                              const void *ptr,
+                              GLsizei length,
+                              const GLchar *label);
+void CaptureOrthof(CaptureWriter *writer,
+                   const Context *context,
+                   GLfloat l,
+                   GLfloat r,
+                   GLfloat b,
+                   GLfloat t,
+                   GLfloat n,
+                   GLfloat f);
+void CaptureOrthox(CaptureWriter *writer,
+                   const Context *context,
+                   GLfixed l,
+                   GLfixed r,
+                   GLfixed b,
+                   GLfixed t,
+                   GLfixed n,
+                   GLfixed f);
+void CapturePauseTransformFeedback(CaptureWriter *writer, const Context *context);
+void CapturePixelStorei(CaptureWriter *writer, const Context *context, GLenum pname, GLint param);
+void CapturePointParameterf(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum pname,
+                            GLfloat param);
+void CapturePointParameterfv(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum pname,
+                             const GLfloat *params);
+void CapturePointParameterx(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum pname,
+                            GLfixed param);
+void CapturePointParameterxv(CaptureWriter *writer,
+                             const Context *context,
+                             GLenum pname,
+                             const GLfixed *params);
+void CapturePointSize(CaptureWriter *writer, const Context *context, GLfloat size);
+void CapturePointSizePointerOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum type,
+                                GLsizei stride,
+                                const void *pointer);
+void CapturePointSizex(CaptureWriter *writer, const Context *context, GLfixed size);
+void CapturePolygonOffset(CaptureWriter *writer,
+                          const Context *context,
+                          GLfloat factor,
+                          GLfloat units);
+void CapturePolygonOffsetx(CaptureWriter *writer,
+                           const Context *context,
+                           GLfixed factor,
+                           GLfixed units);
+void CapturePopDebugGroupKHR(CaptureWriter *writer, const Context *context);
+void CapturePopGroupMarkerEXT(CaptureWriter *writer, const Context *context);
+void CapturePopMatrix(CaptureWriter *writer, const Context *context);
+void CaptureProgramBinary(CaptureWriter *writer,
+                          const Context *context,
+                          GLuint program,
+                          GLenum binaryFormat,
+                          const void *binary,
+                          GLsizei length);
+void CaptureProgramBinaryOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLenum binaryFormat,
+                             const void *binary,
+                             GLint length);
+void CaptureProgramParameteri(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLenum pname,
+                              GLint value);
+void CaptureProgramUniform1f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0);
+void CaptureProgramUniform1fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform1i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0);
+void CaptureProgramUniform1iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform1ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0);
+void CaptureProgramUniform1uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniform2f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1);
+void CaptureProgramUniform2fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform2i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1);
+void CaptureProgramUniform2iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform2ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1);
+void CaptureProgramUniform2uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniform3f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2);
+void CaptureProgramUniform3fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform3i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2);
+void CaptureProgramUniform3iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform3ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2);
+void CaptureProgramUniform3uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniform4f(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLfloat v0,
+                             GLfloat v1,
+                             GLfloat v2,
+                             GLfloat v3);
+void CaptureProgramUniform4fv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLfloat *value);
+void CaptureProgramUniform4i(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint program,
+                             GLint location,
+                             GLint v0,
+                             GLint v1,
+                             GLint v2,
+                             GLint v3);
+void CaptureProgramUniform4iv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLsizei count,
+                              const GLint *value);
+void CaptureProgramUniform4ui(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint program,
+                              GLint location,
+                              GLuint v0,
+                              GLuint v1,
+                              GLuint v2,
+                              GLuint v3);
+void CaptureProgramUniform4uiv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint program,
+                               GLint location,
+                               GLsizei count,
+                               const GLuint *value);
+void CaptureProgramUniformMatrix2fv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+void CaptureProgramUniformMatrix2x3fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix2x4fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix3fv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+void CaptureProgramUniformMatrix3x2fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix3x4fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix4fv(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei count,
+                                    GLboolean transpose,
+                                    const GLfloat *value);
+void CaptureProgramUniformMatrix4x2fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CaptureProgramUniformMatrix4x3fv(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei count,
+                                      GLboolean transpose,
+                                      const GLfloat *value);
+void CapturePushDebugGroupKHR(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum source,
+                              GLuint id,
+                              GLsizei length,
+                              const GLchar *message);
+void CapturePushGroupMarkerEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLsizei length,
+                               const GLchar *marker);
+void CapturePushMatrix(CaptureWriter *writer, const Context *context);
+void CaptureQueryCounterEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint id,
+                            GLenum target);
+void CaptureQueryMatrixxOES(CaptureWriter *writer,
+                            const Context *context,
+                            GLfixed *mantissa,
+                            GLint *exponent,
+                            GLbitfield returnValue);
+void CaptureReadBuffer(CaptureWriter *writer, const Context *context, GLenum src);
+void CaptureReadPixels(CaptureWriter *writer,
+                       const Context *context,
+                       GLint x,
+                       GLint y,
+                       GLsizei width,
+                       GLsizei height,
+                       GLenum format,
+                       GLenum type,
+                       void *pixels);
+void CaptureReadnPixelsEXT(CaptureWriter *writer,
+                           const Context *context,
+                           GLint x,
+                           GLint y,
+                           GLsizei width,
+                           GLsizei height,
+                           GLenum format,
+                           GLenum type,
+                           GLsizei bufSize,
+                           void *data);
+void CaptureReleaseShaderCompiler(CaptureWriter *writer, const Context *context);
+void CaptureRenderbufferStorage(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLenum internalformat,
+                                GLsizei width,
+                                GLsizei height);
+void CaptureRenderbufferStorageMultisample(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLsizei samples,
+                                           GLenum internalformat,
+                                           GLsizei width,
+                                           GLsizei height);
+void CaptureRenderbufferStorageMultisampleANGLE(CaptureWriter *writer,
+                                                const Context *context,
+                                                GLenum target,
+                                                GLsizei samples,
+                                                GLenum internalformat,
+                                                GLsizei width,
+                                                GLsizei height);
+void CaptureRenderbufferStorageOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum target,
+                                   GLenum internalformat,
+                                   GLsizei width,
+                                   GLsizei height);
+void CaptureResumeTransformFeedback(CaptureWriter *writer, const Context *context);
+void CaptureRotatef(CaptureWriter *writer,
+                    const Context *context,
+                    GLfloat angle,
+                    GLfloat x,
+                    GLfloat y,
+                    GLfloat z);
+void CaptureRotatex(CaptureWriter *writer,
+                    const Context *context,
+                    GLfixed angle,
+                    GLfixed x,
+                    GLfixed y,
+                    GLfixed z);
+void CaptureSampleCoverage(CaptureWriter *writer,
+                           const Context *context,
+                           GLfloat value,
+                           GLboolean invert);
+void CaptureSampleCoveragex(CaptureWriter *writer,
+                            const Context *context,
+                            GLclampx value,
+                            GLboolean invert);
+void CaptureSampleMaski(CaptureWriter *writer,
+                        const Context *context,
+                        GLuint maskNumber,
+                        GLbitfield mask);
+void CaptureSamplerParameterIivOES(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint sampler,
+                                   GLenum pname,
+                                   const GLint *param);
+void CaptureSamplerParameterIuivOES(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint sampler,
+                                    GLenum pname,
+                                    const GLuint *param);
+void CaptureSamplerParameterf(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint sampler,
+                              GLenum pname,
+                              GLfloat param);
+void CaptureSamplerParameterfv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLfloat *param);
+void CaptureSamplerParameteri(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint sampler,
+                              GLenum pname,
+                              GLint param);
+void CaptureSamplerParameteriv(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint sampler,
+                               GLenum pname,
+                               const GLint *param);
+void CaptureScalef(CaptureWriter *writer, const Context *context, GLfloat x, GLfloat y, GLfloat z);
+void CaptureScalex(CaptureWriter *writer, const Context *context, GLfixed x, GLfixed y, GLfixed z);
+void CaptureScissor(CaptureWriter *writer,
+                    const Context *context,
+                    GLint x,
+                    GLint y,
+                    GLsizei width,
+                    GLsizei height);
+void CaptureSemaphoreParameterui64vEXT(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint semaphore,
+                                       GLenum pname,
+                                       const GLuint64 *params);
+void CaptureSetFenceNV(CaptureWriter *writer,
+                       const Context *context,
+                       GLuint fence,
+                       GLenum condition);
+void CaptureShadeModel(CaptureWriter *writer, const Context *context, GLenum mode);
+void CaptureShaderBinary(CaptureWriter *writer,
+                         const Context *context,
+                         GLsizei count,
+                         const GLuint *shaders,
+                         GLenum binaryformat,
+                         const void *binary,
+                         GLsizei length);
+void CaptureShaderSource(CaptureWriter *writer,
+                         const Context *context,
+                         GLuint shader,
+                         GLsizei count,
+                         const GLchar *const *string,
+                         const GLint *length);
+void CaptureSignalSemaphoreEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint semaphore,
+                               GLuint numBufferBarriers,
+                               const GLuint *buffers,
+                               GLuint numTextureBarriers,
+                               const GLuint *textures,
+                               const GLenum *dstLayouts);
+void CaptureStencilFunc(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum func,
+                        GLint ref,
+                        GLuint mask);
+void CaptureStencilFuncSeparate(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum face,
+                                GLenum func,
+                                GLint ref,
+                                GLuint mask);
+void CaptureStencilMask(CaptureWriter *writer, const Context *context, GLuint mask);
+void CaptureStencilMaskSeparate(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum face,
+                                GLuint mask);
+void CaptureStencilOp(CaptureWriter *writer,
+                      const Context *context,
+                      GLenum fail,
+                      GLenum zfail,
+                      GLenum zpass);
+void CaptureStencilOpSeparate(CaptureWriter *writer,
+                              const Context *context,
+                              GLenum face,
+                              GLenum sfail,
+                              GLenum dpfail,
+                              GLenum dppass);
+void CaptureTestFenceNV(CaptureWriter *writer,
+                        const Context *context,
+                        GLuint fence,
+                        GLboolean returnValue);
+void CaptureTexCoordPointer(CaptureWriter *writer,
+                            const Context *context,
+                            GLint size,
+                            GLenum type,
+                            GLsizei stride,
+                            const void *pointer);
+void CaptureTexEnvf(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum target,
+                    GLenum pname,
+                    GLfloat param);
+void CaptureTexEnvfv(CaptureWriter *writer,
+                     const Context *context,
+                     GLenum target,
+                     GLenum pname,
+                     const GLfloat *params);
+void CaptureTexEnvi(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum target,
+                    GLenum pname,
+                    GLint param);
+void CaptureTexEnviv(CaptureWriter *writer,
+                     const Context *context,
+                     GLenum target,
+                     GLenum pname,
+                     const GLint *params);
+void CaptureTexEnvx(CaptureWriter *writer,
+                    const Context *context,
+                    GLenum target,
+                    GLenum pname,
+                    GLfixed param);
+void CaptureTexEnvxv(CaptureWriter *writer,
+                     const Context *context,
+                     GLenum target,
+                     GLenum pname,
+                     const GLfixed *params);
+void CaptureTexGenfOES(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum coord,
+                       GLenum pname,
+                       GLfloat param);
+void CaptureTexGenfvOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum coord,
+                        GLenum pname,
+                        const GLfloat *params);
+void CaptureTexGeniOES(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum coord,
+                       GLenum pname,
+                       GLint param);
+void CaptureTexGenivOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum coord,
+                        GLenum pname,
+                        const GLint *params);
+void CaptureTexGenxOES(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum coord,
+                       GLenum pname,
+                       GLfixed param);
+void CaptureTexGenxvOES(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum coord,
+                        GLenum pname,
+                        const GLfixed *params);
+void CaptureTexImage2D(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels);
+void CaptureTexImage3D(CaptureWriter *writer,
+                       const Context *context,
+                       GLenum target,
+                       GLint level,
+                       GLint internalformat,
+                       GLsizei width,
+                       GLsizei height,
+                       GLsizei depth,
+                       GLint border,
+                       GLenum format,
+                       GLenum type,
+                       const void *pixels);
+void CaptureTexParameterIivOES(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLenum pname,
+                               const GLint *params);
+void CaptureTexParameterIuivOES(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum target,
+                                GLenum pname,
+                                const GLuint *params);
+void CaptureTexParameterf(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLfloat param);
+void CaptureTexParameterfv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfloat *params);
+void CaptureTexParameteri(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLint param);
+void CaptureTexParameteriv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLint *params);
+void CaptureTexParameterx(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLenum pname,
+                          GLfixed param);
+void CaptureTexParameterxv(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLenum pname,
+                           const GLfixed *params);
+void CaptureTexStorage1DEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width);
+void CaptureTexStorage2D(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height);
+void CaptureTexStorage2DEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height);
+void CaptureTexStorage2DMultisample(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum target,
+                                    GLsizei samples,
+                                    GLenum internalformat,
+                                    GLsizei width,
+                                    GLsizei height,
+                                    GLboolean fixedsamplelocations);
+void CaptureTexStorage3D(CaptureWriter *writer,
+                         const Context *context,
+                         GLenum target,
+                         GLsizei levels,
+                         GLenum internalformat,
+                         GLsizei width,
+                         GLsizei height,
+                         GLsizei depth);
+void CaptureTexStorage3DEXT(CaptureWriter *writer,
+                            const Context *context,
+                            GLenum target,
+                            GLsizei levels,
+                            GLenum internalformat,
+                            GLsizei width,
+                            GLsizei height,
+                            GLsizei depth);
+void CaptureTexStorage3DMultisampleOES(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLsizei samples,
+                                       GLenum internalformat,
+                                       GLsizei width,
+                                       GLsizei height,
+                                       GLsizei depth,
+                                       GLboolean fixedsamplelocations);
+void CaptureTexStorageMem2DEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLuint memory,
+                               GLuint64 offset);
+void CaptureTexStorageMem2DMultisampleEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset);
+void CaptureTexStorageMem3DEXT(CaptureWriter *writer,
+                               const Context *context,
+                               GLenum target,
+                               GLsizei levels,
+                               GLenum internalFormat,
+                               GLsizei width,
+                               GLsizei height,
+                               GLsizei depth,
+                               GLuint memory,
+                               GLuint64 offset);
+void CaptureTexStorageMem3DMultisampleEXT(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLsizei samples,
+                                          GLenum internalFormat,
+                                          GLsizei width,
+                                          GLsizei height,
+                                          GLsizei depth,
+                                          GLboolean fixedSampleLocations,
+                                          GLuint memory,
+                                          GLuint64 offset);
+void CaptureTexSubImage2D(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels);
+void CaptureTexSubImage3D(CaptureWriter *writer,
+                          const Context *context,
+                          GLenum target,
+                          GLint level,
+                          GLint xoffset,
+                          GLint yoffset,
+                          GLint zoffset,
+                          GLsizei width,
+                          GLsizei height,
+                          GLsizei depth,
+                          GLenum format,
+                          GLenum type,
+                          const void *pixels);
+void CaptureTransformFeedbackVaryings(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLsizei count,
+                                      const GLchar *const *varyings,
+                                      GLenum bufferMode);
+void CaptureTranslatef(CaptureWriter *writer,
+                       const Context *context,
+                       GLfloat x,
+                       GLfloat y,
+                       GLfloat z);
+void CaptureTranslatex(CaptureWriter *writer,
+                       const Context *context,
+                       GLfixed x,
+                       GLfixed y,
+                       GLfixed z);
+void CaptureUniform1f(CaptureWriter *writer, const Context *context, GLint location, GLfloat v0);
+void CaptureUniform1fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value);
+void CaptureUniform1i(CaptureWriter *writer, const Context *context, GLint location, GLint v0);
+void CaptureUniform1iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value);
+void CaptureUniform1ui(CaptureWriter *writer, const Context *context, GLint location, GLuint v0);
+void CaptureUniform1uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value);
+void CaptureUniform2f(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1);
+void CaptureUniform2fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value);
+void CaptureUniform2i(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1);
+void CaptureUniform2iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value);
+void CaptureUniform2ui(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1);
+void CaptureUniform2uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value);
+void CaptureUniform3f(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2);
+void CaptureUniform3fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value);
+void CaptureUniform3i(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1,
+                      GLint v2);
+void CaptureUniform3iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value);
+void CaptureUniform3ui(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1,
+                       GLuint v2);
+void CaptureUniform3uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value);
+void CaptureUniform4f(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLfloat v0,
+                      GLfloat v1,
+                      GLfloat v2,
+                      GLfloat v3);
+void CaptureUniform4fv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLfloat *value);
+void CaptureUniform4i(CaptureWriter *writer,
+                      const Context *context,
+                      GLint location,
+                      GLint v0,
+                      GLint v1,
+                      GLint v2,
+                      GLint v3);
+void CaptureUniform4iv(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLsizei count,
+                       const GLint *value);
+void CaptureUniform4ui(CaptureWriter *writer,
+                       const Context *context,
+                       GLint location,
+                       GLuint v0,
+                       GLuint v1,
+                       GLuint v2,
+                       GLuint v3);
+void CaptureUniform4uiv(CaptureWriter *writer,
+                        const Context *context,
+                        GLint location,
+                        GLsizei count,
+                        const GLuint *value);
+void CaptureUniformBlockBinding(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint program,
+                                GLuint uniformBlockIndex,
+                                GLuint uniformBlockBinding);
+void CaptureUniformMatrix2fv(CaptureWriter *writer,
+                             const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+void CaptureUniformMatrix2x3fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix2x4fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix3fv(CaptureWriter *writer,
+                             const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+void CaptureUniformMatrix3x2fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix3x4fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix4fv(CaptureWriter *writer,
+                             const Context *context,
+                             GLint location,
+                             GLsizei count,
+                             GLboolean transpose,
+                             const GLfloat *value);
+void CaptureUniformMatrix4x2fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUniformMatrix4x3fv(CaptureWriter *writer,
+                               const Context *context,
+                               GLint location,
+                               GLsizei count,
+                               GLboolean transpose,
+                               const GLfloat *value);
+void CaptureUnmapBuffer(CaptureWriter *writer,
+                        const Context *context,
+                        GLenum target,
+                        GLboolean returnValue);
+void CaptureUnmapBufferOES(CaptureWriter *writer,
+                           const Context *context,
+                           GLenum target,
+                           GLboolean returnValue);
+void CaptureUseProgram(CaptureWriter *writer, const Context *context, GLuint program);
+void CaptureUseProgramStages(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint pipeline,
+                             GLbitfield stages,
+                             GLuint program);
+void CaptureValidateProgram(CaptureWriter *writer, const Context *context, GLuint program);
+void CaptureValidateProgramPipeline(CaptureWriter *writer, const Context *context, GLuint pipeline);
+void CaptureVertexAttrib1f(CaptureWriter *writer, const Context *context, GLuint index, GLfloat x);
+void CaptureVertexAttrib1fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v);
+void CaptureVertexAttrib2f(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y);
+void CaptureVertexAttrib2fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v);
+void CaptureVertexAttrib3f(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z);
+void CaptureVertexAttrib3fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v);
+void CaptureVertexAttrib4f(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint index,
+                           GLfloat x,
+                           GLfloat y,
+                           GLfloat z,
+                           GLfloat w);
+void CaptureVertexAttrib4fv(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            const GLfloat *v);
+void CaptureVertexAttribBinding(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint attribindex,
+                                GLuint bindingindex);
+void CaptureVertexAttribDivisor(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint index,
+                                GLuint divisor);
+void CaptureVertexAttribDivisorANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint index,
+                                     GLuint divisor);
+void CaptureVertexAttribDivisorEXT(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint index,
+                                   GLuint divisor);
+void CaptureVertexAttribFormat(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint attribindex,
+                               GLint size,
+                               GLenum type,
+                               GLboolean normalized,
+                               GLuint relativeoffset);
+void CaptureVertexAttribI4i(CaptureWriter *writer,
+                            const Context *context,
+                            GLuint index,
+                            GLint x,
+                            GLint y,
+                            GLint z,
+                            GLint w);
+void CaptureVertexAttribI4iv(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint index,
+                             const GLint *v);
+void CaptureVertexAttribI4ui(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint index,
+                             GLuint x,
+                             GLuint y,
+                             GLuint z,
+                             GLuint w);
+void CaptureVertexAttribI4uiv(CaptureWriter *writer,
+                              const Context *context,
+                              GLuint index,
+                              const GLuint *v);
+void CaptureVertexAttribIFormat(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint attribindex,
+                                GLint size,
+                                GLenum type,
+                                GLuint relativeoffset);
+void CaptureVertexAttribIPointer(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint index,
+                                 GLint size,
+                                 GLenum type,
+                                 GLsizei stride,
+                                 const void *pointer);
+void CaptureVertexAttribPointer(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint index,
+                                GLint size,
+                                GLenum type,
+                                GLboolean normalized,
+                                GLsizei stride,
+                                const void *pointer);
+void CaptureVertexBindingDivisor(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint bindingindex,
+                                 GLuint divisor);
+void CaptureVertexPointer(CaptureWriter *writer,
+                          const Context *context,
+                          GLint size,
+                          GLenum type,
+                          GLsizei stride,
+                          const void *pointer);
+void CaptureViewport(CaptureWriter *writer,
+                     const Context *context,
+                     GLint x,
+                     GLint y,
+                     GLsizei width,
+                     GLsizei height);
+void CaptureWaitSemaphoreEXT(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint semaphore,
+                             GLuint numBufferBarriers,
+                             const GLuint *buffers,
+                             GLuint numTextureBarriers,
+                             const GLuint *textures,
+                             const GLenum *srcLayouts);
+void CaptureWaitSync(CaptureWriter *writer,
+                     const Context *context,
+                     GLsync sync,
+                     GLbitfield flags,
+                     GLuint64 timeout);
+void CaptureWeightPointerOES(CaptureWriter *writer,
+                             const Context *context,
+                             GLint size,
+                             GLenum type,
+                             GLsizei stride,
+                             const void *pointer);
+void CaptureBindUniformLocationCHROMIUM(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint program,
+                                        GLint location,
+                                        const GLchar *name);
+void CaptureCoverageModulationCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum components);
+void CaptureMatrixLoadfCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum matrixMode,
+                                const GLfloat *matrix);
+void CaptureMatrixLoadIdentityCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum matrixMode);
+void CaptureGenPathsCHROMIUM(CaptureWriter *writer,
+                             const Context *context,
+                             GLsizei range,
+                             GLuint returnValue);
+void CaptureDeletePathsCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint first,
+                                GLsizei range);
+void CaptureIsPathCHROMIUM(CaptureWriter *writer,
+                           const Context *context,
+                           GLuint path,
+                           GLboolean returnValue);
+void CapturePathCommandsCHROMIUM(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLuint path,
+                                 GLsizei numCommands,
+                                 const GLubyte *commands,
+                                 GLsizei numCoords,
+                                 GLenum coordType,
+                                 const void *coords);
+void CapturePathParameterfCHROMIUM(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint path,
+                                   GLenum pname,
+                                   GLfloat value);
+void CapturePathParameteriCHROMIUM(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint path,
+                                   GLenum pname,
+                                   GLint value);
+void CaptureGetPathParameterfvCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLfloat *value);
+void CaptureGetPathParameterivCHROMIUM(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLuint path,
+                                       GLenum pname,
+                                       GLint *value);
+void CapturePathStencilFuncCHROMIUM(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLenum func,
+                                    GLint ref,
+                                    GLuint mask);
+void CaptureStencilFillPathCHROMIUM(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint path,
+                                    GLenum fillMode,
+                                    GLuint mask);
+void CaptureStencilStrokePathCHROMIUM(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint path,
+                                      GLint reference,
+                                      GLuint mask);
+void CaptureCoverFillPathCHROMIUM(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint path,
+                                  GLenum coverMode);
+void CaptureCoverStrokePathCHROMIUM(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint path,
+                                    GLenum coverMode);
+void CaptureStencilThenCoverFillPathCHROMIUM(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint path,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum coverMode);
+void CaptureStencilThenCoverStrokePathCHROMIUM(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint path,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum coverMode);
+void CaptureCoverFillPathInstancedCHROMIUM(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLsizei numPath,
+                                           GLenum pathNameType,
+                                           const void *paths,
+                                           GLuint pathBase,
+                                           GLenum coverMode,
+                                           GLenum transformType,
+                                           const GLfloat *transformValues);
+void CaptureCoverStrokePathInstancedCHROMIUM(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLsizei numPath,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum coverMode,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues);
+void CaptureStencilStrokePathInstancedCHROMIUM(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLsizei numPath,
+                                               GLenum pathNameType,
+                                               const void *paths,
+                                               GLuint pathBase,
+                                               GLint reference,
+                                               GLuint mask,
+                                               GLenum transformType,
+                                               const GLfloat *transformValues);
+void CaptureStencilFillPathInstancedCHROMIUM(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLsizei numPaths,
+                                             GLenum pathNameType,
+                                             const void *paths,
+                                             GLuint pathBase,
+                                             GLenum fillMode,
+                                             GLuint mask,
+                                             GLenum transformType,
+                                             const GLfloat *transformValues);
+void CaptureStencilThenCoverFillPathInstancedCHROMIUM(CaptureWriter *writer,
+                                                      const Context *context,
+                                                      GLsizei numPaths,
+                                                      GLenum pathNameType,
+                                                      const void *paths,
+                                                      GLuint pathBase,
+                                                      GLenum fillMode,
+                                                      GLuint mask,
+                                                      GLenum coverMode,
+                                                      GLenum transformType,
+                                                      const GLfloat *transformValues);
+void CaptureStencilThenCoverStrokePathInstancedCHROMIUM(CaptureWriter *writer,
+                                                        const Context *context,
+                                                        GLsizei numPaths,
+                                                        GLenum pathNameType,
+                                                        const void *paths,
+                                                        GLuint pathBase,
+                                                        GLint reference,
+                                                        GLuint mask,
+                                                        GLenum coverMode,
+                                                        GLenum transformType,
+                                                        const GLfloat *transformValues);
+void CaptureBindFragmentInputLocationCHROMIUM(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLuint programs,
+                                              GLint location,
+                                              const GLchar *name);
+void CaptureProgramPathFragmentInputGenCHROMIUM(CaptureWriter *writer,
+                                                const Context *context,
+                                                GLuint program,
+                                                GLint location,
+                                                GLenum genMode,
+                                                GLint components,
+                                                const GLfloat *coeffs);
+void CaptureCopyTextureCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLuint sourceId,
+                                GLint sourceLevel,
+                                GLenum destTarget,
+                                GLuint destId,
+                                GLint destLevel,
+                                GLint internalFormat,
+                                GLenum destType,
+                                GLboolean unpackFlipY,
+                                GLboolean unpackPremultiplyAlpha,
+                                GLboolean unpackUnmultiplyAlpha);
+void CaptureCopySubTextureCHROMIUM(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint sourceId,
+                                   GLint sourceLevel,
+                                   GLenum destTarget,
+                                   GLuint destId,
+                                   GLint destLevel,
+                                   GLint xoffset,
+                                   GLint yoffset,
+                                   GLint x,
+                                   GLint y,
+                                   GLint width,
+                                   GLint height,
+                                   GLboolean unpackFlipY,
+                                   GLboolean unpackPremultiplyAlpha,
+                                   GLboolean unpackUnmultiplyAlpha);
+void CaptureCompressedCopyTextureCHROMIUM(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint sourceId,
+                                          GLuint destId);
+void CaptureRequestExtensionANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  const GLchar *name);
+void CaptureGetBooleanvRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLboolean *params);
+void CaptureGetBufferParameterivRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum target,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            GLsizei *length,
+                                            GLint *params);
+void CaptureGetFloatvRobustANGLE(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum pname,
+                                 GLsizei bufSize,
+                                 GLsizei *length,
+                                 GLfloat *params);
+void CaptureGetFramebufferAttachmentParameterivRobustANGLE(CaptureWriter *writer,
+                                                           const Context *context,
+                                                           GLenum target,
+                                                           GLenum attachment,
+                                                           GLenum pname,
+                                                           GLsizei bufSize,
+                                                           GLsizei *length,
+                                                           GLint *params);
+void CaptureGetIntegervRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *data);
+void CaptureGetProgramivRobustANGLE(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLenum pname,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params);
+void CaptureGetRenderbufferParameterivRobustANGLE(CaptureWriter *writer,
+                                                  const Context *context,
+                                                  GLenum target,
+                                                  GLenum pname,
+                                                  GLsizei bufSize,
+                                                  GLsizei *length,
+                                                  GLint *params);
+void CaptureGetShaderivRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLuint shader,
+                                   GLenum pname,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLint *params);
+void CaptureGetTexParameterfvRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params);
+void CaptureGetTexParameterivRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params);
+void CaptureGetUniformfvRobustANGLE(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLfloat *params);
+void CaptureGetUniformivRobustANGLE(CaptureWriter *writer,
+                                    const Context *context,
+                                    GLuint program,
+                                    GLint location,
+                                    GLsizei bufSize,
+                                    GLsizei *length,
+                                    GLint *params);
+void CaptureGetVertexAttribfvRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLfloat *params);
+void CaptureGetVertexAttribivRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLuint index,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLint *params);
+void CaptureGetVertexAttribPointervRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint index,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               void **pointer);
+void CaptureReadPixelsRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLint x,
+                                  GLint y,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLsizei *columns,
+                                  GLsizei *rows,
+                                  void *pixels);
+void CaptureTexImage2DRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels);
+void CaptureTexParameterfvRobustANGLE(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLfloat *params);
+void CaptureTexParameterivRobustANGLE(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLenum target,
+                                      GLenum pname,
+                                      GLsizei bufSize,
+                                      const GLint *params);
+void CaptureTexSubImage2DRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels);
+void CaptureTexImage3DRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLint level,
+                                  GLint internalformat,
+                                  GLsizei width,
+                                  GLsizei height,
+                                  GLsizei depth,
+                                  GLint border,
+                                  GLenum format,
+                                  GLenum type,
+                                  GLsizei bufSize,
+                                  const void *pixels);
+void CaptureTexSubImage3DRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLint level,
+                                     GLint xoffset,
+                                     GLint yoffset,
+                                     GLint zoffset,
+                                     GLsizei width,
+                                     GLsizei height,
+                                     GLsizei depth,
+                                     GLenum format,
+                                     GLenum type,
+                                     GLsizei bufSize,
+                                     const void *pixels);
+void CaptureCompressedTexImage2DRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data);
+void CaptureCompressedTexSubImage2DRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLsizei xoffset,
+                                               GLsizei yoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data);
+void CaptureCompressedTexImage3DRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum target,
+                                            GLint level,
+                                            GLenum internalformat,
+                                            GLsizei width,
+                                            GLsizei height,
+                                            GLsizei depth,
+                                            GLint border,
+                                            GLsizei imageSize,
+                                            GLsizei dataSize,
+                                            const GLvoid *data);
+void CaptureCompressedTexSubImage3DRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLenum target,
+                                               GLint level,
+                                               GLint xoffset,
+                                               GLint yoffset,
+                                               GLint zoffset,
+                                               GLsizei width,
+                                               GLsizei height,
+                                               GLsizei depth,
+                                               GLenum format,
+                                               GLsizei imageSize,
+                                               GLsizei dataSize,
+                                               const GLvoid *data);
+void CaptureGetQueryivRobustANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum target,
+                                  GLenum pname,
+                                  GLsizei bufSize,
+                                  GLsizei *length,
+                                  GLint *params);
+void CaptureGetQueryObjectuivRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLuint id,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         GLuint *params);
+void CaptureGetBufferPointervRobustANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLenum pname,
+                                         GLsizei bufSize,
+                                         GLsizei *length,
+                                         void **params);
+void CaptureGetIntegeri_vRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *data);
+void CaptureGetInternalformativRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLenum internalformat,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLint *params);
+void CaptureGetVertexAttribIivRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint index,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params);
+void CaptureGetVertexAttribIuivRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint index,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params);
+void CaptureGetUniformuivRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLuint *params);
+void CaptureGetActiveUniformBlockivRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint program,
+                                               GLuint uniformBlockIndex,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLint *params);
+void CaptureGetInteger64vRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum pname,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint64 *data);
+void CaptureGetInteger64i_vRobustANGLE(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLuint index,
+                                       GLsizei bufSize,
+                                       GLsizei *length,
+                                       GLint64 *data);
+void CaptureGetBufferParameteri64vRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum target,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint64 *params);
+void CaptureSamplerParameterivRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint sampler,
+                                          GLuint pname,
+                                          GLsizei bufSize,
+                                          const GLint *param);
+void CaptureSamplerParameterfvRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint sampler,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          const GLfloat *param);
+void CaptureGetSamplerParameterivRobustANGLE(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params);
+void CaptureGetSamplerParameterfvRobustANGLE(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint sampler,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLfloat *params);
+void CaptureGetFramebufferParameterivRobustANGLE(CaptureWriter *writer,
+                                                 const Context *context,
+                                                 GLuint sampler,
+                                                 GLenum pname,
+                                                 GLsizei bufSize,
+                                                 GLsizei *length,
+                                                 GLint *params);
+void CaptureGetProgramInterfaceivRobustANGLE(CaptureWriter *writer,
+                                             const Context *context,
+                                             GLuint program,
+                                             GLenum programInterface,
+                                             GLenum pname,
+                                             GLsizei bufSize,
+                                             GLsizei *length,
+                                             GLint *params);
+void CaptureGetBooleani_vRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLenum target,
+                                     GLuint index,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLboolean *data);
+void CaptureGetMultisamplefvRobustANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum pname,
+                                        GLuint index,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLfloat *val);
+void CaptureGetTexLevelParameterivRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params);
+void CaptureGetTexLevelParameterfvRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum target,
+                                              GLint level,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLfloat *params);
+void CaptureGetPointervRobustANGLERobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              void **params);
+void CaptureReadnPixelsRobustANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLint x,
+                                   GLint y,
+                                   GLsizei width,
+                                   GLsizei height,
+                                   GLenum format,
+                                   GLenum type,
+                                   GLsizei bufSize,
+                                   GLsizei *length,
+                                   GLsizei *columns,
+                                   GLsizei *rows,
+                                   void *data);
+void CaptureGetnUniformfvRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLfloat *params);
+void CaptureGetnUniformivRobustANGLE(CaptureWriter *writer,
+                                     const Context *context,
+                                     GLuint program,
+                                     GLint location,
+                                     GLsizei bufSize,
+                                     GLsizei *length,
+                                     GLint *params);
+void CaptureGetnUniformuivRobustANGLE(CaptureWriter *writer,
+                                      const Context *context,
+                                      GLuint program,
+                                      GLint location,
+                                      GLsizei bufSize,
+                                      GLsizei *length,
+                                      GLuint *params);
+void CaptureTexParameterIivRobustANGLE(CaptureWriter *writer,
+                                       const Context *context,
+                                       GLenum target,
+                                       GLenum pname,
+                                       GLsizei bufSize,
+                                       const GLint *params);
+void CaptureTexParameterIuivRobustANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum target,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        const GLuint *params);
+void CaptureGetTexParameterIivRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum target,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint *params);
+void CaptureGetTexParameterIuivRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLenum target,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint *params);
+void CaptureSamplerParameterIivRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint sampler,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           const GLint *param);
+void CaptureSamplerParameterIuivRobustANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLuint sampler,
+                                            GLenum pname,
+                                            GLsizei bufSize,
+                                            const GLuint *param);
+void CaptureGetSamplerParameterIivRobustANGLE(CaptureWriter *writer,
+                                              const Context *context,
+                                              GLuint sampler,
+                                              GLenum pname,
+                                              GLsizei bufSize,
+                                              GLsizei *length,
+                                              GLint *params);
+void CaptureGetSamplerParameterIuivRobustANGLE(CaptureWriter *writer,
+                                               const Context *context,
+                                               GLuint sampler,
+                                               GLenum pname,
+                                               GLsizei bufSize,
+                                               GLsizei *length,
+                                               GLuint *params);
+void CaptureGetQueryObjectivRobustANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLuint id,
+                                        GLenum pname,
+                                        GLsizei bufSize,
+                                        GLsizei *length,
+                                        GLint *params);
+void CaptureGetQueryObjecti64vRobustANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLuint id,
+                                          GLenum pname,
+                                          GLsizei bufSize,
+                                          GLsizei *length,
+                                          GLint64 *params);
+void CaptureGetQueryObjectui64vRobustANGLE(CaptureWriter *writer,
+                                           const Context *context,
+                                           GLuint id,
+                                           GLenum pname,
+                                           GLsizei bufSize,
+                                           GLsizei *length,
+                                           GLuint64 *params);
+void CaptureCopyTexture3DANGLE(CaptureWriter *writer,
+                               const Context *context,
+                               GLuint sourceId,
+                               GLint sourceLevel,
+                               GLenum destTarget,
+                               GLuint destId,
+                               GLint destLevel,
+                               GLint internalFormat,
+                               GLenum destType,
+                               GLboolean unpackFlipY,
+                               GLboolean unpackPremultiplyAlpha,
+                               GLboolean unpackUnmultiplyAlpha);
+void CaptureCopySubTexture3DANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLuint sourceId,
+                                  GLint sourceLevel,
+                                  GLenum destTarget,
+                                  GLuint destId,
+                                  GLint destLevel,
+                                  GLint xoffset,
+                                  GLint yoffset,
+                                  GLint zoffset,
+                                  GLint x,
+                                  GLint y,
+                                  GLint z,
+                                  GLint width,
+                                  GLint height,
+                                  GLint depth,
+                                  GLboolean unpackFlipY,
+                                  GLboolean unpackPremultiplyAlpha,
+                                  GLboolean unpackUnmultiplyAlpha);
+void CaptureTexStorage2DMultisampleANGLE(CaptureWriter *writer,
+                                         const Context *context,
+                                         GLenum target,
+                                         GLsizei samples,
+                                         GLenum internalformat,
+                                         GLsizei width,
+                                         GLsizei height,
+                                         GLboolean fixedsamplelocations);
+void CaptureGetTexLevelParameterivANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLint *params);
+void CaptureGetTexLevelParameterfvANGLE(CaptureWriter *writer,
+                                        const Context *context,
+                                        GLenum target,
+                                        GLint level,
+                                        GLenum pname,
+                                        GLfloat *params);
+void CaptureMultiDrawArraysANGLE(CaptureWriter *writer,
+                                 const Context *context,
+                                 GLenum mode,
+                                 const GLint *firsts,
+                                 const GLsizei *counts,
+                                 GLsizei drawcount);
+void CaptureMultiDrawArraysInstancedANGLE(CaptureWriter *writer,
+                                          const Context *context,
+                                          GLenum mode,
+                                          const GLint *firsts,
+                                          const GLsizei *counts,
+                                          const GLsizei *instanceCounts,
+                                          GLsizei drawcount);
+void CaptureMultiDrawElementsANGLE(CaptureWriter *writer,
+                                   const Context *context,
+                                   GLenum mode,
+                                   const GLsizei *counts,
+                                   GLenum type,
+                                   const GLvoid *const *indices,
+                                   GLsizei drawcount);
+void CaptureMultiDrawElementsInstancedANGLE(CaptureWriter *writer,
+                                            const Context *context,
+                                            GLenum mode,
+                                            const GLsizei *counts,
+                                            GLenum type,
+                                            const GLvoid *const *indices,
+                                            const GLsizei *instanceCounts,
+                                            GLsizei drawcount);
+void CaptureGetMultisamplefvANGLE(CaptureWriter *writer,
+                                  const Context *context,
+                                  GLenum pname,
+                                  GLuint index,
+                                  GLfloat *val);
+void CaptureSampleMaskiANGLE(CaptureWriter *writer,
+                             const Context *context,
+                             GLuint maskNumber,
+                             GLbitfield mask);
+void CaptureProvokingVertexANGLE(CaptureWriter *writer, const Context *context, GLenum mode);
+void CaptureLoseContextCHROMIUM(CaptureWriter *writer,
+                                const Context *context,
+                                GLenum current,
+                                GLenum other);
+}  // namespace gl
+
+#endif  // LIBGLESV2_CAPTURE_GLES_AUTOGEN_H_
@@ -0,0 +1,100 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_point_stats.cpp:
+//   Implements the per entry point call counts and CPU time.
+
+#include "libGLESv2/entry_point_stats.h"
+
+#if defined(ANGLE_ENABLE_ENTRY_POINT_STATS)
+
+#    include <algorithm>
+#    include <cstdlib>
+#    include <vector>
+
+#    include "common/mathutil.h"
+#    include "common/system_utils.h"
+
+namespace gl
+{
+namespace
+{
+angle::PackedEnumMap<EntryPoint, EntryPointStats> gEntryPointStats;
+
+void DumpEntryPointStatsAtExit()
+{
+    std::string path = angle::GetEnvironmentVar("ANGLE_ENTRY_POINT_STATS_FILE");
+    FILE *file       = path.empty() ? stderr : fopen(path.c_str(), "w");
+    if (!file)
+    {
+        return;
+    }
+
+    DumpEntryPointStats(file);
+
+    if (file != stderr)
+    {
+        fclose(file);
+    }
+}
+}  // anonymous namespace
+
+void RecordEntryPointCall(EntryPoint entryPoint, uint64_t timeNs)
+{
+    static bool registeredDump = (std::atexit(DumpEntryPointStatsAtExit) == 0);
+    ANGLE_UNUSED_VARIABLE(registeredDump);
+
+    uint32_t clampedTimeNs = static_cast<uint32_t>(std::min<uint64_t>(timeNs, 0xFFFFFFFFu));
+    size_t bucket          = clampedTimeNs == 0 ? 0 : static_cast<size_t>(FindMSB(clampedTimeNs));
+
+    EntryPointStats &stats = gEntryPointStats[entryPoint];
+    stats.callCount.fetch_add(1, std::memory_order_relaxed);
+    stats.totalTimeNs.fetch_add(timeNs, std::memory_order_relaxed);
+    stats.timeHistogram[bucket].fetch_add(1, std::memory_order_relaxed);
+}
+
+void DumpEntryPointStats(FILE *file)
+{
+    std::vector<EntryPoint> called;
+    for (size_t index = 0; index < angle::EnumSize<EntryPoint>(); ++index)
+    {
+        EntryPoint entryPoint = static_cast<EntryPoint>(index);
+        if (gEntryPointStats[entryPoint].callCount.load(std::memory_order_relaxed) > 0)
+        {
+            called.push_back(entryPoint);
+        }
+    }
+
+    std::sort(called.begin(), called.end(), [](EntryPoint a, EntryPoint b) {
+        return gEntryPointStats[a].totalTimeNs.load(std::memory_order_relaxed) >
+               gEntryPointStats[b].totalTimeNs.load(std::memory_order_relaxed);
+    });
+
+    fprintf(file, "%-40s %12s %14s %12s  %s\n", "entry point", "calls", "total ms", "avg ns",
+            "histogram (log2 ns: calls)");
+    for (EntryPoint entryPoint : called)
+    {
+        const EntryPointStats &stats = gEntryPointStats[entryPoint];
+        uint64_t callCount           = stats.callCount.load(std::memory_order_relaxed);
+        uint64_t totalTimeNs         = stats.totalTimeNs.load(std::memory_order_relaxed);
+
+        fprintf(file, "%-40s %12llu %14.3f %12.1f ", GetEntryPointName(entryPoint),
+                static_cast<unsigned long long>(callCount), totalTimeNs * 1e-6,
+                static_cast<double>(totalTimeNs) / callCount);
+        for (size_t bucket = 0; bucket < kEntryPointTimeBuckets; ++bucket)
+        {
+            uint64_t bucketCount = stats.timeHistogram[bucket].load(std::memory_order_relaxed);
+            if (bucketCount > 0)
+            {
+                fprintf(file, " %zu:%llu", bucket, static_cast<unsigned long long>(bucketCount));
+            }
+        }
+        fprintf(file, "\n");
+    }
+    fflush(file);
+}
+}  // namespace gl
+
+#endif  // defined(ANGLE_ENABLE_ENTRY_POINT_STATS)
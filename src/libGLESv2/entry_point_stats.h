@@ -0,0 +1,68 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_point_stats.h:
+//   Per entry point call counts and CPU time, for builds with angle_enable_entry_point_stats. The
+//   generated entry points record themselves with ANGLE_SCOPED_ENTRY_POINT_STATS, and the stats
+//   are written to stderr, or to the file named by ANGLE_ENTRY_POINT_STATS_FILE, at exit.
+
+#ifndef LIBGLESV2_ENTRY_POINT_STATS_H_
+#define LIBGLESV2_ENTRY_POINT_STATS_H_
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+#if defined(ANGLE_ENABLE_ENTRY_POINT_STATS)
+
+#    include <array>
+#    include <atomic>
+#    include <chrono>
+#    include <stdio.h>
+
+#    include "common/PackedEnums.h"
+#    include "common/angleutils.h"
+
+namespace gl
+{
+// Call times are bucketed by powers of two nanoseconds: bucket i counts the calls that took
+// [2^i, 2^(i+1)) ns. The last bucket also counts the longer calls.
+constexpr size_t kEntryPointTimeBuckets = 32;
+
+struct EntryPointStats
+{
+    std::atomic<uint64_t> callCount;
+    std::atomic<uint64_t> totalTimeNs;
+    std::array<std::atomic<uint64_t>, kEntryPointTimeBuckets> timeHistogram;
+};
+
+void RecordEntryPointCall(EntryPoint entryPoint, uint64_t timeNs);
+
+// Writes the stats of every called entry point, most expensive first.
+void DumpEntryPointStats(FILE *file);
+
+class ScopedEntryPointStats final : angle::NonCopyable
+{
+  public:
+    explicit ScopedEntryPointStats(EntryPoint entryPoint)
+        : mEntryPoint(entryPoint), mStartTime(std::chrono::steady_clock::now())
+    {}
+
+    ~ScopedEntryPointStats()
+    {
+        std::chrono::nanoseconds elapsed = std::chrono::steady_clock::now() - mStartTime;
+        RecordEntryPointCall(mEntryPoint, static_cast<uint64_t>(elapsed.count()));
+    }
+
+  private:
+    EntryPoint mEntryPoint;
+    std::chrono::steady_clock::time_point mStartTime;
+};
+}  // namespace gl
+
+#    define ANGLE_SCOPED_ENTRY_POINT_STATS(EP) gl::ScopedEntryPointStats entryPointStats(EP)
+#else
+#    define ANGLE_SCOPED_ENTRY_POINT_STATS(EP)
+#endif  // defined(ANGLE_ENABLE_ENTRY_POINT_STATS)
+
+#endif  // LIBGLESV2_ENTRY_POINT_STATS_H_
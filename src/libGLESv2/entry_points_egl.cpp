@@ -19,6 +19,7 @@
 #include "libANGLE/Thread.h"
 #include "libANGLE/queryutils.h"
 #include "libANGLE/validationEGL.h"
+#include "libGLESv2/api_capture.h"
 #include "libGLESv2/global_state.h"
 #include "libGLESv2/proc_table.h"
 
@@ -27,11 +28,6 @@ using namespace egl;
 namespace
 {
 
-bool CompareProc(const ProcEntry &a, const char *b)
-{
-    return strcmp(a.first, b) < 0;
-}
-
 void ClipConfigs(const std::vector<const Config *> &filteredConfigs,
                  EGLConfig *output_configs,
                  EGLint config_size,
@@ -570,6 +566,7 @@ EGLBoolean EGLAPIENTRY EGL_SwapBuffers(EGLDisplay dpy, EGLSurface surface)
 
     ANGLE_EGL_TRY_RETURN(thread, eglSurface->swap(thread->getContext()), "eglSwapBuffers",
                          GetSurfaceIfValid(display, eglSurface), EGL_FALSE);
+    ANGLE_CAPTURE_FRAME_END();
 
     thread->setSuccess();
     return EGL_TRUE;
@@ -1057,12 +1054,11 @@ __eglMustCastToProperFunctionPointerType EGLAPIENTRY EGL_GetProcAddress(const ch
     EVENT("(const char *procname = \"%s\")", procname);
     Thread *thread = egl::GetCurrentThread();
 
-    ProcEntry *entry =
-        std::lower_bound(&g_procTable[0], &g_procTable[g_numProcs], procname, CompareProc);
+    const ProcEntry *entry = FindProcEntry(procname);
 
     thread->setSuccess();
 
-    if (entry == &g_procTable[g_numProcs] || strcmp(entry->first, procname) != 0)
+    if (entry == nullptr)
     {
         return nullptr;
     }
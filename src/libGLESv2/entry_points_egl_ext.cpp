@@ -18,6 +18,7 @@
 #include "libANGLE/Thread.h"
 #include "libANGLE/queryutils.h"
 #include "libANGLE/validationEGL.h"
+#include "libGLESv2/api_capture.h"
 #include "libGLESv2/global_state.h"
 
 using namespace egl;
@@ -1069,6 +1070,7 @@ EGLBoolean EGLAPIENTRY EGL_SwapBuffersWithDamageKHR(EGLDisplay dpy,
                          GetSurfaceIfValid(display, eglSurface));
         return EGL_FALSE;
     }
+    ANGLE_CAPTURE_FRAME_END();
 
     thread->setSuccess();
     return EGL_TRUE;
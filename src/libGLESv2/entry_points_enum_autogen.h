@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -21,6 +21,7 @@ enum class EntryPoint
     AlphaFunc,
     AlphaFuncx,
     AttachShader,
+    BatchCommandsANGLE,
     BeginQuery,
     BeginQueryEXT,
     BeginTransformFeedback,
@@ -661,7 +662,11 @@ enum class EntryPoint
     Viewport,
     WaitSemaphoreEXT,
     WaitSync,
-    WeightPointerOES
+    WeightPointerOES,
+
+    EnumCount
 };
+
+const char *GetEntryPointName(EntryPoint entryPoint);
 }  // namespace gl
 #endif  // LIBGLESV2_ENTRY_POINTS_ENUM_AUTOGEN_H_
@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by generate_entry_points.py using data from gl.xml.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -13,6 +13,9 @@
 #include "libANGLE/Context.h"
 #include "libANGLE/Context.inl.h"
 #include "libANGLE/validationES1.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,8 +23,10 @@ namespace gl
 {
 void GL_APIENTRY AlphaFunc(GLenum func, GLfloat ref)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AlphaFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfloat ref = %f)", func, ref);
+    ANGLE_BINARY_TRACE(EntryPoint::AlphaFunc, func, ref);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -30,14 +35,17 @@ void GL_APIENTRY AlphaFunc(GLenum func, GLfloat ref)
         if (context->skipValidation() || ValidateAlphaFunc(context, funcPacked, ref))
         {
             context->alphaFunc(funcPacked, ref);
+            ANGLE_CAPTURE(AlphaFunc, context, func, ref);
         }
     }
 }
 
 void GL_APIENTRY AlphaFuncx(GLenum func, GLfixed ref)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AlphaFuncx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfixed ref = 0x%X)", func, ref);
+    ANGLE_BINARY_TRACE(EntryPoint::AlphaFuncx, func, ref);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -46,15 +54,18 @@ void GL_APIENTRY AlphaFuncx(GLenum func, GLfixed ref)
         if (context->skipValidation() || ValidateAlphaFuncx(context, funcPacked, ref))
         {
             context->alphaFuncx(funcPacked, ref);
+            ANGLE_CAPTURE(AlphaFuncx, context, func, ref);
         }
     }
 }
 
 void GL_APIENTRY ClearColorx(GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearColorx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearColorx, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -62,14 +73,17 @@ void GL_APIENTRY ClearColorx(GLfixed red, GLfixed green, GLfixed blue, GLfixed a
         if (context->skipValidation() || ValidateClearColorx(context, red, green, blue, alpha))
         {
             context->clearColorx(red, green, blue, alpha);
+            ANGLE_CAPTURE(ClearColorx, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY ClearDepthx(GLfixed depth)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearDepthx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed depth = 0x%X)", depth);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearDepthx, depth);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -77,14 +91,17 @@ void GL_APIENTRY ClearDepthx(GLfixed depth)
         if (context->skipValidation() || ValidateClearDepthx(context, depth))
         {
             context->clearDepthx(depth);
+            ANGLE_CAPTURE(ClearDepthx, context, depth);
         }
     }
 }
 
 void GL_APIENTRY ClientActiveTexture(GLenum texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClientActiveTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_TRACE(EntryPoint::ClientActiveTexture, texture);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -92,14 +109,17 @@ void GL_APIENTRY ClientActiveTexture(GLenum texture)
         if (context->skipValidation() || ValidateClientActiveTexture(context, texture))
         {
             context->clientActiveTexture(texture);
+            ANGLE_CAPTURE(ClientActiveTexture, context, texture);
         }
     }
 }
 
 void GL_APIENTRY ClipPlanef(GLenum p, const GLfloat *eqn)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClipPlanef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum p = 0x%X, const GLfloat *eqn = 0x%016" PRIxPTR ")", p, (uintptr_t)eqn);
+    ANGLE_BINARY_TRACE(EntryPoint::ClipPlanef, p, eqn);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -107,15 +127,18 @@ void GL_APIENTRY ClipPlanef(GLenum p, const GLfloat *eqn)
         if (context->skipValidation() || ValidateClipPlanef(context, p, eqn))
         {
             context->clipPlanef(p, eqn);
+            ANGLE_CAPTURE(ClipPlanef, context, p, eqn);
         }
     }
 }
 
 void GL_APIENTRY ClipPlanex(GLenum plane, const GLfixed *equation)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClipPlanex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, const GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_TRACE(EntryPoint::ClipPlanex, plane, equation);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -123,15 +146,18 @@ void GL_APIENTRY ClipPlanex(GLenum plane, const GLfixed *equation)
         if (context->skipValidation() || ValidateClipPlanex(context, plane, equation))
         {
             context->clipPlanex(plane, equation);
+            ANGLE_CAPTURE(ClipPlanex, context, plane, equation);
         }
     }
 }
 
 void GL_APIENTRY Color4f(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::Color4f, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -139,15 +165,18 @@ void GL_APIENTRY Color4f(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha
         if (context->skipValidation() || ValidateColor4f(context, red, green, blue, alpha))
         {
             context->color4f(red, green, blue, alpha);
+            ANGLE_CAPTURE(Color4f, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY Color4ub(GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4ub);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLubyte red = %d, GLubyte green = %d, GLubyte blue = %d, GLubyte alpha = %d)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::Color4ub, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -155,15 +184,18 @@ void GL_APIENTRY Color4ub(GLubyte red, GLubyte green, GLubyte blue, GLubyte alph
         if (context->skipValidation() || ValidateColor4ub(context, red, green, blue, alpha))
         {
             context->color4ub(red, green, blue, alpha);
+            ANGLE_CAPTURE(Color4ub, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY Color4x(GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4x);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::Color4x, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -171,17 +203,20 @@ void GL_APIENTRY Color4x(GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha
         if (context->skipValidation() || ValidateColor4x(context, red, green, blue, alpha))
         {
             context->color4x(red, green, blue, alpha);
+            ANGLE_CAPTURE(Color4x, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY ColorPointer(GLint size, GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ColorPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::ColorPointer, size, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -191,14 +226,17 @@ void GL_APIENTRY ColorPointer(GLint size, GLenum type, GLsizei stride, const voi
             ValidateColorPointer(context, size, typePacked, stride, pointer))
         {
             context->colorPointer(size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(ColorPointer, context, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY DepthRangex(GLfixed n, GLfixed f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthRangex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed n = 0x%X, GLfixed f = 0x%X)", n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthRangex, n, f);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -206,14 +244,17 @@ void GL_APIENTRY DepthRangex(GLfixed n, GLfixed f)
         if (context->skipValidation() || ValidateDepthRangex(context, n, f))
         {
             context->depthRangex(n, f);
+            ANGLE_CAPTURE(DepthRangex, context, n, f);
         }
     }
 }
 
 void GL_APIENTRY DisableClientState(GLenum array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DisableClientState);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::DisableClientState, array);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -222,14 +263,17 @@ void GL_APIENTRY DisableClientState(GLenum array)
         if (context->skipValidation() || ValidateDisableClientState(context, arrayPacked))
         {
             context->disableClientState(arrayPacked);
+            ANGLE_CAPTURE(DisableClientState, context, array);
         }
     }
 }
 
 void GL_APIENTRY EnableClientState(GLenum array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EnableClientState);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::EnableClientState, array);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -238,14 +282,17 @@ void GL_APIENTRY EnableClientState(GLenum array)
         if (context->skipValidation() || ValidateEnableClientState(context, arrayPacked))
         {
             context->enableClientState(arrayPacked);
+            ANGLE_CAPTURE(EnableClientState, context, array);
         }
     }
 }
 
 void GL_APIENTRY Fogf(GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogf, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -253,15 +300,18 @@ void GL_APIENTRY Fogf(GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateFogf(context, pname, param))
         {
             context->fogf(pname, param);
+            ANGLE_CAPTURE(Fogf, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Fogfv(GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogfv, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -269,14 +319,17 @@ void GL_APIENTRY Fogfv(GLenum pname, const GLfloat *params)
         if (context->skipValidation() || ValidateFogfv(context, pname, params))
         {
             context->fogfv(pname, params);
+            ANGLE_CAPTURE(Fogfv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY Fogx(GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogx, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -284,15 +337,18 @@ void GL_APIENTRY Fogx(GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateFogx(context, pname, param))
         {
             context->fogx(pname, param);
+            ANGLE_CAPTURE(Fogx, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Fogxv(GLenum pname, const GLfixed *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogxv, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -300,17 +356,20 @@ void GL_APIENTRY Fogxv(GLenum pname, const GLfixed *param)
         if (context->skipValidation() || ValidateFogxv(context, pname, param))
         {
             context->fogxv(pname, param);
+            ANGLE_CAPTURE(Fogxv, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Frustumf(GLfloat l, GLfloat r, GLfloat b, GLfloat t, GLfloat n, GLfloat f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Frustumf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Frustumf, l, r, b, t, n, f);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -318,17 +377,20 @@ void GL_APIENTRY Frustumf(GLfloat l, GLfloat r, GLfloat b, GLfloat t, GLfloat n,
         if (context->skipValidation() || ValidateFrustumf(context, l, r, b, t, n, f))
         {
             context->frustumf(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Frustumf, context, l, r, b, t, n, f);
         }
     }
 }
 
 void GL_APIENTRY Frustumx(GLfixed l, GLfixed r, GLfixed b, GLfixed t, GLfixed n, GLfixed f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Frustumx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Frustumx, l, r, b, t, n, f);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -336,15 +398,18 @@ void GL_APIENTRY Frustumx(GLfixed l, GLfixed r, GLfixed b, GLfixed t, GLfixed n,
         if (context->skipValidation() || ValidateFrustumx(context, l, r, b, t, n, f))
         {
             context->frustumx(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Frustumx, context, l, r, b, t, n, f);
         }
     }
 }
 
 void GL_APIENTRY GetClipPlanef(GLenum plane, GLfloat *equation)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetClipPlanef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfloat *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_TRACE(EntryPoint::GetClipPlanef, plane, equation);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -352,15 +417,18 @@ void GL_APIENTRY GetClipPlanef(GLenum plane, GLfloat *equation)
         if (context->skipValidation() || ValidateGetClipPlanef(context, plane, equation))
         {
             context->getClipPlanef(plane, equation);
+            ANGLE_CAPTURE(GetClipPlanef, context, plane, equation);
         }
     }
 }
 
 void GL_APIENTRY GetClipPlanex(GLenum plane, GLfixed *equation)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetClipPlanex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_TRACE(EntryPoint::GetClipPlanex, plane, equation);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -368,14 +436,17 @@ void GL_APIENTRY GetClipPlanex(GLenum plane, GLfixed *equation)
         if (context->skipValidation() || ValidateGetClipPlanex(context, plane, equation))
         {
             context->getClipPlanex(plane, equation);
+            ANGLE_CAPTURE(GetClipPlanex, context, plane, equation);
         }
     }
 }
 
 void GL_APIENTRY GetFixedv(GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFixedv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFixedv, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -383,15 +454,18 @@ void GL_APIENTRY GetFixedv(GLenum pname, GLfixed *params)
         if (context->skipValidation() || ValidateGetFixedv(context, pname, params))
         {
             context->getFixedv(pname, params);
+            ANGLE_CAPTURE(GetFixedv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetLightfv(GLenum light, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetLightfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetLightfv, light, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -400,15 +474,18 @@ void GL_APIENTRY GetLightfv(GLenum light, GLenum pname, GLfloat *params)
         if (context->skipValidation() || ValidateGetLightfv(context, light, pnamePacked, params))
         {
             context->getLightfv(light, pnamePacked, params);
+            ANGLE_CAPTURE(GetLightfv, context, light, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetLightxv(GLenum light, GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetLightxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetLightxv, light, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -417,15 +494,18 @@ void GL_APIENTRY GetLightxv(GLenum light, GLenum pname, GLfixed *params)
         if (context->skipValidation() || ValidateGetLightxv(context, light, pnamePacked, params))
         {
             context->getLightxv(light, pnamePacked, params);
+            ANGLE_CAPTURE(GetLightxv, context, light, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetMaterialfv(GLenum face, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMaterialfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMaterialfv, face, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -434,15 +514,18 @@ void GL_APIENTRY GetMaterialfv(GLenum face, GLenum pname, GLfloat *params)
         if (context->skipValidation() || ValidateGetMaterialfv(context, face, pnamePacked, params))
         {
             context->getMaterialfv(face, pnamePacked, params);
+            ANGLE_CAPTURE(GetMaterialfv, context, face, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetMaterialxv(GLenum face, GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMaterialxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMaterialxv, face, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -451,14 +534,17 @@ void GL_APIENTRY GetMaterialxv(GLenum face, GLenum pname, GLfixed *params)
         if (context->skipValidation() || ValidateGetMaterialxv(context, face, pnamePacked, params))
         {
             context->getMaterialxv(face, pnamePacked, params);
+            ANGLE_CAPTURE(GetMaterialxv, context, face, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetPointerv(GLenum pname, void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPointerv, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -466,15 +552,18 @@ void GL_APIENTRY GetPointerv(GLenum pname, void **params)
         if (context->skipValidation() || ValidateGetPointerv(context, pname, params))
         {
             context->getPointerv(pname, params);
+            ANGLE_CAPTURE(GetPointerv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexEnvfv(GLenum target, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnvfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexEnvfv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -485,15 +574,18 @@ void GL_APIENTRY GetTexEnvfv(GLenum target, GLenum pname, GLfloat *params)
             ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params))
         {
             context->getTexEnvfv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(GetTexEnvfv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexEnviv(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnviv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexEnviv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -504,15 +596,18 @@ void GL_APIENTRY GetTexEnviv(GLenum target, GLenum pname, GLint *params)
             ValidateGetTexEnviv(context, targetPacked, pnamePacked, params))
         {
             context->getTexEnviv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(GetTexEnviv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexEnvxv(GLenum target, GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnvxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexEnvxv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -523,15 +618,18 @@ void GL_APIENTRY GetTexEnvxv(GLenum target, GLenum pname, GLfixed *params)
             ValidateGetTexEnvxv(context, targetPacked, pnamePacked, params))
         {
             context->getTexEnvxv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(GetTexEnvxv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexParameterxv(GLenum target, GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterxv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -541,14 +639,17 @@ void GL_APIENTRY GetTexParameterxv(GLenum target, GLenum pname, GLfixed *params)
             ValidateGetTexParameterxv(context, targetPacked, pname, params))
         {
             context->getTexParameterxv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterxv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY LightModelf(GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelf, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -556,15 +657,18 @@ void GL_APIENTRY LightModelf(GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateLightModelf(context, pname, param))
         {
             context->lightModelf(pname, param);
+            ANGLE_CAPTURE(LightModelf, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY LightModelfv(GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelfv, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -572,14 +676,17 @@ void GL_APIENTRY LightModelfv(GLenum pname, const GLfloat *params)
         if (context->skipValidation() || ValidateLightModelfv(context, pname, params))
         {
             context->lightModelfv(pname, params);
+            ANGLE_CAPTURE(LightModelfv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY LightModelx(GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelx, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -587,15 +694,18 @@ void GL_APIENTRY LightModelx(GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateLightModelx(context, pname, param))
         {
             context->lightModelx(pname, param);
+            ANGLE_CAPTURE(LightModelx, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY LightModelxv(GLenum pname, const GLfixed *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelxv, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -603,14 +713,17 @@ void GL_APIENTRY LightModelxv(GLenum pname, const GLfixed *param)
         if (context->skipValidation() || ValidateLightModelxv(context, pname, param))
         {
             context->lightModelxv(pname, param);
+            ANGLE_CAPTURE(LightModelxv, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Lightf(GLenum light, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", light, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightf, light, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -619,15 +732,18 @@ void GL_APIENTRY Lightf(GLenum light, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateLightf(context, light, pnamePacked, param))
         {
             context->lightf(light, pnamePacked, param);
+            ANGLE_CAPTURE(Lightf, context, light, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Lightfv(GLenum light, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightfv, light, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -636,14 +752,17 @@ void GL_APIENTRY Lightfv(GLenum light, GLenum pname, const GLfloat *params)
         if (context->skipValidation() || ValidateLightfv(context, light, pnamePacked, params))
         {
             context->lightfv(light, pnamePacked, params);
+            ANGLE_CAPTURE(Lightfv, context, light, pname, params);
         }
     }
 }
 
 void GL_APIENTRY Lightx(GLenum light, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", light, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightx, light, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -652,15 +771,18 @@ void GL_APIENTRY Lightx(GLenum light, GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateLightx(context, light, pnamePacked, param))
         {
             context->lightx(light, pnamePacked, param);
+            ANGLE_CAPTURE(Lightx, context, light, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Lightxv(GLenum light, GLenum pname, const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightxv, light, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -669,14 +791,17 @@ void GL_APIENTRY Lightxv(GLenum light, GLenum pname, const GLfixed *params)
         if (context->skipValidation() || ValidateLightxv(context, light, pnamePacked, params))
         {
             context->lightxv(light, pnamePacked, params);
+            ANGLE_CAPTURE(Lightxv, context, light, pname, params);
         }
     }
 }
 
 void GL_APIENTRY LineWidthx(GLfixed width)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LineWidthx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed width = 0x%X)", width);
+    ANGLE_BINARY_TRACE(EntryPoint::LineWidthx, width);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -684,14 +809,17 @@ void GL_APIENTRY LineWidthx(GLfixed width)
         if (context->skipValidation() || ValidateLineWidthx(context, width))
         {
             context->lineWidthx(width);
+            ANGLE_CAPTURE(LineWidthx, context, width);
         }
     }
 }
 
 void GL_APIENTRY LoadIdentity()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadIdentity);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::LoadIdentity);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -699,14 +827,17 @@ void GL_APIENTRY LoadIdentity()
         if (context->skipValidation() || ValidateLoadIdentity(context))
         {
             context->loadIdentity();
+            ANGLE_CAPTURE(LoadIdentity, context);
         }
     }
 }
 
 void GL_APIENTRY LoadMatrixf(const GLfloat *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadMatrixf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::LoadMatrixf, m);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -714,14 +845,17 @@ void GL_APIENTRY LoadMatrixf(const GLfloat *m)
         if (context->skipValidation() || ValidateLoadMatrixf(context, m))
         {
             context->loadMatrixf(m);
+            ANGLE_CAPTURE(LoadMatrixf, context, m);
         }
     }
 }
 
 void GL_APIENTRY LoadMatrixx(const GLfixed *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadMatrixx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::LoadMatrixx, m);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -729,14 +863,17 @@ void GL_APIENTRY LoadMatrixx(const GLfixed *m)
         if (context->skipValidation() || ValidateLoadMatrixx(context, m))
         {
             context->loadMatrixx(m);
+            ANGLE_CAPTURE(LoadMatrixx, context, m);
         }
     }
 }
 
 void GL_APIENTRY LogicOp(GLenum opcode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LogicOp);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum opcode = 0x%X)", opcode);
+    ANGLE_BINARY_TRACE(EntryPoint::LogicOp, opcode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -745,14 +882,17 @@ void GL_APIENTRY LogicOp(GLenum opcode)
         if (context->skipValidation() || ValidateLogicOp(context, opcodePacked))
         {
             context->logicOp(opcodePacked);
+            ANGLE_CAPTURE(LogicOp, context, opcode);
         }
     }
 }
 
 void GL_APIENTRY Materialf(GLenum face, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", face, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialf, face, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -761,15 +901,18 @@ void GL_APIENTRY Materialf(GLenum face, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateMaterialf(context, face, pnamePacked, param))
         {
             context->materialf(face, pnamePacked, param);
+            ANGLE_CAPTURE(Materialf, context, face, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Materialfv(GLenum face, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialfv, face, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -778,14 +921,17 @@ void GL_APIENTRY Materialfv(GLenum face, GLenum pname, const GLfloat *params)
         if (context->skipValidation() || ValidateMaterialfv(context, face, pnamePacked, params))
         {
             context->materialfv(face, pnamePacked, params);
+            ANGLE_CAPTURE(Materialfv, context, face, pname, params);
         }
     }
 }
 
 void GL_APIENTRY Materialx(GLenum face, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", face, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialx, face, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -794,15 +940,18 @@ void GL_APIENTRY Materialx(GLenum face, GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateMaterialx(context, face, pnamePacked, param))
         {
             context->materialx(face, pnamePacked, param);
+            ANGLE_CAPTURE(Materialx, context, face, pname, param);
         }
     }
 }
 
 void GL_APIENTRY Materialxv(GLenum face, GLenum pname, const GLfixed *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialxv, face, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -811,14 +960,17 @@ void GL_APIENTRY Materialxv(GLenum face, GLenum pname, const GLfixed *param)
         if (context->skipValidation() || ValidateMaterialxv(context, face, pnamePacked, param))
         {
             context->materialxv(face, pnamePacked, param);
+            ANGLE_CAPTURE(Materialxv, context, face, pname, param);
         }
     }
 }
 
 void GL_APIENTRY MatrixMode(GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixMode);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixMode, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -827,14 +979,17 @@ void GL_APIENTRY MatrixMode(GLenum mode)
         if (context->skipValidation() || ValidateMatrixMode(context, modePacked))
         {
             context->matrixMode(modePacked);
+            ANGLE_CAPTURE(MatrixMode, context, mode);
         }
     }
 }
 
 void GL_APIENTRY MultMatrixf(const GLfloat *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultMatrixf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::MultMatrixf, m);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -842,14 +997,17 @@ void GL_APIENTRY MultMatrixf(const GLfloat *m)
         if (context->skipValidation() || ValidateMultMatrixf(context, m))
         {
             context->multMatrixf(m);
+            ANGLE_CAPTURE(MultMatrixf, context, m);
         }
     }
 }
 
 void GL_APIENTRY MultMatrixx(const GLfixed *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultMatrixx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::MultMatrixx, m);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -857,15 +1015,18 @@ void GL_APIENTRY MultMatrixx(const GLfixed *m)
         if (context->skipValidation() || ValidateMultMatrixx(context, m))
         {
             context->multMatrixx(m);
+            ANGLE_CAPTURE(MultMatrixx, context, m);
         }
     }
 }
 
 void GL_APIENTRY MultiTexCoord4f(GLenum target, GLfloat s, GLfloat t, GLfloat r, GLfloat q)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiTexCoord4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLfloat s = %f, GLfloat t = %f, GLfloat r = %f, GLfloat q = %f)",
           target, s, t, r, q);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiTexCoord4f, target, s, t, r, q);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -873,17 +1034,20 @@ void GL_APIENTRY MultiTexCoord4f(GLenum target, GLfloat s, GLfloat t, GLfloat r,
         if (context->skipValidation() || ValidateMultiTexCoord4f(context, target, s, t, r, q))
         {
             context->multiTexCoord4f(target, s, t, r, q);
+            ANGLE_CAPTURE(MultiTexCoord4f, context, target, s, t, r, q);
         }
     }
 }
 
 void GL_APIENTRY MultiTexCoord4x(GLenum texture, GLfixed s, GLfixed t, GLfixed r, GLfixed q)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiTexCoord4x);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum texture = 0x%X, GLfixed s = 0x%X, GLfixed t = 0x%X, GLfixed r = 0x%X, GLfixed q = "
         "0x%X)",
         texture, s, t, r, q);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiTexCoord4x, texture, s, t, r, q);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -891,14 +1055,17 @@ void GL_APIENTRY MultiTexCoord4x(GLenum texture, GLfixed s, GLfixed t, GLfixed r
         if (context->skipValidation() || ValidateMultiTexCoord4x(context, texture, s, t, r, q))
         {
             context->multiTexCoord4x(texture, s, t, r, q);
+            ANGLE_CAPTURE(MultiTexCoord4x, context, texture, s, t, r, q);
         }
     }
 }
 
 void GL_APIENTRY Normal3f(GLfloat nx, GLfloat ny, GLfloat nz)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Normal3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat nx = %f, GLfloat ny = %f, GLfloat nz = %f)", nx, ny, nz);
+    ANGLE_BINARY_TRACE(EntryPoint::Normal3f, nx, ny, nz);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -906,14 +1073,17 @@ void GL_APIENTRY Normal3f(GLfloat nx, GLfloat ny, GLfloat nz)
         if (context->skipValidation() || ValidateNormal3f(context, nx, ny, nz))
         {
             context->normal3f(nx, ny, nz);
+            ANGLE_CAPTURE(Normal3f, context, nx, ny, nz);
         }
     }
 }
 
 void GL_APIENTRY Normal3x(GLfixed nx, GLfixed ny, GLfixed nz)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Normal3x);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed nx = 0x%X, GLfixed ny = 0x%X, GLfixed nz = 0x%X)", nx, ny, nz);
+    ANGLE_BINARY_TRACE(EntryPoint::Normal3x, nx, ny, nz);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -921,15 +1091,18 @@ void GL_APIENTRY Normal3x(GLfixed nx, GLfixed ny, GLfixed nz)
         if (context->skipValidation() || ValidateNormal3x(context, nx, ny, nz))
         {
             context->normal3x(nx, ny, nz);
+            ANGLE_CAPTURE(Normal3x, context, nx, ny, nz);
         }
     }
 }
 
 void GL_APIENTRY NormalPointer(GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::NormalPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::NormalPointer, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -939,17 +1112,20 @@ void GL_APIENTRY NormalPointer(GLenum type, GLsizei stride, const void *pointer)
             ValidateNormalPointer(context, typePacked, stride, pointer))
         {
             context->normalPointer(typePacked, stride, pointer);
+            ANGLE_CAPTURE(NormalPointer, context, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY Orthof(GLfloat l, GLfloat r, GLfloat b, GLfloat t, GLfloat n, GLfloat f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Orthof);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Orthof, l, r, b, t, n, f);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -957,17 +1133,20 @@ void GL_APIENTRY Orthof(GLfloat l, GLfloat r, GLfloat b, GLfloat t, GLfloat n, G
         if (context->skipValidation() || ValidateOrthof(context, l, r, b, t, n, f))
         {
             context->orthof(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Orthof, context, l, r, b, t, n, f);
         }
     }
 }
 
 void GL_APIENTRY Orthox(GLfixed l, GLfixed r, GLfixed b, GLfixed t, GLfixed n, GLfixed f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Orthox);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Orthox, l, r, b, t, n, f);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -975,14 +1154,17 @@ void GL_APIENTRY Orthox(GLfixed l, GLfixed r, GLfixed b, GLfixed t, GLfixed n, G
         if (context->skipValidation() || ValidateOrthox(context, l, r, b, t, n, f))
         {
             context->orthox(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Orthox, context, l, r, b, t, n, f);
         }
     }
 }
 
 void GL_APIENTRY PointParameterf(GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterf, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -991,15 +1173,18 @@ void GL_APIENTRY PointParameterf(GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidatePointParameterf(context, pnamePacked, param))
         {
             context->pointParameterf(pnamePacked, param);
+            ANGLE_CAPTURE(PointParameterf, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY PointParameterfv(GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterfv, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1008,14 +1193,17 @@ void GL_APIENTRY PointParameterfv(GLenum pname, const GLfloat *params)
         if (context->skipValidation() || ValidatePointParameterfv(context, pnamePacked, params))
         {
             context->pointParameterfv(pnamePacked, params);
+            ANGLE_CAPTURE(PointParameterfv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY PointParameterx(GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterx, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1024,15 +1212,18 @@ void GL_APIENTRY PointParameterx(GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidatePointParameterx(context, pnamePacked, param))
         {
             context->pointParameterx(pnamePacked, param);
+            ANGLE_CAPTURE(PointParameterx, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY PointParameterxv(GLenum pname, const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterxv, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1041,14 +1232,17 @@ void GL_APIENTRY PointParameterxv(GLenum pname, const GLfixed *params)
         if (context->skipValidation() || ValidatePointParameterxv(context, pnamePacked, params))
         {
             context->pointParameterxv(pnamePacked, params);
+            ANGLE_CAPTURE(PointParameterxv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY PointSize(GLfloat size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSize);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat size = %f)", size);
+    ANGLE_BINARY_TRACE(EntryPoint::PointSize, size);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1056,14 +1250,17 @@ void GL_APIENTRY PointSize(GLfloat size)
         if (context->skipValidation() || ValidatePointSize(context, size))
         {
             context->pointSize(size);
+            ANGLE_CAPTURE(PointSize, context, size);
         }
     }
 }
 
 void GL_APIENTRY PointSizex(GLfixed size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSizex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed size = 0x%X)", size);
+    ANGLE_BINARY_TRACE(EntryPoint::PointSizex, size);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1071,14 +1268,17 @@ void GL_APIENTRY PointSizex(GLfixed size)
         if (context->skipValidation() || ValidatePointSizex(context, size))
         {
             context->pointSizex(size);
+            ANGLE_CAPTURE(PointSizex, context, size);
         }
     }
 }
 
 void GL_APIENTRY PolygonOffsetx(GLfixed factor, GLfixed units)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PolygonOffsetx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed factor = 0x%X, GLfixed units = 0x%X)", factor, units);
+    ANGLE_BINARY_TRACE(EntryPoint::PolygonOffsetx, factor, units);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1086,14 +1286,17 @@ void GL_APIENTRY PolygonOffsetx(GLfixed factor, GLfixed units)
         if (context->skipValidation() || ValidatePolygonOffsetx(context, factor, units))
         {
             context->polygonOffsetx(factor, units);
+            ANGLE_CAPTURE(PolygonOffsetx, context, factor, units);
         }
     }
 }
 
 void GL_APIENTRY PopMatrix()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopMatrix);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PopMatrix);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1101,14 +1304,17 @@ void GL_APIENTRY PopMatrix()
         if (context->skipValidation() || ValidatePopMatrix(context))
         {
             context->popMatrix();
+            ANGLE_CAPTURE(PopMatrix, context);
         }
     }
 }
 
 void GL_APIENTRY PushMatrix()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushMatrix);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PushMatrix);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1116,14 +1322,17 @@ void GL_APIENTRY PushMatrix()
         if (context->skipValidation() || ValidatePushMatrix(context))
         {
             context->pushMatrix();
+            ANGLE_CAPTURE(PushMatrix, context);
         }
     }
 }
 
 void GL_APIENTRY Rotatef(GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Rotatef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat angle = %f, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", angle, x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Rotatef, angle, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1131,15 +1340,18 @@ void GL_APIENTRY Rotatef(GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
         if (context->skipValidation() || ValidateRotatef(context, angle, x, y, z))
         {
             context->rotatef(angle, x, y, z);
+            ANGLE_CAPTURE(Rotatef, context, angle, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY Rotatex(GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Rotatex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed angle = 0x%X, GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", angle, x,
           y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Rotatex, angle, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1147,14 +1359,17 @@ void GL_APIENTRY Rotatex(GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
         if (context->skipValidation() || ValidateRotatex(context, angle, x, y, z))
         {
             context->rotatex(angle, x, y, z);
+            ANGLE_CAPTURE(Rotatex, context, angle, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY SampleCoveragex(GLclampx value, GLboolean invert)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleCoveragex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLclampx value = 0x%X, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleCoveragex, value, invert);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1162,14 +1377,17 @@ void GL_APIENTRY SampleCoveragex(GLclampx value, GLboolean invert)
         if (context->skipValidation() || ValidateSampleCoveragex(context, value, invert))
         {
             context->sampleCoveragex(value, invert);
+            ANGLE_CAPTURE(SampleCoveragex, context, value, invert);
         }
     }
 }
 
 void GL_APIENTRY Scalef(GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scalef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Scalef, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1177,14 +1395,17 @@ void GL_APIENTRY Scalef(GLfloat x, GLfloat y, GLfloat z)
         if (context->skipValidation() || ValidateScalef(context, x, y, z))
         {
             context->scalef(x, y, z);
+            ANGLE_CAPTURE(Scalef, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY Scalex(GLfixed x, GLfixed y, GLfixed z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scalex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Scalex, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1192,14 +1413,17 @@ void GL_APIENTRY Scalex(GLfixed x, GLfixed y, GLfixed z)
         if (context->skipValidation() || ValidateScalex(context, x, y, z))
         {
             context->scalex(x, y, z);
+            ANGLE_CAPTURE(Scalex, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY ShadeModel(GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShadeModel);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::ShadeModel, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1208,17 +1432,20 @@ void GL_APIENTRY ShadeModel(GLenum mode)
         if (context->skipValidation() || ValidateShadeModel(context, modePacked))
         {
             context->shadeModel(modePacked);
+            ANGLE_CAPTURE(ShadeModel, context, mode);
         }
     }
 }
 
 void GL_APIENTRY TexCoordPointer(GLint size, GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexCoordPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::TexCoordPointer, size, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1228,14 +1455,17 @@ void GL_APIENTRY TexCoordPointer(GLint size, GLenum type, GLsizei stride, const
             ValidateTexCoordPointer(context, size, typePacked, stride, pointer))
         {
             context->texCoordPointer(size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(TexCoordPointer, context, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY TexEnvf(GLenum target, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvf, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1245,15 +1475,18 @@ void GL_APIENTRY TexEnvf(GLenum target, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateTexEnvf(context, targetPacked, pnamePacked, param))
         {
             context->texEnvf(targetPacked, pnamePacked, param);
+            ANGLE_CAPTURE(TexEnvf, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexEnvfv(GLenum target, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvfv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1264,14 +1497,17 @@ void GL_APIENTRY TexEnvfv(GLenum target, GLenum pname, const GLfloat *params)
             ValidateTexEnvfv(context, targetPacked, pnamePacked, params))
         {
             context->texEnvfv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(TexEnvfv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexEnvi(GLenum target, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvi);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvi, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1281,15 +1517,18 @@ void GL_APIENTRY TexEnvi(GLenum target, GLenum pname, GLint param)
         if (context->skipValidation() || ValidateTexEnvi(context, targetPacked, pnamePacked, param))
         {
             context->texEnvi(targetPacked, pnamePacked, param);
+            ANGLE_CAPTURE(TexEnvi, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexEnviv(GLenum target, GLenum pname, const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnviv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnviv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1300,15 +1539,18 @@ void GL_APIENTRY TexEnviv(GLenum target, GLenum pname, const GLint *params)
             ValidateTexEnviv(context, targetPacked, pnamePacked, params))
         {
             context->texEnviv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(TexEnviv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexEnvx(GLenum target, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvx, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1318,15 +1560,18 @@ void GL_APIENTRY TexEnvx(GLenum target, GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateTexEnvx(context, targetPacked, pnamePacked, param))
         {
             context->texEnvx(targetPacked, pnamePacked, param);
+            ANGLE_CAPTURE(TexEnvx, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexEnvxv(GLenum target, GLenum pname, const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvxv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1337,15 +1582,18 @@ void GL_APIENTRY TexEnvxv(GLenum target, GLenum pname, const GLfixed *params)
             ValidateTexEnvxv(context, targetPacked, pnamePacked, params))
         {
             context->texEnvxv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(TexEnvxv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexParameterx(GLenum target, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterx, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1354,15 +1602,18 @@ void GL_APIENTRY TexParameterx(GLenum target, GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateTexParameterx(context, targetPacked, pname, param))
         {
             context->texParameterx(targetPacked, pname, param);
+            ANGLE_CAPTURE(TexParameterx, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexParameterxv(GLenum target, GLenum pname, const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterxv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1372,14 +1623,17 @@ void GL_APIENTRY TexParameterxv(GLenum target, GLenum pname, const GLfixed *para
             ValidateTexParameterxv(context, targetPacked, pname, params))
         {
             context->texParameterxv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterxv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY Translatef(GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Translatef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Translatef, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1387,14 +1641,17 @@ void GL_APIENTRY Translatef(GLfloat x, GLfloat y, GLfloat z)
         if (context->skipValidation() || ValidateTranslatef(context, x, y, z))
         {
             context->translatef(x, y, z);
+            ANGLE_CAPTURE(Translatef, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY Translatex(GLfixed x, GLfixed y, GLfixed z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Translatex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Translatex, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1402,17 +1659,20 @@ void GL_APIENTRY Translatex(GLfixed x, GLfixed y, GLfixed z)
         if (context->skipValidation() || ValidateTranslatex(context, x, y, z))
         {
             context->translatex(x, y, z);
+            ANGLE_CAPTURE(Translatex, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY VertexPointer(GLint size, GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexPointer, size, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1422,6 +1682,7 @@ void GL_APIENTRY VertexPointer(GLint size, GLenum type, GLsizei stride, const vo
             ValidateVertexPointer(context, size, typePacked, stride, pointer))
         {
             context->vertexPointer(size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(VertexPointer, context, size, type, stride, pointer);
         }
     }
 }
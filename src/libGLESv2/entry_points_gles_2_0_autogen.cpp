@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by generate_entry_points.py using data from gl.xml.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -13,6 +13,9 @@
 #include "libANGLE/Context.h"
 #include "libANGLE/Context.inl.h"
 #include "libANGLE/validationES2.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,8 +23,10 @@ namespace gl
 {
 void GL_APIENTRY ActiveTexture(GLenum texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ActiveTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_TRACE(EntryPoint::ActiveTexture, texture);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -29,14 +34,17 @@ void GL_APIENTRY ActiveTexture(GLenum texture)
         if (context->skipValidation() || ValidateActiveTexture(context, texture))
         {
             context->activeTexture(texture);
+            ANGLE_CAPTURE(ActiveTexture, context, texture);
         }
     }
 }
 
 void GL_APIENTRY AttachShader(GLuint program, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AttachShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_TRACE(EntryPoint::AttachShader, program, shader);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -44,15 +52,18 @@ void GL_APIENTRY AttachShader(GLuint program, GLuint shader)
         if (context->skipValidation() || ValidateAttachShader(context, program, shader))
         {
             context->attachShader(program, shader);
+            ANGLE_CAPTURE(AttachShader, context, program, shader);
         }
     }
 }
 
 void GL_APIENTRY BindAttribLocation(GLuint program, GLuint index, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindAttribLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint index = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, index, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindAttribLocation, program, index, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -60,14 +71,17 @@ void GL_APIENTRY BindAttribLocation(GLuint program, GLuint index, const GLchar *
         if (context->skipValidation() || ValidateBindAttribLocation(context, program, index, name))
         {
             context->bindAttribLocation(program, index, name);
+            ANGLE_CAPTURE(BindAttribLocation, context, program, index, name);
         }
     }
 }
 
 void GL_APIENTRY BindBuffer(GLenum target, GLuint buffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint buffer = %u)", target, buffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindBuffer, target, buffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -76,14 +90,17 @@ void GL_APIENTRY BindBuffer(GLenum target, GLuint buffer)
         if (context->skipValidation() || ValidateBindBuffer(context, targetPacked, buffer))
         {
             context->bindBuffer(targetPacked, buffer);
+            ANGLE_CAPTURE(BindBuffer, context, target, buffer);
         }
     }
 }
 
 void GL_APIENTRY BindFramebuffer(GLenum target, GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFramebuffer, target, framebuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -91,14 +108,17 @@ void GL_APIENTRY BindFramebuffer(GLenum target, GLuint framebuffer)
         if (context->skipValidation() || ValidateBindFramebuffer(context, target, framebuffer))
         {
             context->bindFramebuffer(target, framebuffer);
+            ANGLE_CAPTURE(BindFramebuffer, context, target, framebuffer);
         }
     }
 }
 
 void GL_APIENTRY BindRenderbuffer(GLenum target, GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindRenderbuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindRenderbuffer, target, renderbuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -106,14 +126,17 @@ void GL_APIENTRY BindRenderbuffer(GLenum target, GLuint renderbuffer)
         if (context->skipValidation() || ValidateBindRenderbuffer(context, target, renderbuffer))
         {
             context->bindRenderbuffer(target, renderbuffer);
+            ANGLE_CAPTURE(BindRenderbuffer, context, target, renderbuffer);
         }
     }
 }
 
 void GL_APIENTRY BindTexture(GLenum target, GLuint texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint texture = %u)", target, texture);
+    ANGLE_BINARY_TRACE(EntryPoint::BindTexture, target, texture);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -122,15 +145,18 @@ void GL_APIENTRY BindTexture(GLenum target, GLuint texture)
         if (context->skipValidation() || ValidateBindTexture(context, targetPacked, texture))
         {
             context->bindTexture(targetPacked, texture);
+            ANGLE_CAPTURE(BindTexture, context, target, texture);
         }
     }
 }
 
 void GL_APIENTRY BlendColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendColor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendColor, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -138,14 +164,17 @@ void GL_APIENTRY BlendColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat al
         if (context->skipValidation() || ValidateBlendColor(context, red, green, blue, alpha))
         {
             context->blendColor(red, green, blue, alpha);
+            ANGLE_CAPTURE(BlendColor, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY BlendEquation(GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendEquation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendEquation, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -153,14 +182,17 @@ void GL_APIENTRY BlendEquation(GLenum mode)
         if (context->skipValidation() || ValidateBlendEquation(context, mode))
         {
             context->blendEquation(mode);
+            ANGLE_CAPTURE(BlendEquation, context, mode);
         }
     }
 }
 
 void GL_APIENTRY BlendEquationSeparate(GLenum modeRGB, GLenum modeAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendEquationSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum modeRGB = 0x%X, GLenum modeAlpha = 0x%X)", modeRGB, modeAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendEquationSeparate, modeRGB, modeAlpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -168,14 +200,17 @@ void GL_APIENTRY BlendEquationSeparate(GLenum modeRGB, GLenum modeAlpha)
         if (context->skipValidation() || ValidateBlendEquationSeparate(context, modeRGB, modeAlpha))
         {
             context->blendEquationSeparate(modeRGB, modeAlpha);
+            ANGLE_CAPTURE(BlendEquationSeparate, context, modeRGB, modeAlpha);
         }
     }
 }
 
 void GL_APIENTRY BlendFunc(GLenum sfactor, GLenum dfactor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum sfactor = 0x%X, GLenum dfactor = 0x%X)", sfactor, dfactor);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendFunc, sfactor, dfactor);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -183,6 +218,7 @@ void GL_APIENTRY BlendFunc(GLenum sfactor, GLenum dfactor)
         if (context->skipValidation() || ValidateBlendFunc(context, sfactor, dfactor))
         {
             context->blendFunc(sfactor, dfactor);
+            ANGLE_CAPTURE(BlendFunc, context, sfactor, dfactor);
         }
     }
 }
@@ -192,11 +228,14 @@ void GL_APIENTRY BlendFuncSeparate(GLenum sfactorRGB,
                                    GLenum sfactorAlpha,
                                    GLenum dfactorAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendFuncSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum sfactorRGB = 0x%X, GLenum dfactorRGB = 0x%X, GLenum sfactorAlpha = 0x%X, GLenum "
         "dfactorAlpha = 0x%X)",
         sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendFuncSeparate, sfactorRGB, dfactorRGB, sfactorAlpha,
+                       dfactorAlpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -205,16 +244,20 @@ void GL_APIENTRY BlendFuncSeparate(GLenum sfactorRGB,
             ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha))
         {
             context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+            ANGLE_CAPTURE(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                          dfactorAlpha);
         }
     }
 }
 
 void GL_APIENTRY BufferData(GLenum target, GLsizeiptr size, const void *data, GLenum usage)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferData);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLsizeiptr size = %llu, const void *data = 0x%016" PRIxPTR
           ", GLenum usage = 0x%X)",
           target, static_cast<unsigned long long>(size), (uintptr_t)data, usage);
+    ANGLE_BINARY_TRACE(EntryPoint::BufferData, target, size, data, usage);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -225,18 +268,21 @@ void GL_APIENTRY BufferData(GLenum target, GLsizeiptr size, const void *data, GL
             ValidateBufferData(context, targetPacked, size, data, usagePacked))
         {
             context->bufferData(targetPacked, size, data, usagePacked);
+            ANGLE_CAPTURE(BufferData, context, target, size, data, usage);
         }
     }
 }
 
 void GL_APIENTRY BufferSubData(GLenum target, GLintptr offset, GLsizeiptr size, const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferSubData);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr size = %llu, const void *data = "
         "0x%016" PRIxPTR ")",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(size),
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::BufferSubData, target, offset, size, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -246,21 +292,26 @@ void GL_APIENTRY BufferSubData(GLenum target, GLintptr offset, GLsizeiptr size,
             ValidateBufferSubData(context, targetPacked, offset, size, data))
         {
             context->bufferSubData(targetPacked, offset, size, data);
+            ANGLE_CAPTURE(BufferSubData, context, target, offset, size, data);
         }
     }
 }
 
 GLenum GL_APIENTRY CheckFramebufferStatus(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CheckFramebufferStatus);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::CheckFramebufferStatus, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateCheckFramebufferStatus(context, target))
         {
-            return context->checkFramebufferStatus(target);
+            GLenum returnValue = context->checkFramebufferStatus(target);
+            ANGLE_CAPTURE(CheckFramebufferStatus, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -269,8 +320,10 @@ GLenum GL_APIENTRY CheckFramebufferStatus(GLenum target)
 
 void GL_APIENTRY Clear(GLbitfield mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Clear);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield mask = 0x%X)", mask);
+    ANGLE_BINARY_TRACE(EntryPoint::Clear, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -278,15 +331,18 @@ void GL_APIENTRY Clear(GLbitfield mask)
         if (context->skipValidation() || ValidateClear(context, mask))
         {
             context->clear(mask);
+            ANGLE_CAPTURE(Clear, context, mask);
         }
     }
 }
 
 void GL_APIENTRY ClearColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearColor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearColor, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -294,14 +350,17 @@ void GL_APIENTRY ClearColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat al
         if (context->skipValidation() || ValidateClearColor(context, red, green, blue, alpha))
         {
             context->clearColor(red, green, blue, alpha);
+            ANGLE_CAPTURE(ClearColor, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY ClearDepthf(GLfloat d)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearDepthf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat d = %f)", d);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearDepthf, d);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -309,14 +368,17 @@ void GL_APIENTRY ClearDepthf(GLfloat d)
         if (context->skipValidation() || ValidateClearDepthf(context, d))
         {
             context->clearDepthf(d);
+            ANGLE_CAPTURE(ClearDepthf, context, d);
         }
     }
 }
 
 void GL_APIENTRY ClearStencil(GLint s)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearStencil);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint s = %d)", s);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearStencil, s);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -324,15 +386,18 @@ void GL_APIENTRY ClearStencil(GLint s)
         if (context->skipValidation() || ValidateClearStencil(context, s))
         {
             context->clearStencil(s);
+            ANGLE_CAPTURE(ClearStencil, context, s);
         }
     }
 }
 
 void GL_APIENTRY ColorMask(GLboolean red, GLboolean green, GLboolean blue, GLboolean alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ColorMask);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean red = %u, GLboolean green = %u, GLboolean blue = %u, GLboolean alpha = %u)",
           red, green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::ColorMask, red, green, blue, alpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -340,14 +405,17 @@ void GL_APIENTRY ColorMask(GLboolean red, GLboolean green, GLboolean blue, GLboo
         if (context->skipValidation() || ValidateColorMask(context, red, green, blue, alpha))
         {
             context->colorMask(red, green, blue, alpha);
+            ANGLE_CAPTURE(ColorMask, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY CompileShader(GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompileShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_TRACE(EntryPoint::CompileShader, shader);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -355,6 +423,7 @@ void GL_APIENTRY CompileShader(GLuint shader)
         if (context->skipValidation() || ValidateCompileShader(context, shader))
         {
             context->compileShader(shader);
+            ANGLE_CAPTURE(CompileShader, context, shader);
         }
     }
 }
@@ -368,12 +437,15 @@ void GL_APIENTRY CompressedTexImage2D(GLenum target,
                                       GLsizei imageSize,
                                       const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, const void *data = "
         "0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage2D, target, level, internalformat, width,
+                       height, border, imageSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -385,6 +457,8 @@ void GL_APIENTRY CompressedTexImage2D(GLenum target,
         {
             context->compressedTexImage2D(targetPacked, level, internalformat, width, height,
                                           border, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexImage2D, context, target, level, internalformat, width,
+                          height, border, imageSize, data);
         }
     }
 }
@@ -399,12 +473,15 @@ void GL_APIENTRY CompressedTexSubImage2D(GLenum target,
                                          GLsizei imageSize,
                                          const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLsizei "
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLsizei imageSize = %d, const void "
         "*data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage2D, target, level, xoffset, yoffset, width,
+                       height, format, imageSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -416,6 +493,8 @@ void GL_APIENTRY CompressedTexSubImage2D(GLenum target,
         {
             context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width, height,
                                              format, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage2D, context, target, level, xoffset, yoffset, width,
+                          height, format, imageSize, data);
         }
     }
 }
@@ -429,11 +508,14 @@ void GL_APIENTRY CopyTexImage2D(GLenum target,
                                 GLsizei height,
                                 GLint border)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLint x = %d, "
         "GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLint border = %d)",
         target, level, internalformat, x, y, width, height, border);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexImage2D, target, level, internalformat, x, y, width,
+                       height, border);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -445,6 +527,8 @@ void GL_APIENTRY CopyTexImage2D(GLenum target,
         {
             context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height,
                                     border);
+            ANGLE_CAPTURE(CopyTexImage2D, context, target, level, internalformat, x, y, width,
+                          height, border);
         }
     }
 }
@@ -458,11 +542,14 @@ void GL_APIENTRY CopyTexSubImage2D(GLenum target,
                                    GLsizei width,
                                    GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexSubImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint x "
         "= %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, x, y, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexSubImage2D, target, level, xoffset, yoffset, x, y, width,
+                       height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -473,21 +560,27 @@ void GL_APIENTRY CopyTexSubImage2D(GLenum target,
                                       height))
         {
             context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width, height);
+            ANGLE_CAPTURE(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y, width,
+                          height);
         }
     }
 }
 
 GLuint GL_APIENTRY CreateProgram()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::CreateProgram);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateCreateProgram(context))
         {
-            return context->createProgram();
+            GLuint returnValue = context->createProgram();
+            ANGLE_CAPTURE(CreateProgram, context, returnValue);
+            return returnValue;
         }
     }
 
@@ -496,8 +589,10 @@ GLuint GL_APIENTRY CreateProgram()
 
 GLuint GL_APIENTRY CreateShader(GLenum type)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X)", type);
+    ANGLE_BINARY_TRACE(EntryPoint::CreateShader, type);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -505,7 +600,9 @@ GLuint GL_APIENTRY CreateShader(GLenum type)
         ShaderType typePacked = FromGLenum<ShaderType>(type);
         if (context->skipValidation() || ValidateCreateShader(context, typePacked))
         {
-            return context->createShader(typePacked);
+            GLuint returnValue = context->createShader(typePacked);
+            ANGLE_CAPTURE(CreateShader, context, type, returnValue);
+            return returnValue;
         }
     }
 
@@ -514,8 +611,10 @@ GLuint GL_APIENTRY CreateShader(GLenum type)
 
 void GL_APIENTRY CullFace(GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CullFace);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::CullFace, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -524,14 +623,17 @@ void GL_APIENTRY CullFace(GLenum mode)
         if (context->skipValidation() || ValidateCullFace(context, modePacked))
         {
             context->cullFace(modePacked);
+            ANGLE_CAPTURE(CullFace, context, mode);
         }
     }
 }
 
 void GL_APIENTRY DeleteBuffers(GLsizei n, const GLuint *buffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteBuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteBuffers, n, buffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -539,15 +641,18 @@ void GL_APIENTRY DeleteBuffers(GLsizei n, const GLuint *buffers)
         if (context->skipValidation() || ValidateDeleteBuffers(context, n, buffers))
         {
             context->deleteBuffers(n, buffers);
+            ANGLE_CAPTURE(DeleteBuffers, context, n, buffers);
         }
     }
 }
 
 void GL_APIENTRY DeleteFramebuffers(GLsizei n, const GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFramebuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteFramebuffers, n, framebuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -555,14 +660,17 @@ void GL_APIENTRY DeleteFramebuffers(GLsizei n, const GLuint *framebuffers)
         if (context->skipValidation() || ValidateDeleteFramebuffers(context, n, framebuffers))
         {
             context->deleteFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(DeleteFramebuffers, context, n, framebuffers);
         }
     }
 }
 
 void GL_APIENTRY DeleteProgram(GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteProgram, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -570,15 +678,18 @@ void GL_APIENTRY DeleteProgram(GLuint program)
         if (context->skipValidation() || ValidateDeleteProgram(context, program))
         {
             context->deleteProgram(program);
+            ANGLE_CAPTURE(DeleteProgram, context, program);
         }
     }
 }
 
 void GL_APIENTRY DeleteRenderbuffers(GLsizei n, const GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteRenderbuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteRenderbuffers, n, renderbuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -586,14 +697,17 @@ void GL_APIENTRY DeleteRenderbuffers(GLsizei n, const GLuint *renderbuffers)
         if (context->skipValidation() || ValidateDeleteRenderbuffers(context, n, renderbuffers))
         {
             context->deleteRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(DeleteRenderbuffers, context, n, renderbuffers);
         }
     }
 }
 
 void GL_APIENTRY DeleteShader(GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteShader, shader);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -601,14 +715,17 @@ void GL_APIENTRY DeleteShader(GLuint shader)
         if (context->skipValidation() || ValidateDeleteShader(context, shader))
         {
             context->deleteShader(shader);
+            ANGLE_CAPTURE(DeleteShader, context, shader);
         }
     }
 }
 
 void GL_APIENTRY DeleteTextures(GLsizei n, const GLuint *textures)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteTextures);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteTextures, n, textures);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -616,14 +733,17 @@ void GL_APIENTRY DeleteTextures(GLsizei n, const GLuint *textures)
         if (context->skipValidation() || ValidateDeleteTextures(context, n, textures))
         {
             context->deleteTextures(n, textures);
+            ANGLE_CAPTURE(DeleteTextures, context, n, textures);
         }
     }
 }
 
 void GL_APIENTRY DepthFunc(GLenum func)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X)", func);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthFunc, func);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -631,14 +751,17 @@ void GL_APIENTRY DepthFunc(GLenum func)
         if (context->skipValidation() || ValidateDepthFunc(context, func))
         {
             context->depthFunc(func);
+            ANGLE_CAPTURE(DepthFunc, context, func);
         }
     }
 }
 
 void GL_APIENTRY DepthMask(GLboolean flag)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthMask);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean flag = %u)", flag);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthMask, flag);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -646,14 +769,17 @@ void GL_APIENTRY DepthMask(GLboolean flag)
         if (context->skipValidation() || ValidateDepthMask(context, flag))
         {
             context->depthMask(flag);
+            ANGLE_CAPTURE(DepthMask, context, flag);
         }
     }
 }
 
 void GL_APIENTRY DepthRangef(GLfloat n, GLfloat f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthRangef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat n = %f, GLfloat f = %f)", n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthRangef, n, f);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -661,14 +787,17 @@ void GL_APIENTRY DepthRangef(GLfloat n, GLfloat f)
         if (context->skipValidation() || ValidateDepthRangef(context, n, f))
         {
             context->depthRangef(n, f);
+            ANGLE_CAPTURE(DepthRangef, context, n, f);
         }
     }
 }
 
 void GL_APIENTRY DetachShader(GLuint program, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DetachShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_TRACE(EntryPoint::DetachShader, program, shader);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -676,14 +805,17 @@ void GL_APIENTRY DetachShader(GLuint program, GLuint shader)
         if (context->skipValidation() || ValidateDetachShader(context, program, shader))
         {
             context->detachShader(program, shader);
+            ANGLE_CAPTURE(DetachShader, context, program, shader);
         }
     }
 }
 
 void GL_APIENTRY Disable(GLenum cap)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Disable);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_TRACE(EntryPoint::Disable, cap);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -691,14 +823,17 @@ void GL_APIENTRY Disable(GLenum cap)
         if (context->skipValidation() || ValidateDisable(context, cap))
         {
             context->disable(cap);
+            ANGLE_CAPTURE(Disable, context, cap);
         }
     }
 }
 
 void GL_APIENTRY DisableVertexAttribArray(GLuint index)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DisableVertexAttribArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_TRACE(EntryPoint::DisableVertexAttribArray, index);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -706,14 +841,17 @@ void GL_APIENTRY DisableVertexAttribArray(GLuint index)
         if (context->skipValidation() || ValidateDisableVertexAttribArray(context, index))
         {
             context->disableVertexAttribArray(index);
+            ANGLE_CAPTURE(DisableVertexAttribArray, context, index);
         }
     }
 }
 
 void GL_APIENTRY DrawArrays(GLenum mode, GLint first, GLsizei count)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArrays);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d)", mode, first, count);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArrays, mode, first, count);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -722,17 +860,20 @@ void GL_APIENTRY DrawArrays(GLenum mode, GLint first, GLsizei count)
         if (context->skipValidation() || ValidateDrawArrays(context, modePacked, first, count))
         {
             context->drawArrays(modePacked, first, count);
+            ANGLE_CAPTURE(DrawArrays, context, mode, first, count);
         }
     }
 }
 
 void GL_APIENTRY DrawElements(GLenum mode, GLsizei count, GLenum type, const void *indices)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElements);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ")",
         mode, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElements, mode, count, type, indices);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -743,14 +884,17 @@ void GL_APIENTRY DrawElements(GLenum mode, GLsizei count, GLenum type, const voi
             ValidateDrawElements(context, modePacked, count, typePacked, indices))
         {
             context->drawElements(modePacked, count, typePacked, indices);
+            ANGLE_CAPTURE(DrawElements, context, mode, count, type, indices);
         }
     }
 }
 
 void GL_APIENTRY Enable(GLenum cap)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Enable);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_TRACE(EntryPoint::Enable, cap);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -758,14 +902,17 @@ void GL_APIENTRY Enable(GLenum cap)
         if (context->skipValidation() || ValidateEnable(context, cap))
         {
             context->enable(cap);
+            ANGLE_CAPTURE(Enable, context, cap);
         }
     }
 }
 
 void GL_APIENTRY EnableVertexAttribArray(GLuint index)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EnableVertexAttribArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_TRACE(EntryPoint::EnableVertexAttribArray, index);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -773,14 +920,17 @@ void GL_APIENTRY EnableVertexAttribArray(GLuint index)
         if (context->skipValidation() || ValidateEnableVertexAttribArray(context, index))
         {
             context->enableVertexAttribArray(index);
+            ANGLE_CAPTURE(EnableVertexAttribArray, context, index);
         }
     }
 }
 
 void GL_APIENTRY Finish()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Finish);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::Finish);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -788,14 +938,17 @@ void GL_APIENTRY Finish()
         if (context->skipValidation() || ValidateFinish(context))
         {
             context->finish();
+            ANGLE_CAPTURE(Finish, context);
         }
     }
 }
 
 void GL_APIENTRY Flush()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Flush);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::Flush);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -803,6 +956,7 @@ void GL_APIENTRY Flush()
         if (context->skipValidation() || ValidateFlush(context))
         {
             context->flush();
+            ANGLE_CAPTURE(Flush, context);
         }
     }
 }
@@ -812,11 +966,14 @@ void GL_APIENTRY FramebufferRenderbuffer(GLenum target,
                                          GLenum renderbuffertarget,
                                          GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferRenderbuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferRenderbuffer, target, attachment, renderbuffertarget,
+                       renderbuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -826,6 +983,8 @@ void GL_APIENTRY FramebufferRenderbuffer(GLenum target,
                                             renderbuffer))
         {
             context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+            ANGLE_CAPTURE(FramebufferRenderbuffer, context, target, attachment, renderbuffertarget,
+                          renderbuffer);
         }
     }
 }
@@ -836,11 +995,14 @@ void GL_APIENTRY FramebufferTexture2D(GLenum target,
                                       GLuint texture,
                                       GLint level)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTexture2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTexture2D, target, attachment, textarget, texture,
+                       level);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -851,14 +1013,18 @@ void GL_APIENTRY FramebufferTexture2D(GLenum target,
                                          level))
         {
             context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+            ANGLE_CAPTURE(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                          level);
         }
     }
 }
 
 void GL_APIENTRY FrontFace(GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FrontFace);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::FrontFace, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -866,14 +1032,17 @@ void GL_APIENTRY FrontFace(GLenum mode)
         if (context->skipValidation() || ValidateFrontFace(context, mode))
         {
             context->frontFace(mode);
+            ANGLE_CAPTURE(FrontFace, context, mode);
         }
     }
 }
 
 void GL_APIENTRY GenBuffers(GLsizei n, GLuint *buffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenBuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenBuffers, n, buffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -881,14 +1050,17 @@ void GL_APIENTRY GenBuffers(GLsizei n, GLuint *buffers)
         if (context->skipValidation() || ValidateGenBuffers(context, n, buffers))
         {
             context->genBuffers(n, buffers);
+            ANGLE_CAPTURE(GenBuffers, context, n, buffers);
         }
     }
 }
 
 void GL_APIENTRY GenFramebuffers(GLsizei n, GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFramebuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenFramebuffers, n, framebuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -896,15 +1068,18 @@ void GL_APIENTRY GenFramebuffers(GLsizei n, GLuint *framebuffers)
         if (context->skipValidation() || ValidateGenFramebuffers(context, n, framebuffers))
         {
             context->genFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(GenFramebuffers, context, n, framebuffers);
         }
     }
 }
 
 void GL_APIENTRY GenRenderbuffers(GLsizei n, GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenRenderbuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenRenderbuffers, n, renderbuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -912,14 +1087,17 @@ void GL_APIENTRY GenRenderbuffers(GLsizei n, GLuint *renderbuffers)
         if (context->skipValidation() || ValidateGenRenderbuffers(context, n, renderbuffers))
         {
             context->genRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(GenRenderbuffers, context, n, renderbuffers);
         }
     }
 }
 
 void GL_APIENTRY GenTextures(GLsizei n, GLuint *textures)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenTextures);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_TRACE(EntryPoint::GenTextures, n, textures);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -927,14 +1105,17 @@ void GL_APIENTRY GenTextures(GLsizei n, GLuint *textures)
         if (context->skipValidation() || ValidateGenTextures(context, n, textures))
         {
             context->genTextures(n, textures);
+            ANGLE_CAPTURE(GenTextures, context, n, textures);
         }
     }
 }
 
 void GL_APIENTRY GenerateMipmap(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenerateMipmap);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::GenerateMipmap, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -943,6 +1124,7 @@ void GL_APIENTRY GenerateMipmap(GLenum target)
         if (context->skipValidation() || ValidateGenerateMipmap(context, targetPacked))
         {
             context->generateMipmap(targetPacked);
+            ANGLE_CAPTURE(GenerateMipmap, context, target);
         }
     }
 }
@@ -955,6 +1137,7 @@ void GL_APIENTRY GetActiveAttrib(GLuint program,
                                  GLenum *type,
                                  GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveAttrib);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = "
@@ -962,6 +1145,8 @@ void GL_APIENTRY GetActiveAttrib(GLuint program,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveAttrib, program, index, bufSize, length, size, type,
+                       name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -970,6 +1155,8 @@ void GL_APIENTRY GetActiveAttrib(GLuint program,
             ValidateGetActiveAttrib(context, program, index, bufSize, length, size, type, name))
         {
             context->getActiveAttrib(program, index, bufSize, length, size, type, name);
+            ANGLE_CAPTURE(GetActiveAttrib, context, program, index, bufSize, length, size, type,
+                          name);
         }
     }
 }
@@ -982,6 +1169,7 @@ void GL_APIENTRY GetActiveUniform(GLuint program,
                                   GLenum *type,
                                   GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniform);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = "
@@ -989,6 +1177,8 @@ void GL_APIENTRY GetActiveUniform(GLuint program,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniform, program, index, bufSize, length, size, type,
+                       name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -997,6 +1187,8 @@ void GL_APIENTRY GetActiveUniform(GLuint program,
             ValidateGetActiveUniform(context, program, index, bufSize, length, size, type, name))
         {
             context->getActiveUniform(program, index, bufSize, length, size, type, name);
+            ANGLE_CAPTURE(GetActiveUniform, context, program, index, bufSize, length, size, type,
+                          name);
         }
     }
 }
@@ -1006,10 +1198,12 @@ void GL_APIENTRY GetAttachedShaders(GLuint program,
                                     GLsizei *count,
                                     GLuint *shaders)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetAttachedShaders);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei maxCount = %d, GLsizei *count = 0x%016" PRIxPTR
           ", GLuint *shaders = 0x%016" PRIxPTR ")",
           program, maxCount, (uintptr_t)count, (uintptr_t)shaders);
+    ANGLE_BINARY_TRACE(EntryPoint::GetAttachedShaders, program, maxCount, count, shaders);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1018,22 +1212,27 @@ void GL_APIENTRY GetAttachedShaders(GLuint program,
             ValidateGetAttachedShaders(context, program, maxCount, count, shaders))
         {
             context->getAttachedShaders(program, maxCount, count, shaders);
+            ANGLE_CAPTURE(GetAttachedShaders, context, program, maxCount, count, shaders);
         }
     }
 }
 
 GLint GL_APIENTRY GetAttribLocation(GLuint program, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetAttribLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetAttribLocation, program, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetAttribLocation(context, program, name))
         {
-            return context->getAttribLocation(program, name);
+            GLint returnValue = context->getAttribLocation(program, name);
+            ANGLE_CAPTURE(GetAttribLocation, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -1042,8 +1241,10 @@ GLint GL_APIENTRY GetAttribLocation(GLuint program, const GLchar *name)
 
 void GL_APIENTRY GetBooleanv(GLenum pname, GLboolean *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleanv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLboolean *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleanv, pname, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1051,15 +1252,18 @@ void GL_APIENTRY GetBooleanv(GLenum pname, GLboolean *data)
         if (context->skipValidation() || ValidateGetBooleanv(context, pname, data))
         {
             context->getBooleanv(pname, data);
+            ANGLE_CAPTURE(GetBooleanv, context, pname, data);
         }
     }
 }
 
 void GL_APIENTRY GetBufferParameteriv(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteriv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1069,21 +1273,26 @@ void GL_APIENTRY GetBufferParameteriv(GLenum target, GLenum pname, GLint *params
             ValidateGetBufferParameteriv(context, targetPacked, pname, params))
         {
             context->getBufferParameteriv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferParameteriv, context, target, pname, params);
         }
     }
 }
 
 GLenum GL_APIENTRY GetError()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetError);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::GetError);
 
     Context *context = GetGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetError(context))
         {
-            return context->getError();
+            GLenum returnValue = context->getError();
+            ANGLE_CAPTURE(GetError, context, returnValue);
+            return returnValue;
         }
     }
 
@@ -1092,8 +1301,10 @@ GLenum GL_APIENTRY GetError()
 
 void GL_APIENTRY GetFloatv(GLenum pname, GLfloat *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFloatv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFloatv, pname, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1101,6 +1312,7 @@ void GL_APIENTRY GetFloatv(GLenum pname, GLfloat *data)
         if (context->skipValidation() || ValidateGetFloatv(context, pname, data))
         {
             context->getFloatv(pname, data);
+            ANGLE_CAPTURE(GetFloatv, context, pname, data);
         }
     }
 }
@@ -1110,11 +1322,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameteriv(GLenum target,
                                                      GLenum pname,
                                                      GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameteriv, target, attachment, pname,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1123,14 +1338,18 @@ void GL_APIENTRY GetFramebufferAttachmentParameteriv(GLenum target,
             ValidateGetFramebufferAttachmentParameteriv(context, target, attachment, pname, params))
         {
             context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+            ANGLE_CAPTURE(GetFramebufferAttachmentParameteriv, context, target, attachment, pname,
+                          params);
         }
     }
 }
 
 void GL_APIENTRY GetIntegerv(GLenum pname, GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegerv, pname, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1138,6 +1357,7 @@ void GL_APIENTRY GetIntegerv(GLenum pname, GLint *data)
         if (context->skipValidation() || ValidateGetIntegerv(context, pname, data))
         {
             context->getIntegerv(pname, data);
+            ANGLE_CAPTURE(GetIntegerv, context, pname, data);
         }
     }
 }
@@ -1147,10 +1367,12 @@ void GL_APIENTRY GetProgramInfoLog(GLuint program,
                                    GLsizei *length,
                                    GLchar *infoLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInfoLog);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramInfoLog, program, bufSize, length, infoLog);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1159,15 +1381,18 @@ void GL_APIENTRY GetProgramInfoLog(GLuint program,
             ValidateGetProgramInfoLog(context, program, bufSize, length, infoLog))
         {
             context->getProgramInfoLog(program, bufSize, length, infoLog);
+            ANGLE_CAPTURE(GetProgramInfoLog, context, program, bufSize, length, infoLog);
         }
     }
 }
 
 void GL_APIENTRY GetProgramiv(GLuint program, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", program,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramiv, program, pname, params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -1175,15 +1400,18 @@ void GL_APIENTRY GetProgramiv(GLuint program, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetProgramiv(context, program, pname, params))
         {
             context->getProgramiv(program, pname, params);
+            ANGLE_CAPTURE(GetProgramiv, context, program, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetRenderbufferParameteriv(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameteriv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1192,16 +1420,19 @@ void GL_APIENTRY GetRenderbufferParameteriv(GLenum target, GLenum pname, GLint *
             ValidateGetRenderbufferParameteriv(context, target, pname, params))
         {
             context->getRenderbufferParameteriv(target, pname, params);
+            ANGLE_CAPTURE(GetRenderbufferParameteriv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetShaderInfoLog(GLuint shader, GLsizei bufSize, GLsizei *length, GLchar *infoLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderInfoLog);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderInfoLog, shader, bufSize, length, infoLog);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1210,6 +1441,7 @@ void GL_APIENTRY GetShaderInfoLog(GLuint shader, GLsizei bufSize, GLsizei *lengt
             ValidateGetShaderInfoLog(context, shader, bufSize, length, infoLog))
         {
             context->getShaderInfoLog(shader, bufSize, length, infoLog);
+            ANGLE_CAPTURE(GetShaderInfoLog, context, shader, bufSize, length, infoLog);
         }
     }
 }
@@ -1219,10 +1451,13 @@ void GL_APIENTRY GetShaderPrecisionFormat(GLenum shadertype,
                                           GLint *range,
                                           GLint *precision)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderPrecisionFormat);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum shadertype = 0x%X, GLenum precisiontype = 0x%X, GLint *range = 0x%016" PRIxPTR
           ", GLint *precision = 0x%016" PRIxPTR ")",
           shadertype, precisiontype, (uintptr_t)range, (uintptr_t)precision);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderPrecisionFormat, shadertype, precisiontype, range,
+                       precision);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1231,16 +1466,20 @@ void GL_APIENTRY GetShaderPrecisionFormat(GLenum shadertype,
             ValidateGetShaderPrecisionFormat(context, shadertype, precisiontype, range, precision))
         {
             context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
+            ANGLE_CAPTURE(GetShaderPrecisionFormat, context, shadertype, precisiontype, range,
+                          precision);
         }
     }
 }
 
 void GL_APIENTRY GetShaderSource(GLuint shader, GLsizei bufSize, GLsizei *length, GLchar *source)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderSource);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderSource, shader, bufSize, length, source);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1249,15 +1488,18 @@ void GL_APIENTRY GetShaderSource(GLuint shader, GLsizei bufSize, GLsizei *length
             ValidateGetShaderSource(context, shader, bufSize, length, source))
         {
             context->getShaderSource(shader, bufSize, length, source);
+            ANGLE_CAPTURE(GetShaderSource, context, shader, bufSize, length, source);
         }
     }
 }
 
 void GL_APIENTRY GetShaderiv(GLuint shader, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", shader,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderiv, shader, pname, params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -1265,21 +1507,26 @@ void GL_APIENTRY GetShaderiv(GLuint shader, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetShaderiv(context, shader, pname, params))
         {
             context->getShaderiv(shader, pname, params);
+            ANGLE_CAPTURE(GetShaderiv, context, shader, pname, params);
         }
     }
 }
 
 const GLubyte *GL_APIENTRY GetString(GLenum name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetString);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X)", name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetString, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetString(context, name))
         {
-            return context->getString(name);
+            const GLubyte *returnValue = context->getString(name);
+            ANGLE_CAPTURE(GetString, context, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -1288,9 +1535,11 @@ const GLubyte *GL_APIENTRY GetString(GLenum name)
 
 void GL_APIENTRY GetTexParameterfv(GLenum target, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterfv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1300,15 +1549,18 @@ void GL_APIENTRY GetTexParameterfv(GLenum target, GLenum pname, GLfloat *params)
             ValidateGetTexParameterfv(context, targetPacked, pname, params))
         {
             context->getTexParameterfv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterfv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexParameteriv(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameteriv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1318,22 +1570,27 @@ void GL_APIENTRY GetTexParameteriv(GLenum target, GLenum pname, GLint *params)
             ValidateGetTexParameteriv(context, targetPacked, pname, params))
         {
             context->getTexParameteriv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameteriv, context, target, pname, params);
         }
     }
 }
 
 GLint GL_APIENTRY GetUniformLocation(GLuint program, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformLocation, program, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetUniformLocation(context, program, name))
         {
-            return context->getUniformLocation(program, name);
+            GLint returnValue = context->getUniformLocation(program, name);
+            ANGLE_CAPTURE(GetUniformLocation, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -1342,9 +1599,11 @@ GLint GL_APIENTRY GetUniformLocation(GLuint program, const GLchar *name)
 
 void GL_APIENTRY GetUniformfv(GLuint program, GLint location, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat *params = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformfv, program, location, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1352,15 +1611,18 @@ void GL_APIENTRY GetUniformfv(GLuint program, GLint location, GLfloat *params)
         if (context->skipValidation() || ValidateGetUniformfv(context, program, location, params))
         {
             context->getUniformfv(program, location, params);
+            ANGLE_CAPTURE(GetUniformfv, context, program, location, params);
         }
     }
 }
 
 void GL_APIENTRY GetUniformiv(GLuint program, GLint location, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformiv, program, location, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1368,15 +1630,18 @@ void GL_APIENTRY GetUniformiv(GLuint program, GLint location, GLint *params)
         if (context->skipValidation() || ValidateGetUniformiv(context, program, location, params))
         {
             context->getUniformiv(program, location, params);
+            ANGLE_CAPTURE(GetUniformiv, context, program, location, params);
         }
     }
 }
 
 void GL_APIENTRY GetVertexAttribPointerv(GLuint index, GLenum pname, void **pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribPointerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, void **pointer = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribPointerv, index, pname, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1385,15 +1650,18 @@ void GL_APIENTRY GetVertexAttribPointerv(GLuint index, GLenum pname, void **poin
             ValidateGetVertexAttribPointerv(context, index, pname, pointer))
         {
             context->getVertexAttribPointerv(index, pname, pointer);
+            ANGLE_CAPTURE(GetVertexAttribPointerv, context, index, pname, pointer);
         }
     }
 }
 
 void GL_APIENTRY GetVertexAttribfv(GLuint index, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribfv, index, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1401,15 +1669,18 @@ void GL_APIENTRY GetVertexAttribfv(GLuint index, GLenum pname, GLfloat *params)
         if (context->skipValidation() || ValidateGetVertexAttribfv(context, index, pname, params))
         {
             context->getVertexAttribfv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribfv, context, index, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetVertexAttribiv(GLuint index, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribiv, index, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1417,14 +1688,17 @@ void GL_APIENTRY GetVertexAttribiv(GLuint index, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetVertexAttribiv(context, index, pname, params))
         {
             context->getVertexAttribiv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribiv, context, index, pname, params);
         }
     }
 }
 
 void GL_APIENTRY Hint(GLenum target, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Hint);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum mode = 0x%X)", target, mode);
+    ANGLE_BINARY_TRACE(EntryPoint::Hint, target, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1432,21 +1706,26 @@ void GL_APIENTRY Hint(GLenum target, GLenum mode)
         if (context->skipValidation() || ValidateHint(context, target, mode))
         {
             context->hint(target, mode);
+            ANGLE_CAPTURE(Hint, context, target, mode);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsBuffer(GLuint buffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint buffer = %u)", buffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsBuffer, buffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsBuffer(context, buffer))
         {
-            return context->isBuffer(buffer);
+            GLboolean returnValue = context->isBuffer(buffer);
+            ANGLE_CAPTURE(IsBuffer, context, buffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -1455,15 +1734,19 @@ GLboolean GL_APIENTRY IsBuffer(GLuint buffer)
 
 GLboolean GL_APIENTRY IsEnabled(GLenum cap)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsEnabled);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_TRACE(EntryPoint::IsEnabled, cap);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsEnabled(context, cap))
         {
-            return context->isEnabled(cap);
+            GLboolean returnValue = context->isEnabled(cap);
+            ANGLE_CAPTURE(IsEnabled, context, cap, returnValue);
+            return returnValue;
         }
     }
 
@@ -1472,15 +1755,19 @@ GLboolean GL_APIENTRY IsEnabled(GLenum cap)
 
 GLboolean GL_APIENTRY IsFramebuffer(GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsFramebuffer, framebuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsFramebuffer(context, framebuffer))
         {
-            return context->isFramebuffer(framebuffer);
+            GLboolean returnValue = context->isFramebuffer(framebuffer);
+            ANGLE_CAPTURE(IsFramebuffer, context, framebuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -1489,15 +1776,19 @@ GLboolean GL_APIENTRY IsFramebuffer(GLuint framebuffer)
 
 GLboolean GL_APIENTRY IsProgram(GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::IsProgram, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsProgram(context, program))
         {
-            return context->isProgram(program);
+            GLboolean returnValue = context->isProgram(program);
+            ANGLE_CAPTURE(IsProgram, context, program, returnValue);
+            return returnValue;
         }
     }
 
@@ -1506,15 +1797,19 @@ GLboolean GL_APIENTRY IsProgram(GLuint program)
 
 GLboolean GL_APIENTRY IsRenderbuffer(GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsRenderbuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsRenderbuffer, renderbuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsRenderbuffer(context, renderbuffer))
         {
-            return context->isRenderbuffer(renderbuffer);
+            GLboolean returnValue = context->isRenderbuffer(renderbuffer);
+            ANGLE_CAPTURE(IsRenderbuffer, context, renderbuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -1523,15 +1818,19 @@ GLboolean GL_APIENTRY IsRenderbuffer(GLuint renderbuffer)
 
 GLboolean GL_APIENTRY IsShader(GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_TRACE(EntryPoint::IsShader, shader);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsShader(context, shader))
         {
-            return context->isShader(shader);
+            GLboolean returnValue = context->isShader(shader);
+            ANGLE_CAPTURE(IsShader, context, shader, returnValue);
+            return returnValue;
         }
     }
 
@@ -1540,15 +1839,19 @@ GLboolean GL_APIENTRY IsShader(GLuint shader)
 
 GLboolean GL_APIENTRY IsTexture(GLuint texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint texture = %u)", texture);
+    ANGLE_BINARY_TRACE(EntryPoint::IsTexture, texture);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsTexture(context, texture))
         {
-            return context->isTexture(texture);
+            GLboolean returnValue = context->isTexture(texture);
+            ANGLE_CAPTURE(IsTexture, context, texture, returnValue);
+            return returnValue;
         }
     }
 
@@ -1557,8 +1860,10 @@ GLboolean GL_APIENTRY IsTexture(GLuint texture)
 
 void GL_APIENTRY LineWidth(GLfloat width)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LineWidth);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat width = %f)", width);
+    ANGLE_BINARY_TRACE(EntryPoint::LineWidth, width);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1566,14 +1871,17 @@ void GL_APIENTRY LineWidth(GLfloat width)
         if (context->skipValidation() || ValidateLineWidth(context, width))
         {
             context->lineWidth(width);
+            ANGLE_CAPTURE(LineWidth, context, width);
         }
     }
 }
 
 void GL_APIENTRY LinkProgram(GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LinkProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::LinkProgram, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1581,14 +1889,17 @@ void GL_APIENTRY LinkProgram(GLuint program)
         if (context->skipValidation() || ValidateLinkProgram(context, program))
         {
             context->linkProgram(program);
+            ANGLE_CAPTURE(LinkProgram, context, program);
         }
     }
 }
 
 void GL_APIENTRY PixelStorei(GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PixelStorei);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint param = %d)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::PixelStorei, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1596,14 +1907,17 @@ void GL_APIENTRY PixelStorei(GLenum pname, GLint param)
         if (context->skipValidation() || ValidatePixelStorei(context, pname, param))
         {
             context->pixelStorei(pname, param);
+            ANGLE_CAPTURE(PixelStorei, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY PolygonOffset(GLfloat factor, GLfloat units)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PolygonOffset);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat factor = %f, GLfloat units = %f)", factor, units);
+    ANGLE_BINARY_TRACE(EntryPoint::PolygonOffset, factor, units);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1611,6 +1925,7 @@ void GL_APIENTRY PolygonOffset(GLfloat factor, GLfloat units)
         if (context->skipValidation() || ValidatePolygonOffset(context, factor, units))
         {
             context->polygonOffset(factor, units);
+            ANGLE_CAPTURE(PolygonOffset, context, factor, units);
         }
     }
 }
@@ -1623,11 +1938,13 @@ void GL_APIENTRY ReadPixels(GLint x,
                             GLenum type,
                             void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadPixels);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, void *pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadPixels, x, y, width, height, format, type, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1636,14 +1953,17 @@ void GL_APIENTRY ReadPixels(GLint x,
             ValidateReadPixels(context, x, y, width, height, format, type, pixels))
         {
             context->readPixels(x, y, width, height, format, type, pixels);
+            ANGLE_CAPTURE(ReadPixels, context, x, y, width, height, format, type, pixels);
         }
     }
 }
 
 void GL_APIENTRY ReleaseShaderCompiler()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReleaseShaderCompiler);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::ReleaseShaderCompiler);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1651,6 +1971,7 @@ void GL_APIENTRY ReleaseShaderCompiler()
         if (context->skipValidation() || ValidateReleaseShaderCompiler(context))
         {
             context->releaseShaderCompiler();
+            ANGLE_CAPTURE(ReleaseShaderCompiler, context);
         }
     }
 }
@@ -1660,11 +1981,13 @@ void GL_APIENTRY RenderbufferStorage(GLenum target,
                                      GLsizei width,
                                      GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorage);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorage, target, internalformat, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1673,14 +1996,17 @@ void GL_APIENTRY RenderbufferStorage(GLenum target,
             ValidateRenderbufferStorage(context, target, internalformat, width, height))
         {
             context->renderbufferStorage(target, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorage, context, target, internalformat, width, height);
         }
     }
 }
 
 void GL_APIENTRY SampleCoverage(GLfloat value, GLboolean invert)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleCoverage);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat value = %f, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleCoverage, value, invert);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1688,15 +2014,18 @@ void GL_APIENTRY SampleCoverage(GLfloat value, GLboolean invert)
         if (context->skipValidation() || ValidateSampleCoverage(context, value, invert))
         {
             context->sampleCoverage(value, invert);
+            ANGLE_CAPTURE(SampleCoverage, context, value, invert);
         }
     }
 }
 
 void GL_APIENTRY Scissor(GLint x, GLint y, GLsizei width, GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scissor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_TRACE(EntryPoint::Scissor, x, y, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1704,6 +2033,7 @@ void GL_APIENTRY Scissor(GLint x, GLint y, GLsizei width, GLsizei height)
         if (context->skipValidation() || ValidateScissor(context, x, y, width, height))
         {
             context->scissor(x, y, width, height);
+            ANGLE_CAPTURE(Scissor, context, x, y, width, height);
         }
     }
 }
@@ -1714,11 +2044,13 @@ void GL_APIENTRY ShaderBinary(GLsizei count,
                               const void *binary,
                               GLsizei length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShaderBinary);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, const GLuint *shaders = 0x%016" PRIxPTR
           ", GLenum binaryformat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           count, (uintptr_t)shaders, binaryformat, (uintptr_t)binary, length);
+    ANGLE_BINARY_TRACE(EntryPoint::ShaderBinary, count, shaders, binaryformat, binary, length);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1727,6 +2059,7 @@ void GL_APIENTRY ShaderBinary(GLsizei count,
             ValidateShaderBinary(context, count, shaders, binaryformat, binary, length))
         {
             context->shaderBinary(count, shaders, binaryformat, binary, length);
+            ANGLE_CAPTURE(ShaderBinary, context, count, shaders, binaryformat, binary, length);
         }
     }
 }
@@ -1736,10 +2069,12 @@ void GL_APIENTRY ShaderSource(GLuint shader,
                               const GLchar *const *string,
                               const GLint *length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShaderSource);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei count = %d, const GLchar *const*string = 0x%016" PRIxPTR
           ", const GLint *length = 0x%016" PRIxPTR ")",
           shader, count, (uintptr_t)string, (uintptr_t)length);
+    ANGLE_BINARY_TRACE(EntryPoint::ShaderSource, shader, count, string, length);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1748,14 +2083,17 @@ void GL_APIENTRY ShaderSource(GLuint shader,
             ValidateShaderSource(context, shader, count, string, length))
         {
             context->shaderSource(shader, count, string, length);
+            ANGLE_CAPTURE(ShaderSource, context, shader, count, string, length);
         }
     }
 }
 
 void GL_APIENTRY StencilFunc(GLenum func, GLint ref, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFunc, func, ref, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1763,15 +2101,18 @@ void GL_APIENTRY StencilFunc(GLenum func, GLint ref, GLuint mask)
         if (context->skipValidation() || ValidateStencilFunc(context, func, ref, mask))
         {
             context->stencilFunc(func, ref, mask);
+            ANGLE_CAPTURE(StencilFunc, context, func, ref, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilFuncSeparate(GLenum face, GLenum func, GLint ref, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFuncSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", face, func,
           ref, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFuncSeparate, face, func, ref, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1780,14 +2121,17 @@ void GL_APIENTRY StencilFuncSeparate(GLenum face, GLenum func, GLint ref, GLuint
             ValidateStencilFuncSeparate(context, face, func, ref, mask))
         {
             context->stencilFuncSeparate(face, func, ref, mask);
+            ANGLE_CAPTURE(StencilFuncSeparate, context, face, func, ref, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilMask(GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilMask);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint mask = %u)", mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilMask, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1795,14 +2139,17 @@ void GL_APIENTRY StencilMask(GLuint mask)
         if (context->skipValidation() || ValidateStencilMask(context, mask))
         {
             context->stencilMask(mask);
+            ANGLE_CAPTURE(StencilMask, context, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilMaskSeparate(GLenum face, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilMaskSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLuint mask = %u)", face, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilMaskSeparate, face, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1810,14 +2157,17 @@ void GL_APIENTRY StencilMaskSeparate(GLenum face, GLuint mask)
         if (context->skipValidation() || ValidateStencilMaskSeparate(context, face, mask))
         {
             context->stencilMaskSeparate(face, mask);
+            ANGLE_CAPTURE(StencilMaskSeparate, context, face, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilOp(GLenum fail, GLenum zfail, GLenum zpass)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilOp);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum fail = 0x%X, GLenum zfail = 0x%X, GLenum zpass = 0x%X)", fail, zfail, zpass);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilOp, fail, zfail, zpass);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1825,15 +2175,18 @@ void GL_APIENTRY StencilOp(GLenum fail, GLenum zfail, GLenum zpass)
         if (context->skipValidation() || ValidateStencilOp(context, fail, zfail, zpass))
         {
             context->stencilOp(fail, zfail, zpass);
+            ANGLE_CAPTURE(StencilOp, context, fail, zfail, zpass);
         }
     }
 }
 
 void GL_APIENTRY StencilOpSeparate(GLenum face, GLenum sfail, GLenum dpfail, GLenum dppass)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilOpSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum sfail = 0x%X, GLenum dpfail = 0x%X, GLenum dppass = 0x%X)",
           face, sfail, dpfail, dppass);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilOpSeparate, face, sfail, dpfail, dppass);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1842,6 +2195,7 @@ void GL_APIENTRY StencilOpSeparate(GLenum face, GLenum sfail, GLenum dpfail, GLe
             ValidateStencilOpSeparate(context, face, sfail, dpfail, dppass))
         {
             context->stencilOpSeparate(face, sfail, dpfail, dppass);
+            ANGLE_CAPTURE(StencilOpSeparate, context, face, sfail, dpfail, dppass);
         }
     }
 }
@@ -1856,12 +2210,15 @@ void GL_APIENTRY TexImage2D(GLenum target,
                             GLenum type,
                             const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
         "GLsizei height = %d, GLint border = %d, GLenum format = 0x%X, GLenum type = 0x%X, const "
         "void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage2D, target, level, internalformat, width, height, border,
+                       format, type, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1873,14 +2230,18 @@ void GL_APIENTRY TexImage2D(GLenum target,
         {
             context->texImage2D(targetPacked, level, internalformat, width, height, border, format,
                                 type, pixels);
+            ANGLE_CAPTURE(TexImage2D, context, target, level, internalformat, width, height, border,
+                          format, type, pixels);
         }
     }
 }
 
 void GL_APIENTRY TexParameterf(GLenum target, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterf, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1889,15 +2250,18 @@ void GL_APIENTRY TexParameterf(GLenum target, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateTexParameterf(context, targetPacked, pname, param))
         {
             context->texParameterf(targetPacked, pname, param);
+            ANGLE_CAPTURE(TexParameterf, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexParameterfv(GLenum target, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterfv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1907,14 +2271,17 @@ void GL_APIENTRY TexParameterfv(GLenum target, GLenum pname, const GLfloat *para
             ValidateTexParameterfv(context, targetPacked, pname, params))
         {
             context->texParameterfv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterfv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexParameteri(GLenum target, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameteri, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1923,15 +2290,18 @@ void GL_APIENTRY TexParameteri(GLenum target, GLenum pname, GLint param)
         if (context->skipValidation() || ValidateTexParameteri(context, targetPacked, pname, param))
         {
             context->texParameteri(targetPacked, pname, param);
+            ANGLE_CAPTURE(TexParameteri, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexParameteriv(GLenum target, GLenum pname, const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameteriv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1941,6 +2311,7 @@ void GL_APIENTRY TexParameteriv(GLenum target, GLenum pname, const GLint *params
             ValidateTexParameteriv(context, targetPacked, pname, params))
         {
             context->texParameteriv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameteriv, context, target, pname, params);
         }
     }
 }
@@ -1955,12 +2326,15 @@ void GL_APIENTRY TexSubImage2D(GLenum target,
                                GLenum type,
                                const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLsizei "
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, const void "
         "*pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage2D, target, level, xoffset, yoffset, width, height,
+                       format, type, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1972,14 +2346,18 @@ void GL_APIENTRY TexSubImage2D(GLenum target,
         {
             context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format,
                                    type, pixels);
+            ANGLE_CAPTURE(TexSubImage2D, context, target, level, xoffset, yoffset, width, height,
+                          format, type, pixels);
         }
     }
 }
 
 void GL_APIENTRY Uniform1f(GLint location, GLfloat v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f)", location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1f, location, v0);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1987,15 +2365,18 @@ void GL_APIENTRY Uniform1f(GLint location, GLfloat v0)
         if (context->skipValidation() || ValidateUniform1f(context, location, v0))
         {
             context->uniform1f(location, v0);
+            ANGLE_CAPTURE(Uniform1f, context, location, v0);
         }
     }
 }
 
 void GL_APIENTRY Uniform1fv(GLint location, GLsizei count, const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1fv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2003,14 +2384,17 @@ void GL_APIENTRY Uniform1fv(GLint location, GLsizei count, const GLfloat *value)
         if (context->skipValidation() || ValidateUniform1fv(context, location, count, value))
         {
             context->uniform1fv(location, count, value);
+            ANGLE_CAPTURE(Uniform1fv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform1i(GLint location, GLint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d)", location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1i, location, v0);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2018,15 +2402,18 @@ void GL_APIENTRY Uniform1i(GLint location, GLint v0)
         if (context->skipValidation() || ValidateUniform1i(context, location, v0))
         {
             context->uniform1i(location, v0);
+            ANGLE_CAPTURE(Uniform1i, context, location, v0);
         }
     }
 }
 
 void GL_APIENTRY Uniform1iv(GLint location, GLsizei count, const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1iv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2034,14 +2421,17 @@ void GL_APIENTRY Uniform1iv(GLint location, GLsizei count, const GLint *value)
         if (context->skipValidation() || ValidateUniform1iv(context, location, count, value))
         {
             context->uniform1iv(location, count, value);
+            ANGLE_CAPTURE(Uniform1iv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform2f(GLint location, GLfloat v0, GLfloat v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2f, location, v0, v1);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2049,15 +2439,18 @@ void GL_APIENTRY Uniform2f(GLint location, GLfloat v0, GLfloat v1)
         if (context->skipValidation() || ValidateUniform2f(context, location, v0, v1))
         {
             context->uniform2f(location, v0, v1);
+            ANGLE_CAPTURE(Uniform2f, context, location, v0, v1);
         }
     }
 }
 
 void GL_APIENTRY Uniform2fv(GLint location, GLsizei count, const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2fv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2065,14 +2458,17 @@ void GL_APIENTRY Uniform2fv(GLint location, GLsizei count, const GLfloat *value)
         if (context->skipValidation() || ValidateUniform2fv(context, location, count, value))
         {
             context->uniform2fv(location, count, value);
+            ANGLE_CAPTURE(Uniform2fv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform2i(GLint location, GLint v0, GLint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d)", location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2i, location, v0, v1);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2080,15 +2476,18 @@ void GL_APIENTRY Uniform2i(GLint location, GLint v0, GLint v1)
         if (context->skipValidation() || ValidateUniform2i(context, location, v0, v1))
         {
             context->uniform2i(location, v0, v1);
+            ANGLE_CAPTURE(Uniform2i, context, location, v0, v1);
         }
     }
 }
 
 void GL_APIENTRY Uniform2iv(GLint location, GLsizei count, const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2iv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2096,15 +2495,18 @@ void GL_APIENTRY Uniform2iv(GLint location, GLsizei count, const GLint *value)
         if (context->skipValidation() || ValidateUniform2iv(context, location, count, value))
         {
             context->uniform2iv(location, count, value);
+            ANGLE_CAPTURE(Uniform2iv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform3f(GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f)", location, v0,
           v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3f, location, v0, v1, v2);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2112,15 +2514,18 @@ void GL_APIENTRY Uniform3f(GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
         if (context->skipValidation() || ValidateUniform3f(context, location, v0, v1, v2))
         {
             context->uniform3f(location, v0, v1, v2);
+            ANGLE_CAPTURE(Uniform3f, context, location, v0, v1, v2);
         }
     }
 }
 
 void GL_APIENTRY Uniform3fv(GLint location, GLsizei count, const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3fv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2128,15 +2533,18 @@ void GL_APIENTRY Uniform3fv(GLint location, GLsizei count, const GLfloat *value)
         if (context->skipValidation() || ValidateUniform3fv(context, location, count, value))
         {
             context->uniform3fv(location, count, value);
+            ANGLE_CAPTURE(Uniform3fv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform3i(GLint location, GLint v0, GLint v1, GLint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)", location, v0, v1,
           v2);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3i, location, v0, v1, v2);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2144,15 +2552,18 @@ void GL_APIENTRY Uniform3i(GLint location, GLint v0, GLint v1, GLint v2)
         if (context->skipValidation() || ValidateUniform3i(context, location, v0, v1, v2))
         {
             context->uniform3i(location, v0, v1, v2);
+            ANGLE_CAPTURE(Uniform3i, context, location, v0, v1, v2);
         }
     }
 }
 
 void GL_APIENTRY Uniform3iv(GLint location, GLsizei count, const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3iv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2160,16 +2571,19 @@ void GL_APIENTRY Uniform3iv(GLint location, GLsizei count, const GLint *value)
         if (context->skipValidation() || ValidateUniform3iv(context, location, count, value))
         {
             context->uniform3iv(location, count, value);
+            ANGLE_CAPTURE(Uniform3iv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform4f(GLint location, GLfloat v0, GLfloat v1, GLfloat v2, GLfloat v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f, GLfloat v3 = %f)",
         location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4f, location, v0, v1, v2, v3);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2177,15 +2591,18 @@ void GL_APIENTRY Uniform4f(GLint location, GLfloat v0, GLfloat v1, GLfloat v2, G
         if (context->skipValidation() || ValidateUniform4f(context, location, v0, v1, v2, v3))
         {
             context->uniform4f(location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(Uniform4f, context, location, v0, v1, v2, v3);
         }
     }
 }
 
 void GL_APIENTRY Uniform4fv(GLint location, GLsizei count, const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4fv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2193,15 +2610,18 @@ void GL_APIENTRY Uniform4fv(GLint location, GLsizei count, const GLfloat *value)
         if (context->skipValidation() || ValidateUniform4fv(context, location, count, value))
         {
             context->uniform4fv(location, count, value);
+            ANGLE_CAPTURE(Uniform4fv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform4i(GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, GLint v3 = %d)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4i, location, v0, v1, v2, v3);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2209,15 +2629,18 @@ void GL_APIENTRY Uniform4i(GLint location, GLint v0, GLint v1, GLint v2, GLint v
         if (context->skipValidation() || ValidateUniform4i(context, location, v0, v1, v2, v3))
         {
             context->uniform4i(location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(Uniform4i, context, location, v0, v1, v2, v3);
         }
     }
 }
 
 void GL_APIENTRY Uniform4iv(GLint location, GLsizei count, const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4iv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2225,6 +2648,7 @@ void GL_APIENTRY Uniform4iv(GLint location, GLsizei count, const GLint *value)
         if (context->skipValidation() || ValidateUniform4iv(context, location, count, value))
         {
             context->uniform4iv(location, count, value);
+            ANGLE_CAPTURE(Uniform4iv, context, location, count, value);
         }
     }
 }
@@ -2234,11 +2658,13 @@ void GL_APIENTRY UniformMatrix2fv(GLint location,
                                   GLboolean transpose,
                                   const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2247,6 +2673,7 @@ void GL_APIENTRY UniformMatrix2fv(GLint location,
             ValidateUniformMatrix2fv(context, location, count, transpose, value))
         {
             context->uniformMatrix2fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix2fv, context, location, count, transpose, value);
         }
     }
 }
@@ -2256,11 +2683,13 @@ void GL_APIENTRY UniformMatrix3fv(GLint location,
                                   GLboolean transpose,
                                   const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2269,6 +2698,7 @@ void GL_APIENTRY UniformMatrix3fv(GLint location,
             ValidateUniformMatrix3fv(context, location, count, transpose, value))
         {
             context->uniformMatrix3fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix3fv, context, location, count, transpose, value);
         }
     }
 }
@@ -2278,11 +2708,13 @@ void GL_APIENTRY UniformMatrix4fv(GLint location,
                                   GLboolean transpose,
                                   const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2291,14 +2723,17 @@ void GL_APIENTRY UniformMatrix4fv(GLint location,
             ValidateUniformMatrix4fv(context, location, count, transpose, value))
         {
             context->uniformMatrix4fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix4fv, context, location, count, transpose, value);
         }
     }
 }
 
 void GL_APIENTRY UseProgram(GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UseProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::UseProgram, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2306,14 +2741,17 @@ void GL_APIENTRY UseProgram(GLuint program)
         if (context->skipValidation() || ValidateUseProgram(context, program))
         {
             context->useProgram(program);
+            ANGLE_CAPTURE(UseProgram, context, program);
         }
     }
 }
 
 void GL_APIENTRY ValidateProgram(GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ValidateProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::ValidateProgram, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2321,14 +2759,17 @@ void GL_APIENTRY ValidateProgram(GLuint program)
         if (context->skipValidation() || ValidateValidateProgram(context, program))
         {
             context->validateProgram(program);
+            ANGLE_CAPTURE(ValidateProgram, context, program);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib1f(GLuint index, GLfloat x)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib1f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f)", index, x);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib1f, index, x);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2336,14 +2777,17 @@ void GL_APIENTRY VertexAttrib1f(GLuint index, GLfloat x)
         if (context->skipValidation() || ValidateVertexAttrib1f(context, index, x))
         {
             context->vertexAttrib1f(index, x);
+            ANGLE_CAPTURE(VertexAttrib1f, context, index, x);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib1fv(GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib1fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib1fv, index, v);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2351,14 +2795,17 @@ void GL_APIENTRY VertexAttrib1fv(GLuint index, const GLfloat *v)
         if (context->skipValidation() || ValidateVertexAttrib1fv(context, index, v))
         {
             context->vertexAttrib1fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib1fv, context, index, v);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib2f(GLuint index, GLfloat x, GLfloat y)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib2f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f)", index, x, y);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib2f, index, x, y);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2366,14 +2813,17 @@ void GL_APIENTRY VertexAttrib2f(GLuint index, GLfloat x, GLfloat y)
         if (context->skipValidation() || ValidateVertexAttrib2f(context, index, x, y))
         {
             context->vertexAttrib2f(index, x, y);
+            ANGLE_CAPTURE(VertexAttrib2f, context, index, x, y);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib2fv(GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib2fv, index, v);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2381,14 +2831,17 @@ void GL_APIENTRY VertexAttrib2fv(GLuint index, const GLfloat *v)
         if (context->skipValidation() || ValidateVertexAttrib2fv(context, index, v))
         {
             context->vertexAttrib2fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib2fv, context, index, v);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib3f(GLuint index, GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", index, x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib3f, index, x, y, z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2396,14 +2849,17 @@ void GL_APIENTRY VertexAttrib3f(GLuint index, GLfloat x, GLfloat y, GLfloat z)
         if (context->skipValidation() || ValidateVertexAttrib3f(context, index, x, y, z))
         {
             context->vertexAttrib3f(index, x, y, z);
+            ANGLE_CAPTURE(VertexAttrib3f, context, index, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib3fv(GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib3fv, index, v);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2411,15 +2867,18 @@ void GL_APIENTRY VertexAttrib3fv(GLuint index, const GLfloat *v)
         if (context->skipValidation() || ValidateVertexAttrib3fv(context, index, v))
         {
             context->vertexAttrib3fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib3fv, context, index, v);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib4f(GLuint index, GLfloat x, GLfloat y, GLfloat z, GLfloat w)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat w = %f)",
           index, x, y, z, w);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib4f, index, x, y, z, w);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2427,14 +2886,17 @@ void GL_APIENTRY VertexAttrib4f(GLuint index, GLfloat x, GLfloat y, GLfloat z, G
         if (context->skipValidation() || ValidateVertexAttrib4f(context, index, x, y, z, w))
         {
             context->vertexAttrib4f(index, x, y, z, w);
+            ANGLE_CAPTURE(VertexAttrib4f, context, index, x, y, z, w);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib4fv(GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib4fv, index, v);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2442,6 +2904,7 @@ void GL_APIENTRY VertexAttrib4fv(GLuint index, const GLfloat *v)
         if (context->skipValidation() || ValidateVertexAttrib4fv(context, index, v))
         {
             context->vertexAttrib4fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib4fv, context, index, v);
         }
     }
 }
@@ -2453,11 +2916,14 @@ void GL_APIENTRY VertexAttribPointer(GLuint index,
                                      GLsizei stride,
                                      const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
         index, size, type, normalized, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribPointer, index, size, type, normalized, stride,
+                       pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2468,15 +2934,19 @@ void GL_APIENTRY VertexAttribPointer(GLuint index,
                                         pointer))
         {
             context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
+            ANGLE_CAPTURE(VertexAttribPointer, context, index, size, type, normalized, stride,
+                          pointer);
         }
     }
 }
 
 void GL_APIENTRY Viewport(GLint x, GLint y, GLsizei width, GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Viewport);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_TRACE(EntryPoint::Viewport, x, y, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2484,6 +2954,7 @@ void GL_APIENTRY Viewport(GLint x, GLint y, GLsizei width, GLsizei height)
         if (context->skipValidation() || ValidateViewport(context, x, y, width, height))
         {
             context->viewport(x, y, width, height);
+            ANGLE_CAPTURE(Viewport, context, x, y, width, height);
         }
     }
 }
@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by generate_entry_points.py using data from gl.xml.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -13,6 +13,9 @@
 #include "libANGLE/Context.h"
 #include "libANGLE/Context.inl.h"
 #include "libANGLE/validationES3.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,8 +23,10 @@ namespace gl
 {
 void GL_APIENTRY BeginQuery(GLenum target, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginQuery);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_TRACE(EntryPoint::BeginQuery, target, id);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -30,14 +35,17 @@ void GL_APIENTRY BeginQuery(GLenum target, GLuint id)
         if (context->skipValidation() || ValidateBeginQuery(context, targetPacked, id))
         {
             context->beginQuery(targetPacked, id);
+            ANGLE_CAPTURE(BeginQuery, context, target, id);
         }
     }
 }
 
 void GL_APIENTRY BeginTransformFeedback(GLenum primitiveMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum primitiveMode = 0x%X)", primitiveMode);
+    ANGLE_BINARY_TRACE(EntryPoint::BeginTransformFeedback, primitiveMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -47,14 +55,17 @@ void GL_APIENTRY BeginTransformFeedback(GLenum primitiveMode)
             ValidateBeginTransformFeedback(context, primitiveModePacked))
         {
             context->beginTransformFeedback(primitiveModePacked);
+            ANGLE_CAPTURE(BeginTransformFeedback, context, primitiveMode);
         }
     }
 }
 
 void GL_APIENTRY BindBufferBase(GLenum target, GLuint index, GLuint buffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBufferBase);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u)", target, index, buffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindBufferBase, target, index, buffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -64,6 +75,7 @@ void GL_APIENTRY BindBufferBase(GLenum target, GLuint index, GLuint buffer)
             ValidateBindBufferBase(context, targetPacked, index, buffer))
         {
             context->bindBufferBase(targetPacked, index, buffer);
+            ANGLE_CAPTURE(BindBufferBase, context, target, index, buffer);
         }
     }
 }
@@ -71,12 +83,14 @@ void GL_APIENTRY BindBufferBase(GLenum target, GLuint index, GLuint buffer)
 void GL_APIENTRY
 BindBufferRange(GLenum target, GLuint index, GLuint buffer, GLintptr offset, GLsizeiptr size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBufferRange);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u, GLintptr offset = %llu, "
         "GLsizeiptr size = %llu)",
         target, index, buffer, static_cast<unsigned long long>(offset),
         static_cast<unsigned long long>(size));
+    ANGLE_BINARY_TRACE(EntryPoint::BindBufferRange, target, index, buffer, offset, size);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -86,14 +100,17 @@ BindBufferRange(GLenum target, GLuint index, GLuint buffer, GLintptr offset, GLs
             ValidateBindBufferRange(context, targetPacked, index, buffer, offset, size))
         {
             context->bindBufferRange(targetPacked, index, buffer, offset, size);
+            ANGLE_CAPTURE(BindBufferRange, context, target, index, buffer, offset, size);
         }
     }
 }
 
 void GL_APIENTRY BindSampler(GLuint unit, GLuint sampler)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindSampler);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint unit = %u, GLuint sampler = %u)", unit, sampler);
+    ANGLE_BINARY_TRACE(EntryPoint::BindSampler, unit, sampler);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -101,14 +118,17 @@ void GL_APIENTRY BindSampler(GLuint unit, GLuint sampler)
         if (context->skipValidation() || ValidateBindSampler(context, unit, sampler))
         {
             context->bindSampler(unit, sampler);
+            ANGLE_CAPTURE(BindSampler, context, unit, sampler);
         }
     }
 }
 
 void GL_APIENTRY BindTransformFeedback(GLenum target, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_TRACE(EntryPoint::BindTransformFeedback, target, id);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -116,14 +136,17 @@ void GL_APIENTRY BindTransformFeedback(GLenum target, GLuint id)
         if (context->skipValidation() || ValidateBindTransformFeedback(context, target, id))
         {
             context->bindTransformFeedback(target, id);
+            ANGLE_CAPTURE(BindTransformFeedback, context, target, id);
         }
     }
 }
 
 void GL_APIENTRY BindVertexArray(GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::BindVertexArray, array);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -131,6 +154,7 @@ void GL_APIENTRY BindVertexArray(GLuint array)
         if (context->skipValidation() || ValidateBindVertexArray(context, array))
         {
             context->bindVertexArray(array);
+            ANGLE_CAPTURE(BindVertexArray, context, array);
         }
     }
 }
@@ -146,12 +170,15 @@ void GL_APIENTRY BlitFramebuffer(GLint srcX0,
                                  GLbitfield mask,
                                  GLenum filter)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlitFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint srcX0 = %d, GLint srcY0 = %d, GLint srcX1 = %d, GLint srcY1 = %d, GLint dstX0 = "
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_TRACE(EntryPoint::BlitFramebuffer, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                       dstY1, mask, filter);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -162,15 +189,19 @@ void GL_APIENTRY BlitFramebuffer(GLint srcX0,
         {
             context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
                                      filter);
+            ANGLE_CAPTURE(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                          dstY1, mask, filter);
         }
     }
 }
 
 void GL_APIENTRY ClearBufferfi(GLenum buffer, GLint drawbuffer, GLfloat depth, GLint stencil)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferfi);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, GLfloat depth = %f, GLint stencil = %d)",
           buffer, drawbuffer, depth, stencil);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferfi, buffer, drawbuffer, depth, stencil);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -179,15 +210,18 @@ void GL_APIENTRY ClearBufferfi(GLenum buffer, GLint drawbuffer, GLfloat depth, G
             ValidateClearBufferfi(context, buffer, drawbuffer, depth, stencil))
         {
             context->clearBufferfi(buffer, drawbuffer, depth, stencil);
+            ANGLE_CAPTURE(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
         }
     }
 }
 
 void GL_APIENTRY ClearBufferfv(GLenum buffer, GLint drawbuffer, const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferfv, buffer, drawbuffer, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -195,15 +229,18 @@ void GL_APIENTRY ClearBufferfv(GLenum buffer, GLint drawbuffer, const GLfloat *v
         if (context->skipValidation() || ValidateClearBufferfv(context, buffer, drawbuffer, value))
         {
             context->clearBufferfv(buffer, drawbuffer, value);
+            ANGLE_CAPTURE(ClearBufferfv, context, buffer, drawbuffer, value);
         }
     }
 }
 
 void GL_APIENTRY ClearBufferiv(GLenum buffer, GLint drawbuffer, const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferiv, buffer, drawbuffer, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -211,15 +248,18 @@ void GL_APIENTRY ClearBufferiv(GLenum buffer, GLint drawbuffer, const GLint *val
         if (context->skipValidation() || ValidateClearBufferiv(context, buffer, drawbuffer, value))
         {
             context->clearBufferiv(buffer, drawbuffer, value);
+            ANGLE_CAPTURE(ClearBufferiv, context, buffer, drawbuffer, value);
         }
     }
 }
 
 void GL_APIENTRY ClearBufferuiv(GLenum buffer, GLint drawbuffer, const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferuiv, buffer, drawbuffer, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -227,22 +267,27 @@ void GL_APIENTRY ClearBufferuiv(GLenum buffer, GLint drawbuffer, const GLuint *v
         if (context->skipValidation() || ValidateClearBufferuiv(context, buffer, drawbuffer, value))
         {
             context->clearBufferuiv(buffer, drawbuffer, value);
+            ANGLE_CAPTURE(ClearBufferuiv, context, buffer, drawbuffer, value);
         }
     }
 }
 
 GLenum GL_APIENTRY ClientWaitSync(GLsync sync, GLbitfield flags, GLuint64 timeout)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClientWaitSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_TRACE(EntryPoint::ClientWaitSync, sync, flags, timeout);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateClientWaitSync(context, sync, flags, timeout))
         {
-            return context->clientWaitSync(sync, flags, timeout);
+            GLenum returnValue = context->clientWaitSync(sync, flags, timeout);
+            ANGLE_CAPTURE(ClientWaitSync, context, sync, flags, timeout, returnValue);
+            return returnValue;
         }
     }
 
@@ -259,12 +304,15 @@ void GL_APIENTRY CompressedTexImage3D(GLenum target,
                                       GLsizei imageSize,
                                       const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d, GLint border = %d, GLsizei imageSize = %d, "
         "const void *data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage3D, target, level, internalformat, width,
+                       height, depth, border, imageSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -276,6 +324,8 @@ void GL_APIENTRY CompressedTexImage3D(GLenum target,
         {
             context->compressedTexImage3D(targetPacked, level, internalformat, width, height, depth,
                                           border, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexImage3D, context, target, level, internalformat, width,
+                          height, depth, border, imageSize, data);
         }
     }
 }
@@ -292,6 +342,7 @@ void GL_APIENTRY CompressedTexSubImage3D(GLenum target,
                                          GLsizei imageSize,
                                          const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -299,6 +350,8 @@ void GL_APIENTRY CompressedTexSubImage3D(GLenum target,
         "= 0x%X, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage3D, target, level, xoffset, yoffset,
+                       zoffset, width, height, depth, format, imageSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -310,6 +363,8 @@ void GL_APIENTRY CompressedTexSubImage3D(GLenum target,
         {
             context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width,
                                              height, depth, format, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage3D, context, target, level, xoffset, yoffset,
+                          zoffset, width, height, depth, format, imageSize, data);
         }
     }
 }
@@ -320,12 +375,15 @@ void GL_APIENTRY CopyBufferSubData(GLenum readTarget,
                                    GLintptr writeOffset,
                                    GLsizeiptr size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyBufferSubData);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum readTarget = 0x%X, GLenum writeTarget = 0x%X, GLintptr readOffset = %llu, "
         "GLintptr writeOffset = %llu, GLsizeiptr size = %llu)",
         readTarget, writeTarget, static_cast<unsigned long long>(readOffset),
         static_cast<unsigned long long>(writeOffset), static_cast<unsigned long long>(size));
+    ANGLE_BINARY_TRACE(EntryPoint::CopyBufferSubData, readTarget, writeTarget, readOffset,
+                       writeOffset, size);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -338,6 +396,8 @@ void GL_APIENTRY CopyBufferSubData(GLenum readTarget,
         {
             context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset, writeOffset,
                                        size);
+            ANGLE_CAPTURE(CopyBufferSubData, context, readTarget, writeTarget, readOffset,
+                          writeOffset, size);
         }
     }
 }
@@ -352,11 +412,14 @@ void GL_APIENTRY CopyTexSubImage3D(GLenum target,
                                    GLsizei width,
                                    GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexSubImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
         "zoffset = %d, GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, zoffset, x, y, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexSubImage3D, target, level, xoffset, yoffset, zoffset, x,
+                       y, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -368,14 +431,18 @@ void GL_APIENTRY CopyTexSubImage3D(GLenum target,
         {
             context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y, width,
                                        height);
+            ANGLE_CAPTURE(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset, x,
+                          y, width, height);
         }
     }
 }
 
 void GL_APIENTRY DeleteQueries(GLsizei n, const GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteQueries);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteQueries, n, ids);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -383,15 +450,18 @@ void GL_APIENTRY DeleteQueries(GLsizei n, const GLuint *ids)
         if (context->skipValidation() || ValidateDeleteQueries(context, n, ids))
         {
             context->deleteQueries(n, ids);
+            ANGLE_CAPTURE(DeleteQueries, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY DeleteSamplers(GLsizei count, const GLuint *samplers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSamplers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, const GLuint *samplers = 0x%016" PRIxPTR ")", count,
           (uintptr_t)samplers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteSamplers, count, samplers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -399,14 +469,17 @@ void GL_APIENTRY DeleteSamplers(GLsizei count, const GLuint *samplers)
         if (context->skipValidation() || ValidateDeleteSamplers(context, count, samplers))
         {
             context->deleteSamplers(count, samplers);
+            ANGLE_CAPTURE(DeleteSamplers, context, count, samplers);
         }
     }
 }
 
 void GL_APIENTRY DeleteSync(GLsync sync)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteSync, sync);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -414,14 +487,17 @@ void GL_APIENTRY DeleteSync(GLsync sync)
         if (context->skipValidation() || ValidateDeleteSync(context, sync))
         {
             context->deleteSync(sync);
+            ANGLE_CAPTURE(DeleteSync, context, sync);
         }
     }
 }
 
 void GL_APIENTRY DeleteTransformFeedbacks(GLsizei n, const GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteTransformFeedbacks);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteTransformFeedbacks, n, ids);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -429,14 +505,17 @@ void GL_APIENTRY DeleteTransformFeedbacks(GLsizei n, const GLuint *ids)
         if (context->skipValidation() || ValidateDeleteTransformFeedbacks(context, n, ids))
         {
             context->deleteTransformFeedbacks(n, ids);
+            ANGLE_CAPTURE(DeleteTransformFeedbacks, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY DeleteVertexArrays(GLsizei n, const GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteVertexArrays);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteVertexArrays, n, arrays);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -444,15 +523,18 @@ void GL_APIENTRY DeleteVertexArrays(GLsizei n, const GLuint *arrays)
         if (context->skipValidation() || ValidateDeleteVertexArrays(context, n, arrays))
         {
             context->deleteVertexArrays(n, arrays);
+            ANGLE_CAPTURE(DeleteVertexArrays, context, n, arrays);
         }
     }
 }
 
 void GL_APIENTRY DrawArraysInstanced(GLenum mode, GLint first, GLsizei count, GLsizei instancecount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstanced);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei instancecount = %d)",
           mode, first, count, instancecount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstanced, mode, first, count, instancecount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -462,14 +544,17 @@ void GL_APIENTRY DrawArraysInstanced(GLenum mode, GLint first, GLsizei count, GL
             ValidateDrawArraysInstanced(context, modePacked, first, count, instancecount))
         {
             context->drawArraysInstanced(modePacked, first, count, instancecount);
+            ANGLE_CAPTURE(DrawArraysInstanced, context, mode, first, count, instancecount);
         }
     }
 }
 
 void GL_APIENTRY DrawBuffers(GLsizei n, const GLenum *bufs)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawBuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawBuffers, n, bufs);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -477,6 +562,7 @@ void GL_APIENTRY DrawBuffers(GLsizei n, const GLenum *bufs)
         if (context->skipValidation() || ValidateDrawBuffers(context, n, bufs))
         {
             context->drawBuffers(n, bufs);
+            ANGLE_CAPTURE(DrawBuffers, context, n, bufs);
         }
     }
 }
@@ -487,11 +573,14 @@ void GL_APIENTRY DrawElementsInstanced(GLenum mode,
                                        const void *indices,
                                        GLsizei instancecount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstanced);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei instancecount = %d)",
         mode, count, type, (uintptr_t)indices, instancecount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstanced, mode, count, type, indices,
+                       instancecount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -503,6 +592,8 @@ void GL_APIENTRY DrawElementsInstanced(GLenum mode,
                                           instancecount))
         {
             context->drawElementsInstanced(modePacked, count, typePacked, indices, instancecount);
+            ANGLE_CAPTURE(DrawElementsInstanced, context, mode, count, type, indices,
+                          instancecount);
         }
     }
 }
@@ -514,11 +605,13 @@ void GL_APIENTRY DrawRangeElements(GLenum mode,
                                    GLenum type,
                                    const void *indices)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawRangeElements);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLuint start = %u, GLuint end = %u, GLsizei count = %d, GLenum type "
         "= 0x%X, const void *indices = 0x%016" PRIxPTR ")",
         mode, start, end, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawRangeElements, mode, start, end, count, type, indices);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -529,14 +622,17 @@ void GL_APIENTRY DrawRangeElements(GLenum mode,
             ValidateDrawRangeElements(context, modePacked, start, end, count, typePacked, indices))
         {
             context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
+            ANGLE_CAPTURE(DrawRangeElements, context, mode, start, end, count, type, indices);
         }
     }
 }
 
 void GL_APIENTRY EndQuery(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndQuery);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::EndQuery, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -545,14 +641,17 @@ void GL_APIENTRY EndQuery(GLenum target)
         if (context->skipValidation() || ValidateEndQuery(context, targetPacked))
         {
             context->endQuery(targetPacked);
+            ANGLE_CAPTURE(EndQuery, context, target);
         }
     }
 }
 
 void GL_APIENTRY EndTransformFeedback()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::EndTransformFeedback);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -560,21 +659,26 @@ void GL_APIENTRY EndTransformFeedback()
         if (context->skipValidation() || ValidateEndTransformFeedback(context))
         {
             context->endTransformFeedback();
+            ANGLE_CAPTURE(EndTransformFeedback, context);
         }
     }
 }
 
 GLsync GL_APIENTRY FenceSync(GLenum condition, GLbitfield flags)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FenceSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum condition = 0x%X, GLbitfield flags = 0x%X)", condition, flags);
+    ANGLE_BINARY_TRACE(EntryPoint::FenceSync, condition, flags);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateFenceSync(context, condition, flags))
         {
-            return context->fenceSync(condition, flags);
+            GLsync returnValue = context->fenceSync(condition, flags);
+            ANGLE_CAPTURE(FenceSync, context, condition, flags, returnValue);
+            return returnValue;
         }
     }
 
@@ -583,9 +687,11 @@ GLsync GL_APIENTRY FenceSync(GLenum condition, GLbitfield flags)
 
 void GL_APIENTRY FlushMappedBufferRange(GLenum target, GLintptr offset, GLsizeiptr length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FlushMappedBufferRange);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_TRACE(EntryPoint::FlushMappedBufferRange, target, offset, length);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -595,6 +701,7 @@ void GL_APIENTRY FlushMappedBufferRange(GLenum target, GLintptr offset, GLsizeip
             ValidateFlushMappedBufferRange(context, targetPacked, offset, length))
         {
             context->flushMappedBufferRange(targetPacked, offset, length);
+            ANGLE_CAPTURE(FlushMappedBufferRange, context, target, offset, length);
         }
     }
 }
@@ -602,11 +709,14 @@ void GL_APIENTRY FlushMappedBufferRange(GLenum target, GLintptr offset, GLsizeip
 void GL_APIENTRY
 FramebufferTextureLayer(GLenum target, GLenum attachment, GLuint texture, GLint level, GLint layer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureLayer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint layer = %d)",
         target, attachment, texture, level, layer);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureLayer, target, attachment, texture, level,
+                       layer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -615,14 +725,18 @@ FramebufferTextureLayer(GLenum target, GLenum attachment, GLuint texture, GLint
             ValidateFramebufferTextureLayer(context, target, attachment, texture, level, layer))
         {
             context->framebufferTextureLayer(target, attachment, texture, level, layer);
+            ANGLE_CAPTURE(FramebufferTextureLayer, context, target, attachment, texture, level,
+                          layer);
         }
     }
 }
 
 void GL_APIENTRY GenQueries(GLsizei n, GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenQueries);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::GenQueries, n, ids);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -630,14 +744,17 @@ void GL_APIENTRY GenQueries(GLsizei n, GLuint *ids)
         if (context->skipValidation() || ValidateGenQueries(context, n, ids))
         {
             context->genQueries(n, ids);
+            ANGLE_CAPTURE(GenQueries, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY GenSamplers(GLsizei count, GLuint *samplers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenSamplers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, GLuint *samplers = 0x%016" PRIxPTR ")", count, (uintptr_t)samplers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenSamplers, count, samplers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -645,14 +762,17 @@ void GL_APIENTRY GenSamplers(GLsizei count, GLuint *samplers)
         if (context->skipValidation() || ValidateGenSamplers(context, count, samplers))
         {
             context->genSamplers(count, samplers);
+            ANGLE_CAPTURE(GenSamplers, context, count, samplers);
         }
     }
 }
 
 void GL_APIENTRY GenTransformFeedbacks(GLsizei n, GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenTransformFeedbacks);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::GenTransformFeedbacks, n, ids);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -660,14 +780,17 @@ void GL_APIENTRY GenTransformFeedbacks(GLsizei n, GLuint *ids)
         if (context->skipValidation() || ValidateGenTransformFeedbacks(context, n, ids))
         {
             context->genTransformFeedbacks(n, ids);
+            ANGLE_CAPTURE(GenTransformFeedbacks, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY GenVertexArrays(GLsizei n, GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenVertexArrays);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::GenVertexArrays, n, arrays);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -675,6 +798,7 @@ void GL_APIENTRY GenVertexArrays(GLsizei n, GLuint *arrays)
         if (context->skipValidation() || ValidateGenVertexArrays(context, n, arrays))
         {
             context->genVertexArrays(n, arrays);
+            ANGLE_CAPTURE(GenVertexArrays, context, n, arrays);
         }
     }
 }
@@ -685,11 +809,14 @@ void GL_APIENTRY GetActiveUniformBlockName(GLuint program,
                                            GLsizei *length,
                                            GLchar *uniformBlockName)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockName);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLsizei bufSize = %d, GLsizei "
         "*length = 0x%016" PRIxPTR ", GLchar *uniformBlockName = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, bufSize, (uintptr_t)length, (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockName, program, uniformBlockIndex, bufSize,
+                       length, uniformBlockName);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -700,6 +827,8 @@ void GL_APIENTRY GetActiveUniformBlockName(GLuint program,
         {
             context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
                                                uniformBlockName);
+            ANGLE_CAPTURE(GetActiveUniformBlockName, context, program, uniformBlockIndex, bufSize,
+                          length, uniformBlockName);
         }
     }
 }
@@ -709,11 +838,14 @@ void GL_APIENTRY GetActiveUniformBlockiv(GLuint program,
                                          GLenum pname,
                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockiv, program, uniformBlockIndex, pname,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -722,6 +854,8 @@ void GL_APIENTRY GetActiveUniformBlockiv(GLuint program,
             ValidateGetActiveUniformBlockiv(context, program, uniformBlockIndex, pname, params))
         {
             context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
+            ANGLE_CAPTURE(GetActiveUniformBlockiv, context, program, uniformBlockIndex, pname,
+                          params);
         }
     }
 }
@@ -732,11 +866,14 @@ void GL_APIENTRY GetActiveUniformsiv(GLuint program,
                                      GLenum pname,
                                      GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformsiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLuint *uniformIndices = "
         "0x%016" PRIxPTR ", GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformIndices, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformsiv, program, uniformCount, uniformIndices,
+                       pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -745,15 +882,19 @@ void GL_APIENTRY GetActiveUniformsiv(GLuint program,
                                                                      uniformIndices, pname, params))
         {
             context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
+            ANGLE_CAPTURE(GetActiveUniformsiv, context, program, uniformCount, uniformIndices,
+                          pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetBufferParameteri64v(GLenum target, GLenum pname, GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteri64v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteri64v, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -763,15 +904,18 @@ void GL_APIENTRY GetBufferParameteri64v(GLenum target, GLenum pname, GLint64 *pa
             ValidateGetBufferParameteri64v(context, targetPacked, pname, params))
         {
             context->getBufferParameteri64v(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferParameteri64v, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetBufferPointerv(GLenum target, GLenum pname, void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointerv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -781,22 +925,27 @@ void GL_APIENTRY GetBufferPointerv(GLenum target, GLenum pname, void **params)
             ValidateGetBufferPointerv(context, targetPacked, pname, params))
         {
             context->getBufferPointerv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferPointerv, context, target, pname, params);
         }
     }
 }
 
 GLint GL_APIENTRY GetFragDataLocation(GLuint program, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFragDataLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFragDataLocation, program, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetFragDataLocation(context, program, name))
         {
-            return context->getFragDataLocation(program, name);
+            GLint returnValue = context->getFragDataLocation(program, name);
+            ANGLE_CAPTURE(GetFragDataLocation, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -805,9 +954,11 @@ GLint GL_APIENTRY GetFragDataLocation(GLuint program, const GLchar *name)
 
 void GL_APIENTRY GetInteger64i_v(GLenum target, GLuint index, GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64i_v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint64 *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64i_v, target, index, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -815,14 +966,17 @@ void GL_APIENTRY GetInteger64i_v(GLenum target, GLuint index, GLint64 *data)
         if (context->skipValidation() || ValidateGetInteger64i_v(context, target, index, data))
         {
             context->getInteger64i_v(target, index, data);
+            ANGLE_CAPTURE(GetInteger64i_v, context, target, index, data);
         }
     }
 }
 
 void GL_APIENTRY GetInteger64v(GLenum pname, GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint64 *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64v, pname, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -830,15 +984,18 @@ void GL_APIENTRY GetInteger64v(GLenum pname, GLint64 *data)
         if (context->skipValidation() || ValidateGetInteger64v(context, pname, data))
         {
             context->getInteger64v(pname, data);
+            ANGLE_CAPTURE(GetInteger64v, context, pname, data);
         }
     }
 }
 
 void GL_APIENTRY GetIntegeri_v(GLenum target, GLuint index, GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegeri_v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegeri_v, target, index, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -846,6 +1003,7 @@ void GL_APIENTRY GetIntegeri_v(GLenum target, GLuint index, GLint *data)
         if (context->skipValidation() || ValidateGetIntegeri_v(context, target, index, data))
         {
             context->getIntegeri_v(target, index, data);
+            ANGLE_CAPTURE(GetIntegeri_v, context, target, index, data);
         }
     }
 }
@@ -856,11 +1014,14 @@ void GL_APIENTRY GetInternalformativ(GLenum target,
                                      GLsizei bufSize,
                                      GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInternalformativ);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLint *params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInternalformativ, target, internalformat, pname, bufSize,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -869,6 +1030,8 @@ void GL_APIENTRY GetInternalformativ(GLenum target,
             ValidateGetInternalformativ(context, target, internalformat, pname, bufSize, params))
         {
             context->getInternalformativ(target, internalformat, pname, bufSize, params);
+            ANGLE_CAPTURE(GetInternalformativ, context, target, internalformat, pname, bufSize,
+                          params);
         }
     }
 }
@@ -879,10 +1042,13 @@ void GL_APIENTRY GetProgramBinary(GLuint program,
                                   GLenum *binaryFormat,
                                   void *binary)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramBinary);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramBinary, program, bufSize, length, binaryFormat,
+                       binary);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -891,15 +1057,19 @@ void GL_APIENTRY GetProgramBinary(GLuint program,
             ValidateGetProgramBinary(context, program, bufSize, length, binaryFormat, binary))
         {
             context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+            ANGLE_CAPTURE(GetProgramBinary, context, program, bufSize, length, binaryFormat,
+                          binary);
         }
     }
 }
 
 void GL_APIENTRY GetQueryObjectuiv(GLuint id, GLenum pname, GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuiv, id, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -907,15 +1077,18 @@ void GL_APIENTRY GetQueryObjectuiv(GLuint id, GLenum pname, GLuint *params)
         if (context->skipValidation() || ValidateGetQueryObjectuiv(context, id, pname, params))
         {
             context->getQueryObjectuiv(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectuiv, context, id, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetQueryiv(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryiv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -924,15 +1097,18 @@ void GL_APIENTRY GetQueryiv(GLenum target, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetQueryiv(context, targetPacked, pname, params))
         {
             context->getQueryiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetQueryiv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetSamplerParameterfv(GLuint sampler, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterfv, sampler, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -941,15 +1117,18 @@ void GL_APIENTRY GetSamplerParameterfv(GLuint sampler, GLenum pname, GLfloat *pa
             ValidateGetSamplerParameterfv(context, sampler, pname, params))
         {
             context->getSamplerParameterfv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameterfv, context, sampler, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetSamplerParameteriv(GLuint sampler, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameteriv, sampler, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -958,21 +1137,26 @@ void GL_APIENTRY GetSamplerParameteriv(GLuint sampler, GLenum pname, GLint *para
             ValidateGetSamplerParameteriv(context, sampler, pname, params))
         {
             context->getSamplerParameteriv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameteriv, context, sampler, pname, params);
         }
     }
 }
 
 const GLubyte *GL_APIENTRY GetStringi(GLenum name, GLuint index)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetStringi);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X, GLuint index = %u)", name, index);
+    ANGLE_BINARY_TRACE(EntryPoint::GetStringi, name, index);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetStringi(context, name, index))
         {
-            return context->getStringi(name, index);
+            const GLubyte *returnValue = context->getStringi(name, index);
+            ANGLE_CAPTURE(GetStringi, context, name, index, returnValue);
+            return returnValue;
         }
     }
 
@@ -982,11 +1166,13 @@ const GLubyte *GL_APIENTRY GetStringi(GLenum name, GLuint index)
 void GL_APIENTRY
 GetSynciv(GLsync sync, GLenum pname, GLsizei bufSize, GLsizei *length, GLint *values)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSynciv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR
           ", GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLint *values = 0x%016" PRIxPTR ")",
           (uintptr_t)sync, pname, bufSize, (uintptr_t)length, (uintptr_t)values);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSynciv, sync, pname, bufSize, length, values);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -995,6 +1181,7 @@ GetSynciv(GLsync sync, GLenum pname, GLsizei bufSize, GLsizei *length, GLint *va
             ValidateGetSynciv(context, sync, pname, bufSize, length, values))
         {
             context->getSynciv(sync, pname, bufSize, length, values);
+            ANGLE_CAPTURE(GetSynciv, context, sync, pname, bufSize, length, values);
         }
     }
 }
@@ -1007,6 +1194,7 @@ void GL_APIENTRY GetTransformFeedbackVarying(GLuint program,
                                              GLenum *type,
                                              GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTransformFeedbackVarying);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = "
@@ -1014,6 +1202,8 @@ void GL_APIENTRY GetTransformFeedbackVarying(GLuint program,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTransformFeedbackVarying, program, index, bufSize, length,
+                       size, type, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1023,15 +1213,19 @@ void GL_APIENTRY GetTransformFeedbackVarying(GLuint program,
                                                 type, name))
         {
             context->getTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
+            ANGLE_CAPTURE(GetTransformFeedbackVarying, context, program, index, bufSize, length,
+                          size, type, name);
         }
     }
 }
 
 GLuint GL_APIENTRY GetUniformBlockIndex(GLuint program, const GLchar *uniformBlockName)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformBlockIndex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *uniformBlockName = 0x%016" PRIxPTR ")", program,
           (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformBlockIndex, program, uniformBlockName);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1039,7 +1233,9 @@ GLuint GL_APIENTRY GetUniformBlockIndex(GLuint program, const GLchar *uniformBlo
         if (context->skipValidation() ||
             ValidateGetUniformBlockIndex(context, program, uniformBlockName))
         {
-            return context->getUniformBlockIndex(program, uniformBlockName);
+            GLuint returnValue = context->getUniformBlockIndex(program, uniformBlockName);
+            ANGLE_CAPTURE(GetUniformBlockIndex, context, program, uniformBlockName, returnValue);
+            return returnValue;
         }
     }
 
@@ -1051,11 +1247,14 @@ void GL_APIENTRY GetUniformIndices(GLuint program,
                                    const GLchar *const *uniformNames,
                                    GLuint *uniformIndices)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformIndices);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLchar *const*uniformNames = "
         "0x%016" PRIxPTR ", GLuint *uniformIndices = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformNames, (uintptr_t)uniformIndices);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformIndices, program, uniformCount, uniformNames,
+                       uniformIndices);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1064,15 +1263,19 @@ void GL_APIENTRY GetUniformIndices(GLuint program,
             ValidateGetUniformIndices(context, program, uniformCount, uniformNames, uniformIndices))
         {
             context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
+            ANGLE_CAPTURE(GetUniformIndices, context, program, uniformCount, uniformNames,
+                          uniformIndices);
         }
     }
 }
 
 void GL_APIENTRY GetUniformuiv(GLuint program, GLint location, GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformuiv, program, location, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1080,15 +1283,18 @@ void GL_APIENTRY GetUniformuiv(GLuint program, GLint location, GLuint *params)
         if (context->skipValidation() || ValidateGetUniformuiv(context, program, location, params))
         {
             context->getUniformuiv(program, location, params);
+            ANGLE_CAPTURE(GetUniformuiv, context, program, location, params);
         }
     }
 }
 
 void GL_APIENTRY GetVertexAttribIiv(GLuint index, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIiv, index, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1096,15 +1302,18 @@ void GL_APIENTRY GetVertexAttribIiv(GLuint index, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetVertexAttribIiv(context, index, pname, params))
         {
             context->getVertexAttribIiv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribIiv, context, index, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetVertexAttribIuiv(GLuint index, GLenum pname, GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIuiv, index, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1112,6 +1321,7 @@ void GL_APIENTRY GetVertexAttribIuiv(GLuint index, GLenum pname, GLuint *params)
         if (context->skipValidation() || ValidateGetVertexAttribIuiv(context, index, pname, params))
         {
             context->getVertexAttribIuiv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribIuiv, context, index, pname, params);
         }
     }
 }
@@ -1120,11 +1330,13 @@ void GL_APIENTRY InvalidateFramebuffer(GLenum target,
                                        GLsizei numAttachments,
                                        const GLenum *attachments)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InvalidateFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_TRACE(EntryPoint::InvalidateFramebuffer, target, numAttachments, attachments);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1133,6 +1345,7 @@ void GL_APIENTRY InvalidateFramebuffer(GLenum target,
             ValidateInvalidateFramebuffer(context, target, numAttachments, attachments))
         {
             context->invalidateFramebuffer(target, numAttachments, attachments);
+            ANGLE_CAPTURE(InvalidateFramebuffer, context, target, numAttachments, attachments);
         }
     }
 }
@@ -1145,11 +1358,14 @@ void GL_APIENTRY InvalidateSubFramebuffer(GLenum target,
                                           GLsizei width,
                                           GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InvalidateSubFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ", GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, numAttachments, (uintptr_t)attachments, x, y, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::InvalidateSubFramebuffer, target, numAttachments, attachments, x,
+                       y, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1160,21 +1376,27 @@ void GL_APIENTRY InvalidateSubFramebuffer(GLenum target,
         {
             context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width,
                                               height);
+            ANGLE_CAPTURE(InvalidateSubFramebuffer, context, target, numAttachments, attachments, x,
+                          y, width, height);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsQuery(GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsQuery);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_TRACE(EntryPoint::IsQuery, id);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsQuery(context, id))
         {
-            return context->isQuery(id);
+            GLboolean returnValue = context->isQuery(id);
+            ANGLE_CAPTURE(IsQuery, context, id, returnValue);
+            return returnValue;
         }
     }
 
@@ -1183,15 +1405,19 @@ GLboolean GL_APIENTRY IsQuery(GLuint id)
 
 GLboolean GL_APIENTRY IsSampler(GLuint sampler)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsSampler);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u)", sampler);
+    ANGLE_BINARY_TRACE(EntryPoint::IsSampler, sampler);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsSampler(context, sampler))
         {
-            return context->isSampler(sampler);
+            GLboolean returnValue = context->isSampler(sampler);
+            ANGLE_CAPTURE(IsSampler, context, sampler, returnValue);
+            return returnValue;
         }
     }
 
@@ -1200,15 +1426,19 @@ GLboolean GL_APIENTRY IsSampler(GLuint sampler)
 
 GLboolean GL_APIENTRY IsSync(GLsync sync)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_TRACE(EntryPoint::IsSync, sync);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsSync(context, sync))
         {
-            return context->isSync(sync);
+            GLboolean returnValue = context->isSync(sync);
+            ANGLE_CAPTURE(IsSync, context, sync, returnValue);
+            return returnValue;
         }
     }
 
@@ -1217,15 +1447,19 @@ GLboolean GL_APIENTRY IsSync(GLsync sync)
 
 GLboolean GL_APIENTRY IsTransformFeedback(GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_TRACE(EntryPoint::IsTransformFeedback, id);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsTransformFeedback(context, id))
         {
-            return context->isTransformFeedback(id);
+            GLboolean returnValue = context->isTransformFeedback(id);
+            ANGLE_CAPTURE(IsTransformFeedback, context, id, returnValue);
+            return returnValue;
         }
     }
 
@@ -1234,15 +1468,19 @@ GLboolean GL_APIENTRY IsTransformFeedback(GLuint id)
 
 GLboolean GL_APIENTRY IsVertexArray(GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsVertexArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::IsVertexArray, array);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsVertexArray(context, array))
         {
-            return context->isVertexArray(array);
+            GLboolean returnValue = context->isVertexArray(array);
+            ANGLE_CAPTURE(IsVertexArray, context, array, returnValue);
+            return returnValue;
         }
     }
 
@@ -1254,12 +1492,14 @@ void *GL_APIENTRY MapBufferRange(GLenum target,
                                  GLsizeiptr length,
                                  GLbitfield access)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MapBufferRange);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu, GLbitfield "
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_TRACE(EntryPoint::MapBufferRange, target, offset, length, access);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1268,7 +1508,9 @@ void *GL_APIENTRY MapBufferRange(GLenum target,
         if (context->skipValidation() ||
             ValidateMapBufferRange(context, targetPacked, offset, length, access))
         {
-            return context->mapBufferRange(targetPacked, offset, length, access);
+            void *returnValue = context->mapBufferRange(targetPacked, offset, length, access);
+            ANGLE_CAPTURE(MapBufferRange, context, target, offset, length, access, returnValue);
+            return returnValue;
         }
     }
 
@@ -1277,8 +1519,10 @@ void *GL_APIENTRY MapBufferRange(GLenum target,
 
 void GL_APIENTRY PauseTransformFeedback()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PauseTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PauseTransformFeedback);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1286,6 +1530,7 @@ void GL_APIENTRY PauseTransformFeedback()
         if (context->skipValidation() || ValidatePauseTransformFeedback(context))
         {
             context->pauseTransformFeedback();
+            ANGLE_CAPTURE(PauseTransformFeedback, context);
         }
     }
 }
@@ -1295,10 +1540,12 @@ void GL_APIENTRY ProgramBinary(GLuint program,
                                const void *binary,
                                GLsizei length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramBinary);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramBinary, program, binaryFormat, binary, length);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1307,14 +1554,17 @@ void GL_APIENTRY ProgramBinary(GLuint program,
             ValidateProgramBinary(context, program, binaryFormat, binary, length))
         {
             context->programBinary(program, binaryFormat, binary, length);
+            ANGLE_CAPTURE(ProgramBinary, context, program, binaryFormat, binary, length);
         }
     }
 }
 
 void GL_APIENTRY ProgramParameteri(GLuint program, GLenum pname, GLint value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint value = %d)", program, pname, value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramParameteri, program, pname, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1322,14 +1572,17 @@ void GL_APIENTRY ProgramParameteri(GLuint program, GLenum pname, GLint value)
         if (context->skipValidation() || ValidateProgramParameteri(context, program, pname, value))
         {
             context->programParameteri(program, pname, value);
+            ANGLE_CAPTURE(ProgramParameteri, context, program, pname, value);
         }
     }
 }
 
 void GL_APIENTRY ReadBuffer(GLenum src)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum src = 0x%X)", src);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadBuffer, src);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1337,6 +1590,7 @@ void GL_APIENTRY ReadBuffer(GLenum src)
         if (context->skipValidation() || ValidateReadBuffer(context, src))
         {
             context->readBuffer(src);
+            ANGLE_CAPTURE(ReadBuffer, context, src);
         }
     }
 }
@@ -1347,11 +1601,14 @@ void GL_APIENTRY RenderbufferStorageMultisample(GLenum target,
                                                 GLsizei width,
                                                 GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageMultisample);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageMultisample, target, samples, internalformat,
+                       width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1361,14 +1618,18 @@ void GL_APIENTRY RenderbufferStorageMultisample(GLenum target,
                                                    height))
         {
             context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorageMultisample, context, target, samples, internalformat,
+                          width, height);
         }
     }
 }
 
 void GL_APIENTRY ResumeTransformFeedback()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ResumeTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::ResumeTransformFeedback);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1376,14 +1637,17 @@ void GL_APIENTRY ResumeTransformFeedback()
         if (context->skipValidation() || ValidateResumeTransformFeedback(context))
         {
             context->resumeTransformFeedback();
+            ANGLE_CAPTURE(ResumeTransformFeedback, context);
         }
     }
 }
 
 void GL_APIENTRY SamplerParameterf(GLuint sampler, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat param = %f)", sampler, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterf, sampler, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1391,15 +1655,18 @@ void GL_APIENTRY SamplerParameterf(GLuint sampler, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateSamplerParameterf(context, sampler, pname, param))
         {
             context->samplerParameterf(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterf, context, sampler, pname, param);
         }
     }
 }
 
 void GL_APIENTRY SamplerParameterfv(GLuint sampler, GLenum pname, const GLfloat *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLfloat *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterfv, sampler, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1407,14 +1674,17 @@ void GL_APIENTRY SamplerParameterfv(GLuint sampler, GLenum pname, const GLfloat
         if (context->skipValidation() || ValidateSamplerParameterfv(context, sampler, pname, param))
         {
             context->samplerParameterfv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterfv, context, sampler, pname, param);
         }
     }
 }
 
 void GL_APIENTRY SamplerParameteri(GLuint sampler, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint param = %d)", sampler, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameteri, sampler, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1422,15 +1692,18 @@ void GL_APIENTRY SamplerParameteri(GLuint sampler, GLenum pname, GLint param)
         if (context->skipValidation() || ValidateSamplerParameteri(context, sampler, pname, param))
         {
             context->samplerParameteri(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameteri, context, sampler, pname, param);
         }
     }
 }
 
 void GL_APIENTRY SamplerParameteriv(GLuint sampler, GLenum pname, const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameteriv, sampler, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1438,6 +1711,7 @@ void GL_APIENTRY SamplerParameteriv(GLuint sampler, GLenum pname, const GLint *p
         if (context->skipValidation() || ValidateSamplerParameteriv(context, sampler, pname, param))
         {
             context->samplerParameteriv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameteriv, context, sampler, pname, param);
         }
     }
 }
@@ -1453,6 +1727,7 @@ void GL_APIENTRY TexImage3D(GLenum target,
                             GLenum type,
                             const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
@@ -1460,6 +1735,8 @@ void GL_APIENTRY TexImage3D(GLenum target,
         "type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage3D, target, level, internalformat, width, height, depth,
+                       border, format, type, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1471,6 +1748,8 @@ void GL_APIENTRY TexImage3D(GLenum target,
         {
             context->texImage3D(targetPacked, level, internalformat, width, height, depth, border,
                                 format, type, pixels);
+            ANGLE_CAPTURE(TexImage3D, context, target, level, internalformat, width, height, depth,
+                          border, format, type, pixels);
         }
     }
 }
@@ -1478,11 +1757,13 @@ void GL_APIENTRY TexImage3D(GLenum target,
 void GL_APIENTRY
 TexStorage2D(GLenum target, GLsizei levels, GLenum internalformat, GLsizei width, GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2D, target, levels, internalformat, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1492,6 +1773,7 @@ TexStorage2D(GLenum target, GLsizei levels, GLenum internalformat, GLsizei width
             ValidateTexStorage2D(context, targetPacked, levels, internalformat, width, height))
         {
             context->texStorage2D(targetPacked, levels, internalformat, width, height);
+            ANGLE_CAPTURE(TexStorage2D, context, target, levels, internalformat, width, height);
         }
     }
 }
@@ -1503,11 +1785,14 @@ void GL_APIENTRY TexStorage3D(GLenum target,
                               GLsizei height,
                               GLsizei depth)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage3D, target, levels, internalformat, width, height,
+                       depth);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1517,6 +1802,8 @@ void GL_APIENTRY TexStorage3D(GLenum target,
                                                               internalformat, width, height, depth))
         {
             context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+            ANGLE_CAPTURE(TexStorage3D, context, target, levels, internalformat, width, height,
+                          depth);
         }
     }
 }
@@ -1533,6 +1820,7 @@ void GL_APIENTRY TexSubImage3D(GLenum target,
                                GLenum type,
                                const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -1540,6 +1828,8 @@ void GL_APIENTRY TexSubImage3D(GLenum target,
         "= 0x%X, GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage3D, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, type, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1551,6 +1841,8 @@ void GL_APIENTRY TexSubImage3D(GLenum target,
         {
             context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height,
                                    depth, format, type, pixels);
+            ANGLE_CAPTURE(TexSubImage3D, context, target, level, xoffset, yoffset, zoffset, width,
+                          height, depth, format, type, pixels);
         }
     }
 }
@@ -1560,10 +1852,12 @@ void GL_APIENTRY TransformFeedbackVaryings(GLuint program,
                                            const GLchar *const *varyings,
                                            GLenum bufferMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TransformFeedbackVaryings);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei count = %d, const GLchar *const*varyings = 0x%016" PRIxPTR
           ", GLenum bufferMode = 0x%X)",
           program, count, (uintptr_t)varyings, bufferMode);
+    ANGLE_BINARY_TRACE(EntryPoint::TransformFeedbackVaryings, program, count, varyings, bufferMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1572,14 +1866,17 @@ void GL_APIENTRY TransformFeedbackVaryings(GLuint program,
             ValidateTransformFeedbackVaryings(context, program, count, varyings, bufferMode))
         {
             context->transformFeedbackVaryings(program, count, varyings, bufferMode);
+            ANGLE_CAPTURE(TransformFeedbackVaryings, context, program, count, varyings, bufferMode);
         }
     }
 }
 
 void GL_APIENTRY Uniform1ui(GLint location, GLuint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u)", location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1ui, location, v0);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1587,15 +1884,18 @@ void GL_APIENTRY Uniform1ui(GLint location, GLuint v0)
         if (context->skipValidation() || ValidateUniform1ui(context, location, v0))
         {
             context->uniform1ui(location, v0);
+            ANGLE_CAPTURE(Uniform1ui, context, location, v0);
         }
     }
 }
 
 void GL_APIENTRY Uniform1uiv(GLint location, GLsizei count, const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1uiv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1603,14 +1903,17 @@ void GL_APIENTRY Uniform1uiv(GLint location, GLsizei count, const GLuint *value)
         if (context->skipValidation() || ValidateUniform1uiv(context, location, count, value))
         {
             context->uniform1uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform1uiv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform2ui(GLint location, GLuint v0, GLuint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2ui, location, v0, v1);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1618,15 +1921,18 @@ void GL_APIENTRY Uniform2ui(GLint location, GLuint v0, GLuint v1)
         if (context->skipValidation() || ValidateUniform2ui(context, location, v0, v1))
         {
             context->uniform2ui(location, v0, v1);
+            ANGLE_CAPTURE(Uniform2ui, context, location, v0, v1);
         }
     }
 }
 
 void GL_APIENTRY Uniform2uiv(GLint location, GLsizei count, const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2uiv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1634,15 +1940,18 @@ void GL_APIENTRY Uniform2uiv(GLint location, GLsizei count, const GLuint *value)
         if (context->skipValidation() || ValidateUniform2uiv(context, location, count, value))
         {
             context->uniform2uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform2uiv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform3ui(GLint location, GLuint v0, GLuint v1, GLuint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u)", location, v0, v1,
           v2);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3ui, location, v0, v1, v2);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1650,15 +1959,18 @@ void GL_APIENTRY Uniform3ui(GLint location, GLuint v0, GLuint v1, GLuint v2)
         if (context->skipValidation() || ValidateUniform3ui(context, location, v0, v1, v2))
         {
             context->uniform3ui(location, v0, v1, v2);
+            ANGLE_CAPTURE(Uniform3ui, context, location, v0, v1, v2);
         }
     }
 }
 
 void GL_APIENTRY Uniform3uiv(GLint location, GLsizei count, const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3uiv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1666,15 +1978,18 @@ void GL_APIENTRY Uniform3uiv(GLint location, GLsizei count, const GLuint *value)
         if (context->skipValidation() || ValidateUniform3uiv(context, location, count, value))
         {
             context->uniform3uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform3uiv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform4ui(GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u, GLuint v3 = %u)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4ui, location, v0, v1, v2, v3);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1682,15 +1997,18 @@ void GL_APIENTRY Uniform4ui(GLint location, GLuint v0, GLuint v1, GLuint v2, GLu
         if (context->skipValidation() || ValidateUniform4ui(context, location, v0, v1, v2, v3))
         {
             context->uniform4ui(location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(Uniform4ui, context, location, v0, v1, v2, v3);
         }
     }
 }
 
 void GL_APIENTRY Uniform4uiv(GLint location, GLsizei count, const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4uiv, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1698,6 +2016,7 @@ void GL_APIENTRY Uniform4uiv(GLint location, GLsizei count, const GLuint *value)
         if (context->skipValidation() || ValidateUniform4uiv(context, location, count, value))
         {
             context->uniform4uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform4uiv, context, location, count, value);
         }
     }
 }
@@ -1706,9 +2025,12 @@ void GL_APIENTRY UniformBlockBinding(GLuint program,
                                      GLuint uniformBlockIndex,
                                      GLuint uniformBlockBinding)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformBlockBinding);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint uniformBlockIndex = %u, GLuint uniformBlockBinding = %u)",
           program, uniformBlockIndex, uniformBlockBinding);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformBlockBinding, program, uniformBlockIndex,
+                       uniformBlockBinding);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1717,6 +2039,8 @@ void GL_APIENTRY UniformBlockBinding(GLuint program,
             ValidateUniformBlockBinding(context, program, uniformBlockIndex, uniformBlockBinding))
         {
             context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
+            ANGLE_CAPTURE(UniformBlockBinding, context, program, uniformBlockIndex,
+                          uniformBlockBinding);
         }
     }
 }
@@ -1726,11 +2050,13 @@ void GL_APIENTRY UniformMatrix2x3fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2x3fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1739,6 +2065,7 @@ void GL_APIENTRY UniformMatrix2x3fv(GLint location,
             ValidateUniformMatrix2x3fv(context, location, count, transpose, value))
         {
             context->uniformMatrix2x3fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix2x3fv, context, location, count, transpose, value);
         }
     }
 }
@@ -1748,11 +2075,13 @@ void GL_APIENTRY UniformMatrix2x4fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2x4fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1761,6 +2090,7 @@ void GL_APIENTRY UniformMatrix2x4fv(GLint location,
             ValidateUniformMatrix2x4fv(context, location, count, transpose, value))
         {
             context->uniformMatrix2x4fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix2x4fv, context, location, count, transpose, value);
         }
     }
 }
@@ -1770,11 +2100,13 @@ void GL_APIENTRY UniformMatrix3x2fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3x2fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1783,6 +2115,7 @@ void GL_APIENTRY UniformMatrix3x2fv(GLint location,
             ValidateUniformMatrix3x2fv(context, location, count, transpose, value))
         {
             context->uniformMatrix3x2fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix3x2fv, context, location, count, transpose, value);
         }
     }
 }
@@ -1792,11 +2125,13 @@ void GL_APIENTRY UniformMatrix3x4fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3x4fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1805,6 +2140,7 @@ void GL_APIENTRY UniformMatrix3x4fv(GLint location,
             ValidateUniformMatrix3x4fv(context, location, count, transpose, value))
         {
             context->uniformMatrix3x4fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix3x4fv, context, location, count, transpose, value);
         }
     }
 }
@@ -1814,11 +2150,13 @@ void GL_APIENTRY UniformMatrix4x2fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4x2fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1827,6 +2165,7 @@ void GL_APIENTRY UniformMatrix4x2fv(GLint location,
             ValidateUniformMatrix4x2fv(context, location, count, transpose, value))
         {
             context->uniformMatrix4x2fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix4x2fv, context, location, count, transpose, value);
         }
     }
 }
@@ -1836,11 +2175,13 @@ void GL_APIENTRY UniformMatrix4x3fv(GLint location,
                                     GLboolean transpose,
                                     const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4x3fv, location, count, transpose, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1849,14 +2190,17 @@ void GL_APIENTRY UniformMatrix4x3fv(GLint location,
             ValidateUniformMatrix4x3fv(context, location, count, transpose, value))
         {
             context->uniformMatrix4x3fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix4x3fv, context, location, count, transpose, value);
         }
     }
 }
 
 GLboolean GL_APIENTRY UnmapBuffer(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UnmapBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::UnmapBuffer, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1864,7 +2208,9 @@ GLboolean GL_APIENTRY UnmapBuffer(GLenum target)
         BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
         if (context->skipValidation() || ValidateUnmapBuffer(context, targetPacked))
         {
-            return context->unmapBuffer(targetPacked);
+            GLboolean returnValue = context->unmapBuffer(targetPacked);
+            ANGLE_CAPTURE(UnmapBuffer, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -1873,8 +2219,10 @@ GLboolean GL_APIENTRY UnmapBuffer(GLenum target)
 
 void GL_APIENTRY VertexAttribDivisor(GLuint index, GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisor, index, divisor);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1882,15 +2230,18 @@ void GL_APIENTRY VertexAttribDivisor(GLuint index, GLuint divisor)
         if (context->skipValidation() || ValidateVertexAttribDivisor(context, index, divisor))
         {
             context->vertexAttribDivisor(index, divisor);
+            ANGLE_CAPTURE(VertexAttribDivisor, context, index, divisor);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribI4i(GLuint index, GLint x, GLint y, GLint z, GLint w)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLint x = %d, GLint y = %d, GLint z = %d, GLint w = %d)", index, x,
           y, z, w);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4i, index, x, y, z, w);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1898,14 +2249,17 @@ void GL_APIENTRY VertexAttribI4i(GLuint index, GLint x, GLint y, GLint z, GLint
         if (context->skipValidation() || ValidateVertexAttribI4i(context, index, x, y, z, w))
         {
             context->vertexAttribI4i(index, x, y, z, w);
+            ANGLE_CAPTURE(VertexAttribI4i, context, index, x, y, z, w);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribI4iv(GLuint index, const GLint *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4iv, index, v);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1913,15 +2267,18 @@ void GL_APIENTRY VertexAttribI4iv(GLuint index, const GLint *v)
         if (context->skipValidation() || ValidateVertexAttribI4iv(context, index, v))
         {
             context->vertexAttribI4iv(index, v);
+            ANGLE_CAPTURE(VertexAttribI4iv, context, index, v);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribI4ui(GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint x = %u, GLuint y = %u, GLuint z = %u, GLuint w = %u)", index,
           x, y, z, w);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4ui, index, x, y, z, w);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1929,14 +2286,17 @@ void GL_APIENTRY VertexAttribI4ui(GLuint index, GLuint x, GLuint y, GLuint z, GL
         if (context->skipValidation() || ValidateVertexAttribI4ui(context, index, x, y, z, w))
         {
             context->vertexAttribI4ui(index, x, y, z, w);
+            ANGLE_CAPTURE(VertexAttribI4ui, context, index, x, y, z, w);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribI4uiv(GLuint index, const GLuint *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLuint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4uiv, index, v);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1944,6 +2304,7 @@ void GL_APIENTRY VertexAttribI4uiv(GLuint index, const GLuint *v)
         if (context->skipValidation() || ValidateVertexAttribI4uiv(context, index, v))
         {
             context->vertexAttribI4uiv(index, v);
+            ANGLE_CAPTURE(VertexAttribI4uiv, context, index, v);
         }
     }
 }
@@ -1951,11 +2312,13 @@ void GL_APIENTRY VertexAttribI4uiv(GLuint index, const GLuint *v)
 void GL_APIENTRY
 VertexAttribIPointer(GLuint index, GLint size, GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribIPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void "
         "*pointer = 0x%016" PRIxPTR ")",
         index, size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribIPointer, index, size, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1965,15 +2328,18 @@ VertexAttribIPointer(GLuint index, GLint size, GLenum type, GLsizei stride, cons
             ValidateVertexAttribIPointer(context, index, size, typePacked, stride, pointer))
         {
             context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(VertexAttribIPointer, context, index, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY WaitSync(GLsync sync, GLbitfield flags, GLuint64 timeout)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WaitSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_TRACE(EntryPoint::WaitSync, sync, flags, timeout);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1981,6 +2347,7 @@ void GL_APIENTRY WaitSync(GLsync sync, GLbitfield flags, GLuint64 timeout)
         if (context->skipValidation() || ValidateWaitSync(context, sync, flags, timeout))
         {
             context->waitSync(sync, flags, timeout);
+            ANGLE_CAPTURE(WaitSync, context, sync, flags, timeout);
         }
     }
 }
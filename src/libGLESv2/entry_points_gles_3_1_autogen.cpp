@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by generate_entry_points.py using data from gl.xml.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -13,6 +13,9 @@
 #include "libANGLE/Context.h"
 #include "libANGLE/Context.inl.h"
 #include "libANGLE/validationES31.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,8 +23,10 @@ namespace gl
 {
 void GL_APIENTRY ActiveShaderProgram(GLuint pipeline, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ActiveShaderProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLuint program = %u)", pipeline, program);
+    ANGLE_BINARY_TRACE(EntryPoint::ActiveShaderProgram, pipeline, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -29,6 +34,7 @@ void GL_APIENTRY ActiveShaderProgram(GLuint pipeline, GLuint program)
         if (context->skipValidation() || ValidateActiveShaderProgram(context, pipeline, program))
         {
             context->activeShaderProgram(pipeline, program);
+            ANGLE_CAPTURE(ActiveShaderProgram, context, pipeline, program);
         }
     }
 }
@@ -41,11 +47,14 @@ void GL_APIENTRY BindImageTexture(GLuint unit,
                                   GLenum access,
                                   GLenum format)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindImageTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint unit = %u, GLuint texture = %u, GLint level = %d, GLboolean layered = %u, GLint "
         "layer = %d, GLenum access = 0x%X, GLenum format = 0x%X)",
         unit, texture, level, layered, layer, access, format);
+    ANGLE_BINARY_TRACE(EntryPoint::BindImageTexture, unit, texture, level, layered, layer, access,
+                       format);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -54,14 +63,18 @@ void GL_APIENTRY BindImageTexture(GLuint unit,
             ValidateBindImageTexture(context, unit, texture, level, layered, layer, access, format))
         {
             context->bindImageTexture(unit, texture, level, layered, layer, access, format);
+            ANGLE_CAPTURE(BindImageTexture, context, unit, texture, level, layered, layer, access,
+                          format);
         }
     }
 }
 
 void GL_APIENTRY BindProgramPipeline(GLuint pipeline)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindProgramPipeline);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_TRACE(EntryPoint::BindProgramPipeline, pipeline);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -69,6 +82,7 @@ void GL_APIENTRY BindProgramPipeline(GLuint pipeline)
         if (context->skipValidation() || ValidateBindProgramPipeline(context, pipeline))
         {
             context->bindProgramPipeline(pipeline);
+            ANGLE_CAPTURE(BindProgramPipeline, context, pipeline);
         }
     }
 }
@@ -78,11 +92,13 @@ void GL_APIENTRY BindVertexBuffer(GLuint bindingindex,
                                   GLintptr offset,
                                   GLsizei stride)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint bindingindex = %u, GLuint buffer = %u, GLintptr offset = %llu, GLsizei stride = "
         "%d)",
         bindingindex, buffer, static_cast<unsigned long long>(offset), stride);
+    ANGLE_BINARY_TRACE(EntryPoint::BindVertexBuffer, bindingindex, buffer, offset, stride);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -91,16 +107,19 @@ void GL_APIENTRY BindVertexBuffer(GLuint bindingindex,
             ValidateBindVertexBuffer(context, bindingindex, buffer, offset, stride))
         {
             context->bindVertexBuffer(bindingindex, buffer, offset, stride);
+            ANGLE_CAPTURE(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
         }
     }
 }
 
 GLuint GL_APIENTRY CreateShaderProgramv(GLenum type, GLsizei count, const GLchar *const *strings)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateShaderProgramv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei count = %d, const GLchar *const*strings = 0x%016" PRIxPTR
           ")",
           type, count, (uintptr_t)strings);
+    ANGLE_BINARY_TRACE(EntryPoint::CreateShaderProgramv, type, count, strings);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -109,7 +128,9 @@ GLuint GL_APIENTRY CreateShaderProgramv(GLenum type, GLsizei count, const GLchar
         if (context->skipValidation() ||
             ValidateCreateShaderProgramv(context, typePacked, count, strings))
         {
-            return context->createShaderProgramv(typePacked, count, strings);
+            GLuint returnValue = context->createShaderProgramv(typePacked, count, strings);
+            ANGLE_CAPTURE(CreateShaderProgramv, context, type, count, strings, returnValue);
+            return returnValue;
         }
     }
 
@@ -118,8 +139,10 @@ GLuint GL_APIENTRY CreateShaderProgramv(GLenum type, GLsizei count, const GLchar
 
 void GL_APIENTRY DeleteProgramPipelines(GLsizei n, const GLuint *pipelines)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteProgramPipelines);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteProgramPipelines, n, pipelines);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -127,15 +150,18 @@ void GL_APIENTRY DeleteProgramPipelines(GLsizei n, const GLuint *pipelines)
         if (context->skipValidation() || ValidateDeleteProgramPipelines(context, n, pipelines))
         {
             context->deleteProgramPipelines(n, pipelines);
+            ANGLE_CAPTURE(DeleteProgramPipelines, context, n, pipelines);
         }
     }
 }
 
 void GL_APIENTRY DispatchCompute(GLuint num_groups_x, GLuint num_groups_y, GLuint num_groups_z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DispatchCompute);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint num_groups_x = %u, GLuint num_groups_y = %u, GLuint num_groups_z = %u)",
           num_groups_x, num_groups_y, num_groups_z);
+    ANGLE_BINARY_TRACE(EntryPoint::DispatchCompute, num_groups_x, num_groups_y, num_groups_z);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -144,14 +170,17 @@ void GL_APIENTRY DispatchCompute(GLuint num_groups_x, GLuint num_groups_y, GLuin
             ValidateDispatchCompute(context, num_groups_x, num_groups_y, num_groups_z))
         {
             context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+            ANGLE_CAPTURE(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
         }
     }
 }
 
 void GL_APIENTRY DispatchComputeIndirect(GLintptr indirect)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DispatchComputeIndirect);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLintptr indirect = %llu)", static_cast<unsigned long long>(indirect));
+    ANGLE_BINARY_TRACE(EntryPoint::DispatchComputeIndirect, indirect);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -159,15 +188,18 @@ void GL_APIENTRY DispatchComputeIndirect(GLintptr indirect)
         if (context->skipValidation() || ValidateDispatchComputeIndirect(context, indirect))
         {
             context->dispatchComputeIndirect(indirect);
+            ANGLE_CAPTURE(DispatchComputeIndirect, context, indirect);
         }
     }
 }
 
 void GL_APIENTRY DrawArraysIndirect(GLenum mode, const void *indirect)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysIndirect);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const void *indirect = 0x%016" PRIxPTR ")", mode,
           (uintptr_t)indirect);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysIndirect, mode, indirect);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -176,15 +208,18 @@ void GL_APIENTRY DrawArraysIndirect(GLenum mode, const void *indirect)
         if (context->skipValidation() || ValidateDrawArraysIndirect(context, modePacked, indirect))
         {
             context->drawArraysIndirect(modePacked, indirect);
+            ANGLE_CAPTURE(DrawArraysIndirect, context, mode, indirect);
         }
     }
 }
 
 void GL_APIENTRY DrawElementsIndirect(GLenum mode, GLenum type, const void *indirect)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsIndirect);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLenum type = 0x%X, const void *indirect = 0x%016" PRIxPTR ")",
           mode, type, (uintptr_t)indirect);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsIndirect, mode, type, indirect);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -195,14 +230,17 @@ void GL_APIENTRY DrawElementsIndirect(GLenum mode, GLenum type, const void *indi
             ValidateDrawElementsIndirect(context, modePacked, typePacked, indirect))
         {
             context->drawElementsIndirect(modePacked, typePacked, indirect);
+            ANGLE_CAPTURE(DrawElementsIndirect, context, mode, type, indirect);
         }
     }
 }
 
 void GL_APIENTRY FramebufferParameteri(GLenum target, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferParameteri, target, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -211,14 +249,17 @@ void GL_APIENTRY FramebufferParameteri(GLenum target, GLenum pname, GLint param)
             ValidateFramebufferParameteri(context, target, pname, param))
         {
             context->framebufferParameteri(target, pname, param);
+            ANGLE_CAPTURE(FramebufferParameteri, context, target, pname, param);
         }
     }
 }
 
 void GL_APIENTRY GenProgramPipelines(GLsizei n, GLuint *pipelines)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenProgramPipelines);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_TRACE(EntryPoint::GenProgramPipelines, n, pipelines);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -226,15 +267,18 @@ void GL_APIENTRY GenProgramPipelines(GLsizei n, GLuint *pipelines)
         if (context->skipValidation() || ValidateGenProgramPipelines(context, n, pipelines))
         {
             context->genProgramPipelines(n, pipelines);
+            ANGLE_CAPTURE(GenProgramPipelines, context, n, pipelines);
         }
     }
 }
 
 void GL_APIENTRY GetBooleani_v(GLenum target, GLuint index, GLboolean *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleani_v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLboolean *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleani_v, target, index, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -242,15 +286,18 @@ void GL_APIENTRY GetBooleani_v(GLenum target, GLuint index, GLboolean *data)
         if (context->skipValidation() || ValidateGetBooleani_v(context, target, index, data))
         {
             context->getBooleani_v(target, index, data);
+            ANGLE_CAPTURE(GetBooleani_v, context, target, index, data);
         }
     }
 }
 
 void GL_APIENTRY GetFramebufferParameteriv(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferParameteriv, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -259,15 +306,18 @@ void GL_APIENTRY GetFramebufferParameteriv(GLenum target, GLenum pname, GLint *p
             ValidateGetFramebufferParameteriv(context, target, pname, params))
         {
             context->getFramebufferParameteriv(target, pname, params);
+            ANGLE_CAPTURE(GetFramebufferParameteriv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetMultisamplefv(GLenum pname, GLuint index, GLfloat *val)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat *val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefv, pname, index, val);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -275,6 +325,7 @@ void GL_APIENTRY GetMultisamplefv(GLenum pname, GLuint index, GLfloat *val)
         if (context->skipValidation() || ValidateGetMultisamplefv(context, pname, index, val))
         {
             context->getMultisamplefv(pname, index, val);
+            ANGLE_CAPTURE(GetMultisamplefv, context, pname, index, val);
         }
     }
 }
@@ -284,11 +335,13 @@ void GL_APIENTRY GetProgramInterfaceiv(GLuint program,
                                        GLenum pname,
                                        GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInterfaceiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLint *params "
         "= 0x%016" PRIxPTR ")",
         program, programInterface, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramInterfaceiv, program, programInterface, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -297,6 +350,7 @@ void GL_APIENTRY GetProgramInterfaceiv(GLuint program,
             ValidateGetProgramInterfaceiv(context, program, programInterface, pname, params))
         {
             context->getProgramInterfaceiv(program, programInterface, pname, params);
+            ANGLE_CAPTURE(GetProgramInterfaceiv, context, program, programInterface, pname, params);
         }
     }
 }
@@ -306,10 +360,12 @@ void GL_APIENTRY GetProgramPipelineInfoLog(GLuint pipeline,
                                            GLsizei *length,
                                            GLchar *infoLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramPipelineInfoLog);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           pipeline, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramPipelineInfoLog, pipeline, bufSize, length, infoLog);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -318,15 +374,18 @@ void GL_APIENTRY GetProgramPipelineInfoLog(GLuint pipeline,
             ValidateGetProgramPipelineInfoLog(context, pipeline, bufSize, length, infoLog))
         {
             context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
+            ANGLE_CAPTURE(GetProgramPipelineInfoLog, context, pipeline, bufSize, length, infoLog);
         }
     }
 }
 
 void GL_APIENTRY GetProgramPipelineiv(GLuint pipeline, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramPipelineiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           pipeline, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramPipelineiv, pipeline, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -335,6 +394,7 @@ void GL_APIENTRY GetProgramPipelineiv(GLuint pipeline, GLenum pname, GLint *para
             ValidateGetProgramPipelineiv(context, pipeline, pname, params))
         {
             context->getProgramPipelineiv(pipeline, pname, params);
+            ANGLE_CAPTURE(GetProgramPipelineiv, context, pipeline, pname, params);
         }
     }
 }
@@ -343,11 +403,13 @@ GLuint GL_APIENTRY GetProgramResourceIndex(GLuint program,
                                            GLenum programInterface,
                                            const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceIndex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceIndex, program, programInterface, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -355,7 +417,10 @@ GLuint GL_APIENTRY GetProgramResourceIndex(GLuint program,
         if (context->skipValidation() ||
             ValidateGetProgramResourceIndex(context, program, programInterface, name))
         {
-            return context->getProgramResourceIndex(program, programInterface, name);
+            GLuint returnValue = context->getProgramResourceIndex(program, programInterface, name);
+            ANGLE_CAPTURE(GetProgramResourceIndex, context, program, programInterface, name,
+                          returnValue);
+            return returnValue;
         }
     }
 
@@ -366,11 +431,13 @@ GLint GL_APIENTRY GetProgramResourceLocation(GLuint program,
                                              GLenum programInterface,
                                              const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceLocation, program, programInterface, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -378,7 +445,11 @@ GLint GL_APIENTRY GetProgramResourceLocation(GLuint program,
         if (context->skipValidation() ||
             ValidateGetProgramResourceLocation(context, program, programInterface, name))
         {
-            return context->getProgramResourceLocation(program, programInterface, name);
+            GLint returnValue =
+                context->getProgramResourceLocation(program, programInterface, name);
+            ANGLE_CAPTURE(GetProgramResourceLocation, context, program, programInterface, name,
+                          returnValue);
+            return returnValue;
         }
     }
 
@@ -392,11 +463,14 @@ void GL_APIENTRY GetProgramResourceName(GLuint program,
                                         GLsizei *length,
                                         GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceName);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLuint index = %u, GLsizei bufSize "
         "= %d, GLsizei *length = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
         program, programInterface, index, bufSize, (uintptr_t)length, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceName, program, programInterface, index,
+                       bufSize, length, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -407,6 +481,8 @@ void GL_APIENTRY GetProgramResourceName(GLuint program,
         {
             context->getProgramResourceName(program, programInterface, index, bufSize, length,
                                             name);
+            ANGLE_CAPTURE(GetProgramResourceName, context, program, programInterface, index,
+                          bufSize, length, name);
         }
     }
 }
@@ -420,6 +496,7 @@ void GL_APIENTRY GetProgramResourceiv(GLuint program,
                                       GLsizei *length,
                                       GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLuint index = %u, GLsizei "
@@ -428,6 +505,8 @@ void GL_APIENTRY GetProgramResourceiv(GLuint program,
         ", GLint *params = 0x%016" PRIxPTR ")",
         program, programInterface, index, propCount, (uintptr_t)props, bufSize, (uintptr_t)length,
         (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceiv, program, programInterface, index,
+                       propCount, props, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -438,17 +517,21 @@ void GL_APIENTRY GetProgramResourceiv(GLuint program,
         {
             context->getProgramResourceiv(program, programInterface, index, propCount, props,
                                           bufSize, length, params);
+            ANGLE_CAPTURE(GetProgramResourceiv, context, program, programInterface, index,
+                          propCount, props, bufSize, length, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexLevelParameterfv(GLenum target, GLint level, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfv, target, level, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -458,17 +541,20 @@ void GL_APIENTRY GetTexLevelParameterfv(GLenum target, GLint level, GLenum pname
             ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameterfv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameterfv, context, target, level, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexLevelParameteriv(GLenum target, GLint level, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameteriv, target, level, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -478,21 +564,26 @@ void GL_APIENTRY GetTexLevelParameteriv(GLenum target, GLint level, GLenum pname
             ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameteriv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameteriv, context, target, level, pname, params);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsProgramPipeline(GLuint pipeline)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsProgramPipeline);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_TRACE(EntryPoint::IsProgramPipeline, pipeline);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsProgramPipeline(context, pipeline))
         {
-            return context->isProgramPipeline(pipeline);
+            GLboolean returnValue = context->isProgramPipeline(pipeline);
+            ANGLE_CAPTURE(IsProgramPipeline, context, pipeline, returnValue);
+            return returnValue;
         }
     }
 
@@ -501,8 +592,10 @@ GLboolean GL_APIENTRY IsProgramPipeline(GLuint pipeline)
 
 void GL_APIENTRY MemoryBarrier(GLbitfield barriers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryBarrier);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_TRACE(EntryPoint::MemoryBarrier, barriers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -510,14 +603,17 @@ void GL_APIENTRY MemoryBarrier(GLbitfield barriers)
         if (context->skipValidation() || ValidateMemoryBarrier(context, barriers))
         {
             context->memoryBarrier(barriers);
+            ANGLE_CAPTURE(MemoryBarrier, context, barriers);
         }
     }
 }
 
 void GL_APIENTRY MemoryBarrierByRegion(GLbitfield barriers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryBarrierByRegion);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_TRACE(EntryPoint::MemoryBarrierByRegion, barriers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -525,14 +621,17 @@ void GL_APIENTRY MemoryBarrierByRegion(GLbitfield barriers)
         if (context->skipValidation() || ValidateMemoryBarrierByRegion(context, barriers))
         {
             context->memoryBarrierByRegion(barriers);
+            ANGLE_CAPTURE(MemoryBarrierByRegion, context, barriers);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform1f(GLuint program, GLint location, GLfloat v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f)", program, location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1f, program, location, v0);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -540,6 +639,7 @@ void GL_APIENTRY ProgramUniform1f(GLuint program, GLint location, GLfloat v0)
         if (context->skipValidation() || ValidateProgramUniform1f(context, program, location, v0))
         {
             context->programUniform1f(program, location, v0);
+            ANGLE_CAPTURE(ProgramUniform1f, context, program, location, v0);
         }
     }
 }
@@ -549,11 +649,13 @@ void GL_APIENTRY ProgramUniform1fv(GLuint program,
                                    GLsizei count,
                                    const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1fv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -562,14 +664,17 @@ void GL_APIENTRY ProgramUniform1fv(GLuint program,
             ValidateProgramUniform1fv(context, program, location, count, value))
         {
             context->programUniform1fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform1fv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform1i(GLuint program, GLint location, GLint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d)", program, location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1i, program, location, v0);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -577,6 +682,7 @@ void GL_APIENTRY ProgramUniform1i(GLuint program, GLint location, GLint v0)
         if (context->skipValidation() || ValidateProgramUniform1i(context, program, location, v0))
         {
             context->programUniform1i(program, location, v0);
+            ANGLE_CAPTURE(ProgramUniform1i, context, program, location, v0);
         }
     }
 }
@@ -586,11 +692,13 @@ void GL_APIENTRY ProgramUniform1iv(GLuint program,
                                    GLsizei count,
                                    const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1iv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -599,14 +707,17 @@ void GL_APIENTRY ProgramUniform1iv(GLuint program,
             ValidateProgramUniform1iv(context, program, location, count, value))
         {
             context->programUniform1iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform1iv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform1ui(GLuint program, GLint location, GLuint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u)", program, location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1ui, program, location, v0);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -614,6 +725,7 @@ void GL_APIENTRY ProgramUniform1ui(GLuint program, GLint location, GLuint v0)
         if (context->skipValidation() || ValidateProgramUniform1ui(context, program, location, v0))
         {
             context->programUniform1ui(program, location, v0);
+            ANGLE_CAPTURE(ProgramUniform1ui, context, program, location, v0);
         }
     }
 }
@@ -623,11 +735,13 @@ void GL_APIENTRY ProgramUniform1uiv(GLuint program,
                                     GLsizei count,
                                     const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1uiv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -636,15 +750,18 @@ void GL_APIENTRY ProgramUniform1uiv(GLuint program,
             ValidateProgramUniform1uiv(context, program, location, count, value))
         {
             context->programUniform1uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform1uiv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform2f(GLuint program, GLint location, GLfloat v0, GLfloat v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", program,
           location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2f, program, location, v0, v1);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -653,6 +770,7 @@ void GL_APIENTRY ProgramUniform2f(GLuint program, GLint location, GLfloat v0, GL
             ValidateProgramUniform2f(context, program, location, v0, v1))
         {
             context->programUniform2f(program, location, v0, v1);
+            ANGLE_CAPTURE(ProgramUniform2f, context, program, location, v0, v1);
         }
     }
 }
@@ -662,11 +780,13 @@ void GL_APIENTRY ProgramUniform2fv(GLuint program,
                                    GLsizei count,
                                    const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2fv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -675,15 +795,18 @@ void GL_APIENTRY ProgramUniform2fv(GLuint program,
             ValidateProgramUniform2fv(context, program, location, count, value))
         {
             context->programUniform2fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform2fv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform2i(GLuint program, GLint location, GLint v0, GLint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d)", program,
           location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2i, program, location, v0, v1);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -692,6 +815,7 @@ void GL_APIENTRY ProgramUniform2i(GLuint program, GLint location, GLint v0, GLin
             ValidateProgramUniform2i(context, program, location, v0, v1))
         {
             context->programUniform2i(program, location, v0, v1);
+            ANGLE_CAPTURE(ProgramUniform2i, context, program, location, v0, v1);
         }
     }
 }
@@ -701,11 +825,13 @@ void GL_APIENTRY ProgramUniform2iv(GLuint program,
                                    GLsizei count,
                                    const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2iv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -714,15 +840,18 @@ void GL_APIENTRY ProgramUniform2iv(GLuint program,
             ValidateProgramUniform2iv(context, program, location, count, value))
         {
             context->programUniform2iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform2iv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform2ui(GLuint program, GLint location, GLuint v0, GLuint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", program,
           location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2ui, program, location, v0, v1);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -731,6 +860,7 @@ void GL_APIENTRY ProgramUniform2ui(GLuint program, GLint location, GLuint v0, GL
             ValidateProgramUniform2ui(context, program, location, v0, v1))
         {
             context->programUniform2ui(program, location, v0, v1);
+            ANGLE_CAPTURE(ProgramUniform2ui, context, program, location, v0, v1);
         }
     }
 }
@@ -740,11 +870,13 @@ void GL_APIENTRY ProgramUniform2uiv(GLuint program,
                                     GLsizei count,
                                     const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2uiv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -753,6 +885,7 @@ void GL_APIENTRY ProgramUniform2uiv(GLuint program,
             ValidateProgramUniform2uiv(context, program, location, count, value))
         {
             context->programUniform2uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform2uiv, context, program, location, count, value);
         }
     }
 }
@@ -760,11 +893,13 @@ void GL_APIENTRY ProgramUniform2uiv(GLuint program,
 void GL_APIENTRY
 ProgramUniform3f(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3f, program, location, v0, v1, v2);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -773,6 +908,7 @@ ProgramUniform3f(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat
             ValidateProgramUniform3f(context, program, location, v0, v1, v2))
         {
             context->programUniform3f(program, location, v0, v1, v2);
+            ANGLE_CAPTURE(ProgramUniform3f, context, program, location, v0, v1, v2);
         }
     }
 }
@@ -782,11 +918,13 @@ void GL_APIENTRY ProgramUniform3fv(GLuint program,
                                    GLsizei count,
                                    const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3fv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -795,15 +933,18 @@ void GL_APIENTRY ProgramUniform3fv(GLuint program,
             ValidateProgramUniform3fv(context, program, location, count, value))
         {
             context->programUniform3fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform3fv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform3i(GLuint program, GLint location, GLint v0, GLint v1, GLint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)",
           program, location, v0, v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3i, program, location, v0, v1, v2);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -812,6 +953,7 @@ void GL_APIENTRY ProgramUniform3i(GLuint program, GLint location, GLint v0, GLin
             ValidateProgramUniform3i(context, program, location, v0, v1, v2))
         {
             context->programUniform3i(program, location, v0, v1, v2);
+            ANGLE_CAPTURE(ProgramUniform3i, context, program, location, v0, v1, v2);
         }
     }
 }
@@ -821,11 +963,13 @@ void GL_APIENTRY ProgramUniform3iv(GLuint program,
                                    GLsizei count,
                                    const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3iv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -834,17 +978,20 @@ void GL_APIENTRY ProgramUniform3iv(GLuint program,
             ValidateProgramUniform3iv(context, program, location, count, value))
         {
             context->programUniform3iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform3iv, context, program, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY ProgramUniform3ui(GLuint program, GLint location, GLuint v0, GLuint v1, GLuint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3ui, program, location, v0, v1, v2);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -853,6 +1000,7 @@ void GL_APIENTRY ProgramUniform3ui(GLuint program, GLint location, GLuint v0, GL
             ValidateProgramUniform3ui(context, program, location, v0, v1, v2))
         {
             context->programUniform3ui(program, location, v0, v1, v2);
+            ANGLE_CAPTURE(ProgramUniform3ui, context, program, location, v0, v1, v2);
         }
     }
 }
@@ -862,11 +1010,13 @@ void GL_APIENTRY ProgramUniform3uiv(GLuint program,
                                     GLsizei count,
                                     const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3uiv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -875,6 +1025,7 @@ void GL_APIENTRY ProgramUniform3uiv(GLuint program,
             ValidateProgramUniform3uiv(context, program, location, count, value))
         {
             context->programUniform3uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform3uiv, context, program, location, count, value);
         }
     }
 }
@@ -882,11 +1033,13 @@ void GL_APIENTRY ProgramUniform3uiv(GLuint program,
 void GL_APIENTRY
 ProgramUniform4f(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat v2, GLfloat v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f, GLfloat v3 = %f)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4f, program, location, v0, v1, v2, v3);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -895,6 +1048,7 @@ ProgramUniform4f(GLuint program, GLint location, GLfloat v0, GLfloat v1, GLfloat
             ValidateProgramUniform4f(context, program, location, v0, v1, v2, v3))
         {
             context->programUniform4f(program, location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
         }
     }
 }
@@ -904,11 +1058,13 @@ void GL_APIENTRY ProgramUniform4fv(GLuint program,
                                    GLsizei count,
                                    const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4fv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -917,6 +1073,7 @@ void GL_APIENTRY ProgramUniform4fv(GLuint program,
             ValidateProgramUniform4fv(context, program, location, count, value))
         {
             context->programUniform4fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform4fv, context, program, location, count, value);
         }
     }
 }
@@ -924,11 +1081,13 @@ void GL_APIENTRY ProgramUniform4fv(GLuint program,
 void GL_APIENTRY
 ProgramUniform4i(GLuint program, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, "
         "GLint v3 = %d)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4i, program, location, v0, v1, v2, v3);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -937,6 +1096,7 @@ ProgramUniform4i(GLuint program, GLint location, GLint v0, GLint v1, GLint v2, G
             ValidateProgramUniform4i(context, program, location, v0, v1, v2, v3))
         {
             context->programUniform4i(program, location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
         }
     }
 }
@@ -946,11 +1106,13 @@ void GL_APIENTRY ProgramUniform4iv(GLuint program,
                                    GLsizei count,
                                    const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4iv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -959,6 +1121,7 @@ void GL_APIENTRY ProgramUniform4iv(GLuint program,
             ValidateProgramUniform4iv(context, program, location, count, value))
         {
             context->programUniform4iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform4iv, context, program, location, count, value);
         }
     }
 }
@@ -966,11 +1129,13 @@ void GL_APIENTRY ProgramUniform4iv(GLuint program,
 void GL_APIENTRY
 ProgramUniform4ui(GLuint program, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u, GLuint v3 = %u)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4ui, program, location, v0, v1, v2, v3);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -979,6 +1144,7 @@ ProgramUniform4ui(GLuint program, GLint location, GLuint v0, GLuint v1, GLuint v
             ValidateProgramUniform4ui(context, program, location, v0, v1, v2, v3))
         {
             context->programUniform4ui(program, location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
         }
     }
 }
@@ -988,11 +1154,13 @@ void GL_APIENTRY ProgramUniform4uiv(GLuint program,
                                     GLsizei count,
                                     const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4uiv, program, location, count, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1001,6 +1169,7 @@ void GL_APIENTRY ProgramUniform4uiv(GLuint program,
             ValidateProgramUniform4uiv(context, program, location, count, value))
         {
             context->programUniform4uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform4uiv, context, program, location, count, value);
         }
     }
 }
@@ -1011,11 +1180,14 @@ void GL_APIENTRY ProgramUniformMatrix2fv(GLuint program,
                                          GLboolean transpose,
                                          const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1024,6 +1196,8 @@ void GL_APIENTRY ProgramUniformMatrix2fv(GLuint program,
             ValidateProgramUniformMatrix2fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix2fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1034,11 +1208,14 @@ void GL_APIENTRY ProgramUniformMatrix2x3fv(GLuint program,
                                            GLboolean transpose,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2x3fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1047,6 +1224,8 @@ void GL_APIENTRY ProgramUniformMatrix2x3fv(GLuint program,
             ValidateProgramUniformMatrix2x3fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix2x3fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix2x3fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1057,11 +1236,14 @@ void GL_APIENTRY ProgramUniformMatrix2x4fv(GLuint program,
                                            GLboolean transpose,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2x4fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1070,6 +1252,8 @@ void GL_APIENTRY ProgramUniformMatrix2x4fv(GLuint program,
             ValidateProgramUniformMatrix2x4fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix2x4fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix2x4fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1080,11 +1264,14 @@ void GL_APIENTRY ProgramUniformMatrix3fv(GLuint program,
                                          GLboolean transpose,
                                          const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1093,6 +1280,8 @@ void GL_APIENTRY ProgramUniformMatrix3fv(GLuint program,
             ValidateProgramUniformMatrix3fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix3fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1103,11 +1292,14 @@ void GL_APIENTRY ProgramUniformMatrix3x2fv(GLuint program,
                                            GLboolean transpose,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3x2fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1116,6 +1308,8 @@ void GL_APIENTRY ProgramUniformMatrix3x2fv(GLuint program,
             ValidateProgramUniformMatrix3x2fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix3x2fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix3x2fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1126,11 +1320,14 @@ void GL_APIENTRY ProgramUniformMatrix3x4fv(GLuint program,
                                            GLboolean transpose,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3x4fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1139,6 +1336,8 @@ void GL_APIENTRY ProgramUniformMatrix3x4fv(GLuint program,
             ValidateProgramUniformMatrix3x4fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix3x4fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix3x4fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1149,11 +1348,14 @@ void GL_APIENTRY ProgramUniformMatrix4fv(GLuint program,
                                          GLboolean transpose,
                                          const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1162,6 +1364,8 @@ void GL_APIENTRY ProgramUniformMatrix4fv(GLuint program,
             ValidateProgramUniformMatrix4fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix4fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1172,11 +1376,14 @@ void GL_APIENTRY ProgramUniformMatrix4x2fv(GLuint program,
                                            GLboolean transpose,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4x2fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1185,6 +1392,8 @@ void GL_APIENTRY ProgramUniformMatrix4x2fv(GLuint program,
             ValidateProgramUniformMatrix4x2fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix4x2fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix4x2fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -1195,11 +1404,14 @@ void GL_APIENTRY ProgramUniformMatrix4x3fv(GLuint program,
                                            GLboolean transpose,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4x3fv, program, location, count, transpose,
+                       value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1208,14 +1420,18 @@ void GL_APIENTRY ProgramUniformMatrix4x3fv(GLuint program,
             ValidateProgramUniformMatrix4x3fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix4x3fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix4x3fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
 
 void GL_APIENTRY SampleMaski(GLuint maskNumber, GLbitfield mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleMaski);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleMaski, maskNumber, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1223,6 +1439,7 @@ void GL_APIENTRY SampleMaski(GLuint maskNumber, GLbitfield mask)
         if (context->skipValidation() || ValidateSampleMaski(context, maskNumber, mask))
         {
             context->sampleMaski(maskNumber, mask);
+            ANGLE_CAPTURE(SampleMaski, context, maskNumber, mask);
         }
     }
 }
@@ -1234,11 +1451,14 @@ void GL_APIENTRY TexStorage2DMultisample(GLenum target,
                                          GLsizei height,
                                          GLboolean fixedsamplelocations)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DMultisample);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DMultisample, target, samples, internalformat, width,
+                       height, fixedsamplelocations);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1250,15 +1470,19 @@ void GL_APIENTRY TexStorage2DMultisample(GLenum target,
         {
             context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
                                              fixedsamplelocations);
+            ANGLE_CAPTURE(TexStorage2DMultisample, context, target, samples, internalformat, width,
+                          height, fixedsamplelocations);
         }
     }
 }
 
 void GL_APIENTRY UseProgramStages(GLuint pipeline, GLbitfield stages, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UseProgramStages);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLbitfield stages = 0x%X, GLuint program = %u)", pipeline, stages,
           program);
+    ANGLE_BINARY_TRACE(EntryPoint::UseProgramStages, pipeline, stages, program);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1267,14 +1491,17 @@ void GL_APIENTRY UseProgramStages(GLuint pipeline, GLbitfield stages, GLuint pro
             ValidateUseProgramStages(context, pipeline, stages, program))
         {
             context->useProgramStages(pipeline, stages, program);
+            ANGLE_CAPTURE(UseProgramStages, context, pipeline, stages, program);
         }
     }
 }
 
 void GL_APIENTRY ValidateProgramPipeline(GLuint pipeline)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ValidateProgramPipeline);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_TRACE(EntryPoint::ValidateProgramPipeline, pipeline);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1282,14 +1509,17 @@ void GL_APIENTRY ValidateProgramPipeline(GLuint pipeline)
         if (context->skipValidation() || ValidateValidateProgramPipeline(context, pipeline))
         {
             context->validateProgramPipeline(pipeline);
+            ANGLE_CAPTURE(ValidateProgramPipeline, context, pipeline);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribBinding(GLuint attribindex, GLuint bindingindex)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribBinding);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint attribindex = %u, GLuint bindingindex = %u)", attribindex, bindingindex);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribBinding, attribindex, bindingindex);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1298,6 +1528,7 @@ void GL_APIENTRY VertexAttribBinding(GLuint attribindex, GLuint bindingindex)
             ValidateVertexAttribBinding(context, attribindex, bindingindex))
         {
             context->vertexAttribBinding(attribindex, bindingindex);
+            ANGLE_CAPTURE(VertexAttribBinding, context, attribindex, bindingindex);
         }
     }
 }
@@ -1308,11 +1539,14 @@ void GL_APIENTRY VertexAttribFormat(GLuint attribindex,
                                     GLboolean normalized,
                                     GLuint relativeoffset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribFormat);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLuint relativeoffset = %u)",
         attribindex, size, type, normalized, relativeoffset);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribFormat, attribindex, size, type, normalized,
+                       relativeoffset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1323,6 +1557,8 @@ void GL_APIENTRY VertexAttribFormat(GLuint attribindex,
                                        relativeoffset))
         {
             context->vertexAttribFormat(attribindex, size, typePacked, normalized, relativeoffset);
+            ANGLE_CAPTURE(VertexAttribFormat, context, attribindex, size, type, normalized,
+                          relativeoffset);
         }
     }
 }
@@ -1332,11 +1568,13 @@ void GL_APIENTRY VertexAttribIFormat(GLuint attribindex,
                                      GLenum type,
                                      GLuint relativeoffset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribIFormat);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLuint relativeoffset = "
         "%u)",
         attribindex, size, type, relativeoffset);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribIFormat, attribindex, size, type, relativeoffset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1346,14 +1584,17 @@ void GL_APIENTRY VertexAttribIFormat(GLuint attribindex,
             ValidateVertexAttribIFormat(context, attribindex, size, typePacked, relativeoffset))
         {
             context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
+            ANGLE_CAPTURE(VertexAttribIFormat, context, attribindex, size, type, relativeoffset);
         }
     }
 }
 
 void GL_APIENTRY VertexBindingDivisor(GLuint bindingindex, GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexBindingDivisor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint bindingindex = %u, GLuint divisor = %u)", bindingindex, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexBindingDivisor, bindingindex, divisor);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1362,6 +1603,7 @@ void GL_APIENTRY VertexBindingDivisor(GLuint bindingindex, GLuint divisor)
             ValidateVertexBindingDivisor(context, bindingindex, divisor))
         {
             context->vertexBindingDivisor(bindingindex, divisor);
+            ANGLE_CAPTURE(VertexBindingDivisor, context, bindingindex, divisor);
         }
     }
 }
@@ -0,0 +1,10619 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_gles_batch_autogen.cpp:
+//   Decodes the commands submitted with glBatchCommandsANGLE.
+
+#include "libGLESv2/entry_points_gles_batch_autogen.h"
+
+#include "common/mathutil.h"
+#include "libANGLE/Context.h"
+#include "libANGLE/Context.inl.h"
+#include "libANGLE/ErrorStrings.h"
+#include "libANGLE/validationES1.h"
+#include "libANGLE/validationES2.h"
+#include "libANGLE/validationES3.h"
+#include "libANGLE/validationES31.h"
+#include "libANGLE/validationESEXT.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace gl
+{
+namespace
+{
+// The number of words of each command: the entry point followed by one word per parameter. The
+// entry points that can't be batched have no size.
+constexpr uint8_t kBatchCommandSizes[] = {
+    0,   // Invalid
+    3,   // ActiveShaderProgram
+    2,   // ActiveTexture
+    3,   // AlphaFunc
+    3,   // AlphaFuncx
+    3,   // AttachShader
+    0,   // BatchCommandsANGLE
+    3,   // BeginQuery
+    3,   // BeginQueryEXT
+    2,   // BeginTransformFeedback
+    4,   // BindAttribLocation
+    3,   // BindBuffer
+    4,   // BindBufferBase
+    6,   // BindBufferRange
+    4,   // BindFragDataLocationEXT
+    5,   // BindFragDataLocationIndexedEXT
+    4,   // BindFragmentInputLocationCHROMIUM
+    3,   // BindFramebuffer
+    3,   // BindFramebufferOES
+    8,   // BindImageTexture
+    2,   // BindProgramPipeline
+    3,   // BindRenderbuffer
+    3,   // BindRenderbufferOES
+    3,   // BindSampler
+    3,   // BindTexture
+    3,   // BindTransformFeedback
+    4,   // BindUniformLocationCHROMIUM
+    2,   // BindVertexArray
+    2,   // BindVertexArrayOES
+    5,   // BindVertexBuffer
+    5,   // BlendColor
+    2,   // BlendEquation
+    3,   // BlendEquationSeparate
+    3,   // BlendFunc
+    5,   // BlendFuncSeparate
+    11,  // BlitFramebuffer
+    11,  // BlitFramebufferANGLE
+    5,   // BufferData
+    5,   // BufferStorageMemEXT
+    5,   // BufferSubData
+    0,   // CheckFramebufferStatus
+    0,   // CheckFramebufferStatusOES
+    2,   // Clear
+    5,   // ClearBufferfi
+    4,   // ClearBufferfv
+    4,   // ClearBufferiv
+    4,   // ClearBufferuiv
+    5,   // ClearColor
+    5,   // ClearColorx
+    2,   // ClearDepthf
+    2,   // ClearDepthx
+    2,   // ClearStencil
+    2,   // ClientActiveTexture
+    0,   // ClientWaitSync
+    3,   // ClipPlanef
+    3,   // ClipPlanex
+    5,   // Color4f
+    5,   // Color4ub
+    5,   // Color4x
+    5,   // ColorMask
+    5,   // ColorPointer
+    2,   // CompileShader
+    3,   // CompressedCopyTextureCHROMIUM
+    9,   // CompressedTexImage2D
+    10,  // CompressedTexImage2DRobustANGLE
+    10,  // CompressedTexImage3D
+    11,  // CompressedTexImage3DRobustANGLE
+    10,  // CompressedTexSubImage2D
+    11,  // CompressedTexSubImage2DRobustANGLE
+    12,  // CompressedTexSubImage3D
+    13,  // CompressedTexSubImage3DRobustANGLE
+    6,   // CopyBufferSubData
+    18,  // CopySubTexture3DANGLE
+    15,  // CopySubTextureCHROMIUM
+    9,   // CopyTexImage2D
+    9,   // CopyTexSubImage2D
+    10,  // CopyTexSubImage3D
+    11,  // CopyTexture3DANGLE
+    11,  // CopyTextureCHROMIUM
+    3,   // CoverFillPathCHROMIUM
+    8,   // CoverFillPathInstancedCHROMIUM
+    3,   // CoverStrokePathCHROMIUM
+    8,   // CoverStrokePathInstancedCHROMIUM
+    2,   // CoverageModulationCHROMIUM
+    3,   // CreateMemoryObjectsEXT
+    0,   // CreateProgram
+    0,   // CreateShader
+    0,   // CreateShaderProgramv
+    2,   // CullFace
+    2,   // CurrentPaletteMatrixOES
+    3,   // DebugMessageCallbackKHR
+    7,   // DebugMessageControlKHR
+    7,   // DebugMessageInsertKHR
+    3,   // DeleteBuffers
+    3,   // DeleteFencesNV
+    3,   // DeleteFramebuffers
+    3,   // DeleteFramebuffersOES
+    3,   // DeleteMemoryObjectsEXT
+    3,   // DeletePathsCHROMIUM
+    2,   // DeleteProgram
+    3,   // DeleteProgramPipelines
+    3,   // DeleteQueries
+    3,   // DeleteQueriesEXT
+    3,   // DeleteRenderbuffers
+    3,   // DeleteRenderbuffersOES
+    3,   // DeleteSamplers
+    3,   // DeleteSemaphoresEXT
+    2,   // DeleteShader
+    2,   // DeleteSync
+    3,   // DeleteTextures
+    3,   // DeleteTransformFeedbacks
+    3,   // DeleteVertexArrays
+    3,   // DeleteVertexArraysOES
+    2,   // DepthFunc
+    2,   // DepthMask
+    3,   // DepthRangef
+    3,   // DepthRangex
+    3,   // DetachShader
+    2,   // Disable
+    2,   // DisableClientState
+    2,   // DisableVertexAttribArray
+    4,   // DiscardFramebufferEXT
+    4,   // DispatchCompute
+    2,   // DispatchComputeIndirect
+    4,   // DrawArrays
+    3,   // DrawArraysIndirect
+    5,   // DrawArraysInstanced
+    5,   // DrawArraysInstancedANGLE
+    5,   // DrawArraysInstancedEXT
+    3,   // DrawBuffers
+    3,   // DrawBuffersEXT
+    5,   // DrawElements
+    4,   // DrawElementsIndirect
+    6,   // DrawElementsInstanced
+    6,   // DrawElementsInstancedANGLE
+    6,   // DrawElementsInstancedEXT
+    7,   // DrawRangeElements
+    6,   // DrawTexfOES
+    2,   // DrawTexfvOES
+    6,   // DrawTexiOES
+    2,   // DrawTexivOES
+    6,   // DrawTexsOES
+    2,   // DrawTexsvOES
+    6,   // DrawTexxOES
+    2,   // DrawTexxvOES
+    3,   // EGLImageTargetRenderbufferStorageOES
+    3,   // EGLImageTargetTexture2DOES
+    2,   // Enable
+    2,   // EnableClientState
+    2,   // EnableVertexAttribArray
+    2,   // EndQuery
+    2,   // EndQueryEXT
+    1,   // EndTransformFeedback
+    0,   // FenceSync
+    1,   // Finish
+    2,   // FinishFenceNV
+    1,   // Flush
+    4,   // FlushMappedBufferRange
+    4,   // FlushMappedBufferRangeEXT
+    3,   // Fogf
+    3,   // Fogfv
+    3,   // Fogx
+    3,   // Fogxv
+    4,   // FramebufferParameteri
+    5,   // FramebufferRenderbuffer
+    5,   // FramebufferRenderbufferOES
+    6,   // FramebufferTexture2D
+    6,   // FramebufferTexture2DOES
+    5,   // FramebufferTextureEXT
+    6,   // FramebufferTextureLayer
+    7,   // FramebufferTextureMultiviewOVR
+    2,   // FrontFace
+    7,   // Frustumf
+    7,   // Frustumx
+    3,   // GenBuffers
+    3,   // GenFencesNV
+    3,   // GenFramebuffers
+    3,   // GenFramebuffersOES
+    0,   // GenPathsCHROMIUM
+    3,   // GenProgramPipelines
+    3,   // GenQueries
+    3,   // GenQueriesEXT
+    3,   // GenRenderbuffers
+    3,   // GenRenderbuffersOES
+    3,   // GenSamplers
+    3,   // GenSemaphoresEXT
+    3,   // GenTextures
+    3,   // GenTransformFeedbacks
+    3,   // GenVertexArrays
+    3,   // GenVertexArraysOES
+    2,   // GenerateMipmap
+    2,   // GenerateMipmapOES
+    8,   // GetActiveAttrib
+    8,   // GetActiveUniform
+    6,   // GetActiveUniformBlockName
+    5,   // GetActiveUniformBlockiv
+    7,   // GetActiveUniformBlockivRobustANGLE
+    6,   // GetActiveUniformsiv
+    5,   // GetAttachedShaders
+    0,   // GetAttribLocation
+    4,   // GetBooleani_v
+    6,   // GetBooleani_vRobustANGLE
+    3,   // GetBooleanv
+    5,   // GetBooleanvRobustANGLE
+    4,   // GetBufferParameteri64v
+    6,   // GetBufferParameteri64vRobustANGLE
+    4,   // GetBufferParameteriv
+    6,   // GetBufferParameterivRobustANGLE
+    4,   // GetBufferPointerv
+    4,   // GetBufferPointervOES
+    6,   // GetBufferPointervRobustANGLE
+    3,   // GetClipPlanef
+    3,   // GetClipPlanex
+    0,   // GetDebugMessageLogKHR
+    0,   // GetError
+    4,   // GetFenceivNV
+    3,   // GetFixedv
+    3,   // GetFloatv
+    5,   // GetFloatvRobustANGLE
+    0,   // GetFragDataIndexEXT
+    0,   // GetFragDataLocation
+    5,   // GetFramebufferAttachmentParameteriv
+    5,   // GetFramebufferAttachmentParameterivOES
+    7,   // GetFramebufferAttachmentParameterivRobustANGLE
+    4,   // GetFramebufferParameteriv
+    6,   // GetFramebufferParameterivRobustANGLE
+    0,   // GetGraphicsResetStatusEXT
+    4,   // GetInteger64i_v
+    6,   // GetInteger64i_vRobustANGLE
+    3,   // GetInteger64v
+    5,   // GetInteger64vRobustANGLE
+    4,   // GetIntegeri_v
+    6,   // GetIntegeri_vRobustANGLE
+    3,   // GetIntegerv
+    5,   // GetIntegervRobustANGLE
+    6,   // GetInternalformativ
+    7,   // GetInternalformativRobustANGLE
+    4,   // GetLightfv
+    4,   // GetLightxv
+    4,   // GetMaterialfv
+    4,   // GetMaterialxv
+    4,   // GetMemoryObjectParameterivEXT
+    4,   // GetMultisamplefv
+    4,   // GetMultisamplefvANGLE
+    6,   // GetMultisamplefvRobustANGLE
+    6,   // GetObjectLabelKHR
+    5,   // GetObjectPtrLabelKHR
+    4,   // GetPathParameterfvCHROMIUM
+    4,   // GetPathParameterivCHROMIUM
+    3,   // GetPointerv
+    3,   // GetPointervKHR
+    5,   // GetPointervRobustANGLERobustANGLE
+    6,   // GetProgramBinary
+    6,   // GetProgramBinaryOES
+    5,   // GetProgramInfoLog
+    5,   // GetProgramInterfaceiv
+    7,   // GetProgramInterfaceivRobustANGLE
+    5,   // GetProgramPipelineInfoLog
+    4,   // GetProgramPipelineiv
+    0,   // GetProgramResourceIndex
+    0,   // GetProgramResourceLocation
+    0,   // GetProgramResourceLocationIndexEXT
+    7,   // GetProgramResourceName
+    9,   // GetProgramResourceiv
+    4,   // GetProgramiv
+    6,   // GetProgramivRobustANGLE
+    4,   // GetQueryObjecti64vEXT
+    6,   // GetQueryObjecti64vRobustANGLE
+    4,   // GetQueryObjectivEXT
+    6,   // GetQueryObjectivRobustANGLE
+    4,   // GetQueryObjectui64vEXT
+    6,   // GetQueryObjectui64vRobustANGLE
+    4,   // GetQueryObjectuiv
+    4,   // GetQueryObjectuivEXT
+    6,   // GetQueryObjectuivRobustANGLE
+    4,   // GetQueryiv
+    4,   // GetQueryivEXT
+    6,   // GetQueryivRobustANGLE
+    4,   // GetRenderbufferParameteriv
+    4,   // GetRenderbufferParameterivOES
+    6,   // GetRenderbufferParameterivRobustANGLE
+    4,   // GetSamplerParameterIivOES
+    6,   // GetSamplerParameterIivRobustANGLE
+    4,   // GetSamplerParameterIuivOES
+    6,   // GetSamplerParameterIuivRobustANGLE
+    4,   // GetSamplerParameterfv
+    6,   // GetSamplerParameterfvRobustANGLE
+    4,   // GetSamplerParameteriv
+    6,   // GetSamplerParameterivRobustANGLE
+    4,   // GetSemaphoreParameterui64vEXT
+    5,   // GetShaderInfoLog
+    5,   // GetShaderPrecisionFormat
+    5,   // GetShaderSource
+    4,   // GetShaderiv
+    6,   // GetShaderivRobustANGLE
+    0,   // GetString
+    0,   // GetStringi
+    6,   // GetSynciv
+    4,   // GetTexEnvfv
+    4,   // GetTexEnviv
+    4,   // GetTexEnvxv
+    4,   // GetTexGenfvOES
+    4,   // GetTexGenivOES
+    4,   // GetTexGenxvOES
+    5,   // GetTexLevelParameterfv
+    5,   // GetTexLevelParameterfvANGLE
+    7,   // GetTexLevelParameterfvRobustANGLE
+    5,   // GetTexLevelParameteriv
+    5,   // GetTexLevelParameterivANGLE
+    7,   // GetTexLevelParameterivRobustANGLE
+    4,   // GetTexParameterIivOES
+    6,   // GetTexParameterIivRobustANGLE
+    4,   // GetTexParameterIuivOES
+    6,   // GetTexParameterIuivRobustANGLE
+    4,   // GetTexParameterfv
+    6,   // GetTexParameterfvRobustANGLE
+    4,   // GetTexParameteriv
+    6,   // GetTexParameterivRobustANGLE
+    4,   // GetTexParameterxv
+    8,   // GetTransformFeedbackVarying
+    5,   // GetTranslatedShaderSourceANGLE
+    0,   // GetUniformBlockIndex
+    5,   // GetUniformIndices
+    0,   // GetUniformLocation
+    4,   // GetUniformfv
+    6,   // GetUniformfvRobustANGLE
+    4,   // GetUniformiv
+    6,   // GetUniformivRobustANGLE
+    4,   // GetUniformuiv
+    6,   // GetUniformuivRobustANGLE
+    4,   // GetUnsignedBytei_vEXT
+    3,   // GetUnsignedBytevEXT
+    4,   // GetVertexAttribIiv
+    6,   // GetVertexAttribIivRobustANGLE
+    4,   // GetVertexAttribIuiv
+    6,   // GetVertexAttribIuivRobustANGLE
+    4,   // GetVertexAttribPointerv
+    6,   // GetVertexAttribPointervRobustANGLE
+    4,   // GetVertexAttribfv
+    6,   // GetVertexAttribfvRobustANGLE
+    4,   // GetVertexAttribiv
+    6,   // GetVertexAttribivRobustANGLE
+    5,   // GetnUniformfvEXT
+    6,   // GetnUniformfvRobustANGLE
+    5,   // GetnUniformivEXT
+    6,   // GetnUniformivRobustANGLE
+    6,   // GetnUniformuivRobustANGLE
+    3,   // Hint
+    5,   // ImportMemoryFdEXT
+    4,   // ImportSemaphoreFdEXT
+    3,   // InsertEventMarkerEXT
+    4,   // InvalidateFramebuffer
+    8,   // InvalidateSubFramebuffer
+    0,   // IsBuffer
+    0,   // IsEnabled
+    0,   // IsFenceNV
+    0,   // IsFramebuffer
+    0,   // IsFramebufferOES
+    0,   // IsMemoryObjectEXT
+    0,   // IsPathCHROMIUM
+    0,   // IsProgram
+    0,   // IsProgramPipeline
+    0,   // IsQuery
+    0,   // IsQueryEXT
+    0,   // IsRenderbuffer
+    0,   // IsRenderbufferOES
+    0,   // IsSampler
+    0,   // IsSemaphoreEXT
+    0,   // IsShader
+    0,   // IsSync
+    0,   // IsTexture
+    0,   // IsTransformFeedback
+    0,   // IsVertexArray
+    0,   // IsVertexArrayOES
+    3,   // LightModelf
+    3,   // LightModelfv
+    3,   // LightModelx
+    3,   // LightModelxv
+    4,   // Lightf
+    4,   // Lightfv
+    4,   // Lightx
+    4,   // Lightxv
+    2,   // LineWidth
+    2,   // LineWidthx
+    2,   // LinkProgram
+    1,   // LoadIdentity
+    2,   // LoadMatrixf
+    2,   // LoadMatrixx
+    1,   // LoadPaletteFromModelViewMatrixOES
+    2,   // LogicOp
+    3,   // LoseContextCHROMIUM
+    0,   // MapBufferOES
+    0,   // MapBufferRange
+    0,   // MapBufferRangeEXT
+    4,   // Materialf
+    4,   // Materialfv
+    4,   // Materialx
+    4,   // Materialxv
+    5,   // MatrixIndexPointerOES
+    2,   // MatrixLoadIdentityCHROMIUM
+    3,   // MatrixLoadfCHROMIUM
+    2,   // MatrixMode
+    2,   // MaxShaderCompilerThreadsKHR
+    2,   // MemoryBarrier
+    2,   // MemoryBarrierByRegion
+    4,   // MemoryObjectParameterivEXT
+    2,   // MultMatrixf
+    2,   // MultMatrixx
+    5,   // MultiDrawArraysANGLE
+    6,   // MultiDrawArraysInstancedANGLE
+    6,   // MultiDrawElementsANGLE
+    7,   // MultiDrawElementsInstancedANGLE
+    6,   // MultiTexCoord4f
+    6,   // MultiTexCoord4x
+    4,   // Normal3f
+    4,   // Normal3x
+    4,   // NormalPointer
+    5,   // ObjectLabelKHR
+    4,   // ObjectPtrLabelKHR
+    7,   // Orthof
+    7,   // Orthox
+    7,   // PathCommandsCHROMIUM
+    4,   // PathParameterfCHROMIUM
+    4,   // PathParameteriCHROMIUM
+    4,   // PathStencilFuncCHROMIUM
+    1,   // PauseTransformFeedback
+    3,   // PixelStorei
+    3,   // PointParameterf
+    3,   // PointParameterfv
+    3,   // PointParameterx
+    3,   // PointParameterxv
+    2,   // PointSize
+    4,   // PointSizePointerOES
+    2,   // PointSizex
+    3,   // PolygonOffset
+    3,   // PolygonOffsetx
+    1,   // PopDebugGroupKHR
+    1,   // PopGroupMarkerEXT
+    1,   // PopMatrix
+    5,   // ProgramBinary
+    5,   // ProgramBinaryOES
+    4,   // ProgramParameteri
+    6,   // ProgramPathFragmentInputGenCHROMIUM
+    4,   // ProgramUniform1f
+    5,   // ProgramUniform1fv
+    4,   // ProgramUniform1i
+    5,   // ProgramUniform1iv
+    4,   // ProgramUniform1ui
+    5,   // ProgramUniform1uiv
+    5,   // ProgramUniform2f
+    5,   // ProgramUniform2fv
+    5,   // ProgramUniform2i
+    5,   // ProgramUniform2iv
+    5,   // ProgramUniform2ui
+    5,   // ProgramUniform2uiv
+    6,   // ProgramUniform3f
+    5,   // ProgramUniform3fv
+    6,   // ProgramUniform3i
+    5,   // ProgramUniform3iv
+    6,   // ProgramUniform3ui
+    5,   // ProgramUniform3uiv
+    7,   // ProgramUniform4f
+    5,   // ProgramUniform4fv
+    7,   // ProgramUniform4i
+    5,   // ProgramUniform4iv
+    7,   // ProgramUniform4ui
+    5,   // ProgramUniform4uiv
+    6,   // ProgramUniformMatrix2fv
+    6,   // ProgramUniformMatrix2x3fv
+    6,   // ProgramUniformMatrix2x4fv
+    6,   // ProgramUniformMatrix3fv
+    6,   // ProgramUniformMatrix3x2fv
+    6,   // ProgramUniformMatrix3x4fv
+    6,   // ProgramUniformMatrix4fv
+    6,   // ProgramUniformMatrix4x2fv
+    6,   // ProgramUniformMatrix4x3fv
+    2,   // ProvokingVertexANGLE
+    5,   // PushDebugGroupKHR
+    3,   // PushGroupMarkerEXT
+    1,   // PushMatrix
+    3,   // QueryCounterEXT
+    0,   // QueryMatrixxOES
+    2,   // ReadBuffer
+    8,   // ReadPixels
+    12,  // ReadPixelsRobustANGLE
+    9,   // ReadnPixelsEXT
+    12,  // ReadnPixelsRobustANGLE
+    1,   // ReleaseShaderCompiler
+    5,   // RenderbufferStorage
+    6,   // RenderbufferStorageMultisample
+    6,   // RenderbufferStorageMultisampleANGLE
+    5,   // RenderbufferStorageOES
+    2,   // RequestExtensionANGLE
+    1,   // ResumeTransformFeedback
+    5,   // Rotatef
+    5,   // Rotatex
+    3,   // SampleCoverage
+    3,   // SampleCoveragex
+    3,   // SampleMaski
+    3,   // SampleMaskiANGLE
+    4,   // SamplerParameterIivOES
+    5,   // SamplerParameterIivRobustANGLE
+    4,   // SamplerParameterIuivOES
+    5,   // SamplerParameterIuivRobustANGLE
+    4,   // SamplerParameterf
+    4,   // SamplerParameterfv
+    5,   // SamplerParameterfvRobustANGLE
+    4,   // SamplerParameteri
+    4,   // SamplerParameteriv
+    5,   // SamplerParameterivRobustANGLE
+    4,   // Scalef
+    4,   // Scalex
+    5,   // Scissor
+    4,   // SemaphoreParameterui64vEXT
+    3,   // SetFenceNV
+    2,   // ShadeModel
+    6,   // ShaderBinary
+    5,   // ShaderSource
+    7,   // SignalSemaphoreEXT
+    4,   // StencilFillPathCHROMIUM
+    9,   // StencilFillPathInstancedCHROMIUM
+    4,   // StencilFunc
+    5,   // StencilFuncSeparate
+    2,   // StencilMask
+    3,   // StencilMaskSeparate
+    4,   // StencilOp
+    5,   // StencilOpSeparate
+    4,   // StencilStrokePathCHROMIUM
+    9,   // StencilStrokePathInstancedCHROMIUM
+    5,   // StencilThenCoverFillPathCHROMIUM
+    10,  // StencilThenCoverFillPathInstancedCHROMIUM
+    5,   // StencilThenCoverStrokePathCHROMIUM
+    10,  // StencilThenCoverStrokePathInstancedCHROMIUM
+    0,   // TestFenceNV
+    5,   // TexCoordPointer
+    4,   // TexEnvf
+    4,   // TexEnvfv
+    4,   // TexEnvi
+    4,   // TexEnviv
+    4,   // TexEnvx
+    4,   // TexEnvxv
+    4,   // TexGenfOES
+    4,   // TexGenfvOES
+    4,   // TexGeniOES
+    4,   // TexGenivOES
+    4,   // TexGenxOES
+    4,   // TexGenxvOES
+    10,  // TexImage2D
+    11,  // TexImage2DRobustANGLE
+    11,  // TexImage3D
+    12,  // TexImage3DRobustANGLE
+    4,   // TexParameterIivOES
+    5,   // TexParameterIivRobustANGLE
+    4,   // TexParameterIuivOES
+    5,   // TexParameterIuivRobustANGLE
+    4,   // TexParameterf
+    4,   // TexParameterfv
+    5,   // TexParameterfvRobustANGLE
+    4,   // TexParameteri
+    4,   // TexParameteriv
+    5,   // TexParameterivRobustANGLE
+    4,   // TexParameterx
+    4,   // TexParameterxv
+    5,   // TexStorage1DEXT
+    6,   // TexStorage2D
+    6,   // TexStorage2DEXT
+    7,   // TexStorage2DMultisample
+    7,   // TexStorage2DMultisampleANGLE
+    7,   // TexStorage3D
+    7,   // TexStorage3DEXT
+    8,   // TexStorage3DMultisampleOES
+    8,   // TexStorageMem2DEXT
+    9,   // TexStorageMem2DMultisampleEXT
+    9,   // TexStorageMem3DEXT
+    10,  // TexStorageMem3DMultisampleEXT
+    10,  // TexSubImage2D
+    11,  // TexSubImage2DRobustANGLE
+    12,  // TexSubImage3D
+    13,  // TexSubImage3DRobustANGLE
+    5,   // TransformFeedbackVaryings
+    4,   // Translatef
+    4,   // Translatex
+    3,   // Uniform1f
+    4,   // Uniform1fv
+    3,   // Uniform1i
+    4,   // Uniform1iv
+    3,   // Uniform1ui
+    4,   // Uniform1uiv
+    4,   // Uniform2f
+    4,   // Uniform2fv
+    4,   // Uniform2i
+    4,   // Uniform2iv
+    4,   // Uniform2ui
+    4,   // Uniform2uiv
+    5,   // Uniform3f
+    4,   // Uniform3fv
+    5,   // Uniform3i
+    4,   // Uniform3iv
+    5,   // Uniform3ui
+    4,   // Uniform3uiv
+    6,   // Uniform4f
+    4,   // Uniform4fv
+    6,   // Uniform4i
+    4,   // Uniform4iv
+    6,   // Uniform4ui
+    4,   // Uniform4uiv
+    4,   // UniformBlockBinding
+    5,   // UniformMatrix2fv
+    5,   // UniformMatrix2x3fv
+    5,   // UniformMatrix2x4fv
+    5,   // UniformMatrix3fv
+    5,   // UniformMatrix3x2fv
+    5,   // UniformMatrix3x4fv
+    5,   // UniformMatrix4fv
+    5,   // UniformMatrix4x2fv
+    5,   // UniformMatrix4x3fv
+    0,   // UnmapBuffer
+    0,   // UnmapBufferOES
+    2,   // UseProgram
+    4,   // UseProgramStages
+    2,   // ValidateProgram
+    2,   // ValidateProgramPipeline
+    3,   // VertexAttrib1f
+    3,   // VertexAttrib1fv
+    4,   // VertexAttrib2f
+    3,   // VertexAttrib2fv
+    5,   // VertexAttrib3f
+    3,   // VertexAttrib3fv
+    6,   // VertexAttrib4f
+    3,   // VertexAttrib4fv
+    3,   // VertexAttribBinding
+    3,   // VertexAttribDivisor
+    3,   // VertexAttribDivisorANGLE
+    3,   // VertexAttribDivisorEXT
+    6,   // VertexAttribFormat
+    6,   // VertexAttribI4i
+    3,   // VertexAttribI4iv
+    6,   // VertexAttribI4ui
+    3,   // VertexAttribI4uiv
+    5,   // VertexAttribIFormat
+    6,   // VertexAttribIPointer
+    7,   // VertexAttribPointer
+    3,   // VertexBindingDivisor
+    5,   // VertexPointer
+    5,   // Viewport
+    7,   // WaitSemaphoreEXT
+    4,   // WaitSync
+    5,   // WeightPointerOES
+};
+static_assert(ArraySize(kBatchCommandSizes) == static_cast<size_t>(EntryPoint::EnumCount),
+              "kBatchCommandSizes must have an entry per entry point");
+
+void DecodeBatchCommand(Context *context, EntryPoint entryPoint, const GLuint64 *args)
+{
+    switch (entryPoint)
+    {
+        case EntryPoint::ActiveShaderProgram:
+        {
+            GLuint pipeline = static_cast<GLuint>(args[0]);
+            GLuint program  = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ActiveShaderProgram);
+            ANGLE_BINARY_TRACE(EntryPoint::ActiveShaderProgram, pipeline, program);
+            if (context->skipValidation() ||
+                ValidateActiveShaderProgram(context, pipeline, program))
+            {
+                context->activeShaderProgram(pipeline, program);
+                ANGLE_CAPTURE(ActiveShaderProgram, context, pipeline, program);
+            }
+            break;
+        }
+        case EntryPoint::ActiveTexture:
+        {
+            GLenum texture = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ActiveTexture);
+            ANGLE_BINARY_TRACE(EntryPoint::ActiveTexture, texture);
+            if (context->skipValidation() || ValidateActiveTexture(context, texture))
+            {
+                context->activeTexture(texture);
+                ANGLE_CAPTURE(ActiveTexture, context, texture);
+            }
+            break;
+        }
+        case EntryPoint::AlphaFunc:
+        {
+            GLenum func              = static_cast<GLenum>(args[0]);
+            GLfloat ref              = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AlphaFunc);
+            ANGLE_BINARY_TRACE(EntryPoint::AlphaFunc, func, ref);
+            if (context->skipValidation() || ValidateAlphaFunc(context, funcPacked, ref))
+            {
+                context->alphaFunc(funcPacked, ref);
+                ANGLE_CAPTURE(AlphaFunc, context, func, ref);
+            }
+            break;
+        }
+        case EntryPoint::AlphaFuncx:
+        {
+            GLenum func              = static_cast<GLenum>(args[0]);
+            GLfixed ref              = static_cast<GLfixed>(args[1]);
+            AlphaTestFunc funcPacked = FromGLenum<AlphaTestFunc>(func);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AlphaFuncx);
+            ANGLE_BINARY_TRACE(EntryPoint::AlphaFuncx, func, ref);
+            if (context->skipValidation() || ValidateAlphaFuncx(context, funcPacked, ref))
+            {
+                context->alphaFuncx(funcPacked, ref);
+                ANGLE_CAPTURE(AlphaFuncx, context, func, ref);
+            }
+            break;
+        }
+        case EntryPoint::AttachShader:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLuint shader  = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AttachShader);
+            ANGLE_BINARY_TRACE(EntryPoint::AttachShader, program, shader);
+            if (context->skipValidation() || ValidateAttachShader(context, program, shader))
+            {
+                context->attachShader(program, shader);
+                ANGLE_CAPTURE(AttachShader, context, program, shader);
+            }
+            break;
+        }
+        case EntryPoint::BeginQuery:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLuint id              = static_cast<GLuint>(args[1]);
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginQuery);
+            ANGLE_BINARY_TRACE(EntryPoint::BeginQuery, target, id);
+            if (context->skipValidation() || ValidateBeginQuery(context, targetPacked, id))
+            {
+                context->beginQuery(targetPacked, id);
+                ANGLE_CAPTURE(BeginQuery, context, target, id);
+            }
+            break;
+        }
+        case EntryPoint::BeginQueryEXT:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLuint id              = static_cast<GLuint>(args[1]);
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginQueryEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::BeginQueryEXT, target, id);
+            if (context->skipValidation() || ValidateBeginQueryEXT(context, targetPacked, id))
+            {
+                context->beginQuery(targetPacked, id);
+                ANGLE_CAPTURE(BeginQueryEXT, context, target, id);
+            }
+            break;
+        }
+        case EntryPoint::BeginTransformFeedback:
+        {
+            GLenum primitiveMode              = static_cast<GLenum>(args[0]);
+            PrimitiveMode primitiveModePacked = FromGLenum<PrimitiveMode>(primitiveMode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginTransformFeedback);
+            ANGLE_BINARY_TRACE(EntryPoint::BeginTransformFeedback, primitiveMode);
+            if (context->skipValidation() ||
+                ValidateBeginTransformFeedback(context, primitiveModePacked))
+            {
+                context->beginTransformFeedback(primitiveModePacked);
+                ANGLE_CAPTURE(BeginTransformFeedback, context, primitiveMode);
+            }
+            break;
+        }
+        case EntryPoint::BindAttribLocation:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLuint index       = static_cast<GLuint>(args[1]);
+            const GLchar *name = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindAttribLocation);
+            ANGLE_BINARY_TRACE(EntryPoint::BindAttribLocation, program, index, name);
+            if (context->skipValidation() ||
+                ValidateBindAttribLocation(context, program, index, name))
+            {
+                context->bindAttribLocation(program, index, name);
+                ANGLE_CAPTURE(BindAttribLocation, context, program, index, name);
+            }
+            break;
+        }
+        case EntryPoint::BindBuffer:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLuint buffer              = static_cast<GLuint>(args[1]);
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::BindBuffer, target, buffer);
+            if (context->skipValidation() || ValidateBindBuffer(context, targetPacked, buffer))
+            {
+                context->bindBuffer(targetPacked, buffer);
+                ANGLE_CAPTURE(BindBuffer, context, target, buffer);
+            }
+            break;
+        }
+        case EntryPoint::BindBufferBase:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLuint index               = static_cast<GLuint>(args[1]);
+            GLuint buffer              = static_cast<GLuint>(args[2]);
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBufferBase);
+            ANGLE_BINARY_TRACE(EntryPoint::BindBufferBase, target, index, buffer);
+            if (context->skipValidation() ||
+                ValidateBindBufferBase(context, targetPacked, index, buffer))
+            {
+                context->bindBufferBase(targetPacked, index, buffer);
+                ANGLE_CAPTURE(BindBufferBase, context, target, index, buffer);
+            }
+            break;
+        }
+        case EntryPoint::BindBufferRange:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLuint index               = static_cast<GLuint>(args[1]);
+            GLuint buffer              = static_cast<GLuint>(args[2]);
+            GLintptr offset            = static_cast<GLintptr>(args[3]);
+            GLsizeiptr size            = static_cast<GLsizeiptr>(args[4]);
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBufferRange);
+            ANGLE_BINARY_TRACE(EntryPoint::BindBufferRange, target, index, buffer, offset, size);
+            if (context->skipValidation() ||
+                ValidateBindBufferRange(context, targetPacked, index, buffer, offset, size))
+            {
+                context->bindBufferRange(targetPacked, index, buffer, offset, size);
+                ANGLE_CAPTURE(BindBufferRange, context, target, index, buffer, offset, size);
+            }
+            break;
+        }
+        case EntryPoint::BindFragDataLocationEXT:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLuint color       = static_cast<GLuint>(args[1]);
+            const GLchar *name = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragDataLocationEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::BindFragDataLocationEXT, program, color, name);
+            if (context->skipValidation() ||
+                ValidateBindFragDataLocationEXT(context, program, color, name))
+            {
+                context->bindFragDataLocation(program, color, name);
+                ANGLE_CAPTURE(BindFragDataLocationEXT, context, program, color, name);
+            }
+            break;
+        }
+        case EntryPoint::BindFragDataLocationIndexedEXT:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLuint colorNumber = static_cast<GLuint>(args[1]);
+            GLuint index       = static_cast<GLuint>(args[2]);
+            const GLchar *name = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragDataLocationIndexedEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::BindFragDataLocationIndexedEXT, program, colorNumber,
+                               index, name);
+            if (context->skipValidation() ||
+                ValidateBindFragDataLocationIndexedEXT(context, program, colorNumber, index, name))
+            {
+                context->bindFragDataLocationIndexed(program, colorNumber, index, name);
+                ANGLE_CAPTURE(BindFragDataLocationIndexedEXT, context, program, colorNumber, index,
+                              name);
+            }
+            break;
+        }
+        case EntryPoint::BindFramebuffer:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLuint framebuffer = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFramebuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::BindFramebuffer, target, framebuffer);
+            if (context->skipValidation() || ValidateBindFramebuffer(context, target, framebuffer))
+            {
+                context->bindFramebuffer(target, framebuffer);
+                ANGLE_CAPTURE(BindFramebuffer, context, target, framebuffer);
+            }
+            break;
+        }
+        case EntryPoint::BindFramebufferOES:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLuint framebuffer = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFramebufferOES);
+            ANGLE_BINARY_TRACE(EntryPoint::BindFramebufferOES, target, framebuffer);
+            if (context->skipValidation() ||
+                ValidateBindFramebufferOES(context, target, framebuffer))
+            {
+                context->bindFramebuffer(target, framebuffer);
+                ANGLE_CAPTURE(BindFramebufferOES, context, target, framebuffer);
+            }
+            break;
+        }
+        case EntryPoint::BindImageTexture:
+        {
+            GLuint unit       = static_cast<GLuint>(args[0]);
+            GLuint texture    = static_cast<GLuint>(args[1]);
+            GLint level       = static_cast<GLint>(args[2]);
+            GLboolean layered = static_cast<GLboolean>(args[3]);
+            GLint layer       = static_cast<GLint>(args[4]);
+            GLenum access     = static_cast<GLenum>(args[5]);
+            GLenum format     = static_cast<GLenum>(args[6]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindImageTexture);
+            ANGLE_BINARY_TRACE(EntryPoint::BindImageTexture, unit, texture, level, layered, layer,
+                               access, format);
+            if (context->skipValidation() ||
+                ValidateBindImageTexture(context, unit, texture, level, layered, layer, access,
+                                         format))
+            {
+                context->bindImageTexture(unit, texture, level, layered, layer, access, format);
+                ANGLE_CAPTURE(BindImageTexture, context, unit, texture, level, layered, layer,
+                              access, format);
+            }
+            break;
+        }
+        case EntryPoint::BindProgramPipeline:
+        {
+            GLuint pipeline = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindProgramPipeline);
+            ANGLE_BINARY_TRACE(EntryPoint::BindProgramPipeline, pipeline);
+            if (context->skipValidation() || ValidateBindProgramPipeline(context, pipeline))
+            {
+                context->bindProgramPipeline(pipeline);
+                ANGLE_CAPTURE(BindProgramPipeline, context, pipeline);
+            }
+            break;
+        }
+        case EntryPoint::BindRenderbuffer:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLuint renderbuffer = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindRenderbuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::BindRenderbuffer, target, renderbuffer);
+            if (context->skipValidation() ||
+                ValidateBindRenderbuffer(context, target, renderbuffer))
+            {
+                context->bindRenderbuffer(target, renderbuffer);
+                ANGLE_CAPTURE(BindRenderbuffer, context, target, renderbuffer);
+            }
+            break;
+        }
+        case EntryPoint::BindRenderbufferOES:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLuint renderbuffer = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindRenderbufferOES);
+            ANGLE_BINARY_TRACE(EntryPoint::BindRenderbufferOES, target, renderbuffer);
+            if (context->skipValidation() ||
+                ValidateBindRenderbufferOES(context, target, renderbuffer))
+            {
+                context->bindRenderbuffer(target, renderbuffer);
+                ANGLE_CAPTURE(BindRenderbufferOES, context, target, renderbuffer);
+            }
+            break;
+        }
+        case EntryPoint::BindSampler:
+        {
+            GLuint unit    = static_cast<GLuint>(args[0]);
+            GLuint sampler = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindSampler);
+            ANGLE_BINARY_TRACE(EntryPoint::BindSampler, unit, sampler);
+            if (context->skipValidation() || ValidateBindSampler(context, unit, sampler))
+            {
+                context->bindSampler(unit, sampler);
+                ANGLE_CAPTURE(BindSampler, context, unit, sampler);
+            }
+            break;
+        }
+        case EntryPoint::BindTexture:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLuint texture           = static_cast<GLuint>(args[1]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindTexture);
+            ANGLE_BINARY_TRACE(EntryPoint::BindTexture, target, texture);
+            if (context->skipValidation() || ValidateBindTexture(context, targetPacked, texture))
+            {
+                context->bindTexture(targetPacked, texture);
+                ANGLE_CAPTURE(BindTexture, context, target, texture);
+            }
+            break;
+        }
+        case EntryPoint::BindTransformFeedback:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLuint id     = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindTransformFeedback);
+            ANGLE_BINARY_TRACE(EntryPoint::BindTransformFeedback, target, id);
+            if (context->skipValidation() || ValidateBindTransformFeedback(context, target, id))
+            {
+                context->bindTransformFeedback(target, id);
+                ANGLE_CAPTURE(BindTransformFeedback, context, target, id);
+            }
+            break;
+        }
+        case EntryPoint::BindVertexArray:
+        {
+            GLuint array = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexArray);
+            ANGLE_BINARY_TRACE(EntryPoint::BindVertexArray, array);
+            if (context->skipValidation() || ValidateBindVertexArray(context, array))
+            {
+                context->bindVertexArray(array);
+                ANGLE_CAPTURE(BindVertexArray, context, array);
+            }
+            break;
+        }
+        case EntryPoint::BindVertexArrayOES:
+        {
+            GLuint array = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexArrayOES);
+            ANGLE_BINARY_TRACE(EntryPoint::BindVertexArrayOES, array);
+            if (context->skipValidation() || ValidateBindVertexArrayOES(context, array))
+            {
+                context->bindVertexArray(array);
+                ANGLE_CAPTURE(BindVertexArrayOES, context, array);
+            }
+            break;
+        }
+        case EntryPoint::BindVertexBuffer:
+        {
+            GLuint bindingindex = static_cast<GLuint>(args[0]);
+            GLuint buffer       = static_cast<GLuint>(args[1]);
+            GLintptr offset     = static_cast<GLintptr>(args[2]);
+            GLsizei stride      = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexBuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::BindVertexBuffer, bindingindex, buffer, offset, stride);
+            if (context->skipValidation() ||
+                ValidateBindVertexBuffer(context, bindingindex, buffer, offset, stride))
+            {
+                context->bindVertexBuffer(bindingindex, buffer, offset, stride);
+                ANGLE_CAPTURE(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
+            }
+            break;
+        }
+        case EntryPoint::BlendColor:
+        {
+            GLfloat red   = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat green = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat blue  = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat alpha = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendColor);
+            ANGLE_BINARY_TRACE(EntryPoint::BlendColor, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateBlendColor(context, red, green, blue, alpha))
+            {
+                context->blendColor(red, green, blue, alpha);
+                ANGLE_CAPTURE(BlendColor, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::BlendEquation:
+        {
+            GLenum mode = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendEquation);
+            ANGLE_BINARY_TRACE(EntryPoint::BlendEquation, mode);
+            if (context->skipValidation() || ValidateBlendEquation(context, mode))
+            {
+                context->blendEquation(mode);
+                ANGLE_CAPTURE(BlendEquation, context, mode);
+            }
+            break;
+        }
+        case EntryPoint::BlendEquationSeparate:
+        {
+            GLenum modeRGB   = static_cast<GLenum>(args[0]);
+            GLenum modeAlpha = static_cast<GLenum>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendEquationSeparate);
+            ANGLE_BINARY_TRACE(EntryPoint::BlendEquationSeparate, modeRGB, modeAlpha);
+            if (context->skipValidation() ||
+                ValidateBlendEquationSeparate(context, modeRGB, modeAlpha))
+            {
+                context->blendEquationSeparate(modeRGB, modeAlpha);
+                ANGLE_CAPTURE(BlendEquationSeparate, context, modeRGB, modeAlpha);
+            }
+            break;
+        }
+        case EntryPoint::BlendFunc:
+        {
+            GLenum sfactor = static_cast<GLenum>(args[0]);
+            GLenum dfactor = static_cast<GLenum>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendFunc);
+            ANGLE_BINARY_TRACE(EntryPoint::BlendFunc, sfactor, dfactor);
+            if (context->skipValidation() || ValidateBlendFunc(context, sfactor, dfactor))
+            {
+                context->blendFunc(sfactor, dfactor);
+                ANGLE_CAPTURE(BlendFunc, context, sfactor, dfactor);
+            }
+            break;
+        }
+        case EntryPoint::BlendFuncSeparate:
+        {
+            GLenum sfactorRGB   = static_cast<GLenum>(args[0]);
+            GLenum dfactorRGB   = static_cast<GLenum>(args[1]);
+            GLenum sfactorAlpha = static_cast<GLenum>(args[2]);
+            GLenum dfactorAlpha = static_cast<GLenum>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendFuncSeparate);
+            ANGLE_BINARY_TRACE(EntryPoint::BlendFuncSeparate, sfactorRGB, dfactorRGB, sfactorAlpha,
+                               dfactorAlpha);
+            if (context->skipValidation() ||
+                ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                                          dfactorAlpha))
+            {
+                context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+                ANGLE_CAPTURE(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                              dfactorAlpha);
+            }
+            break;
+        }
+        case EntryPoint::BlitFramebuffer:
+        {
+            GLint srcX0     = static_cast<GLint>(args[0]);
+            GLint srcY0     = static_cast<GLint>(args[1]);
+            GLint srcX1     = static_cast<GLint>(args[2]);
+            GLint srcY1     = static_cast<GLint>(args[3]);
+            GLint dstX0     = static_cast<GLint>(args[4]);
+            GLint dstY0     = static_cast<GLint>(args[5]);
+            GLint dstX1     = static_cast<GLint>(args[6]);
+            GLint dstY1     = static_cast<GLint>(args[7]);
+            GLbitfield mask = static_cast<GLbitfield>(args[8]);
+            GLenum filter   = static_cast<GLenum>(args[9]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlitFramebuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::BlitFramebuffer, srcX0, srcY0, srcX1, srcY1, dstX0,
+                               dstY0, dstX1, dstY1, mask, filter);
+            if (context->skipValidation() ||
+                ValidateBlitFramebuffer(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                                        dstY1, mask, filter))
+            {
+                context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                                         mask, filter);
+                ANGLE_CAPTURE(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                              dstX1, dstY1, mask, filter);
+            }
+            break;
+        }
+        case EntryPoint::BlitFramebufferANGLE:
+        {
+            GLint srcX0     = static_cast<GLint>(args[0]);
+            GLint srcY0     = static_cast<GLint>(args[1]);
+            GLint srcX1     = static_cast<GLint>(args[2]);
+            GLint srcY1     = static_cast<GLint>(args[3]);
+            GLint dstX0     = static_cast<GLint>(args[4]);
+            GLint dstY0     = static_cast<GLint>(args[5]);
+            GLint dstX1     = static_cast<GLint>(args[6]);
+            GLint dstY1     = static_cast<GLint>(args[7]);
+            GLbitfield mask = static_cast<GLbitfield>(args[8]);
+            GLenum filter   = static_cast<GLenum>(args[9]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlitFramebufferANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::BlitFramebufferANGLE, srcX0, srcY0, srcX1, srcY1, dstX0,
+                               dstY0, dstX1, dstY1, mask, filter);
+            if (context->skipValidation() ||
+                ValidateBlitFramebufferANGLE(context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                                             dstX1, dstY1, mask, filter))
+            {
+                context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1,
+                                         mask, filter);
+                ANGLE_CAPTURE(BlitFramebufferANGLE, context, srcX0, srcY0, srcX1, srcY1, dstX0,
+                              dstY0, dstX1, dstY1, mask, filter);
+            }
+            break;
+        }
+        case EntryPoint::BufferData:
+        {
+            GLenum target    = static_cast<GLenum>(args[0]);
+            GLsizeiptr size  = static_cast<GLsizeiptr>(args[1]);
+            const void *data = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLenum usage     = static_cast<GLenum>(args[3]);
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            BufferUsage usagePacked    = FromGLenum<BufferUsage>(usage);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferData);
+            ANGLE_BINARY_TRACE(EntryPoint::BufferData, target, size, data, usage);
+            if (context->skipValidation() ||
+                ValidateBufferData(context, targetPacked, size, data, usagePacked))
+            {
+                context->bufferData(targetPacked, size, data, usagePacked);
+                ANGLE_CAPTURE(BufferData, context, target, size, data, usage);
+            }
+            break;
+        }
+        case EntryPoint::BufferStorageMemEXT:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizeiptr size          = static_cast<GLsizeiptr>(args[1]);
+            GLuint memory            = static_cast<GLuint>(args[2]);
+            GLuint64 offset          = static_cast<GLuint64>(args[3]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferStorageMemEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::BufferStorageMemEXT, target, size, memory, offset);
+            if (context->skipValidation() ||
+                ValidateBufferStorageMemEXT(context, targetPacked, size, memory, offset))
+            {
+                context->bufferStorageMem(targetPacked, size, memory, offset);
+                ANGLE_CAPTURE(BufferStorageMemEXT, context, target, size, memory, offset);
+            }
+            break;
+        }
+        case EntryPoint::BufferSubData:
+        {
+            GLenum target    = static_cast<GLenum>(args[0]);
+            GLintptr offset  = static_cast<GLintptr>(args[1]);
+            GLsizeiptr size  = static_cast<GLsizeiptr>(args[2]);
+            const void *data = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferSubData);
+            ANGLE_BINARY_TRACE(EntryPoint::BufferSubData, target, offset, size, data);
+            if (context->skipValidation() ||
+                ValidateBufferSubData(context, targetPacked, offset, size, data))
+            {
+                context->bufferSubData(targetPacked, offset, size, data);
+                ANGLE_CAPTURE(BufferSubData, context, target, offset, size, data);
+            }
+            break;
+        }
+        case EntryPoint::Clear:
+        {
+            GLbitfield mask = static_cast<GLbitfield>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Clear);
+            ANGLE_BINARY_TRACE(EntryPoint::Clear, mask);
+            if (context->skipValidation() || ValidateClear(context, mask))
+            {
+                context->clear(mask);
+                ANGLE_CAPTURE(Clear, context, mask);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferfi:
+        {
+            GLenum buffer    = static_cast<GLenum>(args[0]);
+            GLint drawbuffer = static_cast<GLint>(args[1]);
+            GLfloat depth    = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLint stencil    = static_cast<GLint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferfi);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearBufferfi, buffer, drawbuffer, depth, stencil);
+            if (context->skipValidation() ||
+                ValidateClearBufferfi(context, buffer, drawbuffer, depth, stencil))
+            {
+                context->clearBufferfi(buffer, drawbuffer, depth, stencil);
+                ANGLE_CAPTURE(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferfv:
+        {
+            GLenum buffer    = static_cast<GLenum>(args[0]);
+            GLint drawbuffer = static_cast<GLint>(args[1]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferfv);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearBufferfv, buffer, drawbuffer, value);
+            if (context->skipValidation() ||
+                ValidateClearBufferfv(context, buffer, drawbuffer, value))
+            {
+                context->clearBufferfv(buffer, drawbuffer, value);
+                ANGLE_CAPTURE(ClearBufferfv, context, buffer, drawbuffer, value);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferiv:
+        {
+            GLenum buffer      = static_cast<GLenum>(args[0]);
+            GLint drawbuffer   = static_cast<GLint>(args[1]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferiv);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearBufferiv, buffer, drawbuffer, value);
+            if (context->skipValidation() ||
+                ValidateClearBufferiv(context, buffer, drawbuffer, value))
+            {
+                context->clearBufferiv(buffer, drawbuffer, value);
+                ANGLE_CAPTURE(ClearBufferiv, context, buffer, drawbuffer, value);
+            }
+            break;
+        }
+        case EntryPoint::ClearBufferuiv:
+        {
+            GLenum buffer       = static_cast<GLenum>(args[0]);
+            GLint drawbuffer    = static_cast<GLint>(args[1]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferuiv);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearBufferuiv, buffer, drawbuffer, value);
+            if (context->skipValidation() ||
+                ValidateClearBufferuiv(context, buffer, drawbuffer, value))
+            {
+                context->clearBufferuiv(buffer, drawbuffer, value);
+                ANGLE_CAPTURE(ClearBufferuiv, context, buffer, drawbuffer, value);
+            }
+            break;
+        }
+        case EntryPoint::ClearColor:
+        {
+            GLfloat red   = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat green = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat blue  = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat alpha = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearColor);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearColor, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateClearColor(context, red, green, blue, alpha))
+            {
+                context->clearColor(red, green, blue, alpha);
+                ANGLE_CAPTURE(ClearColor, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::ClearColorx:
+        {
+            GLfixed red   = static_cast<GLfixed>(args[0]);
+            GLfixed green = static_cast<GLfixed>(args[1]);
+            GLfixed blue  = static_cast<GLfixed>(args[2]);
+            GLfixed alpha = static_cast<GLfixed>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearColorx);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearColorx, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateClearColorx(context, red, green, blue, alpha))
+            {
+                context->clearColorx(red, green, blue, alpha);
+                ANGLE_CAPTURE(ClearColorx, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::ClearDepthf:
+        {
+            GLfloat d = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearDepthf);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearDepthf, d);
+            if (context->skipValidation() || ValidateClearDepthf(context, d))
+            {
+                context->clearDepthf(d);
+                ANGLE_CAPTURE(ClearDepthf, context, d);
+            }
+            break;
+        }
+        case EntryPoint::ClearDepthx:
+        {
+            GLfixed depth = static_cast<GLfixed>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearDepthx);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearDepthx, depth);
+            if (context->skipValidation() || ValidateClearDepthx(context, depth))
+            {
+                context->clearDepthx(depth);
+                ANGLE_CAPTURE(ClearDepthx, context, depth);
+            }
+            break;
+        }
+        case EntryPoint::ClearStencil:
+        {
+            GLint s = static_cast<GLint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearStencil);
+            ANGLE_BINARY_TRACE(EntryPoint::ClearStencil, s);
+            if (context->skipValidation() || ValidateClearStencil(context, s))
+            {
+                context->clearStencil(s);
+                ANGLE_CAPTURE(ClearStencil, context, s);
+            }
+            break;
+        }
+        case EntryPoint::ClientActiveTexture:
+        {
+            GLenum texture = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClientActiveTexture);
+            ANGLE_BINARY_TRACE(EntryPoint::ClientActiveTexture, texture);
+            if (context->skipValidation() || ValidateClientActiveTexture(context, texture))
+            {
+                context->clientActiveTexture(texture);
+                ANGLE_CAPTURE(ClientActiveTexture, context, texture);
+            }
+            break;
+        }
+        case EntryPoint::ClipPlanef:
+        {
+            GLenum p           = static_cast<GLenum>(args[0]);
+            const GLfloat *eqn = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClipPlanef);
+            ANGLE_BINARY_TRACE(EntryPoint::ClipPlanef, p, eqn);
+            if (context->skipValidation() || ValidateClipPlanef(context, p, eqn))
+            {
+                context->clipPlanef(p, eqn);
+                ANGLE_CAPTURE(ClipPlanef, context, p, eqn);
+            }
+            break;
+        }
+        case EntryPoint::ClipPlanex:
+        {
+            GLenum plane = static_cast<GLenum>(args[0]);
+            const GLfixed *equation =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClipPlanex);
+            ANGLE_BINARY_TRACE(EntryPoint::ClipPlanex, plane, equation);
+            if (context->skipValidation() || ValidateClipPlanex(context, plane, equation))
+            {
+                context->clipPlanex(plane, equation);
+                ANGLE_CAPTURE(ClipPlanex, context, plane, equation);
+            }
+            break;
+        }
+        case EntryPoint::Color4f:
+        {
+            GLfloat red   = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat green = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat blue  = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat alpha = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4f);
+            ANGLE_BINARY_TRACE(EntryPoint::Color4f, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateColor4f(context, red, green, blue, alpha))
+            {
+                context->color4f(red, green, blue, alpha);
+                ANGLE_CAPTURE(Color4f, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::Color4ub:
+        {
+            GLubyte red   = static_cast<GLubyte>(args[0]);
+            GLubyte green = static_cast<GLubyte>(args[1]);
+            GLubyte blue  = static_cast<GLubyte>(args[2]);
+            GLubyte alpha = static_cast<GLubyte>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4ub);
+            ANGLE_BINARY_TRACE(EntryPoint::Color4ub, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateColor4ub(context, red, green, blue, alpha))
+            {
+                context->color4ub(red, green, blue, alpha);
+                ANGLE_CAPTURE(Color4ub, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::Color4x:
+        {
+            GLfixed red   = static_cast<GLfixed>(args[0]);
+            GLfixed green = static_cast<GLfixed>(args[1]);
+            GLfixed blue  = static_cast<GLfixed>(args[2]);
+            GLfixed alpha = static_cast<GLfixed>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4x);
+            ANGLE_BINARY_TRACE(EntryPoint::Color4x, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateColor4x(context, red, green, blue, alpha))
+            {
+                context->color4x(red, green, blue, alpha);
+                ANGLE_CAPTURE(Color4x, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::ColorMask:
+        {
+            GLboolean red   = static_cast<GLboolean>(args[0]);
+            GLboolean green = static_cast<GLboolean>(args[1]);
+            GLboolean blue  = static_cast<GLboolean>(args[2]);
+            GLboolean alpha = static_cast<GLboolean>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ColorMask);
+            ANGLE_BINARY_TRACE(EntryPoint::ColorMask, red, green, blue, alpha);
+            if (context->skipValidation() || ValidateColorMask(context, red, green, blue, alpha))
+            {
+                context->colorMask(red, green, blue, alpha);
+                ANGLE_CAPTURE(ColorMask, context, red, green, blue, alpha);
+            }
+            break;
+        }
+        case EntryPoint::ColorPointer:
+        {
+            GLint size          = static_cast<GLint>(args[0]);
+            GLenum type         = static_cast<GLenum>(args[1]);
+            GLsizei stride      = static_cast<GLsizei>(args[2]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ColorPointer);
+            ANGLE_BINARY_TRACE(EntryPoint::ColorPointer, size, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidateColorPointer(context, size, typePacked, stride, pointer))
+            {
+                context->colorPointer(size, typePacked, stride, pointer);
+                ANGLE_CAPTURE(ColorPointer, context, size, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::CompileShader:
+        {
+            GLuint shader = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompileShader);
+            ANGLE_BINARY_TRACE(EntryPoint::CompileShader, shader);
+            if (context->skipValidation() || ValidateCompileShader(context, shader))
+            {
+                context->compileShader(shader);
+                ANGLE_CAPTURE(CompileShader, context, shader);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexImage2D:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLint level           = static_cast<GLint>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            GLsizei height        = static_cast<GLsizei>(args[4]);
+            GLint border          = static_cast<GLint>(args[5]);
+            GLsizei imageSize     = static_cast<GLsizei>(args[6]);
+            const void *data      = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[7]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage2D, target, level, internalformat,
+                               width, height, border, imageSize, data);
+            if (context->skipValidation() ||
+                ValidateCompressedTexImage2D(context, targetPacked, level, internalformat, width,
+                                             height, border, imageSize, data))
+            {
+                context->compressedTexImage2D(targetPacked, level, internalformat, width, height,
+                                              border, imageSize, data);
+                ANGLE_CAPTURE(CompressedTexImage2D, context, target, level, internalformat, width,
+                              height, border, imageSize, data);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexImage3D:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLint level           = static_cast<GLint>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            GLsizei height        = static_cast<GLsizei>(args[4]);
+            GLsizei depth         = static_cast<GLsizei>(args[5]);
+            GLint border          = static_cast<GLint>(args[6]);
+            GLsizei imageSize     = static_cast<GLsizei>(args[7]);
+            const void *data      = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[8]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage3D);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage3D, target, level, internalformat,
+                               width, height, depth, border, imageSize, data);
+            if (context->skipValidation() ||
+                ValidateCompressedTexImage3D(context, targetPacked, level, internalformat, width,
+                                             height, depth, border, imageSize, data))
+            {
+                context->compressedTexImage3D(targetPacked, level, internalformat, width, height,
+                                              depth, border, imageSize, data);
+                ANGLE_CAPTURE(CompressedTexImage3D, context, target, level, internalformat, width,
+                              height, depth, border, imageSize, data);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexSubImage2D:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLint level       = static_cast<GLint>(args[1]);
+            GLint xoffset     = static_cast<GLint>(args[2]);
+            GLint yoffset     = static_cast<GLint>(args[3]);
+            GLsizei width     = static_cast<GLsizei>(args[4]);
+            GLsizei height    = static_cast<GLsizei>(args[5]);
+            GLenum format     = static_cast<GLenum>(args[6]);
+            GLsizei imageSize = static_cast<GLsizei>(args[7]);
+            const void *data  = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[8]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage2D, target, level, xoffset, yoffset,
+                               width, height, format, imageSize, data);
+            if (context->skipValidation() ||
+                ValidateCompressedTexSubImage2D(context, targetPacked, level, xoffset, yoffset,
+                                                width, height, format, imageSize, data))
+            {
+                context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width,
+                                                 height, format, imageSize, data);
+                ANGLE_CAPTURE(CompressedTexSubImage2D, context, target, level, xoffset, yoffset,
+                              width, height, format, imageSize, data);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexSubImage3D:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLint level       = static_cast<GLint>(args[1]);
+            GLint xoffset     = static_cast<GLint>(args[2]);
+            GLint yoffset     = static_cast<GLint>(args[3]);
+            GLint zoffset     = static_cast<GLint>(args[4]);
+            GLsizei width     = static_cast<GLsizei>(args[5]);
+            GLsizei height    = static_cast<GLsizei>(args[6]);
+            GLsizei depth     = static_cast<GLsizei>(args[7]);
+            GLenum format     = static_cast<GLenum>(args[8]);
+            GLsizei imageSize = static_cast<GLsizei>(args[9]);
+            const void *data  = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[10]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage3D);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage3D, target, level, xoffset, yoffset,
+                               zoffset, width, height, depth, format, imageSize, data);
+            if (context->skipValidation() ||
+                ValidateCompressedTexSubImage3D(context, targetPacked, level, xoffset, yoffset,
+                                                zoffset, width, height, depth, format, imageSize,
+                                                data))
+            {
+                context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset,
+                                                 width, height, depth, format, imageSize, data);
+                ANGLE_CAPTURE(CompressedTexSubImage3D, context, target, level, xoffset, yoffset,
+                              zoffset, width, height, depth, format, imageSize, data);
+            }
+            break;
+        }
+        case EntryPoint::CopyBufferSubData:
+        {
+            GLenum readTarget               = static_cast<GLenum>(args[0]);
+            GLenum writeTarget              = static_cast<GLenum>(args[1]);
+            GLintptr readOffset             = static_cast<GLintptr>(args[2]);
+            GLintptr writeOffset            = static_cast<GLintptr>(args[3]);
+            GLsizeiptr size                 = static_cast<GLsizeiptr>(args[4]);
+            BufferBinding readTargetPacked  = FromGLenum<BufferBinding>(readTarget);
+            BufferBinding writeTargetPacked = FromGLenum<BufferBinding>(writeTarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyBufferSubData);
+            ANGLE_BINARY_TRACE(EntryPoint::CopyBufferSubData, readTarget, writeTarget, readOffset,
+                               writeOffset, size);
+            if (context->skipValidation() ||
+                ValidateCopyBufferSubData(context, readTargetPacked, writeTargetPacked, readOffset,
+                                          writeOffset, size))
+            {
+                context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset,
+                                           writeOffset, size);
+                ANGLE_CAPTURE(CopyBufferSubData, context, readTarget, writeTarget, readOffset,
+                              writeOffset, size);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexImage2D:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLint level                = static_cast<GLint>(args[1]);
+            GLenum internalformat      = static_cast<GLenum>(args[2]);
+            GLint x                    = static_cast<GLint>(args[3]);
+            GLint y                    = static_cast<GLint>(args[4]);
+            GLsizei width              = static_cast<GLsizei>(args[5]);
+            GLsizei height             = static_cast<GLsizei>(args[6]);
+            GLint border               = static_cast<GLint>(args[7]);
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexImage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::CopyTexImage2D, target, level, internalformat, x, y,
+                               width, height, border);
+            if (context->skipValidation() ||
+                ValidateCopyTexImage2D(context, targetPacked, level, internalformat, x, y, width,
+                                       height, border))
+            {
+                context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height,
+                                        border);
+                ANGLE_CAPTURE(CopyTexImage2D, context, target, level, internalformat, x, y, width,
+                              height, border);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexSubImage2D:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLint level                = static_cast<GLint>(args[1]);
+            GLint xoffset              = static_cast<GLint>(args[2]);
+            GLint yoffset              = static_cast<GLint>(args[3]);
+            GLint x                    = static_cast<GLint>(args[4]);
+            GLint y                    = static_cast<GLint>(args[5]);
+            GLsizei width              = static_cast<GLsizei>(args[6]);
+            GLsizei height             = static_cast<GLsizei>(args[7]);
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexSubImage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::CopyTexSubImage2D, target, level, xoffset, yoffset, x, y,
+                               width, height);
+            if (context->skipValidation() ||
+                ValidateCopyTexSubImage2D(context, targetPacked, level, xoffset, yoffset, x, y,
+                                          width, height))
+            {
+                context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width,
+                                           height);
+                ANGLE_CAPTURE(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y,
+                              width, height);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexSubImage3D:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLint level                = static_cast<GLint>(args[1]);
+            GLint xoffset              = static_cast<GLint>(args[2]);
+            GLint yoffset              = static_cast<GLint>(args[3]);
+            GLint zoffset              = static_cast<GLint>(args[4]);
+            GLint x                    = static_cast<GLint>(args[5]);
+            GLint y                    = static_cast<GLint>(args[6]);
+            GLsizei width              = static_cast<GLsizei>(args[7]);
+            GLsizei height             = static_cast<GLsizei>(args[8]);
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexSubImage3D);
+            ANGLE_BINARY_TRACE(EntryPoint::CopyTexSubImage3D, target, level, xoffset, yoffset,
+                               zoffset, x, y, width, height);
+            if (context->skipValidation() ||
+                ValidateCopyTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset,
+                                          x, y, width, height))
+            {
+                context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y,
+                                           width, height);
+                ANGLE_CAPTURE(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset,
+                              x, y, width, height);
+            }
+            break;
+        }
+        case EntryPoint::CreateMemoryObjectsEXT:
+        {
+            GLsizei n             = static_cast<GLsizei>(args[0]);
+            GLuint *memoryObjects = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateMemoryObjectsEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::CreateMemoryObjectsEXT, n, memoryObjects);
+            if (context->skipValidation() ||
+                ValidateCreateMemoryObjectsEXT(context, n, memoryObjects))
+            {
+                context->createMemoryObjects(n, memoryObjects);
+                ANGLE_CAPTURE(CreateMemoryObjectsEXT, context, n, memoryObjects);
+            }
+            break;
+        }
+        case EntryPoint::CullFace:
+        {
+            GLenum mode             = static_cast<GLenum>(args[0]);
+            CullFaceMode modePacked = FromGLenum<CullFaceMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CullFace);
+            ANGLE_BINARY_TRACE(EntryPoint::CullFace, mode);
+            if (context->skipValidation() || ValidateCullFace(context, modePacked))
+            {
+                context->cullFace(modePacked);
+                ANGLE_CAPTURE(CullFace, context, mode);
+            }
+            break;
+        }
+        case EntryPoint::CurrentPaletteMatrixOES:
+        {
+            GLuint matrixpaletteindex = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CurrentPaletteMatrixOES);
+            ANGLE_BINARY_TRACE(EntryPoint::CurrentPaletteMatrixOES, matrixpaletteindex);
+            if (context->skipValidation() ||
+                ValidateCurrentPaletteMatrixOES(context, matrixpaletteindex))
+            {
+                context->currentPaletteMatrix(matrixpaletteindex);
+                ANGLE_CAPTURE(CurrentPaletteMatrixOES, context, matrixpaletteindex);
+            }
+            break;
+        }
+        case EntryPoint::DebugMessageCallbackKHR:
+        {
+            GLDEBUGPROCKHR callback =
+                reinterpret_cast<GLDEBUGPROCKHR>(static_cast<uintptr_t>(args[0]));
+            const void *userParam = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageCallbackKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::DebugMessageCallbackKHR, callback, userParam);
+            if (context->skipValidation() ||
+                ValidateDebugMessageCallbackKHR(context, callback, userParam))
+            {
+                context->debugMessageCallback(callback, userParam);
+                ANGLE_CAPTURE(DebugMessageCallbackKHR, context, callback, userParam);
+            }
+            break;
+        }
+        case EntryPoint::DebugMessageControlKHR:
+        {
+            GLenum source     = static_cast<GLenum>(args[0]);
+            GLenum type       = static_cast<GLenum>(args[1]);
+            GLenum severity   = static_cast<GLenum>(args[2]);
+            GLsizei count     = static_cast<GLsizei>(args[3]);
+            const GLuint *ids = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[4]));
+            GLboolean enabled = static_cast<GLboolean>(args[5]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageControlKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::DebugMessageControlKHR, source, type, severity, count,
+                               ids, enabled);
+            if (context->skipValidation() ||
+                ValidateDebugMessageControlKHR(context, source, type, severity, count, ids,
+                                               enabled))
+            {
+                context->debugMessageControl(source, type, severity, count, ids, enabled);
+                ANGLE_CAPTURE(DebugMessageControlKHR, context, source, type, severity, count, ids,
+                              enabled);
+            }
+            break;
+        }
+        case EntryPoint::DebugMessageInsertKHR:
+        {
+            GLenum source     = static_cast<GLenum>(args[0]);
+            GLenum type       = static_cast<GLenum>(args[1]);
+            GLuint id         = static_cast<GLuint>(args[2]);
+            GLenum severity   = static_cast<GLenum>(args[3]);
+            GLsizei length    = static_cast<GLsizei>(args[4]);
+            const GLchar *buf = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageInsertKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::DebugMessageInsertKHR, source, type, id, severity,
+                               length, buf);
+            if (context->skipValidation() ||
+                ValidateDebugMessageInsertKHR(context, source, type, id, severity, length, buf))
+            {
+                context->debugMessageInsert(source, type, id, severity, length, buf);
+                ANGLE_CAPTURE(DebugMessageInsertKHR, context, source, type, id, severity, length,
+                              buf);
+            }
+            break;
+        }
+        case EntryPoint::DeleteBuffers:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *buffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteBuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteBuffers, n, buffers);
+            if (context->skipValidation() || ValidateDeleteBuffers(context, n, buffers))
+            {
+                context->deleteBuffers(n, buffers);
+                ANGLE_CAPTURE(DeleteBuffers, context, n, buffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteFencesNV:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *fences =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFencesNV);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteFencesNV, n, fences);
+            if (context->skipValidation() || ValidateDeleteFencesNV(context, n, fences))
+            {
+                context->deleteFencesNV(n, fences);
+                ANGLE_CAPTURE(DeleteFencesNV, context, n, fences);
+            }
+            break;
+        }
+        case EntryPoint::DeleteFramebuffers:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *framebuffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFramebuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteFramebuffers, n, framebuffers);
+            if (context->skipValidation() || ValidateDeleteFramebuffers(context, n, framebuffers))
+            {
+                context->deleteFramebuffers(n, framebuffers);
+                ANGLE_CAPTURE(DeleteFramebuffers, context, n, framebuffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteFramebuffersOES:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *framebuffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFramebuffersOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteFramebuffersOES, n, framebuffers);
+            if (context->skipValidation() ||
+                ValidateDeleteFramebuffersOES(context, n, framebuffers))
+            {
+                context->deleteFramebuffers(n, framebuffers);
+                ANGLE_CAPTURE(DeleteFramebuffersOES, context, n, framebuffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteMemoryObjectsEXT:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *memoryObjects =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteMemoryObjectsEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteMemoryObjectsEXT, n, memoryObjects);
+            if (context->skipValidation() ||
+                ValidateDeleteMemoryObjectsEXT(context, n, memoryObjects))
+            {
+                context->deleteMemoryObjects(n, memoryObjects);
+                ANGLE_CAPTURE(DeleteMemoryObjectsEXT, context, n, memoryObjects);
+            }
+            break;
+        }
+        case EntryPoint::DeleteProgram:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteProgram);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteProgram, program);
+            if (context->skipValidation() || ValidateDeleteProgram(context, program))
+            {
+                context->deleteProgram(program);
+                ANGLE_CAPTURE(DeleteProgram, context, program);
+            }
+            break;
+        }
+        case EntryPoint::DeleteProgramPipelines:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *pipelines =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteProgramPipelines);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteProgramPipelines, n, pipelines);
+            if (context->skipValidation() || ValidateDeleteProgramPipelines(context, n, pipelines))
+            {
+                context->deleteProgramPipelines(n, pipelines);
+                ANGLE_CAPTURE(DeleteProgramPipelines, context, n, pipelines);
+            }
+            break;
+        }
+        case EntryPoint::DeleteQueries:
+        {
+            GLsizei n         = static_cast<GLsizei>(args[0]);
+            const GLuint *ids = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteQueries);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteQueries, n, ids);
+            if (context->skipValidation() || ValidateDeleteQueries(context, n, ids))
+            {
+                context->deleteQueries(n, ids);
+                ANGLE_CAPTURE(DeleteQueries, context, n, ids);
+            }
+            break;
+        }
+        case EntryPoint::DeleteQueriesEXT:
+        {
+            GLsizei n         = static_cast<GLsizei>(args[0]);
+            const GLuint *ids = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteQueriesEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteQueriesEXT, n, ids);
+            if (context->skipValidation() || ValidateDeleteQueriesEXT(context, n, ids))
+            {
+                context->deleteQueries(n, ids);
+                ANGLE_CAPTURE(DeleteQueriesEXT, context, n, ids);
+            }
+            break;
+        }
+        case EntryPoint::DeleteRenderbuffers:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *renderbuffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteRenderbuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteRenderbuffers, n, renderbuffers);
+            if (context->skipValidation() || ValidateDeleteRenderbuffers(context, n, renderbuffers))
+            {
+                context->deleteRenderbuffers(n, renderbuffers);
+                ANGLE_CAPTURE(DeleteRenderbuffers, context, n, renderbuffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteRenderbuffersOES:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *renderbuffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteRenderbuffersOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteRenderbuffersOES, n, renderbuffers);
+            if (context->skipValidation() ||
+                ValidateDeleteRenderbuffersOES(context, n, renderbuffers))
+            {
+                context->deleteRenderbuffers(n, renderbuffers);
+                ANGLE_CAPTURE(DeleteRenderbuffersOES, context, n, renderbuffers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteSamplers:
+        {
+            GLsizei count = static_cast<GLsizei>(args[0]);
+            const GLuint *samplers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSamplers);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteSamplers, count, samplers);
+            if (context->skipValidation() || ValidateDeleteSamplers(context, count, samplers))
+            {
+                context->deleteSamplers(count, samplers);
+                ANGLE_CAPTURE(DeleteSamplers, context, count, samplers);
+            }
+            break;
+        }
+        case EntryPoint::DeleteSemaphoresEXT:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *semaphores =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSemaphoresEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteSemaphoresEXT, n, semaphores);
+            if (context->skipValidation() || ValidateDeleteSemaphoresEXT(context, n, semaphores))
+            {
+                context->deleteSemaphores(n, semaphores);
+                ANGLE_CAPTURE(DeleteSemaphoresEXT, context, n, semaphores);
+            }
+            break;
+        }
+        case EntryPoint::DeleteShader:
+        {
+            GLuint shader = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteShader);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteShader, shader);
+            if (context->skipValidation() || ValidateDeleteShader(context, shader))
+            {
+                context->deleteShader(shader);
+                ANGLE_CAPTURE(DeleteShader, context, shader);
+            }
+            break;
+        }
+        case EntryPoint::DeleteSync:
+        {
+            GLsync sync = reinterpret_cast<GLsync>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSync);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteSync, sync);
+            if (context->skipValidation() || ValidateDeleteSync(context, sync))
+            {
+                context->deleteSync(sync);
+                ANGLE_CAPTURE(DeleteSync, context, sync);
+            }
+            break;
+        }
+        case EntryPoint::DeleteTextures:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *textures =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteTextures);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteTextures, n, textures);
+            if (context->skipValidation() || ValidateDeleteTextures(context, n, textures))
+            {
+                context->deleteTextures(n, textures);
+                ANGLE_CAPTURE(DeleteTextures, context, n, textures);
+            }
+            break;
+        }
+        case EntryPoint::DeleteTransformFeedbacks:
+        {
+            GLsizei n         = static_cast<GLsizei>(args[0]);
+            const GLuint *ids = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteTransformFeedbacks);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteTransformFeedbacks, n, ids);
+            if (context->skipValidation() || ValidateDeleteTransformFeedbacks(context, n, ids))
+            {
+                context->deleteTransformFeedbacks(n, ids);
+                ANGLE_CAPTURE(DeleteTransformFeedbacks, context, n, ids);
+            }
+            break;
+        }
+        case EntryPoint::DeleteVertexArrays:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *arrays =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteVertexArrays);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteVertexArrays, n, arrays);
+            if (context->skipValidation() || ValidateDeleteVertexArrays(context, n, arrays))
+            {
+                context->deleteVertexArrays(n, arrays);
+                ANGLE_CAPTURE(DeleteVertexArrays, context, n, arrays);
+            }
+            break;
+        }
+        case EntryPoint::DeleteVertexArraysOES:
+        {
+            GLsizei n = static_cast<GLsizei>(args[0]);
+            const GLuint *arrays =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteVertexArraysOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DeleteVertexArraysOES, n, arrays);
+            if (context->skipValidation() || ValidateDeleteVertexArraysOES(context, n, arrays))
+            {
+                context->deleteVertexArrays(n, arrays);
+                ANGLE_CAPTURE(DeleteVertexArraysOES, context, n, arrays);
+            }
+            break;
+        }
+        case EntryPoint::DepthFunc:
+        {
+            GLenum func = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthFunc);
+            ANGLE_BINARY_TRACE(EntryPoint::DepthFunc, func);
+            if (context->skipValidation() || ValidateDepthFunc(context, func))
+            {
+                context->depthFunc(func);
+                ANGLE_CAPTURE(DepthFunc, context, func);
+            }
+            break;
+        }
+        case EntryPoint::DepthMask:
+        {
+            GLboolean flag = static_cast<GLboolean>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthMask);
+            ANGLE_BINARY_TRACE(EntryPoint::DepthMask, flag);
+            if (context->skipValidation() || ValidateDepthMask(context, flag))
+            {
+                context->depthMask(flag);
+                ANGLE_CAPTURE(DepthMask, context, flag);
+            }
+            break;
+        }
+        case EntryPoint::DepthRangef:
+        {
+            GLfloat n = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat f = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthRangef);
+            ANGLE_BINARY_TRACE(EntryPoint::DepthRangef, n, f);
+            if (context->skipValidation() || ValidateDepthRangef(context, n, f))
+            {
+                context->depthRangef(n, f);
+                ANGLE_CAPTURE(DepthRangef, context, n, f);
+            }
+            break;
+        }
+        case EntryPoint::DepthRangex:
+        {
+            GLfixed n = static_cast<GLfixed>(args[0]);
+            GLfixed f = static_cast<GLfixed>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthRangex);
+            ANGLE_BINARY_TRACE(EntryPoint::DepthRangex, n, f);
+            if (context->skipValidation() || ValidateDepthRangex(context, n, f))
+            {
+                context->depthRangex(n, f);
+                ANGLE_CAPTURE(DepthRangex, context, n, f);
+            }
+            break;
+        }
+        case EntryPoint::DetachShader:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLuint shader  = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DetachShader);
+            ANGLE_BINARY_TRACE(EntryPoint::DetachShader, program, shader);
+            if (context->skipValidation() || ValidateDetachShader(context, program, shader))
+            {
+                context->detachShader(program, shader);
+                ANGLE_CAPTURE(DetachShader, context, program, shader);
+            }
+            break;
+        }
+        case EntryPoint::Disable:
+        {
+            GLenum cap = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Disable);
+            ANGLE_BINARY_TRACE(EntryPoint::Disable, cap);
+            if (context->skipValidation() || ValidateDisable(context, cap))
+            {
+                context->disable(cap);
+                ANGLE_CAPTURE(Disable, context, cap);
+            }
+            break;
+        }
+        case EntryPoint::DisableClientState:
+        {
+            GLenum array                      = static_cast<GLenum>(args[0]);
+            ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DisableClientState);
+            ANGLE_BINARY_TRACE(EntryPoint::DisableClientState, array);
+            if (context->skipValidation() || ValidateDisableClientState(context, arrayPacked))
+            {
+                context->disableClientState(arrayPacked);
+                ANGLE_CAPTURE(DisableClientState, context, array);
+            }
+            break;
+        }
+        case EntryPoint::DisableVertexAttribArray:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DisableVertexAttribArray);
+            ANGLE_BINARY_TRACE(EntryPoint::DisableVertexAttribArray, index);
+            if (context->skipValidation() || ValidateDisableVertexAttribArray(context, index))
+            {
+                context->disableVertexAttribArray(index);
+                ANGLE_CAPTURE(DisableVertexAttribArray, context, index);
+            }
+            break;
+        }
+        case EntryPoint::DiscardFramebufferEXT:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLsizei numAttachments = static_cast<GLsizei>(args[1]);
+            const GLenum *attachments =
+                reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DiscardFramebufferEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DiscardFramebufferEXT, target, numAttachments,
+                               attachments);
+            if (context->skipValidation() ||
+                ValidateDiscardFramebufferEXT(context, target, numAttachments, attachments))
+            {
+                context->discardFramebuffer(target, numAttachments, attachments);
+                ANGLE_CAPTURE(DiscardFramebufferEXT, context, target, numAttachments, attachments);
+            }
+            break;
+        }
+        case EntryPoint::DispatchCompute:
+        {
+            GLuint num_groups_x = static_cast<GLuint>(args[0]);
+            GLuint num_groups_y = static_cast<GLuint>(args[1]);
+            GLuint num_groups_z = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DispatchCompute);
+            ANGLE_BINARY_TRACE(EntryPoint::DispatchCompute, num_groups_x, num_groups_y,
+                               num_groups_z);
+            if (context->skipValidation() ||
+                ValidateDispatchCompute(context, num_groups_x, num_groups_y, num_groups_z))
+            {
+                context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+                ANGLE_CAPTURE(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
+            }
+            break;
+        }
+        case EntryPoint::DispatchComputeIndirect:
+        {
+            GLintptr indirect = static_cast<GLintptr>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DispatchComputeIndirect);
+            ANGLE_BINARY_TRACE(EntryPoint::DispatchComputeIndirect, indirect);
+            if (context->skipValidation() || ValidateDispatchComputeIndirect(context, indirect))
+            {
+                context->dispatchComputeIndirect(indirect);
+                ANGLE_CAPTURE(DispatchComputeIndirect, context, indirect);
+            }
+            break;
+        }
+        case EntryPoint::DrawArrays:
+        {
+            GLenum mode              = static_cast<GLenum>(args[0]);
+            GLint first              = static_cast<GLint>(args[1]);
+            GLsizei count            = static_cast<GLsizei>(args[2]);
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArrays);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawArrays, mode, first, count);
+            if (context->skipValidation() || ValidateDrawArrays(context, modePacked, first, count))
+            {
+                context->drawArrays(modePacked, first, count);
+                ANGLE_CAPTURE(DrawArrays, context, mode, first, count);
+            }
+            break;
+        }
+        case EntryPoint::DrawArraysIndirect:
+        {
+            GLenum mode          = static_cast<GLenum>(args[0]);
+            const void *indirect = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[1]));
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysIndirect);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawArraysIndirect, mode, indirect);
+            if (context->skipValidation() ||
+                ValidateDrawArraysIndirect(context, modePacked, indirect))
+            {
+                context->drawArraysIndirect(modePacked, indirect);
+                ANGLE_CAPTURE(DrawArraysIndirect, context, mode, indirect);
+            }
+            break;
+        }
+        case EntryPoint::DrawArraysInstanced:
+        {
+            GLenum mode              = static_cast<GLenum>(args[0]);
+            GLint first              = static_cast<GLint>(args[1]);
+            GLsizei count            = static_cast<GLsizei>(args[2]);
+            GLsizei instancecount    = static_cast<GLsizei>(args[3]);
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstanced);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstanced, mode, first, count, instancecount);
+            if (context->skipValidation() ||
+                ValidateDrawArraysInstanced(context, modePacked, first, count, instancecount))
+            {
+                context->drawArraysInstanced(modePacked, first, count, instancecount);
+                ANGLE_CAPTURE(DrawArraysInstanced, context, mode, first, count, instancecount);
+            }
+            break;
+        }
+        case EntryPoint::DrawArraysInstancedANGLE:
+        {
+            GLenum mode              = static_cast<GLenum>(args[0]);
+            GLint first              = static_cast<GLint>(args[1]);
+            GLsizei count            = static_cast<GLsizei>(args[2]);
+            GLsizei primcount        = static_cast<GLsizei>(args[3]);
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstancedANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstancedANGLE, mode, first, count, primcount);
+            if (context->skipValidation() ||
+                ValidateDrawArraysInstancedANGLE(context, modePacked, first, count, primcount))
+            {
+                context->drawArraysInstanced(modePacked, first, count, primcount);
+                ANGLE_CAPTURE(DrawArraysInstancedANGLE, context, mode, first, count, primcount);
+            }
+            break;
+        }
+        case EntryPoint::DrawArraysInstancedEXT:
+        {
+            GLenum mode              = static_cast<GLenum>(args[0]);
+            GLint start              = static_cast<GLint>(args[1]);
+            GLsizei count            = static_cast<GLsizei>(args[2]);
+            GLsizei primcount        = static_cast<GLsizei>(args[3]);
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstancedEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstancedEXT, mode, start, count, primcount);
+            if (context->skipValidation() ||
+                ValidateDrawArraysInstancedEXT(context, modePacked, start, count, primcount))
+            {
+                context->drawArraysInstanced(modePacked, start, count, primcount);
+                ANGLE_CAPTURE(DrawArraysInstancedEXT, context, mode, start, count, primcount);
+            }
+            break;
+        }
+        case EntryPoint::DrawBuffers:
+        {
+            GLsizei n          = static_cast<GLsizei>(args[0]);
+            const GLenum *bufs = reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawBuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawBuffers, n, bufs);
+            if (context->skipValidation() || ValidateDrawBuffers(context, n, bufs))
+            {
+                context->drawBuffers(n, bufs);
+                ANGLE_CAPTURE(DrawBuffers, context, n, bufs);
+            }
+            break;
+        }
+        case EntryPoint::DrawBuffersEXT:
+        {
+            GLsizei n          = static_cast<GLsizei>(args[0]);
+            const GLenum *bufs = reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawBuffersEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawBuffersEXT, n, bufs);
+            if (context->skipValidation() || ValidateDrawBuffersEXT(context, n, bufs))
+            {
+                context->drawBuffers(n, bufs);
+                ANGLE_CAPTURE(DrawBuffersEXT, context, n, bufs);
+            }
+            break;
+        }
+        case EntryPoint::DrawElements:
+        {
+            GLenum mode         = static_cast<GLenum>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLenum type         = static_cast<GLenum>(args[2]);
+            const void *indices = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElements);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawElements, mode, count, type, indices);
+            if (context->skipValidation() ||
+                ValidateDrawElements(context, modePacked, count, typePacked, indices))
+            {
+                context->drawElements(modePacked, count, typePacked, indices);
+                ANGLE_CAPTURE(DrawElements, context, mode, count, type, indices);
+            }
+            break;
+        }
+        case EntryPoint::DrawElementsIndirect:
+        {
+            GLenum mode          = static_cast<GLenum>(args[0]);
+            GLenum type          = static_cast<GLenum>(args[1]);
+            const void *indirect = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsIndirect);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawElementsIndirect, mode, type, indirect);
+            if (context->skipValidation() ||
+                ValidateDrawElementsIndirect(context, modePacked, typePacked, indirect))
+            {
+                context->drawElementsIndirect(modePacked, typePacked, indirect);
+                ANGLE_CAPTURE(DrawElementsIndirect, context, mode, type, indirect);
+            }
+            break;
+        }
+        case EntryPoint::DrawElementsInstanced:
+        {
+            GLenum mode           = static_cast<GLenum>(args[0]);
+            GLsizei count         = static_cast<GLsizei>(args[1]);
+            GLenum type           = static_cast<GLenum>(args[2]);
+            const void *indices   = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            GLsizei instancecount = static_cast<GLsizei>(args[4]);
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstanced);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstanced, mode, count, type, indices,
+                               instancecount);
+            if (context->skipValidation() ||
+                ValidateDrawElementsInstanced(context, modePacked, count, typePacked, indices,
+                                              instancecount))
+            {
+                context->drawElementsInstanced(modePacked, count, typePacked, indices,
+                                               instancecount);
+                ANGLE_CAPTURE(DrawElementsInstanced, context, mode, count, type, indices,
+                              instancecount);
+            }
+            break;
+        }
+        case EntryPoint::DrawElementsInstancedANGLE:
+        {
+            GLenum mode         = static_cast<GLenum>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLenum type         = static_cast<GLenum>(args[2]);
+            const void *indices = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            GLsizei primcount   = static_cast<GLsizei>(args[4]);
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstancedANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstancedANGLE, mode, count, type, indices,
+                               primcount);
+            if (context->skipValidation() ||
+                ValidateDrawElementsInstancedANGLE(context, modePacked, count, typePacked, indices,
+                                                   primcount))
+            {
+                context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+                ANGLE_CAPTURE(DrawElementsInstancedANGLE, context, mode, count, type, indices,
+                              primcount);
+            }
+            break;
+        }
+        case EntryPoint::DrawElementsInstancedEXT:
+        {
+            GLenum mode         = static_cast<GLenum>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLenum type         = static_cast<GLenum>(args[2]);
+            const void *indices = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            GLsizei primcount   = static_cast<GLsizei>(args[4]);
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstancedEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstancedEXT, mode, count, type, indices,
+                               primcount);
+            if (context->skipValidation() ||
+                ValidateDrawElementsInstancedEXT(context, modePacked, count, typePacked, indices,
+                                                 primcount))
+            {
+                context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+                ANGLE_CAPTURE(DrawElementsInstancedEXT, context, mode, count, type, indices,
+                              primcount);
+            }
+            break;
+        }
+        case EntryPoint::DrawRangeElements:
+        {
+            GLenum mode         = static_cast<GLenum>(args[0]);
+            GLuint start        = static_cast<GLuint>(args[1]);
+            GLuint end          = static_cast<GLuint>(args[2]);
+            GLsizei count       = static_cast<GLsizei>(args[3]);
+            GLenum type         = static_cast<GLenum>(args[4]);
+            const void *indices = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[5]));
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawRangeElements);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawRangeElements, mode, start, end, count, type,
+                               indices);
+            if (context->skipValidation() ||
+                ValidateDrawRangeElements(context, modePacked, start, end, count, typePacked,
+                                          indices))
+            {
+                context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
+                ANGLE_CAPTURE(DrawRangeElements, context, mode, start, end, count, type, indices);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexfOES:
+        {
+            GLfloat x      = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat y      = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat z      = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat width  = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat height = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexfOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexfOES, x, y, z, width, height);
+            if (context->skipValidation() || ValidateDrawTexfOES(context, x, y, z, width, height))
+            {
+                context->drawTexf(x, y, z, width, height);
+                ANGLE_CAPTURE(DrawTexfOES, context, x, y, z, width, height);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexfvOES:
+        {
+            const GLfloat *coords =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexfvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexfvOES, coords);
+            if (context->skipValidation() || ValidateDrawTexfvOES(context, coords))
+            {
+                context->drawTexfv(coords);
+                ANGLE_CAPTURE(DrawTexfvOES, context, coords);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexiOES:
+        {
+            GLint x      = static_cast<GLint>(args[0]);
+            GLint y      = static_cast<GLint>(args[1]);
+            GLint z      = static_cast<GLint>(args[2]);
+            GLint width  = static_cast<GLint>(args[3]);
+            GLint height = static_cast<GLint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexiOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexiOES, x, y, z, width, height);
+            if (context->skipValidation() || ValidateDrawTexiOES(context, x, y, z, width, height))
+            {
+                context->drawTexi(x, y, z, width, height);
+                ANGLE_CAPTURE(DrawTexiOES, context, x, y, z, width, height);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexivOES:
+        {
+            const GLint *coords = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexivOES, coords);
+            if (context->skipValidation() || ValidateDrawTexivOES(context, coords))
+            {
+                context->drawTexiv(coords);
+                ANGLE_CAPTURE(DrawTexivOES, context, coords);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexsOES:
+        {
+            GLshort x      = static_cast<GLshort>(args[0]);
+            GLshort y      = static_cast<GLshort>(args[1]);
+            GLshort z      = static_cast<GLshort>(args[2]);
+            GLshort width  = static_cast<GLshort>(args[3]);
+            GLshort height = static_cast<GLshort>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexsOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexsOES, x, y, z, width, height);
+            if (context->skipValidation() || ValidateDrawTexsOES(context, x, y, z, width, height))
+            {
+                context->drawTexs(x, y, z, width, height);
+                ANGLE_CAPTURE(DrawTexsOES, context, x, y, z, width, height);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexsvOES:
+        {
+            const GLshort *coords =
+                reinterpret_cast<const GLshort *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexsvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexsvOES, coords);
+            if (context->skipValidation() || ValidateDrawTexsvOES(context, coords))
+            {
+                context->drawTexsv(coords);
+                ANGLE_CAPTURE(DrawTexsvOES, context, coords);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexxOES:
+        {
+            GLfixed x      = static_cast<GLfixed>(args[0]);
+            GLfixed y      = static_cast<GLfixed>(args[1]);
+            GLfixed z      = static_cast<GLfixed>(args[2]);
+            GLfixed width  = static_cast<GLfixed>(args[3]);
+            GLfixed height = static_cast<GLfixed>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexxOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexxOES, x, y, z, width, height);
+            if (context->skipValidation() || ValidateDrawTexxOES(context, x, y, z, width, height))
+            {
+                context->drawTexx(x, y, z, width, height);
+                ANGLE_CAPTURE(DrawTexxOES, context, x, y, z, width, height);
+            }
+            break;
+        }
+        case EntryPoint::DrawTexxvOES:
+        {
+            const GLfixed *coords =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexxvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::DrawTexxvOES, coords);
+            if (context->skipValidation() || ValidateDrawTexxvOES(context, coords))
+            {
+                context->drawTexxv(coords);
+                ANGLE_CAPTURE(DrawTexxvOES, context, coords);
+            }
+            break;
+        }
+        case EntryPoint::EGLImageTargetRenderbufferStorageOES:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLeglImageOES image = reinterpret_cast<GLeglImageOES>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EGLImageTargetRenderbufferStorageOES);
+            ANGLE_BINARY_TRACE(EntryPoint::EGLImageTargetRenderbufferStorageOES, target, image);
+            if (context->skipValidation() ||
+                ValidateEGLImageTargetRenderbufferStorageOES(context, target, image))
+            {
+                context->eGLImageTargetRenderbufferStorage(target, image);
+                ANGLE_CAPTURE(EGLImageTargetRenderbufferStorageOES, context, target, image);
+            }
+            break;
+        }
+        case EntryPoint::EGLImageTargetTexture2DOES:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLeglImageOES image = reinterpret_cast<GLeglImageOES>(static_cast<uintptr_t>(args[1]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EGLImageTargetTexture2DOES);
+            ANGLE_BINARY_TRACE(EntryPoint::EGLImageTargetTexture2DOES, target, image);
+            if (context->skipValidation() ||
+                ValidateEGLImageTargetTexture2DOES(context, targetPacked, image))
+            {
+                context->eGLImageTargetTexture2D(targetPacked, image);
+                ANGLE_CAPTURE(EGLImageTargetTexture2DOES, context, target, image);
+            }
+            break;
+        }
+        case EntryPoint::Enable:
+        {
+            GLenum cap = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Enable);
+            ANGLE_BINARY_TRACE(EntryPoint::Enable, cap);
+            if (context->skipValidation() || ValidateEnable(context, cap))
+            {
+                context->enable(cap);
+                ANGLE_CAPTURE(Enable, context, cap);
+            }
+            break;
+        }
+        case EntryPoint::EnableClientState:
+        {
+            GLenum array                      = static_cast<GLenum>(args[0]);
+            ClientVertexArrayType arrayPacked = FromGLenum<ClientVertexArrayType>(array);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EnableClientState);
+            ANGLE_BINARY_TRACE(EntryPoint::EnableClientState, array);
+            if (context->skipValidation() || ValidateEnableClientState(context, arrayPacked))
+            {
+                context->enableClientState(arrayPacked);
+                ANGLE_CAPTURE(EnableClientState, context, array);
+            }
+            break;
+        }
+        case EntryPoint::EnableVertexAttribArray:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EnableVertexAttribArray);
+            ANGLE_BINARY_TRACE(EntryPoint::EnableVertexAttribArray, index);
+            if (context->skipValidation() || ValidateEnableVertexAttribArray(context, index))
+            {
+                context->enableVertexAttribArray(index);
+                ANGLE_CAPTURE(EnableVertexAttribArray, context, index);
+            }
+            break;
+        }
+        case EntryPoint::EndQuery:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndQuery);
+            ANGLE_BINARY_TRACE(EntryPoint::EndQuery, target);
+            if (context->skipValidation() || ValidateEndQuery(context, targetPacked))
+            {
+                context->endQuery(targetPacked);
+                ANGLE_CAPTURE(EndQuery, context, target);
+            }
+            break;
+        }
+        case EntryPoint::EndQueryEXT:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndQueryEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::EndQueryEXT, target);
+            if (context->skipValidation() || ValidateEndQueryEXT(context, targetPacked))
+            {
+                context->endQuery(targetPacked);
+                ANGLE_CAPTURE(EndQueryEXT, context, target);
+            }
+            break;
+        }
+        case EntryPoint::EndTransformFeedback:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndTransformFeedback);
+            ANGLE_BINARY_TRACE(EntryPoint::EndTransformFeedback);
+            if (context->skipValidation() || ValidateEndTransformFeedback(context))
+            {
+                context->endTransformFeedback();
+                ANGLE_CAPTURE(EndTransformFeedback, context);
+            }
+            break;
+        }
+        case EntryPoint::Finish:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Finish);
+            ANGLE_BINARY_TRACE(EntryPoint::Finish);
+            if (context->skipValidation() || ValidateFinish(context))
+            {
+                context->finish();
+                ANGLE_CAPTURE(Finish, context);
+            }
+            break;
+        }
+        case EntryPoint::FinishFenceNV:
+        {
+            GLuint fence = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FinishFenceNV);
+            ANGLE_BINARY_TRACE(EntryPoint::FinishFenceNV, fence);
+            if (context->skipValidation() || ValidateFinishFenceNV(context, fence))
+            {
+                context->finishFenceNV(fence);
+                ANGLE_CAPTURE(FinishFenceNV, context, fence);
+            }
+            break;
+        }
+        case EntryPoint::Flush:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Flush);
+            ANGLE_BINARY_TRACE(EntryPoint::Flush);
+            if (context->skipValidation() || ValidateFlush(context))
+            {
+                context->flush();
+                ANGLE_CAPTURE(Flush, context);
+            }
+            break;
+        }
+        case EntryPoint::FlushMappedBufferRange:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLintptr offset            = static_cast<GLintptr>(args[1]);
+            GLsizeiptr length          = static_cast<GLsizeiptr>(args[2]);
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FlushMappedBufferRange);
+            ANGLE_BINARY_TRACE(EntryPoint::FlushMappedBufferRange, target, offset, length);
+            if (context->skipValidation() ||
+                ValidateFlushMappedBufferRange(context, targetPacked, offset, length))
+            {
+                context->flushMappedBufferRange(targetPacked, offset, length);
+                ANGLE_CAPTURE(FlushMappedBufferRange, context, target, offset, length);
+            }
+            break;
+        }
+        case EntryPoint::FlushMappedBufferRangeEXT:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLintptr offset            = static_cast<GLintptr>(args[1]);
+            GLsizeiptr length          = static_cast<GLsizeiptr>(args[2]);
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FlushMappedBufferRangeEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::FlushMappedBufferRangeEXT, target, offset, length);
+            if (context->skipValidation() ||
+                ValidateFlushMappedBufferRangeEXT(context, targetPacked, offset, length))
+            {
+                context->flushMappedBufferRange(targetPacked, offset, length);
+                ANGLE_CAPTURE(FlushMappedBufferRangeEXT, context, target, offset, length);
+            }
+            break;
+        }
+        case EntryPoint::Fogf:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLfloat param = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogf);
+            ANGLE_BINARY_TRACE(EntryPoint::Fogf, pname, param);
+            if (context->skipValidation() || ValidateFogf(context, pname, param))
+            {
+                context->fogf(pname, param);
+                ANGLE_CAPTURE(Fogf, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Fogfv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogfv);
+            ANGLE_BINARY_TRACE(EntryPoint::Fogfv, pname, params);
+            if (context->skipValidation() || ValidateFogfv(context, pname, params))
+            {
+                context->fogfv(pname, params);
+                ANGLE_CAPTURE(Fogfv, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::Fogx:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLfixed param = static_cast<GLfixed>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogx);
+            ANGLE_BINARY_TRACE(EntryPoint::Fogx, pname, param);
+            if (context->skipValidation() || ValidateFogx(context, pname, param))
+            {
+                context->fogx(pname, param);
+                ANGLE_CAPTURE(Fogx, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Fogxv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            const GLfixed *param =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogxv);
+            ANGLE_BINARY_TRACE(EntryPoint::Fogxv, pname, param);
+            if (context->skipValidation() || ValidateFogxv(context, pname, param))
+            {
+                context->fogxv(pname, param);
+                ANGLE_CAPTURE(Fogxv, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferParameteri:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint param   = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferParameteri);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferParameteri, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateFramebufferParameteri(context, target, pname, param))
+            {
+                context->framebufferParameteri(target, pname, param);
+                ANGLE_CAPTURE(FramebufferParameteri, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferRenderbuffer:
+        {
+            GLenum target             = static_cast<GLenum>(args[0]);
+            GLenum attachment         = static_cast<GLenum>(args[1]);
+            GLenum renderbuffertarget = static_cast<GLenum>(args[2]);
+            GLuint renderbuffer       = static_cast<GLuint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferRenderbuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferRenderbuffer, target, attachment,
+                               renderbuffertarget, renderbuffer);
+            if (context->skipValidation() ||
+                ValidateFramebufferRenderbuffer(context, target, attachment, renderbuffertarget,
+                                                renderbuffer))
+            {
+                context->framebufferRenderbuffer(target, attachment, renderbuffertarget,
+                                                 renderbuffer);
+                ANGLE_CAPTURE(FramebufferRenderbuffer, context, target, attachment,
+                              renderbuffertarget, renderbuffer);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferRenderbufferOES:
+        {
+            GLenum target             = static_cast<GLenum>(args[0]);
+            GLenum attachment         = static_cast<GLenum>(args[1]);
+            GLenum renderbuffertarget = static_cast<GLenum>(args[2]);
+            GLuint renderbuffer       = static_cast<GLuint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferRenderbufferOES);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferRenderbufferOES, target, attachment,
+                               renderbuffertarget, renderbuffer);
+            if (context->skipValidation() ||
+                ValidateFramebufferRenderbufferOES(context, target, attachment, renderbuffertarget,
+                                                   renderbuffer))
+            {
+                context->framebufferRenderbuffer(target, attachment, renderbuffertarget,
+                                                 renderbuffer);
+                ANGLE_CAPTURE(FramebufferRenderbufferOES, context, target, attachment,
+                              renderbuffertarget, renderbuffer);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTexture2D:
+        {
+            GLenum target                 = static_cast<GLenum>(args[0]);
+            GLenum attachment             = static_cast<GLenum>(args[1]);
+            GLenum textarget              = static_cast<GLenum>(args[2]);
+            GLuint texture                = static_cast<GLuint>(args[3]);
+            GLint level                   = static_cast<GLint>(args[4]);
+            TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTexture2D);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferTexture2D, target, attachment, textarget,
+                               texture, level);
+            if (context->skipValidation() ||
+                ValidateFramebufferTexture2D(context, target, attachment, textargetPacked, texture,
+                                             level))
+            {
+                context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+                ANGLE_CAPTURE(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                              level);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTexture2DOES:
+        {
+            GLenum target                 = static_cast<GLenum>(args[0]);
+            GLenum attachment             = static_cast<GLenum>(args[1]);
+            GLenum textarget              = static_cast<GLenum>(args[2]);
+            GLuint texture                = static_cast<GLuint>(args[3]);
+            GLint level                   = static_cast<GLint>(args[4]);
+            TextureTarget textargetPacked = FromGLenum<TextureTarget>(textarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTexture2DOES);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferTexture2DOES, target, attachment, textarget,
+                               texture, level);
+            if (context->skipValidation() ||
+                ValidateFramebufferTexture2DOES(context, target, attachment, textargetPacked,
+                                                texture, level))
+            {
+                context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+                ANGLE_CAPTURE(FramebufferTexture2DOES, context, target, attachment, textarget,
+                              texture, level);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTextureEXT:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLenum attachment = static_cast<GLenum>(args[1]);
+            GLuint texture    = static_cast<GLuint>(args[2]);
+            GLint level       = static_cast<GLint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureEXT, target, attachment, texture,
+                               level);
+            if (context->skipValidation() ||
+                ValidateFramebufferTextureEXT(context, target, attachment, texture, level))
+            {
+                context->framebufferTexture(target, attachment, texture, level);
+                ANGLE_CAPTURE(FramebufferTextureEXT, context, target, attachment, texture, level);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTextureLayer:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLenum attachment = static_cast<GLenum>(args[1]);
+            GLuint texture    = static_cast<GLuint>(args[2]);
+            GLint level       = static_cast<GLint>(args[3]);
+            GLint layer       = static_cast<GLint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureLayer);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureLayer, target, attachment, texture,
+                               level, layer);
+            if (context->skipValidation() ||
+                ValidateFramebufferTextureLayer(context, target, attachment, texture, level, layer))
+            {
+                context->framebufferTextureLayer(target, attachment, texture, level, layer);
+                ANGLE_CAPTURE(FramebufferTextureLayer, context, target, attachment, texture, level,
+                              layer);
+            }
+            break;
+        }
+        case EntryPoint::FramebufferTextureMultiviewOVR:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLenum attachment   = static_cast<GLenum>(args[1]);
+            GLuint texture      = static_cast<GLuint>(args[2]);
+            GLint level         = static_cast<GLint>(args[3]);
+            GLint baseViewIndex = static_cast<GLint>(args[4]);
+            GLsizei numViews    = static_cast<GLsizei>(args[5]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureMultiviewOVR);
+            ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureMultiviewOVR, target, attachment,
+                               texture, level, baseViewIndex, numViews);
+            if (context->skipValidation() ||
+                ValidateFramebufferTextureMultiviewOVR(context, target, attachment, texture, level,
+                                                       baseViewIndex, numViews))
+            {
+                context->framebufferTextureMultiview(target, attachment, texture, level,
+                                                     baseViewIndex, numViews);
+                ANGLE_CAPTURE(FramebufferTextureMultiviewOVR, context, target, attachment, texture,
+                              level, baseViewIndex, numViews);
+            }
+            break;
+        }
+        case EntryPoint::FrontFace:
+        {
+            GLenum mode = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FrontFace);
+            ANGLE_BINARY_TRACE(EntryPoint::FrontFace, mode);
+            if (context->skipValidation() || ValidateFrontFace(context, mode))
+            {
+                context->frontFace(mode);
+                ANGLE_CAPTURE(FrontFace, context, mode);
+            }
+            break;
+        }
+        case EntryPoint::Frustumf:
+        {
+            GLfloat l = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat r = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat b = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat t = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat n = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            GLfloat f = bitCast<GLfloat>(static_cast<uint32_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Frustumf);
+            ANGLE_BINARY_TRACE(EntryPoint::Frustumf, l, r, b, t, n, f);
+            if (context->skipValidation() || ValidateFrustumf(context, l, r, b, t, n, f))
+            {
+                context->frustumf(l, r, b, t, n, f);
+                ANGLE_CAPTURE(Frustumf, context, l, r, b, t, n, f);
+            }
+            break;
+        }
+        case EntryPoint::Frustumx:
+        {
+            GLfixed l = static_cast<GLfixed>(args[0]);
+            GLfixed r = static_cast<GLfixed>(args[1]);
+            GLfixed b = static_cast<GLfixed>(args[2]);
+            GLfixed t = static_cast<GLfixed>(args[3]);
+            GLfixed n = static_cast<GLfixed>(args[4]);
+            GLfixed f = static_cast<GLfixed>(args[5]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Frustumx);
+            ANGLE_BINARY_TRACE(EntryPoint::Frustumx, l, r, b, t, n, f);
+            if (context->skipValidation() || ValidateFrustumx(context, l, r, b, t, n, f))
+            {
+                context->frustumx(l, r, b, t, n, f);
+                ANGLE_CAPTURE(Frustumx, context, l, r, b, t, n, f);
+            }
+            break;
+        }
+        case EntryPoint::GenBuffers:
+        {
+            GLsizei n       = static_cast<GLsizei>(args[0]);
+            GLuint *buffers = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenBuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::GenBuffers, n, buffers);
+            if (context->skipValidation() || ValidateGenBuffers(context, n, buffers))
+            {
+                context->genBuffers(n, buffers);
+                ANGLE_CAPTURE(GenBuffers, context, n, buffers);
+            }
+            break;
+        }
+        case EntryPoint::GenFencesNV:
+        {
+            GLsizei n      = static_cast<GLsizei>(args[0]);
+            GLuint *fences = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFencesNV);
+            ANGLE_BINARY_TRACE(EntryPoint::GenFencesNV, n, fences);
+            if (context->skipValidation() || ValidateGenFencesNV(context, n, fences))
+            {
+                context->genFencesNV(n, fences);
+                ANGLE_CAPTURE(GenFencesNV, context, n, fences);
+            }
+            break;
+        }
+        case EntryPoint::GenFramebuffers:
+        {
+            GLsizei n            = static_cast<GLsizei>(args[0]);
+            GLuint *framebuffers = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFramebuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::GenFramebuffers, n, framebuffers);
+            if (context->skipValidation() || ValidateGenFramebuffers(context, n, framebuffers))
+            {
+                context->genFramebuffers(n, framebuffers);
+                ANGLE_CAPTURE(GenFramebuffers, context, n, framebuffers);
+            }
+            break;
+        }
+        case EntryPoint::GenFramebuffersOES:
+        {
+            GLsizei n            = static_cast<GLsizei>(args[0]);
+            GLuint *framebuffers = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFramebuffersOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GenFramebuffersOES, n, framebuffers);
+            if (context->skipValidation() || ValidateGenFramebuffersOES(context, n, framebuffers))
+            {
+                context->genFramebuffers(n, framebuffers);
+                ANGLE_CAPTURE(GenFramebuffersOES, context, n, framebuffers);
+            }
+            break;
+        }
+        case EntryPoint::GenProgramPipelines:
+        {
+            GLsizei n         = static_cast<GLsizei>(args[0]);
+            GLuint *pipelines = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenProgramPipelines);
+            ANGLE_BINARY_TRACE(EntryPoint::GenProgramPipelines, n, pipelines);
+            if (context->skipValidation() || ValidateGenProgramPipelines(context, n, pipelines))
+            {
+                context->genProgramPipelines(n, pipelines);
+                ANGLE_CAPTURE(GenProgramPipelines, context, n, pipelines);
+            }
+            break;
+        }
+        case EntryPoint::GenQueries:
+        {
+            GLsizei n   = static_cast<GLsizei>(args[0]);
+            GLuint *ids = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenQueries);
+            ANGLE_BINARY_TRACE(EntryPoint::GenQueries, n, ids);
+            if (context->skipValidation() || ValidateGenQueries(context, n, ids))
+            {
+                context->genQueries(n, ids);
+                ANGLE_CAPTURE(GenQueries, context, n, ids);
+            }
+            break;
+        }
+        case EntryPoint::GenQueriesEXT:
+        {
+            GLsizei n   = static_cast<GLsizei>(args[0]);
+            GLuint *ids = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenQueriesEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GenQueriesEXT, n, ids);
+            if (context->skipValidation() || ValidateGenQueriesEXT(context, n, ids))
+            {
+                context->genQueries(n, ids);
+                ANGLE_CAPTURE(GenQueriesEXT, context, n, ids);
+            }
+            break;
+        }
+        case EntryPoint::GenRenderbuffers:
+        {
+            GLsizei n             = static_cast<GLsizei>(args[0]);
+            GLuint *renderbuffers = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenRenderbuffers);
+            ANGLE_BINARY_TRACE(EntryPoint::GenRenderbuffers, n, renderbuffers);
+            if (context->skipValidation() || ValidateGenRenderbuffers(context, n, renderbuffers))
+            {
+                context->genRenderbuffers(n, renderbuffers);
+                ANGLE_CAPTURE(GenRenderbuffers, context, n, renderbuffers);
+            }
+            break;
+        }
+        case EntryPoint::GenRenderbuffersOES:
+        {
+            GLsizei n             = static_cast<GLsizei>(args[0]);
+            GLuint *renderbuffers = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenRenderbuffersOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GenRenderbuffersOES, n, renderbuffers);
+            if (context->skipValidation() || ValidateGenRenderbuffersOES(context, n, renderbuffers))
+            {
+                context->genRenderbuffers(n, renderbuffers);
+                ANGLE_CAPTURE(GenRenderbuffersOES, context, n, renderbuffers);
+            }
+            break;
+        }
+        case EntryPoint::GenSamplers:
+        {
+            GLsizei count    = static_cast<GLsizei>(args[0]);
+            GLuint *samplers = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenSamplers);
+            ANGLE_BINARY_TRACE(EntryPoint::GenSamplers, count, samplers);
+            if (context->skipValidation() || ValidateGenSamplers(context, count, samplers))
+            {
+                context->genSamplers(count, samplers);
+                ANGLE_CAPTURE(GenSamplers, context, count, samplers);
+            }
+            break;
+        }
+        case EntryPoint::GenSemaphoresEXT:
+        {
+            GLsizei n          = static_cast<GLsizei>(args[0]);
+            GLuint *semaphores = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenSemaphoresEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GenSemaphoresEXT, n, semaphores);
+            if (context->skipValidation() || ValidateGenSemaphoresEXT(context, n, semaphores))
+            {
+                context->genSemaphores(n, semaphores);
+                ANGLE_CAPTURE(GenSemaphoresEXT, context, n, semaphores);
+            }
+            break;
+        }
+        case EntryPoint::GenTextures:
+        {
+            GLsizei n        = static_cast<GLsizei>(args[0]);
+            GLuint *textures = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenTextures);
+            ANGLE_BINARY_TRACE(EntryPoint::GenTextures, n, textures);
+            if (context->skipValidation() || ValidateGenTextures(context, n, textures))
+            {
+                context->genTextures(n, textures);
+                ANGLE_CAPTURE(GenTextures, context, n, textures);
+            }
+            break;
+        }
+        case EntryPoint::GenTransformFeedbacks:
+        {
+            GLsizei n   = static_cast<GLsizei>(args[0]);
+            GLuint *ids = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenTransformFeedbacks);
+            ANGLE_BINARY_TRACE(EntryPoint::GenTransformFeedbacks, n, ids);
+            if (context->skipValidation() || ValidateGenTransformFeedbacks(context, n, ids))
+            {
+                context->genTransformFeedbacks(n, ids);
+                ANGLE_CAPTURE(GenTransformFeedbacks, context, n, ids);
+            }
+            break;
+        }
+        case EntryPoint::GenVertexArrays:
+        {
+            GLsizei n      = static_cast<GLsizei>(args[0]);
+            GLuint *arrays = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenVertexArrays);
+            ANGLE_BINARY_TRACE(EntryPoint::GenVertexArrays, n, arrays);
+            if (context->skipValidation() || ValidateGenVertexArrays(context, n, arrays))
+            {
+                context->genVertexArrays(n, arrays);
+                ANGLE_CAPTURE(GenVertexArrays, context, n, arrays);
+            }
+            break;
+        }
+        case EntryPoint::GenVertexArraysOES:
+        {
+            GLsizei n      = static_cast<GLsizei>(args[0]);
+            GLuint *arrays = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenVertexArraysOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GenVertexArraysOES, n, arrays);
+            if (context->skipValidation() || ValidateGenVertexArraysOES(context, n, arrays))
+            {
+                context->genVertexArrays(n, arrays);
+                ANGLE_CAPTURE(GenVertexArraysOES, context, n, arrays);
+            }
+            break;
+        }
+        case EntryPoint::GenerateMipmap:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenerateMipmap);
+            ANGLE_BINARY_TRACE(EntryPoint::GenerateMipmap, target);
+            if (context->skipValidation() || ValidateGenerateMipmap(context, targetPacked))
+            {
+                context->generateMipmap(targetPacked);
+                ANGLE_CAPTURE(GenerateMipmap, context, target);
+            }
+            break;
+        }
+        case EntryPoint::GenerateMipmapOES:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenerateMipmapOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GenerateMipmapOES, target);
+            if (context->skipValidation() || ValidateGenerateMipmapOES(context, targetPacked))
+            {
+                context->generateMipmap(targetPacked);
+                ANGLE_CAPTURE(GenerateMipmapOES, context, target);
+            }
+            break;
+        }
+        case EntryPoint::GetActiveAttrib:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *size     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            GLenum *type    = reinterpret_cast<GLenum *>(static_cast<uintptr_t>(args[5]));
+            GLchar *name    = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[6]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveAttrib);
+            ANGLE_BINARY_TRACE(EntryPoint::GetActiveAttrib, program, index, bufSize, length, size,
+                               type, name);
+            if (context->skipValidation() ||
+                ValidateGetActiveAttrib(context, program, index, bufSize, length, size, type, name))
+            {
+                context->getActiveAttrib(program, index, bufSize, length, size, type, name);
+                ANGLE_CAPTURE(GetActiveAttrib, context, program, index, bufSize, length, size, type,
+                              name);
+            }
+            break;
+        }
+        case EntryPoint::GetActiveUniform:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *size     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            GLenum *type    = reinterpret_cast<GLenum *>(static_cast<uintptr_t>(args[5]));
+            GLchar *name    = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[6]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniform);
+            ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniform, program, index, bufSize, length, size,
+                               type, name);
+            if (context->skipValidation() ||
+                ValidateGetActiveUniform(context, program, index, bufSize, length, size, type,
+                                         name))
+            {
+                context->getActiveUniform(program, index, bufSize, length, size, type, name);
+                ANGLE_CAPTURE(GetActiveUniform, context, program, index, bufSize, length, size,
+                              type, name);
+            }
+            break;
+        }
+        case EntryPoint::GetActiveUniformBlockName:
+        {
+            GLuint program           = static_cast<GLuint>(args[0]);
+            GLuint uniformBlockIndex = static_cast<GLuint>(args[1]);
+            GLsizei bufSize          = static_cast<GLsizei>(args[2]);
+            GLsizei *length          = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLchar *uniformBlockName = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockName);
+            ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockName, program, uniformBlockIndex,
+                               bufSize, length, uniformBlockName);
+            if (context->skipValidation() ||
+                ValidateGetActiveUniformBlockName(context, program, uniformBlockIndex, bufSize,
+                                                  length, uniformBlockName))
+            {
+                context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
+                                                   uniformBlockName);
+                ANGLE_CAPTURE(GetActiveUniformBlockName, context, program, uniformBlockIndex,
+                              bufSize, length, uniformBlockName);
+            }
+            break;
+        }
+        case EntryPoint::GetActiveUniformBlockiv:
+        {
+            GLuint program           = static_cast<GLuint>(args[0]);
+            GLuint uniformBlockIndex = static_cast<GLuint>(args[1]);
+            GLenum pname             = static_cast<GLenum>(args[2]);
+            GLint *params            = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockiv, program, uniformBlockIndex,
+                               pname, params);
+            if (context->skipValidation() ||
+                ValidateGetActiveUniformBlockiv(context, program, uniformBlockIndex, pname, params))
+            {
+                context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
+                ANGLE_CAPTURE(GetActiveUniformBlockiv, context, program, uniformBlockIndex, pname,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetActiveUniformsiv:
+        {
+            GLuint program       = static_cast<GLuint>(args[0]);
+            GLsizei uniformCount = static_cast<GLsizei>(args[1]);
+            const GLuint *uniformIndices =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            GLenum pname  = static_cast<GLenum>(args[3]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformsiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformsiv, program, uniformCount,
+                               uniformIndices, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetActiveUniformsiv(context, program, uniformCount, uniformIndices, pname,
+                                            params))
+            {
+                context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
+                ANGLE_CAPTURE(GetActiveUniformsiv, context, program, uniformCount, uniformIndices,
+                              pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetAttachedShaders:
+        {
+            GLuint program   = static_cast<GLuint>(args[0]);
+            GLsizei maxCount = static_cast<GLsizei>(args[1]);
+            GLsizei *count   = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLuint *shaders  = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetAttachedShaders);
+            ANGLE_BINARY_TRACE(EntryPoint::GetAttachedShaders, program, maxCount, count, shaders);
+            if (context->skipValidation() ||
+                ValidateGetAttachedShaders(context, program, maxCount, count, shaders))
+            {
+                context->getAttachedShaders(program, maxCount, count, shaders);
+                ANGLE_CAPTURE(GetAttachedShaders, context, program, maxCount, count, shaders);
+            }
+            break;
+        }
+        case EntryPoint::GetBooleani_v:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLboolean *data = reinterpret_cast<GLboolean *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleani_v);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBooleani_v, target, index, data);
+            if (context->skipValidation() || ValidateGetBooleani_v(context, target, index, data))
+            {
+                context->getBooleani_v(target, index, data);
+                ANGLE_CAPTURE(GetBooleani_v, context, target, index, data);
+            }
+            break;
+        }
+        case EntryPoint::GetBooleanv:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLboolean *data = reinterpret_cast<GLboolean *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleanv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBooleanv, pname, data);
+            if (context->skipValidation() || ValidateGetBooleanv(context, pname, data))
+            {
+                context->getBooleanv(pname, data);
+                ANGLE_CAPTURE(GetBooleanv, context, pname, data);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferParameteri64v:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLint64 *params = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[2]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteri64v);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteri64v, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferParameteri64v(context, targetPacked, pname, params))
+            {
+                context->getBufferParameteri64v(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetBufferParameteri64v, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferParameteriv:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLenum pname               = static_cast<GLenum>(args[1]);
+            GLint *params              = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteriv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferParameteriv(context, targetPacked, pname, params))
+            {
+                context->getBufferParameteriv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetBufferParameteriv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferPointerv:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLenum pname               = static_cast<GLenum>(args[1]);
+            void **params              = reinterpret_cast<void **>(static_cast<uintptr_t>(args[2]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointerv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointerv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferPointerv(context, targetPacked, pname, params))
+            {
+                context->getBufferPointerv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetBufferPointerv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferPointervOES:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLenum pname               = static_cast<GLenum>(args[1]);
+            void **params              = reinterpret_cast<void **>(static_cast<uintptr_t>(args[2]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointervOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointervOES, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferPointervOES(context, targetPacked, pname, params))
+            {
+                context->getBufferPointerv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetBufferPointervOES, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetClipPlanef:
+        {
+            GLenum plane      = static_cast<GLenum>(args[0]);
+            GLfloat *equation = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetClipPlanef);
+            ANGLE_BINARY_TRACE(EntryPoint::GetClipPlanef, plane, equation);
+            if (context->skipValidation() || ValidateGetClipPlanef(context, plane, equation))
+            {
+                context->getClipPlanef(plane, equation);
+                ANGLE_CAPTURE(GetClipPlanef, context, plane, equation);
+            }
+            break;
+        }
+        case EntryPoint::GetClipPlanex:
+        {
+            GLenum plane      = static_cast<GLenum>(args[0]);
+            GLfixed *equation = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetClipPlanex);
+            ANGLE_BINARY_TRACE(EntryPoint::GetClipPlanex, plane, equation);
+            if (context->skipValidation() || ValidateGetClipPlanex(context, plane, equation))
+            {
+                context->getClipPlanex(plane, equation);
+                ANGLE_CAPTURE(GetClipPlanex, context, plane, equation);
+            }
+            break;
+        }
+        case EntryPoint::GetFenceivNV:
+        {
+            GLuint fence  = static_cast<GLuint>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFenceivNV);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFenceivNV, fence, pname, params);
+            if (context->skipValidation() || ValidateGetFenceivNV(context, fence, pname, params))
+            {
+                context->getFenceivNV(fence, pname, params);
+                ANGLE_CAPTURE(GetFenceivNV, context, fence, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFixedv:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLfixed *params = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFixedv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFixedv, pname, params);
+            if (context->skipValidation() || ValidateGetFixedv(context, pname, params))
+            {
+                context->getFixedv(pname, params);
+                ANGLE_CAPTURE(GetFixedv, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFloatv:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLfloat *data = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFloatv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFloatv, pname, data);
+            if (context->skipValidation() || ValidateGetFloatv(context, pname, data))
+            {
+                context->getFloatv(pname, data);
+                ANGLE_CAPTURE(GetFloatv, context, pname, data);
+            }
+            break;
+        }
+        case EntryPoint::GetFramebufferAttachmentParameteriv:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLenum attachment = static_cast<GLenum>(args[1]);
+            GLenum pname      = static_cast<GLenum>(args[2]);
+            GLint *params     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameteriv, target, attachment,
+                               pname, params);
+            if (context->skipValidation() || ValidateGetFramebufferAttachmentParameteriv(
+                                                 context, target, attachment, pname, params))
+            {
+                context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+                ANGLE_CAPTURE(GetFramebufferAttachmentParameteriv, context, target, attachment,
+                              pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFramebufferAttachmentParameterivOES:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLenum attachment = static_cast<GLenum>(args[1]);
+            GLenum pname      = static_cast<GLenum>(args[2]);
+            GLint *params     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameterivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameterivOES, target,
+                               attachment, pname, params);
+            if (context->skipValidation() || ValidateGetFramebufferAttachmentParameterivOES(
+                                                 context, target, attachment, pname, params))
+            {
+                context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+                ANGLE_CAPTURE(GetFramebufferAttachmentParameterivOES, context, target, attachment,
+                              pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFramebufferParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferParameteriv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetFramebufferParameteriv(context, target, pname, params))
+            {
+                context->getFramebufferParameteriv(target, pname, params);
+                ANGLE_CAPTURE(GetFramebufferParameteriv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetInteger64i_v:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLuint index  = static_cast<GLuint>(args[1]);
+            GLint64 *data = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64i_v);
+            ANGLE_BINARY_TRACE(EntryPoint::GetInteger64i_v, target, index, data);
+            if (context->skipValidation() || ValidateGetInteger64i_v(context, target, index, data))
+            {
+                context->getInteger64i_v(target, index, data);
+                ANGLE_CAPTURE(GetInteger64i_v, context, target, index, data);
+            }
+            break;
+        }
+        case EntryPoint::GetInteger64v:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLint64 *data = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64v);
+            ANGLE_BINARY_TRACE(EntryPoint::GetInteger64v, pname, data);
+            if (context->skipValidation() || ValidateGetInteger64v(context, pname, data))
+            {
+                context->getInteger64v(pname, data);
+                ANGLE_CAPTURE(GetInteger64v, context, pname, data);
+            }
+            break;
+        }
+        case EntryPoint::GetIntegeri_v:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLuint index  = static_cast<GLuint>(args[1]);
+            GLint *data   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegeri_v);
+            ANGLE_BINARY_TRACE(EntryPoint::GetIntegeri_v, target, index, data);
+            if (context->skipValidation() || ValidateGetIntegeri_v(context, target, index, data))
+            {
+                context->getIntegeri_v(target, index, data);
+                ANGLE_CAPTURE(GetIntegeri_v, context, target, index, data);
+            }
+            break;
+        }
+        case EntryPoint::GetIntegerv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            GLint *data  = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegerv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetIntegerv, pname, data);
+            if (context->skipValidation() || ValidateGetIntegerv(context, pname, data))
+            {
+                context->getIntegerv(pname, data);
+                ANGLE_CAPTURE(GetIntegerv, context, pname, data);
+            }
+            break;
+        }
+        case EntryPoint::GetInternalformativ:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLenum internalformat = static_cast<GLenum>(args[1]);
+            GLenum pname          = static_cast<GLenum>(args[2]);
+            GLsizei bufSize       = static_cast<GLsizei>(args[3]);
+            GLint *params         = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInternalformativ);
+            ANGLE_BINARY_TRACE(EntryPoint::GetInternalformativ, target, internalformat, pname,
+                               bufSize, params);
+            if (context->skipValidation() ||
+                ValidateGetInternalformativ(context, target, internalformat, pname, bufSize,
+                                            params))
+            {
+                context->getInternalformativ(target, internalformat, pname, bufSize, params);
+                ANGLE_CAPTURE(GetInternalformativ, context, target, internalformat, pname, bufSize,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetLightfv:
+        {
+            GLenum light    = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetLightfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetLightfv, light, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetLightfv(context, light, pnamePacked, params))
+            {
+                context->getLightfv(light, pnamePacked, params);
+                ANGLE_CAPTURE(GetLightfv, context, light, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetLightxv:
+        {
+            GLenum light    = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfixed *params = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[2]));
+            LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetLightxv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetLightxv, light, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetLightxv(context, light, pnamePacked, params))
+            {
+                context->getLightxv(light, pnamePacked, params);
+                ANGLE_CAPTURE(GetLightxv, context, light, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetMaterialfv:
+        {
+            GLenum face     = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMaterialfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetMaterialfv, face, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetMaterialfv(context, face, pnamePacked, params))
+            {
+                context->getMaterialfv(face, pnamePacked, params);
+                ANGLE_CAPTURE(GetMaterialfv, context, face, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetMaterialxv:
+        {
+            GLenum face     = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfixed *params = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[2]));
+            MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMaterialxv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetMaterialxv, face, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetMaterialxv(context, face, pnamePacked, params))
+            {
+                context->getMaterialxv(face, pnamePacked, params);
+                ANGLE_CAPTURE(GetMaterialxv, context, face, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetMemoryObjectParameterivEXT:
+        {
+            GLuint memoryObject = static_cast<GLuint>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            GLint *params       = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMemoryObjectParameterivEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetMemoryObjectParameterivEXT, memoryObject, pname,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetMemoryObjectParameterivEXT(context, memoryObject, pname, params))
+            {
+                context->getMemoryObjectParameteriv(memoryObject, pname, params);
+                ANGLE_CAPTURE(GetMemoryObjectParameterivEXT, context, memoryObject, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetMultisamplefv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            GLuint index = static_cast<GLuint>(args[1]);
+            GLfloat *val = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefv, pname, index, val);
+            if (context->skipValidation() || ValidateGetMultisamplefv(context, pname, index, val))
+            {
+                context->getMultisamplefv(pname, index, val);
+                ANGLE_CAPTURE(GetMultisamplefv, context, pname, index, val);
+            }
+            break;
+        }
+        case EntryPoint::GetObjectLabelKHR:
+        {
+            GLenum identifier = static_cast<GLenum>(args[0]);
+            GLuint name       = static_cast<GLuint>(args[1]);
+            GLsizei bufSize   = static_cast<GLsizei>(args[2]);
+            GLsizei *length   = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLchar *label     = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetObjectLabelKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::GetObjectLabelKHR, identifier, name, bufSize, length,
+                               label);
+            if (context->skipValidation() ||
+                ValidateGetObjectLabelKHR(context, identifier, name, bufSize, length, label))
+            {
+                context->getObjectLabel(identifier, name, bufSize, length, label);
+                ANGLE_CAPTURE(GetObjectLabelKHR, context, identifier, name, bufSize, length, label);
+            }
+            break;
+        }
+        case EntryPoint::GetObjectPtrLabelKHR:
+        {
+            const void *ptr = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[0]));
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLchar *label   = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetObjectPtrLabelKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::GetObjectPtrLabelKHR, ptr, bufSize, length, label);
+            if (context->skipValidation() ||
+                ValidateGetObjectPtrLabelKHR(context, ptr, bufSize, length, label))
+            {
+                context->getObjectPtrLabel(ptr, bufSize, length, label);
+                ANGLE_CAPTURE(GetObjectPtrLabelKHR, context, ptr, bufSize, length, label);
+            }
+            break;
+        }
+        case EntryPoint::GetPointerv:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            void **params = reinterpret_cast<void **>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointerv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetPointerv, pname, params);
+            if (context->skipValidation() || ValidateGetPointerv(context, pname, params))
+            {
+                context->getPointerv(pname, params);
+                ANGLE_CAPTURE(GetPointerv, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetPointervKHR:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            void **params = reinterpret_cast<void **>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointervKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::GetPointervKHR, pname, params);
+            if (context->skipValidation() || ValidateGetPointervKHR(context, pname, params))
+            {
+                context->getPointerv(pname, params);
+                ANGLE_CAPTURE(GetPointervKHR, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramBinary:
+        {
+            GLuint program       = static_cast<GLuint>(args[0]);
+            GLsizei bufSize      = static_cast<GLsizei>(args[1]);
+            GLsizei *length      = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLenum *binaryFormat = reinterpret_cast<GLenum *>(static_cast<uintptr_t>(args[3]));
+            void *binary         = reinterpret_cast<void *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramBinary);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramBinary, program, bufSize, length, binaryFormat,
+                               binary);
+            if (context->skipValidation() ||
+                ValidateGetProgramBinary(context, program, bufSize, length, binaryFormat, binary))
+            {
+                context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+                ANGLE_CAPTURE(GetProgramBinary, context, program, bufSize, length, binaryFormat,
+                              binary);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramBinaryOES:
+        {
+            GLuint program       = static_cast<GLuint>(args[0]);
+            GLsizei bufSize      = static_cast<GLsizei>(args[1]);
+            GLsizei *length      = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLenum *binaryFormat = reinterpret_cast<GLenum *>(static_cast<uintptr_t>(args[3]));
+            void *binary         = reinterpret_cast<void *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramBinaryOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramBinaryOES, program, bufSize, length,
+                               binaryFormat, binary);
+            if (context->skipValidation() ||
+                ValidateGetProgramBinaryOES(context, program, bufSize, length, binaryFormat,
+                                            binary))
+            {
+                context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+                ANGLE_CAPTURE(GetProgramBinaryOES, context, program, bufSize, length, binaryFormat,
+                              binary);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramInfoLog:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLchar *infoLog = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInfoLog);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramInfoLog, program, bufSize, length, infoLog);
+            if (context->skipValidation() ||
+                ValidateGetProgramInfoLog(context, program, bufSize, length, infoLog))
+            {
+                context->getProgramInfoLog(program, bufSize, length, infoLog);
+                ANGLE_CAPTURE(GetProgramInfoLog, context, program, bufSize, length, infoLog);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramInterfaceiv:
+        {
+            GLuint program          = static_cast<GLuint>(args[0]);
+            GLenum programInterface = static_cast<GLenum>(args[1]);
+            GLenum pname            = static_cast<GLenum>(args[2]);
+            GLint *params           = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInterfaceiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramInterfaceiv, program, programInterface, pname,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetProgramInterfaceiv(context, program, programInterface, pname, params))
+            {
+                context->getProgramInterfaceiv(program, programInterface, pname, params);
+                ANGLE_CAPTURE(GetProgramInterfaceiv, context, program, programInterface, pname,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramPipelineInfoLog:
+        {
+            GLuint pipeline = static_cast<GLuint>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLchar *infoLog = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramPipelineInfoLog);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramPipelineInfoLog, pipeline, bufSize, length,
+                               infoLog);
+            if (context->skipValidation() ||
+                ValidateGetProgramPipelineInfoLog(context, pipeline, bufSize, length, infoLog))
+            {
+                context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
+                ANGLE_CAPTURE(GetProgramPipelineInfoLog, context, pipeline, bufSize, length,
+                              infoLog);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramPipelineiv:
+        {
+            GLuint pipeline = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramPipelineiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramPipelineiv, pipeline, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetProgramPipelineiv(context, pipeline, pname, params))
+            {
+                context->getProgramPipelineiv(pipeline, pname, params);
+                ANGLE_CAPTURE(GetProgramPipelineiv, context, pipeline, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramResourceName:
+        {
+            GLuint program          = static_cast<GLuint>(args[0]);
+            GLenum programInterface = static_cast<GLenum>(args[1]);
+            GLuint index            = static_cast<GLuint>(args[2]);
+            GLsizei bufSize         = static_cast<GLsizei>(args[3]);
+            GLsizei *length         = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLchar *name            = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceName);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceName, program, programInterface, index,
+                               bufSize, length, name);
+            if (context->skipValidation() ||
+                ValidateGetProgramResourceName(context, program, programInterface, index, bufSize,
+                                               length, name))
+            {
+                context->getProgramResourceName(program, programInterface, index, bufSize, length,
+                                                name);
+                ANGLE_CAPTURE(GetProgramResourceName, context, program, programInterface, index,
+                              bufSize, length, name);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramResourceiv:
+        {
+            GLuint program          = static_cast<GLuint>(args[0]);
+            GLenum programInterface = static_cast<GLenum>(args[1]);
+            GLuint index            = static_cast<GLuint>(args[2]);
+            GLsizei propCount       = static_cast<GLsizei>(args[3]);
+            const GLenum *props = reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[4]));
+            GLsizei bufSize     = static_cast<GLsizei>(args[5]);
+            GLsizei *length     = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[6]));
+            GLint *params       = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[7]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceiv, program, programInterface, index,
+                               propCount, props, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetProgramResourceiv(context, program, programInterface, index, propCount,
+                                             props, bufSize, length, params))
+            {
+                context->getProgramResourceiv(program, programInterface, index, propCount, props,
+                                              bufSize, length, params);
+                ANGLE_CAPTURE(GetProgramResourceiv, context, program, programInterface, index,
+                              propCount, props, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramiv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLint *params  = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramiv, program, pname, params);
+            if (context->skipValidation() || ValidateGetProgramiv(context, program, pname, params))
+            {
+                context->getProgramiv(program, pname, params);
+                ANGLE_CAPTURE(GetProgramiv, context, program, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjecti64vEXT:
+        {
+            GLuint id       = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLint64 *params = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjecti64vEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjecti64vEXT, id, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjecti64vEXT(context, id, pname, params))
+            {
+                context->getQueryObjecti64v(id, pname, params);
+                ANGLE_CAPTURE(GetQueryObjecti64vEXT, context, id, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectivEXT:
+        {
+            GLuint id     = static_cast<GLuint>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectivEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectivEXT, id, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjectivEXT(context, id, pname, params))
+            {
+                context->getQueryObjectiv(id, pname, params);
+                ANGLE_CAPTURE(GetQueryObjectivEXT, context, id, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectui64vEXT:
+        {
+            GLuint id        = static_cast<GLuint>(args[0]);
+            GLenum pname     = static_cast<GLenum>(args[1]);
+            GLuint64 *params = reinterpret_cast<GLuint64 *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectui64vEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectui64vEXT, id, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjectui64vEXT(context, id, pname, params))
+            {
+                context->getQueryObjectui64v(id, pname, params);
+                ANGLE_CAPTURE(GetQueryObjectui64vEXT, context, id, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectuiv:
+        {
+            GLuint id      = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLuint *params = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuiv, id, pname, params);
+            if (context->skipValidation() || ValidateGetQueryObjectuiv(context, id, pname, params))
+            {
+                context->getQueryObjectuiv(id, pname, params);
+                ANGLE_CAPTURE(GetQueryObjectuiv, context, id, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectuivEXT:
+        {
+            GLuint id      = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLuint *params = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuivEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuivEXT, id, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjectuivEXT(context, id, pname, params))
+            {
+                context->getQueryObjectuiv(id, pname, params);
+                ANGLE_CAPTURE(GetQueryObjectuivEXT, context, id, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryiv:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLenum pname           = static_cast<GLenum>(args[1]);
+            GLint *params          = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryiv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryiv(context, targetPacked, pname, params))
+            {
+                context->getQueryiv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetQueryiv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryivEXT:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLenum pname           = static_cast<GLenum>(args[1]);
+            GLint *params          = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryivEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryivEXT, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryivEXT(context, targetPacked, pname, params))
+            {
+                context->getQueryiv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetQueryivEXT, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetRenderbufferParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameteriv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetRenderbufferParameteriv(context, target, pname, params))
+            {
+                context->getRenderbufferParameteriv(target, pname, params);
+                ANGLE_CAPTURE(GetRenderbufferParameteriv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetRenderbufferParameterivOES:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameterivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameterivOES, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetRenderbufferParameterivOES(context, target, pname, params))
+            {
+                context->getRenderbufferParameteriv(target, pname, params);
+                ANGLE_CAPTURE(GetRenderbufferParameterivOES, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterIivOES:
+        {
+            GLuint sampler = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLint *params  = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIivOES, sampler, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetSamplerParameterIivOES(context, sampler, pname, params))
+            {
+                context->getSamplerParameterIiv(sampler, pname, params);
+                ANGLE_CAPTURE(GetSamplerParameterIivOES, context, sampler, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterIuivOES:
+        {
+            GLuint sampler = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLuint *params = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIuivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIuivOES, sampler, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetSamplerParameterIuivOES(context, sampler, pname, params))
+            {
+                context->getSamplerParameterIuiv(sampler, pname, params);
+                ANGLE_CAPTURE(GetSamplerParameterIuivOES, context, sampler, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterfv:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterfv, sampler, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetSamplerParameterfv(context, sampler, pname, params))
+            {
+                context->getSamplerParameterfv(sampler, pname, params);
+                ANGLE_CAPTURE(GetSamplerParameterfv, context, sampler, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameteriv:
+        {
+            GLuint sampler = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLint *params  = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameteriv, sampler, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetSamplerParameteriv(context, sampler, pname, params))
+            {
+                context->getSamplerParameteriv(sampler, pname, params);
+                ANGLE_CAPTURE(GetSamplerParameteriv, context, sampler, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSemaphoreParameterui64vEXT:
+        {
+            GLuint semaphore = static_cast<GLuint>(args[0]);
+            GLenum pname     = static_cast<GLenum>(args[1]);
+            GLuint64 *params = reinterpret_cast<GLuint64 *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSemaphoreParameterui64vEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSemaphoreParameterui64vEXT, semaphore, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetSemaphoreParameterui64vEXT(context, semaphore, pname, params))
+            {
+                context->getSemaphoreParameterui64v(semaphore, pname, params);
+                ANGLE_CAPTURE(GetSemaphoreParameterui64vEXT, context, semaphore, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetShaderInfoLog:
+        {
+            GLuint shader   = static_cast<GLuint>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLchar *infoLog = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderInfoLog);
+            ANGLE_BINARY_TRACE(EntryPoint::GetShaderInfoLog, shader, bufSize, length, infoLog);
+            if (context->skipValidation() ||
+                ValidateGetShaderInfoLog(context, shader, bufSize, length, infoLog))
+            {
+                context->getShaderInfoLog(shader, bufSize, length, infoLog);
+                ANGLE_CAPTURE(GetShaderInfoLog, context, shader, bufSize, length, infoLog);
+            }
+            break;
+        }
+        case EntryPoint::GetShaderPrecisionFormat:
+        {
+            GLenum shadertype    = static_cast<GLenum>(args[0]);
+            GLenum precisiontype = static_cast<GLenum>(args[1]);
+            GLint *range         = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            GLint *precision     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderPrecisionFormat);
+            ANGLE_BINARY_TRACE(EntryPoint::GetShaderPrecisionFormat, shadertype, precisiontype,
+                               range, precision);
+            if (context->skipValidation() ||
+                ValidateGetShaderPrecisionFormat(context, shadertype, precisiontype, range,
+                                                 precision))
+            {
+                context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
+                ANGLE_CAPTURE(GetShaderPrecisionFormat, context, shadertype, precisiontype, range,
+                              precision);
+            }
+            break;
+        }
+        case EntryPoint::GetShaderSource:
+        {
+            GLuint shader   = static_cast<GLuint>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLchar *source  = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderSource);
+            ANGLE_BINARY_TRACE(EntryPoint::GetShaderSource, shader, bufSize, length, source);
+            if (context->skipValidation() ||
+                ValidateGetShaderSource(context, shader, bufSize, length, source))
+            {
+                context->getShaderSource(shader, bufSize, length, source);
+                ANGLE_CAPTURE(GetShaderSource, context, shader, bufSize, length, source);
+            }
+            break;
+        }
+        case EntryPoint::GetShaderiv:
+        {
+            GLuint shader = static_cast<GLuint>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetShaderiv, shader, pname, params);
+            if (context->skipValidation() || ValidateGetShaderiv(context, shader, pname, params))
+            {
+                context->getShaderiv(shader, pname, params);
+                ANGLE_CAPTURE(GetShaderiv, context, shader, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSynciv:
+        {
+            GLsync sync     = reinterpret_cast<GLsync>(static_cast<uintptr_t>(args[0]));
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *values   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSynciv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSynciv, sync, pname, bufSize, length, values);
+            if (context->skipValidation() ||
+                ValidateGetSynciv(context, sync, pname, bufSize, length, values))
+            {
+                context->getSynciv(sync, pname, bufSize, length, values);
+                ANGLE_CAPTURE(GetSynciv, context, sync, pname, bufSize, length, values);
+            }
+            break;
+        }
+        case EntryPoint::GetTexEnvfv:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnvfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexEnvfv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params))
+            {
+                context->getTexEnvfv(targetPacked, pnamePacked, params);
+                ANGLE_CAPTURE(GetTexEnvfv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexEnviv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnviv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexEnviv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexEnviv(context, targetPacked, pnamePacked, params))
+            {
+                context->getTexEnviv(targetPacked, pnamePacked, params);
+                ANGLE_CAPTURE(GetTexEnviv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexEnvxv:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfixed *params = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnvxv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexEnvxv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexEnvxv(context, targetPacked, pnamePacked, params))
+            {
+                context->getTexEnvxv(targetPacked, pnamePacked, params);
+                ANGLE_CAPTURE(GetTexEnvxv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexGenfvOES:
+        {
+            GLenum coord    = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenfvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexGenfvOES, coord, pname, params);
+            if (context->skipValidation() || ValidateGetTexGenfvOES(context, coord, pname, params))
+            {
+                context->getTexGenfv(coord, pname, params);
+                ANGLE_CAPTURE(GetTexGenfvOES, context, coord, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexGenivOES:
+        {
+            GLenum coord  = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexGenivOES, coord, pname, params);
+            if (context->skipValidation() || ValidateGetTexGenivOES(context, coord, pname, params))
+            {
+                context->getTexGeniv(coord, pname, params);
+                ANGLE_CAPTURE(GetTexGenivOES, context, coord, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexGenxvOES:
+        {
+            GLenum coord    = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfixed *params = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenxvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexGenxvOES, coord, pname, params);
+            if (context->skipValidation() || ValidateGetTexGenxvOES(context, coord, pname, params))
+            {
+                context->getTexGenxv(coord, pname, params);
+                ANGLE_CAPTURE(GetTexGenxvOES, context, coord, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexLevelParameterfv:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLint level     = static_cast<GLint>(args[1]);
+            GLenum pname    = static_cast<GLenum>(args[2]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[3]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfv, target, level, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params))
+            {
+                context->getTexLevelParameterfv(targetPacked, level, pname, params);
+                ANGLE_CAPTURE(GetTexLevelParameterfv, context, target, level, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexLevelParameteriv:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLint level                = static_cast<GLint>(args[1]);
+            GLenum pname               = static_cast<GLenum>(args[2]);
+            GLint *params              = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameteriv, target, level, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params))
+            {
+                context->getTexLevelParameteriv(targetPacked, level, pname, params);
+                ANGLE_CAPTURE(GetTexLevelParameteriv, context, target, level, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterIivOES:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLint *params            = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIivOES, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterIivOES(context, targetPacked, pname, params))
+            {
+                context->getTexParameterIiv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetTexParameterIivOES, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterIuivOES:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLuint *params           = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIuivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIuivOES, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterIuivOES(context, targetPacked, pname, params))
+            {
+                context->getTexParameterIuiv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetTexParameterIuivOES, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterfv:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLfloat *params          = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterfv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterfv(context, targetPacked, pname, params))
+            {
+                context->getTexParameterfv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetTexParameterfv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameteriv:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLint *params            = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameteriv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameteriv(context, targetPacked, pname, params))
+            {
+                context->getTexParameteriv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetTexParameteriv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterxv:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLfixed *params          = reinterpret_cast<GLfixed *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterxv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterxv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterxv(context, targetPacked, pname, params))
+            {
+                context->getTexParameterxv(targetPacked, pname, params);
+                ANGLE_CAPTURE(GetTexParameterxv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTransformFeedbackVarying:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLsizei *size   = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLenum *type    = reinterpret_cast<GLenum *>(static_cast<uintptr_t>(args[5]));
+            GLchar *name    = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[6]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTransformFeedbackVarying);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTransformFeedbackVarying, program, index, bufSize,
+                               length, size, type, name);
+            if (context->skipValidation() ||
+                ValidateGetTransformFeedbackVarying(context, program, index, bufSize, length, size,
+                                                    type, name))
+            {
+                context->getTransformFeedbackVarying(program, index, bufSize, length, size, type,
+                                                     name);
+                ANGLE_CAPTURE(GetTransformFeedbackVarying, context, program, index, bufSize, length,
+                              size, type, name);
+            }
+            break;
+        }
+        case EntryPoint::GetTranslatedShaderSourceANGLE:
+        {
+            GLuint shader   = static_cast<GLuint>(args[0]);
+            GLsizei bufsize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLchar *source  = reinterpret_cast<GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTranslatedShaderSourceANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTranslatedShaderSourceANGLE, shader, bufsize, length,
+                               source);
+            if (context->skipValidation() ||
+                ValidateGetTranslatedShaderSourceANGLE(context, shader, bufsize, length, source))
+            {
+                context->getTranslatedShaderSource(shader, bufsize, length, source);
+                ANGLE_CAPTURE(GetTranslatedShaderSourceANGLE, context, shader, bufsize, length,
+                              source);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformIndices:
+        {
+            GLuint program       = static_cast<GLuint>(args[0]);
+            GLsizei uniformCount = static_cast<GLsizei>(args[1]);
+            const GLchar *const *uniformNames =
+                reinterpret_cast<const GLchar *const *>(static_cast<uintptr_t>(args[2]));
+            GLuint *uniformIndices = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformIndices);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformIndices, program, uniformCount, uniformNames,
+                               uniformIndices);
+            if (context->skipValidation() ||
+                ValidateGetUniformIndices(context, program, uniformCount, uniformNames,
+                                          uniformIndices))
+            {
+                context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
+                ANGLE_CAPTURE(GetUniformIndices, context, program, uniformCount, uniformNames,
+                              uniformIndices);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformfv:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformfv, program, location, params);
+            if (context->skipValidation() ||
+                ValidateGetUniformfv(context, program, location, params))
+            {
+                context->getUniformfv(program, location, params);
+                ANGLE_CAPTURE(GetUniformfv, context, program, location, params);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformiv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLint *params  = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformiv, program, location, params);
+            if (context->skipValidation() ||
+                ValidateGetUniformiv(context, program, location, params))
+            {
+                context->getUniformiv(program, location, params);
+                ANGLE_CAPTURE(GetUniformiv, context, program, location, params);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformuiv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLuint *params = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformuiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformuiv, program, location, params);
+            if (context->skipValidation() ||
+                ValidateGetUniformuiv(context, program, location, params))
+            {
+                context->getUniformuiv(program, location, params);
+                ANGLE_CAPTURE(GetUniformuiv, context, program, location, params);
+            }
+            break;
+        }
+        case EntryPoint::GetUnsignedBytevEXT:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLubyte *data = reinterpret_cast<GLubyte *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUnsignedBytevEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUnsignedBytevEXT, pname, data);
+            if (context->skipValidation() || ValidateGetUnsignedBytevEXT(context, pname, data))
+            {
+                context->getUnsignedBytev(pname, data);
+                ANGLE_CAPTURE(GetUnsignedBytevEXT, context, pname, data);
+            }
+            break;
+        }
+        case EntryPoint::GetUnsignedBytei_vEXT:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLuint index  = static_cast<GLuint>(args[1]);
+            GLubyte *data = reinterpret_cast<GLubyte *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUnsignedBytei_vEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUnsignedBytei_vEXT, target, index, data);
+            if (context->skipValidation() ||
+                ValidateGetUnsignedBytei_vEXT(context, target, index, data))
+            {
+                context->getUnsignedBytei_v(target, index, data);
+                ANGLE_CAPTURE(GetUnsignedBytei_vEXT, context, target, index, data);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribIiv:
+        {
+            GLuint index  = static_cast<GLuint>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIiv, index, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetVertexAttribIiv(context, index, pname, params))
+            {
+                context->getVertexAttribIiv(index, pname, params);
+                ANGLE_CAPTURE(GetVertexAttribIiv, context, index, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribIuiv:
+        {
+            GLuint index   = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLuint *params = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIuiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIuiv, index, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetVertexAttribIuiv(context, index, pname, params))
+            {
+                context->getVertexAttribIuiv(index, pname, params);
+                ANGLE_CAPTURE(GetVertexAttribIuiv, context, index, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribPointerv:
+        {
+            GLuint index   = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            void **pointer = reinterpret_cast<void **>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribPointerv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribPointerv, index, pname, pointer);
+            if (context->skipValidation() ||
+                ValidateGetVertexAttribPointerv(context, index, pname, pointer))
+            {
+                context->getVertexAttribPointerv(index, pname, pointer);
+                ANGLE_CAPTURE(GetVertexAttribPointerv, context, index, pname, pointer);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribfv:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribfv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribfv, index, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetVertexAttribfv(context, index, pname, params))
+            {
+                context->getVertexAttribfv(index, pname, params);
+                ANGLE_CAPTURE(GetVertexAttribfv, context, index, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribiv:
+        {
+            GLuint index  = static_cast<GLuint>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLint *params = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribiv);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribiv, index, pname, params);
+            if (context->skipValidation() ||
+                ValidateGetVertexAttribiv(context, index, pname, params))
+            {
+                context->getVertexAttribiv(index, pname, params);
+                ANGLE_CAPTURE(GetVertexAttribiv, context, index, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetnUniformfvEXT:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformfvEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetnUniformfvEXT, program, location, bufSize, params);
+            if (context->skipValidation() ||
+                ValidateGetnUniformfvEXT(context, program, location, bufSize, params))
+            {
+                context->getnUniformfv(program, location, bufSize, params);
+                ANGLE_CAPTURE(GetnUniformfvEXT, context, program, location, bufSize, params);
+            }
+            break;
+        }
+        case EntryPoint::GetnUniformivEXT:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformivEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::GetnUniformivEXT, program, location, bufSize, params);
+            if (context->skipValidation() ||
+                ValidateGetnUniformivEXT(context, program, location, bufSize, params))
+            {
+                context->getnUniformiv(program, location, bufSize, params);
+                ANGLE_CAPTURE(GetnUniformivEXT, context, program, location, bufSize, params);
+            }
+            break;
+        }
+        case EntryPoint::Hint:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum mode   = static_cast<GLenum>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Hint);
+            ANGLE_BINARY_TRACE(EntryPoint::Hint, target, mode);
+            if (context->skipValidation() || ValidateHint(context, target, mode))
+            {
+                context->hint(target, mode);
+                ANGLE_CAPTURE(Hint, context, target, mode);
+            }
+            break;
+        }
+        case EntryPoint::ImportMemoryFdEXT:
+        {
+            GLuint memory               = static_cast<GLuint>(args[0]);
+            GLuint64 size               = static_cast<GLuint64>(args[1]);
+            GLenum handleType           = static_cast<GLenum>(args[2]);
+            GLint fd                    = static_cast<GLint>(args[3]);
+            HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ImportMemoryFdEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::ImportMemoryFdEXT, memory, size, handleType, fd);
+            if (context->skipValidation() ||
+                ValidateImportMemoryFdEXT(context, memory, size, handleTypePacked, fd))
+            {
+                context->importMemoryFd(memory, size, handleTypePacked, fd);
+                ANGLE_CAPTURE(ImportMemoryFdEXT, context, memory, size, handleType, fd);
+            }
+            break;
+        }
+        case EntryPoint::ImportSemaphoreFdEXT:
+        {
+            GLuint semaphore            = static_cast<GLuint>(args[0]);
+            GLenum handleType           = static_cast<GLenum>(args[1]);
+            GLint fd                    = static_cast<GLint>(args[2]);
+            HandleType handleTypePacked = FromGLenum<HandleType>(handleType);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ImportSemaphoreFdEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::ImportSemaphoreFdEXT, semaphore, handleType, fd);
+            if (context->skipValidation() ||
+                ValidateImportSemaphoreFdEXT(context, semaphore, handleTypePacked, fd))
+            {
+                context->importSemaphoreFd(semaphore, handleTypePacked, fd);
+                ANGLE_CAPTURE(ImportSemaphoreFdEXT, context, semaphore, handleType, fd);
+            }
+            break;
+        }
+        case EntryPoint::InsertEventMarkerEXT:
+        {
+            GLsizei length = static_cast<GLsizei>(args[0]);
+            const GLchar *marker =
+                reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InsertEventMarkerEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::InsertEventMarkerEXT, length, marker);
+            if (context->skipValidation() || ValidateInsertEventMarkerEXT(context, length, marker))
+            {
+                context->insertEventMarker(length, marker);
+                ANGLE_CAPTURE(InsertEventMarkerEXT, context, length, marker);
+            }
+            break;
+        }
+        case EntryPoint::InvalidateFramebuffer:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLsizei numAttachments = static_cast<GLsizei>(args[1]);
+            const GLenum *attachments =
+                reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InvalidateFramebuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::InvalidateFramebuffer, target, numAttachments,
+                               attachments);
+            if (context->skipValidation() ||
+                ValidateInvalidateFramebuffer(context, target, numAttachments, attachments))
+            {
+                context->invalidateFramebuffer(target, numAttachments, attachments);
+                ANGLE_CAPTURE(InvalidateFramebuffer, context, target, numAttachments, attachments);
+            }
+            break;
+        }
+        case EntryPoint::InvalidateSubFramebuffer:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLsizei numAttachments = static_cast<GLsizei>(args[1]);
+            const GLenum *attachments =
+                reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[2]));
+            GLint x        = static_cast<GLint>(args[3]);
+            GLint y        = static_cast<GLint>(args[4]);
+            GLsizei width  = static_cast<GLsizei>(args[5]);
+            GLsizei height = static_cast<GLsizei>(args[6]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InvalidateSubFramebuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::InvalidateSubFramebuffer, target, numAttachments,
+                               attachments, x, y, width, height);
+            if (context->skipValidation() ||
+                ValidateInvalidateSubFramebuffer(context, target, numAttachments, attachments, x, y,
+                                                 width, height))
+            {
+                context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width,
+                                                  height);
+                ANGLE_CAPTURE(InvalidateSubFramebuffer, context, target, numAttachments,
+                              attachments, x, y, width, height);
+            }
+            break;
+        }
+        case EntryPoint::LightModelf:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLfloat param = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelf);
+            ANGLE_BINARY_TRACE(EntryPoint::LightModelf, pname, param);
+            if (context->skipValidation() || ValidateLightModelf(context, pname, param))
+            {
+                context->lightModelf(pname, param);
+                ANGLE_CAPTURE(LightModelf, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::LightModelfv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelfv);
+            ANGLE_BINARY_TRACE(EntryPoint::LightModelfv, pname, params);
+            if (context->skipValidation() || ValidateLightModelfv(context, pname, params))
+            {
+                context->lightModelfv(pname, params);
+                ANGLE_CAPTURE(LightModelfv, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::LightModelx:
+        {
+            GLenum pname  = static_cast<GLenum>(args[0]);
+            GLfixed param = static_cast<GLfixed>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelx);
+            ANGLE_BINARY_TRACE(EntryPoint::LightModelx, pname, param);
+            if (context->skipValidation() || ValidateLightModelx(context, pname, param))
+            {
+                context->lightModelx(pname, param);
+                ANGLE_CAPTURE(LightModelx, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::LightModelxv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            const GLfixed *param =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelxv);
+            ANGLE_BINARY_TRACE(EntryPoint::LightModelxv, pname, param);
+            if (context->skipValidation() || ValidateLightModelxv(context, pname, param))
+            {
+                context->lightModelxv(pname, param);
+                ANGLE_CAPTURE(LightModelxv, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Lightf:
+        {
+            GLenum light               = static_cast<GLenum>(args[0]);
+            GLenum pname               = static_cast<GLenum>(args[1]);
+            GLfloat param              = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightf);
+            ANGLE_BINARY_TRACE(EntryPoint::Lightf, light, pname, param);
+            if (context->skipValidation() || ValidateLightf(context, light, pnamePacked, param))
+            {
+                context->lightf(light, pnamePacked, param);
+                ANGLE_CAPTURE(Lightf, context, light, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Lightfv:
+        {
+            GLenum light = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightfv);
+            ANGLE_BINARY_TRACE(EntryPoint::Lightfv, light, pname, params);
+            if (context->skipValidation() || ValidateLightfv(context, light, pnamePacked, params))
+            {
+                context->lightfv(light, pnamePacked, params);
+                ANGLE_CAPTURE(Lightfv, context, light, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::Lightx:
+        {
+            GLenum light               = static_cast<GLenum>(args[0]);
+            GLenum pname               = static_cast<GLenum>(args[1]);
+            GLfixed param              = static_cast<GLfixed>(args[2]);
+            LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightx);
+            ANGLE_BINARY_TRACE(EntryPoint::Lightx, light, pname, param);
+            if (context->skipValidation() || ValidateLightx(context, light, pnamePacked, param))
+            {
+                context->lightx(light, pnamePacked, param);
+                ANGLE_CAPTURE(Lightx, context, light, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Lightxv:
+        {
+            GLenum light = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            const GLfixed *params =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[2]));
+            LightParameter pnamePacked = FromGLenum<LightParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightxv);
+            ANGLE_BINARY_TRACE(EntryPoint::Lightxv, light, pname, params);
+            if (context->skipValidation() || ValidateLightxv(context, light, pnamePacked, params))
+            {
+                context->lightxv(light, pnamePacked, params);
+                ANGLE_CAPTURE(Lightxv, context, light, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::LineWidth:
+        {
+            GLfloat width = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LineWidth);
+            ANGLE_BINARY_TRACE(EntryPoint::LineWidth, width);
+            if (context->skipValidation() || ValidateLineWidth(context, width))
+            {
+                context->lineWidth(width);
+                ANGLE_CAPTURE(LineWidth, context, width);
+            }
+            break;
+        }
+        case EntryPoint::LineWidthx:
+        {
+            GLfixed width = static_cast<GLfixed>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LineWidthx);
+            ANGLE_BINARY_TRACE(EntryPoint::LineWidthx, width);
+            if (context->skipValidation() || ValidateLineWidthx(context, width))
+            {
+                context->lineWidthx(width);
+                ANGLE_CAPTURE(LineWidthx, context, width);
+            }
+            break;
+        }
+        case EntryPoint::LinkProgram:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LinkProgram);
+            ANGLE_BINARY_TRACE(EntryPoint::LinkProgram, program);
+            if (context->skipValidation() || ValidateLinkProgram(context, program))
+            {
+                context->linkProgram(program);
+                ANGLE_CAPTURE(LinkProgram, context, program);
+            }
+            break;
+        }
+        case EntryPoint::LoadIdentity:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadIdentity);
+            ANGLE_BINARY_TRACE(EntryPoint::LoadIdentity);
+            if (context->skipValidation() || ValidateLoadIdentity(context))
+            {
+                context->loadIdentity();
+                ANGLE_CAPTURE(LoadIdentity, context);
+            }
+            break;
+        }
+        case EntryPoint::LoadMatrixf:
+        {
+            const GLfloat *m = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadMatrixf);
+            ANGLE_BINARY_TRACE(EntryPoint::LoadMatrixf, m);
+            if (context->skipValidation() || ValidateLoadMatrixf(context, m))
+            {
+                context->loadMatrixf(m);
+                ANGLE_CAPTURE(LoadMatrixf, context, m);
+            }
+            break;
+        }
+        case EntryPoint::LoadMatrixx:
+        {
+            const GLfixed *m = reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadMatrixx);
+            ANGLE_BINARY_TRACE(EntryPoint::LoadMatrixx, m);
+            if (context->skipValidation() || ValidateLoadMatrixx(context, m))
+            {
+                context->loadMatrixx(m);
+                ANGLE_CAPTURE(LoadMatrixx, context, m);
+            }
+            break;
+        }
+        case EntryPoint::LoadPaletteFromModelViewMatrixOES:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadPaletteFromModelViewMatrixOES);
+            ANGLE_BINARY_TRACE(EntryPoint::LoadPaletteFromModelViewMatrixOES);
+            if (context->skipValidation() || ValidateLoadPaletteFromModelViewMatrixOES(context))
+            {
+                context->loadPaletteFromModelViewMatrix();
+                ANGLE_CAPTURE(LoadPaletteFromModelViewMatrixOES, context);
+            }
+            break;
+        }
+        case EntryPoint::LogicOp:
+        {
+            GLenum opcode                 = static_cast<GLenum>(args[0]);
+            LogicalOperation opcodePacked = FromGLenum<LogicalOperation>(opcode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LogicOp);
+            ANGLE_BINARY_TRACE(EntryPoint::LogicOp, opcode);
+            if (context->skipValidation() || ValidateLogicOp(context, opcodePacked))
+            {
+                context->logicOp(opcodePacked);
+                ANGLE_CAPTURE(LogicOp, context, opcode);
+            }
+            break;
+        }
+        case EntryPoint::Materialf:
+        {
+            GLenum face                   = static_cast<GLenum>(args[0]);
+            GLenum pname                  = static_cast<GLenum>(args[1]);
+            GLfloat param                 = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialf);
+            ANGLE_BINARY_TRACE(EntryPoint::Materialf, face, pname, param);
+            if (context->skipValidation() || ValidateMaterialf(context, face, pnamePacked, param))
+            {
+                context->materialf(face, pnamePacked, param);
+                ANGLE_CAPTURE(Materialf, context, face, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Materialfv:
+        {
+            GLenum face  = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialfv);
+            ANGLE_BINARY_TRACE(EntryPoint::Materialfv, face, pname, params);
+            if (context->skipValidation() || ValidateMaterialfv(context, face, pnamePacked, params))
+            {
+                context->materialfv(face, pnamePacked, params);
+                ANGLE_CAPTURE(Materialfv, context, face, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::Materialx:
+        {
+            GLenum face                   = static_cast<GLenum>(args[0]);
+            GLenum pname                  = static_cast<GLenum>(args[1]);
+            GLfixed param                 = static_cast<GLfixed>(args[2]);
+            MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialx);
+            ANGLE_BINARY_TRACE(EntryPoint::Materialx, face, pname, param);
+            if (context->skipValidation() || ValidateMaterialx(context, face, pnamePacked, param))
+            {
+                context->materialx(face, pnamePacked, param);
+                ANGLE_CAPTURE(Materialx, context, face, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Materialxv:
+        {
+            GLenum face  = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            const GLfixed *param =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[2]));
+            MaterialParameter pnamePacked = FromGLenum<MaterialParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialxv);
+            ANGLE_BINARY_TRACE(EntryPoint::Materialxv, face, pname, param);
+            if (context->skipValidation() || ValidateMaterialxv(context, face, pnamePacked, param))
+            {
+                context->materialxv(face, pnamePacked, param);
+                ANGLE_CAPTURE(Materialxv, context, face, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::MatrixIndexPointerOES:
+        {
+            GLint size          = static_cast<GLint>(args[0]);
+            GLenum type         = static_cast<GLenum>(args[1]);
+            GLsizei stride      = static_cast<GLsizei>(args[2]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixIndexPointerOES);
+            ANGLE_BINARY_TRACE(EntryPoint::MatrixIndexPointerOES, size, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidateMatrixIndexPointerOES(context, size, type, stride, pointer))
+            {
+                context->matrixIndexPointer(size, type, stride, pointer);
+                ANGLE_CAPTURE(MatrixIndexPointerOES, context, size, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::MatrixMode:
+        {
+            GLenum mode           = static_cast<GLenum>(args[0]);
+            MatrixType modePacked = FromGLenum<MatrixType>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixMode);
+            ANGLE_BINARY_TRACE(EntryPoint::MatrixMode, mode);
+            if (context->skipValidation() || ValidateMatrixMode(context, modePacked))
+            {
+                context->matrixMode(modePacked);
+                ANGLE_CAPTURE(MatrixMode, context, mode);
+            }
+            break;
+        }
+        case EntryPoint::MaxShaderCompilerThreadsKHR:
+        {
+            GLuint count = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MaxShaderCompilerThreadsKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::MaxShaderCompilerThreadsKHR, count);
+            if (context->skipValidation() || ValidateMaxShaderCompilerThreadsKHR(context, count))
+            {
+                context->maxShaderCompilerThreads(count);
+                ANGLE_CAPTURE(MaxShaderCompilerThreadsKHR, context, count);
+            }
+            break;
+        }
+        case EntryPoint::MemoryBarrier:
+        {
+            GLbitfield barriers = static_cast<GLbitfield>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryBarrier);
+            ANGLE_BINARY_TRACE(EntryPoint::MemoryBarrier, barriers);
+            if (context->skipValidation() || ValidateMemoryBarrier(context, barriers))
+            {
+                context->memoryBarrier(barriers);
+                ANGLE_CAPTURE(MemoryBarrier, context, barriers);
+            }
+            break;
+        }
+        case EntryPoint::MemoryBarrierByRegion:
+        {
+            GLbitfield barriers = static_cast<GLbitfield>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryBarrierByRegion);
+            ANGLE_BINARY_TRACE(EntryPoint::MemoryBarrierByRegion, barriers);
+            if (context->skipValidation() || ValidateMemoryBarrierByRegion(context, barriers))
+            {
+                context->memoryBarrierByRegion(barriers);
+                ANGLE_CAPTURE(MemoryBarrierByRegion, context, barriers);
+            }
+            break;
+        }
+        case EntryPoint::MemoryObjectParameterivEXT:
+        {
+            GLuint memoryObject = static_cast<GLuint>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryObjectParameterivEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::MemoryObjectParameterivEXT, memoryObject, pname, params);
+            if (context->skipValidation() ||
+                ValidateMemoryObjectParameterivEXT(context, memoryObject, pname, params))
+            {
+                context->memoryObjectParameteriv(memoryObject, pname, params);
+                ANGLE_CAPTURE(MemoryObjectParameterivEXT, context, memoryObject, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::MultMatrixf:
+        {
+            const GLfloat *m = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultMatrixf);
+            ANGLE_BINARY_TRACE(EntryPoint::MultMatrixf, m);
+            if (context->skipValidation() || ValidateMultMatrixf(context, m))
+            {
+                context->multMatrixf(m);
+                ANGLE_CAPTURE(MultMatrixf, context, m);
+            }
+            break;
+        }
+        case EntryPoint::MultMatrixx:
+        {
+            const GLfixed *m = reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultMatrixx);
+            ANGLE_BINARY_TRACE(EntryPoint::MultMatrixx, m);
+            if (context->skipValidation() || ValidateMultMatrixx(context, m))
+            {
+                context->multMatrixx(m);
+                ANGLE_CAPTURE(MultMatrixx, context, m);
+            }
+            break;
+        }
+        case EntryPoint::MultiTexCoord4f:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLfloat s     = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat t     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat r     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat q     = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiTexCoord4f);
+            ANGLE_BINARY_TRACE(EntryPoint::MultiTexCoord4f, target, s, t, r, q);
+            if (context->skipValidation() || ValidateMultiTexCoord4f(context, target, s, t, r, q))
+            {
+                context->multiTexCoord4f(target, s, t, r, q);
+                ANGLE_CAPTURE(MultiTexCoord4f, context, target, s, t, r, q);
+            }
+            break;
+        }
+        case EntryPoint::MultiTexCoord4x:
+        {
+            GLenum texture = static_cast<GLenum>(args[0]);
+            GLfixed s      = static_cast<GLfixed>(args[1]);
+            GLfixed t      = static_cast<GLfixed>(args[2]);
+            GLfixed r      = static_cast<GLfixed>(args[3]);
+            GLfixed q      = static_cast<GLfixed>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiTexCoord4x);
+            ANGLE_BINARY_TRACE(EntryPoint::MultiTexCoord4x, texture, s, t, r, q);
+            if (context->skipValidation() || ValidateMultiTexCoord4x(context, texture, s, t, r, q))
+            {
+                context->multiTexCoord4x(texture, s, t, r, q);
+                ANGLE_CAPTURE(MultiTexCoord4x, context, texture, s, t, r, q);
+            }
+            break;
+        }
+        case EntryPoint::Normal3f:
+        {
+            GLfloat nx = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat ny = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat nz = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Normal3f);
+            ANGLE_BINARY_TRACE(EntryPoint::Normal3f, nx, ny, nz);
+            if (context->skipValidation() || ValidateNormal3f(context, nx, ny, nz))
+            {
+                context->normal3f(nx, ny, nz);
+                ANGLE_CAPTURE(Normal3f, context, nx, ny, nz);
+            }
+            break;
+        }
+        case EntryPoint::Normal3x:
+        {
+            GLfixed nx = static_cast<GLfixed>(args[0]);
+            GLfixed ny = static_cast<GLfixed>(args[1]);
+            GLfixed nz = static_cast<GLfixed>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Normal3x);
+            ANGLE_BINARY_TRACE(EntryPoint::Normal3x, nx, ny, nz);
+            if (context->skipValidation() || ValidateNormal3x(context, nx, ny, nz))
+            {
+                context->normal3x(nx, ny, nz);
+                ANGLE_CAPTURE(Normal3x, context, nx, ny, nz);
+            }
+            break;
+        }
+        case EntryPoint::NormalPointer:
+        {
+            GLenum type         = static_cast<GLenum>(args[0]);
+            GLsizei stride      = static_cast<GLsizei>(args[1]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::NormalPointer);
+            ANGLE_BINARY_TRACE(EntryPoint::NormalPointer, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidateNormalPointer(context, typePacked, stride, pointer))
+            {
+                context->normalPointer(typePacked, stride, pointer);
+                ANGLE_CAPTURE(NormalPointer, context, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::ObjectLabelKHR:
+        {
+            GLenum identifier   = static_cast<GLenum>(args[0]);
+            GLuint name         = static_cast<GLuint>(args[1]);
+            GLsizei length      = static_cast<GLsizei>(args[2]);
+            const GLchar *label = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ObjectLabelKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::ObjectLabelKHR, identifier, name, length, label);
+            if (context->skipValidation() ||
+                ValidateObjectLabelKHR(context, identifier, name, length, label))
+            {
+                context->objectLabel(identifier, name, length, label);
+                ANGLE_CAPTURE(ObjectLabelKHR, context, identifier, name, length, label);
+            }
+            break;
+        }
+        case EntryPoint::ObjectPtrLabelKHR:
+        {
+            const void *ptr     = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[0]));
+            GLsizei length      = static_cast<GLsizei>(args[1]);
+            const GLchar *label = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ObjectPtrLabelKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::ObjectPtrLabelKHR, ptr, length, label);
+            if (context->skipValidation() || ValidateObjectPtrLabelKHR(context, ptr, length, label))
+            {
+                context->objectPtrLabel(ptr, length, label);
+                ANGLE_CAPTURE(ObjectPtrLabelKHR, context, ptr, length, label);
+            }
+            break;
+        }
+        case EntryPoint::Orthof:
+        {
+            GLfloat l = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat r = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat b = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat t = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat n = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            GLfloat f = bitCast<GLfloat>(static_cast<uint32_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Orthof);
+            ANGLE_BINARY_TRACE(EntryPoint::Orthof, l, r, b, t, n, f);
+            if (context->skipValidation() || ValidateOrthof(context, l, r, b, t, n, f))
+            {
+                context->orthof(l, r, b, t, n, f);
+                ANGLE_CAPTURE(Orthof, context, l, r, b, t, n, f);
+            }
+            break;
+        }
+        case EntryPoint::Orthox:
+        {
+            GLfixed l = static_cast<GLfixed>(args[0]);
+            GLfixed r = static_cast<GLfixed>(args[1]);
+            GLfixed b = static_cast<GLfixed>(args[2]);
+            GLfixed t = static_cast<GLfixed>(args[3]);
+            GLfixed n = static_cast<GLfixed>(args[4]);
+            GLfixed f = static_cast<GLfixed>(args[5]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Orthox);
+            ANGLE_BINARY_TRACE(EntryPoint::Orthox, l, r, b, t, n, f);
+            if (context->skipValidation() || ValidateOrthox(context, l, r, b, t, n, f))
+            {
+                context->orthox(l, r, b, t, n, f);
+                ANGLE_CAPTURE(Orthox, context, l, r, b, t, n, f);
+            }
+            break;
+        }
+        case EntryPoint::PauseTransformFeedback:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PauseTransformFeedback);
+            ANGLE_BINARY_TRACE(EntryPoint::PauseTransformFeedback);
+            if (context->skipValidation() || ValidatePauseTransformFeedback(context))
+            {
+                context->pauseTransformFeedback();
+                ANGLE_CAPTURE(PauseTransformFeedback, context);
+            }
+            break;
+        }
+        case EntryPoint::PixelStorei:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            GLint param  = static_cast<GLint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PixelStorei);
+            ANGLE_BINARY_TRACE(EntryPoint::PixelStorei, pname, param);
+            if (context->skipValidation() || ValidatePixelStorei(context, pname, param))
+            {
+                context->pixelStorei(pname, param);
+                ANGLE_CAPTURE(PixelStorei, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::PointParameterf:
+        {
+            GLenum pname               = static_cast<GLenum>(args[0]);
+            GLfloat param              = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterf);
+            ANGLE_BINARY_TRACE(EntryPoint::PointParameterf, pname, param);
+            if (context->skipValidation() || ValidatePointParameterf(context, pnamePacked, param))
+            {
+                context->pointParameterf(pnamePacked, param);
+                ANGLE_CAPTURE(PointParameterf, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::PointParameterfv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterfv);
+            ANGLE_BINARY_TRACE(EntryPoint::PointParameterfv, pname, params);
+            if (context->skipValidation() || ValidatePointParameterfv(context, pnamePacked, params))
+            {
+                context->pointParameterfv(pnamePacked, params);
+                ANGLE_CAPTURE(PointParameterfv, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::PointParameterx:
+        {
+            GLenum pname               = static_cast<GLenum>(args[0]);
+            GLfixed param              = static_cast<GLfixed>(args[1]);
+            PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterx);
+            ANGLE_BINARY_TRACE(EntryPoint::PointParameterx, pname, param);
+            if (context->skipValidation() || ValidatePointParameterx(context, pnamePacked, param))
+            {
+                context->pointParameterx(pnamePacked, param);
+                ANGLE_CAPTURE(PointParameterx, context, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::PointParameterxv:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            const GLfixed *params =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[1]));
+            PointParameter pnamePacked = FromGLenum<PointParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterxv);
+            ANGLE_BINARY_TRACE(EntryPoint::PointParameterxv, pname, params);
+            if (context->skipValidation() || ValidatePointParameterxv(context, pnamePacked, params))
+            {
+                context->pointParameterxv(pnamePacked, params);
+                ANGLE_CAPTURE(PointParameterxv, context, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::PointSize:
+        {
+            GLfloat size = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSize);
+            ANGLE_BINARY_TRACE(EntryPoint::PointSize, size);
+            if (context->skipValidation() || ValidatePointSize(context, size))
+            {
+                context->pointSize(size);
+                ANGLE_CAPTURE(PointSize, context, size);
+            }
+            break;
+        }
+        case EntryPoint::PointSizePointerOES:
+        {
+            GLenum type         = static_cast<GLenum>(args[0]);
+            GLsizei stride      = static_cast<GLsizei>(args[1]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSizePointerOES);
+            ANGLE_BINARY_TRACE(EntryPoint::PointSizePointerOES, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidatePointSizePointerOES(context, typePacked, stride, pointer))
+            {
+                context->pointSizePointer(typePacked, stride, pointer);
+                ANGLE_CAPTURE(PointSizePointerOES, context, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::PointSizex:
+        {
+            GLfixed size = static_cast<GLfixed>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSizex);
+            ANGLE_BINARY_TRACE(EntryPoint::PointSizex, size);
+            if (context->skipValidation() || ValidatePointSizex(context, size))
+            {
+                context->pointSizex(size);
+                ANGLE_CAPTURE(PointSizex, context, size);
+            }
+            break;
+        }
+        case EntryPoint::PolygonOffset:
+        {
+            GLfloat factor = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat units  = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PolygonOffset);
+            ANGLE_BINARY_TRACE(EntryPoint::PolygonOffset, factor, units);
+            if (context->skipValidation() || ValidatePolygonOffset(context, factor, units))
+            {
+                context->polygonOffset(factor, units);
+                ANGLE_CAPTURE(PolygonOffset, context, factor, units);
+            }
+            break;
+        }
+        case EntryPoint::PolygonOffsetx:
+        {
+            GLfixed factor = static_cast<GLfixed>(args[0]);
+            GLfixed units  = static_cast<GLfixed>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PolygonOffsetx);
+            ANGLE_BINARY_TRACE(EntryPoint::PolygonOffsetx, factor, units);
+            if (context->skipValidation() || ValidatePolygonOffsetx(context, factor, units))
+            {
+                context->polygonOffsetx(factor, units);
+                ANGLE_CAPTURE(PolygonOffsetx, context, factor, units);
+            }
+            break;
+        }
+        case EntryPoint::PopDebugGroupKHR:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopDebugGroupKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::PopDebugGroupKHR);
+            if (context->skipValidation() || ValidatePopDebugGroupKHR(context))
+            {
+                context->popDebugGroup();
+                ANGLE_CAPTURE(PopDebugGroupKHR, context);
+            }
+            break;
+        }
+        case EntryPoint::PopGroupMarkerEXT:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopGroupMarkerEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::PopGroupMarkerEXT);
+            if (context->skipValidation() || ValidatePopGroupMarkerEXT(context))
+            {
+                context->popGroupMarker();
+                ANGLE_CAPTURE(PopGroupMarkerEXT, context);
+            }
+            break;
+        }
+        case EntryPoint::PopMatrix:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopMatrix);
+            ANGLE_BINARY_TRACE(EntryPoint::PopMatrix);
+            if (context->skipValidation() || ValidatePopMatrix(context))
+            {
+                context->popMatrix();
+                ANGLE_CAPTURE(PopMatrix, context);
+            }
+            break;
+        }
+        case EntryPoint::ProgramBinary:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLenum binaryFormat = static_cast<GLenum>(args[1]);
+            const void *binary  = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLsizei length      = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramBinary);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramBinary, program, binaryFormat, binary, length);
+            if (context->skipValidation() ||
+                ValidateProgramBinary(context, program, binaryFormat, binary, length))
+            {
+                context->programBinary(program, binaryFormat, binary, length);
+                ANGLE_CAPTURE(ProgramBinary, context, program, binaryFormat, binary, length);
+            }
+            break;
+        }
+        case EntryPoint::ProgramBinaryOES:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLenum binaryFormat = static_cast<GLenum>(args[1]);
+            const void *binary  = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLint length        = static_cast<GLint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramBinaryOES);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramBinaryOES, program, binaryFormat, binary, length);
+            if (context->skipValidation() ||
+                ValidateProgramBinaryOES(context, program, binaryFormat, binary, length))
+            {
+                context->programBinary(program, binaryFormat, binary, length);
+                ANGLE_CAPTURE(ProgramBinaryOES, context, program, binaryFormat, binary, length);
+            }
+            break;
+        }
+        case EntryPoint::ProgramParameteri:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLint value    = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramParameteri);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramParameteri, program, pname, value);
+            if (context->skipValidation() ||
+                ValidateProgramParameteri(context, program, pname, value))
+            {
+                context->programParameteri(program, pname, value);
+                ANGLE_CAPTURE(ProgramParameteri, context, program, pname, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1f:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1f);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1f, program, location, v0);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1f(context, program, location, v0))
+            {
+                context->programUniform1f(program, location, v0);
+                ANGLE_CAPTURE(ProgramUniform1f, context, program, location, v0);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1fv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLsizei count  = static_cast<GLsizei>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1fv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1fv(context, program, location, count, value))
+            {
+                context->programUniform1fv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform1fv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1i:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLint v0       = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1i);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1i, program, location, v0);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1i(context, program, location, v0))
+            {
+                context->programUniform1i(program, location, v0);
+                ANGLE_CAPTURE(ProgramUniform1i, context, program, location, v0);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1iv:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLint location     = static_cast<GLint>(args[1]);
+            GLsizei count      = static_cast<GLsizei>(args[2]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1iv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1iv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1iv(context, program, location, count, value))
+            {
+                context->programUniform1iv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform1iv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1ui:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLuint v0      = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1ui);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1ui, program, location, v0);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1ui(context, program, location, v0))
+            {
+                context->programUniform1ui(program, location, v0);
+                ANGLE_CAPTURE(ProgramUniform1ui, context, program, location, v0);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform1uiv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1uiv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform1uiv(context, program, location, count, value))
+            {
+                context->programUniform1uiv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform1uiv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2f:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat v1     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2f);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2f, program, location, v0, v1);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2f(context, program, location, v0, v1))
+            {
+                context->programUniform2f(program, location, v0, v1);
+                ANGLE_CAPTURE(ProgramUniform2f, context, program, location, v0, v1);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2fv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLsizei count  = static_cast<GLsizei>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2fv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2fv(context, program, location, count, value))
+            {
+                context->programUniform2fv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform2fv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2i:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLint v0       = static_cast<GLint>(args[2]);
+            GLint v1       = static_cast<GLint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2i);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2i, program, location, v0, v1);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2i(context, program, location, v0, v1))
+            {
+                context->programUniform2i(program, location, v0, v1);
+                ANGLE_CAPTURE(ProgramUniform2i, context, program, location, v0, v1);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2iv:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLint location     = static_cast<GLint>(args[1]);
+            GLsizei count      = static_cast<GLsizei>(args[2]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2iv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2iv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2iv(context, program, location, count, value))
+            {
+                context->programUniform2iv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform2iv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2ui:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLuint v0      = static_cast<GLuint>(args[2]);
+            GLuint v1      = static_cast<GLuint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2ui);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2ui, program, location, v0, v1);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2ui(context, program, location, v0, v1))
+            {
+                context->programUniform2ui(program, location, v0, v1);
+                ANGLE_CAPTURE(ProgramUniform2ui, context, program, location, v0, v1);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform2uiv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2uiv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform2uiv(context, program, location, count, value))
+            {
+                context->programUniform2uiv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform2uiv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3f:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat v1     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat v2     = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3f);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3f, program, location, v0, v1, v2);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3f(context, program, location, v0, v1, v2))
+            {
+                context->programUniform3f(program, location, v0, v1, v2);
+                ANGLE_CAPTURE(ProgramUniform3f, context, program, location, v0, v1, v2);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3fv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLsizei count  = static_cast<GLsizei>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3fv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3fv(context, program, location, count, value))
+            {
+                context->programUniform3fv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform3fv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3i:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLint v0       = static_cast<GLint>(args[2]);
+            GLint v1       = static_cast<GLint>(args[3]);
+            GLint v2       = static_cast<GLint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3i);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3i, program, location, v0, v1, v2);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3i(context, program, location, v0, v1, v2))
+            {
+                context->programUniform3i(program, location, v0, v1, v2);
+                ANGLE_CAPTURE(ProgramUniform3i, context, program, location, v0, v1, v2);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3iv:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLint location     = static_cast<GLint>(args[1]);
+            GLsizei count      = static_cast<GLsizei>(args[2]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3iv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3iv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3iv(context, program, location, count, value))
+            {
+                context->programUniform3iv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform3iv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3ui:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLuint v0      = static_cast<GLuint>(args[2]);
+            GLuint v1      = static_cast<GLuint>(args[3]);
+            GLuint v2      = static_cast<GLuint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3ui);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3ui, program, location, v0, v1, v2);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3ui(context, program, location, v0, v1, v2))
+            {
+                context->programUniform3ui(program, location, v0, v1, v2);
+                ANGLE_CAPTURE(ProgramUniform3ui, context, program, location, v0, v1, v2);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform3uiv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3uiv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform3uiv(context, program, location, count, value))
+            {
+                context->programUniform3uiv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform3uiv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4f:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat v1     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat v2     = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            GLfloat v3     = bitCast<GLfloat>(static_cast<uint32_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4f);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4f, program, location, v0, v1, v2, v3);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4f(context, program, location, v0, v1, v2, v3))
+            {
+                context->programUniform4f(program, location, v0, v1, v2, v3);
+                ANGLE_CAPTURE(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4fv:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLsizei count  = static_cast<GLsizei>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4fv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4fv(context, program, location, count, value))
+            {
+                context->programUniform4fv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform4fv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4i:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLint v0       = static_cast<GLint>(args[2]);
+            GLint v1       = static_cast<GLint>(args[3]);
+            GLint v2       = static_cast<GLint>(args[4]);
+            GLint v3       = static_cast<GLint>(args[5]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4i);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4i, program, location, v0, v1, v2, v3);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4i(context, program, location, v0, v1, v2, v3))
+            {
+                context->programUniform4i(program, location, v0, v1, v2, v3);
+                ANGLE_CAPTURE(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4iv:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLint location     = static_cast<GLint>(args[1]);
+            GLsizei count      = static_cast<GLsizei>(args[2]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4iv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4iv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4iv(context, program, location, count, value))
+            {
+                context->programUniform4iv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform4iv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4ui:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLint location = static_cast<GLint>(args[1]);
+            GLuint v0      = static_cast<GLuint>(args[2]);
+            GLuint v1      = static_cast<GLuint>(args[3]);
+            GLuint v2      = static_cast<GLuint>(args[4]);
+            GLuint v3      = static_cast<GLuint>(args[5]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4ui);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4ui, program, location, v0, v1, v2, v3);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4ui(context, program, location, v0, v1, v2, v3))
+            {
+                context->programUniform4ui(program, location, v0, v1, v2, v3);
+                ANGLE_CAPTURE(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniform4uiv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4uiv, program, location, count, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniform4uiv(context, program, location, count, value))
+            {
+                context->programUniform4uiv(program, location, count, value);
+                ANGLE_CAPTURE(ProgramUniform4uiv, context, program, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix2fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix2fv(context, program, location, count, transpose,
+                                                value))
+            {
+                context->programUniformMatrix2fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                              value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix2x3fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2x3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2x3fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix2x3fv(context, program, location, count, transpose,
+                                                  value))
+            {
+                context->programUniformMatrix2x3fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix2x3fv, context, program, location, count,
+                              transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix2x4fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2x4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2x4fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix2x4fv(context, program, location, count, transpose,
+                                                  value))
+            {
+                context->programUniformMatrix2x4fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix2x4fv, context, program, location, count,
+                              transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix3fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix3fv(context, program, location, count, transpose,
+                                                value))
+            {
+                context->programUniformMatrix3fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                              value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix3x2fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3x2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3x2fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix3x2fv(context, program, location, count, transpose,
+                                                  value))
+            {
+                context->programUniformMatrix3x2fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix3x2fv, context, program, location, count,
+                              transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix3x4fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3x4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3x4fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix3x4fv(context, program, location, count, transpose,
+                                                  value))
+            {
+                context->programUniformMatrix3x4fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix3x4fv, context, program, location, count,
+                              transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix4fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix4fv(context, program, location, count, transpose,
+                                                value))
+            {
+                context->programUniformMatrix4fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                              value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix4x2fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4x2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4x2fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix4x2fv(context, program, location, count, transpose,
+                                                  value))
+            {
+                context->programUniformMatrix4x2fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix4x2fv, context, program, location, count,
+                              transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::ProgramUniformMatrix4x3fv:
+        {
+            GLuint program      = static_cast<GLuint>(args[0]);
+            GLint location      = static_cast<GLint>(args[1]);
+            GLsizei count       = static_cast<GLsizei>(args[2]);
+            GLboolean transpose = static_cast<GLboolean>(args[3]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4x3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4x3fv, program, location, count,
+                               transpose, value);
+            if (context->skipValidation() ||
+                ValidateProgramUniformMatrix4x3fv(context, program, location, count, transpose,
+                                                  value))
+            {
+                context->programUniformMatrix4x3fv(program, location, count, transpose, value);
+                ANGLE_CAPTURE(ProgramUniformMatrix4x3fv, context, program, location, count,
+                              transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::PushDebugGroupKHR:
+        {
+            GLenum source  = static_cast<GLenum>(args[0]);
+            GLuint id      = static_cast<GLuint>(args[1]);
+            GLsizei length = static_cast<GLsizei>(args[2]);
+            const GLchar *message =
+                reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushDebugGroupKHR);
+            ANGLE_BINARY_TRACE(EntryPoint::PushDebugGroupKHR, source, id, length, message);
+            if (context->skipValidation() ||
+                ValidatePushDebugGroupKHR(context, source, id, length, message))
+            {
+                context->pushDebugGroup(source, id, length, message);
+                ANGLE_CAPTURE(PushDebugGroupKHR, context, source, id, length, message);
+            }
+            break;
+        }
+        case EntryPoint::PushGroupMarkerEXT:
+        {
+            GLsizei length = static_cast<GLsizei>(args[0]);
+            const GLchar *marker =
+                reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushGroupMarkerEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::PushGroupMarkerEXT, length, marker);
+            if (context->skipValidation() || ValidatePushGroupMarkerEXT(context, length, marker))
+            {
+                context->pushGroupMarker(length, marker);
+                ANGLE_CAPTURE(PushGroupMarkerEXT, context, length, marker);
+            }
+            break;
+        }
+        case EntryPoint::PushMatrix:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushMatrix);
+            ANGLE_BINARY_TRACE(EntryPoint::PushMatrix);
+            if (context->skipValidation() || ValidatePushMatrix(context))
+            {
+                context->pushMatrix();
+                ANGLE_CAPTURE(PushMatrix, context);
+            }
+            break;
+        }
+        case EntryPoint::QueryCounterEXT:
+        {
+            GLuint id              = static_cast<GLuint>(args[0]);
+            GLenum target          = static_cast<GLenum>(args[1]);
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::QueryCounterEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::QueryCounterEXT, id, target);
+            if (context->skipValidation() || ValidateQueryCounterEXT(context, id, targetPacked))
+            {
+                context->queryCounter(id, targetPacked);
+                ANGLE_CAPTURE(QueryCounterEXT, context, id, target);
+            }
+            break;
+        }
+        case EntryPoint::ReadBuffer:
+        {
+            GLenum src = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadBuffer);
+            ANGLE_BINARY_TRACE(EntryPoint::ReadBuffer, src);
+            if (context->skipValidation() || ValidateReadBuffer(context, src))
+            {
+                context->readBuffer(src);
+                ANGLE_CAPTURE(ReadBuffer, context, src);
+            }
+            break;
+        }
+        case EntryPoint::ReadPixels:
+        {
+            GLint x        = static_cast<GLint>(args[0]);
+            GLint y        = static_cast<GLint>(args[1]);
+            GLsizei width  = static_cast<GLsizei>(args[2]);
+            GLsizei height = static_cast<GLsizei>(args[3]);
+            GLenum format  = static_cast<GLenum>(args[4]);
+            GLenum type    = static_cast<GLenum>(args[5]);
+            void *pixels   = reinterpret_cast<void *>(static_cast<uintptr_t>(args[6]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadPixels);
+            ANGLE_BINARY_TRACE(EntryPoint::ReadPixels, x, y, width, height, format, type, pixels);
+            if (context->skipValidation() ||
+                ValidateReadPixels(context, x, y, width, height, format, type, pixels))
+            {
+                context->readPixels(x, y, width, height, format, type, pixels);
+                ANGLE_CAPTURE(ReadPixels, context, x, y, width, height, format, type, pixels);
+            }
+            break;
+        }
+        case EntryPoint::ReadnPixelsEXT:
+        {
+            GLint x         = static_cast<GLint>(args[0]);
+            GLint y         = static_cast<GLint>(args[1]);
+            GLsizei width   = static_cast<GLsizei>(args[2]);
+            GLsizei height  = static_cast<GLsizei>(args[3]);
+            GLenum format   = static_cast<GLenum>(args[4]);
+            GLenum type     = static_cast<GLenum>(args[5]);
+            GLsizei bufSize = static_cast<GLsizei>(args[6]);
+            void *data      = reinterpret_cast<void *>(static_cast<uintptr_t>(args[7]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadnPixelsEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::ReadnPixelsEXT, x, y, width, height, format, type,
+                               bufSize, data);
+            if (context->skipValidation() ||
+                ValidateReadnPixelsEXT(context, x, y, width, height, format, type, bufSize, data))
+            {
+                context->readnPixels(x, y, width, height, format, type, bufSize, data);
+                ANGLE_CAPTURE(ReadnPixelsEXT, context, x, y, width, height, format, type, bufSize,
+                              data);
+            }
+            break;
+        }
+        case EntryPoint::ReleaseShaderCompiler:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReleaseShaderCompiler);
+            ANGLE_BINARY_TRACE(EntryPoint::ReleaseShaderCompiler);
+            if (context->skipValidation() || ValidateReleaseShaderCompiler(context))
+            {
+                context->releaseShaderCompiler();
+                ANGLE_CAPTURE(ReleaseShaderCompiler, context);
+            }
+            break;
+        }
+        case EntryPoint::RenderbufferStorage:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLenum internalformat = static_cast<GLenum>(args[1]);
+            GLsizei width         = static_cast<GLsizei>(args[2]);
+            GLsizei height        = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorage);
+            ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorage, target, internalformat, width,
+                               height);
+            if (context->skipValidation() ||
+                ValidateRenderbufferStorage(context, target, internalformat, width, height))
+            {
+                context->renderbufferStorage(target, internalformat, width, height);
+                ANGLE_CAPTURE(RenderbufferStorage, context, target, internalformat, width, height);
+            }
+            break;
+        }
+        case EntryPoint::RenderbufferStorageMultisample:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLsizei samples       = static_cast<GLsizei>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            GLsizei height        = static_cast<GLsizei>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageMultisample);
+            ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageMultisample, target, samples,
+                               internalformat, width, height);
+            if (context->skipValidation() ||
+                ValidateRenderbufferStorageMultisample(context, target, samples, internalformat,
+                                                       width, height))
+            {
+                context->renderbufferStorageMultisample(target, samples, internalformat, width,
+                                                        height);
+                ANGLE_CAPTURE(RenderbufferStorageMultisample, context, target, samples,
+                              internalformat, width, height);
+            }
+            break;
+        }
+        case EntryPoint::RenderbufferStorageMultisampleANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLsizei samples       = static_cast<GLsizei>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            GLsizei height        = static_cast<GLsizei>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageMultisampleANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageMultisampleANGLE, target, samples,
+                               internalformat, width, height);
+            if (context->skipValidation() ||
+                ValidateRenderbufferStorageMultisampleANGLE(context, target, samples,
+                                                            internalformat, width, height))
+            {
+                context->renderbufferStorageMultisample(target, samples, internalformat, width,
+                                                        height);
+                ANGLE_CAPTURE(RenderbufferStorageMultisampleANGLE, context, target, samples,
+                              internalformat, width, height);
+            }
+            break;
+        }
+        case EntryPoint::RenderbufferStorageOES:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLenum internalformat = static_cast<GLenum>(args[1]);
+            GLsizei width         = static_cast<GLsizei>(args[2]);
+            GLsizei height        = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageOES);
+            ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageOES, target, internalformat, width,
+                               height);
+            if (context->skipValidation() ||
+                ValidateRenderbufferStorageOES(context, target, internalformat, width, height))
+            {
+                context->renderbufferStorage(target, internalformat, width, height);
+                ANGLE_CAPTURE(RenderbufferStorageOES, context, target, internalformat, width,
+                              height);
+            }
+            break;
+        }
+        case EntryPoint::ResumeTransformFeedback:
+        {
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ResumeTransformFeedback);
+            ANGLE_BINARY_TRACE(EntryPoint::ResumeTransformFeedback);
+            if (context->skipValidation() || ValidateResumeTransformFeedback(context))
+            {
+                context->resumeTransformFeedback();
+                ANGLE_CAPTURE(ResumeTransformFeedback, context);
+            }
+            break;
+        }
+        case EntryPoint::Rotatef:
+        {
+            GLfloat angle = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat x     = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat y     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat z     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Rotatef);
+            ANGLE_BINARY_TRACE(EntryPoint::Rotatef, angle, x, y, z);
+            if (context->skipValidation() || ValidateRotatef(context, angle, x, y, z))
+            {
+                context->rotatef(angle, x, y, z);
+                ANGLE_CAPTURE(Rotatef, context, angle, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::Rotatex:
+        {
+            GLfixed angle = static_cast<GLfixed>(args[0]);
+            GLfixed x     = static_cast<GLfixed>(args[1]);
+            GLfixed y     = static_cast<GLfixed>(args[2]);
+            GLfixed z     = static_cast<GLfixed>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Rotatex);
+            ANGLE_BINARY_TRACE(EntryPoint::Rotatex, angle, x, y, z);
+            if (context->skipValidation() || ValidateRotatex(context, angle, x, y, z))
+            {
+                context->rotatex(angle, x, y, z);
+                ANGLE_CAPTURE(Rotatex, context, angle, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::SampleCoverage:
+        {
+            GLfloat value    = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLboolean invert = static_cast<GLboolean>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleCoverage);
+            ANGLE_BINARY_TRACE(EntryPoint::SampleCoverage, value, invert);
+            if (context->skipValidation() || ValidateSampleCoverage(context, value, invert))
+            {
+                context->sampleCoverage(value, invert);
+                ANGLE_CAPTURE(SampleCoverage, context, value, invert);
+            }
+            break;
+        }
+        case EntryPoint::SampleCoveragex:
+        {
+            GLclampx value   = static_cast<GLclampx>(args[0]);
+            GLboolean invert = static_cast<GLboolean>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleCoveragex);
+            ANGLE_BINARY_TRACE(EntryPoint::SampleCoveragex, value, invert);
+            if (context->skipValidation() || ValidateSampleCoveragex(context, value, invert))
+            {
+                context->sampleCoveragex(value, invert);
+                ANGLE_CAPTURE(SampleCoveragex, context, value, invert);
+            }
+            break;
+        }
+        case EntryPoint::SampleMaski:
+        {
+            GLuint maskNumber = static_cast<GLuint>(args[0]);
+            GLbitfield mask   = static_cast<GLbitfield>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleMaski);
+            ANGLE_BINARY_TRACE(EntryPoint::SampleMaski, maskNumber, mask);
+            if (context->skipValidation() || ValidateSampleMaski(context, maskNumber, mask))
+            {
+                context->sampleMaski(maskNumber, mask);
+                ANGLE_CAPTURE(SampleMaski, context, maskNumber, mask);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterIivOES:
+        {
+            GLuint sampler     = static_cast<GLuint>(args[0]);
+            GLenum pname       = static_cast<GLenum>(args[1]);
+            const GLint *param = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIivOES, sampler, pname, param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterIivOES(context, sampler, pname, param))
+            {
+                context->samplerParameterIiv(sampler, pname, param);
+                ANGLE_CAPTURE(SamplerParameterIivOES, context, sampler, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterIuivOES:
+        {
+            GLuint sampler      = static_cast<GLuint>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            const GLuint *param = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIuivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIuivOES, sampler, pname, param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterIuivOES(context, sampler, pname, param))
+            {
+                context->samplerParameterIuiv(sampler, pname, param);
+                ANGLE_CAPTURE(SamplerParameterIuivOES, context, sampler, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterf:
+        {
+            GLuint sampler = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLfloat param  = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterf);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterf, sampler, pname, param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterf(context, sampler, pname, param))
+            {
+                context->samplerParameterf(sampler, pname, param);
+                ANGLE_CAPTURE(SamplerParameterf, context, sampler, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterfv:
+        {
+            GLuint sampler = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            const GLfloat *param =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterfv);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterfv, sampler, pname, param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterfv(context, sampler, pname, param))
+            {
+                context->samplerParameterfv(sampler, pname, param);
+                ANGLE_CAPTURE(SamplerParameterfv, context, sampler, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameteri:
+        {
+            GLuint sampler = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLint param    = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameteri);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameteri, sampler, pname, param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameteri(context, sampler, pname, param))
+            {
+                context->samplerParameteri(sampler, pname, param);
+                ANGLE_CAPTURE(SamplerParameteri, context, sampler, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameteriv:
+        {
+            GLuint sampler     = static_cast<GLuint>(args[0]);
+            GLenum pname       = static_cast<GLenum>(args[1]);
+            const GLint *param = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameteriv, sampler, pname, param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameteriv(context, sampler, pname, param))
+            {
+                context->samplerParameteriv(sampler, pname, param);
+                ANGLE_CAPTURE(SamplerParameteriv, context, sampler, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::Scalef:
+        {
+            GLfloat x = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat y = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat z = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scalef);
+            ANGLE_BINARY_TRACE(EntryPoint::Scalef, x, y, z);
+            if (context->skipValidation() || ValidateScalef(context, x, y, z))
+            {
+                context->scalef(x, y, z);
+                ANGLE_CAPTURE(Scalef, context, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::Scalex:
+        {
+            GLfixed x = static_cast<GLfixed>(args[0]);
+            GLfixed y = static_cast<GLfixed>(args[1]);
+            GLfixed z = static_cast<GLfixed>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scalex);
+            ANGLE_BINARY_TRACE(EntryPoint::Scalex, x, y, z);
+            if (context->skipValidation() || ValidateScalex(context, x, y, z))
+            {
+                context->scalex(x, y, z);
+                ANGLE_CAPTURE(Scalex, context, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::Scissor:
+        {
+            GLint x        = static_cast<GLint>(args[0]);
+            GLint y        = static_cast<GLint>(args[1]);
+            GLsizei width  = static_cast<GLsizei>(args[2]);
+            GLsizei height = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scissor);
+            ANGLE_BINARY_TRACE(EntryPoint::Scissor, x, y, width, height);
+            if (context->skipValidation() || ValidateScissor(context, x, y, width, height))
+            {
+                context->scissor(x, y, width, height);
+                ANGLE_CAPTURE(Scissor, context, x, y, width, height);
+            }
+            break;
+        }
+        case EntryPoint::SemaphoreParameterui64vEXT:
+        {
+            GLuint semaphore = static_cast<GLuint>(args[0]);
+            GLenum pname     = static_cast<GLenum>(args[1]);
+            const GLuint64 *params =
+                reinterpret_cast<const GLuint64 *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SemaphoreParameterui64vEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::SemaphoreParameterui64vEXT, semaphore, pname, params);
+            if (context->skipValidation() ||
+                ValidateSemaphoreParameterui64vEXT(context, semaphore, pname, params))
+            {
+                context->semaphoreParameterui64v(semaphore, pname, params);
+                ANGLE_CAPTURE(SemaphoreParameterui64vEXT, context, semaphore, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::SetFenceNV:
+        {
+            GLuint fence     = static_cast<GLuint>(args[0]);
+            GLenum condition = static_cast<GLenum>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SetFenceNV);
+            ANGLE_BINARY_TRACE(EntryPoint::SetFenceNV, fence, condition);
+            if (context->skipValidation() || ValidateSetFenceNV(context, fence, condition))
+            {
+                context->setFenceNV(fence, condition);
+                ANGLE_CAPTURE(SetFenceNV, context, fence, condition);
+            }
+            break;
+        }
+        case EntryPoint::ShadeModel:
+        {
+            GLenum mode             = static_cast<GLenum>(args[0]);
+            ShadingModel modePacked = FromGLenum<ShadingModel>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShadeModel);
+            ANGLE_BINARY_TRACE(EntryPoint::ShadeModel, mode);
+            if (context->skipValidation() || ValidateShadeModel(context, modePacked))
+            {
+                context->shadeModel(modePacked);
+                ANGLE_CAPTURE(ShadeModel, context, mode);
+            }
+            break;
+        }
+        case EntryPoint::ShaderBinary:
+        {
+            GLsizei count = static_cast<GLsizei>(args[0]);
+            const GLuint *shaders =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            GLenum binaryformat = static_cast<GLenum>(args[2]);
+            const void *binary  = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            GLsizei length      = static_cast<GLsizei>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShaderBinary);
+            ANGLE_BINARY_TRACE(EntryPoint::ShaderBinary, count, shaders, binaryformat, binary,
+                               length);
+            if (context->skipValidation() ||
+                ValidateShaderBinary(context, count, shaders, binaryformat, binary, length))
+            {
+                context->shaderBinary(count, shaders, binaryformat, binary, length);
+                ANGLE_CAPTURE(ShaderBinary, context, count, shaders, binaryformat, binary, length);
+            }
+            break;
+        }
+        case EntryPoint::ShaderSource:
+        {
+            GLuint shader = static_cast<GLuint>(args[0]);
+            GLsizei count = static_cast<GLsizei>(args[1]);
+            const GLchar *const *string =
+                reinterpret_cast<const GLchar *const *>(static_cast<uintptr_t>(args[2]));
+            const GLint *length = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShaderSource);
+            ANGLE_BINARY_TRACE(EntryPoint::ShaderSource, shader, count, string, length);
+            if (context->skipValidation() ||
+                ValidateShaderSource(context, shader, count, string, length))
+            {
+                context->shaderSource(shader, count, string, length);
+                ANGLE_CAPTURE(ShaderSource, context, shader, count, string, length);
+            }
+            break;
+        }
+        case EntryPoint::SignalSemaphoreEXT:
+        {
+            GLuint semaphore         = static_cast<GLuint>(args[0]);
+            GLuint numBufferBarriers = static_cast<GLuint>(args[1]);
+            const GLuint *buffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            GLuint numTextureBarriers = static_cast<GLuint>(args[3]);
+            const GLuint *textures =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[4]));
+            const GLenum *dstLayouts =
+                reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SignalSemaphoreEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::SignalSemaphoreEXT, semaphore, numBufferBarriers,
+                               buffers, numTextureBarriers, textures, dstLayouts);
+            if (context->skipValidation() ||
+                ValidateSignalSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
+                                           numTextureBarriers, textures, dstLayouts))
+            {
+                context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                                         textures, dstLayouts);
+                ANGLE_CAPTURE(SignalSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                              numTextureBarriers, textures, dstLayouts);
+            }
+            break;
+        }
+        case EntryPoint::StencilFunc:
+        {
+            GLenum func = static_cast<GLenum>(args[0]);
+            GLint ref   = static_cast<GLint>(args[1]);
+            GLuint mask = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFunc);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilFunc, func, ref, mask);
+            if (context->skipValidation() || ValidateStencilFunc(context, func, ref, mask))
+            {
+                context->stencilFunc(func, ref, mask);
+                ANGLE_CAPTURE(StencilFunc, context, func, ref, mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilFuncSeparate:
+        {
+            GLenum face = static_cast<GLenum>(args[0]);
+            GLenum func = static_cast<GLenum>(args[1]);
+            GLint ref   = static_cast<GLint>(args[2]);
+            GLuint mask = static_cast<GLuint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFuncSeparate);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilFuncSeparate, face, func, ref, mask);
+            if (context->skipValidation() ||
+                ValidateStencilFuncSeparate(context, face, func, ref, mask))
+            {
+                context->stencilFuncSeparate(face, func, ref, mask);
+                ANGLE_CAPTURE(StencilFuncSeparate, context, face, func, ref, mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilMask:
+        {
+            GLuint mask = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilMask);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilMask, mask);
+            if (context->skipValidation() || ValidateStencilMask(context, mask))
+            {
+                context->stencilMask(mask);
+                ANGLE_CAPTURE(StencilMask, context, mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilMaskSeparate:
+        {
+            GLenum face = static_cast<GLenum>(args[0]);
+            GLuint mask = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilMaskSeparate);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilMaskSeparate, face, mask);
+            if (context->skipValidation() || ValidateStencilMaskSeparate(context, face, mask))
+            {
+                context->stencilMaskSeparate(face, mask);
+                ANGLE_CAPTURE(StencilMaskSeparate, context, face, mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilOp:
+        {
+            GLenum fail  = static_cast<GLenum>(args[0]);
+            GLenum zfail = static_cast<GLenum>(args[1]);
+            GLenum zpass = static_cast<GLenum>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilOp);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilOp, fail, zfail, zpass);
+            if (context->skipValidation() || ValidateStencilOp(context, fail, zfail, zpass))
+            {
+                context->stencilOp(fail, zfail, zpass);
+                ANGLE_CAPTURE(StencilOp, context, fail, zfail, zpass);
+            }
+            break;
+        }
+        case EntryPoint::StencilOpSeparate:
+        {
+            GLenum face   = static_cast<GLenum>(args[0]);
+            GLenum sfail  = static_cast<GLenum>(args[1]);
+            GLenum dpfail = static_cast<GLenum>(args[2]);
+            GLenum dppass = static_cast<GLenum>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilOpSeparate);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilOpSeparate, face, sfail, dpfail, dppass);
+            if (context->skipValidation() ||
+                ValidateStencilOpSeparate(context, face, sfail, dpfail, dppass))
+            {
+                context->stencilOpSeparate(face, sfail, dpfail, dppass);
+                ANGLE_CAPTURE(StencilOpSeparate, context, face, sfail, dpfail, dppass);
+            }
+            break;
+        }
+        case EntryPoint::TexCoordPointer:
+        {
+            GLint size          = static_cast<GLint>(args[0]);
+            GLenum type         = static_cast<GLenum>(args[1]);
+            GLsizei stride      = static_cast<GLsizei>(args[2]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexCoordPointer);
+            ANGLE_BINARY_TRACE(EntryPoint::TexCoordPointer, size, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidateTexCoordPointer(context, size, typePacked, stride, pointer))
+            {
+                context->texCoordPointer(size, typePacked, stride, pointer);
+                ANGLE_CAPTURE(TexCoordPointer, context, size, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::TexEnvf:
+        {
+            GLenum target                   = static_cast<GLenum>(args[0]);
+            GLenum pname                    = static_cast<GLenum>(args[1]);
+            GLfloat param                   = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvf);
+            ANGLE_BINARY_TRACE(EntryPoint::TexEnvf, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateTexEnvf(context, targetPacked, pnamePacked, param))
+            {
+                context->texEnvf(targetPacked, pnamePacked, param);
+                ANGLE_CAPTURE(TexEnvf, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexEnvfv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvfv);
+            ANGLE_BINARY_TRACE(EntryPoint::TexEnvfv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexEnvfv(context, targetPacked, pnamePacked, params))
+            {
+                context->texEnvfv(targetPacked, pnamePacked, params);
+                ANGLE_CAPTURE(TexEnvfv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexEnvi:
+        {
+            GLenum target                   = static_cast<GLenum>(args[0]);
+            GLenum pname                    = static_cast<GLenum>(args[1]);
+            GLint param                     = static_cast<GLint>(args[2]);
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvi);
+            ANGLE_BINARY_TRACE(EntryPoint::TexEnvi, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateTexEnvi(context, targetPacked, pnamePacked, param))
+            {
+                context->texEnvi(targetPacked, pnamePacked, param);
+                ANGLE_CAPTURE(TexEnvi, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexEnviv:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnviv);
+            ANGLE_BINARY_TRACE(EntryPoint::TexEnviv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexEnviv(context, targetPacked, pnamePacked, params))
+            {
+                context->texEnviv(targetPacked, pnamePacked, params);
+                ANGLE_CAPTURE(TexEnviv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexEnvx:
+        {
+            GLenum target                   = static_cast<GLenum>(args[0]);
+            GLenum pname                    = static_cast<GLenum>(args[1]);
+            GLfixed param                   = static_cast<GLfixed>(args[2]);
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvx);
+            ANGLE_BINARY_TRACE(EntryPoint::TexEnvx, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateTexEnvx(context, targetPacked, pnamePacked, param))
+            {
+                context->texEnvx(targetPacked, pnamePacked, param);
+                ANGLE_CAPTURE(TexEnvx, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexEnvxv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            const GLfixed *params =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[2]));
+            TextureEnvTarget targetPacked   = FromGLenum<TextureEnvTarget>(target);
+            TextureEnvParameter pnamePacked = FromGLenum<TextureEnvParameter>(pname);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvxv);
+            ANGLE_BINARY_TRACE(EntryPoint::TexEnvxv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexEnvxv(context, targetPacked, pnamePacked, params))
+            {
+                context->texEnvxv(targetPacked, pnamePacked, params);
+                ANGLE_CAPTURE(TexEnvxv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexGenfOES:
+        {
+            GLenum coord  = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLfloat param = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenfOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexGenfOES, coord, pname, param);
+            if (context->skipValidation() || ValidateTexGenfOES(context, coord, pname, param))
+            {
+                context->texGenf(coord, pname, param);
+                ANGLE_CAPTURE(TexGenfOES, context, coord, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexGenfvOES:
+        {
+            GLenum coord = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenfvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexGenfvOES, coord, pname, params);
+            if (context->skipValidation() || ValidateTexGenfvOES(context, coord, pname, params))
+            {
+                context->texGenfv(coord, pname, params);
+                ANGLE_CAPTURE(TexGenfvOES, context, coord, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexGeniOES:
+        {
+            GLenum coord = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            GLint param  = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGeniOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexGeniOES, coord, pname, param);
+            if (context->skipValidation() || ValidateTexGeniOES(context, coord, pname, param))
+            {
+                context->texGeni(coord, pname, param);
+                ANGLE_CAPTURE(TexGeniOES, context, coord, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexGenivOES:
+        {
+            GLenum coord        = static_cast<GLenum>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexGenivOES, coord, pname, params);
+            if (context->skipValidation() || ValidateTexGenivOES(context, coord, pname, params))
+            {
+                context->texGeniv(coord, pname, params);
+                ANGLE_CAPTURE(TexGenivOES, context, coord, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexGenxOES:
+        {
+            GLenum coord  = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLfixed param = static_cast<GLfixed>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenxOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexGenxOES, coord, pname, param);
+            if (context->skipValidation() || ValidateTexGenxOES(context, coord, pname, param))
+            {
+                context->texGenx(coord, pname, param);
+                ANGLE_CAPTURE(TexGenxOES, context, coord, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexGenxvOES:
+        {
+            GLenum coord = static_cast<GLenum>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            const GLfixed *params =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenxvOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexGenxvOES, coord, pname, params);
+            if (context->skipValidation() || ValidateTexGenxvOES(context, coord, pname, params))
+            {
+                context->texGenxv(coord, pname, params);
+                ANGLE_CAPTURE(TexGenxvOES, context, coord, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexImage2D:
+        {
+            GLenum target        = static_cast<GLenum>(args[0]);
+            GLint level          = static_cast<GLint>(args[1]);
+            GLint internalformat = static_cast<GLint>(args[2]);
+            GLsizei width        = static_cast<GLsizei>(args[3]);
+            GLsizei height       = static_cast<GLsizei>(args[4]);
+            GLint border         = static_cast<GLint>(args[5]);
+            GLenum format        = static_cast<GLenum>(args[6]);
+            GLenum type          = static_cast<GLenum>(args[7]);
+            const void *pixels   = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[8]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::TexImage2D, target, level, internalformat, width, height,
+                               border, format, type, pixels);
+            if (context->skipValidation() ||
+                ValidateTexImage2D(context, targetPacked, level, internalformat, width, height,
+                                   border, format, type, pixels))
+            {
+                context->texImage2D(targetPacked, level, internalformat, width, height, border,
+                                    format, type, pixels);
+                ANGLE_CAPTURE(TexImage2D, context, target, level, internalformat, width, height,
+                              border, format, type, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexImage3D:
+        {
+            GLenum target        = static_cast<GLenum>(args[0]);
+            GLint level          = static_cast<GLint>(args[1]);
+            GLint internalformat = static_cast<GLint>(args[2]);
+            GLsizei width        = static_cast<GLsizei>(args[3]);
+            GLsizei height       = static_cast<GLsizei>(args[4]);
+            GLsizei depth        = static_cast<GLsizei>(args[5]);
+            GLint border         = static_cast<GLint>(args[6]);
+            GLenum format        = static_cast<GLenum>(args[7]);
+            GLenum type          = static_cast<GLenum>(args[8]);
+            const void *pixels   = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[9]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage3D);
+            ANGLE_BINARY_TRACE(EntryPoint::TexImage3D, target, level, internalformat, width, height,
+                               depth, border, format, type, pixels);
+            if (context->skipValidation() ||
+                ValidateTexImage3D(context, targetPacked, level, internalformat, width, height,
+                                   depth, border, format, type, pixels))
+            {
+                context->texImage3D(targetPacked, level, internalformat, width, height, depth,
+                                    border, format, type, pixels);
+                ANGLE_CAPTURE(TexImage3D, context, target, level, internalformat, width, height,
+                              depth, border, format, type, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterIivOES:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterIivOES, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexParameterIivOES(context, targetPacked, pname, params))
+            {
+                context->texParameterIiv(targetPacked, pname, params);
+                ANGLE_CAPTURE(TexParameterIivOES, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterIuivOES:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            const GLuint *params =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIuivOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterIuivOES, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexParameterIuivOES(context, targetPacked, pname, params))
+            {
+                context->texParameterIuiv(targetPacked, pname, params);
+                ANGLE_CAPTURE(TexParameterIuivOES, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterf:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLfloat param            = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterf);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterf, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateTexParameterf(context, targetPacked, pname, param))
+            {
+                context->texParameterf(targetPacked, pname, param);
+                ANGLE_CAPTURE(TexParameterf, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterfv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterfv);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterfv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexParameterfv(context, targetPacked, pname, params))
+            {
+                context->texParameterfv(targetPacked, pname, params);
+                ANGLE_CAPTURE(TexParameterfv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameteri:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLint param              = static_cast<GLint>(args[2]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameteri);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameteri, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateTexParameteri(context, targetPacked, pname, param))
+            {
+                context->texParameteri(targetPacked, pname, param);
+                ANGLE_CAPTURE(TexParameteri, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexParameteriv:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameteriv);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameteriv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexParameteriv(context, targetPacked, pname, params))
+            {
+                context->texParameteriv(targetPacked, pname, params);
+                ANGLE_CAPTURE(TexParameteriv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterx:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLfixed param            = static_cast<GLfixed>(args[2]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterx);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterx, target, pname, param);
+            if (context->skipValidation() ||
+                ValidateTexParameterx(context, targetPacked, pname, param))
+            {
+                context->texParameterx(targetPacked, pname, param);
+                ANGLE_CAPTURE(TexParameterx, context, target, pname, param);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterxv:
+        {
+            GLenum target = static_cast<GLenum>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            const GLfixed *params =
+                reinterpret_cast<const GLfixed *>(static_cast<uintptr_t>(args[2]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterxv);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterxv, target, pname, params);
+            if (context->skipValidation() ||
+                ValidateTexParameterxv(context, targetPacked, pname, params))
+            {
+                context->texParameterxv(targetPacked, pname, params);
+                ANGLE_CAPTURE(TexParameterxv, context, target, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage1DEXT:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLsizei levels        = static_cast<GLsizei>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage1DEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage1DEXT, target, levels, internalformat, width);
+            if (context->skipValidation() ||
+                ValidateTexStorage1DEXT(context, target, levels, internalformat, width))
+            {
+                context->texStorage1D(target, levels, internalformat, width);
+                ANGLE_CAPTURE(TexStorage1DEXT, context, target, levels, internalformat, width);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage2D:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizei levels           = static_cast<GLsizei>(args[1]);
+            GLenum internalformat    = static_cast<GLenum>(args[2]);
+            GLsizei width            = static_cast<GLsizei>(args[3]);
+            GLsizei height           = static_cast<GLsizei>(args[4]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage2D, target, levels, internalformat, width,
+                               height);
+            if (context->skipValidation() ||
+                ValidateTexStorage2D(context, targetPacked, levels, internalformat, width, height))
+            {
+                context->texStorage2D(targetPacked, levels, internalformat, width, height);
+                ANGLE_CAPTURE(TexStorage2D, context, target, levels, internalformat, width, height);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage2DEXT:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizei levels           = static_cast<GLsizei>(args[1]);
+            GLenum internalformat    = static_cast<GLenum>(args[2]);
+            GLsizei width            = static_cast<GLsizei>(args[3]);
+            GLsizei height           = static_cast<GLsizei>(args[4]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DEXT, target, levels, internalformat, width,
+                               height);
+            if (context->skipValidation() || ValidateTexStorage2DEXT(context, targetPacked, levels,
+                                                                     internalformat, width, height))
+            {
+                context->texStorage2D(targetPacked, levels, internalformat, width, height);
+                ANGLE_CAPTURE(TexStorage2DEXT, context, target, levels, internalformat, width,
+                              height);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage2DMultisample:
+        {
+            GLenum target                  = static_cast<GLenum>(args[0]);
+            GLsizei samples                = static_cast<GLsizei>(args[1]);
+            GLenum internalformat          = static_cast<GLenum>(args[2]);
+            GLsizei width                  = static_cast<GLsizei>(args[3]);
+            GLsizei height                 = static_cast<GLsizei>(args[4]);
+            GLboolean fixedsamplelocations = static_cast<GLboolean>(args[5]);
+            TextureType targetPacked       = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DMultisample);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DMultisample, target, samples, internalformat,
+                               width, height, fixedsamplelocations);
+            if (context->skipValidation() ||
+                ValidateTexStorage2DMultisample(context, targetPacked, samples, internalformat,
+                                                width, height, fixedsamplelocations))
+            {
+                context->texStorage2DMultisample(targetPacked, samples, internalformat, width,
+                                                 height, fixedsamplelocations);
+                ANGLE_CAPTURE(TexStorage2DMultisample, context, target, samples, internalformat,
+                              width, height, fixedsamplelocations);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage3D:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizei levels           = static_cast<GLsizei>(args[1]);
+            GLenum internalformat    = static_cast<GLenum>(args[2]);
+            GLsizei width            = static_cast<GLsizei>(args[3]);
+            GLsizei height           = static_cast<GLsizei>(args[4]);
+            GLsizei depth            = static_cast<GLsizei>(args[5]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3D);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage3D, target, levels, internalformat, width,
+                               height, depth);
+            if (context->skipValidation() ||
+                ValidateTexStorage3D(context, targetPacked, levels, internalformat, width, height,
+                                     depth))
+            {
+                context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+                ANGLE_CAPTURE(TexStorage3D, context, target, levels, internalformat, width, height,
+                              depth);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage3DEXT:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizei levels           = static_cast<GLsizei>(args[1]);
+            GLenum internalformat    = static_cast<GLenum>(args[2]);
+            GLsizei width            = static_cast<GLsizei>(args[3]);
+            GLsizei height           = static_cast<GLsizei>(args[4]);
+            GLsizei depth            = static_cast<GLsizei>(args[5]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3DEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage3DEXT, target, levels, internalformat, width,
+                               height, depth);
+            if (context->skipValidation() ||
+                ValidateTexStorage3DEXT(context, targetPacked, levels, internalformat, width,
+                                        height, depth))
+            {
+                context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+                ANGLE_CAPTURE(TexStorage3DEXT, context, target, levels, internalformat, width,
+                              height, depth);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage3DMultisampleOES:
+        {
+            GLenum target                  = static_cast<GLenum>(args[0]);
+            GLsizei samples                = static_cast<GLsizei>(args[1]);
+            GLenum internalformat          = static_cast<GLenum>(args[2]);
+            GLsizei width                  = static_cast<GLsizei>(args[3]);
+            GLsizei height                 = static_cast<GLsizei>(args[4]);
+            GLsizei depth                  = static_cast<GLsizei>(args[5]);
+            GLboolean fixedsamplelocations = static_cast<GLboolean>(args[6]);
+            TextureType targetPacked       = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3DMultisampleOES);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage3DMultisampleOES, target, samples,
+                               internalformat, width, height, depth, fixedsamplelocations);
+            if (context->skipValidation() ||
+                ValidateTexStorage3DMultisampleOES(context, targetPacked, samples, internalformat,
+                                                   width, height, depth, fixedsamplelocations))
+            {
+                context->texStorage3DMultisample(targetPacked, samples, internalformat, width,
+                                                 height, depth, fixedsamplelocations);
+                ANGLE_CAPTURE(TexStorage3DMultisampleOES, context, target, samples, internalformat,
+                              width, height, depth, fixedsamplelocations);
+            }
+            break;
+        }
+        case EntryPoint::TexStorageMem2DEXT:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizei levels           = static_cast<GLsizei>(args[1]);
+            GLenum internalFormat    = static_cast<GLenum>(args[2]);
+            GLsizei width            = static_cast<GLsizei>(args[3]);
+            GLsizei height           = static_cast<GLsizei>(args[4]);
+            GLuint memory            = static_cast<GLuint>(args[5]);
+            GLuint64 offset          = static_cast<GLuint64>(args[6]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem2DEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem2DEXT, target, levels, internalFormat,
+                               width, height, memory, offset);
+            if (context->skipValidation() ||
+                ValidateTexStorageMem2DEXT(context, targetPacked, levels, internalFormat, width,
+                                           height, memory, offset))
+            {
+                context->texStorageMem2D(targetPacked, levels, internalFormat, width, height,
+                                         memory, offset);
+                ANGLE_CAPTURE(TexStorageMem2DEXT, context, target, levels, internalFormat, width,
+                              height, memory, offset);
+            }
+            break;
+        }
+        case EntryPoint::TexStorageMem2DMultisampleEXT:
+        {
+            GLenum target                  = static_cast<GLenum>(args[0]);
+            GLsizei samples                = static_cast<GLsizei>(args[1]);
+            GLenum internalFormat          = static_cast<GLenum>(args[2]);
+            GLsizei width                  = static_cast<GLsizei>(args[3]);
+            GLsizei height                 = static_cast<GLsizei>(args[4]);
+            GLboolean fixedSampleLocations = static_cast<GLboolean>(args[5]);
+            GLuint memory                  = static_cast<GLuint>(args[6]);
+            GLuint64 offset                = static_cast<GLuint64>(args[7]);
+            TextureType targetPacked       = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem2DMultisampleEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem2DMultisampleEXT, target, samples,
+                               internalFormat, width, height, fixedSampleLocations, memory, offset);
+            if (context->skipValidation() ||
+                ValidateTexStorageMem2DMultisampleEXT(context, targetPacked, samples,
+                                                      internalFormat, width, height,
+                                                      fixedSampleLocations, memory, offset))
+            {
+                context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width,
+                                                    height, fixedSampleLocations, memory, offset);
+                ANGLE_CAPTURE(TexStorageMem2DMultisampleEXT, context, target, samples,
+                              internalFormat, width, height, fixedSampleLocations, memory, offset);
+            }
+            break;
+        }
+        case EntryPoint::TexStorageMem3DEXT:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLsizei levels           = static_cast<GLsizei>(args[1]);
+            GLenum internalFormat    = static_cast<GLenum>(args[2]);
+            GLsizei width            = static_cast<GLsizei>(args[3]);
+            GLsizei height           = static_cast<GLsizei>(args[4]);
+            GLsizei depth            = static_cast<GLsizei>(args[5]);
+            GLuint memory            = static_cast<GLuint>(args[6]);
+            GLuint64 offset          = static_cast<GLuint64>(args[7]);
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem3DEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem3DEXT, target, levels, internalFormat,
+                               width, height, depth, memory, offset);
+            if (context->skipValidation() ||
+                ValidateTexStorageMem3DEXT(context, targetPacked, levels, internalFormat, width,
+                                           height, depth, memory, offset))
+            {
+                context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth,
+                                         memory, offset);
+                ANGLE_CAPTURE(TexStorageMem3DEXT, context, target, levels, internalFormat, width,
+                              height, depth, memory, offset);
+            }
+            break;
+        }
+        case EntryPoint::TexStorageMem3DMultisampleEXT:
+        {
+            GLenum target                  = static_cast<GLenum>(args[0]);
+            GLsizei samples                = static_cast<GLsizei>(args[1]);
+            GLenum internalFormat          = static_cast<GLenum>(args[2]);
+            GLsizei width                  = static_cast<GLsizei>(args[3]);
+            GLsizei height                 = static_cast<GLsizei>(args[4]);
+            GLsizei depth                  = static_cast<GLsizei>(args[5]);
+            GLboolean fixedSampleLocations = static_cast<GLboolean>(args[6]);
+            GLuint memory                  = static_cast<GLuint>(args[7]);
+            GLuint64 offset                = static_cast<GLuint64>(args[8]);
+            TextureType targetPacked       = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem3DMultisampleEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem3DMultisampleEXT, target, samples,
+                               internalFormat, width, height, depth, fixedSampleLocations, memory,
+                               offset);
+            if (context->skipValidation() ||
+                ValidateTexStorageMem3DMultisampleEXT(context, targetPacked, samples,
+                                                      internalFormat, width, height, depth,
+                                                      fixedSampleLocations, memory, offset))
+            {
+                context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width,
+                                                    height, depth, fixedSampleLocations, memory,
+                                                    offset);
+                ANGLE_CAPTURE(TexStorageMem3DMultisampleEXT, context, target, samples,
+                              internalFormat, width, height, depth, fixedSampleLocations, memory,
+                              offset);
+            }
+            break;
+        }
+        case EntryPoint::TexSubImage2D:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLint level        = static_cast<GLint>(args[1]);
+            GLint xoffset      = static_cast<GLint>(args[2]);
+            GLint yoffset      = static_cast<GLint>(args[3]);
+            GLsizei width      = static_cast<GLsizei>(args[4]);
+            GLsizei height     = static_cast<GLsizei>(args[5]);
+            GLenum format      = static_cast<GLenum>(args[6]);
+            GLenum type        = static_cast<GLenum>(args[7]);
+            const void *pixels = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[8]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage2D);
+            ANGLE_BINARY_TRACE(EntryPoint::TexSubImage2D, target, level, xoffset, yoffset, width,
+                               height, format, type, pixels);
+            if (context->skipValidation() ||
+                ValidateTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width, height,
+                                      format, type, pixels))
+            {
+                context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format,
+                                       type, pixels);
+                ANGLE_CAPTURE(TexSubImage2D, context, target, level, xoffset, yoffset, width,
+                              height, format, type, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexSubImage3D:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLint level        = static_cast<GLint>(args[1]);
+            GLint xoffset      = static_cast<GLint>(args[2]);
+            GLint yoffset      = static_cast<GLint>(args[3]);
+            GLint zoffset      = static_cast<GLint>(args[4]);
+            GLsizei width      = static_cast<GLsizei>(args[5]);
+            GLsizei height     = static_cast<GLsizei>(args[6]);
+            GLsizei depth      = static_cast<GLsizei>(args[7]);
+            GLenum format      = static_cast<GLenum>(args[8]);
+            GLenum type        = static_cast<GLenum>(args[9]);
+            const void *pixels = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[10]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage3D);
+            ANGLE_BINARY_TRACE(EntryPoint::TexSubImage3D, target, level, xoffset, yoffset, zoffset,
+                               width, height, depth, format, type, pixels);
+            if (context->skipValidation() ||
+                ValidateTexSubImage3D(context, targetPacked, level, xoffset, yoffset, zoffset,
+                                      width, height, depth, format, type, pixels))
+            {
+                context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width,
+                                       height, depth, format, type, pixels);
+                ANGLE_CAPTURE(TexSubImage3D, context, target, level, xoffset, yoffset, zoffset,
+                              width, height, depth, format, type, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TransformFeedbackVaryings:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            GLsizei count  = static_cast<GLsizei>(args[1]);
+            const GLchar *const *varyings =
+                reinterpret_cast<const GLchar *const *>(static_cast<uintptr_t>(args[2]));
+            GLenum bufferMode = static_cast<GLenum>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TransformFeedbackVaryings);
+            ANGLE_BINARY_TRACE(EntryPoint::TransformFeedbackVaryings, program, count, varyings,
+                               bufferMode);
+            if (context->skipValidation() ||
+                ValidateTransformFeedbackVaryings(context, program, count, varyings, bufferMode))
+            {
+                context->transformFeedbackVaryings(program, count, varyings, bufferMode);
+                ANGLE_CAPTURE(TransformFeedbackVaryings, context, program, count, varyings,
+                              bufferMode);
+            }
+            break;
+        }
+        case EntryPoint::Translatef:
+        {
+            GLfloat x = bitCast<GLfloat>(static_cast<uint32_t>(args[0]));
+            GLfloat y = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat z = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Translatef);
+            ANGLE_BINARY_TRACE(EntryPoint::Translatef, x, y, z);
+            if (context->skipValidation() || ValidateTranslatef(context, x, y, z))
+            {
+                context->translatef(x, y, z);
+                ANGLE_CAPTURE(Translatef, context, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::Translatex:
+        {
+            GLfixed x = static_cast<GLfixed>(args[0]);
+            GLfixed y = static_cast<GLfixed>(args[1]);
+            GLfixed z = static_cast<GLfixed>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Translatex);
+            ANGLE_BINARY_TRACE(EntryPoint::Translatex, x, y, z);
+            if (context->skipValidation() || ValidateTranslatex(context, x, y, z))
+            {
+                context->translatex(x, y, z);
+                ANGLE_CAPTURE(Translatex, context, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1f:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1f);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform1f, location, v0);
+            if (context->skipValidation() || ValidateUniform1f(context, location, v0))
+            {
+                context->uniform1f(location, v0);
+                ANGLE_CAPTURE(Uniform1f, context, location, v0);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1fv:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLsizei count  = static_cast<GLsizei>(args[1]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1fv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform1fv, location, count, value);
+            if (context->skipValidation() || ValidateUniform1fv(context, location, count, value))
+            {
+                context->uniform1fv(location, count, value);
+                ANGLE_CAPTURE(Uniform1fv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1i:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLint v0       = static_cast<GLint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1i);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform1i, location, v0);
+            if (context->skipValidation() || ValidateUniform1i(context, location, v0))
+            {
+                context->uniform1i(location, v0);
+                ANGLE_CAPTURE(Uniform1i, context, location, v0);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1iv:
+        {
+            GLint location     = static_cast<GLint>(args[0]);
+            GLsizei count      = static_cast<GLsizei>(args[1]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1iv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform1iv, location, count, value);
+            if (context->skipValidation() || ValidateUniform1iv(context, location, count, value))
+            {
+                context->uniform1iv(location, count, value);
+                ANGLE_CAPTURE(Uniform1iv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1ui:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLuint v0      = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1ui);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform1ui, location, v0);
+            if (context->skipValidation() || ValidateUniform1ui(context, location, v0))
+            {
+                context->uniform1ui(location, v0);
+                ANGLE_CAPTURE(Uniform1ui, context, location, v0);
+            }
+            break;
+        }
+        case EntryPoint::Uniform1uiv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform1uiv, location, count, value);
+            if (context->skipValidation() || ValidateUniform1uiv(context, location, count, value))
+            {
+                context->uniform1uiv(location, count, value);
+                ANGLE_CAPTURE(Uniform1uiv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2f:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat v1     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2f);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform2f, location, v0, v1);
+            if (context->skipValidation() || ValidateUniform2f(context, location, v0, v1))
+            {
+                context->uniform2f(location, v0, v1);
+                ANGLE_CAPTURE(Uniform2f, context, location, v0, v1);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2fv:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLsizei count  = static_cast<GLsizei>(args[1]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform2fv, location, count, value);
+            if (context->skipValidation() || ValidateUniform2fv(context, location, count, value))
+            {
+                context->uniform2fv(location, count, value);
+                ANGLE_CAPTURE(Uniform2fv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2i:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLint v0       = static_cast<GLint>(args[1]);
+            GLint v1       = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2i);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform2i, location, v0, v1);
+            if (context->skipValidation() || ValidateUniform2i(context, location, v0, v1))
+            {
+                context->uniform2i(location, v0, v1);
+                ANGLE_CAPTURE(Uniform2i, context, location, v0, v1);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2iv:
+        {
+            GLint location     = static_cast<GLint>(args[0]);
+            GLsizei count      = static_cast<GLsizei>(args[1]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2iv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform2iv, location, count, value);
+            if (context->skipValidation() || ValidateUniform2iv(context, location, count, value))
+            {
+                context->uniform2iv(location, count, value);
+                ANGLE_CAPTURE(Uniform2iv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2ui:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLuint v0      = static_cast<GLuint>(args[1]);
+            GLuint v1      = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2ui);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform2ui, location, v0, v1);
+            if (context->skipValidation() || ValidateUniform2ui(context, location, v0, v1))
+            {
+                context->uniform2ui(location, v0, v1);
+                ANGLE_CAPTURE(Uniform2ui, context, location, v0, v1);
+            }
+            break;
+        }
+        case EntryPoint::Uniform2uiv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform2uiv, location, count, value);
+            if (context->skipValidation() || ValidateUniform2uiv(context, location, count, value))
+            {
+                context->uniform2uiv(location, count, value);
+                ANGLE_CAPTURE(Uniform2uiv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3f:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat v1     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat v2     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3f);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform3f, location, v0, v1, v2);
+            if (context->skipValidation() || ValidateUniform3f(context, location, v0, v1, v2))
+            {
+                context->uniform3f(location, v0, v1, v2);
+                ANGLE_CAPTURE(Uniform3f, context, location, v0, v1, v2);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3fv:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLsizei count  = static_cast<GLsizei>(args[1]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform3fv, location, count, value);
+            if (context->skipValidation() || ValidateUniform3fv(context, location, count, value))
+            {
+                context->uniform3fv(location, count, value);
+                ANGLE_CAPTURE(Uniform3fv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3i:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLint v0       = static_cast<GLint>(args[1]);
+            GLint v1       = static_cast<GLint>(args[2]);
+            GLint v2       = static_cast<GLint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3i);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform3i, location, v0, v1, v2);
+            if (context->skipValidation() || ValidateUniform3i(context, location, v0, v1, v2))
+            {
+                context->uniform3i(location, v0, v1, v2);
+                ANGLE_CAPTURE(Uniform3i, context, location, v0, v1, v2);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3iv:
+        {
+            GLint location     = static_cast<GLint>(args[0]);
+            GLsizei count      = static_cast<GLsizei>(args[1]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3iv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform3iv, location, count, value);
+            if (context->skipValidation() || ValidateUniform3iv(context, location, count, value))
+            {
+                context->uniform3iv(location, count, value);
+                ANGLE_CAPTURE(Uniform3iv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3ui:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLuint v0      = static_cast<GLuint>(args[1]);
+            GLuint v1      = static_cast<GLuint>(args[2]);
+            GLuint v2      = static_cast<GLuint>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3ui);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform3ui, location, v0, v1, v2);
+            if (context->skipValidation() || ValidateUniform3ui(context, location, v0, v1, v2))
+            {
+                context->uniform3ui(location, v0, v1, v2);
+                ANGLE_CAPTURE(Uniform3ui, context, location, v0, v1, v2);
+            }
+            break;
+        }
+        case EntryPoint::Uniform3uiv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform3uiv, location, count, value);
+            if (context->skipValidation() || ValidateUniform3uiv(context, location, count, value))
+            {
+                context->uniform3uiv(location, count, value);
+                ANGLE_CAPTURE(Uniform3uiv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4f:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLfloat v0     = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat v1     = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat v2     = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat v3     = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4f);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform4f, location, v0, v1, v2, v3);
+            if (context->skipValidation() || ValidateUniform4f(context, location, v0, v1, v2, v3))
+            {
+                context->uniform4f(location, v0, v1, v2, v3);
+                ANGLE_CAPTURE(Uniform4f, context, location, v0, v1, v2, v3);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4fv:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLsizei count  = static_cast<GLsizei>(args[1]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform4fv, location, count, value);
+            if (context->skipValidation() || ValidateUniform4fv(context, location, count, value))
+            {
+                context->uniform4fv(location, count, value);
+                ANGLE_CAPTURE(Uniform4fv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4i:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLint v0       = static_cast<GLint>(args[1]);
+            GLint v1       = static_cast<GLint>(args[2]);
+            GLint v2       = static_cast<GLint>(args[3]);
+            GLint v3       = static_cast<GLint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4i);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform4i, location, v0, v1, v2, v3);
+            if (context->skipValidation() || ValidateUniform4i(context, location, v0, v1, v2, v3))
+            {
+                context->uniform4i(location, v0, v1, v2, v3);
+                ANGLE_CAPTURE(Uniform4i, context, location, v0, v1, v2, v3);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4iv:
+        {
+            GLint location     = static_cast<GLint>(args[0]);
+            GLsizei count      = static_cast<GLsizei>(args[1]);
+            const GLint *value = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4iv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform4iv, location, count, value);
+            if (context->skipValidation() || ValidateUniform4iv(context, location, count, value))
+            {
+                context->uniform4iv(location, count, value);
+                ANGLE_CAPTURE(Uniform4iv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4ui:
+        {
+            GLint location = static_cast<GLint>(args[0]);
+            GLuint v0      = static_cast<GLuint>(args[1]);
+            GLuint v1      = static_cast<GLuint>(args[2]);
+            GLuint v2      = static_cast<GLuint>(args[3]);
+            GLuint v3      = static_cast<GLuint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4ui);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform4ui, location, v0, v1, v2, v3);
+            if (context->skipValidation() || ValidateUniform4ui(context, location, v0, v1, v2, v3))
+            {
+                context->uniform4ui(location, v0, v1, v2, v3);
+                ANGLE_CAPTURE(Uniform4ui, context, location, v0, v1, v2, v3);
+            }
+            break;
+        }
+        case EntryPoint::Uniform4uiv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            const GLuint *value = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::Uniform4uiv, location, count, value);
+            if (context->skipValidation() || ValidateUniform4uiv(context, location, count, value))
+            {
+                context->uniform4uiv(location, count, value);
+                ANGLE_CAPTURE(Uniform4uiv, context, location, count, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformBlockBinding:
+        {
+            GLuint program             = static_cast<GLuint>(args[0]);
+            GLuint uniformBlockIndex   = static_cast<GLuint>(args[1]);
+            GLuint uniformBlockBinding = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformBlockBinding);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformBlockBinding, program, uniformBlockIndex,
+                               uniformBlockBinding);
+            if (context->skipValidation() ||
+                ValidateUniformBlockBinding(context, program, uniformBlockIndex,
+                                            uniformBlockBinding))
+            {
+                context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
+                ANGLE_CAPTURE(UniformBlockBinding, context, program, uniformBlockIndex,
+                              uniformBlockBinding);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix2fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix2fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix2fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix2fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix2x3fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2x3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2x3fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix2x3fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix2x3fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix2x3fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix2x4fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2x4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2x4fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix2x4fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix2x4fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix2x4fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix3fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix3fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix3fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix3fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix3x2fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3x2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3x2fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix3x2fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix3x2fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix3x2fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix3x4fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3x4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3x4fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix3x4fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix3x4fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix3x4fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix4fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix4fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix4fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix4fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix4x2fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4x2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4x2fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix4x2fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix4x2fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix4x2fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UniformMatrix4x3fv:
+        {
+            GLint location      = static_cast<GLint>(args[0]);
+            GLsizei count       = static_cast<GLsizei>(args[1]);
+            GLboolean transpose = static_cast<GLboolean>(args[2]);
+            const GLfloat *value =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4x3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4x3fv, location, count, transpose, value);
+            if (context->skipValidation() ||
+                ValidateUniformMatrix4x3fv(context, location, count, transpose, value))
+            {
+                context->uniformMatrix4x3fv(location, count, transpose, value);
+                ANGLE_CAPTURE(UniformMatrix4x3fv, context, location, count, transpose, value);
+            }
+            break;
+        }
+        case EntryPoint::UseProgram:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UseProgram);
+            ANGLE_BINARY_TRACE(EntryPoint::UseProgram, program);
+            if (context->skipValidation() || ValidateUseProgram(context, program))
+            {
+                context->useProgram(program);
+                ANGLE_CAPTURE(UseProgram, context, program);
+            }
+            break;
+        }
+        case EntryPoint::UseProgramStages:
+        {
+            GLuint pipeline   = static_cast<GLuint>(args[0]);
+            GLbitfield stages = static_cast<GLbitfield>(args[1]);
+            GLuint program    = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UseProgramStages);
+            ANGLE_BINARY_TRACE(EntryPoint::UseProgramStages, pipeline, stages, program);
+            if (context->skipValidation() ||
+                ValidateUseProgramStages(context, pipeline, stages, program))
+            {
+                context->useProgramStages(pipeline, stages, program);
+                ANGLE_CAPTURE(UseProgramStages, context, pipeline, stages, program);
+            }
+            break;
+        }
+        case EntryPoint::ValidateProgram:
+        {
+            GLuint program = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ValidateProgram);
+            ANGLE_BINARY_TRACE(EntryPoint::ValidateProgram, program);
+            if (context->skipValidation() || ValidateValidateProgram(context, program))
+            {
+                context->validateProgram(program);
+                ANGLE_CAPTURE(ValidateProgram, context, program);
+            }
+            break;
+        }
+        case EntryPoint::ValidateProgramPipeline:
+        {
+            GLuint pipeline = static_cast<GLuint>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ValidateProgramPipeline);
+            ANGLE_BINARY_TRACE(EntryPoint::ValidateProgramPipeline, pipeline);
+            if (context->skipValidation() || ValidateValidateProgramPipeline(context, pipeline))
+            {
+                context->validateProgramPipeline(pipeline);
+                ANGLE_CAPTURE(ValidateProgramPipeline, context, pipeline);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib1f:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            GLfloat x    = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib1f);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib1f, index, x);
+            if (context->skipValidation() || ValidateVertexAttrib1f(context, index, x))
+            {
+                context->vertexAttrib1f(index, x);
+                ANGLE_CAPTURE(VertexAttrib1f, context, index, x);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib1fv:
+        {
+            GLuint index     = static_cast<GLuint>(args[0]);
+            const GLfloat *v = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib1fv);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib1fv, index, v);
+            if (context->skipValidation() || ValidateVertexAttrib1fv(context, index, v))
+            {
+                context->vertexAttrib1fv(index, v);
+                ANGLE_CAPTURE(VertexAttrib1fv, context, index, v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib2f:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            GLfloat x    = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat y    = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib2f);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib2f, index, x, y);
+            if (context->skipValidation() || ValidateVertexAttrib2f(context, index, x, y))
+            {
+                context->vertexAttrib2f(index, x, y);
+                ANGLE_CAPTURE(VertexAttrib2f, context, index, x, y);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib2fv:
+        {
+            GLuint index     = static_cast<GLuint>(args[0]);
+            const GLfloat *v = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib2fv);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib2fv, index, v);
+            if (context->skipValidation() || ValidateVertexAttrib2fv(context, index, v))
+            {
+                context->vertexAttrib2fv(index, v);
+                ANGLE_CAPTURE(VertexAttrib2fv, context, index, v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib3f:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            GLfloat x    = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat y    = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat z    = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib3f);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib3f, index, x, y, z);
+            if (context->skipValidation() || ValidateVertexAttrib3f(context, index, x, y, z))
+            {
+                context->vertexAttrib3f(index, x, y, z);
+                ANGLE_CAPTURE(VertexAttrib3f, context, index, x, y, z);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib3fv:
+        {
+            GLuint index     = static_cast<GLuint>(args[0]);
+            const GLfloat *v = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib3fv);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib3fv, index, v);
+            if (context->skipValidation() || ValidateVertexAttrib3fv(context, index, v))
+            {
+                context->vertexAttrib3fv(index, v);
+                ANGLE_CAPTURE(VertexAttrib3fv, context, index, v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib4f:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            GLfloat x    = bitCast<GLfloat>(static_cast<uint32_t>(args[1]));
+            GLfloat y    = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            GLfloat z    = bitCast<GLfloat>(static_cast<uint32_t>(args[3]));
+            GLfloat w    = bitCast<GLfloat>(static_cast<uint32_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib4f);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib4f, index, x, y, z, w);
+            if (context->skipValidation() || ValidateVertexAttrib4f(context, index, x, y, z, w))
+            {
+                context->vertexAttrib4f(index, x, y, z, w);
+                ANGLE_CAPTURE(VertexAttrib4f, context, index, x, y, z, w);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttrib4fv:
+        {
+            GLuint index     = static_cast<GLuint>(args[0]);
+            const GLfloat *v = reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib4fv);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib4fv, index, v);
+            if (context->skipValidation() || ValidateVertexAttrib4fv(context, index, v))
+            {
+                context->vertexAttrib4fv(index, v);
+                ANGLE_CAPTURE(VertexAttrib4fv, context, index, v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribBinding:
+        {
+            GLuint attribindex  = static_cast<GLuint>(args[0]);
+            GLuint bindingindex = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribBinding);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribBinding, attribindex, bindingindex);
+            if (context->skipValidation() ||
+                ValidateVertexAttribBinding(context, attribindex, bindingindex))
+            {
+                context->vertexAttribBinding(attribindex, bindingindex);
+                ANGLE_CAPTURE(VertexAttribBinding, context, attribindex, bindingindex);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribDivisor:
+        {
+            GLuint index   = static_cast<GLuint>(args[0]);
+            GLuint divisor = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisor);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisor, index, divisor);
+            if (context->skipValidation() || ValidateVertexAttribDivisor(context, index, divisor))
+            {
+                context->vertexAttribDivisor(index, divisor);
+                ANGLE_CAPTURE(VertexAttribDivisor, context, index, divisor);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribDivisorANGLE:
+        {
+            GLuint index   = static_cast<GLuint>(args[0]);
+            GLuint divisor = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisorANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisorANGLE, index, divisor);
+            if (context->skipValidation() ||
+                ValidateVertexAttribDivisorANGLE(context, index, divisor))
+            {
+                context->vertexAttribDivisor(index, divisor);
+                ANGLE_CAPTURE(VertexAttribDivisorANGLE, context, index, divisor);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribDivisorEXT:
+        {
+            GLuint index   = static_cast<GLuint>(args[0]);
+            GLuint divisor = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisorEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisorEXT, index, divisor);
+            if (context->skipValidation() ||
+                ValidateVertexAttribDivisorEXT(context, index, divisor))
+            {
+                context->vertexAttribDivisor(index, divisor);
+                ANGLE_CAPTURE(VertexAttribDivisorEXT, context, index, divisor);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribFormat:
+        {
+            GLuint attribindex          = static_cast<GLuint>(args[0]);
+            GLint size                  = static_cast<GLint>(args[1]);
+            GLenum type                 = static_cast<GLenum>(args[2]);
+            GLboolean normalized        = static_cast<GLboolean>(args[3]);
+            GLuint relativeoffset       = static_cast<GLuint>(args[4]);
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribFormat);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribFormat, attribindex, size, type, normalized,
+                               relativeoffset);
+            if (context->skipValidation() ||
+                ValidateVertexAttribFormat(context, attribindex, size, typePacked, normalized,
+                                           relativeoffset))
+            {
+                context->vertexAttribFormat(attribindex, size, typePacked, normalized,
+                                            relativeoffset);
+                ANGLE_CAPTURE(VertexAttribFormat, context, attribindex, size, type, normalized,
+                              relativeoffset);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4i:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            GLint x      = static_cast<GLint>(args[1]);
+            GLint y      = static_cast<GLint>(args[2]);
+            GLint z      = static_cast<GLint>(args[3]);
+            GLint w      = static_cast<GLint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4i);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4i, index, x, y, z, w);
+            if (context->skipValidation() || ValidateVertexAttribI4i(context, index, x, y, z, w))
+            {
+                context->vertexAttribI4i(index, x, y, z, w);
+                ANGLE_CAPTURE(VertexAttribI4i, context, index, x, y, z, w);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4iv:
+        {
+            GLuint index   = static_cast<GLuint>(args[0]);
+            const GLint *v = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4iv);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4iv, index, v);
+            if (context->skipValidation() || ValidateVertexAttribI4iv(context, index, v))
+            {
+                context->vertexAttribI4iv(index, v);
+                ANGLE_CAPTURE(VertexAttribI4iv, context, index, v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4ui:
+        {
+            GLuint index = static_cast<GLuint>(args[0]);
+            GLuint x     = static_cast<GLuint>(args[1]);
+            GLuint y     = static_cast<GLuint>(args[2]);
+            GLuint z     = static_cast<GLuint>(args[3]);
+            GLuint w     = static_cast<GLuint>(args[4]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4ui);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4ui, index, x, y, z, w);
+            if (context->skipValidation() || ValidateVertexAttribI4ui(context, index, x, y, z, w))
+            {
+                context->vertexAttribI4ui(index, x, y, z, w);
+                ANGLE_CAPTURE(VertexAttribI4ui, context, index, x, y, z, w);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribI4uiv:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            const GLuint *v = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4uiv);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4uiv, index, v);
+            if (context->skipValidation() || ValidateVertexAttribI4uiv(context, index, v))
+            {
+                context->vertexAttribI4uiv(index, v);
+                ANGLE_CAPTURE(VertexAttribI4uiv, context, index, v);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribIFormat:
+        {
+            GLuint attribindex          = static_cast<GLuint>(args[0]);
+            GLint size                  = static_cast<GLint>(args[1]);
+            GLenum type                 = static_cast<GLenum>(args[2]);
+            GLuint relativeoffset       = static_cast<GLuint>(args[3]);
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribIFormat);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribIFormat, attribindex, size, type,
+                               relativeoffset);
+            if (context->skipValidation() ||
+                ValidateVertexAttribIFormat(context, attribindex, size, typePacked, relativeoffset))
+            {
+                context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
+                ANGLE_CAPTURE(VertexAttribIFormat, context, attribindex, size, type,
+                              relativeoffset);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribIPointer:
+        {
+            GLuint index        = static_cast<GLuint>(args[0]);
+            GLint size          = static_cast<GLint>(args[1]);
+            GLenum type         = static_cast<GLenum>(args[2]);
+            GLsizei stride      = static_cast<GLsizei>(args[3]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[4]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribIPointer);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribIPointer, index, size, type, stride,
+                               pointer);
+            if (context->skipValidation() ||
+                ValidateVertexAttribIPointer(context, index, size, typePacked, stride, pointer))
+            {
+                context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
+                ANGLE_CAPTURE(VertexAttribIPointer, context, index, size, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::VertexAttribPointer:
+        {
+            GLuint index         = static_cast<GLuint>(args[0]);
+            GLint size           = static_cast<GLint>(args[1]);
+            GLenum type          = static_cast<GLenum>(args[2]);
+            GLboolean normalized = static_cast<GLboolean>(args[3]);
+            GLsizei stride       = static_cast<GLsizei>(args[4]);
+            const void *pointer  = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[5]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribPointer);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexAttribPointer, index, size, type, normalized,
+                               stride, pointer);
+            if (context->skipValidation() ||
+                ValidateVertexAttribPointer(context, index, size, typePacked, normalized, stride,
+                                            pointer))
+            {
+                context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
+                ANGLE_CAPTURE(VertexAttribPointer, context, index, size, type, normalized, stride,
+                              pointer);
+            }
+            break;
+        }
+        case EntryPoint::VertexBindingDivisor:
+        {
+            GLuint bindingindex = static_cast<GLuint>(args[0]);
+            GLuint divisor      = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexBindingDivisor);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexBindingDivisor, bindingindex, divisor);
+            if (context->skipValidation() ||
+                ValidateVertexBindingDivisor(context, bindingindex, divisor))
+            {
+                context->vertexBindingDivisor(bindingindex, divisor);
+                ANGLE_CAPTURE(VertexBindingDivisor, context, bindingindex, divisor);
+            }
+            break;
+        }
+        case EntryPoint::VertexPointer:
+        {
+            GLint size          = static_cast<GLint>(args[0]);
+            GLenum type         = static_cast<GLenum>(args[1]);
+            GLsizei stride      = static_cast<GLsizei>(args[2]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            VertexAttribType typePacked = FromGLenum<VertexAttribType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexPointer);
+            ANGLE_BINARY_TRACE(EntryPoint::VertexPointer, size, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidateVertexPointer(context, size, typePacked, stride, pointer))
+            {
+                context->vertexPointer(size, typePacked, stride, pointer);
+                ANGLE_CAPTURE(VertexPointer, context, size, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::Viewport:
+        {
+            GLint x        = static_cast<GLint>(args[0]);
+            GLint y        = static_cast<GLint>(args[1]);
+            GLsizei width  = static_cast<GLsizei>(args[2]);
+            GLsizei height = static_cast<GLsizei>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Viewport);
+            ANGLE_BINARY_TRACE(EntryPoint::Viewport, x, y, width, height);
+            if (context->skipValidation() || ValidateViewport(context, x, y, width, height))
+            {
+                context->viewport(x, y, width, height);
+                ANGLE_CAPTURE(Viewport, context, x, y, width, height);
+            }
+            break;
+        }
+        case EntryPoint::WaitSemaphoreEXT:
+        {
+            GLuint semaphore         = static_cast<GLuint>(args[0]);
+            GLuint numBufferBarriers = static_cast<GLuint>(args[1]);
+            const GLuint *buffers =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[2]));
+            GLuint numTextureBarriers = static_cast<GLuint>(args[3]);
+            const GLuint *textures =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[4]));
+            const GLenum *srcLayouts =
+                reinterpret_cast<const GLenum *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WaitSemaphoreEXT);
+            ANGLE_BINARY_TRACE(EntryPoint::WaitSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                               numTextureBarriers, textures, srcLayouts);
+            if (context->skipValidation() ||
+                ValidateWaitSemaphoreEXT(context, semaphore, numBufferBarriers, buffers,
+                                         numTextureBarriers, textures, srcLayouts))
+            {
+                context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                                       textures, srcLayouts);
+                ANGLE_CAPTURE(WaitSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                              numTextureBarriers, textures, srcLayouts);
+            }
+            break;
+        }
+        case EntryPoint::WaitSync:
+        {
+            GLsync sync      = reinterpret_cast<GLsync>(static_cast<uintptr_t>(args[0]));
+            GLbitfield flags = static_cast<GLbitfield>(args[1]);
+            GLuint64 timeout = static_cast<GLuint64>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WaitSync);
+            ANGLE_BINARY_TRACE(EntryPoint::WaitSync, sync, flags, timeout);
+            if (context->skipValidation() || ValidateWaitSync(context, sync, flags, timeout))
+            {
+                context->waitSync(sync, flags, timeout);
+                ANGLE_CAPTURE(WaitSync, context, sync, flags, timeout);
+            }
+            break;
+        }
+        case EntryPoint::WeightPointerOES:
+        {
+            GLint size          = static_cast<GLint>(args[0]);
+            GLenum type         = static_cast<GLenum>(args[1]);
+            GLsizei stride      = static_cast<GLsizei>(args[2]);
+            const void *pointer = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WeightPointerOES);
+            ANGLE_BINARY_TRACE(EntryPoint::WeightPointerOES, size, type, stride, pointer);
+            if (context->skipValidation() ||
+                ValidateWeightPointerOES(context, size, type, stride, pointer))
+            {
+                context->weightPointer(size, type, stride, pointer);
+                ANGLE_CAPTURE(WeightPointerOES, context, size, type, stride, pointer);
+            }
+            break;
+        }
+        case EntryPoint::BindUniformLocationCHROMIUM:
+        {
+            GLuint program     = static_cast<GLuint>(args[0]);
+            GLint location     = static_cast<GLint>(args[1]);
+            const GLchar *name = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindUniformLocationCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::BindUniformLocationCHROMIUM, program, location, name);
+            if (context->skipValidation() ||
+                ValidateBindUniformLocationCHROMIUM(context, program, location, name))
+            {
+                context->bindUniformLocation(program, location, name);
+                ANGLE_CAPTURE(BindUniformLocationCHROMIUM, context, program, location, name);
+            }
+            break;
+        }
+        case EntryPoint::CoverageModulationCHROMIUM:
+        {
+            GLenum components = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverageModulationCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CoverageModulationCHROMIUM, components);
+            if (context->skipValidation() ||
+                ValidateCoverageModulationCHROMIUM(context, components))
+            {
+                context->coverageModulation(components);
+                ANGLE_CAPTURE(CoverageModulationCHROMIUM, context, components);
+            }
+            break;
+        }
+        case EntryPoint::MatrixLoadfCHROMIUM:
+        {
+            GLenum matrixMode = static_cast<GLenum>(args[0]);
+            const GLfloat *matrix =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[1]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixLoadfCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::MatrixLoadfCHROMIUM, matrixMode, matrix);
+            if (context->skipValidation() ||
+                ValidateMatrixLoadfCHROMIUM(context, matrixMode, matrix))
+            {
+                context->matrixLoadf(matrixMode, matrix);
+                ANGLE_CAPTURE(MatrixLoadfCHROMIUM, context, matrixMode, matrix);
+            }
+            break;
+        }
+        case EntryPoint::MatrixLoadIdentityCHROMIUM:
+        {
+            GLenum matrixMode = static_cast<GLenum>(args[0]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixLoadIdentityCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::MatrixLoadIdentityCHROMIUM, matrixMode);
+            if (context->skipValidation() ||
+                ValidateMatrixLoadIdentityCHROMIUM(context, matrixMode))
+            {
+                context->matrixLoadIdentity(matrixMode);
+                ANGLE_CAPTURE(MatrixLoadIdentityCHROMIUM, context, matrixMode);
+            }
+            break;
+        }
+        case EntryPoint::DeletePathsCHROMIUM:
+        {
+            GLuint first  = static_cast<GLuint>(args[0]);
+            GLsizei range = static_cast<GLsizei>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeletePathsCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::DeletePathsCHROMIUM, first, range);
+            if (context->skipValidation() || ValidateDeletePathsCHROMIUM(context, first, range))
+            {
+                context->deletePaths(first, range);
+                ANGLE_CAPTURE(DeletePathsCHROMIUM, context, first, range);
+            }
+            break;
+        }
+        case EntryPoint::PathCommandsCHROMIUM:
+        {
+            GLuint path         = static_cast<GLuint>(args[0]);
+            GLsizei numCommands = static_cast<GLsizei>(args[1]);
+            const GLubyte *commands =
+                reinterpret_cast<const GLubyte *>(static_cast<uintptr_t>(args[2]));
+            GLsizei numCoords  = static_cast<GLsizei>(args[3]);
+            GLenum coordType   = static_cast<GLenum>(args[4]);
+            const void *coords = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathCommandsCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::PathCommandsCHROMIUM, path, numCommands, commands,
+                               numCoords, coordType, coords);
+            if (context->skipValidation() ||
+                ValidatePathCommandsCHROMIUM(context, path, numCommands, commands, numCoords,
+                                             coordType, coords))
+            {
+                context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
+                ANGLE_CAPTURE(PathCommandsCHROMIUM, context, path, numCommands, commands, numCoords,
+                              coordType, coords);
+            }
+            break;
+        }
+        case EntryPoint::PathParameterfCHROMIUM:
+        {
+            GLuint path   = static_cast<GLuint>(args[0]);
+            GLenum pname  = static_cast<GLenum>(args[1]);
+            GLfloat value = bitCast<GLfloat>(static_cast<uint32_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathParameterfCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::PathParameterfCHROMIUM, path, pname, value);
+            if (context->skipValidation() ||
+                ValidatePathParameterfCHROMIUM(context, path, pname, value))
+            {
+                context->pathParameterf(path, pname, value);
+                ANGLE_CAPTURE(PathParameterfCHROMIUM, context, path, pname, value);
+            }
+            break;
+        }
+        case EntryPoint::PathParameteriCHROMIUM:
+        {
+            GLuint path  = static_cast<GLuint>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            GLint value  = static_cast<GLint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathParameteriCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::PathParameteriCHROMIUM, path, pname, value);
+            if (context->skipValidation() ||
+                ValidatePathParameteriCHROMIUM(context, path, pname, value))
+            {
+                context->pathParameteri(path, pname, value);
+                ANGLE_CAPTURE(PathParameteriCHROMIUM, context, path, pname, value);
+            }
+            break;
+        }
+        case EntryPoint::GetPathParameterfvCHROMIUM:
+        {
+            GLuint path    = static_cast<GLuint>(args[0]);
+            GLenum pname   = static_cast<GLenum>(args[1]);
+            GLfloat *value = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPathParameterfvCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::GetPathParameterfvCHROMIUM, path, pname, value);
+            if (context->skipValidation() ||
+                ValidateGetPathParameterfvCHROMIUM(context, path, pname, value))
+            {
+                context->getPathParameterfv(path, pname, value);
+                ANGLE_CAPTURE(GetPathParameterfvCHROMIUM, context, path, pname, value);
+            }
+            break;
+        }
+        case EntryPoint::GetPathParameterivCHROMIUM:
+        {
+            GLuint path  = static_cast<GLuint>(args[0]);
+            GLenum pname = static_cast<GLenum>(args[1]);
+            GLint *value = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPathParameterivCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::GetPathParameterivCHROMIUM, path, pname, value);
+            if (context->skipValidation() ||
+                ValidateGetPathParameterivCHROMIUM(context, path, pname, value))
+            {
+                context->getPathParameteriv(path, pname, value);
+                ANGLE_CAPTURE(GetPathParameterivCHROMIUM, context, path, pname, value);
+            }
+            break;
+        }
+        case EntryPoint::PathStencilFuncCHROMIUM:
+        {
+            GLenum func = static_cast<GLenum>(args[0]);
+            GLint ref   = static_cast<GLint>(args[1]);
+            GLuint mask = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathStencilFuncCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::PathStencilFuncCHROMIUM, func, ref, mask);
+            if (context->skipValidation() ||
+                ValidatePathStencilFuncCHROMIUM(context, func, ref, mask))
+            {
+                context->pathStencilFunc(func, ref, mask);
+                ANGLE_CAPTURE(PathStencilFuncCHROMIUM, context, func, ref, mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilFillPathCHROMIUM:
+        {
+            GLuint path     = static_cast<GLuint>(args[0]);
+            GLenum fillMode = static_cast<GLenum>(args[1]);
+            GLuint mask     = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFillPathCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilFillPathCHROMIUM, path, fillMode, mask);
+            if (context->skipValidation() ||
+                ValidateStencilFillPathCHROMIUM(context, path, fillMode, mask))
+            {
+                context->stencilFillPath(path, fillMode, mask);
+                ANGLE_CAPTURE(StencilFillPathCHROMIUM, context, path, fillMode, mask);
+            }
+            break;
+        }
+        case EntryPoint::StencilStrokePathCHROMIUM:
+        {
+            GLuint path     = static_cast<GLuint>(args[0]);
+            GLint reference = static_cast<GLint>(args[1]);
+            GLuint mask     = static_cast<GLuint>(args[2]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilStrokePathCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilStrokePathCHROMIUM, path, reference, mask);
+            if (context->skipValidation() ||
+                ValidateStencilStrokePathCHROMIUM(context, path, reference, mask))
+            {
+                context->stencilStrokePath(path, reference, mask);
+                ANGLE_CAPTURE(StencilStrokePathCHROMIUM, context, path, reference, mask);
+            }
+            break;
+        }
+        case EntryPoint::CoverFillPathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(args[0]);
+            GLenum coverMode = static_cast<GLenum>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverFillPathCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CoverFillPathCHROMIUM, path, coverMode);
+            if (context->skipValidation() ||
+                ValidateCoverFillPathCHROMIUM(context, path, coverMode))
+            {
+                context->coverFillPath(path, coverMode);
+                ANGLE_CAPTURE(CoverFillPathCHROMIUM, context, path, coverMode);
+            }
+            break;
+        }
+        case EntryPoint::CoverStrokePathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(args[0]);
+            GLenum coverMode = static_cast<GLenum>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverStrokePathCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CoverStrokePathCHROMIUM, path, coverMode);
+            if (context->skipValidation() ||
+                ValidateCoverStrokePathCHROMIUM(context, path, coverMode))
+            {
+                context->coverStrokePath(path, coverMode);
+                ANGLE_CAPTURE(CoverStrokePathCHROMIUM, context, path, coverMode);
+            }
+            break;
+        }
+        case EntryPoint::StencilThenCoverFillPathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(args[0]);
+            GLenum fillMode  = static_cast<GLenum>(args[1]);
+            GLuint mask      = static_cast<GLuint>(args[2]);
+            GLenum coverMode = static_cast<GLenum>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverFillPathCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverFillPathCHROMIUM, path, fillMode, mask,
+                               coverMode);
+            if (context->skipValidation() ||
+                ValidateStencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask, coverMode))
+            {
+                context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
+                ANGLE_CAPTURE(StencilThenCoverFillPathCHROMIUM, context, path, fillMode, mask,
+                              coverMode);
+            }
+            break;
+        }
+        case EntryPoint::StencilThenCoverStrokePathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(args[0]);
+            GLint reference  = static_cast<GLint>(args[1]);
+            GLuint mask      = static_cast<GLuint>(args[2]);
+            GLenum coverMode = static_cast<GLenum>(args[3]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverStrokePathCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverStrokePathCHROMIUM, path, reference,
+                               mask, coverMode);
+            if (context->skipValidation() || ValidateStencilThenCoverStrokePathCHROMIUM(
+                                                 context, path, reference, mask, coverMode))
+            {
+                context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
+                ANGLE_CAPTURE(StencilThenCoverStrokePathCHROMIUM, context, path, reference, mask,
+                              coverMode);
+            }
+            break;
+        }
+        case EntryPoint::CoverFillPathInstancedCHROMIUM:
+        {
+            GLsizei numPath      = static_cast<GLsizei>(args[0]);
+            GLenum pathNameType  = static_cast<GLenum>(args[1]);
+            const void *paths    = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLuint pathBase      = static_cast<GLuint>(args[3]);
+            GLenum coverMode     = static_cast<GLenum>(args[4]);
+            GLenum transformType = static_cast<GLenum>(args[5]);
+            const GLfloat *transformValues =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[6]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverFillPathInstancedCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CoverFillPathInstancedCHROMIUM, numPath, pathNameType,
+                               paths, pathBase, coverMode, transformType, transformValues);
+            if (context->skipValidation() || ValidateCoverFillPathInstancedCHROMIUM(
+                                                 context, numPath, pathNameType, paths, pathBase,
+                                                 coverMode, transformType, transformValues))
+            {
+                context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
+                                                transformType, transformValues);
+                ANGLE_CAPTURE(CoverFillPathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                              pathBase, coverMode, transformType, transformValues);
+            }
+            break;
+        }
+        case EntryPoint::CoverStrokePathInstancedCHROMIUM:
+        {
+            GLsizei numPath      = static_cast<GLsizei>(args[0]);
+            GLenum pathNameType  = static_cast<GLenum>(args[1]);
+            const void *paths    = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLuint pathBase      = static_cast<GLuint>(args[3]);
+            GLenum coverMode     = static_cast<GLenum>(args[4]);
+            GLenum transformType = static_cast<GLenum>(args[5]);
+            const GLfloat *transformValues =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[6]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverStrokePathInstancedCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CoverStrokePathInstancedCHROMIUM, numPath, pathNameType,
+                               paths, pathBase, coverMode, transformType, transformValues);
+            if (context->skipValidation() || ValidateCoverStrokePathInstancedCHROMIUM(
+                                                 context, numPath, pathNameType, paths, pathBase,
+                                                 coverMode, transformType, transformValues))
+            {
+                context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
+                                                  transformType, transformValues);
+                ANGLE_CAPTURE(CoverStrokePathInstancedCHROMIUM, context, numPath, pathNameType,
+                              paths, pathBase, coverMode, transformType, transformValues);
+            }
+            break;
+        }
+        case EntryPoint::StencilStrokePathInstancedCHROMIUM:
+        {
+            GLsizei numPath      = static_cast<GLsizei>(args[0]);
+            GLenum pathNameType  = static_cast<GLenum>(args[1]);
+            const void *paths    = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLuint pathBase      = static_cast<GLuint>(args[3]);
+            GLint reference      = static_cast<GLint>(args[4]);
+            GLuint mask          = static_cast<GLuint>(args[5]);
+            GLenum transformType = static_cast<GLenum>(args[6]);
+            const GLfloat *transformValues =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[7]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilStrokePathInstancedCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilStrokePathInstancedCHROMIUM, numPath,
+                               pathNameType, paths, pathBase, reference, mask, transformType,
+                               transformValues);
+            if (context->skipValidation() || ValidateStencilStrokePathInstancedCHROMIUM(
+                                                 context, numPath, pathNameType, paths, pathBase,
+                                                 reference, mask, transformType, transformValues))
+            {
+                context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase,
+                                                    reference, mask, transformType,
+                                                    transformValues);
+                ANGLE_CAPTURE(StencilStrokePathInstancedCHROMIUM, context, numPath, pathNameType,
+                              paths, pathBase, reference, mask, transformType, transformValues);
+            }
+            break;
+        }
+        case EntryPoint::StencilFillPathInstancedCHROMIUM:
+        {
+            GLsizei numPaths     = static_cast<GLsizei>(args[0]);
+            GLenum pathNameType  = static_cast<GLenum>(args[1]);
+            const void *paths    = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLuint pathBase      = static_cast<GLuint>(args[3]);
+            GLenum fillMode      = static_cast<GLenum>(args[4]);
+            GLuint mask          = static_cast<GLuint>(args[5]);
+            GLenum transformType = static_cast<GLenum>(args[6]);
+            const GLfloat *transformValues =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[7]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFillPathInstancedCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilFillPathInstancedCHROMIUM, numPaths, pathNameType,
+                               paths, pathBase, fillMode, mask, transformType, transformValues);
+            if (context->skipValidation() || ValidateStencilFillPathInstancedCHROMIUM(
+                                                 context, numPaths, pathNameType, paths, pathBase,
+                                                 fillMode, mask, transformType, transformValues))
+            {
+                context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode,
+                                                  mask, transformType, transformValues);
+                ANGLE_CAPTURE(StencilFillPathInstancedCHROMIUM, context, numPaths, pathNameType,
+                              paths, pathBase, fillMode, mask, transformType, transformValues);
+            }
+            break;
+        }
+        case EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM:
+        {
+            GLsizei numPaths     = static_cast<GLsizei>(args[0]);
+            GLenum pathNameType  = static_cast<GLenum>(args[1]);
+            const void *paths    = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLuint pathBase      = static_cast<GLuint>(args[3]);
+            GLenum fillMode      = static_cast<GLenum>(args[4]);
+            GLuint mask          = static_cast<GLuint>(args[5]);
+            GLenum coverMode     = static_cast<GLenum>(args[6]);
+            GLenum transformType = static_cast<GLenum>(args[7]);
+            const GLfloat *transformValues =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[8]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM, numPaths,
+                               pathNameType, paths, pathBase, fillMode, mask, coverMode,
+                               transformType, transformValues);
+            if (context->skipValidation() ||
+                ValidateStencilThenCoverFillPathInstancedCHROMIUM(
+                    context, numPaths, pathNameType, paths, pathBase, fillMode, mask, coverMode,
+                    transformType, transformValues))
+            {
+                context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase,
+                                                           fillMode, mask, coverMode, transformType,
+                                                           transformValues);
+                ANGLE_CAPTURE(StencilThenCoverFillPathInstancedCHROMIUM, context, numPaths,
+                              pathNameType, paths, pathBase, fillMode, mask, coverMode,
+                              transformType, transformValues);
+            }
+            break;
+        }
+        case EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM:
+        {
+            GLsizei numPaths     = static_cast<GLsizei>(args[0]);
+            GLenum pathNameType  = static_cast<GLenum>(args[1]);
+            const void *paths    = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[2]));
+            GLuint pathBase      = static_cast<GLuint>(args[3]);
+            GLint reference      = static_cast<GLint>(args[4]);
+            GLuint mask          = static_cast<GLuint>(args[5]);
+            GLenum coverMode     = static_cast<GLenum>(args[6]);
+            GLenum transformType = static_cast<GLenum>(args[7]);
+            const GLfloat *transformValues =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[8]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM, numPaths,
+                               pathNameType, paths, pathBase, reference, mask, coverMode,
+                               transformType, transformValues);
+            if (context->skipValidation() ||
+                ValidateStencilThenCoverStrokePathInstancedCHROMIUM(
+                    context, numPaths, pathNameType, paths, pathBase, reference, mask, coverMode,
+                    transformType, transformValues))
+            {
+                context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths,
+                                                             pathBase, reference, mask, coverMode,
+                                                             transformType, transformValues);
+                ANGLE_CAPTURE(StencilThenCoverStrokePathInstancedCHROMIUM, context, numPaths,
+                              pathNameType, paths, pathBase, reference, mask, coverMode,
+                              transformType, transformValues);
+            }
+            break;
+        }
+        case EntryPoint::BindFragmentInputLocationCHROMIUM:
+        {
+            GLuint programs    = static_cast<GLuint>(args[0]);
+            GLint location     = static_cast<GLint>(args[1]);
+            const GLchar *name = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragmentInputLocationCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::BindFragmentInputLocationCHROMIUM, programs, location,
+                               name);
+            if (context->skipValidation() ||
+                ValidateBindFragmentInputLocationCHROMIUM(context, programs, location, name))
+            {
+                context->bindFragmentInputLocation(programs, location, name);
+                ANGLE_CAPTURE(BindFragmentInputLocationCHROMIUM, context, programs, location, name);
+            }
+            break;
+        }
+        case EntryPoint::ProgramPathFragmentInputGenCHROMIUM:
+        {
+            GLuint program   = static_cast<GLuint>(args[0]);
+            GLint location   = static_cast<GLint>(args[1]);
+            GLenum genMode   = static_cast<GLenum>(args[2]);
+            GLint components = static_cast<GLint>(args[3]);
+            const GLfloat *coeffs =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramPathFragmentInputGenCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::ProgramPathFragmentInputGenCHROMIUM, program, location,
+                               genMode, components, coeffs);
+            if (context->skipValidation() ||
+                ValidateProgramPathFragmentInputGenCHROMIUM(context, program, location, genMode,
+                                                            components, coeffs))
+            {
+                context->programPathFragmentInputGen(program, location, genMode, components,
+                                                     coeffs);
+                ANGLE_CAPTURE(ProgramPathFragmentInputGenCHROMIUM, context, program, location,
+                              genMode, components, coeffs);
+            }
+            break;
+        }
+        case EntryPoint::CopyTextureCHROMIUM:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(args[0]);
+            GLint sourceLevel                = static_cast<GLint>(args[1]);
+            GLenum destTarget                = static_cast<GLenum>(args[2]);
+            GLuint destId                    = static_cast<GLuint>(args[3]);
+            GLint destLevel                  = static_cast<GLint>(args[4]);
+            GLint internalFormat             = static_cast<GLint>(args[5]);
+            GLenum destType                  = static_cast<GLenum>(args[6]);
+            GLboolean unpackFlipY            = static_cast<GLboolean>(args[7]);
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(args[8]);
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(args[9]);
+            TextureTarget destTargetPacked   = FromGLenum<TextureTarget>(destTarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTextureCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CopyTextureCHROMIUM, sourceId, sourceLevel, destTarget,
+                               destId, destLevel, internalFormat, destType, unpackFlipY,
+                               unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            if (context->skipValidation() ||
+                ValidateCopyTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked,
+                                            destId, destLevel, internalFormat, destType,
+                                            unpackFlipY, unpackPremultiplyAlpha,
+                                            unpackUnmultiplyAlpha))
+            {
+                context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                                     internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                                     unpackUnmultiplyAlpha);
+                ANGLE_CAPTURE(CopyTextureCHROMIUM, context, sourceId, sourceLevel, destTarget,
+                              destId, destLevel, internalFormat, destType, unpackFlipY,
+                              unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            }
+            break;
+        }
+        case EntryPoint::CopySubTextureCHROMIUM:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(args[0]);
+            GLint sourceLevel                = static_cast<GLint>(args[1]);
+            GLenum destTarget                = static_cast<GLenum>(args[2]);
+            GLuint destId                    = static_cast<GLuint>(args[3]);
+            GLint destLevel                  = static_cast<GLint>(args[4]);
+            GLint xoffset                    = static_cast<GLint>(args[5]);
+            GLint yoffset                    = static_cast<GLint>(args[6]);
+            GLint x                          = static_cast<GLint>(args[7]);
+            GLint y                          = static_cast<GLint>(args[8]);
+            GLint width                      = static_cast<GLint>(args[9]);
+            GLint height                     = static_cast<GLint>(args[10]);
+            GLboolean unpackFlipY            = static_cast<GLboolean>(args[11]);
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(args[12]);
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(args[13]);
+            TextureTarget destTargetPacked   = FromGLenum<TextureTarget>(destTarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopySubTextureCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CopySubTextureCHROMIUM, sourceId, sourceLevel,
+                               destTarget, destId, destLevel, xoffset, yoffset, x, y, width, height,
+                               unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            if (context->skipValidation() ||
+                ValidateCopySubTextureCHROMIUM(context, sourceId, sourceLevel, destTargetPacked,
+                                               destId, destLevel, xoffset, yoffset, x, y, width,
+                                               height, unpackFlipY, unpackPremultiplyAlpha,
+                                               unpackUnmultiplyAlpha))
+            {
+                context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                                        xoffset, yoffset, x, y, width, height, unpackFlipY,
+                                        unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+                ANGLE_CAPTURE(CopySubTextureCHROMIUM, context, sourceId, sourceLevel, destTarget,
+                              destId, destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                              unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            }
+            break;
+        }
+        case EntryPoint::CompressedCopyTextureCHROMIUM:
+        {
+            GLuint sourceId = static_cast<GLuint>(args[0]);
+            GLuint destId   = static_cast<GLuint>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedCopyTextureCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedCopyTextureCHROMIUM, sourceId, destId);
+            if (context->skipValidation() ||
+                ValidateCompressedCopyTextureCHROMIUM(context, sourceId, destId))
+            {
+                context->compressedCopyTexture(sourceId, destId);
+                ANGLE_CAPTURE(CompressedCopyTextureCHROMIUM, context, sourceId, destId);
+            }
+            break;
+        }
+        case EntryPoint::RequestExtensionANGLE:
+        {
+            const GLchar *name = reinterpret_cast<const GLchar *>(static_cast<uintptr_t>(args[0]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RequestExtensionANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::RequestExtensionANGLE, name);
+            if (context->skipValidation() || ValidateRequestExtensionANGLE(context, name))
+            {
+                context->requestExtension(name);
+                ANGLE_CAPTURE(RequestExtensionANGLE, context, name);
+            }
+            break;
+        }
+        case EntryPoint::GetBooleanvRobustANGLE:
+        {
+            GLenum pname      = static_cast<GLenum>(args[0]);
+            GLsizei bufSize   = static_cast<GLsizei>(args[1]);
+            GLsizei *length   = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLboolean *params = reinterpret_cast<GLboolean *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleanvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBooleanvRobustANGLE, pname, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetBooleanvRobustANGLE(context, pname, bufSize, length, params))
+            {
+                context->getBooleanvRobust(pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetBooleanvRobustANGLE, context, pname, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameterivRobustANGLE, target, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferParameterivRobustANGLE(context, targetPacked, pname, bufSize,
+                                                        length, params))
+            {
+                context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetBufferParameterivRobustANGLE, context, target, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFloatvRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFloatvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFloatvRobustANGLE, pname, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetFloatvRobustANGLE(context, pname, bufSize, length, params))
+            {
+                context->getFloatvRobust(pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetFloatvRobustANGLE, context, pname, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE:
+        {
+            GLenum target     = static_cast<GLenum>(args[0]);
+            GLenum attachment = static_cast<GLenum>(args[1]);
+            GLenum pname      = static_cast<GLenum>(args[2]);
+            GLsizei bufSize   = static_cast<GLsizei>(args[3]);
+            GLsizei *length   = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLint *params     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(
+                EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE, target,
+                               attachment, pname, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetFramebufferAttachmentParameterivRobustANGLE(
+                    context, target, attachment, pname, bufSize, length, params))
+            {
+                context->getFramebufferAttachmentParameterivRobust(target, attachment, pname,
+                                                                   bufSize, length, params);
+                ANGLE_CAPTURE(GetFramebufferAttachmentParameterivRobustANGLE, context, target,
+                              attachment, pname, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetIntegervRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLint *data     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegervRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetIntegervRobustANGLE, pname, bufSize, length, data);
+            if (context->skipValidation() ||
+                ValidateGetIntegervRobustANGLE(context, pname, bufSize, length, data))
+            {
+                context->getIntegervRobust(pname, bufSize, length, data);
+                ANGLE_CAPTURE(GetIntegervRobustANGLE, context, pname, bufSize, length, data);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramivRobustANGLE, program, pname, bufSize, length,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetProgramivRobustANGLE(context, program, pname, bufSize, length, params))
+            {
+                context->getProgramivRobust(program, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetProgramivRobustANGLE, context, program, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetRenderbufferParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameterivRobustANGLE, target, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() || ValidateGetRenderbufferParameterivRobustANGLE(
+                                                 context, target, pname, bufSize, length, params))
+            {
+                context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetRenderbufferParameterivRobustANGLE, context, target, pname,
+                              bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetShaderivRobustANGLE:
+        {
+            GLuint shader   = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetShaderivRobustANGLE, shader, pname, bufSize, length,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetShaderivRobustANGLE(context, shader, pname, bufSize, length, params))
+            {
+                context->getShaderivRobust(shader, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetShaderivRobustANGLE, context, shader, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterfvRobustANGLE:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLsizei bufSize          = static_cast<GLsizei>(args[2]);
+            GLsizei *length          = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLfloat *params          = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[4]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterfvRobustANGLE, target, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                                     params))
+            {
+                context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetTexParameterfvRobustANGLE, context, target, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterivRobustANGLE:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLsizei bufSize          = static_cast<GLsizei>(args[2]);
+            GLsizei *length          = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params            = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterivRobustANGLE, target, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                                     params))
+            {
+                context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetTexParameterivRobustANGLE, context, target, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformfvRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformfvRobustANGLE, program, location, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetUniformfvRobustANGLE(context, program, location, bufSize, length,
+                                                params))
+            {
+                context->getUniformfvRobust(program, location, bufSize, length, params);
+                ANGLE_CAPTURE(GetUniformfvRobustANGLE, context, program, location, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformivRobustANGLE, program, location, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetUniformivRobustANGLE(context, program, location, bufSize, length,
+                                                params))
+            {
+                context->getUniformivRobust(program, location, bufSize, length, params);
+                ANGLE_CAPTURE(GetUniformivRobustANGLE, context, program, location, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribfvRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribfvRobustANGLE, index, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() || ValidateGetVertexAttribfvRobustANGLE(
+                                                 context, index, pname, bufSize, length, params))
+            {
+                context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetVertexAttribfvRobustANGLE, context, index, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribivRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribivRobustANGLE, index, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() || ValidateGetVertexAttribivRobustANGLE(
+                                                 context, index, pname, bufSize, length, params))
+            {
+                context->getVertexAttribivRobust(index, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetVertexAttribivRobustANGLE, context, index, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribPointervRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            void **pointer  = reinterpret_cast<void **>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribPointervRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribPointervRobustANGLE, index, pname,
+                               bufSize, length, pointer);
+            if (context->skipValidation() || ValidateGetVertexAttribPointervRobustANGLE(
+                                                 context, index, pname, bufSize, length, pointer))
+            {
+                context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
+                ANGLE_CAPTURE(GetVertexAttribPointervRobustANGLE, context, index, pname, bufSize,
+                              length, pointer);
+            }
+            break;
+        }
+        case EntryPoint::ReadPixelsRobustANGLE:
+        {
+            GLint x          = static_cast<GLint>(args[0]);
+            GLint y          = static_cast<GLint>(args[1]);
+            GLsizei width    = static_cast<GLsizei>(args[2]);
+            GLsizei height   = static_cast<GLsizei>(args[3]);
+            GLenum format    = static_cast<GLenum>(args[4]);
+            GLenum type      = static_cast<GLenum>(args[5]);
+            GLsizei bufSize  = static_cast<GLsizei>(args[6]);
+            GLsizei *length  = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[7]));
+            GLsizei *columns = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[8]));
+            GLsizei *rows    = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[9]));
+            void *pixels     = reinterpret_cast<void *>(static_cast<uintptr_t>(args[10]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadPixelsRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::ReadPixelsRobustANGLE, x, y, width, height, format, type,
+                               bufSize, length, columns, rows, pixels);
+            if (context->skipValidation() ||
+                ValidateReadPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize,
+                                              length, columns, rows, pixels))
+            {
+                context->readPixelsRobust(x, y, width, height, format, type, bufSize, length,
+                                          columns, rows, pixels);
+                ANGLE_CAPTURE(ReadPixelsRobustANGLE, context, x, y, width, height, format, type,
+                              bufSize, length, columns, rows, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexImage2DRobustANGLE:
+        {
+            GLenum target        = static_cast<GLenum>(args[0]);
+            GLint level          = static_cast<GLint>(args[1]);
+            GLint internalformat = static_cast<GLint>(args[2]);
+            GLsizei width        = static_cast<GLsizei>(args[3]);
+            GLsizei height       = static_cast<GLsizei>(args[4]);
+            GLint border         = static_cast<GLint>(args[5]);
+            GLenum format        = static_cast<GLenum>(args[6]);
+            GLenum type          = static_cast<GLenum>(args[7]);
+            GLsizei bufSize      = static_cast<GLsizei>(args[8]);
+            const void *pixels   = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[9]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage2DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexImage2DRobustANGLE, target, level, internalformat,
+                               width, height, border, format, type, bufSize, pixels);
+            if (context->skipValidation() ||
+                ValidateTexImage2DRobustANGLE(context, targetPacked, level, internalformat, width,
+                                              height, border, format, type, bufSize, pixels))
+            {
+                context->texImage2DRobust(targetPacked, level, internalformat, width, height,
+                                          border, format, type, bufSize, pixels);
+                ANGLE_CAPTURE(TexImage2DRobustANGLE, context, target, level, internalformat, width,
+                              height, border, format, type, bufSize, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterfvRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            const GLfloat *params =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterfvRobustANGLE, target, pname, bufSize,
+                               params);
+            if (context->skipValidation() ||
+                ValidateTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, params))
+            {
+                context->texParameterfvRobust(targetPacked, pname, bufSize, params);
+                ANGLE_CAPTURE(TexParameterfvRobustANGLE, context, target, pname, bufSize, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterivRobustANGLE:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            GLsizei bufSize     = static_cast<GLsizei>(args[2]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterivRobustANGLE, target, pname, bufSize,
+                               params);
+            if (context->skipValidation() ||
+                ValidateTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, params))
+            {
+                context->texParameterivRobust(targetPacked, pname, bufSize, params);
+                ANGLE_CAPTURE(TexParameterivRobustANGLE, context, target, pname, bufSize, params);
+            }
+            break;
+        }
+        case EntryPoint::TexSubImage2DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLint level        = static_cast<GLint>(args[1]);
+            GLint xoffset      = static_cast<GLint>(args[2]);
+            GLint yoffset      = static_cast<GLint>(args[3]);
+            GLsizei width      = static_cast<GLsizei>(args[4]);
+            GLsizei height     = static_cast<GLsizei>(args[5]);
+            GLenum format      = static_cast<GLenum>(args[6]);
+            GLenum type        = static_cast<GLenum>(args[7]);
+            GLsizei bufSize    = static_cast<GLsizei>(args[8]);
+            const void *pixels = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[9]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage2DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexSubImage2DRobustANGLE, target, level, xoffset,
+                               yoffset, width, height, format, type, bufSize, pixels);
+            if (context->skipValidation() ||
+                ValidateTexSubImage2DRobustANGLE(context, targetPacked, level, xoffset, yoffset,
+                                                 width, height, format, type, bufSize, pixels))
+            {
+                context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
+                                             format, type, bufSize, pixels);
+                ANGLE_CAPTURE(TexSubImage2DRobustANGLE, context, target, level, xoffset, yoffset,
+                              width, height, format, type, bufSize, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexImage3DRobustANGLE:
+        {
+            GLenum target        = static_cast<GLenum>(args[0]);
+            GLint level          = static_cast<GLint>(args[1]);
+            GLint internalformat = static_cast<GLint>(args[2]);
+            GLsizei width        = static_cast<GLsizei>(args[3]);
+            GLsizei height       = static_cast<GLsizei>(args[4]);
+            GLsizei depth        = static_cast<GLsizei>(args[5]);
+            GLint border         = static_cast<GLint>(args[6]);
+            GLenum format        = static_cast<GLenum>(args[7]);
+            GLenum type          = static_cast<GLenum>(args[8]);
+            GLsizei bufSize      = static_cast<GLsizei>(args[9]);
+            const void *pixels   = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[10]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage3DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexImage3DRobustANGLE, target, level, internalformat,
+                               width, height, depth, border, format, type, bufSize, pixels);
+            if (context->skipValidation() ||
+                ValidateTexImage3DRobustANGLE(context, targetPacked, level, internalformat, width,
+                                              height, depth, border, format, type, bufSize, pixels))
+            {
+                context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth,
+                                          border, format, type, bufSize, pixels);
+                ANGLE_CAPTURE(TexImage3DRobustANGLE, context, target, level, internalformat, width,
+                              height, depth, border, format, type, bufSize, pixels);
+            }
+            break;
+        }
+        case EntryPoint::TexSubImage3DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLint level        = static_cast<GLint>(args[1]);
+            GLint xoffset      = static_cast<GLint>(args[2]);
+            GLint yoffset      = static_cast<GLint>(args[3]);
+            GLint zoffset      = static_cast<GLint>(args[4]);
+            GLsizei width      = static_cast<GLsizei>(args[5]);
+            GLsizei height     = static_cast<GLsizei>(args[6]);
+            GLsizei depth      = static_cast<GLsizei>(args[7]);
+            GLenum format      = static_cast<GLenum>(args[8]);
+            GLenum type        = static_cast<GLenum>(args[9]);
+            GLsizei bufSize    = static_cast<GLsizei>(args[10]);
+            const void *pixels = reinterpret_cast<const void *>(static_cast<uintptr_t>(args[11]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage3DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexSubImage3DRobustANGLE, target, level, xoffset,
+                               yoffset, zoffset, width, height, depth, format, type, bufSize,
+                               pixels);
+            if (context->skipValidation() ||
+                ValidateTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset, yoffset,
+                                                 zoffset, width, height, depth, format, type,
+                                                 bufSize, pixels))
+            {
+                context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width,
+                                             height, depth, format, type, bufSize, pixels);
+                ANGLE_CAPTURE(TexSubImage3DRobustANGLE, context, target, level, xoffset, yoffset,
+                              zoffset, width, height, depth, format, type, bufSize, pixels);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexImage2DRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLint level           = static_cast<GLint>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            GLsizei height        = static_cast<GLsizei>(args[4]);
+            GLint border          = static_cast<GLint>(args[5]);
+            GLsizei imageSize     = static_cast<GLsizei>(args[6]);
+            GLsizei dataSize      = static_cast<GLsizei>(args[7]);
+            const GLvoid *data = reinterpret_cast<const GLvoid *>(static_cast<uintptr_t>(args[8]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage2DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage2DRobustANGLE, target, level,
+                               internalformat, width, height, border, imageSize, dataSize, data);
+            if (context->skipValidation() || ValidateCompressedTexImage2DRobustANGLE(
+                                                 context, targetPacked, level, internalformat,
+                                                 width, height, border, imageSize, dataSize, data))
+            {
+                context->compressedTexImage2DRobust(targetPacked, level, internalformat, width,
+                                                    height, border, imageSize, dataSize, data);
+                ANGLE_CAPTURE(CompressedTexImage2DRobustANGLE, context, target, level,
+                              internalformat, width, height, border, imageSize, dataSize, data);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexSubImage2DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLint level        = static_cast<GLint>(args[1]);
+            GLsizei xoffset    = static_cast<GLsizei>(args[2]);
+            GLsizei yoffset    = static_cast<GLsizei>(args[3]);
+            GLsizei width      = static_cast<GLsizei>(args[4]);
+            GLsizei height     = static_cast<GLsizei>(args[5]);
+            GLenum format      = static_cast<GLenum>(args[6]);
+            GLsizei imageSize  = static_cast<GLsizei>(args[7]);
+            GLsizei dataSize   = static_cast<GLsizei>(args[8]);
+            const GLvoid *data = reinterpret_cast<const GLvoid *>(static_cast<uintptr_t>(args[9]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage2DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage2DRobustANGLE, target, level,
+                               xoffset, yoffset, width, height, format, imageSize, dataSize, data);
+            if (context->skipValidation() || ValidateCompressedTexSubImage2DRobustANGLE(
+                                                 context, targetPacked, level, xoffset, yoffset,
+                                                 width, height, format, imageSize, dataSize, data))
+            {
+                context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width,
+                                                       height, format, imageSize, dataSize, data);
+                ANGLE_CAPTURE(CompressedTexSubImage2DRobustANGLE, context, target, level, xoffset,
+                              yoffset, width, height, format, imageSize, dataSize, data);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexImage3DRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLint level           = static_cast<GLint>(args[1]);
+            GLenum internalformat = static_cast<GLenum>(args[2]);
+            GLsizei width         = static_cast<GLsizei>(args[3]);
+            GLsizei height        = static_cast<GLsizei>(args[4]);
+            GLsizei depth         = static_cast<GLsizei>(args[5]);
+            GLint border          = static_cast<GLint>(args[6]);
+            GLsizei imageSize     = static_cast<GLsizei>(args[7]);
+            GLsizei dataSize      = static_cast<GLsizei>(args[8]);
+            const GLvoid *data = reinterpret_cast<const GLvoid *>(static_cast<uintptr_t>(args[9]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage3DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage3DRobustANGLE, target, level,
+                               internalformat, width, height, depth, border, imageSize, dataSize,
+                               data);
+            if (context->skipValidation() ||
+                ValidateCompressedTexImage3DRobustANGLE(context, targetPacked, level,
+                                                        internalformat, width, height, depth,
+                                                        border, imageSize, dataSize, data))
+            {
+                context->compressedTexImage3DRobust(targetPacked, level, internalformat, width,
+                                                    height, depth, border, imageSize, dataSize,
+                                                    data);
+                ANGLE_CAPTURE(CompressedTexImage3DRobustANGLE, context, target, level,
+                              internalformat, width, height, depth, border, imageSize, dataSize,
+                              data);
+            }
+            break;
+        }
+        case EntryPoint::CompressedTexSubImage3DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(args[0]);
+            GLint level        = static_cast<GLint>(args[1]);
+            GLint xoffset      = static_cast<GLint>(args[2]);
+            GLint yoffset      = static_cast<GLint>(args[3]);
+            GLint zoffset      = static_cast<GLint>(args[4]);
+            GLsizei width      = static_cast<GLsizei>(args[5]);
+            GLsizei height     = static_cast<GLsizei>(args[6]);
+            GLsizei depth      = static_cast<GLsizei>(args[7]);
+            GLenum format      = static_cast<GLenum>(args[8]);
+            GLsizei imageSize  = static_cast<GLsizei>(args[9]);
+            GLsizei dataSize   = static_cast<GLsizei>(args[10]);
+            const GLvoid *data = reinterpret_cast<const GLvoid *>(static_cast<uintptr_t>(args[11]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage3DRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage3DRobustANGLE, target, level,
+                               xoffset, yoffset, zoffset, width, height, depth, format, imageSize,
+                               dataSize, data);
+            if (context->skipValidation() ||
+                ValidateCompressedTexSubImage3DRobustANGLE(context, targetPacked, level, xoffset,
+                                                           yoffset, zoffset, width, height, depth,
+                                                           format, imageSize, dataSize, data))
+            {
+                context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset,
+                                                       zoffset, width, height, depth, format,
+                                                       imageSize, dataSize, data);
+                ANGLE_CAPTURE(CompressedTexSubImage3DRobustANGLE, context, target, level, xoffset,
+                              yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
+                              data);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryivRobustANGLE:
+        {
+            GLenum target          = static_cast<GLenum>(args[0]);
+            GLenum pname           = static_cast<GLenum>(args[1]);
+            GLsizei bufSize        = static_cast<GLsizei>(args[2]);
+            GLsizei *length        = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params          = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            QueryType targetPacked = FromGLenum<QueryType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryivRobustANGLE, target, pname, bufSize, length,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetQueryivRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                              params))
+            {
+                context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetQueryivRobustANGLE, context, target, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectuivRobustANGLE:
+        {
+            GLuint id       = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint *params  = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuivRobustANGLE, id, pname, bufSize, length,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjectuivRobustANGLE(context, id, pname, bufSize, length, params))
+            {
+                context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetQueryObjectuivRobustANGLE, context, id, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferPointervRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            void **params   = reinterpret_cast<void **>(static_cast<uintptr_t>(args[4]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointervRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointervRobustANGLE, target, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferPointervRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                                     params))
+            {
+                context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetBufferPointervRobustANGLE, context, target, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetIntegeri_vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *data     = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegeri_vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetIntegeri_vRobustANGLE, target, index, bufSize, length,
+                               data);
+            if (context->skipValidation() ||
+                ValidateGetIntegeri_vRobustANGLE(context, target, index, bufSize, length, data))
+            {
+                context->getIntegeri_vRobust(target, index, bufSize, length, data);
+                ANGLE_CAPTURE(GetIntegeri_vRobustANGLE, context, target, index, bufSize, length,
+                              data);
+            }
+            break;
+        }
+        case EntryPoint::GetInternalformativRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(args[0]);
+            GLenum internalformat = static_cast<GLenum>(args[1]);
+            GLenum pname          = static_cast<GLenum>(args[2]);
+            GLsizei bufSize       = static_cast<GLsizei>(args[3]);
+            GLsizei *length       = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLint *params         = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInternalformativRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetInternalformativRobustANGLE, target, internalformat,
+                               pname, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetInternalformativRobustANGLE(context, target, internalformat, pname,
+                                                       bufSize, length, params))
+            {
+                context->getInternalformativRobust(target, internalformat, pname, bufSize, length,
+                                                   params);
+                ANGLE_CAPTURE(GetInternalformativRobustANGLE, context, target, internalformat,
+                              pname, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribIivRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIivRobustANGLE, index, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() || ValidateGetVertexAttribIivRobustANGLE(
+                                                 context, index, pname, bufSize, length, params))
+            {
+                context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetVertexAttribIivRobustANGLE, context, index, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetVertexAttribIuivRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint *params  = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIuivRobustANGLE, index, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() || ValidateGetVertexAttribIuivRobustANGLE(
+                                                 context, index, pname, bufSize, length, params))
+            {
+                context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetVertexAttribIuivRobustANGLE, context, index, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetUniformuivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint *params  = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetUniformuivRobustANGLE, program, location, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetUniformuivRobustANGLE(context, program, location, bufSize, length,
+                                                 params))
+            {
+                context->getUniformuivRobust(program, location, bufSize, length, params);
+                ANGLE_CAPTURE(GetUniformuivRobustANGLE, context, program, location, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetActiveUniformBlockivRobustANGLE:
+        {
+            GLuint program           = static_cast<GLuint>(args[0]);
+            GLuint uniformBlockIndex = static_cast<GLuint>(args[1]);
+            GLenum pname             = static_cast<GLenum>(args[2]);
+            GLsizei bufSize          = static_cast<GLsizei>(args[3]);
+            GLsizei *length          = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLint *params            = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockivRobustANGLE, program,
+                               uniformBlockIndex, pname, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetActiveUniformBlockivRobustANGLE(context, program, uniformBlockIndex,
+                                                           pname, bufSize, length, params))
+            {
+                context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize,
+                                                       length, params);
+                ANGLE_CAPTURE(GetActiveUniformBlockivRobustANGLE, context, program,
+                              uniformBlockIndex, pname, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetInteger64vRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLint64 *data   = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetInteger64vRobustANGLE, pname, bufSize, length, data);
+            if (context->skipValidation() ||
+                ValidateGetInteger64vRobustANGLE(context, pname, bufSize, length, data))
+            {
+                context->getInteger64vRobust(pname, bufSize, length, data);
+                ANGLE_CAPTURE(GetInteger64vRobustANGLE, context, pname, bufSize, length, data);
+            }
+            break;
+        }
+        case EntryPoint::GetInteger64i_vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint64 *data   = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64i_vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetInteger64i_vRobustANGLE, target, index, bufSize,
+                               length, data);
+            if (context->skipValidation() ||
+                ValidateGetInteger64i_vRobustANGLE(context, target, index, bufSize, length, data))
+            {
+                context->getInteger64i_vRobust(target, index, bufSize, length, data);
+                ANGLE_CAPTURE(GetInteger64i_vRobustANGLE, context, target, index, bufSize, length,
+                              data);
+            }
+            break;
+        }
+        case EntryPoint::GetBufferParameteri64vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint64 *params = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[4]));
+            BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteri64vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteri64vRobustANGLE, target, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetBufferParameteri64vRobustANGLE(context, targetPacked, pname, bufSize,
+                                                          length, params))
+            {
+                context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetBufferParameteri64vRobustANGLE, context, target, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterivRobustANGLE:
+        {
+            GLuint sampler     = static_cast<GLuint>(args[0]);
+            GLuint pname       = static_cast<GLuint>(args[1]);
+            GLsizei bufSize    = static_cast<GLsizei>(args[2]);
+            const GLint *param = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterivRobustANGLE, sampler, pname, bufSize,
+                               param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, param))
+            {
+                context->samplerParameterivRobust(sampler, pname, bufSize, param);
+                ANGLE_CAPTURE(SamplerParameterivRobustANGLE, context, sampler, pname, bufSize,
+                              param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterfvRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            const GLfloat *param =
+                reinterpret_cast<const GLfloat *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterfvRobustANGLE, sampler, pname, bufSize,
+                               param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, param))
+            {
+                context->samplerParameterfvRobust(sampler, pname, bufSize, param);
+                ANGLE_CAPTURE(SamplerParameterfvRobustANGLE, context, sampler, pname, bufSize,
+                              param);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterivRobustANGLE, sampler, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() || ValidateGetSamplerParameterivRobustANGLE(
+                                                 context, sampler, pname, bufSize, length, params))
+            {
+                context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetSamplerParameterivRobustANGLE, context, sampler, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterfvRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterfvRobustANGLE, sampler, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() || ValidateGetSamplerParameterfvRobustANGLE(
+                                                 context, sampler, pname, bufSize, length, params))
+            {
+                context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetSamplerParameterfvRobustANGLE, context, sampler, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetFramebufferParameterivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferParameterivRobustANGLE, sampler, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() || ValidateGetFramebufferParameterivRobustANGLE(
+                                                 context, sampler, pname, bufSize, length, params))
+            {
+                context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetFramebufferParameterivRobustANGLE, context, sampler, pname,
+                              bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetProgramInterfaceivRobustANGLE:
+        {
+            GLuint program          = static_cast<GLuint>(args[0]);
+            GLenum programInterface = static_cast<GLenum>(args[1]);
+            GLenum pname            = static_cast<GLenum>(args[2]);
+            GLsizei bufSize         = static_cast<GLsizei>(args[3]);
+            GLsizei *length         = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLint *params           = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[5]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInterfaceivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetProgramInterfaceivRobustANGLE, program,
+                               programInterface, pname, bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetProgramInterfaceivRobustANGLE(context, program, programInterface, pname,
+                                                         bufSize, length, params))
+            {
+                context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize,
+                                                     length, params);
+                ANGLE_CAPTURE(GetProgramInterfaceivRobustANGLE, context, program, programInterface,
+                              pname, bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetBooleani_vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLboolean *data = reinterpret_cast<GLboolean *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleani_vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetBooleani_vRobustANGLE, target, index, bufSize, length,
+                               data);
+            if (context->skipValidation() ||
+                ValidateGetBooleani_vRobustANGLE(context, target, index, bufSize, length, data))
+            {
+                context->getBooleani_vRobust(target, index, bufSize, length, data);
+                ANGLE_CAPTURE(GetBooleani_vRobustANGLE, context, target, index, bufSize, length,
+                              data);
+            }
+            break;
+        }
+        case EntryPoint::GetMultisamplefvRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLuint index    = static_cast<GLuint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLfloat *val    = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefvRobustANGLE, pname, index, bufSize,
+                               length, val);
+            if (context->skipValidation() ||
+                ValidateGetMultisamplefvRobustANGLE(context, pname, index, bufSize, length, val))
+            {
+                context->getMultisamplefvRobust(pname, index, bufSize, length, val);
+                ANGLE_CAPTURE(GetMultisamplefvRobustANGLE, context, pname, index, bufSize, length,
+                              val);
+            }
+            break;
+        }
+        case EntryPoint::GetTexLevelParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLint level     = static_cast<GLint>(args[1]);
+            GLenum pname    = static_cast<GLenum>(args[2]);
+            GLsizei bufSize = static_cast<GLsizei>(args[3]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[5]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterivRobustANGLE, target, level, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetTexLevelParameterivRobustANGLE(context, targetPacked, level, pname,
+                                                          bufSize, length, params))
+            {
+                context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length,
+                                                      params);
+                ANGLE_CAPTURE(GetTexLevelParameterivRobustANGLE, context, target, level, pname,
+                              bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexLevelParameterfvRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLint level     = static_cast<GLint>(args[1]);
+            GLenum pname    = static_cast<GLenum>(args[2]);
+            GLsizei bufSize = static_cast<GLsizei>(args[3]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[5]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfvRobustANGLE, target, level, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() ||
+                ValidateGetTexLevelParameterfvRobustANGLE(context, targetPacked, level, pname,
+                                                          bufSize, length, params))
+            {
+                context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length,
+                                                      params);
+                ANGLE_CAPTURE(GetTexLevelParameterfvRobustANGLE, context, target, level, pname,
+                              bufSize, length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetPointervRobustANGLERobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(args[0]);
+            GLsizei bufSize = static_cast<GLsizei>(args[1]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[2]));
+            void **params   = reinterpret_cast<void **>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointervRobustANGLERobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetPointervRobustANGLERobustANGLE, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetPointervRobustANGLERobustANGLE(context, pname, bufSize, length, params))
+            {
+                context->getPointervRobustANGLERobust(pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetPointervRobustANGLERobustANGLE, context, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::ReadnPixelsRobustANGLE:
+        {
+            GLint x          = static_cast<GLint>(args[0]);
+            GLint y          = static_cast<GLint>(args[1]);
+            GLsizei width    = static_cast<GLsizei>(args[2]);
+            GLsizei height   = static_cast<GLsizei>(args[3]);
+            GLenum format    = static_cast<GLenum>(args[4]);
+            GLenum type      = static_cast<GLenum>(args[5]);
+            GLsizei bufSize  = static_cast<GLsizei>(args[6]);
+            GLsizei *length  = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[7]));
+            GLsizei *columns = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[8]));
+            GLsizei *rows    = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[9]));
+            void *data       = reinterpret_cast<void *>(static_cast<uintptr_t>(args[10]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadnPixelsRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::ReadnPixelsRobustANGLE, x, y, width, height, format,
+                               type, bufSize, length, columns, rows, data);
+            if (context->skipValidation() ||
+                ValidateReadnPixelsRobustANGLE(context, x, y, width, height, format, type, bufSize,
+                                               length, columns, rows, data))
+            {
+                context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length,
+                                           columns, rows, data);
+                ANGLE_CAPTURE(ReadnPixelsRobustANGLE, context, x, y, width, height, format, type,
+                              bufSize, length, columns, rows, data);
+            }
+            break;
+        }
+        case EntryPoint::GetnUniformfvRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformfvRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetnUniformfvRobustANGLE, program, location, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetnUniformfvRobustANGLE(context, program, location, bufSize, length,
+                                                 params))
+            {
+                context->getnUniformfvRobust(program, location, bufSize, length, params);
+                ANGLE_CAPTURE(GetnUniformfvRobustANGLE, context, program, location, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetnUniformivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetnUniformivRobustANGLE, program, location, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetnUniformivRobustANGLE(context, program, location, bufSize, length,
+                                                 params))
+            {
+                context->getnUniformivRobust(program, location, bufSize, length, params);
+                ANGLE_CAPTURE(GetnUniformivRobustANGLE, context, program, location, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetnUniformuivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(args[0]);
+            GLint location  = static_cast<GLint>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint *params  = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetnUniformuivRobustANGLE, program, location, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetnUniformuivRobustANGLE(context, program, location, bufSize, length,
+                                                  params))
+            {
+                context->getnUniformuivRobust(program, location, bufSize, length, params);
+                ANGLE_CAPTURE(GetnUniformuivRobustANGLE, context, program, location, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterIivRobustANGLE:
+        {
+            GLenum target       = static_cast<GLenum>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            GLsizei bufSize     = static_cast<GLsizei>(args[2]);
+            const GLint *params = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterIivRobustANGLE, target, pname, bufSize,
+                               params);
+            if (context->skipValidation() ||
+                ValidateTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, params))
+            {
+                context->texParameterIivRobust(targetPacked, pname, bufSize, params);
+                ANGLE_CAPTURE(TexParameterIivRobustANGLE, context, target, pname, bufSize, params);
+            }
+            break;
+        }
+        case EntryPoint::TexParameterIuivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            const GLuint *params =
+                reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[3]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexParameterIuivRobustANGLE, target, pname, bufSize,
+                               params);
+            if (context->skipValidation() ||
+                ValidateTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, params))
+            {
+                context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
+                ANGLE_CAPTURE(TexParameterIuivRobustANGLE, context, target, pname, bufSize, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterIivRobustANGLE:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLsizei bufSize          = static_cast<GLsizei>(args[2]);
+            GLsizei *length          = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params            = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIivRobustANGLE, target, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, length,
+                                                      params))
+            {
+                context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetTexParameterIivRobustANGLE, context, target, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexParameterIuivRobustANGLE:
+        {
+            GLenum target            = static_cast<GLenum>(args[0]);
+            GLenum pname             = static_cast<GLenum>(args[1]);
+            GLsizei bufSize          = static_cast<GLsizei>(args[2]);
+            GLsizei *length          = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint *params           = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[4]));
+            TextureType targetPacked = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIuivRobustANGLE, target, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize,
+                                                       length, params))
+            {
+                context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetTexParameterIuivRobustANGLE, context, target, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterIivRobustANGLE:
+        {
+            GLuint sampler     = static_cast<GLuint>(args[0]);
+            GLenum pname       = static_cast<GLenum>(args[1]);
+            GLsizei bufSize    = static_cast<GLsizei>(args[2]);
+            const GLint *param = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIivRobustANGLE, sampler, pname, bufSize,
+                               param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, param))
+            {
+                context->samplerParameterIivRobust(sampler, pname, bufSize, param);
+                ANGLE_CAPTURE(SamplerParameterIivRobustANGLE, context, sampler, pname, bufSize,
+                              param);
+            }
+            break;
+        }
+        case EntryPoint::SamplerParameterIuivRobustANGLE:
+        {
+            GLuint sampler      = static_cast<GLuint>(args[0]);
+            GLenum pname        = static_cast<GLenum>(args[1]);
+            GLsizei bufSize     = static_cast<GLsizei>(args[2]);
+            const GLuint *param = reinterpret_cast<const GLuint *>(static_cast<uintptr_t>(args[3]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIuivRobustANGLE, sampler, pname, bufSize,
+                               param);
+            if (context->skipValidation() ||
+                ValidateSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, param))
+            {
+                context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
+                ANGLE_CAPTURE(SamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize,
+                              param);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterIivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIivRobustANGLE, sampler, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() || ValidateGetSamplerParameterIivRobustANGLE(
+                                                 context, sampler, pname, bufSize, length, params))
+            {
+                context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetSamplerParameterIivRobustANGLE, context, sampler, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetSamplerParameterIuivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint *params  = reinterpret_cast<GLuint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIuivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIuivRobustANGLE, sampler, pname,
+                               bufSize, length, params);
+            if (context->skipValidation() || ValidateGetSamplerParameterIuivRobustANGLE(
+                                                 context, sampler, pname, bufSize, length, params))
+            {
+                context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetSamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize,
+                              length, params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectivRobustANGLE:
+        {
+            GLuint id       = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint *params   = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectivRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectivRobustANGLE, id, pname, bufSize, length,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjectivRobustANGLE(context, id, pname, bufSize, length, params))
+            {
+                context->getQueryObjectivRobust(id, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetQueryObjectivRobustANGLE, context, id, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjecti64vRobustANGLE:
+        {
+            GLuint id       = static_cast<GLuint>(args[0]);
+            GLenum pname    = static_cast<GLenum>(args[1]);
+            GLsizei bufSize = static_cast<GLsizei>(args[2]);
+            GLsizei *length = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLint64 *params = reinterpret_cast<GLint64 *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjecti64vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjecti64vRobustANGLE, id, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjecti64vRobustANGLE(context, id, pname, bufSize, length, params))
+            {
+                context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetQueryObjecti64vRobustANGLE, context, id, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::GetQueryObjectui64vRobustANGLE:
+        {
+            GLuint id        = static_cast<GLuint>(args[0]);
+            GLenum pname     = static_cast<GLenum>(args[1]);
+            GLsizei bufSize  = static_cast<GLsizei>(args[2]);
+            GLsizei *length  = reinterpret_cast<GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLuint64 *params = reinterpret_cast<GLuint64 *>(static_cast<uintptr_t>(args[4]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectui64vRobustANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectui64vRobustANGLE, id, pname, bufSize,
+                               length, params);
+            if (context->skipValidation() ||
+                ValidateGetQueryObjectui64vRobustANGLE(context, id, pname, bufSize, length, params))
+            {
+                context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
+                ANGLE_CAPTURE(GetQueryObjectui64vRobustANGLE, context, id, pname, bufSize, length,
+                              params);
+            }
+            break;
+        }
+        case EntryPoint::CopyTexture3DANGLE:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(args[0]);
+            GLint sourceLevel                = static_cast<GLint>(args[1]);
+            GLenum destTarget                = static_cast<GLenum>(args[2]);
+            GLuint destId                    = static_cast<GLuint>(args[3]);
+            GLint destLevel                  = static_cast<GLint>(args[4]);
+            GLint internalFormat             = static_cast<GLint>(args[5]);
+            GLenum destType                  = static_cast<GLenum>(args[6]);
+            GLboolean unpackFlipY            = static_cast<GLboolean>(args[7]);
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(args[8]);
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(args[9]);
+            TextureTarget destTargetPacked   = FromGLenum<TextureTarget>(destTarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexture3DANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::CopyTexture3DANGLE, sourceId, sourceLevel, destTarget,
+                               destId, destLevel, internalFormat, destType, unpackFlipY,
+                               unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            if (context->skipValidation() ||
+                ValidateCopyTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked, destId,
+                                           destLevel, internalFormat, destType, unpackFlipY,
+                                           unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
+            {
+                context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
+                                       internalFormat, destType, unpackFlipY,
+                                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+                ANGLE_CAPTURE(CopyTexture3DANGLE, context, sourceId, sourceLevel, destTarget,
+                              destId, destLevel, internalFormat, destType, unpackFlipY,
+                              unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            }
+            break;
+        }
+        case EntryPoint::CopySubTexture3DANGLE:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(args[0]);
+            GLint sourceLevel                = static_cast<GLint>(args[1]);
+            GLenum destTarget                = static_cast<GLenum>(args[2]);
+            GLuint destId                    = static_cast<GLuint>(args[3]);
+            GLint destLevel                  = static_cast<GLint>(args[4]);
+            GLint xoffset                    = static_cast<GLint>(args[5]);
+            GLint yoffset                    = static_cast<GLint>(args[6]);
+            GLint zoffset                    = static_cast<GLint>(args[7]);
+            GLint x                          = static_cast<GLint>(args[8]);
+            GLint y                          = static_cast<GLint>(args[9]);
+            GLint z                          = static_cast<GLint>(args[10]);
+            GLint width                      = static_cast<GLint>(args[11]);
+            GLint height                     = static_cast<GLint>(args[12]);
+            GLint depth                      = static_cast<GLint>(args[13]);
+            GLboolean unpackFlipY            = static_cast<GLboolean>(args[14]);
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(args[15]);
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(args[16]);
+            TextureTarget destTargetPacked   = FromGLenum<TextureTarget>(destTarget);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopySubTexture3DANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::CopySubTexture3DANGLE, sourceId, sourceLevel, destTarget,
+                               destId, destLevel, xoffset, yoffset, zoffset, x, y, z, width, height,
+                               depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            if (context->skipValidation() ||
+                ValidateCopySubTexture3DANGLE(context, sourceId, sourceLevel, destTargetPacked,
+                                              destId, destLevel, xoffset, yoffset, zoffset, x, y, z,
+                                              width, height, depth, unpackFlipY,
+                                              unpackPremultiplyAlpha, unpackUnmultiplyAlpha))
+            {
+                context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId,
+                                          destLevel, xoffset, yoffset, zoffset, x, y, z, width,
+                                          height, depth, unpackFlipY, unpackPremultiplyAlpha,
+                                          unpackUnmultiplyAlpha);
+                ANGLE_CAPTURE(CopySubTexture3DANGLE, context, sourceId, sourceLevel, destTarget,
+                              destId, destLevel, xoffset, yoffset, zoffset, x, y, z, width, height,
+                              depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            }
+            break;
+        }
+        case EntryPoint::TexStorage2DMultisampleANGLE:
+        {
+            GLenum target                  = static_cast<GLenum>(args[0]);
+            GLsizei samples                = static_cast<GLsizei>(args[1]);
+            GLenum internalformat          = static_cast<GLenum>(args[2]);
+            GLsizei width                  = static_cast<GLsizei>(args[3]);
+            GLsizei height                 = static_cast<GLsizei>(args[4]);
+            GLboolean fixedsamplelocations = static_cast<GLboolean>(args[5]);
+            TextureType targetPacked       = FromGLenum<TextureType>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DMultisampleANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DMultisampleANGLE, target, samples,
+                               internalformat, width, height, fixedsamplelocations);
+            if (context->skipValidation() ||
+                ValidateTexStorage2DMultisampleANGLE(context, targetPacked, samples, internalformat,
+                                                     width, height, fixedsamplelocations))
+            {
+                context->texStorage2DMultisample(targetPacked, samples, internalformat, width,
+                                                 height, fixedsamplelocations);
+                ANGLE_CAPTURE(TexStorage2DMultisampleANGLE, context, target, samples,
+                              internalformat, width, height, fixedsamplelocations);
+            }
+            break;
+        }
+        case EntryPoint::GetTexLevelParameterivANGLE:
+        {
+            GLenum target              = static_cast<GLenum>(args[0]);
+            GLint level                = static_cast<GLint>(args[1]);
+            GLenum pname               = static_cast<GLenum>(args[2]);
+            GLint *params              = reinterpret_cast<GLint *>(static_cast<uintptr_t>(args[3]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterivANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterivANGLE, target, level, pname,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetTexLevelParameterivANGLE(context, targetPacked, level, pname, params))
+            {
+                context->getTexLevelParameteriv(targetPacked, level, pname, params);
+                ANGLE_CAPTURE(GetTexLevelParameterivANGLE, context, target, level, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::GetTexLevelParameterfvANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(args[0]);
+            GLint level     = static_cast<GLint>(args[1]);
+            GLenum pname    = static_cast<GLenum>(args[2]);
+            GLfloat *params = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[3]));
+            TextureTarget targetPacked = FromGLenum<TextureTarget>(target);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfvANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfvANGLE, target, level, pname,
+                               params);
+            if (context->skipValidation() ||
+                ValidateGetTexLevelParameterfvANGLE(context, targetPacked, level, pname, params))
+            {
+                context->getTexLevelParameterfv(targetPacked, level, pname, params);
+                ANGLE_CAPTURE(GetTexLevelParameterfvANGLE, context, target, level, pname, params);
+            }
+            break;
+        }
+        case EntryPoint::MultiDrawArraysANGLE:
+        {
+            GLenum mode         = static_cast<GLenum>(args[0]);
+            const GLint *firsts = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[1]));
+            const GLsizei *counts =
+                reinterpret_cast<const GLsizei *>(static_cast<uintptr_t>(args[2]));
+            GLsizei drawcount        = static_cast<GLsizei>(args[3]);
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawArraysANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::MultiDrawArraysANGLE, mode, firsts, counts, drawcount);
+            if (context->skipValidation() ||
+                ValidateMultiDrawArraysANGLE(context, modePacked, firsts, counts, drawcount))
+            {
+                context->multiDrawArrays(modePacked, firsts, counts, drawcount);
+                ANGLE_CAPTURE(MultiDrawArraysANGLE, context, mode, firsts, counts, drawcount);
+            }
+            break;
+        }
+        case EntryPoint::MultiDrawArraysInstancedANGLE:
+        {
+            GLenum mode         = static_cast<GLenum>(args[0]);
+            const GLint *firsts = reinterpret_cast<const GLint *>(static_cast<uintptr_t>(args[1]));
+            const GLsizei *counts =
+                reinterpret_cast<const GLsizei *>(static_cast<uintptr_t>(args[2]));
+            const GLsizei *instanceCounts =
+                reinterpret_cast<const GLsizei *>(static_cast<uintptr_t>(args[3]));
+            GLsizei drawcount        = static_cast<GLsizei>(args[4]);
+            PrimitiveMode modePacked = FromGLenum<PrimitiveMode>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawArraysInstancedANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::MultiDrawArraysInstancedANGLE, mode, firsts, counts,
+                               instanceCounts, drawcount);
+            if (context->skipValidation() ||
+                ValidateMultiDrawArraysInstancedANGLE(context, modePacked, firsts, counts,
+                                                      instanceCounts, drawcount))
+            {
+                context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts,
+                                                  drawcount);
+                ANGLE_CAPTURE(MultiDrawArraysInstancedANGLE, context, mode, firsts, counts,
+                              instanceCounts, drawcount);
+            }
+            break;
+        }
+        case EntryPoint::MultiDrawElementsANGLE:
+        {
+            GLenum mode = static_cast<GLenum>(args[0]);
+            const GLsizei *counts =
+                reinterpret_cast<const GLsizei *>(static_cast<uintptr_t>(args[1]));
+            GLenum type = static_cast<GLenum>(args[2]);
+            const GLvoid *const *indices =
+                reinterpret_cast<const GLvoid *const *>(static_cast<uintptr_t>(args[3]));
+            GLsizei drawcount           = static_cast<GLsizei>(args[4]);
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawElementsANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::MultiDrawElementsANGLE, mode, counts, type, indices,
+                               drawcount);
+            if (context->skipValidation() ||
+                ValidateMultiDrawElementsANGLE(context, modePacked, counts, typePacked, indices,
+                                               drawcount))
+            {
+                context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
+                ANGLE_CAPTURE(MultiDrawElementsANGLE, context, mode, counts, type, indices,
+                              drawcount);
+            }
+            break;
+        }
+        case EntryPoint::MultiDrawElementsInstancedANGLE:
+        {
+            GLenum mode = static_cast<GLenum>(args[0]);
+            const GLsizei *counts =
+                reinterpret_cast<const GLsizei *>(static_cast<uintptr_t>(args[1]));
+            GLenum type = static_cast<GLenum>(args[2]);
+            const GLvoid *const *indices =
+                reinterpret_cast<const GLvoid *const *>(static_cast<uintptr_t>(args[3]));
+            const GLsizei *instanceCounts =
+                reinterpret_cast<const GLsizei *>(static_cast<uintptr_t>(args[4]));
+            GLsizei drawcount           = static_cast<GLsizei>(args[5]);
+            PrimitiveMode modePacked    = FromGLenum<PrimitiveMode>(mode);
+            DrawElementsType typePacked = FromGLenum<DrawElementsType>(type);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawElementsInstancedANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::MultiDrawElementsInstancedANGLE, mode, counts, type,
+                               indices, instanceCounts, drawcount);
+            if (context->skipValidation() ||
+                ValidateMultiDrawElementsInstancedANGLE(context, modePacked, counts, typePacked,
+                                                        indices, instanceCounts, drawcount))
+            {
+                context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices,
+                                                    instanceCounts, drawcount);
+                ANGLE_CAPTURE(MultiDrawElementsInstancedANGLE, context, mode, counts, type, indices,
+                              instanceCounts, drawcount);
+            }
+            break;
+        }
+        case EntryPoint::GetMultisamplefvANGLE:
+        {
+            GLenum pname = static_cast<GLenum>(args[0]);
+            GLuint index = static_cast<GLuint>(args[1]);
+            GLfloat *val = reinterpret_cast<GLfloat *>(static_cast<uintptr_t>(args[2]));
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefvANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefvANGLE, pname, index, val);
+            if (context->skipValidation() ||
+                ValidateGetMultisamplefvANGLE(context, pname, index, val))
+            {
+                context->getMultisamplefv(pname, index, val);
+                ANGLE_CAPTURE(GetMultisamplefvANGLE, context, pname, index, val);
+            }
+            break;
+        }
+        case EntryPoint::SampleMaskiANGLE:
+        {
+            GLuint maskNumber = static_cast<GLuint>(args[0]);
+            GLbitfield mask   = static_cast<GLbitfield>(args[1]);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleMaskiANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::SampleMaskiANGLE, maskNumber, mask);
+            if (context->skipValidation() || ValidateSampleMaskiANGLE(context, maskNumber, mask))
+            {
+                context->sampleMaski(maskNumber, mask);
+                ANGLE_CAPTURE(SampleMaskiANGLE, context, maskNumber, mask);
+            }
+            break;
+        }
+        case EntryPoint::ProvokingVertexANGLE:
+        {
+            GLenum mode                = static_cast<GLenum>(args[0]);
+            ProvokingVertex modePacked = FromGLenum<ProvokingVertex>(mode);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProvokingVertexANGLE);
+            ANGLE_BINARY_TRACE(EntryPoint::ProvokingVertexANGLE, mode);
+            if (context->skipValidation() || ValidateProvokingVertexANGLE(context, modePacked))
+            {
+                context->provokingVertex(modePacked);
+                ANGLE_CAPTURE(ProvokingVertexANGLE, context, mode);
+            }
+            break;
+        }
+        case EntryPoint::LoseContextCHROMIUM:
+        {
+            GLenum current                    = static_cast<GLenum>(args[0]);
+            GLenum other                      = static_cast<GLenum>(args[1]);
+            GraphicsResetStatus currentPacked = FromGLenum<GraphicsResetStatus>(current);
+            GraphicsResetStatus otherPacked   = FromGLenum<GraphicsResetStatus>(other);
+            ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoseContextCHROMIUM);
+            ANGLE_BINARY_TRACE(EntryPoint::LoseContextCHROMIUM, current, other);
+            if (context->skipValidation() ||
+                ValidateLoseContextCHROMIUM(context, currentPacked, otherPacked))
+            {
+                context->loseContext(currentPacked, otherPacked);
+                ANGLE_CAPTURE(LoseContextCHROMIUM, context, current, other);
+            }
+            break;
+        }
+        default:
+            UNREACHABLE();
+            break;
+    }
+}
+}  // anonymous namespace
+
+void DecodeBatchCommands(Context *context, GLsizei size, const GLuint64 *commands)
+{
+    const GLuint64 *command = commands;
+    const GLuint64 *end     = commands + size;
+    while (command < end)
+    {
+        // Commands after one that loses the context fail as separate calls would.
+        if (ANGLE_UNLIKELY(context->isContextLost()))
+        {
+            context->handleError(GL_OUT_OF_MEMORY, err::kContextLost, __FILE__, ANGLE_FUNCTION,
+                                 __LINE__);
+            return;
+        }
+
+        size_t commandSize =
+            command[0] < ArraySize(kBatchCommandSizes) ? kBatchCommandSizes[command[0]] : 0;
+        if (commandSize == 0)
+        {
+            context->validationError(GL_INVALID_ENUM, err::kInvalidBatchCommand);
+            return;
+        }
+
+        if (static_cast<size_t>(end - command) < commandSize)
+        {
+            context->validationError(GL_INVALID_VALUE, err::kTruncatedBatchCommand);
+            return;
+        }
+
+        DecodeBatchCommand(context, static_cast<EntryPoint>(command[0]), command + 1);
+        command += commandSize;
+    }
+}
+}  // namespace gl
@@ -0,0 +1,25 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// entry_points_gles_batch_autogen.h:
+//   Decodes the commands submitted with glBatchCommandsANGLE.
+
+#ifndef LIBGLESV2_ENTRY_POINTS_GLES_BATCH_AUTOGEN_H_
+#define LIBGLESV2_ENTRY_POINTS_GLES_BATCH_AUTOGEN_H_
+
+#include "angle_gl.h"
+
+namespace gl
+{
+class Context;
+
+// Makes the calls encoded in commands, as described in extensions/ANGLE_batch_commands.txt. Stops
+// at the first command that can't be decoded, after generating a GL error.
+void DecodeBatchCommands(Context *context, GLsizei size, const GLuint64 *commands);
+}  // namespace gl
+
+#endif  // LIBGLESV2_ENTRY_POINTS_GLES_BATCH_AUTOGEN_H_
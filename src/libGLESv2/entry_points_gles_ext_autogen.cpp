@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -13,6 +13,9 @@
 #include "libANGLE/Context.h"
 #include "libANGLE/Context.inl.h"
 #include "libANGLE/validationESEXT.h"
+#include "libGLESv2/api_capture.h"
+#include "libGLESv2/binary_trace.h"
+#include "libGLESv2/entry_point_stats.h"
 #include "libGLESv2/entry_points_utils.h"
 #include "libGLESv2/global_state.h"
 
@@ -20,10 +23,30 @@
 #include "libANGLE/validationES2.h"
 #include "libANGLE/validationES3.h"
 #include "libANGLE/validationES31.h"
+#include "libGLESv2/entry_points_gles_batch_autogen.h"
 
 namespace gl
 {
 
+// GL_ANGLE_batch_commands
+void GL_APIENTRY BatchCommandsANGLE(GLsizei size, const GLuint64 *commands)
+{
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BatchCommandsANGLE);
+    ANGLE_SCOPED_GLOBAL_LOCK();
+    EVENT("(GLsizei size = %d, const GLuint64 *commands = 0x%016" PRIxPTR ")", size,
+          (uintptr_t)commands);
+    ANGLE_BINARY_TRACE(EntryPoint::BatchCommandsANGLE, size, commands);
+
+    Context *context = GetValidGlobalContext();
+    if (context)
+    {
+        if (context->skipValidation() || ValidateBatchCommandsANGLE(context, size, commands))
+        {
+            DecodeBatchCommands(context, size, commands);
+        }
+    }
+}
+
 // GL_ANGLE_copy_texture_3d
 void GL_APIENTRY CopyTexture3DANGLE(GLuint sourceId,
                                     GLint sourceLevel,
@@ -36,6 +59,7 @@ void GL_APIENTRY CopyTexture3DANGLE(GLuint sourceId,
                                     GLboolean unpackPremultiplyAlpha,
                                     GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexture3DANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -44,6 +68,9 @@ void GL_APIENTRY CopyTexture3DANGLE(GLuint sourceId,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexture3DANGLE, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -57,6 +84,9 @@ void GL_APIENTRY CopyTexture3DANGLE(GLuint sourceId,
             context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                    internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
                                    unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopyTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                          destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                          unpackUnmultiplyAlpha);
         }
     }
 }
@@ -79,6 +109,7 @@ void GL_APIENTRY CopySubTexture3DANGLE(GLuint sourceId,
                                        GLboolean unpackPremultiplyAlpha,
                                        GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopySubTexture3DANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -88,6 +119,9 @@ void GL_APIENTRY CopySubTexture3DANGLE(GLuint sourceId,
         "unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, zoffset, x, y, z,
         width, height, depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopySubTexture3DANGLE, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, xoffset, yoffset, zoffset, x, y, z, width, height, depth,
+                       unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -102,6 +136,9 @@ void GL_APIENTRY CopySubTexture3DANGLE(GLuint sourceId,
             context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                       xoffset, yoffset, zoffset, x, y, z, width, height, depth,
                                       unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopySubTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                          destLevel, xoffset, yoffset, zoffset, x, y, z, width, height, depth,
+                          unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
         }
     }
 }
@@ -118,12 +155,15 @@ void GL_APIENTRY BlitFramebufferANGLE(GLint srcX0,
                                       GLbitfield mask,
                                       GLenum filter)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlitFramebufferANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint srcX0 = %d, GLint srcY0 = %d, GLint srcX1 = %d, GLint srcY1 = %d, GLint dstX0 = "
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_TRACE(EntryPoint::BlitFramebufferANGLE, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                       dstX1, dstY1, mask, filter);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -134,6 +174,8 @@ void GL_APIENTRY BlitFramebufferANGLE(GLint srcX0,
         {
             context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
                                      filter);
+            ANGLE_CAPTURE(BlitFramebufferANGLE, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                          dstX1, dstY1, mask, filter);
         }
     }
 }
@@ -145,11 +187,14 @@ void GL_APIENTRY RenderbufferStorageMultisampleANGLE(GLenum target,
                                                      GLsizei width,
                                                      GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageMultisampleANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageMultisampleANGLE, target, samples,
+                       internalformat, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -159,6 +204,8 @@ void GL_APIENTRY RenderbufferStorageMultisampleANGLE(GLenum target,
                                                         width, height))
         {
             context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorageMultisampleANGLE, context, target, samples,
+                          internalformat, width, height);
         }
     }
 }
@@ -169,9 +216,11 @@ void GL_APIENTRY DrawArraysInstancedANGLE(GLenum mode,
                                           GLsizei count,
                                           GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, first, count, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstancedANGLE, mode, first, count, primcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -181,6 +230,7 @@ void GL_APIENTRY DrawArraysInstancedANGLE(GLenum mode,
             ValidateDrawArraysInstancedANGLE(context, modePacked, first, count, primcount))
         {
             context->drawArraysInstanced(modePacked, first, count, primcount);
+            ANGLE_CAPTURE(DrawArraysInstancedANGLE, context, mode, first, count, primcount);
         }
     }
 }
@@ -191,11 +241,14 @@ void GL_APIENTRY DrawElementsInstancedANGLE(GLenum mode,
                                             const void *indices,
                                             GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstancedANGLE, mode, count, type, indices,
+                       primcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -207,14 +260,18 @@ void GL_APIENTRY DrawElementsInstancedANGLE(GLenum mode,
                                                primcount))
         {
             context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+            ANGLE_CAPTURE(DrawElementsInstancedANGLE, context, mode, count, type, indices,
+                          primcount);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribDivisorANGLE(GLuint index, GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisorANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisorANGLE, index, divisor);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -222,6 +279,7 @@ void GL_APIENTRY VertexAttribDivisorANGLE(GLuint index, GLuint divisor)
         if (context->skipValidation() || ValidateVertexAttribDivisorANGLE(context, index, divisor))
         {
             context->vertexAttribDivisor(index, divisor);
+            ANGLE_CAPTURE(VertexAttribDivisorANGLE, context, index, divisor);
         }
     }
 }
@@ -232,10 +290,12 @@ void GL_APIENTRY MultiDrawArraysANGLE(GLenum mode,
                                       const GLsizei *counts,
                                       GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawArraysANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
           ", const GLsizei *counts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawArraysANGLE, mode, firsts, counts, drawcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -245,6 +305,7 @@ void GL_APIENTRY MultiDrawArraysANGLE(GLenum mode,
             ValidateMultiDrawArraysANGLE(context, modePacked, firsts, counts, drawcount))
         {
             context->multiDrawArrays(modePacked, firsts, counts, drawcount);
+            ANGLE_CAPTURE(MultiDrawArraysANGLE, context, mode, firsts, counts, drawcount);
         }
     }
 }
@@ -255,11 +316,14 @@ void GL_APIENTRY MultiDrawArraysInstancedANGLE(GLenum mode,
                                                const GLsizei *instanceCounts,
                                                GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawArraysInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
           ", const GLsizei *counts = 0x%016" PRIxPTR
           ", const GLsizei *instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawArraysInstancedANGLE, mode, firsts, counts,
+                       instanceCounts, drawcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -271,6 +335,8 @@ void GL_APIENTRY MultiDrawArraysInstancedANGLE(GLenum mode,
         {
             context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts,
                                               drawcount);
+            ANGLE_CAPTURE(MultiDrawArraysInstancedANGLE, context, mode, firsts, counts,
+                          instanceCounts, drawcount);
         }
     }
 }
@@ -281,11 +347,13 @@ void GL_APIENTRY MultiDrawElementsANGLE(GLenum mode,
                                         const GLvoid *const *indices,
                                         GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawElementsANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLsizei *counts = 0x%016" PRIxPTR
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawElementsANGLE, mode, counts, type, indices, drawcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -297,6 +365,7 @@ void GL_APIENTRY MultiDrawElementsANGLE(GLenum mode,
                                            drawcount))
         {
             context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
+            ANGLE_CAPTURE(MultiDrawElementsANGLE, context, mode, counts, type, indices, drawcount);
         }
     }
 }
@@ -308,11 +377,14 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLE(GLenum mode,
                                                  const GLsizei *instanceCounts,
                                                  GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawElementsInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLsizei *counts = 0x%016" PRIxPTR
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", const GLsizei*instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawElementsInstancedANGLE, mode, counts, type, indices,
+                       instanceCounts, drawcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -325,6 +397,8 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLE(GLenum mode,
         {
             context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices,
                                                 instanceCounts, drawcount);
+            ANGLE_CAPTURE(MultiDrawElementsInstancedANGLE, context, mode, counts, type, indices,
+                          instanceCounts, drawcount);
         }
     }
 }
@@ -332,8 +406,10 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLE(GLenum mode,
 // GL_ANGLE_provoking_vertex
 void GL_APIENTRY ProvokingVertexANGLE(GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProvokingVertexANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::ProvokingVertexANGLE, mode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -342,6 +418,7 @@ void GL_APIENTRY ProvokingVertexANGLE(GLenum mode)
         if (context->skipValidation() || ValidateProvokingVertexANGLE(context, modePacked))
         {
             context->provokingVertex(modePacked);
+            ANGLE_CAPTURE(ProvokingVertexANGLE, context, mode);
         }
     }
 }
@@ -349,8 +426,10 @@ void GL_APIENTRY ProvokingVertexANGLE(GLenum mode)
 // GL_ANGLE_request_extension
 void GL_APIENTRY RequestExtensionANGLE(const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RequestExtensionANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLchar * name = 0x%016" PRIxPTR ")", (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::RequestExtensionANGLE, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -358,6 +437,7 @@ void GL_APIENTRY RequestExtensionANGLE(const GLchar *name)
         if (context->skipValidation() || ValidateRequestExtensionANGLE(context, name))
         {
             context->requestExtension(name);
+            ANGLE_CAPTURE(RequestExtensionANGLE, context, name);
         }
     }
 }
@@ -368,10 +448,12 @@ void GL_APIENTRY GetBooleanvRobustANGLE(GLenum pname,
                                         GLsizei *length,
                                         GLboolean *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleanvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLboolean * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleanvRobustANGLE, pname, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -380,6 +462,7 @@ void GL_APIENTRY GetBooleanvRobustANGLE(GLenum pname,
             ValidateGetBooleanvRobustANGLE(context, pname, bufSize, length, params))
         {
             context->getBooleanvRobust(pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBooleanvRobustANGLE, context, pname, bufSize, length, params);
         }
     }
 }
@@ -390,11 +473,14 @@ void GL_APIENTRY GetBufferParameterivRobustANGLE(GLenum target,
                                                  GLsizei *length,
                                                  GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameterivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -404,6 +490,8 @@ void GL_APIENTRY GetBufferParameterivRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBufferParameterivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -413,10 +501,12 @@ void GL_APIENTRY GetFloatvRobustANGLE(GLenum pname,
                                       GLsizei *length,
                                       GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFloatvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLfloat * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFloatvRobustANGLE, pname, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -425,6 +515,7 @@ void GL_APIENTRY GetFloatvRobustANGLE(GLenum pname,
             ValidateGetFloatvRobustANGLE(context, pname, bufSize, length, params))
         {
             context->getFloatvRobust(pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetFloatvRobustANGLE, context, pname, bufSize, length, params);
         }
     }
 }
@@ -436,11 +527,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivRobustANGLE(GLenum target,
                                                                 GLsizei *length,
                                                                 GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = "
         "%d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, attachment, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE, target,
+                       attachment, pname, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -451,16 +545,20 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivRobustANGLE(GLenum target,
         {
             context->getFramebufferAttachmentParameterivRobust(target, attachment, pname, bufSize,
                                                                length, params);
+            ANGLE_CAPTURE(GetFramebufferAttachmentParameterivRobustANGLE, context, target,
+                          attachment, pname, bufSize, length, params);
         }
     }
 }
 
 void GL_APIENTRY GetIntegervRobustANGLE(GLenum pname, GLsizei bufSize, GLsizei *length, GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegervRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegervRobustANGLE, pname, bufSize, length, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -469,6 +567,7 @@ void GL_APIENTRY GetIntegervRobustANGLE(GLenum pname, GLsizei bufSize, GLsizei *
             ValidateGetIntegervRobustANGLE(context, pname, bufSize, length, data))
         {
             context->getIntegervRobust(pname, bufSize, length, data);
+            ANGLE_CAPTURE(GetIntegervRobustANGLE, context, pname, bufSize, length, data);
         }
     }
 }
@@ -479,11 +578,14 @@ void GL_APIENTRY GetProgramivRobustANGLE(GLuint program,
                                          GLsizei *length,
                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramivRobustANGLE, program, pname, bufSize, length,
+                       params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -492,6 +594,8 @@ void GL_APIENTRY GetProgramivRobustANGLE(GLuint program,
             ValidateGetProgramivRobustANGLE(context, program, pname, bufSize, length, params))
         {
             context->getProgramivRobust(program, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetProgramivRobustANGLE, context, program, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -502,11 +606,14 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLE(GLenum target,
                                                        GLsizei *length,
                                                        GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameterivRobustANGLE, target, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -515,6 +622,8 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLE(GLenum target,
                                              context, target, pname, bufSize, length, params))
         {
             context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetRenderbufferParameterivRobustANGLE, context, target, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -522,11 +631,13 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLE(GLenum target,
 void GL_APIENTRY
 GetShaderivRobustANGLE(GLuint shader, GLenum pname, GLsizei bufSize, GLsizei *length, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint shader = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         shader, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderivRobustANGLE, shader, pname, bufSize, length, params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -535,6 +646,7 @@ GetShaderivRobustANGLE(GLuint shader, GLenum pname, GLsizei bufSize, GLsizei *le
             ValidateGetShaderivRobustANGLE(context, shader, pname, bufSize, length, params))
         {
             context->getShaderivRobust(shader, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetShaderivRobustANGLE, context, shader, pname, bufSize, length, params);
         }
     }
 }
@@ -545,11 +657,14 @@ void GL_APIENTRY GetTexParameterfvRobustANGLE(GLenum target,
                                               GLsizei *length,
                                               GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterfvRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -559,6 +674,8 @@ void GL_APIENTRY GetTexParameterfvRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterfvRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -569,11 +686,14 @@ void GL_APIENTRY GetTexParameterivRobustANGLE(GLenum target,
                                               GLsizei *length,
                                               GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -583,6 +703,8 @@ void GL_APIENTRY GetTexParameterivRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -593,11 +715,14 @@ void GL_APIENTRY GetUniformfvRobustANGLE(GLuint program,
                                          GLsizei *length,
                                          GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformfvRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -606,6 +731,8 @@ void GL_APIENTRY GetUniformfvRobustANGLE(GLuint program,
             ValidateGetUniformfvRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getUniformfvRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetUniformfvRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -616,11 +743,14 @@ void GL_APIENTRY GetUniformivRobustANGLE(GLuint program,
                                          GLsizei *length,
                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -629,6 +759,8 @@ void GL_APIENTRY GetUniformivRobustANGLE(GLuint program,
             ValidateGetUniformivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getUniformivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetUniformivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -639,11 +771,14 @@ void GL_APIENTRY GetVertexAttribfvRobustANGLE(GLuint index,
                                               GLsizei *length,
                                               GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribfvRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -652,6 +787,8 @@ void GL_APIENTRY GetVertexAttribfvRobustANGLE(GLuint index,
             ValidateGetVertexAttribfvRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribfvRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -662,11 +799,14 @@ void GL_APIENTRY GetVertexAttribivRobustANGLE(GLuint index,
                                               GLsizei *length,
                                               GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribivRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -675,6 +815,8 @@ void GL_APIENTRY GetVertexAttribivRobustANGLE(GLuint index,
             ValidateGetVertexAttribivRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribivRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribivRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -685,11 +827,14 @@ void GL_APIENTRY GetVertexAttribPointervRobustANGLE(GLuint index,
                                                     GLsizei *length,
                                                     void **pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribPointervRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** pointer = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribPointervRobustANGLE, index, pname, bufSize,
+                       length, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -698,6 +843,8 @@ void GL_APIENTRY GetVertexAttribPointervRobustANGLE(GLuint index,
                                              context, index, pname, bufSize, length, pointer))
         {
             context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
+            ANGLE_CAPTURE(GetVertexAttribPointervRobustANGLE, context, index, pname, bufSize,
+                          length, pointer);
         }
     }
 }
@@ -714,6 +861,7 @@ void GL_APIENTRY ReadPixelsRobustANGLE(GLint x,
                                        GLsizei *rows,
                                        void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadPixelsRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
@@ -722,6 +870,8 @@ void GL_APIENTRY ReadPixelsRobustANGLE(GLint x,
         ", void * pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadPixelsRobustANGLE, x, y, width, height, format, type,
+                       bufSize, length, columns, rows, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -732,6 +882,8 @@ void GL_APIENTRY ReadPixelsRobustANGLE(GLint x,
         {
             context->readPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
                                       rows, pixels);
+            ANGLE_CAPTURE(ReadPixelsRobustANGLE, context, x, y, width, height, format, type,
+                          bufSize, length, columns, rows, pixels);
         }
     }
 }
@@ -747,6 +899,7 @@ void GL_APIENTRY TexImage2DRobustANGLE(GLenum target,
                                        GLsizei bufSize,
                                        const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
@@ -754,6 +907,8 @@ void GL_APIENTRY TexImage2DRobustANGLE(GLenum target,
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage2DRobustANGLE, target, level, internalformat, width,
+                       height, border, format, type, bufSize, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -765,6 +920,8 @@ void GL_APIENTRY TexImage2DRobustANGLE(GLenum target,
         {
             context->texImage2DRobust(targetPacked, level, internalformat, width, height, border,
                                       format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexImage2DRobustANGLE, context, target, level, internalformat, width,
+                          height, border, format, type, bufSize, pixels);
         }
     }
 }
@@ -774,11 +931,13 @@ void GL_APIENTRY TexParameterfvRobustANGLE(GLenum target,
                                            GLsizei bufSize,
                                            const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * params "
         "= 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterfvRobustANGLE, target, pname, bufSize, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -788,6 +947,7 @@ void GL_APIENTRY TexParameterfvRobustANGLE(GLenum target,
             ValidateTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterfvRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterfvRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -797,11 +957,13 @@ void GL_APIENTRY TexParameterivRobustANGLE(GLenum target,
                                            GLsizei bufSize,
                                            const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -811,6 +973,7 @@ void GL_APIENTRY TexParameterivRobustANGLE(GLenum target,
             ValidateTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterivRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterivRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -826,12 +989,15 @@ void GL_APIENTRY TexSubImage2DRobustANGLE(GLenum target,
                                           GLsizei bufSize,
                                           const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLsizei "
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei "
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, bufSize, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage2DRobustANGLE, target, level, xoffset, yoffset, width,
+                       height, format, type, bufSize, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -843,6 +1009,8 @@ void GL_APIENTRY TexSubImage2DRobustANGLE(GLenum target,
         {
             context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
                                          format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexSubImage2DRobustANGLE, context, target, level, xoffset, yoffset, width,
+                          height, format, type, bufSize, pixels);
         }
     }
 }
@@ -859,6 +1027,7 @@ void GL_APIENTRY TexImage3DRobustANGLE(GLenum target,
                                        GLsizei bufSize,
                                        const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
@@ -866,6 +1035,8 @@ void GL_APIENTRY TexImage3DRobustANGLE(GLenum target,
         "type = 0x%X, GLsizei bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage3DRobustANGLE, target, level, internalformat, width,
+                       height, depth, border, format, type, bufSize, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -877,6 +1048,8 @@ void GL_APIENTRY TexImage3DRobustANGLE(GLenum target,
         {
             context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth,
                                       border, format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexImage3DRobustANGLE, context, target, level, internalformat, width,
+                          height, depth, border, format, type, bufSize, pixels);
         }
     }
 }
@@ -894,6 +1067,7 @@ void GL_APIENTRY TexSubImage3DRobustANGLE(GLenum target,
                                           GLsizei bufSize,
                                           const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -902,6 +1076,8 @@ void GL_APIENTRY TexSubImage3DRobustANGLE(GLenum target,
         ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage3DRobustANGLE, target, level, xoffset, yoffset,
+                       zoffset, width, height, depth, format, type, bufSize, pixels);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -914,6 +1090,8 @@ void GL_APIENTRY TexSubImage3DRobustANGLE(GLenum target,
         {
             context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width,
                                          height, depth, format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexSubImage3DRobustANGLE, context, target, level, xoffset, yoffset,
+                          zoffset, width, height, depth, format, type, bufSize, pixels);
         }
     }
 }
@@ -928,12 +1106,15 @@ void GL_APIENTRY CompressedTexImage2DRobustANGLE(GLenum target,
                                                  GLsizei dataSize,
                                                  const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, GLsizei dataSize = "
         "%d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, dataSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage2DRobustANGLE, target, level, internalformat,
+                       width, height, border, imageSize, dataSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -945,6 +1126,8 @@ void GL_APIENTRY CompressedTexImage2DRobustANGLE(GLenum target,
         {
             context->compressedTexImage2DRobust(targetPacked, level, internalformat, width, height,
                                                 border, imageSize, dataSize, data);
+            ANGLE_CAPTURE(CompressedTexImage2DRobustANGLE, context, target, level, internalformat,
+                          width, height, border, imageSize, dataSize, data);
         }
     }
 }
@@ -960,6 +1143,7 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLE(GLenum target,
                                                     GLsizei dataSize,
                                                     const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLsizei xoffset = %d, GLsizei yoffset = %d, "
@@ -967,6 +1151,8 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLE(GLenum target,
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage2DRobustANGLE, target, level, xoffset,
+                       yoffset, width, height, format, imageSize, dataSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -978,6 +1164,8 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLE(GLenum target,
         {
             context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width,
                                                    height, format, imageSize, dataSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage2DRobustANGLE, context, target, level, xoffset,
+                          yoffset, width, height, format, imageSize, dataSize, data);
         }
     }
 }
@@ -993,6 +1181,7 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLE(GLenum target,
                                                  GLsizei dataSize,
                                                  const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
@@ -1000,6 +1189,8 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLE(GLenum target,
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage3DRobustANGLE, target, level, internalformat,
+                       width, height, depth, border, imageSize, dataSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1011,6 +1202,8 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLE(GLenum target,
         {
             context->compressedTexImage3DRobust(targetPacked, level, internalformat, width, height,
                                                 depth, border, imageSize, dataSize, data);
+            ANGLE_CAPTURE(CompressedTexImage3DRobustANGLE, context, target, level, internalformat,
+                          width, height, depth, border, imageSize, dataSize, data);
         }
     }
 }
@@ -1028,6 +1221,7 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLE(GLenum target,
                                                     GLsizei dataSize,
                                                     const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -1036,6 +1230,8 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLE(GLenum target,
         "0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage3DRobustANGLE, target, level, xoffset,
+                       yoffset, zoffset, width, height, depth, format, imageSize, dataSize, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1049,6 +1245,9 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLE(GLenum target,
             context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset,
                                                    width, height, depth, format, imageSize,
                                                    dataSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage3DRobustANGLE, context, target, level, xoffset,
+                          yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
+                          data);
         }
     }
 }
@@ -1056,11 +1255,13 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLE(GLenum target,
 void GL_APIENTRY
 GetQueryivRobustANGLE(GLenum target, GLenum pname, GLsizei bufSize, GLsizei *length, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1070,6 +1271,7 @@ GetQueryivRobustANGLE(GLenum target, GLenum pname, GLsizei bufSize, GLsizei *len
             ValidateGetQueryivRobustANGLE(context, targetPacked, pname, bufSize, length, params))
         {
             context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryivRobustANGLE, context, target, pname, bufSize, length, params);
         }
     }
 }
@@ -1080,11 +1282,14 @@ void GL_APIENTRY GetQueryObjectuivRobustANGLE(GLuint id,
                                               GLsizei *length,
                                               GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuivRobustANGLE, id, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1093,6 +1298,8 @@ void GL_APIENTRY GetQueryObjectuivRobustANGLE(GLuint id,
             ValidateGetQueryObjectuivRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjectuivRobustANGLE, context, id, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1103,11 +1310,14 @@ void GL_APIENTRY GetBufferPointervRobustANGLE(GLenum target,
                                               GLsizei *length,
                                               void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointervRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointervRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1117,6 +1327,8 @@ void GL_APIENTRY GetBufferPointervRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBufferPointervRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1124,11 +1336,13 @@ void GL_APIENTRY GetBufferPointervRobustANGLE(GLenum target,
 void GL_APIENTRY
 GetIntegeri_vRobustANGLE(GLenum target, GLuint index, GLsizei bufSize, GLsizei *length, GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegeri_vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegeri_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1137,6 +1351,7 @@ GetIntegeri_vRobustANGLE(GLenum target, GLuint index, GLsizei bufSize, GLsizei *
             ValidateGetIntegeri_vRobustANGLE(context, target, index, bufSize, length, data))
         {
             context->getIntegeri_vRobust(target, index, bufSize, length, data);
+            ANGLE_CAPTURE(GetIntegeri_vRobustANGLE, context, target, index, bufSize, length, data);
         }
     }
 }
@@ -1148,11 +1363,14 @@ void GL_APIENTRY GetInternalformativRobustANGLE(GLenum target,
                                                 GLsizei *length,
                                                 GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInternalformativRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInternalformativRobustANGLE, target, internalformat, pname,
+                       bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1163,6 +1381,8 @@ void GL_APIENTRY GetInternalformativRobustANGLE(GLenum target,
         {
             context->getInternalformativRobust(target, internalformat, pname, bufSize, length,
                                                params);
+            ANGLE_CAPTURE(GetInternalformativRobustANGLE, context, target, internalformat, pname,
+                          bufSize, length, params);
         }
     }
 }
@@ -1173,11 +1393,14 @@ void GL_APIENTRY GetVertexAttribIivRobustANGLE(GLuint index,
                                                GLsizei *length,
                                                GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIivRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1186,6 +1409,8 @@ void GL_APIENTRY GetVertexAttribIivRobustANGLE(GLuint index,
             ValidateGetVertexAttribIivRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribIivRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1196,11 +1421,14 @@ void GL_APIENTRY GetVertexAttribIuivRobustANGLE(GLuint index,
                                                 GLsizei *length,
                                                 GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIuivRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1209,6 +1437,8 @@ void GL_APIENTRY GetVertexAttribIuivRobustANGLE(GLuint index,
             ValidateGetVertexAttribIuivRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribIuivRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1219,11 +1449,14 @@ void GL_APIENTRY GetUniformuivRobustANGLE(GLuint program,
                                           GLsizei *length,
                                           GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformuivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1232,6 +1465,8 @@ void GL_APIENTRY GetUniformuivRobustANGLE(GLuint program,
             ValidateGetUniformuivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getUniformuivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetUniformuivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -1243,11 +1478,14 @@ void GL_APIENTRY GetActiveUniformBlockivRobustANGLE(GLuint program,
                                                     GLsizei *length,
                                                     GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockivRobustANGLE, program, uniformBlockIndex,
+                       pname, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1258,6 +1496,8 @@ void GL_APIENTRY GetActiveUniformBlockivRobustANGLE(GLuint program,
         {
             context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize,
                                                    length, params);
+            ANGLE_CAPTURE(GetActiveUniformBlockivRobustANGLE, context, program, uniformBlockIndex,
+                          pname, bufSize, length, params);
         }
     }
 }
@@ -1267,10 +1507,12 @@ void GL_APIENTRY GetInteger64vRobustANGLE(GLenum pname,
                                           GLsizei *length,
                                           GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint64 * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64vRobustANGLE, pname, bufSize, length, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1279,6 +1521,7 @@ void GL_APIENTRY GetInteger64vRobustANGLE(GLenum pname,
             ValidateGetInteger64vRobustANGLE(context, pname, bufSize, length, data))
         {
             context->getInteger64vRobust(pname, bufSize, length, data);
+            ANGLE_CAPTURE(GetInteger64vRobustANGLE, context, pname, bufSize, length, data);
         }
     }
 }
@@ -1289,11 +1532,14 @@ void GL_APIENTRY GetInteger64i_vRobustANGLE(GLenum target,
                                             GLsizei *length,
                                             GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64i_vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64i_vRobustANGLE, target, index, bufSize, length,
+                       data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1302,6 +1548,8 @@ void GL_APIENTRY GetInteger64i_vRobustANGLE(GLenum target,
             ValidateGetInteger64i_vRobustANGLE(context, target, index, bufSize, length, data))
         {
             context->getInteger64i_vRobust(target, index, bufSize, length, data);
+            ANGLE_CAPTURE(GetInteger64i_vRobustANGLE, context, target, index, bufSize, length,
+                          data);
         }
     }
 }
@@ -1312,11 +1560,14 @@ void GL_APIENTRY GetBufferParameteri64vRobustANGLE(GLenum target,
                                                    GLsizei *length,
                                                    GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteri64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteri64vRobustANGLE, target, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1326,6 +1577,8 @@ void GL_APIENTRY GetBufferParameteri64vRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBufferParameteri64vRobustANGLE, context, target, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1335,11 +1588,13 @@ void GL_APIENTRY SamplerParameterivRobustANGLE(GLuint sampler,
                                                GLsizei bufSize,
                                                const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLuint pname = %u, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1348,6 +1603,7 @@ void GL_APIENTRY SamplerParameterivRobustANGLE(GLuint sampler,
             ValidateSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterivRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterivRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -1357,11 +1613,13 @@ void GL_APIENTRY SamplerParameterfvRobustANGLE(GLuint sampler,
                                                GLsizei bufSize,
                                                const GLfloat *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterfvRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1370,6 +1628,7 @@ void GL_APIENTRY SamplerParameterfvRobustANGLE(GLuint sampler,
             ValidateSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterfvRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterfvRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -1380,11 +1639,14 @@ void GL_APIENTRY GetSamplerParameterivRobustANGLE(GLuint sampler,
                                                   GLsizei *length,
                                                   GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1393,6 +1655,8 @@ void GL_APIENTRY GetSamplerParameterivRobustANGLE(GLuint sampler,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1403,11 +1667,14 @@ void GL_APIENTRY GetSamplerParameterfvRobustANGLE(GLuint sampler,
                                                   GLsizei *length,
                                                   GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterfvRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1416,6 +1683,8 @@ void GL_APIENTRY GetSamplerParameterfvRobustANGLE(GLuint sampler,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterfvRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1426,11 +1695,14 @@ void GL_APIENTRY GetFramebufferParameterivRobustANGLE(GLuint sampler,
                                                       GLsizei *length,
                                                       GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferParameterivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1439,6 +1711,8 @@ void GL_APIENTRY GetFramebufferParameterivRobustANGLE(GLuint sampler,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetFramebufferParameterivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1450,11 +1724,14 @@ void GL_APIENTRY GetProgramInterfaceivRobustANGLE(GLuint program,
                                                   GLsizei *length,
                                                   GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInterfaceivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLsizei "
         "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, programInterface, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramInterfaceivRobustANGLE, program, programInterface,
+                       pname, bufSize, length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1465,6 +1742,8 @@ void GL_APIENTRY GetProgramInterfaceivRobustANGLE(GLuint program,
         {
             context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize, length,
                                                  params);
+            ANGLE_CAPTURE(GetProgramInterfaceivRobustANGLE, context, program, programInterface,
+                          pname, bufSize, length, params);
         }
     }
 }
@@ -1475,11 +1754,13 @@ void GL_APIENTRY GetBooleani_vRobustANGLE(GLenum target,
                                           GLsizei *length,
                                           GLboolean *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleani_vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLboolean * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleani_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1488,6 +1769,7 @@ void GL_APIENTRY GetBooleani_vRobustANGLE(GLenum target,
             ValidateGetBooleani_vRobustANGLE(context, target, index, bufSize, length, data))
         {
             context->getBooleani_vRobust(target, index, bufSize, length, data);
+            ANGLE_CAPTURE(GetBooleani_vRobustANGLE, context, target, index, bufSize, length, data);
         }
     }
 }
@@ -1498,11 +1780,13 @@ void GL_APIENTRY GetMultisamplefvRobustANGLE(GLenum pname,
                                              GLsizei *length,
                                              GLfloat *val)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum pname = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * val = 0x%016" PRIxPTR ")",
         pname, index, bufSize, (uintptr_t)length, (uintptr_t)val);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefvRobustANGLE, pname, index, bufSize, length, val);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1511,6 +1795,7 @@ void GL_APIENTRY GetMultisamplefvRobustANGLE(GLenum pname,
             ValidateGetMultisamplefvRobustANGLE(context, pname, index, bufSize, length, val))
         {
             context->getMultisamplefvRobust(pname, index, bufSize, length, val);
+            ANGLE_CAPTURE(GetMultisamplefvRobustANGLE, context, pname, index, bufSize, length, val);
         }
     }
 }
@@ -1522,11 +1807,14 @@ void GL_APIENTRY GetTexLevelParameterivRobustANGLE(GLenum target,
                                                    GLsizei *length,
                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterivRobustANGLE, target, level, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1538,6 +1826,8 @@ void GL_APIENTRY GetTexLevelParameterivRobustANGLE(GLenum target,
         {
             context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length,
                                                   params);
+            ANGLE_CAPTURE(GetTexLevelParameterivRobustANGLE, context, target, level, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1549,11 +1839,14 @@ void GL_APIENTRY GetTexLevelParameterfvRobustANGLE(GLenum target,
                                                    GLsizei *length,
                                                    GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfvRobustANGLE, target, level, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1565,6 +1858,8 @@ void GL_APIENTRY GetTexLevelParameterfvRobustANGLE(GLenum target,
         {
             context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length,
                                                   params);
+            ANGLE_CAPTURE(GetTexLevelParameterfvRobustANGLE, context, target, level, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1574,10 +1869,13 @@ void GL_APIENTRY GetPointervRobustANGLERobustANGLE(GLenum pname,
                                                    GLsizei *length,
                                                    void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointervRobustANGLERobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", void ** params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPointervRobustANGLERobustANGLE, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1586,6 +1884,8 @@ void GL_APIENTRY GetPointervRobustANGLERobustANGLE(GLenum pname,
             ValidateGetPointervRobustANGLERobustANGLE(context, pname, bufSize, length, params))
         {
             context->getPointervRobustANGLERobust(pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetPointervRobustANGLERobustANGLE, context, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1602,6 +1902,7 @@ void GL_APIENTRY ReadnPixelsRobustANGLE(GLint x,
                                         GLsizei *rows,
                                         void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadnPixelsRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
@@ -1610,6 +1911,8 @@ void GL_APIENTRY ReadnPixelsRobustANGLE(GLint x,
         ", void * data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadnPixelsRobustANGLE, x, y, width, height, format, type,
+                       bufSize, length, columns, rows, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1620,6 +1923,8 @@ void GL_APIENTRY ReadnPixelsRobustANGLE(GLint x,
         {
             context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
                                        rows, data);
+            ANGLE_CAPTURE(ReadnPixelsRobustANGLE, context, x, y, width, height, format, type,
+                          bufSize, length, columns, rows, data);
         }
     }
 }
@@ -1630,11 +1935,14 @@ void GL_APIENTRY GetnUniformfvRobustANGLE(GLuint program,
                                           GLsizei *length,
                                           GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformfvRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1643,6 +1951,8 @@ void GL_APIENTRY GetnUniformfvRobustANGLE(GLuint program,
             ValidateGetnUniformfvRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getnUniformfvRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetnUniformfvRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -1653,11 +1963,14 @@ void GL_APIENTRY GetnUniformivRobustANGLE(GLuint program,
                                           GLsizei *length,
                                           GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1666,6 +1979,8 @@ void GL_APIENTRY GetnUniformivRobustANGLE(GLuint program,
             ValidateGetnUniformivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getnUniformivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetnUniformivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -1676,11 +1991,14 @@ void GL_APIENTRY GetnUniformuivRobustANGLE(GLuint program,
                                            GLsizei *length,
                                            GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformuivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1689,6 +2007,8 @@ void GL_APIENTRY GetnUniformuivRobustANGLE(GLuint program,
             ValidateGetnUniformuivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getnUniformuivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetnUniformuivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -1698,11 +2018,13 @@ void GL_APIENTRY TexParameterIivRobustANGLE(GLenum target,
                                             GLsizei bufSize,
                                             const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1712,6 +2034,7 @@ void GL_APIENTRY TexParameterIivRobustANGLE(GLenum target,
             ValidateTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterIivRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterIivRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -1721,11 +2044,13 @@ void GL_APIENTRY TexParameterIuivRobustANGLE(GLenum target,
                                              GLsizei bufSize,
                                              const GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIuivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1735,6 +2060,7 @@ void GL_APIENTRY TexParameterIuivRobustANGLE(GLenum target,
             ValidateTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterIuivRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -1745,11 +2071,14 @@ void GL_APIENTRY GetTexParameterIivRobustANGLE(GLenum target,
                                                GLsizei *length,
                                                GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1759,6 +2088,8 @@ void GL_APIENTRY GetTexParameterIivRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterIivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1769,11 +2100,14 @@ void GL_APIENTRY GetTexParameterIuivRobustANGLE(GLenum target,
                                                 GLsizei *length,
                                                 GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIuivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1783,6 +2117,8 @@ void GL_APIENTRY GetTexParameterIuivRobustANGLE(GLenum target,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterIuivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1792,11 +2128,13 @@ void GL_APIENTRY SamplerParameterIivRobustANGLE(GLuint sampler,
                                                 GLsizei bufSize,
                                                 const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1805,6 +2143,7 @@ void GL_APIENTRY SamplerParameterIivRobustANGLE(GLuint sampler,
             ValidateSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterIivRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterIivRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -1814,11 +2153,13 @@ void GL_APIENTRY SamplerParameterIuivRobustANGLE(GLuint sampler,
                                                  GLsizei bufSize,
                                                  const GLuint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIuivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1827,6 +2168,7 @@ void GL_APIENTRY SamplerParameterIuivRobustANGLE(GLuint sampler,
             ValidateSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -1837,11 +2179,14 @@ void GL_APIENTRY GetSamplerParameterIivRobustANGLE(GLuint sampler,
                                                    GLsizei *length,
                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1850,6 +2195,8 @@ void GL_APIENTRY GetSamplerParameterIivRobustANGLE(GLuint sampler,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterIivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1860,11 +2207,14 @@ void GL_APIENTRY GetSamplerParameterIuivRobustANGLE(GLuint sampler,
                                                     GLsizei *length,
                                                     GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIuivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1873,6 +2223,8 @@ void GL_APIENTRY GetSamplerParameterIuivRobustANGLE(GLuint sampler,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -1883,11 +2235,13 @@ void GL_APIENTRY GetQueryObjectivRobustANGLE(GLuint id,
                                              GLsizei *length,
                                              GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectivRobustANGLE, id, pname, bufSize, length, params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -1896,6 +2250,7 @@ void GL_APIENTRY GetQueryObjectivRobustANGLE(GLuint id,
             ValidateGetQueryObjectivRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjectivRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjectivRobustANGLE, context, id, pname, bufSize, length, params);
         }
     }
 }
@@ -1906,11 +2261,14 @@ void GL_APIENTRY GetQueryObjecti64vRobustANGLE(GLuint id,
                                                GLsizei *length,
                                                GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjecti64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjecti64vRobustANGLE, id, pname, bufSize, length,
+                       params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -1919,6 +2277,8 @@ void GL_APIENTRY GetQueryObjecti64vRobustANGLE(GLuint id,
             ValidateGetQueryObjecti64vRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjecti64vRobustANGLE, context, id, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1929,11 +2289,14 @@ void GL_APIENTRY GetQueryObjectui64vRobustANGLE(GLuint id,
                                                 GLsizei *length,
                                                 GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectui64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectui64vRobustANGLE, id, pname, bufSize, length,
+                       params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1942,6 +2305,8 @@ void GL_APIENTRY GetQueryObjectui64vRobustANGLE(GLuint id,
             ValidateGetQueryObjectui64vRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjectui64vRobustANGLE, context, id, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -1954,11 +2319,14 @@ void GL_APIENTRY TexStorage2DMultisampleANGLE(GLenum target,
                                               GLsizei height,
                                               GLboolean fixedsamplelocations)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DMultisampleANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DMultisampleANGLE, target, samples, internalformat,
+                       width, height, fixedsamplelocations);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1970,6 +2338,8 @@ void GL_APIENTRY TexStorage2DMultisampleANGLE(GLenum target,
         {
             context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
                                              fixedsamplelocations);
+            ANGLE_CAPTURE(TexStorage2DMultisampleANGLE, context, target, samples, internalformat,
+                          width, height, fixedsamplelocations);
         }
     }
 }
@@ -1979,11 +2349,13 @@ void GL_APIENTRY GetTexLevelParameterivANGLE(GLenum target,
                                              GLenum pname,
                                              GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterivANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterivANGLE, target, level, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -1993,6 +2365,7 @@ void GL_APIENTRY GetTexLevelParameterivANGLE(GLenum target,
             ValidateGetTexLevelParameterivANGLE(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameteriv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameterivANGLE, context, target, level, pname, params);
         }
     }
 }
@@ -2002,11 +2375,13 @@ void GL_APIENTRY GetTexLevelParameterfvANGLE(GLenum target,
                                              GLenum pname,
                                              GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfvANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfvANGLE, target, level, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2016,15 +2391,18 @@ void GL_APIENTRY GetTexLevelParameterfvANGLE(GLenum target,
             ValidateGetTexLevelParameterfvANGLE(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameterfv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameterfvANGLE, context, target, level, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetMultisamplefvANGLE(GLenum pname, GLuint index, GLfloat *val)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefvANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat * val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefvANGLE, pname, index, val);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2032,14 +2410,17 @@ void GL_APIENTRY GetMultisamplefvANGLE(GLenum pname, GLuint index, GLfloat *val)
         if (context->skipValidation() || ValidateGetMultisamplefvANGLE(context, pname, index, val))
         {
             context->getMultisamplefv(pname, index, val);
+            ANGLE_CAPTURE(GetMultisamplefvANGLE, context, pname, index, val);
         }
     }
 }
 
 void GL_APIENTRY SampleMaskiANGLE(GLuint maskNumber, GLbitfield mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleMaskiANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleMaskiANGLE, maskNumber, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2047,6 +2428,7 @@ void GL_APIENTRY SampleMaskiANGLE(GLuint maskNumber, GLbitfield mask)
         if (context->skipValidation() || ValidateSampleMaskiANGLE(context, maskNumber, mask))
         {
             context->sampleMaski(maskNumber, mask);
+            ANGLE_CAPTURE(SampleMaskiANGLE, context, maskNumber, mask);
         }
     }
 }
@@ -2057,10 +2439,12 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLE(GLuint shader,
                                                 GLsizei *length,
                                                 GLchar *source)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTranslatedShaderSourceANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei bufsize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufsize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTranslatedShaderSourceANGLE, shader, bufsize, length, source);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2069,6 +2453,7 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLE(GLuint shader,
             ValidateGetTranslatedShaderSourceANGLE(context, shader, bufsize, length, source))
         {
             context->getTranslatedShaderSource(shader, bufsize, length, source);
+            ANGLE_CAPTURE(GetTranslatedShaderSourceANGLE, context, shader, bufsize, length, source);
         }
     }
 }
@@ -2076,9 +2461,11 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLE(GLuint shader,
 // GL_CHROMIUM_bind_uniform_location
 void GL_APIENTRY BindUniformLocationCHROMIUM(GLuint program, GLint location, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindUniformLocationCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, const GLchar* name = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindUniformLocationCHROMIUM, program, location, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2087,6 +2474,7 @@ void GL_APIENTRY BindUniformLocationCHROMIUM(GLuint program, GLint location, con
             ValidateBindUniformLocationCHROMIUM(context, program, location, name))
         {
             context->bindUniformLocation(program, location, name);
+            ANGLE_CAPTURE(BindUniformLocationCHROMIUM, context, program, location, name);
         }
     }
 }
@@ -2094,8 +2482,10 @@ void GL_APIENTRY BindUniformLocationCHROMIUM(GLuint program, GLint location, con
 // GL_CHROMIUM_copy_compressed_texture
 void GL_APIENTRY CompressedCopyTextureCHROMIUM(GLuint sourceId, GLuint destId)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedCopyTextureCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sourceId = %u, GLuint destId = %u)", sourceId, destId);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedCopyTextureCHROMIUM, sourceId, destId);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2104,6 +2494,7 @@ void GL_APIENTRY CompressedCopyTextureCHROMIUM(GLuint sourceId, GLuint destId)
             ValidateCompressedCopyTextureCHROMIUM(context, sourceId, destId))
         {
             context->compressedCopyTexture(sourceId, destId);
+            ANGLE_CAPTURE(CompressedCopyTextureCHROMIUM, context, sourceId, destId);
         }
     }
 }
@@ -2120,6 +2511,7 @@ void GL_APIENTRY CopyTextureCHROMIUM(GLuint sourceId,
                                      GLboolean unpackPremultiplyAlpha,
                                      GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTextureCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -2128,6 +2520,9 @@ void GL_APIENTRY CopyTextureCHROMIUM(GLuint sourceId,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTextureCHROMIUM, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2141,6 +2536,9 @@ void GL_APIENTRY CopyTextureCHROMIUM(GLuint sourceId,
             context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                  internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
                                  unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopyTextureCHROMIUM, context, sourceId, sourceLevel, destTarget, destId,
+                          destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                          unpackUnmultiplyAlpha);
         }
     }
 }
@@ -2160,6 +2558,7 @@ void GL_APIENTRY CopySubTextureCHROMIUM(GLuint sourceId,
                                         GLboolean unpackPremultiplyAlpha,
                                         GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopySubTextureCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -2168,6 +2567,9 @@ void GL_APIENTRY CopySubTextureCHROMIUM(GLuint sourceId,
         "unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, x, y, width, height,
         unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopySubTextureCHROMIUM, sourceId, sourceLevel, destTarget,
+                       destId, destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2182,6 +2584,9 @@ void GL_APIENTRY CopySubTextureCHROMIUM(GLuint sourceId,
             context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                     xoffset, yoffset, x, y, width, height, unpackFlipY,
                                     unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopySubTextureCHROMIUM, context, sourceId, sourceLevel, destTarget,
+                          destId, destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                          unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
         }
     }
 }
@@ -2189,8 +2594,10 @@ void GL_APIENTRY CopySubTextureCHROMIUM(GLuint sourceId,
 // GL_CHROMIUM_framebuffer_mixed_samples
 void GL_APIENTRY CoverageModulationCHROMIUM(GLenum components)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverageModulationCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum components = 0x%X)", components);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverageModulationCHROMIUM, components);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2198,15 +2605,18 @@ void GL_APIENTRY CoverageModulationCHROMIUM(GLenum components)
         if (context->skipValidation() || ValidateCoverageModulationCHROMIUM(context, components))
         {
             context->coverageModulation(components);
+            ANGLE_CAPTURE(CoverageModulationCHROMIUM, context, components);
         }
     }
 }
 
 void GL_APIENTRY MatrixLoadfCHROMIUM(GLenum matrixMode, const GLfloat *matrix)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixLoadfCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X, const GLfloat * matrix = 0x%016" PRIxPTR ")", matrixMode,
           (uintptr_t)matrix);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixLoadfCHROMIUM, matrixMode, matrix);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2214,14 +2624,17 @@ void GL_APIENTRY MatrixLoadfCHROMIUM(GLenum matrixMode, const GLfloat *matrix)
         if (context->skipValidation() || ValidateMatrixLoadfCHROMIUM(context, matrixMode, matrix))
         {
             context->matrixLoadf(matrixMode, matrix);
+            ANGLE_CAPTURE(MatrixLoadfCHROMIUM, context, matrixMode, matrix);
         }
     }
 }
 
 void GL_APIENTRY MatrixLoadIdentityCHROMIUM(GLenum matrixMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixLoadIdentityCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X)", matrixMode);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixLoadIdentityCHROMIUM, matrixMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2229,6 +2642,7 @@ void GL_APIENTRY MatrixLoadIdentityCHROMIUM(GLenum matrixMode)
         if (context->skipValidation() || ValidateMatrixLoadIdentityCHROMIUM(context, matrixMode))
         {
             context->matrixLoadIdentity(matrixMode);
+            ANGLE_CAPTURE(MatrixLoadIdentityCHROMIUM, context, matrixMode);
         }
     }
 }
@@ -2236,8 +2650,10 @@ void GL_APIENTRY MatrixLoadIdentityCHROMIUM(GLenum matrixMode)
 // GL_CHROMIUM_lose_context
 void GL_APIENTRY LoseContextCHROMIUM(GLenum current, GLenum other)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoseContextCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum current = 0x%X, GLenum other = 0x%X)", current, other);
+    ANGLE_BINARY_TRACE(EntryPoint::LoseContextCHROMIUM, current, other);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2248,6 +2664,7 @@ void GL_APIENTRY LoseContextCHROMIUM(GLenum current, GLenum other)
             ValidateLoseContextCHROMIUM(context, currentPacked, otherPacked))
         {
             context->loseContext(currentPacked, otherPacked);
+            ANGLE_CAPTURE(LoseContextCHROMIUM, context, current, other);
         }
     }
 }
@@ -2255,15 +2672,19 @@ void GL_APIENTRY LoseContextCHROMIUM(GLenum current, GLenum other)
 // GL_CHROMIUM_path_rendering
 GLuint GL_APIENTRY GenPathsCHROMIUM(GLsizei range)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenPathsCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei range = %d)", range);
+    ANGLE_BINARY_TRACE(EntryPoint::GenPathsCHROMIUM, range);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGenPathsCHROMIUM(context, range))
         {
-            return context->genPaths(range);
+            GLuint returnValue = context->genPaths(range);
+            ANGLE_CAPTURE(GenPathsCHROMIUM, context, range, returnValue);
+            return returnValue;
         }
     }
 
@@ -2272,8 +2693,10 @@ GLuint GL_APIENTRY GenPathsCHROMIUM(GLsizei range)
 
 void GL_APIENTRY DeletePathsCHROMIUM(GLuint first, GLsizei range)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeletePathsCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint first = %u, GLsizei range = %d)", first, range);
+    ANGLE_BINARY_TRACE(EntryPoint::DeletePathsCHROMIUM, first, range);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2281,21 +2704,26 @@ void GL_APIENTRY DeletePathsCHROMIUM(GLuint first, GLsizei range)
         if (context->skipValidation() || ValidateDeletePathsCHROMIUM(context, first, range))
         {
             context->deletePaths(first, range);
+            ANGLE_CAPTURE(DeletePathsCHROMIUM, context, first, range);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsPathCHROMIUM(GLuint path)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u)", path);
+    ANGLE_BINARY_TRACE(EntryPoint::IsPathCHROMIUM, path);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsPathCHROMIUM(context, path))
         {
-            return context->isPath(path);
+            GLboolean returnValue = context->isPath(path);
+            ANGLE_CAPTURE(IsPathCHROMIUM, context, path, returnValue);
+            return returnValue;
         }
     }
 
@@ -2309,11 +2737,14 @@ void GL_APIENTRY PathCommandsCHROMIUM(GLuint path,
                                       GLenum coordType,
                                       const void *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathCommandsCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLsizei numCommands = %d, const GLubyte * commands = 0x%016" PRIxPTR
           ", GLsizei numCoords = %d, GLenum coordType = 0x%X, const void* coords = 0x%016" PRIxPTR
           ")",
           path, numCommands, (uintptr_t)commands, numCoords, coordType, (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::PathCommandsCHROMIUM, path, numCommands, commands, numCoords,
+                       coordType, coords);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2323,14 +2754,18 @@ void GL_APIENTRY PathCommandsCHROMIUM(GLuint path,
                                          coords))
         {
             context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
+            ANGLE_CAPTURE(PathCommandsCHROMIUM, context, path, numCommands, commands, numCoords,
+                          coordType, coords);
         }
     }
 }
 
 void GL_APIENTRY PathParameterfCHROMIUM(GLuint path, GLenum pname, GLfloat value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathParameterfCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat value = %f)", path, pname, value);
+    ANGLE_BINARY_TRACE(EntryPoint::PathParameterfCHROMIUM, path, pname, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2339,14 +2774,17 @@ void GL_APIENTRY PathParameterfCHROMIUM(GLuint path, GLenum pname, GLfloat value
             ValidatePathParameterfCHROMIUM(context, path, pname, value))
         {
             context->pathParameterf(path, pname, value);
+            ANGLE_CAPTURE(PathParameterfCHROMIUM, context, path, pname, value);
         }
     }
 }
 
 void GL_APIENTRY PathParameteriCHROMIUM(GLuint path, GLenum pname, GLint value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathParameteriCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint value = %d)", path, pname, value);
+    ANGLE_BINARY_TRACE(EntryPoint::PathParameteriCHROMIUM, path, pname, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2355,15 +2793,18 @@ void GL_APIENTRY PathParameteriCHROMIUM(GLuint path, GLenum pname, GLint value)
             ValidatePathParameteriCHROMIUM(context, path, pname, value))
         {
             context->pathParameteri(path, pname, value);
+            ANGLE_CAPTURE(PathParameteriCHROMIUM, context, path, pname, value);
         }
     }
 }
 
 void GL_APIENTRY GetPathParameterfvCHROMIUM(GLuint path, GLenum pname, GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPathParameterfvCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat * value = 0x%016" PRIxPTR ")", path,
           pname, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPathParameterfvCHROMIUM, path, pname, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2372,15 +2813,18 @@ void GL_APIENTRY GetPathParameterfvCHROMIUM(GLuint path, GLenum pname, GLfloat *
             ValidateGetPathParameterfvCHROMIUM(context, path, pname, value))
         {
             context->getPathParameterfv(path, pname, value);
+            ANGLE_CAPTURE(GetPathParameterfvCHROMIUM, context, path, pname, value);
         }
     }
 }
 
 void GL_APIENTRY GetPathParameterivCHROMIUM(GLuint path, GLenum pname, GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPathParameterivCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint * value = 0x%016" PRIxPTR ")", path, pname,
           (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPathParameterivCHROMIUM, path, pname, value);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2389,14 +2833,17 @@ void GL_APIENTRY GetPathParameterivCHROMIUM(GLuint path, GLenum pname, GLint *va
             ValidateGetPathParameterivCHROMIUM(context, path, pname, value))
         {
             context->getPathParameteriv(path, pname, value);
+            ANGLE_CAPTURE(GetPathParameterivCHROMIUM, context, path, pname, value);
         }
     }
 }
 
 void GL_APIENTRY PathStencilFuncCHROMIUM(GLenum func, GLint ref, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathStencilFuncCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::PathStencilFuncCHROMIUM, func, ref, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2404,14 +2851,17 @@ void GL_APIENTRY PathStencilFuncCHROMIUM(GLenum func, GLint ref, GLuint mask)
         if (context->skipValidation() || ValidatePathStencilFuncCHROMIUM(context, func, ref, mask))
         {
             context->pathStencilFunc(func, ref, mask);
+            ANGLE_CAPTURE(PathStencilFuncCHROMIUM, context, func, ref, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilFillPathCHROMIUM(GLuint path, GLenum fillMode, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFillPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u)", path, fillMode, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFillPathCHROMIUM, path, fillMode, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2420,14 +2870,17 @@ void GL_APIENTRY StencilFillPathCHROMIUM(GLuint path, GLenum fillMode, GLuint ma
             ValidateStencilFillPathCHROMIUM(context, path, fillMode, mask))
         {
             context->stencilFillPath(path, fillMode, mask);
+            ANGLE_CAPTURE(StencilFillPathCHROMIUM, context, path, fillMode, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilStrokePathCHROMIUM(GLuint path, GLint reference, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilStrokePathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u)", path, reference, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilStrokePathCHROMIUM, path, reference, mask);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2436,14 +2889,17 @@ void GL_APIENTRY StencilStrokePathCHROMIUM(GLuint path, GLint reference, GLuint
             ValidateStencilStrokePathCHROMIUM(context, path, reference, mask))
         {
             context->stencilStrokePath(path, reference, mask);
+            ANGLE_CAPTURE(StencilStrokePathCHROMIUM, context, path, reference, mask);
         }
     }
 }
 
 void GL_APIENTRY CoverFillPathCHROMIUM(GLuint path, GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverFillPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverFillPathCHROMIUM, path, coverMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2451,14 +2907,17 @@ void GL_APIENTRY CoverFillPathCHROMIUM(GLuint path, GLenum coverMode)
         if (context->skipValidation() || ValidateCoverFillPathCHROMIUM(context, path, coverMode))
         {
             context->coverFillPath(path, coverMode);
+            ANGLE_CAPTURE(CoverFillPathCHROMIUM, context, path, coverMode);
         }
     }
 }
 
 void GL_APIENTRY CoverStrokePathCHROMIUM(GLuint path, GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverStrokePathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverStrokePathCHROMIUM, path, coverMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2466,6 +2925,7 @@ void GL_APIENTRY CoverStrokePathCHROMIUM(GLuint path, GLenum coverMode)
         if (context->skipValidation() || ValidateCoverStrokePathCHROMIUM(context, path, coverMode))
         {
             context->coverStrokePath(path, coverMode);
+            ANGLE_CAPTURE(CoverStrokePathCHROMIUM, context, path, coverMode);
         }
     }
 }
@@ -2475,9 +2935,12 @@ void GL_APIENTRY StencilThenCoverFillPathCHROMIUM(GLuint path,
                                                   GLuint mask,
                                                   GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverFillPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, fillMode, mask, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverFillPathCHROMIUM, path, fillMode, mask,
+                       coverMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2486,6 +2949,8 @@ void GL_APIENTRY StencilThenCoverFillPathCHROMIUM(GLuint path,
             ValidateStencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask, coverMode))
         {
             context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
+            ANGLE_CAPTURE(StencilThenCoverFillPathCHROMIUM, context, path, fillMode, mask,
+                          coverMode);
         }
     }
 }
@@ -2495,9 +2960,12 @@ void GL_APIENTRY StencilThenCoverStrokePathCHROMIUM(GLuint path,
                                                     GLuint mask,
                                                     GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverStrokePathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, reference, mask, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverStrokePathCHROMIUM, path, reference, mask,
+                       coverMode);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2506,6 +2974,8 @@ void GL_APIENTRY StencilThenCoverStrokePathCHROMIUM(GLuint path,
             ValidateStencilThenCoverStrokePathCHROMIUM(context, path, reference, mask, coverMode))
         {
             context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
+            ANGLE_CAPTURE(StencilThenCoverStrokePathCHROMIUM, context, path, reference, mask,
+                          coverMode);
         }
     }
 }
@@ -2518,12 +2988,15 @@ void GL_APIENTRY CoverFillPathInstancedCHROMIUM(GLsizei numPath,
                                                 GLenum transformType,
                                                 const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverFillPathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPath = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum coverMode = 0x%X, GLenum transformType = 0x%X, const "
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverFillPathInstancedCHROMIUM, numPath, pathNameType, paths,
+                       pathBase, coverMode, transformType, transformValues);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2534,6 +3007,8 @@ void GL_APIENTRY CoverFillPathInstancedCHROMIUM(GLsizei numPath,
         {
             context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
                                             transformType, transformValues);
+            ANGLE_CAPTURE(CoverFillPathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                          pathBase, coverMode, transformType, transformValues);
         }
     }
 }
@@ -2546,12 +3021,15 @@ void GL_APIENTRY CoverStrokePathInstancedCHROMIUM(GLsizei numPath,
                                                   GLenum transformType,
                                                   const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverStrokePathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPath = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum coverMode = 0x%X, GLenum transformType = 0x%X, const "
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverStrokePathInstancedCHROMIUM, numPath, pathNameType, paths,
+                       pathBase, coverMode, transformType, transformValues);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2562,6 +3040,8 @@ void GL_APIENTRY CoverStrokePathInstancedCHROMIUM(GLsizei numPath,
         {
             context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
                                               transformType, transformValues);
+            ANGLE_CAPTURE(CoverStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                          pathBase, coverMode, transformType, transformValues);
         }
     }
 }
@@ -2575,12 +3055,15 @@ void GL_APIENTRY StencilStrokePathInstancedCHROMIUM(GLsizei numPath,
                                                     GLenum transformType,
                                                     const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilStrokePathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPath = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLint reference = %d, GLuint mask = %u, GLenum transformType = "
           "0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, reference, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilStrokePathInstancedCHROMIUM, numPath, pathNameType, paths,
+                       pathBase, reference, mask, transformType, transformValues);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2591,6 +3074,8 @@ void GL_APIENTRY StencilStrokePathInstancedCHROMIUM(GLsizei numPath,
         {
             context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase, reference,
                                                 mask, transformType, transformValues);
+            ANGLE_CAPTURE(StencilStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                          pathBase, reference, mask, transformType, transformValues);
         }
     }
 }
@@ -2604,12 +3089,15 @@ void GL_APIENTRY StencilFillPathInstancedCHROMIUM(GLsizei numPaths,
                                                   GLenum transformType,
                                                   const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFillPathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPaths = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum transformType "
           "= 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFillPathInstancedCHROMIUM, numPaths, pathNameType, paths,
+                       pathBase, fillMode, mask, transformType, transformValues);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2620,6 +3108,8 @@ void GL_APIENTRY StencilFillPathInstancedCHROMIUM(GLsizei numPaths,
         {
             context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode,
                                               mask, transformType, transformValues);
+            ANGLE_CAPTURE(StencilFillPathInstancedCHROMIUM, context, numPaths, pathNameType, paths,
+                          pathBase, fillMode, mask, transformType, transformValues);
         }
     }
 }
@@ -2634,12 +3124,16 @@ void GL_APIENTRY StencilThenCoverFillPathInstancedCHROMIUM(GLsizei numPaths,
                                                            GLenum transformType,
                                                            const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPaths = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum coverMode = "
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM, numPaths,
+                       pathNameType, paths, pathBase, fillMode, mask, coverMode, transformType,
+                       transformValues);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2652,6 +3146,9 @@ void GL_APIENTRY StencilThenCoverFillPathInstancedCHROMIUM(GLsizei numPaths,
             context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase,
                                                        fillMode, mask, coverMode, transformType,
                                                        transformValues);
+            ANGLE_CAPTURE(StencilThenCoverFillPathInstancedCHROMIUM, context, numPaths,
+                          pathNameType, paths, pathBase, fillMode, mask, coverMode, transformType,
+                          transformValues);
         }
     }
 }
@@ -2666,12 +3163,16 @@ void GL_APIENTRY StencilThenCoverStrokePathInstancedCHROMIUM(GLsizei numPaths,
                                                              GLenum transformType,
                                                              const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPaths = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode = "
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, reference, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM, numPaths,
+                       pathNameType, paths, pathBase, reference, mask, coverMode, transformType,
+                       transformValues);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2684,6 +3185,9 @@ void GL_APIENTRY StencilThenCoverStrokePathInstancedCHROMIUM(GLsizei numPaths,
             context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths, pathBase,
                                                          reference, mask, coverMode, transformType,
                                                          transformValues);
+            ANGLE_CAPTURE(StencilThenCoverStrokePathInstancedCHROMIUM, context, numPaths,
+                          pathNameType, paths, pathBase, reference, mask, coverMode, transformType,
+                          transformValues);
         }
     }
 }
@@ -2692,9 +3196,11 @@ void GL_APIENTRY BindFragmentInputLocationCHROMIUM(GLuint programs,
                                                    GLint location,
                                                    const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragmentInputLocationCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint programs = %u, GLint location = %d, const GLchar * name = 0x%016" PRIxPTR ")",
           programs, location, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFragmentInputLocationCHROMIUM, programs, location, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2703,6 +3209,7 @@ void GL_APIENTRY BindFragmentInputLocationCHROMIUM(GLuint programs,
             ValidateBindFragmentInputLocationCHROMIUM(context, programs, location, name))
         {
             context->bindFragmentInputLocation(programs, location, name);
+            ANGLE_CAPTURE(BindFragmentInputLocationCHROMIUM, context, programs, location, name);
         }
     }
 }
@@ -2713,11 +3220,14 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUM(GLuint program,
                                                      GLint components,
                                                      const GLfloat *coeffs)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramPathFragmentInputGenCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLenum genMode = 0x%X, GLint components = %d, "
         "const GLfloat * coeffs = 0x%016" PRIxPTR ")",
         program, location, genMode, components, (uintptr_t)coeffs);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramPathFragmentInputGenCHROMIUM, program, location, genMode,
+                       components, coeffs);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2727,6 +3237,8 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUM(GLuint program,
                                                         components, coeffs))
         {
             context->programPathFragmentInputGen(program, location, genMode, components, coeffs);
+            ANGLE_CAPTURE(ProgramPathFragmentInputGenCHROMIUM, context, program, location, genMode,
+                          components, coeffs);
         }
     }
 }
@@ -2734,9 +3246,11 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUM(GLuint program,
 // GL_EXT_blend_func_extended
 void GL_APIENTRY BindFragDataLocationEXT(GLuint program, GLuint color, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragDataLocationEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint color = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, color, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFragDataLocationEXT, program, color, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2745,6 +3259,7 @@ void GL_APIENTRY BindFragDataLocationEXT(GLuint program, GLuint color, const GLc
             ValidateBindFragDataLocationEXT(context, program, color, name))
         {
             context->bindFragDataLocation(program, color, name);
+            ANGLE_CAPTURE(BindFragDataLocationEXT, context, program, color, name);
         }
     }
 }
@@ -2754,11 +3269,14 @@ void GL_APIENTRY BindFragDataLocationIndexedEXT(GLuint program,
                                                 GLuint index,
                                                 const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragDataLocationIndexedEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint colorNumber = %u, GLuint index = %u, const GLchar *name = "
         "0x%016" PRIxPTR ")",
         program, colorNumber, index, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFragDataLocationIndexedEXT, program, colorNumber, index,
+                       name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2767,22 +3285,28 @@ void GL_APIENTRY BindFragDataLocationIndexedEXT(GLuint program,
             ValidateBindFragDataLocationIndexedEXT(context, program, colorNumber, index, name))
         {
             context->bindFragDataLocationIndexed(program, colorNumber, index, name);
+            ANGLE_CAPTURE(BindFragDataLocationIndexedEXT, context, program, colorNumber, index,
+                          name);
         }
     }
 }
 
 GLint GL_APIENTRY GetFragDataIndexEXT(GLuint program, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFragDataIndexEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFragDataIndexEXT, program, name);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetFragDataIndexEXT(context, program, name))
         {
-            return context->getFragDataIndex(program, name);
+            GLint returnValue = context->getFragDataIndex(program, name);
+            ANGLE_CAPTURE(GetFragDataIndexEXT, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -2793,11 +3317,14 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXT(GLuint program,
                                                      GLenum programInterface,
                                                      const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceLocationIndexEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceLocationIndexEXT, program, programInterface,
+                       name);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2805,7 +3332,11 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXT(GLuint program,
         if (context->skipValidation() ||
             ValidateGetProgramResourceLocationIndexEXT(context, program, programInterface, name))
         {
-            return context->getProgramResourceLocationIndex(program, programInterface, name);
+            GLint returnValue =
+                context->getProgramResourceLocationIndex(program, programInterface, name);
+            ANGLE_CAPTURE(GetProgramResourceLocationIndexEXT, context, program, programInterface,
+                          name, returnValue);
+            return returnValue;
         }
     }
 
@@ -2815,11 +3346,13 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXT(GLuint program,
 // GL_EXT_debug_marker
 void GL_APIENTRY InsertEventMarkerEXT(GLsizei length, const GLchar *marker)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InsertEventMarkerEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_TRACE(EntryPoint::InsertEventMarkerEXT, length, marker);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2827,16 +3360,19 @@ void GL_APIENTRY InsertEventMarkerEXT(GLsizei length, const GLchar *marker)
         if (context->skipValidation() || ValidateInsertEventMarkerEXT(context, length, marker))
         {
             context->insertEventMarker(length, marker);
+            ANGLE_CAPTURE(InsertEventMarkerEXT, context, length, marker);
         }
     }
 }
 
 void GL_APIENTRY PopGroupMarkerEXT()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopGroupMarkerEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PopGroupMarkerEXT);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2844,17 +3380,20 @@ void GL_APIENTRY PopGroupMarkerEXT()
         if (context->skipValidation() || ValidatePopGroupMarkerEXT(context))
         {
             context->popGroupMarker();
+            ANGLE_CAPTURE(PopGroupMarkerEXT, context);
         }
     }
 }
 
 void GL_APIENTRY PushGroupMarkerEXT(GLsizei length, const GLchar *marker)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushGroupMarkerEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_TRACE(EntryPoint::PushGroupMarkerEXT, length, marker);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2862,6 +3401,7 @@ void GL_APIENTRY PushGroupMarkerEXT(GLsizei length, const GLchar *marker)
         if (context->skipValidation() || ValidatePushGroupMarkerEXT(context, length, marker))
         {
             context->pushGroupMarker(length, marker);
+            ANGLE_CAPTURE(PushGroupMarkerEXT, context, length, marker);
         }
     }
 }
@@ -2871,11 +3411,13 @@ void GL_APIENTRY DiscardFramebufferEXT(GLenum target,
                                        GLsizei numAttachments,
                                        const GLenum *attachments)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DiscardFramebufferEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_TRACE(EntryPoint::DiscardFramebufferEXT, target, numAttachments, attachments);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2884,6 +3426,7 @@ void GL_APIENTRY DiscardFramebufferEXT(GLenum target,
             ValidateDiscardFramebufferEXT(context, target, numAttachments, attachments))
         {
             context->discardFramebuffer(target, numAttachments, attachments);
+            ANGLE_CAPTURE(DiscardFramebufferEXT, context, target, numAttachments, attachments);
         }
     }
 }
@@ -2891,8 +3434,10 @@ void GL_APIENTRY DiscardFramebufferEXT(GLenum target,
 // GL_EXT_disjoint_timer_query
 void GL_APIENTRY BeginQueryEXT(GLenum target, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginQueryEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_TRACE(EntryPoint::BeginQueryEXT, target, id);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2901,14 +3446,17 @@ void GL_APIENTRY BeginQueryEXT(GLenum target, GLuint id)
         if (context->skipValidation() || ValidateBeginQueryEXT(context, targetPacked, id))
         {
             context->beginQuery(targetPacked, id);
+            ANGLE_CAPTURE(BeginQueryEXT, context, target, id);
         }
     }
 }
 
 void GL_APIENTRY DeleteQueriesEXT(GLsizei n, const GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteQueriesEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteQueriesEXT, n, ids);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2916,14 +3464,17 @@ void GL_APIENTRY DeleteQueriesEXT(GLsizei n, const GLuint *ids)
         if (context->skipValidation() || ValidateDeleteQueriesEXT(context, n, ids))
         {
             context->deleteQueries(n, ids);
+            ANGLE_CAPTURE(DeleteQueriesEXT, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY EndQueryEXT(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndQueryEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::EndQueryEXT, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2932,14 +3483,17 @@ void GL_APIENTRY EndQueryEXT(GLenum target)
         if (context->skipValidation() || ValidateEndQueryEXT(context, targetPacked))
         {
             context->endQuery(targetPacked);
+            ANGLE_CAPTURE(EndQueryEXT, context, target);
         }
     }
 }
 
 void GL_APIENTRY GenQueriesEXT(GLsizei n, GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenQueriesEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::GenQueriesEXT, n, ids);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2947,15 +3501,18 @@ void GL_APIENTRY GenQueriesEXT(GLsizei n, GLuint *ids)
         if (context->skipValidation() || ValidateGenQueriesEXT(context, n, ids))
         {
             context->genQueries(n, ids);
+            ANGLE_CAPTURE(GenQueriesEXT, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY GetQueryObjecti64vEXT(GLuint id, GLenum pname, GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjecti64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjecti64vEXT, id, pname, params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -2963,15 +3520,18 @@ void GL_APIENTRY GetQueryObjecti64vEXT(GLuint id, GLenum pname, GLint64 *params)
         if (context->skipValidation() || ValidateGetQueryObjecti64vEXT(context, id, pname, params))
         {
             context->getQueryObjecti64v(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjecti64vEXT, context, id, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetQueryObjectivEXT(GLuint id, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectivEXT, id, pname, params);
 
     Context *context = GetGlobalContext();
     if (context)
@@ -2979,15 +3539,18 @@ void GL_APIENTRY GetQueryObjectivEXT(GLuint id, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetQueryObjectivEXT(context, id, pname, params))
         {
             context->getQueryObjectiv(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectivEXT, context, id, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetQueryObjectui64vEXT(GLuint id, GLenum pname, GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectui64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectui64vEXT, id, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -2995,15 +3558,18 @@ void GL_APIENTRY GetQueryObjectui64vEXT(GLuint id, GLenum pname, GLuint64 *param
         if (context->skipValidation() || ValidateGetQueryObjectui64vEXT(context, id, pname, params))
         {
             context->getQueryObjectui64v(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectui64vEXT, context, id, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetQueryObjectuivEXT(GLuint id, GLenum pname, GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuivEXT, id, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3011,15 +3577,18 @@ void GL_APIENTRY GetQueryObjectuivEXT(GLuint id, GLenum pname, GLuint *params)
         if (context->skipValidation() || ValidateGetQueryObjectuivEXT(context, id, pname, params))
         {
             context->getQueryObjectuiv(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectuivEXT, context, id, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetQueryivEXT(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryivEXT, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3029,21 +3598,26 @@ void GL_APIENTRY GetQueryivEXT(GLenum target, GLenum pname, GLint *params)
             ValidateGetQueryivEXT(context, targetPacked, pname, params))
         {
             context->getQueryiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetQueryivEXT, context, target, pname, params);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsQueryEXT(GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsQueryEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_TRACE(EntryPoint::IsQueryEXT, id);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsQueryEXT(context, id))
         {
-            return context->isQuery(id);
+            GLboolean returnValue = context->isQuery(id);
+            ANGLE_CAPTURE(IsQueryEXT, context, id, returnValue);
+            return returnValue;
         }
     }
 
@@ -3052,8 +3626,10 @@ GLboolean GL_APIENTRY IsQueryEXT(GLuint id)
 
 void GL_APIENTRY QueryCounterEXT(GLuint id, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::QueryCounterEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum target = 0x%X)", id, target);
+    ANGLE_BINARY_TRACE(EntryPoint::QueryCounterEXT, id, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3062,6 +3638,7 @@ void GL_APIENTRY QueryCounterEXT(GLuint id, GLenum target)
         if (context->skipValidation() || ValidateQueryCounterEXT(context, id, targetPacked))
         {
             context->queryCounter(id, targetPacked);
+            ANGLE_CAPTURE(QueryCounterEXT, context, id, target);
         }
     }
 }
@@ -3069,8 +3646,10 @@ void GL_APIENTRY QueryCounterEXT(GLuint id, GLenum target)
 // GL_EXT_draw_buffers
 void GL_APIENTRY DrawBuffersEXT(GLsizei n, const GLenum *bufs)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawBuffersEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawBuffersEXT, n, bufs);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3078,6 +3657,7 @@ void GL_APIENTRY DrawBuffersEXT(GLsizei n, const GLenum *bufs)
         if (context->skipValidation() || ValidateDrawBuffersEXT(context, n, bufs))
         {
             context->drawBuffers(n, bufs);
+            ANGLE_CAPTURE(DrawBuffersEXT, context, n, bufs);
         }
     }
 }
@@ -3088,9 +3668,11 @@ void GL_APIENTRY FramebufferTextureEXT(GLenum target,
                                        GLuint texture,
                                        GLint level)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d)",
           target, attachment, texture, level);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureEXT, target, attachment, texture, level);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3099,6 +3681,7 @@ void GL_APIENTRY FramebufferTextureEXT(GLenum target,
             ValidateFramebufferTextureEXT(context, target, attachment, texture, level))
         {
             context->framebufferTexture(target, attachment, texture, level);
+            ANGLE_CAPTURE(FramebufferTextureEXT, context, target, attachment, texture, level);
         }
     }
 }
@@ -3106,9 +3689,11 @@ void GL_APIENTRY FramebufferTextureEXT(GLenum target,
 // GL_EXT_instanced_arrays
 void GL_APIENTRY DrawArraysInstancedEXT(GLenum mode, GLint start, GLsizei count, GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstancedEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint start = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, start, count, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstancedEXT, mode, start, count, primcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3118,6 +3703,7 @@ void GL_APIENTRY DrawArraysInstancedEXT(GLenum mode, GLint start, GLsizei count,
             ValidateDrawArraysInstancedEXT(context, modePacked, start, count, primcount))
         {
             context->drawArraysInstanced(modePacked, start, count, primcount);
+            ANGLE_CAPTURE(DrawArraysInstancedEXT, context, mode, start, count, primcount);
         }
     }
 }
@@ -3128,11 +3714,13 @@ void GL_APIENTRY DrawElementsInstancedEXT(GLenum mode,
                                           const void *indices,
                                           GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstancedEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstancedEXT, mode, count, type, indices, primcount);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3144,14 +3732,17 @@ void GL_APIENTRY DrawElementsInstancedEXT(GLenum mode,
                                              primcount))
         {
             context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+            ANGLE_CAPTURE(DrawElementsInstancedEXT, context, mode, count, type, indices, primcount);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribDivisorEXT(GLuint index, GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisorEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisorEXT, index, divisor);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3159,6 +3750,7 @@ void GL_APIENTRY VertexAttribDivisorEXT(GLuint index, GLuint divisor)
         if (context->skipValidation() || ValidateVertexAttribDivisorEXT(context, index, divisor))
         {
             context->vertexAttribDivisor(index, divisor);
+            ANGLE_CAPTURE(VertexAttribDivisorEXT, context, index, divisor);
         }
     }
 }
@@ -3166,9 +3758,11 @@ void GL_APIENTRY VertexAttribDivisorEXT(GLuint index, GLuint divisor)
 // GL_EXT_map_buffer_range
 void GL_APIENTRY FlushMappedBufferRangeEXT(GLenum target, GLintptr offset, GLsizeiptr length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FlushMappedBufferRangeEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_TRACE(EntryPoint::FlushMappedBufferRangeEXT, target, offset, length);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3178,6 +3772,7 @@ void GL_APIENTRY FlushMappedBufferRangeEXT(GLenum target, GLintptr offset, GLsiz
             ValidateFlushMappedBufferRangeEXT(context, targetPacked, offset, length))
         {
             context->flushMappedBufferRange(targetPacked, offset, length);
+            ANGLE_CAPTURE(FlushMappedBufferRangeEXT, context, target, offset, length);
         }
     }
 }
@@ -3187,12 +3782,14 @@ void *GL_APIENTRY MapBufferRangeEXT(GLenum target,
                                     GLsizeiptr length,
                                     GLbitfield access)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MapBufferRangeEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu, GLbitfield "
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_TRACE(EntryPoint::MapBufferRangeEXT, target, offset, length, access);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3201,7 +3798,9 @@ void *GL_APIENTRY MapBufferRangeEXT(GLenum target,
         if (context->skipValidation() ||
             ValidateMapBufferRangeEXT(context, targetPacked, offset, length, access))
         {
-            return context->mapBufferRange(targetPacked, offset, length, access);
+            void *returnValue = context->mapBufferRange(targetPacked, offset, length, access);
+            ANGLE_CAPTURE(MapBufferRangeEXT, context, target, offset, length, access, returnValue);
+            return returnValue;
         }
     }
 
@@ -3211,12 +3810,14 @@ void *GL_APIENTRY MapBufferRangeEXT(GLenum target,
 // GL_EXT_memory_object
 void GL_APIENTRY BufferStorageMemEXT(GLenum target, GLsizeiptr size, GLuint memory, GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferStorageMemEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizeiptr size = %llu, GLuint memory = %u, GLuint64 offset = "
         "%llu)",
         target, static_cast<unsigned long long>(size), memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::BufferStorageMemEXT, target, size, memory, offset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3226,15 +3827,18 @@ void GL_APIENTRY BufferStorageMemEXT(GLenum target, GLsizeiptr size, GLuint memo
             ValidateBufferStorageMemEXT(context, targetPacked, size, memory, offset))
         {
             context->bufferStorageMem(targetPacked, size, memory, offset);
+            ANGLE_CAPTURE(BufferStorageMemEXT, context, target, size, memory, offset);
         }
     }
 }
 
 void GL_APIENTRY CreateMemoryObjectsEXT(GLsizei n, GLuint *memoryObjects)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateMemoryObjectsEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_TRACE(EntryPoint::CreateMemoryObjectsEXT, n, memoryObjects);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3242,15 +3846,18 @@ void GL_APIENTRY CreateMemoryObjectsEXT(GLsizei n, GLuint *memoryObjects)
         if (context->skipValidation() || ValidateCreateMemoryObjectsEXT(context, n, memoryObjects))
         {
             context->createMemoryObjects(n, memoryObjects);
+            ANGLE_CAPTURE(CreateMemoryObjectsEXT, context, n, memoryObjects);
         }
     }
 }
 
 void GL_APIENTRY DeleteMemoryObjectsEXT(GLsizei n, const GLuint *memoryObjects)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteMemoryObjectsEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteMemoryObjectsEXT, n, memoryObjects);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3258,15 +3865,18 @@ void GL_APIENTRY DeleteMemoryObjectsEXT(GLsizei n, const GLuint *memoryObjects)
         if (context->skipValidation() || ValidateDeleteMemoryObjectsEXT(context, n, memoryObjects))
         {
             context->deleteMemoryObjects(n, memoryObjects);
+            ANGLE_CAPTURE(DeleteMemoryObjectsEXT, context, n, memoryObjects);
         }
     }
 }
 
 void GL_APIENTRY GetMemoryObjectParameterivEXT(GLuint memoryObject, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMemoryObjectParameterivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMemoryObjectParameterivEXT, memoryObject, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3275,14 +3885,17 @@ void GL_APIENTRY GetMemoryObjectParameterivEXT(GLuint memoryObject, GLenum pname
             ValidateGetMemoryObjectParameterivEXT(context, memoryObject, pname, params))
         {
             context->getMemoryObjectParameteriv(memoryObject, pname, params);
+            ANGLE_CAPTURE(GetMemoryObjectParameterivEXT, context, memoryObject, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetUnsignedBytevEXT(GLenum pname, GLubyte *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUnsignedBytevEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLubyte *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUnsignedBytevEXT, pname, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3290,15 +3903,18 @@ void GL_APIENTRY GetUnsignedBytevEXT(GLenum pname, GLubyte *data)
         if (context->skipValidation() || ValidateGetUnsignedBytevEXT(context, pname, data))
         {
             context->getUnsignedBytev(pname, data);
+            ANGLE_CAPTURE(GetUnsignedBytevEXT, context, pname, data);
         }
     }
 }
 
 void GL_APIENTRY GetUnsignedBytei_vEXT(GLenum target, GLuint index, GLubyte *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUnsignedBytei_vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLubyte *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUnsignedBytei_vEXT, target, index, data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3307,21 +3923,26 @@ void GL_APIENTRY GetUnsignedBytei_vEXT(GLenum target, GLuint index, GLubyte *dat
             ValidateGetUnsignedBytei_vEXT(context, target, index, data))
         {
             context->getUnsignedBytei_v(target, index, data);
+            ANGLE_CAPTURE(GetUnsignedBytei_vEXT, context, target, index, data);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsMemoryObjectEXT(GLuint memoryObject)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsMemoryObjectEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u)", memoryObject);
+    ANGLE_BINARY_TRACE(EntryPoint::IsMemoryObjectEXT, memoryObject);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsMemoryObjectEXT(context, memoryObject))
         {
-            return context->isMemoryObject(memoryObject);
+            GLboolean returnValue = context->isMemoryObject(memoryObject);
+            ANGLE_CAPTURE(IsMemoryObjectEXT, context, memoryObject, returnValue);
+            return returnValue;
         }
     }
 
@@ -3330,10 +3951,12 @@ GLboolean GL_APIENTRY IsMemoryObjectEXT(GLuint memoryObject)
 
 void GL_APIENTRY MemoryObjectParameterivEXT(GLuint memoryObject, GLenum pname, const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryObjectParameterivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR
           ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::MemoryObjectParameterivEXT, memoryObject, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3342,6 +3965,7 @@ void GL_APIENTRY MemoryObjectParameterivEXT(GLuint memoryObject, GLenum pname, c
             ValidateMemoryObjectParameterivEXT(context, memoryObject, pname, params))
         {
             context->memoryObjectParameteriv(memoryObject, pname, params);
+            ANGLE_CAPTURE(MemoryObjectParameterivEXT, context, memoryObject, pname, params);
         }
     }
 }
@@ -3354,12 +3978,15 @@ void GL_APIENTRY TexStorageMem2DEXT(GLenum target,
                                     GLuint memory,
                                     GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem2DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalFormat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem2DEXT, target, levels, internalFormat, width,
+                       height, memory, offset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3371,6 +3998,8 @@ void GL_APIENTRY TexStorageMem2DEXT(GLenum target,
         {
             context->texStorageMem2D(targetPacked, levels, internalFormat, width, height, memory,
                                      offset);
+            ANGLE_CAPTURE(TexStorageMem2DEXT, context, target, levels, internalFormat, width,
+                          height, memory, offset);
         }
     }
 }
@@ -3384,6 +4013,7 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXT(GLenum target,
                                                GLuint memory,
                                                GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem2DMultisampleEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalFormat = 0x%X, GLsizei width "
@@ -3391,6 +4021,8 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXT(GLenum target,
         "GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem2DMultisampleEXT, target, samples, internalFormat,
+                       width, height, fixedSampleLocations, memory, offset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3402,6 +4034,8 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXT(GLenum target,
         {
             context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width,
                                                 height, fixedSampleLocations, memory, offset);
+            ANGLE_CAPTURE(TexStorageMem2DMultisampleEXT, context, target, samples, internalFormat,
+                          width, height, fixedSampleLocations, memory, offset);
         }
     }
 }
@@ -3415,12 +4049,15 @@ void GL_APIENTRY TexStorageMem3DEXT(GLenum target,
                                     GLuint memory,
                                     GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem3DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalFormat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, depth, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem3DEXT, target, levels, internalFormat, width,
+                       height, depth, memory, offset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3432,6 +4069,8 @@ void GL_APIENTRY TexStorageMem3DEXT(GLenum target,
         {
             context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth,
                                      memory, offset);
+            ANGLE_CAPTURE(TexStorageMem3DEXT, context, target, levels, internalFormat, width,
+                          height, depth, memory, offset);
         }
     }
 }
@@ -3446,6 +4085,7 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXT(GLenum target,
                                                GLuint memory,
                                                GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem3DMultisampleEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalFormat = 0x%X, GLsizei width "
@@ -3453,6 +4093,8 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXT(GLenum target,
         "GLuint memory = %u, GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, depth, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem3DMultisampleEXT, target, samples, internalFormat,
+                       width, height, depth, fixedSampleLocations, memory, offset);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3465,6 +4107,8 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXT(GLenum target,
             context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width,
                                                 height, depth, fixedSampleLocations, memory,
                                                 offset);
+            ANGLE_CAPTURE(TexStorageMem3DMultisampleEXT, context, target, samples, internalFormat,
+                          width, height, depth, fixedSampleLocations, memory, offset);
         }
     }
 }
@@ -3472,9 +4116,11 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXT(GLenum target,
 // GL_EXT_memory_object_fd
 void GL_APIENTRY ImportMemoryFdEXT(GLuint memory, GLuint64 size, GLenum handleType, GLint fd)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ImportMemoryFdEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memory = %u, GLuint64 size = %llu, GLenum handleType = 0x%X, GLint fd = %d)",
           memory, static_cast<unsigned long long>(size), handleType, fd);
+    ANGLE_BINARY_TRACE(EntryPoint::ImportMemoryFdEXT, memory, size, handleType, fd);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3484,6 +4130,7 @@ void GL_APIENTRY ImportMemoryFdEXT(GLuint memory, GLuint64 size, GLenum handleTy
             ValidateImportMemoryFdEXT(context, memory, size, handleTypePacked, fd))
         {
             context->importMemoryFd(memory, size, handleTypePacked, fd);
+            ANGLE_CAPTURE(ImportMemoryFdEXT, context, memory, size, handleType, fd);
         }
     }
 }
@@ -3506,15 +4153,19 @@ void GL_APIENTRY ImportMemoryFdEXT(GLuint memory, GLuint64 size, GLenum handleTy
 // GL_EXT_robustness
 GLenum GL_APIENTRY GetGraphicsResetStatusEXT()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetGraphicsResetStatusEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::GetGraphicsResetStatusEXT);
 
     Context *context = GetGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateGetGraphicsResetStatusEXT(context))
         {
-            return context->getGraphicsResetStatus();
+            GLenum returnValue = context->getGraphicsResetStatus();
+            ANGLE_CAPTURE(GetGraphicsResetStatusEXT, context, returnValue);
+            return returnValue;
         }
     }
 
@@ -3523,11 +4174,13 @@ GLenum GL_APIENTRY GetGraphicsResetStatusEXT()
 
 void GL_APIENTRY GetnUniformfvEXT(GLuint program, GLint location, GLsizei bufSize, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformfvEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformfvEXT, program, location, bufSize, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3536,17 +4189,20 @@ void GL_APIENTRY GetnUniformfvEXT(GLuint program, GLint location, GLsizei bufSiz
             ValidateGetnUniformfvEXT(context, program, location, bufSize, params))
         {
             context->getnUniformfv(program, location, bufSize, params);
+            ANGLE_CAPTURE(GetnUniformfvEXT, context, program, location, bufSize, params);
         }
     }
 }
 
 void GL_APIENTRY GetnUniformivEXT(GLuint program, GLint location, GLsizei bufSize, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformivEXT, program, location, bufSize, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3555,6 +4211,7 @@ void GL_APIENTRY GetnUniformivEXT(GLuint program, GLint location, GLsizei bufSiz
             ValidateGetnUniformivEXT(context, program, location, bufSize, params))
         {
             context->getnUniformiv(program, location, bufSize, params);
+            ANGLE_CAPTURE(GetnUniformivEXT, context, program, location, bufSize, params);
         }
     }
 }
@@ -3568,11 +4225,14 @@ void GL_APIENTRY ReadnPixelsEXT(GLint x,
                                 GLsizei bufSize,
                                 void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadnPixelsEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, void *data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadnPixelsEXT, x, y, width, height, format, type, bufSize,
+                       data);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3581,6 +4241,8 @@ void GL_APIENTRY ReadnPixelsEXT(GLint x,
             ValidateReadnPixelsEXT(context, x, y, width, height, format, type, bufSize, data))
         {
             context->readnPixels(x, y, width, height, format, type, bufSize, data);
+            ANGLE_CAPTURE(ReadnPixelsEXT, context, x, y, width, height, format, type, bufSize,
+                          data);
         }
     }
 }
@@ -3588,9 +4250,11 @@ void GL_APIENTRY ReadnPixelsEXT(GLint x,
 // GL_EXT_semaphore
 void GL_APIENTRY DeleteSemaphoresEXT(GLsizei n, const GLuint *semaphores)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSemaphoresEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *semaphores = 0x%016" PRIxPTR ")", n,
           (uintptr_t)semaphores);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteSemaphoresEXT, n, semaphores);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3598,14 +4262,17 @@ void GL_APIENTRY DeleteSemaphoresEXT(GLsizei n, const GLuint *semaphores)
         if (context->skipValidation() || ValidateDeleteSemaphoresEXT(context, n, semaphores))
         {
             context->deleteSemaphores(n, semaphores);
+            ANGLE_CAPTURE(DeleteSemaphoresEXT, context, n, semaphores);
         }
     }
 }
 
 void GL_APIENTRY GenSemaphoresEXT(GLsizei n, GLuint *semaphores)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenSemaphoresEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *semaphores = 0x%016" PRIxPTR ")", n, (uintptr_t)semaphores);
+    ANGLE_BINARY_TRACE(EntryPoint::GenSemaphoresEXT, n, semaphores);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3613,15 +4280,18 @@ void GL_APIENTRY GenSemaphoresEXT(GLsizei n, GLuint *semaphores)
         if (context->skipValidation() || ValidateGenSemaphoresEXT(context, n, semaphores))
         {
             context->genSemaphores(n, semaphores);
+            ANGLE_CAPTURE(GenSemaphoresEXT, context, n, semaphores);
         }
     }
 }
 
 void GL_APIENTRY GetSemaphoreParameterui64vEXT(GLuint semaphore, GLenum pname, GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSemaphoreParameterui64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSemaphoreParameterui64vEXT, semaphore, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3630,21 +4300,26 @@ void GL_APIENTRY GetSemaphoreParameterui64vEXT(GLuint semaphore, GLenum pname, G
             ValidateGetSemaphoreParameterui64vEXT(context, semaphore, pname, params))
         {
             context->getSemaphoreParameterui64v(semaphore, pname, params);
+            ANGLE_CAPTURE(GetSemaphoreParameterui64vEXT, context, semaphore, pname, params);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsSemaphoreEXT(GLuint semaphore)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsSemaphoreEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u)", semaphore);
+    ANGLE_BINARY_TRACE(EntryPoint::IsSemaphoreEXT, semaphore);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsSemaphoreEXT(context, semaphore))
         {
-            return context->isSemaphore(semaphore);
+            GLboolean returnValue = context->isSemaphore(semaphore);
+            ANGLE_CAPTURE(IsSemaphoreEXT, context, semaphore, returnValue);
+            return returnValue;
         }
     }
 
@@ -3653,10 +4328,12 @@ GLboolean GL_APIENTRY IsSemaphoreEXT(GLuint semaphore)
 
 void GL_APIENTRY SemaphoreParameterui64vEXT(GLuint semaphore, GLenum pname, const GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SemaphoreParameterui64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, const GLuint64 *params = 0x%016" PRIxPTR
           ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::SemaphoreParameterui64vEXT, semaphore, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3665,6 +4342,7 @@ void GL_APIENTRY SemaphoreParameterui64vEXT(GLuint semaphore, GLenum pname, cons
             ValidateSemaphoreParameterui64vEXT(context, semaphore, pname, params))
         {
             context->semaphoreParameterui64v(semaphore, pname, params);
+            ANGLE_CAPTURE(SemaphoreParameterui64vEXT, context, semaphore, pname, params);
         }
     }
 }
@@ -3676,6 +4354,7 @@ void GL_APIENTRY SignalSemaphoreEXT(GLuint semaphore,
                                     const GLuint *textures,
                                     const GLenum *dstLayouts)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SignalSemaphoreEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint semaphore = %u, GLuint numBufferBarriers = %u, const GLuint *buffers = "
@@ -3683,6 +4362,8 @@ void GL_APIENTRY SignalSemaphoreEXT(GLuint semaphore,
         ", const GLenum *dstLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)dstLayouts);
+    ANGLE_BINARY_TRACE(EntryPoint::SignalSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, dstLayouts);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3693,6 +4374,8 @@ void GL_APIENTRY SignalSemaphoreEXT(GLuint semaphore,
         {
             context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
                                      textures, dstLayouts);
+            ANGLE_CAPTURE(SignalSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                          numTextureBarriers, textures, dstLayouts);
         }
     }
 }
@@ -3704,6 +4387,7 @@ void GL_APIENTRY WaitSemaphoreEXT(GLuint semaphore,
                                   const GLuint *textures,
                                   const GLenum *srcLayouts)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WaitSemaphoreEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint semaphore = %u, GLuint numBufferBarriers = %u, const GLuint *buffers = "
@@ -3711,6 +4395,8 @@ void GL_APIENTRY WaitSemaphoreEXT(GLuint semaphore,
         ", const GLenum *srcLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)srcLayouts);
+    ANGLE_BINARY_TRACE(EntryPoint::WaitSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, srcLayouts);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3721,6 +4407,8 @@ void GL_APIENTRY WaitSemaphoreEXT(GLuint semaphore,
         {
             context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
                                    textures, srcLayouts);
+            ANGLE_CAPTURE(WaitSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                          numTextureBarriers, textures, srcLayouts);
         }
     }
 }
@@ -3732,9 +4420,11 @@ void GL_APIENTRY WaitSemaphoreEXT(GLuint semaphore,
 // GL_EXT_semaphore_fd
 void GL_APIENTRY ImportSemaphoreFdEXT(GLuint semaphore, GLenum handleType, GLint fd)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ImportSemaphoreFdEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum handleType = 0x%X, GLint fd = %d)", semaphore, handleType,
           fd);
+    ANGLE_BINARY_TRACE(EntryPoint::ImportSemaphoreFdEXT, semaphore, handleType, fd);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3744,6 +4434,7 @@ void GL_APIENTRY ImportSemaphoreFdEXT(GLuint semaphore, GLenum handleType, GLint
             ValidateImportSemaphoreFdEXT(context, semaphore, handleTypePacked, fd))
         {
             context->importSemaphoreFd(semaphore, handleTypePacked, fd);
+            ANGLE_CAPTURE(ImportSemaphoreFdEXT, context, semaphore, handleType, fd);
         }
     }
 }
@@ -3754,11 +4445,13 @@ void GL_APIENTRY TexStorage1DEXT(GLenum target,
                                  GLenum internalformat,
                                  GLsizei width)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage1DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d)",
         target, levels, internalformat, width);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage1DEXT, target, levels, internalformat, width);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3767,6 +4460,7 @@ void GL_APIENTRY TexStorage1DEXT(GLenum target,
             ValidateTexStorage1DEXT(context, target, levels, internalformat, width))
         {
             context->texStorage1D(target, levels, internalformat, width);
+            ANGLE_CAPTURE(TexStorage1DEXT, context, target, levels, internalformat, width);
         }
     }
 }
@@ -3774,11 +4468,13 @@ void GL_APIENTRY TexStorage1DEXT(GLenum target,
 void GL_APIENTRY
 TexStorage2DEXT(GLenum target, GLsizei levels, GLenum internalformat, GLsizei width, GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DEXT, target, levels, internalformat, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3788,6 +4484,7 @@ TexStorage2DEXT(GLenum target, GLsizei levels, GLenum internalformat, GLsizei wi
             ValidateTexStorage2DEXT(context, targetPacked, levels, internalformat, width, height))
         {
             context->texStorage2D(targetPacked, levels, internalformat, width, height);
+            ANGLE_CAPTURE(TexStorage2DEXT, context, target, levels, internalformat, width, height);
         }
     }
 }
@@ -3799,11 +4496,14 @@ void GL_APIENTRY TexStorage3DEXT(GLenum target,
                                  GLsizei height,
                                  GLsizei depth)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage3DEXT, target, levels, internalformat, width, height,
+                       depth);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3814,6 +4514,8 @@ void GL_APIENTRY TexStorage3DEXT(GLenum target,
                                     depth))
         {
             context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+            ANGLE_CAPTURE(TexStorage3DEXT, context, target, levels, internalformat, width, height,
+                          depth);
         }
     }
 }
@@ -3821,10 +4523,12 @@ void GL_APIENTRY TexStorage3DEXT(GLenum target,
 // GL_KHR_debug
 void GL_APIENTRY DebugMessageCallbackKHR(GLDEBUGPROCKHR callback, const void *userParam)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageCallbackKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLDEBUGPROCKHR callback = 0x%016" PRIxPTR ", const void *userParam = 0x%016" PRIxPTR
           ")",
           (uintptr_t)callback, (uintptr_t)userParam);
+    ANGLE_BINARY_TRACE(EntryPoint::DebugMessageCallbackKHR, callback, userParam);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3833,6 +4537,7 @@ void GL_APIENTRY DebugMessageCallbackKHR(GLDEBUGPROCKHR callback, const void *us
             ValidateDebugMessageCallbackKHR(context, callback, userParam))
         {
             context->debugMessageCallback(callback, userParam);
+            ANGLE_CAPTURE(DebugMessageCallbackKHR, context, callback, userParam);
         }
     }
 }
@@ -3844,11 +4549,14 @@ void GL_APIENTRY DebugMessageControlKHR(GLenum source,
                                         const GLuint *ids,
                                         GLboolean enabled)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageControlKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLenum severity = 0x%X, GLsizei count = %d, "
         "const GLuint *ids = 0x%016" PRIxPTR ", GLboolean enabled = %u)",
         source, type, severity, count, (uintptr_t)ids, enabled);
+    ANGLE_BINARY_TRACE(EntryPoint::DebugMessageControlKHR, source, type, severity, count, ids,
+                       enabled);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3857,6 +4565,8 @@ void GL_APIENTRY DebugMessageControlKHR(GLenum source,
             ValidateDebugMessageControlKHR(context, source, type, severity, count, ids, enabled))
         {
             context->debugMessageControl(source, type, severity, count, ids, enabled);
+            ANGLE_CAPTURE(DebugMessageControlKHR, context, source, type, severity, count, ids,
+                          enabled);
         }
     }
 }
@@ -3868,11 +4578,13 @@ void GL_APIENTRY DebugMessageInsertKHR(GLenum source,
                                        GLsizei length,
                                        const GLchar *buf)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageInsertKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLuint id = %u, GLenum severity = 0x%X, "
         "GLsizei length = %d, const GLchar *buf = 0x%016" PRIxPTR ")",
         source, type, id, severity, length, (uintptr_t)buf);
+    ANGLE_BINARY_TRACE(EntryPoint::DebugMessageInsertKHR, source, type, id, severity, length, buf);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3881,6 +4593,7 @@ void GL_APIENTRY DebugMessageInsertKHR(GLenum source,
             ValidateDebugMessageInsertKHR(context, source, type, id, severity, length, buf))
         {
             context->debugMessageInsert(source, type, id, severity, length, buf);
+            ANGLE_CAPTURE(DebugMessageInsertKHR, context, source, type, id, severity, length, buf);
         }
     }
 }
@@ -3894,6 +4607,7 @@ GLuint GL_APIENTRY GetDebugMessageLogKHR(GLuint count,
                                          GLsizei *lengths,
                                          GLchar *messageLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetDebugMessageLogKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint count = %u, GLsizei bufSize = %d, GLenum *sources = 0x%016" PRIxPTR
           ", GLenum *types = 0x%016" PRIxPTR ", GLuint *ids = 0x%016" PRIxPTR
@@ -3901,6 +4615,8 @@ GLuint GL_APIENTRY GetDebugMessageLogKHR(GLuint count,
           ", GLchar *messageLog = 0x%016" PRIxPTR ")",
           count, bufSize, (uintptr_t)sources, (uintptr_t)types, (uintptr_t)ids,
           (uintptr_t)severities, (uintptr_t)lengths, (uintptr_t)messageLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetDebugMessageLogKHR, count, bufSize, sources, types, ids,
+                       severities, lengths, messageLog);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3909,8 +4625,11 @@ GLuint GL_APIENTRY GetDebugMessageLogKHR(GLuint count,
             ValidateGetDebugMessageLogKHR(context, count, bufSize, sources, types, ids, severities,
                                           lengths, messageLog))
         {
-            return context->getDebugMessageLog(count, bufSize, sources, types, ids, severities,
-                                               lengths, messageLog);
+            GLuint returnValue = context->getDebugMessageLog(count, bufSize, sources, types, ids,
+                                                             severities, lengths, messageLog);
+            ANGLE_CAPTURE(GetDebugMessageLogKHR, context, count, bufSize, sources, types, ids,
+                          severities, lengths, messageLog, returnValue);
+            return returnValue;
         }
     }
 
@@ -3920,11 +4639,13 @@ GLuint GL_APIENTRY GetDebugMessageLogKHR(GLuint count,
 void GL_APIENTRY
 GetObjectLabelKHR(GLenum identifier, GLuint name, GLsizei bufSize, GLsizei *length, GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetObjectLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei bufSize = %d, GLsizei *length = "
         "0x%016" PRIxPTR ", GLchar *label = 0x%016" PRIxPTR ")",
         identifier, name, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::GetObjectLabelKHR, identifier, name, bufSize, length, label);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3933,6 +4654,7 @@ GetObjectLabelKHR(GLenum identifier, GLuint name, GLsizei bufSize, GLsizei *leng
             ValidateGetObjectLabelKHR(context, identifier, name, bufSize, length, label))
         {
             context->getObjectLabel(identifier, name, bufSize, length, label);
+            ANGLE_CAPTURE(GetObjectLabelKHR, context, identifier, name, bufSize, length, label);
         }
     }
 }
@@ -3942,11 +4664,13 @@ void GL_APIENTRY GetObjectPtrLabelKHR(const void *ptr,
                                       GLsizei *length,
                                       GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetObjectPtrLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const void *ptr = 0x%016" PRIxPTR
           ", GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::GetObjectPtrLabelKHR, ptr, bufSize, length, label);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3955,14 +4679,17 @@ void GL_APIENTRY GetObjectPtrLabelKHR(const void *ptr,
             ValidateGetObjectPtrLabelKHR(context, ptr, bufSize, length, label))
         {
             context->getObjectPtrLabel(ptr, bufSize, length, label);
+            ANGLE_CAPTURE(GetObjectPtrLabelKHR, context, ptr, bufSize, length, label);
         }
     }
 }
 
 void GL_APIENTRY GetPointervKHR(GLenum pname, void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointervKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPointervKHR, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3970,17 +4697,20 @@ void GL_APIENTRY GetPointervKHR(GLenum pname, void **params)
         if (context->skipValidation() || ValidateGetPointervKHR(context, pname, params))
         {
             context->getPointerv(pname, params);
+            ANGLE_CAPTURE(GetPointervKHR, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY ObjectLabelKHR(GLenum identifier, GLuint name, GLsizei length, const GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ObjectLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei length = %d, const GLchar *label = "
         "0x%016" PRIxPTR ")",
         identifier, name, length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::ObjectLabelKHR, identifier, name, length, label);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -3989,16 +4719,19 @@ void GL_APIENTRY ObjectLabelKHR(GLenum identifier, GLuint name, GLsizei length,
             ValidateObjectLabelKHR(context, identifier, name, length, label))
         {
             context->objectLabel(identifier, name, length, label);
+            ANGLE_CAPTURE(ObjectLabelKHR, context, identifier, name, length, label);
         }
     }
 }
 
 void GL_APIENTRY ObjectPtrLabelKHR(const void *ptr, GLsizei length, const GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ObjectPtrLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const void *ptr = 0x%016" PRIxPTR
           ", GLsizei length = %d, const GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::ObjectPtrLabelKHR, ptr, length, label);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4006,14 +4739,17 @@ void GL_APIENTRY ObjectPtrLabelKHR(const void *ptr, GLsizei length, const GLchar
         if (context->skipValidation() || ValidateObjectPtrLabelKHR(context, ptr, length, label))
         {
             context->objectPtrLabel(ptr, length, label);
+            ANGLE_CAPTURE(ObjectPtrLabelKHR, context, ptr, length, label);
         }
     }
 }
 
 void GL_APIENTRY PopDebugGroupKHR()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopDebugGroupKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PopDebugGroupKHR);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4021,17 +4757,20 @@ void GL_APIENTRY PopDebugGroupKHR()
         if (context->skipValidation() || ValidatePopDebugGroupKHR(context))
         {
             context->popDebugGroup();
+            ANGLE_CAPTURE(PopDebugGroupKHR, context);
         }
     }
 }
 
 void GL_APIENTRY PushDebugGroupKHR(GLenum source, GLuint id, GLsizei length, const GLchar *message)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushDebugGroupKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum source = 0x%X, GLuint id = %u, GLsizei length = %d, const GLchar *message = "
         "0x%016" PRIxPTR ")",
         source, id, length, (uintptr_t)message);
+    ANGLE_BINARY_TRACE(EntryPoint::PushDebugGroupKHR, source, id, length, message);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4040,6 +4779,7 @@ void GL_APIENTRY PushDebugGroupKHR(GLenum source, GLuint id, GLsizei length, con
             ValidatePushDebugGroupKHR(context, source, id, length, message))
         {
             context->pushDebugGroup(source, id, length, message);
+            ANGLE_CAPTURE(PushDebugGroupKHR, context, source, id, length, message);
         }
     }
 }
@@ -4047,8 +4787,10 @@ void GL_APIENTRY PushDebugGroupKHR(GLenum source, GLuint id, GLsizei length, con
 // GL_KHR_parallel_shader_compile
 void GL_APIENTRY MaxShaderCompilerThreadsKHR(GLuint count)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MaxShaderCompilerThreadsKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint count = %u)", count);
+    ANGLE_BINARY_TRACE(EntryPoint::MaxShaderCompilerThreadsKHR, count);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4056,6 +4798,7 @@ void GL_APIENTRY MaxShaderCompilerThreadsKHR(GLuint count)
         if (context->skipValidation() || ValidateMaxShaderCompilerThreadsKHR(context, count))
         {
             context->maxShaderCompilerThreads(count);
+            ANGLE_CAPTURE(MaxShaderCompilerThreadsKHR, context, count);
         }
     }
 }
@@ -4063,8 +4806,10 @@ void GL_APIENTRY MaxShaderCompilerThreadsKHR(GLuint count)
 // GL_NV_fence
 void GL_APIENTRY DeleteFencesNV(GLsizei n, const GLuint *fences)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFencesNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteFencesNV, n, fences);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4072,14 +4817,17 @@ void GL_APIENTRY DeleteFencesNV(GLsizei n, const GLuint *fences)
         if (context->skipValidation() || ValidateDeleteFencesNV(context, n, fences))
         {
             context->deleteFencesNV(n, fences);
+            ANGLE_CAPTURE(DeleteFencesNV, context, n, fences);
         }
     }
 }
 
 void GL_APIENTRY FinishFenceNV(GLuint fence)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FinishFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_TRACE(EntryPoint::FinishFenceNV, fence);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4087,14 +4835,17 @@ void GL_APIENTRY FinishFenceNV(GLuint fence)
         if (context->skipValidation() || ValidateFinishFenceNV(context, fence))
         {
             context->finishFenceNV(fence);
+            ANGLE_CAPTURE(FinishFenceNV, context, fence);
         }
     }
 }
 
 void GL_APIENTRY GenFencesNV(GLsizei n, GLuint *fences)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFencesNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_TRACE(EntryPoint::GenFencesNV, n, fences);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4102,15 +4853,18 @@ void GL_APIENTRY GenFencesNV(GLsizei n, GLuint *fences)
         if (context->skipValidation() || ValidateGenFencesNV(context, n, fences))
         {
             context->genFencesNV(n, fences);
+            ANGLE_CAPTURE(GenFencesNV, context, n, fences);
         }
     }
 }
 
 void GL_APIENTRY GetFenceivNV(GLuint fence, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFenceivNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", fence,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFenceivNV, fence, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4118,21 +4872,26 @@ void GL_APIENTRY GetFenceivNV(GLuint fence, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetFenceivNV(context, fence, pname, params))
         {
             context->getFenceivNV(fence, pname, params);
+            ANGLE_CAPTURE(GetFenceivNV, context, fence, pname, params);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsFenceNV(GLuint fence)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_TRACE(EntryPoint::IsFenceNV, fence);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsFenceNV(context, fence))
         {
-            return context->isFenceNV(fence);
+            GLboolean returnValue = context->isFenceNV(fence);
+            ANGLE_CAPTURE(IsFenceNV, context, fence, returnValue);
+            return returnValue;
         }
     }
 
@@ -4141,8 +4900,10 @@ GLboolean GL_APIENTRY IsFenceNV(GLuint fence)
 
 void GL_APIENTRY SetFenceNV(GLuint fence, GLenum condition)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SetFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum condition = 0x%X)", fence, condition);
+    ANGLE_BINARY_TRACE(EntryPoint::SetFenceNV, fence, condition);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4150,21 +4911,26 @@ void GL_APIENTRY SetFenceNV(GLuint fence, GLenum condition)
         if (context->skipValidation() || ValidateSetFenceNV(context, fence, condition))
         {
             context->setFenceNV(fence, condition);
+            ANGLE_CAPTURE(SetFenceNV, context, fence, condition);
         }
     }
 }
 
 GLboolean GL_APIENTRY TestFenceNV(GLuint fence)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TestFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_TRACE(EntryPoint::TestFenceNV, fence);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateTestFenceNV(context, fence))
         {
-            return context->testFenceNV(fence);
+            GLboolean returnValue = context->testFenceNV(fence);
+            ANGLE_CAPTURE(TestFenceNV, context, fence, returnValue);
+            return returnValue;
         }
     }
 
@@ -4174,9 +4940,11 @@ GLboolean GL_APIENTRY TestFenceNV(GLuint fence)
 // GL_OES_EGL_image
 void GL_APIENTRY EGLImageTargetRenderbufferStorageOES(GLenum target, GLeglImageOES image)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EGLImageTargetRenderbufferStorageOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_TRACE(EntryPoint::EGLImageTargetRenderbufferStorageOES, target, image);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4185,15 +4953,18 @@ void GL_APIENTRY EGLImageTargetRenderbufferStorageOES(GLenum target, GLeglImageO
             ValidateEGLImageTargetRenderbufferStorageOES(context, target, image))
         {
             context->eGLImageTargetRenderbufferStorage(target, image);
+            ANGLE_CAPTURE(EGLImageTargetRenderbufferStorageOES, context, target, image);
         }
     }
 }
 
 void GL_APIENTRY EGLImageTargetTexture2DOES(GLenum target, GLeglImageOES image)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EGLImageTargetTexture2DOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_TRACE(EntryPoint::EGLImageTargetTexture2DOES, target, image);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4203,6 +4974,7 @@ void GL_APIENTRY EGLImageTargetTexture2DOES(GLenum target, GLeglImageOES image)
             ValidateEGLImageTargetTexture2DOES(context, targetPacked, image))
         {
             context->eGLImageTargetTexture2D(targetPacked, image);
+            ANGLE_CAPTURE(EGLImageTargetTexture2DOES, context, target, image);
         }
     }
 }
@@ -4210,10 +4982,12 @@ void GL_APIENTRY EGLImageTargetTexture2DOES(GLenum target, GLeglImageOES image)
 // GL_OES_draw_texture
 void GL_APIENTRY DrawTexfOES(GLfloat x, GLfloat y, GLfloat z, GLfloat width, GLfloat height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexfOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat width = %f, GLfloat height = %f)",
         x, y, z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexfOES, x, y, z, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4221,14 +4995,17 @@ void GL_APIENTRY DrawTexfOES(GLfloat x, GLfloat y, GLfloat z, GLfloat width, GLf
         if (context->skipValidation() || ValidateDrawTexfOES(context, x, y, z, width, height))
         {
             context->drawTexf(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexfOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexfvOES(const GLfloat *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexfvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexfvOES, coords);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4236,15 +5013,18 @@ void GL_APIENTRY DrawTexfvOES(const GLfloat *coords)
         if (context->skipValidation() || ValidateDrawTexfvOES(context, coords))
         {
             context->drawTexfv(coords);
+            ANGLE_CAPTURE(DrawTexfvOES, context, coords);
         }
     }
 }
 
 void GL_APIENTRY DrawTexiOES(GLint x, GLint y, GLint z, GLint width, GLint height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexiOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLint z = %d, GLint width = %d, GLint height = %d)", x, y,
           z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexiOES, x, y, z, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4252,14 +5032,17 @@ void GL_APIENTRY DrawTexiOES(GLint x, GLint y, GLint z, GLint width, GLint heigh
         if (context->skipValidation() || ValidateDrawTexiOES(context, x, y, z, width, height))
         {
             context->drawTexi(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexiOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexivOES(const GLint *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLint *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexivOES, coords);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4267,16 +5050,19 @@ void GL_APIENTRY DrawTexivOES(const GLint *coords)
         if (context->skipValidation() || ValidateDrawTexivOES(context, coords))
         {
             context->drawTexiv(coords);
+            ANGLE_CAPTURE(DrawTexivOES, context, coords);
         }
     }
 }
 
 void GL_APIENTRY DrawTexsOES(GLshort x, GLshort y, GLshort z, GLshort width, GLshort height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexsOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLshort x = %d, GLshort y = %d, GLshort z = %d, GLshort width = %d, GLshort height = %d)",
         x, y, z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexsOES, x, y, z, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4284,14 +5070,17 @@ void GL_APIENTRY DrawTexsOES(GLshort x, GLshort y, GLshort z, GLshort width, GLs
         if (context->skipValidation() || ValidateDrawTexsOES(context, x, y, z, width, height))
         {
             context->drawTexs(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexsOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexsvOES(const GLshort *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexsvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLshort *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexsvOES, coords);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4299,17 +5088,20 @@ void GL_APIENTRY DrawTexsvOES(const GLshort *coords)
         if (context->skipValidation() || ValidateDrawTexsvOES(context, coords))
         {
             context->drawTexsv(coords);
+            ANGLE_CAPTURE(DrawTexsvOES, context, coords);
         }
     }
 }
 
 void GL_APIENTRY DrawTexxOES(GLfixed x, GLfixed y, GLfixed z, GLfixed width, GLfixed height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexxOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X, GLfixed width = 0x%X, GLfixed "
         "height = 0x%X)",
         x, y, z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexxOES, x, y, z, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4317,14 +5109,17 @@ void GL_APIENTRY DrawTexxOES(GLfixed x, GLfixed y, GLfixed z, GLfixed width, GLf
         if (context->skipValidation() || ValidateDrawTexxOES(context, x, y, z, width, height))
         {
             context->drawTexx(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexxOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexxvOES(const GLfixed *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexxvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexxvOES, coords);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4332,6 +5127,7 @@ void GL_APIENTRY DrawTexxvOES(const GLfixed *coords)
         if (context->skipValidation() || ValidateDrawTexxvOES(context, coords))
         {
             context->drawTexxv(coords);
+            ANGLE_CAPTURE(DrawTexxvOES, context, coords);
         }
     }
 }
@@ -4339,8 +5135,10 @@ void GL_APIENTRY DrawTexxvOES(const GLfixed *coords)
 // GL_OES_framebuffer_object
 void GL_APIENTRY BindFramebufferOES(GLenum target, GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFramebufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFramebufferOES, target, framebuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4348,14 +5146,17 @@ void GL_APIENTRY BindFramebufferOES(GLenum target, GLuint framebuffer)
         if (context->skipValidation() || ValidateBindFramebufferOES(context, target, framebuffer))
         {
             context->bindFramebuffer(target, framebuffer);
+            ANGLE_CAPTURE(BindFramebufferOES, context, target, framebuffer);
         }
     }
 }
 
 void GL_APIENTRY BindRenderbufferOES(GLenum target, GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindRenderbufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindRenderbufferOES, target, renderbuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4363,21 +5164,26 @@ void GL_APIENTRY BindRenderbufferOES(GLenum target, GLuint renderbuffer)
         if (context->skipValidation() || ValidateBindRenderbufferOES(context, target, renderbuffer))
         {
             context->bindRenderbuffer(target, renderbuffer);
+            ANGLE_CAPTURE(BindRenderbufferOES, context, target, renderbuffer);
         }
     }
 }
 
 GLenum GL_APIENTRY CheckFramebufferStatusOES(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CheckFramebufferStatusOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::CheckFramebufferStatusOES, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateCheckFramebufferStatusOES(context, target))
         {
-            return context->checkFramebufferStatus(target);
+            GLenum returnValue = context->checkFramebufferStatus(target);
+            ANGLE_CAPTURE(CheckFramebufferStatusOES, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -4386,9 +5192,11 @@ GLenum GL_APIENTRY CheckFramebufferStatusOES(GLenum target)
 
 void GL_APIENTRY DeleteFramebuffersOES(GLsizei n, const GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFramebuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteFramebuffersOES, n, framebuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4396,15 +5204,18 @@ void GL_APIENTRY DeleteFramebuffersOES(GLsizei n, const GLuint *framebuffers)
         if (context->skipValidation() || ValidateDeleteFramebuffersOES(context, n, framebuffers))
         {
             context->deleteFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(DeleteFramebuffersOES, context, n, framebuffers);
         }
     }
 }
 
 void GL_APIENTRY DeleteRenderbuffersOES(GLsizei n, const GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteRenderbuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteRenderbuffersOES, n, renderbuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4412,6 +5223,7 @@ void GL_APIENTRY DeleteRenderbuffersOES(GLsizei n, const GLuint *renderbuffers)
         if (context->skipValidation() || ValidateDeleteRenderbuffersOES(context, n, renderbuffers))
         {
             context->deleteRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(DeleteRenderbuffersOES, context, n, renderbuffers);
         }
     }
 }
@@ -4421,11 +5233,14 @@ void GL_APIENTRY FramebufferRenderbufferOES(GLenum target,
                                             GLenum renderbuffertarget,
                                             GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferRenderbufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferRenderbufferOES, target, attachment,
+                       renderbuffertarget, renderbuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4435,6 +5250,8 @@ void GL_APIENTRY FramebufferRenderbufferOES(GLenum target,
                                                renderbuffer))
         {
             context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+            ANGLE_CAPTURE(FramebufferRenderbufferOES, context, target, attachment,
+                          renderbuffertarget, renderbuffer);
         }
     }
 }
@@ -4445,11 +5262,14 @@ void GL_APIENTRY FramebufferTexture2DOES(GLenum target,
                                          GLuint texture,
                                          GLint level)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTexture2DOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTexture2DOES, target, attachment, textarget, texture,
+                       level);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4460,14 +5280,18 @@ void GL_APIENTRY FramebufferTexture2DOES(GLenum target,
                                             level))
         {
             context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+            ANGLE_CAPTURE(FramebufferTexture2DOES, context, target, attachment, textarget, texture,
+                          level);
         }
     }
 }
 
 void GL_APIENTRY GenFramebuffersOES(GLsizei n, GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFramebuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenFramebuffersOES, n, framebuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4475,15 +5299,18 @@ void GL_APIENTRY GenFramebuffersOES(GLsizei n, GLuint *framebuffers)
         if (context->skipValidation() || ValidateGenFramebuffersOES(context, n, framebuffers))
         {
             context->genFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(GenFramebuffersOES, context, n, framebuffers);
         }
     }
 }
 
 void GL_APIENTRY GenRenderbuffersOES(GLsizei n, GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenRenderbuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenRenderbuffersOES, n, renderbuffers);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4491,14 +5318,17 @@ void GL_APIENTRY GenRenderbuffersOES(GLsizei n, GLuint *renderbuffers)
         if (context->skipValidation() || ValidateGenRenderbuffersOES(context, n, renderbuffers))
         {
             context->genRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(GenRenderbuffersOES, context, n, renderbuffers);
         }
     }
 }
 
 void GL_APIENTRY GenerateMipmapOES(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenerateMipmapOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::GenerateMipmapOES, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4507,6 +5337,7 @@ void GL_APIENTRY GenerateMipmapOES(GLenum target)
         if (context->skipValidation() || ValidateGenerateMipmapOES(context, targetPacked))
         {
             context->generateMipmap(targetPacked);
+            ANGLE_CAPTURE(GenerateMipmapOES, context, target);
         }
     }
 }
@@ -4516,11 +5347,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivOES(GLenum target,
                                                         GLenum pname,
                                                         GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameterivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameterivOES, target, attachment,
+                       pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4529,15 +5363,19 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivOES(GLenum target,
                                              context, target, attachment, pname, params))
         {
             context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+            ANGLE_CAPTURE(GetFramebufferAttachmentParameterivOES, context, target, attachment,
+                          pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetRenderbufferParameterivOES(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameterivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameterivOES, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4546,21 +5384,26 @@ void GL_APIENTRY GetRenderbufferParameterivOES(GLenum target, GLenum pname, GLin
             ValidateGetRenderbufferParameterivOES(context, target, pname, params))
         {
             context->getRenderbufferParameteriv(target, pname, params);
+            ANGLE_CAPTURE(GetRenderbufferParameterivOES, context, target, pname, params);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsFramebufferOES(GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsFramebufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsFramebufferOES, framebuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsFramebufferOES(context, framebuffer))
         {
-            return context->isFramebuffer(framebuffer);
+            GLboolean returnValue = context->isFramebuffer(framebuffer);
+            ANGLE_CAPTURE(IsFramebufferOES, context, framebuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -4569,15 +5412,19 @@ GLboolean GL_APIENTRY IsFramebufferOES(GLuint framebuffer)
 
 GLboolean GL_APIENTRY IsRenderbufferOES(GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsRenderbufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsRenderbufferOES, renderbuffer);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsRenderbufferOES(context, renderbuffer))
         {
-            return context->isRenderbuffer(renderbuffer);
+            GLboolean returnValue = context->isRenderbuffer(renderbuffer);
+            ANGLE_CAPTURE(IsRenderbufferOES, context, renderbuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -4589,11 +5436,13 @@ void GL_APIENTRY RenderbufferStorageOES(GLenum target,
                                         GLsizei width,
                                         GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageOES, target, internalformat, width, height);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4602,6 +5451,7 @@ void GL_APIENTRY RenderbufferStorageOES(GLenum target,
             ValidateRenderbufferStorageOES(context, target, internalformat, width, height))
         {
             context->renderbufferStorage(target, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorageOES, context, target, internalformat, width, height);
         }
     }
 }
@@ -4613,10 +5463,13 @@ void GL_APIENTRY GetProgramBinaryOES(GLuint program,
                                      GLenum *binaryFormat,
                                      void *binary)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramBinaryOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramBinaryOES, program, bufSize, length, binaryFormat,
+                       binary);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4625,6 +5478,8 @@ void GL_APIENTRY GetProgramBinaryOES(GLuint program,
             ValidateGetProgramBinaryOES(context, program, bufSize, length, binaryFormat, binary))
         {
             context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+            ANGLE_CAPTURE(GetProgramBinaryOES, context, program, bufSize, length, binaryFormat,
+                          binary);
         }
     }
 }
@@ -4634,10 +5489,12 @@ void GL_APIENTRY ProgramBinaryOES(GLuint program,
                                   const void *binary,
                                   GLint length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramBinaryOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLint length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramBinaryOES, program, binaryFormat, binary, length);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4646,6 +5503,7 @@ void GL_APIENTRY ProgramBinaryOES(GLuint program,
             ValidateProgramBinaryOES(context, program, binaryFormat, binary, length))
         {
             context->programBinary(program, binaryFormat, binary, length);
+            ANGLE_CAPTURE(ProgramBinaryOES, context, program, binaryFormat, binary, length);
         }
     }
 }
@@ -4653,9 +5511,11 @@ void GL_APIENTRY ProgramBinaryOES(GLuint program,
 // GL_OES_mapbuffer
 void GL_APIENTRY GetBufferPointervOES(GLenum target, GLenum pname, void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointervOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointervOES, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4665,14 +5525,17 @@ void GL_APIENTRY GetBufferPointervOES(GLenum target, GLenum pname, void **params
             ValidateGetBufferPointervOES(context, targetPacked, pname, params))
         {
             context->getBufferPointerv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferPointervOES, context, target, pname, params);
         }
     }
 }
 
 void *GL_APIENTRY MapBufferOES(GLenum target, GLenum access)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MapBufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum access = 0x%X)", target, access);
+    ANGLE_BINARY_TRACE(EntryPoint::MapBufferOES, target, access);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4680,7 +5543,9 @@ void *GL_APIENTRY MapBufferOES(GLenum target, GLenum access)
         BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
         if (context->skipValidation() || ValidateMapBufferOES(context, targetPacked, access))
         {
-            return context->mapBuffer(targetPacked, access);
+            void *returnValue = context->mapBuffer(targetPacked, access);
+            ANGLE_CAPTURE(MapBufferOES, context, target, access, returnValue);
+            return returnValue;
         }
     }
 
@@ -4689,8 +5554,10 @@ void *GL_APIENTRY MapBufferOES(GLenum target, GLenum access)
 
 GLboolean GL_APIENTRY UnmapBufferOES(GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UnmapBufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::UnmapBufferOES, target);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4698,7 +5565,9 @@ GLboolean GL_APIENTRY UnmapBufferOES(GLenum target)
         BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
         if (context->skipValidation() || ValidateUnmapBufferOES(context, targetPacked))
         {
-            return context->unmapBuffer(targetPacked);
+            GLboolean returnValue = context->unmapBuffer(targetPacked);
+            ANGLE_CAPTURE(UnmapBufferOES, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -4708,8 +5577,10 @@ GLboolean GL_APIENTRY UnmapBufferOES(GLenum target)
 // GL_OES_matrix_palette
 void GL_APIENTRY CurrentPaletteMatrixOES(GLuint matrixpaletteindex)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CurrentPaletteMatrixOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint matrixpaletteindex = %u)", matrixpaletteindex);
+    ANGLE_BINARY_TRACE(EntryPoint::CurrentPaletteMatrixOES, matrixpaletteindex);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4718,14 +5589,17 @@ void GL_APIENTRY CurrentPaletteMatrixOES(GLuint matrixpaletteindex)
             ValidateCurrentPaletteMatrixOES(context, matrixpaletteindex))
         {
             context->currentPaletteMatrix(matrixpaletteindex);
+            ANGLE_CAPTURE(CurrentPaletteMatrixOES, context, matrixpaletteindex);
         }
     }
 }
 
 void GL_APIENTRY LoadPaletteFromModelViewMatrixOES()
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadPaletteFromModelViewMatrixOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::LoadPaletteFromModelViewMatrixOES);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4733,17 +5607,20 @@ void GL_APIENTRY LoadPaletteFromModelViewMatrixOES()
         if (context->skipValidation() || ValidateLoadPaletteFromModelViewMatrixOES(context))
         {
             context->loadPaletteFromModelViewMatrix();
+            ANGLE_CAPTURE(LoadPaletteFromModelViewMatrixOES, context);
         }
     }
 }
 
 void GL_APIENTRY MatrixIndexPointerOES(GLint size, GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixIndexPointerOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixIndexPointerOES, size, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4752,17 +5629,20 @@ void GL_APIENTRY MatrixIndexPointerOES(GLint size, GLenum type, GLsizei stride,
             ValidateMatrixIndexPointerOES(context, size, type, stride, pointer))
         {
             context->matrixIndexPointer(size, type, stride, pointer);
+            ANGLE_CAPTURE(MatrixIndexPointerOES, context, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY WeightPointerOES(GLint size, GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WeightPointerOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::WeightPointerOES, size, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4771,6 +5651,7 @@ void GL_APIENTRY WeightPointerOES(GLint size, GLenum type, GLsizei stride, const
             ValidateWeightPointerOES(context, size, type, stride, pointer))
         {
             context->weightPointer(size, type, stride, pointer);
+            ANGLE_CAPTURE(WeightPointerOES, context, size, type, stride, pointer);
         }
     }
 }
@@ -4778,9 +5659,11 @@ void GL_APIENTRY WeightPointerOES(GLint size, GLenum type, GLsizei stride, const
 // GL_OES_point_size_array
 void GL_APIENTRY PointSizePointerOES(GLenum type, GLsizei stride, const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSizePointerOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::PointSizePointerOES, type, stride, pointer);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4790,6 +5673,7 @@ void GL_APIENTRY PointSizePointerOES(GLenum type, GLsizei stride, const void *po
             ValidatePointSizePointerOES(context, typePacked, stride, pointer))
         {
             context->pointSizePointer(typePacked, stride, pointer);
+            ANGLE_CAPTURE(PointSizePointerOES, context, type, stride, pointer);
         }
     }
 }
@@ -4797,16 +5681,20 @@ void GL_APIENTRY PointSizePointerOES(GLenum type, GLsizei stride, const void *po
 // GL_OES_query_matrix
 GLbitfield GL_APIENTRY QueryMatrixxOES(GLfixed *mantissa, GLint *exponent)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::QueryMatrixxOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed *mantissa = 0x%016" PRIxPTR ", GLint *exponent = 0x%016" PRIxPTR ")",
           (uintptr_t)mantissa, (uintptr_t)exponent);
+    ANGLE_BINARY_TRACE(EntryPoint::QueryMatrixxOES, mantissa, exponent);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateQueryMatrixxOES(context, mantissa, exponent))
         {
-            return context->queryMatrixx(mantissa, exponent);
+            GLbitfield returnValue = context->queryMatrixx(mantissa, exponent);
+            ANGLE_CAPTURE(QueryMatrixxOES, context, mantissa, exponent, returnValue);
+            return returnValue;
         }
     }
 
@@ -4816,9 +5704,11 @@ GLbitfield GL_APIENTRY QueryMatrixxOES(GLfixed *mantissa, GLint *exponent)
 // GL_OES_texture_border_clamp
 void GL_APIENTRY GetSamplerParameterIivOES(GLuint sampler, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIivOES, sampler, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4827,15 +5717,18 @@ void GL_APIENTRY GetSamplerParameterIivOES(GLuint sampler, GLenum pname, GLint *
             ValidateGetSamplerParameterIivOES(context, sampler, pname, params))
         {
             context->getSamplerParameterIiv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameterIivOES, context, sampler, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetSamplerParameterIuivOES(GLuint sampler, GLenum pname, GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIuivOES, sampler, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4844,15 +5737,18 @@ void GL_APIENTRY GetSamplerParameterIuivOES(GLuint sampler, GLenum pname, GLuint
             ValidateGetSamplerParameterIuivOES(context, sampler, pname, params))
         {
             context->getSamplerParameterIuiv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameterIuivOES, context, sampler, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexParameterIivOES(GLenum target, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIivOES, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4862,15 +5758,18 @@ void GL_APIENTRY GetTexParameterIivOES(GLenum target, GLenum pname, GLint *param
             ValidateGetTexParameterIivOES(context, targetPacked, pname, params))
         {
             context->getTexParameterIiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterIivOES, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexParameterIuivOES(GLenum target, GLenum pname, GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIuivOES, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4880,15 +5779,18 @@ void GL_APIENTRY GetTexParameterIuivOES(GLenum target, GLenum pname, GLuint *par
             ValidateGetTexParameterIuivOES(context, targetPacked, pname, params))
         {
             context->getTexParameterIuiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterIuivOES, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY SamplerParameterIivOES(GLuint sampler, GLenum pname, const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIivOES, sampler, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4897,15 +5799,18 @@ void GL_APIENTRY SamplerParameterIivOES(GLuint sampler, GLenum pname, const GLin
             ValidateSamplerParameterIivOES(context, sampler, pname, param))
         {
             context->samplerParameterIiv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterIivOES, context, sampler, pname, param);
         }
     }
 }
 
 void GL_APIENTRY SamplerParameterIuivOES(GLuint sampler, GLenum pname, const GLuint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLuint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIuivOES, sampler, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4914,15 +5819,18 @@ void GL_APIENTRY SamplerParameterIuivOES(GLuint sampler, GLenum pname, const GLu
             ValidateSamplerParameterIuivOES(context, sampler, pname, param))
         {
             context->samplerParameterIuiv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterIuivOES, context, sampler, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexParameterIivOES(GLenum target, GLenum pname, const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIivOES, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4932,15 +5840,18 @@ void GL_APIENTRY TexParameterIivOES(GLenum target, GLenum pname, const GLint *pa
             ValidateTexParameterIivOES(context, targetPacked, pname, params))
         {
             context->texParameterIiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterIivOES, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexParameterIuivOES(GLenum target, GLenum pname, const GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLuint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIuivOES, target, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4950,6 +5861,7 @@ void GL_APIENTRY TexParameterIuivOES(GLenum target, GLenum pname, const GLuint *
             ValidateTexParameterIuivOES(context, targetPacked, pname, params))
         {
             context->texParameterIuiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterIuivOES, context, target, pname, params);
         }
     }
 }
@@ -4957,9 +5869,11 @@ void GL_APIENTRY TexParameterIuivOES(GLenum target, GLenum pname, const GLuint *
 // GL_OES_texture_cube_map
 void GL_APIENTRY GetTexGenfvOES(GLenum coord, GLenum pname, GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenfvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexGenfvOES, coord, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4967,15 +5881,18 @@ void GL_APIENTRY GetTexGenfvOES(GLenum coord, GLenum pname, GLfloat *params)
         if (context->skipValidation() || ValidateGetTexGenfvOES(context, coord, pname, params))
         {
             context->getTexGenfv(coord, pname, params);
+            ANGLE_CAPTURE(GetTexGenfvOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexGenivOES(GLenum coord, GLenum pname, GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexGenivOES, coord, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4983,15 +5900,18 @@ void GL_APIENTRY GetTexGenivOES(GLenum coord, GLenum pname, GLint *params)
         if (context->skipValidation() || ValidateGetTexGenivOES(context, coord, pname, params))
         {
             context->getTexGeniv(coord, pname, params);
+            ANGLE_CAPTURE(GetTexGenivOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetTexGenxvOES(GLenum coord, GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenxvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexGenxvOES, coord, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -4999,14 +5919,17 @@ void GL_APIENTRY GetTexGenxvOES(GLenum coord, GLenum pname, GLfixed *params)
         if (context->skipValidation() || ValidateGetTexGenxvOES(context, coord, pname, params))
         {
             context->getTexGenxv(coord, pname, params);
+            ANGLE_CAPTURE(GetTexGenxvOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexGenfOES(GLenum coord, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenfOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", coord, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenfOES, coord, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5014,15 +5937,18 @@ void GL_APIENTRY TexGenfOES(GLenum coord, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateTexGenfOES(context, coord, pname, param))
         {
             context->texGenf(coord, pname, param);
+            ANGLE_CAPTURE(TexGenfOES, context, coord, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexGenfvOES(GLenum coord, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenfvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenfvOES, coord, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5030,14 +5956,17 @@ void GL_APIENTRY TexGenfvOES(GLenum coord, GLenum pname, const GLfloat *params)
         if (context->skipValidation() || ValidateTexGenfvOES(context, coord, pname, params))
         {
             context->texGenfv(coord, pname, params);
+            ANGLE_CAPTURE(TexGenfvOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexGeniOES(GLenum coord, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGeniOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint param = %d)", coord, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGeniOES, coord, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5045,15 +5974,18 @@ void GL_APIENTRY TexGeniOES(GLenum coord, GLenum pname, GLint param)
         if (context->skipValidation() || ValidateTexGeniOES(context, coord, pname, param))
         {
             context->texGeni(coord, pname, param);
+            ANGLE_CAPTURE(TexGeniOES, context, coord, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexGenivOES(GLenum coord, GLenum pname, const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenivOES, coord, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5061,14 +5993,17 @@ void GL_APIENTRY TexGenivOES(GLenum coord, GLenum pname, const GLint *params)
         if (context->skipValidation() || ValidateTexGenivOES(context, coord, pname, params))
         {
             context->texGeniv(coord, pname, params);
+            ANGLE_CAPTURE(TexGenivOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexGenxOES(GLenum coord, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenxOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", coord, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenxOES, coord, pname, param);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5076,15 +6011,18 @@ void GL_APIENTRY TexGenxOES(GLenum coord, GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateTexGenxOES(context, coord, pname, param))
         {
             context->texGenx(coord, pname, param);
+            ANGLE_CAPTURE(TexGenxOES, context, coord, pname, param);
         }
     }
 }
 
 void GL_APIENTRY TexGenxvOES(GLenum coord, GLenum pname, const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenxvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenxvOES, coord, pname, params);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5092,6 +6030,7 @@ void GL_APIENTRY TexGenxvOES(GLenum coord, GLenum pname, const GLfixed *params)
         if (context->skipValidation() || ValidateTexGenxvOES(context, coord, pname, params))
         {
             context->texGenxv(coord, pname, params);
+            ANGLE_CAPTURE(TexGenxvOES, context, coord, pname, params);
         }
     }
 }
@@ -5105,11 +6044,14 @@ void GL_APIENTRY TexStorage3DMultisampleOES(GLenum target,
                                             GLsizei depth,
                                             GLboolean fixedsamplelocations)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3DMultisampleOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLsizei depth = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, depth, fixedsamplelocations);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage3DMultisampleOES, target, samples, internalformat,
+                       width, height, depth, fixedsamplelocations);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5121,6 +6063,8 @@ void GL_APIENTRY TexStorage3DMultisampleOES(GLenum target,
         {
             context->texStorage3DMultisample(targetPacked, samples, internalformat, width, height,
                                              depth, fixedsamplelocations);
+            ANGLE_CAPTURE(TexStorage3DMultisampleOES, context, target, samples, internalformat,
+                          width, height, depth, fixedsamplelocations);
         }
     }
 }
@@ -5128,8 +6072,10 @@ void GL_APIENTRY TexStorage3DMultisampleOES(GLenum target,
 // GL_OES_vertex_array_object
 void GL_APIENTRY BindVertexArrayOES(GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexArrayOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::BindVertexArrayOES, array);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5137,14 +6083,17 @@ void GL_APIENTRY BindVertexArrayOES(GLuint array)
         if (context->skipValidation() || ValidateBindVertexArrayOES(context, array))
         {
             context->bindVertexArray(array);
+            ANGLE_CAPTURE(BindVertexArrayOES, context, array);
         }
     }
 }
 
 void GL_APIENTRY DeleteVertexArraysOES(GLsizei n, const GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteVertexArraysOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteVertexArraysOES, n, arrays);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5152,14 +6101,17 @@ void GL_APIENTRY DeleteVertexArraysOES(GLsizei n, const GLuint *arrays)
         if (context->skipValidation() || ValidateDeleteVertexArraysOES(context, n, arrays))
         {
             context->deleteVertexArrays(n, arrays);
+            ANGLE_CAPTURE(DeleteVertexArraysOES, context, n, arrays);
         }
     }
 }
 
 void GL_APIENTRY GenVertexArraysOES(GLsizei n, GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenVertexArraysOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::GenVertexArraysOES, n, arrays);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5167,21 +6119,26 @@ void GL_APIENTRY GenVertexArraysOES(GLsizei n, GLuint *arrays)
         if (context->skipValidation() || ValidateGenVertexArraysOES(context, n, arrays))
         {
             context->genVertexArrays(n, arrays);
+            ANGLE_CAPTURE(GenVertexArraysOES, context, n, arrays);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsVertexArrayOES(GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsVertexArrayOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::IsVertexArrayOES, array);
 
     Context *context = GetValidGlobalContext();
     if (context)
     {
         if (context->skipValidation() || ValidateIsVertexArrayOES(context, array))
         {
-            return context->isVertexArray(array);
+            GLboolean returnValue = context->isVertexArray(array);
+            ANGLE_CAPTURE(IsVertexArrayOES, context, array, returnValue);
+            return returnValue;
         }
     }
 
@@ -5196,11 +6153,14 @@ void GL_APIENTRY FramebufferTextureMultiviewOVR(GLenum target,
                                                 GLint baseViewIndex,
                                                 GLsizei numViews)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureMultiviewOVR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint baseViewIndex = %d, GLsizei numViews = %d)",
         target, attachment, texture, level, baseViewIndex, numViews);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureMultiviewOVR, target, attachment, texture,
+                       level, baseViewIndex, numViews);
 
     Context *context = GetValidGlobalContext();
     if (context)
@@ -5211,6 +6171,8 @@ void GL_APIENTRY FramebufferTextureMultiviewOVR(GLenum target,
         {
             context->framebufferTextureMultiview(target, attachment, texture, level, baseViewIndex,
                                                  numViews);
+            ANGLE_CAPTURE(FramebufferTextureMultiviewOVR, context, target, attachment, texture,
+                          level, baseViewIndex, numViews);
         }
     }
 }
@@ -5220,8 +6182,10 @@ void GL_APIENTRY FramebufferTextureMultiviewOVR(GLenum target,
 // EGL_ANGLE_explicit_context
 void GL_APIENTRY ActiveShaderProgramContextANGLE(GLeglContext ctx, GLuint pipeline, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ActiveShaderProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLuint program = %u)", pipeline, program);
+    ANGLE_BINARY_TRACE(EntryPoint::ActiveShaderProgram, pipeline, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5230,14 +6194,17 @@ void GL_APIENTRY ActiveShaderProgramContextANGLE(GLeglContext ctx, GLuint pipeli
         if (context->skipValidation() || ValidateActiveShaderProgram(context, pipeline, program))
         {
             context->activeShaderProgram(pipeline, program);
+            ANGLE_CAPTURE(ActiveShaderProgram, context, pipeline, program);
         }
     }
 }
 
 void GL_APIENTRY ActiveTextureContextANGLE(GLeglContext ctx, GLenum texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ActiveTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_TRACE(EntryPoint::ActiveTexture, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5246,14 +6213,17 @@ void GL_APIENTRY ActiveTextureContextANGLE(GLeglContext ctx, GLenum texture)
         if (context->skipValidation() || ValidateActiveTexture(context, texture))
         {
             context->activeTexture(texture);
+            ANGLE_CAPTURE(ActiveTexture, context, texture);
         }
     }
 }
 
 void GL_APIENTRY AlphaFuncContextANGLE(GLeglContext ctx, GLenum func, GLfloat ref)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AlphaFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfloat ref = %f)", func, ref);
+    ANGLE_BINARY_TRACE(EntryPoint::AlphaFunc, func, ref);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5263,14 +6233,17 @@ void GL_APIENTRY AlphaFuncContextANGLE(GLeglContext ctx, GLenum func, GLfloat re
         if (context->skipValidation() || ValidateAlphaFunc(context, funcPacked, ref))
         {
             context->alphaFunc(funcPacked, ref);
+            ANGLE_CAPTURE(AlphaFunc, context, func, ref);
         }
     }
 }
 
 void GL_APIENTRY AlphaFuncxContextANGLE(GLeglContext ctx, GLenum func, GLfixed ref)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AlphaFuncx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLfixed ref = 0x%X)", func, ref);
+    ANGLE_BINARY_TRACE(EntryPoint::AlphaFuncx, func, ref);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5280,14 +6253,17 @@ void GL_APIENTRY AlphaFuncxContextANGLE(GLeglContext ctx, GLenum func, GLfixed r
         if (context->skipValidation() || ValidateAlphaFuncx(context, funcPacked, ref))
         {
             context->alphaFuncx(funcPacked, ref);
+            ANGLE_CAPTURE(AlphaFuncx, context, func, ref);
         }
     }
 }
 
 void GL_APIENTRY AttachShaderContextANGLE(GLeglContext ctx, GLuint program, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::AttachShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_TRACE(EntryPoint::AttachShader, program, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5296,14 +6272,17 @@ void GL_APIENTRY AttachShaderContextANGLE(GLeglContext ctx, GLuint program, GLui
         if (context->skipValidation() || ValidateAttachShader(context, program, shader))
         {
             context->attachShader(program, shader);
+            ANGLE_CAPTURE(AttachShader, context, program, shader);
         }
     }
 }
 
 void GL_APIENTRY BeginQueryContextANGLE(GLeglContext ctx, GLenum target, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginQuery);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_TRACE(EntryPoint::BeginQuery, target, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5313,14 +6292,17 @@ void GL_APIENTRY BeginQueryContextANGLE(GLeglContext ctx, GLenum target, GLuint
         if (context->skipValidation() || ValidateBeginQuery(context, targetPacked, id))
         {
             context->beginQuery(targetPacked, id);
+            ANGLE_CAPTURE(BeginQuery, context, target, id);
         }
     }
 }
 
 void GL_APIENTRY BeginQueryEXTContextANGLE(GLeglContext ctx, GLenum target, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginQueryEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_TRACE(EntryPoint::BeginQueryEXT, target, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5330,14 +6312,17 @@ void GL_APIENTRY BeginQueryEXTContextANGLE(GLeglContext ctx, GLenum target, GLui
         if (context->skipValidation() || ValidateBeginQueryEXT(context, targetPacked, id))
         {
             context->beginQuery(targetPacked, id);
+            ANGLE_CAPTURE(BeginQueryEXT, context, target, id);
         }
     }
 }
 
 void GL_APIENTRY BeginTransformFeedbackContextANGLE(GLeglContext ctx, GLenum primitiveMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BeginTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum primitiveMode = 0x%X)", primitiveMode);
+    ANGLE_BINARY_TRACE(EntryPoint::BeginTransformFeedback, primitiveMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5348,6 +6333,7 @@ void GL_APIENTRY BeginTransformFeedbackContextANGLE(GLeglContext ctx, GLenum pri
             ValidateBeginTransformFeedback(context, primitiveModePacked))
         {
             context->beginTransformFeedback(primitiveModePacked);
+            ANGLE_CAPTURE(BeginTransformFeedback, context, primitiveMode);
         }
     }
 }
@@ -5357,9 +6343,11 @@ void GL_APIENTRY BindAttribLocationContextANGLE(GLeglContext ctx,
                                                 GLuint index,
                                                 const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindAttribLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint index = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, index, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindAttribLocation, program, index, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5368,14 +6356,17 @@ void GL_APIENTRY BindAttribLocationContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateBindAttribLocation(context, program, index, name))
         {
             context->bindAttribLocation(program, index, name);
+            ANGLE_CAPTURE(BindAttribLocation, context, program, index, name);
         }
     }
 }
 
 void GL_APIENTRY BindBufferContextANGLE(GLeglContext ctx, GLenum target, GLuint buffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint buffer = %u)", target, buffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindBuffer, target, buffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5385,6 +6376,7 @@ void GL_APIENTRY BindBufferContextANGLE(GLeglContext ctx, GLenum target, GLuint
         if (context->skipValidation() || ValidateBindBuffer(context, targetPacked, buffer))
         {
             context->bindBuffer(targetPacked, buffer);
+            ANGLE_CAPTURE(BindBuffer, context, target, buffer);
         }
     }
 }
@@ -5394,8 +6386,10 @@ void GL_APIENTRY BindBufferBaseContextANGLE(GLeglContext ctx,
                                             GLuint index,
                                             GLuint buffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBufferBase);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u)", target, index, buffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindBufferBase, target, index, buffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5406,6 +6400,7 @@ void GL_APIENTRY BindBufferBaseContextANGLE(GLeglContext ctx,
             ValidateBindBufferBase(context, targetPacked, index, buffer))
         {
             context->bindBufferBase(targetPacked, index, buffer);
+            ANGLE_CAPTURE(BindBufferBase, context, target, index, buffer);
         }
     }
 }
@@ -5417,12 +6412,14 @@ void GL_APIENTRY BindBufferRangeContextANGLE(GLeglContext ctx,
                                              GLintptr offset,
                                              GLsizeiptr size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindBufferRange);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLuint buffer = %u, GLintptr offset = %llu, "
         "GLsizeiptr size = %llu)",
         target, index, buffer, static_cast<unsigned long long>(offset),
         static_cast<unsigned long long>(size));
+    ANGLE_BINARY_TRACE(EntryPoint::BindBufferRange, target, index, buffer, offset, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5433,6 +6430,7 @@ void GL_APIENTRY BindBufferRangeContextANGLE(GLeglContext ctx,
             ValidateBindBufferRange(context, targetPacked, index, buffer, offset, size))
         {
             context->bindBufferRange(targetPacked, index, buffer, offset, size);
+            ANGLE_CAPTURE(BindBufferRange, context, target, index, buffer, offset, size);
         }
     }
 }
@@ -5442,9 +6440,11 @@ void GL_APIENTRY BindFragDataLocationEXTContextANGLE(GLeglContext ctx,
                                                      GLuint color,
                                                      const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragDataLocationEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint color = %u, const GLchar *name = 0x%016" PRIxPTR ")",
           program, color, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFragDataLocationEXT, program, color, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5454,6 +6454,7 @@ void GL_APIENTRY BindFragDataLocationEXTContextANGLE(GLeglContext ctx,
             ValidateBindFragDataLocationEXT(context, program, color, name))
         {
             context->bindFragDataLocation(program, color, name);
+            ANGLE_CAPTURE(BindFragDataLocationEXT, context, program, color, name);
         }
     }
 }
@@ -5464,11 +6465,14 @@ void GL_APIENTRY BindFragDataLocationIndexedEXTContextANGLE(GLeglContext ctx,
                                                             GLuint index,
                                                             const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragDataLocationIndexedEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint colorNumber = %u, GLuint index = %u, const GLchar *name = "
         "0x%016" PRIxPTR ")",
         program, colorNumber, index, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFragDataLocationIndexedEXT, program, colorNumber, index,
+                       name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5478,14 +6482,18 @@ void GL_APIENTRY BindFragDataLocationIndexedEXTContextANGLE(GLeglContext ctx,
             ValidateBindFragDataLocationIndexedEXT(context, program, colorNumber, index, name))
         {
             context->bindFragDataLocationIndexed(program, colorNumber, index, name);
+            ANGLE_CAPTURE(BindFragDataLocationIndexedEXT, context, program, colorNumber, index,
+                          name);
         }
     }
 }
 
 void GL_APIENTRY BindFramebufferContextANGLE(GLeglContext ctx, GLenum target, GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFramebuffer, target, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5494,14 +6502,17 @@ void GL_APIENTRY BindFramebufferContextANGLE(GLeglContext ctx, GLenum target, GL
         if (context->skipValidation() || ValidateBindFramebuffer(context, target, framebuffer))
         {
             context->bindFramebuffer(target, framebuffer);
+            ANGLE_CAPTURE(BindFramebuffer, context, target, framebuffer);
         }
     }
 }
 
 void GL_APIENTRY BindFramebufferOESContextANGLE(GLeglContext ctx, GLenum target, GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFramebufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint framebuffer = %u)", target, framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFramebufferOES, target, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5510,6 +6521,7 @@ void GL_APIENTRY BindFramebufferOESContextANGLE(GLeglContext ctx, GLenum target,
         if (context->skipValidation() || ValidateBindFramebufferOES(context, target, framebuffer))
         {
             context->bindFramebuffer(target, framebuffer);
+            ANGLE_CAPTURE(BindFramebufferOES, context, target, framebuffer);
         }
     }
 }
@@ -5523,11 +6535,14 @@ void GL_APIENTRY BindImageTextureContextANGLE(GLeglContext ctx,
                                               GLenum access,
                                               GLenum format)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindImageTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint unit = %u, GLuint texture = %u, GLint level = %d, GLboolean layered = %u, GLint "
         "layer = %d, GLenum access = 0x%X, GLenum format = 0x%X)",
         unit, texture, level, layered, layer, access, format);
+    ANGLE_BINARY_TRACE(EntryPoint::BindImageTexture, unit, texture, level, layered, layer, access,
+                       format);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5537,14 +6552,18 @@ void GL_APIENTRY BindImageTextureContextANGLE(GLeglContext ctx,
             ValidateBindImageTexture(context, unit, texture, level, layered, layer, access, format))
         {
             context->bindImageTexture(unit, texture, level, layered, layer, access, format);
+            ANGLE_CAPTURE(BindImageTexture, context, unit, texture, level, layered, layer, access,
+                          format);
         }
     }
 }
 
 void GL_APIENTRY BindProgramPipelineContextANGLE(GLeglContext ctx, GLuint pipeline)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindProgramPipeline);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_TRACE(EntryPoint::BindProgramPipeline, pipeline);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5553,14 +6572,17 @@ void GL_APIENTRY BindProgramPipelineContextANGLE(GLeglContext ctx, GLuint pipeli
         if (context->skipValidation() || ValidateBindProgramPipeline(context, pipeline))
         {
             context->bindProgramPipeline(pipeline);
+            ANGLE_CAPTURE(BindProgramPipeline, context, pipeline);
         }
     }
 }
 
 void GL_APIENTRY BindRenderbufferContextANGLE(GLeglContext ctx, GLenum target, GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindRenderbuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindRenderbuffer, target, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5569,6 +6591,7 @@ void GL_APIENTRY BindRenderbufferContextANGLE(GLeglContext ctx, GLenum target, G
         if (context->skipValidation() || ValidateBindRenderbuffer(context, target, renderbuffer))
         {
             context->bindRenderbuffer(target, renderbuffer);
+            ANGLE_CAPTURE(BindRenderbuffer, context, target, renderbuffer);
         }
     }
 }
@@ -5577,8 +6600,10 @@ void GL_APIENTRY BindRenderbufferOESContextANGLE(GLeglContext ctx,
                                                  GLenum target,
                                                  GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindRenderbufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint renderbuffer = %u)", target, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::BindRenderbufferOES, target, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5587,14 +6612,17 @@ void GL_APIENTRY BindRenderbufferOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateBindRenderbufferOES(context, target, renderbuffer))
         {
             context->bindRenderbuffer(target, renderbuffer);
+            ANGLE_CAPTURE(BindRenderbufferOES, context, target, renderbuffer);
         }
     }
 }
 
 void GL_APIENTRY BindSamplerContextANGLE(GLeglContext ctx, GLuint unit, GLuint sampler)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindSampler);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint unit = %u, GLuint sampler = %u)", unit, sampler);
+    ANGLE_BINARY_TRACE(EntryPoint::BindSampler, unit, sampler);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5603,14 +6631,17 @@ void GL_APIENTRY BindSamplerContextANGLE(GLeglContext ctx, GLuint unit, GLuint s
         if (context->skipValidation() || ValidateBindSampler(context, unit, sampler))
         {
             context->bindSampler(unit, sampler);
+            ANGLE_CAPTURE(BindSampler, context, unit, sampler);
         }
     }
 }
 
 void GL_APIENTRY BindTextureContextANGLE(GLeglContext ctx, GLenum target, GLuint texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint texture = %u)", target, texture);
+    ANGLE_BINARY_TRACE(EntryPoint::BindTexture, target, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5620,14 +6651,17 @@ void GL_APIENTRY BindTextureContextANGLE(GLeglContext ctx, GLenum target, GLuint
         if (context->skipValidation() || ValidateBindTexture(context, targetPacked, texture))
         {
             context->bindTexture(targetPacked, texture);
+            ANGLE_CAPTURE(BindTexture, context, target, texture);
         }
     }
 }
 
 void GL_APIENTRY BindTransformFeedbackContextANGLE(GLeglContext ctx, GLenum target, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint id = %u)", target, id);
+    ANGLE_BINARY_TRACE(EntryPoint::BindTransformFeedback, target, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5636,14 +6670,17 @@ void GL_APIENTRY BindTransformFeedbackContextANGLE(GLeglContext ctx, GLenum targ
         if (context->skipValidation() || ValidateBindTransformFeedback(context, target, id))
         {
             context->bindTransformFeedback(target, id);
+            ANGLE_CAPTURE(BindTransformFeedback, context, target, id);
         }
     }
 }
 
 void GL_APIENTRY BindVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::BindVertexArray, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5652,14 +6689,17 @@ void GL_APIENTRY BindVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
         if (context->skipValidation() || ValidateBindVertexArray(context, array))
         {
             context->bindVertexArray(array);
+            ANGLE_CAPTURE(BindVertexArray, context, array);
         }
     }
 }
 
 void GL_APIENTRY BindVertexArrayOESContextANGLE(GLeglContext ctx, GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexArrayOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::BindVertexArrayOES, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5668,6 +6708,7 @@ void GL_APIENTRY BindVertexArrayOESContextANGLE(GLeglContext ctx, GLuint array)
         if (context->skipValidation() || ValidateBindVertexArrayOES(context, array))
         {
             context->bindVertexArray(array);
+            ANGLE_CAPTURE(BindVertexArrayOES, context, array);
         }
     }
 }
@@ -5678,11 +6719,13 @@ void GL_APIENTRY BindVertexBufferContextANGLE(GLeglContext ctx,
                                               GLintptr offset,
                                               GLsizei stride)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindVertexBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint bindingindex = %u, GLuint buffer = %u, GLintptr offset = %llu, GLsizei stride = "
         "%d)",
         bindingindex, buffer, static_cast<unsigned long long>(offset), stride);
+    ANGLE_BINARY_TRACE(EntryPoint::BindVertexBuffer, bindingindex, buffer, offset, stride);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5692,6 +6735,7 @@ void GL_APIENTRY BindVertexBufferContextANGLE(GLeglContext ctx,
             ValidateBindVertexBuffer(context, bindingindex, buffer, offset, stride))
         {
             context->bindVertexBuffer(bindingindex, buffer, offset, stride);
+            ANGLE_CAPTURE(BindVertexBuffer, context, bindingindex, buffer, offset, stride);
         }
     }
 }
@@ -5699,9 +6743,11 @@ void GL_APIENTRY BindVertexBufferContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 BlendColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendColor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendColor, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5710,14 +6756,17 @@ BlendColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blu
         if (context->skipValidation() || ValidateBlendColor(context, red, green, blue, alpha))
         {
             context->blendColor(red, green, blue, alpha);
+            ANGLE_CAPTURE(BlendColor, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY BlendEquationContextANGLE(GLeglContext ctx, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendEquation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendEquation, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5726,6 +6775,7 @@ void GL_APIENTRY BlendEquationContextANGLE(GLeglContext ctx, GLenum mode)
         if (context->skipValidation() || ValidateBlendEquation(context, mode))
         {
             context->blendEquation(mode);
+            ANGLE_CAPTURE(BlendEquation, context, mode);
         }
     }
 }
@@ -5734,8 +6784,10 @@ void GL_APIENTRY BlendEquationSeparateContextANGLE(GLeglContext ctx,
                                                    GLenum modeRGB,
                                                    GLenum modeAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendEquationSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum modeRGB = 0x%X, GLenum modeAlpha = 0x%X)", modeRGB, modeAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendEquationSeparate, modeRGB, modeAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5744,14 +6796,17 @@ void GL_APIENTRY BlendEquationSeparateContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateBlendEquationSeparate(context, modeRGB, modeAlpha))
         {
             context->blendEquationSeparate(modeRGB, modeAlpha);
+            ANGLE_CAPTURE(BlendEquationSeparate, context, modeRGB, modeAlpha);
         }
     }
 }
 
 void GL_APIENTRY BlendFuncContextANGLE(GLeglContext ctx, GLenum sfactor, GLenum dfactor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum sfactor = 0x%X, GLenum dfactor = 0x%X)", sfactor, dfactor);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendFunc, sfactor, dfactor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5760,6 +6815,7 @@ void GL_APIENTRY BlendFuncContextANGLE(GLeglContext ctx, GLenum sfactor, GLenum
         if (context->skipValidation() || ValidateBlendFunc(context, sfactor, dfactor))
         {
             context->blendFunc(sfactor, dfactor);
+            ANGLE_CAPTURE(BlendFunc, context, sfactor, dfactor);
         }
     }
 }
@@ -5770,11 +6826,14 @@ void GL_APIENTRY BlendFuncSeparateContextANGLE(GLeglContext ctx,
                                                GLenum sfactorAlpha,
                                                GLenum dfactorAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlendFuncSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum sfactorRGB = 0x%X, GLenum dfactorRGB = 0x%X, GLenum sfactorAlpha = 0x%X, GLenum "
         "dfactorAlpha = 0x%X)",
         sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::BlendFuncSeparate, sfactorRGB, dfactorRGB, sfactorAlpha,
+                       dfactorAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5784,6 +6843,8 @@ void GL_APIENTRY BlendFuncSeparateContextANGLE(GLeglContext ctx,
             ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha))
         {
             context->blendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+            ANGLE_CAPTURE(BlendFuncSeparate, context, sfactorRGB, dfactorRGB, sfactorAlpha,
+                          dfactorAlpha);
         }
     }
 }
@@ -5800,12 +6861,15 @@ void GL_APIENTRY BlitFramebufferContextANGLE(GLeglContext ctx,
                                              GLbitfield mask,
                                              GLenum filter)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlitFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint srcX0 = %d, GLint srcY0 = %d, GLint srcX1 = %d, GLint srcY1 = %d, GLint dstX0 = "
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_TRACE(EntryPoint::BlitFramebuffer, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                       dstY1, mask, filter);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5817,6 +6881,8 @@ void GL_APIENTRY BlitFramebufferContextANGLE(GLeglContext ctx,
         {
             context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
                                      filter);
+            ANGLE_CAPTURE(BlitFramebuffer, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1,
+                          dstY1, mask, filter);
         }
     }
 }
@@ -5833,12 +6899,15 @@ void GL_APIENTRY BlitFramebufferANGLEContextANGLE(GLeglContext ctx,
                                                   GLbitfield mask,
                                                   GLenum filter)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BlitFramebufferANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint srcX0 = %d, GLint srcY0 = %d, GLint srcX1 = %d, GLint srcY1 = %d, GLint dstX0 = "
         "%d, GLint dstY0 = %d, GLint dstX1 = %d, GLint dstY1 = %d, GLbitfield mask = 0x%X, GLenum "
         "filter = 0x%X)",
         srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+    ANGLE_BINARY_TRACE(EntryPoint::BlitFramebufferANGLE, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                       dstX1, dstY1, mask, filter);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5850,6 +6919,8 @@ void GL_APIENTRY BlitFramebufferANGLEContextANGLE(GLeglContext ctx,
         {
             context->blitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
                                      filter);
+            ANGLE_CAPTURE(BlitFramebufferANGLE, context, srcX0, srcY0, srcX1, srcY1, dstX0, dstY0,
+                          dstX1, dstY1, mask, filter);
         }
     }
 }
@@ -5860,10 +6931,12 @@ void GL_APIENTRY BufferDataContextANGLE(GLeglContext ctx,
                                         const void *data,
                                         GLenum usage)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferData);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLsizeiptr size = %llu, const void *data = 0x%016" PRIxPTR
           ", GLenum usage = 0x%X)",
           target, static_cast<unsigned long long>(size), (uintptr_t)data, usage);
+    ANGLE_BINARY_TRACE(EntryPoint::BufferData, target, size, data, usage);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5875,6 +6948,7 @@ void GL_APIENTRY BufferDataContextANGLE(GLeglContext ctx,
             ValidateBufferData(context, targetPacked, size, data, usagePacked))
         {
             context->bufferData(targetPacked, size, data, usagePacked);
+            ANGLE_CAPTURE(BufferData, context, target, size, data, usage);
         }
     }
 }
@@ -5885,12 +6959,14 @@ void GL_APIENTRY BufferStorageMemEXTContextANGLE(GLeglContext ctx,
                                                  GLuint memory,
                                                  GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferStorageMemEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizeiptr size = %llu, GLuint memory = %u, GLuint64 offset = "
         "%llu)",
         target, static_cast<unsigned long long>(size), memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::BufferStorageMemEXT, target, size, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5901,6 +6977,7 @@ void GL_APIENTRY BufferStorageMemEXTContextANGLE(GLeglContext ctx,
             ValidateBufferStorageMemEXT(context, targetPacked, size, memory, offset))
         {
             context->bufferStorageMem(targetPacked, size, memory, offset);
+            ANGLE_CAPTURE(BufferStorageMemEXT, context, target, size, memory, offset);
         }
     }
 }
@@ -5911,12 +6988,14 @@ void GL_APIENTRY BufferSubDataContextANGLE(GLeglContext ctx,
                                            GLsizeiptr size,
                                            const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BufferSubData);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr size = %llu, const void *data = "
         "0x%016" PRIxPTR ")",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(size),
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::BufferSubData, target, offset, size, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5927,14 +7006,17 @@ void GL_APIENTRY BufferSubDataContextANGLE(GLeglContext ctx,
             ValidateBufferSubData(context, targetPacked, offset, size, data))
         {
             context->bufferSubData(targetPacked, offset, size, data);
+            ANGLE_CAPTURE(BufferSubData, context, target, offset, size, data);
         }
     }
 }
 
 GLenum GL_APIENTRY CheckFramebufferStatusContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CheckFramebufferStatus);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::CheckFramebufferStatus, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5942,7 +7024,9 @@ GLenum GL_APIENTRY CheckFramebufferStatusContextANGLE(GLeglContext ctx, GLenum t
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateCheckFramebufferStatus(context, target))
         {
-            return context->checkFramebufferStatus(target);
+            GLenum returnValue = context->checkFramebufferStatus(target);
+            ANGLE_CAPTURE(CheckFramebufferStatus, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -5951,8 +7035,10 @@ GLenum GL_APIENTRY CheckFramebufferStatusContextANGLE(GLeglContext ctx, GLenum t
 
 GLenum GL_APIENTRY CheckFramebufferStatusOESContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CheckFramebufferStatusOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::CheckFramebufferStatusOES, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5960,7 +7046,9 @@ GLenum GL_APIENTRY CheckFramebufferStatusOESContextANGLE(GLeglContext ctx, GLenu
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateCheckFramebufferStatusOES(context, target))
         {
-            return context->checkFramebufferStatus(target);
+            GLenum returnValue = context->checkFramebufferStatus(target);
+            ANGLE_CAPTURE(CheckFramebufferStatusOES, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -5969,8 +7057,10 @@ GLenum GL_APIENTRY CheckFramebufferStatusOESContextANGLE(GLeglContext ctx, GLenu
 
 void GL_APIENTRY ClearContextANGLE(GLeglContext ctx, GLbitfield mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Clear);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield mask = 0x%X)", mask);
+    ANGLE_BINARY_TRACE(EntryPoint::Clear, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -5979,6 +7069,7 @@ void GL_APIENTRY ClearContextANGLE(GLeglContext ctx, GLbitfield mask)
         if (context->skipValidation() || ValidateClear(context, mask))
         {
             context->clear(mask);
+            ANGLE_CAPTURE(Clear, context, mask);
         }
     }
 }
@@ -5989,9 +7080,11 @@ void GL_APIENTRY ClearBufferfiContextANGLE(GLeglContext ctx,
                                            GLfloat depth,
                                            GLint stencil)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferfi);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, GLfloat depth = %f, GLint stencil = %d)",
           buffer, drawbuffer, depth, stencil);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferfi, buffer, drawbuffer, depth, stencil);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6001,6 +7094,7 @@ void GL_APIENTRY ClearBufferfiContextANGLE(GLeglContext ctx,
             ValidateClearBufferfi(context, buffer, drawbuffer, depth, stencil))
         {
             context->clearBufferfi(buffer, drawbuffer, depth, stencil);
+            ANGLE_CAPTURE(ClearBufferfi, context, buffer, drawbuffer, depth, stencil);
         }
     }
 }
@@ -6010,9 +7104,11 @@ void GL_APIENTRY ClearBufferfvContextANGLE(GLeglContext ctx,
                                            GLint drawbuffer,
                                            const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferfv, buffer, drawbuffer, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6021,6 +7117,7 @@ void GL_APIENTRY ClearBufferfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateClearBufferfv(context, buffer, drawbuffer, value))
         {
             context->clearBufferfv(buffer, drawbuffer, value);
+            ANGLE_CAPTURE(ClearBufferfv, context, buffer, drawbuffer, value);
         }
     }
 }
@@ -6030,9 +7127,11 @@ void GL_APIENTRY ClearBufferivContextANGLE(GLeglContext ctx,
                                            GLint drawbuffer,
                                            const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferiv, buffer, drawbuffer, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6041,6 +7140,7 @@ void GL_APIENTRY ClearBufferivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateClearBufferiv(context, buffer, drawbuffer, value))
         {
             context->clearBufferiv(buffer, drawbuffer, value);
+            ANGLE_CAPTURE(ClearBufferiv, context, buffer, drawbuffer, value);
         }
     }
 }
@@ -6050,9 +7150,11 @@ void GL_APIENTRY ClearBufferuivContextANGLE(GLeglContext ctx,
                                             GLint drawbuffer,
                                             const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearBufferuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum buffer = 0x%X, GLint drawbuffer = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           buffer, drawbuffer, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearBufferuiv, buffer, drawbuffer, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6061,6 +7163,7 @@ void GL_APIENTRY ClearBufferuivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateClearBufferuiv(context, buffer, drawbuffer, value))
         {
             context->clearBufferuiv(buffer, drawbuffer, value);
+            ANGLE_CAPTURE(ClearBufferuiv, context, buffer, drawbuffer, value);
         }
     }
 }
@@ -6068,9 +7171,11 @@ void GL_APIENTRY ClearBufferuivContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 ClearColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearColor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearColor, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6079,6 +7184,7 @@ ClearColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blu
         if (context->skipValidation() || ValidateClearColor(context, red, green, blue, alpha))
         {
             context->clearColor(red, green, blue, alpha);
+            ANGLE_CAPTURE(ClearColor, context, red, green, blue, alpha);
         }
     }
 }
@@ -6086,9 +7192,11 @@ ClearColorContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blu
 void GL_APIENTRY
 ClearColorxContextANGLE(GLeglContext ctx, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearColorx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearColorx, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6097,14 +7205,17 @@ ClearColorxContextANGLE(GLeglContext ctx, GLfixed red, GLfixed green, GLfixed bl
         if (context->skipValidation() || ValidateClearColorx(context, red, green, blue, alpha))
         {
             context->clearColorx(red, green, blue, alpha);
+            ANGLE_CAPTURE(ClearColorx, context, red, green, blue, alpha);
         }
     }
 }
 
 void GL_APIENTRY ClearDepthfContextANGLE(GLeglContext ctx, GLfloat d)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearDepthf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat d = %f)", d);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearDepthf, d);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6113,14 +7224,17 @@ void GL_APIENTRY ClearDepthfContextANGLE(GLeglContext ctx, GLfloat d)
         if (context->skipValidation() || ValidateClearDepthf(context, d))
         {
             context->clearDepthf(d);
+            ANGLE_CAPTURE(ClearDepthf, context, d);
         }
     }
 }
 
 void GL_APIENTRY ClearDepthxContextANGLE(GLeglContext ctx, GLfixed depth)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearDepthx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed depth = 0x%X)", depth);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearDepthx, depth);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6129,14 +7243,17 @@ void GL_APIENTRY ClearDepthxContextANGLE(GLeglContext ctx, GLfixed depth)
         if (context->skipValidation() || ValidateClearDepthx(context, depth))
         {
             context->clearDepthx(depth);
+            ANGLE_CAPTURE(ClearDepthx, context, depth);
         }
     }
 }
 
 void GL_APIENTRY ClearStencilContextANGLE(GLeglContext ctx, GLint s)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClearStencil);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint s = %d)", s);
+    ANGLE_BINARY_TRACE(EntryPoint::ClearStencil, s);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6145,14 +7262,17 @@ void GL_APIENTRY ClearStencilContextANGLE(GLeglContext ctx, GLint s)
         if (context->skipValidation() || ValidateClearStencil(context, s))
         {
             context->clearStencil(s);
+            ANGLE_CAPTURE(ClearStencil, context, s);
         }
     }
 }
 
 void GL_APIENTRY ClientActiveTextureContextANGLE(GLeglContext ctx, GLenum texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClientActiveTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum texture = 0x%X)", texture);
+    ANGLE_BINARY_TRACE(EntryPoint::ClientActiveTexture, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6161,6 +7281,7 @@ void GL_APIENTRY ClientActiveTextureContextANGLE(GLeglContext ctx, GLenum textur
         if (context->skipValidation() || ValidateClientActiveTexture(context, texture))
         {
             context->clientActiveTexture(texture);
+            ANGLE_CAPTURE(ClientActiveTexture, context, texture);
         }
     }
 }
@@ -6170,9 +7291,11 @@ GLenum GL_APIENTRY ClientWaitSyncContextANGLE(GLeglContext ctx,
                                               GLbitfield flags,
                                               GLuint64 timeout)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClientWaitSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_TRACE(EntryPoint::ClientWaitSync, sync, flags, timeout);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6180,7 +7303,9 @@ GLenum GL_APIENTRY ClientWaitSyncContextANGLE(GLeglContext ctx,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateClientWaitSync(context, sync, flags, timeout))
         {
-            return context->clientWaitSync(sync, flags, timeout);
+            GLenum returnValue = context->clientWaitSync(sync, flags, timeout);
+            ANGLE_CAPTURE(ClientWaitSync, context, sync, flags, timeout, returnValue);
+            return returnValue;
         }
     }
 
@@ -6189,8 +7314,10 @@ GLenum GL_APIENTRY ClientWaitSyncContextANGLE(GLeglContext ctx,
 
 void GL_APIENTRY ClipPlanefContextANGLE(GLeglContext ctx, GLenum p, const GLfloat *eqn)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClipPlanef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum p = 0x%X, const GLfloat *eqn = 0x%016" PRIxPTR ")", p, (uintptr_t)eqn);
+    ANGLE_BINARY_TRACE(EntryPoint::ClipPlanef, p, eqn);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6199,15 +7326,18 @@ void GL_APIENTRY ClipPlanefContextANGLE(GLeglContext ctx, GLenum p, const GLfloa
         if (context->skipValidation() || ValidateClipPlanef(context, p, eqn))
         {
             context->clipPlanef(p, eqn);
+            ANGLE_CAPTURE(ClipPlanef, context, p, eqn);
         }
     }
 }
 
 void GL_APIENTRY ClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, const GLfixed *equation)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ClipPlanex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, const GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_TRACE(EntryPoint::ClipPlanex, plane, equation);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6216,6 +7346,7 @@ void GL_APIENTRY ClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, const GL
         if (context->skipValidation() || ValidateClipPlanex(context, plane, equation))
         {
             context->clipPlanex(plane, equation);
+            ANGLE_CAPTURE(ClipPlanex, context, plane, equation);
         }
     }
 }
@@ -6223,9 +7354,11 @@ void GL_APIENTRY ClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, const GL
 void GL_APIENTRY
 Color4fContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat red = %f, GLfloat green = %f, GLfloat blue = %f, GLfloat alpha = %f)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::Color4f, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6234,6 +7367,7 @@ Color4fContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue,
         if (context->skipValidation() || ValidateColor4f(context, red, green, blue, alpha))
         {
             context->color4f(red, green, blue, alpha);
+            ANGLE_CAPTURE(Color4f, context, red, green, blue, alpha);
         }
     }
 }
@@ -6241,9 +7375,11 @@ Color4fContextANGLE(GLeglContext ctx, GLfloat red, GLfloat green, GLfloat blue,
 void GL_APIENTRY
 Color4ubContextANGLE(GLeglContext ctx, GLubyte red, GLubyte green, GLubyte blue, GLubyte alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4ub);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLubyte red = %d, GLubyte green = %d, GLubyte blue = %d, GLubyte alpha = %d)", red,
           green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::Color4ub, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6252,6 +7388,7 @@ Color4ubContextANGLE(GLeglContext ctx, GLubyte red, GLubyte green, GLubyte blue,
         if (context->skipValidation() || ValidateColor4ub(context, red, green, blue, alpha))
         {
             context->color4ub(red, green, blue, alpha);
+            ANGLE_CAPTURE(Color4ub, context, red, green, blue, alpha);
         }
     }
 }
@@ -6259,9 +7396,11 @@ Color4ubContextANGLE(GLeglContext ctx, GLubyte red, GLubyte green, GLubyte blue,
 void GL_APIENTRY
 Color4xContextANGLE(GLeglContext ctx, GLfixed red, GLfixed green, GLfixed blue, GLfixed alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Color4x);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed red = 0x%X, GLfixed green = 0x%X, GLfixed blue = 0x%X, GLfixed alpha = 0x%X)",
           red, green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::Color4x, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6270,6 +7409,7 @@ Color4xContextANGLE(GLeglContext ctx, GLfixed red, GLfixed green, GLfixed blue,
         if (context->skipValidation() || ValidateColor4x(context, red, green, blue, alpha))
         {
             context->color4x(red, green, blue, alpha);
+            ANGLE_CAPTURE(Color4x, context, red, green, blue, alpha);
         }
     }
 }
@@ -6280,9 +7420,11 @@ void GL_APIENTRY ColorMaskContextANGLE(GLeglContext ctx,
                                        GLboolean blue,
                                        GLboolean alpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ColorMask);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean red = %u, GLboolean green = %u, GLboolean blue = %u, GLboolean alpha = %u)",
           red, green, blue, alpha);
+    ANGLE_BINARY_TRACE(EntryPoint::ColorMask, red, green, blue, alpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6291,6 +7433,7 @@ void GL_APIENTRY ColorMaskContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateColorMask(context, red, green, blue, alpha))
         {
             context->colorMask(red, green, blue, alpha);
+            ANGLE_CAPTURE(ColorMask, context, red, green, blue, alpha);
         }
     }
 }
@@ -6301,11 +7444,13 @@ void GL_APIENTRY ColorPointerContextANGLE(GLeglContext ctx,
                                           GLsizei stride,
                                           const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ColorPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::ColorPointer, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6316,14 +7461,17 @@ void GL_APIENTRY ColorPointerContextANGLE(GLeglContext ctx,
             ValidateColorPointer(context, size, typePacked, stride, pointer))
         {
             context->colorPointer(size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(ColorPointer, context, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY CompileShaderContextANGLE(GLeglContext ctx, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompileShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_TRACE(EntryPoint::CompileShader, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6332,6 +7480,7 @@ void GL_APIENTRY CompileShaderContextANGLE(GLeglContext ctx, GLuint shader)
         if (context->skipValidation() || ValidateCompileShader(context, shader))
         {
             context->compileShader(shader);
+            ANGLE_CAPTURE(CompileShader, context, shader);
         }
     }
 }
@@ -6346,12 +7495,15 @@ void GL_APIENTRY CompressedTexImage2DContextANGLE(GLeglContext ctx,
                                                   GLsizei imageSize,
                                                   const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, const void *data = "
         "0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage2D, target, level, internalformat, width,
+                       height, border, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6364,6 +7516,8 @@ void GL_APIENTRY CompressedTexImage2DContextANGLE(GLeglContext ctx,
         {
             context->compressedTexImage2D(targetPacked, level, internalformat, width, height,
                                           border, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexImage2D, context, target, level, internalformat, width,
+                          height, border, imageSize, data);
         }
     }
 }
@@ -6379,12 +7533,15 @@ void GL_APIENTRY CompressedTexImage3DContextANGLE(GLeglContext ctx,
                                                   GLsizei imageSize,
                                                   const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d, GLint border = %d, GLsizei imageSize = %d, "
         "const void *data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage3D, target, level, internalformat, width,
+                       height, depth, border, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6397,6 +7554,8 @@ void GL_APIENTRY CompressedTexImage3DContextANGLE(GLeglContext ctx,
         {
             context->compressedTexImage3D(targetPacked, level, internalformat, width, height, depth,
                                           border, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexImage3D, context, target, level, internalformat, width,
+                          height, depth, border, imageSize, data);
         }
     }
 }
@@ -6412,12 +7571,15 @@ void GL_APIENTRY CompressedTexSubImage2DContextANGLE(GLeglContext ctx,
                                                      GLsizei imageSize,
                                                      const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLsizei "
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLsizei imageSize = %d, const void "
         "*data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage2D, target, level, xoffset, yoffset, width,
+                       height, format, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6430,6 +7592,8 @@ void GL_APIENTRY CompressedTexSubImage2DContextANGLE(GLeglContext ctx,
         {
             context->compressedTexSubImage2D(targetPacked, level, xoffset, yoffset, width, height,
                                              format, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage2D, context, target, level, xoffset, yoffset, width,
+                          height, format, imageSize, data);
         }
     }
 }
@@ -6447,6 +7611,7 @@ void GL_APIENTRY CompressedTexSubImage3DContextANGLE(GLeglContext ctx,
                                                      GLsizei imageSize,
                                                      const void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -6454,6 +7619,8 @@ void GL_APIENTRY CompressedTexSubImage3DContextANGLE(GLeglContext ctx,
         "= 0x%X, GLsizei imageSize = %d, const void *data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage3D, target, level, xoffset, yoffset,
+                       zoffset, width, height, depth, format, imageSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6466,6 +7633,8 @@ void GL_APIENTRY CompressedTexSubImage3DContextANGLE(GLeglContext ctx,
         {
             context->compressedTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width,
                                              height, depth, format, imageSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage3D, context, target, level, xoffset, yoffset,
+                          zoffset, width, height, depth, format, imageSize, data);
         }
     }
 }
@@ -6477,12 +7646,15 @@ void GL_APIENTRY CopyBufferSubDataContextANGLE(GLeglContext ctx,
                                                GLintptr writeOffset,
                                                GLsizeiptr size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyBufferSubData);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum readTarget = 0x%X, GLenum writeTarget = 0x%X, GLintptr readOffset = %llu, "
         "GLintptr writeOffset = %llu, GLsizeiptr size = %llu)",
         readTarget, writeTarget, static_cast<unsigned long long>(readOffset),
         static_cast<unsigned long long>(writeOffset), static_cast<unsigned long long>(size));
+    ANGLE_BINARY_TRACE(EntryPoint::CopyBufferSubData, readTarget, writeTarget, readOffset,
+                       writeOffset, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6496,6 +7668,8 @@ void GL_APIENTRY CopyBufferSubDataContextANGLE(GLeglContext ctx,
         {
             context->copyBufferSubData(readTargetPacked, writeTargetPacked, readOffset, writeOffset,
                                        size);
+            ANGLE_CAPTURE(CopyBufferSubData, context, readTarget, writeTarget, readOffset,
+                          writeOffset, size);
         }
     }
 }
@@ -6510,11 +7684,14 @@ void GL_APIENTRY CopyTexImage2DContextANGLE(GLeglContext ctx,
                                             GLsizei height,
                                             GLint border)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLint x = %d, "
         "GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLint border = %d)",
         target, level, internalformat, x, y, width, height, border);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexImage2D, target, level, internalformat, x, y, width,
+                       height, border);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6527,6 +7704,8 @@ void GL_APIENTRY CopyTexImage2DContextANGLE(GLeglContext ctx,
         {
             context->copyTexImage2D(targetPacked, level, internalformat, x, y, width, height,
                                     border);
+            ANGLE_CAPTURE(CopyTexImage2D, context, target, level, internalformat, x, y, width,
+                          height, border);
         }
     }
 }
@@ -6541,11 +7720,14 @@ void GL_APIENTRY CopyTexSubImage2DContextANGLE(GLeglContext ctx,
                                                GLsizei width,
                                                GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexSubImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint x "
         "= %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, x, y, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexSubImage2D, target, level, xoffset, yoffset, x, y, width,
+                       height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6557,6 +7739,8 @@ void GL_APIENTRY CopyTexSubImage2DContextANGLE(GLeglContext ctx,
                                       height))
         {
             context->copyTexSubImage2D(targetPacked, level, xoffset, yoffset, x, y, width, height);
+            ANGLE_CAPTURE(CopyTexSubImage2D, context, target, level, xoffset, yoffset, x, y, width,
+                          height);
         }
     }
 }
@@ -6572,11 +7756,14 @@ void GL_APIENTRY CopyTexSubImage3DContextANGLE(GLeglContext ctx,
                                                GLsizei width,
                                                GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexSubImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
         "zoffset = %d, GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, level, xoffset, yoffset, zoffset, x, y, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexSubImage3D, target, level, xoffset, yoffset, zoffset, x,
+                       y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6589,6 +7776,8 @@ void GL_APIENTRY CopyTexSubImage3DContextANGLE(GLeglContext ctx,
         {
             context->copyTexSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, x, y, width,
                                        height);
+            ANGLE_CAPTURE(CopyTexSubImage3D, context, target, level, xoffset, yoffset, zoffset, x,
+                          y, width, height);
         }
     }
 }
@@ -6597,9 +7786,11 @@ void GL_APIENTRY CreateMemoryObjectsEXTContextANGLE(GLeglContext ctx,
                                                     GLsizei n,
                                                     GLuint *memoryObjects)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateMemoryObjectsEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_TRACE(EntryPoint::CreateMemoryObjectsEXT, n, memoryObjects);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6608,14 +7799,17 @@ void GL_APIENTRY CreateMemoryObjectsEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateCreateMemoryObjectsEXT(context, n, memoryObjects))
         {
             context->createMemoryObjects(n, memoryObjects);
+            ANGLE_CAPTURE(CreateMemoryObjectsEXT, context, n, memoryObjects);
         }
     }
 }
 
 GLuint GL_APIENTRY CreateProgramContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::CreateProgram);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6623,7 +7817,9 @@ GLuint GL_APIENTRY CreateProgramContextANGLE(GLeglContext ctx)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateCreateProgram(context))
         {
-            return context->createProgram();
+            GLuint returnValue = context->createProgram();
+            ANGLE_CAPTURE(CreateProgram, context, returnValue);
+            return returnValue;
         }
     }
 
@@ -6632,8 +7828,10 @@ GLuint GL_APIENTRY CreateProgramContextANGLE(GLeglContext ctx)
 
 GLuint GL_APIENTRY CreateShaderContextANGLE(GLeglContext ctx, GLenum type)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X)", type);
+    ANGLE_BINARY_TRACE(EntryPoint::CreateShader, type);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6642,7 +7840,9 @@ GLuint GL_APIENTRY CreateShaderContextANGLE(GLeglContext ctx, GLenum type)
         ShaderType typePacked = FromGLenum<ShaderType>(type);
         if (context->skipValidation() || ValidateCreateShader(context, typePacked))
         {
-            return context->createShader(typePacked);
+            GLuint returnValue = context->createShader(typePacked);
+            ANGLE_CAPTURE(CreateShader, context, type, returnValue);
+            return returnValue;
         }
     }
 
@@ -6654,10 +7854,12 @@ GLuint GL_APIENTRY CreateShaderProgramvContextANGLE(GLeglContext ctx,
                                                     GLsizei count,
                                                     const GLchar *const *strings)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CreateShaderProgramv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei count = %d, const GLchar *const*strings = 0x%016" PRIxPTR
           ")",
           type, count, (uintptr_t)strings);
+    ANGLE_BINARY_TRACE(EntryPoint::CreateShaderProgramv, type, count, strings);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6667,7 +7869,9 @@ GLuint GL_APIENTRY CreateShaderProgramvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() ||
             ValidateCreateShaderProgramv(context, typePacked, count, strings))
         {
-            return context->createShaderProgramv(typePacked, count, strings);
+            GLuint returnValue = context->createShaderProgramv(typePacked, count, strings);
+            ANGLE_CAPTURE(CreateShaderProgramv, context, type, count, strings, returnValue);
+            return returnValue;
         }
     }
 
@@ -6676,8 +7880,10 @@ GLuint GL_APIENTRY CreateShaderProgramvContextANGLE(GLeglContext ctx,
 
 void GL_APIENTRY CullFaceContextANGLE(GLeglContext ctx, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CullFace);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::CullFace, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6687,14 +7893,17 @@ void GL_APIENTRY CullFaceContextANGLE(GLeglContext ctx, GLenum mode)
         if (context->skipValidation() || ValidateCullFace(context, modePacked))
         {
             context->cullFace(modePacked);
+            ANGLE_CAPTURE(CullFace, context, mode);
         }
     }
 }
 
 void GL_APIENTRY CurrentPaletteMatrixOESContextANGLE(GLeglContext ctx, GLuint matrixpaletteindex)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CurrentPaletteMatrixOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint matrixpaletteindex = %u)", matrixpaletteindex);
+    ANGLE_BINARY_TRACE(EntryPoint::CurrentPaletteMatrixOES, matrixpaletteindex);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6704,6 +7913,7 @@ void GL_APIENTRY CurrentPaletteMatrixOESContextANGLE(GLeglContext ctx, GLuint ma
             ValidateCurrentPaletteMatrixOES(context, matrixpaletteindex))
         {
             context->currentPaletteMatrix(matrixpaletteindex);
+            ANGLE_CAPTURE(CurrentPaletteMatrixOES, context, matrixpaletteindex);
         }
     }
 }
@@ -6712,10 +7922,12 @@ void GL_APIENTRY DebugMessageCallbackKHRContextANGLE(GLeglContext ctx,
                                                      GLDEBUGPROCKHR callback,
                                                      const void *userParam)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageCallbackKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLDEBUGPROCKHR callback = 0x%016" PRIxPTR ", const void *userParam = 0x%016" PRIxPTR
           ")",
           (uintptr_t)callback, (uintptr_t)userParam);
+    ANGLE_BINARY_TRACE(EntryPoint::DebugMessageCallbackKHR, callback, userParam);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6725,6 +7937,7 @@ void GL_APIENTRY DebugMessageCallbackKHRContextANGLE(GLeglContext ctx,
             ValidateDebugMessageCallbackKHR(context, callback, userParam))
         {
             context->debugMessageCallback(callback, userParam);
+            ANGLE_CAPTURE(DebugMessageCallbackKHR, context, callback, userParam);
         }
     }
 }
@@ -6737,11 +7950,14 @@ void GL_APIENTRY DebugMessageControlKHRContextANGLE(GLeglContext ctx,
                                                     const GLuint *ids,
                                                     GLboolean enabled)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageControlKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLenum severity = 0x%X, GLsizei count = %d, "
         "const GLuint *ids = 0x%016" PRIxPTR ", GLboolean enabled = %u)",
         source, type, severity, count, (uintptr_t)ids, enabled);
+    ANGLE_BINARY_TRACE(EntryPoint::DebugMessageControlKHR, source, type, severity, count, ids,
+                       enabled);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6751,6 +7967,8 @@ void GL_APIENTRY DebugMessageControlKHRContextANGLE(GLeglContext ctx,
             ValidateDebugMessageControlKHR(context, source, type, severity, count, ids, enabled))
         {
             context->debugMessageControl(source, type, severity, count, ids, enabled);
+            ANGLE_CAPTURE(DebugMessageControlKHR, context, source, type, severity, count, ids,
+                          enabled);
         }
     }
 }
@@ -6763,11 +7981,13 @@ void GL_APIENTRY DebugMessageInsertKHRContextANGLE(GLeglContext ctx,
                                                    GLsizei length,
                                                    const GLchar *buf)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DebugMessageInsertKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum source = 0x%X, GLenum type = 0x%X, GLuint id = %u, GLenum severity = 0x%X, "
         "GLsizei length = %d, const GLchar *buf = 0x%016" PRIxPTR ")",
         source, type, id, severity, length, (uintptr_t)buf);
+    ANGLE_BINARY_TRACE(EntryPoint::DebugMessageInsertKHR, source, type, id, severity, length, buf);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6777,14 +7997,17 @@ void GL_APIENTRY DebugMessageInsertKHRContextANGLE(GLeglContext ctx,
             ValidateDebugMessageInsertKHR(context, source, type, id, severity, length, buf))
         {
             context->debugMessageInsert(source, type, id, severity, length, buf);
+            ANGLE_CAPTURE(DebugMessageInsertKHR, context, source, type, id, severity, length, buf);
         }
     }
 }
 
 void GL_APIENTRY DeleteBuffersContextANGLE(GLeglContext ctx, GLsizei n, const GLuint *buffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteBuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteBuffers, n, buffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6793,14 +8016,17 @@ void GL_APIENTRY DeleteBuffersContextANGLE(GLeglContext ctx, GLsizei n, const GL
         if (context->skipValidation() || ValidateDeleteBuffers(context, n, buffers))
         {
             context->deleteBuffers(n, buffers);
+            ANGLE_CAPTURE(DeleteBuffers, context, n, buffers);
         }
     }
 }
 
 void GL_APIENTRY DeleteFencesNVContextANGLE(GLeglContext ctx, GLsizei n, const GLuint *fences)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFencesNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteFencesNV, n, fences);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6809,6 +8035,7 @@ void GL_APIENTRY DeleteFencesNVContextANGLE(GLeglContext ctx, GLsizei n, const G
         if (context->skipValidation() || ValidateDeleteFencesNV(context, n, fences))
         {
             context->deleteFencesNV(n, fences);
+            ANGLE_CAPTURE(DeleteFencesNV, context, n, fences);
         }
     }
 }
@@ -6817,9 +8044,11 @@ void GL_APIENTRY DeleteFramebuffersContextANGLE(GLeglContext ctx,
                                                 GLsizei n,
                                                 const GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFramebuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteFramebuffers, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6828,6 +8057,7 @@ void GL_APIENTRY DeleteFramebuffersContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteFramebuffers(context, n, framebuffers))
         {
             context->deleteFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(DeleteFramebuffers, context, n, framebuffers);
         }
     }
 }
@@ -6836,9 +8066,11 @@ void GL_APIENTRY DeleteFramebuffersOESContextANGLE(GLeglContext ctx,
                                                    GLsizei n,
                                                    const GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteFramebuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *framebuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteFramebuffersOES, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6847,6 +8079,7 @@ void GL_APIENTRY DeleteFramebuffersOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteFramebuffersOES(context, n, framebuffers))
         {
             context->deleteFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(DeleteFramebuffersOES, context, n, framebuffers);
         }
     }
 }
@@ -6855,9 +8088,11 @@ void GL_APIENTRY DeleteMemoryObjectsEXTContextANGLE(GLeglContext ctx,
                                                     GLsizei n,
                                                     const GLuint *memoryObjects)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteMemoryObjectsEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *memoryObjects = 0x%016" PRIxPTR ")", n,
           (uintptr_t)memoryObjects);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteMemoryObjectsEXT, n, memoryObjects);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6866,14 +8101,17 @@ void GL_APIENTRY DeleteMemoryObjectsEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteMemoryObjectsEXT(context, n, memoryObjects))
         {
             context->deleteMemoryObjects(n, memoryObjects);
+            ANGLE_CAPTURE(DeleteMemoryObjectsEXT, context, n, memoryObjects);
         }
     }
 }
 
 void GL_APIENTRY DeleteProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6882,6 +8120,7 @@ void GL_APIENTRY DeleteProgramContextANGLE(GLeglContext ctx, GLuint program)
         if (context->skipValidation() || ValidateDeleteProgram(context, program))
         {
             context->deleteProgram(program);
+            ANGLE_CAPTURE(DeleteProgram, context, program);
         }
     }
 }
@@ -6890,8 +8129,10 @@ void GL_APIENTRY DeleteProgramPipelinesContextANGLE(GLeglContext ctx,
                                                     GLsizei n,
                                                     const GLuint *pipelines)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteProgramPipelines);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteProgramPipelines, n, pipelines);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6900,14 +8141,17 @@ void GL_APIENTRY DeleteProgramPipelinesContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteProgramPipelines(context, n, pipelines))
         {
             context->deleteProgramPipelines(n, pipelines);
+            ANGLE_CAPTURE(DeleteProgramPipelines, context, n, pipelines);
         }
     }
 }
 
 void GL_APIENTRY DeleteQueriesContextANGLE(GLeglContext ctx, GLsizei n, const GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteQueries);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteQueries, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6916,14 +8160,17 @@ void GL_APIENTRY DeleteQueriesContextANGLE(GLeglContext ctx, GLsizei n, const GL
         if (context->skipValidation() || ValidateDeleteQueries(context, n, ids))
         {
             context->deleteQueries(n, ids);
+            ANGLE_CAPTURE(DeleteQueries, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY DeleteQueriesEXTContextANGLE(GLeglContext ctx, GLsizei n, const GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteQueriesEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteQueriesEXT, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6932,6 +8179,7 @@ void GL_APIENTRY DeleteQueriesEXTContextANGLE(GLeglContext ctx, GLsizei n, const
         if (context->skipValidation() || ValidateDeleteQueriesEXT(context, n, ids))
         {
             context->deleteQueries(n, ids);
+            ANGLE_CAPTURE(DeleteQueriesEXT, context, n, ids);
         }
     }
 }
@@ -6940,9 +8188,11 @@ void GL_APIENTRY DeleteRenderbuffersContextANGLE(GLeglContext ctx,
                                                  GLsizei n,
                                                  const GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteRenderbuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteRenderbuffers, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6951,6 +8201,7 @@ void GL_APIENTRY DeleteRenderbuffersContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteRenderbuffers(context, n, renderbuffers))
         {
             context->deleteRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(DeleteRenderbuffers, context, n, renderbuffers);
         }
     }
 }
@@ -6959,9 +8210,11 @@ void GL_APIENTRY DeleteRenderbuffersOESContextANGLE(GLeglContext ctx,
                                                     GLsizei n,
                                                     const GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteRenderbuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteRenderbuffersOES, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6970,15 +8223,18 @@ void GL_APIENTRY DeleteRenderbuffersOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteRenderbuffersOES(context, n, renderbuffers))
         {
             context->deleteRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(DeleteRenderbuffersOES, context, n, renderbuffers);
         }
     }
 }
 
 void GL_APIENTRY DeleteSamplersContextANGLE(GLeglContext ctx, GLsizei count, const GLuint *samplers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSamplers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, const GLuint *samplers = 0x%016" PRIxPTR ")", count,
           (uintptr_t)samplers);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteSamplers, count, samplers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -6987,6 +8243,7 @@ void GL_APIENTRY DeleteSamplersContextANGLE(GLeglContext ctx, GLsizei count, con
         if (context->skipValidation() || ValidateDeleteSamplers(context, count, samplers))
         {
             context->deleteSamplers(count, samplers);
+            ANGLE_CAPTURE(DeleteSamplers, context, count, samplers);
         }
     }
 }
@@ -6995,9 +8252,11 @@ void GL_APIENTRY DeleteSemaphoresEXTContextANGLE(GLeglContext ctx,
                                                  GLsizei n,
                                                  const GLuint *semaphores)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSemaphoresEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *semaphores = 0x%016" PRIxPTR ")", n,
           (uintptr_t)semaphores);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteSemaphoresEXT, n, semaphores);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7006,14 +8265,17 @@ void GL_APIENTRY DeleteSemaphoresEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteSemaphoresEXT(context, n, semaphores))
         {
             context->deleteSemaphores(n, semaphores);
+            ANGLE_CAPTURE(DeleteSemaphoresEXT, context, n, semaphores);
         }
     }
 }
 
 void GL_APIENTRY DeleteShaderContextANGLE(GLeglContext ctx, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteShader, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7022,14 +8284,17 @@ void GL_APIENTRY DeleteShaderContextANGLE(GLeglContext ctx, GLuint shader)
         if (context->skipValidation() || ValidateDeleteShader(context, shader))
         {
             context->deleteShader(shader);
+            ANGLE_CAPTURE(DeleteShader, context, shader);
         }
     }
 }
 
 void GL_APIENTRY DeleteSyncContextANGLE(GLeglContext ctx, GLsync sync)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteSync, sync);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7038,14 +8303,17 @@ void GL_APIENTRY DeleteSyncContextANGLE(GLeglContext ctx, GLsync sync)
         if (context->skipValidation() || ValidateDeleteSync(context, sync))
         {
             context->deleteSync(sync);
+            ANGLE_CAPTURE(DeleteSync, context, sync);
         }
     }
 }
 
 void GL_APIENTRY DeleteTexturesContextANGLE(GLeglContext ctx, GLsizei n, const GLuint *textures)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteTextures);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteTextures, n, textures);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7054,6 +8322,7 @@ void GL_APIENTRY DeleteTexturesContextANGLE(GLeglContext ctx, GLsizei n, const G
         if (context->skipValidation() || ValidateDeleteTextures(context, n, textures))
         {
             context->deleteTextures(n, textures);
+            ANGLE_CAPTURE(DeleteTextures, context, n, textures);
         }
     }
 }
@@ -7062,8 +8331,10 @@ void GL_APIENTRY DeleteTransformFeedbacksContextANGLE(GLeglContext ctx,
                                                       GLsizei n,
                                                       const GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteTransformFeedbacks);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteTransformFeedbacks, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7072,14 +8343,17 @@ void GL_APIENTRY DeleteTransformFeedbacksContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteTransformFeedbacks(context, n, ids))
         {
             context->deleteTransformFeedbacks(n, ids);
+            ANGLE_CAPTURE(DeleteTransformFeedbacks, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY DeleteVertexArraysContextANGLE(GLeglContext ctx, GLsizei n, const GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteVertexArrays);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteVertexArrays, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7088,6 +8362,7 @@ void GL_APIENTRY DeleteVertexArraysContextANGLE(GLeglContext ctx, GLsizei n, con
         if (context->skipValidation() || ValidateDeleteVertexArrays(context, n, arrays))
         {
             context->deleteVertexArrays(n, arrays);
+            ANGLE_CAPTURE(DeleteVertexArrays, context, n, arrays);
         }
     }
 }
@@ -7096,8 +8371,10 @@ void GL_APIENTRY DeleteVertexArraysOESContextANGLE(GLeglContext ctx,
                                                    GLsizei n,
                                                    const GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeleteVertexArraysOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::DeleteVertexArraysOES, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7106,14 +8383,17 @@ void GL_APIENTRY DeleteVertexArraysOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDeleteVertexArraysOES(context, n, arrays))
         {
             context->deleteVertexArrays(n, arrays);
+            ANGLE_CAPTURE(DeleteVertexArraysOES, context, n, arrays);
         }
     }
 }
 
 void GL_APIENTRY DepthFuncContextANGLE(GLeglContext ctx, GLenum func)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X)", func);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthFunc, func);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7122,14 +8402,17 @@ void GL_APIENTRY DepthFuncContextANGLE(GLeglContext ctx, GLenum func)
         if (context->skipValidation() || ValidateDepthFunc(context, func))
         {
             context->depthFunc(func);
+            ANGLE_CAPTURE(DepthFunc, context, func);
         }
     }
 }
 
 void GL_APIENTRY DepthMaskContextANGLE(GLeglContext ctx, GLboolean flag)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthMask);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLboolean flag = %u)", flag);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthMask, flag);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7138,14 +8421,17 @@ void GL_APIENTRY DepthMaskContextANGLE(GLeglContext ctx, GLboolean flag)
         if (context->skipValidation() || ValidateDepthMask(context, flag))
         {
             context->depthMask(flag);
+            ANGLE_CAPTURE(DepthMask, context, flag);
         }
     }
 }
 
 void GL_APIENTRY DepthRangefContextANGLE(GLeglContext ctx, GLfloat n, GLfloat f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthRangef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat n = %f, GLfloat f = %f)", n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthRangef, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7154,14 +8440,17 @@ void GL_APIENTRY DepthRangefContextANGLE(GLeglContext ctx, GLfloat n, GLfloat f)
         if (context->skipValidation() || ValidateDepthRangef(context, n, f))
         {
             context->depthRangef(n, f);
+            ANGLE_CAPTURE(DepthRangef, context, n, f);
         }
     }
 }
 
 void GL_APIENTRY DepthRangexContextANGLE(GLeglContext ctx, GLfixed n, GLfixed f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DepthRangex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed n = 0x%X, GLfixed f = 0x%X)", n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::DepthRangex, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7170,14 +8459,17 @@ void GL_APIENTRY DepthRangexContextANGLE(GLeglContext ctx, GLfixed n, GLfixed f)
         if (context->skipValidation() || ValidateDepthRangex(context, n, f))
         {
             context->depthRangex(n, f);
+            ANGLE_CAPTURE(DepthRangex, context, n, f);
         }
     }
 }
 
 void GL_APIENTRY DetachShaderContextANGLE(GLeglContext ctx, GLuint program, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DetachShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint shader = %u)", program, shader);
+    ANGLE_BINARY_TRACE(EntryPoint::DetachShader, program, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7186,14 +8478,17 @@ void GL_APIENTRY DetachShaderContextANGLE(GLeglContext ctx, GLuint program, GLui
         if (context->skipValidation() || ValidateDetachShader(context, program, shader))
         {
             context->detachShader(program, shader);
+            ANGLE_CAPTURE(DetachShader, context, program, shader);
         }
     }
 }
 
 void GL_APIENTRY DisableContextANGLE(GLeglContext ctx, GLenum cap)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Disable);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_TRACE(EntryPoint::Disable, cap);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7202,14 +8497,17 @@ void GL_APIENTRY DisableContextANGLE(GLeglContext ctx, GLenum cap)
         if (context->skipValidation() || ValidateDisable(context, cap))
         {
             context->disable(cap);
+            ANGLE_CAPTURE(Disable, context, cap);
         }
     }
 }
 
 void GL_APIENTRY DisableClientStateContextANGLE(GLeglContext ctx, GLenum array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DisableClientState);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::DisableClientState, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7219,14 +8517,17 @@ void GL_APIENTRY DisableClientStateContextANGLE(GLeglContext ctx, GLenum array)
         if (context->skipValidation() || ValidateDisableClientState(context, arrayPacked))
         {
             context->disableClientState(arrayPacked);
+            ANGLE_CAPTURE(DisableClientState, context, array);
         }
     }
 }
 
 void GL_APIENTRY DisableVertexAttribArrayContextANGLE(GLeglContext ctx, GLuint index)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DisableVertexAttribArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_TRACE(EntryPoint::DisableVertexAttribArray, index);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7235,6 +8536,7 @@ void GL_APIENTRY DisableVertexAttribArrayContextANGLE(GLeglContext ctx, GLuint i
         if (context->skipValidation() || ValidateDisableVertexAttribArray(context, index))
         {
             context->disableVertexAttribArray(index);
+            ANGLE_CAPTURE(DisableVertexAttribArray, context, index);
         }
     }
 }
@@ -7244,11 +8546,13 @@ void GL_APIENTRY DiscardFramebufferEXTContextANGLE(GLeglContext ctx,
                                                    GLsizei numAttachments,
                                                    const GLenum *attachments)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DiscardFramebufferEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_TRACE(EntryPoint::DiscardFramebufferEXT, target, numAttachments, attachments);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7258,6 +8562,7 @@ void GL_APIENTRY DiscardFramebufferEXTContextANGLE(GLeglContext ctx,
             ValidateDiscardFramebufferEXT(context, target, numAttachments, attachments))
         {
             context->discardFramebuffer(target, numAttachments, attachments);
+            ANGLE_CAPTURE(DiscardFramebufferEXT, context, target, numAttachments, attachments);
         }
     }
 }
@@ -7267,9 +8572,11 @@ void GL_APIENTRY DispatchComputeContextANGLE(GLeglContext ctx,
                                              GLuint num_groups_y,
                                              GLuint num_groups_z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DispatchCompute);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint num_groups_x = %u, GLuint num_groups_y = %u, GLuint num_groups_z = %u)",
           num_groups_x, num_groups_y, num_groups_z);
+    ANGLE_BINARY_TRACE(EntryPoint::DispatchCompute, num_groups_x, num_groups_y, num_groups_z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7279,14 +8586,17 @@ void GL_APIENTRY DispatchComputeContextANGLE(GLeglContext ctx,
             ValidateDispatchCompute(context, num_groups_x, num_groups_y, num_groups_z))
         {
             context->dispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+            ANGLE_CAPTURE(DispatchCompute, context, num_groups_x, num_groups_y, num_groups_z);
         }
     }
 }
 
 void GL_APIENTRY DispatchComputeIndirectContextANGLE(GLeglContext ctx, GLintptr indirect)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DispatchComputeIndirect);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLintptr indirect = %llu)", static_cast<unsigned long long>(indirect));
+    ANGLE_BINARY_TRACE(EntryPoint::DispatchComputeIndirect, indirect);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7295,14 +8605,17 @@ void GL_APIENTRY DispatchComputeIndirectContextANGLE(GLeglContext ctx, GLintptr
         if (context->skipValidation() || ValidateDispatchComputeIndirect(context, indirect))
         {
             context->dispatchComputeIndirect(indirect);
+            ANGLE_CAPTURE(DispatchComputeIndirect, context, indirect);
         }
     }
 }
 
 void GL_APIENTRY DrawArraysContextANGLE(GLeglContext ctx, GLenum mode, GLint first, GLsizei count)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArrays);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d)", mode, first, count);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArrays, mode, first, count);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7312,15 +8625,18 @@ void GL_APIENTRY DrawArraysContextANGLE(GLeglContext ctx, GLenum mode, GLint fir
         if (context->skipValidation() || ValidateDrawArrays(context, modePacked, first, count))
         {
             context->drawArrays(modePacked, first, count);
+            ANGLE_CAPTURE(DrawArrays, context, mode, first, count);
         }
     }
 }
 
 void GL_APIENTRY DrawArraysIndirectContextANGLE(GLeglContext ctx, GLenum mode, const void *indirect)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysIndirect);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const void *indirect = 0x%016" PRIxPTR ")", mode,
           (uintptr_t)indirect);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysIndirect, mode, indirect);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7330,6 +8646,7 @@ void GL_APIENTRY DrawArraysIndirectContextANGLE(GLeglContext ctx, GLenum mode, c
         if (context->skipValidation() || ValidateDrawArraysIndirect(context, modePacked, indirect))
         {
             context->drawArraysIndirect(modePacked, indirect);
+            ANGLE_CAPTURE(DrawArraysIndirect, context, mode, indirect);
         }
     }
 }
@@ -7340,9 +8657,11 @@ void GL_APIENTRY DrawArraysInstancedContextANGLE(GLeglContext ctx,
                                                  GLsizei count,
                                                  GLsizei instancecount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstanced);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei instancecount = %d)",
           mode, first, count, instancecount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstanced, mode, first, count, instancecount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7353,6 +8672,7 @@ void GL_APIENTRY DrawArraysInstancedContextANGLE(GLeglContext ctx,
             ValidateDrawArraysInstanced(context, modePacked, first, count, instancecount))
         {
             context->drawArraysInstanced(modePacked, first, count, instancecount);
+            ANGLE_CAPTURE(DrawArraysInstanced, context, mode, first, count, instancecount);
         }
     }
 }
@@ -7363,9 +8683,11 @@ void GL_APIENTRY DrawArraysInstancedANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei count,
                                                       GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint first = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, first, count, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstancedANGLE, mode, first, count, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7376,6 +8698,7 @@ void GL_APIENTRY DrawArraysInstancedANGLEContextANGLE(GLeglContext ctx,
             ValidateDrawArraysInstancedANGLE(context, modePacked, first, count, primcount))
         {
             context->drawArraysInstanced(modePacked, first, count, primcount);
+            ANGLE_CAPTURE(DrawArraysInstancedANGLE, context, mode, first, count, primcount);
         }
     }
 }
@@ -7386,9 +8709,11 @@ void GL_APIENTRY DrawArraysInstancedEXTContextANGLE(GLeglContext ctx,
                                                     GLsizei count,
                                                     GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawArraysInstancedEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLint start = %d, GLsizei count = %d, GLsizei primcount = %d)",
           mode, start, count, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawArraysInstancedEXT, mode, start, count, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7399,14 +8724,17 @@ void GL_APIENTRY DrawArraysInstancedEXTContextANGLE(GLeglContext ctx,
             ValidateDrawArraysInstancedEXT(context, modePacked, start, count, primcount))
         {
             context->drawArraysInstanced(modePacked, start, count, primcount);
+            ANGLE_CAPTURE(DrawArraysInstancedEXT, context, mode, start, count, primcount);
         }
     }
 }
 
 void GL_APIENTRY DrawBuffersContextANGLE(GLeglContext ctx, GLsizei n, const GLenum *bufs)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawBuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawBuffers, n, bufs);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7415,14 +8743,17 @@ void GL_APIENTRY DrawBuffersContextANGLE(GLeglContext ctx, GLsizei n, const GLen
         if (context->skipValidation() || ValidateDrawBuffers(context, n, bufs))
         {
             context->drawBuffers(n, bufs);
+            ANGLE_CAPTURE(DrawBuffers, context, n, bufs);
         }
     }
 }
 
 void GL_APIENTRY DrawBuffersEXTContextANGLE(GLeglContext ctx, GLsizei n, const GLenum *bufs)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawBuffersEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, const GLenum *bufs = 0x%016" PRIxPTR ")", n, (uintptr_t)bufs);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawBuffersEXT, n, bufs);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7431,6 +8762,7 @@ void GL_APIENTRY DrawBuffersEXTContextANGLE(GLeglContext ctx, GLsizei n, const G
         if (context->skipValidation() || ValidateDrawBuffersEXT(context, n, bufs))
         {
             context->drawBuffers(n, bufs);
+            ANGLE_CAPTURE(DrawBuffersEXT, context, n, bufs);
         }
     }
 }
@@ -7441,11 +8773,13 @@ void GL_APIENTRY DrawElementsContextANGLE(GLeglContext ctx,
                                           GLenum type,
                                           const void *indices)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElements);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ")",
         mode, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElements, mode, count, type, indices);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7457,6 +8791,7 @@ void GL_APIENTRY DrawElementsContextANGLE(GLeglContext ctx,
             ValidateDrawElements(context, modePacked, count, typePacked, indices))
         {
             context->drawElements(modePacked, count, typePacked, indices);
+            ANGLE_CAPTURE(DrawElements, context, mode, count, type, indices);
         }
     }
 }
@@ -7466,9 +8801,11 @@ void GL_APIENTRY DrawElementsIndirectContextANGLE(GLeglContext ctx,
                                                   GLenum type,
                                                   const void *indirect)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsIndirect);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, GLenum type = 0x%X, const void *indirect = 0x%016" PRIxPTR ")",
           mode, type, (uintptr_t)indirect);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsIndirect, mode, type, indirect);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7480,6 +8817,7 @@ void GL_APIENTRY DrawElementsIndirectContextANGLE(GLeglContext ctx,
             ValidateDrawElementsIndirect(context, modePacked, typePacked, indirect))
         {
             context->drawElementsIndirect(modePacked, typePacked, indirect);
+            ANGLE_CAPTURE(DrawElementsIndirect, context, mode, type, indirect);
         }
     }
 }
@@ -7491,11 +8829,14 @@ void GL_APIENTRY DrawElementsInstancedContextANGLE(GLeglContext ctx,
                                                    const void *indices,
                                                    GLsizei instancecount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstanced);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei instancecount = %d)",
         mode, count, type, (uintptr_t)indices, instancecount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstanced, mode, count, type, indices,
+                       instancecount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7508,6 +8849,8 @@ void GL_APIENTRY DrawElementsInstancedContextANGLE(GLeglContext ctx,
                                           instancecount))
         {
             context->drawElementsInstanced(modePacked, count, typePacked, indices, instancecount);
+            ANGLE_CAPTURE(DrawElementsInstanced, context, mode, count, type, indices,
+                          instancecount);
         }
     }
 }
@@ -7519,11 +8862,14 @@ void GL_APIENTRY DrawElementsInstancedANGLEContextANGLE(GLeglContext ctx,
                                                         const void *indices,
                                                         GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstancedANGLE, mode, count, type, indices,
+                       primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7536,6 +8882,8 @@ void GL_APIENTRY DrawElementsInstancedANGLEContextANGLE(GLeglContext ctx,
                                                primcount))
         {
             context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+            ANGLE_CAPTURE(DrawElementsInstancedANGLE, context, mode, count, type, indices,
+                          primcount);
         }
     }
 }
@@ -7547,11 +8895,13 @@ void GL_APIENTRY DrawElementsInstancedEXTContextANGLE(GLeglContext ctx,
                                                       const void *indices,
                                                       GLsizei primcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawElementsInstancedEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLsizei count = %d, GLenum type = 0x%X, const void *indices = "
         "0x%016" PRIxPTR ", GLsizei primcount = %d)",
         mode, count, type, (uintptr_t)indices, primcount);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawElementsInstancedEXT, mode, count, type, indices, primcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7564,6 +8914,7 @@ void GL_APIENTRY DrawElementsInstancedEXTContextANGLE(GLeglContext ctx,
                                              primcount))
         {
             context->drawElementsInstanced(modePacked, count, typePacked, indices, primcount);
+            ANGLE_CAPTURE(DrawElementsInstancedEXT, context, mode, count, type, indices, primcount);
         }
     }
 }
@@ -7576,11 +8927,13 @@ void GL_APIENTRY DrawRangeElementsContextANGLE(GLeglContext ctx,
                                                GLenum type,
                                                const void *indices)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawRangeElements);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum mode = 0x%X, GLuint start = %u, GLuint end = %u, GLsizei count = %d, GLenum type "
         "= 0x%X, const void *indices = 0x%016" PRIxPTR ")",
         mode, start, end, count, type, (uintptr_t)indices);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawRangeElements, mode, start, end, count, type, indices);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7592,6 +8945,7 @@ void GL_APIENTRY DrawRangeElementsContextANGLE(GLeglContext ctx,
             ValidateDrawRangeElements(context, modePacked, start, end, count, typePacked, indices))
         {
             context->drawRangeElements(modePacked, start, end, count, typePacked, indices);
+            ANGLE_CAPTURE(DrawRangeElements, context, mode, start, end, count, type, indices);
         }
     }
 }
@@ -7603,10 +8957,12 @@ void GL_APIENTRY DrawTexfOESContextANGLE(GLeglContext ctx,
                                          GLfloat width,
                                          GLfloat height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexfOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat width = %f, GLfloat height = %f)",
         x, y, z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexfOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7615,14 +8971,17 @@ void GL_APIENTRY DrawTexfOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDrawTexfOES(context, x, y, z, width, height))
         {
             context->drawTexf(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexfOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexfvOESContextANGLE(GLeglContext ctx, const GLfloat *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexfvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexfvOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7631,6 +8990,7 @@ void GL_APIENTRY DrawTexfvOESContextANGLE(GLeglContext ctx, const GLfloat *coord
         if (context->skipValidation() || ValidateDrawTexfvOES(context, coords))
         {
             context->drawTexfv(coords);
+            ANGLE_CAPTURE(DrawTexfvOES, context, coords);
         }
     }
 }
@@ -7638,9 +8998,11 @@ void GL_APIENTRY DrawTexfvOESContextANGLE(GLeglContext ctx, const GLfloat *coord
 void GL_APIENTRY
 DrawTexiOESContextANGLE(GLeglContext ctx, GLint x, GLint y, GLint z, GLint width, GLint height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexiOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLint z = %d, GLint width = %d, GLint height = %d)", x, y,
           z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexiOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7649,14 +9011,17 @@ DrawTexiOESContextANGLE(GLeglContext ctx, GLint x, GLint y, GLint z, GLint width
         if (context->skipValidation() || ValidateDrawTexiOES(context, x, y, z, width, height))
         {
             context->drawTexi(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexiOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexivOESContextANGLE(GLeglContext ctx, const GLint *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLint *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexivOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7665,6 +9030,7 @@ void GL_APIENTRY DrawTexivOESContextANGLE(GLeglContext ctx, const GLint *coords)
         if (context->skipValidation() || ValidateDrawTexivOES(context, coords))
         {
             context->drawTexiv(coords);
+            ANGLE_CAPTURE(DrawTexivOES, context, coords);
         }
     }
 }
@@ -7676,10 +9042,12 @@ void GL_APIENTRY DrawTexsOESContextANGLE(GLeglContext ctx,
                                          GLshort width,
                                          GLshort height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexsOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLshort x = %d, GLshort y = %d, GLshort z = %d, GLshort width = %d, GLshort height = %d)",
         x, y, z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexsOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7688,14 +9056,17 @@ void GL_APIENTRY DrawTexsOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDrawTexsOES(context, x, y, z, width, height))
         {
             context->drawTexs(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexsOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexsvOESContextANGLE(GLeglContext ctx, const GLshort *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexsvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLshort *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexsvOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7704,6 +9075,7 @@ void GL_APIENTRY DrawTexsvOESContextANGLE(GLeglContext ctx, const GLshort *coord
         if (context->skipValidation() || ValidateDrawTexsvOES(context, coords))
         {
             context->drawTexsv(coords);
+            ANGLE_CAPTURE(DrawTexsvOES, context, coords);
         }
     }
 }
@@ -7715,11 +9087,13 @@ void GL_APIENTRY DrawTexxOESContextANGLE(GLeglContext ctx,
                                          GLfixed width,
                                          GLfixed height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexxOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X, GLfixed width = 0x%X, GLfixed "
         "height = 0x%X)",
         x, y, z, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexxOES, x, y, z, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7728,14 +9102,17 @@ void GL_APIENTRY DrawTexxOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateDrawTexxOES(context, x, y, z, width, height))
         {
             context->drawTexx(x, y, z, width, height);
+            ANGLE_CAPTURE(DrawTexxOES, context, x, y, z, width, height);
         }
     }
 }
 
 void GL_APIENTRY DrawTexxvOESContextANGLE(GLeglContext ctx, const GLfixed *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DrawTexxvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *coords = 0x%016" PRIxPTR ")", (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::DrawTexxvOES, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7744,6 +9121,7 @@ void GL_APIENTRY DrawTexxvOESContextANGLE(GLeglContext ctx, const GLfixed *coord
         if (context->skipValidation() || ValidateDrawTexxvOES(context, coords))
         {
             context->drawTexxv(coords);
+            ANGLE_CAPTURE(DrawTexxvOES, context, coords);
         }
     }
 }
@@ -7752,9 +9130,11 @@ void GL_APIENTRY EGLImageTargetRenderbufferStorageOESContextANGLE(GLeglContext c
                                                                   GLenum target,
                                                                   GLeglImageOES image)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EGLImageTargetRenderbufferStorageOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_TRACE(EntryPoint::EGLImageTargetRenderbufferStorageOES, target, image);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7764,6 +9144,7 @@ void GL_APIENTRY EGLImageTargetRenderbufferStorageOESContextANGLE(GLeglContext c
             ValidateEGLImageTargetRenderbufferStorageOES(context, target, image))
         {
             context->eGLImageTargetRenderbufferStorage(target, image);
+            ANGLE_CAPTURE(EGLImageTargetRenderbufferStorageOES, context, target, image);
         }
     }
 }
@@ -7772,9 +9153,11 @@ void GL_APIENTRY EGLImageTargetTexture2DOESContextANGLE(GLeglContext ctx,
                                                         GLenum target,
                                                         GLeglImageOES image)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EGLImageTargetTexture2DOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLeglImageOES image = 0x%016" PRIxPTR ")", target,
           (uintptr_t)image);
+    ANGLE_BINARY_TRACE(EntryPoint::EGLImageTargetTexture2DOES, target, image);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7785,14 +9168,17 @@ void GL_APIENTRY EGLImageTargetTexture2DOESContextANGLE(GLeglContext ctx,
             ValidateEGLImageTargetTexture2DOES(context, targetPacked, image))
         {
             context->eGLImageTargetTexture2D(targetPacked, image);
+            ANGLE_CAPTURE(EGLImageTargetTexture2DOES, context, target, image);
         }
     }
 }
 
 void GL_APIENTRY EnableContextANGLE(GLeglContext ctx, GLenum cap)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Enable);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_TRACE(EntryPoint::Enable, cap);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7801,14 +9187,17 @@ void GL_APIENTRY EnableContextANGLE(GLeglContext ctx, GLenum cap)
         if (context->skipValidation() || ValidateEnable(context, cap))
         {
             context->enable(cap);
+            ANGLE_CAPTURE(Enable, context, cap);
         }
     }
 }
 
 void GL_APIENTRY EnableClientStateContextANGLE(GLeglContext ctx, GLenum array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EnableClientState);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum array = 0x%X)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::EnableClientState, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7818,14 +9207,17 @@ void GL_APIENTRY EnableClientStateContextANGLE(GLeglContext ctx, GLenum array)
         if (context->skipValidation() || ValidateEnableClientState(context, arrayPacked))
         {
             context->enableClientState(arrayPacked);
+            ANGLE_CAPTURE(EnableClientState, context, array);
         }
     }
 }
 
 void GL_APIENTRY EnableVertexAttribArrayContextANGLE(GLeglContext ctx, GLuint index)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EnableVertexAttribArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u)", index);
+    ANGLE_BINARY_TRACE(EntryPoint::EnableVertexAttribArray, index);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7834,14 +9226,17 @@ void GL_APIENTRY EnableVertexAttribArrayContextANGLE(GLeglContext ctx, GLuint in
         if (context->skipValidation() || ValidateEnableVertexAttribArray(context, index))
         {
             context->enableVertexAttribArray(index);
+            ANGLE_CAPTURE(EnableVertexAttribArray, context, index);
         }
     }
 }
 
 void GL_APIENTRY EndQueryContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndQuery);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::EndQuery, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7851,14 +9246,17 @@ void GL_APIENTRY EndQueryContextANGLE(GLeglContext ctx, GLenum target)
         if (context->skipValidation() || ValidateEndQuery(context, targetPacked))
         {
             context->endQuery(targetPacked);
+            ANGLE_CAPTURE(EndQuery, context, target);
         }
     }
 }
 
 void GL_APIENTRY EndQueryEXTContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndQueryEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::EndQueryEXT, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7868,14 +9266,17 @@ void GL_APIENTRY EndQueryEXTContextANGLE(GLeglContext ctx, GLenum target)
         if (context->skipValidation() || ValidateEndQueryEXT(context, targetPacked))
         {
             context->endQuery(targetPacked);
+            ANGLE_CAPTURE(EndQueryEXT, context, target);
         }
     }
 }
 
 void GL_APIENTRY EndTransformFeedbackContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::EndTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::EndTransformFeedback);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7884,14 +9285,17 @@ void GL_APIENTRY EndTransformFeedbackContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateEndTransformFeedback(context))
         {
             context->endTransformFeedback();
+            ANGLE_CAPTURE(EndTransformFeedback, context);
         }
     }
 }
 
 GLsync GL_APIENTRY FenceSyncContextANGLE(GLeglContext ctx, GLenum condition, GLbitfield flags)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FenceSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum condition = 0x%X, GLbitfield flags = 0x%X)", condition, flags);
+    ANGLE_BINARY_TRACE(EntryPoint::FenceSync, condition, flags);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7899,7 +9303,9 @@ GLsync GL_APIENTRY FenceSyncContextANGLE(GLeglContext ctx, GLenum condition, GLb
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateFenceSync(context, condition, flags))
         {
-            return context->fenceSync(condition, flags);
+            GLsync returnValue = context->fenceSync(condition, flags);
+            ANGLE_CAPTURE(FenceSync, context, condition, flags, returnValue);
+            return returnValue;
         }
     }
 
@@ -7908,8 +9314,10 @@ GLsync GL_APIENTRY FenceSyncContextANGLE(GLeglContext ctx, GLenum condition, GLb
 
 void GL_APIENTRY FinishContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Finish);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::Finish);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7918,14 +9326,17 @@ void GL_APIENTRY FinishContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateFinish(context))
         {
             context->finish();
+            ANGLE_CAPTURE(Finish, context);
         }
     }
 }
 
 void GL_APIENTRY FinishFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FinishFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_TRACE(EntryPoint::FinishFenceNV, fence);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7934,14 +9345,17 @@ void GL_APIENTRY FinishFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
         if (context->skipValidation() || ValidateFinishFenceNV(context, fence))
         {
             context->finishFenceNV(fence);
+            ANGLE_CAPTURE(FinishFenceNV, context, fence);
         }
     }
 }
 
 void GL_APIENTRY FlushContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Flush);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::Flush);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7950,6 +9364,7 @@ void GL_APIENTRY FlushContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateFlush(context))
         {
             context->flush();
+            ANGLE_CAPTURE(Flush, context);
         }
     }
 }
@@ -7959,9 +9374,11 @@ void GL_APIENTRY FlushMappedBufferRangeContextANGLE(GLeglContext ctx,
                                                     GLintptr offset,
                                                     GLsizeiptr length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FlushMappedBufferRange);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_TRACE(EntryPoint::FlushMappedBufferRange, target, offset, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7972,6 +9389,7 @@ void GL_APIENTRY FlushMappedBufferRangeContextANGLE(GLeglContext ctx,
             ValidateFlushMappedBufferRange(context, targetPacked, offset, length))
         {
             context->flushMappedBufferRange(targetPacked, offset, length);
+            ANGLE_CAPTURE(FlushMappedBufferRange, context, target, offset, length);
         }
     }
 }
@@ -7981,9 +9399,11 @@ void GL_APIENTRY FlushMappedBufferRangeEXTContextANGLE(GLeglContext ctx,
                                                        GLintptr offset,
                                                        GLsizeiptr length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FlushMappedBufferRangeEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu)", target,
           static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length));
+    ANGLE_BINARY_TRACE(EntryPoint::FlushMappedBufferRangeEXT, target, offset, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -7994,14 +9414,17 @@ void GL_APIENTRY FlushMappedBufferRangeEXTContextANGLE(GLeglContext ctx,
             ValidateFlushMappedBufferRangeEXT(context, targetPacked, offset, length))
         {
             context->flushMappedBufferRange(targetPacked, offset, length);
+            ANGLE_CAPTURE(FlushMappedBufferRangeEXT, context, target, offset, length);
         }
     }
 }
 
 void GL_APIENTRY FogfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogf, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8010,15 +9433,18 @@ void GL_APIENTRY FogfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat param)
         if (context->skipValidation() || ValidateFogf(context, pname, param))
         {
             context->fogf(pname, param);
+            ANGLE_CAPTURE(Fogf, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY FogfvContextANGLE(GLeglContext ctx, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogfv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8027,14 +9453,17 @@ void GL_APIENTRY FogfvContextANGLE(GLeglContext ctx, GLenum pname, const GLfloat
         if (context->skipValidation() || ValidateFogfv(context, pname, params))
         {
             context->fogfv(pname, params);
+            ANGLE_CAPTURE(Fogfv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY FogxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogx, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8043,15 +9472,18 @@ void GL_APIENTRY FogxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed param)
         if (context->skipValidation() || ValidateFogx(context, pname, param))
         {
             context->fogx(pname, param);
+            ANGLE_CAPTURE(Fogx, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY FogxvContextANGLE(GLeglContext ctx, GLenum pname, const GLfixed *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Fogxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::Fogxv, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8060,6 +9492,7 @@ void GL_APIENTRY FogxvContextANGLE(GLeglContext ctx, GLenum pname, const GLfixed
         if (context->skipValidation() || ValidateFogxv(context, pname, param))
         {
             context->fogxv(pname, param);
+            ANGLE_CAPTURE(Fogxv, context, pname, param);
         }
     }
 }
@@ -8069,8 +9502,10 @@ void GL_APIENTRY FramebufferParameteriContextANGLE(GLeglContext ctx,
                                                    GLenum pname,
                                                    GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferParameteri, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8080,6 +9515,7 @@ void GL_APIENTRY FramebufferParameteriContextANGLE(GLeglContext ctx,
             ValidateFramebufferParameteri(context, target, pname, param))
         {
             context->framebufferParameteri(target, pname, param);
+            ANGLE_CAPTURE(FramebufferParameteri, context, target, pname, param);
         }
     }
 }
@@ -8090,11 +9526,14 @@ void GL_APIENTRY FramebufferRenderbufferContextANGLE(GLeglContext ctx,
                                                      GLenum renderbuffertarget,
                                                      GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferRenderbuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferRenderbuffer, target, attachment, renderbuffertarget,
+                       renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8105,6 +9544,8 @@ void GL_APIENTRY FramebufferRenderbufferContextANGLE(GLeglContext ctx,
                                             renderbuffer))
         {
             context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+            ANGLE_CAPTURE(FramebufferRenderbuffer, context, target, attachment, renderbuffertarget,
+                          renderbuffer);
         }
     }
 }
@@ -8115,11 +9556,14 @@ void GL_APIENTRY FramebufferRenderbufferOESContextANGLE(GLeglContext ctx,
                                                         GLenum renderbuffertarget,
                                                         GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferRenderbufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum renderbuffertarget = 0x%X, GLuint "
         "renderbuffer = %u)",
         target, attachment, renderbuffertarget, renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferRenderbufferOES, target, attachment,
+                       renderbuffertarget, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8130,6 +9574,8 @@ void GL_APIENTRY FramebufferRenderbufferOESContextANGLE(GLeglContext ctx,
                                                renderbuffer))
         {
             context->framebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+            ANGLE_CAPTURE(FramebufferRenderbufferOES, context, target, attachment,
+                          renderbuffertarget, renderbuffer);
         }
     }
 }
@@ -8141,11 +9587,14 @@ void GL_APIENTRY FramebufferTexture2DContextANGLE(GLeglContext ctx,
                                                   GLuint texture,
                                                   GLint level)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTexture2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTexture2D, target, attachment, textarget, texture,
+                       level);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8157,6 +9606,8 @@ void GL_APIENTRY FramebufferTexture2DContextANGLE(GLeglContext ctx,
                                          level))
         {
             context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+            ANGLE_CAPTURE(FramebufferTexture2D, context, target, attachment, textarget, texture,
+                          level);
         }
     }
 }
@@ -8168,11 +9619,14 @@ void GL_APIENTRY FramebufferTexture2DOESContextANGLE(GLeglContext ctx,
                                                      GLuint texture,
                                                      GLint level)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTexture2DOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum textarget = 0x%X, GLuint texture "
         "= %u, GLint level = %d)",
         target, attachment, textarget, texture, level);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTexture2DOES, target, attachment, textarget, texture,
+                       level);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8184,6 +9638,8 @@ void GL_APIENTRY FramebufferTexture2DOESContextANGLE(GLeglContext ctx,
                                             level))
         {
             context->framebufferTexture2D(target, attachment, textargetPacked, texture, level);
+            ANGLE_CAPTURE(FramebufferTexture2DOES, context, target, attachment, textarget, texture,
+                          level);
         }
     }
 }
@@ -8194,9 +9650,11 @@ void GL_APIENTRY FramebufferTextureEXTContextANGLE(GLeglContext ctx,
                                                    GLuint texture,
                                                    GLint level)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d)",
           target, attachment, texture, level);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureEXT, target, attachment, texture, level);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8206,6 +9664,7 @@ void GL_APIENTRY FramebufferTextureEXTContextANGLE(GLeglContext ctx,
             ValidateFramebufferTextureEXT(context, target, attachment, texture, level))
         {
             context->framebufferTexture(target, attachment, texture, level);
+            ANGLE_CAPTURE(FramebufferTextureEXT, context, target, attachment, texture, level);
         }
     }
 }
@@ -8217,11 +9676,14 @@ void GL_APIENTRY FramebufferTextureLayerContextANGLE(GLeglContext ctx,
                                                      GLint level,
                                                      GLint layer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureLayer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint layer = %d)",
         target, attachment, texture, level, layer);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureLayer, target, attachment, texture, level,
+                       layer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8231,6 +9693,8 @@ void GL_APIENTRY FramebufferTextureLayerContextANGLE(GLeglContext ctx,
             ValidateFramebufferTextureLayer(context, target, attachment, texture, level, layer))
         {
             context->framebufferTextureLayer(target, attachment, texture, level, layer);
+            ANGLE_CAPTURE(FramebufferTextureLayer, context, target, attachment, texture, level,
+                          layer);
         }
     }
 }
@@ -8243,11 +9707,14 @@ void GL_APIENTRY FramebufferTextureMultiviewOVRContextANGLE(GLeglContext ctx,
                                                             GLint baseViewIndex,
                                                             GLsizei numViews)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FramebufferTextureMultiviewOVR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLuint texture = %u, GLint level = %d, "
         "GLint baseViewIndex = %d, GLsizei numViews = %d)",
         target, attachment, texture, level, baseViewIndex, numViews);
+    ANGLE_BINARY_TRACE(EntryPoint::FramebufferTextureMultiviewOVR, target, attachment, texture,
+                       level, baseViewIndex, numViews);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8259,14 +9726,18 @@ void GL_APIENTRY FramebufferTextureMultiviewOVRContextANGLE(GLeglContext ctx,
         {
             context->framebufferTextureMultiview(target, attachment, texture, level, baseViewIndex,
                                                  numViews);
+            ANGLE_CAPTURE(FramebufferTextureMultiviewOVR, context, target, attachment, texture,
+                          level, baseViewIndex, numViews);
         }
     }
 }
 
 void GL_APIENTRY FrontFaceContextANGLE(GLeglContext ctx, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::FrontFace);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::FrontFace, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8275,6 +9746,7 @@ void GL_APIENTRY FrontFaceContextANGLE(GLeglContext ctx, GLenum mode)
         if (context->skipValidation() || ValidateFrontFace(context, mode))
         {
             context->frontFace(mode);
+            ANGLE_CAPTURE(FrontFace, context, mode);
         }
     }
 }
@@ -8287,11 +9759,13 @@ void GL_APIENTRY FrustumfContextANGLE(GLeglContext ctx,
                                       GLfloat n,
                                       GLfloat f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Frustumf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Frustumf, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8300,6 +9774,7 @@ void GL_APIENTRY FrustumfContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateFrustumf(context, l, r, b, t, n, f))
         {
             context->frustumf(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Frustumf, context, l, r, b, t, n, f);
         }
     }
 }
@@ -8312,11 +9787,13 @@ void GL_APIENTRY FrustumxContextANGLE(GLeglContext ctx,
                                       GLfixed n,
                                       GLfixed f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Frustumx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Frustumx, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8325,14 +9802,17 @@ void GL_APIENTRY FrustumxContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateFrustumx(context, l, r, b, t, n, f))
         {
             context->frustumx(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Frustumx, context, l, r, b, t, n, f);
         }
     }
 }
 
 void GL_APIENTRY GenBuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint *buffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenBuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *buffers = 0x%016" PRIxPTR ")", n, (uintptr_t)buffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenBuffers, n, buffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8341,14 +9821,17 @@ void GL_APIENTRY GenBuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint *buf
         if (context->skipValidation() || ValidateGenBuffers(context, n, buffers))
         {
             context->genBuffers(n, buffers);
+            ANGLE_CAPTURE(GenBuffers, context, n, buffers);
         }
     }
 }
 
 void GL_APIENTRY GenFencesNVContextANGLE(GLeglContext ctx, GLsizei n, GLuint *fences)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFencesNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *fences = 0x%016" PRIxPTR ")", n, (uintptr_t)fences);
+    ANGLE_BINARY_TRACE(EntryPoint::GenFencesNV, n, fences);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8357,14 +9840,17 @@ void GL_APIENTRY GenFencesNVContextANGLE(GLeglContext ctx, GLsizei n, GLuint *fe
         if (context->skipValidation() || ValidateGenFencesNV(context, n, fences))
         {
             context->genFencesNV(n, fences);
+            ANGLE_CAPTURE(GenFencesNV, context, n, fences);
         }
     }
 }
 
 void GL_APIENTRY GenFramebuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFramebuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenFramebuffers, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8373,14 +9859,17 @@ void GL_APIENTRY GenFramebuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint
         if (context->skipValidation() || ValidateGenFramebuffers(context, n, framebuffers))
         {
             context->genFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(GenFramebuffers, context, n, framebuffers);
         }
     }
 }
 
 void GL_APIENTRY GenFramebuffersOESContextANGLE(GLeglContext ctx, GLsizei n, GLuint *framebuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenFramebuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *framebuffers = 0x%016" PRIxPTR ")", n, (uintptr_t)framebuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenFramebuffersOES, n, framebuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8389,14 +9878,17 @@ void GL_APIENTRY GenFramebuffersOESContextANGLE(GLeglContext ctx, GLsizei n, GLu
         if (context->skipValidation() || ValidateGenFramebuffersOES(context, n, framebuffers))
         {
             context->genFramebuffers(n, framebuffers);
+            ANGLE_CAPTURE(GenFramebuffersOES, context, n, framebuffers);
         }
     }
 }
 
 void GL_APIENTRY GenProgramPipelinesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *pipelines)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenProgramPipelines);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *pipelines = 0x%016" PRIxPTR ")", n, (uintptr_t)pipelines);
+    ANGLE_BINARY_TRACE(EntryPoint::GenProgramPipelines, n, pipelines);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8405,14 +9897,17 @@ void GL_APIENTRY GenProgramPipelinesContextANGLE(GLeglContext ctx, GLsizei n, GL
         if (context->skipValidation() || ValidateGenProgramPipelines(context, n, pipelines))
         {
             context->genProgramPipelines(n, pipelines);
+            ANGLE_CAPTURE(GenProgramPipelines, context, n, pipelines);
         }
     }
 }
 
 void GL_APIENTRY GenQueriesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenQueries);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::GenQueries, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8421,14 +9916,17 @@ void GL_APIENTRY GenQueriesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *ids
         if (context->skipValidation() || ValidateGenQueries(context, n, ids))
         {
             context->genQueries(n, ids);
+            ANGLE_CAPTURE(GenQueries, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY GenQueriesEXTContextANGLE(GLeglContext ctx, GLsizei n, GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenQueriesEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::GenQueriesEXT, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8437,15 +9935,18 @@ void GL_APIENTRY GenQueriesEXTContextANGLE(GLeglContext ctx, GLsizei n, GLuint *
         if (context->skipValidation() || ValidateGenQueriesEXT(context, n, ids))
         {
             context->genQueries(n, ids);
+            ANGLE_CAPTURE(GenQueriesEXT, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY GenRenderbuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenRenderbuffers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenRenderbuffers, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8454,15 +9955,18 @@ void GL_APIENTRY GenRenderbuffersContextANGLE(GLeglContext ctx, GLsizei n, GLuin
         if (context->skipValidation() || ValidateGenRenderbuffers(context, n, renderbuffers))
         {
             context->genRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(GenRenderbuffers, context, n, renderbuffers);
         }
     }
 }
 
 void GL_APIENTRY GenRenderbuffersOESContextANGLE(GLeglContext ctx, GLsizei n, GLuint *renderbuffers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenRenderbuffersOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *renderbuffers = 0x%016" PRIxPTR ")", n,
           (uintptr_t)renderbuffers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenRenderbuffersOES, n, renderbuffers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8471,14 +9975,17 @@ void GL_APIENTRY GenRenderbuffersOESContextANGLE(GLeglContext ctx, GLsizei n, GL
         if (context->skipValidation() || ValidateGenRenderbuffersOES(context, n, renderbuffers))
         {
             context->genRenderbuffers(n, renderbuffers);
+            ANGLE_CAPTURE(GenRenderbuffersOES, context, n, renderbuffers);
         }
     }
 }
 
 void GL_APIENTRY GenSamplersContextANGLE(GLeglContext ctx, GLsizei count, GLuint *samplers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenSamplers);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, GLuint *samplers = 0x%016" PRIxPTR ")", count, (uintptr_t)samplers);
+    ANGLE_BINARY_TRACE(EntryPoint::GenSamplers, count, samplers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8487,14 +9994,17 @@ void GL_APIENTRY GenSamplersContextANGLE(GLeglContext ctx, GLsizei count, GLuint
         if (context->skipValidation() || ValidateGenSamplers(context, count, samplers))
         {
             context->genSamplers(count, samplers);
+            ANGLE_CAPTURE(GenSamplers, context, count, samplers);
         }
     }
 }
 
 void GL_APIENTRY GenSemaphoresEXTContextANGLE(GLeglContext ctx, GLsizei n, GLuint *semaphores)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenSemaphoresEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *semaphores = 0x%016" PRIxPTR ")", n, (uintptr_t)semaphores);
+    ANGLE_BINARY_TRACE(EntryPoint::GenSemaphoresEXT, n, semaphores);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8503,14 +10013,17 @@ void GL_APIENTRY GenSemaphoresEXTContextANGLE(GLeglContext ctx, GLsizei n, GLuin
         if (context->skipValidation() || ValidateGenSemaphoresEXT(context, n, semaphores))
         {
             context->genSemaphores(n, semaphores);
+            ANGLE_CAPTURE(GenSemaphoresEXT, context, n, semaphores);
         }
     }
 }
 
 void GL_APIENTRY GenTexturesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *textures)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenTextures);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *textures = 0x%016" PRIxPTR ")", n, (uintptr_t)textures);
+    ANGLE_BINARY_TRACE(EntryPoint::GenTextures, n, textures);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8519,14 +10032,17 @@ void GL_APIENTRY GenTexturesContextANGLE(GLeglContext ctx, GLsizei n, GLuint *te
         if (context->skipValidation() || ValidateGenTextures(context, n, textures))
         {
             context->genTextures(n, textures);
+            ANGLE_CAPTURE(GenTextures, context, n, textures);
         }
     }
 }
 
 void GL_APIENTRY GenTransformFeedbacksContextANGLE(GLeglContext ctx, GLsizei n, GLuint *ids)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenTransformFeedbacks);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *ids = 0x%016" PRIxPTR ")", n, (uintptr_t)ids);
+    ANGLE_BINARY_TRACE(EntryPoint::GenTransformFeedbacks, n, ids);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8535,14 +10051,17 @@ void GL_APIENTRY GenTransformFeedbacksContextANGLE(GLeglContext ctx, GLsizei n,
         if (context->skipValidation() || ValidateGenTransformFeedbacks(context, n, ids))
         {
             context->genTransformFeedbacks(n, ids);
+            ANGLE_CAPTURE(GenTransformFeedbacks, context, n, ids);
         }
     }
 }
 
 void GL_APIENTRY GenVertexArraysContextANGLE(GLeglContext ctx, GLsizei n, GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenVertexArrays);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::GenVertexArrays, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8551,14 +10070,17 @@ void GL_APIENTRY GenVertexArraysContextANGLE(GLeglContext ctx, GLsizei n, GLuint
         if (context->skipValidation() || ValidateGenVertexArrays(context, n, arrays))
         {
             context->genVertexArrays(n, arrays);
+            ANGLE_CAPTURE(GenVertexArrays, context, n, arrays);
         }
     }
 }
 
 void GL_APIENTRY GenVertexArraysOESContextANGLE(GLeglContext ctx, GLsizei n, GLuint *arrays)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenVertexArraysOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei n = %d, GLuint *arrays = 0x%016" PRIxPTR ")", n, (uintptr_t)arrays);
+    ANGLE_BINARY_TRACE(EntryPoint::GenVertexArraysOES, n, arrays);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8567,14 +10089,17 @@ void GL_APIENTRY GenVertexArraysOESContextANGLE(GLeglContext ctx, GLsizei n, GLu
         if (context->skipValidation() || ValidateGenVertexArraysOES(context, n, arrays))
         {
             context->genVertexArrays(n, arrays);
+            ANGLE_CAPTURE(GenVertexArraysOES, context, n, arrays);
         }
     }
 }
 
 void GL_APIENTRY GenerateMipmapContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenerateMipmap);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::GenerateMipmap, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8584,14 +10109,17 @@ void GL_APIENTRY GenerateMipmapContextANGLE(GLeglContext ctx, GLenum target)
         if (context->skipValidation() || ValidateGenerateMipmap(context, targetPacked))
         {
             context->generateMipmap(targetPacked);
+            ANGLE_CAPTURE(GenerateMipmap, context, target);
         }
     }
 }
 
 void GL_APIENTRY GenerateMipmapOESContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenerateMipmapOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::GenerateMipmapOES, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8601,6 +10129,7 @@ void GL_APIENTRY GenerateMipmapOESContextANGLE(GLeglContext ctx, GLenum target)
         if (context->skipValidation() || ValidateGenerateMipmapOES(context, targetPacked))
         {
             context->generateMipmap(targetPacked);
+            ANGLE_CAPTURE(GenerateMipmapOES, context, target);
         }
     }
 }
@@ -8614,6 +10143,7 @@ void GL_APIENTRY GetActiveAttribContextANGLE(GLeglContext ctx,
                                              GLenum *type,
                                              GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveAttrib);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = "
@@ -8621,6 +10151,8 @@ void GL_APIENTRY GetActiveAttribContextANGLE(GLeglContext ctx,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveAttrib, program, index, bufSize, length, size, type,
+                       name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8630,6 +10162,8 @@ void GL_APIENTRY GetActiveAttribContextANGLE(GLeglContext ctx,
             ValidateGetActiveAttrib(context, program, index, bufSize, length, size, type, name))
         {
             context->getActiveAttrib(program, index, bufSize, length, size, type, name);
+            ANGLE_CAPTURE(GetActiveAttrib, context, program, index, bufSize, length, size, type,
+                          name);
         }
     }
 }
@@ -8643,6 +10177,7 @@ void GL_APIENTRY GetActiveUniformContextANGLE(GLeglContext ctx,
                                               GLenum *type,
                                               GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniform);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = "
@@ -8650,6 +10185,8 @@ void GL_APIENTRY GetActiveUniformContextANGLE(GLeglContext ctx,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniform, program, index, bufSize, length, size, type,
+                       name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8659,6 +10196,8 @@ void GL_APIENTRY GetActiveUniformContextANGLE(GLeglContext ctx,
             ValidateGetActiveUniform(context, program, index, bufSize, length, size, type, name))
         {
             context->getActiveUniform(program, index, bufSize, length, size, type, name);
+            ANGLE_CAPTURE(GetActiveUniform, context, program, index, bufSize, length, size, type,
+                          name);
         }
     }
 }
@@ -8670,11 +10209,14 @@ void GL_APIENTRY GetActiveUniformBlockNameContextANGLE(GLeglContext ctx,
                                                        GLsizei *length,
                                                        GLchar *uniformBlockName)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockName);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLsizei bufSize = %d, GLsizei "
         "*length = 0x%016" PRIxPTR ", GLchar *uniformBlockName = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, bufSize, (uintptr_t)length, (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockName, program, uniformBlockIndex, bufSize,
+                       length, uniformBlockName);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8686,6 +10228,8 @@ void GL_APIENTRY GetActiveUniformBlockNameContextANGLE(GLeglContext ctx,
         {
             context->getActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
                                                uniformBlockName);
+            ANGLE_CAPTURE(GetActiveUniformBlockName, context, program, uniformBlockIndex, bufSize,
+                          length, uniformBlockName);
         }
     }
 }
@@ -8696,11 +10240,14 @@ void GL_APIENTRY GetActiveUniformBlockivContextANGLE(GLeglContext ctx,
                                                      GLenum pname,
                                                      GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockiv, program, uniformBlockIndex, pname,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8710,6 +10257,8 @@ void GL_APIENTRY GetActiveUniformBlockivContextANGLE(GLeglContext ctx,
             ValidateGetActiveUniformBlockiv(context, program, uniformBlockIndex, pname, params))
         {
             context->getActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
+            ANGLE_CAPTURE(GetActiveUniformBlockiv, context, program, uniformBlockIndex, pname,
+                          params);
         }
     }
 }
@@ -8721,11 +10270,14 @@ void GL_APIENTRY GetActiveUniformsivContextANGLE(GLeglContext ctx,
                                                  GLenum pname,
                                                  GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformsiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLuint *uniformIndices = "
         "0x%016" PRIxPTR ", GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformIndices, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformsiv, program, uniformCount, uniformIndices,
+                       pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8735,6 +10287,8 @@ void GL_APIENTRY GetActiveUniformsivContextANGLE(GLeglContext ctx,
                                                                      uniformIndices, pname, params))
         {
             context->getActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
+            ANGLE_CAPTURE(GetActiveUniformsiv, context, program, uniformCount, uniformIndices,
+                          pname, params);
         }
     }
 }
@@ -8745,10 +10299,12 @@ void GL_APIENTRY GetAttachedShadersContextANGLE(GLeglContext ctx,
                                                 GLsizei *count,
                                                 GLuint *shaders)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetAttachedShaders);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei maxCount = %d, GLsizei *count = 0x%016" PRIxPTR
           ", GLuint *shaders = 0x%016" PRIxPTR ")",
           program, maxCount, (uintptr_t)count, (uintptr_t)shaders);
+    ANGLE_BINARY_TRACE(EntryPoint::GetAttachedShaders, program, maxCount, count, shaders);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8758,6 +10314,7 @@ void GL_APIENTRY GetAttachedShadersContextANGLE(GLeglContext ctx,
             ValidateGetAttachedShaders(context, program, maxCount, count, shaders))
         {
             context->getAttachedShaders(program, maxCount, count, shaders);
+            ANGLE_CAPTURE(GetAttachedShaders, context, program, maxCount, count, shaders);
         }
     }
 }
@@ -8766,9 +10323,11 @@ GLint GL_APIENTRY GetAttribLocationContextANGLE(GLeglContext ctx,
                                                 GLuint program,
                                                 const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetAttribLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetAttribLocation, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8776,7 +10335,9 @@ GLint GL_APIENTRY GetAttribLocationContextANGLE(GLeglContext ctx,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetAttribLocation(context, program, name))
         {
-            return context->getAttribLocation(program, name);
+            GLint returnValue = context->getAttribLocation(program, name);
+            ANGLE_CAPTURE(GetAttribLocation, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -8788,9 +10349,11 @@ void GL_APIENTRY GetBooleani_vContextANGLE(GLeglContext ctx,
                                            GLuint index,
                                            GLboolean *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleani_v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLboolean *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleani_v, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8799,14 +10362,17 @@ void GL_APIENTRY GetBooleani_vContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetBooleani_v(context, target, index, data))
         {
             context->getBooleani_v(target, index, data);
+            ANGLE_CAPTURE(GetBooleani_v, context, target, index, data);
         }
     }
 }
 
 void GL_APIENTRY GetBooleanvContextANGLE(GLeglContext ctx, GLenum pname, GLboolean *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleanv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLboolean *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleanv, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8815,6 +10381,7 @@ void GL_APIENTRY GetBooleanvContextANGLE(GLeglContext ctx, GLenum pname, GLboole
         if (context->skipValidation() || ValidateGetBooleanv(context, pname, data))
         {
             context->getBooleanv(pname, data);
+            ANGLE_CAPTURE(GetBooleanv, context, pname, data);
         }
     }
 }
@@ -8824,9 +10391,11 @@ void GL_APIENTRY GetBufferParameteri64vContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteri64v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteri64v, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8837,6 +10406,7 @@ void GL_APIENTRY GetBufferParameteri64vContextANGLE(GLeglContext ctx,
             ValidateGetBufferParameteri64v(context, targetPacked, pname, params))
         {
             context->getBufferParameteri64v(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferParameteri64v, context, target, pname, params);
         }
     }
 }
@@ -8846,9 +10416,11 @@ void GL_APIENTRY GetBufferParameterivContextANGLE(GLeglContext ctx,
                                                   GLenum pname,
                                                   GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8859,6 +10431,7 @@ void GL_APIENTRY GetBufferParameterivContextANGLE(GLeglContext ctx,
             ValidateGetBufferParameteriv(context, targetPacked, pname, params))
         {
             context->getBufferParameteriv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferParameteriv, context, target, pname, params);
         }
     }
 }
@@ -8868,9 +10441,11 @@ void GL_APIENTRY GetBufferPointervContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointerv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8881,6 +10456,7 @@ void GL_APIENTRY GetBufferPointervContextANGLE(GLeglContext ctx,
             ValidateGetBufferPointerv(context, targetPacked, pname, params))
         {
             context->getBufferPointerv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferPointerv, context, target, pname, params);
         }
     }
 }
@@ -8890,9 +10466,11 @@ void GL_APIENTRY GetBufferPointervOESContextANGLE(GLeglContext ctx,
                                                   GLenum pname,
                                                   void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointervOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointervOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8903,15 +10481,18 @@ void GL_APIENTRY GetBufferPointervOESContextANGLE(GLeglContext ctx,
             ValidateGetBufferPointervOES(context, targetPacked, pname, params))
         {
             context->getBufferPointerv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetBufferPointervOES, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetClipPlanefContextANGLE(GLeglContext ctx, GLenum plane, GLfloat *equation)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetClipPlanef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfloat *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_TRACE(EntryPoint::GetClipPlanef, plane, equation);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8920,15 +10501,18 @@ void GL_APIENTRY GetClipPlanefContextANGLE(GLeglContext ctx, GLenum plane, GLflo
         if (context->skipValidation() || ValidateGetClipPlanef(context, plane, equation))
         {
             context->getClipPlanef(plane, equation);
+            ANGLE_CAPTURE(GetClipPlanef, context, plane, equation);
         }
     }
 }
 
 void GL_APIENTRY GetClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, GLfixed *equation)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetClipPlanex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum plane = 0x%X, GLfixed *equation = 0x%016" PRIxPTR ")", plane,
           (uintptr_t)equation);
+    ANGLE_BINARY_TRACE(EntryPoint::GetClipPlanex, plane, equation);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8937,6 +10521,7 @@ void GL_APIENTRY GetClipPlanexContextANGLE(GLeglContext ctx, GLenum plane, GLfix
         if (context->skipValidation() || ValidateGetClipPlanex(context, plane, equation))
         {
             context->getClipPlanex(plane, equation);
+            ANGLE_CAPTURE(GetClipPlanex, context, plane, equation);
         }
     }
 }
@@ -8951,6 +10536,7 @@ GLuint GL_APIENTRY GetDebugMessageLogKHRContextANGLE(GLeglContext ctx,
                                                      GLsizei *lengths,
                                                      GLchar *messageLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetDebugMessageLogKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint count = %u, GLsizei bufSize = %d, GLenum *sources = 0x%016" PRIxPTR
           ", GLenum *types = 0x%016" PRIxPTR ", GLuint *ids = 0x%016" PRIxPTR
@@ -8958,6 +10544,8 @@ GLuint GL_APIENTRY GetDebugMessageLogKHRContextANGLE(GLeglContext ctx,
           ", GLchar *messageLog = 0x%016" PRIxPTR ")",
           count, bufSize, (uintptr_t)sources, (uintptr_t)types, (uintptr_t)ids,
           (uintptr_t)severities, (uintptr_t)lengths, (uintptr_t)messageLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetDebugMessageLogKHR, count, bufSize, sources, types, ids,
+                       severities, lengths, messageLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8967,8 +10555,11 @@ GLuint GL_APIENTRY GetDebugMessageLogKHRContextANGLE(GLeglContext ctx,
             ValidateGetDebugMessageLogKHR(context, count, bufSize, sources, types, ids, severities,
                                           lengths, messageLog))
         {
-            return context->getDebugMessageLog(count, bufSize, sources, types, ids, severities,
-                                               lengths, messageLog);
+            GLuint returnValue = context->getDebugMessageLog(count, bufSize, sources, types, ids,
+                                                             severities, lengths, messageLog);
+            ANGLE_CAPTURE(GetDebugMessageLogKHR, context, count, bufSize, sources, types, ids,
+                          severities, lengths, messageLog, returnValue);
+            return returnValue;
         }
     }
 
@@ -8977,8 +10568,10 @@ GLuint GL_APIENTRY GetDebugMessageLogKHRContextANGLE(GLeglContext ctx,
 
 GLenum GL_APIENTRY GetErrorContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetError);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::GetError);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -8986,7 +10579,9 @@ GLenum GL_APIENTRY GetErrorContextANGLE(GLeglContext ctx)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetError(context))
         {
-            return context->getError();
+            GLenum returnValue = context->getError();
+            ANGLE_CAPTURE(GetError, context, returnValue);
+            return returnValue;
         }
     }
 
@@ -8998,9 +10593,11 @@ void GL_APIENTRY GetFenceivNVContextANGLE(GLeglContext ctx,
                                           GLenum pname,
                                           GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFenceivNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", fence,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFenceivNV, fence, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9009,14 +10606,17 @@ void GL_APIENTRY GetFenceivNVContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetFenceivNV(context, fence, pname, params))
         {
             context->getFenceivNV(fence, pname, params);
+            ANGLE_CAPTURE(GetFenceivNV, context, fence, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetFixedvContextANGLE(GLeglContext ctx, GLenum pname, GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFixedv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFixedv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9025,14 +10625,17 @@ void GL_APIENTRY GetFixedvContextANGLE(GLeglContext ctx, GLenum pname, GLfixed *
         if (context->skipValidation() || ValidateGetFixedv(context, pname, params))
         {
             context->getFixedv(pname, params);
+            ANGLE_CAPTURE(GetFixedv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetFloatvContextANGLE(GLeglContext ctx, GLenum pname, GLfloat *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFloatv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFloatv, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9041,6 +10644,7 @@ void GL_APIENTRY GetFloatvContextANGLE(GLeglContext ctx, GLenum pname, GLfloat *
         if (context->skipValidation() || ValidateGetFloatv(context, pname, data))
         {
             context->getFloatv(pname, data);
+            ANGLE_CAPTURE(GetFloatv, context, pname, data);
         }
     }
 }
@@ -9049,9 +10653,11 @@ GLint GL_APIENTRY GetFragDataIndexEXTContextANGLE(GLeglContext ctx,
                                                   GLuint program,
                                                   const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFragDataIndexEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFragDataIndexEXT, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9059,7 +10665,9 @@ GLint GL_APIENTRY GetFragDataIndexEXTContextANGLE(GLeglContext ctx,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetFragDataIndexEXT(context, program, name))
         {
-            return context->getFragDataIndex(program, name);
+            GLint returnValue = context->getFragDataIndex(program, name);
+            ANGLE_CAPTURE(GetFragDataIndexEXT, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -9070,9 +10678,11 @@ GLint GL_APIENTRY GetFragDataLocationContextANGLE(GLeglContext ctx,
                                                   GLuint program,
                                                   const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFragDataLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFragDataLocation, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9080,7 +10690,9 @@ GLint GL_APIENTRY GetFragDataLocationContextANGLE(GLeglContext ctx,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetFragDataLocation(context, program, name))
         {
-            return context->getFragDataLocation(program, name);
+            GLint returnValue = context->getFragDataLocation(program, name);
+            ANGLE_CAPTURE(GetFragDataLocation, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -9093,11 +10705,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivContextANGLE(GLeglContext ct
                                                                  GLenum pname,
                                                                  GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameteriv, target, attachment, pname,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9107,6 +10722,8 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivContextANGLE(GLeglContext ct
             ValidateGetFramebufferAttachmentParameteriv(context, target, attachment, pname, params))
         {
             context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+            ANGLE_CAPTURE(GetFramebufferAttachmentParameteriv, context, target, attachment, pname,
+                          params);
         }
     }
 }
@@ -9117,11 +10734,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivOESContextANGLE(GLeglContext
                                                                     GLenum pname,
                                                                     GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameterivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, attachment, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameterivOES, target, attachment,
+                       pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9131,6 +10751,8 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivOESContextANGLE(GLeglContext
                                              context, target, attachment, pname, params))
         {
             context->getFramebufferAttachmentParameteriv(target, attachment, pname, params);
+            ANGLE_CAPTURE(GetFramebufferAttachmentParameterivOES, context, target, attachment,
+                          pname, params);
         }
     }
 }
@@ -9140,9 +10762,11 @@ void GL_APIENTRY GetFramebufferParameterivContextANGLE(GLeglContext ctx,
                                                        GLenum pname,
                                                        GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9152,14 +10776,17 @@ void GL_APIENTRY GetFramebufferParameterivContextANGLE(GLeglContext ctx,
             ValidateGetFramebufferParameteriv(context, target, pname, params))
         {
             context->getFramebufferParameteriv(target, pname, params);
+            ANGLE_CAPTURE(GetFramebufferParameteriv, context, target, pname, params);
         }
     }
 }
 
 GLenum GL_APIENTRY GetGraphicsResetStatusEXTContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetGraphicsResetStatusEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::GetGraphicsResetStatusEXT);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9167,7 +10794,9 @@ GLenum GL_APIENTRY GetGraphicsResetStatusEXTContextANGLE(GLeglContext ctx)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetGraphicsResetStatusEXT(context))
         {
-            return context->getGraphicsResetStatus();
+            GLenum returnValue = context->getGraphicsResetStatus();
+            ANGLE_CAPTURE(GetGraphicsResetStatusEXT, context, returnValue);
+            return returnValue;
         }
     }
 
@@ -9179,9 +10808,11 @@ void GL_APIENTRY GetInteger64i_vContextANGLE(GLeglContext ctx,
                                              GLuint index,
                                              GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64i_v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint64 *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64i_v, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9190,14 +10821,17 @@ void GL_APIENTRY GetInteger64i_vContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetInteger64i_v(context, target, index, data))
         {
             context->getInteger64i_v(target, index, data);
+            ANGLE_CAPTURE(GetInteger64i_v, context, target, index, data);
         }
     }
 }
 
 void GL_APIENTRY GetInteger64vContextANGLE(GLeglContext ctx, GLenum pname, GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint64 *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64v, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9206,6 +10840,7 @@ void GL_APIENTRY GetInteger64vContextANGLE(GLeglContext ctx, GLenum pname, GLint
         if (context->skipValidation() || ValidateGetInteger64v(context, pname, data))
         {
             context->getInteger64v(pname, data);
+            ANGLE_CAPTURE(GetInteger64v, context, pname, data);
         }
     }
 }
@@ -9215,9 +10850,11 @@ void GL_APIENTRY GetIntegeri_vContextANGLE(GLeglContext ctx,
                                            GLuint index,
                                            GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegeri_v);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLint *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegeri_v, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9226,14 +10863,17 @@ void GL_APIENTRY GetIntegeri_vContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetIntegeri_v(context, target, index, data))
         {
             context->getIntegeri_v(target, index, data);
+            ANGLE_CAPTURE(GetIntegeri_v, context, target, index, data);
         }
     }
 }
 
 void GL_APIENTRY GetIntegervContextANGLE(GLeglContext ctx, GLenum pname, GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegerv, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9242,6 +10882,7 @@ void GL_APIENTRY GetIntegervContextANGLE(GLeglContext ctx, GLenum pname, GLint *
         if (context->skipValidation() || ValidateGetIntegerv(context, pname, data))
         {
             context->getIntegerv(pname, data);
+            ANGLE_CAPTURE(GetIntegerv, context, pname, data);
         }
     }
 }
@@ -9253,11 +10894,14 @@ void GL_APIENTRY GetInternalformativContextANGLE(GLeglContext ctx,
                                                  GLsizei bufSize,
                                                  GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInternalformativ);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLint *params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInternalformativ, target, internalformat, pname, bufSize,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9267,6 +10911,8 @@ void GL_APIENTRY GetInternalformativContextANGLE(GLeglContext ctx,
             ValidateGetInternalformativ(context, target, internalformat, pname, bufSize, params))
         {
             context->getInternalformativ(target, internalformat, pname, bufSize, params);
+            ANGLE_CAPTURE(GetInternalformativ, context, target, internalformat, pname, bufSize,
+                          params);
         }
     }
 }
@@ -9276,9 +10922,11 @@ void GL_APIENTRY GetLightfvContextANGLE(GLeglContext ctx,
                                         GLenum pname,
                                         GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetLightfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetLightfv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9288,6 +10936,7 @@ void GL_APIENTRY GetLightfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetLightfv(context, light, pnamePacked, params))
         {
             context->getLightfv(light, pnamePacked, params);
+            ANGLE_CAPTURE(GetLightfv, context, light, pname, params);
         }
     }
 }
@@ -9297,9 +10946,11 @@ void GL_APIENTRY GetLightxvContextANGLE(GLeglContext ctx,
                                         GLenum pname,
                                         GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetLightxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", light,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetLightxv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9309,6 +10960,7 @@ void GL_APIENTRY GetLightxvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetLightxv(context, light, pnamePacked, params))
         {
             context->getLightxv(light, pnamePacked, params);
+            ANGLE_CAPTURE(GetLightxv, context, light, pname, params);
         }
     }
 }
@@ -9318,9 +10970,11 @@ void GL_APIENTRY GetMaterialfvContextANGLE(GLeglContext ctx,
                                            GLenum pname,
                                            GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMaterialfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMaterialfv, face, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9330,6 +10984,7 @@ void GL_APIENTRY GetMaterialfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetMaterialfv(context, face, pnamePacked, params))
         {
             context->getMaterialfv(face, pnamePacked, params);
+            ANGLE_CAPTURE(GetMaterialfv, context, face, pname, params);
         }
     }
 }
@@ -9339,9 +10994,11 @@ void GL_APIENTRY GetMaterialxvContextANGLE(GLeglContext ctx,
                                            GLenum pname,
                                            GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMaterialxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", face,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMaterialxv, face, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9351,6 +11008,7 @@ void GL_APIENTRY GetMaterialxvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetMaterialxv(context, face, pnamePacked, params))
         {
             context->getMaterialxv(face, pnamePacked, params);
+            ANGLE_CAPTURE(GetMaterialxv, context, face, pname, params);
         }
     }
 }
@@ -9360,9 +11018,11 @@ void GL_APIENTRY GetMemoryObjectParameterivEXTContextANGLE(GLeglContext ctx,
                                                            GLenum pname,
                                                            GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMemoryObjectParameterivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMemoryObjectParameterivEXT, memoryObject, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9372,6 +11032,7 @@ void GL_APIENTRY GetMemoryObjectParameterivEXTContextANGLE(GLeglContext ctx,
             ValidateGetMemoryObjectParameterivEXT(context, memoryObject, pname, params))
         {
             context->getMemoryObjectParameteriv(memoryObject, pname, params);
+            ANGLE_CAPTURE(GetMemoryObjectParameterivEXT, context, memoryObject, pname, params);
         }
     }
 }
@@ -9381,9 +11042,11 @@ void GL_APIENTRY GetMultisamplefvContextANGLE(GLeglContext ctx,
                                               GLuint index,
                                               GLfloat *val)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat *val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefv, pname, index, val);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9392,6 +11055,7 @@ void GL_APIENTRY GetMultisamplefvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetMultisamplefv(context, pname, index, val))
         {
             context->getMultisamplefv(pname, index, val);
+            ANGLE_CAPTURE(GetMultisamplefv, context, pname, index, val);
         }
     }
 }
@@ -9403,11 +11067,13 @@ void GL_APIENTRY GetObjectLabelKHRContextANGLE(GLeglContext ctx,
                                                GLsizei *length,
                                                GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetObjectLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei bufSize = %d, GLsizei *length = "
         "0x%016" PRIxPTR ", GLchar *label = 0x%016" PRIxPTR ")",
         identifier, name, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::GetObjectLabelKHR, identifier, name, bufSize, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9417,6 +11083,7 @@ void GL_APIENTRY GetObjectLabelKHRContextANGLE(GLeglContext ctx,
             ValidateGetObjectLabelKHR(context, identifier, name, bufSize, length, label))
         {
             context->getObjectLabel(identifier, name, bufSize, length, label);
+            ANGLE_CAPTURE(GetObjectLabelKHR, context, identifier, name, bufSize, length, label);
         }
     }
 }
@@ -9427,11 +11094,13 @@ void GL_APIENTRY GetObjectPtrLabelKHRContextANGLE(GLeglContext ctx,
                                                   GLsizei *length,
                                                   GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetObjectPtrLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const void *ptr = 0x%016" PRIxPTR
           ", GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, bufSize, (uintptr_t)length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::GetObjectPtrLabelKHR, ptr, bufSize, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9441,14 +11110,17 @@ void GL_APIENTRY GetObjectPtrLabelKHRContextANGLE(GLeglContext ctx,
             ValidateGetObjectPtrLabelKHR(context, ptr, bufSize, length, label))
         {
             context->getObjectPtrLabel(ptr, bufSize, length, label);
+            ANGLE_CAPTURE(GetObjectPtrLabelKHR, context, ptr, bufSize, length, label);
         }
     }
 }
 
 void GL_APIENTRY GetPointervContextANGLE(GLeglContext ctx, GLenum pname, void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPointerv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9457,14 +11129,17 @@ void GL_APIENTRY GetPointervContextANGLE(GLeglContext ctx, GLenum pname, void **
         if (context->skipValidation() || ValidateGetPointerv(context, pname, params))
         {
             context->getPointerv(pname, params);
+            ANGLE_CAPTURE(GetPointerv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY GetPointervKHRContextANGLE(GLeglContext ctx, GLenum pname, void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointervKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, void **params = 0x%016" PRIxPTR ")", pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPointervKHR, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9473,6 +11148,7 @@ void GL_APIENTRY GetPointervKHRContextANGLE(GLeglContext ctx, GLenum pname, void
         if (context->skipValidation() || ValidateGetPointervKHR(context, pname, params))
         {
             context->getPointerv(pname, params);
+            ANGLE_CAPTURE(GetPointervKHR, context, pname, params);
         }
     }
 }
@@ -9484,10 +11160,13 @@ void GL_APIENTRY GetProgramBinaryContextANGLE(GLeglContext ctx,
                                               GLenum *binaryFormat,
                                               void *binary)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramBinary);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramBinary, program, bufSize, length, binaryFormat,
+                       binary);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9497,6 +11176,8 @@ void GL_APIENTRY GetProgramBinaryContextANGLE(GLeglContext ctx,
             ValidateGetProgramBinary(context, program, bufSize, length, binaryFormat, binary))
         {
             context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+            ANGLE_CAPTURE(GetProgramBinary, context, program, bufSize, length, binaryFormat,
+                          binary);
         }
     }
 }
@@ -9508,10 +11189,13 @@ void GL_APIENTRY GetProgramBinaryOESContextANGLE(GLeglContext ctx,
                                                  GLenum *binaryFormat,
                                                  void *binary)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramBinaryOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLenum *binaryFormat = 0x%016" PRIxPTR ", void *binary = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)binaryFormat, (uintptr_t)binary);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramBinaryOES, program, bufSize, length, binaryFormat,
+                       binary);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9521,6 +11205,8 @@ void GL_APIENTRY GetProgramBinaryOESContextANGLE(GLeglContext ctx,
             ValidateGetProgramBinaryOES(context, program, bufSize, length, binaryFormat, binary))
         {
             context->getProgramBinary(program, bufSize, length, binaryFormat, binary);
+            ANGLE_CAPTURE(GetProgramBinaryOES, context, program, bufSize, length, binaryFormat,
+                          binary);
         }
     }
 }
@@ -9531,10 +11217,12 @@ void GL_APIENTRY GetProgramInfoLogContextANGLE(GLeglContext ctx,
                                                GLsizei *length,
                                                GLchar *infoLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInfoLog);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           program, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramInfoLog, program, bufSize, length, infoLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9544,6 +11232,7 @@ void GL_APIENTRY GetProgramInfoLogContextANGLE(GLeglContext ctx,
             ValidateGetProgramInfoLog(context, program, bufSize, length, infoLog))
         {
             context->getProgramInfoLog(program, bufSize, length, infoLog);
+            ANGLE_CAPTURE(GetProgramInfoLog, context, program, bufSize, length, infoLog);
         }
     }
 }
@@ -9554,11 +11243,13 @@ void GL_APIENTRY GetProgramInterfaceivContextANGLE(GLeglContext ctx,
                                                    GLenum pname,
                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInterfaceiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLint *params "
         "= 0x%016" PRIxPTR ")",
         program, programInterface, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramInterfaceiv, program, programInterface, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9568,6 +11259,7 @@ void GL_APIENTRY GetProgramInterfaceivContextANGLE(GLeglContext ctx,
             ValidateGetProgramInterfaceiv(context, program, programInterface, pname, params))
         {
             context->getProgramInterfaceiv(program, programInterface, pname, params);
+            ANGLE_CAPTURE(GetProgramInterfaceiv, context, program, programInterface, pname, params);
         }
     }
 }
@@ -9578,10 +11270,12 @@ void GL_APIENTRY GetProgramPipelineInfoLogContextANGLE(GLeglContext ctx,
                                                        GLsizei *length,
                                                        GLchar *infoLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramPipelineInfoLog);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           pipeline, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramPipelineInfoLog, pipeline, bufSize, length, infoLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9591,6 +11285,7 @@ void GL_APIENTRY GetProgramPipelineInfoLogContextANGLE(GLeglContext ctx,
             ValidateGetProgramPipelineInfoLog(context, pipeline, bufSize, length, infoLog))
         {
             context->getProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
+            ANGLE_CAPTURE(GetProgramPipelineInfoLog, context, pipeline, bufSize, length, infoLog);
         }
     }
 }
@@ -9600,9 +11295,11 @@ void GL_APIENTRY GetProgramPipelineivContextANGLE(GLeglContext ctx,
                                                   GLenum pname,
                                                   GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramPipelineiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")",
           pipeline, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramPipelineiv, pipeline, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9612,6 +11309,7 @@ void GL_APIENTRY GetProgramPipelineivContextANGLE(GLeglContext ctx,
             ValidateGetProgramPipelineiv(context, pipeline, pname, params))
         {
             context->getProgramPipelineiv(pipeline, pname, params);
+            ANGLE_CAPTURE(GetProgramPipelineiv, context, pipeline, pname, params);
         }
     }
 }
@@ -9621,11 +11319,13 @@ GLuint GL_APIENTRY GetProgramResourceIndexContextANGLE(GLeglContext ctx,
                                                        GLenum programInterface,
                                                        const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceIndex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceIndex, program, programInterface, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9634,7 +11334,10 @@ GLuint GL_APIENTRY GetProgramResourceIndexContextANGLE(GLeglContext ctx,
         if (context->skipValidation() ||
             ValidateGetProgramResourceIndex(context, program, programInterface, name))
         {
-            return context->getProgramResourceIndex(program, programInterface, name);
+            GLuint returnValue = context->getProgramResourceIndex(program, programInterface, name);
+            ANGLE_CAPTURE(GetProgramResourceIndex, context, program, programInterface, name,
+                          returnValue);
+            return returnValue;
         }
     }
 
@@ -9646,11 +11349,13 @@ GLint GL_APIENTRY GetProgramResourceLocationContextANGLE(GLeglContext ctx,
                                                          GLenum programInterface,
                                                          const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceLocation, program, programInterface, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9659,7 +11364,11 @@ GLint GL_APIENTRY GetProgramResourceLocationContextANGLE(GLeglContext ctx,
         if (context->skipValidation() ||
             ValidateGetProgramResourceLocation(context, program, programInterface, name))
         {
-            return context->getProgramResourceLocation(program, programInterface, name);
+            GLint returnValue =
+                context->getProgramResourceLocation(program, programInterface, name);
+            ANGLE_CAPTURE(GetProgramResourceLocation, context, program, programInterface, name,
+                          returnValue);
+            return returnValue;
         }
     }
 
@@ -9671,11 +11380,14 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXTContextANGLE(GLeglContext ct
                                                                  GLenum programInterface,
                                                                  const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceLocationIndexEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, const GLchar *name = 0x%016" PRIxPTR
         ")",
         program, programInterface, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceLocationIndexEXT, program, programInterface,
+                       name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9684,7 +11396,11 @@ GLint GL_APIENTRY GetProgramResourceLocationIndexEXTContextANGLE(GLeglContext ct
         if (context->skipValidation() ||
             ValidateGetProgramResourceLocationIndexEXT(context, program, programInterface, name))
         {
-            return context->getProgramResourceLocationIndex(program, programInterface, name);
+            GLint returnValue =
+                context->getProgramResourceLocationIndex(program, programInterface, name);
+            ANGLE_CAPTURE(GetProgramResourceLocationIndexEXT, context, program, programInterface,
+                          name, returnValue);
+            return returnValue;
         }
     }
 
@@ -9699,11 +11415,14 @@ void GL_APIENTRY GetProgramResourceNameContextANGLE(GLeglContext ctx,
                                                     GLsizei *length,
                                                     GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceName);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLuint index = %u, GLsizei bufSize "
         "= %d, GLsizei *length = 0x%016" PRIxPTR ", GLchar *name = 0x%016" PRIxPTR ")",
         program, programInterface, index, bufSize, (uintptr_t)length, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceName, program, programInterface, index,
+                       bufSize, length, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9715,6 +11434,8 @@ void GL_APIENTRY GetProgramResourceNameContextANGLE(GLeglContext ctx,
         {
             context->getProgramResourceName(program, programInterface, index, bufSize, length,
                                             name);
+            ANGLE_CAPTURE(GetProgramResourceName, context, program, programInterface, index,
+                          bufSize, length, name);
         }
     }
 }
@@ -9729,6 +11450,7 @@ void GL_APIENTRY GetProgramResourceivContextANGLE(GLeglContext ctx,
                                                   GLsizei *length,
                                                   GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramResourceiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLuint index = %u, GLsizei "
@@ -9737,6 +11459,8 @@ void GL_APIENTRY GetProgramResourceivContextANGLE(GLeglContext ctx,
         ", GLint *params = 0x%016" PRIxPTR ")",
         program, programInterface, index, propCount, (uintptr_t)props, bufSize, (uintptr_t)length,
         (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramResourceiv, program, programInterface, index,
+                       propCount, props, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9748,6 +11472,8 @@ void GL_APIENTRY GetProgramResourceivContextANGLE(GLeglContext ctx,
         {
             context->getProgramResourceiv(program, programInterface, index, propCount, props,
                                           bufSize, length, params);
+            ANGLE_CAPTURE(GetProgramResourceiv, context, program, programInterface, index,
+                          propCount, props, bufSize, length, params);
         }
     }
 }
@@ -9757,9 +11483,11 @@ void GL_APIENTRY GetProgramivContextANGLE(GLeglContext ctx,
                                           GLenum pname,
                                           GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", program,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramiv, program, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9768,6 +11496,7 @@ void GL_APIENTRY GetProgramivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetProgramiv(context, program, pname, params))
         {
             context->getProgramiv(program, pname, params);
+            ANGLE_CAPTURE(GetProgramiv, context, program, pname, params);
         }
     }
 }
@@ -9777,9 +11506,11 @@ void GL_APIENTRY GetQueryObjecti64vEXTContextANGLE(GLeglContext ctx,
                                                    GLenum pname,
                                                    GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjecti64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjecti64vEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9788,6 +11519,7 @@ void GL_APIENTRY GetQueryObjecti64vEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetQueryObjecti64vEXT(context, id, pname, params))
         {
             context->getQueryObjecti64v(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjecti64vEXT, context, id, pname, params);
         }
     }
 }
@@ -9797,9 +11529,11 @@ void GL_APIENTRY GetQueryObjectivEXTContextANGLE(GLeglContext ctx,
                                                  GLenum pname,
                                                  GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectivEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9808,6 +11542,7 @@ void GL_APIENTRY GetQueryObjectivEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetQueryObjectivEXT(context, id, pname, params))
         {
             context->getQueryObjectiv(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectivEXT, context, id, pname, params);
         }
     }
 }
@@ -9817,9 +11552,11 @@ void GL_APIENTRY GetQueryObjectui64vEXTContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectui64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectui64vEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9828,6 +11565,7 @@ void GL_APIENTRY GetQueryObjectui64vEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetQueryObjectui64vEXT(context, id, pname, params))
         {
             context->getQueryObjectui64v(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectui64vEXT, context, id, pname, params);
         }
     }
 }
@@ -9837,9 +11575,11 @@ void GL_APIENTRY GetQueryObjectuivContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuiv, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9848,6 +11588,7 @@ void GL_APIENTRY GetQueryObjectuivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetQueryObjectuiv(context, id, pname, params))
         {
             context->getQueryObjectuiv(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectuiv, context, id, pname, params);
         }
     }
 }
@@ -9857,9 +11598,11 @@ void GL_APIENTRY GetQueryObjectuivEXTContextANGLE(GLeglContext ctx,
                                                   GLenum pname,
                                                   GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", id, pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuivEXT, id, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9868,6 +11611,7 @@ void GL_APIENTRY GetQueryObjectuivEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetQueryObjectuivEXT(context, id, pname, params))
         {
             context->getQueryObjectuiv(id, pname, params);
+            ANGLE_CAPTURE(GetQueryObjectuivEXT, context, id, pname, params);
         }
     }
 }
@@ -9877,9 +11621,11 @@ void GL_APIENTRY GetQueryivContextANGLE(GLeglContext ctx,
                                         GLenum pname,
                                         GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryiv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9889,6 +11635,7 @@ void GL_APIENTRY GetQueryivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetQueryiv(context, targetPacked, pname, params))
         {
             context->getQueryiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetQueryiv, context, target, pname, params);
         }
     }
 }
@@ -9898,9 +11645,11 @@ void GL_APIENTRY GetQueryivEXTContextANGLE(GLeglContext ctx,
                                            GLenum pname,
                                            GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryivEXT, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9911,6 +11660,7 @@ void GL_APIENTRY GetQueryivEXTContextANGLE(GLeglContext ctx,
             ValidateGetQueryivEXT(context, targetPacked, pname, params))
         {
             context->getQueryiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetQueryivEXT, context, target, pname, params);
         }
     }
 }
@@ -9920,9 +11670,11 @@ void GL_APIENTRY GetRenderbufferParameterivContextANGLE(GLeglContext ctx,
                                                         GLenum pname,
                                                         GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9932,6 +11684,7 @@ void GL_APIENTRY GetRenderbufferParameterivContextANGLE(GLeglContext ctx,
             ValidateGetRenderbufferParameteriv(context, target, pname, params))
         {
             context->getRenderbufferParameteriv(target, pname, params);
+            ANGLE_CAPTURE(GetRenderbufferParameteriv, context, target, pname, params);
         }
     }
 }
@@ -9941,9 +11694,11 @@ void GL_APIENTRY GetRenderbufferParameterivOESContextANGLE(GLeglContext ctx,
                                                            GLenum pname,
                                                            GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameterivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameterivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9953,6 +11708,7 @@ void GL_APIENTRY GetRenderbufferParameterivOESContextANGLE(GLeglContext ctx,
             ValidateGetRenderbufferParameterivOES(context, target, pname, params))
         {
             context->getRenderbufferParameteriv(target, pname, params);
+            ANGLE_CAPTURE(GetRenderbufferParameterivOES, context, target, pname, params);
         }
     }
 }
@@ -9962,9 +11718,11 @@ void GL_APIENTRY GetSamplerParameterIivOESContextANGLE(GLeglContext ctx,
                                                        GLenum pname,
                                                        GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIivOES, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9974,6 +11732,7 @@ void GL_APIENTRY GetSamplerParameterIivOESContextANGLE(GLeglContext ctx,
             ValidateGetSamplerParameterIivOES(context, sampler, pname, params))
         {
             context->getSamplerParameterIiv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameterIivOES, context, sampler, pname, params);
         }
     }
 }
@@ -9983,9 +11742,11 @@ void GL_APIENTRY GetSamplerParameterIuivOESContextANGLE(GLeglContext ctx,
                                                         GLenum pname,
                                                         GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIuivOES, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -9995,6 +11756,7 @@ void GL_APIENTRY GetSamplerParameterIuivOESContextANGLE(GLeglContext ctx,
             ValidateGetSamplerParameterIuivOES(context, sampler, pname, params))
         {
             context->getSamplerParameterIuiv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameterIuivOES, context, sampler, pname, params);
         }
     }
 }
@@ -10004,9 +11766,11 @@ void GL_APIENTRY GetSamplerParameterfvContextANGLE(GLeglContext ctx,
                                                    GLenum pname,
                                                    GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterfv, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10016,6 +11780,7 @@ void GL_APIENTRY GetSamplerParameterfvContextANGLE(GLeglContext ctx,
             ValidateGetSamplerParameterfv(context, sampler, pname, params))
         {
             context->getSamplerParameterfv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameterfv, context, sampler, pname, params);
         }
     }
 }
@@ -10025,9 +11790,11 @@ void GL_APIENTRY GetSamplerParameterivContextANGLE(GLeglContext ctx,
                                                    GLenum pname,
                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", sampler,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameteriv, sampler, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10037,6 +11804,7 @@ void GL_APIENTRY GetSamplerParameterivContextANGLE(GLeglContext ctx,
             ValidateGetSamplerParameteriv(context, sampler, pname, params))
         {
             context->getSamplerParameteriv(sampler, pname, params);
+            ANGLE_CAPTURE(GetSamplerParameteriv, context, sampler, pname, params);
         }
     }
 }
@@ -10046,9 +11814,11 @@ void GL_APIENTRY GetSemaphoreParameterui64vEXTContextANGLE(GLeglContext ctx,
                                                            GLenum pname,
                                                            GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSemaphoreParameterui64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, GLuint64 *params = 0x%016" PRIxPTR ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSemaphoreParameterui64vEXT, semaphore, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10058,6 +11828,7 @@ void GL_APIENTRY GetSemaphoreParameterui64vEXTContextANGLE(GLeglContext ctx,
             ValidateGetSemaphoreParameterui64vEXT(context, semaphore, pname, params))
         {
             context->getSemaphoreParameterui64v(semaphore, pname, params);
+            ANGLE_CAPTURE(GetSemaphoreParameterui64vEXT, context, semaphore, pname, params);
         }
     }
 }
@@ -10068,10 +11839,12 @@ void GL_APIENTRY GetShaderInfoLogContextANGLE(GLeglContext ctx,
                                               GLsizei *length,
                                               GLchar *infoLog)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderInfoLog);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *infoLog = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)infoLog);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderInfoLog, shader, bufSize, length, infoLog);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10081,6 +11854,7 @@ void GL_APIENTRY GetShaderInfoLogContextANGLE(GLeglContext ctx,
             ValidateGetShaderInfoLog(context, shader, bufSize, length, infoLog))
         {
             context->getShaderInfoLog(shader, bufSize, length, infoLog);
+            ANGLE_CAPTURE(GetShaderInfoLog, context, shader, bufSize, length, infoLog);
         }
     }
 }
@@ -10091,10 +11865,13 @@ void GL_APIENTRY GetShaderPrecisionFormatContextANGLE(GLeglContext ctx,
                                                       GLint *range,
                                                       GLint *precision)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderPrecisionFormat);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum shadertype = 0x%X, GLenum precisiontype = 0x%X, GLint *range = 0x%016" PRIxPTR
           ", GLint *precision = 0x%016" PRIxPTR ")",
           shadertype, precisiontype, (uintptr_t)range, (uintptr_t)precision);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderPrecisionFormat, shadertype, precisiontype, range,
+                       precision);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10104,6 +11881,8 @@ void GL_APIENTRY GetShaderPrecisionFormatContextANGLE(GLeglContext ctx,
             ValidateGetShaderPrecisionFormat(context, shadertype, precisiontype, range, precision))
         {
             context->getShaderPrecisionFormat(shadertype, precisiontype, range, precision);
+            ANGLE_CAPTURE(GetShaderPrecisionFormat, context, shadertype, precisiontype, range,
+                          precision);
         }
     }
 }
@@ -10114,10 +11893,12 @@ void GL_APIENTRY GetShaderSourceContextANGLE(GLeglContext ctx,
                                              GLsizei *length,
                                              GLchar *source)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderSource);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufSize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderSource, shader, bufSize, length, source);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10127,6 +11908,7 @@ void GL_APIENTRY GetShaderSourceContextANGLE(GLeglContext ctx,
             ValidateGetShaderSource(context, shader, bufSize, length, source))
         {
             context->getShaderSource(shader, bufSize, length, source);
+            ANGLE_CAPTURE(GetShaderSource, context, shader, bufSize, length, source);
         }
     }
 }
@@ -10136,9 +11918,11 @@ void GL_APIENTRY GetShaderivContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", shader,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderiv, shader, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10147,14 +11931,17 @@ void GL_APIENTRY GetShaderivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetShaderiv(context, shader, pname, params))
         {
             context->getShaderiv(shader, pname, params);
+            ANGLE_CAPTURE(GetShaderiv, context, shader, pname, params);
         }
     }
 }
 
 const GLubyte *GL_APIENTRY GetStringContextANGLE(GLeglContext ctx, GLenum name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetString);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X)", name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetString, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10162,7 +11949,9 @@ const GLubyte *GL_APIENTRY GetStringContextANGLE(GLeglContext ctx, GLenum name)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetString(context, name))
         {
-            return context->getString(name);
+            const GLubyte *returnValue = context->getString(name);
+            ANGLE_CAPTURE(GetString, context, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -10171,8 +11960,10 @@ const GLubyte *GL_APIENTRY GetStringContextANGLE(GLeglContext ctx, GLenum name)
 
 const GLubyte *GL_APIENTRY GetStringiContextANGLE(GLeglContext ctx, GLenum name, GLuint index)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetStringi);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum name = 0x%X, GLuint index = %u)", name, index);
+    ANGLE_BINARY_TRACE(EntryPoint::GetStringi, name, index);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10180,7 +11971,9 @@ const GLubyte *GL_APIENTRY GetStringiContextANGLE(GLeglContext ctx, GLenum name,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetStringi(context, name, index))
         {
-            return context->getStringi(name, index);
+            const GLubyte *returnValue = context->getStringi(name, index);
+            ANGLE_CAPTURE(GetStringi, context, name, index, returnValue);
+            return returnValue;
         }
     }
 
@@ -10194,11 +11987,13 @@ void GL_APIENTRY GetSyncivContextANGLE(GLeglContext ctx,
                                        GLsizei *length,
                                        GLint *values)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSynciv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR
           ", GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLint *values = 0x%016" PRIxPTR ")",
           (uintptr_t)sync, pname, bufSize, (uintptr_t)length, (uintptr_t)values);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSynciv, sync, pname, bufSize, length, values);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10208,6 +12003,7 @@ void GL_APIENTRY GetSyncivContextANGLE(GLeglContext ctx,
             ValidateGetSynciv(context, sync, pname, bufSize, length, values))
         {
             context->getSynciv(sync, pname, bufSize, length, values);
+            ANGLE_CAPTURE(GetSynciv, context, sync, pname, bufSize, length, values);
         }
     }
 }
@@ -10217,9 +12013,11 @@ void GL_APIENTRY GetTexEnvfvContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnvfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexEnvfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10231,6 +12029,7 @@ void GL_APIENTRY GetTexEnvfvContextANGLE(GLeglContext ctx,
             ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params))
         {
             context->getTexEnvfv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(GetTexEnvfv, context, target, pname, params);
         }
     }
 }
@@ -10240,9 +12039,11 @@ void GL_APIENTRY GetTexEnvivContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnviv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexEnviv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10254,6 +12055,7 @@ void GL_APIENTRY GetTexEnvivContextANGLE(GLeglContext ctx,
             ValidateGetTexEnviv(context, targetPacked, pnamePacked, params))
         {
             context->getTexEnviv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(GetTexEnviv, context, target, pname, params);
         }
     }
 }
@@ -10263,9 +12065,11 @@ void GL_APIENTRY GetTexEnvxvContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexEnvxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexEnvxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10277,6 +12081,7 @@ void GL_APIENTRY GetTexEnvxvContextANGLE(GLeglContext ctx,
             ValidateGetTexEnvxv(context, targetPacked, pnamePacked, params))
         {
             context->getTexEnvxv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(GetTexEnvxv, context, target, pname, params);
         }
     }
 }
@@ -10286,9 +12091,11 @@ void GL_APIENTRY GetTexGenfvOESContextANGLE(GLeglContext ctx,
                                             GLenum pname,
                                             GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenfvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexGenfvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10297,6 +12104,7 @@ void GL_APIENTRY GetTexGenfvOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetTexGenfvOES(context, coord, pname, params))
         {
             context->getTexGenfv(coord, pname, params);
+            ANGLE_CAPTURE(GetTexGenfvOES, context, coord, pname, params);
         }
     }
 }
@@ -10306,9 +12114,11 @@ void GL_APIENTRY GetTexGenivOESContextANGLE(GLeglContext ctx,
                                             GLenum pname,
                                             GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexGenivOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10317,6 +12127,7 @@ void GL_APIENTRY GetTexGenivOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetTexGenivOES(context, coord, pname, params))
         {
             context->getTexGeniv(coord, pname, params);
+            ANGLE_CAPTURE(GetTexGenivOES, context, coord, pname, params);
         }
     }
 }
@@ -10326,9 +12137,11 @@ void GL_APIENTRY GetTexGenxvOESContextANGLE(GLeglContext ctx,
                                             GLenum pname,
                                             GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexGenxvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")", coord,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexGenxvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10337,6 +12150,7 @@ void GL_APIENTRY GetTexGenxvOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetTexGenxvOES(context, coord, pname, params))
         {
             context->getTexGenxv(coord, pname, params);
+            ANGLE_CAPTURE(GetTexGenxvOES, context, coord, pname, params);
         }
     }
 }
@@ -10347,11 +12161,13 @@ void GL_APIENTRY GetTexLevelParameterfvContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfv, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10362,6 +12178,7 @@ void GL_APIENTRY GetTexLevelParameterfvContextANGLE(GLeglContext ctx,
             ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameterfv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameterfv, context, target, level, pname, params);
         }
     }
 }
@@ -10372,11 +12189,13 @@ void GL_APIENTRY GetTexLevelParameterivContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint *params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameteriv, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10387,6 +12206,7 @@ void GL_APIENTRY GetTexLevelParameterivContextANGLE(GLeglContext ctx,
             ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameteriv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameteriv, context, target, level, pname, params);
         }
     }
 }
@@ -10396,9 +12216,11 @@ void GL_APIENTRY GetTexParameterIivOESContextANGLE(GLeglContext ctx,
                                                    GLenum pname,
                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10409,6 +12231,7 @@ void GL_APIENTRY GetTexParameterIivOESContextANGLE(GLeglContext ctx,
             ValidateGetTexParameterIivOES(context, targetPacked, pname, params))
         {
             context->getTexParameterIiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterIivOES, context, target, pname, params);
         }
     }
 }
@@ -10418,9 +12241,11 @@ void GL_APIENTRY GetTexParameterIuivOESContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIuivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10431,6 +12256,7 @@ void GL_APIENTRY GetTexParameterIuivOESContextANGLE(GLeglContext ctx,
             ValidateGetTexParameterIuivOES(context, targetPacked, pname, params))
         {
             context->getTexParameterIuiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterIuivOES, context, target, pname, params);
         }
     }
 }
@@ -10440,9 +12266,11 @@ void GL_APIENTRY GetTexParameterfvContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10453,6 +12281,7 @@ void GL_APIENTRY GetTexParameterfvContextANGLE(GLeglContext ctx,
             ValidateGetTexParameterfv(context, targetPacked, pname, params))
         {
             context->getTexParameterfv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterfv, context, target, pname, params);
         }
     }
 }
@@ -10462,9 +12291,11 @@ void GL_APIENTRY GetTexParameterivContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", target,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10475,6 +12306,7 @@ void GL_APIENTRY GetTexParameterivContextANGLE(GLeglContext ctx,
             ValidateGetTexParameteriv(context, targetPacked, pname, params))
         {
             context->getTexParameteriv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameteriv, context, target, pname, params);
         }
     }
 }
@@ -10484,9 +12316,11 @@ void GL_APIENTRY GetTexParameterxvContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10497,6 +12331,7 @@ void GL_APIENTRY GetTexParameterxvContextANGLE(GLeglContext ctx,
             ValidateGetTexParameterxv(context, targetPacked, pname, params))
         {
             context->getTexParameterxv(targetPacked, pname, params);
+            ANGLE_CAPTURE(GetTexParameterxv, context, target, pname, params);
         }
     }
 }
@@ -10510,6 +12345,7 @@ void GL_APIENTRY GetTransformFeedbackVaryingContextANGLE(GLeglContext ctx,
                                                          GLenum *type,
                                                          GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTransformFeedbackVarying);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint index = %u, GLsizei bufSize = %d, GLsizei *length = "
@@ -10517,6 +12353,8 @@ void GL_APIENTRY GetTransformFeedbackVaryingContextANGLE(GLeglContext ctx,
         ", GLchar *name = 0x%016" PRIxPTR ")",
         program, index, bufSize, (uintptr_t)length, (uintptr_t)size, (uintptr_t)type,
         (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTransformFeedbackVarying, program, index, bufSize, length,
+                       size, type, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10527,6 +12365,8 @@ void GL_APIENTRY GetTransformFeedbackVaryingContextANGLE(GLeglContext ctx,
                                                 type, name))
         {
             context->getTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
+            ANGLE_CAPTURE(GetTransformFeedbackVarying, context, program, index, bufSize, length,
+                          size, type, name);
         }
     }
 }
@@ -10537,10 +12377,12 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLEContextANGLE(GLeglContext ctx,
                                                             GLsizei *length,
                                                             GLchar *source)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTranslatedShaderSourceANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei bufsize = %d, GLsizei *length = 0x%016" PRIxPTR
           ", GLchar *source = 0x%016" PRIxPTR ")",
           shader, bufsize, (uintptr_t)length, (uintptr_t)source);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTranslatedShaderSourceANGLE, shader, bufsize, length, source);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10550,6 +12392,7 @@ void GL_APIENTRY GetTranslatedShaderSourceANGLEContextANGLE(GLeglContext ctx,
             ValidateGetTranslatedShaderSourceANGLE(context, shader, bufsize, length, source))
         {
             context->getTranslatedShaderSource(shader, bufsize, length, source);
+            ANGLE_CAPTURE(GetTranslatedShaderSourceANGLE, context, shader, bufsize, length, source);
         }
     }
 }
@@ -10558,9 +12401,11 @@ GLuint GL_APIENTRY GetUniformBlockIndexContextANGLE(GLeglContext ctx,
                                                     GLuint program,
                                                     const GLchar *uniformBlockName)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformBlockIndex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *uniformBlockName = 0x%016" PRIxPTR ")", program,
           (uintptr_t)uniformBlockName);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformBlockIndex, program, uniformBlockName);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10569,7 +12414,9 @@ GLuint GL_APIENTRY GetUniformBlockIndexContextANGLE(GLeglContext ctx,
         if (context->skipValidation() ||
             ValidateGetUniformBlockIndex(context, program, uniformBlockName))
         {
-            return context->getUniformBlockIndex(program, uniformBlockName);
+            GLuint returnValue = context->getUniformBlockIndex(program, uniformBlockName);
+            ANGLE_CAPTURE(GetUniformBlockIndex, context, program, uniformBlockName, returnValue);
+            return returnValue;
         }
     }
 
@@ -10582,11 +12429,14 @@ void GL_APIENTRY GetUniformIndicesContextANGLE(GLeglContext ctx,
                                                const GLchar *const *uniformNames,
                                                GLuint *uniformIndices)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformIndices);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLsizei uniformCount = %d, const GLchar *const*uniformNames = "
         "0x%016" PRIxPTR ", GLuint *uniformIndices = 0x%016" PRIxPTR ")",
         program, uniformCount, (uintptr_t)uniformNames, (uintptr_t)uniformIndices);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformIndices, program, uniformCount, uniformNames,
+                       uniformIndices);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10596,6 +12446,8 @@ void GL_APIENTRY GetUniformIndicesContextANGLE(GLeglContext ctx,
             ValidateGetUniformIndices(context, program, uniformCount, uniformNames, uniformIndices))
         {
             context->getUniformIndices(program, uniformCount, uniformNames, uniformIndices);
+            ANGLE_CAPTURE(GetUniformIndices, context, program, uniformCount, uniformNames,
+                          uniformIndices);
         }
     }
 }
@@ -10604,9 +12456,11 @@ GLint GL_APIENTRY GetUniformLocationContextANGLE(GLeglContext ctx,
                                                  GLuint program,
                                                  const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformLocation);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, const GLchar *name = 0x%016" PRIxPTR ")", program,
           (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformLocation, program, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10614,7 +12468,9 @@ GLint GL_APIENTRY GetUniformLocationContextANGLE(GLeglContext ctx,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGetUniformLocation(context, program, name))
         {
-            return context->getUniformLocation(program, name);
+            GLint returnValue = context->getUniformLocation(program, name);
+            ANGLE_CAPTURE(GetUniformLocation, context, program, name, returnValue);
+            return returnValue;
         }
     }
 
@@ -10626,9 +12482,11 @@ void GL_APIENTRY GetUniformfvContextANGLE(GLeglContext ctx,
                                           GLint location,
                                           GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat *params = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformfv, program, location, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10637,6 +12495,7 @@ void GL_APIENTRY GetUniformfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetUniformfv(context, program, location, params))
         {
             context->getUniformfv(program, location, params);
+            ANGLE_CAPTURE(GetUniformfv, context, program, location, params);
         }
     }
 }
@@ -10646,9 +12505,11 @@ void GL_APIENTRY GetUniformivContextANGLE(GLeglContext ctx,
                                           GLint location,
                                           GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformiv, program, location, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10657,6 +12518,7 @@ void GL_APIENTRY GetUniformivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetUniformiv(context, program, location, params))
         {
             context->getUniformiv(program, location, params);
+            ANGLE_CAPTURE(GetUniformiv, context, program, location, params);
         }
     }
 }
@@ -10666,9 +12528,11 @@ void GL_APIENTRY GetUniformuivContextANGLE(GLeglContext ctx,
                                            GLint location,
                                            GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint *params = 0x%016" PRIxPTR ")", program,
           location, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformuiv, program, location, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10677,14 +12541,17 @@ void GL_APIENTRY GetUniformuivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetUniformuiv(context, program, location, params))
         {
             context->getUniformuiv(program, location, params);
+            ANGLE_CAPTURE(GetUniformuiv, context, program, location, params);
         }
     }
 }
 
 void GL_APIENTRY GetUnsignedBytevEXTContextANGLE(GLeglContext ctx, GLenum pname, GLubyte *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUnsignedBytevEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLubyte *data = 0x%016" PRIxPTR ")", pname, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUnsignedBytevEXT, pname, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10693,6 +12560,7 @@ void GL_APIENTRY GetUnsignedBytevEXTContextANGLE(GLeglContext ctx, GLenum pname,
         if (context->skipValidation() || ValidateGetUnsignedBytevEXT(context, pname, data))
         {
             context->getUnsignedBytev(pname, data);
+            ANGLE_CAPTURE(GetUnsignedBytevEXT, context, pname, data);
         }
     }
 }
@@ -10702,9 +12570,11 @@ void GL_APIENTRY GetUnsignedBytei_vEXTContextANGLE(GLeglContext ctx,
                                                    GLuint index,
                                                    GLubyte *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUnsignedBytei_vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLuint index = %u, GLubyte *data = 0x%016" PRIxPTR ")", target,
           index, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUnsignedBytei_vEXT, target, index, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10714,6 +12584,7 @@ void GL_APIENTRY GetUnsignedBytei_vEXTContextANGLE(GLeglContext ctx,
             ValidateGetUnsignedBytei_vEXT(context, target, index, data))
         {
             context->getUnsignedBytei_v(target, index, data);
+            ANGLE_CAPTURE(GetUnsignedBytei_vEXT, context, target, index, data);
         }
     }
 }
@@ -10723,9 +12594,11 @@ void GL_APIENTRY GetVertexAttribIivContextANGLE(GLeglContext ctx,
                                                 GLenum pname,
                                                 GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIiv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10734,6 +12607,7 @@ void GL_APIENTRY GetVertexAttribIivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetVertexAttribIiv(context, index, pname, params))
         {
             context->getVertexAttribIiv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribIiv, context, index, pname, params);
         }
     }
 }
@@ -10743,9 +12617,11 @@ void GL_APIENTRY GetVertexAttribIuivContextANGLE(GLeglContext ctx,
                                                  GLenum pname,
                                                  GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIuiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLuint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIuiv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10754,6 +12630,7 @@ void GL_APIENTRY GetVertexAttribIuivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetVertexAttribIuiv(context, index, pname, params))
         {
             context->getVertexAttribIuiv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribIuiv, context, index, pname, params);
         }
     }
 }
@@ -10763,9 +12640,11 @@ void GL_APIENTRY GetVertexAttribPointervContextANGLE(GLeglContext ctx,
                                                      GLenum pname,
                                                      void **pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribPointerv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, void **pointer = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribPointerv, index, pname, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10775,6 +12654,7 @@ void GL_APIENTRY GetVertexAttribPointervContextANGLE(GLeglContext ctx,
             ValidateGetVertexAttribPointerv(context, index, pname, pointer))
         {
             context->getVertexAttribPointerv(index, pname, pointer);
+            ANGLE_CAPTURE(GetVertexAttribPointerv, context, index, pname, pointer);
         }
     }
 }
@@ -10784,9 +12664,11 @@ void GL_APIENTRY GetVertexAttribfvContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLfloat *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribfv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10795,6 +12677,7 @@ void GL_APIENTRY GetVertexAttribfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetVertexAttribfv(context, index, pname, params))
         {
             context->getVertexAttribfv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribfv, context, index, pname, params);
         }
     }
 }
@@ -10804,9 +12687,11 @@ void GL_APIENTRY GetVertexAttribivContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLenum pname = 0x%X, GLint *params = 0x%016" PRIxPTR ")", index,
           pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribiv, index, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10815,6 +12700,7 @@ void GL_APIENTRY GetVertexAttribivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetVertexAttribiv(context, index, pname, params))
         {
             context->getVertexAttribiv(index, pname, params);
+            ANGLE_CAPTURE(GetVertexAttribiv, context, index, pname, params);
         }
     }
 }
@@ -10825,11 +12711,13 @@ void GL_APIENTRY GetnUniformfvEXTContextANGLE(GLeglContext ctx,
                                               GLsizei bufSize,
                                               GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformfvEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLfloat *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformfvEXT, program, location, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10839,6 +12727,7 @@ void GL_APIENTRY GetnUniformfvEXTContextANGLE(GLeglContext ctx,
             ValidateGetnUniformfvEXT(context, program, location, bufSize, params))
         {
             context->getnUniformfv(program, location, bufSize, params);
+            ANGLE_CAPTURE(GetnUniformfvEXT, context, program, location, bufSize, params);
         }
     }
 }
@@ -10849,11 +12738,13 @@ void GL_APIENTRY GetnUniformivEXTContextANGLE(GLeglContext ctx,
                                               GLsizei bufSize,
                                               GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLint *params = "
         "0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformivEXT, program, location, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10863,14 +12754,17 @@ void GL_APIENTRY GetnUniformivEXTContextANGLE(GLeglContext ctx,
             ValidateGetnUniformivEXT(context, program, location, bufSize, params))
         {
             context->getnUniformiv(program, location, bufSize, params);
+            ANGLE_CAPTURE(GetnUniformivEXT, context, program, location, bufSize, params);
         }
     }
 }
 
 void GL_APIENTRY HintContextANGLE(GLeglContext ctx, GLenum target, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Hint);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum mode = 0x%X)", target, mode);
+    ANGLE_BINARY_TRACE(EntryPoint::Hint, target, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10879,6 +12773,7 @@ void GL_APIENTRY HintContextANGLE(GLeglContext ctx, GLenum target, GLenum mode)
         if (context->skipValidation() || ValidateHint(context, target, mode))
         {
             context->hint(target, mode);
+            ANGLE_CAPTURE(Hint, context, target, mode);
         }
     }
 }
@@ -10889,9 +12784,11 @@ void GL_APIENTRY ImportMemoryFdEXTContextANGLE(GLeglContext ctx,
                                                GLenum handleType,
                                                GLint fd)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ImportMemoryFdEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memory = %u, GLuint64 size = %llu, GLenum handleType = 0x%X, GLint fd = %d)",
           memory, static_cast<unsigned long long>(size), handleType, fd);
+    ANGLE_BINARY_TRACE(EntryPoint::ImportMemoryFdEXT, memory, size, handleType, fd);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10902,6 +12799,7 @@ void GL_APIENTRY ImportMemoryFdEXTContextANGLE(GLeglContext ctx,
             ValidateImportMemoryFdEXT(context, memory, size, handleTypePacked, fd))
         {
             context->importMemoryFd(memory, size, handleTypePacked, fd);
+            ANGLE_CAPTURE(ImportMemoryFdEXT, context, memory, size, handleType, fd);
         }
     }
 }
@@ -10911,9 +12809,11 @@ void GL_APIENTRY ImportSemaphoreFdEXTContextANGLE(GLeglContext ctx,
                                                   GLenum handleType,
                                                   GLint fd)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ImportSemaphoreFdEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum handleType = 0x%X, GLint fd = %d)", semaphore, handleType,
           fd);
+    ANGLE_BINARY_TRACE(EntryPoint::ImportSemaphoreFdEXT, semaphore, handleType, fd);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10924,6 +12824,7 @@ void GL_APIENTRY ImportSemaphoreFdEXTContextANGLE(GLeglContext ctx,
             ValidateImportSemaphoreFdEXT(context, semaphore, handleTypePacked, fd))
         {
             context->importSemaphoreFd(semaphore, handleTypePacked, fd);
+            ANGLE_CAPTURE(ImportSemaphoreFdEXT, context, semaphore, handleType, fd);
         }
     }
 }
@@ -10932,11 +12833,13 @@ void GL_APIENTRY InsertEventMarkerEXTContextANGLE(GLeglContext ctx,
                                                   GLsizei length,
                                                   const GLchar *marker)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InsertEventMarkerEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_TRACE(EntryPoint::InsertEventMarkerEXT, length, marker);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10945,6 +12848,7 @@ void GL_APIENTRY InsertEventMarkerEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateInsertEventMarkerEXT(context, length, marker))
         {
             context->insertEventMarker(length, marker);
+            ANGLE_CAPTURE(InsertEventMarkerEXT, context, length, marker);
         }
     }
 }
@@ -10954,11 +12858,13 @@ void GL_APIENTRY InvalidateFramebufferContextANGLE(GLeglContext ctx,
                                                    GLsizei numAttachments,
                                                    const GLenum *attachments)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InvalidateFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ")",
         target, numAttachments, (uintptr_t)attachments);
+    ANGLE_BINARY_TRACE(EntryPoint::InvalidateFramebuffer, target, numAttachments, attachments);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10968,6 +12874,7 @@ void GL_APIENTRY InvalidateFramebufferContextANGLE(GLeglContext ctx,
             ValidateInvalidateFramebuffer(context, target, numAttachments, attachments))
         {
             context->invalidateFramebuffer(target, numAttachments, attachments);
+            ANGLE_CAPTURE(InvalidateFramebuffer, context, target, numAttachments, attachments);
         }
     }
 }
@@ -10981,11 +12888,14 @@ void GL_APIENTRY InvalidateSubFramebufferContextANGLE(GLeglContext ctx,
                                                       GLsizei width,
                                                       GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::InvalidateSubFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei numAttachments = %d, const GLenum *attachments = "
         "0x%016" PRIxPTR ", GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)",
         target, numAttachments, (uintptr_t)attachments, x, y, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::InvalidateSubFramebuffer, target, numAttachments, attachments, x,
+                       y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -10997,14 +12907,18 @@ void GL_APIENTRY InvalidateSubFramebufferContextANGLE(GLeglContext ctx,
         {
             context->invalidateSubFramebuffer(target, numAttachments, attachments, x, y, width,
                                               height);
+            ANGLE_CAPTURE(InvalidateSubFramebuffer, context, target, numAttachments, attachments, x,
+                          y, width, height);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsBufferContextANGLE(GLeglContext ctx, GLuint buffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint buffer = %u)", buffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsBuffer, buffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11012,7 +12926,9 @@ GLboolean GL_APIENTRY IsBufferContextANGLE(GLeglContext ctx, GLuint buffer)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsBuffer(context, buffer))
         {
-            return context->isBuffer(buffer);
+            GLboolean returnValue = context->isBuffer(buffer);
+            ANGLE_CAPTURE(IsBuffer, context, buffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -11021,8 +12937,10 @@ GLboolean GL_APIENTRY IsBufferContextANGLE(GLeglContext ctx, GLuint buffer)
 
 GLboolean GL_APIENTRY IsEnabledContextANGLE(GLeglContext ctx, GLenum cap)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsEnabled);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum cap = 0x%X)", cap);
+    ANGLE_BINARY_TRACE(EntryPoint::IsEnabled, cap);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11030,7 +12948,9 @@ GLboolean GL_APIENTRY IsEnabledContextANGLE(GLeglContext ctx, GLenum cap)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsEnabled(context, cap))
         {
-            return context->isEnabled(cap);
+            GLboolean returnValue = context->isEnabled(cap);
+            ANGLE_CAPTURE(IsEnabled, context, cap, returnValue);
+            return returnValue;
         }
     }
 
@@ -11039,8 +12959,10 @@ GLboolean GL_APIENTRY IsEnabledContextANGLE(GLeglContext ctx, GLenum cap)
 
 GLboolean GL_APIENTRY IsFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_TRACE(EntryPoint::IsFenceNV, fence);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11048,7 +12970,9 @@ GLboolean GL_APIENTRY IsFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsFenceNV(context, fence))
         {
-            return context->isFenceNV(fence);
+            GLboolean returnValue = context->isFenceNV(fence);
+            ANGLE_CAPTURE(IsFenceNV, context, fence, returnValue);
+            return returnValue;
         }
     }
 
@@ -11057,8 +12981,10 @@ GLboolean GL_APIENTRY IsFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 
 GLboolean GL_APIENTRY IsFramebufferContextANGLE(GLeglContext ctx, GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsFramebuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsFramebuffer, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11066,7 +12992,9 @@ GLboolean GL_APIENTRY IsFramebufferContextANGLE(GLeglContext ctx, GLuint framebu
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsFramebuffer(context, framebuffer))
         {
-            return context->isFramebuffer(framebuffer);
+            GLboolean returnValue = context->isFramebuffer(framebuffer);
+            ANGLE_CAPTURE(IsFramebuffer, context, framebuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -11075,8 +13003,10 @@ GLboolean GL_APIENTRY IsFramebufferContextANGLE(GLeglContext ctx, GLuint framebu
 
 GLboolean GL_APIENTRY IsFramebufferOESContextANGLE(GLeglContext ctx, GLuint framebuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsFramebufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint framebuffer = %u)", framebuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsFramebufferOES, framebuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11084,7 +13014,9 @@ GLboolean GL_APIENTRY IsFramebufferOESContextANGLE(GLeglContext ctx, GLuint fram
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsFramebufferOES(context, framebuffer))
         {
-            return context->isFramebuffer(framebuffer);
+            GLboolean returnValue = context->isFramebuffer(framebuffer);
+            ANGLE_CAPTURE(IsFramebufferOES, context, framebuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -11093,8 +13025,10 @@ GLboolean GL_APIENTRY IsFramebufferOESContextANGLE(GLeglContext ctx, GLuint fram
 
 GLboolean GL_APIENTRY IsMemoryObjectEXTContextANGLE(GLeglContext ctx, GLuint memoryObject)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsMemoryObjectEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u)", memoryObject);
+    ANGLE_BINARY_TRACE(EntryPoint::IsMemoryObjectEXT, memoryObject);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11102,7 +13036,9 @@ GLboolean GL_APIENTRY IsMemoryObjectEXTContextANGLE(GLeglContext ctx, GLuint mem
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsMemoryObjectEXT(context, memoryObject))
         {
-            return context->isMemoryObject(memoryObject);
+            GLboolean returnValue = context->isMemoryObject(memoryObject);
+            ANGLE_CAPTURE(IsMemoryObjectEXT, context, memoryObject, returnValue);
+            return returnValue;
         }
     }
 
@@ -11111,8 +13047,10 @@ GLboolean GL_APIENTRY IsMemoryObjectEXTContextANGLE(GLeglContext ctx, GLuint mem
 
 GLboolean GL_APIENTRY IsProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::IsProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11120,7 +13058,9 @@ GLboolean GL_APIENTRY IsProgramContextANGLE(GLeglContext ctx, GLuint program)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsProgram(context, program))
         {
-            return context->isProgram(program);
+            GLboolean returnValue = context->isProgram(program);
+            ANGLE_CAPTURE(IsProgram, context, program, returnValue);
+            return returnValue;
         }
     }
 
@@ -11129,8 +13069,10 @@ GLboolean GL_APIENTRY IsProgramContextANGLE(GLeglContext ctx, GLuint program)
 
 GLboolean GL_APIENTRY IsProgramPipelineContextANGLE(GLeglContext ctx, GLuint pipeline)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsProgramPipeline);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_TRACE(EntryPoint::IsProgramPipeline, pipeline);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11138,7 +13080,9 @@ GLboolean GL_APIENTRY IsProgramPipelineContextANGLE(GLeglContext ctx, GLuint pip
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsProgramPipeline(context, pipeline))
         {
-            return context->isProgramPipeline(pipeline);
+            GLboolean returnValue = context->isProgramPipeline(pipeline);
+            ANGLE_CAPTURE(IsProgramPipeline, context, pipeline, returnValue);
+            return returnValue;
         }
     }
 
@@ -11147,8 +13091,10 @@ GLboolean GL_APIENTRY IsProgramPipelineContextANGLE(GLeglContext ctx, GLuint pip
 
 GLboolean GL_APIENTRY IsQueryContextANGLE(GLeglContext ctx, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsQuery);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_TRACE(EntryPoint::IsQuery, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11156,7 +13102,9 @@ GLboolean GL_APIENTRY IsQueryContextANGLE(GLeglContext ctx, GLuint id)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsQuery(context, id))
         {
-            return context->isQuery(id);
+            GLboolean returnValue = context->isQuery(id);
+            ANGLE_CAPTURE(IsQuery, context, id, returnValue);
+            return returnValue;
         }
     }
 
@@ -11165,8 +13113,10 @@ GLboolean GL_APIENTRY IsQueryContextANGLE(GLeglContext ctx, GLuint id)
 
 GLboolean GL_APIENTRY IsQueryEXTContextANGLE(GLeglContext ctx, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsQueryEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_TRACE(EntryPoint::IsQueryEXT, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11174,7 +13124,9 @@ GLboolean GL_APIENTRY IsQueryEXTContextANGLE(GLeglContext ctx, GLuint id)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsQueryEXT(context, id))
         {
-            return context->isQuery(id);
+            GLboolean returnValue = context->isQuery(id);
+            ANGLE_CAPTURE(IsQueryEXT, context, id, returnValue);
+            return returnValue;
         }
     }
 
@@ -11183,8 +13135,10 @@ GLboolean GL_APIENTRY IsQueryEXTContextANGLE(GLeglContext ctx, GLuint id)
 
 GLboolean GL_APIENTRY IsRenderbufferContextANGLE(GLeglContext ctx, GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsRenderbuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsRenderbuffer, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11192,7 +13146,9 @@ GLboolean GL_APIENTRY IsRenderbufferContextANGLE(GLeglContext ctx, GLuint render
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsRenderbuffer(context, renderbuffer))
         {
-            return context->isRenderbuffer(renderbuffer);
+            GLboolean returnValue = context->isRenderbuffer(renderbuffer);
+            ANGLE_CAPTURE(IsRenderbuffer, context, renderbuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -11201,8 +13157,10 @@ GLboolean GL_APIENTRY IsRenderbufferContextANGLE(GLeglContext ctx, GLuint render
 
 GLboolean GL_APIENTRY IsRenderbufferOESContextANGLE(GLeglContext ctx, GLuint renderbuffer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsRenderbufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint renderbuffer = %u)", renderbuffer);
+    ANGLE_BINARY_TRACE(EntryPoint::IsRenderbufferOES, renderbuffer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11210,7 +13168,9 @@ GLboolean GL_APIENTRY IsRenderbufferOESContextANGLE(GLeglContext ctx, GLuint ren
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsRenderbufferOES(context, renderbuffer))
         {
-            return context->isRenderbuffer(renderbuffer);
+            GLboolean returnValue = context->isRenderbuffer(renderbuffer);
+            ANGLE_CAPTURE(IsRenderbufferOES, context, renderbuffer, returnValue);
+            return returnValue;
         }
     }
 
@@ -11219,8 +13179,10 @@ GLboolean GL_APIENTRY IsRenderbufferOESContextANGLE(GLeglContext ctx, GLuint ren
 
 GLboolean GL_APIENTRY IsSemaphoreEXTContextANGLE(GLeglContext ctx, GLuint semaphore)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsSemaphoreEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u)", semaphore);
+    ANGLE_BINARY_TRACE(EntryPoint::IsSemaphoreEXT, semaphore);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11228,7 +13190,9 @@ GLboolean GL_APIENTRY IsSemaphoreEXTContextANGLE(GLeglContext ctx, GLuint semaph
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsSemaphoreEXT(context, semaphore))
         {
-            return context->isSemaphore(semaphore);
+            GLboolean returnValue = context->isSemaphore(semaphore);
+            ANGLE_CAPTURE(IsSemaphoreEXT, context, semaphore, returnValue);
+            return returnValue;
         }
     }
 
@@ -11237,8 +13201,10 @@ GLboolean GL_APIENTRY IsSemaphoreEXTContextANGLE(GLeglContext ctx, GLuint semaph
 
 GLboolean GL_APIENTRY IsSamplerContextANGLE(GLeglContext ctx, GLuint sampler)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsSampler);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u)", sampler);
+    ANGLE_BINARY_TRACE(EntryPoint::IsSampler, sampler);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11246,7 +13212,9 @@ GLboolean GL_APIENTRY IsSamplerContextANGLE(GLeglContext ctx, GLuint sampler)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsSampler(context, sampler))
         {
-            return context->isSampler(sampler);
+            GLboolean returnValue = context->isSampler(sampler);
+            ANGLE_CAPTURE(IsSampler, context, sampler, returnValue);
+            return returnValue;
         }
     }
 
@@ -11255,8 +13223,10 @@ GLboolean GL_APIENTRY IsSamplerContextANGLE(GLeglContext ctx, GLuint sampler)
 
 GLboolean GL_APIENTRY IsShaderContextANGLE(GLeglContext ctx, GLuint shader)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsShader);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u)", shader);
+    ANGLE_BINARY_TRACE(EntryPoint::IsShader, shader);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11264,7 +13234,9 @@ GLboolean GL_APIENTRY IsShaderContextANGLE(GLeglContext ctx, GLuint shader)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsShader(context, shader))
         {
-            return context->isShader(shader);
+            GLboolean returnValue = context->isShader(shader);
+            ANGLE_CAPTURE(IsShader, context, shader, returnValue);
+            return returnValue;
         }
     }
 
@@ -11273,8 +13245,10 @@ GLboolean GL_APIENTRY IsShaderContextANGLE(GLeglContext ctx, GLuint shader)
 
 GLboolean GL_APIENTRY IsSyncContextANGLE(GLeglContext ctx, GLsync sync)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ")", (uintptr_t)sync);
+    ANGLE_BINARY_TRACE(EntryPoint::IsSync, sync);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11282,7 +13256,9 @@ GLboolean GL_APIENTRY IsSyncContextANGLE(GLeglContext ctx, GLsync sync)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsSync(context, sync))
         {
-            return context->isSync(sync);
+            GLboolean returnValue = context->isSync(sync);
+            ANGLE_CAPTURE(IsSync, context, sync, returnValue);
+            return returnValue;
         }
     }
 
@@ -11291,8 +13267,10 @@ GLboolean GL_APIENTRY IsSyncContextANGLE(GLeglContext ctx, GLsync sync)
 
 GLboolean GL_APIENTRY IsTextureContextANGLE(GLeglContext ctx, GLuint texture)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsTexture);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint texture = %u)", texture);
+    ANGLE_BINARY_TRACE(EntryPoint::IsTexture, texture);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11300,7 +13278,9 @@ GLboolean GL_APIENTRY IsTextureContextANGLE(GLeglContext ctx, GLuint texture)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsTexture(context, texture))
         {
-            return context->isTexture(texture);
+            GLboolean returnValue = context->isTexture(texture);
+            ANGLE_CAPTURE(IsTexture, context, texture, returnValue);
+            return returnValue;
         }
     }
 
@@ -11309,8 +13289,10 @@ GLboolean GL_APIENTRY IsTextureContextANGLE(GLeglContext ctx, GLuint texture)
 
 GLboolean GL_APIENTRY IsTransformFeedbackContextANGLE(GLeglContext ctx, GLuint id)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u)", id);
+    ANGLE_BINARY_TRACE(EntryPoint::IsTransformFeedback, id);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11318,7 +13300,9 @@ GLboolean GL_APIENTRY IsTransformFeedbackContextANGLE(GLeglContext ctx, GLuint i
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsTransformFeedback(context, id))
         {
-            return context->isTransformFeedback(id);
+            GLboolean returnValue = context->isTransformFeedback(id);
+            ANGLE_CAPTURE(IsTransformFeedback, context, id, returnValue);
+            return returnValue;
         }
     }
 
@@ -11327,8 +13311,10 @@ GLboolean GL_APIENTRY IsTransformFeedbackContextANGLE(GLeglContext ctx, GLuint i
 
 GLboolean GL_APIENTRY IsVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsVertexArray);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::IsVertexArray, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11336,7 +13322,9 @@ GLboolean GL_APIENTRY IsVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsVertexArray(context, array))
         {
-            return context->isVertexArray(array);
+            GLboolean returnValue = context->isVertexArray(array);
+            ANGLE_CAPTURE(IsVertexArray, context, array, returnValue);
+            return returnValue;
         }
     }
 
@@ -11345,8 +13333,10 @@ GLboolean GL_APIENTRY IsVertexArrayContextANGLE(GLeglContext ctx, GLuint array)
 
 GLboolean GL_APIENTRY IsVertexArrayOESContextANGLE(GLeglContext ctx, GLuint array)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsVertexArrayOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint array = %u)", array);
+    ANGLE_BINARY_TRACE(EntryPoint::IsVertexArrayOES, array);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11354,7 +13344,9 @@ GLboolean GL_APIENTRY IsVertexArrayOESContextANGLE(GLeglContext ctx, GLuint arra
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsVertexArrayOES(context, array))
         {
-            return context->isVertexArray(array);
+            GLboolean returnValue = context->isVertexArray(array);
+            ANGLE_CAPTURE(IsVertexArrayOES, context, array, returnValue);
+            return returnValue;
         }
     }
 
@@ -11363,8 +13355,10 @@ GLboolean GL_APIENTRY IsVertexArrayOESContextANGLE(GLeglContext ctx, GLuint arra
 
 void GL_APIENTRY LightModelfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelf, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11373,15 +13367,18 @@ void GL_APIENTRY LightModelfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat
         if (context->skipValidation() || ValidateLightModelf(context, pname, param))
         {
             context->lightModelf(pname, param);
+            ANGLE_CAPTURE(LightModelf, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY LightModelfvContextANGLE(GLeglContext ctx, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelfv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11390,14 +13387,17 @@ void GL_APIENTRY LightModelfvContextANGLE(GLeglContext ctx, GLenum pname, const
         if (context->skipValidation() || ValidateLightModelfv(context, pname, params))
         {
             context->lightModelfv(pname, params);
+            ANGLE_CAPTURE(LightModelfv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY LightModelxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelx, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11406,15 +13406,18 @@ void GL_APIENTRY LightModelxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed
         if (context->skipValidation() || ValidateLightModelx(context, pname, param))
         {
             context->lightModelx(pname, param);
+            ANGLE_CAPTURE(LightModelx, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY LightModelxvContextANGLE(GLeglContext ctx, GLenum pname, const GLfixed *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LightModelxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::LightModelxv, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11423,14 +13426,17 @@ void GL_APIENTRY LightModelxvContextANGLE(GLeglContext ctx, GLenum pname, const
         if (context->skipValidation() || ValidateLightModelxv(context, pname, param))
         {
             context->lightModelxv(pname, param);
+            ANGLE_CAPTURE(LightModelxv, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY LightfContextANGLE(GLeglContext ctx, GLenum light, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", light, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightf, light, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11440,6 +13446,7 @@ void GL_APIENTRY LightfContextANGLE(GLeglContext ctx, GLenum light, GLenum pname
         if (context->skipValidation() || ValidateLightf(context, light, pnamePacked, param))
         {
             context->lightf(light, pnamePacked, param);
+            ANGLE_CAPTURE(Lightf, context, light, pname, param);
         }
     }
 }
@@ -11449,9 +13456,11 @@ void GL_APIENTRY LightfvContextANGLE(GLeglContext ctx,
                                      GLenum pname,
                                      const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightfv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11461,14 +13470,17 @@ void GL_APIENTRY LightfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateLightfv(context, light, pnamePacked, params))
         {
             context->lightfv(light, pnamePacked, params);
+            ANGLE_CAPTURE(Lightfv, context, light, pname, params);
         }
     }
 }
 
 void GL_APIENTRY LightxContextANGLE(GLeglContext ctx, GLenum light, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", light, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightx, light, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11478,6 +13490,7 @@ void GL_APIENTRY LightxContextANGLE(GLeglContext ctx, GLenum light, GLenum pname
         if (context->skipValidation() || ValidateLightx(context, light, pnamePacked, param))
         {
             context->lightx(light, pnamePacked, param);
+            ANGLE_CAPTURE(Lightx, context, light, pname, param);
         }
     }
 }
@@ -11487,9 +13500,11 @@ void GL_APIENTRY LightxvContextANGLE(GLeglContext ctx,
                                      GLenum pname,
                                      const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Lightxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum light = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           light, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Lightxv, light, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11499,14 +13514,17 @@ void GL_APIENTRY LightxvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateLightxv(context, light, pnamePacked, params))
         {
             context->lightxv(light, pnamePacked, params);
+            ANGLE_CAPTURE(Lightxv, context, light, pname, params);
         }
     }
 }
 
 void GL_APIENTRY LineWidthContextANGLE(GLeglContext ctx, GLfloat width)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LineWidth);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat width = %f)", width);
+    ANGLE_BINARY_TRACE(EntryPoint::LineWidth, width);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11515,14 +13533,17 @@ void GL_APIENTRY LineWidthContextANGLE(GLeglContext ctx, GLfloat width)
         if (context->skipValidation() || ValidateLineWidth(context, width))
         {
             context->lineWidth(width);
+            ANGLE_CAPTURE(LineWidth, context, width);
         }
     }
 }
 
 void GL_APIENTRY LineWidthxContextANGLE(GLeglContext ctx, GLfixed width)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LineWidthx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed width = 0x%X)", width);
+    ANGLE_BINARY_TRACE(EntryPoint::LineWidthx, width);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11531,14 +13552,17 @@ void GL_APIENTRY LineWidthxContextANGLE(GLeglContext ctx, GLfixed width)
         if (context->skipValidation() || ValidateLineWidthx(context, width))
         {
             context->lineWidthx(width);
+            ANGLE_CAPTURE(LineWidthx, context, width);
         }
     }
 }
 
 void GL_APIENTRY LinkProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LinkProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::LinkProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11547,14 +13571,17 @@ void GL_APIENTRY LinkProgramContextANGLE(GLeglContext ctx, GLuint program)
         if (context->skipValidation() || ValidateLinkProgram(context, program))
         {
             context->linkProgram(program);
+            ANGLE_CAPTURE(LinkProgram, context, program);
         }
     }
 }
 
 void GL_APIENTRY LoadIdentityContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadIdentity);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::LoadIdentity);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11563,14 +13590,17 @@ void GL_APIENTRY LoadIdentityContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateLoadIdentity(context))
         {
             context->loadIdentity();
+            ANGLE_CAPTURE(LoadIdentity, context);
         }
     }
 }
 
 void GL_APIENTRY LoadMatrixfContextANGLE(GLeglContext ctx, const GLfloat *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadMatrixf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::LoadMatrixf, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11579,14 +13609,17 @@ void GL_APIENTRY LoadMatrixfContextANGLE(GLeglContext ctx, const GLfloat *m)
         if (context->skipValidation() || ValidateLoadMatrixf(context, m))
         {
             context->loadMatrixf(m);
+            ANGLE_CAPTURE(LoadMatrixf, context, m);
         }
     }
 }
 
 void GL_APIENTRY LoadMatrixxContextANGLE(GLeglContext ctx, const GLfixed *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadMatrixx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::LoadMatrixx, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11595,14 +13628,17 @@ void GL_APIENTRY LoadMatrixxContextANGLE(GLeglContext ctx, const GLfixed *m)
         if (context->skipValidation() || ValidateLoadMatrixx(context, m))
         {
             context->loadMatrixx(m);
+            ANGLE_CAPTURE(LoadMatrixx, context, m);
         }
     }
 }
 
 void GL_APIENTRY LoadPaletteFromModelViewMatrixOESContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoadPaletteFromModelViewMatrixOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::LoadPaletteFromModelViewMatrixOES);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11611,14 +13647,17 @@ void GL_APIENTRY LoadPaletteFromModelViewMatrixOESContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateLoadPaletteFromModelViewMatrixOES(context))
         {
             context->loadPaletteFromModelViewMatrix();
+            ANGLE_CAPTURE(LoadPaletteFromModelViewMatrixOES, context);
         }
     }
 }
 
 void GL_APIENTRY LogicOpContextANGLE(GLeglContext ctx, GLenum opcode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LogicOp);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum opcode = 0x%X)", opcode);
+    ANGLE_BINARY_TRACE(EntryPoint::LogicOp, opcode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11628,14 +13667,17 @@ void GL_APIENTRY LogicOpContextANGLE(GLeglContext ctx, GLenum opcode)
         if (context->skipValidation() || ValidateLogicOp(context, opcodePacked))
         {
             context->logicOp(opcodePacked);
+            ANGLE_CAPTURE(LogicOp, context, opcode);
         }
     }
 }
 
 void *GL_APIENTRY MapBufferOESContextANGLE(GLeglContext ctx, GLenum target, GLenum access)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MapBufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum access = 0x%X)", target, access);
+    ANGLE_BINARY_TRACE(EntryPoint::MapBufferOES, target, access);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11644,7 +13686,9 @@ void *GL_APIENTRY MapBufferOESContextANGLE(GLeglContext ctx, GLenum target, GLen
         BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
         if (context->skipValidation() || ValidateMapBufferOES(context, targetPacked, access))
         {
-            return context->mapBuffer(targetPacked, access);
+            void *returnValue = context->mapBuffer(targetPacked, access);
+            ANGLE_CAPTURE(MapBufferOES, context, target, access, returnValue);
+            return returnValue;
         }
     }
 
@@ -11657,12 +13701,14 @@ void *GL_APIENTRY MapBufferRangeContextANGLE(GLeglContext ctx,
                                              GLsizeiptr length,
                                              GLbitfield access)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MapBufferRange);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu, GLbitfield "
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_TRACE(EntryPoint::MapBufferRange, target, offset, length, access);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11672,7 +13718,9 @@ void *GL_APIENTRY MapBufferRangeContextANGLE(GLeglContext ctx,
         if (context->skipValidation() ||
             ValidateMapBufferRange(context, targetPacked, offset, length, access))
         {
-            return context->mapBufferRange(targetPacked, offset, length, access);
+            void *returnValue = context->mapBufferRange(targetPacked, offset, length, access);
+            ANGLE_CAPTURE(MapBufferRange, context, target, offset, length, access, returnValue);
+            return returnValue;
         }
     }
 
@@ -11685,12 +13733,14 @@ void *GL_APIENTRY MapBufferRangeEXTContextANGLE(GLeglContext ctx,
                                                 GLsizeiptr length,
                                                 GLbitfield access)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MapBufferRangeEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLintptr offset = %llu, GLsizeiptr length = %llu, GLbitfield "
         "access = 0x%X)",
         target, static_cast<unsigned long long>(offset), static_cast<unsigned long long>(length),
         access);
+    ANGLE_BINARY_TRACE(EntryPoint::MapBufferRangeEXT, target, offset, length, access);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11700,7 +13750,9 @@ void *GL_APIENTRY MapBufferRangeEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() ||
             ValidateMapBufferRangeEXT(context, targetPacked, offset, length, access))
         {
-            return context->mapBufferRange(targetPacked, offset, length, access);
+            void *returnValue = context->mapBufferRange(targetPacked, offset, length, access);
+            ANGLE_CAPTURE(MapBufferRangeEXT, context, target, offset, length, access, returnValue);
+            return returnValue;
         }
     }
 
@@ -11709,8 +13761,10 @@ void *GL_APIENTRY MapBufferRangeEXTContextANGLE(GLeglContext ctx,
 
 void GL_APIENTRY MaterialfContextANGLE(GLeglContext ctx, GLenum face, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", face, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialf, face, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11720,6 +13774,7 @@ void GL_APIENTRY MaterialfContextANGLE(GLeglContext ctx, GLenum face, GLenum pna
         if (context->skipValidation() || ValidateMaterialf(context, face, pnamePacked, param))
         {
             context->materialf(face, pnamePacked, param);
+            ANGLE_CAPTURE(Materialf, context, face, pname, param);
         }
     }
 }
@@ -11729,9 +13784,11 @@ void GL_APIENTRY MaterialfvContextANGLE(GLeglContext ctx,
                                         GLenum pname,
                                         const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialfv, face, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11741,14 +13798,17 @@ void GL_APIENTRY MaterialfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateMaterialfv(context, face, pnamePacked, params))
         {
             context->materialfv(face, pnamePacked, params);
+            ANGLE_CAPTURE(Materialfv, context, face, pname, params);
         }
     }
 }
 
 void GL_APIENTRY MaterialxContextANGLE(GLeglContext ctx, GLenum face, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", face, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialx, face, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11758,6 +13818,7 @@ void GL_APIENTRY MaterialxContextANGLE(GLeglContext ctx, GLenum face, GLenum pna
         if (context->skipValidation() || ValidateMaterialx(context, face, pnamePacked, param))
         {
             context->materialx(face, pnamePacked, param);
+            ANGLE_CAPTURE(Materialx, context, face, pname, param);
         }
     }
 }
@@ -11767,9 +13828,11 @@ void GL_APIENTRY MaterialxvContextANGLE(GLeglContext ctx,
                                         GLenum pname,
                                         const GLfixed *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Materialxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum pname = 0x%X, const GLfixed *param = 0x%016" PRIxPTR ")",
           face, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::Materialxv, face, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11779,6 +13842,7 @@ void GL_APIENTRY MaterialxvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateMaterialxv(context, face, pnamePacked, param))
         {
             context->materialxv(face, pnamePacked, param);
+            ANGLE_CAPTURE(Materialxv, context, face, pname, param);
         }
     }
 }
@@ -11789,11 +13853,13 @@ void GL_APIENTRY MatrixIndexPointerOESContextANGLE(GLeglContext ctx,
                                                    GLsizei stride,
                                                    const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixIndexPointerOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixIndexPointerOES, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11803,14 +13869,17 @@ void GL_APIENTRY MatrixIndexPointerOESContextANGLE(GLeglContext ctx,
             ValidateMatrixIndexPointerOES(context, size, type, stride, pointer))
         {
             context->matrixIndexPointer(size, type, stride, pointer);
+            ANGLE_CAPTURE(MatrixIndexPointerOES, context, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY MatrixModeContextANGLE(GLeglContext ctx, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixMode);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixMode, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11820,14 +13889,17 @@ void GL_APIENTRY MatrixModeContextANGLE(GLeglContext ctx, GLenum mode)
         if (context->skipValidation() || ValidateMatrixMode(context, modePacked))
         {
             context->matrixMode(modePacked);
+            ANGLE_CAPTURE(MatrixMode, context, mode);
         }
     }
 }
 
 void GL_APIENTRY MaxShaderCompilerThreadsKHRContextANGLE(GLeglContext ctx, GLuint count)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MaxShaderCompilerThreadsKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint count = %u)", count);
+    ANGLE_BINARY_TRACE(EntryPoint::MaxShaderCompilerThreadsKHR, count);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11836,14 +13908,17 @@ void GL_APIENTRY MaxShaderCompilerThreadsKHRContextANGLE(GLeglContext ctx, GLuin
         if (context->skipValidation() || ValidateMaxShaderCompilerThreadsKHR(context, count))
         {
             context->maxShaderCompilerThreads(count);
+            ANGLE_CAPTURE(MaxShaderCompilerThreadsKHR, context, count);
         }
     }
 }
 
 void GL_APIENTRY MemoryBarrierContextANGLE(GLeglContext ctx, GLbitfield barriers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryBarrier);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_TRACE(EntryPoint::MemoryBarrier, barriers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11852,14 +13927,17 @@ void GL_APIENTRY MemoryBarrierContextANGLE(GLeglContext ctx, GLbitfield barriers
         if (context->skipValidation() || ValidateMemoryBarrier(context, barriers))
         {
             context->memoryBarrier(barriers);
+            ANGLE_CAPTURE(MemoryBarrier, context, barriers);
         }
     }
 }
 
 void GL_APIENTRY MemoryBarrierByRegionContextANGLE(GLeglContext ctx, GLbitfield barriers)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryBarrierByRegion);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLbitfield barriers = 0x%X)", barriers);
+    ANGLE_BINARY_TRACE(EntryPoint::MemoryBarrierByRegion, barriers);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11868,6 +13946,7 @@ void GL_APIENTRY MemoryBarrierByRegionContextANGLE(GLeglContext ctx, GLbitfield
         if (context->skipValidation() || ValidateMemoryBarrierByRegion(context, barriers))
         {
             context->memoryBarrierByRegion(barriers);
+            ANGLE_CAPTURE(MemoryBarrierByRegion, context, barriers);
         }
     }
 }
@@ -11877,10 +13956,12 @@ void GL_APIENTRY MemoryObjectParameterivEXTContextANGLE(GLeglContext ctx,
                                                         GLenum pname,
                                                         const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MemoryObjectParameterivEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint memoryObject = %u, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR
           ")",
           memoryObject, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::MemoryObjectParameterivEXT, memoryObject, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11890,14 +13971,17 @@ void GL_APIENTRY MemoryObjectParameterivEXTContextANGLE(GLeglContext ctx,
             ValidateMemoryObjectParameterivEXT(context, memoryObject, pname, params))
         {
             context->memoryObjectParameteriv(memoryObject, pname, params);
+            ANGLE_CAPTURE(MemoryObjectParameterivEXT, context, memoryObject, pname, params);
         }
     }
 }
 
 void GL_APIENTRY MultMatrixfContextANGLE(GLeglContext ctx, const GLfloat *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultMatrixf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfloat *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::MultMatrixf, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11906,14 +13990,17 @@ void GL_APIENTRY MultMatrixfContextANGLE(GLeglContext ctx, const GLfloat *m)
         if (context->skipValidation() || ValidateMultMatrixf(context, m))
         {
             context->multMatrixf(m);
+            ANGLE_CAPTURE(MultMatrixf, context, m);
         }
     }
 }
 
 void GL_APIENTRY MultMatrixxContextANGLE(GLeglContext ctx, const GLfixed *m)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultMatrixx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLfixed *m = 0x%016" PRIxPTR ")", (uintptr_t)m);
+    ANGLE_BINARY_TRACE(EntryPoint::MultMatrixx, m);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11922,6 +14009,7 @@ void GL_APIENTRY MultMatrixxContextANGLE(GLeglContext ctx, const GLfixed *m)
         if (context->skipValidation() || ValidateMultMatrixx(context, m))
         {
             context->multMatrixx(m);
+            ANGLE_CAPTURE(MultMatrixx, context, m);
         }
     }
 }
@@ -11933,9 +14021,11 @@ void GL_APIENTRY MultiTexCoord4fContextANGLE(GLeglContext ctx,
                                              GLfloat r,
                                              GLfloat q)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiTexCoord4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLfloat s = %f, GLfloat t = %f, GLfloat r = %f, GLfloat q = %f)",
           target, s, t, r, q);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiTexCoord4f, target, s, t, r, q);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11944,6 +14034,7 @@ void GL_APIENTRY MultiTexCoord4fContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateMultiTexCoord4f(context, target, s, t, r, q))
         {
             context->multiTexCoord4f(target, s, t, r, q);
+            ANGLE_CAPTURE(MultiTexCoord4f, context, target, s, t, r, q);
         }
     }
 }
@@ -11955,11 +14046,13 @@ void GL_APIENTRY MultiTexCoord4xContextANGLE(GLeglContext ctx,
                                              GLfixed r,
                                              GLfixed q)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiTexCoord4x);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum texture = 0x%X, GLfixed s = 0x%X, GLfixed t = 0x%X, GLfixed r = 0x%X, GLfixed q = "
         "0x%X)",
         texture, s, t, r, q);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiTexCoord4x, texture, s, t, r, q);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11968,14 +14061,17 @@ void GL_APIENTRY MultiTexCoord4xContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateMultiTexCoord4x(context, texture, s, t, r, q))
         {
             context->multiTexCoord4x(texture, s, t, r, q);
+            ANGLE_CAPTURE(MultiTexCoord4x, context, texture, s, t, r, q);
         }
     }
 }
 
 void GL_APIENTRY Normal3fContextANGLE(GLeglContext ctx, GLfloat nx, GLfloat ny, GLfloat nz)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Normal3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat nx = %f, GLfloat ny = %f, GLfloat nz = %f)", nx, ny, nz);
+    ANGLE_BINARY_TRACE(EntryPoint::Normal3f, nx, ny, nz);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -11984,14 +14080,17 @@ void GL_APIENTRY Normal3fContextANGLE(GLeglContext ctx, GLfloat nx, GLfloat ny,
         if (context->skipValidation() || ValidateNormal3f(context, nx, ny, nz))
         {
             context->normal3f(nx, ny, nz);
+            ANGLE_CAPTURE(Normal3f, context, nx, ny, nz);
         }
     }
 }
 
 void GL_APIENTRY Normal3xContextANGLE(GLeglContext ctx, GLfixed nx, GLfixed ny, GLfixed nz)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Normal3x);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed nx = 0x%X, GLfixed ny = 0x%X, GLfixed nz = 0x%X)", nx, ny, nz);
+    ANGLE_BINARY_TRACE(EntryPoint::Normal3x, nx, ny, nz);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12000,6 +14099,7 @@ void GL_APIENTRY Normal3xContextANGLE(GLeglContext ctx, GLfixed nx, GLfixed ny,
         if (context->skipValidation() || ValidateNormal3x(context, nx, ny, nz))
         {
             context->normal3x(nx, ny, nz);
+            ANGLE_CAPTURE(Normal3x, context, nx, ny, nz);
         }
     }
 }
@@ -12009,9 +14109,11 @@ void GL_APIENTRY NormalPointerContextANGLE(GLeglContext ctx,
                                            GLsizei stride,
                                            const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::NormalPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::NormalPointer, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12022,6 +14124,7 @@ void GL_APIENTRY NormalPointerContextANGLE(GLeglContext ctx,
             ValidateNormalPointer(context, typePacked, stride, pointer))
         {
             context->normalPointer(typePacked, stride, pointer);
+            ANGLE_CAPTURE(NormalPointer, context, type, stride, pointer);
         }
     }
 }
@@ -12032,11 +14135,13 @@ void GL_APIENTRY ObjectLabelKHRContextANGLE(GLeglContext ctx,
                                             GLsizei length,
                                             const GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ObjectLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum identifier = 0x%X, GLuint name = %u, GLsizei length = %d, const GLchar *label = "
         "0x%016" PRIxPTR ")",
         identifier, name, length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::ObjectLabelKHR, identifier, name, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12046,6 +14151,7 @@ void GL_APIENTRY ObjectLabelKHRContextANGLE(GLeglContext ctx,
             ValidateObjectLabelKHR(context, identifier, name, length, label))
         {
             context->objectLabel(identifier, name, length, label);
+            ANGLE_CAPTURE(ObjectLabelKHR, context, identifier, name, length, label);
         }
     }
 }
@@ -12055,10 +14161,12 @@ void GL_APIENTRY ObjectPtrLabelKHRContextANGLE(GLeglContext ctx,
                                                GLsizei length,
                                                const GLchar *label)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ObjectPtrLabelKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const void *ptr = 0x%016" PRIxPTR
           ", GLsizei length = %d, const GLchar *label = 0x%016" PRIxPTR ")",
           (uintptr_t)ptr, length, (uintptr_t)label);
+    ANGLE_BINARY_TRACE(EntryPoint::ObjectPtrLabelKHR, ptr, length, label);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12067,6 +14175,7 @@ void GL_APIENTRY ObjectPtrLabelKHRContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateObjectPtrLabelKHR(context, ptr, length, label))
         {
             context->objectPtrLabel(ptr, length, label);
+            ANGLE_CAPTURE(ObjectPtrLabelKHR, context, ptr, length, label);
         }
     }
 }
@@ -12079,11 +14188,13 @@ void GL_APIENTRY OrthofContextANGLE(GLeglContext ctx,
                                     GLfloat n,
                                     GLfloat f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Orthof);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfloat l = %f, GLfloat r = %f, GLfloat b = %f, GLfloat t = %f, GLfloat n = %f, GLfloat "
         "f = %f)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Orthof, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12092,6 +14203,7 @@ void GL_APIENTRY OrthofContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateOrthof(context, l, r, b, t, n, f))
         {
             context->orthof(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Orthof, context, l, r, b, t, n, f);
         }
     }
 }
@@ -12104,11 +14216,13 @@ void GL_APIENTRY OrthoxContextANGLE(GLeglContext ctx,
                                     GLfixed n,
                                     GLfixed f)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Orthox);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLfixed l = 0x%X, GLfixed r = 0x%X, GLfixed b = 0x%X, GLfixed t = 0x%X, GLfixed n = "
         "0x%X, GLfixed f = 0x%X)",
         l, r, b, t, n, f);
+    ANGLE_BINARY_TRACE(EntryPoint::Orthox, l, r, b, t, n, f);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12117,14 +14231,17 @@ void GL_APIENTRY OrthoxContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateOrthox(context, l, r, b, t, n, f))
         {
             context->orthox(l, r, b, t, n, f);
+            ANGLE_CAPTURE(Orthox, context, l, r, b, t, n, f);
         }
     }
 }
 
 void GL_APIENTRY PauseTransformFeedbackContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PauseTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PauseTransformFeedback);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12133,14 +14250,17 @@ void GL_APIENTRY PauseTransformFeedbackContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidatePauseTransformFeedback(context))
         {
             context->pauseTransformFeedback();
+            ANGLE_CAPTURE(PauseTransformFeedback, context);
         }
     }
 }
 
 void GL_APIENTRY PixelStoreiContextANGLE(GLeglContext ctx, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PixelStorei);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLint param = %d)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::PixelStorei, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12149,14 +14269,17 @@ void GL_APIENTRY PixelStoreiContextANGLE(GLeglContext ctx, GLenum pname, GLint p
         if (context->skipValidation() || ValidatePixelStorei(context, pname, param))
         {
             context->pixelStorei(pname, param);
+            ANGLE_CAPTURE(PixelStorei, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY PointParameterfContextANGLE(GLeglContext ctx, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfloat param = %f)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterf, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12166,15 +14289,18 @@ void GL_APIENTRY PointParameterfContextANGLE(GLeglContext ctx, GLenum pname, GLf
         if (context->skipValidation() || ValidatePointParameterf(context, pnamePacked, param))
         {
             context->pointParameterf(pnamePacked, param);
+            ANGLE_CAPTURE(PointParameterf, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY PointParameterfvContextANGLE(GLeglContext ctx, GLenum pname, const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterfv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12184,14 +14310,17 @@ void GL_APIENTRY PointParameterfvContextANGLE(GLeglContext ctx, GLenum pname, co
         if (context->skipValidation() || ValidatePointParameterfv(context, pnamePacked, params))
         {
             context->pointParameterfv(pnamePacked, params);
+            ANGLE_CAPTURE(PointParameterfv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY PointParameterxContextANGLE(GLeglContext ctx, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLfixed param = 0x%X)", pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterx, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12201,15 +14330,18 @@ void GL_APIENTRY PointParameterxContextANGLE(GLeglContext ctx, GLenum pname, GLf
         if (context->skipValidation() || ValidatePointParameterx(context, pnamePacked, param))
         {
             context->pointParameterx(pnamePacked, param);
+            ANGLE_CAPTURE(PointParameterx, context, pname, param);
         }
     }
 }
 
 void GL_APIENTRY PointParameterxvContextANGLE(GLeglContext ctx, GLenum pname, const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointParameterxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")", pname,
           (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::PointParameterxv, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12219,14 +14351,17 @@ void GL_APIENTRY PointParameterxvContextANGLE(GLeglContext ctx, GLenum pname, co
         if (context->skipValidation() || ValidatePointParameterxv(context, pnamePacked, params))
         {
             context->pointParameterxv(pnamePacked, params);
+            ANGLE_CAPTURE(PointParameterxv, context, pname, params);
         }
     }
 }
 
 void GL_APIENTRY PointSizeContextANGLE(GLeglContext ctx, GLfloat size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSize);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat size = %f)", size);
+    ANGLE_BINARY_TRACE(EntryPoint::PointSize, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12235,6 +14370,7 @@ void GL_APIENTRY PointSizeContextANGLE(GLeglContext ctx, GLfloat size)
         if (context->skipValidation() || ValidatePointSize(context, size))
         {
             context->pointSize(size);
+            ANGLE_CAPTURE(PointSize, context, size);
         }
     }
 }
@@ -12244,9 +14380,11 @@ void GL_APIENTRY PointSizePointerOESContextANGLE(GLeglContext ctx,
                                                  GLsizei stride,
                                                  const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSizePointerOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
           type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::PointSizePointerOES, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12257,14 +14395,17 @@ void GL_APIENTRY PointSizePointerOESContextANGLE(GLeglContext ctx,
             ValidatePointSizePointerOES(context, typePacked, stride, pointer))
         {
             context->pointSizePointer(typePacked, stride, pointer);
+            ANGLE_CAPTURE(PointSizePointerOES, context, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY PointSizexContextANGLE(GLeglContext ctx, GLfixed size)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PointSizex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed size = 0x%X)", size);
+    ANGLE_BINARY_TRACE(EntryPoint::PointSizex, size);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12273,14 +14414,17 @@ void GL_APIENTRY PointSizexContextANGLE(GLeglContext ctx, GLfixed size)
         if (context->skipValidation() || ValidatePointSizex(context, size))
         {
             context->pointSizex(size);
+            ANGLE_CAPTURE(PointSizex, context, size);
         }
     }
 }
 
 void GL_APIENTRY PolygonOffsetContextANGLE(GLeglContext ctx, GLfloat factor, GLfloat units)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PolygonOffset);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat factor = %f, GLfloat units = %f)", factor, units);
+    ANGLE_BINARY_TRACE(EntryPoint::PolygonOffset, factor, units);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12289,14 +14433,17 @@ void GL_APIENTRY PolygonOffsetContextANGLE(GLeglContext ctx, GLfloat factor, GLf
         if (context->skipValidation() || ValidatePolygonOffset(context, factor, units))
         {
             context->polygonOffset(factor, units);
+            ANGLE_CAPTURE(PolygonOffset, context, factor, units);
         }
     }
 }
 
 void GL_APIENTRY PolygonOffsetxContextANGLE(GLeglContext ctx, GLfixed factor, GLfixed units)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PolygonOffsetx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed factor = 0x%X, GLfixed units = 0x%X)", factor, units);
+    ANGLE_BINARY_TRACE(EntryPoint::PolygonOffsetx, factor, units);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12305,14 +14452,17 @@ void GL_APIENTRY PolygonOffsetxContextANGLE(GLeglContext ctx, GLfixed factor, GL
         if (context->skipValidation() || ValidatePolygonOffsetx(context, factor, units))
         {
             context->polygonOffsetx(factor, units);
+            ANGLE_CAPTURE(PolygonOffsetx, context, factor, units);
         }
     }
 }
 
 void GL_APIENTRY PopDebugGroupKHRContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopDebugGroupKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PopDebugGroupKHR);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12321,16 +14471,19 @@ void GL_APIENTRY PopDebugGroupKHRContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidatePopDebugGroupKHR(context))
         {
             context->popDebugGroup();
+            ANGLE_CAPTURE(PopDebugGroupKHR, context);
         }
     }
 }
 
 void GL_APIENTRY PopGroupMarkerEXTContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopGroupMarkerEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PopGroupMarkerEXT);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12339,14 +14492,17 @@ void GL_APIENTRY PopGroupMarkerEXTContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidatePopGroupMarkerEXT(context))
         {
             context->popGroupMarker();
+            ANGLE_CAPTURE(PopGroupMarkerEXT, context);
         }
     }
 }
 
 void GL_APIENTRY PopMatrixContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PopMatrix);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PopMatrix);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12355,6 +14511,7 @@ void GL_APIENTRY PopMatrixContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidatePopMatrix(context))
         {
             context->popMatrix();
+            ANGLE_CAPTURE(PopMatrix, context);
         }
     }
 }
@@ -12365,10 +14522,12 @@ void GL_APIENTRY ProgramBinaryContextANGLE(GLeglContext ctx,
                                            const void *binary,
                                            GLsizei length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramBinary);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramBinary, program, binaryFormat, binary, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12378,6 +14537,7 @@ void GL_APIENTRY ProgramBinaryContextANGLE(GLeglContext ctx,
             ValidateProgramBinary(context, program, binaryFormat, binary, length))
         {
             context->programBinary(program, binaryFormat, binary, length);
+            ANGLE_CAPTURE(ProgramBinary, context, program, binaryFormat, binary, length);
         }
     }
 }
@@ -12388,10 +14548,12 @@ void GL_APIENTRY ProgramBinaryOESContextANGLE(GLeglContext ctx,
                                               const void *binary,
                                               GLint length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramBinaryOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum binaryFormat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLint length = %d)",
           program, binaryFormat, (uintptr_t)binary, length);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramBinaryOES, program, binaryFormat, binary, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12401,6 +14563,7 @@ void GL_APIENTRY ProgramBinaryOESContextANGLE(GLeglContext ctx,
             ValidateProgramBinaryOES(context, program, binaryFormat, binary, length))
         {
             context->programBinary(program, binaryFormat, binary, length);
+            ANGLE_CAPTURE(ProgramBinaryOES, context, program, binaryFormat, binary, length);
         }
     }
 }
@@ -12410,8 +14573,10 @@ void GL_APIENTRY ProgramParameteriContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLint value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLenum pname = 0x%X, GLint value = %d)", program, pname, value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramParameteri, program, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12420,6 +14585,7 @@ void GL_APIENTRY ProgramParameteriContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateProgramParameteri(context, program, pname, value))
         {
             context->programParameteri(program, pname, value);
+            ANGLE_CAPTURE(ProgramParameteri, context, program, pname, value);
         }
     }
 }
@@ -12429,8 +14595,10 @@ void GL_APIENTRY ProgramUniform1fContextANGLE(GLeglContext ctx,
                                               GLint location,
                                               GLfloat v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f)", program, location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1f, program, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12439,6 +14607,7 @@ void GL_APIENTRY ProgramUniform1fContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateProgramUniform1f(context, program, location, v0))
         {
             context->programUniform1f(program, location, v0);
+            ANGLE_CAPTURE(ProgramUniform1f, context, program, location, v0);
         }
     }
 }
@@ -12449,11 +14618,13 @@ void GL_APIENTRY ProgramUniform1fvContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12463,6 +14634,7 @@ void GL_APIENTRY ProgramUniform1fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniform1fv(context, program, location, count, value))
         {
             context->programUniform1fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform1fv, context, program, location, count, value);
         }
     }
 }
@@ -12472,8 +14644,10 @@ void GL_APIENTRY ProgramUniform1iContextANGLE(GLeglContext ctx,
                                               GLint location,
                                               GLint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d)", program, location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1i, program, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12482,6 +14656,7 @@ void GL_APIENTRY ProgramUniform1iContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateProgramUniform1i(context, program, location, v0))
         {
             context->programUniform1i(program, location, v0);
+            ANGLE_CAPTURE(ProgramUniform1i, context, program, location, v0);
         }
     }
 }
@@ -12492,11 +14667,13 @@ void GL_APIENTRY ProgramUniform1ivContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12506,6 +14683,7 @@ void GL_APIENTRY ProgramUniform1ivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform1iv(context, program, location, count, value))
         {
             context->programUniform1iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform1iv, context, program, location, count, value);
         }
     }
 }
@@ -12515,8 +14693,10 @@ void GL_APIENTRY ProgramUniform1uiContextANGLE(GLeglContext ctx,
                                                GLint location,
                                                GLuint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u)", program, location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1ui, program, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12525,6 +14705,7 @@ void GL_APIENTRY ProgramUniform1uiContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateProgramUniform1ui(context, program, location, v0))
         {
             context->programUniform1ui(program, location, v0);
+            ANGLE_CAPTURE(ProgramUniform1ui, context, program, location, v0);
         }
     }
 }
@@ -12535,11 +14716,13 @@ void GL_APIENTRY ProgramUniform1uivContextANGLE(GLeglContext ctx,
                                                 GLsizei count,
                                                 const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform1uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform1uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12549,6 +14732,7 @@ void GL_APIENTRY ProgramUniform1uivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform1uiv(context, program, location, count, value))
         {
             context->programUniform1uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform1uiv, context, program, location, count, value);
         }
     }
 }
@@ -12559,9 +14743,11 @@ void GL_APIENTRY ProgramUniform2fContextANGLE(GLeglContext ctx,
                                               GLfloat v0,
                                               GLfloat v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", program,
           location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2f, program, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12571,6 +14757,7 @@ void GL_APIENTRY ProgramUniform2fContextANGLE(GLeglContext ctx,
             ValidateProgramUniform2f(context, program, location, v0, v1))
         {
             context->programUniform2f(program, location, v0, v1);
+            ANGLE_CAPTURE(ProgramUniform2f, context, program, location, v0, v1);
         }
     }
 }
@@ -12581,11 +14768,13 @@ void GL_APIENTRY ProgramUniform2fvContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12595,6 +14784,7 @@ void GL_APIENTRY ProgramUniform2fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniform2fv(context, program, location, count, value))
         {
             context->programUniform2fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform2fv, context, program, location, count, value);
         }
     }
 }
@@ -12602,9 +14792,11 @@ void GL_APIENTRY ProgramUniform2fvContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 ProgramUniform2iContextANGLE(GLeglContext ctx, GLuint program, GLint location, GLint v0, GLint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d)", program,
           location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2i, program, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12614,6 +14806,7 @@ ProgramUniform2iContextANGLE(GLeglContext ctx, GLuint program, GLint location, G
             ValidateProgramUniform2i(context, program, location, v0, v1))
         {
             context->programUniform2i(program, location, v0, v1);
+            ANGLE_CAPTURE(ProgramUniform2i, context, program, location, v0, v1);
         }
     }
 }
@@ -12624,11 +14817,13 @@ void GL_APIENTRY ProgramUniform2ivContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12638,6 +14833,7 @@ void GL_APIENTRY ProgramUniform2ivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform2iv(context, program, location, count, value))
         {
             context->programUniform2iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform2iv, context, program, location, count, value);
         }
     }
 }
@@ -12648,9 +14844,11 @@ void GL_APIENTRY ProgramUniform2uiContextANGLE(GLeglContext ctx,
                                                GLuint v0,
                                                GLuint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", program,
           location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2ui, program, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12660,6 +14858,7 @@ void GL_APIENTRY ProgramUniform2uiContextANGLE(GLeglContext ctx,
             ValidateProgramUniform2ui(context, program, location, v0, v1))
         {
             context->programUniform2ui(program, location, v0, v1);
+            ANGLE_CAPTURE(ProgramUniform2ui, context, program, location, v0, v1);
         }
     }
 }
@@ -12670,11 +14869,13 @@ void GL_APIENTRY ProgramUniform2uivContextANGLE(GLeglContext ctx,
                                                 GLsizei count,
                                                 const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform2uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform2uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12684,6 +14885,7 @@ void GL_APIENTRY ProgramUniform2uivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform2uiv(context, program, location, count, value))
         {
             context->programUniform2uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform2uiv, context, program, location, count, value);
         }
     }
 }
@@ -12695,11 +14897,13 @@ void GL_APIENTRY ProgramUniform3fContextANGLE(GLeglContext ctx,
                                               GLfloat v1,
                                               GLfloat v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3f, program, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12709,6 +14913,7 @@ void GL_APIENTRY ProgramUniform3fContextANGLE(GLeglContext ctx,
             ValidateProgramUniform3f(context, program, location, v0, v1, v2))
         {
             context->programUniform3f(program, location, v0, v1, v2);
+            ANGLE_CAPTURE(ProgramUniform3f, context, program, location, v0, v1, v2);
         }
     }
 }
@@ -12719,11 +14924,13 @@ void GL_APIENTRY ProgramUniform3fvContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12733,6 +14940,7 @@ void GL_APIENTRY ProgramUniform3fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniform3fv(context, program, location, count, value))
         {
             context->programUniform3fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform3fv, context, program, location, count, value);
         }
     }
 }
@@ -12744,9 +14952,11 @@ void GL_APIENTRY ProgramUniform3iContextANGLE(GLeglContext ctx,
                                               GLint v1,
                                               GLint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)",
           program, location, v0, v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3i, program, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12756,6 +14966,7 @@ void GL_APIENTRY ProgramUniform3iContextANGLE(GLeglContext ctx,
             ValidateProgramUniform3i(context, program, location, v0, v1, v2))
         {
             context->programUniform3i(program, location, v0, v1, v2);
+            ANGLE_CAPTURE(ProgramUniform3i, context, program, location, v0, v1, v2);
         }
     }
 }
@@ -12766,11 +14977,13 @@ void GL_APIENTRY ProgramUniform3ivContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12780,6 +14993,7 @@ void GL_APIENTRY ProgramUniform3ivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform3iv(context, program, location, count, value))
         {
             context->programUniform3iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform3iv, context, program, location, count, value);
         }
     }
 }
@@ -12791,11 +15005,13 @@ void GL_APIENTRY ProgramUniform3uiContextANGLE(GLeglContext ctx,
                                                GLuint v1,
                                                GLuint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u)",
         program, location, v0, v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3ui, program, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12805,6 +15021,7 @@ void GL_APIENTRY ProgramUniform3uiContextANGLE(GLeglContext ctx,
             ValidateProgramUniform3ui(context, program, location, v0, v1, v2))
         {
             context->programUniform3ui(program, location, v0, v1, v2);
+            ANGLE_CAPTURE(ProgramUniform3ui, context, program, location, v0, v1, v2);
         }
     }
 }
@@ -12815,11 +15032,13 @@ void GL_APIENTRY ProgramUniform3uivContextANGLE(GLeglContext ctx,
                                                 GLsizei count,
                                                 const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform3uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform3uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12829,6 +15048,7 @@ void GL_APIENTRY ProgramUniform3uivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform3uiv(context, program, location, count, value))
         {
             context->programUniform3uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform3uiv, context, program, location, count, value);
         }
     }
 }
@@ -12841,11 +15061,13 @@ void GL_APIENTRY ProgramUniform4fContextANGLE(GLeglContext ctx,
                                               GLfloat v2,
                                               GLfloat v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = "
         "%f, GLfloat v3 = %f)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4f, program, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12855,6 +15077,7 @@ void GL_APIENTRY ProgramUniform4fContextANGLE(GLeglContext ctx,
             ValidateProgramUniform4f(context, program, location, v0, v1, v2, v3))
         {
             context->programUniform4f(program, location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(ProgramUniform4f, context, program, location, v0, v1, v2, v3);
         }
     }
 }
@@ -12865,11 +15088,13 @@ void GL_APIENTRY ProgramUniform4fvContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLfloat *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4fv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12879,6 +15104,7 @@ void GL_APIENTRY ProgramUniform4fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniform4fv(context, program, location, count, value))
         {
             context->programUniform4fv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform4fv, context, program, location, count, value);
         }
     }
 }
@@ -12891,11 +15117,13 @@ void GL_APIENTRY ProgramUniform4iContextANGLE(GLeglContext ctx,
                                               GLint v2,
                                               GLint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, "
         "GLint v3 = %d)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4i, program, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12905,6 +15133,7 @@ void GL_APIENTRY ProgramUniform4iContextANGLE(GLeglContext ctx,
             ValidateProgramUniform4i(context, program, location, v0, v1, v2, v3))
         {
             context->programUniform4i(program, location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(ProgramUniform4i, context, program, location, v0, v1, v2, v3);
         }
     }
 }
@@ -12915,11 +15144,13 @@ void GL_APIENTRY ProgramUniform4ivContextANGLE(GLeglContext ctx,
                                                GLsizei count,
                                                const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4iv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12929,6 +15160,7 @@ void GL_APIENTRY ProgramUniform4ivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform4iv(context, program, location, count, value))
         {
             context->programUniform4iv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform4iv, context, program, location, count, value);
         }
     }
 }
@@ -12941,11 +15173,13 @@ void GL_APIENTRY ProgramUniform4uiContextANGLE(GLeglContext ctx,
                                                GLuint v2,
                                                GLuint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = "
         "%u, GLuint v3 = %u)",
         program, location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4ui, program, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12955,6 +15189,7 @@ void GL_APIENTRY ProgramUniform4uiContextANGLE(GLeglContext ctx,
             ValidateProgramUniform4ui(context, program, location, v0, v1, v2, v3))
         {
             context->programUniform4ui(program, location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(ProgramUniform4ui, context, program, location, v0, v1, v2, v3);
         }
     }
 }
@@ -12965,11 +15200,13 @@ void GL_APIENTRY ProgramUniform4uivContextANGLE(GLeglContext ctx,
                                                 GLsizei count,
                                                 const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniform4uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, const GLuint *value = "
         "0x%016" PRIxPTR ")",
         program, location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniform4uiv, program, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -12979,6 +15216,7 @@ void GL_APIENTRY ProgramUniform4uivContextANGLE(GLeglContext ctx,
             ValidateProgramUniform4uiv(context, program, location, count, value))
         {
             context->programUniform4uiv(program, location, count, value);
+            ANGLE_CAPTURE(ProgramUniform4uiv, context, program, location, count, value);
         }
     }
 }
@@ -12990,11 +15228,14 @@ void GL_APIENTRY ProgramUniformMatrix2fvContextANGLE(GLeglContext ctx,
                                                      GLboolean transpose,
                                                      const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13004,6 +15245,8 @@ void GL_APIENTRY ProgramUniformMatrix2fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix2fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix2fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix2fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13015,11 +15258,14 @@ void GL_APIENTRY ProgramUniformMatrix2x3fvContextANGLE(GLeglContext ctx,
                                                        GLboolean transpose,
                                                        const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2x3fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13029,6 +15275,8 @@ void GL_APIENTRY ProgramUniformMatrix2x3fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix2x3fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix2x3fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix2x3fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13040,11 +15288,14 @@ void GL_APIENTRY ProgramUniformMatrix2x4fvContextANGLE(GLeglContext ctx,
                                                        GLboolean transpose,
                                                        const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix2x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix2x4fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13054,6 +15305,8 @@ void GL_APIENTRY ProgramUniformMatrix2x4fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix2x4fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix2x4fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix2x4fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13065,11 +15318,14 @@ void GL_APIENTRY ProgramUniformMatrix3fvContextANGLE(GLeglContext ctx,
                                                      GLboolean transpose,
                                                      const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13079,6 +15335,8 @@ void GL_APIENTRY ProgramUniformMatrix3fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix3fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix3fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix3fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13090,11 +15348,14 @@ void GL_APIENTRY ProgramUniformMatrix3x2fvContextANGLE(GLeglContext ctx,
                                                        GLboolean transpose,
                                                        const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3x2fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13104,6 +15365,8 @@ void GL_APIENTRY ProgramUniformMatrix3x2fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix3x2fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix3x2fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix3x2fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13115,11 +15378,14 @@ void GL_APIENTRY ProgramUniformMatrix3x4fvContextANGLE(GLeglContext ctx,
                                                        GLboolean transpose,
                                                        const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix3x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix3x4fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13129,6 +15395,8 @@ void GL_APIENTRY ProgramUniformMatrix3x4fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix3x4fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix3x4fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix3x4fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13140,11 +15408,14 @@ void GL_APIENTRY ProgramUniformMatrix4fvContextANGLE(GLeglContext ctx,
                                                      GLboolean transpose,
                                                      const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13154,6 +15425,8 @@ void GL_APIENTRY ProgramUniformMatrix4fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix4fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix4fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix4fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13165,11 +15438,14 @@ void GL_APIENTRY ProgramUniformMatrix4x2fvContextANGLE(GLeglContext ctx,
                                                        GLboolean transpose,
                                                        const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4x2fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13179,6 +15455,8 @@ void GL_APIENTRY ProgramUniformMatrix4x2fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix4x2fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix4x2fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix4x2fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13190,11 +15468,14 @@ void GL_APIENTRY ProgramUniformMatrix4x3fvContextANGLE(GLeglContext ctx,
                                                        GLboolean transpose,
                                                        const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramUniformMatrix4x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, "
         "const GLfloat *value = 0x%016" PRIxPTR ")",
         program, location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramUniformMatrix4x3fv, program, location, count, transpose,
+                       value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13204,6 +15485,8 @@ void GL_APIENTRY ProgramUniformMatrix4x3fvContextANGLE(GLeglContext ctx,
             ValidateProgramUniformMatrix4x3fv(context, program, location, count, transpose, value))
         {
             context->programUniformMatrix4x3fv(program, location, count, transpose, value);
+            ANGLE_CAPTURE(ProgramUniformMatrix4x3fv, context, program, location, count, transpose,
+                          value);
         }
     }
 }
@@ -13214,11 +15497,13 @@ void GL_APIENTRY PushDebugGroupKHRContextANGLE(GLeglContext ctx,
                                                GLsizei length,
                                                const GLchar *message)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushDebugGroupKHR);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum source = 0x%X, GLuint id = %u, GLsizei length = %d, const GLchar *message = "
         "0x%016" PRIxPTR ")",
         source, id, length, (uintptr_t)message);
+    ANGLE_BINARY_TRACE(EntryPoint::PushDebugGroupKHR, source, id, length, message);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13228,6 +15513,7 @@ void GL_APIENTRY PushDebugGroupKHRContextANGLE(GLeglContext ctx,
             ValidatePushDebugGroupKHR(context, source, id, length, message))
         {
             context->pushDebugGroup(source, id, length, message);
+            ANGLE_CAPTURE(PushDebugGroupKHR, context, source, id, length, message);
         }
     }
 }
@@ -13236,11 +15522,13 @@ void GL_APIENTRY PushGroupMarkerEXTContextANGLE(GLeglContext ctx,
                                                 GLsizei length,
                                                 const GLchar *marker)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushGroupMarkerEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     // Don't run an EVENT() macro on the EXT_debug_marker entry points.
     // It can interfere with the debug events being set by the caller.
     // EVENT("(GLsizei length = %d, const GLchar *marker = 0x%016" PRIxPTR ")", length,
     // (uintptr_t)marker);
+    ANGLE_BINARY_TRACE(EntryPoint::PushGroupMarkerEXT, length, marker);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13249,14 +15537,17 @@ void GL_APIENTRY PushGroupMarkerEXTContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidatePushGroupMarkerEXT(context, length, marker))
         {
             context->pushGroupMarker(length, marker);
+            ANGLE_CAPTURE(PushGroupMarkerEXT, context, length, marker);
         }
     }
 }
 
 void GL_APIENTRY PushMatrixContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PushMatrix);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::PushMatrix);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13265,14 +15556,17 @@ void GL_APIENTRY PushMatrixContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidatePushMatrix(context))
         {
             context->pushMatrix();
+            ANGLE_CAPTURE(PushMatrix, context);
         }
     }
 }
 
 void GL_APIENTRY QueryCounterEXTContextANGLE(GLeglContext ctx, GLuint id, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::QueryCounterEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint id = %u, GLenum target = 0x%X)", id, target);
+    ANGLE_BINARY_TRACE(EntryPoint::QueryCounterEXT, id, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13282,6 +15576,7 @@ void GL_APIENTRY QueryCounterEXTContextANGLE(GLeglContext ctx, GLuint id, GLenum
         if (context->skipValidation() || ValidateQueryCounterEXT(context, id, targetPacked))
         {
             context->queryCounter(id, targetPacked);
+            ANGLE_CAPTURE(QueryCounterEXT, context, id, target);
         }
     }
 }
@@ -13290,9 +15585,11 @@ GLbitfield GL_APIENTRY QueryMatrixxOESContextANGLE(GLeglContext ctx,
                                                    GLfixed *mantissa,
                                                    GLint *exponent)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::QueryMatrixxOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed *mantissa = 0x%016" PRIxPTR ", GLint *exponent = 0x%016" PRIxPTR ")",
           (uintptr_t)mantissa, (uintptr_t)exponent);
+    ANGLE_BINARY_TRACE(EntryPoint::QueryMatrixxOES, mantissa, exponent);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13300,7 +15597,9 @@ GLbitfield GL_APIENTRY QueryMatrixxOESContextANGLE(GLeglContext ctx,
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateQueryMatrixxOES(context, mantissa, exponent))
         {
-            return context->queryMatrixx(mantissa, exponent);
+            GLbitfield returnValue = context->queryMatrixx(mantissa, exponent);
+            ANGLE_CAPTURE(QueryMatrixxOES, context, mantissa, exponent, returnValue);
+            return returnValue;
         }
     }
 
@@ -13309,8 +15608,10 @@ GLbitfield GL_APIENTRY QueryMatrixxOESContextANGLE(GLeglContext ctx,
 
 void GL_APIENTRY ReadBufferContextANGLE(GLeglContext ctx, GLenum src)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum src = 0x%X)", src);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadBuffer, src);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13319,6 +15620,7 @@ void GL_APIENTRY ReadBufferContextANGLE(GLeglContext ctx, GLenum src)
         if (context->skipValidation() || ValidateReadBuffer(context, src))
         {
             context->readBuffer(src);
+            ANGLE_CAPTURE(ReadBuffer, context, src);
         }
     }
 }
@@ -13332,11 +15634,13 @@ void GL_APIENTRY ReadPixelsContextANGLE(GLeglContext ctx,
                                         GLenum type,
                                         void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadPixels);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, void *pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadPixels, x, y, width, height, format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13346,6 +15650,7 @@ void GL_APIENTRY ReadPixelsContextANGLE(GLeglContext ctx,
             ValidateReadPixels(context, x, y, width, height, format, type, pixels))
         {
             context->readPixels(x, y, width, height, format, type, pixels);
+            ANGLE_CAPTURE(ReadPixels, context, x, y, width, height, format, type, pixels);
         }
     }
 }
@@ -13360,11 +15665,14 @@ void GL_APIENTRY ReadnPixelsEXTContextANGLE(GLeglContext ctx,
                                             GLsizei bufSize,
                                             void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadnPixelsEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
         "0x%X, GLenum type = 0x%X, GLsizei bufSize = %d, void *data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadnPixelsEXT, x, y, width, height, format, type, bufSize,
+                       data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13374,14 +15682,18 @@ void GL_APIENTRY ReadnPixelsEXTContextANGLE(GLeglContext ctx,
             ValidateReadnPixelsEXT(context, x, y, width, height, format, type, bufSize, data))
         {
             context->readnPixels(x, y, width, height, format, type, bufSize, data);
+            ANGLE_CAPTURE(ReadnPixelsEXT, context, x, y, width, height, format, type, bufSize,
+                          data);
         }
     }
 }
 
 void GL_APIENTRY ReleaseShaderCompilerContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReleaseShaderCompiler);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::ReleaseShaderCompiler);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13390,6 +15702,7 @@ void GL_APIENTRY ReleaseShaderCompilerContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateReleaseShaderCompiler(context))
         {
             context->releaseShaderCompiler();
+            ANGLE_CAPTURE(ReleaseShaderCompiler, context);
         }
     }
 }
@@ -13400,11 +15713,13 @@ void GL_APIENTRY RenderbufferStorageContextANGLE(GLeglContext ctx,
                                                  GLsizei width,
                                                  GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorage);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorage, target, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13414,6 +15729,7 @@ void GL_APIENTRY RenderbufferStorageContextANGLE(GLeglContext ctx,
             ValidateRenderbufferStorage(context, target, internalformat, width, height))
         {
             context->renderbufferStorage(target, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorage, context, target, internalformat, width, height);
         }
     }
 }
@@ -13425,11 +15741,14 @@ void GL_APIENTRY RenderbufferStorageMultisampleContextANGLE(GLeglContext ctx,
                                                             GLsizei width,
                                                             GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageMultisample);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageMultisample, target, samples, internalformat,
+                       width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13440,6 +15759,8 @@ void GL_APIENTRY RenderbufferStorageMultisampleContextANGLE(GLeglContext ctx,
                                                    height))
         {
             context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorageMultisample, context, target, samples, internalformat,
+                          width, height);
         }
     }
 }
@@ -13451,11 +15772,14 @@ void GL_APIENTRY RenderbufferStorageMultisampleANGLEContextANGLE(GLeglContext ct
                                                                  GLsizei width,
                                                                  GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageMultisampleANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d)",
         target, samples, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageMultisampleANGLE, target, samples,
+                       internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13466,6 +15790,8 @@ void GL_APIENTRY RenderbufferStorageMultisampleANGLEContextANGLE(GLeglContext ct
                                                         width, height))
         {
             context->renderbufferStorageMultisample(target, samples, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorageMultisampleANGLE, context, target, samples,
+                          internalformat, width, height);
         }
     }
 }
@@ -13476,11 +15802,13 @@ void GL_APIENTRY RenderbufferStorageOESContextANGLE(GLeglContext ctx,
                                                     GLsizei width,
                                                     GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RenderbufferStorageOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLsizei width = %d, GLsizei height = "
         "%d)",
         target, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::RenderbufferStorageOES, target, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13490,14 +15818,17 @@ void GL_APIENTRY RenderbufferStorageOESContextANGLE(GLeglContext ctx,
             ValidateRenderbufferStorageOES(context, target, internalformat, width, height))
         {
             context->renderbufferStorage(target, internalformat, width, height);
+            ANGLE_CAPTURE(RenderbufferStorageOES, context, target, internalformat, width, height);
         }
     }
 }
 
 void GL_APIENTRY ResumeTransformFeedbackContextANGLE(GLeglContext ctx)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ResumeTransformFeedback);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("()");
+    ANGLE_BINARY_TRACE(EntryPoint::ResumeTransformFeedback);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13506,6 +15837,7 @@ void GL_APIENTRY ResumeTransformFeedbackContextANGLE(GLeglContext ctx)
         if (context->skipValidation() || ValidateResumeTransformFeedback(context))
         {
             context->resumeTransformFeedback();
+            ANGLE_CAPTURE(ResumeTransformFeedback, context);
         }
     }
 }
@@ -13513,8 +15845,10 @@ void GL_APIENTRY ResumeTransformFeedbackContextANGLE(GLeglContext ctx)
 void GL_APIENTRY
 RotatefContextANGLE(GLeglContext ctx, GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Rotatef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat angle = %f, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", angle, x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Rotatef, angle, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13523,6 +15857,7 @@ RotatefContextANGLE(GLeglContext ctx, GLfloat angle, GLfloat x, GLfloat y, GLflo
         if (context->skipValidation() || ValidateRotatef(context, angle, x, y, z))
         {
             context->rotatef(angle, x, y, z);
+            ANGLE_CAPTURE(Rotatef, context, angle, x, y, z);
         }
     }
 }
@@ -13530,9 +15865,11 @@ RotatefContextANGLE(GLeglContext ctx, GLfloat angle, GLfloat x, GLfloat y, GLflo
 void GL_APIENTRY
 RotatexContextANGLE(GLeglContext ctx, GLfixed angle, GLfixed x, GLfixed y, GLfixed z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Rotatex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed angle = 0x%X, GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", angle, x,
           y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Rotatex, angle, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13541,14 +15878,17 @@ RotatexContextANGLE(GLeglContext ctx, GLfixed angle, GLfixed x, GLfixed y, GLfix
         if (context->skipValidation() || ValidateRotatex(context, angle, x, y, z))
         {
             context->rotatex(angle, x, y, z);
+            ANGLE_CAPTURE(Rotatex, context, angle, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY SampleCoverageContextANGLE(GLeglContext ctx, GLfloat value, GLboolean invert)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleCoverage);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat value = %f, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleCoverage, value, invert);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13557,14 +15897,17 @@ void GL_APIENTRY SampleCoverageContextANGLE(GLeglContext ctx, GLfloat value, GLb
         if (context->skipValidation() || ValidateSampleCoverage(context, value, invert))
         {
             context->sampleCoverage(value, invert);
+            ANGLE_CAPTURE(SampleCoverage, context, value, invert);
         }
     }
 }
 
 void GL_APIENTRY SampleCoveragexContextANGLE(GLeglContext ctx, GLclampx value, GLboolean invert)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleCoveragex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLclampx value = 0x%X, GLboolean invert = %u)", value, invert);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleCoveragex, value, invert);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13573,14 +15916,17 @@ void GL_APIENTRY SampleCoveragexContextANGLE(GLeglContext ctx, GLclampx value, G
         if (context->skipValidation() || ValidateSampleCoveragex(context, value, invert))
         {
             context->sampleCoveragex(value, invert);
+            ANGLE_CAPTURE(SampleCoveragex, context, value, invert);
         }
     }
 }
 
 void GL_APIENTRY SampleMaskiContextANGLE(GLeglContext ctx, GLuint maskNumber, GLbitfield mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleMaski);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleMaski, maskNumber, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13589,6 +15935,7 @@ void GL_APIENTRY SampleMaskiContextANGLE(GLeglContext ctx, GLuint maskNumber, GL
         if (context->skipValidation() || ValidateSampleMaski(context, maskNumber, mask))
         {
             context->sampleMaski(maskNumber, mask);
+            ANGLE_CAPTURE(SampleMaski, context, maskNumber, mask);
         }
     }
 }
@@ -13598,9 +15945,11 @@ void GL_APIENTRY SamplerParameterIivOESContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIivOES, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13610,6 +15959,7 @@ void GL_APIENTRY SamplerParameterIivOESContextANGLE(GLeglContext ctx,
             ValidateSamplerParameterIivOES(context, sampler, pname, param))
         {
             context->samplerParameterIiv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterIivOES, context, sampler, pname, param);
         }
     }
 }
@@ -13619,9 +15969,11 @@ void GL_APIENTRY SamplerParameterIuivOESContextANGLE(GLeglContext ctx,
                                                      GLenum pname,
                                                      const GLuint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLuint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIuivOES, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13631,6 +15983,7 @@ void GL_APIENTRY SamplerParameterIuivOESContextANGLE(GLeglContext ctx,
             ValidateSamplerParameterIuivOES(context, sampler, pname, param))
         {
             context->samplerParameterIuiv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterIuivOES, context, sampler, pname, param);
         }
     }
 }
@@ -13640,8 +15993,10 @@ void GL_APIENTRY SamplerParameterfContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLfloat param = %f)", sampler, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterf, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13650,6 +16005,7 @@ void GL_APIENTRY SamplerParameterfContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateSamplerParameterf(context, sampler, pname, param))
         {
             context->samplerParameterf(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterf, context, sampler, pname, param);
         }
     }
 }
@@ -13659,9 +16015,11 @@ void GL_APIENTRY SamplerParameterfvContextANGLE(GLeglContext ctx,
                                                 GLenum pname,
                                                 const GLfloat *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLfloat *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterfv, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13670,6 +16028,7 @@ void GL_APIENTRY SamplerParameterfvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateSamplerParameterfv(context, sampler, pname, param))
         {
             context->samplerParameterfv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameterfv, context, sampler, pname, param);
         }
     }
 }
@@ -13679,8 +16038,10 @@ void GL_APIENTRY SamplerParameteriContextANGLE(GLeglContext ctx,
                                                GLenum pname,
                                                GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, GLint param = %d)", sampler, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameteri, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13689,6 +16050,7 @@ void GL_APIENTRY SamplerParameteriContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateSamplerParameteri(context, sampler, pname, param))
         {
             context->samplerParameteri(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameteri, context, sampler, pname, param);
         }
     }
 }
@@ -13698,9 +16060,11 @@ void GL_APIENTRY SamplerParameterivContextANGLE(GLeglContext ctx,
                                                 GLenum pname,
                                                 const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sampler = %u, GLenum pname = 0x%X, const GLint *param = 0x%016" PRIxPTR ")",
           sampler, pname, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameteriv, sampler, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13709,14 +16073,17 @@ void GL_APIENTRY SamplerParameterivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateSamplerParameteriv(context, sampler, pname, param))
         {
             context->samplerParameteriv(sampler, pname, param);
+            ANGLE_CAPTURE(SamplerParameteriv, context, sampler, pname, param);
         }
     }
 }
 
 void GL_APIENTRY ScalefContextANGLE(GLeglContext ctx, GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scalef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Scalef, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13725,14 +16092,17 @@ void GL_APIENTRY ScalefContextANGLE(GLeglContext ctx, GLfloat x, GLfloat y, GLfl
         if (context->skipValidation() || ValidateScalef(context, x, y, z))
         {
             context->scalef(x, y, z);
+            ANGLE_CAPTURE(Scalef, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY ScalexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y, GLfixed z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scalex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Scalex, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13741,6 +16111,7 @@ void GL_APIENTRY ScalexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y, GLfi
         if (context->skipValidation() || ValidateScalex(context, x, y, z))
         {
             context->scalex(x, y, z);
+            ANGLE_CAPTURE(Scalex, context, x, y, z);
         }
     }
 }
@@ -13748,9 +16119,11 @@ void GL_APIENTRY ScalexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y, GLfi
 void GL_APIENTRY
 ScissorContextANGLE(GLeglContext ctx, GLint x, GLint y, GLsizei width, GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Scissor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_TRACE(EntryPoint::Scissor, x, y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13759,6 +16132,7 @@ ScissorContextANGLE(GLeglContext ctx, GLint x, GLint y, GLsizei width, GLsizei h
         if (context->skipValidation() || ValidateScissor(context, x, y, width, height))
         {
             context->scissor(x, y, width, height);
+            ANGLE_CAPTURE(Scissor, context, x, y, width, height);
         }
     }
 }
@@ -13768,10 +16142,12 @@ void GL_APIENTRY SemaphoreParameterui64vEXTContextANGLE(GLeglContext ctx,
                                                         GLenum pname,
                                                         const GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SemaphoreParameterui64vEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint semaphore = %u, GLenum pname = 0x%X, const GLuint64 *params = 0x%016" PRIxPTR
           ")",
           semaphore, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::SemaphoreParameterui64vEXT, semaphore, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13781,14 +16157,17 @@ void GL_APIENTRY SemaphoreParameterui64vEXTContextANGLE(GLeglContext ctx,
             ValidateSemaphoreParameterui64vEXT(context, semaphore, pname, params))
         {
             context->semaphoreParameterui64v(semaphore, pname, params);
+            ANGLE_CAPTURE(SemaphoreParameterui64vEXT, context, semaphore, pname, params);
         }
     }
 }
 
 void GL_APIENTRY SetFenceNVContextANGLE(GLeglContext ctx, GLuint fence, GLenum condition)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SetFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u, GLenum condition = 0x%X)", fence, condition);
+    ANGLE_BINARY_TRACE(EntryPoint::SetFenceNV, fence, condition);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13797,14 +16176,17 @@ void GL_APIENTRY SetFenceNVContextANGLE(GLeglContext ctx, GLuint fence, GLenum c
         if (context->skipValidation() || ValidateSetFenceNV(context, fence, condition))
         {
             context->setFenceNV(fence, condition);
+            ANGLE_CAPTURE(SetFenceNV, context, fence, condition);
         }
     }
 }
 
 void GL_APIENTRY ShadeModelContextANGLE(GLeglContext ctx, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShadeModel);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::ShadeModel, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13814,6 +16196,7 @@ void GL_APIENTRY ShadeModelContextANGLE(GLeglContext ctx, GLenum mode)
         if (context->skipValidation() || ValidateShadeModel(context, modePacked))
         {
             context->shadeModel(modePacked);
+            ANGLE_CAPTURE(ShadeModel, context, mode);
         }
     }
 }
@@ -13825,11 +16208,13 @@ void GL_APIENTRY ShaderBinaryContextANGLE(GLeglContext ctx,
                                           const void *binary,
                                           GLsizei length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShaderBinary);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei count = %d, const GLuint *shaders = 0x%016" PRIxPTR
           ", GLenum binaryformat = 0x%X, const void *binary = 0x%016" PRIxPTR
           ", GLsizei length = %d)",
           count, (uintptr_t)shaders, binaryformat, (uintptr_t)binary, length);
+    ANGLE_BINARY_TRACE(EntryPoint::ShaderBinary, count, shaders, binaryformat, binary, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13839,6 +16224,7 @@ void GL_APIENTRY ShaderBinaryContextANGLE(GLeglContext ctx,
             ValidateShaderBinary(context, count, shaders, binaryformat, binary, length))
         {
             context->shaderBinary(count, shaders, binaryformat, binary, length);
+            ANGLE_CAPTURE(ShaderBinary, context, count, shaders, binaryformat, binary, length);
         }
     }
 }
@@ -13849,10 +16235,12 @@ void GL_APIENTRY ShaderSourceContextANGLE(GLeglContext ctx,
                                           const GLchar *const *string,
                                           const GLint *length)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ShaderSource);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint shader = %u, GLsizei count = %d, const GLchar *const*string = 0x%016" PRIxPTR
           ", const GLint *length = 0x%016" PRIxPTR ")",
           shader, count, (uintptr_t)string, (uintptr_t)length);
+    ANGLE_BINARY_TRACE(EntryPoint::ShaderSource, shader, count, string, length);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13862,6 +16250,7 @@ void GL_APIENTRY ShaderSourceContextANGLE(GLeglContext ctx,
             ValidateShaderSource(context, shader, count, string, length))
         {
             context->shaderSource(shader, count, string, length);
+            ANGLE_CAPTURE(ShaderSource, context, shader, count, string, length);
         }
     }
 }
@@ -13874,6 +16263,7 @@ void GL_APIENTRY SignalSemaphoreEXTContextANGLE(GLeglContext ctx,
                                                 const GLuint *textures,
                                                 const GLenum *dstLayouts)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SignalSemaphoreEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint semaphore = %u, GLuint numBufferBarriers = %u, const GLuint *buffers = "
@@ -13881,6 +16271,8 @@ void GL_APIENTRY SignalSemaphoreEXTContextANGLE(GLeglContext ctx,
         ", const GLenum *dstLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)dstLayouts);
+    ANGLE_BINARY_TRACE(EntryPoint::SignalSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, dstLayouts);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13892,14 +16284,18 @@ void GL_APIENTRY SignalSemaphoreEXTContextANGLE(GLeglContext ctx,
         {
             context->signalSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
                                      textures, dstLayouts);
+            ANGLE_CAPTURE(SignalSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                          numTextureBarriers, textures, dstLayouts);
         }
     }
 }
 
 void GL_APIENTRY StencilFuncContextANGLE(GLeglContext ctx, GLenum func, GLint ref, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFunc);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFunc, func, ref, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13908,6 +16304,7 @@ void GL_APIENTRY StencilFuncContextANGLE(GLeglContext ctx, GLenum func, GLint re
         if (context->skipValidation() || ValidateStencilFunc(context, func, ref, mask))
         {
             context->stencilFunc(func, ref, mask);
+            ANGLE_CAPTURE(StencilFunc, context, func, ref, mask);
         }
     }
 }
@@ -13915,9 +16312,11 @@ void GL_APIENTRY StencilFuncContextANGLE(GLeglContext ctx, GLenum func, GLint re
 void GL_APIENTRY
 StencilFuncSeparateContextANGLE(GLeglContext ctx, GLenum face, GLenum func, GLint ref, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFuncSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", face, func,
           ref, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFuncSeparate, face, func, ref, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13927,14 +16326,17 @@ StencilFuncSeparateContextANGLE(GLeglContext ctx, GLenum face, GLenum func, GLin
             ValidateStencilFuncSeparate(context, face, func, ref, mask))
         {
             context->stencilFuncSeparate(face, func, ref, mask);
+            ANGLE_CAPTURE(StencilFuncSeparate, context, face, func, ref, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilMaskContextANGLE(GLeglContext ctx, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilMask);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint mask = %u)", mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilMask, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13943,14 +16345,17 @@ void GL_APIENTRY StencilMaskContextANGLE(GLeglContext ctx, GLuint mask)
         if (context->skipValidation() || ValidateStencilMask(context, mask))
         {
             context->stencilMask(mask);
+            ANGLE_CAPTURE(StencilMask, context, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilMaskSeparateContextANGLE(GLeglContext ctx, GLenum face, GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilMaskSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLuint mask = %u)", face, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilMaskSeparate, face, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13959,14 +16364,17 @@ void GL_APIENTRY StencilMaskSeparateContextANGLE(GLeglContext ctx, GLenum face,
         if (context->skipValidation() || ValidateStencilMaskSeparate(context, face, mask))
         {
             context->stencilMaskSeparate(face, mask);
+            ANGLE_CAPTURE(StencilMaskSeparate, context, face, mask);
         }
     }
 }
 
 void GL_APIENTRY StencilOpContextANGLE(GLeglContext ctx, GLenum fail, GLenum zfail, GLenum zpass)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilOp);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum fail = 0x%X, GLenum zfail = 0x%X, GLenum zpass = 0x%X)", fail, zfail, zpass);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilOp, fail, zfail, zpass);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13975,6 +16383,7 @@ void GL_APIENTRY StencilOpContextANGLE(GLeglContext ctx, GLenum fail, GLenum zfa
         if (context->skipValidation() || ValidateStencilOp(context, fail, zfail, zpass))
         {
             context->stencilOp(fail, zfail, zpass);
+            ANGLE_CAPTURE(StencilOp, context, fail, zfail, zpass);
         }
     }
 }
@@ -13985,9 +16394,11 @@ void GL_APIENTRY StencilOpSeparateContextANGLE(GLeglContext ctx,
                                                GLenum dpfail,
                                                GLenum dppass)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilOpSeparate);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum face = 0x%X, GLenum sfail = 0x%X, GLenum dpfail = 0x%X, GLenum dppass = 0x%X)",
           face, sfail, dpfail, dppass);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilOpSeparate, face, sfail, dpfail, dppass);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -13997,14 +16408,17 @@ void GL_APIENTRY StencilOpSeparateContextANGLE(GLeglContext ctx,
             ValidateStencilOpSeparate(context, face, sfail, dpfail, dppass))
         {
             context->stencilOpSeparate(face, sfail, dpfail, dppass);
+            ANGLE_CAPTURE(StencilOpSeparate, context, face, sfail, dpfail, dppass);
         }
     }
 }
 
 GLboolean GL_APIENTRY TestFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TestFenceNV);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint fence = %u)", fence);
+    ANGLE_BINARY_TRACE(EntryPoint::TestFenceNV, fence);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14012,7 +16426,9 @@ GLboolean GL_APIENTRY TestFenceNVContextANGLE(GLeglContext ctx, GLuint fence)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateTestFenceNV(context, fence))
         {
-            return context->testFenceNV(fence);
+            GLboolean returnValue = context->testFenceNV(fence);
+            ANGLE_CAPTURE(TestFenceNV, context, fence, returnValue);
+            return returnValue;
         }
     }
 
@@ -14025,11 +16441,13 @@ void GL_APIENTRY TexCoordPointerContextANGLE(GLeglContext ctx,
                                              GLsizei stride,
                                              const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexCoordPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::TexCoordPointer, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14040,14 +16458,17 @@ void GL_APIENTRY TexCoordPointerContextANGLE(GLeglContext ctx,
             ValidateTexCoordPointer(context, size, typePacked, stride, pointer))
         {
             context->texCoordPointer(size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(TexCoordPointer, context, size, type, stride, pointer);
         }
     }
 }
 
 void GL_APIENTRY TexEnvfContextANGLE(GLeglContext ctx, GLenum target, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvf, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14058,6 +16479,7 @@ void GL_APIENTRY TexEnvfContextANGLE(GLeglContext ctx, GLenum target, GLenum pna
         if (context->skipValidation() || ValidateTexEnvf(context, targetPacked, pnamePacked, param))
         {
             context->texEnvf(targetPacked, pnamePacked, param);
+            ANGLE_CAPTURE(TexEnvf, context, target, pname, param);
         }
     }
 }
@@ -14067,9 +16489,11 @@ void GL_APIENTRY TexEnvfvContextANGLE(GLeglContext ctx,
                                       GLenum pname,
                                       const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14081,14 +16505,17 @@ void GL_APIENTRY TexEnvfvContextANGLE(GLeglContext ctx,
             ValidateTexEnvfv(context, targetPacked, pnamePacked, params))
         {
             context->texEnvfv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(TexEnvfv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexEnviContextANGLE(GLeglContext ctx, GLenum target, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvi);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvi, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14099,6 +16526,7 @@ void GL_APIENTRY TexEnviContextANGLE(GLeglContext ctx, GLenum target, GLenum pna
         if (context->skipValidation() || ValidateTexEnvi(context, targetPacked, pnamePacked, param))
         {
             context->texEnvi(targetPacked, pnamePacked, param);
+            ANGLE_CAPTURE(TexEnvi, context, target, pname, param);
         }
     }
 }
@@ -14108,9 +16536,11 @@ void GL_APIENTRY TexEnvivContextANGLE(GLeglContext ctx,
                                       GLenum pname,
                                       const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnviv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnviv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14122,15 +16552,18 @@ void GL_APIENTRY TexEnvivContextANGLE(GLeglContext ctx,
             ValidateTexEnviv(context, targetPacked, pnamePacked, params))
         {
             context->texEnviv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(TexEnviv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexEnvxContextANGLE(GLeglContext ctx, GLenum target, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvx, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14141,6 +16574,7 @@ void GL_APIENTRY TexEnvxContextANGLE(GLeglContext ctx, GLenum target, GLenum pna
         if (context->skipValidation() || ValidateTexEnvx(context, targetPacked, pnamePacked, param))
         {
             context->texEnvx(targetPacked, pnamePacked, param);
+            ANGLE_CAPTURE(TexEnvx, context, target, pname, param);
         }
     }
 }
@@ -14150,9 +16584,11 @@ void GL_APIENTRY TexEnvxvContextANGLE(GLeglContext ctx,
                                       GLenum pname,
                                       const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexEnvxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexEnvxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14164,14 +16600,17 @@ void GL_APIENTRY TexEnvxvContextANGLE(GLeglContext ctx,
             ValidateTexEnvxv(context, targetPacked, pnamePacked, params))
         {
             context->texEnvxv(targetPacked, pnamePacked, params);
+            ANGLE_CAPTURE(TexEnvxv, context, target, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexGenfOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum pname, GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenfOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", coord, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenfOES, coord, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14180,6 +16619,7 @@ void GL_APIENTRY TexGenfOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum p
         if (context->skipValidation() || ValidateTexGenfOES(context, coord, pname, param))
         {
             context->texGenf(coord, pname, param);
+            ANGLE_CAPTURE(TexGenfOES, context, coord, pname, param);
         }
     }
 }
@@ -14189,9 +16629,11 @@ void GL_APIENTRY TexGenfvOESContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenfvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenfvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14200,14 +16642,17 @@ void GL_APIENTRY TexGenfvOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateTexGenfvOES(context, coord, pname, params))
         {
             context->texGenfv(coord, pname, params);
+            ANGLE_CAPTURE(TexGenfvOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexGeniOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum pname, GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGeniOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLint param = %d)", coord, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGeniOES, coord, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14216,6 +16661,7 @@ void GL_APIENTRY TexGeniOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum p
         if (context->skipValidation() || ValidateTexGeniOES(context, coord, pname, param))
         {
             context->texGeni(coord, pname, param);
+            ANGLE_CAPTURE(TexGeniOES, context, coord, pname, param);
         }
     }
 }
@@ -14225,9 +16671,11 @@ void GL_APIENTRY TexGenivOESContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenivOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14236,14 +16684,17 @@ void GL_APIENTRY TexGenivOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateTexGenivOES(context, coord, pname, params))
         {
             context->texGeniv(coord, pname, params);
+            ANGLE_CAPTURE(TexGenivOES, context, coord, pname, params);
         }
     }
 }
 
 void GL_APIENTRY TexGenxOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum pname, GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenxOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", coord, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenxOES, coord, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14252,6 +16703,7 @@ void GL_APIENTRY TexGenxOESContextANGLE(GLeglContext ctx, GLenum coord, GLenum p
         if (context->skipValidation() || ValidateTexGenxOES(context, coord, pname, param))
         {
             context->texGenx(coord, pname, param);
+            ANGLE_CAPTURE(TexGenxOES, context, coord, pname, param);
         }
     }
 }
@@ -14261,9 +16713,11 @@ void GL_APIENTRY TexGenxvOESContextANGLE(GLeglContext ctx,
                                          GLenum pname,
                                          const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexGenxvOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum coord = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           coord, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexGenxvOES, coord, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14272,6 +16726,7 @@ void GL_APIENTRY TexGenxvOESContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateTexGenxvOES(context, coord, pname, params))
         {
             context->texGenxv(coord, pname, params);
+            ANGLE_CAPTURE(TexGenxvOES, context, coord, pname, params);
         }
     }
 }
@@ -14287,12 +16742,15 @@ void GL_APIENTRY TexImage2DContextANGLE(GLeglContext ctx,
                                         GLenum type,
                                         const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
         "GLsizei height = %d, GLint border = %d, GLenum format = 0x%X, GLenum type = 0x%X, const "
         "void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage2D, target, level, internalformat, width, height, border,
+                       format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14305,6 +16763,8 @@ void GL_APIENTRY TexImage2DContextANGLE(GLeglContext ctx,
         {
             context->texImage2D(targetPacked, level, internalformat, width, height, border, format,
                                 type, pixels);
+            ANGLE_CAPTURE(TexImage2D, context, target, level, internalformat, width, height, border,
+                          format, type, pixels);
         }
     }
 }
@@ -14321,6 +16781,7 @@ void GL_APIENTRY TexImage3DContextANGLE(GLeglContext ctx,
                                         GLenum type,
                                         const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
@@ -14328,6 +16789,8 @@ void GL_APIENTRY TexImage3DContextANGLE(GLeglContext ctx,
         "type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage3D, target, level, internalformat, width, height, depth,
+                       border, format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14340,6 +16803,8 @@ void GL_APIENTRY TexImage3DContextANGLE(GLeglContext ctx,
         {
             context->texImage3D(targetPacked, level, internalformat, width, height, depth, border,
                                 format, type, pixels);
+            ANGLE_CAPTURE(TexImage3D, context, target, level, internalformat, width, height, depth,
+                          border, format, type, pixels);
         }
     }
 }
@@ -14349,9 +16814,11 @@ void GL_APIENTRY TexParameterIivOESContextANGLE(GLeglContext ctx,
                                                 GLenum pname,
                                                 const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14362,6 +16829,7 @@ void GL_APIENTRY TexParameterIivOESContextANGLE(GLeglContext ctx,
             ValidateTexParameterIivOES(context, targetPacked, pname, params))
         {
             context->texParameterIiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterIivOES, context, target, pname, params);
         }
     }
 }
@@ -14371,9 +16839,11 @@ void GL_APIENTRY TexParameterIuivOESContextANGLE(GLeglContext ctx,
                                                  GLenum pname,
                                                  const GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIuivOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLuint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIuivOES, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14384,6 +16854,7 @@ void GL_APIENTRY TexParameterIuivOESContextANGLE(GLeglContext ctx,
             ValidateTexParameterIuivOES(context, targetPacked, pname, params))
         {
             context->texParameterIuiv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterIuivOES, context, target, pname, params);
         }
     }
 }
@@ -14393,8 +16864,10 @@ void GL_APIENTRY TexParameterfContextANGLE(GLeglContext ctx,
                                            GLenum pname,
                                            GLfloat param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterf);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfloat param = %f)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterf, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14404,6 +16877,7 @@ void GL_APIENTRY TexParameterfContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateTexParameterf(context, targetPacked, pname, param))
         {
             context->texParameterf(targetPacked, pname, param);
+            ANGLE_CAPTURE(TexParameterf, context, target, pname, param);
         }
     }
 }
@@ -14413,9 +16887,11 @@ void GL_APIENTRY TexParameterfvContextANGLE(GLeglContext ctx,
                                             GLenum pname,
                                             const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterfv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfloat *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterfv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14426,6 +16902,7 @@ void GL_APIENTRY TexParameterfvContextANGLE(GLeglContext ctx,
             ValidateTexParameterfv(context, targetPacked, pname, params))
         {
             context->texParameterfv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterfv, context, target, pname, params);
         }
     }
 }
@@ -14435,8 +16912,10 @@ void GL_APIENTRY TexParameteriContextANGLE(GLeglContext ctx,
                                            GLenum pname,
                                            GLint param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameteri);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLint param = %d)", target, pname, param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameteri, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14446,6 +16925,7 @@ void GL_APIENTRY TexParameteriContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateTexParameteri(context, targetPacked, pname, param))
         {
             context->texParameteri(targetPacked, pname, param);
+            ANGLE_CAPTURE(TexParameteri, context, target, pname, param);
         }
     }
 }
@@ -14455,9 +16935,11 @@ void GL_APIENTRY TexParameterivContextANGLE(GLeglContext ctx,
                                             GLenum pname,
                                             const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameteriv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLint *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameteriv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14468,6 +16950,7 @@ void GL_APIENTRY TexParameterivContextANGLE(GLeglContext ctx,
             ValidateTexParameteriv(context, targetPacked, pname, params))
         {
             context->texParameteriv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameteriv, context, target, pname, params);
         }
     }
 }
@@ -14477,9 +16960,11 @@ void GL_APIENTRY TexParameterxContextANGLE(GLeglContext ctx,
                                            GLenum pname,
                                            GLfixed param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterx);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, GLfixed param = 0x%X)", target, pname,
           param);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterx, target, pname, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14489,6 +16974,7 @@ void GL_APIENTRY TexParameterxContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateTexParameterx(context, targetPacked, pname, param))
         {
             context->texParameterx(targetPacked, pname, param);
+            ANGLE_CAPTURE(TexParameterx, context, target, pname, param);
         }
     }
 }
@@ -14498,9 +16984,11 @@ void GL_APIENTRY TexParameterxvContextANGLE(GLeglContext ctx,
                                             GLenum pname,
                                             const GLfixed *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterxv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X, GLenum pname = 0x%X, const GLfixed *params = 0x%016" PRIxPTR ")",
           target, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterxv, target, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14511,6 +16999,7 @@ void GL_APIENTRY TexParameterxvContextANGLE(GLeglContext ctx,
             ValidateTexParameterxv(context, targetPacked, pname, params))
         {
             context->texParameterxv(targetPacked, pname, params);
+            ANGLE_CAPTURE(TexParameterxv, context, target, pname, params);
         }
     }
 }
@@ -14521,11 +17010,13 @@ void GL_APIENTRY TexStorage1DEXTContextANGLE(GLeglContext ctx,
                                              GLenum internalformat,
                                              GLsizei width)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage1DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d)",
         target, levels, internalformat, width);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage1DEXT, target, levels, internalformat, width);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14535,6 +17026,7 @@ void GL_APIENTRY TexStorage1DEXTContextANGLE(GLeglContext ctx,
             ValidateTexStorage1DEXT(context, target, levels, internalformat, width))
         {
             context->texStorage1D(target, levels, internalformat, width);
+            ANGLE_CAPTURE(TexStorage1DEXT, context, target, levels, internalformat, width);
         }
     }
 }
@@ -14546,11 +17038,13 @@ void GL_APIENTRY TexStorage2DContextANGLE(GLeglContext ctx,
                                           GLsizei width,
                                           GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2D, target, levels, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14561,6 +17055,7 @@ void GL_APIENTRY TexStorage2DContextANGLE(GLeglContext ctx,
             ValidateTexStorage2D(context, targetPacked, levels, internalformat, width, height))
         {
             context->texStorage2D(targetPacked, levels, internalformat, width, height);
+            ANGLE_CAPTURE(TexStorage2D, context, target, levels, internalformat, width, height);
         }
     }
 }
@@ -14572,11 +17067,13 @@ void GL_APIENTRY TexStorage2DEXTContextANGLE(GLeglContext ctx,
                                              GLsizei width,
                                              GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d)",
         target, levels, internalformat, width, height);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DEXT, target, levels, internalformat, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14587,6 +17084,7 @@ void GL_APIENTRY TexStorage2DEXTContextANGLE(GLeglContext ctx,
             ValidateTexStorage2DEXT(context, targetPacked, levels, internalformat, width, height))
         {
             context->texStorage2D(targetPacked, levels, internalformat, width, height);
+            ANGLE_CAPTURE(TexStorage2DEXT, context, target, levels, internalformat, width, height);
         }
     }
 }
@@ -14599,11 +17097,14 @@ void GL_APIENTRY TexStorage2DMultisampleContextANGLE(GLeglContext ctx,
                                                      GLsizei height,
                                                      GLboolean fixedsamplelocations)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DMultisample);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DMultisample, target, samples, internalformat, width,
+                       height, fixedsamplelocations);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14616,6 +17117,8 @@ void GL_APIENTRY TexStorage2DMultisampleContextANGLE(GLeglContext ctx,
         {
             context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
                                              fixedsamplelocations);
+            ANGLE_CAPTURE(TexStorage2DMultisample, context, target, samples, internalformat, width,
+                          height, fixedsamplelocations);
         }
     }
 }
@@ -14628,11 +17131,14 @@ void GL_APIENTRY TexStorage3DContextANGLE(GLeglContext ctx,
                                           GLsizei height,
                                           GLsizei depth)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage3D, target, levels, internalformat, width, height,
+                       depth);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14643,6 +17149,8 @@ void GL_APIENTRY TexStorage3DContextANGLE(GLeglContext ctx,
                                                               internalformat, width, height, depth))
         {
             context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+            ANGLE_CAPTURE(TexStorage3D, context, target, levels, internalformat, width, height,
+                          depth);
         }
     }
 }
@@ -14655,11 +17163,14 @@ void GL_APIENTRY TexStorage3DEXTContextANGLE(GLeglContext ctx,
                                              GLsizei height,
                                              GLsizei depth)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d)",
         target, levels, internalformat, width, height, depth);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage3DEXT, target, levels, internalformat, width, height,
+                       depth);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14671,6 +17182,8 @@ void GL_APIENTRY TexStorage3DEXTContextANGLE(GLeglContext ctx,
                                     depth))
         {
             context->texStorage3D(targetPacked, levels, internalformat, width, height, depth);
+            ANGLE_CAPTURE(TexStorage3DEXT, context, target, levels, internalformat, width, height,
+                          depth);
         }
     }
 }
@@ -14684,11 +17197,14 @@ void GL_APIENTRY TexStorage3DMultisampleOESContextANGLE(GLeglContext ctx,
                                                         GLsizei depth,
                                                         GLboolean fixedsamplelocations)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage3DMultisampleOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLsizei depth = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, depth, fixedsamplelocations);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage3DMultisampleOES, target, samples, internalformat,
+                       width, height, depth, fixedsamplelocations);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14701,6 +17217,8 @@ void GL_APIENTRY TexStorage3DMultisampleOESContextANGLE(GLeglContext ctx,
         {
             context->texStorage3DMultisample(targetPacked, samples, internalformat, width, height,
                                              depth, fixedsamplelocations);
+            ANGLE_CAPTURE(TexStorage3DMultisampleOES, context, target, samples, internalformat,
+                          width, height, depth, fixedsamplelocations);
         }
     }
 }
@@ -14714,12 +17232,15 @@ void GL_APIENTRY TexStorageMem2DEXTContextANGLE(GLeglContext ctx,
                                                 GLuint memory,
                                                 GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem2DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalFormat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem2DEXT, target, levels, internalFormat, width,
+                       height, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14732,6 +17253,8 @@ void GL_APIENTRY TexStorageMem2DEXTContextANGLE(GLeglContext ctx,
         {
             context->texStorageMem2D(targetPacked, levels, internalFormat, width, height, memory,
                                      offset);
+            ANGLE_CAPTURE(TexStorageMem2DEXT, context, target, levels, internalFormat, width,
+                          height, memory, offset);
         }
     }
 }
@@ -14746,6 +17269,7 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXTContextANGLE(GLeglContext ctx,
                                                            GLuint memory,
                                                            GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem2DMultisampleEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalFormat = 0x%X, GLsizei width "
@@ -14753,6 +17277,8 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXTContextANGLE(GLeglContext ctx,
         "GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem2DMultisampleEXT, target, samples, internalFormat,
+                       width, height, fixedSampleLocations, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14765,6 +17291,8 @@ void GL_APIENTRY TexStorageMem2DMultisampleEXTContextANGLE(GLeglContext ctx,
         {
             context->texStorageMem2DMultisample(targetPacked, samples, internalFormat, width,
                                                 height, fixedSampleLocations, memory, offset);
+            ANGLE_CAPTURE(TexStorageMem2DMultisampleEXT, context, target, samples, internalFormat,
+                          width, height, fixedSampleLocations, memory, offset);
         }
     }
 }
@@ -14779,12 +17307,15 @@ void GL_APIENTRY TexStorageMem3DEXTContextANGLE(GLeglContext ctx,
                                                 GLuint memory,
                                                 GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem3DEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei levels = %d, GLenum internalFormat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLsizei depth = %d, GLuint memory = %u, GLuint64 offset = %llu)",
         target, levels, internalFormat, width, height, depth, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem3DEXT, target, levels, internalFormat, width,
+                       height, depth, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14797,6 +17328,8 @@ void GL_APIENTRY TexStorageMem3DEXTContextANGLE(GLeglContext ctx,
         {
             context->texStorageMem3D(targetPacked, levels, internalFormat, width, height, depth,
                                      memory, offset);
+            ANGLE_CAPTURE(TexStorageMem3DEXT, context, target, levels, internalFormat, width,
+                          height, depth, memory, offset);
         }
     }
 }
@@ -14812,6 +17345,7 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXTContextANGLE(GLeglContext ctx,
                                                            GLuint memory,
                                                            GLuint64 offset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorageMem3DMultisampleEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalFormat = 0x%X, GLsizei width "
@@ -14819,6 +17353,8 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXTContextANGLE(GLeglContext ctx,
         "GLuint memory = %u, GLuint64 offset = %llu)",
         target, samples, internalFormat, width, height, depth, fixedSampleLocations, memory,
         static_cast<unsigned long long>(offset));
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorageMem3DMultisampleEXT, target, samples, internalFormat,
+                       width, height, depth, fixedSampleLocations, memory, offset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14832,6 +17368,8 @@ void GL_APIENTRY TexStorageMem3DMultisampleEXTContextANGLE(GLeglContext ctx,
             context->texStorageMem3DMultisample(targetPacked, samples, internalFormat, width,
                                                 height, depth, fixedSampleLocations, memory,
                                                 offset);
+            ANGLE_CAPTURE(TexStorageMem3DMultisampleEXT, context, target, samples, internalFormat,
+                          width, height, depth, fixedSampleLocations, memory, offset);
         }
     }
 }
@@ -14847,12 +17385,15 @@ void GL_APIENTRY TexSubImage2DContextANGLE(GLeglContext ctx,
                                            GLenum type,
                                            const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage2D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLsizei "
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, const void "
         "*pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage2D, target, level, xoffset, yoffset, width, height,
+                       format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14865,6 +17406,8 @@ void GL_APIENTRY TexSubImage2DContextANGLE(GLeglContext ctx,
         {
             context->texSubImage2D(targetPacked, level, xoffset, yoffset, width, height, format,
                                    type, pixels);
+            ANGLE_CAPTURE(TexSubImage2D, context, target, level, xoffset, yoffset, width, height,
+                          format, type, pixels);
         }
     }
 }
@@ -14882,6 +17425,7 @@ void GL_APIENTRY TexSubImage3DContextANGLE(GLeglContext ctx,
                                            GLenum type,
                                            const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage3D);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -14889,6 +17433,8 @@ void GL_APIENTRY TexSubImage3DContextANGLE(GLeglContext ctx,
         "= 0x%X, GLenum type = 0x%X, const void *pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage3D, target, level, xoffset, yoffset, zoffset, width,
+                       height, depth, format, type, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14901,6 +17447,8 @@ void GL_APIENTRY TexSubImage3DContextANGLE(GLeglContext ctx,
         {
             context->texSubImage3D(targetPacked, level, xoffset, yoffset, zoffset, width, height,
                                    depth, format, type, pixels);
+            ANGLE_CAPTURE(TexSubImage3D, context, target, level, xoffset, yoffset, zoffset, width,
+                          height, depth, format, type, pixels);
         }
     }
 }
@@ -14911,10 +17459,12 @@ void GL_APIENTRY TransformFeedbackVaryingsContextANGLE(GLeglContext ctx,
                                                        const GLchar *const *varyings,
                                                        GLenum bufferMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TransformFeedbackVaryings);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLsizei count = %d, const GLchar *const*varyings = 0x%016" PRIxPTR
           ", GLenum bufferMode = 0x%X)",
           program, count, (uintptr_t)varyings, bufferMode);
+    ANGLE_BINARY_TRACE(EntryPoint::TransformFeedbackVaryings, program, count, varyings, bufferMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14924,14 +17474,17 @@ void GL_APIENTRY TransformFeedbackVaryingsContextANGLE(GLeglContext ctx,
             ValidateTransformFeedbackVaryings(context, program, count, varyings, bufferMode))
         {
             context->transformFeedbackVaryings(program, count, varyings, bufferMode);
+            ANGLE_CAPTURE(TransformFeedbackVaryings, context, program, count, varyings, bufferMode);
         }
     }
 }
 
 void GL_APIENTRY TranslatefContextANGLE(GLeglContext ctx, GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Translatef);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Translatef, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14940,14 +17493,17 @@ void GL_APIENTRY TranslatefContextANGLE(GLeglContext ctx, GLfloat x, GLfloat y,
         if (context->skipValidation() || ValidateTranslatef(context, x, y, z))
         {
             context->translatef(x, y, z);
+            ANGLE_CAPTURE(Translatef, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY TranslatexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y, GLfixed z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Translatex);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLfixed x = 0x%X, GLfixed y = 0x%X, GLfixed z = 0x%X)", x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::Translatex, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14956,14 +17512,17 @@ void GL_APIENTRY TranslatexContextANGLE(GLeglContext ctx, GLfixed x, GLfixed y,
         if (context->skipValidation() || ValidateTranslatex(context, x, y, z))
         {
             context->translatex(x, y, z);
+            ANGLE_CAPTURE(Translatex, context, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY Uniform1fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f)", location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1f, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14972,6 +17531,7 @@ void GL_APIENTRY Uniform1fContextANGLE(GLeglContext ctx, GLint location, GLfloat
         if (context->skipValidation() || ValidateUniform1f(context, location, v0))
         {
             context->uniform1f(location, v0);
+            ANGLE_CAPTURE(Uniform1f, context, location, v0);
         }
     }
 }
@@ -14981,9 +17541,11 @@ void GL_APIENTRY Uniform1fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -14992,14 +17554,17 @@ void GL_APIENTRY Uniform1fvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform1fv(context, location, count, value))
         {
             context->uniform1fv(location, count, value);
+            ANGLE_CAPTURE(Uniform1fv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform1iContextANGLE(GLeglContext ctx, GLint location, GLint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d)", location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1i, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15008,6 +17573,7 @@ void GL_APIENTRY Uniform1iContextANGLE(GLeglContext ctx, GLint location, GLint v
         if (context->skipValidation() || ValidateUniform1i(context, location, v0))
         {
             context->uniform1i(location, v0);
+            ANGLE_CAPTURE(Uniform1i, context, location, v0);
         }
     }
 }
@@ -15017,9 +17583,11 @@ void GL_APIENTRY Uniform1ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15028,14 +17596,17 @@ void GL_APIENTRY Uniform1ivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform1iv(context, location, count, value))
         {
             context->uniform1iv(location, count, value);
+            ANGLE_CAPTURE(Uniform1iv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform1uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u)", location, v0);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1ui, location, v0);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15044,6 +17615,7 @@ void GL_APIENTRY Uniform1uiContextANGLE(GLeglContext ctx, GLint location, GLuint
         if (context->skipValidation() || ValidateUniform1ui(context, location, v0))
         {
             context->uniform1ui(location, v0);
+            ANGLE_CAPTURE(Uniform1ui, context, location, v0);
         }
     }
 }
@@ -15053,9 +17625,11 @@ void GL_APIENTRY Uniform1uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform1uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform1uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15064,14 +17638,17 @@ void GL_APIENTRY Uniform1uivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform1uiv(context, location, count, value))
         {
             context->uniform1uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform1uiv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform2fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0, GLfloat v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f)", location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2f, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15080,6 +17657,7 @@ void GL_APIENTRY Uniform2fContextANGLE(GLeglContext ctx, GLint location, GLfloat
         if (context->skipValidation() || ValidateUniform2f(context, location, v0, v1))
         {
             context->uniform2f(location, v0, v1);
+            ANGLE_CAPTURE(Uniform2f, context, location, v0, v1);
         }
     }
 }
@@ -15089,9 +17667,11 @@ void GL_APIENTRY Uniform2fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15100,14 +17680,17 @@ void GL_APIENTRY Uniform2fvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform2fv(context, location, count, value))
         {
             context->uniform2fv(location, count, value);
+            ANGLE_CAPTURE(Uniform2fv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform2iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d)", location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2i, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15116,6 +17699,7 @@ void GL_APIENTRY Uniform2iContextANGLE(GLeglContext ctx, GLint location, GLint v
         if (context->skipValidation() || ValidateUniform2i(context, location, v0, v1))
         {
             context->uniform2i(location, v0, v1);
+            ANGLE_CAPTURE(Uniform2i, context, location, v0, v1);
         }
     }
 }
@@ -15125,9 +17709,11 @@ void GL_APIENTRY Uniform2ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15136,14 +17722,17 @@ void GL_APIENTRY Uniform2ivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform2iv(context, location, count, value))
         {
             context->uniform2iv(location, count, value);
+            ANGLE_CAPTURE(Uniform2iv, context, location, count, value);
         }
     }
 }
 
 void GL_APIENTRY Uniform2uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u)", location, v0, v1);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2ui, location, v0, v1);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15152,6 +17741,7 @@ void GL_APIENTRY Uniform2uiContextANGLE(GLeglContext ctx, GLint location, GLuint
         if (context->skipValidation() || ValidateUniform2ui(context, location, v0, v1))
         {
             context->uniform2ui(location, v0, v1);
+            ANGLE_CAPTURE(Uniform2ui, context, location, v0, v1);
         }
     }
 }
@@ -15161,9 +17751,11 @@ void GL_APIENTRY Uniform2uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform2uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform2uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15172,6 +17764,7 @@ void GL_APIENTRY Uniform2uivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform2uiv(context, location, count, value))
         {
             context->uniform2uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform2uiv, context, location, count, value);
         }
     }
 }
@@ -15179,9 +17772,11 @@ void GL_APIENTRY Uniform2uivContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 Uniform3fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0, GLfloat v1, GLfloat v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f)", location, v0,
           v1, v2);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3f, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15190,6 +17785,7 @@ Uniform3fContextANGLE(GLeglContext ctx, GLint location, GLfloat v0, GLfloat v1,
         if (context->skipValidation() || ValidateUniform3f(context, location, v0, v1, v2))
         {
             context->uniform3f(location, v0, v1, v2);
+            ANGLE_CAPTURE(Uniform3f, context, location, v0, v1, v2);
         }
     }
 }
@@ -15199,9 +17795,11 @@ void GL_APIENTRY Uniform3fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15210,6 +17808,7 @@ void GL_APIENTRY Uniform3fvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform3fv(context, location, count, value))
         {
             context->uniform3fv(location, count, value);
+            ANGLE_CAPTURE(Uniform3fv, context, location, count, value);
         }
     }
 }
@@ -15217,9 +17816,11 @@ void GL_APIENTRY Uniform3fvContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 Uniform3iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1, GLint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d)", location, v0, v1,
           v2);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3i, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15228,6 +17829,7 @@ Uniform3iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1, GLin
         if (context->skipValidation() || ValidateUniform3i(context, location, v0, v1, v2))
         {
             context->uniform3i(location, v0, v1, v2);
+            ANGLE_CAPTURE(Uniform3i, context, location, v0, v1, v2);
         }
     }
 }
@@ -15237,9 +17839,11 @@ void GL_APIENTRY Uniform3ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15248,6 +17852,7 @@ void GL_APIENTRY Uniform3ivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform3iv(context, location, count, value))
         {
             context->uniform3iv(location, count, value);
+            ANGLE_CAPTURE(Uniform3iv, context, location, count, value);
         }
     }
 }
@@ -15255,9 +17860,11 @@ void GL_APIENTRY Uniform3ivContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 Uniform3uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1, GLuint v2)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u)", location, v0, v1,
           v2);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3ui, location, v0, v1, v2);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15266,6 +17873,7 @@ Uniform3uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1, G
         if (context->skipValidation() || ValidateUniform3ui(context, location, v0, v1, v2))
         {
             context->uniform3ui(location, v0, v1, v2);
+            ANGLE_CAPTURE(Uniform3ui, context, location, v0, v1, v2);
         }
     }
 }
@@ -15275,9 +17883,11 @@ void GL_APIENTRY Uniform3uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform3uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform3uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15286,6 +17896,7 @@ void GL_APIENTRY Uniform3uivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform3uiv(context, location, count, value))
         {
             context->uniform3uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform3uiv, context, location, count, value);
         }
     }
 }
@@ -15297,10 +17908,12 @@ void GL_APIENTRY Uniform4fContextANGLE(GLeglContext ctx,
                                        GLfloat v2,
                                        GLfloat v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLfloat v0 = %f, GLfloat v1 = %f, GLfloat v2 = %f, GLfloat v3 = %f)",
         location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4f, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15309,6 +17922,7 @@ void GL_APIENTRY Uniform4fContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform4f(context, location, v0, v1, v2, v3))
         {
             context->uniform4f(location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(Uniform4f, context, location, v0, v1, v2, v3);
         }
     }
 }
@@ -15318,9 +17932,11 @@ void GL_APIENTRY Uniform4fvContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLfloat *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4fv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15329,6 +17945,7 @@ void GL_APIENTRY Uniform4fvContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform4fv(context, location, count, value))
         {
             context->uniform4fv(location, count, value);
+            ANGLE_CAPTURE(Uniform4fv, context, location, count, value);
         }
     }
 }
@@ -15336,9 +17953,11 @@ void GL_APIENTRY Uniform4fvContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 Uniform4iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1, GLint v2, GLint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLint v0 = %d, GLint v1 = %d, GLint v2 = %d, GLint v3 = %d)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4i, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15347,6 +17966,7 @@ Uniform4iContextANGLE(GLeglContext ctx, GLint location, GLint v0, GLint v1, GLin
         if (context->skipValidation() || ValidateUniform4i(context, location, v0, v1, v2, v3))
         {
             context->uniform4i(location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(Uniform4i, context, location, v0, v1, v2, v3);
         }
     }
 }
@@ -15356,9 +17976,11 @@ void GL_APIENTRY Uniform4ivContextANGLE(GLeglContext ctx,
                                         GLsizei count,
                                         const GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4iv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15367,6 +17989,7 @@ void GL_APIENTRY Uniform4ivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform4iv(context, location, count, value))
         {
             context->uniform4iv(location, count, value);
+            ANGLE_CAPTURE(Uniform4iv, context, location, count, value);
         }
     }
 }
@@ -15374,9 +17997,11 @@ void GL_APIENTRY Uniform4ivContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 Uniform4uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1, GLuint v2, GLuint v3)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLuint v0 = %u, GLuint v1 = %u, GLuint v2 = %u, GLuint v3 = %u)",
           location, v0, v1, v2, v3);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4ui, location, v0, v1, v2, v3);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15385,6 +18010,7 @@ Uniform4uiContextANGLE(GLeglContext ctx, GLint location, GLuint v0, GLuint v1, G
         if (context->skipValidation() || ValidateUniform4ui(context, location, v0, v1, v2, v3))
         {
             context->uniform4ui(location, v0, v1, v2, v3);
+            ANGLE_CAPTURE(Uniform4ui, context, location, v0, v1, v2, v3);
         }
     }
 }
@@ -15394,9 +18020,11 @@ void GL_APIENTRY Uniform4uivContextANGLE(GLeglContext ctx,
                                          GLsizei count,
                                          const GLuint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Uniform4uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint location = %d, GLsizei count = %d, const GLuint *value = 0x%016" PRIxPTR ")",
           location, count, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::Uniform4uiv, location, count, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15405,6 +18033,7 @@ void GL_APIENTRY Uniform4uivContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateUniform4uiv(context, location, count, value))
         {
             context->uniform4uiv(location, count, value);
+            ANGLE_CAPTURE(Uniform4uiv, context, location, count, value);
         }
     }
 }
@@ -15414,9 +18043,12 @@ void GL_APIENTRY UniformBlockBindingContextANGLE(GLeglContext ctx,
                                                  GLuint uniformBlockIndex,
                                                  GLuint uniformBlockBinding)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformBlockBinding);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLuint uniformBlockIndex = %u, GLuint uniformBlockBinding = %u)",
           program, uniformBlockIndex, uniformBlockBinding);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformBlockBinding, program, uniformBlockIndex,
+                       uniformBlockBinding);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15426,6 +18058,8 @@ void GL_APIENTRY UniformBlockBindingContextANGLE(GLeglContext ctx,
             ValidateUniformBlockBinding(context, program, uniformBlockIndex, uniformBlockBinding))
         {
             context->uniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
+            ANGLE_CAPTURE(UniformBlockBinding, context, program, uniformBlockIndex,
+                          uniformBlockBinding);
         }
     }
 }
@@ -15436,11 +18070,13 @@ void GL_APIENTRY UniformMatrix2fvContextANGLE(GLeglContext ctx,
                                               GLboolean transpose,
                                               const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15450,6 +18086,7 @@ void GL_APIENTRY UniformMatrix2fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix2fv(context, location, count, transpose, value))
         {
             context->uniformMatrix2fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix2fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15460,11 +18097,13 @@ void GL_APIENTRY UniformMatrix2x3fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2x3fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15474,6 +18113,7 @@ void GL_APIENTRY UniformMatrix2x3fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix2x3fv(context, location, count, transpose, value))
         {
             context->uniformMatrix2x3fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix2x3fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15484,11 +18124,13 @@ void GL_APIENTRY UniformMatrix2x4fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix2x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix2x4fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15498,6 +18140,7 @@ void GL_APIENTRY UniformMatrix2x4fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix2x4fv(context, location, count, transpose, value))
         {
             context->uniformMatrix2x4fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix2x4fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15508,11 +18151,13 @@ void GL_APIENTRY UniformMatrix3fvContextANGLE(GLeglContext ctx,
                                               GLboolean transpose,
                                               const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15522,6 +18167,7 @@ void GL_APIENTRY UniformMatrix3fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix3fv(context, location, count, transpose, value))
         {
             context->uniformMatrix3fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix3fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15532,11 +18178,13 @@ void GL_APIENTRY UniformMatrix3x2fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3x2fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15546,6 +18194,7 @@ void GL_APIENTRY UniformMatrix3x2fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix3x2fv(context, location, count, transpose, value))
         {
             context->uniformMatrix3x2fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix3x2fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15556,11 +18205,13 @@ void GL_APIENTRY UniformMatrix3x4fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix3x4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix3x4fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15570,6 +18221,7 @@ void GL_APIENTRY UniformMatrix3x4fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix3x4fv(context, location, count, transpose, value))
         {
             context->uniformMatrix3x4fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix3x4fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15580,11 +18232,13 @@ void GL_APIENTRY UniformMatrix4fvContextANGLE(GLeglContext ctx,
                                               GLboolean transpose,
                                               const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15594,6 +18248,7 @@ void GL_APIENTRY UniformMatrix4fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix4fv(context, location, count, transpose, value))
         {
             context->uniformMatrix4fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix4fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15604,11 +18259,13 @@ void GL_APIENTRY UniformMatrix4x2fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4x2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4x2fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15618,6 +18275,7 @@ void GL_APIENTRY UniformMatrix4x2fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix4x2fv(context, location, count, transpose, value))
         {
             context->uniformMatrix4x2fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix4x2fv, context, location, count, transpose, value);
         }
     }
 }
@@ -15628,11 +18286,13 @@ void GL_APIENTRY UniformMatrix4x3fvContextANGLE(GLeglContext ctx,
                                                 GLboolean transpose,
                                                 const GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UniformMatrix4x3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint location = %d, GLsizei count = %d, GLboolean transpose = %u, const GLfloat *value "
         "= 0x%016" PRIxPTR ")",
         location, count, transpose, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::UniformMatrix4x3fv, location, count, transpose, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15642,14 +18302,17 @@ void GL_APIENTRY UniformMatrix4x3fvContextANGLE(GLeglContext ctx,
             ValidateUniformMatrix4x3fv(context, location, count, transpose, value))
         {
             context->uniformMatrix4x3fv(location, count, transpose, value);
+            ANGLE_CAPTURE(UniformMatrix4x3fv, context, location, count, transpose, value);
         }
     }
 }
 
 GLboolean GL_APIENTRY UnmapBufferContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UnmapBuffer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::UnmapBuffer, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15658,7 +18321,9 @@ GLboolean GL_APIENTRY UnmapBufferContextANGLE(GLeglContext ctx, GLenum target)
         BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
         if (context->skipValidation() || ValidateUnmapBuffer(context, targetPacked))
         {
-            return context->unmapBuffer(targetPacked);
+            GLboolean returnValue = context->unmapBuffer(targetPacked);
+            ANGLE_CAPTURE(UnmapBuffer, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -15667,8 +18332,10 @@ GLboolean GL_APIENTRY UnmapBufferContextANGLE(GLeglContext ctx, GLenum target)
 
 GLboolean GL_APIENTRY UnmapBufferOESContextANGLE(GLeglContext ctx, GLenum target)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UnmapBufferOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum target = 0x%X)", target);
+    ANGLE_BINARY_TRACE(EntryPoint::UnmapBufferOES, target);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15677,7 +18344,9 @@ GLboolean GL_APIENTRY UnmapBufferOESContextANGLE(GLeglContext ctx, GLenum target
         BufferBinding targetPacked = FromGLenum<BufferBinding>(target);
         if (context->skipValidation() || ValidateUnmapBufferOES(context, targetPacked))
         {
-            return context->unmapBuffer(targetPacked);
+            GLboolean returnValue = context->unmapBuffer(targetPacked);
+            ANGLE_CAPTURE(UnmapBufferOES, context, target, returnValue);
+            return returnValue;
         }
     }
 
@@ -15686,8 +18355,10 @@ GLboolean GL_APIENTRY UnmapBufferOESContextANGLE(GLeglContext ctx, GLenum target
 
 void GL_APIENTRY UseProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UseProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::UseProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15696,6 +18367,7 @@ void GL_APIENTRY UseProgramContextANGLE(GLeglContext ctx, GLuint program)
         if (context->skipValidation() || ValidateUseProgram(context, program))
         {
             context->useProgram(program);
+            ANGLE_CAPTURE(UseProgram, context, program);
         }
     }
 }
@@ -15705,9 +18377,11 @@ void GL_APIENTRY UseProgramStagesContextANGLE(GLeglContext ctx,
                                               GLbitfield stages,
                                               GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::UseProgramStages);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u, GLbitfield stages = 0x%X, GLuint program = %u)", pipeline, stages,
           program);
+    ANGLE_BINARY_TRACE(EntryPoint::UseProgramStages, pipeline, stages, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15717,14 +18391,17 @@ void GL_APIENTRY UseProgramStagesContextANGLE(GLeglContext ctx,
             ValidateUseProgramStages(context, pipeline, stages, program))
         {
             context->useProgramStages(pipeline, stages, program);
+            ANGLE_CAPTURE(UseProgramStages, context, pipeline, stages, program);
         }
     }
 }
 
 void GL_APIENTRY ValidateProgramContextANGLE(GLeglContext ctx, GLuint program)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ValidateProgram);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u)", program);
+    ANGLE_BINARY_TRACE(EntryPoint::ValidateProgram, program);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15733,14 +18410,17 @@ void GL_APIENTRY ValidateProgramContextANGLE(GLeglContext ctx, GLuint program)
         if (context->skipValidation() || ValidateValidateProgram(context, program))
         {
             context->validateProgram(program);
+            ANGLE_CAPTURE(ValidateProgram, context, program);
         }
     }
 }
 
 void GL_APIENTRY ValidateProgramPipelineContextANGLE(GLeglContext ctx, GLuint pipeline)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ValidateProgramPipeline);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint pipeline = %u)", pipeline);
+    ANGLE_BINARY_TRACE(EntryPoint::ValidateProgramPipeline, pipeline);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15749,14 +18429,17 @@ void GL_APIENTRY ValidateProgramPipelineContextANGLE(GLeglContext ctx, GLuint pi
         if (context->skipValidation() || ValidateValidateProgramPipeline(context, pipeline))
         {
             context->validateProgramPipeline(pipeline);
+            ANGLE_CAPTURE(ValidateProgramPipeline, context, pipeline);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib1fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib1f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f)", index, x);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib1f, index, x);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15765,14 +18448,17 @@ void GL_APIENTRY VertexAttrib1fContextANGLE(GLeglContext ctx, GLuint index, GLfl
         if (context->skipValidation() || ValidateVertexAttrib1f(context, index, x))
         {
             context->vertexAttrib1f(index, x);
+            ANGLE_CAPTURE(VertexAttrib1f, context, index, x);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib1fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib1fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib1fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15781,14 +18467,17 @@ void GL_APIENTRY VertexAttrib1fvContextANGLE(GLeglContext ctx, GLuint index, con
         if (context->skipValidation() || ValidateVertexAttrib1fv(context, index, v))
         {
             context->vertexAttrib1fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib1fv, context, index, v);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib2fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x, GLfloat y)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib2f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f)", index, x, y);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib2f, index, x, y);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15797,14 +18486,17 @@ void GL_APIENTRY VertexAttrib2fContextANGLE(GLeglContext ctx, GLuint index, GLfl
         if (context->skipValidation() || ValidateVertexAttrib2f(context, index, x, y))
         {
             context->vertexAttrib2f(index, x, y);
+            ANGLE_CAPTURE(VertexAttrib2f, context, index, x, y);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib2fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib2fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib2fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15813,6 +18505,7 @@ void GL_APIENTRY VertexAttrib2fvContextANGLE(GLeglContext ctx, GLuint index, con
         if (context->skipValidation() || ValidateVertexAttrib2fv(context, index, v))
         {
             context->vertexAttrib2fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib2fv, context, index, v);
         }
     }
 }
@@ -15820,8 +18513,10 @@ void GL_APIENTRY VertexAttrib2fvContextANGLE(GLeglContext ctx, GLuint index, con
 void GL_APIENTRY
 VertexAttrib3fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x, GLfloat y, GLfloat z)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib3f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f)", index, x, y, z);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib3f, index, x, y, z);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15830,14 +18525,17 @@ VertexAttrib3fContextANGLE(GLeglContext ctx, GLuint index, GLfloat x, GLfloat y,
         if (context->skipValidation() || ValidateVertexAttrib3f(context, index, x, y, z))
         {
             context->vertexAttrib3f(index, x, y, z);
+            ANGLE_CAPTURE(VertexAttrib3f, context, index, x, y, z);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib3fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib3fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib3fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15846,6 +18544,7 @@ void GL_APIENTRY VertexAttrib3fvContextANGLE(GLeglContext ctx, GLuint index, con
         if (context->skipValidation() || ValidateVertexAttrib3fv(context, index, v))
         {
             context->vertexAttrib3fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib3fv, context, index, v);
         }
     }
 }
@@ -15857,9 +18556,11 @@ void GL_APIENTRY VertexAttrib4fContextANGLE(GLeglContext ctx,
                                             GLfloat z,
                                             GLfloat w)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib4f);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLfloat x = %f, GLfloat y = %f, GLfloat z = %f, GLfloat w = %f)",
           index, x, y, z, w);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib4f, index, x, y, z, w);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15868,14 +18569,17 @@ void GL_APIENTRY VertexAttrib4fContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateVertexAttrib4f(context, index, x, y, z, w))
         {
             context->vertexAttrib4f(index, x, y, z, w);
+            ANGLE_CAPTURE(VertexAttrib4f, context, index, x, y, z, w);
         }
     }
 }
 
 void GL_APIENTRY VertexAttrib4fvContextANGLE(GLeglContext ctx, GLuint index, const GLfloat *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttrib4fv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLfloat *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttrib4fv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15884,6 +18588,7 @@ void GL_APIENTRY VertexAttrib4fvContextANGLE(GLeglContext ctx, GLuint index, con
         if (context->skipValidation() || ValidateVertexAttrib4fv(context, index, v))
         {
             context->vertexAttrib4fv(index, v);
+            ANGLE_CAPTURE(VertexAttrib4fv, context, index, v);
         }
     }
 }
@@ -15892,8 +18597,10 @@ void GL_APIENTRY VertexAttribBindingContextANGLE(GLeglContext ctx,
                                                  GLuint attribindex,
                                                  GLuint bindingindex)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribBinding);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint attribindex = %u, GLuint bindingindex = %u)", attribindex, bindingindex);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribBinding, attribindex, bindingindex);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15903,14 +18610,17 @@ void GL_APIENTRY VertexAttribBindingContextANGLE(GLeglContext ctx,
             ValidateVertexAttribBinding(context, attribindex, bindingindex))
         {
             context->vertexAttribBinding(attribindex, bindingindex);
+            ANGLE_CAPTURE(VertexAttribBinding, context, attribindex, bindingindex);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribDivisorContextANGLE(GLeglContext ctx, GLuint index, GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisor, index, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15919,6 +18629,7 @@ void GL_APIENTRY VertexAttribDivisorContextANGLE(GLeglContext ctx, GLuint index,
         if (context->skipValidation() || ValidateVertexAttribDivisor(context, index, divisor))
         {
             context->vertexAttribDivisor(index, divisor);
+            ANGLE_CAPTURE(VertexAttribDivisor, context, index, divisor);
         }
     }
 }
@@ -15927,8 +18638,10 @@ void GL_APIENTRY VertexAttribDivisorANGLEContextANGLE(GLeglContext ctx,
                                                       GLuint index,
                                                       GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisorANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisorANGLE, index, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15937,14 +18650,17 @@ void GL_APIENTRY VertexAttribDivisorANGLEContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateVertexAttribDivisorANGLE(context, index, divisor))
         {
             context->vertexAttribDivisor(index, divisor);
+            ANGLE_CAPTURE(VertexAttribDivisorANGLE, context, index, divisor);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribDivisorEXTContextANGLE(GLeglContext ctx, GLuint index, GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribDivisorEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint divisor = %u)", index, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribDivisorEXT, index, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15953,6 +18669,7 @@ void GL_APIENTRY VertexAttribDivisorEXTContextANGLE(GLeglContext ctx, GLuint ind
         if (context->skipValidation() || ValidateVertexAttribDivisorEXT(context, index, divisor))
         {
             context->vertexAttribDivisor(index, divisor);
+            ANGLE_CAPTURE(VertexAttribDivisorEXT, context, index, divisor);
         }
     }
 }
@@ -15964,11 +18681,14 @@ void GL_APIENTRY VertexAttribFormatContextANGLE(GLeglContext ctx,
                                                 GLboolean normalized,
                                                 GLuint relativeoffset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribFormat);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLuint relativeoffset = %u)",
         attribindex, size, type, normalized, relativeoffset);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribFormat, attribindex, size, type, normalized,
+                       relativeoffset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15980,6 +18700,8 @@ void GL_APIENTRY VertexAttribFormatContextANGLE(GLeglContext ctx,
                                        relativeoffset))
         {
             context->vertexAttribFormat(attribindex, size, typePacked, normalized, relativeoffset);
+            ANGLE_CAPTURE(VertexAttribFormat, context, attribindex, size, type, normalized,
+                          relativeoffset);
         }
     }
 }
@@ -15987,9 +18709,11 @@ void GL_APIENTRY VertexAttribFormatContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 VertexAttribI4iContextANGLE(GLeglContext ctx, GLuint index, GLint x, GLint y, GLint z, GLint w)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4i);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLint x = %d, GLint y = %d, GLint z = %d, GLint w = %d)", index, x,
           y, z, w);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4i, index, x, y, z, w);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -15998,14 +18722,17 @@ VertexAttribI4iContextANGLE(GLeglContext ctx, GLuint index, GLint x, GLint y, GL
         if (context->skipValidation() || ValidateVertexAttribI4i(context, index, x, y, z, w))
         {
             context->vertexAttribI4i(index, x, y, z, w);
+            ANGLE_CAPTURE(VertexAttribI4i, context, index, x, y, z, w);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribI4ivContextANGLE(GLeglContext ctx, GLuint index, const GLint *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4iv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4iv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16014,6 +18741,7 @@ void GL_APIENTRY VertexAttribI4ivContextANGLE(GLeglContext ctx, GLuint index, co
         if (context->skipValidation() || ValidateVertexAttribI4iv(context, index, v))
         {
             context->vertexAttribI4iv(index, v);
+            ANGLE_CAPTURE(VertexAttribI4iv, context, index, v);
         }
     }
 }
@@ -16021,9 +18749,11 @@ void GL_APIENTRY VertexAttribI4ivContextANGLE(GLeglContext ctx, GLuint index, co
 void GL_APIENTRY
 VertexAttribI4uiContextANGLE(GLeglContext ctx, GLuint index, GLuint x, GLuint y, GLuint z, GLuint w)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4ui);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, GLuint x = %u, GLuint y = %u, GLuint z = %u, GLuint w = %u)", index,
           x, y, z, w);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4ui, index, x, y, z, w);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16032,14 +18762,17 @@ VertexAttribI4uiContextANGLE(GLeglContext ctx, GLuint index, GLuint x, GLuint y,
         if (context->skipValidation() || ValidateVertexAttribI4ui(context, index, x, y, z, w))
         {
             context->vertexAttribI4ui(index, x, y, z, w);
+            ANGLE_CAPTURE(VertexAttribI4ui, context, index, x, y, z, w);
         }
     }
 }
 
 void GL_APIENTRY VertexAttribI4uivContextANGLE(GLeglContext ctx, GLuint index, const GLuint *v)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribI4uiv);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint index = %u, const GLuint *v = 0x%016" PRIxPTR ")", index, (uintptr_t)v);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribI4uiv, index, v);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16048,6 +18781,7 @@ void GL_APIENTRY VertexAttribI4uivContextANGLE(GLeglContext ctx, GLuint index, c
         if (context->skipValidation() || ValidateVertexAttribI4uiv(context, index, v))
         {
             context->vertexAttribI4uiv(index, v);
+            ANGLE_CAPTURE(VertexAttribI4uiv, context, index, v);
         }
     }
 }
@@ -16058,11 +18792,13 @@ void GL_APIENTRY VertexAttribIFormatContextANGLE(GLeglContext ctx,
                                                  GLenum type,
                                                  GLuint relativeoffset)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribIFormat);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint attribindex = %u, GLint size = %d, GLenum type = 0x%X, GLuint relativeoffset = "
         "%u)",
         attribindex, size, type, relativeoffset);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribIFormat, attribindex, size, type, relativeoffset);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16073,6 +18809,7 @@ void GL_APIENTRY VertexAttribIFormatContextANGLE(GLeglContext ctx,
             ValidateVertexAttribIFormat(context, attribindex, size, typePacked, relativeoffset))
         {
             context->vertexAttribIFormat(attribindex, size, typePacked, relativeoffset);
+            ANGLE_CAPTURE(VertexAttribIFormat, context, attribindex, size, type, relativeoffset);
         }
     }
 }
@@ -16084,11 +18821,13 @@ void GL_APIENTRY VertexAttribIPointerContextANGLE(GLeglContext ctx,
                                                   GLsizei stride,
                                                   const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribIPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void "
         "*pointer = 0x%016" PRIxPTR ")",
         index, size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribIPointer, index, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16099,6 +18838,7 @@ void GL_APIENTRY VertexAttribIPointerContextANGLE(GLeglContext ctx,
             ValidateVertexAttribIPointer(context, index, size, typePacked, stride, pointer))
         {
             context->vertexAttribIPointer(index, size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(VertexAttribIPointer, context, index, size, type, stride, pointer);
         }
     }
 }
@@ -16111,11 +18851,14 @@ void GL_APIENTRY VertexAttribPointerContextANGLE(GLeglContext ctx,
                                                  GLsizei stride,
                                                  const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexAttribPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLint size = %d, GLenum type = 0x%X, GLboolean normalized = %u, "
         "GLsizei stride = %d, const void *pointer = 0x%016" PRIxPTR ")",
         index, size, type, normalized, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexAttribPointer, index, size, type, normalized, stride,
+                       pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16127,6 +18870,8 @@ void GL_APIENTRY VertexAttribPointerContextANGLE(GLeglContext ctx,
                                         pointer))
         {
             context->vertexAttribPointer(index, size, typePacked, normalized, stride, pointer);
+            ANGLE_CAPTURE(VertexAttribPointer, context, index, size, type, normalized, stride,
+                          pointer);
         }
     }
 }
@@ -16135,8 +18880,10 @@ void GL_APIENTRY VertexBindingDivisorContextANGLE(GLeglContext ctx,
                                                   GLuint bindingindex,
                                                   GLuint divisor)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexBindingDivisor);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint bindingindex = %u, GLuint divisor = %u)", bindingindex, divisor);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexBindingDivisor, bindingindex, divisor);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16146,6 +18893,7 @@ void GL_APIENTRY VertexBindingDivisorContextANGLE(GLeglContext ctx,
             ValidateVertexBindingDivisor(context, bindingindex, divisor))
         {
             context->vertexBindingDivisor(bindingindex, divisor);
+            ANGLE_CAPTURE(VertexBindingDivisor, context, bindingindex, divisor);
         }
     }
 }
@@ -16156,11 +18904,13 @@ void GL_APIENTRY VertexPointerContextANGLE(GLeglContext ctx,
                                            GLsizei stride,
                                            const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::VertexPointer);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::VertexPointer, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16171,6 +18921,7 @@ void GL_APIENTRY VertexPointerContextANGLE(GLeglContext ctx,
             ValidateVertexPointer(context, size, typePacked, stride, pointer))
         {
             context->vertexPointer(size, typePacked, stride, pointer);
+            ANGLE_CAPTURE(VertexPointer, context, size, type, stride, pointer);
         }
     }
 }
@@ -16178,9 +18929,11 @@ void GL_APIENTRY VertexPointerContextANGLE(GLeglContext ctx,
 void GL_APIENTRY
 ViewportContextANGLE(GLeglContext ctx, GLint x, GLint y, GLsizei width, GLsizei height)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::Viewport);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d)", x, y, width,
           height);
+    ANGLE_BINARY_TRACE(EntryPoint::Viewport, x, y, width, height);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16189,6 +18942,7 @@ ViewportContextANGLE(GLeglContext ctx, GLint x, GLint y, GLsizei width, GLsizei
         if (context->skipValidation() || ValidateViewport(context, x, y, width, height))
         {
             context->viewport(x, y, width, height);
+            ANGLE_CAPTURE(Viewport, context, x, y, width, height);
         }
     }
 }
@@ -16201,6 +18955,7 @@ void GL_APIENTRY WaitSemaphoreEXTContextANGLE(GLeglContext ctx,
                                               const GLuint *textures,
                                               const GLenum *srcLayouts)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WaitSemaphoreEXT);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint semaphore = %u, GLuint numBufferBarriers = %u, const GLuint *buffers = "
@@ -16208,6 +18963,8 @@ void GL_APIENTRY WaitSemaphoreEXTContextANGLE(GLeglContext ctx,
         ", const GLenum *srcLayouts = 0x%016" PRIxPTR ")",
         semaphore, numBufferBarriers, (uintptr_t)buffers, numTextureBarriers, (uintptr_t)textures,
         (uintptr_t)srcLayouts);
+    ANGLE_BINARY_TRACE(EntryPoint::WaitSemaphoreEXT, semaphore, numBufferBarriers, buffers,
+                       numTextureBarriers, textures, srcLayouts);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16219,6 +18976,8 @@ void GL_APIENTRY WaitSemaphoreEXTContextANGLE(GLeglContext ctx,
         {
             context->waitSemaphore(semaphore, numBufferBarriers, buffers, numTextureBarriers,
                                    textures, srcLayouts);
+            ANGLE_CAPTURE(WaitSemaphoreEXT, context, semaphore, numBufferBarriers, buffers,
+                          numTextureBarriers, textures, srcLayouts);
         }
     }
 }
@@ -16228,9 +18987,11 @@ void GL_APIENTRY WaitSyncContextANGLE(GLeglContext ctx,
                                       GLbitfield flags,
                                       GLuint64 timeout)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WaitSync);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsync sync = 0x%016" PRIxPTR ", GLbitfield flags = 0x%X, GLuint64 timeout = %llu)",
           (uintptr_t)sync, flags, static_cast<unsigned long long>(timeout));
+    ANGLE_BINARY_TRACE(EntryPoint::WaitSync, sync, flags, timeout);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16239,6 +19000,7 @@ void GL_APIENTRY WaitSyncContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateWaitSync(context, sync, flags, timeout))
         {
             context->waitSync(sync, flags, timeout);
+            ANGLE_CAPTURE(WaitSync, context, sync, flags, timeout);
         }
     }
 }
@@ -16249,11 +19011,13 @@ void GL_APIENTRY WeightPointerOESContextANGLE(GLeglContext ctx,
                                               GLsizei stride,
                                               const void *pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::WeightPointerOES);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint size = %d, GLenum type = 0x%X, GLsizei stride = %d, const void *pointer = "
         "0x%016" PRIxPTR ")",
         size, type, stride, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::WeightPointerOES, size, type, stride, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16263,6 +19027,7 @@ void GL_APIENTRY WeightPointerOESContextANGLE(GLeglContext ctx,
             ValidateWeightPointerOES(context, size, type, stride, pointer))
         {
             context->weightPointer(size, type, stride, pointer);
+            ANGLE_CAPTURE(WeightPointerOES, context, size, type, stride, pointer);
         }
     }
 }
@@ -16272,9 +19037,11 @@ void GL_APIENTRY BindUniformLocationCHROMIUMContextANGLE(GLeglContext ctx,
                                                          GLint location,
                                                          const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindUniformLocationCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint program = %u, GLint location = %d, const GLchar* name = 0x%016" PRIxPTR ")",
           program, location, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindUniformLocationCHROMIUM, program, location, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16284,14 +19051,17 @@ void GL_APIENTRY BindUniformLocationCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateBindUniformLocationCHROMIUM(context, program, location, name))
         {
             context->bindUniformLocation(program, location, name);
+            ANGLE_CAPTURE(BindUniformLocationCHROMIUM, context, program, location, name);
         }
     }
 }
 
 void GL_APIENTRY CoverageModulationCHROMIUMContextANGLE(GLeglContext ctx, GLenum components)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverageModulationCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum components = 0x%X)", components);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverageModulationCHROMIUM, components);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16300,6 +19070,7 @@ void GL_APIENTRY CoverageModulationCHROMIUMContextANGLE(GLeglContext ctx, GLenum
         if (context->skipValidation() || ValidateCoverageModulationCHROMIUM(context, components))
         {
             context->coverageModulation(components);
+            ANGLE_CAPTURE(CoverageModulationCHROMIUM, context, components);
         }
     }
 }
@@ -16308,9 +19079,11 @@ void GL_APIENTRY MatrixLoadfCHROMIUMContextANGLE(GLeglContext ctx,
                                                  GLenum matrixMode,
                                                  const GLfloat *matrix)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixLoadfCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X, const GLfloat * matrix = 0x%016" PRIxPTR ")", matrixMode,
           (uintptr_t)matrix);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixLoadfCHROMIUM, matrixMode, matrix);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16319,14 +19092,17 @@ void GL_APIENTRY MatrixLoadfCHROMIUMContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateMatrixLoadfCHROMIUM(context, matrixMode, matrix))
         {
             context->matrixLoadf(matrixMode, matrix);
+            ANGLE_CAPTURE(MatrixLoadfCHROMIUM, context, matrixMode, matrix);
         }
     }
 }
 
 void GL_APIENTRY MatrixLoadIdentityCHROMIUMContextANGLE(GLeglContext ctx, GLenum matrixMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MatrixLoadIdentityCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum matrixMode = 0x%X)", matrixMode);
+    ANGLE_BINARY_TRACE(EntryPoint::MatrixLoadIdentityCHROMIUM, matrixMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16335,14 +19111,17 @@ void GL_APIENTRY MatrixLoadIdentityCHROMIUMContextANGLE(GLeglContext ctx, GLenum
         if (context->skipValidation() || ValidateMatrixLoadIdentityCHROMIUM(context, matrixMode))
         {
             context->matrixLoadIdentity(matrixMode);
+            ANGLE_CAPTURE(MatrixLoadIdentityCHROMIUM, context, matrixMode);
         }
     }
 }
 
 GLuint GL_APIENTRY GenPathsCHROMIUMContextANGLE(GLeglContext ctx, GLsizei range)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GenPathsCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei range = %d)", range);
+    ANGLE_BINARY_TRACE(EntryPoint::GenPathsCHROMIUM, range);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16350,7 +19129,9 @@ GLuint GL_APIENTRY GenPathsCHROMIUMContextANGLE(GLeglContext ctx, GLsizei range)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateGenPathsCHROMIUM(context, range))
         {
-            return context->genPaths(range);
+            GLuint returnValue = context->genPaths(range);
+            ANGLE_CAPTURE(GenPathsCHROMIUM, context, range, returnValue);
+            return returnValue;
         }
     }
 
@@ -16359,8 +19140,10 @@ GLuint GL_APIENTRY GenPathsCHROMIUMContextANGLE(GLeglContext ctx, GLsizei range)
 
 void GL_APIENTRY DeletePathsCHROMIUMContextANGLE(GLeglContext ctx, GLuint first, GLsizei range)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::DeletePathsCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint first = %u, GLsizei range = %d)", first, range);
+    ANGLE_BINARY_TRACE(EntryPoint::DeletePathsCHROMIUM, first, range);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16369,14 +19152,17 @@ void GL_APIENTRY DeletePathsCHROMIUMContextANGLE(GLeglContext ctx, GLuint first,
         if (context->skipValidation() || ValidateDeletePathsCHROMIUM(context, first, range))
         {
             context->deletePaths(first, range);
+            ANGLE_CAPTURE(DeletePathsCHROMIUM, context, first, range);
         }
     }
 }
 
 GLboolean GL_APIENTRY IsPathCHROMIUMContextANGLE(GLeglContext ctx, GLuint path)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::IsPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u)", path);
+    ANGLE_BINARY_TRACE(EntryPoint::IsPathCHROMIUM, path);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16384,7 +19170,9 @@ GLboolean GL_APIENTRY IsPathCHROMIUMContextANGLE(GLeglContext ctx, GLuint path)
         ASSERT(context == GetValidGlobalContext());
         if (context->skipValidation() || ValidateIsPathCHROMIUM(context, path))
         {
-            return context->isPath(path);
+            GLboolean returnValue = context->isPath(path);
+            ANGLE_CAPTURE(IsPathCHROMIUM, context, path, returnValue);
+            return returnValue;
         }
     }
 
@@ -16399,11 +19187,14 @@ void GL_APIENTRY PathCommandsCHROMIUMContextANGLE(GLeglContext ctx,
                                                   GLenum coordType,
                                                   const void *coords)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathCommandsCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLsizei numCommands = %d, const GLubyte * commands = 0x%016" PRIxPTR
           ", GLsizei numCoords = %d, GLenum coordType = 0x%X, const void* coords = 0x%016" PRIxPTR
           ")",
           path, numCommands, (uintptr_t)commands, numCoords, coordType, (uintptr_t)coords);
+    ANGLE_BINARY_TRACE(EntryPoint::PathCommandsCHROMIUM, path, numCommands, commands, numCoords,
+                       coordType, coords);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16414,6 +19205,8 @@ void GL_APIENTRY PathCommandsCHROMIUMContextANGLE(GLeglContext ctx,
                                          coords))
         {
             context->pathCommands(path, numCommands, commands, numCoords, coordType, coords);
+            ANGLE_CAPTURE(PathCommandsCHROMIUM, context, path, numCommands, commands, numCoords,
+                          coordType, coords);
         }
     }
 }
@@ -16423,8 +19216,10 @@ void GL_APIENTRY PathParameterfCHROMIUMContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLfloat value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathParameterfCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat value = %f)", path, pname, value);
+    ANGLE_BINARY_TRACE(EntryPoint::PathParameterfCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16434,6 +19229,7 @@ void GL_APIENTRY PathParameterfCHROMIUMContextANGLE(GLeglContext ctx,
             ValidatePathParameterfCHROMIUM(context, path, pname, value))
         {
             context->pathParameterf(path, pname, value);
+            ANGLE_CAPTURE(PathParameterfCHROMIUM, context, path, pname, value);
         }
     }
 }
@@ -16443,8 +19239,10 @@ void GL_APIENTRY PathParameteriCHROMIUMContextANGLE(GLeglContext ctx,
                                                     GLenum pname,
                                                     GLint value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathParameteriCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint value = %d)", path, pname, value);
+    ANGLE_BINARY_TRACE(EntryPoint::PathParameteriCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16454,6 +19252,7 @@ void GL_APIENTRY PathParameteriCHROMIUMContextANGLE(GLeglContext ctx,
             ValidatePathParameteriCHROMIUM(context, path, pname, value))
         {
             context->pathParameteri(path, pname, value);
+            ANGLE_CAPTURE(PathParameteriCHROMIUM, context, path, pname, value);
         }
     }
 }
@@ -16463,9 +19262,11 @@ void GL_APIENTRY GetPathParameterfvCHROMIUMContextANGLE(GLeglContext ctx,
                                                         GLenum pname,
                                                         GLfloat *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPathParameterfvCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLfloat * value = 0x%016" PRIxPTR ")", path,
           pname, (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPathParameterfvCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16475,6 +19276,7 @@ void GL_APIENTRY GetPathParameterfvCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateGetPathParameterfvCHROMIUM(context, path, pname, value))
         {
             context->getPathParameterfv(path, pname, value);
+            ANGLE_CAPTURE(GetPathParameterfvCHROMIUM, context, path, pname, value);
         }
     }
 }
@@ -16484,9 +19286,11 @@ void GL_APIENTRY GetPathParameterivCHROMIUMContextANGLE(GLeglContext ctx,
                                                         GLenum pname,
                                                         GLint *value)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPathParameterivCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum pname = 0x%X, GLint * value = 0x%016" PRIxPTR ")", path, pname,
           (uintptr_t)value);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPathParameterivCHROMIUM, path, pname, value);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16496,6 +19300,7 @@ void GL_APIENTRY GetPathParameterivCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateGetPathParameterivCHROMIUM(context, path, pname, value))
         {
             context->getPathParameteriv(path, pname, value);
+            ANGLE_CAPTURE(GetPathParameterivCHROMIUM, context, path, pname, value);
         }
     }
 }
@@ -16505,8 +19310,10 @@ void GL_APIENTRY PathStencilFuncCHROMIUMContextANGLE(GLeglContext ctx,
                                                      GLint ref,
                                                      GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::PathStencilFuncCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum func = 0x%X, GLint ref = %d, GLuint mask = %u)", func, ref, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::PathStencilFuncCHROMIUM, func, ref, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16515,6 +19322,7 @@ void GL_APIENTRY PathStencilFuncCHROMIUMContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidatePathStencilFuncCHROMIUM(context, func, ref, mask))
         {
             context->pathStencilFunc(func, ref, mask);
+            ANGLE_CAPTURE(PathStencilFuncCHROMIUM, context, func, ref, mask);
         }
     }
 }
@@ -16524,8 +19332,10 @@ void GL_APIENTRY StencilFillPathCHROMIUMContextANGLE(GLeglContext ctx,
                                                      GLenum fillMode,
                                                      GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFillPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u)", path, fillMode, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFillPathCHROMIUM, path, fillMode, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16535,6 +19345,7 @@ void GL_APIENTRY StencilFillPathCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateStencilFillPathCHROMIUM(context, path, fillMode, mask))
         {
             context->stencilFillPath(path, fillMode, mask);
+            ANGLE_CAPTURE(StencilFillPathCHROMIUM, context, path, fillMode, mask);
         }
     }
 }
@@ -16544,8 +19355,10 @@ void GL_APIENTRY StencilStrokePathCHROMIUMContextANGLE(GLeglContext ctx,
                                                        GLint reference,
                                                        GLuint mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilStrokePathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u)", path, reference, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilStrokePathCHROMIUM, path, reference, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16555,14 +19368,17 @@ void GL_APIENTRY StencilStrokePathCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateStencilStrokePathCHROMIUM(context, path, reference, mask))
         {
             context->stencilStrokePath(path, reference, mask);
+            ANGLE_CAPTURE(StencilStrokePathCHROMIUM, context, path, reference, mask);
         }
     }
 }
 
 void GL_APIENTRY CoverFillPathCHROMIUMContextANGLE(GLeglContext ctx, GLuint path, GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverFillPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverFillPathCHROMIUM, path, coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16571,6 +19387,7 @@ void GL_APIENTRY CoverFillPathCHROMIUMContextANGLE(GLeglContext ctx, GLuint path
         if (context->skipValidation() || ValidateCoverFillPathCHROMIUM(context, path, coverMode))
         {
             context->coverFillPath(path, coverMode);
+            ANGLE_CAPTURE(CoverFillPathCHROMIUM, context, path, coverMode);
         }
     }
 }
@@ -16579,8 +19396,10 @@ void GL_APIENTRY CoverStrokePathCHROMIUMContextANGLE(GLeglContext ctx,
                                                      GLuint path,
                                                      GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverStrokePathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum coverMode = 0x%X)", path, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverStrokePathCHROMIUM, path, coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16589,6 +19408,7 @@ void GL_APIENTRY CoverStrokePathCHROMIUMContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateCoverStrokePathCHROMIUM(context, path, coverMode))
         {
             context->coverStrokePath(path, coverMode);
+            ANGLE_CAPTURE(CoverStrokePathCHROMIUM, context, path, coverMode);
         }
     }
 }
@@ -16599,9 +19419,12 @@ void GL_APIENTRY StencilThenCoverFillPathCHROMIUMContextANGLE(GLeglContext ctx,
                                                               GLuint mask,
                                                               GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverFillPathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, fillMode, mask, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverFillPathCHROMIUM, path, fillMode, mask,
+                       coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16611,6 +19434,8 @@ void GL_APIENTRY StencilThenCoverFillPathCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateStencilThenCoverFillPathCHROMIUM(context, path, fillMode, mask, coverMode))
         {
             context->stencilThenCoverFillPath(path, fillMode, mask, coverMode);
+            ANGLE_CAPTURE(StencilThenCoverFillPathCHROMIUM, context, path, fillMode, mask,
+                          coverMode);
         }
     }
 }
@@ -16621,9 +19446,12 @@ void GL_APIENTRY StencilThenCoverStrokePathCHROMIUMContextANGLE(GLeglContext ctx
                                                                 GLuint mask,
                                                                 GLenum coverMode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverStrokePathCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint path = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode = 0x%X)",
           path, reference, mask, coverMode);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverStrokePathCHROMIUM, path, reference, mask,
+                       coverMode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16633,6 +19461,8 @@ void GL_APIENTRY StencilThenCoverStrokePathCHROMIUMContextANGLE(GLeglContext ctx
             ValidateStencilThenCoverStrokePathCHROMIUM(context, path, reference, mask, coverMode))
         {
             context->stencilThenCoverStrokePath(path, reference, mask, coverMode);
+            ANGLE_CAPTURE(StencilThenCoverStrokePathCHROMIUM, context, path, reference, mask,
+                          coverMode);
         }
     }
 }
@@ -16646,12 +19476,15 @@ void GL_APIENTRY CoverFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
                                                             GLenum transformType,
                                                             const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverFillPathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPath = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum coverMode = 0x%X, GLenum transformType = 0x%X, const "
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverFillPathInstancedCHROMIUM, numPath, pathNameType, paths,
+                       pathBase, coverMode, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16663,6 +19496,8 @@ void GL_APIENTRY CoverFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
         {
             context->coverFillPathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
                                             transformType, transformValues);
+            ANGLE_CAPTURE(CoverFillPathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                          pathBase, coverMode, transformType, transformValues);
         }
     }
 }
@@ -16676,12 +19511,15 @@ void GL_APIENTRY CoverStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
                                                               GLenum transformType,
                                                               const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CoverStrokePathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPath = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum coverMode = 0x%X, GLenum transformType = 0x%X, const "
           "GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, coverMode, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::CoverStrokePathInstancedCHROMIUM, numPath, pathNameType, paths,
+                       pathBase, coverMode, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16693,6 +19531,8 @@ void GL_APIENTRY CoverStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
         {
             context->coverStrokePathInstanced(numPath, pathNameType, paths, pathBase, coverMode,
                                               transformType, transformValues);
+            ANGLE_CAPTURE(CoverStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                          pathBase, coverMode, transformType, transformValues);
         }
     }
 }
@@ -16707,12 +19547,15 @@ void GL_APIENTRY StencilStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx
                                                                 GLenum transformType,
                                                                 const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilStrokePathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPath = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLint reference = %d, GLuint mask = %u, GLenum transformType = "
           "0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPath, pathNameType, (uintptr_t)paths, pathBase, reference, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilStrokePathInstancedCHROMIUM, numPath, pathNameType, paths,
+                       pathBase, reference, mask, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16724,6 +19567,8 @@ void GL_APIENTRY StencilStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx
         {
             context->stencilStrokePathInstanced(numPath, pathNameType, paths, pathBase, reference,
                                                 mask, transformType, transformValues);
+            ANGLE_CAPTURE(StencilStrokePathInstancedCHROMIUM, context, numPath, pathNameType, paths,
+                          pathBase, reference, mask, transformType, transformValues);
         }
     }
 }
@@ -16738,12 +19583,15 @@ void GL_APIENTRY StencilFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
                                                               GLenum transformType,
                                                               const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilFillPathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPaths = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum transformType "
           "= 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, transformType,
           (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilFillPathInstancedCHROMIUM, numPaths, pathNameType, paths,
+                       pathBase, fillMode, mask, transformType, transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16755,6 +19603,8 @@ void GL_APIENTRY StencilFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
         {
             context->stencilFillPathInstanced(numPaths, pathNameType, paths, pathBase, fillMode,
                                               mask, transformType, transformValues);
+            ANGLE_CAPTURE(StencilFillPathInstancedCHROMIUM, context, numPaths, pathNameType, paths,
+                          pathBase, fillMode, mask, transformType, transformValues);
         }
     }
 }
@@ -16771,12 +19621,16 @@ StencilThenCoverFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
                                                       GLenum transformType,
                                                       const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPaths = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLenum fillMode = 0x%X, GLuint mask = %u, GLenum coverMode = "
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, fillMode, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM, numPaths,
+                       pathNameType, paths, pathBase, fillMode, mask, coverMode, transformType,
+                       transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16790,6 +19644,9 @@ StencilThenCoverFillPathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
             context->stencilThenCoverFillPathInstanced(numPaths, pathNameType, paths, pathBase,
                                                        fillMode, mask, coverMode, transformType,
                                                        transformValues);
+            ANGLE_CAPTURE(StencilThenCoverFillPathInstancedCHROMIUM, context, numPaths,
+                          pathNameType, paths, pathBase, fillMode, mask, coverMode, transformType,
+                          transformValues);
         }
     }
 }
@@ -16806,12 +19663,16 @@ StencilThenCoverStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
                                                         GLenum transformType,
                                                         const GLfloat *transformValues)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLsizei numPaths = %d, GLenum pathNameType = 0x%X, const void * paths = 0x%016" PRIxPTR
           ", GLuint pathBase = %u, GLint reference = %d, GLuint mask = %u, GLenum coverMode = "
           "0x%X, GLenum transformType = 0x%X, const GLfloat * transformValues = 0x%016" PRIxPTR ")",
           numPaths, pathNameType, (uintptr_t)paths, pathBase, reference, mask, coverMode,
           transformType, (uintptr_t)transformValues);
+    ANGLE_BINARY_TRACE(EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM, numPaths,
+                       pathNameType, paths, pathBase, reference, mask, coverMode, transformType,
+                       transformValues);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16825,6 +19686,9 @@ StencilThenCoverStrokePathInstancedCHROMIUMContextANGLE(GLeglContext ctx,
             context->stencilThenCoverStrokePathInstanced(numPaths, pathNameType, paths, pathBase,
                                                          reference, mask, coverMode, transformType,
                                                          transformValues);
+            ANGLE_CAPTURE(StencilThenCoverStrokePathInstancedCHROMIUM, context, numPaths,
+                          pathNameType, paths, pathBase, reference, mask, coverMode, transformType,
+                          transformValues);
         }
     }
 }
@@ -16834,9 +19698,11 @@ void GL_APIENTRY BindFragmentInputLocationCHROMIUMContextANGLE(GLeglContext ctx,
                                                                GLint location,
                                                                const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BindFragmentInputLocationCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint programs = %u, GLint location = %d, const GLchar * name = 0x%016" PRIxPTR ")",
           programs, location, (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::BindFragmentInputLocationCHROMIUM, programs, location, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16846,6 +19712,7 @@ void GL_APIENTRY BindFragmentInputLocationCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateBindFragmentInputLocationCHROMIUM(context, programs, location, name))
         {
             context->bindFragmentInputLocation(programs, location, name);
+            ANGLE_CAPTURE(BindFragmentInputLocationCHROMIUM, context, programs, location, name);
         }
     }
 }
@@ -16857,11 +19724,14 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUMContextANGLE(GLeglContext ct
                                                                  GLint components,
                                                                  const GLfloat *coeffs)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProgramPathFragmentInputGenCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLenum genMode = 0x%X, GLint components = %d, "
         "const GLfloat * coeffs = 0x%016" PRIxPTR ")",
         program, location, genMode, components, (uintptr_t)coeffs);
+    ANGLE_BINARY_TRACE(EntryPoint::ProgramPathFragmentInputGenCHROMIUM, program, location, genMode,
+                       components, coeffs);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16872,6 +19742,8 @@ void GL_APIENTRY ProgramPathFragmentInputGenCHROMIUMContextANGLE(GLeglContext ct
                                                         components, coeffs))
         {
             context->programPathFragmentInputGen(program, location, genMode, components, coeffs);
+            ANGLE_CAPTURE(ProgramPathFragmentInputGenCHROMIUM, context, program, location, genMode,
+                          components, coeffs);
         }
     }
 }
@@ -16888,6 +19760,7 @@ void GL_APIENTRY CopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
                                                  GLboolean unpackPremultiplyAlpha,
                                                  GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTextureCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -16896,6 +19769,9 @@ void GL_APIENTRY CopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTextureCHROMIUM, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16910,6 +19786,9 @@ void GL_APIENTRY CopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
             context->copyTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                  internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
                                  unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopyTextureCHROMIUM, context, sourceId, sourceLevel, destTarget, destId,
+                          destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                          unpackUnmultiplyAlpha);
         }
     }
 }
@@ -16930,6 +19809,7 @@ void GL_APIENTRY CopySubTextureCHROMIUMContextANGLE(GLeglContext ctx,
                                                     GLboolean unpackPremultiplyAlpha,
                                                     GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopySubTextureCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -16938,6 +19818,9 @@ void GL_APIENTRY CopySubTextureCHROMIUMContextANGLE(GLeglContext ctx,
         "unpackPremultiplyAlpha = %u, GLboolean unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, x, y, width, height,
         unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopySubTextureCHROMIUM, sourceId, sourceLevel, destTarget,
+                       destId, destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                       unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16953,6 +19836,9 @@ void GL_APIENTRY CopySubTextureCHROMIUMContextANGLE(GLeglContext ctx,
             context->copySubTexture(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                     xoffset, yoffset, x, y, width, height, unpackFlipY,
                                     unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopySubTextureCHROMIUM, context, sourceId, sourceLevel, destTarget,
+                          destId, destLevel, xoffset, yoffset, x, y, width, height, unpackFlipY,
+                          unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
         }
     }
 }
@@ -16961,8 +19847,10 @@ void GL_APIENTRY CompressedCopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
                                                            GLuint sourceId,
                                                            GLuint destId)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedCopyTextureCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint sourceId = %u, GLuint destId = %u)", sourceId, destId);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedCopyTextureCHROMIUM, sourceId, destId);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16972,14 +19860,17 @@ void GL_APIENTRY CompressedCopyTextureCHROMIUMContextANGLE(GLeglContext ctx,
             ValidateCompressedCopyTextureCHROMIUM(context, sourceId, destId))
         {
             context->compressedCopyTexture(sourceId, destId);
+            ANGLE_CAPTURE(CompressedCopyTextureCHROMIUM, context, sourceId, destId);
         }
     }
 }
 
 void GL_APIENTRY RequestExtensionANGLEContextANGLE(GLeglContext ctx, const GLchar *name)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::RequestExtensionANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(const GLchar * name = 0x%016" PRIxPTR ")", (uintptr_t)name);
+    ANGLE_BINARY_TRACE(EntryPoint::RequestExtensionANGLE, name);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -16988,6 +19879,7 @@ void GL_APIENTRY RequestExtensionANGLEContextANGLE(GLeglContext ctx, const GLcha
         if (context->skipValidation() || ValidateRequestExtensionANGLE(context, name))
         {
             context->requestExtension(name);
+            ANGLE_CAPTURE(RequestExtensionANGLE, context, name);
         }
     }
 }
@@ -16998,10 +19890,12 @@ void GL_APIENTRY GetBooleanvRobustANGLEContextANGLE(GLeglContext ctx,
                                                     GLsizei *length,
                                                     GLboolean *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleanvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLboolean * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleanvRobustANGLE, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17011,6 +19905,7 @@ void GL_APIENTRY GetBooleanvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetBooleanvRobustANGLE(context, pname, bufSize, length, params))
         {
             context->getBooleanvRobust(pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBooleanvRobustANGLE, context, pname, bufSize, length, params);
         }
     }
 }
@@ -17022,11 +19917,14 @@ void GL_APIENTRY GetBufferParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                                              GLsizei *length,
                                                              GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameterivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17037,6 +19935,8 @@ void GL_APIENTRY GetBufferParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getBufferParameterivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBufferParameterivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17047,10 +19947,12 @@ void GL_APIENTRY GetFloatvRobustANGLEContextANGLE(GLeglContext ctx,
                                                   GLsizei *length,
                                                   GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFloatvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLfloat * params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFloatvRobustANGLE, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17060,6 +19962,7 @@ void GL_APIENTRY GetFloatvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetFloatvRobustANGLE(context, pname, bufSize, length, params))
         {
             context->getFloatvRobust(pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetFloatvRobustANGLE, context, pname, bufSize, length, params);
         }
     }
 }
@@ -17072,11 +19975,14 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivRobustANGLEContextANGLE(GLeg
                                                                             GLsizei *length,
                                                                             GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum attachment = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = "
         "%d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, attachment, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE, target,
+                       attachment, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17088,6 +19994,8 @@ void GL_APIENTRY GetFramebufferAttachmentParameterivRobustANGLEContextANGLE(GLeg
         {
             context->getFramebufferAttachmentParameterivRobust(target, attachment, pname, bufSize,
                                                                length, params);
+            ANGLE_CAPTURE(GetFramebufferAttachmentParameterivRobustANGLE, context, target,
+                          attachment, pname, bufSize, length, params);
         }
     }
 }
@@ -17098,10 +20006,12 @@ void GL_APIENTRY GetIntegervRobustANGLEContextANGLE(GLeglContext ctx,
                                                     GLsizei *length,
                                                     GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegervRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegervRobustANGLE, pname, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17111,6 +20021,7 @@ void GL_APIENTRY GetIntegervRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetIntegervRobustANGLE(context, pname, bufSize, length, data))
         {
             context->getIntegervRobust(pname, bufSize, length, data);
+            ANGLE_CAPTURE(GetIntegervRobustANGLE, context, pname, bufSize, length, data);
         }
     }
 }
@@ -17122,11 +20033,14 @@ void GL_APIENTRY GetProgramivRobustANGLEContextANGLE(GLeglContext ctx,
                                                      GLsizei *length,
                                                      GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramivRobustANGLE, program, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17136,6 +20050,8 @@ void GL_APIENTRY GetProgramivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetProgramivRobustANGLE(context, program, pname, bufSize, length, params))
         {
             context->getProgramivRobust(program, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetProgramivRobustANGLE, context, program, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17147,11 +20063,14 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLEContextANGLE(GLeglContext
                                                                    GLsizei *length,
                                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetRenderbufferParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetRenderbufferParameterivRobustANGLE, target, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17161,6 +20080,8 @@ void GL_APIENTRY GetRenderbufferParameterivRobustANGLEContextANGLE(GLeglContext
                                              context, target, pname, bufSize, length, params))
         {
             context->getRenderbufferParameterivRobust(target, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetRenderbufferParameterivRobustANGLE, context, target, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -17172,11 +20093,13 @@ void GL_APIENTRY GetShaderivRobustANGLEContextANGLE(GLeglContext ctx,
                                                     GLsizei *length,
                                                     GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetShaderivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint shader = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         shader, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetShaderivRobustANGLE, shader, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17186,6 +20109,7 @@ void GL_APIENTRY GetShaderivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetShaderivRobustANGLE(context, shader, pname, bufSize, length, params))
         {
             context->getShaderivRobust(shader, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetShaderivRobustANGLE, context, shader, pname, bufSize, length, params);
         }
     }
 }
@@ -17197,11 +20121,14 @@ void GL_APIENTRY GetTexParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei *length,
                                                           GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterfvRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17212,6 +20139,8 @@ void GL_APIENTRY GetTexParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterfvRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterfvRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17223,11 +20152,14 @@ void GL_APIENTRY GetTexParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei *length,
                                                           GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17238,6 +20170,8 @@ void GL_APIENTRY GetTexParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17249,11 +20183,14 @@ void GL_APIENTRY GetUniformfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                      GLsizei *length,
                                                      GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformfvRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17263,6 +20200,8 @@ void GL_APIENTRY GetUniformfvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetUniformfvRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getUniformfvRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetUniformfvRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -17274,11 +20213,14 @@ void GL_APIENTRY GetUniformivRobustANGLEContextANGLE(GLeglContext ctx,
                                                      GLsizei *length,
                                                      GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17288,6 +20230,8 @@ void GL_APIENTRY GetUniformivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetUniformivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getUniformivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetUniformivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -17299,11 +20243,14 @@ void GL_APIENTRY GetVertexAttribfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei *length,
                                                           GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribfvRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17313,6 +20260,8 @@ void GL_APIENTRY GetVertexAttribfvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetVertexAttribfvRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribfvRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribfvRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17324,11 +20273,14 @@ void GL_APIENTRY GetVertexAttribivRobustANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei *length,
                                                           GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribivRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17338,6 +20290,8 @@ void GL_APIENTRY GetVertexAttribivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetVertexAttribivRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribivRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribivRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17349,11 +20303,14 @@ void GL_APIENTRY GetVertexAttribPointervRobustANGLEContextANGLE(GLeglContext ctx
                                                                 GLsizei *length,
                                                                 void **pointer)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribPointervRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** pointer = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)pointer);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribPointervRobustANGLE, index, pname, bufSize,
+                       length, pointer);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17363,6 +20320,8 @@ void GL_APIENTRY GetVertexAttribPointervRobustANGLEContextANGLE(GLeglContext ctx
                                              context, index, pname, bufSize, length, pointer))
         {
             context->getVertexAttribPointervRobust(index, pname, bufSize, length, pointer);
+            ANGLE_CAPTURE(GetVertexAttribPointervRobustANGLE, context, index, pname, bufSize,
+                          length, pointer);
         }
     }
 }
@@ -17380,6 +20339,7 @@ void GL_APIENTRY ReadPixelsRobustANGLEContextANGLE(GLeglContext ctx,
                                                    GLsizei *rows,
                                                    void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadPixelsRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
@@ -17388,6 +20348,8 @@ void GL_APIENTRY ReadPixelsRobustANGLEContextANGLE(GLeglContext ctx,
         ", void * pixels = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadPixelsRobustANGLE, x, y, width, height, format, type,
+                       bufSize, length, columns, rows, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17399,6 +20361,8 @@ void GL_APIENTRY ReadPixelsRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->readPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
                                       rows, pixels);
+            ANGLE_CAPTURE(ReadPixelsRobustANGLE, context, x, y, width, height, format, type,
+                          bufSize, length, columns, rows, pixels);
         }
     }
 }
@@ -17415,6 +20379,7 @@ void GL_APIENTRY TexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
                                                    GLsizei bufSize,
                                                    const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
@@ -17422,6 +20387,8 @@ void GL_APIENTRY TexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage2DRobustANGLE, target, level, internalformat, width,
+                       height, border, format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17434,6 +20401,8 @@ void GL_APIENTRY TexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->texImage2DRobust(targetPacked, level, internalformat, width, height, border,
                                       format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexImage2DRobustANGLE, context, target, level, internalformat, width,
+                          height, border, format, type, bufSize, pixels);
         }
     }
 }
@@ -17444,11 +20413,13 @@ void GL_APIENTRY TexParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                        GLsizei bufSize,
                                                        const GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * params "
         "= 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterfvRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17459,6 +20430,7 @@ void GL_APIENTRY TexParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateTexParameterfvRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterfvRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterfvRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -17469,11 +20441,13 @@ void GL_APIENTRY TexParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                                        GLsizei bufSize,
                                                        const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17484,6 +20458,7 @@ void GL_APIENTRY TexParameterivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateTexParameterivRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterivRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterivRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -17500,12 +20475,15 @@ void GL_APIENTRY TexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei bufSize,
                                                       const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLsizei "
         "width = %d, GLsizei height = %d, GLenum format = 0x%X, GLenum type = 0x%X, GLsizei "
         "bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, type, bufSize, (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage2DRobustANGLE, target, level, xoffset, yoffset, width,
+                       height, format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17518,6 +20496,8 @@ void GL_APIENTRY TexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->texSubImage2DRobust(targetPacked, level, xoffset, yoffset, width, height,
                                          format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexSubImage2DRobustANGLE, context, target, level, xoffset, yoffset, width,
+                          height, format, type, bufSize, pixels);
         }
     }
 }
@@ -17535,6 +20515,7 @@ void GL_APIENTRY TexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
                                                    GLsizei bufSize,
                                                    const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint internalformat = %d, GLsizei width = %d, "
@@ -17542,6 +20523,8 @@ void GL_APIENTRY TexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         "type = 0x%X, GLsizei bufSize = %d, const void * pixels = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexImage3DRobustANGLE, target, level, internalformat, width,
+                       height, depth, border, format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17554,6 +20537,8 @@ void GL_APIENTRY TexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->texImage3DRobust(targetPacked, level, internalformat, width, height, depth,
                                       border, format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexImage3DRobustANGLE, context, target, level, internalformat, width,
+                          height, depth, border, format, type, bufSize, pixels);
         }
     }
 }
@@ -17572,6 +20557,7 @@ void GL_APIENTRY TexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei bufSize,
                                                       const void *pixels)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexSubImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -17580,6 +20566,8 @@ void GL_APIENTRY TexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, type, bufSize,
         (uintptr_t)pixels);
+    ANGLE_BINARY_TRACE(EntryPoint::TexSubImage3DRobustANGLE, target, level, xoffset, yoffset,
+                       zoffset, width, height, depth, format, type, bufSize, pixels);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17593,6 +20581,8 @@ void GL_APIENTRY TexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->texSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset, width,
                                          height, depth, format, type, bufSize, pixels);
+            ANGLE_CAPTURE(TexSubImage3DRobustANGLE, context, target, level, xoffset, yoffset,
+                          zoffset, width, height, depth, format, type, bufSize, pixels);
         }
     }
 }
@@ -17608,12 +20598,15 @@ void GL_APIENTRY CompressedTexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
                                                              GLsizei dataSize,
                                                              const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
         "%d, GLsizei height = %d, GLint border = %d, GLsizei imageSize = %d, GLsizei dataSize = "
         "%d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, border, imageSize, dataSize, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage2DRobustANGLE, target, level, internalformat,
+                       width, height, border, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17626,6 +20619,8 @@ void GL_APIENTRY CompressedTexImage2DRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->compressedTexImage2DRobust(targetPacked, level, internalformat, width, height,
                                                 border, imageSize, dataSize, data);
+            ANGLE_CAPTURE(CompressedTexImage2DRobustANGLE, context, target, level, internalformat,
+                          width, height, border, imageSize, dataSize, data);
         }
     }
 }
@@ -17642,6 +20637,7 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx
                                                                 GLsizei dataSize,
                                                                 const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage2DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLsizei xoffset = %d, GLsizei yoffset = %d, "
@@ -17649,6 +20645,8 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, width, height, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage2DRobustANGLE, target, level, xoffset,
+                       yoffset, width, height, format, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17661,6 +20659,8 @@ void GL_APIENTRY CompressedTexSubImage2DRobustANGLEContextANGLE(GLeglContext ctx
         {
             context->compressedTexSubImage2DRobust(targetPacked, level, xoffset, yoffset, width,
                                                    height, format, imageSize, dataSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage2DRobustANGLE, context, target, level, xoffset,
+                          yoffset, width, height, format, imageSize, dataSize, data);
         }
     }
 }
@@ -17677,6 +20677,7 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
                                                              GLsizei dataSize,
                                                              const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum internalformat = 0x%X, GLsizei width = "
@@ -17684,6 +20685,8 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         "GLsizei dataSize = %d, const GLvoid * data = 0x%016" PRIxPTR ")",
         target, level, internalformat, width, height, depth, border, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexImage3DRobustANGLE, target, level, internalformat,
+                       width, height, depth, border, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17696,6 +20699,8 @@ void GL_APIENTRY CompressedTexImage3DRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->compressedTexImage3DRobust(targetPacked, level, internalformat, width, height,
                                                 depth, border, imageSize, dataSize, data);
+            ANGLE_CAPTURE(CompressedTexImage3DRobustANGLE, context, target, level, internalformat,
+                          width, height, depth, border, imageSize, dataSize, data);
         }
     }
 }
@@ -17714,6 +20719,7 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx
                                                                 GLsizei dataSize,
                                                                 const GLvoid *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CompressedTexSubImage3DRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLint xoffset = %d, GLint yoffset = %d, GLint "
@@ -17722,6 +20728,8 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx
         "0x%016" PRIxPTR ")",
         target, level, xoffset, yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
         (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::CompressedTexSubImage3DRobustANGLE, target, level, xoffset,
+                       yoffset, zoffset, width, height, depth, format, imageSize, dataSize, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17736,6 +20744,9 @@ void GL_APIENTRY CompressedTexSubImage3DRobustANGLEContextANGLE(GLeglContext ctx
             context->compressedTexSubImage3DRobust(targetPacked, level, xoffset, yoffset, zoffset,
                                                    width, height, depth, format, imageSize,
                                                    dataSize, data);
+            ANGLE_CAPTURE(CompressedTexSubImage3DRobustANGLE, context, target, level, xoffset,
+                          yoffset, zoffset, width, height, depth, format, imageSize, dataSize,
+                          data);
         }
     }
 }
@@ -17747,11 +20758,13 @@ void GL_APIENTRY GetQueryivRobustANGLEContextANGLE(GLeglContext ctx,
                                                    GLsizei *length,
                                                    GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryivRobustANGLE, target, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17762,6 +20775,7 @@ void GL_APIENTRY GetQueryivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetQueryivRobustANGLE(context, targetPacked, pname, bufSize, length, params))
         {
             context->getQueryivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryivRobustANGLE, context, target, pname, bufSize, length, params);
         }
     }
 }
@@ -17773,11 +20787,14 @@ void GL_APIENTRY GetQueryObjectuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei *length,
                                                           GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectuivRobustANGLE, id, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17787,6 +20804,8 @@ void GL_APIENTRY GetQueryObjectuivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetQueryObjectuivRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjectuivRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjectuivRobustANGLE, context, id, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17798,11 +20817,14 @@ void GL_APIENTRY GetBufferPointervRobustANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei *length,
                                                           void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferPointervRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", void ** params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferPointervRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17813,6 +20835,8 @@ void GL_APIENTRY GetBufferPointervRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getBufferPointervRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBufferPointervRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17824,11 +20848,13 @@ void GL_APIENTRY GetIntegeri_vRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei *length,
                                                       GLint *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetIntegeri_vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetIntegeri_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17838,6 +20864,7 @@ void GL_APIENTRY GetIntegeri_vRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetIntegeri_vRobustANGLE(context, target, index, bufSize, length, data))
         {
             context->getIntegeri_vRobust(target, index, bufSize, length, data);
+            ANGLE_CAPTURE(GetIntegeri_vRobustANGLE, context, target, index, bufSize, length, data);
         }
     }
 }
@@ -17850,11 +20877,14 @@ void GL_APIENTRY GetInternalformativRobustANGLEContextANGLE(GLeglContext ctx,
                                                             GLsizei *length,
                                                             GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInternalformativRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum internalformat = 0x%X, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, internalformat, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInternalformativRobustANGLE, target, internalformat, pname,
+                       bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17866,6 +20896,8 @@ void GL_APIENTRY GetInternalformativRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->getInternalformativRobust(target, internalformat, pname, bufSize, length,
                                                params);
+            ANGLE_CAPTURE(GetInternalformativRobustANGLE, context, target, internalformat, pname,
+                          bufSize, length, params);
         }
     }
 }
@@ -17877,11 +20909,14 @@ void GL_APIENTRY GetVertexAttribIivRobustANGLEContextANGLE(GLeglContext ctx,
                                                            GLsizei *length,
                                                            GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIivRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17891,6 +20926,8 @@ void GL_APIENTRY GetVertexAttribIivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetVertexAttribIivRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribIivRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribIivRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17902,11 +20939,14 @@ void GL_APIENTRY GetVertexAttribIuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                             GLsizei *length,
                                                             GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetVertexAttribIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint index = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         index, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetVertexAttribIuivRobustANGLE, index, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17916,6 +20956,8 @@ void GL_APIENTRY GetVertexAttribIuivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetVertexAttribIuivRobustANGLE(context, index, pname, bufSize, length, params))
         {
             context->getVertexAttribIuivRobust(index, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetVertexAttribIuivRobustANGLE, context, index, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -17927,11 +20969,14 @@ void GL_APIENTRY GetUniformuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei *length,
                                                       GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetUniformuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetUniformuivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17941,6 +20986,8 @@ void GL_APIENTRY GetUniformuivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetUniformuivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getUniformuivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetUniformuivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -17953,11 +21000,14 @@ void GL_APIENTRY GetActiveUniformBlockivRobustANGLEContextANGLE(GLeglContext ctx
                                                                 GLsizei *length,
                                                                 GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetActiveUniformBlockivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLuint uniformBlockIndex = %u, GLenum pname = 0x%X, GLsizei bufSize "
         "= %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, uniformBlockIndex, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetActiveUniformBlockivRobustANGLE, program, uniformBlockIndex,
+                       pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17969,6 +21019,8 @@ void GL_APIENTRY GetActiveUniformBlockivRobustANGLEContextANGLE(GLeglContext ctx
         {
             context->getActiveUniformBlockivRobust(program, uniformBlockIndex, pname, bufSize,
                                                    length, params);
+            ANGLE_CAPTURE(GetActiveUniformBlockivRobustANGLE, context, program, uniformBlockIndex,
+                          pname, bufSize, length, params);
         }
     }
 }
@@ -17979,10 +21031,12 @@ void GL_APIENTRY GetInteger64vRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei *length,
                                                       GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", GLint64 * data = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64vRobustANGLE, pname, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -17992,6 +21046,7 @@ void GL_APIENTRY GetInteger64vRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetInteger64vRobustANGLE(context, pname, bufSize, length, data))
         {
             context->getInteger64vRobust(pname, bufSize, length, data);
+            ANGLE_CAPTURE(GetInteger64vRobustANGLE, context, pname, bufSize, length, data);
         }
     }
 }
@@ -18003,11 +21058,14 @@ void GL_APIENTRY GetInteger64i_vRobustANGLEContextANGLE(GLeglContext ctx,
                                                         GLsizei *length,
                                                         GLint64 *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetInteger64i_vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetInteger64i_vRobustANGLE, target, index, bufSize, length,
+                       data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18017,6 +21075,8 @@ void GL_APIENTRY GetInteger64i_vRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetInteger64i_vRobustANGLE(context, target, index, bufSize, length, data))
         {
             context->getInteger64i_vRobust(target, index, bufSize, length, data);
+            ANGLE_CAPTURE(GetInteger64i_vRobustANGLE, context, target, index, bufSize, length,
+                          data);
         }
     }
 }
@@ -18028,11 +21088,14 @@ void GL_APIENTRY GetBufferParameteri64vRobustANGLEContextANGLE(GLeglContext ctx,
                                                                GLsizei *length,
                                                                GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBufferParameteri64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBufferParameteri64vRobustANGLE, target, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18043,6 +21106,8 @@ void GL_APIENTRY GetBufferParameteri64vRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getBufferParameteri64vRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetBufferParameteri64vRobustANGLE, context, target, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18053,11 +21118,13 @@ void GL_APIENTRY SamplerParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                                            GLsizei bufSize,
                                                            const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLuint pname = %u, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18067,6 +21134,7 @@ void GL_APIENTRY SamplerParameterivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateSamplerParameterivRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterivRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterivRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -18077,11 +21145,13 @@ void GL_APIENTRY SamplerParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                            GLsizei bufSize,
                                                            const GLfloat *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLfloat * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterfvRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18091,6 +21161,7 @@ void GL_APIENTRY SamplerParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateSamplerParameterfvRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterfvRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterfvRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -18102,11 +21173,14 @@ void GL_APIENTRY GetSamplerParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                                               GLsizei *length,
                                                               GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18116,6 +21190,8 @@ void GL_APIENTRY GetSamplerParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18127,11 +21203,14 @@ void GL_APIENTRY GetSamplerParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                               GLsizei *length,
                                                               GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterfvRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18141,6 +21220,8 @@ void GL_APIENTRY GetSamplerParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterfvRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterfvRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18152,11 +21233,14 @@ void GL_APIENTRY GetFramebufferParameterivRobustANGLEContextANGLE(GLeglContext c
                                                                   GLsizei *length,
                                                                   GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetFramebufferParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetFramebufferParameterivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18166,6 +21250,8 @@ void GL_APIENTRY GetFramebufferParameterivRobustANGLEContextANGLE(GLeglContext c
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getFramebufferParameterivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetFramebufferParameterivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18178,11 +21264,14 @@ void GL_APIENTRY GetProgramInterfaceivRobustANGLEContextANGLE(GLeglContext ctx,
                                                               GLsizei *length,
                                                               GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetProgramInterfaceivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLenum programInterface = 0x%X, GLenum pname = 0x%X, GLsizei "
         "bufSize = %d, GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, programInterface, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetProgramInterfaceivRobustANGLE, program, programInterface,
+                       pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18194,6 +21283,8 @@ void GL_APIENTRY GetProgramInterfaceivRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->getProgramInterfaceivRobust(program, programInterface, pname, bufSize, length,
                                                  params);
+            ANGLE_CAPTURE(GetProgramInterfaceivRobustANGLE, context, program, programInterface,
+                          pname, bufSize, length, params);
         }
     }
 }
@@ -18205,11 +21296,13 @@ void GL_APIENTRY GetBooleani_vRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei *length,
                                                       GLboolean *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetBooleani_vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLboolean * data = 0x%016" PRIxPTR ")",
         target, index, bufSize, (uintptr_t)length, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::GetBooleani_vRobustANGLE, target, index, bufSize, length, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18219,6 +21312,7 @@ void GL_APIENTRY GetBooleani_vRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetBooleani_vRobustANGLE(context, target, index, bufSize, length, data))
         {
             context->getBooleani_vRobust(target, index, bufSize, length, data);
+            ANGLE_CAPTURE(GetBooleani_vRobustANGLE, context, target, index, bufSize, length, data);
         }
     }
 }
@@ -18230,11 +21324,13 @@ void GL_APIENTRY GetMultisamplefvRobustANGLEContextANGLE(GLeglContext ctx,
                                                          GLsizei *length,
                                                          GLfloat *val)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum pname = 0x%X, GLuint index = %u, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * val = 0x%016" PRIxPTR ")",
         pname, index, bufSize, (uintptr_t)length, (uintptr_t)val);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefvRobustANGLE, pname, index, bufSize, length, val);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18244,6 +21340,7 @@ void GL_APIENTRY GetMultisamplefvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetMultisamplefvRobustANGLE(context, pname, index, bufSize, length, val))
         {
             context->getMultisamplefvRobust(pname, index, bufSize, length, val);
+            ANGLE_CAPTURE(GetMultisamplefvRobustANGLE, context, pname, index, bufSize, length, val);
         }
     }
 }
@@ -18256,11 +21353,14 @@ void GL_APIENTRY GetTexLevelParameterivRobustANGLEContextANGLE(GLeglContext ctx,
                                                                GLsizei *length,
                                                                GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterivRobustANGLE, target, level, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18273,6 +21373,8 @@ void GL_APIENTRY GetTexLevelParameterivRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->getTexLevelParameterivRobust(targetPacked, level, pname, bufSize, length,
                                                   params);
+            ANGLE_CAPTURE(GetTexLevelParameterivRobustANGLE, context, target, level, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18285,11 +21387,14 @@ void GL_APIENTRY GetTexLevelParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                                GLsizei *length,
                                                                GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLsizei bufSize = %d, "
         "GLsizei * length = 0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         target, level, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfvRobustANGLE, target, level, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18302,6 +21407,8 @@ void GL_APIENTRY GetTexLevelParameterfvRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->getTexLevelParameterfvRobust(targetPacked, level, pname, bufSize, length,
                                                   params);
+            ANGLE_CAPTURE(GetTexLevelParameterfvRobustANGLE, context, target, level, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18312,10 +21419,13 @@ void GL_APIENTRY GetPointervRobustANGLERobustANGLEContextANGLE(GLeglContext ctx,
                                                                GLsizei *length,
                                                                void **params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetPointervRobustANGLERobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = 0x%016" PRIxPTR
           ", void ** params = 0x%016" PRIxPTR ")",
           pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetPointervRobustANGLERobustANGLE, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18325,6 +21435,8 @@ void GL_APIENTRY GetPointervRobustANGLERobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetPointervRobustANGLERobustANGLE(context, pname, bufSize, length, params))
         {
             context->getPointervRobustANGLERobust(pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetPointervRobustANGLERobustANGLE, context, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -18342,6 +21454,7 @@ void GL_APIENTRY ReadnPixelsRobustANGLEContextANGLE(GLeglContext ctx,
                                                     GLsizei *rows,
                                                     void *data)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ReadnPixelsRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLint x = %d, GLint y = %d, GLsizei width = %d, GLsizei height = %d, GLenum format = "
@@ -18350,6 +21463,8 @@ void GL_APIENTRY ReadnPixelsRobustANGLEContextANGLE(GLeglContext ctx,
         ", void * data = 0x%016" PRIxPTR ")",
         x, y, width, height, format, type, bufSize, (uintptr_t)length, (uintptr_t)columns,
         (uintptr_t)rows, (uintptr_t)data);
+    ANGLE_BINARY_TRACE(EntryPoint::ReadnPixelsRobustANGLE, x, y, width, height, format, type,
+                       bufSize, length, columns, rows, data);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18361,6 +21476,8 @@ void GL_APIENTRY ReadnPixelsRobustANGLEContextANGLE(GLeglContext ctx,
         {
             context->readnPixelsRobust(x, y, width, height, format, type, bufSize, length, columns,
                                        rows, data);
+            ANGLE_CAPTURE(ReadnPixelsRobustANGLE, context, x, y, width, height, format, type,
+                          bufSize, length, columns, rows, data);
         }
     }
 }
@@ -18372,11 +21489,14 @@ void GL_APIENTRY GetnUniformfvRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei *length,
                                                       GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformfvRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLfloat * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformfvRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18386,6 +21506,8 @@ void GL_APIENTRY GetnUniformfvRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetnUniformfvRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getnUniformfvRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetnUniformfvRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -18397,11 +21519,14 @@ void GL_APIENTRY GetnUniformivRobustANGLEContextANGLE(GLeglContext ctx,
                                                       GLsizei *length,
                                                       GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18411,6 +21536,8 @@ void GL_APIENTRY GetnUniformivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetnUniformivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getnUniformivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetnUniformivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -18422,11 +21549,14 @@ void GL_APIENTRY GetnUniformuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                        GLsizei *length,
                                                        GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetnUniformuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint program = %u, GLint location = %d, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         program, location, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetnUniformuivRobustANGLE, program, location, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18436,6 +21566,8 @@ void GL_APIENTRY GetnUniformuivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetnUniformuivRobustANGLE(context, program, location, bufSize, length, params))
         {
             context->getnUniformuivRobust(program, location, bufSize, length, params);
+            ANGLE_CAPTURE(GetnUniformuivRobustANGLE, context, program, location, bufSize, length,
+                          params);
         }
     }
 }
@@ -18446,11 +21578,13 @@ void GL_APIENTRY TexParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
                                                         GLsizei bufSize,
                                                         const GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18461,6 +21595,7 @@ void GL_APIENTRY TexParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateTexParameterIivRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterIivRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterIivRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -18471,11 +21606,13 @@ void GL_APIENTRY TexParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                          GLsizei bufSize,
                                                          const GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * params = "
         "0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::TexParameterIuivRobustANGLE, target, pname, bufSize, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18486,6 +21623,7 @@ void GL_APIENTRY TexParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateTexParameterIuivRobustANGLE(context, targetPacked, pname, bufSize, params))
         {
             context->texParameterIuivRobust(targetPacked, pname, bufSize, params);
+            ANGLE_CAPTURE(TexParameterIuivRobustANGLE, context, target, pname, bufSize, params);
         }
     }
 }
@@ -18497,11 +21635,14 @@ void GL_APIENTRY GetTexParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
                                                            GLsizei *length,
                                                            GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18512,6 +21653,8 @@ void GL_APIENTRY GetTexParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterIivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterIivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -18523,11 +21666,14 @@ void GL_APIENTRY GetTexParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                             GLsizei *length,
                                                             GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         target, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexParameterIuivRobustANGLE, target, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18538,6 +21684,8 @@ void GL_APIENTRY GetTexParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, targetPacked, pname, bufSize, length, params))
         {
             context->getTexParameterIuivRobust(targetPacked, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetTexParameterIuivRobustANGLE, context, target, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -18548,11 +21696,13 @@ void GL_APIENTRY SamplerParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
                                                             GLsizei bufSize,
                                                             const GLint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18562,6 +21712,7 @@ void GL_APIENTRY SamplerParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateSamplerParameterIivRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterIivRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterIivRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -18572,11 +21723,13 @@ void GL_APIENTRY SamplerParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
                                                              GLsizei bufSize,
                                                              const GLuint *param)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SamplerParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, const GLuint * param = "
         "0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)param);
+    ANGLE_BINARY_TRACE(EntryPoint::SamplerParameterIuivRobustANGLE, sampler, pname, bufSize, param);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18586,6 +21739,7 @@ void GL_APIENTRY SamplerParameterIuivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateSamplerParameterIuivRobustANGLE(context, sampler, pname, bufSize, param))
         {
             context->samplerParameterIuivRobust(sampler, pname, bufSize, param);
+            ANGLE_CAPTURE(SamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize, param);
         }
     }
 }
@@ -18597,11 +21751,14 @@ void GL_APIENTRY GetSamplerParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
                                                                GLsizei *length,
                                                                GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18611,6 +21768,8 @@ void GL_APIENTRY GetSamplerParameterIivRobustANGLEContextANGLE(GLeglContext ctx,
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterIivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterIivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18622,11 +21781,14 @@ void GL_APIENTRY GetSamplerParameterIuivRobustANGLEContextANGLE(GLeglContext ctx
                                                                 GLsizei *length,
                                                                 GLuint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetSamplerParameterIuivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sampler = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint * params = 0x%016" PRIxPTR ")",
         sampler, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetSamplerParameterIuivRobustANGLE, sampler, pname, bufSize,
+                       length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18636,6 +21798,8 @@ void GL_APIENTRY GetSamplerParameterIuivRobustANGLEContextANGLE(GLeglContext ctx
                                              context, sampler, pname, bufSize, length, params))
         {
             context->getSamplerParameterIuivRobust(sampler, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetSamplerParameterIuivRobustANGLE, context, sampler, pname, bufSize,
+                          length, params);
         }
     }
 }
@@ -18647,11 +21811,13 @@ void GL_APIENTRY GetQueryObjectivRobustANGLEContextANGLE(GLeglContext ctx,
                                                          GLsizei *length,
                                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectivRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectivRobustANGLE, id, pname, bufSize, length, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18661,6 +21827,7 @@ void GL_APIENTRY GetQueryObjectivRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetQueryObjectivRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjectivRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjectivRobustANGLE, context, id, pname, bufSize, length, params);
         }
     }
 }
@@ -18672,11 +21839,14 @@ void GL_APIENTRY GetQueryObjecti64vRobustANGLEContextANGLE(GLeglContext ctx,
                                                            GLsizei *length,
                                                            GLint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjecti64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjecti64vRobustANGLE, id, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18686,6 +21856,8 @@ void GL_APIENTRY GetQueryObjecti64vRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetQueryObjecti64vRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjecti64vRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjecti64vRobustANGLE, context, id, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -18697,11 +21869,14 @@ void GL_APIENTRY GetQueryObjectui64vRobustANGLEContextANGLE(GLeglContext ctx,
                                                             GLsizei *length,
                                                             GLuint64 *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetQueryObjectui64vRobustANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint id = %u, GLenum pname = 0x%X, GLsizei bufSize = %d, GLsizei * length = "
         "0x%016" PRIxPTR ", GLuint64 * params = 0x%016" PRIxPTR ")",
         id, pname, bufSize, (uintptr_t)length, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetQueryObjectui64vRobustANGLE, id, pname, bufSize, length,
+                       params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18711,6 +21886,8 @@ void GL_APIENTRY GetQueryObjectui64vRobustANGLEContextANGLE(GLeglContext ctx,
             ValidateGetQueryObjectui64vRobustANGLE(context, id, pname, bufSize, length, params))
         {
             context->getQueryObjectui64vRobust(id, pname, bufSize, length, params);
+            ANGLE_CAPTURE(GetQueryObjectui64vRobustANGLE, context, id, pname, bufSize, length,
+                          params);
         }
     }
 }
@@ -18727,6 +21904,7 @@ void GL_APIENTRY CopyTexture3DANGLEContextANGLE(GLeglContext ctx,
                                                 GLboolean unpackPremultiplyAlpha,
                                                 GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopyTexture3DANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -18735,6 +21913,9 @@ void GL_APIENTRY CopyTexture3DANGLEContextANGLE(GLeglContext ctx,
         "= %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, internalFormat, destType, unpackFlipY,
         unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopyTexture3DANGLE, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                       unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18749,6 +21930,9 @@ void GL_APIENTRY CopyTexture3DANGLEContextANGLE(GLeglContext ctx,
             context->copyTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                    internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
                                    unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopyTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                          destLevel, internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                          unpackUnmultiplyAlpha);
         }
     }
 }
@@ -18772,6 +21956,7 @@ void GL_APIENTRY CopySubTexture3DANGLEContextANGLE(GLeglContext ctx,
                                                    GLboolean unpackPremultiplyAlpha,
                                                    GLboolean unpackUnmultiplyAlpha)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::CopySubTexture3DANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLuint sourceId = %u, GLint sourceLevel = %d, GLenum destTarget = 0x%X, GLuint destId = "
@@ -18781,6 +21966,9 @@ void GL_APIENTRY CopySubTexture3DANGLEContextANGLE(GLeglContext ctx,
         "unpackUnmultiplyAlpha = %u)",
         sourceId, sourceLevel, destTarget, destId, destLevel, xoffset, yoffset, zoffset, x, y, z,
         width, height, depth, unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+    ANGLE_BINARY_TRACE(EntryPoint::CopySubTexture3DANGLE, sourceId, sourceLevel, destTarget, destId,
+                       destLevel, xoffset, yoffset, zoffset, x, y, z, width, height, depth,
+                       unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18796,6 +21984,9 @@ void GL_APIENTRY CopySubTexture3DANGLEContextANGLE(GLeglContext ctx,
             context->copySubTexture3D(sourceId, sourceLevel, destTargetPacked, destId, destLevel,
                                       xoffset, yoffset, zoffset, x, y, z, width, height, depth,
                                       unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            ANGLE_CAPTURE(CopySubTexture3DANGLE, context, sourceId, sourceLevel, destTarget, destId,
+                          destLevel, xoffset, yoffset, zoffset, x, y, z, width, height, depth,
+                          unpackFlipY, unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
         }
     }
 }
@@ -18808,11 +21999,14 @@ void GL_APIENTRY TexStorage2DMultisampleANGLEContextANGLE(GLeglContext ctx,
                                                           GLsizei height,
                                                           GLboolean fixedsamplelocations)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::TexStorage2DMultisampleANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLsizei samples = %d, GLenum internalformat = 0x%X, GLsizei width "
         "= %d, GLsizei height = %d, GLboolean fixedsamplelocations = %u)",
         target, samples, internalformat, width, height, fixedsamplelocations);
+    ANGLE_BINARY_TRACE(EntryPoint::TexStorage2DMultisampleANGLE, target, samples, internalformat,
+                       width, height, fixedsamplelocations);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18825,6 +22019,8 @@ void GL_APIENTRY TexStorage2DMultisampleANGLEContextANGLE(GLeglContext ctx,
         {
             context->texStorage2DMultisample(targetPacked, samples, internalformat, width, height,
                                              fixedsamplelocations);
+            ANGLE_CAPTURE(TexStorage2DMultisampleANGLE, context, target, samples, internalformat,
+                          width, height, fixedsamplelocations);
         }
     }
 }
@@ -18835,11 +22031,13 @@ void GL_APIENTRY GetTexLevelParameterivANGLEContextANGLE(GLeglContext ctx,
                                                          GLenum pname,
                                                          GLint *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterivANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLint * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterivANGLE, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18850,6 +22048,7 @@ void GL_APIENTRY GetTexLevelParameterivANGLEContextANGLE(GLeglContext ctx,
             ValidateGetTexLevelParameterivANGLE(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameteriv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameterivANGLE, context, target, level, pname, params);
         }
     }
 }
@@ -18860,11 +22059,13 @@ void GL_APIENTRY GetTexLevelParameterfvANGLEContextANGLE(GLeglContext ctx,
                                                          GLenum pname,
                                                          GLfloat *params)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetTexLevelParameterfvANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT(
         "(GLenum target = 0x%X, GLint level = %d, GLenum pname = 0x%X, GLfloat * params = "
         "0x%016" PRIxPTR ")",
         target, level, pname, (uintptr_t)params);
+    ANGLE_BINARY_TRACE(EntryPoint::GetTexLevelParameterfvANGLE, target, level, pname, params);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18875,6 +22076,7 @@ void GL_APIENTRY GetTexLevelParameterfvANGLEContextANGLE(GLeglContext ctx,
             ValidateGetTexLevelParameterfvANGLE(context, targetPacked, level, pname, params))
         {
             context->getTexLevelParameterfv(targetPacked, level, pname, params);
+            ANGLE_CAPTURE(GetTexLevelParameterfvANGLE, context, target, level, pname, params);
         }
     }
 }
@@ -18885,10 +22087,12 @@ void GL_APIENTRY MultiDrawArraysANGLEContextANGLE(GLeglContext ctx,
                                                   const GLsizei *counts,
                                                   GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawArraysANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
           ", const GLsizei *counts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawArraysANGLE, mode, firsts, counts, drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18899,6 +22103,7 @@ void GL_APIENTRY MultiDrawArraysANGLEContextANGLE(GLeglContext ctx,
             ValidateMultiDrawArraysANGLE(context, modePacked, firsts, counts, drawcount))
         {
             context->multiDrawArrays(modePacked, firsts, counts, drawcount);
+            ANGLE_CAPTURE(MultiDrawArraysANGLE, context, mode, firsts, counts, drawcount);
         }
     }
 }
@@ -18910,11 +22115,14 @@ void GL_APIENTRY MultiDrawArraysInstancedANGLEContextANGLE(GLeglContext ctx,
                                                            const GLsizei *instanceCounts,
                                                            GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawArraysInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLint *firsts = 0x%016" PRIxPTR
           ", const GLsizei *counts = 0x%016" PRIxPTR
           ", const GLsizei *instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)firsts, (uintptr_t)counts, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawArraysInstancedANGLE, mode, firsts, counts,
+                       instanceCounts, drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18927,6 +22135,8 @@ void GL_APIENTRY MultiDrawArraysInstancedANGLEContextANGLE(GLeglContext ctx,
         {
             context->multiDrawArraysInstanced(modePacked, firsts, counts, instanceCounts,
                                               drawcount);
+            ANGLE_CAPTURE(MultiDrawArraysInstancedANGLE, context, mode, firsts, counts,
+                          instanceCounts, drawcount);
         }
     }
 }
@@ -18938,11 +22148,13 @@ void GL_APIENTRY MultiDrawElementsANGLEContextANGLE(GLeglContext ctx,
                                                     const GLvoid *const *indices,
                                                     GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawElementsANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLsizei *counts = 0x%016" PRIxPTR
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawElementsANGLE, mode, counts, type, indices, drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18955,6 +22167,7 @@ void GL_APIENTRY MultiDrawElementsANGLEContextANGLE(GLeglContext ctx,
                                            drawcount))
         {
             context->multiDrawElements(modePacked, counts, typePacked, indices, drawcount);
+            ANGLE_CAPTURE(MultiDrawElementsANGLE, context, mode, counts, type, indices, drawcount);
         }
     }
 }
@@ -18967,11 +22180,14 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLEContextANGLE(GLeglContext ctx,
                                                              const GLsizei *instanceCounts,
                                                              GLsizei drawcount)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::MultiDrawElementsInstancedANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X, const GLsizei *counts = 0x%016" PRIxPTR
           ", GLenum type = 0x%X, const GLvoid *const*indices = 0x%016" PRIxPTR
           ", const GLsizei*instanceCounts = 0x%016" PRIxPTR ", GLsizei drawcount = %d)",
           mode, (uintptr_t)counts, type, (uintptr_t)indices, (uintptr_t)instanceCounts, drawcount);
+    ANGLE_BINARY_TRACE(EntryPoint::MultiDrawElementsInstancedANGLE, mode, counts, type, indices,
+                       instanceCounts, drawcount);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -18985,6 +22201,8 @@ void GL_APIENTRY MultiDrawElementsInstancedANGLEContextANGLE(GLeglContext ctx,
         {
             context->multiDrawElementsInstanced(modePacked, counts, typePacked, indices,
                                                 instanceCounts, drawcount);
+            ANGLE_CAPTURE(MultiDrawElementsInstancedANGLE, context, mode, counts, type, indices,
+                          instanceCounts, drawcount);
         }
     }
 }
@@ -18994,9 +22212,11 @@ void GL_APIENTRY GetMultisamplefvANGLEContextANGLE(GLeglContext ctx,
                                                    GLuint index,
                                                    GLfloat *val)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::GetMultisamplefvANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum pname = 0x%X, GLuint index = %u, GLfloat * val = 0x%016" PRIxPTR ")", pname,
           index, (uintptr_t)val);
+    ANGLE_BINARY_TRACE(EntryPoint::GetMultisamplefvANGLE, pname, index, val);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -19005,14 +22225,17 @@ void GL_APIENTRY GetMultisamplefvANGLEContextANGLE(GLeglContext ctx,
         if (context->skipValidation() || ValidateGetMultisamplefvANGLE(context, pname, index, val))
         {
             context->getMultisamplefv(pname, index, val);
+            ANGLE_CAPTURE(GetMultisamplefvANGLE, context, pname, index, val);
         }
     }
 }
 
 void GL_APIENTRY SampleMaskiANGLEContextANGLE(GLeglContext ctx, GLuint maskNumber, GLbitfield mask)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::SampleMaskiANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLuint maskNumber = %u, GLbitfield mask = 0x%X)", maskNumber, mask);
+    ANGLE_BINARY_TRACE(EntryPoint::SampleMaskiANGLE, maskNumber, mask);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -19021,14 +22244,17 @@ void GL_APIENTRY SampleMaskiANGLEContextANGLE(GLeglContext ctx, GLuint maskNumbe
         if (context->skipValidation() || ValidateSampleMaskiANGLE(context, maskNumber, mask))
         {
             context->sampleMaski(maskNumber, mask);
+            ANGLE_CAPTURE(SampleMaskiANGLE, context, maskNumber, mask);
         }
     }
 }
 
 void GL_APIENTRY ProvokingVertexANGLEContextANGLE(GLeglContext ctx, GLenum mode)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::ProvokingVertexANGLE);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum mode = 0x%X)", mode);
+    ANGLE_BINARY_TRACE(EntryPoint::ProvokingVertexANGLE, mode);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -19038,14 +22264,38 @@ void GL_APIENTRY ProvokingVertexANGLEContextANGLE(GLeglContext ctx, GLenum mode)
         if (context->skipValidation() || ValidateProvokingVertexANGLE(context, modePacked))
         {
             context->provokingVertex(modePacked);
+            ANGLE_CAPTURE(ProvokingVertexANGLE, context, mode);
+        }
+    }
+}
+
+void GL_APIENTRY BatchCommandsANGLEContextANGLE(GLeglContext ctx,
+                                                GLsizei size,
+                                                const GLuint64 *commands)
+{
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::BatchCommandsANGLE);
+    ANGLE_SCOPED_GLOBAL_LOCK();
+    EVENT("(GLsizei size = %d, const GLuint64 *commands = 0x%016" PRIxPTR ")", size,
+          (uintptr_t)commands);
+    ANGLE_BINARY_TRACE(EntryPoint::BatchCommandsANGLE, size, commands);
+
+    Context *context = static_cast<gl::Context *>(ctx);
+    if (context)
+    {
+        ASSERT(context == GetValidGlobalContext());
+        if (context->skipValidation() || ValidateBatchCommandsANGLE(context, size, commands))
+        {
+            DecodeBatchCommands(context, size, commands);
         }
     }
 }
 
 void GL_APIENTRY LoseContextCHROMIUMContextANGLE(GLeglContext ctx, GLenum current, GLenum other)
 {
+    ANGLE_SCOPED_ENTRY_POINT_STATS(EntryPoint::LoseContextCHROMIUM);
     ANGLE_SCOPED_GLOBAL_LOCK();
     EVENT("(GLenum current = 0x%X, GLenum other = 0x%X)", current, other);
+    ANGLE_BINARY_TRACE(EntryPoint::LoseContextCHROMIUM, current, other);
 
     Context *context = static_cast<gl::Context *>(ctx);
     if (context)
@@ -19057,6 +22307,7 @@ void GL_APIENTRY LoseContextCHROMIUMContextANGLE(GLeglContext ctx, GLenum curren
             ValidateLoseContextCHROMIUM(context, currentPacked, otherPacked))
         {
             context->loseContext(currentPacked, otherPacked);
+            ANGLE_CAPTURE(LoseContextCHROMIUM, context, current, other);
         }
     }
 }
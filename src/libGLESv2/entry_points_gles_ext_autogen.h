@@ -20,6 +20,9 @@
 namespace gl
 {
 
+// GL_ANGLE_batch_commands
+ANGLE_EXPORT void GL_APIENTRY BatchCommandsANGLE(GLsizei size, const GLuint64 *commands);
+
 // GL_ANGLE_copy_texture_3d
 ANGLE_EXPORT void GL_APIENTRY CopyTexture3DANGLE(GLuint sourceId,
                                                  GLint sourceLevel,
@@ -3725,6 +3728,9 @@ ANGLE_EXPORT void GL_APIENTRY SampleMaskiANGLEContextANGLE(GLeglContext ctx,
                                                            GLuint maskNumber,
                                                            GLbitfield mask);
 ANGLE_EXPORT void GL_APIENTRY ProvokingVertexANGLEContextANGLE(GLeglContext ctx, GLenum mode);
+ANGLE_EXPORT void GL_APIENTRY BatchCommandsANGLEContextANGLE(GLeglContext ctx,
+                                                             GLsizei size,
+                                                             const GLuint64 *commands);
 ANGLE_EXPORT void GL_APIENTRY LoseContextCHROMIUMContextANGLE(GLeglContext ctx,
                                                               GLenum current,
                                                               GLenum other);
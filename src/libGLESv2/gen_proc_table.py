@@ -32,6 +32,8 @@ template_cpp = """// GENERATED FILE - DO NOT EDIT.
 
 #include "libGLESv2/proc_table.h"
 
+#include <string.h>
+
 #include "libGLESv2/entry_points_egl.h"
 #include "libGLESv2/entry_points_egl_ext.h"
 #include "libGLESv2/entry_points_gles_1_0_autogen.h"
@@ -45,17 +47,110 @@ template_cpp = """// GENERATED FILE - DO NOT EDIT.
 
 namespace egl
 {{
+namespace
+{{
+// Seeds of the minimal perfect hash that g_procTable is laid out by. Names are split into buckets
+// by their hash, and each bucket has a seed that sends all of its names to free slots.
+constexpr size_t kNumProcBuckets = {num_buckets};
+constexpr uint16_t kProcBucketSeeds[kNumProcBuckets] = {{
+{bucket_seeds}
+}};
+
+// FNV-1a.
+uint32_t HashProcName(const char *procname)
+{{
+    uint32_t hash = 0x811C9DC5u;
+    for (const char *c = procname; *c != '\\0'; ++c)
+    {{
+        hash = (hash ^ static_cast<uint8_t>(*c)) * 0x01000193u;
+    }}
+    return hash;
+}}
+
+// The MurmurHash3 finalizer.
+uint32_t MixProcHash(uint32_t hash, uint32_t seed)
+{{
+    hash ^= seed;
+    hash ^= hash >> 16;
+    hash *= 0x85EBCA6Bu;
+    hash ^= hash >> 13;
+    hash *= 0xC2B2AE35u;
+    hash ^= hash >> 16;
+    return hash;
+}}
+}}  // anonymous namespace
+
 ProcEntry g_procTable[] = {{
 {proc_data}
 }};
 
 size_t g_numProcs = {num_procs};
+
+const ProcEntry *FindProcEntry(const char *procname)
+{{
+    uint32_t hash        = HashProcName(procname);
+    uint32_t seed        = kProcBucketSeeds[hash % kNumProcBuckets];
+    const ProcEntry &entry = g_procTable[MixProcHash(hash, seed) % g_numProcs];
+    return strcmp(entry.first, procname) == 0 ? &entry : nullptr;
+}}
 }}  // namespace egl
 """
 
+# Average number of names per bucket of the perfect hash. Larger buckets make for a smaller seed
+# table, but for a longer search and larger seeds.
+names_per_bucket = 4
+
 sys.path.append('../libANGLE/renderer')
 import angle_format
 
+def hash_proc_name(name):
+    hash = 0x811C9DC5
+    for c in name:
+        hash = ((hash ^ ord(c)) * 0x01000193) & 0xFFFFFFFF
+    return hash
+
+def mix_proc_hash(hash, seed):
+    hash ^= seed
+    hash ^= hash >> 16
+    hash = (hash * 0x85EBCA6B) & 0xFFFFFFFF
+    hash ^= hash >> 13
+    hash = (hash * 0xC2B2AE35) & 0xFFFFFFFF
+    hash ^= hash >> 16
+    return hash
+
+# Builds a minimal perfect hash of the names with the CHD algorithm: the names are split into
+# buckets, and starting from the largest bucket, each is given the first seed that places all of
+# its names in free slots. Returns the bucket seeds and the names in slot order.
+def build_perfect_hash(names):
+    hashes = {name: hash_proc_name(name) for name in names}
+    if len(set(hashes.values())) != len(names):
+        raise Exception("Proc names with colliding hashes")
+
+    num_procs = len(names)
+    num_buckets = (num_procs + names_per_bucket - 1) / names_per_bucket
+    buckets = [[] for _ in range(num_buckets)]
+    for name in sorted(names):
+        buckets[hashes[name] % num_buckets].append(name)
+
+    slots = [None] * num_procs
+    seeds = [0] * num_buckets
+    for bucket_index in sorted(range(num_buckets), key=lambda index: -len(buckets[index])):
+        bucket = buckets[bucket_index]
+        if not bucket:
+            continue
+        for seed in range(1 << 16):
+            bucket_slots = [mix_proc_hash(hashes[name], seed) % num_procs for name in bucket]
+            if (len(set(bucket_slots)) == len(bucket) and
+                    all(slots[slot] is None for slot in bucket_slots)):
+                break
+        else:
+            raise Exception("No perfect hash seed found for bucket %d" % bucket_index)
+        seeds[bucket_index] = seed
+        for name, slot in zip(bucket, bucket_slots):
+            slots[slot] = name
+
+    return seeds, slots
+
 def main():
 
     # auto_script parameters.
@@ -88,13 +183,16 @@ def main():
             else:
                 all_functions[function] = function
 
-    proc_data = [('    {"%s", P(%s)}' % (func, angle_func)) for func, angle_func in sorted(all_functions.iteritems())]
+    seeds, slots = build_perfect_hash(all_functions.keys())
+    proc_data = [('    {"%s", P(%s)}' % (func, all_functions[func])) for func in slots]
 
     with open(out_file_name, 'w') as out_file:
         output_cpp = template_cpp.format(
             script_name = sys.argv[0],
             data_source_name = data_source_name,
             copyright_year = date.today().year,
+            num_buckets = len(seeds),
+            bucket_seeds = ", ".join([str(seed) for seed in seeds]),
             proc_data = ",\n".join(proc_data),
             num_procs = len(proc_data))
         out_file.write(output_cpp)
@@ -121,6 +121,33 @@ std::mutex &GetGlobalMutex()
 {
     return g_Mutex;
 }
+
+#    if defined(ANGLE_ELIDE_GLOBAL_LOCK)
+std::atomic<bool> gGlobalLockElided(true);
+std::atomic<std::thread::id> gGlobalLockElisionThread{std::thread::id()};
+std::atomic<size_t> gElidedCallCount(0);
+
+bool OnGlobalLockElisionEntry()
+{
+    // The first thread to enter an entry point keeps eliding the lock.
+    std::thread::id currentThread = std::this_thread::get_id();
+    std::thread::id noThread;
+    if (gGlobalLockElisionThread.compare_exchange_strong(noThread, currentThread) ||
+        noThread == currentThread)
+    {
+        return true;
+    }
+
+    // Any other thread turns the lock back on for good. The calls the first thread started
+    // without the lock must finish before this thread takes it.
+    gGlobalLockElided.store(false);
+    while (gElidedCallCount.load() > 0)
+    {
+        std::this_thread::yield();
+    }
+    return false;
+}
+#    endif  // defined(ANGLE_ELIDE_GLOBAL_LOCK)
 }  // namespace angle
 #endif
 
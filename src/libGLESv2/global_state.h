@@ -16,6 +16,11 @@
 
 #include <mutex>
 
+#if defined(ANGLE_ELIDE_GLOBAL_LOCK)
+#    include <atomic>
+#    include <thread>
+#endif  // defined(ANGLE_ELIDE_GLOBAL_LOCK)
+
 namespace egl
 {
 class Debug;
@@ -58,12 +63,90 @@ ANGLE_INLINE Context *GetValidGlobalContext()
 namespace angle
 {
 std::mutex &GetGlobalMutex();
+
+#    if defined(ANGLE_ELIDE_GLOBAL_LOCK)
+// Set until a second thread enters an EGL or GL entry point. Entry points generated with
+// --elide-global-lock skip the global lock on the first thread while it is set. EGL entry points
+// always lock.
+extern std::atomic<bool> gGlobalLockElided;
+extern std::atomic<std::thread::id> gGlobalLockElisionThread;
+
+// The calls running without the global lock.
+extern std::atomic<size_t> gElidedCallCount;
+
+// Called while gGlobalLockElided is set by a thread other than the first one, or before any thread
+// entered. Returns whether the calling thread may elide the lock. Otherwise, clears
+// gGlobalLockElided and waits for the calls running without the lock to finish.
+bool OnGlobalLockElisionEntry();
+
+ANGLE_INLINE bool CanElideGlobalLock()
+{
+    return gGlobalLockElided.load(std::memory_order_acquire) &&
+           (gGlobalLockElisionThread.load(std::memory_order_relaxed) ==
+                std::this_thread::get_id() ||
+            OnGlobalLockElisionEntry());
+}
+
+class ScopedGlobalLock final : angle::NonCopyable
+{
+  public:
+    ScopedGlobalLock()
+    {
+        CanElideGlobalLock();
+        GetGlobalMutex().lock();
+    }
+    ~ScopedGlobalLock() { GetGlobalMutex().unlock(); }
+};
+
+class ScopedElidableGlobalLock final : angle::NonCopyable
+{
+  public:
+    ScopedElidableGlobalLock() : mElided(false)
+    {
+        if (CanElideGlobalLock())
+        {
+            // Pairs with OnGlobalLockElisionEntry: either the call is counted before the flag is
+            // cleared, and is waited for, or it sees the flag cleared and takes the lock.
+            gElidedCallCount.fetch_add(1);
+            if (gGlobalLockElided.load())
+            {
+                mElided = true;
+                return;
+            }
+            gElidedCallCount.fetch_sub(1);
+        }
+        GetGlobalMutex().lock();
+    }
+
+    ~ScopedElidableGlobalLock()
+    {
+        if (mElided)
+        {
+            gElidedCallCount.fetch_sub(1, std::memory_order_release);
+        }
+        else
+        {
+            GetGlobalMutex().unlock();
+        }
+    }
+
+  private:
+    bool mElided;
+};
+#    endif  // defined(ANGLE_ELIDE_GLOBAL_LOCK)
 }  // namespace angle
 
-#    define ANGLE_SCOPED_GLOBAL_LOCK() \
-        std::lock_guard<std::mutex> globalMutexLock(angle::GetGlobalMutex())
+#    if defined(ANGLE_ELIDE_GLOBAL_LOCK)
+#        define ANGLE_SCOPED_GLOBAL_LOCK() angle::ScopedGlobalLock globalMutexLock
+#        define ANGLE_SCOPED_ELIDABLE_GLOBAL_LOCK() angle::ScopedElidableGlobalLock globalMutexLock
+#    else
+#        define ANGLE_SCOPED_GLOBAL_LOCK() \
+            std::lock_guard<std::mutex> globalMutexLock(angle::GetGlobalMutex())
+#        define ANGLE_SCOPED_ELIDABLE_GLOBAL_LOCK() ANGLE_SCOPED_GLOBAL_LOCK()
+#    endif  // defined(ANGLE_ELIDE_GLOBAL_LOCK)
 #else
 #    define ANGLE_SCOPED_GLOBAL_LOCK()
+#    define ANGLE_SCOPED_ELIDABLE_GLOBAL_LOCK()
 #endif
 
 #endif  // LIBGLESV2_GLOBALSTATE_H_
@@ -2418,6 +2418,12 @@ void GL_APIENTRY glVertexPointer(GLint size, GLenum type, GLsizei stride, const
     return gl::VertexPointer(size, type, stride, pointer);
 }
 
+// GL_ANGLE_batch_commands
+void GL_APIENTRY glBatchCommandsANGLE(GLsizei size, const GLuint64 *commands)
+{
+    return gl::BatchCommandsANGLE(size, commands);
+}
+
 // GL_ANGLE_copy_texture_3d
 void GL_APIENTRY glCopyTexture3DANGLE(GLuint sourceId,
                                       GLint sourceLevel,
@@ -9551,6 +9557,13 @@ void GL_APIENTRY glProvokingVertexANGLEContextANGLE(GLeglContext ctx, GLenum mod
     return gl::ProvokingVertexANGLEContextANGLE(ctx, mode);
 }
 
+void GL_APIENTRY glBatchCommandsANGLEContextANGLE(GLeglContext ctx,
+                                                  GLsizei size,
+                                                  const GLuint64 *commands)
+{
+    return gl::BatchCommandsANGLEContextANGLE(ctx, size, commands);
+}
+
 void GL_APIENTRY glLoseContextCHROMIUMContextANGLE(GLeglContext ctx, GLenum current, GLenum other)
 {
     return gl::LoseContextCHROMIUMContextANGLE(ctx, current, other);
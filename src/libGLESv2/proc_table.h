@@ -20,6 +20,10 @@ using ProcEntry = std::pair<const char *, __eglMustCastToProperFunctionPointerTy
 
 extern ProcEntry g_procTable[];
 extern size_t g_numProcs;
+
+// Returns the entry named procname, or nullptr. g_procTable is laid out by a minimal perfect hash of
+// the names, so this only does a single strcmp.
+const ProcEntry *FindProcEntry(const char *procname);
 }  // namespace egl
 
 #endif  // LIBGLESV2_PROC_TABLE_H_
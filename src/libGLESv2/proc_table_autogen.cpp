@@ -1,7 +1,7 @@
 // GENERATED FILE - DO NOT EDIT.
 // Generated by gen_proc_table.py using data from proc_table_data.json.
 //
-// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
 // Use of this source code is governed by a BSD-style license that can be
 // found in the LICENSE file.
 //
@@ -11,6 +11,8 @@
 
 #include "libGLESv2/proc_table.h"
 
+#include <string.h>
+
 #include "libGLESv2/entry_points_egl.h"
 #include "libGLESv2/entry_points_egl_ext.h"
 #include "libGLESv2/entry_points_gles_1_0_autogen.h"
@@ -24,1399 +26,1460 @@
 
 namespace egl
 {
+namespace
+{
+// Seeds of the minimal perfect hash that g_procTable is laid out by. Names are split into buckets
+// by their hash, and each bucket has a seed that sends all of its names to free slots.
+constexpr size_t kNumProcBuckets                     = 334;
+constexpr uint16_t kProcBucketSeeds[kNumProcBuckets] = {
+    1,    12,  10,   126, 54,   21,   7,    37,  17,   90,   392, 13,  63,   0,   166,  34,   0,
+    1,    10,  20,   9,   2,    104,  24,   0,   6,    0,    8,   0,   39,   243, 12,   17,   0,
+    16,   121, 13,   35,  10,   0,    41,   4,   4,    6,    3,   137, 14,   23,  4,    3,    16,
+    25,   111, 5,    0,   280,  0,    7,    90,  87,   72,   3,   19,  42,   4,   5,    31,   86,
+    4,    24,  178,  71,  47,   5,    107,  53,  0,    38,   0,   202, 40,   203, 332,  0,    43,
+    83,   31,  174,  9,   23,   111,  146,  0,   17,   3,    83,  25,  6,    23,  9,    4,    124,
+    2,    10,  125,  8,   1,    125,  60,   136, 110,  62,   21,  54,  114,  4,   523,  35,   60,
+    1,    2,   1,    5,   13,   5,    30,   2,   62,   215,  0,   16,  189,  147, 0,    0,    25,
+    6,    39,  7,    83,  41,   372,  13,   12,  362,  202,  4,   26,  20,   1,   0,    100,  1,
+    28,   65,  120,  80,  180,  162,  764,  0,   0,    27,   93,  0,   48,   227, 24,   6,    111,
+    60,   120, 169,  24,  3,    51,   105,  446, 96,   13,   266, 16,  128,  18,  44,   0,    20,
+    99,   24,  35,   3,   144,  38,   34,   17,  14,   41,   40,  7,   23,   24,  1,    5,    176,
+    218,  132, 129,  19,  1,    338,  648,  17,  186,  296,  3,   211, 197,  417, 1,    1,    11,
+    683,  85,  10,   41,  56,   107,  323,  279, 269,  170,  142, 1,   23,   84,  76,   433,  2,
+    122,  552, 202,  475, 703,  23,   70,   7,   13,   708,  9,   96,  179,  0,   25,   0,    765,
+    70,   540, 304,  74,  369,  10,   127,  19,  12,   13,   84,  25,  190,  144, 52,   420,  185,
+    1516, 54,  1,    15,  164,  1370, 2301, 103, 378,  425,  23,  6,   202,  574, 103,  3,    31,
+    23,   898, 705,  25,  1644, 248,  500,  20,  0,    2350, 1,   644, 1505, 690, 314,  1,    1695,
+    506,  29,  2980, 88,  19,   16,   2,    205, 1349, 1,    89,  7,   460,  93,  2643, 3228, 8,
+    103,  11,  604,  28,  1320, 906,  61,   1,   260,  11,   305};
+
+// FNV-1a.
+uint32_t HashProcName(const char *procname)
+{
+    uint32_t hash = 0x811C9DC5u;
+    for (const char *c = procname; *c != '\0'; ++c)
+    {
+        hash = (hash ^ static_cast<uint8_t>(*c)) * 0x01000193u;
+    }
+    return hash;
+}
+
+// The MurmurHash3 finalizer.
+uint32_t MixProcHash(uint32_t hash, uint32_t seed)
+{
+    hash ^= seed;
+    hash ^= hash >> 16;
+    hash *= 0x85EBCA6Bu;
+    hash ^= hash >> 13;
+    hash *= 0xC2B2AE35u;
+    hash ^= hash >> 16;
+    return hash;
+}
+}  // anonymous namespace
+
 ProcEntry g_procTable[] = {
-    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
-    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
-    {"eglBindAPI", P(EGL_BindAPI)},
-    {"eglBindTexImage", P(EGL_BindTexImage)},
-    {"eglChooseConfig", P(EGL_ChooseConfig)},
-    {"eglClientWaitSync", P(EGL_ClientWaitSync)},
-    {"eglClientWaitSyncKHR", P(EGL_ClientWaitSyncKHR)},
-    {"eglCopyBuffers", P(EGL_CopyBuffers)},
-    {"eglCreateContext", P(EGL_CreateContext)},
-    {"eglCreateDeviceANGLE", P(EGL_CreateDeviceANGLE)},
-    {"eglCreateImage", P(EGL_CreateImage)},
-    {"eglCreateImageKHR", P(EGL_CreateImageKHR)},
-    {"eglCreatePbufferFromClientBuffer", P(EGL_CreatePbufferFromClientBuffer)},
-    {"eglCreatePbufferSurface", P(EGL_CreatePbufferSurface)},
-    {"eglCreatePixmapSurface", P(EGL_CreatePixmapSurface)},
-    {"eglCreatePlatformPixmapSurface", P(EGL_CreatePlatformPixmapSurface)},
-    {"eglCreatePlatformPixmapSurfaceEXT", P(EGL_CreatePlatformPixmapSurfaceEXT)},
-    {"eglCreatePlatformWindowSurface", P(EGL_CreatePlatformWindowSurface)},
-    {"eglCreatePlatformWindowSurfaceEXT", P(EGL_CreatePlatformWindowSurfaceEXT)},
-    {"eglCreateStreamKHR", P(EGL_CreateStreamKHR)},
+    {"glGenBuffersContextANGLE", P(gl::GenBuffersContextANGLE)},
+    {"glNormal3fContextANGLE", P(gl::Normal3fContextANGLE)},
+    {"glBatchCommandsANGLE", P(gl::BatchCommandsANGLE)},
+    {"glUniform4ivContextANGLE", P(gl::Uniform4ivContextANGLE)},
+    {"glGetFragDataLocationContextANGLE", P(gl::GetFragDataLocationContextANGLE)},
+    {"glTestFenceNV", P(gl::TestFenceNV)},
+    {"glLoseContextCHROMIUM", P(gl::LoseContextCHROMIUM)},
+    {"eglSwapInterval", P(EGL_SwapInterval)},
+    {"glLoadPaletteFromModelViewMatrixOESContextANGLE",
+     P(gl::LoadPaletteFromModelViewMatrixOESContextANGLE)},
+    {"glProgramUniform2fContextANGLE", P(gl::ProgramUniform2fContextANGLE)},
+    {"glBindVertexArray", P(gl::BindVertexArray)},
+    {"glIsVertexArrayOES", P(gl::IsVertexArrayOES)},
     {"eglCreateStreamProducerD3DTextureANGLE", P(EGL_CreateStreamProducerD3DTextureANGLE)},
-    {"eglCreateSync", P(EGL_CreateSync)},
+    {"glLineWidthContextANGLE", P(gl::LineWidthContextANGLE)},
+    {"glUniformMatrix3x4fv", P(gl::UniformMatrix3x4fv)},
+    {"glEGLImageTargetTexture2DOESContextANGLE", P(gl::EGLImageTargetTexture2DOESContextANGLE)},
+    {"glStencilFillPathCHROMIUMContextANGLE", P(gl::StencilFillPathCHROMIUMContextANGLE)},
+    {"glGetVertexAttribfvRobustANGLE", P(gl::GetVertexAttribfvRobustANGLE)},
+    {"glVertexAttribFormat", P(gl::VertexAttribFormat)},
+    {"glDepthRangef", P(gl::DepthRangef)},
+    {"glTexSubImage3DRobustANGLE", P(gl::TexSubImage3DRobustANGLE)},
+    {"glTexStorageMem3DMultisampleEXT", P(gl::TexStorageMem3DMultisampleEXT)},
     {"eglCreateSyncKHR", P(EGL_CreateSyncKHR)},
-    {"eglCreateWindowSurface", P(EGL_CreateWindowSurface)},
+    {"glDrawTexivOES", P(gl::DrawTexivOES)},
+    {"glProgramUniform3iContextANGLE", P(gl::ProgramUniform3iContextANGLE)},
+    {"glDeleteTransformFeedbacks", P(gl::DeleteTransformFeedbacks)},
+    {"glGetTexParameterIivOESContextANGLE", P(gl::GetTexParameterIivOESContextANGLE)},
+    {"glGetBooleani_vContextANGLE", P(gl::GetBooleani_vContextANGLE)},
+    {"glColorPointerContextANGLE", P(gl::ColorPointerContextANGLE)},
+    {"glMapBufferRange", P(gl::MapBufferRange)},
+    {"glSamplerParameterIuivOES", P(gl::SamplerParameterIuivOES)},
+    {"glGetVertexAttribivRobustANGLEContextANGLE", P(gl::GetVertexAttribivRobustANGLEContextANGLE)},
+    {"glFlushMappedBufferRangeEXTContextANGLE", P(gl::FlushMappedBufferRangeEXTContextANGLE)},
+    {"glBindVertexArrayOESContextANGLE", P(gl::BindVertexArrayOESContextANGLE)},
+    {"glGetBufferParameteri64vRobustANGLEContextANGLE",
+     P(gl::GetBufferParameteri64vRobustANGLEContextANGLE)},
+    {"glStencilStrokePathInstancedCHROMIUM", P(gl::StencilStrokePathInstancedCHROMIUM)},
+    {"glStencilOp", P(gl::StencilOp)},
+    {"glGetSamplerParameterIivRobustANGLE", P(gl::GetSamplerParameterIivRobustANGLE)},
+    {"eglStreamConsumerReleaseKHR", P(EGL_StreamConsumerReleaseKHR)},
+    {"glGetShaderPrecisionFormatContextANGLE", P(gl::GetShaderPrecisionFormatContextANGLE)},
+    {"glVertexAttrib2fContextANGLE", P(gl::VertexAttrib2fContextANGLE)},
+    {"glGetQueryObjecti64vRobustANGLEContextANGLE",
+     P(gl::GetQueryObjecti64vRobustANGLEContextANGLE)},
+    {"glPointParameterxContextANGLE", P(gl::PointParameterxContextANGLE)},
+    {"glCoverStrokePathInstancedCHROMIUM", P(gl::CoverStrokePathInstancedCHROMIUM)},
+    {"glFrustumf", P(gl::Frustumf)},
+    {"glGetUniformuiv", P(gl::GetUniformuiv)},
+    {"glGetTransformFeedbackVarying", P(gl::GetTransformFeedbackVarying)},
+    {"glSamplerParameterfv", P(gl::SamplerParameterfv)},
+    {"glTexStorageMem3DEXT", P(gl::TexStorageMem3DEXT)},
+    {"glGetUniformfv", P(gl::GetUniformfv)},
+    {"glTexParameterIivOES", P(gl::TexParameterIivOES)},
+    {"glSamplerParameterivRobustANGLEContextANGLE",
+     P(gl::SamplerParameterivRobustANGLEContextANGLE)},
+    {"glBindVertexArrayContextANGLE", P(gl::BindVertexArrayContextANGLE)},
+    {"glFramebufferTextureMultiviewOVRContextANGLE",
+     P(gl::FramebufferTextureMultiviewOVRContextANGLE)},
+    {"glStencilThenCoverStrokePathInstancedCHROMIUM",
+     P(gl::StencilThenCoverStrokePathInstancedCHROMIUM)},
+    {"glCoverFillPathCHROMIUMContextANGLE", P(gl::CoverFillPathCHROMIUMContextANGLE)},
+    {"glGetFramebufferParameterivRobustANGLEContextANGLE",
+     P(gl::GetFramebufferParameterivRobustANGLEContextANGLE)},
+    {"glInvalidateFramebufferContextANGLE", P(gl::InvalidateFramebufferContextANGLE)},
+    {"glUniformMatrix4x2fvContextANGLE", P(gl::UniformMatrix4x2fvContextANGLE)},
+    {"glBlendEquation", P(gl::BlendEquation)},
+    {"glUniform4iv", P(gl::Uniform4iv)},
+    {"glSamplerParameteri", P(gl::SamplerParameteri)},
+    {"glGetFramebufferParameterivRobustANGLE", P(gl::GetFramebufferParameterivRobustANGLE)},
+    {"glUniform3ivContextANGLE", P(gl::Uniform3ivContextANGLE)},
+    {"glTexStorageMem2DEXT", P(gl::TexStorageMem2DEXT)},
+    {"glBindFragDataLocationIndexedEXT", P(gl::BindFragDataLocationIndexedEXT)},
+    {"glVertexAttribDivisor", P(gl::VertexAttribDivisor)},
+    {"glIsFramebuffer", P(gl::IsFramebuffer)},
+    {"glGetBufferPointervOESContextANGLE", P(gl::GetBufferPointervOESContextANGLE)},
+    {"glQueryMatrixxOESContextANGLE", P(gl::QueryMatrixxOESContextANGLE)},
+    {"eglClientWaitSyncKHR", P(EGL_ClientWaitSyncKHR)},
+    {"glFlushMappedBufferRange", P(gl::FlushMappedBufferRange)},
+    {"glGetSamplerParameterfv", P(gl::GetSamplerParameterfv)},
+    {"glGenFramebuffersContextANGLE", P(gl::GenFramebuffersContextANGLE)},
+    {"glClearDepthfContextANGLE", P(gl::ClearDepthfContextANGLE)},
+    {"glPolygonOffsetx", P(gl::PolygonOffsetx)},
+    {"glGetInteger64i_vContextANGLE", P(gl::GetInteger64i_vContextANGLE)},
+    {"glGetnUniformivEXT", P(gl::GetnUniformivEXT)},
+    {"eglBindAPI", P(EGL_BindAPI)},
+    {"glGetBufferParameteri64vContextANGLE", P(gl::GetBufferParameteri64vContextANGLE)},
+    {"glFinishFenceNVContextANGLE", P(gl::FinishFenceNVContextANGLE)},
+    {"glSamplerParameteriv", P(gl::SamplerParameteriv)},
+    {"glProgramUniform1f", P(gl::ProgramUniform1f)},
+    {"glUniform1iv", P(gl::Uniform1iv)},
+    {"glProgramUniformMatrix2fv", P(gl::ProgramUniformMatrix2fv)},
+    {"eglGetConfigAttrib", P(EGL_GetConfigAttrib)},
+    {"glVertexAttribPointer", P(gl::VertexAttribPointer)},
+    {"glGetTexEnvxvContextANGLE", P(gl::GetTexEnvxvContextANGLE)},
+    {"glDeletePathsCHROMIUMContextANGLE", P(gl::DeletePathsCHROMIUMContextANGLE)},
+    {"glShaderBinaryContextANGLE", P(gl::ShaderBinaryContextANGLE)},
+    {"glGenQueries", P(gl::GenQueries)},
+    {"glTexParameteriContextANGLE", P(gl::TexParameteriContextANGLE)},
+    {"glUniform3fv", P(gl::Uniform3fv)},
+    {"glGetQueryivContextANGLE", P(gl::GetQueryivContextANGLE)},
+    {"glDrawArraysInstancedANGLEContextANGLE", P(gl::DrawArraysInstancedANGLEContextANGLE)},
+    {"glUnmapBufferContextANGLE", P(gl::UnmapBufferContextANGLE)},
+    {"glTexStorage2DEXTContextANGLE", P(gl::TexStorage2DEXTContextANGLE)},
+    {"glUniform3ui", P(gl::Uniform3ui)},
+    {"glGetFloatvContextANGLE", P(gl::GetFloatvContextANGLE)},
+    {"glShaderBinary", P(gl::ShaderBinary)},
+    {"glOrthoxContextANGLE", P(gl::OrthoxContextANGLE)},
+    {"glVertexBindingDivisor", P(gl::VertexBindingDivisor)},
+    {"glIsQueryContextANGLE", P(gl::IsQueryContextANGLE)},
+    {"glDrawTexsOESContextANGLE", P(gl::DrawTexsOESContextANGLE)},
+    {"glDrawTexxvOES", P(gl::DrawTexxvOES)},
+    {"glIsBufferContextANGLE", P(gl::IsBufferContextANGLE)},
+    {"glRotatex", P(gl::Rotatex)},
+    {"glGenTextures", P(gl::GenTextures)},
+    {"glCompileShader", P(gl::CompileShader)},
+    {"glDrawTexxOES", P(gl::DrawTexxOES)},
+    {"glObjectPtrLabelKHR", P(gl::ObjectPtrLabelKHR)},
+    {"glGetUnsignedBytevEXT", P(gl::GetUnsignedBytevEXT)},
+    {"glGetBufferPointervOES", P(gl::GetBufferPointervOES)},
+    {"glIsQueryEXTContextANGLE", P(gl::IsQueryEXTContextANGLE)},
+    {"glImportMemoryFdEXT", P(gl::ImportMemoryFdEXT)},
+    {"glDrawBuffersEXT", P(gl::DrawBuffersEXT)},
+    {"glReadnPixelsEXTContextANGLE", P(gl::ReadnPixelsEXTContextANGLE)},
+    {"glFrontFace", P(gl::FrontFace)},
+    {"glCopySubTextureCHROMIUMContextANGLE", P(gl::CopySubTextureCHROMIUMContextANGLE)},
+    {"glRotatexContextANGLE", P(gl::RotatexContextANGLE)},
+    {"glClientActiveTexture", P(gl::ClientActiveTexture)},
+    {"glLoadMatrixf", P(gl::LoadMatrixf)},
+    {"glDisableContextANGLE", P(gl::DisableContextANGLE)},
+    {"eglDestroySurface", P(EGL_DestroySurface)},
+    {"glBlendFuncContextANGLE", P(gl::BlendFuncContextANGLE)},
+    {"glDeleteMemoryObjectsEXTContextANGLE", P(gl::DeleteMemoryObjectsEXTContextANGLE)},
+    {"glPointParameterfvContextANGLE", P(gl::PointParameterfvContextANGLE)},
+    {"glFramebufferParameteri", P(gl::FramebufferParameteri)},
+    {"glGetAttachedShadersContextANGLE", P(gl::GetAttachedShadersContextANGLE)},
+    {"glLightxv", P(gl::Lightxv)},
+    {"glGetFixedvContextANGLE", P(gl::GetFixedvContextANGLE)},
+    {"glDrawArraysInstanced", P(gl::DrawArraysInstanced)},
+    {"glTexStorage3DContextANGLE", P(gl::TexStorage3DContextANGLE)},
+    {"glIsRenderbufferContextANGLE", P(gl::IsRenderbufferContextANGLE)},
+    {"glVertexAttrib2f", P(gl::VertexAttrib2f)},
+    {"glPopDebugGroupKHRContextANGLE", P(gl::PopDebugGroupKHRContextANGLE)},
+    {"glCreateShaderContextANGLE", P(gl::CreateShaderContextANGLE)},
+    {"glSampleMaskiANGLE", P(gl::SampleMaskiANGLE)},
+    {"glDeleteSamplers", P(gl::DeleteSamplers)},
+    {"glProgramUniform3fv", P(gl::ProgramUniform3fv)},
+    {"glStencilMask", P(gl::StencilMask)},
+    {"glCompressedTexImage2DRobustANGLEContextANGLE",
+     P(gl::CompressedTexImage2DRobustANGLEContextANGLE)},
+    {"glClearColorContextANGLE", P(gl::ClearColorContextANGLE)},
+    {"glBindProgramPipelineContextANGLE", P(gl::BindProgramPipelineContextANGLE)},
+    {"glGetVertexAttribIivContextANGLE", P(gl::GetVertexAttribIivContextANGLE)},
+    {"glTexStorage2DMultisampleANGLEContextANGLE", P(gl::TexStorage2DMultisampleANGLEContextANGLE)},
+    {"glProgramUniform3ivContextANGLE", P(gl::ProgramUniform3ivContextANGLE)},
+    {"glReadnPixelsEXT", P(gl::ReadnPixelsEXT)},
+    {"eglCreatePlatformPixmapSurfaceEXT", P(EGL_CreatePlatformPixmapSurfaceEXT)},
+    {"glGetMemoryObjectParameterivEXTContextANGLE",
+     P(gl::GetMemoryObjectParameterivEXTContextANGLE)},
+    {"glBlendColorContextANGLE", P(gl::BlendColorContextANGLE)},
+    {"glPixelStorei", P(gl::PixelStorei)},
+    {"glGetnUniformfvEXT", P(gl::GetnUniformfvEXT)},
+    {"glCoverStrokePathCHROMIUMContextANGLE", P(gl::CoverStrokePathCHROMIUMContextANGLE)},
+    {"glBindProgramPipeline", P(gl::BindProgramPipeline)},
+    {"glUniform1fContextANGLE", P(gl::Uniform1fContextANGLE)},
+    {"glCoverStrokePathCHROMIUM", P(gl::CoverStrokePathCHROMIUM)},
+    {"glLoseContextCHROMIUMContextANGLE", P(gl::LoseContextCHROMIUMContextANGLE)},
+    {"glTranslatexContextANGLE", P(gl::TranslatexContextANGLE)},
+    {"glIsSyncContextANGLE", P(gl::IsSyncContextANGLE)},
     {"eglDebugMessageControlKHR", P(EGL_DebugMessageControlKHR)},
-    {"eglDestroyContext", P(EGL_DestroyContext)},
     {"eglDestroyImage", P(EGL_DestroyImage)},
-    {"eglDestroyImageKHR", P(EGL_DestroyImageKHR)},
-    {"eglDestroyStreamKHR", P(EGL_DestroyStreamKHR)},
-    {"eglDestroySurface", P(EGL_DestroySurface)},
-    {"eglDestroySync", P(EGL_DestroySync)},
-    {"eglDestroySyncKHR", P(EGL_DestroySyncKHR)},
-    {"eglGetCompositorTimingANDROID", P(EGL_GetCompositorTimingANDROID)},
-    {"eglGetCompositorTimingSupportedANDROID", P(EGL_GetCompositorTimingSupportedANDROID)},
-    {"eglGetConfigAttrib", P(EGL_GetConfigAttrib)},
+    {"glGetActiveUniformsivContextANGLE", P(gl::GetActiveUniformsivContextANGLE)},
+    {"glLightf", P(gl::Lightf)},
     {"eglGetConfigs", P(EGL_GetConfigs)},
-    {"eglGetCurrentContext", P(EGL_GetCurrentContext)},
-    {"eglGetCurrentDisplay", P(EGL_GetCurrentDisplay)},
-    {"eglGetCurrentSurface", P(EGL_GetCurrentSurface)},
-    {"eglGetDisplay", P(EGL_GetDisplay)},
-    {"eglGetError", P(EGL_GetError)},
-    {"eglGetFrameTimestampSupportedANDROID", P(EGL_GetFrameTimestampSupportedANDROID)},
-    {"eglGetFrameTimestampsANDROID", P(EGL_GetFrameTimestampsANDROID)},
-    {"eglGetNextFrameIdANDROID", P(EGL_GetNextFrameIdANDROID)},
-    {"eglGetPlatformDisplay", P(EGL_GetPlatformDisplay)},
-    {"eglGetPlatformDisplayEXT", P(EGL_GetPlatformDisplayEXT)},
-    {"eglGetProcAddress", P(EGL_GetProcAddress)},
-    {"eglGetSyncAttrib", P(EGL_GetSyncAttrib)},
-    {"eglGetSyncAttribKHR", P(EGL_GetSyncAttribKHR)},
-    {"eglGetSyncValuesCHROMIUM", P(EGL_GetSyncValuesCHROMIUM)},
-    {"eglInitialize", P(EGL_Initialize)},
+    {"glGetTexParameterIuivRobustANGLEContextANGLE",
+     P(gl::GetTexParameterIuivRobustANGLEContextANGLE)},
+    {"glIsProgramPipeline", P(gl::IsProgramPipeline)},
+    {"glStencilThenCoverFillPathCHROMIUM", P(gl::StencilThenCoverFillPathCHROMIUM)},
+    {"glLightfvContextANGLE", P(gl::LightfvContextANGLE)},
+    {"glGetProgramInfoLog", P(gl::GetProgramInfoLog)},
+    {"glDispatchComputeIndirectContextANGLE", P(gl::DispatchComputeIndirectContextANGLE)},
+    {"glIsQuery", P(gl::IsQuery)},
+    {"glDeleteQueries", P(gl::DeleteQueries)},
+    {"glGetQueryivEXT", P(gl::GetQueryivEXT)},
+    {"glGenProgramPipelines", P(gl::GenProgramPipelines)},
+    {"glLogicOp", P(gl::LogicOp)},
+    {"glTranslatef", P(gl::Translatef)},
     {"eglLabelObjectKHR", P(EGL_LabelObjectKHR)},
-    {"eglMakeCurrent", P(EGL_MakeCurrent)},
-    {"eglPostSubBufferNV", P(EGL_PostSubBufferNV)},
-    {"eglPresentationTimeANDROID", P(EGL_PresentationTimeANDROID)},
-    {"eglProgramCacheGetAttribANGLE", P(EGL_ProgramCacheGetAttribANGLE)},
-    {"eglProgramCachePopulateANGLE", P(EGL_ProgramCachePopulateANGLE)},
-    {"eglProgramCacheQueryANGLE", P(EGL_ProgramCacheQueryANGLE)},
-    {"eglProgramCacheResizeANGLE", P(EGL_ProgramCacheResizeANGLE)},
-    {"eglQueryAPI", P(EGL_QueryAPI)},
-    {"eglQueryContext", P(EGL_QueryContext)},
-    {"eglQueryDebugKHR", P(EGL_QueryDebugKHR)},
-    {"eglQueryDeviceAttribEXT", P(EGL_QueryDeviceAttribEXT)},
-    {"eglQueryDeviceStringEXT", P(EGL_QueryDeviceStringEXT)},
-    {"eglQueryDisplayAttribEXT", P(EGL_QueryDisplayAttribEXT)},
-    {"eglQueryStreamKHR", P(EGL_QueryStreamKHR)},
-    {"eglQueryStreamu64KHR", P(EGL_QueryStreamu64KHR)},
-    {"eglQueryString", P(EGL_QueryString)},
-    {"eglQuerySurface", P(EGL_QuerySurface)},
-    {"eglQuerySurfacePointerANGLE", P(EGL_QuerySurfacePointerANGLE)},
-    {"eglReleaseDeviceANGLE", P(EGL_ReleaseDeviceANGLE)},
-    {"eglReleaseTexImage", P(EGL_ReleaseTexImage)},
-    {"eglReleaseThread", P(EGL_ReleaseThread)},
-    {"eglSetBlobCacheFuncsANDROID", P(EGL_SetBlobCacheFuncsANDROID)},
-    {"eglStreamAttribKHR", P(EGL_StreamAttribKHR)},
-    {"eglStreamConsumerAcquireKHR", P(EGL_StreamConsumerAcquireKHR)},
-    {"eglStreamConsumerGLTextureExternalAttribsNV",
-     P(EGL_StreamConsumerGLTextureExternalAttribsNV)},
-    {"eglStreamConsumerGLTextureExternalKHR", P(EGL_StreamConsumerGLTextureExternalKHR)},
-    {"eglStreamConsumerReleaseKHR", P(EGL_StreamConsumerReleaseKHR)},
-    {"eglStreamPostD3DTextureANGLE", P(EGL_StreamPostD3DTextureANGLE)},
-    {"eglSurfaceAttrib", P(EGL_SurfaceAttrib)},
-    {"eglSwapBuffers", P(EGL_SwapBuffers)},
-    {"eglSwapBuffersWithDamageKHR", P(EGL_SwapBuffersWithDamageKHR)},
-    {"eglSwapInterval", P(EGL_SwapInterval)},
-    {"eglTerminate", P(EGL_Terminate)},
-    {"eglWaitClient", P(EGL_WaitClient)},
-    {"eglWaitGL", P(EGL_WaitGL)},
-    {"eglWaitNative", P(EGL_WaitNative)},
-    {"eglWaitSync", P(EGL_WaitSync)},
-    {"eglWaitSyncKHR", P(EGL_WaitSyncKHR)},
-    {"glActiveShaderProgram", P(gl::ActiveShaderProgram)},
-    {"glActiveShaderProgramContextANGLE", P(gl::ActiveShaderProgramContextANGLE)},
-    {"glActiveTexture", P(gl::ActiveTexture)},
-    {"glActiveTextureContextANGLE", P(gl::ActiveTextureContextANGLE)},
-    {"glAlphaFunc", P(gl::AlphaFunc)},
-    {"glAlphaFuncContextANGLE", P(gl::AlphaFuncContextANGLE)},
-    {"glAlphaFuncx", P(gl::AlphaFuncx)},
-    {"glAlphaFuncxContextANGLE", P(gl::AlphaFuncxContextANGLE)},
-    {"glAttachShader", P(gl::AttachShader)},
-    {"glAttachShaderContextANGLE", P(gl::AttachShaderContextANGLE)},
-    {"glBeginQuery", P(gl::BeginQuery)},
-    {"glBeginQueryContextANGLE", P(gl::BeginQueryContextANGLE)},
-    {"glBeginQueryEXT", P(gl::BeginQueryEXT)},
+    {"glNormalPointerContextANGLE", P(gl::NormalPointerContextANGLE)},
+    {"glProgramUniformMatrix3x4fvContextANGLE", P(gl::ProgramUniformMatrix3x4fvContextANGLE)},
+    {"glMultiTexCoord4fContextANGLE", P(gl::MultiTexCoord4fContextANGLE)},
+    {"glFrustumfContextANGLE", P(gl::FrustumfContextANGLE)},
+    {"glWeightPointerOES", P(gl::WeightPointerOES)},
+    {"glGetRenderbufferParameteriv", P(gl::GetRenderbufferParameteriv)},
+    {"glGetProgramResourceiv", P(gl::GetProgramResourceiv)},
+    {"glGetUniformuivRobustANGLE", P(gl::GetUniformuivRobustANGLE)},
+    {"glGenPathsCHROMIUMContextANGLE", P(gl::GenPathsCHROMIUMContextANGLE)},
+    {"glTexImage2D", P(gl::TexImage2D)},
+    {"glCreateMemoryObjectsEXT", P(gl::CreateMemoryObjectsEXT)},
+    {"glScissorContextANGLE", P(gl::ScissorContextANGLE)},
+    {"eglCreatePixmapSurface", P(EGL_CreatePixmapSurface)},
+    {"glGenFencesNV", P(gl::GenFencesNV)},
+    {"glLoadMatrixx", P(gl::LoadMatrixx)},
+    {"glPopDebugGroupKHR", P(gl::PopDebugGroupKHR)},
+    {"glCopySubTextureCHROMIUM", P(gl::CopySubTextureCHROMIUM)},
+    {"glGetUniformBlockIndex", P(gl::GetUniformBlockIndex)},
+    {"glUniformMatrix4x3fv", P(gl::UniformMatrix4x3fv)},
+    {"glSamplerParameterIivOESContextANGLE", P(gl::SamplerParameterIivOESContextANGLE)},
+    {"glPushGroupMarkerEXTContextANGLE", P(gl::PushGroupMarkerEXTContextANGLE)},
+    {"glProgramUniform2f", P(gl::ProgramUniform2f)},
+    {"glProgramBinary", P(gl::ProgramBinary)},
+    {"glMatrixIndexPointerOESContextANGLE", P(gl::MatrixIndexPointerOESContextANGLE)},
+    {"glGetTexParameterfvRobustANGLEContextANGLE", P(gl::GetTexParameterfvRobustANGLEContextANGLE)},
+    {"glGetGraphicsResetStatusEXTContextANGLE", P(gl::GetGraphicsResetStatusEXTContextANGLE)},
     {"glBeginQueryEXTContextANGLE", P(gl::BeginQueryEXTContextANGLE)},
-    {"glBeginTransformFeedback", P(gl::BeginTransformFeedback)},
-    {"glBeginTransformFeedbackContextANGLE", P(gl::BeginTransformFeedbackContextANGLE)},
-    {"glBindAttribLocation", P(gl::BindAttribLocation)},
-    {"glBindAttribLocationContextANGLE", P(gl::BindAttribLocationContextANGLE)},
-    {"glBindBuffer", P(gl::BindBuffer)},
-    {"glBindBufferBase", P(gl::BindBufferBase)},
-    {"glBindBufferBaseContextANGLE", P(gl::BindBufferBaseContextANGLE)},
-    {"glBindBufferContextANGLE", P(gl::BindBufferContextANGLE)},
-    {"glBindBufferRange", P(gl::BindBufferRange)},
-    {"glBindBufferRangeContextANGLE", P(gl::BindBufferRangeContextANGLE)},
-    {"glBindFragDataLocationEXT", P(gl::BindFragDataLocationEXT)},
-    {"glBindFragDataLocationEXTContextANGLE", P(gl::BindFragDataLocationEXTContextANGLE)},
-    {"glBindFragDataLocationIndexedEXT", P(gl::BindFragDataLocationIndexedEXT)},
+    {"glDeleteSync", P(gl::DeleteSync)},
+    {"glSampleMaskiANGLEContextANGLE", P(gl::SampleMaskiANGLEContextANGLE)},
+    {"glTexStorage3DMultisampleOESContextANGLE", P(gl::TexStorage3DMultisampleOESContextANGLE)},
+    {"glClearBufferfv", P(gl::ClearBufferfv)},
+    {"glGetnUniformfvRobustANGLE", P(gl::GetnUniformfvRobustANGLE)},
+    {"glGetShaderivRobustANGLEContextANGLE", P(gl::GetShaderivRobustANGLEContextANGLE)},
+    {"glGetMaterialxvContextANGLE", P(gl::GetMaterialxvContextANGLE)},
+    {"glStencilFuncContextANGLE", P(gl::StencilFuncContextANGLE)},
+    {"eglGetCompositorTimingSupportedANDROID", P(EGL_GetCompositorTimingSupportedANDROID)},
+    {"glGetInteger64vContextANGLE", P(gl::GetInteger64vContextANGLE)},
+    {"eglGetSyncAttrib", P(EGL_GetSyncAttrib)},
+    {"eglDestroyStreamKHR", P(EGL_DestroyStreamKHR)},
+    {"glDebugMessageControlKHRContextANGLE", P(gl::DebugMessageControlKHRContextANGLE)},
+    {"glGetMemoryObjectParameterivEXT", P(gl::GetMemoryObjectParameterivEXT)},
+    {"glIsVertexArrayOESContextANGLE", P(gl::IsVertexArrayOESContextANGLE)},
+    {"glEnableVertexAttribArray", P(gl::EnableVertexAttribArray)},
+    {"glTexSubImage3DRobustANGLEContextANGLE", P(gl::TexSubImage3DRobustANGLEContextANGLE)},
+    {"glColor4fContextANGLE", P(gl::Color4fContextANGLE)},
+    {"glProgramUniform4uiContextANGLE", P(gl::ProgramUniform4uiContextANGLE)},
+    {"glGenQueriesContextANGLE", P(gl::GenQueriesContextANGLE)},
+    {"glGetBufferPointervContextANGLE", P(gl::GetBufferPointervContextANGLE)},
+    {"glTexImage3DContextANGLE", P(gl::TexImage3DContextANGLE)},
+    {"glGetProgramBinaryContextANGLE", P(gl::GetProgramBinaryContextANGLE)},
+    {"glDebugMessageControlKHR", P(gl::DebugMessageControlKHR)},
+    {"glVertexAttrib3fvContextANGLE", P(gl::VertexAttrib3fvContextANGLE)},
+    {"glGetBufferPointerv", P(gl::GetBufferPointerv)},
+    {"glProgramUniform2iv", P(gl::ProgramUniform2iv)},
+    {"glUniformMatrix3fv", P(gl::UniformMatrix3fv)},
+    {"glIsProgramPipelineContextANGLE", P(gl::IsProgramPipelineContextANGLE)},
+    {"glGetSamplerParameteriv", P(gl::GetSamplerParameteriv)},
+    {"glGenVertexArraysOESContextANGLE", P(gl::GenVertexArraysOESContextANGLE)},
+    {"glBindUniformLocationCHROMIUMContextANGLE", P(gl::BindUniformLocationCHROMIUMContextANGLE)},
+    {"glVertexAttrib4fContextANGLE", P(gl::VertexAttrib4fContextANGLE)},
+    {"glGenVertexArrays", P(gl::GenVertexArrays)},
+    {"glGetFloatvRobustANGLEContextANGLE", P(gl::GetFloatvRobustANGLEContextANGLE)},
+    {"glMatrixLoadfCHROMIUM", P(gl::MatrixLoadfCHROMIUM)},
+    {"glWaitSyncContextANGLE", P(gl::WaitSyncContextANGLE)},
+    {"glGetVertexAttribfvContextANGLE", P(gl::GetVertexAttribfvContextANGLE)},
+    {"glCopyTexSubImage2DContextANGLE", P(gl::CopyTexSubImage2DContextANGLE)},
+    {"glGenBuffers", P(gl::GenBuffers)},
+    {"eglQueryString", P(EGL_QueryString)},
+    {"glIsEnabledContextANGLE", P(gl::IsEnabledContextANGLE)},
+    {"glTexEnvxContextANGLE", P(gl::TexEnvxContextANGLE)},
+    {"glProvokingVertexANGLE", P(gl::ProvokingVertexANGLE)},
+    {"glGetAttribLocation", P(gl::GetAttribLocation)},
+    {"glQueryMatrixxOES", P(gl::QueryMatrixxOES)},
+    {"glGetFramebufferParameterivContextANGLE", P(gl::GetFramebufferParameterivContextANGLE)},
+    {"glPointSize", P(gl::PointSize)},
+    {"glMapBufferOESContextANGLE", P(gl::MapBufferOESContextANGLE)},
+    {"glGetUniformIndicesContextANGLE", P(gl::GetUniformIndicesContextANGLE)},
+    {"glCompressedTexImage3DRobustANGLE", P(gl::CompressedTexImage3DRobustANGLE)},
+    {"glUseProgramStagesContextANGLE", P(gl::UseProgramStagesContextANGLE)},
+    {"glGetSamplerParameterIivRobustANGLEContextANGLE",
+     P(gl::GetSamplerParameterIivRobustANGLEContextANGLE)},
+    {"glTexParameterfvContextANGLE", P(gl::TexParameterfvContextANGLE)},
+    {"glMemoryObjectParameterivEXT", P(gl::MemoryObjectParameterivEXT)},
+    {"glBindRenderbufferContextANGLE", P(gl::BindRenderbufferContextANGLE)},
+    {"glGetProgramivRobustANGLE", P(gl::GetProgramivRobustANGLE)},
+    {"glProgramUniformMatrix2x4fvContextANGLE", P(gl::ProgramUniformMatrix2x4fvContextANGLE)},
+    {"glGetIntegervContextANGLE", P(gl::GetIntegervContextANGLE)},
+    {"glUniformBlockBindingContextANGLE", P(gl::UniformBlockBindingContextANGLE)},
+    {"glGetTexLevelParameterivANGLEContextANGLE", P(gl::GetTexLevelParameterivANGLEContextANGLE)},
+    {"glGetnUniformivRobustANGLE", P(gl::GetnUniformivRobustANGLE)},
+    {"glGetProgramBinaryOESContextANGLE", P(gl::GetProgramBinaryOESContextANGLE)},
+    {"glGetTexParameterxvContextANGLE", P(gl::GetTexParameterxvContextANGLE)},
+    {"glGetShaderInfoLog", P(gl::GetShaderInfoLog)},
+    {"glPathParameteriCHROMIUM", P(gl::PathParameteriCHROMIUM)},
+    {"glLightxvContextANGLE", P(gl::LightxvContextANGLE)},
+    {"glGetTexParameterfvRobustANGLE", P(gl::GetTexParameterfvRobustANGLE)},
+    {"glGetStringi", P(gl::GetStringi)},
     {"glBindFragDataLocationIndexedEXTContextANGLE",
      P(gl::BindFragDataLocationIndexedEXTContextANGLE)},
-    {"glBindFragmentInputLocationCHROMIUM", P(gl::BindFragmentInputLocationCHROMIUM)},
-    {"glBindFragmentInputLocationCHROMIUMContextANGLE",
-     P(gl::BindFragmentInputLocationCHROMIUMContextANGLE)},
-    {"glBindFramebuffer", P(gl::BindFramebuffer)},
-    {"glBindFramebufferContextANGLE", P(gl::BindFramebufferContextANGLE)},
-    {"glBindImageTexture", P(gl::BindImageTexture)},
-    {"glBindImageTextureContextANGLE", P(gl::BindImageTextureContextANGLE)},
-    {"glBindProgramPipeline", P(gl::BindProgramPipeline)},
-    {"glBindProgramPipelineContextANGLE", P(gl::BindProgramPipelineContextANGLE)},
-    {"glBindRenderbuffer", P(gl::BindRenderbuffer)},
-    {"glBindRenderbufferContextANGLE", P(gl::BindRenderbufferContextANGLE)},
-    {"glBindSampler", P(gl::BindSampler)},
-    {"glBindSamplerContextANGLE", P(gl::BindSamplerContextANGLE)},
-    {"glBindTexture", P(gl::BindTexture)},
-    {"glBindTextureContextANGLE", P(gl::BindTextureContextANGLE)},
-    {"glBindTransformFeedback", P(gl::BindTransformFeedback)},
-    {"glBindTransformFeedbackContextANGLE", P(gl::BindTransformFeedbackContextANGLE)},
-    {"glBindUniformLocationCHROMIUM", P(gl::BindUniformLocationCHROMIUM)},
-    {"glBindUniformLocationCHROMIUMContextANGLE", P(gl::BindUniformLocationCHROMIUMContextANGLE)},
-    {"glBindVertexArray", P(gl::BindVertexArray)},
-    {"glBindVertexArrayContextANGLE", P(gl::BindVertexArrayContextANGLE)},
-    {"glBindVertexArrayOES", P(gl::BindVertexArrayOES)},
-    {"glBindVertexArrayOESContextANGLE", P(gl::BindVertexArrayOESContextANGLE)},
-    {"glBindVertexBuffer", P(gl::BindVertexBuffer)},
-    {"glBindVertexBufferContextANGLE", P(gl::BindVertexBufferContextANGLE)},
-    {"glBlendColor", P(gl::BlendColor)},
-    {"glBlendColorContextANGLE", P(gl::BlendColorContextANGLE)},
-    {"glBlendEquation", P(gl::BlendEquation)},
-    {"glBlendEquationContextANGLE", P(gl::BlendEquationContextANGLE)},
-    {"glBlendEquationSeparate", P(gl::BlendEquationSeparate)},
-    {"glBlendEquationSeparateContextANGLE", P(gl::BlendEquationSeparateContextANGLE)},
-    {"glBlendFunc", P(gl::BlendFunc)},
-    {"glBlendFuncContextANGLE", P(gl::BlendFuncContextANGLE)},
-    {"glBlendFuncSeparate", P(gl::BlendFuncSeparate)},
-    {"glBlendFuncSeparateContextANGLE", P(gl::BlendFuncSeparateContextANGLE)},
-    {"glBlitFramebuffer", P(gl::BlitFramebuffer)},
-    {"glBlitFramebufferANGLE", P(gl::BlitFramebufferANGLE)},
-    {"glBlitFramebufferANGLEContextANGLE", P(gl::BlitFramebufferANGLEContextANGLE)},
-    {"glBlitFramebufferContextANGLE", P(gl::BlitFramebufferContextANGLE)},
-    {"glBufferData", P(gl::BufferData)},
-    {"glBufferDataContextANGLE", P(gl::BufferDataContextANGLE)},
-    {"glBufferStorageMemEXT", P(gl::BufferStorageMemEXT)},
-    {"glBufferStorageMemEXTContextANGLE", P(gl::BufferStorageMemEXTContextANGLE)},
-    {"glBufferSubData", P(gl::BufferSubData)},
-    {"glBufferSubDataContextANGLE", P(gl::BufferSubDataContextANGLE)},
-    {"glCheckFramebufferStatus", P(gl::CheckFramebufferStatus)},
-    {"glCheckFramebufferStatusContextANGLE", P(gl::CheckFramebufferStatusContextANGLE)},
-    {"glClear", P(gl::Clear)},
-    {"glClearBufferfi", P(gl::ClearBufferfi)},
-    {"glClearBufferfiContextANGLE", P(gl::ClearBufferfiContextANGLE)},
-    {"glClearBufferfv", P(gl::ClearBufferfv)},
-    {"glClearBufferfvContextANGLE", P(gl::ClearBufferfvContextANGLE)},
-    {"glClearBufferiv", P(gl::ClearBufferiv)},
-    {"glClearBufferivContextANGLE", P(gl::ClearBufferivContextANGLE)},
-    {"glClearBufferuiv", P(gl::ClearBufferuiv)},
-    {"glClearBufferuivContextANGLE", P(gl::ClearBufferuivContextANGLE)},
-    {"glClearColor", P(gl::ClearColor)},
-    {"glClearColorContextANGLE", P(gl::ClearColorContextANGLE)},
-    {"glClearColorx", P(gl::ClearColorx)},
-    {"glClearColorxContextANGLE", P(gl::ClearColorxContextANGLE)},
-    {"glClearContextANGLE", P(gl::ClearContextANGLE)},
+    {"glSamplerParameterfContextANGLE", P(gl::SamplerParameterfContextANGLE)},
+    {"glTexEnviContextANGLE", P(gl::TexEnviContextANGLE)},
+    {"glCompressedTexSubImage3D", P(gl::CompressedTexSubImage3D)},
+    {"glGetQueryObjectuivRobustANGLEContextANGLE", P(gl::GetQueryObjectuivRobustANGLEContextANGLE)},
     {"glClearDepthf", P(gl::ClearDepthf)},
-    {"glClearDepthfContextANGLE", P(gl::ClearDepthfContextANGLE)},
-    {"glClearDepthx", P(gl::ClearDepthx)},
-    {"glClearDepthxContextANGLE", P(gl::ClearDepthxContextANGLE)},
-    {"glClearStencil", P(gl::ClearStencil)},
+    {"glDeleteQueriesEXTContextANGLE", P(gl::DeleteQueriesEXTContextANGLE)},
+    {"glUniform4uivContextANGLE", P(gl::Uniform4uivContextANGLE)},
+    {"glGetUniformivContextANGLE", P(gl::GetUniformivContextANGLE)},
+    {"glCurrentPaletteMatrixOES", P(gl::CurrentPaletteMatrixOES)},
+    {"glTexStorageMem3DEXTContextANGLE", P(gl::TexStorageMem3DEXTContextANGLE)},
+    {"glProgramParameteriContextANGLE", P(gl::ProgramParameteriContextANGLE)},
+    {"glWeightPointerOESContextANGLE", P(gl::WeightPointerOESContextANGLE)},
+    {"eglWaitNative", P(EGL_WaitNative)},
+    {"glGetRenderbufferParameterivRobustANGLE", P(gl::GetRenderbufferParameterivRobustANGLE)},
+    {"glActiveTexture", P(gl::ActiveTexture)},
+    {"glGetTexLevelParameterivContextANGLE", P(gl::GetTexLevelParameterivContextANGLE)},
     {"glClearStencilContextANGLE", P(gl::ClearStencilContextANGLE)},
-    {"glClientActiveTexture", P(gl::ClientActiveTexture)},
-    {"glClientActiveTextureContextANGLE", P(gl::ClientActiveTextureContextANGLE)},
-    {"glClientWaitSync", P(gl::ClientWaitSync)},
-    {"glClientWaitSyncContextANGLE", P(gl::ClientWaitSyncContextANGLE)},
+    {"glBlendFuncSeparate", P(gl::BlendFuncSeparate)},
+    {"glGetInternalformativ", P(gl::GetInternalformativ)},
+    {"glUniformMatrix4x3fvContextANGLE", P(gl::UniformMatrix4x3fvContextANGLE)},
+    {"eglDestroyContext", P(EGL_DestroyContext)},
+    {"glBufferSubData", P(gl::BufferSubData)},
+    {"glGetVertexAttribIivRobustANGLEContextANGLE",
+     P(gl::GetVertexAttribIivRobustANGLEContextANGLE)},
+    {"glBindImageTexture", P(gl::BindImageTexture)},
+    {"glEGLImageTargetRenderbufferStorageOES", P(gl::EGLImageTargetRenderbufferStorageOES)},
+    {"glReadnPixelsRobustANGLE", P(gl::ReadnPixelsRobustANGLE)},
+    {"glCullFace", P(gl::CullFace)},
+    {"glVertexAttribI4ui", P(gl::VertexAttribI4ui)},
+    {"glBufferStorageMemEXT", P(gl::BufferStorageMemEXT)},
+    {"glStencilStrokePathCHROMIUMContextANGLE", P(gl::StencilStrokePathCHROMIUMContextANGLE)},
+    {"glGetProgramivRobustANGLEContextANGLE", P(gl::GetProgramivRobustANGLEContextANGLE)},
+    {"glVertexAttribDivisorANGLEContextANGLE", P(gl::VertexAttribDivisorANGLEContextANGLE)},
+    {"glMatrixLoadIdentityCHROMIUM", P(gl::MatrixLoadIdentityCHROMIUM)},
+    {"glProgramBinaryContextANGLE", P(gl::ProgramBinaryContextANGLE)},
     {"glClipPlanef", P(gl::ClipPlanef)},
-    {"glClipPlanefContextANGLE", P(gl::ClipPlanefContextANGLE)},
-    {"glClipPlanex", P(gl::ClipPlanex)},
-    {"glClipPlanexContextANGLE", P(gl::ClipPlanexContextANGLE)},
-    {"glColor4f", P(gl::Color4f)},
-    {"glColor4fContextANGLE", P(gl::Color4fContextANGLE)},
-    {"glColor4ub", P(gl::Color4ub)},
-    {"glColor4ubContextANGLE", P(gl::Color4ubContextANGLE)},
-    {"glColor4x", P(gl::Color4x)},
-    {"glColor4xContextANGLE", P(gl::Color4xContextANGLE)},
-    {"glColorMask", P(gl::ColorMask)},
-    {"glColorMaskContextANGLE", P(gl::ColorMaskContextANGLE)},
     {"glColorPointer", P(gl::ColorPointer)},
-    {"glColorPointerContextANGLE", P(gl::ColorPointerContextANGLE)},
-    {"glCompileShader", P(gl::CompileShader)},
-    {"glCompileShaderContextANGLE", P(gl::CompileShaderContextANGLE)},
-    {"glCompressedCopyTextureCHROMIUM", P(gl::CompressedCopyTextureCHROMIUM)},
-    {"glCompressedCopyTextureCHROMIUMContextANGLE",
-     P(gl::CompressedCopyTextureCHROMIUMContextANGLE)},
-    {"glCompressedTexImage2D", P(gl::CompressedTexImage2D)},
+    {"glGetTexParameterfv", P(gl::GetTexParameterfv)},
+    {"glGetShaderInfoLogContextANGLE", P(gl::GetShaderInfoLogContextANGLE)},
+    {"glGetMultisamplefvContextANGLE", P(gl::GetMultisamplefvContextANGLE)},
     {"glCompressedTexImage2DContextANGLE", P(gl::CompressedTexImage2DContextANGLE)},
-    {"glCompressedTexImage2DRobustANGLE", P(gl::CompressedTexImage2DRobustANGLE)},
-    {"glCompressedTexImage2DRobustANGLEContextANGLE",
-     P(gl::CompressedTexImage2DRobustANGLEContextANGLE)},
-    {"glCompressedTexImage3D", P(gl::CompressedTexImage3D)},
-    {"glCompressedTexImage3DContextANGLE", P(gl::CompressedTexImage3DContextANGLE)},
-    {"glCompressedTexImage3DRobustANGLE", P(gl::CompressedTexImage3DRobustANGLE)},
-    {"glCompressedTexImage3DRobustANGLEContextANGLE",
-     P(gl::CompressedTexImage3DRobustANGLEContextANGLE)},
-    {"glCompressedTexSubImage2D", P(gl::CompressedTexSubImage2D)},
-    {"glCompressedTexSubImage2DContextANGLE", P(gl::CompressedTexSubImage2DContextANGLE)},
-    {"glCompressedTexSubImage2DRobustANGLE", P(gl::CompressedTexSubImage2DRobustANGLE)},
-    {"glCompressedTexSubImage2DRobustANGLEContextANGLE",
-     P(gl::CompressedTexSubImage2DRobustANGLEContextANGLE)},
-    {"glCompressedTexSubImage3D", P(gl::CompressedTexSubImage3D)},
-    {"glCompressedTexSubImage3DContextANGLE", P(gl::CompressedTexSubImage3DContextANGLE)},
-    {"glCompressedTexSubImage3DRobustANGLE", P(gl::CompressedTexSubImage3DRobustANGLE)},
-    {"glCompressedTexSubImage3DRobustANGLEContextANGLE",
-     P(gl::CompressedTexSubImage3DRobustANGLEContextANGLE)},
-    {"glCopyBufferSubData", P(gl::CopyBufferSubData)},
-    {"glCopyBufferSubDataContextANGLE", P(gl::CopyBufferSubDataContextANGLE)},
-    {"glCopySubTexture3DANGLE", P(gl::CopySubTexture3DANGLE)},
-    {"glCopySubTexture3DANGLEContextANGLE", P(gl::CopySubTexture3DANGLEContextANGLE)},
-    {"glCopySubTextureCHROMIUM", P(gl::CopySubTextureCHROMIUM)},
-    {"glCopySubTextureCHROMIUMContextANGLE", P(gl::CopySubTextureCHROMIUMContextANGLE)},
-    {"glCopyTexImage2D", P(gl::CopyTexImage2D)},
-    {"glCopyTexImage2DContextANGLE", P(gl::CopyTexImage2DContextANGLE)},
-    {"glCopyTexSubImage2D", P(gl::CopyTexSubImage2D)},
-    {"glCopyTexSubImage2DContextANGLE", P(gl::CopyTexSubImage2DContextANGLE)},
-    {"glCopyTexSubImage3D", P(gl::CopyTexSubImage3D)},
-    {"glCopyTexSubImage3DContextANGLE", P(gl::CopyTexSubImage3DContextANGLE)},
-    {"glCopyTexture3DANGLE", P(gl::CopyTexture3DANGLE)},
-    {"glCopyTexture3DANGLEContextANGLE", P(gl::CopyTexture3DANGLEContextANGLE)},
-    {"glCopyTextureCHROMIUM", P(gl::CopyTextureCHROMIUM)},
-    {"glCopyTextureCHROMIUMContextANGLE", P(gl::CopyTextureCHROMIUMContextANGLE)},
-    {"glCoverFillPathCHROMIUM", P(gl::CoverFillPathCHROMIUM)},
-    {"glCoverFillPathCHROMIUMContextANGLE", P(gl::CoverFillPathCHROMIUMContextANGLE)},
-    {"glCoverFillPathInstancedCHROMIUM", P(gl::CoverFillPathInstancedCHROMIUM)},
-    {"glCoverFillPathInstancedCHROMIUMContextANGLE",
-     P(gl::CoverFillPathInstancedCHROMIUMContextANGLE)},
-    {"glCoverStrokePathCHROMIUM", P(gl::CoverStrokePathCHROMIUM)},
-    {"glCoverStrokePathCHROMIUMContextANGLE", P(gl::CoverStrokePathCHROMIUMContextANGLE)},
-    {"glCoverStrokePathInstancedCHROMIUM", P(gl::CoverStrokePathInstancedCHROMIUM)},
-    {"glCoverStrokePathInstancedCHROMIUMContextANGLE",
-     P(gl::CoverStrokePathInstancedCHROMIUMContextANGLE)},
-    {"glCoverageModulationCHROMIUM", P(gl::CoverageModulationCHROMIUM)},
-    {"glCoverageModulationCHROMIUMContextANGLE", P(gl::CoverageModulationCHROMIUMContextANGLE)},
-    {"glCreateMemoryObjectsEXT", P(gl::CreateMemoryObjectsEXT)},
-    {"glCreateMemoryObjectsEXTContextANGLE", P(gl::CreateMemoryObjectsEXTContextANGLE)},
-    {"glCreateProgram", P(gl::CreateProgram)},
-    {"glCreateProgramContextANGLE", P(gl::CreateProgramContextANGLE)},
-    {"glCreateShader", P(gl::CreateShader)},
-    {"glCreateShaderContextANGLE", P(gl::CreateShaderContextANGLE)},
-    {"glCreateShaderProgramv", P(gl::CreateShaderProgramv)},
-    {"glCreateShaderProgramvContextANGLE", P(gl::CreateShaderProgramvContextANGLE)},
-    {"glCullFace", P(gl::CullFace)},
-    {"glCullFaceContextANGLE", P(gl::CullFaceContextANGLE)},
-    {"glCurrentPaletteMatrixOES", P(gl::CurrentPaletteMatrixOES)},
-    {"glCurrentPaletteMatrixOESContextANGLE", P(gl::CurrentPaletteMatrixOESContextANGLE)},
-    {"glDebugMessageCallbackKHR", P(gl::DebugMessageCallbackKHR)},
-    {"glDebugMessageCallbackKHRContextANGLE", P(gl::DebugMessageCallbackKHRContextANGLE)},
-    {"glDebugMessageControlKHR", P(gl::DebugMessageControlKHR)},
-    {"glDebugMessageControlKHRContextANGLE", P(gl::DebugMessageControlKHRContextANGLE)},
-    {"glDebugMessageInsertKHR", P(gl::DebugMessageInsertKHR)},
-    {"glDebugMessageInsertKHRContextANGLE", P(gl::DebugMessageInsertKHRContextANGLE)},
-    {"glDeleteBuffers", P(gl::DeleteBuffers)},
-    {"glDeleteBuffersContextANGLE", P(gl::DeleteBuffersContextANGLE)},
-    {"glDeleteFencesNV", P(gl::DeleteFencesNV)},
-    {"glDeleteFencesNVContextANGLE", P(gl::DeleteFencesNVContextANGLE)},
-    {"glDeleteFramebuffers", P(gl::DeleteFramebuffers)},
-    {"glDeleteFramebuffersContextANGLE", P(gl::DeleteFramebuffersContextANGLE)},
-    {"glDeleteMemoryObjectsEXT", P(gl::DeleteMemoryObjectsEXT)},
-    {"glDeleteMemoryObjectsEXTContextANGLE", P(gl::DeleteMemoryObjectsEXTContextANGLE)},
+    {"glInvalidateFramebuffer", P(gl::InvalidateFramebuffer)},
+    {"glColorMaskContextANGLE", P(gl::ColorMaskContextANGLE)},
+    {"eglStreamConsumerGLTextureExternalAttribsNV",
+     P(EGL_StreamConsumerGLTextureExternalAttribsNV)},
+    {"glColorMask", P(gl::ColorMask)},
     {"glDeletePathsCHROMIUM", P(gl::DeletePathsCHROMIUM)},
-    {"glDeletePathsCHROMIUMContextANGLE", P(gl::DeletePathsCHROMIUMContextANGLE)},
-    {"glDeleteProgram", P(gl::DeleteProgram)},
+    {"glGetnUniformfvEXTContextANGLE", P(gl::GetnUniformfvEXTContextANGLE)},
+    {"glFramebufferParameteriContextANGLE", P(gl::FramebufferParameteriContextANGLE)},
+    {"glDrawElementsIndirectContextANGLE", P(gl::DrawElementsIndirectContextANGLE)},
+    {"glClearBufferuiv", P(gl::ClearBufferuiv)},
+    {"glFramebufferTexture2D", P(gl::FramebufferTexture2D)},
+    {"glRenderbufferStorageMultisampleContextANGLE",
+     P(gl::RenderbufferStorageMultisampleContextANGLE)},
+    {"glVertexAttribDivisorANGLE", P(gl::VertexAttribDivisorANGLE)},
+    {"glProgramUniformMatrix3fvContextANGLE", P(gl::ProgramUniformMatrix3fvContextANGLE)},
+    {"glViewport", P(gl::Viewport)},
+    {"glFrustumx", P(gl::Frustumx)},
+    {"glUniform1ui", P(gl::Uniform1ui)},
+    {"eglQueryDeviceStringEXT", P(EGL_QueryDeviceStringEXT)},
+    {"glGetProgramInterfaceivRobustANGLE", P(gl::GetProgramInterfaceivRobustANGLE)},
+    {"glGetTexLevelParameterfvANGLE", P(gl::GetTexLevelParameterfvANGLE)},
+    {"glValidateProgramContextANGLE", P(gl::ValidateProgramContextANGLE)},
+    {"glVertexAttribI4uiContextANGLE", P(gl::VertexAttribI4uiContextANGLE)},
+    {"glTexEnvf", P(gl::TexEnvf)},
+    {"glGetPointervKHR", P(gl::GetPointervKHR)},
+    {"glGetIntegerv", P(gl::GetIntegerv)},
+    {"glGenSemaphoresEXTContextANGLE", P(gl::GenSemaphoresEXTContextANGLE)},
+    {"glUniform1uiv", P(gl::Uniform1uiv)},
+    {"glGetQueryObjectivEXTContextANGLE", P(gl::GetQueryObjectivEXTContextANGLE)},
+    {"glDisableClientState", P(gl::DisableClientState)},
+    {"glGetObjectPtrLabelKHR", P(gl::GetObjectPtrLabelKHR)},
+    {"glOrthox", P(gl::Orthox)},
+    {"glPolygonOffsetxContextANGLE", P(gl::PolygonOffsetxContextANGLE)},
+    {"glLightx", P(gl::Lightx)},
+    {"glQueryCounterEXTContextANGLE", P(gl::QueryCounterEXTContextANGLE)},
+    {"glStencilFillPathInstancedCHROMIUMContextANGLE",
+     P(gl::StencilFillPathInstancedCHROMIUMContextANGLE)},
+    {"glPointParameterf", P(gl::PointParameterf)},
+    {"glMatrixModeContextANGLE", P(gl::MatrixModeContextANGLE)},
+    {"glCreateMemoryObjectsEXTContextANGLE", P(gl::CreateMemoryObjectsEXTContextANGLE)},
+    {"glGetProgramInterfaceivRobustANGLEContextANGLE",
+     P(gl::GetProgramInterfaceivRobustANGLEContextANGLE)},
+    {"glGenFencesNVContextANGLE", P(gl::GenFencesNVContextANGLE)},
+    {"glGetLightxvContextANGLE", P(gl::GetLightxvContextANGLE)},
+    {"glObjectPtrLabelKHRContextANGLE", P(gl::ObjectPtrLabelKHRContextANGLE)},
+    {"glMaterialx", P(gl::Materialx)},
+    {"glGetQueryObjectuivRobustANGLE", P(gl::GetQueryObjectuivRobustANGLE)},
+    {"eglGetCurrentContext", P(EGL_GetCurrentContext)},
+    {"glInvalidateSubFramebufferContextANGLE", P(gl::InvalidateSubFramebufferContextANGLE)},
+    {"glGetFramebufferAttachmentParameterivRobustANGLEContextANGLE",
+     P(gl::GetFramebufferAttachmentParameterivRobustANGLEContextANGLE)},
+    {"glGetQueryObjectui64vRobustANGLEContextANGLE",
+     P(gl::GetQueryObjectui64vRobustANGLEContextANGLE)},
+    {"glBindFragmentInputLocationCHROMIUM", P(gl::BindFragmentInputLocationCHROMIUM)},
     {"glDeleteProgramContextANGLE", P(gl::DeleteProgramContextANGLE)},
-    {"glDeleteProgramPipelines", P(gl::DeleteProgramPipelines)},
-    {"glDeleteProgramPipelinesContextANGLE", P(gl::DeleteProgramPipelinesContextANGLE)},
-    {"glDeleteQueries", P(gl::DeleteQueries)},
-    {"glDeleteQueriesContextANGLE", P(gl::DeleteQueriesContextANGLE)},
-    {"glDeleteQueriesEXT", P(gl::DeleteQueriesEXT)},
-    {"glDeleteQueriesEXTContextANGLE", P(gl::DeleteQueriesEXTContextANGLE)},
-    {"glDeleteRenderbuffers", P(gl::DeleteRenderbuffers)},
-    {"glDeleteRenderbuffersContextANGLE", P(gl::DeleteRenderbuffersContextANGLE)},
-    {"glDeleteSamplers", P(gl::DeleteSamplers)},
-    {"glDeleteSamplersContextANGLE", P(gl::DeleteSamplersContextANGLE)},
-    {"glDeleteSemaphoresEXT", P(gl::DeleteSemaphoresEXT)},
+    {"glClearBufferivContextANGLE", P(gl::ClearBufferivContextANGLE)},
+    {"glMaterialfContextANGLE", P(gl::MaterialfContextANGLE)},
+    {"glPolygonOffsetContextANGLE", P(gl::PolygonOffsetContextANGLE)},
+    {"glGetQueryivEXTContextANGLE", P(gl::GetQueryivEXTContextANGLE)},
+    {"glMultiDrawArraysANGLEContextANGLE", P(gl::MultiDrawArraysANGLEContextANGLE)},
+    {"glProgramUniform1uivContextANGLE", P(gl::ProgramUniform1uivContextANGLE)},
+    {"glBlendFunc", P(gl::BlendFunc)},
+    {"glBlendEquationContextANGLE", P(gl::BlendEquationContextANGLE)},
+    {"glShaderSourceContextANGLE", P(gl::ShaderSourceContextANGLE)},
+    {"glStencilMaskSeparate", P(gl::StencilMaskSeparate)},
+    {"glGetPathParameterivCHROMIUM", P(gl::GetPathParameterivCHROMIUM)},
+    {"glMapBufferRangeEXT", P(gl::MapBufferRangeEXT)},
+    {"glTexStorage2DMultisampleContextANGLE", P(gl::TexStorage2DMultisampleContextANGLE)},
+    {"glGetQueryObjectui64vEXT", P(gl::GetQueryObjectui64vEXT)},
+    {"glEndQueryContextANGLE", P(gl::EndQueryContextANGLE)},
+    {"glPixelStoreiContextANGLE", P(gl::PixelStoreiContextANGLE)},
+    {"glGetAttachedShaders", P(gl::GetAttachedShaders)},
     {"glDeleteSemaphoresEXTContextANGLE", P(gl::DeleteSemaphoresEXTContextANGLE)},
-    {"glDeleteShader", P(gl::DeleteShader)},
-    {"glDeleteShaderContextANGLE", P(gl::DeleteShaderContextANGLE)},
-    {"glDeleteSync", P(gl::DeleteSync)},
-    {"glDeleteSyncContextANGLE", P(gl::DeleteSyncContextANGLE)},
-    {"glDeleteTextures", P(gl::DeleteTextures)},
-    {"glDeleteTexturesContextANGLE", P(gl::DeleteTexturesContextANGLE)},
-    {"glDeleteTransformFeedbacks", P(gl::DeleteTransformFeedbacks)},
-    {"glDeleteTransformFeedbacksContextANGLE", P(gl::DeleteTransformFeedbacksContextANGLE)},
-    {"glDeleteVertexArrays", P(gl::DeleteVertexArrays)},
-    {"glDeleteVertexArraysContextANGLE", P(gl::DeleteVertexArraysContextANGLE)},
-    {"glDeleteVertexArraysOES", P(gl::DeleteVertexArraysOES)},
-    {"glDeleteVertexArraysOESContextANGLE", P(gl::DeleteVertexArraysOESContextANGLE)},
-    {"glDepthFunc", P(gl::DepthFunc)},
-    {"glDepthFuncContextANGLE", P(gl::DepthFuncContextANGLE)},
-    {"glDepthMask", P(gl::DepthMask)},
-    {"glDepthMaskContextANGLE", P(gl::DepthMaskContextANGLE)},
-    {"glDepthRangef", P(gl::DepthRangef)},
-    {"glDepthRangefContextANGLE", P(gl::DepthRangefContextANGLE)},
-    {"glDepthRangex", P(gl::DepthRangex)},
-    {"glDepthRangexContextANGLE", P(gl::DepthRangexContextANGLE)},
-    {"glDetachShader", P(gl::DetachShader)},
-    {"glDetachShaderContextANGLE", P(gl::DetachShaderContextANGLE)},
-    {"glDisable", P(gl::Disable)},
-    {"glDisableClientState", P(gl::DisableClientState)},
-    {"glDisableClientStateContextANGLE", P(gl::DisableClientStateContextANGLE)},
-    {"glDisableContextANGLE", P(gl::DisableContextANGLE)},
-    {"glDisableVertexAttribArray", P(gl::DisableVertexAttribArray)},
-    {"glDisableVertexAttribArrayContextANGLE", P(gl::DisableVertexAttribArrayContextANGLE)},
-    {"glDiscardFramebufferEXT", P(gl::DiscardFramebufferEXT)},
-    {"glDiscardFramebufferEXTContextANGLE", P(gl::DiscardFramebufferEXTContextANGLE)},
-    {"glDispatchCompute", P(gl::DispatchCompute)},
-    {"glDispatchComputeContextANGLE", P(gl::DispatchComputeContextANGLE)},
-    {"glDispatchComputeIndirect", P(gl::DispatchComputeIndirect)},
-    {"glDispatchComputeIndirectContextANGLE", P(gl::DispatchComputeIndirectContextANGLE)},
-    {"glDrawArrays", P(gl::DrawArrays)},
-    {"glDrawArraysContextANGLE", P(gl::DrawArraysContextANGLE)},
-    {"glDrawArraysIndirect", P(gl::DrawArraysIndirect)},
-    {"glDrawArraysIndirectContextANGLE", P(gl::DrawArraysIndirectContextANGLE)},
-    {"glDrawArraysInstanced", P(gl::DrawArraysInstanced)},
-    {"glDrawArraysInstancedANGLE", P(gl::DrawArraysInstancedANGLE)},
-    {"glDrawArraysInstancedANGLEContextANGLE", P(gl::DrawArraysInstancedANGLEContextANGLE)},
-    {"glDrawArraysInstancedContextANGLE", P(gl::DrawArraysInstancedContextANGLE)},
-    {"glDrawArraysInstancedEXT", P(gl::DrawArraysInstancedEXT)},
-    {"glDrawArraysInstancedEXTContextANGLE", P(gl::DrawArraysInstancedEXTContextANGLE)},
-    {"glDrawBuffers", P(gl::DrawBuffers)},
-    {"glDrawBuffersContextANGLE", P(gl::DrawBuffersContextANGLE)},
-    {"glDrawBuffersEXT", P(gl::DrawBuffersEXT)},
-    {"glDrawBuffersEXTContextANGLE", P(gl::DrawBuffersEXTContextANGLE)},
-    {"glDrawElements", P(gl::DrawElements)},
-    {"glDrawElementsContextANGLE", P(gl::DrawElementsContextANGLE)},
-    {"glDrawElementsIndirect", P(gl::DrawElementsIndirect)},
-    {"glDrawElementsIndirectContextANGLE", P(gl::DrawElementsIndirectContextANGLE)},
-    {"glDrawElementsInstanced", P(gl::DrawElementsInstanced)},
-    {"glDrawElementsInstancedANGLE", P(gl::DrawElementsInstancedANGLE)},
-    {"glDrawElementsInstancedANGLEContextANGLE", P(gl::DrawElementsInstancedANGLEContextANGLE)},
-    {"glDrawElementsInstancedContextANGLE", P(gl::DrawElementsInstancedContextANGLE)},
-    {"glDrawElementsInstancedEXT", P(gl::DrawElementsInstancedEXT)},
-    {"glDrawElementsInstancedEXTContextANGLE", P(gl::DrawElementsInstancedEXTContextANGLE)},
-    {"glDrawRangeElements", P(gl::DrawRangeElements)},
-    {"glDrawRangeElementsContextANGLE", P(gl::DrawRangeElementsContextANGLE)},
-    {"glDrawTexfOES", P(gl::DrawTexfOES)},
-    {"glDrawTexfOESContextANGLE", P(gl::DrawTexfOESContextANGLE)},
-    {"glDrawTexfvOES", P(gl::DrawTexfvOES)},
-    {"glDrawTexfvOESContextANGLE", P(gl::DrawTexfvOESContextANGLE)},
-    {"glDrawTexiOES", P(gl::DrawTexiOES)},
-    {"glDrawTexiOESContextANGLE", P(gl::DrawTexiOESContextANGLE)},
-    {"glDrawTexivOES", P(gl::DrawTexivOES)},
-    {"glDrawTexivOESContextANGLE", P(gl::DrawTexivOESContextANGLE)},
-    {"glDrawTexsOES", P(gl::DrawTexsOES)},
-    {"glDrawTexsOESContextANGLE", P(gl::DrawTexsOESContextANGLE)},
-    {"glDrawTexsvOES", P(gl::DrawTexsvOES)},
-    {"glDrawTexsvOESContextANGLE", P(gl::DrawTexsvOESContextANGLE)},
-    {"glDrawTexxOES", P(gl::DrawTexxOES)},
-    {"glDrawTexxOESContextANGLE", P(gl::DrawTexxOESContextANGLE)},
-    {"glDrawTexxvOES", P(gl::DrawTexxvOES)},
-    {"glDrawTexxvOESContextANGLE", P(gl::DrawTexxvOESContextANGLE)},
-    {"glEGLImageTargetRenderbufferStorageOES", P(gl::EGLImageTargetRenderbufferStorageOES)},
+    {"glClipPlanexContextANGLE", P(gl::ClipPlanexContextANGLE)},
     {"glEGLImageTargetRenderbufferStorageOESContextANGLE",
      P(gl::EGLImageTargetRenderbufferStorageOESContextANGLE)},
-    {"glEGLImageTargetTexture2DOES", P(gl::EGLImageTargetTexture2DOES)},
-    {"glEGLImageTargetTexture2DOESContextANGLE", P(gl::EGLImageTargetTexture2DOESContextANGLE)},
-    {"glEnable", P(gl::Enable)},
-    {"glEnableClientState", P(gl::EnableClientState)},
-    {"glEnableClientStateContextANGLE", P(gl::EnableClientStateContextANGLE)},
-    {"glEnableContextANGLE", P(gl::EnableContextANGLE)},
-    {"glEnableVertexAttribArray", P(gl::EnableVertexAttribArray)},
-    {"glEnableVertexAttribArrayContextANGLE", P(gl::EnableVertexAttribArrayContextANGLE)},
-    {"glEndQuery", P(gl::EndQuery)},
-    {"glEndQueryContextANGLE", P(gl::EndQueryContextANGLE)},
-    {"glEndQueryEXT", P(gl::EndQueryEXT)},
-    {"glEndQueryEXTContextANGLE", P(gl::EndQueryEXTContextANGLE)},
-    {"glEndTransformFeedback", P(gl::EndTransformFeedback)},
-    {"glEndTransformFeedbackContextANGLE", P(gl::EndTransformFeedbackContextANGLE)},
-    {"glFenceSync", P(gl::FenceSync)},
-    {"glFenceSyncContextANGLE", P(gl::FenceSyncContextANGLE)},
-    {"glFinish", P(gl::Finish)},
-    {"glFinishContextANGLE", P(gl::FinishContextANGLE)},
-    {"glFinishFenceNV", P(gl::FinishFenceNV)},
-    {"glFinishFenceNVContextANGLE", P(gl::FinishFenceNVContextANGLE)},
-    {"glFlush", P(gl::Flush)},
-    {"glFlushContextANGLE", P(gl::FlushContextANGLE)},
-    {"glFlushMappedBufferRange", P(gl::FlushMappedBufferRange)},
-    {"glFlushMappedBufferRangeContextANGLE", P(gl::FlushMappedBufferRangeContextANGLE)},
-    {"glFlushMappedBufferRangeEXT", P(gl::FlushMappedBufferRangeEXT)},
-    {"glFlushMappedBufferRangeEXTContextANGLE", P(gl::FlushMappedBufferRangeEXTContextANGLE)},
-    {"glFogf", P(gl::Fogf)},
-    {"glFogfContextANGLE", P(gl::FogfContextANGLE)},
-    {"glFogfv", P(gl::Fogfv)},
-    {"glFogfvContextANGLE", P(gl::FogfvContextANGLE)},
-    {"glFogx", P(gl::Fogx)},
-    {"glFogxContextANGLE", P(gl::FogxContextANGLE)},
-    {"glFogxv", P(gl::Fogxv)},
-    {"glFogxvContextANGLE", P(gl::FogxvContextANGLE)},
-    {"glFramebufferParameteri", P(gl::FramebufferParameteri)},
-    {"glFramebufferParameteriContextANGLE", P(gl::FramebufferParameteriContextANGLE)},
-    {"glFramebufferRenderbuffer", P(gl::FramebufferRenderbuffer)},
-    {"glFramebufferRenderbufferContextANGLE", P(gl::FramebufferRenderbufferContextANGLE)},
-    {"glFramebufferTexture2D", P(gl::FramebufferTexture2D)},
-    {"glFramebufferTexture2DContextANGLE", P(gl::FramebufferTexture2DContextANGLE)},
-    {"glFramebufferTextureEXT", P(gl::FramebufferTextureEXT)},
-    {"glFramebufferTextureEXTContextANGLE", P(gl::FramebufferTextureEXTContextANGLE)},
-    {"glFramebufferTextureLayer", P(gl::FramebufferTextureLayer)},
-    {"glFramebufferTextureLayerContextANGLE", P(gl::FramebufferTextureLayerContextANGLE)},
-    {"glFramebufferTextureMultiviewOVR", P(gl::FramebufferTextureMultiviewOVR)},
-    {"glFramebufferTextureMultiviewOVRContextANGLE",
-     P(gl::FramebufferTextureMultiviewOVRContextANGLE)},
-    {"glFrontFace", P(gl::FrontFace)},
-    {"glFrontFaceContextANGLE", P(gl::FrontFaceContextANGLE)},
-    {"glFrustumf", P(gl::Frustumf)},
-    {"glFrustumfContextANGLE", P(gl::FrustumfContextANGLE)},
-    {"glFrustumx", P(gl::Frustumx)},
-    {"glFrustumxContextANGLE", P(gl::FrustumxContextANGLE)},
-    {"glGenBuffers", P(gl::GenBuffers)},
-    {"glGenBuffersContextANGLE", P(gl::GenBuffersContextANGLE)},
-    {"glGenFencesNV", P(gl::GenFencesNV)},
-    {"glGenFencesNVContextANGLE", P(gl::GenFencesNVContextANGLE)},
-    {"glGenFramebuffers", P(gl::GenFramebuffers)},
-    {"glGenFramebuffersContextANGLE", P(gl::GenFramebuffersContextANGLE)},
-    {"glGenPathsCHROMIUM", P(gl::GenPathsCHROMIUM)},
-    {"glGenPathsCHROMIUMContextANGLE", P(gl::GenPathsCHROMIUMContextANGLE)},
-    {"glGenProgramPipelines", P(gl::GenProgramPipelines)},
-    {"glGenProgramPipelinesContextANGLE", P(gl::GenProgramPipelinesContextANGLE)},
-    {"glGenQueries", P(gl::GenQueries)},
-    {"glGenQueriesContextANGLE", P(gl::GenQueriesContextANGLE)},
-    {"glGenQueriesEXT", P(gl::GenQueriesEXT)},
-    {"glGenQueriesEXTContextANGLE", P(gl::GenQueriesEXTContextANGLE)},
-    {"glGenRenderbuffers", P(gl::GenRenderbuffers)},
-    {"glGenRenderbuffersContextANGLE", P(gl::GenRenderbuffersContextANGLE)},
-    {"glGenSamplers", P(gl::GenSamplers)},
-    {"glGenSamplersContextANGLE", P(gl::GenSamplersContextANGLE)},
-    {"glGenSemaphoresEXT", P(gl::GenSemaphoresEXT)},
-    {"glGenSemaphoresEXTContextANGLE", P(gl::GenSemaphoresEXTContextANGLE)},
-    {"glGenTextures", P(gl::GenTextures)},
-    {"glGenTexturesContextANGLE", P(gl::GenTexturesContextANGLE)},
-    {"glGenTransformFeedbacks", P(gl::GenTransformFeedbacks)},
-    {"glGenTransformFeedbacksContextANGLE", P(gl::GenTransformFeedbacksContextANGLE)},
-    {"glGenVertexArrays", P(gl::GenVertexArrays)},
-    {"glGenVertexArraysContextANGLE", P(gl::GenVertexArraysContextANGLE)},
-    {"glGenVertexArraysOES", P(gl::GenVertexArraysOES)},
-    {"glGenVertexArraysOESContextANGLE", P(gl::GenVertexArraysOESContextANGLE)},
-    {"glGenerateMipmap", P(gl::GenerateMipmap)},
-    {"glGenerateMipmapContextANGLE", P(gl::GenerateMipmapContextANGLE)},
+    {"glUniformMatrix2x4fvContextANGLE", P(gl::UniformMatrix2x4fvContextANGLE)},
+    {"glProgramUniformMatrix4fv", P(gl::ProgramUniformMatrix4fv)},
+    {"eglGetProcAddress", P(EGL_GetProcAddress)},
+    {"glUniformMatrix3fvContextANGLE", P(gl::UniformMatrix3fvContextANGLE)},
+    {"glBindVertexBufferContextANGLE", P(gl::BindVertexBufferContextANGLE)},
+    {"glCurrentPaletteMatrixOESContextANGLE", P(gl::CurrentPaletteMatrixOESContextANGLE)},
+    {"glIsProgram", P(gl::IsProgram)},
+    {"glUniform3uivContextANGLE", P(gl::Uniform3uivContextANGLE)},
+    {"glProgramUniform1uiContextANGLE", P(gl::ProgramUniform1uiContextANGLE)},
+    {"glDiscardFramebufferEXT", P(gl::DiscardFramebufferEXT)},
+    {"glMemoryObjectParameterivEXTContextANGLE", P(gl::MemoryObjectParameterivEXTContextANGLE)},
+    {"glEndQueryEXTContextANGLE", P(gl::EndQueryEXTContextANGLE)},
     {"glGetActiveAttrib", P(gl::GetActiveAttrib)},
-    {"glGetActiveAttribContextANGLE", P(gl::GetActiveAttribContextANGLE)},
-    {"glGetActiveUniform", P(gl::GetActiveUniform)},
-    {"glGetActiveUniformBlockName", P(gl::GetActiveUniformBlockName)},
-    {"glGetActiveUniformBlockNameContextANGLE", P(gl::GetActiveUniformBlockNameContextANGLE)},
+    {"glGenTransformFeedbacks", P(gl::GenTransformFeedbacks)},
     {"glGetActiveUniformBlockiv", P(gl::GetActiveUniformBlockiv)},
-    {"glGetActiveUniformBlockivContextANGLE", P(gl::GetActiveUniformBlockivContextANGLE)},
-    {"glGetActiveUniformBlockivRobustANGLE", P(gl::GetActiveUniformBlockivRobustANGLE)},
-    {"glGetActiveUniformBlockivRobustANGLEContextANGLE",
-     P(gl::GetActiveUniformBlockivRobustANGLEContextANGLE)},
-    {"glGetActiveUniformContextANGLE", P(gl::GetActiveUniformContextANGLE)},
-    {"glGetActiveUniformsiv", P(gl::GetActiveUniformsiv)},
-    {"glGetActiveUniformsivContextANGLE", P(gl::GetActiveUniformsivContextANGLE)},
-    {"glGetAttachedShaders", P(gl::GetAttachedShaders)},
-    {"glGetAttachedShadersContextANGLE", P(gl::GetAttachedShadersContextANGLE)},
-    {"glGetAttribLocation", P(gl::GetAttribLocation)},
-    {"glGetAttribLocationContextANGLE", P(gl::GetAttribLocationContextANGLE)},
-    {"glGetBooleani_v", P(gl::GetBooleani_v)},
-    {"glGetBooleani_vContextANGLE", P(gl::GetBooleani_vContextANGLE)},
-    {"glGetBooleani_vRobustANGLE", P(gl::GetBooleani_vRobustANGLE)},
-    {"glGetBooleani_vRobustANGLEContextANGLE", P(gl::GetBooleani_vRobustANGLEContextANGLE)},
-    {"glGetBooleanv", P(gl::GetBooleanv)},
-    {"glGetBooleanvContextANGLE", P(gl::GetBooleanvContextANGLE)},
-    {"glGetBooleanvRobustANGLE", P(gl::GetBooleanvRobustANGLE)},
-    {"glGetBooleanvRobustANGLEContextANGLE", P(gl::GetBooleanvRobustANGLEContextANGLE)},
-    {"glGetBufferParameteri64v", P(gl::GetBufferParameteri64v)},
-    {"glGetBufferParameteri64vContextANGLE", P(gl::GetBufferParameteri64vContextANGLE)},
-    {"glGetBufferParameteri64vRobustANGLE", P(gl::GetBufferParameteri64vRobustANGLE)},
-    {"glGetBufferParameteri64vRobustANGLEContextANGLE",
-     P(gl::GetBufferParameteri64vRobustANGLEContextANGLE)},
-    {"glGetBufferParameteriv", P(gl::GetBufferParameteriv)},
-    {"glGetBufferParameterivContextANGLE", P(gl::GetBufferParameterivContextANGLE)},
-    {"glGetBufferParameterivRobustANGLE", P(gl::GetBufferParameterivRobustANGLE)},
-    {"glGetBufferParameterivRobustANGLEContextANGLE",
-     P(gl::GetBufferParameterivRobustANGLEContextANGLE)},
-    {"glGetBufferPointerv", P(gl::GetBufferPointerv)},
-    {"glGetBufferPointervContextANGLE", P(gl::GetBufferPointervContextANGLE)},
-    {"glGetBufferPointervOES", P(gl::GetBufferPointervOES)},
-    {"glGetBufferPointervOESContextANGLE", P(gl::GetBufferPointervOESContextANGLE)},
-    {"glGetBufferPointervRobustANGLE", P(gl::GetBufferPointervRobustANGLE)},
-    {"glGetBufferPointervRobustANGLEContextANGLE", P(gl::GetBufferPointervRobustANGLEContextANGLE)},
-    {"glGetClipPlanef", P(gl::GetClipPlanef)},
-    {"glGetClipPlanefContextANGLE", P(gl::GetClipPlanefContextANGLE)},
-    {"glGetClipPlanex", P(gl::GetClipPlanex)},
-    {"glGetClipPlanexContextANGLE", P(gl::GetClipPlanexContextANGLE)},
-    {"glGetDebugMessageLogKHR", P(gl::GetDebugMessageLogKHR)},
-    {"glGetDebugMessageLogKHRContextANGLE", P(gl::GetDebugMessageLogKHRContextANGLE)},
-    {"glGetError", P(gl::GetError)},
-    {"glGetErrorContextANGLE", P(gl::GetErrorContextANGLE)},
-    {"glGetFenceivNV", P(gl::GetFenceivNV)},
-    {"glGetFenceivNVContextANGLE", P(gl::GetFenceivNVContextANGLE)},
-    {"glGetFixedv", P(gl::GetFixedv)},
-    {"glGetFixedvContextANGLE", P(gl::GetFixedvContextANGLE)},
-    {"glGetFloatv", P(gl::GetFloatv)},
-    {"glGetFloatvContextANGLE", P(gl::GetFloatvContextANGLE)},
-    {"glGetFloatvRobustANGLE", P(gl::GetFloatvRobustANGLE)},
-    {"glGetFloatvRobustANGLEContextANGLE", P(gl::GetFloatvRobustANGLEContextANGLE)},
-    {"glGetFragDataIndexEXT", P(gl::GetFragDataIndexEXT)},
-    {"glGetFragDataIndexEXTContextANGLE", P(gl::GetFragDataIndexEXTContextANGLE)},
-    {"glGetFragDataLocation", P(gl::GetFragDataLocation)},
-    {"glGetFragDataLocationContextANGLE", P(gl::GetFragDataLocationContextANGLE)},
+    {"glProgramUniform2ivContextANGLE", P(gl::ProgramUniform2ivContextANGLE)},
+    {"glDrawElements", P(gl::DrawElements)},
+    {"glAlphaFuncContextANGLE", P(gl::AlphaFuncContextANGLE)},
+    {"glGetTexLevelParameterfvANGLEContextANGLE", P(gl::GetTexLevelParameterfvANGLEContextANGLE)},
+    {"glVertexAttrib4fv", P(gl::VertexAttrib4fv)},
+    {"glEnableClientState", P(gl::EnableClientState)},
+    {"eglGetError", P(EGL_GetError)},
+    {"glDepthRangexContextANGLE", P(gl::DepthRangexContextANGLE)},
+    {"glTexEnvxv", P(gl::TexEnvxv)},
+    {"glGetVertexAttribIuivRobustANGLEContextANGLE",
+     P(gl::GetVertexAttribIuivRobustANGLEContextANGLE)},
     {"glGetFramebufferAttachmentParameteriv", P(gl::GetFramebufferAttachmentParameteriv)},
-    {"glGetFramebufferAttachmentParameterivContextANGLE",
-     P(gl::GetFramebufferAttachmentParameterivContextANGLE)},
-    {"glGetFramebufferAttachmentParameterivRobustANGLE",
-     P(gl::GetFramebufferAttachmentParameterivRobustANGLE)},
-    {"glGetFramebufferAttachmentParameterivRobustANGLEContextANGLE",
-     P(gl::GetFramebufferAttachmentParameterivRobustANGLEContextANGLE)},
-    {"glGetFramebufferParameteriv", P(gl::GetFramebufferParameteriv)},
-    {"glGetFramebufferParameterivContextANGLE", P(gl::GetFramebufferParameterivContextANGLE)},
-    {"glGetFramebufferParameterivRobustANGLE", P(gl::GetFramebufferParameterivRobustANGLE)},
-    {"glGetFramebufferParameterivRobustANGLEContextANGLE",
-     P(gl::GetFramebufferParameterivRobustANGLEContextANGLE)},
-    {"glGetGraphicsResetStatusEXT", P(gl::GetGraphicsResetStatusEXT)},
-    {"glGetGraphicsResetStatusEXTContextANGLE", P(gl::GetGraphicsResetStatusEXTContextANGLE)},
-    {"glGetInteger64i_v", P(gl::GetInteger64i_v)},
-    {"glGetInteger64i_vContextANGLE", P(gl::GetInteger64i_vContextANGLE)},
-    {"glGetInteger64i_vRobustANGLE", P(gl::GetInteger64i_vRobustANGLE)},
-    {"glGetInteger64i_vRobustANGLEContextANGLE", P(gl::GetInteger64i_vRobustANGLEContextANGLE)},
-    {"glGetInteger64v", P(gl::GetInteger64v)},
-    {"glGetInteger64vContextANGLE", P(gl::GetInteger64vContextANGLE)},
-    {"glGetInteger64vRobustANGLE", P(gl::GetInteger64vRobustANGLE)},
-    {"glGetInteger64vRobustANGLEContextANGLE", P(gl::GetInteger64vRobustANGLEContextANGLE)},
-    {"glGetIntegeri_v", P(gl::GetIntegeri_v)},
-    {"glGetIntegeri_vContextANGLE", P(gl::GetIntegeri_vContextANGLE)},
-    {"glGetIntegeri_vRobustANGLE", P(gl::GetIntegeri_vRobustANGLE)},
-    {"glGetIntegeri_vRobustANGLEContextANGLE", P(gl::GetIntegeri_vRobustANGLEContextANGLE)},
-    {"glGetIntegerv", P(gl::GetIntegerv)},
-    {"glGetIntegervContextANGLE", P(gl::GetIntegervContextANGLE)},
-    {"glGetIntegervRobustANGLE", P(gl::GetIntegervRobustANGLE)},
-    {"glGetIntegervRobustANGLEContextANGLE", P(gl::GetIntegervRobustANGLEContextANGLE)},
-    {"glGetInternalformativ", P(gl::GetInternalformativ)},
-    {"glGetInternalformativContextANGLE", P(gl::GetInternalformativContextANGLE)},
-    {"glGetInternalformativRobustANGLE", P(gl::GetInternalformativRobustANGLE)},
-    {"glGetInternalformativRobustANGLEContextANGLE",
-     P(gl::GetInternalformativRobustANGLEContextANGLE)},
-    {"glGetLightfv", P(gl::GetLightfv)},
-    {"glGetLightfvContextANGLE", P(gl::GetLightfvContextANGLE)},
-    {"glGetLightxv", P(gl::GetLightxv)},
-    {"glGetLightxvContextANGLE", P(gl::GetLightxvContextANGLE)},
-    {"glGetMaterialfv", P(gl::GetMaterialfv)},
-    {"glGetMaterialfvContextANGLE", P(gl::GetMaterialfvContextANGLE)},
-    {"glGetMaterialxv", P(gl::GetMaterialxv)},
-    {"glGetMaterialxvContextANGLE", P(gl::GetMaterialxvContextANGLE)},
-    {"glGetMemoryObjectParameterivEXT", P(gl::GetMemoryObjectParameterivEXT)},
-    {"glGetMemoryObjectParameterivEXTContextANGLE",
-     P(gl::GetMemoryObjectParameterivEXTContextANGLE)},
-    {"glGetMultisamplefv", P(gl::GetMultisamplefv)},
-    {"glGetMultisamplefvANGLE", P(gl::GetMultisamplefvANGLE)},
-    {"glGetMultisamplefvANGLEContextANGLE", P(gl::GetMultisamplefvANGLEContextANGLE)},
-    {"glGetMultisamplefvContextANGLE", P(gl::GetMultisamplefvContextANGLE)},
-    {"glGetMultisamplefvRobustANGLE", P(gl::GetMultisamplefvRobustANGLE)},
-    {"glGetMultisamplefvRobustANGLEContextANGLE", P(gl::GetMultisamplefvRobustANGLEContextANGLE)},
-    {"glGetObjectLabelKHR", P(gl::GetObjectLabelKHR)},
-    {"glGetObjectLabelKHRContextANGLE", P(gl::GetObjectLabelKHRContextANGLE)},
-    {"glGetObjectPtrLabelKHR", P(gl::GetObjectPtrLabelKHR)},
-    {"glGetObjectPtrLabelKHRContextANGLE", P(gl::GetObjectPtrLabelKHRContextANGLE)},
-    {"glGetPathParameterfvCHROMIUM", P(gl::GetPathParameterfvCHROMIUM)},
-    {"glGetPathParameterfvCHROMIUMContextANGLE", P(gl::GetPathParameterfvCHROMIUMContextANGLE)},
-    {"glGetPathParameterivCHROMIUM", P(gl::GetPathParameterivCHROMIUM)},
-    {"glGetPathParameterivCHROMIUMContextANGLE", P(gl::GetPathParameterivCHROMIUMContextANGLE)},
-    {"glGetPointerv", P(gl::GetPointerv)},
+    {"glGetQueryObjecti64vEXT", P(gl::GetQueryObjecti64vEXT)},
     {"glGetPointervContextANGLE", P(gl::GetPointervContextANGLE)},
-    {"glGetPointervKHR", P(gl::GetPointervKHR)},
-    {"glGetPointervKHRContextANGLE", P(gl::GetPointervKHRContextANGLE)},
-    {"glGetPointervRobustANGLERobustANGLE", P(gl::GetPointervRobustANGLERobustANGLE)},
-    {"glGetPointervRobustANGLERobustANGLEContextANGLE",
-     P(gl::GetPointervRobustANGLERobustANGLEContextANGLE)},
-    {"glGetProgramBinary", P(gl::GetProgramBinary)},
-    {"glGetProgramBinaryContextANGLE", P(gl::GetProgramBinaryContextANGLE)},
-    {"glGetProgramBinaryOES", P(gl::GetProgramBinaryOES)},
-    {"glGetProgramBinaryOESContextANGLE", P(gl::GetProgramBinaryOESContextANGLE)},
-    {"glGetProgramInfoLog", P(gl::GetProgramInfoLog)},
-    {"glGetProgramInfoLogContextANGLE", P(gl::GetProgramInfoLogContextANGLE)},
-    {"glGetProgramInterfaceiv", P(gl::GetProgramInterfaceiv)},
-    {"glGetProgramInterfaceivContextANGLE", P(gl::GetProgramInterfaceivContextANGLE)},
-    {"glGetProgramInterfaceivRobustANGLE", P(gl::GetProgramInterfaceivRobustANGLE)},
-    {"glGetProgramInterfaceivRobustANGLEContextANGLE",
-     P(gl::GetProgramInterfaceivRobustANGLEContextANGLE)},
-    {"glGetProgramPipelineInfoLog", P(gl::GetProgramPipelineInfoLog)},
+    {"glProgramUniform2fv", P(gl::ProgramUniform2fv)},
+    {"glGetActiveUniform", P(gl::GetActiveUniform)},
+    {"glGetFenceivNVContextANGLE", P(gl::GetFenceivNVContextANGLE)},
+    {"glMultiTexCoord4xContextANGLE", P(gl::MultiTexCoord4xContextANGLE)},
+    {"glGetErrorContextANGLE", P(gl::GetErrorContextANGLE)},
+    {"glProgramUniform4iv", P(gl::ProgramUniform4iv)},
+    {"glDrawTexxOESContextANGLE", P(gl::DrawTexxOESContextANGLE)},
+    {"glGetQueryObjectui64vRobustANGLE", P(gl::GetQueryObjectui64vRobustANGLE)},
+    {"glLightfv", P(gl::Lightfv)},
+    {"glUniform1uivContextANGLE", P(gl::Uniform1uivContextANGLE)},
+    {"glGenVertexArraysContextANGLE", P(gl::GenVertexArraysContextANGLE)},
+    {"glTexImage2DRobustANGLE", P(gl::TexImage2DRobustANGLE)},
+    {"glCoverStrokePathInstancedCHROMIUMContextANGLE",
+     P(gl::CoverStrokePathInstancedCHROMIUMContextANGLE)},
     {"glGetProgramPipelineInfoLogContextANGLE", P(gl::GetProgramPipelineInfoLogContextANGLE)},
-    {"glGetProgramPipelineiv", P(gl::GetProgramPipelineiv)},
-    {"glGetProgramPipelineivContextANGLE", P(gl::GetProgramPipelineivContextANGLE)},
-    {"glGetProgramResourceIndex", P(gl::GetProgramResourceIndex)},
-    {"glGetProgramResourceIndexContextANGLE", P(gl::GetProgramResourceIndexContextANGLE)},
-    {"glGetProgramResourceLocation", P(gl::GetProgramResourceLocation)},
+    {"glGetBooleanvContextANGLE", P(gl::GetBooleanvContextANGLE)},
+    {"glTexImage2DContextANGLE", P(gl::TexImage2DContextANGLE)},
+    {"glVertexAttribI4uivContextANGLE", P(gl::VertexAttribI4uivContextANGLE)},
+    {"glMultiDrawElementsANGLE", P(gl::MultiDrawElementsANGLE)},
+    {"glUniform2ui", P(gl::Uniform2ui)},
+    {"glPushMatrixContextANGLE", P(gl::PushMatrixContextANGLE)},
+    {"glGetRenderbufferParameterivContextANGLE", P(gl::GetRenderbufferParameterivContextANGLE)},
+    {"glGetUniformLocationContextANGLE", P(gl::GetUniformLocationContextANGLE)},
+    {"glGetQueryivRobustANGLEContextANGLE", P(gl::GetQueryivRobustANGLEContextANGLE)},
     {"glGetProgramResourceLocationContextANGLE", P(gl::GetProgramResourceLocationContextANGLE)},
-    {"glGetProgramResourceLocationIndexEXT", P(gl::GetProgramResourceLocationIndexEXT)},
-    {"glGetProgramResourceLocationIndexEXTContextANGLE",
-     P(gl::GetProgramResourceLocationIndexEXTContextANGLE)},
-    {"glGetProgramResourceName", P(gl::GetProgramResourceName)},
-    {"glGetProgramResourceNameContextANGLE", P(gl::GetProgramResourceNameContextANGLE)},
-    {"glGetProgramResourceiv", P(gl::GetProgramResourceiv)},
-    {"glGetProgramResourceivContextANGLE", P(gl::GetProgramResourceivContextANGLE)},
-    {"glGetProgramiv", P(gl::GetProgramiv)},
-    {"glGetProgramivContextANGLE", P(gl::GetProgramivContextANGLE)},
-    {"glGetProgramivRobustANGLE", P(gl::GetProgramivRobustANGLE)},
-    {"glGetProgramivRobustANGLEContextANGLE", P(gl::GetProgramivRobustANGLEContextANGLE)},
-    {"glGetQueryObjecti64vEXT", P(gl::GetQueryObjecti64vEXT)},
-    {"glGetQueryObjecti64vEXTContextANGLE", P(gl::GetQueryObjecti64vEXTContextANGLE)},
-    {"glGetQueryObjecti64vRobustANGLE", P(gl::GetQueryObjecti64vRobustANGLE)},
-    {"glGetQueryObjecti64vRobustANGLEContextANGLE",
-     P(gl::GetQueryObjecti64vRobustANGLEContextANGLE)},
-    {"glGetQueryObjectivEXT", P(gl::GetQueryObjectivEXT)},
-    {"glGetQueryObjectivEXTContextANGLE", P(gl::GetQueryObjectivEXTContextANGLE)},
-    {"glGetQueryObjectivRobustANGLE", P(gl::GetQueryObjectivRobustANGLE)},
-    {"glGetQueryObjectivRobustANGLEContextANGLE", P(gl::GetQueryObjectivRobustANGLEContextANGLE)},
-    {"glGetQueryObjectui64vEXT", P(gl::GetQueryObjectui64vEXT)},
-    {"glGetQueryObjectui64vEXTContextANGLE", P(gl::GetQueryObjectui64vEXTContextANGLE)},
-    {"glGetQueryObjectui64vRobustANGLE", P(gl::GetQueryObjectui64vRobustANGLE)},
-    {"glGetQueryObjectui64vRobustANGLEContextANGLE",
-     P(gl::GetQueryObjectui64vRobustANGLEContextANGLE)},
-    {"glGetQueryObjectuiv", P(gl::GetQueryObjectuiv)},
-    {"glGetQueryObjectuivContextANGLE", P(gl::GetQueryObjectuivContextANGLE)},
-    {"glGetQueryObjectuivEXT", P(gl::GetQueryObjectuivEXT)},
-    {"glGetQueryObjectuivEXTContextANGLE", P(gl::GetQueryObjectuivEXTContextANGLE)},
-    {"glGetQueryObjectuivRobustANGLE", P(gl::GetQueryObjectuivRobustANGLE)},
-    {"glGetQueryObjectuivRobustANGLEContextANGLE", P(gl::GetQueryObjectuivRobustANGLEContextANGLE)},
-    {"glGetQueryiv", P(gl::GetQueryiv)},
-    {"glGetQueryivContextANGLE", P(gl::GetQueryivContextANGLE)},
-    {"glGetQueryivEXT", P(gl::GetQueryivEXT)},
-    {"glGetQueryivEXTContextANGLE", P(gl::GetQueryivEXTContextANGLE)},
-    {"glGetQueryivRobustANGLE", P(gl::GetQueryivRobustANGLE)},
-    {"glGetQueryivRobustANGLEContextANGLE", P(gl::GetQueryivRobustANGLEContextANGLE)},
-    {"glGetRenderbufferParameteriv", P(gl::GetRenderbufferParameteriv)},
-    {"glGetRenderbufferParameterivContextANGLE", P(gl::GetRenderbufferParameterivContextANGLE)},
-    {"glGetRenderbufferParameterivRobustANGLE", P(gl::GetRenderbufferParameterivRobustANGLE)},
-    {"glGetRenderbufferParameterivRobustANGLEContextANGLE",
-     P(gl::GetRenderbufferParameterivRobustANGLEContextANGLE)},
-    {"glGetSamplerParameterIivOES", P(gl::GetSamplerParameterIivOES)},
-    {"glGetSamplerParameterIivOESContextANGLE", P(gl::GetSamplerParameterIivOESContextANGLE)},
-    {"glGetSamplerParameterIivRobustANGLE", P(gl::GetSamplerParameterIivRobustANGLE)},
-    {"glGetSamplerParameterIivRobustANGLEContextANGLE",
-     P(gl::GetSamplerParameterIivRobustANGLEContextANGLE)},
-    {"glGetSamplerParameterIuivOES", P(gl::GetSamplerParameterIuivOES)},
-    {"glGetSamplerParameterIuivOESContextANGLE", P(gl::GetSamplerParameterIuivOESContextANGLE)},
-    {"glGetSamplerParameterIuivRobustANGLE", P(gl::GetSamplerParameterIuivRobustANGLE)},
-    {"glGetSamplerParameterIuivRobustANGLEContextANGLE",
-     P(gl::GetSamplerParameterIuivRobustANGLEContextANGLE)},
-    {"glGetSamplerParameterfv", P(gl::GetSamplerParameterfv)},
-    {"glGetSamplerParameterfvContextANGLE", P(gl::GetSamplerParameterfvContextANGLE)},
-    {"glGetSamplerParameterfvRobustANGLE", P(gl::GetSamplerParameterfvRobustANGLE)},
-    {"glGetSamplerParameterfvRobustANGLEContextANGLE",
-     P(gl::GetSamplerParameterfvRobustANGLEContextANGLE)},
-    {"glGetSamplerParameteriv", P(gl::GetSamplerParameteriv)},
-    {"glGetSamplerParameterivContextANGLE", P(gl::GetSamplerParameterivContextANGLE)},
-    {"glGetSamplerParameterivRobustANGLE", P(gl::GetSamplerParameterivRobustANGLE)},
-    {"glGetSamplerParameterivRobustANGLEContextANGLE",
-     P(gl::GetSamplerParameterivRobustANGLEContextANGLE)},
-    {"glGetSemaphoreParameterui64vEXT", P(gl::GetSemaphoreParameterui64vEXT)},
-    {"glGetSemaphoreParameterui64vEXTContextANGLE",
-     P(gl::GetSemaphoreParameterui64vEXTContextANGLE)},
-    {"glGetShaderInfoLog", P(gl::GetShaderInfoLog)},
-    {"glGetShaderInfoLogContextANGLE", P(gl::GetShaderInfoLogContextANGLE)},
-    {"glGetShaderPrecisionFormat", P(gl::GetShaderPrecisionFormat)},
-    {"glGetShaderPrecisionFormatContextANGLE", P(gl::GetShaderPrecisionFormatContextANGLE)},
-    {"glGetShaderSource", P(gl::GetShaderSource)},
-    {"glGetShaderSourceContextANGLE", P(gl::GetShaderSourceContextANGLE)},
-    {"glGetShaderiv", P(gl::GetShaderiv)},
-    {"glGetShaderivContextANGLE", P(gl::GetShaderivContextANGLE)},
-    {"glGetShaderivRobustANGLE", P(gl::GetShaderivRobustANGLE)},
-    {"glGetShaderivRobustANGLEContextANGLE", P(gl::GetShaderivRobustANGLEContextANGLE)},
-    {"glGetString", P(gl::GetString)},
-    {"glGetStringContextANGLE", P(gl::GetStringContextANGLE)},
-    {"glGetStringi", P(gl::GetStringi)},
-    {"glGetStringiContextANGLE", P(gl::GetStringiContextANGLE)},
-    {"glGetSynciv", P(gl::GetSynciv)},
-    {"glGetSyncivContextANGLE", P(gl::GetSyncivContextANGLE)},
-    {"glGetTexEnvfv", P(gl::GetTexEnvfv)},
-    {"glGetTexEnvfvContextANGLE", P(gl::GetTexEnvfvContextANGLE)},
-    {"glGetTexEnviv", P(gl::GetTexEnviv)},
-    {"glGetTexEnvivContextANGLE", P(gl::GetTexEnvivContextANGLE)},
-    {"glGetTexEnvxv", P(gl::GetTexEnvxv)},
-    {"glGetTexEnvxvContextANGLE", P(gl::GetTexEnvxvContextANGLE)},
-    {"glGetTexLevelParameterfv", P(gl::GetTexLevelParameterfv)},
-    {"glGetTexLevelParameterfvANGLE", P(gl::GetTexLevelParameterfvANGLE)},
-    {"glGetTexLevelParameterfvANGLEContextANGLE", P(gl::GetTexLevelParameterfvANGLEContextANGLE)},
-    {"glGetTexLevelParameterfvContextANGLE", P(gl::GetTexLevelParameterfvContextANGLE)},
-    {"glGetTexLevelParameterfvRobustANGLE", P(gl::GetTexLevelParameterfvRobustANGLE)},
-    {"glGetTexLevelParameterfvRobustANGLEContextANGLE",
-     P(gl::GetTexLevelParameterfvRobustANGLEContextANGLE)},
-    {"glGetTexLevelParameteriv", P(gl::GetTexLevelParameteriv)},
-    {"glGetTexLevelParameterivANGLE", P(gl::GetTexLevelParameterivANGLE)},
-    {"glGetTexLevelParameterivANGLEContextANGLE", P(gl::GetTexLevelParameterivANGLEContextANGLE)},
-    {"glGetTexLevelParameterivContextANGLE", P(gl::GetTexLevelParameterivContextANGLE)},
-    {"glGetTexLevelParameterivRobustANGLE", P(gl::GetTexLevelParameterivRobustANGLE)},
-    {"glGetTexLevelParameterivRobustANGLEContextANGLE",
-     P(gl::GetTexLevelParameterivRobustANGLEContextANGLE)},
-    {"glGetTexParameterIivOES", P(gl::GetTexParameterIivOES)},
-    {"glGetTexParameterIivOESContextANGLE", P(gl::GetTexParameterIivOESContextANGLE)},
-    {"glGetTexParameterIivRobustANGLE", P(gl::GetTexParameterIivRobustANGLE)},
-    {"glGetTexParameterIivRobustANGLEContextANGLE",
-     P(gl::GetTexParameterIivRobustANGLEContextANGLE)},
-    {"glGetTexParameterIuivOES", P(gl::GetTexParameterIuivOES)},
-    {"glGetTexParameterIuivOESContextANGLE", P(gl::GetTexParameterIuivOESContextANGLE)},
-    {"glGetTexParameterIuivRobustANGLE", P(gl::GetTexParameterIuivRobustANGLE)},
-    {"glGetTexParameterIuivRobustANGLEContextANGLE",
-     P(gl::GetTexParameterIuivRobustANGLEContextANGLE)},
-    {"glGetTexParameterfv", P(gl::GetTexParameterfv)},
-    {"glGetTexParameterfvContextANGLE", P(gl::GetTexParameterfvContextANGLE)},
-    {"glGetTexParameterfvRobustANGLE", P(gl::GetTexParameterfvRobustANGLE)},
-    {"glGetTexParameterfvRobustANGLEContextANGLE", P(gl::GetTexParameterfvRobustANGLEContextANGLE)},
-    {"glGetTexParameteriv", P(gl::GetTexParameteriv)},
-    {"glGetTexParameterivContextANGLE", P(gl::GetTexParameterivContextANGLE)},
-    {"glGetTexParameterivRobustANGLE", P(gl::GetTexParameterivRobustANGLE)},
-    {"glGetTexParameterivRobustANGLEContextANGLE", P(gl::GetTexParameterivRobustANGLEContextANGLE)},
-    {"glGetTexParameterxv", P(gl::GetTexParameterxv)},
-    {"glGetTexParameterxvContextANGLE", P(gl::GetTexParameterxvContextANGLE)},
-    {"glGetTransformFeedbackVarying", P(gl::GetTransformFeedbackVarying)},
-    {"glGetTransformFeedbackVaryingContextANGLE", P(gl::GetTransformFeedbackVaryingContextANGLE)},
-    {"glGetTranslatedShaderSourceANGLE", P(gl::GetTranslatedShaderSourceANGLE)},
-    {"glGetTranslatedShaderSourceANGLEContextANGLE",
-     P(gl::GetTranslatedShaderSourceANGLEContextANGLE)},
-    {"glGetUniformBlockIndex", P(gl::GetUniformBlockIndex)},
-    {"glGetUniformBlockIndexContextANGLE", P(gl::GetUniformBlockIndexContextANGLE)},
-    {"glGetUniformIndices", P(gl::GetUniformIndices)},
-    {"glGetUniformIndicesContextANGLE", P(gl::GetUniformIndicesContextANGLE)},
-    {"glGetUniformLocation", P(gl::GetUniformLocation)},
-    {"glGetUniformLocationContextANGLE", P(gl::GetUniformLocationContextANGLE)},
-    {"glGetUniformfv", P(gl::GetUniformfv)},
-    {"glGetUniformfvContextANGLE", P(gl::GetUniformfvContextANGLE)},
-    {"glGetUniformfvRobustANGLE", P(gl::GetUniformfvRobustANGLE)},
-    {"glGetUniformfvRobustANGLEContextANGLE", P(gl::GetUniformfvRobustANGLEContextANGLE)},
-    {"glGetUniformiv", P(gl::GetUniformiv)},
-    {"glGetUniformivContextANGLE", P(gl::GetUniformivContextANGLE)},
-    {"glGetUniformivRobustANGLE", P(gl::GetUniformivRobustANGLE)},
-    {"glGetUniformivRobustANGLEContextANGLE", P(gl::GetUniformivRobustANGLEContextANGLE)},
-    {"glGetUniformuiv", P(gl::GetUniformuiv)},
-    {"glGetUniformuivContextANGLE", P(gl::GetUniformuivContextANGLE)},
-    {"glGetUniformuivRobustANGLE", P(gl::GetUniformuivRobustANGLE)},
-    {"glGetUniformuivRobustANGLEContextANGLE", P(gl::GetUniformuivRobustANGLEContextANGLE)},
-    {"glGetUnsignedBytei_vEXT", P(gl::GetUnsignedBytei_vEXT)},
-    {"glGetUnsignedBytei_vEXTContextANGLE", P(gl::GetUnsignedBytei_vEXTContextANGLE)},
-    {"glGetUnsignedBytevEXT", P(gl::GetUnsignedBytevEXT)},
-    {"glGetUnsignedBytevEXTContextANGLE", P(gl::GetUnsignedBytevEXTContextANGLE)},
-    {"glGetVertexAttribIiv", P(gl::GetVertexAttribIiv)},
-    {"glGetVertexAttribIivContextANGLE", P(gl::GetVertexAttribIivContextANGLE)},
-    {"glGetVertexAttribIivRobustANGLE", P(gl::GetVertexAttribIivRobustANGLE)},
-    {"glGetVertexAttribIivRobustANGLEContextANGLE",
-     P(gl::GetVertexAttribIivRobustANGLEContextANGLE)},
-    {"glGetVertexAttribIuiv", P(gl::GetVertexAttribIuiv)},
-    {"glGetVertexAttribIuivContextANGLE", P(gl::GetVertexAttribIuivContextANGLE)},
-    {"glGetVertexAttribIuivRobustANGLE", P(gl::GetVertexAttribIuivRobustANGLE)},
-    {"glGetVertexAttribIuivRobustANGLEContextANGLE",
-     P(gl::GetVertexAttribIuivRobustANGLEContextANGLE)},
-    {"glGetVertexAttribPointerv", P(gl::GetVertexAttribPointerv)},
-    {"glGetVertexAttribPointervContextANGLE", P(gl::GetVertexAttribPointervContextANGLE)},
-    {"glGetVertexAttribPointervRobustANGLE", P(gl::GetVertexAttribPointervRobustANGLE)},
-    {"glGetVertexAttribPointervRobustANGLEContextANGLE",
-     P(gl::GetVertexAttribPointervRobustANGLEContextANGLE)},
-    {"glGetVertexAttribfv", P(gl::GetVertexAttribfv)},
-    {"glGetVertexAttribfvContextANGLE", P(gl::GetVertexAttribfvContextANGLE)},
-    {"glGetVertexAttribfvRobustANGLE", P(gl::GetVertexAttribfvRobustANGLE)},
-    {"glGetVertexAttribfvRobustANGLEContextANGLE", P(gl::GetVertexAttribfvRobustANGLEContextANGLE)},
-    {"glGetVertexAttribiv", P(gl::GetVertexAttribiv)},
-    {"glGetVertexAttribivContextANGLE", P(gl::GetVertexAttribivContextANGLE)},
-    {"glGetVertexAttribivRobustANGLE", P(gl::GetVertexAttribivRobustANGLE)},
-    {"glGetVertexAttribivRobustANGLEContextANGLE", P(gl::GetVertexAttribivRobustANGLEContextANGLE)},
-    {"glGetnUniformfvEXT", P(gl::GetnUniformfvEXT)},
-    {"glGetnUniformfvEXTContextANGLE", P(gl::GetnUniformfvEXTContextANGLE)},
-    {"glGetnUniformfvRobustANGLE", P(gl::GetnUniformfvRobustANGLE)},
-    {"glGetnUniformfvRobustANGLEContextANGLE", P(gl::GetnUniformfvRobustANGLEContextANGLE)},
-    {"glGetnUniformivEXT", P(gl::GetnUniformivEXT)},
-    {"glGetnUniformivEXTContextANGLE", P(gl::GetnUniformivEXTContextANGLE)},
-    {"glGetnUniformivRobustANGLE", P(gl::GetnUniformivRobustANGLE)},
-    {"glGetnUniformivRobustANGLEContextANGLE", P(gl::GetnUniformivRobustANGLEContextANGLE)},
-    {"glGetnUniformuivRobustANGLE", P(gl::GetnUniformuivRobustANGLE)},
-    {"glGetnUniformuivRobustANGLEContextANGLE", P(gl::GetnUniformuivRobustANGLEContextANGLE)},
-    {"glHint", P(gl::Hint)},
-    {"glHintContextANGLE", P(gl::HintContextANGLE)},
-    {"glImportMemoryFdEXT", P(gl::ImportMemoryFdEXT)},
-    {"glImportMemoryFdEXTContextANGLE", P(gl::ImportMemoryFdEXTContextANGLE)},
-    {"glImportSemaphoreFdEXT", P(gl::ImportSemaphoreFdEXT)},
-    {"glImportSemaphoreFdEXTContextANGLE", P(gl::ImportSemaphoreFdEXTContextANGLE)},
-    {"glInsertEventMarkerEXT", P(gl::InsertEventMarkerEXT)},
-    {"glInsertEventMarkerEXTContextANGLE", P(gl::InsertEventMarkerEXTContextANGLE)},
-    {"glInvalidateFramebuffer", P(gl::InvalidateFramebuffer)},
-    {"glInvalidateFramebufferContextANGLE", P(gl::InvalidateFramebufferContextANGLE)},
-    {"glInvalidateSubFramebuffer", P(gl::InvalidateSubFramebuffer)},
-    {"glInvalidateSubFramebufferContextANGLE", P(gl::InvalidateSubFramebufferContextANGLE)},
-    {"glIsBuffer", P(gl::IsBuffer)},
-    {"glIsBufferContextANGLE", P(gl::IsBufferContextANGLE)},
-    {"glIsEnabled", P(gl::IsEnabled)},
-    {"glIsEnabledContextANGLE", P(gl::IsEnabledContextANGLE)},
-    {"glIsFenceNV", P(gl::IsFenceNV)},
-    {"glIsFenceNVContextANGLE", P(gl::IsFenceNVContextANGLE)},
-    {"glIsFramebuffer", P(gl::IsFramebuffer)},
-    {"glIsFramebufferContextANGLE", P(gl::IsFramebufferContextANGLE)},
-    {"glIsMemoryObjectEXT", P(gl::IsMemoryObjectEXT)},
-    {"glIsMemoryObjectEXTContextANGLE", P(gl::IsMemoryObjectEXTContextANGLE)},
-    {"glIsPathCHROMIUM", P(gl::IsPathCHROMIUM)},
-    {"glIsPathCHROMIUMContextANGLE", P(gl::IsPathCHROMIUMContextANGLE)},
-    {"glIsProgram", P(gl::IsProgram)},
-    {"glIsProgramContextANGLE", P(gl::IsProgramContextANGLE)},
-    {"glIsProgramPipeline", P(gl::IsProgramPipeline)},
-    {"glIsProgramPipelineContextANGLE", P(gl::IsProgramPipelineContextANGLE)},
-    {"glIsQuery", P(gl::IsQuery)},
-    {"glIsQueryContextANGLE", P(gl::IsQueryContextANGLE)},
-    {"glIsQueryEXT", P(gl::IsQueryEXT)},
-    {"glIsQueryEXTContextANGLE", P(gl::IsQueryEXTContextANGLE)},
-    {"glIsRenderbuffer", P(gl::IsRenderbuffer)},
-    {"glIsRenderbufferContextANGLE", P(gl::IsRenderbufferContextANGLE)},
-    {"glIsSampler", P(gl::IsSampler)},
-    {"glIsSamplerContextANGLE", P(gl::IsSamplerContextANGLE)},
-    {"glIsSemaphoreEXT", P(gl::IsSemaphoreEXT)},
-    {"glIsSemaphoreEXTContextANGLE", P(gl::IsSemaphoreEXTContextANGLE)},
-    {"glIsShader", P(gl::IsShader)},
-    {"glIsShaderContextANGLE", P(gl::IsShaderContextANGLE)},
-    {"glIsSync", P(gl::IsSync)},
-    {"glIsSyncContextANGLE", P(gl::IsSyncContextANGLE)},
-    {"glIsTexture", P(gl::IsTexture)},
-    {"glIsTextureContextANGLE", P(gl::IsTextureContextANGLE)},
-    {"glIsTransformFeedback", P(gl::IsTransformFeedback)},
-    {"glIsTransformFeedbackContextANGLE", P(gl::IsTransformFeedbackContextANGLE)},
-    {"glIsVertexArray", P(gl::IsVertexArray)},
-    {"glIsVertexArrayContextANGLE", P(gl::IsVertexArrayContextANGLE)},
-    {"glIsVertexArrayOES", P(gl::IsVertexArrayOES)},
-    {"glIsVertexArrayOESContextANGLE", P(gl::IsVertexArrayOESContextANGLE)},
-    {"glLightModelf", P(gl::LightModelf)},
-    {"glLightModelfContextANGLE", P(gl::LightModelfContextANGLE)},
-    {"glLightModelfv", P(gl::LightModelfv)},
-    {"glLightModelfvContextANGLE", P(gl::LightModelfvContextANGLE)},
-    {"glLightModelx", P(gl::LightModelx)},
-    {"glLightModelxContextANGLE", P(gl::LightModelxContextANGLE)},
-    {"glLightModelxv", P(gl::LightModelxv)},
-    {"glLightModelxvContextANGLE", P(gl::LightModelxvContextANGLE)},
-    {"glLightf", P(gl::Lightf)},
-    {"glLightfContextANGLE", P(gl::LightfContextANGLE)},
-    {"glLightfv", P(gl::Lightfv)},
-    {"glLightfvContextANGLE", P(gl::LightfvContextANGLE)},
-    {"glLightx", P(gl::Lightx)},
-    {"glLightxContextANGLE", P(gl::LightxContextANGLE)},
-    {"glLightxv", P(gl::Lightxv)},
-    {"glLightxvContextANGLE", P(gl::LightxvContextANGLE)},
-    {"glLineWidth", P(gl::LineWidth)},
-    {"glLineWidthContextANGLE", P(gl::LineWidthContextANGLE)},
-    {"glLineWidthx", P(gl::LineWidthx)},
-    {"glLineWidthxContextANGLE", P(gl::LineWidthxContextANGLE)},
-    {"glLinkProgram", P(gl::LinkProgram)},
-    {"glLinkProgramContextANGLE", P(gl::LinkProgramContextANGLE)},
-    {"glLoadIdentity", P(gl::LoadIdentity)},
-    {"glLoadIdentityContextANGLE", P(gl::LoadIdentityContextANGLE)},
-    {"glLoadMatrixf", P(gl::LoadMatrixf)},
-    {"glLoadMatrixfContextANGLE", P(gl::LoadMatrixfContextANGLE)},
-    {"glLoadMatrixx", P(gl::LoadMatrixx)},
-    {"glLoadMatrixxContextANGLE", P(gl::LoadMatrixxContextANGLE)},
-    {"glLoadPaletteFromModelViewMatrixOES", P(gl::LoadPaletteFromModelViewMatrixOES)},
-    {"glLoadPaletteFromModelViewMatrixOESContextANGLE",
-     P(gl::LoadPaletteFromModelViewMatrixOESContextANGLE)},
-    {"glLogicOp", P(gl::LogicOp)},
-    {"glLogicOpContextANGLE", P(gl::LogicOpContextANGLE)},
-    {"glLoseContextCHROMIUM", P(gl::LoseContextCHROMIUM)},
-    {"glLoseContextCHROMIUMContextANGLE", P(gl::LoseContextCHROMIUMContextANGLE)},
-    {"glMapBufferOES", P(gl::MapBufferOES)},
-    {"glMapBufferOESContextANGLE", P(gl::MapBufferOESContextANGLE)},
-    {"glMapBufferRange", P(gl::MapBufferRange)},
-    {"glMapBufferRangeContextANGLE", P(gl::MapBufferRangeContextANGLE)},
-    {"glMapBufferRangeEXT", P(gl::MapBufferRangeEXT)},
-    {"glMapBufferRangeEXTContextANGLE", P(gl::MapBufferRangeEXTContextANGLE)},
-    {"glMaterialf", P(gl::Materialf)},
-    {"glMaterialfContextANGLE", P(gl::MaterialfContextANGLE)},
-    {"glMaterialfv", P(gl::Materialfv)},
-    {"glMaterialfvContextANGLE", P(gl::MaterialfvContextANGLE)},
-    {"glMaterialx", P(gl::Materialx)},
-    {"glMaterialxContextANGLE", P(gl::MaterialxContextANGLE)},
-    {"glMaterialxv", P(gl::Materialxv)},
-    {"glMaterialxvContextANGLE", P(gl::MaterialxvContextANGLE)},
-    {"glMatrixIndexPointerOES", P(gl::MatrixIndexPointerOES)},
-    {"glMatrixIndexPointerOESContextANGLE", P(gl::MatrixIndexPointerOESContextANGLE)},
-    {"glMatrixLoadIdentityCHROMIUM", P(gl::MatrixLoadIdentityCHROMIUM)},
-    {"glMatrixLoadIdentityCHROMIUMContextANGLE", P(gl::MatrixLoadIdentityCHROMIUMContextANGLE)},
-    {"glMatrixLoadfCHROMIUM", P(gl::MatrixLoadfCHROMIUM)},
-    {"glMatrixLoadfCHROMIUMContextANGLE", P(gl::MatrixLoadfCHROMIUMContextANGLE)},
-    {"glMatrixMode", P(gl::MatrixMode)},
-    {"glMatrixModeContextANGLE", P(gl::MatrixModeContextANGLE)},
-    {"glMaxShaderCompilerThreadsKHR", P(gl::MaxShaderCompilerThreadsKHR)},
-    {"glMaxShaderCompilerThreadsKHRContextANGLE", P(gl::MaxShaderCompilerThreadsKHRContextANGLE)},
-    {"glMemoryBarrier", P(gl::MemoryBarrier)},
-    {"glMemoryBarrierByRegion", P(gl::MemoryBarrierByRegion)},
-    {"glMemoryBarrierByRegionContextANGLE", P(gl::MemoryBarrierByRegionContextANGLE)},
-    {"glMemoryBarrierContextANGLE", P(gl::MemoryBarrierContextANGLE)},
-    {"glMemoryObjectParameterivEXT", P(gl::MemoryObjectParameterivEXT)},
-    {"glMemoryObjectParameterivEXTContextANGLE", P(gl::MemoryObjectParameterivEXTContextANGLE)},
-    {"glMultMatrixf", P(gl::MultMatrixf)},
-    {"glMultMatrixfContextANGLE", P(gl::MultMatrixfContextANGLE)},
-    {"glMultMatrixx", P(gl::MultMatrixx)},
-    {"glMultMatrixxContextANGLE", P(gl::MultMatrixxContextANGLE)},
-    {"glMultiDrawArraysANGLE", P(gl::MultiDrawArraysANGLE)},
-    {"glMultiDrawArraysANGLEContextANGLE", P(gl::MultiDrawArraysANGLEContextANGLE)},
-    {"glMultiDrawArraysInstancedANGLE", P(gl::MultiDrawArraysInstancedANGLE)},
-    {"glMultiDrawArraysInstancedANGLEContextANGLE",
-     P(gl::MultiDrawArraysInstancedANGLEContextANGLE)},
-    {"glMultiDrawElementsANGLE", P(gl::MultiDrawElementsANGLE)},
-    {"glMultiDrawElementsANGLEContextANGLE", P(gl::MultiDrawElementsANGLEContextANGLE)},
-    {"glMultiDrawElementsInstancedANGLE", P(gl::MultiDrawElementsInstancedANGLE)},
-    {"glMultiDrawElementsInstancedANGLEContextANGLE",
-     P(gl::MultiDrawElementsInstancedANGLEContextANGLE)},
-    {"glMultiTexCoord4f", P(gl::MultiTexCoord4f)},
-    {"glMultiTexCoord4fContextANGLE", P(gl::MultiTexCoord4fContextANGLE)},
-    {"glMultiTexCoord4x", P(gl::MultiTexCoord4x)},
-    {"glMultiTexCoord4xContextANGLE", P(gl::MultiTexCoord4xContextANGLE)},
-    {"glNormal3f", P(gl::Normal3f)},
-    {"glNormal3fContextANGLE", P(gl::Normal3fContextANGLE)},
-    {"glNormal3x", P(gl::Normal3x)},
-    {"glNormal3xContextANGLE", P(gl::Normal3xContextANGLE)},
-    {"glNormalPointer", P(gl::NormalPointer)},
-    {"glNormalPointerContextANGLE", P(gl::NormalPointerContextANGLE)},
-    {"glObjectLabelKHR", P(gl::ObjectLabelKHR)},
-    {"glObjectLabelKHRContextANGLE", P(gl::ObjectLabelKHRContextANGLE)},
-    {"glObjectPtrLabelKHR", P(gl::ObjectPtrLabelKHR)},
-    {"glObjectPtrLabelKHRContextANGLE", P(gl::ObjectPtrLabelKHRContextANGLE)},
-    {"glOrthof", P(gl::Orthof)},
-    {"glOrthofContextANGLE", P(gl::OrthofContextANGLE)},
-    {"glOrthox", P(gl::Orthox)},
-    {"glOrthoxContextANGLE", P(gl::OrthoxContextANGLE)},
-    {"glPathCommandsCHROMIUM", P(gl::PathCommandsCHROMIUM)},
-    {"glPathCommandsCHROMIUMContextANGLE", P(gl::PathCommandsCHROMIUMContextANGLE)},
-    {"glPathParameterfCHROMIUM", P(gl::PathParameterfCHROMIUM)},
-    {"glPathParameterfCHROMIUMContextANGLE", P(gl::PathParameterfCHROMIUMContextANGLE)},
-    {"glPathParameteriCHROMIUM", P(gl::PathParameteriCHROMIUM)},
-    {"glPathParameteriCHROMIUMContextANGLE", P(gl::PathParameteriCHROMIUMContextANGLE)},
-    {"glPathStencilFuncCHROMIUM", P(gl::PathStencilFuncCHROMIUM)},
-    {"glPathStencilFuncCHROMIUMContextANGLE", P(gl::PathStencilFuncCHROMIUMContextANGLE)},
-    {"glPauseTransformFeedback", P(gl::PauseTransformFeedback)},
-    {"glPauseTransformFeedbackContextANGLE", P(gl::PauseTransformFeedbackContextANGLE)},
-    {"glPixelStorei", P(gl::PixelStorei)},
-    {"glPixelStoreiContextANGLE", P(gl::PixelStoreiContextANGLE)},
-    {"glPointParameterf", P(gl::PointParameterf)},
-    {"glPointParameterfContextANGLE", P(gl::PointParameterfContextANGLE)},
-    {"glPointParameterfv", P(gl::PointParameterfv)},
-    {"glPointParameterfvContextANGLE", P(gl::PointParameterfvContextANGLE)},
-    {"glPointParameterx", P(gl::PointParameterx)},
-    {"glPointParameterxContextANGLE", P(gl::PointParameterxContextANGLE)},
-    {"glPointParameterxv", P(gl::PointParameterxv)},
-    {"glPointParameterxvContextANGLE", P(gl::PointParameterxvContextANGLE)},
-    {"glPointSize", P(gl::PointSize)},
-    {"glPointSizeContextANGLE", P(gl::PointSizeContextANGLE)},
-    {"glPointSizePointerOES", P(gl::PointSizePointerOES)},
-    {"glPointSizePointerOESContextANGLE", P(gl::PointSizePointerOESContextANGLE)},
-    {"glPointSizex", P(gl::PointSizex)},
-    {"glPointSizexContextANGLE", P(gl::PointSizexContextANGLE)},
-    {"glPolygonOffset", P(gl::PolygonOffset)},
-    {"glPolygonOffsetContextANGLE", P(gl::PolygonOffsetContextANGLE)},
-    {"glPolygonOffsetx", P(gl::PolygonOffsetx)},
-    {"glPolygonOffsetxContextANGLE", P(gl::PolygonOffsetxContextANGLE)},
-    {"glPopDebugGroupKHR", P(gl::PopDebugGroupKHR)},
-    {"glPopDebugGroupKHRContextANGLE", P(gl::PopDebugGroupKHRContextANGLE)},
-    {"glPopGroupMarkerEXT", P(gl::PopGroupMarkerEXT)},
-    {"glPopGroupMarkerEXTContextANGLE", P(gl::PopGroupMarkerEXTContextANGLE)},
-    {"glPopMatrix", P(gl::PopMatrix)},
-    {"glPopMatrixContextANGLE", P(gl::PopMatrixContextANGLE)},
-    {"glProgramBinary", P(gl::ProgramBinary)},
-    {"glProgramBinaryContextANGLE", P(gl::ProgramBinaryContextANGLE)},
-    {"glProgramBinaryOES", P(gl::ProgramBinaryOES)},
-    {"glProgramBinaryOESContextANGLE", P(gl::ProgramBinaryOESContextANGLE)},
-    {"glProgramParameteri", P(gl::ProgramParameteri)},
-    {"glProgramParameteriContextANGLE", P(gl::ProgramParameteriContextANGLE)},
-    {"glProgramPathFragmentInputGenCHROMIUM", P(gl::ProgramPathFragmentInputGenCHROMIUM)},
-    {"glProgramPathFragmentInputGenCHROMIUMContextANGLE",
-     P(gl::ProgramPathFragmentInputGenCHROMIUMContextANGLE)},
-    {"glProgramUniform1f", P(gl::ProgramUniform1f)},
-    {"glProgramUniform1fContextANGLE", P(gl::ProgramUniform1fContextANGLE)},
-    {"glProgramUniform1fv", P(gl::ProgramUniform1fv)},
-    {"glProgramUniform1fvContextANGLE", P(gl::ProgramUniform1fvContextANGLE)},
-    {"glProgramUniform1i", P(gl::ProgramUniform1i)},
-    {"glProgramUniform1iContextANGLE", P(gl::ProgramUniform1iContextANGLE)},
-    {"glProgramUniform1iv", P(gl::ProgramUniform1iv)},
-    {"glProgramUniform1ivContextANGLE", P(gl::ProgramUniform1ivContextANGLE)},
-    {"glProgramUniform1ui", P(gl::ProgramUniform1ui)},
-    {"glProgramUniform1uiContextANGLE", P(gl::ProgramUniform1uiContextANGLE)},
+    {"glLoadMatrixfContextANGLE", P(gl::LoadMatrixfContextANGLE)},
+    {"eglGetFrameTimestampsANDROID", P(EGL_GetFrameTimestampsANDROID)},
+    {"glLinkProgramContextANGLE", P(gl::LinkProgramContextANGLE)},
+    {"glTexParameteri", P(gl::TexParameteri)},
+    {"eglQueryAPI", P(EGL_QueryAPI)},
+    {"glEGLImageTargetTexture2DOES", P(gl::EGLImageTargetTexture2DOES)},
+    {"glVertexAttribI4i", P(gl::VertexAttribI4i)},
     {"glProgramUniform1uiv", P(gl::ProgramUniform1uiv)},
-    {"glProgramUniform1uivContextANGLE", P(gl::ProgramUniform1uivContextANGLE)},
-    {"glProgramUniform2f", P(gl::ProgramUniform2f)},
-    {"glProgramUniform2fContextANGLE", P(gl::ProgramUniform2fContextANGLE)},
-    {"glProgramUniform2fv", P(gl::ProgramUniform2fv)},
-    {"glProgramUniform2fvContextANGLE", P(gl::ProgramUniform2fvContextANGLE)},
-    {"glProgramUniform2i", P(gl::ProgramUniform2i)},
-    {"glProgramUniform2iContextANGLE", P(gl::ProgramUniform2iContextANGLE)},
-    {"glProgramUniform2iv", P(gl::ProgramUniform2iv)},
-    {"glProgramUniform2ivContextANGLE", P(gl::ProgramUniform2ivContextANGLE)},
-    {"glProgramUniform2ui", P(gl::ProgramUniform2ui)},
-    {"glProgramUniform2uiContextANGLE", P(gl::ProgramUniform2uiContextANGLE)},
-    {"glProgramUniform2uiv", P(gl::ProgramUniform2uiv)},
+    {"glFrustumxContextANGLE", P(gl::FrustumxContextANGLE)},
+    {"glGenSemaphoresEXT", P(gl::GenSemaphoresEXT)},
+    {"glStencilThenCoverStrokePathCHROMIUM", P(gl::StencilThenCoverStrokePathCHROMIUM)},
+    {"glBindUniformLocationCHROMIUM", P(gl::BindUniformLocationCHROMIUM)},
+    {"glCreateShader", P(gl::CreateShader)},
+    {"glCreateProgram", P(gl::CreateProgram)},
+    {"glMaterialfv", P(gl::Materialfv)},
+    {"glBindTransformFeedback", P(gl::BindTransformFeedback)},
+    {"glVertexBindingDivisorContextANGLE", P(gl::VertexBindingDivisorContextANGLE)},
+    {"glMaxShaderCompilerThreadsKHRContextANGLE", P(gl::MaxShaderCompilerThreadsKHRContextANGLE)},
+    {"glDeleteProgramPipelines", P(gl::DeleteProgramPipelines)},
+    {"glResumeTransformFeedback", P(gl::ResumeTransformFeedback)},
+    {"glSamplerParameterIivOES", P(gl::SamplerParameterIivOES)},
+    {"glUniform4uiContextANGLE", P(gl::Uniform4uiContextANGLE)},
+    {"glHintContextANGLE", P(gl::HintContextANGLE)},
+    {"glDrawArraysInstancedEXT", P(gl::DrawArraysInstancedEXT)},
+    {"glMultiDrawArraysInstancedANGLE", P(gl::MultiDrawArraysInstancedANGLE)},
+    {"eglCreatePlatformPixmapSurface", P(EGL_CreatePlatformPixmapSurface)},
+    {"glPointParameterxvContextANGLE", P(gl::PointParameterxvContextANGLE)},
+    {"eglCreatePlatformWindowSurface", P(EGL_CreatePlatformWindowSurface)},
+    {"glGetTexParameterivRobustANGLEContextANGLE", P(gl::GetTexParameterivRobustANGLEContextANGLE)},
+    {"glGetUniformiv", P(gl::GetUniformiv)},
+    {"glFenceSync", P(gl::FenceSync)},
+    {"glGetFenceivNV", P(gl::GetFenceivNV)},
     {"glProgramUniform2uivContextANGLE", P(gl::ProgramUniform2uivContextANGLE)},
-    {"glProgramUniform3f", P(gl::ProgramUniform3f)},
-    {"glProgramUniform3fContextANGLE", P(gl::ProgramUniform3fContextANGLE)},
-    {"glProgramUniform3fv", P(gl::ProgramUniform3fv)},
-    {"glProgramUniform3fvContextANGLE", P(gl::ProgramUniform3fvContextANGLE)},
-    {"glProgramUniform3i", P(gl::ProgramUniform3i)},
-    {"glProgramUniform3iContextANGLE", P(gl::ProgramUniform3iContextANGLE)},
-    {"glProgramUniform3iv", P(gl::ProgramUniform3iv)},
-    {"glProgramUniform3ivContextANGLE", P(gl::ProgramUniform3ivContextANGLE)},
-    {"glProgramUniform3ui", P(gl::ProgramUniform3ui)},
-    {"glProgramUniform3uiContextANGLE", P(gl::ProgramUniform3uiContextANGLE)},
-    {"glProgramUniform3uiv", P(gl::ProgramUniform3uiv)},
-    {"glProgramUniform3uivContextANGLE", P(gl::ProgramUniform3uivContextANGLE)},
-    {"glProgramUniform4f", P(gl::ProgramUniform4f)},
-    {"glProgramUniform4fContextANGLE", P(gl::ProgramUniform4fContextANGLE)},
-    {"glProgramUniform4fv", P(gl::ProgramUniform4fv)},
-    {"glProgramUniform4fvContextANGLE", P(gl::ProgramUniform4fvContextANGLE)},
-    {"glProgramUniform4i", P(gl::ProgramUniform4i)},
-    {"glProgramUniform4iContextANGLE", P(gl::ProgramUniform4iContextANGLE)},
-    {"glProgramUniform4iv", P(gl::ProgramUniform4iv)},
-    {"glProgramUniform4ivContextANGLE", P(gl::ProgramUniform4ivContextANGLE)},
-    {"glProgramUniform4ui", P(gl::ProgramUniform4ui)},
-    {"glProgramUniform4uiContextANGLE", P(gl::ProgramUniform4uiContextANGLE)},
-    {"glProgramUniform4uiv", P(gl::ProgramUniform4uiv)},
-    {"glProgramUniform4uivContextANGLE", P(gl::ProgramUniform4uivContextANGLE)},
-    {"glProgramUniformMatrix2fv", P(gl::ProgramUniformMatrix2fv)},
-    {"glProgramUniformMatrix2fvContextANGLE", P(gl::ProgramUniformMatrix2fvContextANGLE)},
-    {"glProgramUniformMatrix2x3fv", P(gl::ProgramUniformMatrix2x3fv)},
-    {"glProgramUniformMatrix2x3fvContextANGLE", P(gl::ProgramUniformMatrix2x3fvContextANGLE)},
-    {"glProgramUniformMatrix2x4fv", P(gl::ProgramUniformMatrix2x4fv)},
-    {"glProgramUniformMatrix2x4fvContextANGLE", P(gl::ProgramUniformMatrix2x4fvContextANGLE)},
-    {"glProgramUniformMatrix3fv", P(gl::ProgramUniformMatrix3fv)},
-    {"glProgramUniformMatrix3fvContextANGLE", P(gl::ProgramUniformMatrix3fvContextANGLE)},
-    {"glProgramUniformMatrix3x2fv", P(gl::ProgramUniformMatrix3x2fv)},
-    {"glProgramUniformMatrix3x2fvContextANGLE", P(gl::ProgramUniformMatrix3x2fvContextANGLE)},
-    {"glProgramUniformMatrix3x4fv", P(gl::ProgramUniformMatrix3x4fv)},
-    {"glProgramUniformMatrix3x4fvContextANGLE", P(gl::ProgramUniformMatrix3x4fvContextANGLE)},
-    {"glProgramUniformMatrix4fv", P(gl::ProgramUniformMatrix4fv)},
-    {"glProgramUniformMatrix4fvContextANGLE", P(gl::ProgramUniformMatrix4fvContextANGLE)},
-    {"glProgramUniformMatrix4x2fv", P(gl::ProgramUniformMatrix4x2fv)},
-    {"glProgramUniformMatrix4x2fvContextANGLE", P(gl::ProgramUniformMatrix4x2fvContextANGLE)},
-    {"glProgramUniformMatrix4x3fv", P(gl::ProgramUniformMatrix4x3fv)},
-    {"glProgramUniformMatrix4x3fvContextANGLE", P(gl::ProgramUniformMatrix4x3fvContextANGLE)},
-    {"glProvokingVertexANGLE", P(gl::ProvokingVertexANGLE)},
-    {"glProvokingVertexANGLEContextANGLE", P(gl::ProvokingVertexANGLEContextANGLE)},
-    {"glPushDebugGroupKHR", P(gl::PushDebugGroupKHR)},
-    {"glPushDebugGroupKHRContextANGLE", P(gl::PushDebugGroupKHRContextANGLE)},
-    {"glPushGroupMarkerEXT", P(gl::PushGroupMarkerEXT)},
-    {"glPushGroupMarkerEXTContextANGLE", P(gl::PushGroupMarkerEXTContextANGLE)},
-    {"glPushMatrix", P(gl::PushMatrix)},
-    {"glPushMatrixContextANGLE", P(gl::PushMatrixContextANGLE)},
-    {"glQueryCounterEXT", P(gl::QueryCounterEXT)},
-    {"glQueryCounterEXTContextANGLE", P(gl::QueryCounterEXTContextANGLE)},
-    {"glQueryMatrixxOES", P(gl::QueryMatrixxOES)},
-    {"glQueryMatrixxOESContextANGLE", P(gl::QueryMatrixxOESContextANGLE)},
-    {"glReadBuffer", P(gl::ReadBuffer)},
-    {"glReadBufferContextANGLE", P(gl::ReadBufferContextANGLE)},
-    {"glReadPixels", P(gl::ReadPixels)},
+    {"glIsQueryEXT", P(gl::IsQueryEXT)},
+    {"glDepthRangefContextANGLE", P(gl::DepthRangefContextANGLE)},
+    {"glMultiTexCoord4x", P(gl::MultiTexCoord4x)},
+    {"glGenTexturesContextANGLE", P(gl::GenTexturesContextANGLE)},
+    {"glTexEnvfvContextANGLE", P(gl::TexEnvfvContextANGLE)},
+    {"glClearBufferiv", P(gl::ClearBufferiv)},
+    {"glGetSamplerParameterIivOES", P(gl::GetSamplerParameterIivOES)},
+    {"glIsFenceNV", P(gl::IsFenceNV)},
+    {"glProgramBinaryOESContextANGLE", P(gl::ProgramBinaryOESContextANGLE)},
+    {"glProgramBinaryOES", P(gl::ProgramBinaryOES)},
+    {"glGetIntegervRobustANGLE", P(gl::GetIntegervRobustANGLE)},
+    {"glTexParameterIuivOESContextANGLE", P(gl::TexParameterIuivOESContextANGLE)},
+    {"glGetTexParameterxv", P(gl::GetTexParameterxv)},
+    {"glClearColorxContextANGLE", P(gl::ClearColorxContextANGLE)},
+    {"glStencilOpSeparateContextANGLE", P(gl::StencilOpSeparateContextANGLE)},
+    {"glDiscardFramebufferEXTContextANGLE", P(gl::DiscardFramebufferEXTContextANGLE)},
+    {"glDrawTexsvOES", P(gl::DrawTexsvOES)},
+    {"glVertexAttrib1fContextANGLE", P(gl::VertexAttrib1fContextANGLE)},
+    {"glCopyBufferSubData", P(gl::CopyBufferSubData)},
+    {"glCoverageModulationCHROMIUMContextANGLE", P(gl::CoverageModulationCHROMIUMContextANGLE)},
+    {"glSampleMaskiContextANGLE", P(gl::SampleMaskiContextANGLE)},
+    {"glPathParameterfCHROMIUM", P(gl::PathParameterfCHROMIUM)},
+    {"glBeginTransformFeedback", P(gl::BeginTransformFeedback)},
+    {"glScalex", P(gl::Scalex)},
+    {"glCopyTextureCHROMIUM", P(gl::CopyTextureCHROMIUM)},
+    {"glTexParameterxContextANGLE", P(gl::TexParameterxContextANGLE)},
+    {"glDrawTexxvOESContextANGLE", P(gl::DrawTexxvOESContextANGLE)},
+    {"glFlush", P(gl::Flush)},
+    {"glGetVertexAttribivContextANGLE", P(gl::GetVertexAttribivContextANGLE)},
+    {"glGetVertexAttribPointerv", P(gl::GetVertexAttribPointerv)},
+    {"glSignalSemaphoreEXTContextANGLE", P(gl::SignalSemaphoreEXTContextANGLE)},
+    {"glEnableContextANGLE", P(gl::EnableContextANGLE)},
+    {"glGetBooleani_vRobustANGLEContextANGLE", P(gl::GetBooleani_vRobustANGLEContextANGLE)},
+    {"glGetnUniformivEXTContextANGLE", P(gl::GetnUniformivEXTContextANGLE)},
+    {"eglInitialize", P(EGL_Initialize)},
+    {"glVertexAttrib3fv", P(gl::VertexAttrib3fv)},
     {"glReadPixelsContextANGLE", P(gl::ReadPixelsContextANGLE)},
-    {"glReadPixelsRobustANGLE", P(gl::ReadPixelsRobustANGLE)},
-    {"glReadPixelsRobustANGLEContextANGLE", P(gl::ReadPixelsRobustANGLEContextANGLE)},
-    {"glReadnPixelsEXT", P(gl::ReadnPixelsEXT)},
-    {"glReadnPixelsEXTContextANGLE", P(gl::ReadnPixelsEXTContextANGLE)},
-    {"glReadnPixelsRobustANGLE", P(gl::ReadnPixelsRobustANGLE)},
-    {"glReadnPixelsRobustANGLEContextANGLE", P(gl::ReadnPixelsRobustANGLEContextANGLE)},
-    {"glReleaseShaderCompiler", P(gl::ReleaseShaderCompiler)},
-    {"glReleaseShaderCompilerContextANGLE", P(gl::ReleaseShaderCompilerContextANGLE)},
-    {"glRenderbufferStorage", P(gl::RenderbufferStorage)},
+    {"glMemoryBarrierContextANGLE", P(gl::MemoryBarrierContextANGLE)},
+    {"glGetObjectPtrLabelKHRContextANGLE", P(gl::GetObjectPtrLabelKHRContextANGLE)},
+    {"glDrawArrays", P(gl::DrawArrays)},
+    {"glDrawArraysInstancedEXTContextANGLE", P(gl::DrawArraysInstancedEXTContextANGLE)},
+    {"glVertexAttribPointerContextANGLE", P(gl::VertexAttribPointerContextANGLE)},
+    {"eglGetPlatformDisplay", P(EGL_GetPlatformDisplay)},
+    {"glStencilFuncSeparateContextANGLE", P(gl::StencilFuncSeparateContextANGLE)},
+    {"ANGLEResetDisplayPlatform", P(ANGLEResetDisplayPlatform)},
+    {"glDepthMask", P(gl::DepthMask)},
+    {"glDeleteQueriesEXT", P(gl::DeleteQueriesEXT)},
+    {"glGetLightfv", P(gl::GetLightfv)},
+    {"glAttachShaderContextANGLE", P(gl::AttachShaderContextANGLE)},
+    {"glIsProgramContextANGLE", P(gl::IsProgramContextANGLE)},
+    {"glCopyTexture3DANGLE", P(gl::CopyTexture3DANGLE)},
+    {"glTexStorage3DEXTContextANGLE", P(gl::TexStorage3DEXTContextANGLE)},
     {"glRenderbufferStorageContextANGLE", P(gl::RenderbufferStorageContextANGLE)},
-    {"glRenderbufferStorageMultisample", P(gl::RenderbufferStorageMultisample)},
-    {"glRenderbufferStorageMultisampleANGLE", P(gl::RenderbufferStorageMultisampleANGLE)},
-    {"glRenderbufferStorageMultisampleANGLEContextANGLE",
-     P(gl::RenderbufferStorageMultisampleANGLEContextANGLE)},
-    {"glRenderbufferStorageMultisampleContextANGLE",
-     P(gl::RenderbufferStorageMultisampleContextANGLE)},
-    {"glRequestExtensionANGLE", P(gl::RequestExtensionANGLE)},
-    {"glRequestExtensionANGLEContextANGLE", P(gl::RequestExtensionANGLEContextANGLE)},
-    {"glResumeTransformFeedback", P(gl::ResumeTransformFeedback)},
-    {"glResumeTransformFeedbackContextANGLE", P(gl::ResumeTransformFeedbackContextANGLE)},
-    {"glRotatef", P(gl::Rotatef)},
-    {"glRotatefContextANGLE", P(gl::RotatefContextANGLE)},
-    {"glRotatex", P(gl::Rotatex)},
-    {"glRotatexContextANGLE", P(gl::RotatexContextANGLE)},
-    {"glSampleCoverage", P(gl::SampleCoverage)},
+    {"glGetPathParameterfvCHROMIUM", P(gl::GetPathParameterfvCHROMIUM)},
+    {"glIsSamplerContextANGLE", P(gl::IsSamplerContextANGLE)},
+    {"glObjectLabelKHR", P(gl::ObjectLabelKHR)},
+    {"glGetTexParameteriv", P(gl::GetTexParameteriv)},
+    {"glDrawElementsInstancedEXTContextANGLE", P(gl::DrawElementsInstancedEXTContextANGLE)},
+    {"glGetMaterialfvContextANGLE", P(gl::GetMaterialfvContextANGLE)},
+    {"glDrawTexsvOESContextANGLE", P(gl::DrawTexsvOESContextANGLE)},
+    {"glGetProgramBinaryOES", P(gl::GetProgramBinaryOES)},
+    {"glFramebufferTextureLayerContextANGLE", P(gl::FramebufferTextureLayerContextANGLE)},
+    {"glGetUniformfvRobustANGLEContextANGLE", P(gl::GetUniformfvRobustANGLEContextANGLE)},
+    {"glMultMatrixxContextANGLE", P(gl::MultMatrixxContextANGLE)},
+    {"glGetShaderivContextANGLE", P(gl::GetShaderivContextANGLE)},
+    {"glBindBufferContextANGLE", P(gl::BindBufferContextANGLE)},
+    {"glGetVertexAttribIuivRobustANGLE", P(gl::GetVertexAttribIuivRobustANGLE)},
+    {"eglWaitSyncKHR", P(EGL_WaitSyncKHR)},
+    {"glGetDebugMessageLogKHR", P(gl::GetDebugMessageLogKHR)},
+    {"glProgramUniform4ui", P(gl::ProgramUniform4ui)},
+    {"glGetTexLevelParameterfvContextANGLE", P(gl::GetTexLevelParameterfvContextANGLE)},
+    {"glProgramUniform4uiv", P(gl::ProgramUniform4uiv)},
+    {"glUniform4iContextANGLE", P(gl::Uniform4iContextANGLE)},
+    {"glPointParameterfContextANGLE", P(gl::PointParameterfContextANGLE)},
+    {"glBindFragmentInputLocationCHROMIUMContextANGLE",
+     P(gl::BindFragmentInputLocationCHROMIUMContextANGLE)},
+    {"glVertexAttribI4uiv", P(gl::VertexAttribI4uiv)},
+    {"glLoadPaletteFromModelViewMatrixOES", P(gl::LoadPaletteFromModelViewMatrixOES)},
     {"glSampleCoverageContextANGLE", P(gl::SampleCoverageContextANGLE)},
-    {"glSampleCoveragex", P(gl::SampleCoveragex)},
-    {"glSampleCoveragexContextANGLE", P(gl::SampleCoveragexContextANGLE)},
-    {"glSampleMaski", P(gl::SampleMaski)},
-    {"glSampleMaskiANGLE", P(gl::SampleMaskiANGLE)},
-    {"glSampleMaskiANGLEContextANGLE", P(gl::SampleMaskiANGLEContextANGLE)},
-    {"glSampleMaskiContextANGLE", P(gl::SampleMaskiContextANGLE)},
-    {"glSamplerParameterIivOES", P(gl::SamplerParameterIivOES)},
-    {"glSamplerParameterIivOESContextANGLE", P(gl::SamplerParameterIivOESContextANGLE)},
-    {"glSamplerParameterIivRobustANGLE", P(gl::SamplerParameterIivRobustANGLE)},
-    {"glSamplerParameterIivRobustANGLEContextANGLE",
-     P(gl::SamplerParameterIivRobustANGLEContextANGLE)},
-    {"glSamplerParameterIuivOES", P(gl::SamplerParameterIuivOES)},
-    {"glSamplerParameterIuivOESContextANGLE", P(gl::SamplerParameterIuivOESContextANGLE)},
-    {"glSamplerParameterIuivRobustANGLE", P(gl::SamplerParameterIuivRobustANGLE)},
-    {"glSamplerParameterIuivRobustANGLEContextANGLE",
-     P(gl::SamplerParameterIuivRobustANGLEContextANGLE)},
-    {"glSamplerParameterf", P(gl::SamplerParameterf)},
-    {"glSamplerParameterfContextANGLE", P(gl::SamplerParameterfContextANGLE)},
-    {"glSamplerParameterfv", P(gl::SamplerParameterfv)},
-    {"glSamplerParameterfvContextANGLE", P(gl::SamplerParameterfvContextANGLE)},
-    {"glSamplerParameterfvRobustANGLE", P(gl::SamplerParameterfvRobustANGLE)},
-    {"glSamplerParameterfvRobustANGLEContextANGLE",
-     P(gl::SamplerParameterfvRobustANGLEContextANGLE)},
-    {"glSamplerParameteri", P(gl::SamplerParameteri)},
-    {"glSamplerParameteriContextANGLE", P(gl::SamplerParameteriContextANGLE)},
-    {"glSamplerParameteriv", P(gl::SamplerParameteriv)},
-    {"glSamplerParameterivContextANGLE", P(gl::SamplerParameterivContextANGLE)},
-    {"glSamplerParameterivRobustANGLE", P(gl::SamplerParameterivRobustANGLE)},
-    {"glSamplerParameterivRobustANGLEContextANGLE",
-     P(gl::SamplerParameterivRobustANGLEContextANGLE)},
-    {"glScalef", P(gl::Scalef)},
-    {"glScalefContextANGLE", P(gl::ScalefContextANGLE)},
-    {"glScalex", P(gl::Scalex)},
+    {"glGetTexParameterIivOES", P(gl::GetTexParameterIivOES)},
+    {"glEnableVertexAttribArrayContextANGLE", P(gl::EnableVertexAttribArrayContextANGLE)},
+    {"eglGetSyncValuesCHROMIUM", P(EGL_GetSyncValuesCHROMIUM)},
+    {"glFramebufferRenderbufferContextANGLE", P(gl::FramebufferRenderbufferContextANGLE)},
+    {"glGetTranslatedShaderSourceANGLE", P(gl::GetTranslatedShaderSourceANGLE)},
+    {"eglCreateImage", P(EGL_CreateImage)},
+    {"glIsTextureContextANGLE", P(gl::IsTextureContextANGLE)},
+    {"glGetProgramiv", P(gl::GetProgramiv)},
+    {"glGetSamplerParameterIuivOES", P(gl::GetSamplerParameterIuivOES)},
+    {"glGetSynciv", P(gl::GetSynciv)},
+    {"glTexParameterxv", P(gl::TexParameterxv)},
+    {"glPopGroupMarkerEXT", P(gl::PopGroupMarkerEXT)},
+    {"glGetIntegeri_vRobustANGLEContextANGLE", P(gl::GetIntegeri_vRobustANGLEContextANGLE)},
+    {"glUniformMatrix3x2fvContextANGLE", P(gl::UniformMatrix3x2fvContextANGLE)},
+    {"glProgramUniform3i", P(gl::ProgramUniform3i)},
+    {"glGetTexEnviv", P(gl::GetTexEnviv)},
+    {"glGetShaderSource", P(gl::GetShaderSource)},
+    {"glNormal3f", P(gl::Normal3f)},
+    {"glUniformMatrix2x3fvContextANGLE", P(gl::UniformMatrix2x3fvContextANGLE)},
+    {"glGetInteger64vRobustANGLEContextANGLE", P(gl::GetInteger64vRobustANGLEContextANGLE)},
+    {"eglCreateStreamKHR", P(EGL_CreateStreamKHR)},
+    {"glIsSync", P(gl::IsSync)},
+    {"glTexStorage2DMultisample", P(gl::TexStorage2DMultisample)},
+    {"glProgramUniformMatrix3x2fvContextANGLE", P(gl::ProgramUniformMatrix3x2fvContextANGLE)},
+    {"glTexEnviv", P(gl::TexEnviv)},
+    {"glReadBufferContextANGLE", P(gl::ReadBufferContextANGLE)},
     {"glScalexContextANGLE", P(gl::ScalexContextANGLE)},
-    {"glScissor", P(gl::Scissor)},
-    {"glScissorContextANGLE", P(gl::ScissorContextANGLE)},
-    {"glSemaphoreParameterui64vEXT", P(gl::SemaphoreParameterui64vEXT)},
-    {"glSemaphoreParameterui64vEXTContextANGLE", P(gl::SemaphoreParameterui64vEXTContextANGLE)},
-    {"glSetFenceNV", P(gl::SetFenceNV)},
-    {"glSetFenceNVContextANGLE", P(gl::SetFenceNVContextANGLE)},
-    {"glShadeModel", P(gl::ShadeModel)},
-    {"glShadeModelContextANGLE", P(gl::ShadeModelContextANGLE)},
-    {"glShaderBinary", P(gl::ShaderBinary)},
-    {"glShaderBinaryContextANGLE", P(gl::ShaderBinaryContextANGLE)},
-    {"glShaderSource", P(gl::ShaderSource)},
-    {"glShaderSourceContextANGLE", P(gl::ShaderSourceContextANGLE)},
-    {"glSignalSemaphoreEXT", P(gl::SignalSemaphoreEXT)},
-    {"glSignalSemaphoreEXTContextANGLE", P(gl::SignalSemaphoreEXTContextANGLE)},
-    {"glStencilFillPathCHROMIUM", P(gl::StencilFillPathCHROMIUM)},
-    {"glStencilFillPathCHROMIUMContextANGLE", P(gl::StencilFillPathCHROMIUMContextANGLE)},
-    {"glStencilFillPathInstancedCHROMIUM", P(gl::StencilFillPathInstancedCHROMIUM)},
-    {"glStencilFillPathInstancedCHROMIUMContextANGLE",
-     P(gl::StencilFillPathInstancedCHROMIUMContextANGLE)},
+    {"glDepthMaskContextANGLE", P(gl::DepthMaskContextANGLE)},
+    {"glBlendFuncSeparateContextANGLE", P(gl::BlendFuncSeparateContextANGLE)},
+    {"glGetPathParameterfvCHROMIUMContextANGLE", P(gl::GetPathParameterfvCHROMIUMContextANGLE)},
+    {"glCopyTexSubImage3DContextANGLE", P(gl::CopyTexSubImage3DContextANGLE)},
+    {"glPointSizeContextANGLE", P(gl::PointSizeContextANGLE)},
+    {"eglStreamConsumerAcquireKHR", P(EGL_StreamConsumerAcquireKHR)},
+    {"glCopyTexSubImage2D", P(gl::CopyTexSubImage2D)},
+    {"glVertexAttrib2fvContextANGLE", P(gl::VertexAttrib2fvContextANGLE)},
+    {"glGetVertexAttribPointervRobustANGLE", P(gl::GetVertexAttribPointervRobustANGLE)},
+    {"glGetAttribLocationContextANGLE", P(gl::GetAttribLocationContextANGLE)},
+    {"glGetVertexAttribPointervRobustANGLEContextANGLE",
+     P(gl::GetVertexAttribPointervRobustANGLEContextANGLE)},
+    {"glDeleteRenderbuffers", P(gl::DeleteRenderbuffers)},
+    {"glUniform2iv", P(gl::Uniform2iv)},
+    {"glProgramUniformMatrix4x3fv", P(gl::ProgramUniformMatrix4x3fv)},
+    {"glTexParameterfvRobustANGLEContextANGLE", P(gl::TexParameterfvRobustANGLEContextANGLE)},
+    {"glGetMaterialfv", P(gl::GetMaterialfv)},
+    {"glUniformMatrix2fvContextANGLE", P(gl::UniformMatrix2fvContextANGLE)},
+    {"eglStreamConsumerGLTextureExternalKHR", P(EGL_StreamConsumerGLTextureExternalKHR)},
+    {"glSamplerParameteriContextANGLE", P(gl::SamplerParameteriContextANGLE)},
     {"glStencilFunc", P(gl::StencilFunc)},
-    {"glStencilFuncContextANGLE", P(gl::StencilFuncContextANGLE)},
-    {"glStencilFuncSeparate", P(gl::StencilFuncSeparate)},
-    {"glStencilFuncSeparateContextANGLE", P(gl::StencilFuncSeparateContextANGLE)},
-    {"glStencilMask", P(gl::StencilMask)},
-    {"glStencilMaskContextANGLE", P(gl::StencilMaskContextANGLE)},
-    {"glStencilMaskSeparate", P(gl::StencilMaskSeparate)},
-    {"glStencilMaskSeparateContextANGLE", P(gl::StencilMaskSeparateContextANGLE)},
-    {"glStencilOp", P(gl::StencilOp)},
+    {"eglQueryDeviceAttribEXT", P(EGL_QueryDeviceAttribEXT)},
     {"glStencilOpContextANGLE", P(gl::StencilOpContextANGLE)},
-    {"glStencilOpSeparate", P(gl::StencilOpSeparate)},
-    {"glStencilOpSeparateContextANGLE", P(gl::StencilOpSeparateContextANGLE)},
-    {"glStencilStrokePathCHROMIUM", P(gl::StencilStrokePathCHROMIUM)},
-    {"glStencilStrokePathCHROMIUMContextANGLE", P(gl::StencilStrokePathCHROMIUMContextANGLE)},
-    {"glStencilStrokePathInstancedCHROMIUM", P(gl::StencilStrokePathInstancedCHROMIUM)},
+    {"glUniform3uiv", P(gl::Uniform3uiv)},
+    {"glIsMemoryObjectEXTContextANGLE", P(gl::IsMemoryObjectEXTContextANGLE)},
+    {"glGetObjectLabelKHR", P(gl::GetObjectLabelKHR)},
+    {"glBindBuffer", P(gl::BindBuffer)},
+    {"glDeleteQueriesContextANGLE", P(gl::DeleteQueriesContextANGLE)},
+    {"glVertexAttrib4f", P(gl::VertexAttrib4f)},
     {"glStencilStrokePathInstancedCHROMIUMContextANGLE",
      P(gl::StencilStrokePathInstancedCHROMIUMContextANGLE)},
-    {"glStencilThenCoverFillPathCHROMIUM", P(gl::StencilThenCoverFillPathCHROMIUM)},
-    {"glStencilThenCoverFillPathCHROMIUMContextANGLE",
-     P(gl::StencilThenCoverFillPathCHROMIUMContextANGLE)},
+    {"glStencilStrokePathCHROMIUM", P(gl::StencilStrokePathCHROMIUM)},
+    {"glGetTexParameterivRobustANGLE", P(gl::GetTexParameterivRobustANGLE)},
+    {"glGetString", P(gl::GetString)},
+    {"glDrawTexfvOES", P(gl::DrawTexfvOES)},
+    {"glReleaseShaderCompilerContextANGLE", P(gl::ReleaseShaderCompilerContextANGLE)},
+    {"glGenerateMipmapContextANGLE", P(gl::GenerateMipmapContextANGLE)},
+    {"glAlphaFuncx", P(gl::AlphaFuncx)},
+    {"eglReleaseThread", P(EGL_ReleaseThread)},
+    {"glFramebufferTextureLayer", P(gl::FramebufferTextureLayer)},
+    {"glGetTexLevelParameterivRobustANGLEContextANGLE",
+     P(gl::GetTexLevelParameterivRobustANGLEContextANGLE)},
+    {"glFenceSyncContextANGLE", P(gl::FenceSyncContextANGLE)},
+    {"glProgramUniformMatrix4x2fvContextANGLE", P(gl::ProgramUniformMatrix4x2fvContextANGLE)},
+    {"glTexParameterIuivOES", P(gl::TexParameterIuivOES)},
+    {"glGetError", P(gl::GetError)},
+    {"glImportSemaphoreFdEXTContextANGLE", P(gl::ImportSemaphoreFdEXTContextANGLE)},
+    {"glBindVertexArrayOES", P(gl::BindVertexArrayOES)},
+    {"eglProgramCacheGetAttribANGLE", P(EGL_ProgramCacheGetAttribANGLE)},
+    {"glPathCommandsCHROMIUMContextANGLE", P(gl::PathCommandsCHROMIUMContextANGLE)},
+    {"glPointSizePointerOESContextANGLE", P(gl::PointSizePointerOESContextANGLE)},
+    {"glLightModelf", P(gl::LightModelf)},
+    {"glEndTransformFeedbackContextANGLE", P(gl::EndTransformFeedbackContextANGLE)},
+    {"glBindFragDataLocationEXT", P(gl::BindFragDataLocationEXT)},
+    {"glEndQueryEXT", P(gl::EndQueryEXT)},
+    {"eglCreatePbufferFromClientBuffer", P(EGL_CreatePbufferFromClientBuffer)},
+    {"glBlitFramebufferANGLE", P(gl::BlitFramebufferANGLE)},
+    {"glUniform4uiv", P(gl::Uniform4uiv)},
+    {"glGetQueryObjectivRobustANGLE", P(gl::GetQueryObjectivRobustANGLE)},
+    {"glDetachShaderContextANGLE", P(gl::DetachShaderContextANGLE)},
+    {"glUseProgramStages", P(gl::UseProgramStages)},
+    {"glMaterialxv", P(gl::Materialxv)},
+    {"glSetFenceNV", P(gl::SetFenceNV)},
+    {"glPointParameterx", P(gl::PointParameterx)},
+    {"glUniformMatrix2x4fv", P(gl::UniformMatrix2x4fv)},
+    {"glMultiDrawArraysANGLE", P(gl::MultiDrawArraysANGLE)},
+    {"glDrawElementsInstancedANGLEContextANGLE", P(gl::DrawElementsInstancedANGLEContextANGLE)},
+    {"glBindAttribLocation", P(gl::BindAttribLocation)},
+    {"glDetachShader", P(gl::DetachShader)},
+    {"glPushMatrix", P(gl::PushMatrix)},
+    {"glTexParameterIivRobustANGLE", P(gl::TexParameterIivRobustANGLE)},
+    {"glDrawArraysInstancedANGLE", P(gl::DrawArraysInstancedANGLE)},
+    {"glGetUniformLocation", P(gl::GetUniformLocation)},
+    {"glGetBooleanv", P(gl::GetBooleanv)},
+    {"glLineWidthxContextANGLE", P(gl::LineWidthxContextANGLE)},
+    {"glStencilMaskSeparateContextANGLE", P(gl::StencilMaskSeparateContextANGLE)},
     {"glStencilThenCoverFillPathInstancedCHROMIUM",
      P(gl::StencilThenCoverFillPathInstancedCHROMIUM)},
+    {"glGetFragDataLocation", P(gl::GetFragDataLocation)},
+    {"glGetSamplerParameterivRobustANGLE", P(gl::GetSamplerParameterivRobustANGLE)},
+    {"glBindAttribLocationContextANGLE", P(gl::BindAttribLocationContextANGLE)},
+    {"glDeleteTexturesContextANGLE", P(gl::DeleteTexturesContextANGLE)},
+    {"glVertexAttrib1f", P(gl::VertexAttrib1f)},
+    {"glCompileShaderContextANGLE", P(gl::CompileShaderContextANGLE)},
+    {"glEnableClientStateContextANGLE", P(gl::EnableClientStateContextANGLE)},
+    {"glClearBufferuivContextANGLE", P(gl::ClearBufferuivContextANGLE)},
+    {"glGetIntegeri_v", P(gl::GetIntegeri_v)},
+    {"glClearColorx", P(gl::ClearColorx)},
+    {"glAttachShader", P(gl::AttachShader)},
+    {"glDrawArraysIndirect", P(gl::DrawArraysIndirect)},
+    {"glLoadIdentityContextANGLE", P(gl::LoadIdentityContextANGLE)},
+    {"glProgramUniform1fv", P(gl::ProgramUniform1fv)},
+    {"glGetUnsignedBytei_vEXTContextANGLE", P(gl::GetUnsignedBytei_vEXTContextANGLE)},
+    {"glLoadMatrixxContextANGLE", P(gl::LoadMatrixxContextANGLE)},
+    {"glIsTexture", P(gl::IsTexture)},
+    {"glVertexAttrib4fvContextANGLE", P(gl::VertexAttrib4fvContextANGLE)},
+    {"glIsShader", P(gl::IsShader)},
+    {"glMultiDrawElementsInstancedANGLEContextANGLE",
+     P(gl::MultiDrawElementsInstancedANGLEContextANGLE)},
+    {"glActiveTextureContextANGLE", P(gl::ActiveTextureContextANGLE)},
+    {"glGetTexEnvfvContextANGLE", P(gl::GetTexEnvfvContextANGLE)},
+    {"glColor4ub", P(gl::Color4ub)},
+    {"eglCreatePlatformWindowSurfaceEXT", P(EGL_CreatePlatformWindowSurfaceEXT)},
+    {"glMultiDrawElementsANGLEContextANGLE", P(gl::MultiDrawElementsANGLEContextANGLE)},
+    {"glTexSubImage2DRobustANGLE", P(gl::TexSubImage2DRobustANGLE)},
+    {"glCompressedTexImage3DContextANGLE", P(gl::CompressedTexImage3DContextANGLE)},
+    {"glDeleteVertexArraysOES", P(gl::DeleteVertexArraysOES)},
+    {"glProgramUniform3uiContextANGLE", P(gl::ProgramUniform3uiContextANGLE)},
+    {"glUniform2ivContextANGLE", P(gl::Uniform2ivContextANGLE)},
+    {"glSamplerParameterivRobustANGLE", P(gl::SamplerParameterivRobustANGLE)},
+    {"glGetSyncivContextANGLE", P(gl::GetSyncivContextANGLE)},
+    {"glPathParameterfCHROMIUMContextANGLE", P(gl::PathParameterfCHROMIUMContextANGLE)},
+    {"glCompressedTexSubImage2DRobustANGLEContextANGLE",
+     P(gl::CompressedTexSubImage2DRobustANGLEContextANGLE)},
+    {"glGetSamplerParameterfvRobustANGLE", P(gl::GetSamplerParameterfvRobustANGLE)},
+    {"glGetTexEnvivContextANGLE", P(gl::GetTexEnvivContextANGLE)},
+    {"glGetVertexAttribIuivContextANGLE", P(gl::GetVertexAttribIuivContextANGLE)},
+    {"glTexEnvfv", P(gl::TexEnvfv)},
+    {"glTexParameterfv", P(gl::TexParameterfv)},
+    {"glGenerateMipmap", P(gl::GenerateMipmap)},
+    {"glUniform2iContextANGLE", P(gl::Uniform2iContextANGLE)},
+    {"glClearColor", P(gl::ClearColor)},
+    {"glCompressedTexSubImage2D", P(gl::CompressedTexSubImage2D)},
+    {"glGetQueryObjectuiv", P(gl::GetQueryObjectuiv)},
+    {"glIsFenceNVContextANGLE", P(gl::IsFenceNVContextANGLE)},
+    {"glBufferDataContextANGLE", P(gl::BufferDataContextANGLE)},
+    {"glInsertEventMarkerEXTContextANGLE", P(gl::InsertEventMarkerEXTContextANGLE)},
+    {"glGetMultisamplefvANGLE", P(gl::GetMultisamplefvANGLE)},
+    {"eglGetSyncAttribKHR", P(EGL_GetSyncAttribKHR)},
+    {"glSamplerParameterIuivRobustANGLEContextANGLE",
+     P(gl::SamplerParameterIuivRobustANGLEContextANGLE)},
+    {"glUniform3i", P(gl::Uniform3i)},
+    {"glShadeModelContextANGLE", P(gl::ShadeModelContextANGLE)},
+    {"glTexParameterf", P(gl::TexParameterf)},
+    {"glUniformMatrix4fvContextANGLE", P(gl::UniformMatrix4fvContextANGLE)},
+    {"glUniformMatrix3x2fv", P(gl::UniformMatrix3x2fv)},
+    {"glVertexAttribI4ivContextANGLE", P(gl::VertexAttribI4ivContextANGLE)},
+    {"glRenderbufferStorageMultisampleANGLEContextANGLE",
+     P(gl::RenderbufferStorageMultisampleANGLEContextANGLE)},
+    {"glGetTexLevelParameteriv", P(gl::GetTexLevelParameteriv)},
+    {"glGetInternalformativContextANGLE", P(gl::GetInternalformativContextANGLE)},
+    {"glRenderbufferStorageMultisample", P(gl::RenderbufferStorageMultisample)},
+    {"glDispatchComputeIndirect", P(gl::DispatchComputeIndirect)},
+    {"glGetProgramInterfaceivContextANGLE", P(gl::GetProgramInterfaceivContextANGLE)},
+    {"glDepthRangex", P(gl::DepthRangex)},
+    {"glAlphaFunc", P(gl::AlphaFunc)},
+    {"glMaterialf", P(gl::Materialf)},
+    {"glDeleteSemaphoresEXT", P(gl::DeleteSemaphoresEXT)},
+    {"glTexStorageMem2DMultisampleEXT", P(gl::TexStorageMem2DMultisampleEXT)},
+    {"glBatchCommandsANGLEContextANGLE", P(gl::BatchCommandsANGLEContextANGLE)},
+    {"eglQueryContext", P(EGL_QueryContext)},
+    {"glMaterialxvContextANGLE", P(gl::MaterialxvContextANGLE)},
+    {"glDrawBuffers", P(gl::DrawBuffers)},
+    {"eglDestroySyncKHR", P(EGL_DestroySyncKHR)},
+    {"glStencilThenCoverStrokePathInstancedCHROMIUMContextANGLE",
+     P(gl::StencilThenCoverStrokePathInstancedCHROMIUMContextANGLE)},
+    {"glGetBooleanvRobustANGLEContextANGLE", P(gl::GetBooleanvRobustANGLEContextANGLE)},
+    {"eglQuerySurfacePointerANGLE", P(EGL_QuerySurfacePointerANGLE)},
+    {"eglQueryDisplayAttribEXT", P(EGL_QueryDisplayAttribEXT)},
+    {"glShaderSource", P(gl::ShaderSource)},
+    {"glEndQuery", P(gl::EndQuery)},
+    {"glGetSamplerParameterfvRobustANGLEContextANGLE",
+     P(gl::GetSamplerParameterfvRobustANGLEContextANGLE)},
+    {"glInsertEventMarkerEXT", P(gl::InsertEventMarkerEXT)},
+    {"glVertexAttribI4iv", P(gl::VertexAttribI4iv)},
+    {"glProgramPathFragmentInputGenCHROMIUMContextANGLE",
+     P(gl::ProgramPathFragmentInputGenCHROMIUMContextANGLE)},
+    {"glDeleteTransformFeedbacksContextANGLE", P(gl::DeleteTransformFeedbacksContextANGLE)},
+    {"glUniformMatrix2fv", P(gl::UniformMatrix2fv)},
+    {"glDispatchCompute", P(gl::DispatchCompute)},
+    {"glTexSubImage2D", P(gl::TexSubImage2D)},
+    {"glDrawTexfvOESContextANGLE", P(gl::DrawTexfvOESContextANGLE)},
+    {"glGetUniformfvRobustANGLE", P(gl::GetUniformfvRobustANGLE)},
+    {"eglGetFrameTimestampSupportedANDROID", P(EGL_GetFrameTimestampSupportedANDROID)},
+    {"glHint", P(gl::Hint)},
+    {"glEndTransformFeedback", P(gl::EndTransformFeedback)},
+    {"eglGetCurrentDisplay", P(EGL_GetCurrentDisplay)},
+    {"glProgramUniform1iContextANGLE", P(gl::ProgramUniform1iContextANGLE)},
+    {"glCompressedTexImage2DRobustANGLE", P(gl::CompressedTexImage2DRobustANGLE)},
+    {"eglSwapBuffersWithDamageKHR", P(EGL_SwapBuffersWithDamageKHR)},
+    {"glCompressedTexSubImage3DRobustANGLE", P(gl::CompressedTexSubImage3DRobustANGLE)},
+    {"glGetQueryivRobustANGLE", P(gl::GetQueryivRobustANGLE)},
+    {"glDeleteFencesNVContextANGLE", P(gl::DeleteFencesNVContextANGLE)},
+    {"glUniform3fContextANGLE", P(gl::Uniform3fContextANGLE)},
+    {"glProgramUniform3f", P(gl::ProgramUniform3f)},
+    {"glProgramUniformMatrix3x4fv", P(gl::ProgramUniformMatrix3x4fv)},
+    {"glTexParameterx", P(gl::TexParameterx)},
+    {"eglChooseConfig", P(EGL_ChooseConfig)},
+    {"glGetProgramPipelineiv", P(gl::GetProgramPipelineiv)},
+    {"glVertexAttribIFormat", P(gl::VertexAttribIFormat)},
+    {"glDeleteTextures", P(gl::DeleteTextures)},
+    {"glTexStorage3DEXT", P(gl::TexStorage3DEXT)},
+    {"eglGetCompositorTimingANDROID", P(EGL_GetCompositorTimingANDROID)},
+    {"glPointParameterxv", P(gl::PointParameterxv)},
+    {"glGetFloatvRobustANGLE", P(gl::GetFloatvRobustANGLE)},
+    {"glIsVertexArray", P(gl::IsVertexArray)},
+    {"eglCreateDeviceANGLE", P(EGL_CreateDeviceANGLE)},
+    {"glGetMultisamplefvRobustANGLE", P(gl::GetMultisamplefvRobustANGLE)},
+    {"glTexStorage2DEXT", P(gl::TexStorage2DEXT)},
+    {"glUniform3fvContextANGLE", P(gl::Uniform3fvContextANGLE)},
+    {"glUniform1fvContextANGLE", P(gl::Uniform1fvContextANGLE)},
+    {"glTexParameterivRobustANGLE", P(gl::TexParameterivRobustANGLE)},
+    {"glFinishFenceNV", P(gl::FinishFenceNV)},
+    {"glGetProgramInterfaceiv", P(gl::GetProgramInterfaceiv)},
+    {"eglCreateImageKHR", P(EGL_CreateImageKHR)},
     {"glStencilThenCoverFillPathInstancedCHROMIUMContextANGLE",
      P(gl::StencilThenCoverFillPathInstancedCHROMIUMContextANGLE)},
-    {"glStencilThenCoverStrokePathCHROMIUM", P(gl::StencilThenCoverStrokePathCHROMIUM)},
+    {"glBindSampler", P(gl::BindSampler)},
+    {"glGetVertexAttribiv", P(gl::GetVertexAttribiv)},
+    {"glCheckFramebufferStatus", P(gl::CheckFramebufferStatus)},
+    {"glDisableClientStateContextANGLE", P(gl::DisableClientStateContextANGLE)},
+    {"glIsRenderbuffer", P(gl::IsRenderbuffer)},
+    {"glDeleteShaderContextANGLE", P(gl::DeleteShaderContextANGLE)},
+    {"glUniform1i", P(gl::Uniform1i)},
+    {"glClientActiveTextureContextANGLE", P(gl::ClientActiveTextureContextANGLE)},
+    {"glGetQueryObjectuivEXT", P(gl::GetQueryObjectuivEXT)},
+    {"glSampleCoveragexContextANGLE", P(gl::SampleCoveragexContextANGLE)},
+    {"glGetMultisamplefvANGLEContextANGLE", P(gl::GetMultisamplefvANGLEContextANGLE)},
+    {"glDeleteVertexArraysOESContextANGLE", P(gl::DeleteVertexArraysOESContextANGLE)},
+    {"glGetVertexAttribIuiv", P(gl::GetVertexAttribIuiv)},
+    {"glGetProgramPipelineInfoLog", P(gl::GetProgramPipelineInfoLog)},
+    {"eglSurfaceAttrib", P(EGL_SurfaceAttrib)},
+    {"glTexEnvivContextANGLE", P(gl::TexEnvivContextANGLE)},
+    {"glActiveShaderProgram", P(gl::ActiveShaderProgram)},
+    {"glGetClipPlanef", P(gl::GetClipPlanef)},
+    {"glGetTransformFeedbackVaryingContextANGLE", P(gl::GetTransformFeedbackVaryingContextANGLE)},
+    {"glProgramUniformMatrix2x4fv", P(gl::ProgramUniformMatrix2x4fv)},
+    {"glUnmapBufferOESContextANGLE", P(gl::UnmapBufferOESContextANGLE)},
+    {"glGetTexLevelParameterfvRobustANGLEContextANGLE",
+     P(gl::GetTexLevelParameterfvRobustANGLEContextANGLE)},
+    {"glSamplerParameterivContextANGLE", P(gl::SamplerParameterivContextANGLE)},
+    {"glProgramUniformMatrix2x3fv", P(gl::ProgramUniformMatrix2x3fv)},
+    {"glMemoryBarrier", P(gl::MemoryBarrier)},
+    {"glFogfv", P(gl::Fogfv)},
+    {"glGetObjectLabelKHRContextANGLE", P(gl::GetObjectLabelKHRContextANGLE)},
+    {"glGetVertexAttribfv", P(gl::GetVertexAttribfv)},
+    {"eglClientWaitSync", P(EGL_ClientWaitSync)},
+    {"glGetTexParameterivContextANGLE", P(gl::GetTexParameterivContextANGLE)},
+    {"glTexSubImage2DContextANGLE", P(gl::TexSubImage2DContextANGLE)},
+    {"glTexImage3D", P(gl::TexImage3D)},
+    {"glProgramUniform4fContextANGLE", P(gl::ProgramUniform4fContextANGLE)},
+    {"glGetSamplerParameterIuivRobustANGLE", P(gl::GetSamplerParameterIuivRobustANGLE)},
+    {"glGetQueryObjectivEXT", P(gl::GetQueryObjectivEXT)},
+    {"glFinishContextANGLE", P(gl::FinishContextANGLE)},
+    {"glUniformMatrix4fv", P(gl::UniformMatrix4fv)},
+    {"glTexEnvi", P(gl::TexEnvi)},
+    {"glClientWaitSyncContextANGLE", P(gl::ClientWaitSyncContextANGLE)},
+    {"glBindRenderbuffer", P(gl::BindRenderbuffer)},
+    {"eglCreateSync", P(EGL_CreateSync)},
+    {"glIsBuffer", P(gl::IsBuffer)},
+    {"glResumeTransformFeedbackContextANGLE", P(gl::ResumeTransformFeedbackContextANGLE)},
+    {"glDeleteFramebuffersContextANGLE", P(gl::DeleteFramebuffersContextANGLE)},
+    {"eglStreamPostD3DTextureANGLE", P(EGL_StreamPostD3DTextureANGLE)},
+    {"glSampleMaski", P(gl::SampleMaski)},
+    {"glTexEnvxvContextANGLE", P(gl::TexEnvxvContextANGLE)},
+    {"glMemoryBarrierByRegion", P(gl::MemoryBarrierByRegion)},
+    {"glPopMatrixContextANGLE", P(gl::PopMatrixContextANGLE)},
+    {"glProgramUniformMatrix3fv", P(gl::ProgramUniformMatrix3fv)},
+    {"glCopyTexImage2D", P(gl::CopyTexImage2D)},
+    {"eglReleaseTexImage", P(EGL_ReleaseTexImage)},
+    {"glBindVertexBuffer", P(gl::BindVertexBuffer)},
+    {"glSamplerParameterIivRobustANGLEContextANGLE",
+     P(gl::SamplerParameterIivRobustANGLEContextANGLE)},
+    {"glMaxShaderCompilerThreadsKHR", P(gl::MaxShaderCompilerThreadsKHR)},
+    {"glSamplerParameterIuivOESContextANGLE", P(gl::SamplerParameterIuivOESContextANGLE)},
+    {"glCopySubTexture3DANGLE", P(gl::CopySubTexture3DANGLE)},
+    {"glDrawElementsIndirect", P(gl::DrawElementsIndirect)},
+    {"glIsTransformFeedbackContextANGLE", P(gl::IsTransformFeedbackContextANGLE)},
+    {"glPointSizex", P(gl::PointSizex)},
+    {"glReadBuffer", P(gl::ReadBuffer)},
+    {"glProgramUniform1fvContextANGLE", P(gl::ProgramUniform1fvContextANGLE)},
+    {"eglQueryDebugKHR", P(EGL_QueryDebugKHR)},
+    {"glMemoryBarrierByRegionContextANGLE", P(gl::MemoryBarrierByRegionContextANGLE)},
+    {"glClearStencil", P(gl::ClearStencil)},
+    {"glProgramUniformMatrix3x2fv", P(gl::ProgramUniformMatrix3x2fv)},
+    {"glGetBooleani_vRobustANGLE", P(gl::GetBooleani_vRobustANGLE)},
+    {"glGetQueryObjectuivEXTContextANGLE", P(gl::GetQueryObjectuivEXTContextANGLE)},
     {"glStencilThenCoverStrokePathCHROMIUMContextANGLE",
      P(gl::StencilThenCoverStrokePathCHROMIUMContextANGLE)},
-    {"glStencilThenCoverStrokePathInstancedCHROMIUM",
-     P(gl::StencilThenCoverStrokePathInstancedCHROMIUM)},
-    {"glStencilThenCoverStrokePathInstancedCHROMIUMContextANGLE",
-     P(gl::StencilThenCoverStrokePathInstancedCHROMIUMContextANGLE)},
-    {"glTestFenceNV", P(gl::TestFenceNV)},
-    {"glTestFenceNVContextANGLE", P(gl::TestFenceNVContextANGLE)},
+    {"glTexParameterIivRobustANGLEContextANGLE", P(gl::TexParameterIivRobustANGLEContextANGLE)},
+    {"glShadeModel", P(gl::ShadeModel)},
+    {"glLightModelx", P(gl::LightModelx)},
+    {"glBindTransformFeedbackContextANGLE", P(gl::BindTransformFeedbackContextANGLE)},
+    {"glGetProgramResourceIndex", P(gl::GetProgramResourceIndex)},
+    {"glMapBufferRangeContextANGLE", P(gl::MapBufferRangeContextANGLE)},
+    {"glGetInteger64vRobustANGLE", P(gl::GetInteger64vRobustANGLE)},
+    {"glFlushMappedBufferRangeEXT", P(gl::FlushMappedBufferRangeEXT)},
+    {"glTranslatefContextANGLE", P(gl::TranslatefContextANGLE)},
+    {"glGetQueryObjectui64vEXTContextANGLE", P(gl::GetQueryObjectui64vEXTContextANGLE)},
+    {"eglBindTexImage", P(EGL_BindTexImage)},
+    {"glBeginTransformFeedbackContextANGLE", P(gl::BeginTransformFeedbackContextANGLE)},
+    {"glBlendEquationSeparateContextANGLE", P(gl::BlendEquationSeparateContextANGLE)},
+    {"glGetnUniformfvRobustANGLEContextANGLE", P(gl::GetnUniformfvRobustANGLEContextANGLE)},
+    {"glWaitSemaphoreEXTContextANGLE", P(gl::WaitSemaphoreEXTContextANGLE)},
+    {"glIsShaderContextANGLE", P(gl::IsShaderContextANGLE)},
+    {"glCheckFramebufferStatusContextANGLE", P(gl::CheckFramebufferStatusContextANGLE)},
+    {"glIsPathCHROMIUMContextANGLE", P(gl::IsPathCHROMIUMContextANGLE)},
+    {"glMultMatrixf", P(gl::MultMatrixf)},
+    {"glDrawBuffersContextANGLE", P(gl::DrawBuffersContextANGLE)},
+    {"glUniform2fvContextANGLE", P(gl::Uniform2fvContextANGLE)},
+    {"glGetQueryObjectuivContextANGLE", P(gl::GetQueryObjectuivContextANGLE)},
+    {"glDebugMessageInsertKHR", P(gl::DebugMessageInsertKHR)},
+    {"glProgramUniform2ui", P(gl::ProgramUniform2ui)},
+    {"glStencilFillPathInstancedCHROMIUM", P(gl::StencilFillPathInstancedCHROMIUM)},
+    {"glProgramUniform2uiv", P(gl::ProgramUniform2uiv)},
+    {"glGetTexLevelParameterivRobustANGLE", P(gl::GetTexLevelParameterivRobustANGLE)},
+    {"glDeleteSamplersContextANGLE", P(gl::DeleteSamplersContextANGLE)},
+    {"glIsSemaphoreEXTContextANGLE", P(gl::IsSemaphoreEXTContextANGLE)},
+    {"glDeleteMemoryObjectsEXT", P(gl::DeleteMemoryObjectsEXT)},
+    {"glGenQueriesEXTContextANGLE", P(gl::GenQueriesEXTContextANGLE)},
+    {"glGetSamplerParameterIuivOESContextANGLE", P(gl::GetSamplerParameterIuivOESContextANGLE)},
+    {"glObjectLabelKHRContextANGLE", P(gl::ObjectLabelKHRContextANGLE)},
+    {"glGetPointerv", P(gl::GetPointerv)},
+    {"glOrthofContextANGLE", P(gl::OrthofContextANGLE)},
+    {"glProgramUniformMatrix4x3fvContextANGLE", P(gl::ProgramUniformMatrix4x3fvContextANGLE)},
+    {"glProgramUniform3ui", P(gl::ProgramUniform3ui)},
+    {"glTexParameterxvContextANGLE", P(gl::TexParameterxvContextANGLE)},
+    {"glUniform1iContextANGLE", P(gl::Uniform1iContextANGLE)},
+    {"glImportSemaphoreFdEXT", P(gl::ImportSemaphoreFdEXT)},
+    {"glProgramUniformMatrix4x2fv", P(gl::ProgramUniformMatrix4x2fv)},
+    {"glFogfvContextANGLE", P(gl::FogfvContextANGLE)},
+    {"glProgramUniform2uiContextANGLE", P(gl::ProgramUniform2uiContextANGLE)},
+    {"glGetQueryiv", P(gl::GetQueryiv)},
+    {"glTexStorageMem2DMultisampleEXTContextANGLE",
+     P(gl::TexStorageMem2DMultisampleEXTContextANGLE)},
+    {"glIsMemoryObjectEXT", P(gl::IsMemoryObjectEXT)},
+    {"glCoverFillPathCHROMIUM", P(gl::CoverFillPathCHROMIUM)},
+    {"glDeleteBuffersContextANGLE", P(gl::DeleteBuffersContextANGLE)},
+    {"glLogicOpContextANGLE", P(gl::LogicOpContextANGLE)},
+    {"glUniform4fvContextANGLE", P(gl::Uniform4fvContextANGLE)},
+    {"glGetLightxv", P(gl::GetLightxv)},
+    {"glVertexAttribDivisorEXTContextANGLE", P(gl::VertexAttribDivisorEXTContextANGLE)},
+    {"glUniformMatrix2x3fv", P(gl::UniformMatrix2x3fv)},
+    {"glDrawElementsInstancedANGLE", P(gl::DrawElementsInstancedANGLE)},
+    {"glIsSemaphoreEXT", P(gl::IsSemaphoreEXT)},
+    {"glGetActiveUniformBlockivContextANGLE", P(gl::GetActiveUniformBlockivContextANGLE)},
+    {"glDrawTexivOESContextANGLE", P(gl::DrawTexivOESContextANGLE)},
+    {"glGetTexLevelParameterfv", P(gl::GetTexLevelParameterfv)},
+    {"glDepthFuncContextANGLE", P(gl::DepthFuncContextANGLE)},
+    {"glTexParameterIuivRobustANGLE", P(gl::TexParameterIuivRobustANGLE)},
+    {"glGetVertexAttribPointervContextANGLE", P(gl::GetVertexAttribPointervContextANGLE)},
+    {"glReadPixels", P(gl::ReadPixels)},
     {"glTexCoordPointer", P(gl::TexCoordPointer)},
-    {"glTexCoordPointerContextANGLE", P(gl::TexCoordPointerContextANGLE)},
-    {"glTexEnvf", P(gl::TexEnvf)},
-    {"glTexEnvfContextANGLE", P(gl::TexEnvfContextANGLE)},
-    {"glTexEnvfv", P(gl::TexEnvfv)},
-    {"glTexEnvfvContextANGLE", P(gl::TexEnvfvContextANGLE)},
-    {"glTexEnvi", P(gl::TexEnvi)},
-    {"glTexEnviContextANGLE", P(gl::TexEnviContextANGLE)},
-    {"glTexEnviv", P(gl::TexEnviv)},
-    {"glTexEnvivContextANGLE", P(gl::TexEnvivContextANGLE)},
+    {"glVertexAttribIPointer", P(gl::VertexAttribIPointer)},
+    {"eglWaitGL", P(EGL_WaitGL)},
+    {"glTranslatex", P(gl::Translatex)},
+    {"glGetMaterialxv", P(gl::GetMaterialxv)},
+    {"glBeginQuery", P(gl::BeginQuery)},
+    {"glGetUniformIndices", P(gl::GetUniformIndices)},
+    {"glDeleteProgramPipelinesContextANGLE", P(gl::DeleteProgramPipelinesContextANGLE)},
+    {"glFogx", P(gl::Fogx)},
+    {"glDeleteProgram", P(gl::DeleteProgram)},
+    {"glTexSubImage3D", P(gl::TexSubImage3D)},
+    {"glUniform4f", P(gl::Uniform4f)},
+    {"glStencilMaskContextANGLE", P(gl::StencilMaskContextANGLE)},
+    {"glIsVertexArrayContextANGLE", P(gl::IsVertexArrayContextANGLE)},
     {"glTexEnvx", P(gl::TexEnvx)},
-    {"glTexEnvxContextANGLE", P(gl::TexEnvxContextANGLE)},
-    {"glTexEnvxv", P(gl::TexEnvxv)},
-    {"glTexEnvxvContextANGLE", P(gl::TexEnvxvContextANGLE)},
-    {"glTexImage2D", P(gl::TexImage2D)},
-    {"glTexImage2DContextANGLE", P(gl::TexImage2DContextANGLE)},
-    {"glTexImage2DRobustANGLE", P(gl::TexImage2DRobustANGLE)},
-    {"glTexImage2DRobustANGLEContextANGLE", P(gl::TexImage2DRobustANGLEContextANGLE)},
-    {"glTexImage3D", P(gl::TexImage3D)},
-    {"glTexImage3DContextANGLE", P(gl::TexImage3DContextANGLE)},
+    {"eglWaitClient", P(EGL_WaitClient)},
+    {"eglCopyBuffers", P(EGL_CopyBuffers)},
+    {"glGetInternalformativRobustANGLEContextANGLE",
+     P(gl::GetInternalformativRobustANGLEContextANGLE)},
+    {"eglProgramCacheResizeANGLE", P(EGL_ProgramCacheResizeANGLE)},
+    {"glGetRenderbufferParameterivRobustANGLEContextANGLE",
+     P(gl::GetRenderbufferParameterivRobustANGLEContextANGLE)},
+    {"glDebugMessageInsertKHRContextANGLE", P(gl::DebugMessageInsertKHRContextANGLE)},
+    {"glLightModelfvContextANGLE", P(gl::LightModelfvContextANGLE)},
+    {"glTexSubImage3DContextANGLE", P(gl::TexSubImage3DContextANGLE)},
+    {"glSetFenceNVContextANGLE", P(gl::SetFenceNVContextANGLE)},
+    {"glUniform2uiContextANGLE", P(gl::Uniform2uiContextANGLE)},
+    {"glUniform1f", P(gl::Uniform1f)},
+    {"glDrawRangeElements", P(gl::DrawRangeElements)},
+    {"glFinish", P(gl::Finish)},
+    {"glGetDebugMessageLogKHRContextANGLE", P(gl::GetDebugMessageLogKHRContextANGLE)},
+    {"glGetActiveUniformBlockName", P(gl::GetActiveUniformBlockName)},
+    {"eglQuerySurface", P(EGL_QuerySurface)},
+    {"glProgramUniformMatrix4fvContextANGLE", P(gl::ProgramUniformMatrix4fvContextANGLE)},
+    {"glGetTexEnvfv", P(gl::GetTexEnvfv)},
+    {"glGetnUniformuivRobustANGLEContextANGLE", P(gl::GetnUniformuivRobustANGLEContextANGLE)},
+    {"glReadPixelsRobustANGLEContextANGLE", P(gl::ReadPixelsRobustANGLEContextANGLE)},
+    {"glGetBufferParameterivContextANGLE", P(gl::GetBufferParameterivContextANGLE)},
+    {"glMatrixLoadIdentityCHROMIUMContextANGLE", P(gl::MatrixLoadIdentityCHROMIUMContextANGLE)},
+    {"glProgramUniform3uivContextANGLE", P(gl::ProgramUniform3uivContextANGLE)},
+    {"glProgramUniformMatrix2fvContextANGLE", P(gl::ProgramUniformMatrix2fvContextANGLE)},
+    {"glLineWidth", P(gl::LineWidth)},
+    {"glIsEnabled", P(gl::IsEnabled)},
+    {"glGetPointervRobustANGLERobustANGLE", P(gl::GetPointervRobustANGLERobustANGLE)},
+    {"glGetProgramBinary", P(gl::GetProgramBinary)},
+    {"glProgramUniform3iv", P(gl::ProgramUniform3iv)},
+    {"glVertexAttribI4iContextANGLE", P(gl::VertexAttribI4iContextANGLE)},
+    {"glGetBufferPointervRobustANGLE", P(gl::GetBufferPointervRobustANGLE)},
+    {"glDeleteFencesNV", P(gl::DeleteFencesNV)},
+    {"glGetInteger64i_vRobustANGLEContextANGLE", P(gl::GetInteger64i_vRobustANGLEContextANGLE)},
+    {"glProgramUniform1iv", P(gl::ProgramUniform1iv)},
+    {"glUniformBlockBinding", P(gl::UniformBlockBinding)},
+    {"glUniform2fContextANGLE", P(gl::Uniform2fContextANGLE)},
+    {"glDeleteVertexArraysContextANGLE", P(gl::DeleteVertexArraysContextANGLE)},
+    {"glUniform3f", P(gl::Uniform3f)},
+    {"glSemaphoreParameterui64vEXTContextANGLE", P(gl::SemaphoreParameterui64vEXTContextANGLE)},
+    {"glProgramUniform1fContextANGLE", P(gl::ProgramUniform1fContextANGLE)},
+    {"glFlushContextANGLE", P(gl::FlushContextANGLE)},
+    {"glUniform3iContextANGLE", P(gl::Uniform3iContextANGLE)},
+    {"glGetFramebufferParameteriv", P(gl::GetFramebufferParameteriv)},
+    {"glCoverFillPathInstancedCHROMIUMContextANGLE",
+     P(gl::CoverFillPathInstancedCHROMIUMContextANGLE)},
     {"glTexImage3DRobustANGLE", P(gl::TexImage3DRobustANGLE)},
-    {"glTexImage3DRobustANGLEContextANGLE", P(gl::TexImage3DRobustANGLEContextANGLE)},
-    {"glTexParameterIivOES", P(gl::TexParameterIivOES)},
-    {"glTexParameterIivOESContextANGLE", P(gl::TexParameterIivOESContextANGLE)},
-    {"glTexParameterIivRobustANGLE", P(gl::TexParameterIivRobustANGLE)},
-    {"glTexParameterIivRobustANGLEContextANGLE", P(gl::TexParameterIivRobustANGLEContextANGLE)},
-    {"glTexParameterIuivOES", P(gl::TexParameterIuivOES)},
-    {"glTexParameterIuivOESContextANGLE", P(gl::TexParameterIuivOESContextANGLE)},
-    {"glTexParameterIuivRobustANGLE", P(gl::TexParameterIuivRobustANGLE)},
+    {"glViewportContextANGLE", P(gl::ViewportContextANGLE)},
+    {"glUniformMatrix3x4fvContextANGLE", P(gl::UniformMatrix3x4fvContextANGLE)},
+    {"glDepthFunc", P(gl::DepthFunc)},
+    {"glGetSamplerParameterivContextANGLE", P(gl::GetSamplerParameterivContextANGLE)},
+    {"glSampleCoveragex", P(gl::SampleCoveragex)},
+    {"glGenRenderbuffersContextANGLE", P(gl::GenRenderbuffersContextANGLE)},
+    {"glPauseTransformFeedbackContextANGLE", P(gl::PauseTransformFeedbackContextANGLE)},
+    {"glPathCommandsCHROMIUM", P(gl::PathCommandsCHROMIUM)},
+    {"glClear", P(gl::Clear)},
+    {"glUniform1ivContextANGLE", P(gl::Uniform1ivContextANGLE)},
+    {"glGetTexParameterfvContextANGLE", P(gl::GetTexParameterfvContextANGLE)},
+    {"glDrawTexfOES", P(gl::DrawTexfOES)},
+    {"glGenQueriesEXT", P(gl::GenQueriesEXT)},
+    {"glGetGraphicsResetStatusEXT", P(gl::GetGraphicsResetStatusEXT)},
+    {"glUniform4ui", P(gl::Uniform4ui)},
+    {"glValidateProgramPipelineContextANGLE", P(gl::ValidateProgramPipelineContextANGLE)},
+    {"glFogf", P(gl::Fogf)},
+    {"glCompressedCopyTextureCHROMIUMContextANGLE",
+     P(gl::CompressedCopyTextureCHROMIUMContextANGLE)},
+    {"glStencilFuncSeparate", P(gl::StencilFuncSeparate)},
+    {"eglProgramCacheQueryANGLE", P(EGL_ProgramCacheQueryANGLE)},
+    {"glUniform2uiv", P(gl::Uniform2uiv)},
+    {"glUniformMatrix4x2fv", P(gl::UniformMatrix4x2fv)},
+    {"eglPostSubBufferNV", P(EGL_PostSubBufferNV)},
+    {"glGetBooleani_v", P(gl::GetBooleani_v)},
+    {"glPathStencilFuncCHROMIUM", P(gl::PathStencilFuncCHROMIUM)},
+    {"glGetProgramivContextANGLE", P(gl::GetProgramivContextANGLE)},
+    {"glLightxContextANGLE", P(gl::LightxContextANGLE)},
+    {"glProgramUniform3fvContextANGLE", P(gl::ProgramUniform3fvContextANGLE)},
+    {"glProgramUniformMatrix2x3fvContextANGLE", P(gl::ProgramUniformMatrix2x3fvContextANGLE)},
+    {"glClearBufferfiContextANGLE", P(gl::ClearBufferfiContextANGLE)},
+    {"glCoverFillPathInstancedCHROMIUM", P(gl::CoverFillPathInstancedCHROMIUM)},
+    {"glGetBooleanvRobustANGLE", P(gl::GetBooleanvRobustANGLE)},
+    {"glTexParameteriv", P(gl::TexParameteriv)},
+    {"glDisable", P(gl::Disable)},
+    {"glCreateShaderProgramv", P(gl::CreateShaderProgramv)},
+    {"glTexStorage2DContextANGLE", P(gl::TexStorage2DContextANGLE)},
+    {"glBindFramebufferContextANGLE", P(gl::BindFramebufferContextANGLE)},
+    {"eglQueryStreamu64KHR", P(EGL_QueryStreamu64KHR)},
+    {"glDrawArraysInstancedContextANGLE", P(gl::DrawArraysInstancedContextANGLE)},
+    {"glProgramUniform4iContextANGLE", P(gl::ProgramUniform4iContextANGLE)},
+    {"glTransformFeedbackVaryingsContextANGLE", P(gl::TransformFeedbackVaryingsContextANGLE)},
+    {"eglSetBlobCacheFuncsANDROID", P(EGL_SetBlobCacheFuncsANDROID)},
+    {"glVertexAttribBinding", P(gl::VertexAttribBinding)},
+    {"glDisableVertexAttribArray", P(gl::DisableVertexAttribArray)},
+    {"glVertexAttribIPointerContextANGLE", P(gl::VertexAttribIPointerContextANGLE)},
+    {"glLightModelxvContextANGLE", P(gl::LightModelxvContextANGLE)},
     {"glTexParameterIuivRobustANGLEContextANGLE", P(gl::TexParameterIuivRobustANGLEContextANGLE)},
-    {"glTexParameterf", P(gl::TexParameterf)},
-    {"glTexParameterfContextANGLE", P(gl::TexParameterfContextANGLE)},
-    {"glTexParameterfv", P(gl::TexParameterfv)},
-    {"glTexParameterfvContextANGLE", P(gl::TexParameterfvContextANGLE)},
-    {"glTexParameterfvRobustANGLE", P(gl::TexParameterfvRobustANGLE)},
-    {"glTexParameterfvRobustANGLEContextANGLE", P(gl::TexParameterfvRobustANGLEContextANGLE)},
-    {"glTexParameteri", P(gl::TexParameteri)},
-    {"glTexParameteriContextANGLE", P(gl::TexParameteriContextANGLE)},
-    {"glTexParameteriv", P(gl::TexParameteriv)},
-    {"glTexParameterivContextANGLE", P(gl::TexParameterivContextANGLE)},
-    {"glTexParameterivRobustANGLE", P(gl::TexParameterivRobustANGLE)},
+    {"glSamplerParameterf", P(gl::SamplerParameterf)},
+    {"glUniform4fv", P(gl::Uniform4fv)},
+    {"glDisableVertexAttribArrayContextANGLE", P(gl::DisableVertexAttribArrayContextANGLE)},
+    {"glSamplerParameterfvContextANGLE", P(gl::SamplerParameterfvContextANGLE)},
+    {"glGetTexParameterIivRobustANGLEContextANGLE",
+     P(gl::GetTexParameterIivRobustANGLEContextANGLE)},
+    {"glSampleCoverage", P(gl::SampleCoverage)},
+    {"glGetUniformivRobustANGLEContextANGLE", P(gl::GetUniformivRobustANGLEContextANGLE)},
+    {"glGetQueryObjecti64vRobustANGLE", P(gl::GetQueryObjecti64vRobustANGLE)},
+    {"glMultMatrixfContextANGLE", P(gl::MultMatrixfContextANGLE)},
+    {"glPauseTransformFeedback", P(gl::PauseTransformFeedback)},
+    {"glMapBufferOES", P(gl::MapBufferOES)},
+    {"glGetUniformuivRobustANGLEContextANGLE", P(gl::GetUniformuivRobustANGLEContextANGLE)},
+    {"glMatrixMode", P(gl::MatrixMode)},
+    {"glDrawBuffersEXTContextANGLE", P(gl::DrawBuffersEXTContextANGLE)},
+    {"glGetUniformivRobustANGLE", P(gl::GetUniformivRobustANGLE)},
+    {"glGetClipPlanefContextANGLE", P(gl::GetClipPlanefContextANGLE)},
+    {"eglGetPlatformDisplayEXT", P(EGL_GetPlatformDisplayEXT)},
+    {"glClientWaitSync", P(gl::ClientWaitSync)},
+    {"glAlphaFuncxContextANGLE", P(gl::AlphaFuncxContextANGLE)},
+    {"glDrawElementsInstanced", P(gl::DrawElementsInstanced)},
+    {"glGetShaderiv", P(gl::GetShaderiv)},
+    {"glClearBufferfvContextANGLE", P(gl::ClearBufferfvContextANGLE)},
+    {"glLightModelxContextANGLE", P(gl::LightModelxContextANGLE)},
+    {"glDeleteSyncContextANGLE", P(gl::DeleteSyncContextANGLE)},
+    {"glDebugMessageCallbackKHRContextANGLE", P(gl::DebugMessageCallbackKHRContextANGLE)},
+    {"glGetShaderivRobustANGLE", P(gl::GetShaderivRobustANGLE)},
+    {"glGetVertexAttribIivRobustANGLE", P(gl::GetVertexAttribIivRobustANGLE)},
+    {"glGetProgramResourceNameContextANGLE", P(gl::GetProgramResourceNameContextANGLE)},
+    {"glSamplerParameterIuivRobustANGLE", P(gl::SamplerParameterIuivRobustANGLE)},
+    {"glRequestExtensionANGLE", P(gl::RequestExtensionANGLE)},
+    {"glGetUnsignedBytevEXTContextANGLE", P(gl::GetUnsignedBytevEXTContextANGLE)},
+    {"glGetnUniformivRobustANGLEContextANGLE", P(gl::GetnUniformivRobustANGLEContextANGLE)},
+    {"glProgramUniform4fv", P(gl::ProgramUniform4fv)},
+    {"glGetUniformBlockIndexContextANGLE", P(gl::GetUniformBlockIndexContextANGLE)},
+    {"glClearBufferfi", P(gl::ClearBufferfi)},
+    {"glGetTexEnvxv", P(gl::GetTexEnvxv)},
+    {"glDrawArraysIndirectContextANGLE", P(gl::DrawArraysIndirectContextANGLE)},
+    {"eglCreateContext", P(EGL_CreateContext)},
+    {"glGetProgramResourceLocation", P(gl::GetProgramResourceLocation)},
+    {"glTexStorage3DMultisampleOES", P(gl::TexStorage3DMultisampleOES)},
+    {"glCopyTexSubImage3D", P(gl::CopyTexSubImage3D)},
+    {"eglCreatePbufferSurface", P(EGL_CreatePbufferSurface)},
+    {"glBufferSubDataContextANGLE", P(gl::BufferSubDataContextANGLE)},
+    {"glMaterialxContextANGLE", P(gl::MaterialxContextANGLE)},
     {"glTexParameterivRobustANGLEContextANGLE", P(gl::TexParameterivRobustANGLEContextANGLE)},
-    {"glTexParameterx", P(gl::TexParameterx)},
-    {"glTexParameterxContextANGLE", P(gl::TexParameterxContextANGLE)},
-    {"glTexParameterxv", P(gl::TexParameterxv)},
-    {"glTexParameterxvContextANGLE", P(gl::TexParameterxvContextANGLE)},
+    {"glGetActiveUniformBlockNameContextANGLE", P(gl::GetActiveUniformBlockNameContextANGLE)},
+    {"glClipPlanex", P(gl::ClipPlanex)},
+    {"glProvokingVertexANGLEContextANGLE", P(gl::ProvokingVertexANGLEContextANGLE)},
+    {"glGetInteger64v", P(gl::GetInteger64v)},
+    {"glUnmapBufferOES", P(gl::UnmapBufferOES)},
+    {"glGetUniformfvContextANGLE", P(gl::GetUniformfvContextANGLE)},
+    {"glVertexAttribFormatContextANGLE", P(gl::VertexAttribFormatContextANGLE)},
+    {"glGetActiveUniformBlockivRobustANGLE", P(gl::GetActiveUniformBlockivRobustANGLE)},
+    {"glMultiDrawArraysInstancedANGLEContextANGLE",
+     P(gl::MultiDrawArraysInstancedANGLEContextANGLE)},
+    {"glVertexPointer", P(gl::VertexPointer)},
+    {"glGetSamplerParameterivRobustANGLEContextANGLE",
+     P(gl::GetSamplerParameterivRobustANGLEContextANGLE)},
+    {"glGetVertexAttribIiv", P(gl::GetVertexAttribIiv)},
+    {"glVertexAttribDivisorContextANGLE", P(gl::VertexAttribDivisorContextANGLE)},
+    {"glSignalSemaphoreEXT", P(gl::SignalSemaphoreEXT)},
+    {"glBeginQueryEXT", P(gl::BeginQueryEXT)},
+    {"glColor4x", P(gl::Color4x)},
+    {"glGetFixedv", P(gl::GetFixedv)},
+    {"glScalefContextANGLE", P(gl::ScalefContextANGLE)},
+    {"eglGetDisplay", P(EGL_GetDisplay)},
+    {"glGenTransformFeedbacksContextANGLE", P(gl::GenTransformFeedbacksContextANGLE)},
+    {"glProgramUniform2fvContextANGLE", P(gl::ProgramUniform2fvContextANGLE)},
+    {"glUseProgram", P(gl::UseProgram)},
+    {"eglWaitSync", P(EGL_WaitSync)},
+    {"glGetFragDataIndexEXT", P(gl::GetFragDataIndexEXT)},
+    {"glGetStringiContextANGLE", P(gl::GetStringiContextANGLE)},
+    {"glPathStencilFuncCHROMIUMContextANGLE", P(gl::PathStencilFuncCHROMIUMContextANGLE)},
+    {"glBufferData", P(gl::BufferData)},
+    {"glProgramUniform4fvContextANGLE", P(gl::ProgramUniform4fvContextANGLE)},
+    {"glInvalidateSubFramebuffer", P(gl::InvalidateSubFramebuffer)},
+    {"glCullFaceContextANGLE", P(gl::CullFaceContextANGLE)},
+    {"glGenSamplersContextANGLE", P(gl::GenSamplersContextANGLE)},
+    {"glGetIntegeri_vContextANGLE", P(gl::GetIntegeri_vContextANGLE)},
+    {"glGetBufferParameterivRobustANGLEContextANGLE",
+     P(gl::GetBufferParameterivRobustANGLEContextANGLE)},
+    {"eglDestroyImageKHR", P(EGL_DestroyImageKHR)},
+    {"glGetQueryObjecti64vEXTContextANGLE", P(gl::GetQueryObjecti64vEXTContextANGLE)},
+    {"ANGLEGetDisplayPlatform", P(ANGLEGetDisplayPlatform)},
+    {"glCompressedTexImage2D", P(gl::CompressedTexImage2D)},
+    {"glFogfContextANGLE", P(gl::FogfContextANGLE)},
+    {"glUniform1fv", P(gl::Uniform1fv)},
+    {"glGetActiveUniformsiv", P(gl::GetActiveUniformsiv)},
+    {"glDrawArraysContextANGLE", P(gl::DrawArraysContextANGLE)},
+    {"glGetClipPlanex", P(gl::GetClipPlanex)},
+    {"glTexCoordPointerContextANGLE", P(gl::TexCoordPointerContextANGLE)},
+    {"glGetBufferParameterivRobustANGLE", P(gl::GetBufferParameterivRobustANGLE)},
+    {"glUniform2i", P(gl::Uniform2i)},
+    {"glProgramUniform2iContextANGLE", P(gl::ProgramUniform2iContextANGLE)},
+    {"glReadPixelsRobustANGLE", P(gl::ReadPixelsRobustANGLE)},
+    {"glGetSemaphoreParameterui64vEXTContextANGLE",
+     P(gl::GetSemaphoreParameterui64vEXTContextANGLE)},
+    {"glLineWidthx", P(gl::LineWidthx)},
+    {"glFogxContextANGLE", P(gl::FogxContextANGLE)},
+    {"glCopyTexImage2DContextANGLE", P(gl::CopyTexImage2DContextANGLE)},
+    {"glGetBufferParameteri64vRobustANGLE", P(gl::GetBufferParameteri64vRobustANGLE)},
+    {"eglCreateWindowSurface", P(EGL_CreateWindowSurface)},
+    {"glGetInteger64i_v", P(gl::GetInteger64i_v)},
+    {"glCopyTexture3DANGLEContextANGLE", P(gl::CopyTexture3DANGLEContextANGLE)},
+    {"glUseProgramContextANGLE", P(gl::UseProgramContextANGLE)},
+    {"glStencilOpSeparate", P(gl::StencilOpSeparate)},
+    {"glVertexAttrib3fContextANGLE", P(gl::VertexAttrib3fContextANGLE)},
+    {"glBindFragDataLocationEXTContextANGLE", P(gl::BindFragDataLocationEXTContextANGLE)},
+    {"glFramebufferTextureEXTContextANGLE", P(gl::FramebufferTextureEXTContextANGLE)},
+    {"glCopyBufferSubDataContextANGLE", P(gl::CopyBufferSubDataContextANGLE)},
+    {"glGetShaderSourceContextANGLE", P(gl::GetShaderSourceContextANGLE)},
+    {"glGetPointervRobustANGLERobustANGLEContextANGLE",
+     P(gl::GetPointervRobustANGLERobustANGLEContextANGLE)},
+    {"glFramebufferRenderbuffer", P(gl::FramebufferRenderbuffer)},
+    {"glGetBufferPointervRobustANGLEContextANGLE", P(gl::GetBufferPointervRobustANGLEContextANGLE)},
+    {"eglPresentationTimeANDROID", P(EGL_PresentationTimeANDROID)},
+    {"glDrawTexfOESContextANGLE", P(gl::DrawTexfOESContextANGLE)},
+    {"glIsTransformFeedback", P(gl::IsTransformFeedback)},
     {"glTexStorage2D", P(gl::TexStorage2D)},
-    {"glTexStorage2DContextANGLE", P(gl::TexStorage2DContextANGLE)},
-    {"glTexStorage2DEXT", P(gl::TexStorage2DEXT)},
-    {"glTexStorage2DEXTContextANGLE", P(gl::TexStorage2DEXTContextANGLE)},
-    {"glTexStorage2DMultisample", P(gl::TexStorage2DMultisample)},
-    {"glTexStorage2DMultisampleANGLE", P(gl::TexStorage2DMultisampleANGLE)},
-    {"glTexStorage2DMultisampleANGLEContextANGLE", P(gl::TexStorage2DMultisampleANGLEContextANGLE)},
-    {"glTexStorage2DMultisampleContextANGLE", P(gl::TexStorage2DMultisampleContextANGLE)},
+    {"glUniform1uiContextANGLE", P(gl::Uniform1uiContextANGLE)},
+    {"eglGetCurrentSurface", P(EGL_GetCurrentSurface)},
+    {"glDrawTexsOES", P(gl::DrawTexsOES)},
+    {"glRotatef", P(gl::Rotatef)},
+    {"glVertexAttrib1fvContextANGLE", P(gl::VertexAttrib1fvContextANGLE)},
+    {"glPushGroupMarkerEXT", P(gl::PushGroupMarkerEXT)},
+    {"glNormal3xContextANGLE", P(gl::Normal3xContextANGLE)},
+    {"glMultiDrawElementsInstancedANGLE", P(gl::MultiDrawElementsInstancedANGLE)},
+    {"glTexImage3DRobustANGLEContextANGLE", P(gl::TexImage3DRobustANGLEContextANGLE)},
+    {"glBindBufferBase", P(gl::BindBufferBase)},
+    {"glCompressedTexSubImage3DContextANGLE", P(gl::CompressedTexSubImage3DContextANGLE)},
+    {"glMultMatrixx", P(gl::MultMatrixx)},
+    {"glTexImage2DRobustANGLEContextANGLE", P(gl::TexImage2DRobustANGLEContextANGLE)},
+    {"glCoverageModulationCHROMIUM", P(gl::CoverageModulationCHROMIUM)},
+    {"glPathParameteriCHROMIUMContextANGLE", P(gl::PathParameteriCHROMIUMContextANGLE)},
+    {"glMatrixIndexPointerOES", P(gl::MatrixIndexPointerOES)},
+    {"glSemaphoreParameterui64vEXT", P(gl::SemaphoreParameterui64vEXT)},
+    {"glBlitFramebufferContextANGLE", P(gl::BlitFramebufferContextANGLE)},
+    {"glVertexAttrib1fv", P(gl::VertexAttrib1fv)},
+    {"glGetProgramPipelineivContextANGLE", P(gl::GetProgramPipelineivContextANGLE)},
+    {"glPointSizexContextANGLE", P(gl::PointSizexContextANGLE)},
+    {"glGetProgramResourceName", P(gl::GetProgramResourceName)},
+    {"glReleaseShaderCompiler", P(gl::ReleaseShaderCompiler)},
+    {"glTexParameterfContextANGLE", P(gl::TexParameterfContextANGLE)},
+    {"glLightModelfContextANGLE", P(gl::LightModelfContextANGLE)},
+    {"glCompressedTexSubImage2DRobustANGLE", P(gl::CompressedTexSubImage2DRobustANGLE)},
+    {"glGetPathParameterivCHROMIUMContextANGLE", P(gl::GetPathParameterivCHROMIUMContextANGLE)},
+    {"glGetUniformuivContextANGLE", P(gl::GetUniformuivContextANGLE)},
+    {"glBlitFramebufferANGLEContextANGLE", P(gl::BlitFramebufferANGLEContextANGLE)},
+    {"eglQueryStreamKHR", P(EGL_QueryStreamKHR)},
+    {"glGetShaderPrecisionFormat", P(gl::GetShaderPrecisionFormat)},
     {"glTexStorage3D", P(gl::TexStorage3D)},
-    {"glTexStorage3DContextANGLE", P(gl::TexStorage3DContextANGLE)},
-    {"glTexStorage3DEXT", P(gl::TexStorage3DEXT)},
-    {"glTexStorage3DEXTContextANGLE", P(gl::TexStorage3DEXTContextANGLE)},
-    {"glTexStorage3DMultisampleOES", P(gl::TexStorage3DMultisampleOES)},
-    {"glTexStorage3DMultisampleOESContextANGLE", P(gl::TexStorage3DMultisampleOESContextANGLE)},
-    {"glTexStorageMem2DEXT", P(gl::TexStorageMem2DEXT)},
-    {"glTexStorageMem2DEXTContextANGLE", P(gl::TexStorageMem2DEXTContextANGLE)},
-    {"glTexStorageMem2DMultisampleEXT", P(gl::TexStorageMem2DMultisampleEXT)},
-    {"glTexStorageMem2DMultisampleEXTContextANGLE",
-     P(gl::TexStorageMem2DMultisampleEXTContextANGLE)},
-    {"glTexStorageMem3DEXT", P(gl::TexStorageMem3DEXT)},
-    {"glTexStorageMem3DEXTContextANGLE", P(gl::TexStorageMem3DEXTContextANGLE)},
-    {"glTexStorageMem3DMultisampleEXT", P(gl::TexStorageMem3DMultisampleEXT)},
-    {"glTexStorageMem3DMultisampleEXTContextANGLE",
-     P(gl::TexStorageMem3DMultisampleEXTContextANGLE)},
-    {"glTexSubImage2D", P(gl::TexSubImage2D)},
-    {"glTexSubImage2DContextANGLE", P(gl::TexSubImage2DContextANGLE)},
-    {"glTexSubImage2DRobustANGLE", P(gl::TexSubImage2DRobustANGLE)},
-    {"glTexSubImage2DRobustANGLEContextANGLE", P(gl::TexSubImage2DRobustANGLEContextANGLE)},
-    {"glTexSubImage3D", P(gl::TexSubImage3D)},
-    {"glTexSubImage3DContextANGLE", P(gl::TexSubImage3DContextANGLE)},
-    {"glTexSubImage3DRobustANGLE", P(gl::TexSubImage3DRobustANGLE)},
-    {"glTexSubImage3DRobustANGLEContextANGLE", P(gl::TexSubImage3DRobustANGLEContextANGLE)},
+    {"glGetProgramResourceLocationIndexEXTContextANGLE",
+     P(gl::GetProgramResourceLocationIndexEXTContextANGLE)},
+    {"glGetSamplerParameterIivOESContextANGLE", P(gl::GetSamplerParameterIivOESContextANGLE)},
+    {"glFramebufferTexture2DContextANGLE", P(gl::FramebufferTexture2DContextANGLE)},
+    {"glGenSamplers", P(gl::GenSamplers)},
+    {"glColor4ubContextANGLE", P(gl::Color4ubContextANGLE)},
+    {"glUniform4fContextANGLE", P(gl::Uniform4fContextANGLE)},
+    {"glVertexAttribIFormatContextANGLE", P(gl::VertexAttribIFormatContextANGLE)},
+    {"glBlitFramebuffer", P(gl::BlitFramebuffer)},
+    {"glScissor", P(gl::Scissor)},
+    {"glDeleteBuffers", P(gl::DeleteBuffers)},
+    {"glColor4xContextANGLE", P(gl::Color4xContextANGLE)},
     {"glTransformFeedbackVaryings", P(gl::TransformFeedbackVaryings)},
-    {"glTransformFeedbackVaryingsContextANGLE", P(gl::TransformFeedbackVaryingsContextANGLE)},
-    {"glTranslatef", P(gl::Translatef)},
-    {"glTranslatefContextANGLE", P(gl::TranslatefContextANGLE)},
-    {"glTranslatex", P(gl::Translatex)},
-    {"glTranslatexContextANGLE", P(gl::TranslatexContextANGLE)},
-    {"glUniform1f", P(gl::Uniform1f)},
-    {"glUniform1fContextANGLE", P(gl::Uniform1fContextANGLE)},
-    {"glUniform1fv", P(gl::Uniform1fv)},
-    {"glUniform1fvContextANGLE", P(gl::Uniform1fvContextANGLE)},
-    {"glUniform1i", P(gl::Uniform1i)},
-    {"glUniform1iContextANGLE", P(gl::Uniform1iContextANGLE)},
-    {"glUniform1iv", P(gl::Uniform1iv)},
-    {"glUniform1ivContextANGLE", P(gl::Uniform1ivContextANGLE)},
-    {"glUniform1ui", P(gl::Uniform1ui)},
-    {"glUniform1uiContextANGLE", P(gl::Uniform1uiContextANGLE)},
-    {"glUniform1uiv", P(gl::Uniform1uiv)},
-    {"glUniform1uivContextANGLE", P(gl::Uniform1uivContextANGLE)},
+    {"glGetVertexAttribivRobustANGLE", P(gl::GetVertexAttribivRobustANGLE)},
+    {"glLightModelfv", P(gl::LightModelfv)},
+    {"eglStreamAttribKHR", P(EGL_StreamAttribKHR)},
+    {"glTestFenceNVContextANGLE", P(gl::TestFenceNVContextANGLE)},
+    {"glIsSampler", P(gl::IsSampler)},
+    {"glStencilFillPathCHROMIUM", P(gl::StencilFillPathCHROMIUM)},
+    {"glBindImageTextureContextANGLE", P(gl::BindImageTextureContextANGLE)},
+    {"glGetProgramResourceLocationIndexEXT", P(gl::GetProgramResourceLocationIndexEXT)},
+    {"glLightModelxv", P(gl::LightModelxv)},
+    {"eglGetNextFrameIdANDROID", P(EGL_GetNextFrameIdANDROID)},
+    {"glVertexAttrib3f", P(gl::VertexAttrib3f)},
+    {"glCompressedTexImage3D", P(gl::CompressedTexImage3D)},
+    {"glRenderbufferStorageMultisampleANGLE", P(gl::RenderbufferStorageMultisampleANGLE)},
+    {"glFogxv", P(gl::Fogxv)},
+    {"glGetActiveAttribContextANGLE", P(gl::GetActiveAttribContextANGLE)},
+    {"glGetMultisamplefvRobustANGLEContextANGLE", P(gl::GetMultisamplefvRobustANGLEContextANGLE)},
+    {"glFramebufferTextureMultiviewOVR", P(gl::FramebufferTextureMultiviewOVR)},
+    {"glTexParameterivContextANGLE", P(gl::TexParameterivContextANGLE)},
+    {"glGenPathsCHROMIUM", P(gl::GenPathsCHROMIUM)},
+    {"glPolygonOffset", P(gl::PolygonOffset)},
+    {"glGetVertexAttribfvRobustANGLEContextANGLE", P(gl::GetVertexAttribfvRobustANGLEContextANGLE)},
+    {"glGetPointervKHRContextANGLE", P(gl::GetPointervKHRContextANGLE)},
+    {"glSamplerParameterfvRobustANGLEContextANGLE",
+     P(gl::SamplerParameterfvRobustANGLEContextANGLE)},
+    {"glCopyTextureCHROMIUMContextANGLE", P(gl::CopyTextureCHROMIUMContextANGLE)},
+    {"glGetQueryObjectivRobustANGLEContextANGLE", P(gl::GetQueryObjectivRobustANGLEContextANGLE)},
+    {"glGetClipPlanexContextANGLE", P(gl::GetClipPlanexContextANGLE)},
+    {"glGetProgramInfoLogContextANGLE", P(gl::GetProgramInfoLogContextANGLE)},
+    {"glGetSamplerParameterIuivRobustANGLEContextANGLE",
+     P(gl::GetSamplerParameterIuivRobustANGLEContextANGLE)},
+    {"glBindBufferRangeContextANGLE", P(gl::BindBufferRangeContextANGLE)},
+    {"glStencilThenCoverFillPathCHROMIUMContextANGLE",
+     P(gl::StencilThenCoverFillPathCHROMIUMContextANGLE)},
+    {"glPopGroupMarkerEXTContextANGLE", P(gl::PopGroupMarkerEXTContextANGLE)},
+    {"glBindBufferRange", P(gl::BindBufferRange)},
     {"glUniform2f", P(gl::Uniform2f)},
-    {"glUniform2fContextANGLE", P(gl::Uniform2fContextANGLE)},
-    {"glUniform2fv", P(gl::Uniform2fv)},
-    {"glUniform2fvContextANGLE", P(gl::Uniform2fvContextANGLE)},
-    {"glUniform2i", P(gl::Uniform2i)},
-    {"glUniform2iContextANGLE", P(gl::Uniform2iContextANGLE)},
-    {"glUniform2iv", P(gl::Uniform2iv)},
-    {"glUniform2ivContextANGLE", P(gl::Uniform2ivContextANGLE)},
-    {"glUniform2ui", P(gl::Uniform2ui)},
-    {"glUniform2uiContextANGLE", P(gl::Uniform2uiContextANGLE)},
-    {"glUniform2uiv", P(gl::Uniform2uiv)},
-    {"glUniform2uivContextANGLE", P(gl::Uniform2uivContextANGLE)},
-    {"glUniform3f", P(gl::Uniform3f)},
-    {"glUniform3fContextANGLE", P(gl::Uniform3fContextANGLE)},
-    {"glUniform3fv", P(gl::Uniform3fv)},
-    {"glUniform3fvContextANGLE", P(gl::Uniform3fvContextANGLE)},
-    {"glUniform3i", P(gl::Uniform3i)},
-    {"glUniform3iContextANGLE", P(gl::Uniform3iContextANGLE)},
-    {"glUniform3iv", P(gl::Uniform3iv)},
-    {"glUniform3ivContextANGLE", P(gl::Uniform3ivContextANGLE)},
-    {"glUniform3ui", P(gl::Uniform3ui)},
+    {"glNormalPointer", P(gl::NormalPointer)},
+    {"glMultiTexCoord4f", P(gl::MultiTexCoord4f)},
     {"glUniform3uiContextANGLE", P(gl::Uniform3uiContextANGLE)},
-    {"glUniform3uiv", P(gl::Uniform3uiv)},
-    {"glUniform3uivContextANGLE", P(gl::Uniform3uivContextANGLE)},
-    {"glUniform4f", P(gl::Uniform4f)},
-    {"glUniform4fContextANGLE", P(gl::Uniform4fContextANGLE)},
-    {"glUniform4fv", P(gl::Uniform4fv)},
-    {"glUniform4fvContextANGLE", P(gl::Uniform4fvContextANGLE)},
-    {"glUniform4i", P(gl::Uniform4i)},
-    {"glUniform4iContextANGLE", P(gl::Uniform4iContextANGLE)},
-    {"glUniform4iv", P(gl::Uniform4iv)},
-    {"glUniform4ivContextANGLE", P(gl::Uniform4ivContextANGLE)},
-    {"glUniform4ui", P(gl::Uniform4ui)},
-    {"glUniform4uiContextANGLE", P(gl::Uniform4uiContextANGLE)},
-    {"glUniform4uiv", P(gl::Uniform4uiv)},
-    {"glUniform4uivContextANGLE", P(gl::Uniform4uivContextANGLE)},
-    {"glUniformBlockBinding", P(gl::UniformBlockBinding)},
-    {"glUniformBlockBindingContextANGLE", P(gl::UniformBlockBindingContextANGLE)},
-    {"glUniformMatrix2fv", P(gl::UniformMatrix2fv)},
-    {"glUniformMatrix2fvContextANGLE", P(gl::UniformMatrix2fvContextANGLE)},
-    {"glUniformMatrix2x3fv", P(gl::UniformMatrix2x3fv)},
-    {"glUniformMatrix2x3fvContextANGLE", P(gl::UniformMatrix2x3fvContextANGLE)},
-    {"glUniformMatrix2x4fv", P(gl::UniformMatrix2x4fv)},
-    {"glUniformMatrix2x4fvContextANGLE", P(gl::UniformMatrix2x4fvContextANGLE)},
-    {"glUniformMatrix3fv", P(gl::UniformMatrix3fv)},
-    {"glUniformMatrix3fvContextANGLE", P(gl::UniformMatrix3fvContextANGLE)},
-    {"glUniformMatrix3x2fv", P(gl::UniformMatrix3x2fv)},
-    {"glUniformMatrix3x2fvContextANGLE", P(gl::UniformMatrix3x2fvContextANGLE)},
-    {"glUniformMatrix3x4fv", P(gl::UniformMatrix3x4fv)},
-    {"glUniformMatrix3x4fvContextANGLE", P(gl::UniformMatrix3x4fvContextANGLE)},
-    {"glUniformMatrix4fv", P(gl::UniformMatrix4fv)},
-    {"glUniformMatrix4fvContextANGLE", P(gl::UniformMatrix4fvContextANGLE)},
-    {"glUniformMatrix4x2fv", P(gl::UniformMatrix4x2fv)},
-    {"glUniformMatrix4x2fvContextANGLE", P(gl::UniformMatrix4x2fvContextANGLE)},
-    {"glUniformMatrix4x3fv", P(gl::UniformMatrix4x3fv)},
-    {"glUniformMatrix4x3fvContextANGLE", P(gl::UniformMatrix4x3fvContextANGLE)},
-    {"glUnmapBuffer", P(gl::UnmapBuffer)},
-    {"glUnmapBufferContextANGLE", P(gl::UnmapBufferContextANGLE)},
-    {"glUnmapBufferOES", P(gl::UnmapBufferOES)},
-    {"glUnmapBufferOESContextANGLE", P(gl::UnmapBufferOESContextANGLE)},
-    {"glUseProgram", P(gl::UseProgram)},
-    {"glUseProgramContextANGLE", P(gl::UseProgramContextANGLE)},
-    {"glUseProgramStages", P(gl::UseProgramStages)},
-    {"glUseProgramStagesContextANGLE", P(gl::UseProgramStagesContextANGLE)},
-    {"glValidateProgram", P(gl::ValidateProgram)},
-    {"glValidateProgramContextANGLE", P(gl::ValidateProgramContextANGLE)},
-    {"glValidateProgramPipeline", P(gl::ValidateProgramPipeline)},
-    {"glValidateProgramPipelineContextANGLE", P(gl::ValidateProgramPipelineContextANGLE)},
-    {"glVertexAttrib1f", P(gl::VertexAttrib1f)},
-    {"glVertexAttrib1fContextANGLE", P(gl::VertexAttrib1fContextANGLE)},
-    {"glVertexAttrib1fv", P(gl::VertexAttrib1fv)},
-    {"glVertexAttrib1fvContextANGLE", P(gl::VertexAttrib1fvContextANGLE)},
-    {"glVertexAttrib2f", P(gl::VertexAttrib2f)},
-    {"glVertexAttrib2fContextANGLE", P(gl::VertexAttrib2fContextANGLE)},
+    {"glGetInternalformativRobustANGLE", P(gl::GetInternalformativRobustANGLE)},
+    {"glCompressedTexSubImage2DContextANGLE", P(gl::CompressedTexSubImage2DContextANGLE)},
+    {"glDebugMessageCallbackKHR", P(gl::DebugMessageCallbackKHR)},
+    {"glGetnUniformuivRobustANGLE", P(gl::GetnUniformuivRobustANGLE)},
+    {"glDeleteShader", P(gl::DeleteShader)},
+    {"glDrawElementsInstancedEXT", P(gl::DrawElementsInstancedEXT)},
+    {"glGetProgramResourceivContextANGLE", P(gl::GetProgramResourceivContextANGLE)},
+    {"glFlushMappedBufferRangeContextANGLE", P(gl::FlushMappedBufferRangeContextANGLE)},
+    {"glGetTexParameterIivRobustANGLE", P(gl::GetTexParameterIivRobustANGLE)},
+    {"glGetTranslatedShaderSourceANGLEContextANGLE",
+     P(gl::GetTranslatedShaderSourceANGLEContextANGLE)},
+    {"glSamplerParameterIivRobustANGLE", P(gl::SamplerParameterIivRobustANGLE)},
+    {"glDrawElementsContextANGLE", P(gl::DrawElementsContextANGLE)},
+    {"glTexEnvfContextANGLE", P(gl::TexEnvfContextANGLE)},
+    {"glDeleteFramebuffers", P(gl::DeleteFramebuffers)},
+    {"glQueryCounterEXT", P(gl::QueryCounterEXT)},
+    {"glGetFragDataIndexEXTContextANGLE", P(gl::GetFragDataIndexEXTContextANGLE)},
+    {"glCreateShaderProgramvContextANGLE", P(gl::CreateShaderProgramvContextANGLE)},
+    {"glGetFramebufferAttachmentParameterivRobustANGLE",
+     P(gl::GetFramebufferAttachmentParameterivRobustANGLE)},
+    {"glGenVertexArraysOES", P(gl::GenVertexArraysOES)},
+    {"eglReleaseDeviceANGLE", P(EGL_ReleaseDeviceANGLE)},
+    {"glGenFramebuffers", P(gl::GenFramebuffers)},
     {"glVertexAttrib2fv", P(gl::VertexAttrib2fv)},
-    {"glVertexAttrib2fvContextANGLE", P(gl::VertexAttrib2fvContextANGLE)},
-    {"glVertexAttrib3f", P(gl::VertexAttrib3f)},
-    {"glVertexAttrib3fContextANGLE", P(gl::VertexAttrib3fContextANGLE)},
-    {"glVertexAttrib3fv", P(gl::VertexAttrib3fv)},
-    {"glVertexAttrib3fvContextANGLE", P(gl::VertexAttrib3fvContextANGLE)},
-    {"glVertexAttrib4f", P(gl::VertexAttrib4f)},
-    {"glVertexAttrib4fContextANGLE", P(gl::VertexAttrib4fContextANGLE)},
-    {"glVertexAttrib4fv", P(gl::VertexAttrib4fv)},
-    {"glVertexAttrib4fvContextANGLE", P(gl::VertexAttrib4fvContextANGLE)},
-    {"glVertexAttribBinding", P(gl::VertexAttribBinding)},
-    {"glVertexAttribBindingContextANGLE", P(gl::VertexAttribBindingContextANGLE)},
-    {"glVertexAttribDivisor", P(gl::VertexAttribDivisor)},
-    {"glVertexAttribDivisorANGLE", P(gl::VertexAttribDivisorANGLE)},
-    {"glVertexAttribDivisorANGLEContextANGLE", P(gl::VertexAttribDivisorANGLEContextANGLE)},
-    {"glVertexAttribDivisorContextANGLE", P(gl::VertexAttribDivisorContextANGLE)},
+    {"glLinkProgram", P(gl::LinkProgram)},
+    {"glGetTexLevelParameterfvRobustANGLE", P(gl::GetTexLevelParameterfvRobustANGLE)},
+    {"glGetTexParameterIuivOES", P(gl::GetTexParameterIuivOES)},
+    {"glGetProgramResourceIndexContextANGLE", P(gl::GetProgramResourceIndexContextANGLE)},
+    {"eglTerminate", P(EGL_Terminate)},
+    {"glProgramUniform4uivContextANGLE", P(gl::ProgramUniform4uivContextANGLE)},
+    {"glColor4f", P(gl::Color4f)},
+    {"glGetSamplerParameterfvContextANGLE", P(gl::GetSamplerParameterfvContextANGLE)},
+    {"glPointParameterfv", P(gl::PointParameterfv)},
+    {"glProgramUniform2i", P(gl::ProgramUniform2i)},
+    {"glDrawTexiOES", P(gl::DrawTexiOES)},
+    {"glProgramUniform4ivContextANGLE", P(gl::ProgramUniform4ivContextANGLE)},
+    {"eglDestroySync", P(EGL_DestroySync)},
+    {"glBindTextureContextANGLE", P(gl::BindTextureContextANGLE)},
+    {"glGetUnsignedBytei_vEXT", P(gl::GetUnsignedBytei_vEXT)},
+    {"glCreateProgramContextANGLE", P(gl::CreateProgramContextANGLE)},
+    {"glGetMultisamplefv", P(gl::GetMultisamplefv)},
+    {"glTexStorage2DMultisampleANGLE", P(gl::TexStorage2DMultisampleANGLE)},
+    {"glUniform2uivContextANGLE", P(gl::Uniform2uivContextANGLE)},
+    {"glClearDepthx", P(gl::ClearDepthx)},
+    {"glRenderbufferStorage", P(gl::RenderbufferStorage)},
+    {"glGetIntegervRobustANGLEContextANGLE", P(gl::GetIntegervRobustANGLEContextANGLE)},
+    {"glGenRenderbuffers", P(gl::GenRenderbuffers)},
     {"glVertexAttribDivisorEXT", P(gl::VertexAttribDivisorEXT)},
-    {"glVertexAttribDivisorEXTContextANGLE", P(gl::VertexAttribDivisorEXTContextANGLE)},
-    {"glVertexAttribFormat", P(gl::VertexAttribFormat)},
-    {"glVertexAttribFormatContextANGLE", P(gl::VertexAttribFormatContextANGLE)},
-    {"glVertexAttribI4i", P(gl::VertexAttribI4i)},
-    {"glVertexAttribI4iContextANGLE", P(gl::VertexAttribI4iContextANGLE)},
-    {"glVertexAttribI4iv", P(gl::VertexAttribI4iv)},
-    {"glVertexAttribI4ivContextANGLE", P(gl::VertexAttribI4ivContextANGLE)},
-    {"glVertexAttribI4ui", P(gl::VertexAttribI4ui)},
-    {"glVertexAttribI4uiContextANGLE", P(gl::VertexAttribI4uiContextANGLE)},
-    {"glVertexAttribI4uiv", P(gl::VertexAttribI4uiv)},
-    {"glVertexAttribI4uivContextANGLE", P(gl::VertexAttribI4uivContextANGLE)},
-    {"glVertexAttribIFormat", P(gl::VertexAttribIFormat)},
-    {"glVertexAttribIFormatContextANGLE", P(gl::VertexAttribIFormatContextANGLE)},
-    {"glVertexAttribIPointer", P(gl::VertexAttribIPointer)},
-    {"glVertexAttribIPointerContextANGLE", P(gl::VertexAttribIPointerContextANGLE)},
-    {"glVertexAttribPointer", P(gl::VertexAttribPointer)},
-    {"glVertexAttribPointerContextANGLE", P(gl::VertexAttribPointerContextANGLE)},
-    {"glVertexBindingDivisor", P(gl::VertexBindingDivisor)},
-    {"glVertexBindingDivisorContextANGLE", P(gl::VertexBindingDivisorContextANGLE)},
-    {"glVertexPointer", P(gl::VertexPointer)},
+    {"glDrawRangeElementsContextANGLE", P(gl::DrawRangeElementsContextANGLE)},
+    {"glValidateProgram", P(gl::ValidateProgram)},
+    {"glGetFloatv", P(gl::GetFloatv)},
+    {"glGetIntegeri_vRobustANGLE", P(gl::GetIntegeri_vRobustANGLE)},
+    {"glGetFramebufferAttachmentParameterivContextANGLE",
+     P(gl::GetFramebufferAttachmentParameterivContextANGLE)},
+    {"glGetStringContextANGLE", P(gl::GetStringContextANGLE)},
+    {"glBindSamplerContextANGLE", P(gl::BindSamplerContextANGLE)},
+    {"glClearDepthxContextANGLE", P(gl::ClearDepthxContextANGLE)},
+    {"glIsPathCHROMIUM", P(gl::IsPathCHROMIUM)},
+    {"glBeginQueryContextANGLE", P(gl::BeginQueryContextANGLE)},
+    {"glProgramUniform3uiv", P(gl::ProgramUniform3uiv)},
+    {"glGetBufferParameteriv", P(gl::GetBufferParameteriv)},
+    {"glMatrixLoadfCHROMIUMContextANGLE", P(gl::MatrixLoadfCHROMIUMContextANGLE)},
+    {"glBufferStorageMemEXTContextANGLE", P(gl::BufferStorageMemEXTContextANGLE)},
+    {"glRotatefContextANGLE", P(gl::RotatefContextANGLE)},
     {"glVertexPointerContextANGLE", P(gl::VertexPointerContextANGLE)},
-    {"glViewport", P(gl::Viewport)},
-    {"glViewportContextANGLE", P(gl::ViewportContextANGLE)},
-    {"glWaitSemaphoreEXT", P(gl::WaitSemaphoreEXT)},
-    {"glWaitSemaphoreEXTContextANGLE", P(gl::WaitSemaphoreEXTContextANGLE)},
+    {"glPushDebugGroupKHRContextANGLE", P(gl::PushDebugGroupKHRContextANGLE)},
+    {"glTexStorageMem3DMultisampleEXTContextANGLE",
+     P(gl::TexStorageMem3DMultisampleEXTContextANGLE)},
+    {"glActiveShaderProgramContextANGLE", P(gl::ActiveShaderProgramContextANGLE)},
+    {"glPointSizePointerOES", P(gl::PointSizePointerOES)},
+    {"glEnable", P(gl::Enable)},
+    {"glBlendColor", P(gl::BlendColor)},
+    {"glGetLightfvContextANGLE", P(gl::GetLightfvContextANGLE)},
+    {"glOrthof", P(gl::Orthof)},
+    {"glClipPlanefContextANGLE", P(gl::ClipPlanefContextANGLE)},
+    {"glProgramUniform4i", P(gl::ProgramUniform4i)},
+    {"glDrawTexiOESContextANGLE", P(gl::DrawTexiOESContextANGLE)},
+    {"glIsFramebufferContextANGLE", P(gl::IsFramebufferContextANGLE)},
+    {"glDeleteRenderbuffersContextANGLE", P(gl::DeleteRenderbuffersContextANGLE)},
+    {"glPopMatrix", P(gl::PopMatrix)},
+    {"glMaterialfvContextANGLE", P(gl::MaterialfvContextANGLE)},
+    {"glUniform4i", P(gl::Uniform4i)},
+    {"eglSwapBuffers", P(EGL_SwapBuffers)},
+    {"glTexParameterIivOESContextANGLE", P(gl::TexParameterIivOESContextANGLE)},
+    {"glClearContextANGLE", P(gl::ClearContextANGLE)},
+    {"glPushDebugGroupKHR", P(gl::PushDebugGroupKHR)},
+    {"glGetInteger64i_vRobustANGLE", P(gl::GetInteger64i_vRobustANGLE)},
+    {"glFramebufferTextureEXT", P(gl::FramebufferTextureEXT)},
+    {"glUniform3iv", P(gl::Uniform3iv)},
+    {"glImportMemoryFdEXTContextANGLE", P(gl::ImportMemoryFdEXTContextANGLE)},
+    {"eglProgramCachePopulateANGLE", P(EGL_ProgramCachePopulateANGLE)},
+    {"glBindTexture", P(gl::BindTexture)},
+    {"glProgramUniform1ivContextANGLE", P(gl::ProgramUniform1ivContextANGLE)},
+    {"glCompressedCopyTextureCHROMIUM", P(gl::CompressedCopyTextureCHROMIUM)},
+    {"glGetActiveUniformBlockivRobustANGLEContextANGLE",
+     P(gl::GetActiveUniformBlockivRobustANGLEContextANGLE)},
+    {"glProgramUniform1i", P(gl::ProgramUniform1i)},
+    {"glGenProgramPipelinesContextANGLE", P(gl::GenProgramPipelinesContextANGLE)},
+    {"glDeleteVertexArrays", P(gl::DeleteVertexArrays)},
+    {"glRequestExtensionANGLEContextANGLE", P(gl::RequestExtensionANGLEContextANGLE)},
+    {"glGetSemaphoreParameterui64vEXT", P(gl::GetSemaphoreParameterui64vEXT)},
+    {"glGetActiveUniformContextANGLE", P(gl::GetActiveUniformContextANGLE)},
+    {"glReadnPixelsRobustANGLEContextANGLE", P(gl::ReadnPixelsRobustANGLEContextANGLE)},
+    {"glFogxvContextANGLE", P(gl::FogxvContextANGLE)},
+    {"glDrawElementsInstancedContextANGLE", P(gl::DrawElementsInstancedContextANGLE)},
     {"glWaitSync", P(gl::WaitSync)},
-    {"glWaitSyncContextANGLE", P(gl::WaitSyncContextANGLE)},
-    {"glWeightPointerOES", P(gl::WeightPointerOES)},
-    {"glWeightPointerOESContextANGLE", P(gl::WeightPointerOESContextANGLE)}};
+    {"glVertexAttribBindingContextANGLE", P(gl::VertexAttribBindingContextANGLE)},
+    {"glUniform2fv", P(gl::Uniform2fv)},
+    {"glWaitSemaphoreEXT", P(gl::WaitSemaphoreEXT)},
+    {"glGetTexLevelParameterivANGLE", P(gl::GetTexLevelParameterivANGLE)},
+    {"glTexParameterfvRobustANGLE", P(gl::TexParameterfvRobustANGLE)},
+    {"glNormal3x", P(gl::Normal3x)},
+    {"glGetTexParameterIuivOESContextANGLE", P(gl::GetTexParameterIuivOESContextANGLE)},
+    {"glFrontFaceContextANGLE", P(gl::FrontFaceContextANGLE)},
+    {"glBindBufferBaseContextANGLE", P(gl::BindBufferBaseContextANGLE)},
+    {"glProgramParameteri", P(gl::ProgramParameteri)},
+    {"glMapBufferRangeEXTContextANGLE", P(gl::MapBufferRangeEXTContextANGLE)},
+    {"glProgramPathFragmentInputGenCHROMIUM", P(gl::ProgramPathFragmentInputGenCHROMIUM)},
+    {"glProgramUniform4f", P(gl::ProgramUniform4f)},
+    {"glValidateProgramPipeline", P(gl::ValidateProgramPipeline)},
+    {"glCopySubTexture3DANGLEContextANGLE", P(gl::CopySubTexture3DANGLEContextANGLE)},
+    {"glGetBufferParameteri64v", P(gl::GetBufferParameteri64v)},
+    {"eglMakeCurrent", P(EGL_MakeCurrent)},
+    {"glCompressedTexSubImage3DRobustANGLEContextANGLE",
+     P(gl::CompressedTexSubImage3DRobustANGLEContextANGLE)},
+    {"glProgramUniform1ui", P(gl::ProgramUniform1ui)},
+    {"glSamplerParameterfvRobustANGLE", P(gl::SamplerParameterfvRobustANGLE)},
+    {"glDispatchComputeContextANGLE", P(gl::DispatchComputeContextANGLE)},
+    {"glBindFramebuffer", P(gl::BindFramebuffer)},
+    {"glTexStorageMem2DEXTContextANGLE", P(gl::TexStorageMem2DEXTContextANGLE)},
+    {"glGetTexParameterIuivRobustANGLE", P(gl::GetTexParameterIuivRobustANGLE)},
+    {"glBlendEquationSeparate", P(gl::BlendEquationSeparate)},
+    {"glTexSubImage2DRobustANGLEContextANGLE", P(gl::TexSubImage2DRobustANGLEContextANGLE)},
+    {"glLoadIdentity", P(gl::LoadIdentity)},
+    {"glUnmapBuffer", P(gl::UnmapBuffer)},
+    {"glLightfContextANGLE", P(gl::LightfContextANGLE)},
+    {"glCompressedTexImage3DRobustANGLEContextANGLE",
+     P(gl::CompressedTexImage3DRobustANGLEContextANGLE)},
+    {"glScalef", P(gl::Scalef)},
+    {"glProgramUniform3fContextANGLE", P(gl::ProgramUniform3fContextANGLE)}};
 
-size_t g_numProcs = 1332;
+size_t g_numProcs = 1334;
+
+const ProcEntry *FindProcEntry(const char *procname)
+{
+    uint32_t hash          = HashProcName(procname);
+    uint32_t seed          = kProcBucketSeeds[hash % kNumProcBuckets];
+    const ProcEntry &entry = g_procTable[MixProcHash(hash, seed) % g_numProcs];
+    return strcmp(entry.first, procname) == 0 ? &entry : nullptr;
+}
 }  // namespace egl
@@ -0,0 +1,130 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EGLNoErrorContextTest.cpp:
+//   Tests the entry points that eglGetProcAddress returns while a context created with
+//   EGL_CONTEXT_OPENGL_NO_ERROR_KHR is current. They are the same as for other contexts, and
+//   skip validation only while the no-error context is current.
+//
+
+#include <gtest/gtest.h>
+
+#include "test_utils/ANGLETest.h"
+
+using namespace angle;
+
+namespace
+{
+
+class EGLNoErrorContextTest : public EGLTest, public testing::WithParamInterface<PlatformParameters>
+{
+  public:
+    void SetUp() override
+    {
+        EGLTest::SetUp();
+
+        EGLint dispattrs[] = {EGL_PLATFORM_ANGLE_TYPE_ANGLE, GetParam().getRenderer(), EGL_NONE};
+        mDisplay           = eglGetPlatformDisplayEXT(
+            EGL_PLATFORM_ANGLE_ANGLE, reinterpret_cast<void *>(EGL_DEFAULT_DISPLAY), dispattrs);
+        ASSERT_TRUE(mDisplay != EGL_NO_DISPLAY);
+        ASSERT_EGL_TRUE(eglInitialize(mDisplay, nullptr, nullptr));
+
+        EGLint ncfg;
+        EGLint cfgattrs[] = {EGL_RED_SIZE,
+                             8,
+                             EGL_GREEN_SIZE,
+                             8,
+                             EGL_BLUE_SIZE,
+                             8,
+                             EGL_RENDERABLE_TYPE,
+                             EGL_OPENGL_ES2_BIT,
+                             EGL_SURFACE_TYPE,
+                             EGL_PBUFFER_BIT,
+                             EGL_NONE};
+        ASSERT_EGL_TRUE(eglChooseConfig(mDisplay, cfgattrs, &mConfig, 1, &ncfg));
+        ASSERT_EQ(1, ncfg);
+
+        EGLint ctxattrs[] = {EGL_CONTEXT_CLIENT_VERSION, 2, EGL_NONE};
+        mContext          = eglCreateContext(mDisplay, mConfig, nullptr, ctxattrs);
+        ASSERT_TRUE(mContext != EGL_NO_CONTEXT);
+
+        EGLint noErrorCtxattrs[] = {EGL_CONTEXT_CLIENT_VERSION, 2, EGL_CONTEXT_OPENGL_NO_ERROR_KHR,
+                                    EGL_TRUE, EGL_NONE};
+        mNoErrorContext          = eglCreateContext(mDisplay, mConfig, nullptr, noErrorCtxattrs);
+        ASSERT_TRUE(mNoErrorContext != EGL_NO_CONTEXT);
+
+        EGLint surfattrs[] = {EGL_WIDTH, 16, EGL_HEIGHT, 16, EGL_NONE};
+        mSurface           = eglCreatePbufferSurface(mDisplay, mConfig, surfattrs);
+        ASSERT_TRUE(mSurface != EGL_NO_SURFACE);
+    }
+
+    void TearDown() override
+    {
+        if (mDisplay != EGL_NO_DISPLAY)
+        {
+            eglMakeCurrent(mDisplay, EGL_NO_SURFACE, EGL_NO_SURFACE, EGL_NO_CONTEXT);
+            eglDestroyContext(mDisplay, mContext);
+            eglDestroyContext(mDisplay, mNoErrorContext);
+            eglDestroySurface(mDisplay, mSurface);
+            eglTerminate(mDisplay);
+        }
+        ASSERT_EGL_SUCCESS() << "Error during test TearDown";
+    }
+
+  protected:
+    template <typename ProcT>
+    ProcT getProc(EGLContext context, const char *name)
+    {
+        EXPECT_EGL_TRUE(eglMakeCurrent(mDisplay, mSurface, mSurface, context));
+        return reinterpret_cast<ProcT>(eglGetProcAddress(name));
+    }
+
+    EGLDisplay mDisplay        = EGL_NO_DISPLAY;
+    EGLConfig mConfig          = nullptr;
+    EGLContext mContext        = EGL_NO_CONTEXT;
+    EGLContext mNoErrorContext = EGL_NO_CONTEXT;
+    EGLSurface mSurface        = EGL_NO_SURFACE;
+};
+
+// Tests that eglGetProcAddress returns the same entry points for a KHR_no_error context, and that
+// they work with it.
+TEST_P(EGLNoErrorContextTest, GetProcAddress)
+{
+    auto clear = getProc<PFNGLCLEARPROC>(mContext, "glClear");
+    ASSERT_NE(nullptr, clear);
+
+    auto noErrorClearColor = getProc<PFNGLCLEARCOLORPROC>(mNoErrorContext, "glClearColor");
+    auto noErrorClear      = getProc<PFNGLCLEARPROC>(mNoErrorContext, "glClear");
+    ASSERT_NE(nullptr, noErrorClearColor);
+    ASSERT_NE(nullptr, noErrorClear);
+    EXPECT_EQ(clear, noErrorClear);
+
+    noErrorClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    noErrorClear(GL_COLOR_BUFFER_BIT);
+    EXPECT_PIXEL_COLOR_EQ(0, 0, GLColor::green);
+}
+
+// Tests that the entry points looked up while a KHR_no_error context is current still validate the
+// calls made with another context current.
+TEST_P(EGLNoErrorContextTest, OtherContextValidates)
+{
+    auto noErrorClearColor = getProc<PFNGLCLEARCOLORPROC>(mNoErrorContext, "glClearColor");
+    auto noErrorClear      = getProc<PFNGLCLEARPROC>(mNoErrorContext, "glClear");
+    ASSERT_NE(nullptr, noErrorClearColor);
+    ASSERT_NE(nullptr, noErrorClear);
+
+    ASSERT_EGL_TRUE(eglMakeCurrent(mDisplay, mSurface, mSurface, mContext));
+    noErrorClear(0xFFFFFFFF);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    noErrorClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    noErrorClear(GL_COLOR_BUFFER_BIT);
+    EXPECT_PIXEL_COLOR_EQ(0, 0, GLColor::green);
+    ASSERT_GL_NO_ERROR();
+}
+
+}  // anonymous namespace
+
+ANGLE_INSTANTIATE_TEST(EGLNoErrorContextTest, ES2_D3D9(), ES2_D3D11(), ES2_OPENGL(), ES2_VULKAN());
@@ -0,0 +1,154 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+
+// BatchCommandsTest: Tests of GL_ANGLE_batch_commands
+
+#include "test_utils/ANGLETest.h"
+
+#include <string.h>
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+using namespace angle;
+
+namespace
+{
+GLuint64 FloatWord(GLfloat value)
+{
+    uint32_t bits;
+    memcpy(&bits, &value, sizeof(bits));
+    return bits;
+}
+
+class CommandBatch
+{
+  public:
+    void add(gl::EntryPoint entryPoint, std::initializer_list<GLuint64> params)
+    {
+        mWords.push_back(static_cast<GLuint64>(entryPoint));
+        mWords.insert(mWords.end(), params.begin(), params.end());
+    }
+
+    void addClearColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha)
+    {
+        add(gl::EntryPoint::ClearColor,
+            {FloatWord(red), FloatWord(green), FloatWord(blue), FloatWord(alpha)});
+    }
+
+    void submit() { glBatchCommandsANGLE(static_cast<GLsizei>(mWords.size()), mWords.data()); }
+
+    std::vector<GLuint64> &words() { return mWords; }
+
+  private:
+    std::vector<GLuint64> mWords;
+};
+
+class BatchCommandsTest : public ANGLETest
+{
+  protected:
+    BatchCommandsTest()
+    {
+        setWindowWidth(16);
+        setWindowHeight(16);
+        setConfigRedBits(8);
+        setConfigGreenBits(8);
+        setConfigBlueBits(8);
+        setConfigAlphaBits(8);
+    }
+};
+
+// Test that batched commands are executed in order.
+TEST_P(BatchCommandsTest, ExecutesCommands)
+{
+    ANGLE_SKIP_TEST_IF(!EnsureGLExtensionEnabled("GL_ANGLE_batch_commands"));
+
+    CommandBatch batch;
+    batch.addClearColor(1.0f, 0.0f, 0.0f, 1.0f);
+    batch.add(gl::EntryPoint::Clear, {GL_COLOR_BUFFER_BIT});
+    batch.addClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    batch.add(gl::EntryPoint::Clear, {GL_COLOR_BUFFER_BIT});
+    batch.submit();
+
+    EXPECT_GL_NO_ERROR();
+    EXPECT_PIXEL_COLOR_EQ(0, 0, GLColor::green);
+}
+
+// Test that a batched command that fails validation doesn't stop the batch.
+TEST_P(BatchCommandsTest, InvalidCallContinuesBatch)
+{
+    ANGLE_SKIP_TEST_IF(!EnsureGLExtensionEnabled("GL_ANGLE_batch_commands"));
+
+    CommandBatch batch;
+    batch.add(gl::EntryPoint::Enable, {0});
+    batch.addClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    batch.add(gl::EntryPoint::Clear, {GL_COLOR_BUFFER_BIT});
+    batch.submit();
+
+    EXPECT_GL_ERROR(GL_INVALID_ENUM);
+    EXPECT_PIXEL_COLOR_EQ(0, 0, GLColor::green);
+}
+
+// Test that commands that return a value, and unknown commands, can't be batched and stop the
+// batch.
+TEST_P(BatchCommandsTest, UnbatchableCommandStopsBatch)
+{
+    ANGLE_SKIP_TEST_IF(!EnsureGLExtensionEnabled("GL_ANGLE_batch_commands"));
+
+    CommandBatch batch;
+    batch.addClearColor(1.0f, 0.0f, 0.0f, 1.0f);
+    batch.add(gl::EntryPoint::Clear, {GL_COLOR_BUFFER_BIT});
+    batch.add(gl::EntryPoint::GetError, {});
+    batch.addClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    batch.add(gl::EntryPoint::Clear, {GL_COLOR_BUFFER_BIT});
+    batch.submit();
+
+    EXPECT_GL_ERROR(GL_INVALID_ENUM);
+    EXPECT_PIXEL_COLOR_EQ(0, 0, GLColor::red);
+
+    CommandBatch unknown;
+    unknown.add(gl::EntryPoint::EnumCount, {});
+    unknown.submit();
+    EXPECT_GL_ERROR(GL_INVALID_ENUM);
+}
+
+// Test that a command with missing parameters isn't executed.
+TEST_P(BatchCommandsTest, TruncatedCommand)
+{
+    ANGLE_SKIP_TEST_IF(!EnsureGLExtensionEnabled("GL_ANGLE_batch_commands"));
+
+    CommandBatch batch;
+    batch.addClearColor(1.0f, 0.0f, 0.0f, 1.0f);
+    batch.add(gl::EntryPoint::Clear, {GL_COLOR_BUFFER_BIT});
+    batch.addClearColor(0.0f, 1.0f, 0.0f, 1.0f);
+    batch.words().pop_back();
+    batch.submit();
+
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    glClear(GL_COLOR_BUFFER_BIT);
+    EXPECT_PIXEL_COLOR_EQ(0, 0, GLColor::red);
+}
+
+// Test the errors of glBatchCommandsANGLE itself.
+TEST_P(BatchCommandsTest, NegativeSize)
+{
+    ANGLE_SKIP_TEST_IF(!EnsureGLExtensionEnabled("GL_ANGLE_batch_commands"));
+
+    GLuint64 command = static_cast<GLuint64>(gl::EntryPoint::Finish);
+    glBatchCommandsANGLE(-1, &command);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    glBatchCommandsANGLE(0, nullptr);
+    EXPECT_GL_NO_ERROR();
+}
+
+ANGLE_INSTANTIATE_TEST(BatchCommandsTest,
+                       ES2_D3D9(),
+                       ES2_D3D11(),
+                       ES2_OPENGL(),
+                       ES2_OPENGLES(),
+                       ES2_VULKAN());
+}  // namespace
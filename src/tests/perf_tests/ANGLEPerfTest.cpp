@@ -183,8 +183,17 @@ void ANGLEPerfTest::run()
         return;
     }
 
+    Optional<unsigned int> stepsToRunOverride = gStepsToRunOverride;
+    const ::testing::TestInfo *testInfo = ::testing::UnitTest::GetInstance()->current_test_info();
+    auto testSteps =
+        gStepsToRunPerTest.find(std::string(testInfo->test_case_name()) + "." + testInfo->name());
+    if (testSteps != gStepsToRunPerTest.end())
+    {
+        stepsToRunOverride = testSteps->second;
+    }
+
     // Calibrate to a fixed number of steps during an initial set time.
-    if (!gStepsToRunOverride.valid())
+    if (!stepsToRunOverride.valid())
     {
         doRunLoop(kCalibrationRunTimeSeconds);
 
@@ -201,7 +210,7 @@ void ANGLEPerfTest::run()
     }
     else
     {
-        mStepsToRun = gStepsToRunOverride.value();
+        mStepsToRun = stepsToRunOverride.value();
     }
 
     // Do another warmup run. Seems to consistently improve results.
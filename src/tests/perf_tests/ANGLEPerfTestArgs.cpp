@@ -9,14 +9,17 @@
 
 #include "ANGLEPerfTestArgs.h"
 #include <string.h>
+#include <fstream>
 #include <sstream>
 
 namespace angle
 {
 bool gCalibration = false;
 Optional<unsigned int> gStepsToRunOverride;
-bool gEnableTrace      = false;
-const char *gTraceFile = "ANGLETrace.json";
+std::map<std::string, unsigned int> gStepsToRunPerTest;
+bool gEnableTrace        = false;
+const char *gTraceFile   = "ANGLETrace.json";
+const char *gCaptureFile = nullptr;
 }  // namespace angle
 
 using namespace angle;
@@ -37,7 +40,13 @@ void ANGLEProcessPerfTestArgs(int *argc, char **argv)
         }
         else if (strcmp("--trace-file", argv[argIndex]) == 0 && argIndex < *argc - 1)
         {
-            gTraceFile = argv[argIndex];
+            gTraceFile = argv[argIndex + 1];
+            // Skip an additional argument.
+            argIndex++;
+        }
+        else if (strcmp("--capture-file", argv[argIndex]) == 0 && argIndex < *argc - 1)
+        {
+            gCaptureFile = argv[argIndex + 1];
             // Skip an additional argument.
             argIndex++;
         }
@@ -55,6 +64,20 @@ void ANGLEProcessPerfTestArgs(int *argc, char **argv)
             // Skip an additional argument.
             argIndex++;
         }
+        else if (strcmp("--steps-file", argv[argIndex]) == 0 && argIndex < *argc - 1)
+        {
+            // Each line holds a full test name and its number of steps, e.g.
+            // "DrawCallPerfBenchmark.Run/gl 1234".
+            std::ifstream stepsFile(argv[argIndex + 1]);
+            std::string testName;
+            unsigned int stepsToRun = 0;
+            while (stepsFile >> testName >> stepsToRun)
+            {
+                gStepsToRunPerTest[testName] = stepsToRun;
+            }
+            // Skip an additional argument.
+            argIndex++;
+        }
         else
         {
             argv[argcOutCount++] = argv[argIndex];
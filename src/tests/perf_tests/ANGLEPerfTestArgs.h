@@ -10,14 +10,20 @@
 #ifndef TESTS_PERF_TESTS_ANGLE_PERF_TEST_ARGS_H_
 #define TESTS_PERF_TESTS_ANGLE_PERF_TEST_ARGS_H_
 
+#include <map>
+#include <string>
+
 #include "common/Optional.h"
 
 namespace angle
 {
 extern bool gCalibration;
 extern Optional<unsigned int> gStepsToRunOverride;
+// Steps to run of each test, by full test name, from the file given with --steps-file.
+extern std::map<std::string, unsigned int> gStepsToRunPerTest;
 extern bool gEnableTrace;
 extern const char *gTraceFile;
+extern const char *gCaptureFile;
 
 inline bool OneFrame()
 {
@@ -0,0 +1,136 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// CaptureReplayBenchmark:
+//   Replays the GL calls of a capture file, given with --capture-file, as fast as possible. Capture
+//   files are written by builds with angle_enable_capture. The first frame of the capture is
+//   replayed once at startup since it usually creates the resources. Each step then replays the
+//   next frame, going back to the second frame after the last one.
+//
+
+#include "ANGLEPerfTest.h"
+
+#include <iostream>
+
+#include "ANGLEPerfTestArgs.h"
+#include "test_utils/capture_reader.h"
+#include "test_utils/capture_replay_autogen.h"
+
+using namespace angle;
+
+namespace
+{
+struct CaptureReplayParams final : public RenderTestParams
+{
+    CaptureReplayParams()
+    {
+        majorVersion      = 3;
+        minorVersion      = 0;
+        windowWidth       = 1280;
+        windowHeight      = 720;
+        iterationsPerStep = 1;
+    }
+};
+
+std::ostream &operator<<(std::ostream &os, const CaptureReplayParams &params)
+{
+    os << params.suffix().substr(1);
+    return os;
+}
+
+class CaptureReplayBenchmark : public ANGLERenderTest,
+                               public ::testing::WithParamInterface<CaptureReplayParams>
+{
+  public:
+    CaptureReplayBenchmark();
+
+    void initializeBenchmark() override;
+    void drawBenchmark() override;
+
+  private:
+    void replayFrame();
+
+    CaptureReader mReader;
+    size_t mLoopPosition;
+};
+
+CaptureReplayBenchmark::CaptureReplayBenchmark()
+    : ANGLERenderTest("CaptureReplay", GetParam()), mLoopPosition(0)
+{
+    if (!gCaptureFile)
+    {
+        std::cout << "No capture file given with --capture-file. Skipping test." << std::endl;
+        mSkipTest = true;
+    }
+}
+
+void CaptureReplayBenchmark::initializeBenchmark()
+{
+    ASSERT_TRUE(mReader.load(gCaptureFile)) << "Failed to load capture file " << gCaptureFile;
+    size_t startPosition = mReader.getPosition();
+
+    replayFrame();
+
+    // Single frame captures are replayed whole at each step.
+    mLoopPosition = mReader.done() ? startPosition : mReader.getPosition();
+}
+
+void CaptureReplayBenchmark::drawBenchmark()
+{
+    if (mReader.done())
+    {
+        mReader.setPosition(mLoopPosition);
+    }
+
+    replayFrame();
+}
+
+void CaptureReplayBenchmark::replayFrame()
+{
+    while (!mReader.done())
+    {
+        size_t callPosition       = mReader.getPosition();
+        gl::EntryPoint entryPoint = mReader.readEntryPoint();
+        if (entryPoint == gl::EntryPoint::Invalid && !mReader.failed())
+        {
+            break;
+        }
+        if (mReader.failed() || !ReplayCall(entryPoint, &mReader))
+        {
+            abortTest();
+            FAIL() << "Failed to read the call at offset " << callPosition << " of " << gCaptureFile
+                   << ", the file is truncated or corrupt";
+        }
+    }
+}
+
+CaptureReplayParams D3D11Params()
+{
+    CaptureReplayParams params;
+    params.eglParameters = egl_platform::D3D11();
+    return params;
+}
+
+CaptureReplayParams OpenGLOrGLESParams()
+{
+    CaptureReplayParams params;
+    params.eglParameters = egl_platform::OPENGL_OR_GLES(false);
+    return params;
+}
+
+CaptureReplayParams VulkanParams()
+{
+    CaptureReplayParams params;
+    params.eglParameters = egl_platform::VULKAN();
+    return params;
+}
+}  // anonymous namespace
+
+TEST_P(CaptureReplayBenchmark, Run)
+{
+    run();
+}
+
+ANGLE_INSTANTIATE_TEST(CaptureReplayBenchmark, D3D11Params(), OpenGLOrGLESParams(), VulkanParams());
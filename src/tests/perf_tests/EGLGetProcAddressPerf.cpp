@@ -0,0 +1,55 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EGLGetProcAddressPerfTest:
+//   Performance test for resolving every entry point with eglGetProcAddress, as applications
+//   do at startup.
+//
+
+#include "ANGLEPerfTest.h"
+#include "util/system_utils.h"
+
+namespace
+{
+class EGLGetProcAddressPerfTest : public ANGLEPerfTest
+{
+  public:
+    EGLGetProcAddressPerfTest();
+
+    void step() override;
+
+  private:
+    std::unique_ptr<angle::Library> mEGLLibrary;
+    angle::LoadProc mGetProcAddress;
+};
+
+EGLGetProcAddressPerfTest::EGLGetProcAddressPerfTest()
+    : ANGLEPerfTest("EGLGetProcAddress", "_run", 1), mGetProcAddress(nullptr)
+{
+    mEGLLibrary.reset(angle::OpenSharedLibrary(ANGLE_EGL_LIBRARY_NAME));
+    if (mEGLLibrary)
+    {
+        mGetProcAddress =
+            reinterpret_cast<angle::LoadProc>(mEGLLibrary->getSymbol("eglGetProcAddress"));
+    }
+
+    if (!mGetProcAddress)
+    {
+        abortTest();
+    }
+}
+
+void EGLGetProcAddressPerfTest::step()
+{
+    // Resolves all of the EGL and GLES entry points, including the ones ANGLE doesn't expose.
+    angle::LoadEGL(mGetProcAddress);
+    angle::LoadGLES(mGetProcAddress);
+}
+
+TEST_F(EGLGetProcAddressPerfTest, Run)
+{
+    run();
+}
+}  // anonymous namespace
@@ -17,13 +17,14 @@ using namespace testing;
 
 namespace
 {
-// Only applies to D3D11
+// Only applies to D3D11, except loadGLProcsMS which only applies to OpenGL
 struct Captures final : private angle::NonCopyable
 {
     Timer *timer           = CreateTimer();
     size_t loadDLLsMS      = 0;
     size_t createDeviceMS  = 0;
     size_t initResourcesMS = 0;
+    size_t loadGLProcsMS   = 0;
 };
 
 double CapturePlatform_currentTime(angle::PlatformMethods *platformMethods)
@@ -55,6 +56,10 @@ void CapturePlatform_histogramCustomCounts(angle::PlatformMethods *platformMetho
     {
         captures->initResourcesMS += static_cast<size_t>(sample);
     }
+    else if (strcmp(name, "GPU.ANGLE.FunctionsGLLoadProcsMS") == 0)
+    {
+        captures->loadGLProcsMS += static_cast<size_t>(sample);
+    }
 }
 
 class EGLInitializePerfTest : public ANGLEPerfTest,
@@ -144,6 +149,7 @@ void EGLInitializePerfTest::TearDown()
     printResult("LoadDLLs", normalizedTime(mCaptures.loadDLLsMS), "ms", true);
     printResult("D3D11CreateDevice", normalizedTime(mCaptures.createDeviceMS), "ms", true);
     printResult("InitResources", normalizedTime(mCaptures.initResourcesMS), "ms", true);
+    printResult("LoadGLProcs", normalizedTime(mCaptures.loadGLProcsMS), "ms", true);
 
     ANGLEResetDisplayPlatform(mDisplay);
 }
@@ -153,6 +159,10 @@ TEST_P(EGLInitializePerfTest, Run)
     run();
 }
 
-ANGLE_INSTANTIATE_TEST(EGLInitializePerfTest, angle::ES2_D3D11(), angle::ES2_VULKAN());
+ANGLE_INSTANTIATE_TEST(EGLInitializePerfTest,
+                       angle::ES2_D3D11(),
+                       angle::ES2_OPENGL(),
+                       angle::ES2_OPENGLES(),
+                       angle::ES2_VULKAN());
 
 }  // namespace
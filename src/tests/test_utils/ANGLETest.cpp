@@ -1290,8 +1290,8 @@ void EGLTest::SetUp()
     ANGLETestEnvironment::GetEGLLibrary()->getAs("eglGetProcAddress", &getProcAddress);
     ASSERT_NE(nullptr, getProcAddress);
 
-    angle::LoadEGL(getProcAddress);
-    angle::LoadGLES(getProcAddress);
+    angle::LoadEGLLazy(getProcAddress);
+    angle::LoadGLESLazy(getProcAddress);
 #endif  // defined(ANGLE_USE_UTIL_LOADER)
 }
 
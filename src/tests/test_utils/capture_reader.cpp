@@ -0,0 +1,163 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_reader.cpp:
+//   Implements the reading of GL call capture files.
+//
+
+#include "test_utils/capture_reader.h"
+
+#include <stdio.h>
+#include <algorithm>
+
+#include "common/mathutil.h"
+
+namespace angle
+{
+namespace
+{
+// Output parameters with an unknown size, like the values of glGetIntegerv, get at least this
+// much memory.
+constexpr size_t kMinOutputSize = 64 * 1024;
+
+// Output parameters larger than this are taken as corrupt, instead of being allocated. It fits
+// the largest glReadPixels of the perf tests.
+constexpr size_t kMaxOutputSize = 256 * 1024 * 1024;
+
+constexpr size_t kHeaderSize = 3 * sizeof(uint32_t);
+}  // anonymous namespace
+
+CaptureReader::CaptureReader() : mPosition(0), mFailed(false), mOutputCount(0) {}
+
+CaptureReader::~CaptureReader() = default;
+
+bool CaptureReader::load(const char *path)
+{
+    mData.clear();
+    mPosition = 0;
+    mFailed   = true;
+
+    FILE *file = fopen(path, "rb");
+    if (!file)
+    {
+        return false;
+    }
+
+    fseek(file, 0, SEEK_END);
+    long size = ftell(file);
+    fseek(file, 0, SEEK_SET);
+
+    mData.resize(size > 0 ? static_cast<size_t>(size) : 0);
+    size_t readSize = fread(mData.data(), 1, mData.size(), file);
+    fclose(file);
+
+    if (readSize != mData.size() || mData.size() < kHeaderSize)
+    {
+        return false;
+    }
+
+    mFailed = false;
+    if (readParam<uint32_t>() != kCaptureMagic || readParam<uint32_t>() != kCaptureVersion ||
+        readParam<uint32_t>() != static_cast<uint32_t>(gl::EntryPoint::EnumCount))
+    {
+        mFailed = true;
+        return false;
+    }
+
+    return true;
+}
+
+bool CaptureReader::checkRead(size_t size)
+{
+    if (mFailed || mPosition > mData.size() || size > mData.size() - mPosition)
+    {
+        mFailed = true;
+        return false;
+    }
+    return true;
+}
+
+gl::EntryPoint CaptureReader::readEntryPoint()
+{
+    mOutputCount        = 0;
+    uint16_t entryPoint = readParam<uint16_t>();
+    if (entryPoint >= static_cast<uint16_t>(gl::EntryPoint::EnumCount))
+    {
+        mFailed = true;
+        return gl::EntryPoint::Invalid;
+    }
+    return static_cast<gl::EntryPoint>(entryPoint);
+}
+
+const GLchar *const *CaptureReader::readStrings()
+{
+    // Each string takes at least the uint32 of its size, so a larger count is corrupt.
+    uint32_t count = readParam<uint32_t>();
+    if (!checkRead(static_cast<size_t>(count) * sizeof(uint32_t)))
+    {
+        return nullptr;
+    }
+    mStrings.resize(count);
+    for (uint32_t index = 0; index < count; ++index)
+    {
+        mStrings[index] = readClientMemory<GLchar>();
+    }
+    return mStrings.data();
+}
+
+GLsync CaptureReader::readSync()
+{
+    auto iter = mSyncs.find(readParam<uint64_t>());
+    return iter != mSyncs.end() ? iter->second : nullptr;
+}
+
+GLsync CaptureReader::mapSync(GLsync sync)
+{
+    mSyncs[readParam<uint64_t>()] = sync;
+    return sync;
+}
+
+void *CaptureReader::readPointer(bool isInput)
+{
+    uint32_t size = readParam<uint32_t>();
+    if (size == kCaptureNullPointer)
+    {
+        return nullptr;
+    }
+
+    if (size == kCaptureBufferOffset)
+    {
+        return reinterpret_cast<void *>(static_cast<uintptr_t>(readParam<uint64_t>()));
+    }
+
+    if (isInput)
+    {
+        size_t padding = rx::roundUp(mPosition, kCaptureDataAlignment) - mPosition;
+        if (!checkRead(padding + static_cast<size_t>(size)))
+        {
+            return nullptr;
+        }
+        mPosition += padding;
+        void *data = mData.data() + mPosition;
+        mPosition += size;
+        return data;
+    }
+
+    if (size > kMaxOutputSize)
+    {
+        mFailed = true;
+        return nullptr;
+    }
+
+    if (mOutputCount == mOutputs.size())
+    {
+        mOutputs.emplace_back();
+    }
+
+    std::vector<uint8_t> &output = mOutputs[mOutputCount++];
+    output.resize(std::max<size_t>(output.size(), std::max<size_t>(size, kMinOutputSize)));
+    return output.data();
+}
+}  // namespace angle
@@ -0,0 +1,105 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_reader.h:
+//   Reads the GL call capture files written by angle_enable_capture builds. The file is loaded
+//   into memory once, and the client memory of the calls is passed to GL in place, so replaying
+//   the calls costs little more than making them.
+//
+//   Every read is checked against the size of the file. A read past its end, as from a truncated
+//   or corrupt file, fails the reader: it returns zeros and null pointers from then on, and
+//   ReplayCall doesn't make the call.
+//
+
+#ifndef TESTS_TEST_UTILS_CAPTURE_READER_H_
+#define TESTS_TEST_UTILS_CAPTURE_READER_H_
+
+#include <string.h>
+#include <map>
+#include <type_traits>
+#include <vector>
+
+#include "angle_gl.h"
+#include "common/angleutils.h"
+#include "common/capture_format.h"
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace angle
+{
+class CaptureReader final : angle::NonCopyable
+{
+  public:
+    CaptureReader();
+    ~CaptureReader();
+
+    // Fails if the file can't be read, or was written by a build with different entry points.
+    bool load(const char *path);
+
+    bool done() const { return mFailed || mPosition >= mData.size(); }
+    bool failed() const { return mFailed; }
+    size_t getPosition() const { return mPosition; }
+    void setPosition(size_t position) { mPosition = position; }
+
+    // Returns EntryPoint::Invalid at the end of a frame, and when the reader fails.
+    gl::EntryPoint readEntryPoint();
+
+    template <typename T>
+    T readParam()
+    {
+        T value = T();
+        if (checkRead(sizeof(T)))
+        {
+            memcpy(&value, mData.data() + mPosition, sizeof(T));
+            mPosition += sizeof(T);
+        }
+        return value;
+    }
+
+    template <typename T>
+    const T *readClientMemory()
+    {
+        const T *data = reinterpret_cast<const T *>(readPointer(true));
+
+        // Strings are passed to GL in place, so they must end in the file.
+        if (std::is_same<T, GLchar>::value && data && mData[mPosition - 1] != 0)
+        {
+            mFailed = true;
+            return nullptr;
+        }
+        return data;
+    }
+
+    template <typename T>
+    T *readOutputPointer()
+    {
+        return reinterpret_cast<T *>(readPointer(false));
+    }
+
+    const GLchar *const *readStrings();
+
+    GLsync readSync();
+    GLsync mapSync(GLsync sync);
+
+  private:
+    void *readPointer(bool isInput);
+
+    // Fails the reader when fewer than size bytes are left.
+    bool checkRead(size_t size);
+
+    std::vector<uint8_t> mData;
+    size_t mPosition;
+    bool mFailed;
+
+    // Scratch memory for the output parameters of the current call, and the strings of its string
+    // array parameter.
+    std::vector<std::vector<uint8_t>> mOutputs;
+    size_t mOutputCount;
+    std::vector<const GLchar *> mStrings;
+
+    std::map<uint64_t, GLsync> mSyncs;
+};
+}  // namespace angle
+
+#endif  // TESTS_TEST_UTILS_CAPTURE_READER_H_
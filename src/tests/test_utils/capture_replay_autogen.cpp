@@ -0,0 +1,8132 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay_autogen.cpp:
+//   Replays the GLES calls read from a capture file.
+
+#include "test_utils/capture_replay_autogen.h"
+
+#include "common/debug.h"
+#include "test_utils/capture_reader.h"
+#include "util/gles_loader_autogen.h"
+
+namespace angle
+{
+bool ReplayCall(gl::EntryPoint entryPoint, CaptureReader *reader)
+{
+    switch (entryPoint)
+    {
+        case gl::EntryPoint::ActiveShaderProgram:
+        {
+            GLuint pipeline = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glActiveShaderProgram(pipeline, program);
+            return true;
+        }
+        case gl::EntryPoint::ActiveTexture:
+        {
+            GLenum texture = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glActiveTexture(texture);
+            return true;
+        }
+        case gl::EntryPoint::AlphaFunc:
+        {
+            GLenum func = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat ref = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glAlphaFunc(func, ref);
+            return true;
+        }
+        case gl::EntryPoint::AlphaFuncx:
+        {
+            GLenum func = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed ref = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glAlphaFuncx(func, ref);
+            return true;
+        }
+        case gl::EntryPoint::AttachShader:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint shader  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glAttachShader(program, shader);
+            return true;
+        }
+        case gl::EntryPoint::BeginQuery:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint id     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBeginQuery(target, id);
+            return true;
+        }
+        case gl::EntryPoint::BeginQueryEXT:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint id     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBeginQueryEXT(target, id);
+            return true;
+        }
+        case gl::EntryPoint::BeginTransformFeedback:
+        {
+            GLenum primitiveMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBeginTransformFeedback(primitiveMode);
+            return true;
+        }
+        case gl::EntryPoint::BindAttribLocation:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint index       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindAttribLocation(program, index, name);
+            return true;
+        }
+        case gl::EntryPoint::BindBuffer:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint buffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindBuffer(target, buffer);
+            return true;
+        }
+        case gl::EntryPoint::BindBufferBase:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint buffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindBufferBase(target, index, buffer);
+            return true;
+        }
+        case gl::EntryPoint::BindBufferRange:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint buffer   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLintptr offset = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr size = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindBufferRange(target, index, buffer, offset, size);
+            return true;
+        }
+        case gl::EntryPoint::BindFragDataLocationEXT:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint color       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindFragDataLocationEXT(program, color, name);
+            return true;
+        }
+        case gl::EntryPoint::BindFragDataLocationIndexedEXT:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint colorNumber = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint index       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindFragDataLocationIndexedEXT(program, colorNumber, index, name);
+            return true;
+        }
+        case gl::EntryPoint::BindFramebuffer:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint framebuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindFramebuffer(target, framebuffer);
+            return true;
+        }
+        case gl::EntryPoint::BindFramebufferOES:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint framebuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindFramebufferOES(target, framebuffer);
+            return true;
+        }
+        case gl::EntryPoint::BindImageTexture:
+        {
+            GLuint unit       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint texture    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLboolean layered = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLint layer       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum access     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum format     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindImageTexture(unit, texture, level, layered, layer, access, format);
+            return true;
+        }
+        case gl::EntryPoint::BindProgramPipeline:
+        {
+            GLuint pipeline = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindProgramPipeline(pipeline);
+            return true;
+        }
+        case gl::EntryPoint::BindRenderbuffer:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint renderbuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindRenderbuffer(target, renderbuffer);
+            return true;
+        }
+        case gl::EntryPoint::BindRenderbufferOES:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint renderbuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindRenderbufferOES(target, renderbuffer);
+            return true;
+        }
+        case gl::EntryPoint::BindSampler:
+        {
+            GLuint unit    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindSampler(unit, sampler);
+            return true;
+        }
+        case gl::EntryPoint::BindTexture:
+        {
+            GLenum target  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint texture = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindTexture(target, texture);
+            return true;
+        }
+        case gl::EntryPoint::BindTransformFeedback:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint id     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindTransformFeedback(target, id);
+            return true;
+        }
+        case gl::EntryPoint::BindVertexArray:
+        {
+            GLuint array = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindVertexArray(array);
+            return true;
+        }
+        case gl::EntryPoint::BindVertexArrayOES:
+        {
+            GLuint array = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindVertexArrayOES(array);
+            return true;
+        }
+        case gl::EntryPoint::BindVertexBuffer:
+        {
+            GLuint bindingindex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint buffer       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLintptr offset     = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindVertexBuffer(bindingindex, buffer, offset, stride);
+            return true;
+        }
+        case gl::EntryPoint::BlendColor:
+        {
+            GLfloat red   = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat green = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat blue  = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat alpha = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlendColor(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::BlendEquation:
+        {
+            GLenum mode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlendEquation(mode);
+            return true;
+        }
+        case gl::EntryPoint::BlendEquationSeparate:
+        {
+            GLenum modeRGB   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum modeAlpha = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlendEquationSeparate(modeRGB, modeAlpha);
+            return true;
+        }
+        case gl::EntryPoint::BlendFunc:
+        {
+            GLenum sfactor = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum dfactor = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlendFunc(sfactor, dfactor);
+            return true;
+        }
+        case gl::EntryPoint::BlendFuncSeparate:
+        {
+            GLenum sfactorRGB   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum dfactorRGB   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum sfactorAlpha = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum dfactorAlpha = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlendFuncSeparate(sfactorRGB, dfactorRGB, sfactorAlpha, dfactorAlpha);
+            return true;
+        }
+        case gl::EntryPoint::BlitFramebuffer:
+        {
+            GLint srcX0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint srcY0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint srcX1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint srcY1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstX0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstY0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstX1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstY1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLbitfield mask = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            GLenum filter   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlitFramebuffer(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask, filter);
+            return true;
+        }
+        case gl::EntryPoint::BlitFramebufferANGLE:
+        {
+            GLint srcX0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint srcY0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint srcX1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint srcY1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstX0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstY0     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstX1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint dstY1     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLbitfield mask = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            GLenum filter   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBlitFramebufferANGLE(srcX0, srcY0, srcX1, srcY1, dstX0, dstY0, dstX1, dstY1, mask,
+                                   filter);
+            return true;
+        }
+        case gl::EntryPoint::BufferData:
+        {
+            GLenum target    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizeiptr size  = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            const void *data = reader->readClientMemory<void>();
+            GLenum usage     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBufferData(target, size, data, usage);
+            return true;
+        }
+        case gl::EntryPoint::BufferStorageMemEXT:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizeiptr size = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            GLuint memory   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint64 offset = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBufferStorageMemEXT(target, size, memory, offset);
+            return true;
+        }
+        case gl::EntryPoint::BufferSubData:
+        {
+            GLenum target    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLintptr offset  = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr size  = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            const void *data = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBufferSubData(target, offset, size, data);
+            return true;
+        }
+        case gl::EntryPoint::CheckFramebufferStatus:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCheckFramebufferStatus(target);
+            return true;
+        }
+        case gl::EntryPoint::CheckFramebufferStatusOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCheckFramebufferStatusOES(target);
+            return true;
+        }
+        case gl::EntryPoint::Clear:
+        {
+            GLbitfield mask = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClear(mask);
+            return true;
+        }
+        case gl::EntryPoint::ClearBufferfi:
+        {
+            GLenum buffer    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint drawbuffer = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat depth    = static_cast<GLfloat>(reader->readParam<float>());
+            GLint stencil    = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearBufferfi(buffer, drawbuffer, depth, stencil);
+            return true;
+        }
+        case gl::EntryPoint::ClearBufferfv:
+        {
+            GLenum buffer        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint drawbuffer     = static_cast<GLint>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearBufferfv(buffer, drawbuffer, value);
+            return true;
+        }
+        case gl::EntryPoint::ClearBufferiv:
+        {
+            GLenum buffer      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint drawbuffer   = static_cast<GLint>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearBufferiv(buffer, drawbuffer, value);
+            return true;
+        }
+        case gl::EntryPoint::ClearBufferuiv:
+        {
+            GLenum buffer       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint drawbuffer    = static_cast<GLint>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearBufferuiv(buffer, drawbuffer, value);
+            return true;
+        }
+        case gl::EntryPoint::ClearColor:
+        {
+            GLfloat red   = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat green = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat blue  = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat alpha = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearColor(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::ClearColorx:
+        {
+            GLfixed red   = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed green = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed blue  = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed alpha = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearColorx(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::ClearDepthf:
+        {
+            GLfloat d = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearDepthf(d);
+            return true;
+        }
+        case gl::EntryPoint::ClearDepthx:
+        {
+            GLfixed depth = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearDepthx(depth);
+            return true;
+        }
+        case gl::EntryPoint::ClearStencil:
+        {
+            GLint s = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClearStencil(s);
+            return true;
+        }
+        case gl::EntryPoint::ClientActiveTexture:
+        {
+            GLenum texture = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClientActiveTexture(texture);
+            return true;
+        }
+        case gl::EntryPoint::ClientWaitSync:
+        {
+            GLsync sync      = reader->readSync();
+            GLbitfield flags = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            GLuint64 timeout = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClientWaitSync(sync, flags, timeout);
+            return true;
+        }
+        case gl::EntryPoint::ClipPlanef:
+        {
+            GLenum p           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *eqn = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClipPlanef(p, eqn);
+            return true;
+        }
+        case gl::EntryPoint::ClipPlanex:
+        {
+            GLenum plane            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *equation = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glClipPlanex(plane, equation);
+            return true;
+        }
+        case gl::EntryPoint::Color4f:
+        {
+            GLfloat red   = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat green = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat blue  = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat alpha = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glColor4f(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::Color4ub:
+        {
+            GLubyte red   = static_cast<GLubyte>(reader->readParam<uint8_t>());
+            GLubyte green = static_cast<GLubyte>(reader->readParam<uint8_t>());
+            GLubyte blue  = static_cast<GLubyte>(reader->readParam<uint8_t>());
+            GLubyte alpha = static_cast<GLubyte>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glColor4ub(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::Color4x:
+        {
+            GLfixed red   = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed green = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed blue  = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed alpha = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glColor4x(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::ColorMask:
+        {
+            GLboolean red   = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean green = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean blue  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean alpha = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glColorMask(red, green, blue, alpha);
+            return true;
+        }
+        case gl::EntryPoint::ColorPointer:
+        {
+            GLint size          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glColorPointer(size, type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::CompileShader:
+        {
+            GLuint shader = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompileShader(shader);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexImage2D:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei imageSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *data      = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexImage2D(target, level, internalformat, width, height, border, imageSize,
+                                   data);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexImage3D:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei imageSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *data      = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexImage3D(target, level, internalformat, width, height, depth, border,
+                                   imageSize, data);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexSubImage2D:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei imageSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *data  = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexSubImage2D(target, level, xoffset, yoffset, width, height, format,
+                                      imageSize, data);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexSubImage3D:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint zoffset     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei imageSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *data  = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexSubImage3D(target, level, xoffset, yoffset, zoffset, width, height,
+                                      depth, format, imageSize, data);
+            return true;
+        }
+        case gl::EntryPoint::CopyBufferSubData:
+        {
+            GLenum readTarget    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum writeTarget   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLintptr readOffset  = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLintptr writeOffset = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr size      = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopyBufferSubData(readTarget, writeTarget, readOffset, writeOffset, size);
+            return true;
+        }
+        case gl::EntryPoint::CopyTexImage2D:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint x               = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y               = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border          = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopyTexImage2D(target, level, internalformat, x, y, width, height, border);
+            return true;
+        }
+        case gl::EntryPoint::CopyTexSubImage2D:
+        {
+            GLenum target  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint x        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopyTexSubImage2D(target, level, xoffset, yoffset, x, y, width, height);
+            return true;
+        }
+        case gl::EntryPoint::CopyTexSubImage3D:
+        {
+            GLenum target  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint zoffset  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint x        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopyTexSubImage3D(target, level, xoffset, yoffset, zoffset, x, y, width, height);
+            return true;
+        }
+        case gl::EntryPoint::CreateMemoryObjectsEXT:
+        {
+            GLsizei n             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *memoryObjects = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCreateMemoryObjectsEXT(n, memoryObjects);
+            return true;
+        }
+        case gl::EntryPoint::CreateProgram:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCreateProgram();
+            return true;
+        }
+        case gl::EntryPoint::CreateShader:
+        {
+            GLenum type = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCreateShader(type);
+            return true;
+        }
+        case gl::EntryPoint::CreateShaderProgramv:
+        {
+            GLenum type                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei count                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *const *strings = reader->readStrings();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCreateShaderProgramv(type, count, strings);
+            return true;
+        }
+        case gl::EntryPoint::CullFace:
+        {
+            GLenum mode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCullFace(mode);
+            return true;
+        }
+        case gl::EntryPoint::CurrentPaletteMatrixOES:
+        {
+            GLuint matrixpaletteindex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCurrentPaletteMatrixOES(matrixpaletteindex);
+            return true;
+        }
+        case gl::EntryPoint::DebugMessageCallbackKHR:
+        {
+            GLDEBUGPROCKHR callback = nullptr;
+            const void *userParam   = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDebugMessageCallbackKHR(callback, userParam);
+            return true;
+        }
+        case gl::EntryPoint::DebugMessageControlKHR:
+        {
+            GLenum source     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum severity   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei count     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *ids = reader->readClientMemory<GLuint>();
+            GLboolean enabled = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDebugMessageControlKHR(source, type, severity, count, ids, enabled);
+            return true;
+        }
+        case gl::EntryPoint::DebugMessageInsertKHR:
+        {
+            GLenum source     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint id         = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum severity   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei length    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *buf = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDebugMessageInsertKHR(source, type, id, severity, length, buf);
+            return true;
+        }
+        case gl::EntryPoint::DeleteBuffers:
+        {
+            GLsizei n             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *buffers = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteBuffers(n, buffers);
+            return true;
+        }
+        case gl::EntryPoint::DeleteFencesNV:
+        {
+            GLsizei n            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *fences = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteFencesNV(n, fences);
+            return true;
+        }
+        case gl::EntryPoint::DeleteFramebuffers:
+        {
+            GLsizei n                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *framebuffers = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteFramebuffers(n, framebuffers);
+            return true;
+        }
+        case gl::EntryPoint::DeleteFramebuffersOES:
+        {
+            GLsizei n                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *framebuffers = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteFramebuffersOES(n, framebuffers);
+            return true;
+        }
+        case gl::EntryPoint::DeleteMemoryObjectsEXT:
+        {
+            GLsizei n                   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *memoryObjects = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteMemoryObjectsEXT(n, memoryObjects);
+            return true;
+        }
+        case gl::EntryPoint::DeleteProgram:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteProgram(program);
+            return true;
+        }
+        case gl::EntryPoint::DeleteProgramPipelines:
+        {
+            GLsizei n               = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *pipelines = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteProgramPipelines(n, pipelines);
+            return true;
+        }
+        case gl::EntryPoint::DeleteQueries:
+        {
+            GLsizei n         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *ids = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteQueries(n, ids);
+            return true;
+        }
+        case gl::EntryPoint::DeleteQueriesEXT:
+        {
+            GLsizei n         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *ids = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteQueriesEXT(n, ids);
+            return true;
+        }
+        case gl::EntryPoint::DeleteRenderbuffers:
+        {
+            GLsizei n                   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *renderbuffers = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteRenderbuffers(n, renderbuffers);
+            return true;
+        }
+        case gl::EntryPoint::DeleteRenderbuffersOES:
+        {
+            GLsizei n                   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *renderbuffers = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteRenderbuffersOES(n, renderbuffers);
+            return true;
+        }
+        case gl::EntryPoint::DeleteSamplers:
+        {
+            GLsizei count          = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *samplers = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteSamplers(count, samplers);
+            return true;
+        }
+        case gl::EntryPoint::DeleteSemaphoresEXT:
+        {
+            GLsizei n                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *semaphores = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteSemaphoresEXT(n, semaphores);
+            return true;
+        }
+        case gl::EntryPoint::DeleteShader:
+        {
+            GLuint shader = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteShader(shader);
+            return true;
+        }
+        case gl::EntryPoint::DeleteSync:
+        {
+            GLsync sync = reader->readSync();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteSync(sync);
+            return true;
+        }
+        case gl::EntryPoint::DeleteTextures:
+        {
+            GLsizei n              = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *textures = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteTextures(n, textures);
+            return true;
+        }
+        case gl::EntryPoint::DeleteTransformFeedbacks:
+        {
+            GLsizei n         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *ids = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteTransformFeedbacks(n, ids);
+            return true;
+        }
+        case gl::EntryPoint::DeleteVertexArrays:
+        {
+            GLsizei n            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *arrays = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteVertexArrays(n, arrays);
+            return true;
+        }
+        case gl::EntryPoint::DeleteVertexArraysOES:
+        {
+            GLsizei n            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *arrays = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeleteVertexArraysOES(n, arrays);
+            return true;
+        }
+        case gl::EntryPoint::DepthFunc:
+        {
+            GLenum func = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDepthFunc(func);
+            return true;
+        }
+        case gl::EntryPoint::DepthMask:
+        {
+            GLboolean flag = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDepthMask(flag);
+            return true;
+        }
+        case gl::EntryPoint::DepthRangef:
+        {
+            GLfloat n = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat f = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDepthRangef(n, f);
+            return true;
+        }
+        case gl::EntryPoint::DepthRangex:
+        {
+            GLfixed n = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed f = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDepthRangex(n, f);
+            return true;
+        }
+        case gl::EntryPoint::DetachShader:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint shader  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDetachShader(program, shader);
+            return true;
+        }
+        case gl::EntryPoint::Disable:
+        {
+            GLenum cap = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDisable(cap);
+            return true;
+        }
+        case gl::EntryPoint::DisableClientState:
+        {
+            GLenum array = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDisableClientState(array);
+            return true;
+        }
+        case gl::EntryPoint::DisableVertexAttribArray:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDisableVertexAttribArray(index);
+            return true;
+        }
+        case gl::EntryPoint::DiscardFramebufferEXT:
+        {
+            GLenum target             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei numAttachments    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLenum *attachments = reader->readClientMemory<GLenum>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDiscardFramebufferEXT(target, numAttachments, attachments);
+            return true;
+        }
+        case gl::EntryPoint::DispatchCompute:
+        {
+            GLuint num_groups_x = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint num_groups_y = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint num_groups_z = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+            return true;
+        }
+        case gl::EntryPoint::DispatchComputeIndirect:
+        {
+            GLintptr indirect = static_cast<GLintptr>(reader->readParam<int64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDispatchComputeIndirect(indirect);
+            return true;
+        }
+        case gl::EntryPoint::DrawArrays:
+        {
+            GLenum mode   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint first   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawArrays(mode, first, count);
+            return true;
+        }
+        case gl::EntryPoint::DrawArraysIndirect:
+        {
+            GLenum mode          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indirect = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawArraysIndirect(mode, indirect);
+            return true;
+        }
+        case gl::EntryPoint::DrawArraysInstanced:
+        {
+            GLenum mode           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint first           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei instancecount = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawArraysInstanced(mode, first, count, instancecount);
+            return true;
+        }
+        case gl::EntryPoint::DrawArraysInstancedANGLE:
+        {
+            GLenum mode       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint first       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei primcount = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawArraysInstancedANGLE(mode, first, count, primcount);
+            return true;
+        }
+        case gl::EntryPoint::DrawArraysInstancedEXT:
+        {
+            GLenum mode       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint start       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei primcount = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawArraysInstancedEXT(mode, start, count, primcount);
+            return true;
+        }
+        case gl::EntryPoint::DrawBuffers:
+        {
+            GLsizei n          = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLenum *bufs = reader->readClientMemory<GLenum>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawBuffers(n, bufs);
+            return true;
+        }
+        case gl::EntryPoint::DrawBuffersEXT:
+        {
+            GLsizei n          = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLenum *bufs = reader->readClientMemory<GLenum>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawBuffersEXT(n, bufs);
+            return true;
+        }
+        case gl::EntryPoint::DrawElements:
+        {
+            GLenum mode         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indices = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawElements(mode, count, type, indices);
+            return true;
+        }
+        case gl::EntryPoint::DrawElementsIndirect:
+        {
+            GLenum mode          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indirect = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawElementsIndirect(mode, type, indirect);
+            return true;
+        }
+        case gl::EntryPoint::DrawElementsInstanced:
+        {
+            GLenum mode           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei count         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum type           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indices   = reader->readClientMemory<void>();
+            GLsizei instancecount = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawElementsInstanced(mode, count, type, indices, instancecount);
+            return true;
+        }
+        case gl::EntryPoint::DrawElementsInstancedANGLE:
+        {
+            GLenum mode         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indices = reader->readClientMemory<void>();
+            GLsizei primcount   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawElementsInstancedANGLE(mode, count, type, indices, primcount);
+            return true;
+        }
+        case gl::EntryPoint::DrawElementsInstancedEXT:
+        {
+            GLenum mode         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indices = reader->readClientMemory<void>();
+            GLsizei primcount   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawElementsInstancedEXT(mode, count, type, indices, primcount);
+            return true;
+        }
+        case gl::EntryPoint::DrawRangeElements:
+        {
+            GLenum mode         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint start        = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint end          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *indices = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawRangeElements(mode, start, end, count, type, indices);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexfOES:
+        {
+            GLfloat x      = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y      = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat z      = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat width  = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat height = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexfOES(x, y, z, width, height);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexfvOES:
+        {
+            const GLfloat *coords = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexfvOES(coords);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexiOES:
+        {
+            GLint x      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint z      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint width  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint height = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexiOES(x, y, z, width, height);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexivOES:
+        {
+            const GLint *coords = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexivOES(coords);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexsOES:
+        {
+            GLshort x      = static_cast<GLshort>(reader->readParam<int16_t>());
+            GLshort y      = static_cast<GLshort>(reader->readParam<int16_t>());
+            GLshort z      = static_cast<GLshort>(reader->readParam<int16_t>());
+            GLshort width  = static_cast<GLshort>(reader->readParam<int16_t>());
+            GLshort height = static_cast<GLshort>(reader->readParam<int16_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexsOES(x, y, z, width, height);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexsvOES:
+        {
+            const GLshort *coords = reader->readClientMemory<GLshort>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexsvOES(coords);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexxOES:
+        {
+            GLfixed x      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed y      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed z      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed width  = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed height = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexxOES(x, y, z, width, height);
+            return true;
+        }
+        case gl::EntryPoint::DrawTexxvOES:
+        {
+            const GLfixed *coords = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDrawTexxvOES(coords);
+            return true;
+        }
+        case gl::EntryPoint::EGLImageTargetRenderbufferStorageOES:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLeglImageOES image = reinterpret_cast<GLeglImageOES>(
+                static_cast<uintptr_t>(reader->readParam<uint64_t>()));
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEGLImageTargetRenderbufferStorageOES(target, image);
+            return true;
+        }
+        case gl::EntryPoint::EGLImageTargetTexture2DOES:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLeglImageOES image = reinterpret_cast<GLeglImageOES>(
+                static_cast<uintptr_t>(reader->readParam<uint64_t>()));
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEGLImageTargetTexture2DOES(target, image);
+            return true;
+        }
+        case gl::EntryPoint::Enable:
+        {
+            GLenum cap = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEnable(cap);
+            return true;
+        }
+        case gl::EntryPoint::EnableClientState:
+        {
+            GLenum array = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEnableClientState(array);
+            return true;
+        }
+        case gl::EntryPoint::EnableVertexAttribArray:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEnableVertexAttribArray(index);
+            return true;
+        }
+        case gl::EntryPoint::EndQuery:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEndQuery(target);
+            return true;
+        }
+        case gl::EntryPoint::EndQueryEXT:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEndQueryEXT(target);
+            return true;
+        }
+        case gl::EntryPoint::EndTransformFeedback:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glEndTransformFeedback();
+            return true;
+        }
+        case gl::EntryPoint::FenceSync:
+        {
+            GLenum condition = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLbitfield flags = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            reader->mapSync(glFenceSync(condition, flags));
+            return true;
+        }
+        case gl::EntryPoint::Finish:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFinish();
+            return true;
+        }
+        case gl::EntryPoint::FinishFenceNV:
+        {
+            GLuint fence = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFinishFenceNV(fence);
+            return true;
+        }
+        case gl::EntryPoint::Flush:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFlush();
+            return true;
+        }
+        case gl::EntryPoint::FlushMappedBufferRange:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLintptr offset   = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr length = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFlushMappedBufferRange(target, offset, length);
+            return true;
+        }
+        case gl::EntryPoint::FlushMappedBufferRangeEXT:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLintptr offset   = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr length = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFlushMappedBufferRangeEXT(target, offset, length);
+            return true;
+        }
+        case gl::EntryPoint::Fogf:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFogf(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Fogfv:
+        {
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFogfv(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::Fogx:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFogx(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Fogxv:
+        {
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *param = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFogxv(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferParameteri:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint param   = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferParameteri(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferRenderbuffer:
+        {
+            GLenum target             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum renderbuffertarget = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint renderbuffer       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferRenderbuffer(target, attachment, renderbuffertarget, renderbuffer);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferRenderbufferOES:
+        {
+            GLenum target             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum renderbuffertarget = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint renderbuffer       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferRenderbufferOES(target, attachment, renderbuffertarget, renderbuffer);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferTexture2D:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum textarget  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint texture    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferTexture2D(target, attachment, textarget, texture, level);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferTexture2DOES:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum textarget  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint texture    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferTexture2DOES(target, attachment, textarget, texture, level);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferTextureEXT:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint texture    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferTextureEXT(target, attachment, texture, level);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferTextureLayer:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint texture    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint level       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint layer       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferTextureLayer(target, attachment, texture, level, layer);
+            return true;
+        }
+        case gl::EntryPoint::FramebufferTextureMultiviewOVR:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint texture      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint level         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint baseViewIndex = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei numViews    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFramebufferTextureMultiviewOVR(target, attachment, texture, level, baseViewIndex,
+                                             numViews);
+            return true;
+        }
+        case gl::EntryPoint::FrontFace:
+        {
+            GLenum mode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFrontFace(mode);
+            return true;
+        }
+        case gl::EntryPoint::Frustumf:
+        {
+            GLfloat l = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat r = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat b = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat t = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat n = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat f = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFrustumf(l, r, b, t, n, f);
+            return true;
+        }
+        case gl::EntryPoint::Frustumx:
+        {
+            GLfixed l = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed r = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed b = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed t = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed n = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed f = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glFrustumx(l, r, b, t, n, f);
+            return true;
+        }
+        case gl::EntryPoint::GenBuffers:
+        {
+            GLsizei n       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *buffers = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenBuffers(n, buffers);
+            return true;
+        }
+        case gl::EntryPoint::GenFencesNV:
+        {
+            GLsizei n      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *fences = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenFencesNV(n, fences);
+            return true;
+        }
+        case gl::EntryPoint::GenFramebuffers:
+        {
+            GLsizei n            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *framebuffers = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenFramebuffers(n, framebuffers);
+            return true;
+        }
+        case gl::EntryPoint::GenFramebuffersOES:
+        {
+            GLsizei n            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *framebuffers = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenFramebuffersOES(n, framebuffers);
+            return true;
+        }
+        case gl::EntryPoint::GenProgramPipelines:
+        {
+            GLsizei n         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *pipelines = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenProgramPipelines(n, pipelines);
+            return true;
+        }
+        case gl::EntryPoint::GenQueries:
+        {
+            GLsizei n   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *ids = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenQueries(n, ids);
+            return true;
+        }
+        case gl::EntryPoint::GenQueriesEXT:
+        {
+            GLsizei n   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *ids = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenQueriesEXT(n, ids);
+            return true;
+        }
+        case gl::EntryPoint::GenRenderbuffers:
+        {
+            GLsizei n             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *renderbuffers = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenRenderbuffers(n, renderbuffers);
+            return true;
+        }
+        case gl::EntryPoint::GenRenderbuffersOES:
+        {
+            GLsizei n             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *renderbuffers = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenRenderbuffersOES(n, renderbuffers);
+            return true;
+        }
+        case gl::EntryPoint::GenSamplers:
+        {
+            GLsizei count    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *samplers = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenSamplers(count, samplers);
+            return true;
+        }
+        case gl::EntryPoint::GenSemaphoresEXT:
+        {
+            GLsizei n          = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *semaphores = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenSemaphoresEXT(n, semaphores);
+            return true;
+        }
+        case gl::EntryPoint::GenTextures:
+        {
+            GLsizei n        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *textures = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenTextures(n, textures);
+            return true;
+        }
+        case gl::EntryPoint::GenTransformFeedbacks:
+        {
+            GLsizei n   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *ids = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenTransformFeedbacks(n, ids);
+            return true;
+        }
+        case gl::EntryPoint::GenVertexArrays:
+        {
+            GLsizei n      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *arrays = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenVertexArrays(n, arrays);
+            return true;
+        }
+        case gl::EntryPoint::GenVertexArraysOES:
+        {
+            GLsizei n      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint *arrays = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenVertexArraysOES(n, arrays);
+            return true;
+        }
+        case gl::EntryPoint::GenerateMipmap:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenerateMipmap(target);
+            return true;
+        }
+        case gl::EntryPoint::GenerateMipmapOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenerateMipmapOES(target);
+            return true;
+        }
+        case gl::EntryPoint::GetActiveAttrib:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *size     = reader->readOutputPointer<GLint>();
+            GLenum *type    = reader->readOutputPointer<GLenum>();
+            GLchar *name    = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetActiveAttrib(program, index, bufSize, length, size, type, name);
+            return true;
+        }
+        case gl::EntryPoint::GetActiveUniform:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *size     = reader->readOutputPointer<GLint>();
+            GLenum *type    = reader->readOutputPointer<GLenum>();
+            GLchar *name    = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetActiveUniform(program, index, bufSize, length, size, type, name);
+            return true;
+        }
+        case gl::EntryPoint::GetActiveUniformBlockName:
+        {
+            GLuint program           = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint uniformBlockIndex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize          = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length          = reader->readOutputPointer<GLsizei>();
+            GLchar *uniformBlockName = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetActiveUniformBlockName(program, uniformBlockIndex, bufSize, length,
+                                        uniformBlockName);
+            return true;
+        }
+        case gl::EntryPoint::GetActiveUniformBlockiv:
+        {
+            GLuint program           = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint uniformBlockIndex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params            = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetActiveUniformBlockiv(program, uniformBlockIndex, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetActiveUniformsiv:
+        {
+            GLuint program               = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei uniformCount         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *uniformIndices = reader->readClientMemory<GLuint>();
+            GLenum pname                 = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params                = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetActiveUniformsiv(program, uniformCount, uniformIndices, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetAttachedShaders:
+        {
+            GLuint program   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei maxCount = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *count   = reader->readOutputPointer<GLsizei>();
+            GLuint *shaders  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetAttachedShaders(program, maxCount, count, shaders);
+            return true;
+        }
+        case gl::EntryPoint::GetAttribLocation:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetAttribLocation(program, name);
+            return true;
+        }
+        case gl::EntryPoint::GetBooleani_v:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLboolean *data = reader->readOutputPointer<GLboolean>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBooleani_v(target, index, data);
+            return true;
+        }
+        case gl::EntryPoint::GetBooleanv:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLboolean *data = reader->readOutputPointer<GLboolean>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBooleanv(pname, data);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferParameteri64v:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint64 *params = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferParameteri64v(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferParameteriv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferPointerv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            void **params = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferPointerv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferPointervOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            void **params = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferPointervOES(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetClipPlanef:
+        {
+            GLenum plane      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *equation = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetClipPlanef(plane, equation);
+            return true;
+        }
+        case gl::EntryPoint::GetClipPlanex:
+        {
+            GLenum plane      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *equation = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetClipPlanex(plane, equation);
+            return true;
+        }
+        case gl::EntryPoint::GetDebugMessageLogKHR:
+        {
+            GLuint count       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum *sources    = reader->readOutputPointer<GLenum>();
+            GLenum *types      = reader->readOutputPointer<GLenum>();
+            GLuint *ids        = reader->readOutputPointer<GLuint>();
+            GLenum *severities = reader->readOutputPointer<GLenum>();
+            GLsizei *lengths   = reader->readOutputPointer<GLsizei>();
+            GLchar *messageLog = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetDebugMessageLogKHR(count, bufSize, sources, types, ids, severities, lengths,
+                                    messageLog);
+            return true;
+        }
+        case gl::EntryPoint::GetError:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetError();
+            return true;
+        }
+        case gl::EntryPoint::GetFenceivNV:
+        {
+            GLuint fence  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFenceivNV(fence, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFixedv:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *params = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFixedv(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFloatv:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *data = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFloatv(pname, data);
+            return true;
+        }
+        case gl::EntryPoint::GetFragDataIndexEXT:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFragDataIndexEXT(program, name);
+            return true;
+        }
+        case gl::EntryPoint::GetFragDataLocation:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFragDataLocation(program, name);
+            return true;
+        }
+        case gl::EntryPoint::GetFramebufferAttachmentParameteriv:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params     = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFramebufferAttachmentParameteriv(target, attachment, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFramebufferAttachmentParameterivOES:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params     = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFramebufferAttachmentParameterivOES(target, attachment, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFramebufferParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFramebufferParameteriv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetGraphicsResetStatusEXT:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetGraphicsResetStatusEXT();
+            return true;
+        }
+        case gl::EntryPoint::GetInteger64i_v:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint64 *data = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetInteger64i_v(target, index, data);
+            return true;
+        }
+        case gl::EntryPoint::GetInteger64v:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint64 *data = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetInteger64v(pname, data);
+            return true;
+        }
+        case gl::EntryPoint::GetIntegeri_v:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint *data   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetIntegeri_v(target, index, data);
+            return true;
+        }
+        case gl::EntryPoint::GetIntegerv:
+        {
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *data  = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetIntegerv(pname, data);
+            return true;
+        }
+        case gl::EntryPoint::GetInternalformativ:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint *params         = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetInternalformativ(target, internalformat, pname, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::GetLightfv:
+        {
+            GLenum light    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetLightfv(light, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetLightxv:
+        {
+            GLenum light    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *params = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetLightxv(light, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetMaterialfv:
+        {
+            GLenum face     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetMaterialfv(face, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetMaterialxv:
+        {
+            GLenum face     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *params = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetMaterialxv(face, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetMemoryObjectParameterivEXT:
+        {
+            GLuint memoryObject = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params       = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetMemoryObjectParameterivEXT(memoryObject, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetMultisamplefv:
+        {
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLfloat *val = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetMultisamplefv(pname, index, val);
+            return true;
+        }
+        case gl::EntryPoint::GetObjectLabelKHR:
+        {
+            GLenum identifier = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint name       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length   = reader->readOutputPointer<GLsizei>();
+            GLchar *label     = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetObjectLabelKHR(identifier, name, bufSize, length, label);
+            return true;
+        }
+        case gl::EntryPoint::GetObjectPtrLabelKHR:
+        {
+            const void *ptr = reader->readClientMemory<void>();
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLchar *label   = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetObjectPtrLabelKHR(ptr, bufSize, length, label);
+            return true;
+        }
+        case gl::EntryPoint::GetPointerv:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            void **params = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetPointerv(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetPointervKHR:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            void **params = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetPointervKHR(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramBinary:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length      = reader->readOutputPointer<GLsizei>();
+            GLenum *binaryFormat = reader->readOutputPointer<GLenum>();
+            void *binary         = reader->readOutputPointer<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramBinary(program, bufSize, length, binaryFormat, binary);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramBinaryOES:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length      = reader->readOutputPointer<GLsizei>();
+            GLenum *binaryFormat = reader->readOutputPointer<GLenum>();
+            void *binary         = reader->readOutputPointer<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramBinaryOES(program, bufSize, length, binaryFormat, binary);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramInfoLog:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLchar *infoLog = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramInfoLog(program, bufSize, length, infoLog);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramInterfaceiv:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params           = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramInterfaceiv(program, programInterface, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramPipelineInfoLog:
+        {
+            GLuint pipeline = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLchar *infoLog = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramPipelineInfoLog(pipeline, bufSize, length, infoLog);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramPipelineiv:
+        {
+            GLuint pipeline = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramPipelineiv(pipeline, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramResourceIndex:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLchar *name      = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramResourceIndex(program, programInterface, name);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramResourceLocation:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLchar *name      = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramResourceLocation(program, programInterface, name);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramResourceLocationIndexEXT:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLchar *name      = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramResourceLocationIndexEXT(program, programInterface, name);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramResourceName:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index            = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length         = reader->readOutputPointer<GLsizei>();
+            GLchar *name            = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramResourceName(program, programInterface, index, bufSize, length, name);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramResourceiv:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index            = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei propCount       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLenum *props     = reader->readClientMemory<GLenum>();
+            GLsizei bufSize         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length         = reader->readOutputPointer<GLsizei>();
+            GLint *params           = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramResourceiv(program, programInterface, index, propCount, props, bufSize,
+                                   length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramiv:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params  = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramiv(program, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjecti64vEXT:
+        {
+            GLuint id       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint64 *params = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjecti64vEXT(id, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectivEXT:
+        {
+            GLuint id     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectivEXT(id, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectui64vEXT:
+        {
+            GLuint id        = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint64 *params = reader->readOutputPointer<GLuint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectui64vEXT(id, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectuiv:
+        {
+            GLuint id      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint *params = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectuiv(id, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectuivEXT:
+        {
+            GLuint id      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint *params = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectuivEXT(id, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryiv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryiv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryivEXT:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryivEXT(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetRenderbufferParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetRenderbufferParameteriv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetRenderbufferParameterivOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetRenderbufferParameterivOES(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterIivOES:
+        {
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params  = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterIivOES(sampler, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterIuivOES:
+        {
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint *params = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterIuivOES(sampler, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterfv:
+        {
+            GLuint sampler  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterfv(sampler, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameteriv:
+        {
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params  = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameteriv(sampler, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSemaphoreParameterui64vEXT:
+        {
+            GLuint semaphore = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint64 *params = reader->readOutputPointer<GLuint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSemaphoreParameterui64vEXT(semaphore, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetShaderInfoLog:
+        {
+            GLuint shader   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLchar *infoLog = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetShaderInfoLog(shader, bufSize, length, infoLog);
+            return true;
+        }
+        case gl::EntryPoint::GetShaderPrecisionFormat:
+        {
+            GLenum shadertype    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum precisiontype = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *range         = reader->readOutputPointer<GLint>();
+            GLint *precision     = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetShaderPrecisionFormat(shadertype, precisiontype, range, precision);
+            return true;
+        }
+        case gl::EntryPoint::GetShaderSource:
+        {
+            GLuint shader   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLchar *source  = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetShaderSource(shader, bufSize, length, source);
+            return true;
+        }
+        case gl::EntryPoint::GetShaderiv:
+        {
+            GLuint shader = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetShaderiv(shader, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetString:
+        {
+            GLenum name = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetString(name);
+            return true;
+        }
+        case gl::EntryPoint::GetStringi:
+        {
+            GLenum name  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetStringi(name, index);
+            return true;
+        }
+        case gl::EntryPoint::GetSynciv:
+        {
+            GLsync sync     = reader->readSync();
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *values   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSynciv(sync, pname, bufSize, length, values);
+            return true;
+        }
+        case gl::EntryPoint::GetTexEnvfv:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexEnvfv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexEnviv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexEnviv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexEnvxv:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *params = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexEnvxv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexGenfvOES:
+        {
+            GLenum coord    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexGenfvOES(coord, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexGenivOES:
+        {
+            GLenum coord  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexGenivOES(coord, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexGenxvOES:
+        {
+            GLenum coord    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *params = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexGenxvOES(coord, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexLevelParameterfv:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexLevelParameterfv(target, level, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexLevelParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexLevelParameteriv(target, level, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterIivOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterIivOES(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterIuivOES:
+        {
+            GLenum target  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint *params = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterIuivOES(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterfv:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterfv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameteriv:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameteriv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterxv:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed *params = reader->readOutputPointer<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterxv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTransformFeedbackVarying:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLsizei *size   = reader->readOutputPointer<GLsizei>();
+            GLenum *type    = reader->readOutputPointer<GLenum>();
+            GLchar *name    = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTransformFeedbackVarying(program, index, bufSize, length, size, type, name);
+            return true;
+        }
+        case gl::EntryPoint::GetTranslatedShaderSourceANGLE:
+        {
+            GLuint shader   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufsize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLchar *source  = reader->readOutputPointer<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTranslatedShaderSourceANGLE(shader, bufsize, length, source);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformBlockIndex:
+        {
+            GLuint program                 = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *uniformBlockName = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformBlockIndex(program, uniformBlockName);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformIndices:
+        {
+            GLuint program                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei uniformCount              = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *const *uniformNames = reader->readStrings();
+            GLuint *uniformIndices            = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformIndices(program, uniformCount, uniformNames, uniformIndices);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformLocation:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformLocation(program, name);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformfv:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformfv(program, location, params);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformiv:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint *params  = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformiv(program, location, params);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformuiv:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint *params = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformuiv(program, location, params);
+            return true;
+        }
+        case gl::EntryPoint::GetUnsignedBytevEXT:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLubyte *data = reader->readOutputPointer<GLubyte>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUnsignedBytevEXT(pname, data);
+            return true;
+        }
+        case gl::EntryPoint::GetUnsignedBytei_vEXT:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLubyte *data = reader->readOutputPointer<GLubyte>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUnsignedBytei_vEXT(target, index, data);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribIiv:
+        {
+            GLuint index  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribIiv(index, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribIuiv:
+        {
+            GLuint index   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint *params = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribIuiv(index, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribPointerv:
+        {
+            GLuint index   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            void **pointer = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribPointerv(index, pname, pointer);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribfv:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribfv(index, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribiv:
+        {
+            GLuint index  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribiv(index, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetnUniformfvEXT:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetnUniformfvEXT(program, location, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::GetnUniformivEXT:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetnUniformivEXT(program, location, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::Hint:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum mode   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glHint(target, mode);
+            return true;
+        }
+        case gl::EntryPoint::ImportMemoryFdEXT:
+        {
+            GLuint memory     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint64 size     = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            GLenum handleType = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint fd          = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glImportMemoryFdEXT(memory, size, handleType, fd);
+            return true;
+        }
+        case gl::EntryPoint::ImportSemaphoreFdEXT:
+        {
+            GLuint semaphore  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum handleType = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint fd          = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glImportSemaphoreFdEXT(semaphore, handleType, fd);
+            return true;
+        }
+        case gl::EntryPoint::InsertEventMarkerEXT:
+        {
+            GLsizei length       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *marker = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glInsertEventMarkerEXT(length, marker);
+            return true;
+        }
+        case gl::EntryPoint::InvalidateFramebuffer:
+        {
+            GLenum target             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei numAttachments    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLenum *attachments = reader->readClientMemory<GLenum>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glInvalidateFramebuffer(target, numAttachments, attachments);
+            return true;
+        }
+        case gl::EntryPoint::InvalidateSubFramebuffer:
+        {
+            GLenum target             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei numAttachments    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLenum *attachments = reader->readClientMemory<GLenum>();
+            GLint x                   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y                   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glInvalidateSubFramebuffer(target, numAttachments, attachments, x, y, width, height);
+            return true;
+        }
+        case gl::EntryPoint::IsBuffer:
+        {
+            GLuint buffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsBuffer(buffer);
+            return true;
+        }
+        case gl::EntryPoint::IsEnabled:
+        {
+            GLenum cap = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsEnabled(cap);
+            return true;
+        }
+        case gl::EntryPoint::IsFenceNV:
+        {
+            GLuint fence = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsFenceNV(fence);
+            return true;
+        }
+        case gl::EntryPoint::IsFramebuffer:
+        {
+            GLuint framebuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsFramebuffer(framebuffer);
+            return true;
+        }
+        case gl::EntryPoint::IsFramebufferOES:
+        {
+            GLuint framebuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsFramebufferOES(framebuffer);
+            return true;
+        }
+        case gl::EntryPoint::IsMemoryObjectEXT:
+        {
+            GLuint memoryObject = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsMemoryObjectEXT(memoryObject);
+            return true;
+        }
+        case gl::EntryPoint::IsProgram:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsProgram(program);
+            return true;
+        }
+        case gl::EntryPoint::IsProgramPipeline:
+        {
+            GLuint pipeline = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsProgramPipeline(pipeline);
+            return true;
+        }
+        case gl::EntryPoint::IsQuery:
+        {
+            GLuint id = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsQuery(id);
+            return true;
+        }
+        case gl::EntryPoint::IsQueryEXT:
+        {
+            GLuint id = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsQueryEXT(id);
+            return true;
+        }
+        case gl::EntryPoint::IsRenderbuffer:
+        {
+            GLuint renderbuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsRenderbuffer(renderbuffer);
+            return true;
+        }
+        case gl::EntryPoint::IsRenderbufferOES:
+        {
+            GLuint renderbuffer = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsRenderbufferOES(renderbuffer);
+            return true;
+        }
+        case gl::EntryPoint::IsSemaphoreEXT:
+        {
+            GLuint semaphore = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsSemaphoreEXT(semaphore);
+            return true;
+        }
+        case gl::EntryPoint::IsSampler:
+        {
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsSampler(sampler);
+            return true;
+        }
+        case gl::EntryPoint::IsShader:
+        {
+            GLuint shader = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsShader(shader);
+            return true;
+        }
+        case gl::EntryPoint::IsSync:
+        {
+            GLsync sync = reader->readSync();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsSync(sync);
+            return true;
+        }
+        case gl::EntryPoint::IsTexture:
+        {
+            GLuint texture = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsTexture(texture);
+            return true;
+        }
+        case gl::EntryPoint::IsTransformFeedback:
+        {
+            GLuint id = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsTransformFeedback(id);
+            return true;
+        }
+        case gl::EntryPoint::IsVertexArray:
+        {
+            GLuint array = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsVertexArray(array);
+            return true;
+        }
+        case gl::EntryPoint::IsVertexArrayOES:
+        {
+            GLuint array = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsVertexArrayOES(array);
+            return true;
+        }
+        case gl::EntryPoint::LightModelf:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightModelf(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::LightModelfv:
+        {
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightModelfv(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::LightModelx:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightModelx(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::LightModelxv:
+        {
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *param = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightModelxv(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Lightf:
+        {
+            GLenum light  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightf(light, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Lightfv:
+        {
+            GLenum light          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightfv(light, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::Lightx:
+        {
+            GLenum light  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightx(light, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Lightxv:
+        {
+            GLenum light          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *params = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLightxv(light, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::LineWidth:
+        {
+            GLfloat width = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLineWidth(width);
+            return true;
+        }
+        case gl::EntryPoint::LineWidthx:
+        {
+            GLfixed width = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLineWidthx(width);
+            return true;
+        }
+        case gl::EntryPoint::LinkProgram:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLinkProgram(program);
+            return true;
+        }
+        case gl::EntryPoint::LoadIdentity:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLoadIdentity();
+            return true;
+        }
+        case gl::EntryPoint::LoadMatrixf:
+        {
+            const GLfloat *m = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLoadMatrixf(m);
+            return true;
+        }
+        case gl::EntryPoint::LoadMatrixx:
+        {
+            const GLfixed *m = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLoadMatrixx(m);
+            return true;
+        }
+        case gl::EntryPoint::LoadPaletteFromModelViewMatrixOES:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLoadPaletteFromModelViewMatrixOES();
+            return true;
+        }
+        case gl::EntryPoint::LogicOp:
+        {
+            GLenum opcode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLogicOp(opcode);
+            return true;
+        }
+        case gl::EntryPoint::MapBufferOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum access = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMapBufferOES(target, access);
+            return true;
+        }
+        case gl::EntryPoint::MapBufferRange:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLintptr offset   = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr length = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            GLbitfield access = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMapBufferRange(target, offset, length, access);
+            return true;
+        }
+        case gl::EntryPoint::MapBufferRangeEXT:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLintptr offset   = static_cast<GLintptr>(reader->readParam<int64_t>());
+            GLsizeiptr length = static_cast<GLsizeiptr>(reader->readParam<int64_t>());
+            GLbitfield access = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMapBufferRangeEXT(target, offset, length, access);
+            return true;
+        }
+        case gl::EntryPoint::Materialf:
+        {
+            GLenum face   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMaterialf(face, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Materialfv:
+        {
+            GLenum face           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMaterialfv(face, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::Materialx:
+        {
+            GLenum face   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMaterialx(face, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Materialxv:
+        {
+            GLenum face          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *param = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMaterialxv(face, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::MatrixIndexPointerOES:
+        {
+            GLint size          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMatrixIndexPointerOES(size, type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::MatrixMode:
+        {
+            GLenum mode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMatrixMode(mode);
+            return true;
+        }
+        case gl::EntryPoint::MaxShaderCompilerThreadsKHR:
+        {
+            GLuint count = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMaxShaderCompilerThreadsKHR(count);
+            return true;
+        }
+        case gl::EntryPoint::MemoryBarrier:
+        {
+            GLbitfield barriers = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMemoryBarrier(barriers);
+            return true;
+        }
+        case gl::EntryPoint::MemoryBarrierByRegion:
+        {
+            GLbitfield barriers = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMemoryBarrierByRegion(barriers);
+            return true;
+        }
+        case gl::EntryPoint::MemoryObjectParameterivEXT:
+        {
+            GLuint memoryObject = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMemoryObjectParameterivEXT(memoryObject, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::MultMatrixf:
+        {
+            const GLfloat *m = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultMatrixf(m);
+            return true;
+        }
+        case gl::EntryPoint::MultMatrixx:
+        {
+            const GLfixed *m = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultMatrixx(m);
+            return true;
+        }
+        case gl::EntryPoint::MultiTexCoord4f:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat s     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat t     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat r     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat q     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultiTexCoord4f(target, s, t, r, q);
+            return true;
+        }
+        case gl::EntryPoint::MultiTexCoord4x:
+        {
+            GLenum texture = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed s      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed t      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed r      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed q      = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultiTexCoord4x(texture, s, t, r, q);
+            return true;
+        }
+        case gl::EntryPoint::Normal3f:
+        {
+            GLfloat nx = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat ny = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat nz = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glNormal3f(nx, ny, nz);
+            return true;
+        }
+        case gl::EntryPoint::Normal3x:
+        {
+            GLfixed nx = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed ny = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed nz = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glNormal3x(nx, ny, nz);
+            return true;
+        }
+        case gl::EntryPoint::NormalPointer:
+        {
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glNormalPointer(type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::ObjectLabelKHR:
+        {
+            GLenum identifier   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint name         = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei length      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *label = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glObjectLabelKHR(identifier, name, length, label);
+            return true;
+        }
+        case gl::EntryPoint::ObjectPtrLabelKHR:
+        {
+            const void *ptr     = reader->readClientMemory<void>();
+            GLsizei length      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *label = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glObjectPtrLabelKHR(ptr, length, label);
+            return true;
+        }
+        case gl::EntryPoint::Orthof:
+        {
+            GLfloat l = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat r = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat b = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat t = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat n = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat f = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glOrthof(l, r, b, t, n, f);
+            return true;
+        }
+        case gl::EntryPoint::Orthox:
+        {
+            GLfixed l = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed r = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed b = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed t = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed n = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed f = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glOrthox(l, r, b, t, n, f);
+            return true;
+        }
+        case gl::EntryPoint::PauseTransformFeedback:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPauseTransformFeedback();
+            return true;
+        }
+        case gl::EntryPoint::PixelStorei:
+        {
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint param  = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPixelStorei(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::PointParameterf:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointParameterf(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::PointParameterfv:
+        {
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointParameterfv(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::PointParameterx:
+        {
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointParameterx(pname, param);
+            return true;
+        }
+        case gl::EntryPoint::PointParameterxv:
+        {
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *params = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointParameterxv(pname, params);
+            return true;
+        }
+        case gl::EntryPoint::PointSize:
+        {
+            GLfloat size = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointSize(size);
+            return true;
+        }
+        case gl::EntryPoint::PointSizePointerOES:
+        {
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointSizePointerOES(type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::PointSizex:
+        {
+            GLfixed size = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPointSizex(size);
+            return true;
+        }
+        case gl::EntryPoint::PolygonOffset:
+        {
+            GLfloat factor = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat units  = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPolygonOffset(factor, units);
+            return true;
+        }
+        case gl::EntryPoint::PolygonOffsetx:
+        {
+            GLfixed factor = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed units  = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPolygonOffsetx(factor, units);
+            return true;
+        }
+        case gl::EntryPoint::PopDebugGroupKHR:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPopDebugGroupKHR();
+            return true;
+        }
+        case gl::EntryPoint::PopGroupMarkerEXT:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPopGroupMarkerEXT();
+            return true;
+        }
+        case gl::EntryPoint::PopMatrix:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPopMatrix();
+            return true;
+        }
+        case gl::EntryPoint::ProgramBinary:
+        {
+            GLuint program      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum binaryFormat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *binary  = reader->readClientMemory<void>();
+            GLsizei length      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramBinary(program, binaryFormat, binary, length);
+            return true;
+        }
+        case gl::EntryPoint::ProgramBinaryOES:
+        {
+            GLuint program      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum binaryFormat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *binary  = reader->readClientMemory<void>();
+            GLint length        = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramBinaryOES(program, binaryFormat, binary, length);
+            return true;
+        }
+        case gl::EntryPoint::ProgramParameteri:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint value    = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramParameteri(program, pname, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform1f:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform1f(program, location, v0);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform1fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform1fv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform1i:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform1i(program, location, v0);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform1iv:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform1iv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform1ui:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform1ui(program, location, v0);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform1uiv:
+        {
+            GLuint program      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform1uiv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform2f:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v1     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform2f(program, location, v0, v1);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform2fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform2fv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform2i:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v1       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform2i(program, location, v0, v1);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform2iv:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform2iv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform2ui:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v1      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform2ui(program, location, v0, v1);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform2uiv:
+        {
+            GLuint program      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform2uiv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform3f:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v1     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v2     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform3f(program, location, v0, v1, v2);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform3fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform3fv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform3i:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v1       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v2       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform3i(program, location, v0, v1, v2);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform3iv:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform3iv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform3ui:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v1      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v2      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform3ui(program, location, v0, v1, v2);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform3uiv:
+        {
+            GLuint program      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform3uiv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform4f:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v1     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v2     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v3     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform4f(program, location, v0, v1, v2, v3);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform4fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform4fv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform4i:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v1       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v2       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v3       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform4i(program, location, v0, v1, v2, v3);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform4iv:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform4iv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform4ui:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v1      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v2      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v3      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform4ui(program, location, v0, v1, v2, v3);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniform4uiv:
+        {
+            GLuint program      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniform4uiv(program, location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix2fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix2fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix2x3fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix2x3fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix2x4fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix2x4fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix3fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix3fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix3x2fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix3x2fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix3x4fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix3x4fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix4fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix4fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix4x2fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix4x2fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::ProgramUniformMatrix4x3fv:
+        {
+            GLuint program       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramUniformMatrix4x3fv(program, location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::PushDebugGroupKHR:
+        {
+            GLenum source         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint id             = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei length        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *message = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPushDebugGroupKHR(source, id, length, message);
+            return true;
+        }
+        case gl::EntryPoint::PushGroupMarkerEXT:
+        {
+            GLsizei length       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *marker = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPushGroupMarkerEXT(length, marker);
+            return true;
+        }
+        case gl::EntryPoint::PushMatrix:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPushMatrix();
+            return true;
+        }
+        case gl::EntryPoint::QueryCounterEXT:
+        {
+            GLuint id     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glQueryCounterEXT(id, target);
+            return true;
+        }
+        case gl::EntryPoint::QueryMatrixxOES:
+        {
+            GLfixed *mantissa = reader->readOutputPointer<GLfixed>();
+            GLint *exponent   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glQueryMatrixxOES(mantissa, exponent);
+            return true;
+        }
+        case gl::EntryPoint::ReadBuffer:
+        {
+            GLenum src = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glReadBuffer(src);
+            return true;
+        }
+        case gl::EntryPoint::ReadPixels:
+        {
+            GLint x        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            void *pixels   = reader->readOutputPointer<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glReadPixels(x, y, width, height, format, type, pixels);
+            return true;
+        }
+        case gl::EntryPoint::ReadnPixelsEXT:
+        {
+            GLint x         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            void *data      = reader->readOutputPointer<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glReadnPixelsEXT(x, y, width, height, format, type, bufSize, data);
+            return true;
+        }
+        case gl::EntryPoint::ReleaseShaderCompiler:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glReleaseShaderCompiler();
+            return true;
+        }
+        case gl::EntryPoint::RenderbufferStorage:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRenderbufferStorage(target, internalformat, width, height);
+            return true;
+        }
+        case gl::EntryPoint::RenderbufferStorageMultisample:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRenderbufferStorageMultisample(target, samples, internalformat, width, height);
+            return true;
+        }
+        case gl::EntryPoint::RenderbufferStorageMultisampleANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRenderbufferStorageMultisampleANGLE(target, samples, internalformat, width, height);
+            return true;
+        }
+        case gl::EntryPoint::RenderbufferStorageOES:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRenderbufferStorageOES(target, internalformat, width, height);
+            return true;
+        }
+        case gl::EntryPoint::ResumeTransformFeedback:
+        {
+            if (reader->failed())
+            {
+                return false;
+            }
+            glResumeTransformFeedback();
+            return true;
+        }
+        case gl::EntryPoint::Rotatef:
+        {
+            GLfloat angle = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat x     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat z     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRotatef(angle, x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::Rotatex:
+        {
+            GLfixed angle = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed x     = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed y     = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed z     = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRotatex(angle, x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::SampleCoverage:
+        {
+            GLfloat value    = static_cast<GLfloat>(reader->readParam<float>());
+            GLboolean invert = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSampleCoverage(value, invert);
+            return true;
+        }
+        case gl::EntryPoint::SampleCoveragex:
+        {
+            GLclampx value   = static_cast<GLclampx>(reader->readParam<int32_t>());
+            GLboolean invert = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSampleCoveragex(value, invert);
+            return true;
+        }
+        case gl::EntryPoint::SampleMaski:
+        {
+            GLuint maskNumber = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLbitfield mask   = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSampleMaski(maskNumber, mask);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterIivOES:
+        {
+            GLuint sampler     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *param = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterIivOES(sampler, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterIuivOES:
+        {
+            GLuint sampler      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLuint *param = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterIuivOES(sampler, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterf:
+        {
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param  = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterf(sampler, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterfv:
+        {
+            GLuint sampler       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *param = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterfv(sampler, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameteri:
+        {
+            GLuint sampler = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint param    = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameteri(sampler, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameteriv:
+        {
+            GLuint sampler     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *param = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameteriv(sampler, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::Scalef:
+        {
+            GLfloat x = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat z = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glScalef(x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::Scalex:
+        {
+            GLfixed x = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed y = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed z = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glScalex(x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::Scissor:
+        {
+            GLint x        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glScissor(x, y, width, height);
+            return true;
+        }
+        case gl::EntryPoint::SemaphoreParameterui64vEXT:
+        {
+            GLuint semaphore       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLuint64 *params = reader->readClientMemory<GLuint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSemaphoreParameterui64vEXT(semaphore, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::SetFenceNV:
+        {
+            GLuint fence     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum condition = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSetFenceNV(fence, condition);
+            return true;
+        }
+        case gl::EntryPoint::ShadeModel:
+        {
+            GLenum mode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glShadeModel(mode);
+            return true;
+        }
+        case gl::EntryPoint::ShaderBinary:
+        {
+            GLsizei count         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *shaders = reader->readClientMemory<GLuint>();
+            GLenum binaryformat   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *binary    = reader->readClientMemory<void>();
+            GLsizei length        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glShaderBinary(count, shaders, binaryformat, binary, length);
+            return true;
+        }
+        case gl::EntryPoint::ShaderSource:
+        {
+            GLuint shader               = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei count               = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *const *string = reader->readStrings();
+            const GLint *length         = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glShaderSource(shader, count, string, length);
+            return true;
+        }
+        case gl::EntryPoint::SignalSemaphoreEXT:
+        {
+            GLuint semaphore          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint numBufferBarriers  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLuint *buffers     = reader->readClientMemory<GLuint>();
+            GLuint numTextureBarriers = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLuint *textures    = reader->readClientMemory<GLuint>();
+            const GLenum *dstLayouts  = reader->readClientMemory<GLenum>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSignalSemaphoreEXT(semaphore, numBufferBarriers, buffers, numTextureBarriers,
+                                 textures, dstLayouts);
+            return true;
+        }
+        case gl::EntryPoint::StencilFunc:
+        {
+            GLenum func = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint ref   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilFunc(func, ref, mask);
+            return true;
+        }
+        case gl::EntryPoint::StencilFuncSeparate:
+        {
+            GLenum face = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum func = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint ref   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilFuncSeparate(face, func, ref, mask);
+            return true;
+        }
+        case gl::EntryPoint::StencilMask:
+        {
+            GLuint mask = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilMask(mask);
+            return true;
+        }
+        case gl::EntryPoint::StencilMaskSeparate:
+        {
+            GLenum face = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint mask = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilMaskSeparate(face, mask);
+            return true;
+        }
+        case gl::EntryPoint::StencilOp:
+        {
+            GLenum fail  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum zfail = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum zpass = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilOp(fail, zfail, zpass);
+            return true;
+        }
+        case gl::EntryPoint::StencilOpSeparate:
+        {
+            GLenum face   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum sfail  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum dpfail = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum dppass = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilOpSeparate(face, sfail, dpfail, dppass);
+            return true;
+        }
+        case gl::EntryPoint::TestFenceNV:
+        {
+            GLuint fence = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTestFenceNV(fence);
+            return true;
+        }
+        case gl::EntryPoint::TexCoordPointer:
+        {
+            GLint size          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexCoordPointer(size, type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::TexEnvf:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexEnvf(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexEnvfv:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexEnvfv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexEnvi:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint param   = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexEnvi(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexEnviv:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexEnviv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexEnvx:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexEnvx(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexEnvxv:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *params = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexEnvxv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexGenfOES:
+        {
+            GLenum coord  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexGenfOES(coord, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexGenfvOES:
+        {
+            GLenum coord          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexGenfvOES(coord, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexGeniOES:
+        {
+            GLenum coord = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint param  = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexGeniOES(coord, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexGenivOES:
+        {
+            GLenum coord        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexGenivOES(coord, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexGenxOES:
+        {
+            GLenum coord  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexGenxOES(coord, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexGenxvOES:
+        {
+            GLenum coord          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *params = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexGenxvOES(coord, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexImage2D:
+        {
+            GLenum target        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint internalformat = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum format        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *pixels   = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexImage2D(target, level, internalformat, width, height, border, format, type,
+                         pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexImage3D:
+        {
+            GLenum target        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint internalformat = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum format        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *pixels   = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexImage3D(target, level, internalformat, width, height, depth, border, format, type,
+                         pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterIivOES:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterIivOES(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterIuivOES:
+        {
+            GLenum target        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLuint *params = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterIuivOES(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterf:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat param = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterf(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterfv:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterfv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameteri:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint param   = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameteri(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexParameteriv:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameteriv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterx:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfixed param = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterx(target, pname, param);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterxv:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfixed *params = reader->readClientMemory<GLfixed>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterxv(target, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage1DEXT:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage1DEXT(target, levels, internalformat, width);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage2D:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage2D(target, levels, internalformat, width, height);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage2DEXT:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage2DEXT(target, levels, internalformat, width, height);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage2DMultisample:
+        {
+            GLenum target                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height                 = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean fixedsamplelocations = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage2DMultisample(target, samples, internalformat, width, height,
+                                      fixedsamplelocations);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage3D:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage3D(target, levels, internalformat, width, height, depth);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage3DEXT:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage3DEXT(target, levels, internalformat, width, height, depth);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage3DMultisampleOES:
+        {
+            GLenum target                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height                 = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean fixedsamplelocations = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage3DMultisampleOES(target, samples, internalformat, width, height, depth,
+                                         fixedsamplelocations);
+            return true;
+        }
+        case gl::EntryPoint::TexStorageMem2DEXT:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalFormat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint memory         = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint64 offset       = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorageMem2DEXT(target, levels, internalFormat, width, height, memory, offset);
+            return true;
+        }
+        case gl::EntryPoint::TexStorageMem2DMultisampleEXT:
+        {
+            GLenum target                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalFormat          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height                 = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean fixedSampleLocations = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLuint memory                  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint64 offset                = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorageMem2DMultisampleEXT(target, samples, internalFormat, width, height,
+                                            fixedSampleLocations, memory, offset);
+            return true;
+        }
+        case gl::EntryPoint::TexStorageMem3DEXT:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei levels        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalFormat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLuint memory         = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint64 offset       = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorageMem3DEXT(target, levels, internalFormat, width, height, depth, memory,
+                                 offset);
+            return true;
+        }
+        case gl::EntryPoint::TexStorageMem3DMultisampleEXT:
+        {
+            GLenum target                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalFormat          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height                 = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean fixedSampleLocations = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLuint memory                  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint64 offset                = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorageMem3DMultisampleEXT(target, samples, internalFormat, width, height, depth,
+                                            fixedSampleLocations, memory, offset);
+            return true;
+        }
+        case gl::EntryPoint::TexSubImage2D:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *pixels = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexSubImage2D(target, level, xoffset, yoffset, width, height, format, type, pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexSubImage3D:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint zoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *pixels = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexSubImage3D(target, level, xoffset, yoffset, zoffset, width, height, depth, format,
+                            type, pixels);
+            return true;
+        }
+        case gl::EntryPoint::TransformFeedbackVaryings:
+        {
+            GLuint program                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei count                 = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLchar *const *varyings = reader->readStrings();
+            GLenum bufferMode             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTransformFeedbackVaryings(program, count, varyings, bufferMode);
+            return true;
+        }
+        case gl::EntryPoint::Translatef:
+        {
+            GLfloat x = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat z = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTranslatef(x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::Translatex:
+        {
+            GLfixed x = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed y = static_cast<GLfixed>(reader->readParam<int32_t>());
+            GLfixed z = static_cast<GLfixed>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTranslatex(x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::Uniform1f:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform1f(location, v0);
+            return true;
+        }
+        case gl::EntryPoint::Uniform1fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform1fv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform1i:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform1i(location, v0);
+            return true;
+        }
+        case gl::EntryPoint::Uniform1iv:
+        {
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform1iv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform1ui:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform1ui(location, v0);
+            return true;
+        }
+        case gl::EntryPoint::Uniform1uiv:
+        {
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform1uiv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform2f:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v1     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform2f(location, v0, v1);
+            return true;
+        }
+        case gl::EntryPoint::Uniform2fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform2fv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform2i:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v1       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform2i(location, v0, v1);
+            return true;
+        }
+        case gl::EntryPoint::Uniform2iv:
+        {
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform2iv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform2ui:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v1      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform2ui(location, v0, v1);
+            return true;
+        }
+        case gl::EntryPoint::Uniform2uiv:
+        {
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform2uiv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform3f:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v1     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v2     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform3f(location, v0, v1, v2);
+            return true;
+        }
+        case gl::EntryPoint::Uniform3fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform3fv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform3i:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v1       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v2       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform3i(location, v0, v1, v2);
+            return true;
+        }
+        case gl::EntryPoint::Uniform3iv:
+        {
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform3iv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform3ui:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v1      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v2      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform3ui(location, v0, v1, v2);
+            return true;
+        }
+        case gl::EntryPoint::Uniform3uiv:
+        {
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform3uiv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform4f:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLfloat v0     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v1     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v2     = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat v3     = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform4f(location, v0, v1, v2, v3);
+            return true;
+        }
+        case gl::EntryPoint::Uniform4fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform4fv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform4i:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v0       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v1       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v2       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint v3       = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform4i(location, v0, v1, v2, v3);
+            return true;
+        }
+        case gl::EntryPoint::Uniform4iv:
+        {
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *value = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform4iv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::Uniform4ui:
+        {
+            GLint location = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint v0      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v1      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v2      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint v3      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform4ui(location, v0, v1, v2, v3);
+            return true;
+        }
+        case gl::EntryPoint::Uniform4uiv:
+        {
+            GLint location      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *value = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniform4uiv(location, count, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformBlockBinding:
+        {
+            GLuint program             = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint uniformBlockIndex   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint uniformBlockBinding = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformBlockBinding(program, uniformBlockIndex, uniformBlockBinding);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix2fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix2fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix2x3fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix2x3fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix2x4fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix2x4fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix3fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix3fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix3x2fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix3x2fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix3x4fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix3x4fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix4fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix4fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix4x2fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix4x2fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UniformMatrix4x3fv:
+        {
+            GLint location       = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei count        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean transpose  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            const GLfloat *value = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUniformMatrix4x3fv(location, count, transpose, value);
+            return true;
+        }
+        case gl::EntryPoint::UnmapBuffer:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUnmapBuffer(target);
+            return true;
+        }
+        case gl::EntryPoint::UnmapBufferOES:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUnmapBufferOES(target);
+            return true;
+        }
+        case gl::EntryPoint::UseProgram:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUseProgram(program);
+            return true;
+        }
+        case gl::EntryPoint::UseProgramStages:
+        {
+            GLuint pipeline   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLbitfield stages = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            GLuint program    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glUseProgramStages(pipeline, stages, program);
+            return true;
+        }
+        case gl::EntryPoint::ValidateProgram:
+        {
+            GLuint program = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glValidateProgram(program);
+            return true;
+        }
+        case gl::EntryPoint::ValidateProgramPipeline:
+        {
+            GLuint pipeline = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glValidateProgramPipeline(pipeline);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib1f:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLfloat x    = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib1f(index, x);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib1fv:
+        {
+            GLuint index     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLfloat *v = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib1fv(index, v);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib2f:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLfloat x    = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y    = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib2f(index, x, y);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib2fv:
+        {
+            GLuint index     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLfloat *v = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib2fv(index, v);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib3f:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLfloat x    = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y    = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat z    = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib3f(index, x, y, z);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib3fv:
+        {
+            GLuint index     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLfloat *v = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib3fv(index, v);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib4f:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLfloat x    = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat y    = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat z    = static_cast<GLfloat>(reader->readParam<float>());
+            GLfloat w    = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib4f(index, x, y, z, w);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttrib4fv:
+        {
+            GLuint index     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLfloat *v = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttrib4fv(index, v);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribBinding:
+        {
+            GLuint attribindex  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint bindingindex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribBinding(attribindex, bindingindex);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribDivisor:
+        {
+            GLuint index   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint divisor = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribDivisor(index, divisor);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribDivisorANGLE:
+        {
+            GLuint index   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint divisor = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribDivisorANGLE(index, divisor);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribDivisorEXT:
+        {
+            GLuint index   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint divisor = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribDivisorEXT(index, divisor);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribFormat:
+        {
+            GLuint attribindex    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint size            = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLboolean normalized  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLuint relativeoffset = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribFormat(attribindex, size, type, normalized, relativeoffset);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribI4i:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint x      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint z      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint w      = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribI4i(index, x, y, z, w);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribI4iv:
+        {
+            GLuint index   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLint *v = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribI4iv(index, v);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribI4ui:
+        {
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint x     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint y     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint z     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint w     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribI4ui(index, x, y, z, w);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribI4uiv:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLuint *v = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribI4uiv(index, v);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribIFormat:
+        {
+            GLuint attribindex    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint size            = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint relativeoffset = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribIFormat(attribindex, size, type, relativeoffset);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribIPointer:
+        {
+            GLuint index        = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint size          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribIPointer(index, size, type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::VertexAttribPointer:
+        {
+            GLuint index         = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint size           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLboolean normalized = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLsizei stride       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer  = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexAttribPointer(index, size, type, normalized, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::VertexBindingDivisor:
+        {
+            GLuint bindingindex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint divisor      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexBindingDivisor(bindingindex, divisor);
+            return true;
+        }
+        case gl::EntryPoint::VertexPointer:
+        {
+            GLint size          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glVertexPointer(size, type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::Viewport:
+        {
+            GLint x        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glViewport(x, y, width, height);
+            return true;
+        }
+        case gl::EntryPoint::WaitSemaphoreEXT:
+        {
+            GLuint semaphore          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint numBufferBarriers  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLuint *buffers     = reader->readClientMemory<GLuint>();
+            GLuint numTextureBarriers = static_cast<GLuint>(reader->readParam<uint32_t>());
+            const GLuint *textures    = reader->readClientMemory<GLuint>();
+            const GLenum *srcLayouts  = reader->readClientMemory<GLenum>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glWaitSemaphoreEXT(semaphore, numBufferBarriers, buffers, numTextureBarriers, textures,
+                               srcLayouts);
+            return true;
+        }
+        case gl::EntryPoint::WaitSync:
+        {
+            GLsync sync      = reader->readSync();
+            GLbitfield flags = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            GLuint64 timeout = static_cast<GLuint64>(reader->readParam<uint64_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glWaitSync(sync, flags, timeout);
+            return true;
+        }
+        case gl::EntryPoint::WeightPointerOES:
+        {
+            GLint size          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum type         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei stride      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pointer = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glWeightPointerOES(size, type, stride, pointer);
+            return true;
+        }
+        case gl::EntryPoint::BindUniformLocationCHROMIUM:
+        {
+            GLuint program     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindUniformLocationCHROMIUM(program, location, name);
+            return true;
+        }
+        case gl::EntryPoint::CoverageModulationCHROMIUM:
+        {
+            GLenum components = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCoverageModulationCHROMIUM(components);
+            return true;
+        }
+        case gl::EntryPoint::MatrixLoadfCHROMIUM:
+        {
+            GLenum matrixMode     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *matrix = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMatrixLoadfCHROMIUM(matrixMode, matrix);
+            return true;
+        }
+        case gl::EntryPoint::MatrixLoadIdentityCHROMIUM:
+        {
+            GLenum matrixMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMatrixLoadIdentityCHROMIUM(matrixMode);
+            return true;
+        }
+        case gl::EntryPoint::GenPathsCHROMIUM:
+        {
+            GLsizei range = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGenPathsCHROMIUM(range);
+            return true;
+        }
+        case gl::EntryPoint::DeletePathsCHROMIUM:
+        {
+            GLuint first  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei range = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glDeletePathsCHROMIUM(first, range);
+            return true;
+        }
+        case gl::EntryPoint::IsPathCHROMIUM:
+        {
+            GLuint path = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glIsPathCHROMIUM(path);
+            return true;
+        }
+        case gl::EntryPoint::PathCommandsCHROMIUM:
+        {
+            GLuint path             = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei numCommands     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLubyte *commands = reader->readClientMemory<GLubyte>();
+            GLsizei numCoords       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum coordType        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *coords      = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPathCommandsCHROMIUM(path, numCommands, commands, numCoords, coordType, coords);
+            return true;
+        }
+        case gl::EntryPoint::PathParameterfCHROMIUM:
+        {
+            GLuint path   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat value = static_cast<GLfloat>(reader->readParam<float>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPathParameterfCHROMIUM(path, pname, value);
+            return true;
+        }
+        case gl::EntryPoint::PathParameteriCHROMIUM:
+        {
+            GLuint path  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint value  = static_cast<GLint>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPathParameteriCHROMIUM(path, pname, value);
+            return true;
+        }
+        case gl::EntryPoint::GetPathParameterfvCHROMIUM:
+        {
+            GLuint path    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *value = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetPathParameterfvCHROMIUM(path, pname, value);
+            return true;
+        }
+        case gl::EntryPoint::GetPathParameterivCHROMIUM:
+        {
+            GLuint path  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *value = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetPathParameterivCHROMIUM(path, pname, value);
+            return true;
+        }
+        case gl::EntryPoint::PathStencilFuncCHROMIUM:
+        {
+            GLenum func = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint ref   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glPathStencilFuncCHROMIUM(func, ref, mask);
+            return true;
+        }
+        case gl::EntryPoint::StencilFillPathCHROMIUM:
+        {
+            GLuint path     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum fillMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint mask     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilFillPathCHROMIUM(path, fillMode, mask);
+            return true;
+        }
+        case gl::EntryPoint::StencilStrokePathCHROMIUM:
+        {
+            GLuint path     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint reference = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilStrokePathCHROMIUM(path, reference, mask);
+            return true;
+        }
+        case gl::EntryPoint::CoverFillPathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCoverFillPathCHROMIUM(path, coverMode);
+            return true;
+        }
+        case gl::EntryPoint::CoverStrokePathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCoverStrokePathCHROMIUM(path, coverMode);
+            return true;
+        }
+        case gl::EntryPoint::StencilThenCoverFillPathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum fillMode  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint mask      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilThenCoverFillPathCHROMIUM(path, fillMode, mask, coverMode);
+            return true;
+        }
+        case gl::EntryPoint::StencilThenCoverStrokePathCHROMIUM:
+        {
+            GLuint path      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint reference  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilThenCoverStrokePathCHROMIUM(path, reference, mask, coverMode);
+            return true;
+        }
+        case gl::EntryPoint::CoverFillPathInstancedCHROMIUM:
+        {
+            GLsizei numPath                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum pathNameType            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *paths              = reader->readClientMemory<void>();
+            GLuint pathBase                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode               = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum transformType           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *transformValues = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCoverFillPathInstancedCHROMIUM(numPath, pathNameType, paths, pathBase, coverMode,
+                                             transformType, transformValues);
+            return true;
+        }
+        case gl::EntryPoint::CoverStrokePathInstancedCHROMIUM:
+        {
+            GLsizei numPath                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum pathNameType            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *paths              = reader->readClientMemory<void>();
+            GLuint pathBase                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode               = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum transformType           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *transformValues = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCoverStrokePathInstancedCHROMIUM(numPath, pathNameType, paths, pathBase, coverMode,
+                                               transformType, transformValues);
+            return true;
+        }
+        case gl::EntryPoint::StencilStrokePathInstancedCHROMIUM:
+        {
+            GLsizei numPath                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum pathNameType            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *paths              = reader->readClientMemory<void>();
+            GLuint pathBase                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint reference                = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum transformType           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *transformValues = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilStrokePathInstancedCHROMIUM(numPath, pathNameType, paths, pathBase, reference,
+                                                 mask, transformType, transformValues);
+            return true;
+        }
+        case gl::EntryPoint::StencilFillPathInstancedCHROMIUM:
+        {
+            GLsizei numPaths               = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum pathNameType            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *paths              = reader->readClientMemory<void>();
+            GLuint pathBase                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum fillMode                = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint mask                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum transformType           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *transformValues = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilFillPathInstancedCHROMIUM(numPaths, pathNameType, paths, pathBase, fillMode,
+                                               mask, transformType, transformValues);
+            return true;
+        }
+        case gl::EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM:
+        {
+            GLsizei numPaths               = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum pathNameType            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *paths              = reader->readClientMemory<void>();
+            GLuint pathBase                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum fillMode                = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint mask                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode               = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum transformType           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *transformValues = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilThenCoverFillPathInstancedCHROMIUM(numPaths, pathNameType, paths, pathBase,
+                                                        fillMode, mask, coverMode, transformType,
+                                                        transformValues);
+            return true;
+        }
+        case gl::EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM:
+        {
+            GLsizei numPaths               = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum pathNameType            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const void *paths              = reader->readClientMemory<void>();
+            GLuint pathBase                = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint reference                = static_cast<GLint>(reader->readParam<int32_t>());
+            GLuint mask                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum coverMode               = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum transformType           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLfloat *transformValues = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glStencilThenCoverStrokePathInstancedCHROMIUM(numPaths, pathNameType, paths, pathBase,
+                                                          reference, mask, coverMode, transformType,
+                                                          transformValues);
+            return true;
+        }
+        case gl::EntryPoint::BindFragmentInputLocationCHROMIUM:
+        {
+            GLuint programs    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location     = static_cast<GLint>(reader->readParam<int32_t>());
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glBindFragmentInputLocationCHROMIUM(programs, location, name);
+            return true;
+        }
+        case gl::EntryPoint::ProgramPathFragmentInputGenCHROMIUM:
+        {
+            GLuint program        = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum genMode        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint components      = static_cast<GLint>(reader->readParam<int32_t>());
+            const GLfloat *coeffs = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProgramPathFragmentInputGenCHROMIUM(program, location, genMode, components, coeffs);
+            return true;
+        }
+        case gl::EntryPoint::CopyTextureCHROMIUM:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint sourceLevel                = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum destTarget                = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint destId                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint destLevel                  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint internalFormat             = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum destType                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLboolean unpackFlipY            = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopyTextureCHROMIUM(sourceId, sourceLevel, destTarget, destId, destLevel,
+                                  internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                                  unpackUnmultiplyAlpha);
+            return true;
+        }
+        case gl::EntryPoint::CopySubTextureCHROMIUM:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint sourceLevel                = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum destTarget                = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint destId                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint destLevel                  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset                    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset                    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint x                          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y                          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint width                      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint height                     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLboolean unpackFlipY            = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopySubTextureCHROMIUM(sourceId, sourceLevel, destTarget, destId, destLevel, xoffset,
+                                     yoffset, x, y, width, height, unpackFlipY,
+                                     unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            return true;
+        }
+        case gl::EntryPoint::CompressedCopyTextureCHROMIUM:
+        {
+            GLuint sourceId = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint destId   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedCopyTextureCHROMIUM(sourceId, destId);
+            return true;
+        }
+        case gl::EntryPoint::RequestExtensionANGLE:
+        {
+            const GLchar *name = reader->readClientMemory<GLchar>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glRequestExtensionANGLE(name);
+            return true;
+        }
+        case gl::EntryPoint::GetBooleanvRobustANGLE:
+        {
+            GLenum pname      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length   = reader->readOutputPointer<GLsizei>();
+            GLboolean *params = reader->readOutputPointer<GLboolean>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBooleanvRobustANGLE(pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferParameterivRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFloatvRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFloatvRobustANGLE(pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE:
+        {
+            GLenum target     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum attachment = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length   = reader->readOutputPointer<GLsizei>();
+            GLint *params     = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFramebufferAttachmentParameterivRobustANGLE(target, attachment, pname, bufSize,
+                                                             length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetIntegervRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *data     = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetIntegervRobustANGLE(pname, bufSize, length, data);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramivRobustANGLE(program, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetRenderbufferParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetRenderbufferParameterivRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetShaderivRobustANGLE:
+        {
+            GLuint shader   = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetShaderivRobustANGLE(shader, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterfvRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterfvRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterivRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformfvRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformfvRobustANGLE(program, location, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformivRobustANGLE(program, location, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribfvRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribfvRobustANGLE(index, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribivRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribivRobustANGLE(index, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribPointervRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            void **pointer  = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribPointervRobustANGLE(index, pname, bufSize, length, pointer);
+            return true;
+        }
+        case gl::EntryPoint::ReadPixelsRobustANGLE:
+        {
+            GLint x          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length  = reader->readOutputPointer<GLsizei>();
+            GLsizei *columns = reader->readOutputPointer<GLsizei>();
+            GLsizei *rows    = reader->readOutputPointer<GLsizei>();
+            void *pixels     = reader->readOutputPointer<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glReadPixelsRobustANGLE(x, y, width, height, format, type, bufSize, length, columns,
+                                    rows, pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexImage2DRobustANGLE:
+        {
+            GLenum target        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint internalformat = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum format        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pixels   = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexImage2DRobustANGLE(target, level, internalformat, width, height, border, format,
+                                    type, bufSize, pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterfvRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *params = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterfvRobustANGLE(target, pname, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterivRobustANGLE:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterivRobustANGLE(target, pname, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::TexSubImage2DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pixels = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexSubImage2DRobustANGLE(target, level, xoffset, yoffset, width, height, format, type,
+                                       bufSize, pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexImage3DRobustANGLE:
+        {
+            GLenum target        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint internalformat = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border         = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum format        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pixels   = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexImage3DRobustANGLE(target, level, internalformat, width, height, depth, border,
+                                    format, type, bufSize, pixels);
+            return true;
+        }
+        case gl::EntryPoint::TexSubImage3DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint zoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const void *pixels = reader->readClientMemory<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexSubImage3DRobustANGLE(target, level, xoffset, yoffset, zoffset, width, height,
+                                       depth, format, type, bufSize, pixels);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexImage2DRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei imageSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei dataSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLvoid *data    = reader->readClientMemory<GLvoid>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexImage2DRobustANGLE(target, level, internalformat, width, height, border,
+                                              imageSize, dataSize, data);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexSubImage2DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei xoffset    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei yoffset    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei width      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei imageSize  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei dataSize   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLvoid *data = reader->readClientMemory<GLvoid>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexSubImage2DRobustANGLE(target, level, xoffset, yoffset, width, height,
+                                                 format, imageSize, dataSize, data);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexImage3DRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level           = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height        = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLint border          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei imageSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei dataSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLvoid *data    = reader->readClientMemory<GLvoid>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexImage3DRobustANGLE(target, level, internalformat, width, height, depth,
+                                              border, imageSize, dataSize, data);
+            return true;
+        }
+        case gl::EntryPoint::CompressedTexSubImage3DRobustANGLE:
+        {
+            GLenum target      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level        = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint zoffset      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei depth      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei imageSize  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei dataSize   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLvoid *data = reader->readClientMemory<GLvoid>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCompressedTexSubImage3DRobustANGLE(target, level, xoffset, yoffset, zoffset, width,
+                                                 height, depth, format, imageSize, dataSize, data);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryivRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectuivRobustANGLE:
+        {
+            GLuint id       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLuint *params  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectuivRobustANGLE(id, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferPointervRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            void **params   = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferPointervRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetIntegeri_vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *data     = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetIntegeri_vRobustANGLE(target, index, bufSize, length, data);
+            return true;
+        }
+        case gl::EntryPoint::GetInternalformativRobustANGLE:
+        {
+            GLenum target         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum internalformat = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize       = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length       = reader->readOutputPointer<GLsizei>();
+            GLint *params         = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetInternalformativRobustANGLE(target, internalformat, pname, bufSize, length,
+                                             params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribIivRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribIivRobustANGLE(index, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetVertexAttribIuivRobustANGLE:
+        {
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLuint *params  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetVertexAttribIuivRobustANGLE(index, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetUniformuivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLuint *params  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetUniformuivRobustANGLE(program, location, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetActiveUniformBlockivRobustANGLE:
+        {
+            GLuint program           = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint uniformBlockIndex = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname             = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize          = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length          = reader->readOutputPointer<GLsizei>();
+            GLint *params            = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetActiveUniformBlockivRobustANGLE(program, uniformBlockIndex, pname, bufSize, length,
+                                                 params);
+            return true;
+        }
+        case gl::EntryPoint::GetInteger64vRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint64 *data   = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetInteger64vRobustANGLE(pname, bufSize, length, data);
+            return true;
+        }
+        case gl::EntryPoint::GetInteger64i_vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint64 *data   = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetInteger64i_vRobustANGLE(target, index, bufSize, length, data);
+            return true;
+        }
+        case gl::EntryPoint::GetBufferParameteri64vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint64 *params = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBufferParameteri64vRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterivRobustANGLE:
+        {
+            GLuint sampler     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLuint pname       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *param = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterivRobustANGLE(sampler, pname, bufSize, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterfvRobustANGLE:
+        {
+            GLuint sampler       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLfloat *param = reader->readClientMemory<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterfvRobustANGLE(sampler, pname, bufSize, param);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterivRobustANGLE(sampler, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterfvRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterfvRobustANGLE(sampler, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetFramebufferParameterivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetFramebufferParameterivRobustANGLE(sampler, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetProgramInterfaceivRobustANGLE:
+        {
+            GLuint program          = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum programInterface = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname            = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize         = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length         = reader->readOutputPointer<GLsizei>();
+            GLint *params           = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetProgramInterfaceivRobustANGLE(program, programInterface, pname, bufSize, length,
+                                               params);
+            return true;
+        }
+        case gl::EntryPoint::GetBooleani_vRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLboolean *data = reader->readOutputPointer<GLboolean>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetBooleani_vRobustANGLE(target, index, bufSize, length, data);
+            return true;
+        }
+        case gl::EntryPoint::GetMultisamplefvRobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *val    = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetMultisamplefvRobustANGLE(pname, index, bufSize, length, val);
+            return true;
+        }
+        case gl::EntryPoint::GetTexLevelParameterivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexLevelParameterivRobustANGLE(target, level, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexLevelParameterfvRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexLevelParameterfvRobustANGLE(target, level, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetPointervRobustANGLERobustANGLE:
+        {
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            void **params   = reader->readOutputPointer<void *>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetPointervRobustANGLERobustANGLE(pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::ReadnPixelsRobustANGLE:
+        {
+            GLint x          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei width    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height   = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum format    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum type      = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length  = reader->readOutputPointer<GLsizei>();
+            GLsizei *columns = reader->readOutputPointer<GLsizei>();
+            GLsizei *rows    = reader->readOutputPointer<GLsizei>();
+            void *data       = reader->readOutputPointer<void>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glReadnPixelsRobustANGLE(x, y, width, height, format, type, bufSize, length, columns,
+                                     rows, data);
+            return true;
+        }
+        case gl::EntryPoint::GetnUniformfvRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetnUniformfvRobustANGLE(program, location, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetnUniformivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetnUniformivRobustANGLE(program, location, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetnUniformuivRobustANGLE:
+        {
+            GLuint program  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint location  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLuint *params  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetnUniformuivRobustANGLE(program, location, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterIivRobustANGLE:
+        {
+            GLenum target       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *params = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterIivRobustANGLE(target, pname, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::TexParameterIuivRobustANGLE:
+        {
+            GLenum target        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname         = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize      = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *params = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexParameterIuivRobustANGLE(target, pname, bufSize, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterIivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterIivRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexParameterIuivRobustANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLuint *params  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexParameterIuivRobustANGLE(target, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterIivRobustANGLE:
+        {
+            GLuint sampler     = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname       = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize    = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLint *param = reader->readClientMemory<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterIivRobustANGLE(sampler, pname, bufSize, param);
+            return true;
+        }
+        case gl::EntryPoint::SamplerParameterIuivRobustANGLE:
+        {
+            GLuint sampler      = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname        = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            const GLuint *param = reader->readClientMemory<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSamplerParameterIuivRobustANGLE(sampler, pname, bufSize, param);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterIivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterIivRobustANGLE(sampler, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetSamplerParameterIuivRobustANGLE:
+        {
+            GLuint sampler  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLuint *params  = reader->readOutputPointer<GLuint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetSamplerParameterIuivRobustANGLE(sampler, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectivRobustANGLE:
+        {
+            GLuint id       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint *params   = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectivRobustANGLE(id, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjecti64vRobustANGLE:
+        {
+            GLuint id       = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length = reader->readOutputPointer<GLsizei>();
+            GLint64 *params = reader->readOutputPointer<GLint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjecti64vRobustANGLE(id, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::GetQueryObjectui64vRobustANGLE:
+        {
+            GLuint id        = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLenum pname     = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei bufSize  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei *length  = reader->readOutputPointer<GLsizei>();
+            GLuint64 *params = reader->readOutputPointer<GLuint64>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetQueryObjectui64vRobustANGLE(id, pname, bufSize, length, params);
+            return true;
+        }
+        case gl::EntryPoint::CopyTexture3DANGLE:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint sourceLevel                = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum destTarget                = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint destId                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint destLevel                  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint internalFormat             = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum destType                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLboolean unpackFlipY            = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopyTexture3DANGLE(sourceId, sourceLevel, destTarget, destId, destLevel,
+                                 internalFormat, destType, unpackFlipY, unpackPremultiplyAlpha,
+                                 unpackUnmultiplyAlpha);
+            return true;
+        }
+        case gl::EntryPoint::CopySubTexture3DANGLE:
+        {
+            GLuint sourceId                  = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint sourceLevel                = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum destTarget                = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint destId                    = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLint destLevel                  = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint xoffset                    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint yoffset                    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint zoffset                    = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint x                          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint y                          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint z                          = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint width                      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint height                     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLint depth                      = static_cast<GLint>(reader->readParam<int32_t>());
+            GLboolean unpackFlipY            = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackPremultiplyAlpha = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            GLboolean unpackUnmultiplyAlpha  = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glCopySubTexture3DANGLE(sourceId, sourceLevel, destTarget, destId, destLevel, xoffset,
+                                    yoffset, zoffset, x, y, z, width, height, depth, unpackFlipY,
+                                    unpackPremultiplyAlpha, unpackUnmultiplyAlpha);
+            return true;
+        }
+        case gl::EntryPoint::TexStorage2DMultisampleANGLE:
+        {
+            GLenum target                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei samples                = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLenum internalformat          = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLsizei width                  = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLsizei height                 = static_cast<GLsizei>(reader->readParam<int32_t>());
+            GLboolean fixedsamplelocations = static_cast<GLboolean>(reader->readParam<uint8_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glTexStorage2DMultisampleANGLE(target, samples, internalformat, width, height,
+                                           fixedsamplelocations);
+            return true;
+        }
+        case gl::EntryPoint::GetTexLevelParameterivANGLE:
+        {
+            GLenum target = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level   = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum pname  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexLevelParameterivANGLE(target, level, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::GetTexLevelParameterfvANGLE:
+        {
+            GLenum target   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLint level     = static_cast<GLint>(reader->readParam<int32_t>());
+            GLenum pname    = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLfloat *params = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetTexLevelParameterfvANGLE(target, level, pname, params);
+            return true;
+        }
+        case gl::EntryPoint::MultiDrawArraysANGLE:
+        {
+            GLenum mode           = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *firsts   = reader->readClientMemory<GLint>();
+            const GLsizei *counts = reader->readClientMemory<GLsizei>();
+            GLsizei drawcount     = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultiDrawArraysANGLE(mode, firsts, counts, drawcount);
+            return true;
+        }
+        case gl::EntryPoint::MultiDrawArraysInstancedANGLE:
+        {
+            GLenum mode                   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLint *firsts           = reader->readClientMemory<GLint>();
+            const GLsizei *counts         = reader->readClientMemory<GLsizei>();
+            const GLsizei *instanceCounts = reader->readClientMemory<GLsizei>();
+            GLsizei drawcount             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultiDrawArraysInstancedANGLE(mode, firsts, counts, instanceCounts, drawcount);
+            return true;
+        }
+        case gl::EntryPoint::MultiDrawElementsANGLE:
+        {
+            GLenum mode                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLsizei *counts        = reader->readClientMemory<GLsizei>();
+            GLenum type                  = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLvoid *const *indices = reader->readClientMemory<const GLvoid *>();
+            GLsizei drawcount            = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultiDrawElementsANGLE(mode, counts, type, indices, drawcount);
+            return true;
+        }
+        case gl::EntryPoint::MultiDrawElementsInstancedANGLE:
+        {
+            GLenum mode                   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLsizei *counts         = reader->readClientMemory<GLsizei>();
+            GLenum type                   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            const GLvoid *const *indices  = reader->readClientMemory<const GLvoid *>();
+            const GLsizei *instanceCounts = reader->readClientMemory<GLsizei>();
+            GLsizei drawcount             = static_cast<GLsizei>(reader->readParam<int32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glMultiDrawElementsInstancedANGLE(mode, counts, type, indices, instanceCounts,
+                                              drawcount);
+            return true;
+        }
+        case gl::EntryPoint::GetMultisamplefvANGLE:
+        {
+            GLenum pname = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLuint index = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLfloat *val = reader->readOutputPointer<GLfloat>();
+            if (reader->failed())
+            {
+                return false;
+            }
+            glGetMultisamplefvANGLE(pname, index, val);
+            return true;
+        }
+        case gl::EntryPoint::SampleMaskiANGLE:
+        {
+            GLuint maskNumber = static_cast<GLuint>(reader->readParam<uint32_t>());
+            GLbitfield mask   = static_cast<GLbitfield>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glSampleMaskiANGLE(maskNumber, mask);
+            return true;
+        }
+        case gl::EntryPoint::ProvokingVertexANGLE:
+        {
+            GLenum mode = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glProvokingVertexANGLE(mode);
+            return true;
+        }
+        case gl::EntryPoint::LoseContextCHROMIUM:
+        {
+            GLenum current = static_cast<GLenum>(reader->readParam<uint32_t>());
+            GLenum other   = static_cast<GLenum>(reader->readParam<uint32_t>());
+            if (reader->failed())
+            {
+                return false;
+            }
+            glLoseContextCHROMIUM(current, other);
+            return true;
+        }
+        default:
+            return false;
+    }
+}
+}  // namespace angle
@@ -0,0 +1,26 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by generate_entry_points.py using data from gl.xml and gl_angle_ext.xml.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// capture_replay_autogen.h:
+//   Replays the GLES calls read from a capture file.
+
+#ifndef TESTS_TEST_UTILS_CAPTURE_REPLAY_AUTOGEN_H_
+#define TESTS_TEST_UTILS_CAPTURE_REPLAY_AUTOGEN_H_
+
+#include "libGLESv2/entry_points_enum_autogen.h"
+
+namespace angle
+{
+class CaptureReader;
+
+// Reads the parameters of a call to entryPoint and makes the call with the loaded GLES entry
+// points. Returns false without making the call when the parameters can't be read, e.g. from a
+// truncated file.
+bool ReplayCall(gl::EntryPoint entryPoint, CaptureReader *reader);
+}  // namespace angle
+
+#endif  // TESTS_TEST_UTILS_CAPTURE_REPLAY_AUTOGEN_H_
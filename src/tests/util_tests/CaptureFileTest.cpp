@@ -0,0 +1,238 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// CaptureFileTest.cpp:
+//   Writes capture files with CaptureWriter and reads them back with CaptureReader, whole and
+//   truncated.
+//
+
+#include <gtest/gtest.h>
+
+#include <stdio.h>
+#include <string.h>
+#include <vector>
+
+#include "libGLESv2/api_capture.h"
+#include "test_utils/capture_reader.h"
+
+#if defined(ANGLE_ENABLE_CAPTURE)
+
+namespace
+{
+constexpr char kCaptureFile[] = "angle_capture_file_test.bin";
+
+constexpr GLfloat kVertices[]  = {0.0f, 1.0f, -1.0f, -1.0f, 1.0f, -1.0f};
+constexpr char kShaderSource[] = "void main() {}";
+
+class CaptureFileTest : public testing::Test
+{
+  protected:
+    void TearDown() override { remove(kCaptureFile); }
+
+    // Writes one frame with a parameter of each kind.
+    void writeFrame()
+    {
+        FILE *file = fopen(kCaptureFile, "wb");
+        ASSERT_NE(nullptr, file);
+
+        gl::CaptureWriter writer(file);
+        writer.writeCall(gl::EntryPoint::Uniform1f);
+        writer.writeParam<GLint>(3);
+        writer.writeParam<GLfloat>(0.5f);
+
+        writer.writeCall(gl::EntryPoint::BufferData);
+        writer.writeParam<GLenum>(GL_ARRAY_BUFFER);
+        writer.writeParam<GLsizeiptr>(sizeof(kVertices));
+        writer.writeClientMemory(kVertices, sizeof(kVertices));
+        writer.writeParam<GLenum>(GL_STATIC_DRAW);
+
+        writer.writeCall(gl::EntryPoint::GetIntegerv);
+        writer.writeParam<GLenum>(GL_MAX_TEXTURE_SIZE);
+        writer.writeNullPointer();
+
+        const GLchar *strings[] = {kShaderSource};
+        writer.writeCall(gl::EntryPoint::ShaderSource);
+        writer.writeParam<GLuint>(1);
+        writer.writeParam<GLsizei>(1);
+        writer.writeStrings(1, strings, nullptr);
+        writer.writeNullPointer();
+
+        writer.writeFrameEnd();
+    }
+
+    // Reads the frame written by writeFrame, as far as the file goes. Returns whether the whole
+    // frame was read.
+    bool readFrame(angle::CaptureReader *reader)
+    {
+        bool complete = true;
+
+        if (reader->readEntryPoint() == gl::EntryPoint::Uniform1f)
+        {
+            GLint location = reader->readParam<GLint>();
+            GLfloat value  = reader->readParam<GLfloat>();
+            if (!reader->failed())
+            {
+                EXPECT_EQ(3, location);
+                EXPECT_EQ(0.5f, value);
+            }
+        }
+        else
+        {
+            complete = false;
+        }
+
+        if (reader->readEntryPoint() == gl::EntryPoint::BufferData)
+        {
+            GLenum target       = reader->readParam<GLenum>();
+            GLsizeiptr size     = reader->readParam<GLsizeiptr>();
+            const GLfloat *data = reader->readClientMemory<GLfloat>();
+            GLenum usage        = reader->readParam<GLenum>();
+            if (!reader->failed())
+            {
+                EXPECT_EQ(static_cast<GLenum>(GL_ARRAY_BUFFER), target);
+                EXPECT_EQ(static_cast<GLsizeiptr>(sizeof(kVertices)), size);
+                EXPECT_TRUE(data && memcmp(kVertices, data, sizeof(kVertices)) == 0);
+                EXPECT_EQ(static_cast<GLenum>(GL_STATIC_DRAW), usage);
+            }
+        }
+        else
+        {
+            complete = false;
+        }
+
+        if (reader->readEntryPoint() == gl::EntryPoint::GetIntegerv)
+        {
+            GLenum pname  = reader->readParam<GLenum>();
+            GLint *params = reader->readOutputPointer<GLint>();
+            if (!reader->failed())
+            {
+                EXPECT_EQ(static_cast<GLenum>(GL_MAX_TEXTURE_SIZE), pname);
+                EXPECT_EQ(nullptr, params);
+            }
+        }
+        else
+        {
+            complete = false;
+        }
+
+        if (reader->readEntryPoint() == gl::EntryPoint::ShaderSource)
+        {
+            GLuint shader                = reader->readParam<GLuint>();
+            GLsizei count                = reader->readParam<GLsizei>();
+            const GLchar *const *strings = reader->readStrings();
+            const GLint *lengths         = reader->readClientMemory<GLint>();
+            if (!reader->failed())
+            {
+                EXPECT_EQ(1u, shader);
+                EXPECT_EQ(1, count);
+                EXPECT_TRUE(strings && strcmp(kShaderSource, strings[0]) == 0);
+                EXPECT_EQ(nullptr, lengths);
+            }
+        }
+        else
+        {
+            complete = false;
+        }
+
+        if (reader->readEntryPoint() != gl::EntryPoint::Invalid)
+        {
+            complete = false;
+        }
+
+        return complete && !reader->failed();
+    }
+
+    std::vector<uint8_t> readFile()
+    {
+        std::vector<uint8_t> contents;
+        FILE *file = fopen(kCaptureFile, "rb");
+        if (!file)
+        {
+            return contents;
+        }
+
+        uint8_t buffer[256];
+        size_t size;
+        while ((size = fread(buffer, 1, sizeof(buffer), file)) > 0)
+        {
+            contents.insert(contents.end(), buffer, buffer + size);
+        }
+        fclose(file);
+        return contents;
+    }
+
+    void writeFile(const std::vector<uint8_t> &contents, size_t size)
+    {
+        FILE *file = fopen(kCaptureFile, "wb");
+        ASSERT_NE(nullptr, file);
+        ASSERT_EQ(size, fwrite(contents.data(), 1, size, file));
+        fclose(file);
+    }
+};
+
+// Tests that the calls read back are the calls written.
+TEST_F(CaptureFileTest, RoundTrip)
+{
+    writeFrame();
+
+    angle::CaptureReader reader;
+    ASSERT_TRUE(reader.load(kCaptureFile));
+    EXPECT_TRUE(readFrame(&reader));
+    EXPECT_FALSE(reader.failed());
+    EXPECT_TRUE(reader.done());
+}
+
+// Tests that every truncation of the file either fails to load or fails the reader, without
+// reading past the end of the file.
+TEST_F(CaptureFileTest, Truncated)
+{
+    writeFrame();
+    std::vector<uint8_t> contents = readFile();
+    ASSERT_FALSE(contents.empty());
+
+    for (size_t size = 0; size < contents.size(); ++size)
+    {
+        writeFile(contents, size);
+
+        angle::CaptureReader reader;
+        if (!reader.load(kCaptureFile))
+        {
+            EXPECT_TRUE(reader.failed()) << "size " << size;
+            continue;
+        }
+
+        EXPECT_FALSE(readFrame(&reader)) << "size " << size;
+        EXPECT_TRUE(reader.failed()) << "size " << size;
+        EXPECT_TRUE(reader.done()) << "size " << size;
+
+        // Reads after a failure return zeros and null pointers.
+        EXPECT_EQ(gl::EntryPoint::Invalid, reader.readEntryPoint());
+        EXPECT_EQ(0u, reader.readParam<GLuint>());
+        EXPECT_EQ(nullptr, reader.readClientMemory<GLfloat>());
+        EXPECT_EQ(nullptr, reader.readStrings());
+    }
+}
+
+// Tests that a string that doesn't end in the file fails the reader.
+TEST_F(CaptureFileTest, UnterminatedString)
+{
+    writeFrame();
+    std::vector<uint8_t> contents = readFile();
+
+    // Drop the terminator of the shader source, which is followed by the null lengths pointer and
+    // the end of the frame.
+    size_t terminator = contents.size() - sizeof(uint32_t) - sizeof(uint16_t) - 1;
+    ASSERT_EQ(0u, contents[terminator]);
+    contents[terminator] = 'x';
+    writeFile(contents, contents.size());
+
+    angle::CaptureReader reader;
+    ASSERT_TRUE(reader.load(kCaptureFile));
+    EXPECT_FALSE(readFrame(&reader));
+    EXPECT_TRUE(reader.failed());
+}
+}  // anonymous namespace
+
+#endif  // defined(ANGLE_ENABLE_CAPTURE)
@@ -0,0 +1,83 @@
+//
+// Copyright 2019 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// GlobalLockElisionTest.cpp:
+//   Tests the switch of the entry points generated with --elide-global-lock from eliding the
+//   global lock to taking it, when a second thread shows up.
+//
+
+#include <gtest/gtest.h>
+
+#include <atomic>
+#include <chrono>
+#include <thread>
+
+#include "libGLESv2/global_state.h"
+#include "test_utils/ANGLETest.h"
+
+#if ANGLE_FORCE_THREAD_SAFETY == ANGLE_ENABLED && defined(ANGLE_ELIDE_GLOBAL_LOCK)
+
+namespace
+{
+void WaitFor(const std::atomic<bool> &flag, bool value)
+{
+    while (flag.load() != value)
+    {
+        std::this_thread::yield();
+    }
+}
+
+// Tests that a call from a second thread waits for the call the first thread started without the
+// lock, and that both threads take the lock from then on.
+TEST(GlobalLockElisionTest, SecondThreadWaitsForElidedCalls)
+{
+    // The switch happens once per process, and another test may have made it already.
+    ANGLE_SKIP_TEST_IF(!angle::CanElideGlobalLock());
+
+    std::atomic<bool> secondThreadEntered(false);
+    std::atomic<bool> secondThreadDone(false);
+    std::thread secondThread;
+    {
+        angle::ScopedElidableGlobalLock elidedCall;
+        EXPECT_EQ(1u, angle::gElidedCallCount.load());
+
+        secondThread = std::thread([&]() {
+            angle::ScopedElidableGlobalLock lockedCall;
+            secondThreadEntered = true;
+            WaitFor(secondThreadDone, true);
+        });
+
+        // The second thread turns elision off, but doesn't enter while the elided call runs.
+        WaitFor(angle::gGlobalLockElided, false);
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        EXPECT_FALSE(secondThreadEntered.load());
+    }
+
+    // Once the elided call returns, the second thread enters with the lock.
+    WaitFor(secondThreadEntered, true);
+    EXPECT_EQ(0u, angle::gElidedCallCount.load());
+    EXPECT_FALSE(angle::GetGlobalMutex().try_lock());
+    secondThreadDone = true;
+    secondThread.join();
+
+    // The first thread takes the lock too.
+    EXPECT_FALSE(angle::CanElideGlobalLock());
+    {
+        angle::ScopedElidableGlobalLock lockedCall;
+        bool locked = true;
+        std::thread([&]() {
+            locked = !angle::GetGlobalMutex().try_lock();
+            if (!locked)
+            {
+                angle::GetGlobalMutex().unlock();
+            }
+        }).join();
+        EXPECT_TRUE(locked);
+        EXPECT_EQ(0u, angle::gElidedCallCount.load());
+    }
+}
+}  // anonymous namespace
+
+#endif  // ANGLE_FORCE_THREAD_SAFETY == ANGLE_ENABLED && defined(ANGLE_ELIDE_GLOBAL_LOCK)
@@ -117,7 +117,7 @@ bool EGLWindow::initializeDisplay(OSWindow *osWindow,
     }
 
     // Likely we will need to use a fallback to Library::getAs on non-ANGLE platforms.
-    angle::LoadEGL(getProcAddress);
+    angle::LoadEGLLazy(getProcAddress);
 #endif  // defined(ANGLE_USE_UTIL_LOADER)
 
     std::vector<EGLAttrib> displayAttributes;
@@ -276,7 +276,7 @@ bool EGLWindow::initializeSurface(OSWindow *osWindow,
     }
 
 #if defined(ANGLE_USE_UTIL_LOADER)
-    angle::LoadGLES(eglGetProcAddress);
+    angle::LoadGLESLazy(eglGetProcAddress);
 #endif  // defined(ANGLE_USE_UTIL_LOADER)
 
     return true;
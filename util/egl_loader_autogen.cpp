@@ -10,6 +10,12 @@
 
 #include "egl_loader_autogen.h"
 
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include <atomic>
+
 ANGLE_UTIL_EXPORT PFNEGLCHOOSECONFIGPROC eglChooseConfig;
 ANGLE_UTIL_EXPORT PFNEGLCOPYBUFFERSPROC eglCopyBuffers;
 ANGLE_UTIL_EXPORT PFNEGLCREATECONTEXTPROC eglCreateContext;
@@ -105,149 +111,343 @@ ANGLE_UTIL_EXPORT PFNEGLSTREAMCONSUMERGLTEXTUREEXTERNALATTRIBSNVPROC
 
 namespace angle
 {
+namespace
+{
+constexpr size_t kProcCount = 88;
+
+constexpr const char *kProcNames[kProcCount] = {
+    "eglChooseConfig",
+    "eglCopyBuffers",
+    "eglCreateContext",
+    "eglCreatePbufferSurface",
+    "eglCreatePixmapSurface",
+    "eglCreateWindowSurface",
+    "eglDestroyContext",
+    "eglDestroySurface",
+    "eglGetConfigAttrib",
+    "eglGetConfigs",
+    "eglGetCurrentDisplay",
+    "eglGetCurrentSurface",
+    "eglGetDisplay",
+    "eglGetError",
+    "eglGetProcAddress",
+    "eglInitialize",
+    "eglMakeCurrent",
+    "eglQueryContext",
+    "eglQueryString",
+    "eglQuerySurface",
+    "eglSwapBuffers",
+    "eglTerminate",
+    "eglWaitGL",
+    "eglWaitNative",
+    "eglBindTexImage",
+    "eglReleaseTexImage",
+    "eglSurfaceAttrib",
+    "eglSwapInterval",
+    "eglBindAPI",
+    "eglQueryAPI",
+    "eglCreatePbufferFromClientBuffer",
+    "eglReleaseThread",
+    "eglWaitClient",
+    "eglGetCurrentContext",
+    "eglCreateSync",
+    "eglDestroySync",
+    "eglClientWaitSync",
+    "eglGetSyncAttrib",
+    "eglCreateImage",
+    "eglDestroyImage",
+    "eglGetPlatformDisplay",
+    "eglCreatePlatformWindowSurface",
+    "eglCreatePlatformPixmapSurface",
+    "eglWaitSync",
+    "eglSetBlobCacheFuncsANDROID",
+    "eglGetCompositorTimingANDROID",
+    "eglGetCompositorTimingSupportedANDROID",
+    "eglGetFrameTimestampSupportedANDROID",
+    "eglGetFrameTimestampsANDROID",
+    "eglGetNextFrameIdANDROID",
+    "eglPresentationTimeANDROID",
+    "eglCreateDeviceANGLE",
+    "eglReleaseDeviceANGLE",
+    "eglProgramCacheGetAttribANGLE",
+    "eglProgramCachePopulateANGLE",
+    "eglProgramCacheQueryANGLE",
+    "eglProgramCacheResizeANGLE",
+    "eglQuerySurfacePointerANGLE",
+    "eglCreateStreamProducerD3DTextureANGLE",
+    "eglStreamPostD3DTextureANGLE",
+    "eglGetSyncValuesCHROMIUM",
+    "eglQueryDeviceAttribEXT",
+    "eglQueryDeviceStringEXT",
+    "eglQueryDisplayAttribEXT",
+    "eglCreatePlatformPixmapSurfaceEXT",
+    "eglCreatePlatformWindowSurfaceEXT",
+    "eglGetPlatformDisplayEXT",
+    "eglDebugMessageControlKHR",
+    "eglLabelObjectKHR",
+    "eglQueryDebugKHR",
+    "eglClientWaitSyncKHR",
+    "eglCreateSyncKHR",
+    "eglDestroySyncKHR",
+    "eglGetSyncAttribKHR",
+    "eglCreateImageKHR",
+    "eglDestroyImageKHR",
+    "eglCreateStreamKHR",
+    "eglDestroyStreamKHR",
+    "eglQueryStreamKHR",
+    "eglQueryStreamu64KHR",
+    "eglStreamAttribKHR",
+    "eglStreamConsumerAcquireKHR",
+    "eglStreamConsumerGLTextureExternalKHR",
+    "eglStreamConsumerReleaseKHR",
+    "eglSwapBuffersWithDamageKHR",
+    "eglWaitSyncKHR",
+    "eglPostSubBufferNV",
+    "eglStreamConsumerGLTextureExternalAttribsNV",
+};
+
+GenericProc *const kProcs[kProcCount] = {
+    reinterpret_cast<GenericProc *>(&eglChooseConfig),
+    reinterpret_cast<GenericProc *>(&eglCopyBuffers),
+    reinterpret_cast<GenericProc *>(&eglCreateContext),
+    reinterpret_cast<GenericProc *>(&eglCreatePbufferSurface),
+    reinterpret_cast<GenericProc *>(&eglCreatePixmapSurface),
+    reinterpret_cast<GenericProc *>(&eglCreateWindowSurface),
+    reinterpret_cast<GenericProc *>(&eglDestroyContext),
+    reinterpret_cast<GenericProc *>(&eglDestroySurface),
+    reinterpret_cast<GenericProc *>(&eglGetConfigAttrib),
+    reinterpret_cast<GenericProc *>(&eglGetConfigs),
+    reinterpret_cast<GenericProc *>(&eglGetCurrentDisplay),
+    reinterpret_cast<GenericProc *>(&eglGetCurrentSurface),
+    reinterpret_cast<GenericProc *>(&eglGetDisplay),
+    reinterpret_cast<GenericProc *>(&eglGetError),
+    reinterpret_cast<GenericProc *>(&eglGetProcAddress),
+    reinterpret_cast<GenericProc *>(&eglInitialize),
+    reinterpret_cast<GenericProc *>(&eglMakeCurrent),
+    reinterpret_cast<GenericProc *>(&eglQueryContext),
+    reinterpret_cast<GenericProc *>(&eglQueryString),
+    reinterpret_cast<GenericProc *>(&eglQuerySurface),
+    reinterpret_cast<GenericProc *>(&eglSwapBuffers),
+    reinterpret_cast<GenericProc *>(&eglTerminate),
+    reinterpret_cast<GenericProc *>(&eglWaitGL),
+    reinterpret_cast<GenericProc *>(&eglWaitNative),
+    reinterpret_cast<GenericProc *>(&eglBindTexImage),
+    reinterpret_cast<GenericProc *>(&eglReleaseTexImage),
+    reinterpret_cast<GenericProc *>(&eglSurfaceAttrib),
+    reinterpret_cast<GenericProc *>(&eglSwapInterval),
+    reinterpret_cast<GenericProc *>(&eglBindAPI),
+    reinterpret_cast<GenericProc *>(&eglQueryAPI),
+    reinterpret_cast<GenericProc *>(&eglCreatePbufferFromClientBuffer),
+    reinterpret_cast<GenericProc *>(&eglReleaseThread),
+    reinterpret_cast<GenericProc *>(&eglWaitClient),
+    reinterpret_cast<GenericProc *>(&eglGetCurrentContext),
+    reinterpret_cast<GenericProc *>(&eglCreateSync),
+    reinterpret_cast<GenericProc *>(&eglDestroySync),
+    reinterpret_cast<GenericProc *>(&eglClientWaitSync),
+    reinterpret_cast<GenericProc *>(&eglGetSyncAttrib),
+    reinterpret_cast<GenericProc *>(&eglCreateImage),
+    reinterpret_cast<GenericProc *>(&eglDestroyImage),
+    reinterpret_cast<GenericProc *>(&eglGetPlatformDisplay),
+    reinterpret_cast<GenericProc *>(&eglCreatePlatformWindowSurface),
+    reinterpret_cast<GenericProc *>(&eglCreatePlatformPixmapSurface),
+    reinterpret_cast<GenericProc *>(&eglWaitSync),
+    reinterpret_cast<GenericProc *>(&eglSetBlobCacheFuncsANDROID),
+    reinterpret_cast<GenericProc *>(&eglGetCompositorTimingANDROID),
+    reinterpret_cast<GenericProc *>(&eglGetCompositorTimingSupportedANDROID),
+    reinterpret_cast<GenericProc *>(&eglGetFrameTimestampSupportedANDROID),
+    reinterpret_cast<GenericProc *>(&eglGetFrameTimestampsANDROID),
+    reinterpret_cast<GenericProc *>(&eglGetNextFrameIdANDROID),
+    reinterpret_cast<GenericProc *>(&eglPresentationTimeANDROID),
+    reinterpret_cast<GenericProc *>(&eglCreateDeviceANGLE),
+    reinterpret_cast<GenericProc *>(&eglReleaseDeviceANGLE),
+    reinterpret_cast<GenericProc *>(&eglProgramCacheGetAttribANGLE),
+    reinterpret_cast<GenericProc *>(&eglProgramCachePopulateANGLE),
+    reinterpret_cast<GenericProc *>(&eglProgramCacheQueryANGLE),
+    reinterpret_cast<GenericProc *>(&eglProgramCacheResizeANGLE),
+    reinterpret_cast<GenericProc *>(&eglQuerySurfacePointerANGLE),
+    reinterpret_cast<GenericProc *>(&eglCreateStreamProducerD3DTextureANGLE),
+    reinterpret_cast<GenericProc *>(&eglStreamPostD3DTextureANGLE),
+    reinterpret_cast<GenericProc *>(&eglGetSyncValuesCHROMIUM),
+    reinterpret_cast<GenericProc *>(&eglQueryDeviceAttribEXT),
+    reinterpret_cast<GenericProc *>(&eglQueryDeviceStringEXT),
+    reinterpret_cast<GenericProc *>(&eglQueryDisplayAttribEXT),
+    reinterpret_cast<GenericProc *>(&eglCreatePlatformPixmapSurfaceEXT),
+    reinterpret_cast<GenericProc *>(&eglCreatePlatformWindowSurfaceEXT),
+    reinterpret_cast<GenericProc *>(&eglGetPlatformDisplayEXT),
+    reinterpret_cast<GenericProc *>(&eglDebugMessageControlKHR),
+    reinterpret_cast<GenericProc *>(&eglLabelObjectKHR),
+    reinterpret_cast<GenericProc *>(&eglQueryDebugKHR),
+    reinterpret_cast<GenericProc *>(&eglClientWaitSyncKHR),
+    reinterpret_cast<GenericProc *>(&eglCreateSyncKHR),
+    reinterpret_cast<GenericProc *>(&eglDestroySyncKHR),
+    reinterpret_cast<GenericProc *>(&eglGetSyncAttribKHR),
+    reinterpret_cast<GenericProc *>(&eglCreateImageKHR),
+    reinterpret_cast<GenericProc *>(&eglDestroyImageKHR),
+    reinterpret_cast<GenericProc *>(&eglCreateStreamKHR),
+    reinterpret_cast<GenericProc *>(&eglDestroyStreamKHR),
+    reinterpret_cast<GenericProc *>(&eglQueryStreamKHR),
+    reinterpret_cast<GenericProc *>(&eglQueryStreamu64KHR),
+    reinterpret_cast<GenericProc *>(&eglStreamAttribKHR),
+    reinterpret_cast<GenericProc *>(&eglStreamConsumerAcquireKHR),
+    reinterpret_cast<GenericProc *>(&eglStreamConsumerGLTextureExternalKHR),
+    reinterpret_cast<GenericProc *>(&eglStreamConsumerReleaseKHR),
+    reinterpret_cast<GenericProc *>(&eglSwapBuffersWithDamageKHR),
+    reinterpret_cast<GenericProc *>(&eglWaitSyncKHR),
+    reinterpret_cast<GenericProc *>(&eglPostSubBufferNV),
+    reinterpret_cast<GenericProc *>(&eglStreamConsumerGLTextureExternalAttribsNV),
+};
+
+LoadProc gLazyLoadProc = nullptr;
+
+// The functions loaded by the stubs. The stubs stay in the function pointers, which other threads
+// read without synchronization, so the loaded functions are kept in atomic slots instead.
+std::atomic<GenericProc> gLazyProcSlots[kProcCount];
+
+GenericProc LoadLazyProc(size_t index)
+{
+    GenericProc proc = gLazyProcSlots[index].load(std::memory_order_acquire);
+    if (proc)
+    {
+        return proc;
+    }
+
+    // Threads that load the same function at the same time store the same pointer.
+    proc = gLazyLoadProc(kProcNames[index]);
+    if (!proc)
+    {
+        fprintf(stderr, "Failed to load %s.\n", kProcNames[index]);
+        abort();
+    }
+    gLazyProcSlots[index].store(proc, std::memory_order_release);
+    return proc;
+}
+
+template <size_t Index, typename ProcT>
+struct LazyProc;
+
+template <size_t Index, typename ReturnT, typename... ParamsT>
+struct LazyProc<Index, ReturnT(KHRONOS_APIENTRY *)(ParamsT...)>
+{
+    static ReturnT KHRONOS_APIENTRY Stub(ParamsT... params)
+    {
+        using ProcT = ReturnT(KHRONOS_APIENTRY *)(ParamsT...);
+        return reinterpret_cast<ProcT>(LoadLazyProc(Index))(params...);
+    }
+};
+
+// The stubs of the core functions, and null for the extension functions.
+const GenericProc kLazyProcs[kProcCount] = {
+    reinterpret_cast<GenericProc>(&LazyProc<0, PFNEGLCHOOSECONFIGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<1, PFNEGLCOPYBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<2, PFNEGLCREATECONTEXTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<3, PFNEGLCREATEPBUFFERSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<4, PFNEGLCREATEPIXMAPSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<5, PFNEGLCREATEWINDOWSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<6, PFNEGLDESTROYCONTEXTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<7, PFNEGLDESTROYSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<8, PFNEGLGETCONFIGATTRIBPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<9, PFNEGLGETCONFIGSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<10, PFNEGLGETCURRENTDISPLAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<11, PFNEGLGETCURRENTSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<12, PFNEGLGETDISPLAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<13, PFNEGLGETERRORPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<14, PFNEGLGETPROCADDRESSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<15, PFNEGLINITIALIZEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<16, PFNEGLMAKECURRENTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<17, PFNEGLQUERYCONTEXTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<18, PFNEGLQUERYSTRINGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<19, PFNEGLQUERYSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<20, PFNEGLSWAPBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<21, PFNEGLTERMINATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<22, PFNEGLWAITGLPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<23, PFNEGLWAITNATIVEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<24, PFNEGLBINDTEXIMAGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<25, PFNEGLRELEASETEXIMAGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<26, PFNEGLSURFACEATTRIBPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<27, PFNEGLSWAPINTERVALPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<28, PFNEGLBINDAPIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<29, PFNEGLQUERYAPIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<30, PFNEGLCREATEPBUFFERFROMCLIENTBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<31, PFNEGLRELEASETHREADPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<32, PFNEGLWAITCLIENTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<33, PFNEGLGETCURRENTCONTEXTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<34, PFNEGLCREATESYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<35, PFNEGLDESTROYSYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<36, PFNEGLCLIENTWAITSYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<37, PFNEGLGETSYNCATTRIBPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<38, PFNEGLCREATEIMAGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<39, PFNEGLDESTROYIMAGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<40, PFNEGLGETPLATFORMDISPLAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<41, PFNEGLCREATEPLATFORMWINDOWSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<42, PFNEGLCREATEPLATFORMPIXMAPSURFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<43, PFNEGLWAITSYNCPROC>::Stub),
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+};
+}  // anonymous namespace
+
 void LoadEGL(LoadProc loadProc)
 {
-    eglChooseConfig  = reinterpret_cast<PFNEGLCHOOSECONFIGPROC>(loadProc("eglChooseConfig"));
-    eglCopyBuffers   = reinterpret_cast<PFNEGLCOPYBUFFERSPROC>(loadProc("eglCopyBuffers"));
-    eglCreateContext = reinterpret_cast<PFNEGLCREATECONTEXTPROC>(loadProc("eglCreateContext"));
-    eglCreatePbufferSurface =
-        reinterpret_cast<PFNEGLCREATEPBUFFERSURFACEPROC>(loadProc("eglCreatePbufferSurface"));
-    eglCreatePixmapSurface =
-        reinterpret_cast<PFNEGLCREATEPIXMAPSURFACEPROC>(loadProc("eglCreatePixmapSurface"));
-    eglCreateWindowSurface =
-        reinterpret_cast<PFNEGLCREATEWINDOWSURFACEPROC>(loadProc("eglCreateWindowSurface"));
-    eglDestroyContext = reinterpret_cast<PFNEGLDESTROYCONTEXTPROC>(loadProc("eglDestroyContext"));
-    eglDestroySurface = reinterpret_cast<PFNEGLDESTROYSURFACEPROC>(loadProc("eglDestroySurface"));
-    eglGetConfigAttrib =
-        reinterpret_cast<PFNEGLGETCONFIGATTRIBPROC>(loadProc("eglGetConfigAttrib"));
-    eglGetConfigs = reinterpret_cast<PFNEGLGETCONFIGSPROC>(loadProc("eglGetConfigs"));
-    eglGetCurrentDisplay =
-        reinterpret_cast<PFNEGLGETCURRENTDISPLAYPROC>(loadProc("eglGetCurrentDisplay"));
-    eglGetCurrentSurface =
-        reinterpret_cast<PFNEGLGETCURRENTSURFACEPROC>(loadProc("eglGetCurrentSurface"));
-    eglGetDisplay     = reinterpret_cast<PFNEGLGETDISPLAYPROC>(loadProc("eglGetDisplay"));
-    eglGetError       = reinterpret_cast<PFNEGLGETERRORPROC>(loadProc("eglGetError"));
-    eglGetProcAddress = reinterpret_cast<PFNEGLGETPROCADDRESSPROC>(loadProc("eglGetProcAddress"));
-    eglInitialize     = reinterpret_cast<PFNEGLINITIALIZEPROC>(loadProc("eglInitialize"));
-    eglMakeCurrent    = reinterpret_cast<PFNEGLMAKECURRENTPROC>(loadProc("eglMakeCurrent"));
-    eglQueryContext   = reinterpret_cast<PFNEGLQUERYCONTEXTPROC>(loadProc("eglQueryContext"));
-    eglQueryString    = reinterpret_cast<PFNEGLQUERYSTRINGPROC>(loadProc("eglQueryString"));
-    eglQuerySurface   = reinterpret_cast<PFNEGLQUERYSURFACEPROC>(loadProc("eglQuerySurface"));
-    eglSwapBuffers    = reinterpret_cast<PFNEGLSWAPBUFFERSPROC>(loadProc("eglSwapBuffers"));
-    eglTerminate      = reinterpret_cast<PFNEGLTERMINATEPROC>(loadProc("eglTerminate"));
-    eglWaitGL         = reinterpret_cast<PFNEGLWAITGLPROC>(loadProc("eglWaitGL"));
-    eglWaitNative     = reinterpret_cast<PFNEGLWAITNATIVEPROC>(loadProc("eglWaitNative"));
-    eglBindTexImage   = reinterpret_cast<PFNEGLBINDTEXIMAGEPROC>(loadProc("eglBindTexImage"));
-    eglReleaseTexImage =
-        reinterpret_cast<PFNEGLRELEASETEXIMAGEPROC>(loadProc("eglReleaseTexImage"));
-    eglSurfaceAttrib = reinterpret_cast<PFNEGLSURFACEATTRIBPROC>(loadProc("eglSurfaceAttrib"));
-    eglSwapInterval  = reinterpret_cast<PFNEGLSWAPINTERVALPROC>(loadProc("eglSwapInterval"));
-    eglBindAPI       = reinterpret_cast<PFNEGLBINDAPIPROC>(loadProc("eglBindAPI"));
-    eglQueryAPI      = reinterpret_cast<PFNEGLQUERYAPIPROC>(loadProc("eglQueryAPI"));
-    eglCreatePbufferFromClientBuffer = reinterpret_cast<PFNEGLCREATEPBUFFERFROMCLIENTBUFFERPROC>(
-        loadProc("eglCreatePbufferFromClientBuffer"));
-    eglReleaseThread = reinterpret_cast<PFNEGLRELEASETHREADPROC>(loadProc("eglReleaseThread"));
-    eglWaitClient    = reinterpret_cast<PFNEGLWAITCLIENTPROC>(loadProc("eglWaitClient"));
-    eglGetCurrentContext =
-        reinterpret_cast<PFNEGLGETCURRENTCONTEXTPROC>(loadProc("eglGetCurrentContext"));
-    eglCreateSync     = reinterpret_cast<PFNEGLCREATESYNCPROC>(loadProc("eglCreateSync"));
-    eglDestroySync    = reinterpret_cast<PFNEGLDESTROYSYNCPROC>(loadProc("eglDestroySync"));
-    eglClientWaitSync = reinterpret_cast<PFNEGLCLIENTWAITSYNCPROC>(loadProc("eglClientWaitSync"));
-    eglGetSyncAttrib  = reinterpret_cast<PFNEGLGETSYNCATTRIBPROC>(loadProc("eglGetSyncAttrib"));
-    eglCreateImage    = reinterpret_cast<PFNEGLCREATEIMAGEPROC>(loadProc("eglCreateImage"));
-    eglDestroyImage   = reinterpret_cast<PFNEGLDESTROYIMAGEPROC>(loadProc("eglDestroyImage"));
-    eglGetPlatformDisplay =
-        reinterpret_cast<PFNEGLGETPLATFORMDISPLAYPROC>(loadProc("eglGetPlatformDisplay"));
-    eglCreatePlatformWindowSurface = reinterpret_cast<PFNEGLCREATEPLATFORMWINDOWSURFACEPROC>(
-        loadProc("eglCreatePlatformWindowSurface"));
-    eglCreatePlatformPixmapSurface = reinterpret_cast<PFNEGLCREATEPLATFORMPIXMAPSURFACEPROC>(
-        loadProc("eglCreatePlatformPixmapSurface"));
-    eglWaitSync                 = reinterpret_cast<PFNEGLWAITSYNCPROC>(loadProc("eglWaitSync"));
-    eglSetBlobCacheFuncsANDROID = reinterpret_cast<PFNEGLSETBLOBCACHEFUNCSANDROIDPROC>(
-        loadProc("eglSetBlobCacheFuncsANDROID"));
-    eglGetCompositorTimingANDROID = reinterpret_cast<PFNEGLGETCOMPOSITORTIMINGANDROIDPROC>(
-        loadProc("eglGetCompositorTimingANDROID"));
-    eglGetCompositorTimingSupportedANDROID =
-        reinterpret_cast<PFNEGLGETCOMPOSITORTIMINGSUPPORTEDANDROIDPROC>(
-            loadProc("eglGetCompositorTimingSupportedANDROID"));
-    eglGetFrameTimestampSupportedANDROID =
-        reinterpret_cast<PFNEGLGETFRAMETIMESTAMPSUPPORTEDANDROIDPROC>(
-            loadProc("eglGetFrameTimestampSupportedANDROID"));
-    eglGetFrameTimestampsANDROID = reinterpret_cast<PFNEGLGETFRAMETIMESTAMPSANDROIDPROC>(
-        loadProc("eglGetFrameTimestampsANDROID"));
-    eglGetNextFrameIdANDROID =
-        reinterpret_cast<PFNEGLGETNEXTFRAMEIDANDROIDPROC>(loadProc("eglGetNextFrameIdANDROID"));
-    eglPresentationTimeANDROID =
-        reinterpret_cast<PFNEGLPRESENTATIONTIMEANDROIDPROC>(loadProc("eglPresentationTimeANDROID"));
-    eglCreateDeviceANGLE =
-        reinterpret_cast<PFNEGLCREATEDEVICEANGLEPROC>(loadProc("eglCreateDeviceANGLE"));
-    eglReleaseDeviceANGLE =
-        reinterpret_cast<PFNEGLRELEASEDEVICEANGLEPROC>(loadProc("eglReleaseDeviceANGLE"));
-    eglProgramCacheGetAttribANGLE = reinterpret_cast<PFNEGLPROGRAMCACHEGETATTRIBANGLEPROC>(
-        loadProc("eglProgramCacheGetAttribANGLE"));
-    eglProgramCachePopulateANGLE = reinterpret_cast<PFNEGLPROGRAMCACHEPOPULATEANGLEPROC>(
-        loadProc("eglProgramCachePopulateANGLE"));
-    eglProgramCacheQueryANGLE =
-        reinterpret_cast<PFNEGLPROGRAMCACHEQUERYANGLEPROC>(loadProc("eglProgramCacheQueryANGLE"));
-    eglProgramCacheResizeANGLE =
-        reinterpret_cast<PFNEGLPROGRAMCACHERESIZEANGLEPROC>(loadProc("eglProgramCacheResizeANGLE"));
-    eglQuerySurfacePointerANGLE = reinterpret_cast<PFNEGLQUERYSURFACEPOINTERANGLEPROC>(
-        loadProc("eglQuerySurfacePointerANGLE"));
-    eglCreateStreamProducerD3DTextureANGLE =
-        reinterpret_cast<PFNEGLCREATESTREAMPRODUCERD3DTEXTUREANGLEPROC>(
-            loadProc("eglCreateStreamProducerD3DTextureANGLE"));
-    eglStreamPostD3DTextureANGLE = reinterpret_cast<PFNEGLSTREAMPOSTD3DTEXTUREANGLEPROC>(
-        loadProc("eglStreamPostD3DTextureANGLE"));
-    eglGetSyncValuesCHROMIUM =
-        reinterpret_cast<PFNEGLGETSYNCVALUESCHROMIUMPROC>(loadProc("eglGetSyncValuesCHROMIUM"));
-    eglQueryDeviceAttribEXT =
-        reinterpret_cast<PFNEGLQUERYDEVICEATTRIBEXTPROC>(loadProc("eglQueryDeviceAttribEXT"));
-    eglQueryDeviceStringEXT =
-        reinterpret_cast<PFNEGLQUERYDEVICESTRINGEXTPROC>(loadProc("eglQueryDeviceStringEXT"));
-    eglQueryDisplayAttribEXT =
-        reinterpret_cast<PFNEGLQUERYDISPLAYATTRIBEXTPROC>(loadProc("eglQueryDisplayAttribEXT"));
-    eglCreatePlatformPixmapSurfaceEXT = reinterpret_cast<PFNEGLCREATEPLATFORMPIXMAPSURFACEEXTPROC>(
-        loadProc("eglCreatePlatformPixmapSurfaceEXT"));
-    eglCreatePlatformWindowSurfaceEXT = reinterpret_cast<PFNEGLCREATEPLATFORMWINDOWSURFACEEXTPROC>(
-        loadProc("eglCreatePlatformWindowSurfaceEXT"));
-    eglGetPlatformDisplayEXT =
-        reinterpret_cast<PFNEGLGETPLATFORMDISPLAYEXTPROC>(loadProc("eglGetPlatformDisplayEXT"));
-    eglDebugMessageControlKHR =
-        reinterpret_cast<PFNEGLDEBUGMESSAGECONTROLKHRPROC>(loadProc("eglDebugMessageControlKHR"));
-    eglLabelObjectKHR = reinterpret_cast<PFNEGLLABELOBJECTKHRPROC>(loadProc("eglLabelObjectKHR"));
-    eglQueryDebugKHR  = reinterpret_cast<PFNEGLQUERYDEBUGKHRPROC>(loadProc("eglQueryDebugKHR"));
-    eglClientWaitSyncKHR =
-        reinterpret_cast<PFNEGLCLIENTWAITSYNCKHRPROC>(loadProc("eglClientWaitSyncKHR"));
-    eglCreateSyncKHR  = reinterpret_cast<PFNEGLCREATESYNCKHRPROC>(loadProc("eglCreateSyncKHR"));
-    eglDestroySyncKHR = reinterpret_cast<PFNEGLDESTROYSYNCKHRPROC>(loadProc("eglDestroySyncKHR"));
-    eglGetSyncAttribKHR =
-        reinterpret_cast<PFNEGLGETSYNCATTRIBKHRPROC>(loadProc("eglGetSyncAttribKHR"));
-    eglCreateImageKHR = reinterpret_cast<PFNEGLCREATEIMAGEKHRPROC>(loadProc("eglCreateImageKHR"));
-    eglDestroyImageKHR =
-        reinterpret_cast<PFNEGLDESTROYIMAGEKHRPROC>(loadProc("eglDestroyImageKHR"));
-    eglCreateStreamKHR =
-        reinterpret_cast<PFNEGLCREATESTREAMKHRPROC>(loadProc("eglCreateStreamKHR"));
-    eglDestroyStreamKHR =
-        reinterpret_cast<PFNEGLDESTROYSTREAMKHRPROC>(loadProc("eglDestroyStreamKHR"));
-    eglQueryStreamKHR = reinterpret_cast<PFNEGLQUERYSTREAMKHRPROC>(loadProc("eglQueryStreamKHR"));
-    eglQueryStreamu64KHR =
-        reinterpret_cast<PFNEGLQUERYSTREAMU64KHRPROC>(loadProc("eglQueryStreamu64KHR"));
-    eglStreamAttribKHR =
-        reinterpret_cast<PFNEGLSTREAMATTRIBKHRPROC>(loadProc("eglStreamAttribKHR"));
-    eglStreamConsumerAcquireKHR = reinterpret_cast<PFNEGLSTREAMCONSUMERACQUIREKHRPROC>(
-        loadProc("eglStreamConsumerAcquireKHR"));
-    eglStreamConsumerGLTextureExternalKHR =
-        reinterpret_cast<PFNEGLSTREAMCONSUMERGLTEXTUREEXTERNALKHRPROC>(
-            loadProc("eglStreamConsumerGLTextureExternalKHR"));
-    eglStreamConsumerReleaseKHR = reinterpret_cast<PFNEGLSTREAMCONSUMERRELEASEKHRPROC>(
-        loadProc("eglStreamConsumerReleaseKHR"));
-    eglSwapBuffersWithDamageKHR = reinterpret_cast<PFNEGLSWAPBUFFERSWITHDAMAGEKHRPROC>(
-        loadProc("eglSwapBuffersWithDamageKHR"));
-    eglWaitSyncKHR = reinterpret_cast<PFNEGLWAITSYNCKHRPROC>(loadProc("eglWaitSyncKHR"));
-    eglPostSubBufferNV =
-        reinterpret_cast<PFNEGLPOSTSUBBUFFERNVPROC>(loadProc("eglPostSubBufferNV"));
-    eglStreamConsumerGLTextureExternalAttribsNV =
-        reinterpret_cast<PFNEGLSTREAMCONSUMERGLTEXTUREEXTERNALATTRIBSNVPROC>(
-            loadProc("eglStreamConsumerGLTextureExternalAttribsNV"));
+    for (size_t index = 0; index < kProcCount; ++index)
+    {
+        *kProcs[index] = loadProc(kProcNames[index]);
+    }
+}
+
+void LoadEGLLazy(LoadProc loadProc)
+{
+    // loadProc may load from another library than the last time.
+    for (std::atomic<GenericProc> &slot : gLazyProcSlots)
+    {
+        slot.store(nullptr, std::memory_order_relaxed);
+    }
+
+    gLazyLoadProc = loadProc;
+    for (size_t index = 0; index < kProcCount; ++index)
+    {
+        *kProcs[index] = kLazyProcs[index] ? kLazyProcs[index] : loadProc(kProcNames[index]);
+    }
 }
 }  // namespace angle
@@ -115,6 +115,10 @@ namespace angle
 using GenericProc = void (*)();
 using LoadProc    = GenericProc(KHRONOS_APIENTRY *)(const char *);
 ANGLE_UTIL_EXPORT void LoadEGL(LoadProc loadProc);
+
+// Makes each core function load itself with loadProc on its first call instead. Extension functions
+// are loaded right away, so that they are null when loadProc doesn't find them.
+ANGLE_UTIL_EXPORT void LoadEGLLazy(LoadProc loadProc);
 }  // namespace angle
 
 #endif  // UTIL_EGL_LOADER_AUTOGEN_H_
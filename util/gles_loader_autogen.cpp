@@ -10,6 +10,12 @@
 
 #include "gles_loader_autogen.h"
 
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include <atomic>
+
 ANGLE_UTIL_EXPORT PFNGLALPHAFUNCPROC glAlphaFunc;
 ANGLE_UTIL_EXPORT PFNGLCLIPPLANEFPROC glClipPlanef;
 ANGLE_UTIL_EXPORT PFNGLCOLOR4FPROC glColor4f;
@@ -411,6 +417,7 @@ ANGLE_UTIL_EXPORT PFNGLVERTEXATTRIBFORMATPROC glVertexAttribFormat;
 ANGLE_UTIL_EXPORT PFNGLVERTEXATTRIBIFORMATPROC glVertexAttribIFormat;
 ANGLE_UTIL_EXPORT PFNGLVERTEXATTRIBBINDINGPROC glVertexAttribBinding;
 ANGLE_UTIL_EXPORT PFNGLVERTEXBINDINGDIVISORPROC glVertexBindingDivisor;
+ANGLE_UTIL_EXPORT PFNGLBATCHCOMMANDSANGLEPROC glBatchCommandsANGLE;
 ANGLE_UTIL_EXPORT PFNGLCOPYSUBTEXTURE3DANGLEPROC glCopySubTexture3DANGLE;
 ANGLE_UTIL_EXPORT PFNGLCOPYTEXTURE3DANGLEPROC glCopyTexture3DANGLE;
 ANGLE_UTIL_EXPORT PFNGLBLITFRAMEBUFFERANGLEPROC glBlitFramebufferANGLE;
@@ -1100,6 +1107,7 @@ ANGLE_UTIL_EXPORT PFNGLVERTEXATTRIBFORMATCONTEXTANGLEPROC glVertexAttribFormatCo
 ANGLE_UTIL_EXPORT PFNGLVERTEXATTRIBIFORMATCONTEXTANGLEPROC glVertexAttribIFormatContextANGLE;
 ANGLE_UTIL_EXPORT PFNGLVERTEXATTRIBBINDINGCONTEXTANGLEPROC glVertexAttribBindingContextANGLE;
 ANGLE_UTIL_EXPORT PFNGLVERTEXBINDINGDIVISORCONTEXTANGLEPROC glVertexBindingDivisorContextANGLE;
+ANGLE_UTIL_EXPORT PFNGLBATCHCOMMANDSANGLECONTEXTANGLEPROC glBatchCommandsANGLEContextANGLE;
 ANGLE_UTIL_EXPORT PFNGLCOPYSUBTEXTURE3DANGLECONTEXTANGLEPROC glCopySubTexture3DANGLEContextANGLE;
 ANGLE_UTIL_EXPORT PFNGLCOPYTEXTURE3DANGLECONTEXTANGLEPROC glCopyTexture3DANGLEContextANGLE;
 ANGLE_UTIL_EXPORT PFNGLBLITFRAMEBUFFERANGLECONTEXTANGLEPROC glBlitFramebufferANGLEContextANGLE;
@@ -1462,2569 +1470,3962 @@ ANGLE_UTIL_EXPORT PFNGLTEXGENXVOESCONTEXTANGLEPROC glTexGenxvOESContextANGLE;
 
 namespace angle
 {
+namespace
+{
+constexpr size_t kProcCount = 1294;
+
+constexpr const char *kProcNames[kProcCount] = {
+    "glAlphaFunc",
+    "glClipPlanef",
+    "glColor4f",
+    "glFogf",
+    "glFogfv",
+    "glFrustumf",
+    "glGetClipPlanef",
+    "glGetLightfv",
+    "glGetMaterialfv",
+    "glGetTexEnvfv",
+    "glLightModelf",
+    "glLightModelfv",
+    "glLightf",
+    "glLightfv",
+    "glLoadMatrixf",
+    "glMaterialf",
+    "glMaterialfv",
+    "glMultMatrixf",
+    "glMultiTexCoord4f",
+    "glNormal3f",
+    "glOrthof",
+    "glPointParameterf",
+    "glPointParameterfv",
+    "glPointSize",
+    "glRotatef",
+    "glScalef",
+    "glTexEnvf",
+    "glTexEnvfv",
+    "glTranslatef",
+    "glAlphaFuncx",
+    "glClearColorx",
+    "glClearDepthx",
+    "glClientActiveTexture",
+    "glClipPlanex",
+    "glColor4ub",
+    "glColor4x",
+    "glColorPointer",
+    "glDepthRangex",
+    "glDisableClientState",
+    "glEnableClientState",
+    "glFogx",
+    "glFogxv",
+    "glFrustumx",
+    "glGetClipPlanex",
+    "glGetFixedv",
+    "glGetLightxv",
+    "glGetMaterialxv",
+    "glGetPointerv",
+    "glGetTexEnviv",
+    "glGetTexEnvxv",
+    "glGetTexParameterxv",
+    "glLightModelx",
+    "glLightModelxv",
+    "glLightx",
+    "glLightxv",
+    "glLineWidthx",
+    "glLoadIdentity",
+    "glLoadMatrixx",
+    "glLogicOp",
+    "glMaterialx",
+    "glMaterialxv",
+    "glMatrixMode",
+    "glMultMatrixx",
+    "glMultiTexCoord4x",
+    "glNormal3x",
+    "glNormalPointer",
+    "glOrthox",
+    "glPointParameterx",
+    "glPointParameterxv",
+    "glPointSizex",
+    "glPolygonOffsetx",
+    "glPopMatrix",
+    "glPushMatrix",
+    "glRotatex",
+    "glSampleCoveragex",
+    "glScalex",
+    "glShadeModel",
+    "glTexCoordPointer",
+    "glTexEnvi",
+    "glTexEnvx",
+    "glTexEnviv",
+    "glTexEnvxv",
+    "glTexParameterx",
+    "glTexParameterxv",
+    "glTranslatex",
+    "glVertexPointer",
+    "glActiveTexture",
+    "glAttachShader",
+    "glBindAttribLocation",
+    "glBindBuffer",
+    "glBindFramebuffer",
+    "glBindRenderbuffer",
+    "glBindTexture",
+    "glBlendColor",
+    "glBlendEquation",
+    "glBlendEquationSeparate",
+    "glBlendFunc",
+    "glBlendFuncSeparate",
+    "glBufferData",
+    "glBufferSubData",
+    "glCheckFramebufferStatus",
+    "glClear",
+    "glClearColor",
+    "glClearDepthf",
+    "glClearStencil",
+    "glColorMask",
+    "glCompileShader",
+    "glCompressedTexImage2D",
+    "glCompressedTexSubImage2D",
+    "glCopyTexImage2D",
+    "glCopyTexSubImage2D",
+    "glCreateProgram",
+    "glCreateShader",
+    "glCullFace",
+    "glDeleteBuffers",
+    "glDeleteFramebuffers",
+    "glDeleteProgram",
+    "glDeleteRenderbuffers",
+    "glDeleteShader",
+    "glDeleteTextures",
+    "glDepthFunc",
+    "glDepthMask",
+    "glDepthRangef",
+    "glDetachShader",
+    "glDisable",
+    "glDisableVertexAttribArray",
+    "glDrawArrays",
+    "glDrawElements",
+    "glEnable",
+    "glEnableVertexAttribArray",
+    "glFinish",
+    "glFlush",
+    "glFramebufferRenderbuffer",
+    "glFramebufferTexture2D",
+    "glFrontFace",
+    "glGenBuffers",
+    "glGenerateMipmap",
+    "glGenFramebuffers",
+    "glGenRenderbuffers",
+    "glGenTextures",
+    "glGetActiveAttrib",
+    "glGetActiveUniform",
+    "glGetAttachedShaders",
+    "glGetAttribLocation",
+    "glGetBooleanv",
+    "glGetBufferParameteriv",
+    "glGetError",
+    "glGetFloatv",
+    "glGetFramebufferAttachmentParameteriv",
+    "glGetIntegerv",
+    "glGetProgramiv",
+    "glGetProgramInfoLog",
+    "glGetRenderbufferParameteriv",
+    "glGetShaderiv",
+    "glGetShaderInfoLog",
+    "glGetShaderPrecisionFormat",
+    "glGetShaderSource",
+    "glGetString",
+    "glGetTexParameterfv",
+    "glGetTexParameteriv",
+    "glGetUniformfv",
+    "glGetUniformiv",
+    "glGetUniformLocation",
+    "glGetVertexAttribfv",
+    "glGetVertexAttribiv",
+    "glGetVertexAttribPointerv",
+    "glHint",
+    "glIsBuffer",
+    "glIsEnabled",
+    "glIsFramebuffer",
+    "glIsProgram",
+    "glIsRenderbuffer",
+    "glIsShader",
+    "glIsTexture",
+    "glLineWidth",
+    "glLinkProgram",
+    "glPixelStorei",
+    "glPolygonOffset",
+    "glReadPixels",
+    "glReleaseShaderCompiler",
+    "glRenderbufferStorage",
+    "glSampleCoverage",
+    "glScissor",
+    "glShaderBinary",
+    "glShaderSource",
+    "glStencilFunc",
+    "glStencilFuncSeparate",
+    "glStencilMask",
+    "glStencilMaskSeparate",
+    "glStencilOp",
+    "glStencilOpSeparate",
+    "glTexImage2D",
+    "glTexParameterf",
+    "glTexParameterfv",
+    "glTexParameteri",
+    "glTexParameteriv",
+    "glTexSubImage2D",
+    "glUniform1f",
+    "glUniform1fv",
+    "glUniform1i",
+    "glUniform1iv",
+    "glUniform2f",
+    "glUniform2fv",
+    "glUniform2i",
+    "glUniform2iv",
+    "glUniform3f",
+    "glUniform3fv",
+    "glUniform3i",
+    "glUniform3iv",
+    "glUniform4f",
+    "glUniform4fv",
+    "glUniform4i",
+    "glUniform4iv",
+    "glUniformMatrix2fv",
+    "glUniformMatrix3fv",
+    "glUniformMatrix4fv",
+    "glUseProgram",
+    "glValidateProgram",
+    "glVertexAttrib1f",
+    "glVertexAttrib1fv",
+    "glVertexAttrib2f",
+    "glVertexAttrib2fv",
+    "glVertexAttrib3f",
+    "glVertexAttrib3fv",
+    "glVertexAttrib4f",
+    "glVertexAttrib4fv",
+    "glVertexAttribPointer",
+    "glViewport",
+    "glReadBuffer",
+    "glDrawRangeElements",
+    "glTexImage3D",
+    "glTexSubImage3D",
+    "glCopyTexSubImage3D",
+    "glCompressedTexImage3D",
+    "glCompressedTexSubImage3D",
+    "glGenQueries",
+    "glDeleteQueries",
+    "glIsQuery",
+    "glBeginQuery",
+    "glEndQuery",
+    "glGetQueryiv",
+    "glGetQueryObjectuiv",
+    "glUnmapBuffer",
+    "glGetBufferPointerv",
+    "glDrawBuffers",
+    "glUniformMatrix2x3fv",
+    "glUniformMatrix3x2fv",
+    "glUniformMatrix2x4fv",
+    "glUniformMatrix4x2fv",
+    "glUniformMatrix3x4fv",
+    "glUniformMatrix4x3fv",
+    "glBlitFramebuffer",
+    "glRenderbufferStorageMultisample",
+    "glFramebufferTextureLayer",
+    "glMapBufferRange",
+    "glFlushMappedBufferRange",
+    "glBindVertexArray",
+    "glDeleteVertexArrays",
+    "glGenVertexArrays",
+    "glIsVertexArray",
+    "glGetIntegeri_v",
+    "glBeginTransformFeedback",
+    "glEndTransformFeedback",
+    "glBindBufferRange",
+    "glBindBufferBase",
+    "glTransformFeedbackVaryings",
+    "glGetTransformFeedbackVarying",
+    "glVertexAttribIPointer",
+    "glGetVertexAttribIiv",
+    "glGetVertexAttribIuiv",
+    "glVertexAttribI4i",
+    "glVertexAttribI4ui",
+    "glVertexAttribI4iv",
+    "glVertexAttribI4uiv",
+    "glGetUniformuiv",
+    "glGetFragDataLocation",
+    "glUniform1ui",
+    "glUniform2ui",
+    "glUniform3ui",
+    "glUniform4ui",
+    "glUniform1uiv",
+    "glUniform2uiv",
+    "glUniform3uiv",
+    "glUniform4uiv",
+    "glClearBufferiv",
+    "glClearBufferuiv",
+    "glClearBufferfv",
+    "glClearBufferfi",
+    "glGetStringi",
+    "glCopyBufferSubData",
+    "glGetUniformIndices",
+    "glGetActiveUniformsiv",
+    "glGetUniformBlockIndex",
+    "glGetActiveUniformBlockiv",
+    "glGetActiveUniformBlockName",
+    "glUniformBlockBinding",
+    "glDrawArraysInstanced",
+    "glDrawElementsInstanced",
+    "glFenceSync",
+    "glIsSync",
+    "glDeleteSync",
+    "glClientWaitSync",
+    "glWaitSync",
+    "glGetInteger64v",
+    "glGetSynciv",
+    "glGetInteger64i_v",
+    "glGetBufferParameteri64v",
+    "glGenSamplers",
+    "glDeleteSamplers",
+    "glIsSampler",
+    "glBindSampler",
+    "glSamplerParameteri",
+    "glSamplerParameteriv",
+    "glSamplerParameterf",
+    "glSamplerParameterfv",
+    "glGetSamplerParameteriv",
+    "glGetSamplerParameterfv",
+    "glVertexAttribDivisor",
+    "glBindTransformFeedback",
+    "glDeleteTransformFeedbacks",
+    "glGenTransformFeedbacks",
+    "glIsTransformFeedback",
+    "glPauseTransformFeedback",
+    "glResumeTransformFeedback",
+    "glGetProgramBinary",
+    "glProgramBinary",
+    "glProgramParameteri",
+    "glInvalidateFramebuffer",
+    "glInvalidateSubFramebuffer",
+    "glTexStorage2D",
+    "glTexStorage3D",
+    "glGetInternalformativ",
+    "glDispatchCompute",
+    "glDispatchComputeIndirect",
+    "glDrawArraysIndirect",
+    "glDrawElementsIndirect",
+    "glFramebufferParameteri",
+    "glGetFramebufferParameteriv",
+    "glGetProgramInterfaceiv",
+    "glGetProgramResourceIndex",
+    "glGetProgramResourceName",
+    "glGetProgramResourceiv",
+    "glGetProgramResourceLocation",
+    "glUseProgramStages",
+    "glActiveShaderProgram",
+    "glCreateShaderProgramv",
+    "glBindProgramPipeline",
+    "glDeleteProgramPipelines",
+    "glGenProgramPipelines",
+    "glIsProgramPipeline",
+    "glGetProgramPipelineiv",
+    "glProgramUniform1i",
+    "glProgramUniform2i",
+    "glProgramUniform3i",
+    "glProgramUniform4i",
+    "glProgramUniform1ui",
+    "glProgramUniform2ui",
+    "glProgramUniform3ui",
+    "glProgramUniform4ui",
+    "glProgramUniform1f",
+    "glProgramUniform2f",
+    "glProgramUniform3f",
+    "glProgramUniform4f",
+    "glProgramUniform1iv",
+    "glProgramUniform2iv",
+    "glProgramUniform3iv",
+    "glProgramUniform4iv",
+    "glProgramUniform1uiv",
+    "glProgramUniform2uiv",
+    "glProgramUniform3uiv",
+    "glProgramUniform4uiv",
+    "glProgramUniform1fv",
+    "glProgramUniform2fv",
+    "glProgramUniform3fv",
+    "glProgramUniform4fv",
+    "glProgramUniformMatrix2fv",
+    "glProgramUniformMatrix3fv",
+    "glProgramUniformMatrix4fv",
+    "glProgramUniformMatrix2x3fv",
+    "glProgramUniformMatrix3x2fv",
+    "glProgramUniformMatrix2x4fv",
+    "glProgramUniformMatrix4x2fv",
+    "glProgramUniformMatrix3x4fv",
+    "glProgramUniformMatrix4x3fv",
+    "glValidateProgramPipeline",
+    "glGetProgramPipelineInfoLog",
+    "glBindImageTexture",
+    "glGetBooleani_v",
+    "glMemoryBarrier",
+    "glMemoryBarrierByRegion",
+    "glTexStorage2DMultisample",
+    "glGetMultisamplefv",
+    "glSampleMaski",
+    "glGetTexLevelParameteriv",
+    "glGetTexLevelParameterfv",
+    "glBindVertexBuffer",
+    "glVertexAttribFormat",
+    "glVertexAttribIFormat",
+    "glVertexAttribBinding",
+    "glVertexBindingDivisor",
+    "glBatchCommandsANGLE",
+    "glCopySubTexture3DANGLE",
+    "glCopyTexture3DANGLE",
+    "glBlitFramebufferANGLE",
+    "glRenderbufferStorageMultisampleANGLE",
+    "glDrawArraysInstancedANGLE",
+    "glDrawElementsInstancedANGLE",
+    "glVertexAttribDivisorANGLE",
+    "glMultiDrawArraysANGLE",
+    "glMultiDrawArraysInstancedANGLE",
+    "glMultiDrawElementsANGLE",
+    "glMultiDrawElementsInstancedANGLE",
+    "glProvokingVertexANGLE",
+    "glRequestExtensionANGLE",
+    "glCompressedTexImage2DRobustANGLE",
+    "glCompressedTexImage3DRobustANGLE",
+    "glCompressedTexSubImage2DRobustANGLE",
+    "glCompressedTexSubImage3DRobustANGLE",
+    "glGetActiveUniformBlockivRobustANGLE",
+    "glGetBooleani_vRobustANGLE",
+    "glGetBooleanvRobustANGLE",
+    "glGetBufferParameteri64vRobustANGLE",
+    "glGetBufferParameterivRobustANGLE",
+    "glGetBufferPointervRobustANGLE",
+    "glGetFloatvRobustANGLE",
+    "glGetFramebufferAttachmentParameterivRobustANGLE",
+    "glGetFramebufferParameterivRobustANGLE",
+    "glGetInteger64i_vRobustANGLE",
+    "glGetInteger64vRobustANGLE",
+    "glGetIntegeri_vRobustANGLE",
+    "glGetIntegervRobustANGLE",
+    "glGetInternalformativRobustANGLE",
+    "glGetMultisamplefvRobustANGLE",
+    "glGetPointervRobustANGLERobustANGLE",
+    "glGetProgramInterfaceivRobustANGLE",
+    "glGetProgramivRobustANGLE",
+    "glGetQueryObjecti64vRobustANGLE",
+    "glGetQueryObjectivRobustANGLE",
+    "glGetQueryObjectui64vRobustANGLE",
+    "glGetQueryObjectuivRobustANGLE",
+    "glGetQueryivRobustANGLE",
+    "glGetRenderbufferParameterivRobustANGLE",
+    "glGetSamplerParameterIivRobustANGLE",
+    "glGetSamplerParameterIuivRobustANGLE",
+    "glGetSamplerParameterfvRobustANGLE",
+    "glGetSamplerParameterivRobustANGLE",
+    "glGetShaderivRobustANGLE",
+    "glGetTexLevelParameterfvRobustANGLE",
+    "glGetTexLevelParameterivRobustANGLE",
+    "glGetTexParameterIivRobustANGLE",
+    "glGetTexParameterIuivRobustANGLE",
+    "glGetTexParameterfvRobustANGLE",
+    "glGetTexParameterivRobustANGLE",
+    "glGetUniformfvRobustANGLE",
+    "glGetUniformivRobustANGLE",
+    "glGetUniformuivRobustANGLE",
+    "glGetVertexAttribIivRobustANGLE",
+    "glGetVertexAttribIuivRobustANGLE",
+    "glGetVertexAttribPointervRobustANGLE",
+    "glGetVertexAttribfvRobustANGLE",
+    "glGetVertexAttribivRobustANGLE",
+    "glGetnUniformfvRobustANGLE",
+    "glGetnUniformivRobustANGLE",
+    "glGetnUniformuivRobustANGLE",
+    "glReadPixelsRobustANGLE",
+    "glReadnPixelsRobustANGLE",
+    "glSamplerParameterIivRobustANGLE",
+    "glSamplerParameterIuivRobustANGLE",
+    "glSamplerParameterfvRobustANGLE",
+    "glSamplerParameterivRobustANGLE",
+    "glTexImage2DRobustANGLE",
+    "glTexImage3DRobustANGLE",
+    "glTexParameterIivRobustANGLE",
+    "glTexParameterIuivRobustANGLE",
+    "glTexParameterfvRobustANGLE",
+    "glTexParameterivRobustANGLE",
+    "glTexSubImage2DRobustANGLE",
+    "glTexSubImage3DRobustANGLE",
+    "glGetMultisamplefvANGLE",
+    "glGetTexLevelParameterfvANGLE",
+    "glGetTexLevelParameterivANGLE",
+    "glSampleMaskiANGLE",
+    "glTexStorage2DMultisampleANGLE",
+    "glGetTranslatedShaderSourceANGLE",
+    "glBindUniformLocationCHROMIUM",
+    "glCompressedCopyTextureCHROMIUM",
+    "glCopySubTextureCHROMIUM",
+    "glCopyTextureCHROMIUM",
+    "glCoverageModulationCHROMIUM",
+    "glMatrixLoadIdentityCHROMIUM",
+    "glMatrixLoadfCHROMIUM",
+    "glLoseContextCHROMIUM",
+    "glBindFragmentInputLocationCHROMIUM",
+    "glCoverFillPathCHROMIUM",
+    "glCoverFillPathInstancedCHROMIUM",
+    "glCoverStrokePathCHROMIUM",
+    "glCoverStrokePathInstancedCHROMIUM",
+    "glDeletePathsCHROMIUM",
+    "glGenPathsCHROMIUM",
+    "glGetPathParameterfvCHROMIUM",
+    "glGetPathParameterivCHROMIUM",
+    "glIsPathCHROMIUM",
+    "glPathCommandsCHROMIUM",
+    "glPathParameterfCHROMIUM",
+    "glPathParameteriCHROMIUM",
+    "glPathStencilFuncCHROMIUM",
+    "glProgramPathFragmentInputGenCHROMIUM",
+    "glStencilFillPathCHROMIUM",
+    "glStencilFillPathInstancedCHROMIUM",
+    "glStencilStrokePathCHROMIUM",
+    "glStencilStrokePathInstancedCHROMIUM",
+    "glStencilThenCoverFillPathCHROMIUM",
+    "glStencilThenCoverFillPathInstancedCHROMIUM",
+    "glStencilThenCoverStrokePathCHROMIUM",
+    "glStencilThenCoverStrokePathInstancedCHROMIUM",
+    "glBindFragDataLocationEXT",
+    "glBindFragDataLocationIndexedEXT",
+    "glGetFragDataIndexEXT",
+    "glGetProgramResourceLocationIndexEXT",
+    "glInsertEventMarkerEXT",
+    "glPopGroupMarkerEXT",
+    "glPushGroupMarkerEXT",
+    "glDiscardFramebufferEXT",
+    "glBeginQueryEXT",
+    "glDeleteQueriesEXT",
+    "glEndQueryEXT",
+    "glGenQueriesEXT",
+    "glGetQueryObjecti64vEXT",
+    "glGetQueryObjectivEXT",
+    "glGetQueryObjectui64vEXT",
+    "glGetQueryObjectuivEXT",
+    "glGetQueryivEXT",
+    "glIsQueryEXT",
+    "glQueryCounterEXT",
+    "glDrawBuffersEXT",
+    "glFramebufferTextureEXT",
+    "glDrawArraysInstancedEXT",
+    "glDrawElementsInstancedEXT",
+    "glVertexAttribDivisorEXT",
+    "glFlushMappedBufferRangeEXT",
+    "glMapBufferRangeEXT",
+    "glBufferStorageMemEXT",
+    "glCreateMemoryObjectsEXT",
+    "glDeleteMemoryObjectsEXT",
+    "glGetMemoryObjectParameterivEXT",
+    "glGetUnsignedBytei_vEXT",
+    "glGetUnsignedBytevEXT",
+    "glIsMemoryObjectEXT",
+    "glMemoryObjectParameterivEXT",
+    "glTexStorageMem2DEXT",
+    "glTexStorageMem2DMultisampleEXT",
+    "glTexStorageMem3DEXT",
+    "glTexStorageMem3DMultisampleEXT",
+    "glImportMemoryFdEXT",
+    "glGetGraphicsResetStatusEXT",
+    "glGetnUniformfvEXT",
+    "glGetnUniformivEXT",
+    "glReadnPixelsEXT",
+    "glDeleteSemaphoresEXT",
+    "glGenSemaphoresEXT",
+    "glGetSemaphoreParameterui64vEXT",
+    "glIsSemaphoreEXT",
+    "glSemaphoreParameterui64vEXT",
+    "glSignalSemaphoreEXT",
+    "glWaitSemaphoreEXT",
+    "glImportSemaphoreFdEXT",
+    "glTexStorage1DEXT",
+    "glTexStorage2DEXT",
+    "glTexStorage3DEXT",
+    "glDebugMessageCallbackKHR",
+    "glDebugMessageControlKHR",
+    "glDebugMessageInsertKHR",
+    "glGetDebugMessageLogKHR",
+    "glGetObjectLabelKHR",
+    "glGetObjectPtrLabelKHR",
+    "glGetPointervKHR",
+    "glObjectLabelKHR",
+    "glObjectPtrLabelKHR",
+    "glPopDebugGroupKHR",
+    "glPushDebugGroupKHR",
+    "glMaxShaderCompilerThreadsKHR",
+    "glDeleteFencesNV",
+    "glFinishFenceNV",
+    "glGenFencesNV",
+    "glGetFenceivNV",
+    "glIsFenceNV",
+    "glSetFenceNV",
+    "glTestFenceNV",
+    "glEGLImageTargetRenderbufferStorageOES",
+    "glEGLImageTargetTexture2DOES",
+    "glGetProgramBinaryOES",
+    "glProgramBinaryOES",
+    "glGetBufferPointervOES",
+    "glMapBufferOES",
+    "glUnmapBufferOES",
+    "glGetSamplerParameterIivOES",
+    "glGetSamplerParameterIuivOES",
+    "glGetTexParameterIivOES",
+    "glGetTexParameterIuivOES",
+    "glSamplerParameterIivOES",
+    "glSamplerParameterIuivOES",
+    "glTexParameterIivOES",
+    "glTexParameterIuivOES",
+    "glTexStorage3DMultisampleOES",
+    "glBindVertexArrayOES",
+    "glDeleteVertexArraysOES",
+    "glGenVertexArraysOES",
+    "glIsVertexArrayOES",
+    "glFramebufferTextureMultiviewOVR",
+    "glDrawTexfOES",
+    "glDrawTexfvOES",
+    "glDrawTexiOES",
+    "glDrawTexivOES",
+    "glDrawTexsOES",
+    "glDrawTexsvOES",
+    "glDrawTexxOES",
+    "glDrawTexxvOES",
+    "glBindFramebufferOES",
+    "glBindRenderbufferOES",
+    "glCheckFramebufferStatusOES",
+    "glDeleteFramebuffersOES",
+    "glDeleteRenderbuffersOES",
+    "glFramebufferRenderbufferOES",
+    "glFramebufferTexture2DOES",
+    "glGenFramebuffersOES",
+    "glGenRenderbuffersOES",
+    "glGenerateMipmapOES",
+    "glGetFramebufferAttachmentParameterivOES",
+    "glGetRenderbufferParameterivOES",
+    "glIsFramebufferOES",
+    "glIsRenderbufferOES",
+    "glRenderbufferStorageOES",
+    "glCurrentPaletteMatrixOES",
+    "glLoadPaletteFromModelViewMatrixOES",
+    "glMatrixIndexPointerOES",
+    "glWeightPointerOES",
+    "glPointSizePointerOES",
+    "glQueryMatrixxOES",
+    "glGetTexGenfvOES",
+    "glGetTexGenivOES",
+    "glGetTexGenxvOES",
+    "glTexGenfOES",
+    "glTexGenfvOES",
+    "glTexGeniOES",
+    "glTexGenivOES",
+    "glTexGenxOES",
+    "glTexGenxvOES",
+    "glAlphaFuncContextANGLE",
+    "glClipPlanefContextANGLE",
+    "glColor4fContextANGLE",
+    "glFogfContextANGLE",
+    "glFogfvContextANGLE",
+    "glFrustumfContextANGLE",
+    "glGetClipPlanefContextANGLE",
+    "glGetLightfvContextANGLE",
+    "glGetMaterialfvContextANGLE",
+    "glGetTexEnvfvContextANGLE",
+    "glLightModelfContextANGLE",
+    "glLightModelfvContextANGLE",
+    "glLightfContextANGLE",
+    "glLightfvContextANGLE",
+    "glLoadMatrixfContextANGLE",
+    "glMaterialfContextANGLE",
+    "glMaterialfvContextANGLE",
+    "glMultMatrixfContextANGLE",
+    "glMultiTexCoord4fContextANGLE",
+    "glNormal3fContextANGLE",
+    "glOrthofContextANGLE",
+    "glPointParameterfContextANGLE",
+    "glPointParameterfvContextANGLE",
+    "glPointSizeContextANGLE",
+    "glRotatefContextANGLE",
+    "glScalefContextANGLE",
+    "glTexEnvfContextANGLE",
+    "glTexEnvfvContextANGLE",
+    "glTranslatefContextANGLE",
+    "glAlphaFuncxContextANGLE",
+    "glClearColorxContextANGLE",
+    "glClearDepthxContextANGLE",
+    "glClientActiveTextureContextANGLE",
+    "glClipPlanexContextANGLE",
+    "glColor4ubContextANGLE",
+    "glColor4xContextANGLE",
+    "glColorPointerContextANGLE",
+    "glDepthRangexContextANGLE",
+    "glDisableClientStateContextANGLE",
+    "glEnableClientStateContextANGLE",
+    "glFogxContextANGLE",
+    "glFogxvContextANGLE",
+    "glFrustumxContextANGLE",
+    "glGetClipPlanexContextANGLE",
+    "glGetFixedvContextANGLE",
+    "glGetLightxvContextANGLE",
+    "glGetMaterialxvContextANGLE",
+    "glGetPointervContextANGLE",
+    "glGetTexEnvivContextANGLE",
+    "glGetTexEnvxvContextANGLE",
+    "glGetTexParameterxvContextANGLE",
+    "glLightModelxContextANGLE",
+    "glLightModelxvContextANGLE",
+    "glLightxContextANGLE",
+    "glLightxvContextANGLE",
+    "glLineWidthxContextANGLE",
+    "glLoadIdentityContextANGLE",
+    "glLoadMatrixxContextANGLE",
+    "glLogicOpContextANGLE",
+    "glMaterialxContextANGLE",
+    "glMaterialxvContextANGLE",
+    "glMatrixModeContextANGLE",
+    "glMultMatrixxContextANGLE",
+    "glMultiTexCoord4xContextANGLE",
+    "glNormal3xContextANGLE",
+    "glNormalPointerContextANGLE",
+    "glOrthoxContextANGLE",
+    "glPointParameterxContextANGLE",
+    "glPointParameterxvContextANGLE",
+    "glPointSizexContextANGLE",
+    "glPolygonOffsetxContextANGLE",
+    "glPopMatrixContextANGLE",
+    "glPushMatrixContextANGLE",
+    "glRotatexContextANGLE",
+    "glSampleCoveragexContextANGLE",
+    "glScalexContextANGLE",
+    "glShadeModelContextANGLE",
+    "glTexCoordPointerContextANGLE",
+    "glTexEnviContextANGLE",
+    "glTexEnvxContextANGLE",
+    "glTexEnvivContextANGLE",
+    "glTexEnvxvContextANGLE",
+    "glTexParameterxContextANGLE",
+    "glTexParameterxvContextANGLE",
+    "glTranslatexContextANGLE",
+    "glVertexPointerContextANGLE",
+    "glActiveTextureContextANGLE",
+    "glAttachShaderContextANGLE",
+    "glBindAttribLocationContextANGLE",
+    "glBindBufferContextANGLE",
+    "glBindFramebufferContextANGLE",
+    "glBindRenderbufferContextANGLE",
+    "glBindTextureContextANGLE",
+    "glBlendColorContextANGLE",
+    "glBlendEquationContextANGLE",
+    "glBlendEquationSeparateContextANGLE",
+    "glBlendFuncContextANGLE",
+    "glBlendFuncSeparateContextANGLE",
+    "glBufferDataContextANGLE",
+    "glBufferSubDataContextANGLE",
+    "glCheckFramebufferStatusContextANGLE",
+    "glClearContextANGLE",
+    "glClearColorContextANGLE",
+    "glClearDepthfContextANGLE",
+    "glClearStencilContextANGLE",
+    "glColorMaskContextANGLE",
+    "glCompileShaderContextANGLE",
+    "glCompressedTexImage2DContextANGLE",
+    "glCompressedTexSubImage2DContextANGLE",
+    "glCopyTexImage2DContextANGLE",
+    "glCopyTexSubImage2DContextANGLE",
+    "glCreateProgramContextANGLE",
+    "glCreateShaderContextANGLE",
+    "glCullFaceContextANGLE",
+    "glDeleteBuffersContextANGLE",
+    "glDeleteFramebuffersContextANGLE",
+    "glDeleteProgramContextANGLE",
+    "glDeleteRenderbuffersContextANGLE",
+    "glDeleteShaderContextANGLE",
+    "glDeleteTexturesContextANGLE",
+    "glDepthFuncContextANGLE",
+    "glDepthMaskContextANGLE",
+    "glDepthRangefContextANGLE",
+    "glDetachShaderContextANGLE",
+    "glDisableContextANGLE",
+    "glDisableVertexAttribArrayContextANGLE",
+    "glDrawArraysContextANGLE",
+    "glDrawElementsContextANGLE",
+    "glEnableContextANGLE",
+    "glEnableVertexAttribArrayContextANGLE",
+    "glFinishContextANGLE",
+    "glFlushContextANGLE",
+    "glFramebufferRenderbufferContextANGLE",
+    "glFramebufferTexture2DContextANGLE",
+    "glFrontFaceContextANGLE",
+    "glGenBuffersContextANGLE",
+    "glGenerateMipmapContextANGLE",
+    "glGenFramebuffersContextANGLE",
+    "glGenRenderbuffersContextANGLE",
+    "glGenTexturesContextANGLE",
+    "glGetActiveAttribContextANGLE",
+    "glGetActiveUniformContextANGLE",
+    "glGetAttachedShadersContextANGLE",
+    "glGetAttribLocationContextANGLE",
+    "glGetBooleanvContextANGLE",
+    "glGetBufferParameterivContextANGLE",
+    "glGetErrorContextANGLE",
+    "glGetFloatvContextANGLE",
+    "glGetFramebufferAttachmentParameterivContextANGLE",
+    "glGetIntegervContextANGLE",
+    "glGetProgramivContextANGLE",
+    "glGetProgramInfoLogContextANGLE",
+    "glGetRenderbufferParameterivContextANGLE",
+    "glGetShaderivContextANGLE",
+    "glGetShaderInfoLogContextANGLE",
+    "glGetShaderPrecisionFormatContextANGLE",
+    "glGetShaderSourceContextANGLE",
+    "glGetStringContextANGLE",
+    "glGetTexParameterfvContextANGLE",
+    "glGetTexParameterivContextANGLE",
+    "glGetUniformfvContextANGLE",
+    "glGetUniformivContextANGLE",
+    "glGetUniformLocationContextANGLE",
+    "glGetVertexAttribfvContextANGLE",
+    "glGetVertexAttribivContextANGLE",
+    "glGetVertexAttribPointervContextANGLE",
+    "glHintContextANGLE",
+    "glIsBufferContextANGLE",
+    "glIsEnabledContextANGLE",
+    "glIsFramebufferContextANGLE",
+    "glIsProgramContextANGLE",
+    "glIsRenderbufferContextANGLE",
+    "glIsShaderContextANGLE",
+    "glIsTextureContextANGLE",
+    "glLineWidthContextANGLE",
+    "glLinkProgramContextANGLE",
+    "glPixelStoreiContextANGLE",
+    "glPolygonOffsetContextANGLE",
+    "glReadPixelsContextANGLE",
+    "glReleaseShaderCompilerContextANGLE",
+    "glRenderbufferStorageContextANGLE",
+    "glSampleCoverageContextANGLE",
+    "glScissorContextANGLE",
+    "glShaderBinaryContextANGLE",
+    "glShaderSourceContextANGLE",
+    "glStencilFuncContextANGLE",
+    "glStencilFuncSeparateContextANGLE",
+    "glStencilMaskContextANGLE",
+    "glStencilMaskSeparateContextANGLE",
+    "glStencilOpContextANGLE",
+    "glStencilOpSeparateContextANGLE",
+    "glTexImage2DContextANGLE",
+    "glTexParameterfContextANGLE",
+    "glTexParameterfvContextANGLE",
+    "glTexParameteriContextANGLE",
+    "glTexParameterivContextANGLE",
+    "glTexSubImage2DContextANGLE",
+    "glUniform1fContextANGLE",
+    "glUniform1fvContextANGLE",
+    "glUniform1iContextANGLE",
+    "glUniform1ivContextANGLE",
+    "glUniform2fContextANGLE",
+    "glUniform2fvContextANGLE",
+    "glUniform2iContextANGLE",
+    "glUniform2ivContextANGLE",
+    "glUniform3fContextANGLE",
+    "glUniform3fvContextANGLE",
+    "glUniform3iContextANGLE",
+    "glUniform3ivContextANGLE",
+    "glUniform4fContextANGLE",
+    "glUniform4fvContextANGLE",
+    "glUniform4iContextANGLE",
+    "glUniform4ivContextANGLE",
+    "glUniformMatrix2fvContextANGLE",
+    "glUniformMatrix3fvContextANGLE",
+    "glUniformMatrix4fvContextANGLE",
+    "glUseProgramContextANGLE",
+    "glValidateProgramContextANGLE",
+    "glVertexAttrib1fContextANGLE",
+    "glVertexAttrib1fvContextANGLE",
+    "glVertexAttrib2fContextANGLE",
+    "glVertexAttrib2fvContextANGLE",
+    "glVertexAttrib3fContextANGLE",
+    "glVertexAttrib3fvContextANGLE",
+    "glVertexAttrib4fContextANGLE",
+    "glVertexAttrib4fvContextANGLE",
+    "glVertexAttribPointerContextANGLE",
+    "glViewportContextANGLE",
+    "glReadBufferContextANGLE",
+    "glDrawRangeElementsContextANGLE",
+    "glTexImage3DContextANGLE",
+    "glTexSubImage3DContextANGLE",
+    "glCopyTexSubImage3DContextANGLE",
+    "glCompressedTexImage3DContextANGLE",
+    "glCompressedTexSubImage3DContextANGLE",
+    "glGenQueriesContextANGLE",
+    "glDeleteQueriesContextANGLE",
+    "glIsQueryContextANGLE",
+    "glBeginQueryContextANGLE",
+    "glEndQueryContextANGLE",
+    "glGetQueryivContextANGLE",
+    "glGetQueryObjectuivContextANGLE",
+    "glUnmapBufferContextANGLE",
+    "glGetBufferPointervContextANGLE",
+    "glDrawBuffersContextANGLE",
+    "glUniformMatrix2x3fvContextANGLE",
+    "glUniformMatrix3x2fvContextANGLE",
+    "glUniformMatrix2x4fvContextANGLE",
+    "glUniformMatrix4x2fvContextANGLE",
+    "glUniformMatrix3x4fvContextANGLE",
+    "glUniformMatrix4x3fvContextANGLE",
+    "glBlitFramebufferContextANGLE",
+    "glRenderbufferStorageMultisampleContextANGLE",
+    "glFramebufferTextureLayerContextANGLE",
+    "glMapBufferRangeContextANGLE",
+    "glFlushMappedBufferRangeContextANGLE",
+    "glBindVertexArrayContextANGLE",
+    "glDeleteVertexArraysContextANGLE",
+    "glGenVertexArraysContextANGLE",
+    "glIsVertexArrayContextANGLE",
+    "glGetIntegeri_vContextANGLE",
+    "glBeginTransformFeedbackContextANGLE",
+    "glEndTransformFeedbackContextANGLE",
+    "glBindBufferRangeContextANGLE",
+    "glBindBufferBaseContextANGLE",
+    "glTransformFeedbackVaryingsContextANGLE",
+    "glGetTransformFeedbackVaryingContextANGLE",
+    "glVertexAttribIPointerContextANGLE",
+    "glGetVertexAttribIivContextANGLE",
+    "glGetVertexAttribIuivContextANGLE",
+    "glVertexAttribI4iContextANGLE",
+    "glVertexAttribI4uiContextANGLE",
+    "glVertexAttribI4ivContextANGLE",
+    "glVertexAttribI4uivContextANGLE",
+    "glGetUniformuivContextANGLE",
+    "glGetFragDataLocationContextANGLE",
+    "glUniform1uiContextANGLE",
+    "glUniform2uiContextANGLE",
+    "glUniform3uiContextANGLE",
+    "glUniform4uiContextANGLE",
+    "glUniform1uivContextANGLE",
+    "glUniform2uivContextANGLE",
+    "glUniform3uivContextANGLE",
+    "glUniform4uivContextANGLE",
+    "glClearBufferivContextANGLE",
+    "glClearBufferuivContextANGLE",
+    "glClearBufferfvContextANGLE",
+    "glClearBufferfiContextANGLE",
+    "glGetStringiContextANGLE",
+    "glCopyBufferSubDataContextANGLE",
+    "glGetUniformIndicesContextANGLE",
+    "glGetActiveUniformsivContextANGLE",
+    "glGetUniformBlockIndexContextANGLE",
+    "glGetActiveUniformBlockivContextANGLE",
+    "glGetActiveUniformBlockNameContextANGLE",
+    "glUniformBlockBindingContextANGLE",
+    "glDrawArraysInstancedContextANGLE",
+    "glDrawElementsInstancedContextANGLE",
+    "glFenceSyncContextANGLE",
+    "glIsSyncContextANGLE",
+    "glDeleteSyncContextANGLE",
+    "glClientWaitSyncContextANGLE",
+    "glWaitSyncContextANGLE",
+    "glGetInteger64vContextANGLE",
+    "glGetSyncivContextANGLE",
+    "glGetInteger64i_vContextANGLE",
+    "glGetBufferParameteri64vContextANGLE",
+    "glGenSamplersContextANGLE",
+    "glDeleteSamplersContextANGLE",
+    "glIsSamplerContextANGLE",
+    "glBindSamplerContextANGLE",
+    "glSamplerParameteriContextANGLE",
+    "glSamplerParameterivContextANGLE",
+    "glSamplerParameterfContextANGLE",
+    "glSamplerParameterfvContextANGLE",
+    "glGetSamplerParameterivContextANGLE",
+    "glGetSamplerParameterfvContextANGLE",
+    "glVertexAttribDivisorContextANGLE",
+    "glBindTransformFeedbackContextANGLE",
+    "glDeleteTransformFeedbacksContextANGLE",
+    "glGenTransformFeedbacksContextANGLE",
+    "glIsTransformFeedbackContextANGLE",
+    "glPauseTransformFeedbackContextANGLE",
+    "glResumeTransformFeedbackContextANGLE",
+    "glGetProgramBinaryContextANGLE",
+    "glProgramBinaryContextANGLE",
+    "glProgramParameteriContextANGLE",
+    "glInvalidateFramebufferContextANGLE",
+    "glInvalidateSubFramebufferContextANGLE",
+    "glTexStorage2DContextANGLE",
+    "glTexStorage3DContextANGLE",
+    "glGetInternalformativContextANGLE",
+    "glDispatchComputeContextANGLE",
+    "glDispatchComputeIndirectContextANGLE",
+    "glDrawArraysIndirectContextANGLE",
+    "glDrawElementsIndirectContextANGLE",
+    "glFramebufferParameteriContextANGLE",
+    "glGetFramebufferParameterivContextANGLE",
+    "glGetProgramInterfaceivContextANGLE",
+    "glGetProgramResourceIndexContextANGLE",
+    "glGetProgramResourceNameContextANGLE",
+    "glGetProgramResourceivContextANGLE",
+    "glGetProgramResourceLocationContextANGLE",
+    "glUseProgramStagesContextANGLE",
+    "glActiveShaderProgramContextANGLE",
+    "glCreateShaderProgramvContextANGLE",
+    "glBindProgramPipelineContextANGLE",
+    "glDeleteProgramPipelinesContextANGLE",
+    "glGenProgramPipelinesContextANGLE",
+    "glIsProgramPipelineContextANGLE",
+    "glGetProgramPipelineivContextANGLE",
+    "glProgramUniform1iContextANGLE",
+    "glProgramUniform2iContextANGLE",
+    "glProgramUniform3iContextANGLE",
+    "glProgramUniform4iContextANGLE",
+    "glProgramUniform1uiContextANGLE",
+    "glProgramUniform2uiContextANGLE",
+    "glProgramUniform3uiContextANGLE",
+    "glProgramUniform4uiContextANGLE",
+    "glProgramUniform1fContextANGLE",
+    "glProgramUniform2fContextANGLE",
+    "glProgramUniform3fContextANGLE",
+    "glProgramUniform4fContextANGLE",
+    "glProgramUniform1ivContextANGLE",
+    "glProgramUniform2ivContextANGLE",
+    "glProgramUniform3ivContextANGLE",
+    "glProgramUniform4ivContextANGLE",
+    "glProgramUniform1uivContextANGLE",
+    "glProgramUniform2uivContextANGLE",
+    "glProgramUniform3uivContextANGLE",
+    "glProgramUniform4uivContextANGLE",
+    "glProgramUniform1fvContextANGLE",
+    "glProgramUniform2fvContextANGLE",
+    "glProgramUniform3fvContextANGLE",
+    "glProgramUniform4fvContextANGLE",
+    "glProgramUniformMatrix2fvContextANGLE",
+    "glProgramUniformMatrix3fvContextANGLE",
+    "glProgramUniformMatrix4fvContextANGLE",
+    "glProgramUniformMatrix2x3fvContextANGLE",
+    "glProgramUniformMatrix3x2fvContextANGLE",
+    "glProgramUniformMatrix2x4fvContextANGLE",
+    "glProgramUniformMatrix4x2fvContextANGLE",
+    "glProgramUniformMatrix3x4fvContextANGLE",
+    "glProgramUniformMatrix4x3fvContextANGLE",
+    "glValidateProgramPipelineContextANGLE",
+    "glGetProgramPipelineInfoLogContextANGLE",
+    "glBindImageTextureContextANGLE",
+    "glGetBooleani_vContextANGLE",
+    "glMemoryBarrierContextANGLE",
+    "glMemoryBarrierByRegionContextANGLE",
+    "glTexStorage2DMultisampleContextANGLE",
+    "glGetMultisamplefvContextANGLE",
+    "glSampleMaskiContextANGLE",
+    "glGetTexLevelParameterivContextANGLE",
+    "glGetTexLevelParameterfvContextANGLE",
+    "glBindVertexBufferContextANGLE",
+    "glVertexAttribFormatContextANGLE",
+    "glVertexAttribIFormatContextANGLE",
+    "glVertexAttribBindingContextANGLE",
+    "glVertexBindingDivisorContextANGLE",
+    "glBatchCommandsANGLEContextANGLE",
+    "glCopySubTexture3DANGLEContextANGLE",
+    "glCopyTexture3DANGLEContextANGLE",
+    "glBlitFramebufferANGLEContextANGLE",
+    "glRenderbufferStorageMultisampleANGLEContextANGLE",
+    "glDrawArraysInstancedANGLEContextANGLE",
+    "glDrawElementsInstancedANGLEContextANGLE",
+    "glVertexAttribDivisorANGLEContextANGLE",
+    "glMultiDrawArraysANGLEContextANGLE",
+    "glMultiDrawArraysInstancedANGLEContextANGLE",
+    "glMultiDrawElementsANGLEContextANGLE",
+    "glMultiDrawElementsInstancedANGLEContextANGLE",
+    "glProvokingVertexANGLEContextANGLE",
+    "glRequestExtensionANGLEContextANGLE",
+    "glCompressedTexImage2DRobustANGLEContextANGLE",
+    "glCompressedTexImage3DRobustANGLEContextANGLE",
+    "glCompressedTexSubImage2DRobustANGLEContextANGLE",
+    "glCompressedTexSubImage3DRobustANGLEContextANGLE",
+    "glGetActiveUniformBlockivRobustANGLEContextANGLE",
+    "glGetBooleani_vRobustANGLEContextANGLE",
+    "glGetBooleanvRobustANGLEContextANGLE",
+    "glGetBufferParameteri64vRobustANGLEContextANGLE",
+    "glGetBufferParameterivRobustANGLEContextANGLE",
+    "glGetBufferPointervRobustANGLEContextANGLE",
+    "glGetFloatvRobustANGLEContextANGLE",
+    "glGetFramebufferAttachmentParameterivRobustANGLEContextANGLE",
+    "glGetFramebufferParameterivRobustANGLEContextANGLE",
+    "glGetInteger64i_vRobustANGLEContextANGLE",
+    "glGetInteger64vRobustANGLEContextANGLE",
+    "glGetIntegeri_vRobustANGLEContextANGLE",
+    "glGetIntegervRobustANGLEContextANGLE",
+    "glGetInternalformativRobustANGLEContextANGLE",
+    "glGetMultisamplefvRobustANGLEContextANGLE",
+    "glGetPointervRobustANGLERobustANGLEContextANGLE",
+    "glGetProgramInterfaceivRobustANGLEContextANGLE",
+    "glGetProgramivRobustANGLEContextANGLE",
+    "glGetQueryObjecti64vRobustANGLEContextANGLE",
+    "glGetQueryObjectivRobustANGLEContextANGLE",
+    "glGetQueryObjectui64vRobustANGLEContextANGLE",
+    "glGetQueryObjectuivRobustANGLEContextANGLE",
+    "glGetQueryivRobustANGLEContextANGLE",
+    "glGetRenderbufferParameterivRobustANGLEContextANGLE",
+    "glGetSamplerParameterIivRobustANGLEContextANGLE",
+    "glGetSamplerParameterIuivRobustANGLEContextANGLE",
+    "glGetSamplerParameterfvRobustANGLEContextANGLE",
+    "glGetSamplerParameterivRobustANGLEContextANGLE",
+    "glGetShaderivRobustANGLEContextANGLE",
+    "glGetTexLevelParameterfvRobustANGLEContextANGLE",
+    "glGetTexLevelParameterivRobustANGLEContextANGLE",
+    "glGetTexParameterIivRobustANGLEContextANGLE",
+    "glGetTexParameterIuivRobustANGLEContextANGLE",
+    "glGetTexParameterfvRobustANGLEContextANGLE",
+    "glGetTexParameterivRobustANGLEContextANGLE",
+    "glGetUniformfvRobustANGLEContextANGLE",
+    "glGetUniformivRobustANGLEContextANGLE",
+    "glGetUniformuivRobustANGLEContextANGLE",
+    "glGetVertexAttribIivRobustANGLEContextANGLE",
+    "glGetVertexAttribIuivRobustANGLEContextANGLE",
+    "glGetVertexAttribPointervRobustANGLEContextANGLE",
+    "glGetVertexAttribfvRobustANGLEContextANGLE",
+    "glGetVertexAttribivRobustANGLEContextANGLE",
+    "glGetnUniformfvRobustANGLEContextANGLE",
+    "glGetnUniformivRobustANGLEContextANGLE",
+    "glGetnUniformuivRobustANGLEContextANGLE",
+    "glReadPixelsRobustANGLEContextANGLE",
+    "glReadnPixelsRobustANGLEContextANGLE",
+    "glSamplerParameterIivRobustANGLEContextANGLE",
+    "glSamplerParameterIuivRobustANGLEContextANGLE",
+    "glSamplerParameterfvRobustANGLEContextANGLE",
+    "glSamplerParameterivRobustANGLEContextANGLE",
+    "glTexImage2DRobustANGLEContextANGLE",
+    "glTexImage3DRobustANGLEContextANGLE",
+    "glTexParameterIivRobustANGLEContextANGLE",
+    "glTexParameterIuivRobustANGLEContextANGLE",
+    "glTexParameterfvRobustANGLEContextANGLE",
+    "glTexParameterivRobustANGLEContextANGLE",
+    "glTexSubImage2DRobustANGLEContextANGLE",
+    "glTexSubImage3DRobustANGLEContextANGLE",
+    "glGetMultisamplefvANGLEContextANGLE",
+    "glGetTexLevelParameterfvANGLEContextANGLE",
+    "glGetTexLevelParameterivANGLEContextANGLE",
+    "glSampleMaskiANGLEContextANGLE",
+    "glTexStorage2DMultisampleANGLEContextANGLE",
+    "glGetTranslatedShaderSourceANGLEContextANGLE",
+    "glBindUniformLocationCHROMIUMContextANGLE",
+    "glCompressedCopyTextureCHROMIUMContextANGLE",
+    "glCopySubTextureCHROMIUMContextANGLE",
+    "glCopyTextureCHROMIUMContextANGLE",
+    "glCoverageModulationCHROMIUMContextANGLE",
+    "glMatrixLoadIdentityCHROMIUMContextANGLE",
+    "glMatrixLoadfCHROMIUMContextANGLE",
+    "glLoseContextCHROMIUMContextANGLE",
+    "glBindFragmentInputLocationCHROMIUMContextANGLE",
+    "glCoverFillPathCHROMIUMContextANGLE",
+    "glCoverFillPathInstancedCHROMIUMContextANGLE",
+    "glCoverStrokePathCHROMIUMContextANGLE",
+    "glCoverStrokePathInstancedCHROMIUMContextANGLE",
+    "glDeletePathsCHROMIUMContextANGLE",
+    "glGenPathsCHROMIUMContextANGLE",
+    "glGetPathParameterfvCHROMIUMContextANGLE",
+    "glGetPathParameterivCHROMIUMContextANGLE",
+    "glIsPathCHROMIUMContextANGLE",
+    "glPathCommandsCHROMIUMContextANGLE",
+    "glPathParameterfCHROMIUMContextANGLE",
+    "glPathParameteriCHROMIUMContextANGLE",
+    "glPathStencilFuncCHROMIUMContextANGLE",
+    "glProgramPathFragmentInputGenCHROMIUMContextANGLE",
+    "glStencilFillPathCHROMIUMContextANGLE",
+    "glStencilFillPathInstancedCHROMIUMContextANGLE",
+    "glStencilStrokePathCHROMIUMContextANGLE",
+    "glStencilStrokePathInstancedCHROMIUMContextANGLE",
+    "glStencilThenCoverFillPathCHROMIUMContextANGLE",
+    "glStencilThenCoverFillPathInstancedCHROMIUMContextANGLE",
+    "glStencilThenCoverStrokePathCHROMIUMContextANGLE",
+    "glStencilThenCoverStrokePathInstancedCHROMIUMContextANGLE",
+    "glBindFragDataLocationEXTContextANGLE",
+    "glBindFragDataLocationIndexedEXTContextANGLE",
+    "glGetFragDataIndexEXTContextANGLE",
+    "glGetProgramResourceLocationIndexEXTContextANGLE",
+    "glInsertEventMarkerEXTContextANGLE",
+    "glPopGroupMarkerEXTContextANGLE",
+    "glPushGroupMarkerEXTContextANGLE",
+    "glDiscardFramebufferEXTContextANGLE",
+    "glBeginQueryEXTContextANGLE",
+    "glDeleteQueriesEXTContextANGLE",
+    "glEndQueryEXTContextANGLE",
+    "glGenQueriesEXTContextANGLE",
+    "glGetQueryObjecti64vEXTContextANGLE",
+    "glGetQueryObjectivEXTContextANGLE",
+    "glGetQueryObjectui64vEXTContextANGLE",
+    "glGetQueryObjectuivEXTContextANGLE",
+    "glGetQueryivEXTContextANGLE",
+    "glIsQueryEXTContextANGLE",
+    "glQueryCounterEXTContextANGLE",
+    "glDrawBuffersEXTContextANGLE",
+    "glFramebufferTextureEXTContextANGLE",
+    "glDrawArraysInstancedEXTContextANGLE",
+    "glDrawElementsInstancedEXTContextANGLE",
+    "glVertexAttribDivisorEXTContextANGLE",
+    "glFlushMappedBufferRangeEXTContextANGLE",
+    "glMapBufferRangeEXTContextANGLE",
+    "glBufferStorageMemEXTContextANGLE",
+    "glCreateMemoryObjectsEXTContextANGLE",
+    "glDeleteMemoryObjectsEXTContextANGLE",
+    "glGetMemoryObjectParameterivEXTContextANGLE",
+    "glGetUnsignedBytei_vEXTContextANGLE",
+    "glGetUnsignedBytevEXTContextANGLE",
+    "glIsMemoryObjectEXTContextANGLE",
+    "glMemoryObjectParameterivEXTContextANGLE",
+    "glTexStorageMem2DEXTContextANGLE",
+    "glTexStorageMem2DMultisampleEXTContextANGLE",
+    "glTexStorageMem3DEXTContextANGLE",
+    "glTexStorageMem3DMultisampleEXTContextANGLE",
+    "glImportMemoryFdEXTContextANGLE",
+    "glGetGraphicsResetStatusEXTContextANGLE",
+    "glGetnUniformfvEXTContextANGLE",
+    "glGetnUniformivEXTContextANGLE",
+    "glReadnPixelsEXTContextANGLE",
+    "glDeleteSemaphoresEXTContextANGLE",
+    "glGenSemaphoresEXTContextANGLE",
+    "glGetSemaphoreParameterui64vEXTContextANGLE",
+    "glIsSemaphoreEXTContextANGLE",
+    "glSemaphoreParameterui64vEXTContextANGLE",
+    "glSignalSemaphoreEXTContextANGLE",
+    "glWaitSemaphoreEXTContextANGLE",
+    "glImportSemaphoreFdEXTContextANGLE",
+    "glTexStorage1DEXTContextANGLE",
+    "glTexStorage2DEXTContextANGLE",
+    "glTexStorage3DEXTContextANGLE",
+    "glDebugMessageCallbackKHRContextANGLE",
+    "glDebugMessageControlKHRContextANGLE",
+    "glDebugMessageInsertKHRContextANGLE",
+    "glGetDebugMessageLogKHRContextANGLE",
+    "glGetObjectLabelKHRContextANGLE",
+    "glGetObjectPtrLabelKHRContextANGLE",
+    "glGetPointervKHRContextANGLE",
+    "glObjectLabelKHRContextANGLE",
+    "glObjectPtrLabelKHRContextANGLE",
+    "glPopDebugGroupKHRContextANGLE",
+    "glPushDebugGroupKHRContextANGLE",
+    "glMaxShaderCompilerThreadsKHRContextANGLE",
+    "glDeleteFencesNVContextANGLE",
+    "glFinishFenceNVContextANGLE",
+    "glGenFencesNVContextANGLE",
+    "glGetFenceivNVContextANGLE",
+    "glIsFenceNVContextANGLE",
+    "glSetFenceNVContextANGLE",
+    "glTestFenceNVContextANGLE",
+    "glEGLImageTargetRenderbufferStorageOESContextANGLE",
+    "glEGLImageTargetTexture2DOESContextANGLE",
+    "glGetProgramBinaryOESContextANGLE",
+    "glProgramBinaryOESContextANGLE",
+    "glGetBufferPointervOESContextANGLE",
+    "glMapBufferOESContextANGLE",
+    "glUnmapBufferOESContextANGLE",
+    "glGetSamplerParameterIivOESContextANGLE",
+    "glGetSamplerParameterIuivOESContextANGLE",
+    "glGetTexParameterIivOESContextANGLE",
+    "glGetTexParameterIuivOESContextANGLE",
+    "glSamplerParameterIivOESContextANGLE",
+    "glSamplerParameterIuivOESContextANGLE",
+    "glTexParameterIivOESContextANGLE",
+    "glTexParameterIuivOESContextANGLE",
+    "glTexStorage3DMultisampleOESContextANGLE",
+    "glBindVertexArrayOESContextANGLE",
+    "glDeleteVertexArraysOESContextANGLE",
+    "glGenVertexArraysOESContextANGLE",
+    "glIsVertexArrayOESContextANGLE",
+    "glFramebufferTextureMultiviewOVRContextANGLE",
+    "glDrawTexfOESContextANGLE",
+    "glDrawTexfvOESContextANGLE",
+    "glDrawTexiOESContextANGLE",
+    "glDrawTexivOESContextANGLE",
+    "glDrawTexsOESContextANGLE",
+    "glDrawTexsvOESContextANGLE",
+    "glDrawTexxOESContextANGLE",
+    "glDrawTexxvOESContextANGLE",
+    "glBindFramebufferOESContextANGLE",
+    "glBindRenderbufferOESContextANGLE",
+    "glCheckFramebufferStatusOESContextANGLE",
+    "glDeleteFramebuffersOESContextANGLE",
+    "glDeleteRenderbuffersOESContextANGLE",
+    "glFramebufferRenderbufferOESContextANGLE",
+    "glFramebufferTexture2DOESContextANGLE",
+    "glGenFramebuffersOESContextANGLE",
+    "glGenRenderbuffersOESContextANGLE",
+    "glGenerateMipmapOESContextANGLE",
+    "glGetFramebufferAttachmentParameterivOESContextANGLE",
+    "glGetRenderbufferParameterivOESContextANGLE",
+    "glIsFramebufferOESContextANGLE",
+    "glIsRenderbufferOESContextANGLE",
+    "glRenderbufferStorageOESContextANGLE",
+    "glCurrentPaletteMatrixOESContextANGLE",
+    "glLoadPaletteFromModelViewMatrixOESContextANGLE",
+    "glMatrixIndexPointerOESContextANGLE",
+    "glWeightPointerOESContextANGLE",
+    "glPointSizePointerOESContextANGLE",
+    "glQueryMatrixxOESContextANGLE",
+    "glGetTexGenfvOESContextANGLE",
+    "glGetTexGenivOESContextANGLE",
+    "glGetTexGenxvOESContextANGLE",
+    "glTexGenfOESContextANGLE",
+    "glTexGenfvOESContextANGLE",
+    "glTexGeniOESContextANGLE",
+    "glTexGenivOESContextANGLE",
+    "glTexGenxOESContextANGLE",
+    "glTexGenxvOESContextANGLE",
+};
+
+GenericProc *const kProcs[kProcCount] = {
+    reinterpret_cast<GenericProc *>(&glAlphaFunc),
+    reinterpret_cast<GenericProc *>(&glClipPlanef),
+    reinterpret_cast<GenericProc *>(&glColor4f),
+    reinterpret_cast<GenericProc *>(&glFogf),
+    reinterpret_cast<GenericProc *>(&glFogfv),
+    reinterpret_cast<GenericProc *>(&glFrustumf),
+    reinterpret_cast<GenericProc *>(&glGetClipPlanef),
+    reinterpret_cast<GenericProc *>(&glGetLightfv),
+    reinterpret_cast<GenericProc *>(&glGetMaterialfv),
+    reinterpret_cast<GenericProc *>(&glGetTexEnvfv),
+    reinterpret_cast<GenericProc *>(&glLightModelf),
+    reinterpret_cast<GenericProc *>(&glLightModelfv),
+    reinterpret_cast<GenericProc *>(&glLightf),
+    reinterpret_cast<GenericProc *>(&glLightfv),
+    reinterpret_cast<GenericProc *>(&glLoadMatrixf),
+    reinterpret_cast<GenericProc *>(&glMaterialf),
+    reinterpret_cast<GenericProc *>(&glMaterialfv),
+    reinterpret_cast<GenericProc *>(&glMultMatrixf),
+    reinterpret_cast<GenericProc *>(&glMultiTexCoord4f),
+    reinterpret_cast<GenericProc *>(&glNormal3f),
+    reinterpret_cast<GenericProc *>(&glOrthof),
+    reinterpret_cast<GenericProc *>(&glPointParameterf),
+    reinterpret_cast<GenericProc *>(&glPointParameterfv),
+    reinterpret_cast<GenericProc *>(&glPointSize),
+    reinterpret_cast<GenericProc *>(&glRotatef),
+    reinterpret_cast<GenericProc *>(&glScalef),
+    reinterpret_cast<GenericProc *>(&glTexEnvf),
+    reinterpret_cast<GenericProc *>(&glTexEnvfv),
+    reinterpret_cast<GenericProc *>(&glTranslatef),
+    reinterpret_cast<GenericProc *>(&glAlphaFuncx),
+    reinterpret_cast<GenericProc *>(&glClearColorx),
+    reinterpret_cast<GenericProc *>(&glClearDepthx),
+    reinterpret_cast<GenericProc *>(&glClientActiveTexture),
+    reinterpret_cast<GenericProc *>(&glClipPlanex),
+    reinterpret_cast<GenericProc *>(&glColor4ub),
+    reinterpret_cast<GenericProc *>(&glColor4x),
+    reinterpret_cast<GenericProc *>(&glColorPointer),
+    reinterpret_cast<GenericProc *>(&glDepthRangex),
+    reinterpret_cast<GenericProc *>(&glDisableClientState),
+    reinterpret_cast<GenericProc *>(&glEnableClientState),
+    reinterpret_cast<GenericProc *>(&glFogx),
+    reinterpret_cast<GenericProc *>(&glFogxv),
+    reinterpret_cast<GenericProc *>(&glFrustumx),
+    reinterpret_cast<GenericProc *>(&glGetClipPlanex),
+    reinterpret_cast<GenericProc *>(&glGetFixedv),
+    reinterpret_cast<GenericProc *>(&glGetLightxv),
+    reinterpret_cast<GenericProc *>(&glGetMaterialxv),
+    reinterpret_cast<GenericProc *>(&glGetPointerv),
+    reinterpret_cast<GenericProc *>(&glGetTexEnviv),
+    reinterpret_cast<GenericProc *>(&glGetTexEnvxv),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterxv),
+    reinterpret_cast<GenericProc *>(&glLightModelx),
+    reinterpret_cast<GenericProc *>(&glLightModelxv),
+    reinterpret_cast<GenericProc *>(&glLightx),
+    reinterpret_cast<GenericProc *>(&glLightxv),
+    reinterpret_cast<GenericProc *>(&glLineWidthx),
+    reinterpret_cast<GenericProc *>(&glLoadIdentity),
+    reinterpret_cast<GenericProc *>(&glLoadMatrixx),
+    reinterpret_cast<GenericProc *>(&glLogicOp),
+    reinterpret_cast<GenericProc *>(&glMaterialx),
+    reinterpret_cast<GenericProc *>(&glMaterialxv),
+    reinterpret_cast<GenericProc *>(&glMatrixMode),
+    reinterpret_cast<GenericProc *>(&glMultMatrixx),
+    reinterpret_cast<GenericProc *>(&glMultiTexCoord4x),
+    reinterpret_cast<GenericProc *>(&glNormal3x),
+    reinterpret_cast<GenericProc *>(&glNormalPointer),
+    reinterpret_cast<GenericProc *>(&glOrthox),
+    reinterpret_cast<GenericProc *>(&glPointParameterx),
+    reinterpret_cast<GenericProc *>(&glPointParameterxv),
+    reinterpret_cast<GenericProc *>(&glPointSizex),
+    reinterpret_cast<GenericProc *>(&glPolygonOffsetx),
+    reinterpret_cast<GenericProc *>(&glPopMatrix),
+    reinterpret_cast<GenericProc *>(&glPushMatrix),
+    reinterpret_cast<GenericProc *>(&glRotatex),
+    reinterpret_cast<GenericProc *>(&glSampleCoveragex),
+    reinterpret_cast<GenericProc *>(&glScalex),
+    reinterpret_cast<GenericProc *>(&glShadeModel),
+    reinterpret_cast<GenericProc *>(&glTexCoordPointer),
+    reinterpret_cast<GenericProc *>(&glTexEnvi),
+    reinterpret_cast<GenericProc *>(&glTexEnvx),
+    reinterpret_cast<GenericProc *>(&glTexEnviv),
+    reinterpret_cast<GenericProc *>(&glTexEnvxv),
+    reinterpret_cast<GenericProc *>(&glTexParameterx),
+    reinterpret_cast<GenericProc *>(&glTexParameterxv),
+    reinterpret_cast<GenericProc *>(&glTranslatex),
+    reinterpret_cast<GenericProc *>(&glVertexPointer),
+    reinterpret_cast<GenericProc *>(&glActiveTexture),
+    reinterpret_cast<GenericProc *>(&glAttachShader),
+    reinterpret_cast<GenericProc *>(&glBindAttribLocation),
+    reinterpret_cast<GenericProc *>(&glBindBuffer),
+    reinterpret_cast<GenericProc *>(&glBindFramebuffer),
+    reinterpret_cast<GenericProc *>(&glBindRenderbuffer),
+    reinterpret_cast<GenericProc *>(&glBindTexture),
+    reinterpret_cast<GenericProc *>(&glBlendColor),
+    reinterpret_cast<GenericProc *>(&glBlendEquation),
+    reinterpret_cast<GenericProc *>(&glBlendEquationSeparate),
+    reinterpret_cast<GenericProc *>(&glBlendFunc),
+    reinterpret_cast<GenericProc *>(&glBlendFuncSeparate),
+    reinterpret_cast<GenericProc *>(&glBufferData),
+    reinterpret_cast<GenericProc *>(&glBufferSubData),
+    reinterpret_cast<GenericProc *>(&glCheckFramebufferStatus),
+    reinterpret_cast<GenericProc *>(&glClear),
+    reinterpret_cast<GenericProc *>(&glClearColor),
+    reinterpret_cast<GenericProc *>(&glClearDepthf),
+    reinterpret_cast<GenericProc *>(&glClearStencil),
+    reinterpret_cast<GenericProc *>(&glColorMask),
+    reinterpret_cast<GenericProc *>(&glCompileShader),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage2D),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage2D),
+    reinterpret_cast<GenericProc *>(&glCopyTexImage2D),
+    reinterpret_cast<GenericProc *>(&glCopyTexSubImage2D),
+    reinterpret_cast<GenericProc *>(&glCreateProgram),
+    reinterpret_cast<GenericProc *>(&glCreateShader),
+    reinterpret_cast<GenericProc *>(&glCullFace),
+    reinterpret_cast<GenericProc *>(&glDeleteBuffers),
+    reinterpret_cast<GenericProc *>(&glDeleteFramebuffers),
+    reinterpret_cast<GenericProc *>(&glDeleteProgram),
+    reinterpret_cast<GenericProc *>(&glDeleteRenderbuffers),
+    reinterpret_cast<GenericProc *>(&glDeleteShader),
+    reinterpret_cast<GenericProc *>(&glDeleteTextures),
+    reinterpret_cast<GenericProc *>(&glDepthFunc),
+    reinterpret_cast<GenericProc *>(&glDepthMask),
+    reinterpret_cast<GenericProc *>(&glDepthRangef),
+    reinterpret_cast<GenericProc *>(&glDetachShader),
+    reinterpret_cast<GenericProc *>(&glDisable),
+    reinterpret_cast<GenericProc *>(&glDisableVertexAttribArray),
+    reinterpret_cast<GenericProc *>(&glDrawArrays),
+    reinterpret_cast<GenericProc *>(&glDrawElements),
+    reinterpret_cast<GenericProc *>(&glEnable),
+    reinterpret_cast<GenericProc *>(&glEnableVertexAttribArray),
+    reinterpret_cast<GenericProc *>(&glFinish),
+    reinterpret_cast<GenericProc *>(&glFlush),
+    reinterpret_cast<GenericProc *>(&glFramebufferRenderbuffer),
+    reinterpret_cast<GenericProc *>(&glFramebufferTexture2D),
+    reinterpret_cast<GenericProc *>(&glFrontFace),
+    reinterpret_cast<GenericProc *>(&glGenBuffers),
+    reinterpret_cast<GenericProc *>(&glGenerateMipmap),
+    reinterpret_cast<GenericProc *>(&glGenFramebuffers),
+    reinterpret_cast<GenericProc *>(&glGenRenderbuffers),
+    reinterpret_cast<GenericProc *>(&glGenTextures),
+    reinterpret_cast<GenericProc *>(&glGetActiveAttrib),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniform),
+    reinterpret_cast<GenericProc *>(&glGetAttachedShaders),
+    reinterpret_cast<GenericProc *>(&glGetAttribLocation),
+    reinterpret_cast<GenericProc *>(&glGetBooleanv),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetError),
+    reinterpret_cast<GenericProc *>(&glGetFloatv),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferAttachmentParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetIntegerv),
+    reinterpret_cast<GenericProc *>(&glGetProgramiv),
+    reinterpret_cast<GenericProc *>(&glGetProgramInfoLog),
+    reinterpret_cast<GenericProc *>(&glGetRenderbufferParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetShaderiv),
+    reinterpret_cast<GenericProc *>(&glGetShaderInfoLog),
+    reinterpret_cast<GenericProc *>(&glGetShaderPrecisionFormat),
+    reinterpret_cast<GenericProc *>(&glGetShaderSource),
+    reinterpret_cast<GenericProc *>(&glGetString),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterfv),
+    reinterpret_cast<GenericProc *>(&glGetTexParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetUniformfv),
+    reinterpret_cast<GenericProc *>(&glGetUniformiv),
+    reinterpret_cast<GenericProc *>(&glGetUniformLocation),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribfv),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribiv),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribPointerv),
+    reinterpret_cast<GenericProc *>(&glHint),
+    reinterpret_cast<GenericProc *>(&glIsBuffer),
+    reinterpret_cast<GenericProc *>(&glIsEnabled),
+    reinterpret_cast<GenericProc *>(&glIsFramebuffer),
+    reinterpret_cast<GenericProc *>(&glIsProgram),
+    reinterpret_cast<GenericProc *>(&glIsRenderbuffer),
+    reinterpret_cast<GenericProc *>(&glIsShader),
+    reinterpret_cast<GenericProc *>(&glIsTexture),
+    reinterpret_cast<GenericProc *>(&glLineWidth),
+    reinterpret_cast<GenericProc *>(&glLinkProgram),
+    reinterpret_cast<GenericProc *>(&glPixelStorei),
+    reinterpret_cast<GenericProc *>(&glPolygonOffset),
+    reinterpret_cast<GenericProc *>(&glReadPixels),
+    reinterpret_cast<GenericProc *>(&glReleaseShaderCompiler),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorage),
+    reinterpret_cast<GenericProc *>(&glSampleCoverage),
+    reinterpret_cast<GenericProc *>(&glScissor),
+    reinterpret_cast<GenericProc *>(&glShaderBinary),
+    reinterpret_cast<GenericProc *>(&glShaderSource),
+    reinterpret_cast<GenericProc *>(&glStencilFunc),
+    reinterpret_cast<GenericProc *>(&glStencilFuncSeparate),
+    reinterpret_cast<GenericProc *>(&glStencilMask),
+    reinterpret_cast<GenericProc *>(&glStencilMaskSeparate),
+    reinterpret_cast<GenericProc *>(&glStencilOp),
+    reinterpret_cast<GenericProc *>(&glStencilOpSeparate),
+    reinterpret_cast<GenericProc *>(&glTexImage2D),
+    reinterpret_cast<GenericProc *>(&glTexParameterf),
+    reinterpret_cast<GenericProc *>(&glTexParameterfv),
+    reinterpret_cast<GenericProc *>(&glTexParameteri),
+    reinterpret_cast<GenericProc *>(&glTexParameteriv),
+    reinterpret_cast<GenericProc *>(&glTexSubImage2D),
+    reinterpret_cast<GenericProc *>(&glUniform1f),
+    reinterpret_cast<GenericProc *>(&glUniform1fv),
+    reinterpret_cast<GenericProc *>(&glUniform1i),
+    reinterpret_cast<GenericProc *>(&glUniform1iv),
+    reinterpret_cast<GenericProc *>(&glUniform2f),
+    reinterpret_cast<GenericProc *>(&glUniform2fv),
+    reinterpret_cast<GenericProc *>(&glUniform2i),
+    reinterpret_cast<GenericProc *>(&glUniform2iv),
+    reinterpret_cast<GenericProc *>(&glUniform3f),
+    reinterpret_cast<GenericProc *>(&glUniform3fv),
+    reinterpret_cast<GenericProc *>(&glUniform3i),
+    reinterpret_cast<GenericProc *>(&glUniform3iv),
+    reinterpret_cast<GenericProc *>(&glUniform4f),
+    reinterpret_cast<GenericProc *>(&glUniform4fv),
+    reinterpret_cast<GenericProc *>(&glUniform4i),
+    reinterpret_cast<GenericProc *>(&glUniform4iv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix2fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix3fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix4fv),
+    reinterpret_cast<GenericProc *>(&glUseProgram),
+    reinterpret_cast<GenericProc *>(&glValidateProgram),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib1f),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib1fv),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib2f),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib2fv),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib3f),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib3fv),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib4f),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib4fv),
+    reinterpret_cast<GenericProc *>(&glVertexAttribPointer),
+    reinterpret_cast<GenericProc *>(&glViewport),
+    reinterpret_cast<GenericProc *>(&glReadBuffer),
+    reinterpret_cast<GenericProc *>(&glDrawRangeElements),
+    reinterpret_cast<GenericProc *>(&glTexImage3D),
+    reinterpret_cast<GenericProc *>(&glTexSubImage3D),
+    reinterpret_cast<GenericProc *>(&glCopyTexSubImage3D),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage3D),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage3D),
+    reinterpret_cast<GenericProc *>(&glGenQueries),
+    reinterpret_cast<GenericProc *>(&glDeleteQueries),
+    reinterpret_cast<GenericProc *>(&glIsQuery),
+    reinterpret_cast<GenericProc *>(&glBeginQuery),
+    reinterpret_cast<GenericProc *>(&glEndQuery),
+    reinterpret_cast<GenericProc *>(&glGetQueryiv),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectuiv),
+    reinterpret_cast<GenericProc *>(&glUnmapBuffer),
+    reinterpret_cast<GenericProc *>(&glGetBufferPointerv),
+    reinterpret_cast<GenericProc *>(&glDrawBuffers),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix2x3fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix3x2fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix2x4fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix4x2fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix3x4fv),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix4x3fv),
+    reinterpret_cast<GenericProc *>(&glBlitFramebuffer),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageMultisample),
+    reinterpret_cast<GenericProc *>(&glFramebufferTextureLayer),
+    reinterpret_cast<GenericProc *>(&glMapBufferRange),
+    reinterpret_cast<GenericProc *>(&glFlushMappedBufferRange),
+    reinterpret_cast<GenericProc *>(&glBindVertexArray),
+    reinterpret_cast<GenericProc *>(&glDeleteVertexArrays),
+    reinterpret_cast<GenericProc *>(&glGenVertexArrays),
+    reinterpret_cast<GenericProc *>(&glIsVertexArray),
+    reinterpret_cast<GenericProc *>(&glGetIntegeri_v),
+    reinterpret_cast<GenericProc *>(&glBeginTransformFeedback),
+    reinterpret_cast<GenericProc *>(&glEndTransformFeedback),
+    reinterpret_cast<GenericProc *>(&glBindBufferRange),
+    reinterpret_cast<GenericProc *>(&glBindBufferBase),
+    reinterpret_cast<GenericProc *>(&glTransformFeedbackVaryings),
+    reinterpret_cast<GenericProc *>(&glGetTransformFeedbackVarying),
+    reinterpret_cast<GenericProc *>(&glVertexAttribIPointer),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIiv),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIuiv),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4i),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4ui),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4iv),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4uiv),
+    reinterpret_cast<GenericProc *>(&glGetUniformuiv),
+    reinterpret_cast<GenericProc *>(&glGetFragDataLocation),
+    reinterpret_cast<GenericProc *>(&glUniform1ui),
+    reinterpret_cast<GenericProc *>(&glUniform2ui),
+    reinterpret_cast<GenericProc *>(&glUniform3ui),
+    reinterpret_cast<GenericProc *>(&glUniform4ui),
+    reinterpret_cast<GenericProc *>(&glUniform1uiv),
+    reinterpret_cast<GenericProc *>(&glUniform2uiv),
+    reinterpret_cast<GenericProc *>(&glUniform3uiv),
+    reinterpret_cast<GenericProc *>(&glUniform4uiv),
+    reinterpret_cast<GenericProc *>(&glClearBufferiv),
+    reinterpret_cast<GenericProc *>(&glClearBufferuiv),
+    reinterpret_cast<GenericProc *>(&glClearBufferfv),
+    reinterpret_cast<GenericProc *>(&glClearBufferfi),
+    reinterpret_cast<GenericProc *>(&glGetStringi),
+    reinterpret_cast<GenericProc *>(&glCopyBufferSubData),
+    reinterpret_cast<GenericProc *>(&glGetUniformIndices),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformsiv),
+    reinterpret_cast<GenericProc *>(&glGetUniformBlockIndex),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformBlockiv),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformBlockName),
+    reinterpret_cast<GenericProc *>(&glUniformBlockBinding),
+    reinterpret_cast<GenericProc *>(&glDrawArraysInstanced),
+    reinterpret_cast<GenericProc *>(&glDrawElementsInstanced),
+    reinterpret_cast<GenericProc *>(&glFenceSync),
+    reinterpret_cast<GenericProc *>(&glIsSync),
+    reinterpret_cast<GenericProc *>(&glDeleteSync),
+    reinterpret_cast<GenericProc *>(&glClientWaitSync),
+    reinterpret_cast<GenericProc *>(&glWaitSync),
+    reinterpret_cast<GenericProc *>(&glGetInteger64v),
+    reinterpret_cast<GenericProc *>(&glGetSynciv),
+    reinterpret_cast<GenericProc *>(&glGetInteger64i_v),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameteri64v),
+    reinterpret_cast<GenericProc *>(&glGenSamplers),
+    reinterpret_cast<GenericProc *>(&glDeleteSamplers),
+    reinterpret_cast<GenericProc *>(&glIsSampler),
+    reinterpret_cast<GenericProc *>(&glBindSampler),
+    reinterpret_cast<GenericProc *>(&glSamplerParameteri),
+    reinterpret_cast<GenericProc *>(&glSamplerParameteriv),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterf),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterfv),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterfv),
+    reinterpret_cast<GenericProc *>(&glVertexAttribDivisor),
+    reinterpret_cast<GenericProc *>(&glBindTransformFeedback),
+    reinterpret_cast<GenericProc *>(&glDeleteTransformFeedbacks),
+    reinterpret_cast<GenericProc *>(&glGenTransformFeedbacks),
+    reinterpret_cast<GenericProc *>(&glIsTransformFeedback),
+    reinterpret_cast<GenericProc *>(&glPauseTransformFeedback),
+    reinterpret_cast<GenericProc *>(&glResumeTransformFeedback),
+    reinterpret_cast<GenericProc *>(&glGetProgramBinary),
+    reinterpret_cast<GenericProc *>(&glProgramBinary),
+    reinterpret_cast<GenericProc *>(&glProgramParameteri),
+    reinterpret_cast<GenericProc *>(&glInvalidateFramebuffer),
+    reinterpret_cast<GenericProc *>(&glInvalidateSubFramebuffer),
+    reinterpret_cast<GenericProc *>(&glTexStorage2D),
+    reinterpret_cast<GenericProc *>(&glTexStorage3D),
+    reinterpret_cast<GenericProc *>(&glGetInternalformativ),
+    reinterpret_cast<GenericProc *>(&glDispatchCompute),
+    reinterpret_cast<GenericProc *>(&glDispatchComputeIndirect),
+    reinterpret_cast<GenericProc *>(&glDrawArraysIndirect),
+    reinterpret_cast<GenericProc *>(&glDrawElementsIndirect),
+    reinterpret_cast<GenericProc *>(&glFramebufferParameteri),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetProgramInterfaceiv),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceIndex),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceName),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceiv),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceLocation),
+    reinterpret_cast<GenericProc *>(&glUseProgramStages),
+    reinterpret_cast<GenericProc *>(&glActiveShaderProgram),
+    reinterpret_cast<GenericProc *>(&glCreateShaderProgramv),
+    reinterpret_cast<GenericProc *>(&glBindProgramPipeline),
+    reinterpret_cast<GenericProc *>(&glDeleteProgramPipelines),
+    reinterpret_cast<GenericProc *>(&glGenProgramPipelines),
+    reinterpret_cast<GenericProc *>(&glIsProgramPipeline),
+    reinterpret_cast<GenericProc *>(&glGetProgramPipelineiv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1i),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2i),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3i),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4i),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1ui),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2ui),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3ui),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4ui),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1f),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2f),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3f),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4f),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1iv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2iv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3iv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4iv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1uiv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2uiv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3uiv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4uiv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix2fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix3fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix4fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix2x3fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix3x2fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix2x4fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix4x2fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix3x4fv),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix4x3fv),
+    reinterpret_cast<GenericProc *>(&glValidateProgramPipeline),
+    reinterpret_cast<GenericProc *>(&glGetProgramPipelineInfoLog),
+    reinterpret_cast<GenericProc *>(&glBindImageTexture),
+    reinterpret_cast<GenericProc *>(&glGetBooleani_v),
+    reinterpret_cast<GenericProc *>(&glMemoryBarrier),
+    reinterpret_cast<GenericProc *>(&glMemoryBarrierByRegion),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DMultisample),
+    reinterpret_cast<GenericProc *>(&glGetMultisamplefv),
+    reinterpret_cast<GenericProc *>(&glSampleMaski),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameteriv),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterfv),
+    reinterpret_cast<GenericProc *>(&glBindVertexBuffer),
+    reinterpret_cast<GenericProc *>(&glVertexAttribFormat),
+    reinterpret_cast<GenericProc *>(&glVertexAttribIFormat),
+    reinterpret_cast<GenericProc *>(&glVertexAttribBinding),
+    reinterpret_cast<GenericProc *>(&glVertexBindingDivisor),
+    reinterpret_cast<GenericProc *>(&glBatchCommandsANGLE),
+    reinterpret_cast<GenericProc *>(&glCopySubTexture3DANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyTexture3DANGLE),
+    reinterpret_cast<GenericProc *>(&glBlitFramebufferANGLE),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageMultisampleANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawArraysInstancedANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawElementsInstancedANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribDivisorANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawArraysANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawArraysInstancedANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawElementsANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawElementsInstancedANGLE),
+    reinterpret_cast<GenericProc *>(&glProvokingVertexANGLE),
+    reinterpret_cast<GenericProc *>(&glRequestExtensionANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage2DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage3DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage2DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage3DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformBlockivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBooleani_vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBooleanvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameteri64vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferPointervRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFloatvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferAttachmentParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInteger64i_vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInteger64vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetIntegeri_vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetIntegervRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInternalformativRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMultisamplefvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetPointervRobustANGLERobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramInterfaceivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjecti64vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectui64vRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetRenderbufferParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetShaderivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribPointervRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glReadPixelsRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glReadnPixelsRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexImage2DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexImage3DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterIivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterIuivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterfvRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterivRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexSubImage2DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glTexSubImage3DRobustANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMultisamplefvANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterfvANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterivANGLE),
+    reinterpret_cast<GenericProc *>(&glSampleMaskiANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DMultisampleANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTranslatedShaderSourceANGLE),
+    reinterpret_cast<GenericProc *>(&glBindUniformLocationCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCompressedCopyTextureCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCopySubTextureCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCopyTextureCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCoverageModulationCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glMatrixLoadIdentityCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glMatrixLoadfCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glLoseContextCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glBindFragmentInputLocationCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCoverFillPathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCoverFillPathInstancedCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCoverStrokePathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glCoverStrokePathInstancedCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glDeletePathsCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glGenPathsCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glGetPathParameterfvCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glGetPathParameterivCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glIsPathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glPathCommandsCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glPathParameterfCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glPathParameteriCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glPathStencilFuncCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glProgramPathFragmentInputGenCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilFillPathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilFillPathInstancedCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilStrokePathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilStrokePathInstancedCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverFillPathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverFillPathInstancedCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverStrokePathCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverStrokePathInstancedCHROMIUM),
+    reinterpret_cast<GenericProc *>(&glBindFragDataLocationEXT),
+    reinterpret_cast<GenericProc *>(&glBindFragDataLocationIndexedEXT),
+    reinterpret_cast<GenericProc *>(&glGetFragDataIndexEXT),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceLocationIndexEXT),
+    reinterpret_cast<GenericProc *>(&glInsertEventMarkerEXT),
+    reinterpret_cast<GenericProc *>(&glPopGroupMarkerEXT),
+    reinterpret_cast<GenericProc *>(&glPushGroupMarkerEXT),
+    reinterpret_cast<GenericProc *>(&glDiscardFramebufferEXT),
+    reinterpret_cast<GenericProc *>(&glBeginQueryEXT),
+    reinterpret_cast<GenericProc *>(&glDeleteQueriesEXT),
+    reinterpret_cast<GenericProc *>(&glEndQueryEXT),
+    reinterpret_cast<GenericProc *>(&glGenQueriesEXT),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjecti64vEXT),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectivEXT),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectui64vEXT),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectuivEXT),
+    reinterpret_cast<GenericProc *>(&glGetQueryivEXT),
+    reinterpret_cast<GenericProc *>(&glIsQueryEXT),
+    reinterpret_cast<GenericProc *>(&glQueryCounterEXT),
+    reinterpret_cast<GenericProc *>(&glDrawBuffersEXT),
+    reinterpret_cast<GenericProc *>(&glFramebufferTextureEXT),
+    reinterpret_cast<GenericProc *>(&glDrawArraysInstancedEXT),
+    reinterpret_cast<GenericProc *>(&glDrawElementsInstancedEXT),
+    reinterpret_cast<GenericProc *>(&glVertexAttribDivisorEXT),
+    reinterpret_cast<GenericProc *>(&glFlushMappedBufferRangeEXT),
+    reinterpret_cast<GenericProc *>(&glMapBufferRangeEXT),
+    reinterpret_cast<GenericProc *>(&glBufferStorageMemEXT),
+    reinterpret_cast<GenericProc *>(&glCreateMemoryObjectsEXT),
+    reinterpret_cast<GenericProc *>(&glDeleteMemoryObjectsEXT),
+    reinterpret_cast<GenericProc *>(&glGetMemoryObjectParameterivEXT),
+    reinterpret_cast<GenericProc *>(&glGetUnsignedBytei_vEXT),
+    reinterpret_cast<GenericProc *>(&glGetUnsignedBytevEXT),
+    reinterpret_cast<GenericProc *>(&glIsMemoryObjectEXT),
+    reinterpret_cast<GenericProc *>(&glMemoryObjectParameterivEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem2DEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem2DMultisampleEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem3DEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem3DMultisampleEXT),
+    reinterpret_cast<GenericProc *>(&glImportMemoryFdEXT),
+    reinterpret_cast<GenericProc *>(&glGetGraphicsResetStatusEXT),
+    reinterpret_cast<GenericProc *>(&glGetnUniformfvEXT),
+    reinterpret_cast<GenericProc *>(&glGetnUniformivEXT),
+    reinterpret_cast<GenericProc *>(&glReadnPixelsEXT),
+    reinterpret_cast<GenericProc *>(&glDeleteSemaphoresEXT),
+    reinterpret_cast<GenericProc *>(&glGenSemaphoresEXT),
+    reinterpret_cast<GenericProc *>(&glGetSemaphoreParameterui64vEXT),
+    reinterpret_cast<GenericProc *>(&glIsSemaphoreEXT),
+    reinterpret_cast<GenericProc *>(&glSemaphoreParameterui64vEXT),
+    reinterpret_cast<GenericProc *>(&glSignalSemaphoreEXT),
+    reinterpret_cast<GenericProc *>(&glWaitSemaphoreEXT),
+    reinterpret_cast<GenericProc *>(&glImportSemaphoreFdEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorage1DEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DEXT),
+    reinterpret_cast<GenericProc *>(&glTexStorage3DEXT),
+    reinterpret_cast<GenericProc *>(&glDebugMessageCallbackKHR),
+    reinterpret_cast<GenericProc *>(&glDebugMessageControlKHR),
+    reinterpret_cast<GenericProc *>(&glDebugMessageInsertKHR),
+    reinterpret_cast<GenericProc *>(&glGetDebugMessageLogKHR),
+    reinterpret_cast<GenericProc *>(&glGetObjectLabelKHR),
+    reinterpret_cast<GenericProc *>(&glGetObjectPtrLabelKHR),
+    reinterpret_cast<GenericProc *>(&glGetPointervKHR),
+    reinterpret_cast<GenericProc *>(&glObjectLabelKHR),
+    reinterpret_cast<GenericProc *>(&glObjectPtrLabelKHR),
+    reinterpret_cast<GenericProc *>(&glPopDebugGroupKHR),
+    reinterpret_cast<GenericProc *>(&glPushDebugGroupKHR),
+    reinterpret_cast<GenericProc *>(&glMaxShaderCompilerThreadsKHR),
+    reinterpret_cast<GenericProc *>(&glDeleteFencesNV),
+    reinterpret_cast<GenericProc *>(&glFinishFenceNV),
+    reinterpret_cast<GenericProc *>(&glGenFencesNV),
+    reinterpret_cast<GenericProc *>(&glGetFenceivNV),
+    reinterpret_cast<GenericProc *>(&glIsFenceNV),
+    reinterpret_cast<GenericProc *>(&glSetFenceNV),
+    reinterpret_cast<GenericProc *>(&glTestFenceNV),
+    reinterpret_cast<GenericProc *>(&glEGLImageTargetRenderbufferStorageOES),
+    reinterpret_cast<GenericProc *>(&glEGLImageTargetTexture2DOES),
+    reinterpret_cast<GenericProc *>(&glGetProgramBinaryOES),
+    reinterpret_cast<GenericProc *>(&glProgramBinaryOES),
+    reinterpret_cast<GenericProc *>(&glGetBufferPointervOES),
+    reinterpret_cast<GenericProc *>(&glMapBufferOES),
+    reinterpret_cast<GenericProc *>(&glUnmapBufferOES),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIivOES),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIuivOES),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIivOES),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIuivOES),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIivOES),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIuivOES),
+    reinterpret_cast<GenericProc *>(&glTexParameterIivOES),
+    reinterpret_cast<GenericProc *>(&glTexParameterIuivOES),
+    reinterpret_cast<GenericProc *>(&glTexStorage3DMultisampleOES),
+    reinterpret_cast<GenericProc *>(&glBindVertexArrayOES),
+    reinterpret_cast<GenericProc *>(&glDeleteVertexArraysOES),
+    reinterpret_cast<GenericProc *>(&glGenVertexArraysOES),
+    reinterpret_cast<GenericProc *>(&glIsVertexArrayOES),
+    reinterpret_cast<GenericProc *>(&glFramebufferTextureMultiviewOVR),
+    reinterpret_cast<GenericProc *>(&glDrawTexfOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexfvOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexiOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexivOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexsOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexsvOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexxOES),
+    reinterpret_cast<GenericProc *>(&glDrawTexxvOES),
+    reinterpret_cast<GenericProc *>(&glBindFramebufferOES),
+    reinterpret_cast<GenericProc *>(&glBindRenderbufferOES),
+    reinterpret_cast<GenericProc *>(&glCheckFramebufferStatusOES),
+    reinterpret_cast<GenericProc *>(&glDeleteFramebuffersOES),
+    reinterpret_cast<GenericProc *>(&glDeleteRenderbuffersOES),
+    reinterpret_cast<GenericProc *>(&glFramebufferRenderbufferOES),
+    reinterpret_cast<GenericProc *>(&glFramebufferTexture2DOES),
+    reinterpret_cast<GenericProc *>(&glGenFramebuffersOES),
+    reinterpret_cast<GenericProc *>(&glGenRenderbuffersOES),
+    reinterpret_cast<GenericProc *>(&glGenerateMipmapOES),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferAttachmentParameterivOES),
+    reinterpret_cast<GenericProc *>(&glGetRenderbufferParameterivOES),
+    reinterpret_cast<GenericProc *>(&glIsFramebufferOES),
+    reinterpret_cast<GenericProc *>(&glIsRenderbufferOES),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageOES),
+    reinterpret_cast<GenericProc *>(&glCurrentPaletteMatrixOES),
+    reinterpret_cast<GenericProc *>(&glLoadPaletteFromModelViewMatrixOES),
+    reinterpret_cast<GenericProc *>(&glMatrixIndexPointerOES),
+    reinterpret_cast<GenericProc *>(&glWeightPointerOES),
+    reinterpret_cast<GenericProc *>(&glPointSizePointerOES),
+    reinterpret_cast<GenericProc *>(&glQueryMatrixxOES),
+    reinterpret_cast<GenericProc *>(&glGetTexGenfvOES),
+    reinterpret_cast<GenericProc *>(&glGetTexGenivOES),
+    reinterpret_cast<GenericProc *>(&glGetTexGenxvOES),
+    reinterpret_cast<GenericProc *>(&glTexGenfOES),
+    reinterpret_cast<GenericProc *>(&glTexGenfvOES),
+    reinterpret_cast<GenericProc *>(&glTexGeniOES),
+    reinterpret_cast<GenericProc *>(&glTexGenivOES),
+    reinterpret_cast<GenericProc *>(&glTexGenxOES),
+    reinterpret_cast<GenericProc *>(&glTexGenxvOES),
+    reinterpret_cast<GenericProc *>(&glAlphaFuncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClipPlanefContextANGLE),
+    reinterpret_cast<GenericProc *>(&glColor4fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFogfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFogfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFrustumfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetClipPlanefContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetLightfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMaterialfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexEnvfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightModelfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightModelfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLoadMatrixfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMaterialfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMaterialfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultMatrixfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiTexCoord4fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glNormal3fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glOrthofContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointParameterfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointParameterfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointSizeContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRotatefContextANGLE),
+    reinterpret_cast<GenericProc *>(&glScalefContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexEnvfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexEnvfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTranslatefContextANGLE),
+    reinterpret_cast<GenericProc *>(&glAlphaFuncxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearColorxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearDepthxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClientActiveTextureContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClipPlanexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glColor4ubContextANGLE),
+    reinterpret_cast<GenericProc *>(&glColor4xContextANGLE),
+    reinterpret_cast<GenericProc *>(&glColorPointerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDepthRangexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDisableClientStateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEnableClientStateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFogxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFogxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFrustumxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetClipPlanexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFixedvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetLightxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMaterialxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetPointervContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexEnvivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexEnvxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightModelxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightModelxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLightxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLineWidthxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLoadIdentityContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLoadMatrixxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLogicOpContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMaterialxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMaterialxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMatrixModeContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultMatrixxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiTexCoord4xContextANGLE),
+    reinterpret_cast<GenericProc *>(&glNormal3xContextANGLE),
+    reinterpret_cast<GenericProc *>(&glNormalPointerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glOrthoxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointParameterxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointParameterxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointSizexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPolygonOffsetxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPopMatrixContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPushMatrixContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRotatexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSampleCoveragexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glScalexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glShadeModelContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexCoordPointerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexEnviContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexEnvxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexEnvivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexEnvxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterxContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterxvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTranslatexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexPointerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glActiveTextureContextANGLE),
+    reinterpret_cast<GenericProc *>(&glAttachShaderContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindAttribLocationContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindBufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindFramebufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindRenderbufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindTextureContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlendColorContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlendEquationContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlendEquationSeparateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlendFuncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlendFuncSeparateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBufferDataContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBufferSubDataContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCheckFramebufferStatusContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearColorContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearDepthfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearStencilContextANGLE),
+    reinterpret_cast<GenericProc *>(&glColorMaskContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompileShaderContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyTexImage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyTexSubImage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCreateProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCreateShaderContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCullFaceContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteBuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteFramebuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteRenderbuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteShaderContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteTexturesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDepthFuncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDepthMaskContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDepthRangefContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDetachShaderContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDisableContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDisableVertexAttribArrayContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawArraysContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawElementsContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEnableContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEnableVertexAttribArrayContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFinishContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFlushContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferRenderbufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferTexture2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFrontFaceContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenBuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenerateMipmapContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenFramebuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenRenderbuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenTexturesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveAttribContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetAttachedShadersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetAttribLocationContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBooleanvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetErrorContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFloatvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferAttachmentParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetIntegervContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramInfoLogContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetRenderbufferParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetShaderivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetShaderInfoLogContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetShaderPrecisionFormatContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetShaderSourceContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetStringContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformLocationContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribPointervContextANGLE),
+    reinterpret_cast<GenericProc *>(&glHintContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsBufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsEnabledContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsFramebufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsRenderbufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsShaderContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsTextureContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLineWidthContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLinkProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPixelStoreiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPolygonOffsetContextANGLE),
+    reinterpret_cast<GenericProc *>(&glReadPixelsContextANGLE),
+    reinterpret_cast<GenericProc *>(&glReleaseShaderCompilerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSampleCoverageContextANGLE),
+    reinterpret_cast<GenericProc *>(&glScissorContextANGLE),
+    reinterpret_cast<GenericProc *>(&glShaderBinaryContextANGLE),
+    reinterpret_cast<GenericProc *>(&glShaderSourceContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilFuncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilFuncSeparateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilMaskContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilMaskSeparateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilOpContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilOpSeparateContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexImage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameteriContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexSubImage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform1fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform1fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform1iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform1ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform2fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform2iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform2ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform3fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform3iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform3ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform4fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform4iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform4ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUseProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glValidateProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib1fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib1fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib2fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib3fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib4fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttrib4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribPointerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glViewportContextANGLE),
+    reinterpret_cast<GenericProc *>(&glReadBufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawRangeElementsContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexImage3DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexSubImage3DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyTexSubImage3DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage3DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage3DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenQueriesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteQueriesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsQueryContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBeginQueryContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEndQueryContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectuivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUnmapBufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferPointervContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawBuffersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix2x3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix3x2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix2x4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix4x2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix3x4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformMatrix4x3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlitFramebufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageMultisampleContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferTextureLayerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMapBufferRangeContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFlushMappedBufferRangeContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindVertexArrayContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteVertexArraysContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenVertexArraysContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsVertexArrayContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetIntegeri_vContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBeginTransformFeedbackContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEndTransformFeedbackContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindBufferRangeContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindBufferBaseContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTransformFeedbackVaryingsContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTransformFeedbackVaryingContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribIPointerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIuivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribI4uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformuivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFragDataLocationContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform1uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform2uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform3uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform4uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform1uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform2uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform3uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniform4uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearBufferivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearBufferuivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearBufferfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClearBufferfiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetStringiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyBufferSubDataContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformIndicesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformsivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformBlockIndexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformBlockivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformBlockNameContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUniformBlockBindingContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawArraysInstancedContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawElementsInstancedContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFenceSyncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsSyncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteSyncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glClientWaitSyncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glWaitSyncContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInteger64vContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSyncivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInteger64i_vContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameteri64vContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenSamplersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteSamplersContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsSamplerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindSamplerContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameteriContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterfContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribDivisorContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindTransformFeedbackContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteTransformFeedbacksContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenTransformFeedbacksContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsTransformFeedbackContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPauseTransformFeedbackContextANGLE),
+    reinterpret_cast<GenericProc *>(&glResumeTransformFeedbackContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramBinaryContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramBinaryContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramParameteriContextANGLE),
+    reinterpret_cast<GenericProc *>(&glInvalidateFramebufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glInvalidateSubFramebufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage3DContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInternalformativContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDispatchComputeContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDispatchComputeIndirectContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawArraysIndirectContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawElementsIndirectContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferParameteriContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramInterfaceivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceIndexContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceNameContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceLocationContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUseProgramStagesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glActiveShaderProgramContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCreateShaderProgramvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindProgramPipelineContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteProgramPipelinesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenProgramPipelinesContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsProgramPipelineContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramPipelineivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4iContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4uiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4fContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4ivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4uivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform1fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniform4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix2x3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix3x2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix2x4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix4x2fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix3x4fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramUniformMatrix4x3fvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glValidateProgramPipelineContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramPipelineInfoLogContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindImageTextureContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBooleani_vContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMemoryBarrierContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMemoryBarrierByRegionContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DMultisampleContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMultisamplefvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSampleMaskiContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterivContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterfvContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindVertexBufferContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribFormatContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribIFormatContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribBindingContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexBindingDivisorContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBatchCommandsANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopySubTexture3DANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyTexture3DANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBlitFramebufferANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageMultisampleANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawArraysInstancedANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawElementsInstancedANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribDivisorANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawArraysANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawArraysInstancedANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawElementsANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMultiDrawElementsInstancedANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProvokingVertexANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRequestExtensionANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage2DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexImage3DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage2DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedTexSubImage3DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetActiveUniformBlockivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBooleani_vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBooleanvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameteri64vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferPointervRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFloatvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferAttachmentParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInteger64i_vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInteger64vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetIntegeri_vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetIntegervRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetInternalformativRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMultisamplefvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetPointervRobustANGLERobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramInterfaceivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjecti64vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectui64vRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetRenderbufferParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetShaderivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUniformuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribIuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribPointervRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetVertexAttribivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glReadPixelsRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glReadnPixelsRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexImage2DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexImage3DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterIivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterIuivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterfvRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterivRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexSubImage2DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexSubImage3DRobustANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMultisamplefvANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterfvANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexLevelParameterivANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSampleMaskiANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DMultisampleANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTranslatedShaderSourceANGLEContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindUniformLocationCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCompressedCopyTextureCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopySubTextureCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCopyTextureCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCoverageModulationCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMatrixLoadIdentityCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMatrixLoadfCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLoseContextCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindFragmentInputLocationCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCoverFillPathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCoverFillPathInstancedCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCoverStrokePathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCoverStrokePathInstancedCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeletePathsCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenPathsCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetPathParameterfvCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetPathParameterivCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsPathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPathCommandsCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPathParameterfCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPathParameteriCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPathStencilFuncCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramPathFragmentInputGenCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilFillPathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilFillPathInstancedCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilStrokePathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilStrokePathInstancedCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverFillPathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverFillPathInstancedCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverStrokePathCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glStencilThenCoverStrokePathInstancedCHROMIUMContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindFragDataLocationEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindFragDataLocationIndexedEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFragDataIndexEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramResourceLocationIndexEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glInsertEventMarkerEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPopGroupMarkerEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPushGroupMarkerEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDiscardFramebufferEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBeginQueryEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteQueriesEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEndQueryEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenQueriesEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjecti64vEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectivEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectui64vEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryObjectuivEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetQueryivEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsQueryEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glQueryCounterEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawBuffersEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferTextureEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawArraysInstancedEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawElementsInstancedEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glVertexAttribDivisorEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFlushMappedBufferRangeEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMapBufferRangeEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBufferStorageMemEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCreateMemoryObjectsEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteMemoryObjectsEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetMemoryObjectParameterivEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUnsignedBytei_vEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetUnsignedBytevEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsMemoryObjectEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMemoryObjectParameterivEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem2DEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem2DMultisampleEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem3DEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorageMem3DMultisampleEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glImportMemoryFdEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetGraphicsResetStatusEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformfvEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetnUniformivEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glReadnPixelsEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteSemaphoresEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenSemaphoresEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSemaphoreParameterui64vEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsSemaphoreEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSemaphoreParameterui64vEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSignalSemaphoreEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glWaitSemaphoreEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glImportSemaphoreFdEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage1DEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage2DEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage3DEXTContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDebugMessageCallbackKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDebugMessageControlKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDebugMessageInsertKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetDebugMessageLogKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetObjectLabelKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetObjectPtrLabelKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetPointervKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glObjectLabelKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glObjectPtrLabelKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPopDebugGroupKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPushDebugGroupKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMaxShaderCompilerThreadsKHRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteFencesNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFinishFenceNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenFencesNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFenceivNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsFenceNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSetFenceNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTestFenceNVContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEGLImageTargetRenderbufferStorageOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glEGLImageTargetTexture2DOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetProgramBinaryOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glProgramBinaryOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetBufferPointervOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMapBufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glUnmapBufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetSamplerParameterIuivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexParameterIuivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glSamplerParameterIuivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterIivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexParameterIuivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexStorage3DMultisampleOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindVertexArrayOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteVertexArraysOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenVertexArraysOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsVertexArrayOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferTextureMultiviewOVRContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexfOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexfvOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexiOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexsOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexsvOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexxOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDrawTexxvOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindFramebufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glBindRenderbufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCheckFramebufferStatusOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteFramebuffersOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glDeleteRenderbuffersOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferRenderbufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glFramebufferTexture2DOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenFramebuffersOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenRenderbuffersOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGenerateMipmapOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetFramebufferAttachmentParameterivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetRenderbufferParameterivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsFramebufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glIsRenderbufferOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glRenderbufferStorageOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glCurrentPaletteMatrixOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glLoadPaletteFromModelViewMatrixOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glMatrixIndexPointerOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glWeightPointerOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glPointSizePointerOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glQueryMatrixxOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexGenfvOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexGenivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glGetTexGenxvOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexGenfOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexGenfvOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexGeniOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexGenivOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexGenxOESContextANGLE),
+    reinterpret_cast<GenericProc *>(&glTexGenxvOESContextANGLE),
+};
+
+LoadProc gLazyLoadProc = nullptr;
+
+// The functions loaded by the stubs. The stubs stay in the function pointers, which other threads
+// read without synchronization, so the loaded functions are kept in atomic slots instead.
+std::atomic<GenericProc> gLazyProcSlots[kProcCount];
+
+GenericProc LoadLazyProc(size_t index)
+{
+    GenericProc proc = gLazyProcSlots[index].load(std::memory_order_acquire);
+    if (proc)
+    {
+        return proc;
+    }
+
+    // Threads that load the same function at the same time store the same pointer.
+    proc = gLazyLoadProc(kProcNames[index]);
+    if (!proc)
+    {
+        fprintf(stderr, "Failed to load %s.\n", kProcNames[index]);
+        abort();
+    }
+    gLazyProcSlots[index].store(proc, std::memory_order_release);
+    return proc;
+}
+
+template <size_t Index, typename ProcT>
+struct LazyProc;
+
+template <size_t Index, typename ReturnT, typename... ParamsT>
+struct LazyProc<Index, ReturnT(KHRONOS_APIENTRY *)(ParamsT...)>
+{
+    static ReturnT KHRONOS_APIENTRY Stub(ParamsT... params)
+    {
+        using ProcT = ReturnT(KHRONOS_APIENTRY *)(ParamsT...);
+        return reinterpret_cast<ProcT>(LoadLazyProc(Index))(params...);
+    }
+};
+
+// The stubs of the core functions, and null for the extension functions.
+const GenericProc kLazyProcs[kProcCount] = {
+    reinterpret_cast<GenericProc>(&LazyProc<0, PFNGLALPHAFUNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<1, PFNGLCLIPPLANEFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<2, PFNGLCOLOR4FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<3, PFNGLFOGFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<4, PFNGLFOGFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<5, PFNGLFRUSTUMFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<6, PFNGLGETCLIPPLANEFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<7, PFNGLGETLIGHTFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<8, PFNGLGETMATERIALFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<9, PFNGLGETTEXENVFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<10, PFNGLLIGHTMODELFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<11, PFNGLLIGHTMODELFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<12, PFNGLLIGHTFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<13, PFNGLLIGHTFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<14, PFNGLLOADMATRIXFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<15, PFNGLMATERIALFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<16, PFNGLMATERIALFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<17, PFNGLMULTMATRIXFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<18, PFNGLMULTITEXCOORD4FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<19, PFNGLNORMAL3FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<20, PFNGLORTHOFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<21, PFNGLPOINTPARAMETERFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<22, PFNGLPOINTPARAMETERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<23, PFNGLPOINTSIZEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<24, PFNGLROTATEFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<25, PFNGLSCALEFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<26, PFNGLTEXENVFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<27, PFNGLTEXENVFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<28, PFNGLTRANSLATEFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<29, PFNGLALPHAFUNCXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<30, PFNGLCLEARCOLORXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<31, PFNGLCLEARDEPTHXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<32, PFNGLCLIENTACTIVETEXTUREPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<33, PFNGLCLIPPLANEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<34, PFNGLCOLOR4UBPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<35, PFNGLCOLOR4XPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<36, PFNGLCOLORPOINTERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<37, PFNGLDEPTHRANGEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<38, PFNGLDISABLECLIENTSTATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<39, PFNGLENABLECLIENTSTATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<40, PFNGLFOGXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<41, PFNGLFOGXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<42, PFNGLFRUSTUMXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<43, PFNGLGETCLIPPLANEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<44, PFNGLGETFIXEDVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<45, PFNGLGETLIGHTXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<46, PFNGLGETMATERIALXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<47, PFNGLGETPOINTERVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<48, PFNGLGETTEXENVIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<49, PFNGLGETTEXENVXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<50, PFNGLGETTEXPARAMETERXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<51, PFNGLLIGHTMODELXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<52, PFNGLLIGHTMODELXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<53, PFNGLLIGHTXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<54, PFNGLLIGHTXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<55, PFNGLLINEWIDTHXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<56, PFNGLLOADIDENTITYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<57, PFNGLLOADMATRIXXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<58, PFNGLLOGICOPPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<59, PFNGLMATERIALXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<60, PFNGLMATERIALXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<61, PFNGLMATRIXMODEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<62, PFNGLMULTMATRIXXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<63, PFNGLMULTITEXCOORD4XPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<64, PFNGLNORMAL3XPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<65, PFNGLNORMALPOINTERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<66, PFNGLORTHOXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<67, PFNGLPOINTPARAMETERXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<68, PFNGLPOINTPARAMETERXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<69, PFNGLPOINTSIZEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<70, PFNGLPOLYGONOFFSETXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<71, PFNGLPOPMATRIXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<72, PFNGLPUSHMATRIXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<73, PFNGLROTATEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<74, PFNGLSAMPLECOVERAGEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<75, PFNGLSCALEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<76, PFNGLSHADEMODELPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<77, PFNGLTEXCOORDPOINTERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<78, PFNGLTEXENVIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<79, PFNGLTEXENVXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<80, PFNGLTEXENVIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<81, PFNGLTEXENVXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<82, PFNGLTEXPARAMETERXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<83, PFNGLTEXPARAMETERXVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<84, PFNGLTRANSLATEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<85, PFNGLVERTEXPOINTERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<86, PFNGLACTIVETEXTUREPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<87, PFNGLATTACHSHADERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<88, PFNGLBINDATTRIBLOCATIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<89, PFNGLBINDBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<90, PFNGLBINDFRAMEBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<91, PFNGLBINDRENDERBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<92, PFNGLBINDTEXTUREPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<93, PFNGLBLENDCOLORPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<94, PFNGLBLENDEQUATIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<95, PFNGLBLENDEQUATIONSEPARATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<96, PFNGLBLENDFUNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<97, PFNGLBLENDFUNCSEPARATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<98, PFNGLBUFFERDATAPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<99, PFNGLBUFFERSUBDATAPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<100, PFNGLCHECKFRAMEBUFFERSTATUSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<101, PFNGLCLEARPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<102, PFNGLCLEARCOLORPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<103, PFNGLCLEARDEPTHFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<104, PFNGLCLEARSTENCILPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<105, PFNGLCOLORMASKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<106, PFNGLCOMPILESHADERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<107, PFNGLCOMPRESSEDTEXIMAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<108, PFNGLCOMPRESSEDTEXSUBIMAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<109, PFNGLCOPYTEXIMAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<110, PFNGLCOPYTEXSUBIMAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<111, PFNGLCREATEPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<112, PFNGLCREATESHADERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<113, PFNGLCULLFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<114, PFNGLDELETEBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<115, PFNGLDELETEFRAMEBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<116, PFNGLDELETEPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<117, PFNGLDELETERENDERBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<118, PFNGLDELETESHADERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<119, PFNGLDELETETEXTURESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<120, PFNGLDEPTHFUNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<121, PFNGLDEPTHMASKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<122, PFNGLDEPTHRANGEFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<123, PFNGLDETACHSHADERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<124, PFNGLDISABLEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<125, PFNGLDISABLEVERTEXATTRIBARRAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<126, PFNGLDRAWARRAYSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<127, PFNGLDRAWELEMENTSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<128, PFNGLENABLEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<129, PFNGLENABLEVERTEXATTRIBARRAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<130, PFNGLFINISHPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<131, PFNGLFLUSHPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<132, PFNGLFRAMEBUFFERRENDERBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<133, PFNGLFRAMEBUFFERTEXTURE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<134, PFNGLFRONTFACEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<135, PFNGLGENBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<136, PFNGLGENERATEMIPMAPPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<137, PFNGLGENFRAMEBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<138, PFNGLGENRENDERBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<139, PFNGLGENTEXTURESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<140, PFNGLGETACTIVEATTRIBPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<141, PFNGLGETACTIVEUNIFORMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<142, PFNGLGETATTACHEDSHADERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<143, PFNGLGETATTRIBLOCATIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<144, PFNGLGETBOOLEANVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<145, PFNGLGETBUFFERPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<146, PFNGLGETERRORPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<147, PFNGLGETFLOATVPROC>::Stub),
+    reinterpret_cast<GenericProc>(
+        &LazyProc<148, PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<149, PFNGLGETINTEGERVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<150, PFNGLGETPROGRAMIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<151, PFNGLGETPROGRAMINFOLOGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<152, PFNGLGETRENDERBUFFERPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<153, PFNGLGETSHADERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<154, PFNGLGETSHADERINFOLOGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<155, PFNGLGETSHADERPRECISIONFORMATPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<156, PFNGLGETSHADERSOURCEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<157, PFNGLGETSTRINGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<158, PFNGLGETTEXPARAMETERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<159, PFNGLGETTEXPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<160, PFNGLGETUNIFORMFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<161, PFNGLGETUNIFORMIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<162, PFNGLGETUNIFORMLOCATIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<163, PFNGLGETVERTEXATTRIBFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<164, PFNGLGETVERTEXATTRIBIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<165, PFNGLGETVERTEXATTRIBPOINTERVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<166, PFNGLHINTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<167, PFNGLISBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<168, PFNGLISENABLEDPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<169, PFNGLISFRAMEBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<170, PFNGLISPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<171, PFNGLISRENDERBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<172, PFNGLISSHADERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<173, PFNGLISTEXTUREPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<174, PFNGLLINEWIDTHPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<175, PFNGLLINKPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<176, PFNGLPIXELSTOREIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<177, PFNGLPOLYGONOFFSETPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<178, PFNGLREADPIXELSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<179, PFNGLRELEASESHADERCOMPILERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<180, PFNGLRENDERBUFFERSTORAGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<181, PFNGLSAMPLECOVERAGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<182, PFNGLSCISSORPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<183, PFNGLSHADERBINARYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<184, PFNGLSHADERSOURCEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<185, PFNGLSTENCILFUNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<186, PFNGLSTENCILFUNCSEPARATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<187, PFNGLSTENCILMASKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<188, PFNGLSTENCILMASKSEPARATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<189, PFNGLSTENCILOPPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<190, PFNGLSTENCILOPSEPARATEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<191, PFNGLTEXIMAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<192, PFNGLTEXPARAMETERFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<193, PFNGLTEXPARAMETERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<194, PFNGLTEXPARAMETERIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<195, PFNGLTEXPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<196, PFNGLTEXSUBIMAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<197, PFNGLUNIFORM1FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<198, PFNGLUNIFORM1FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<199, PFNGLUNIFORM1IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<200, PFNGLUNIFORM1IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<201, PFNGLUNIFORM2FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<202, PFNGLUNIFORM2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<203, PFNGLUNIFORM2IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<204, PFNGLUNIFORM2IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<205, PFNGLUNIFORM3FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<206, PFNGLUNIFORM3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<207, PFNGLUNIFORM3IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<208, PFNGLUNIFORM3IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<209, PFNGLUNIFORM4FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<210, PFNGLUNIFORM4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<211, PFNGLUNIFORM4IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<212, PFNGLUNIFORM4IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<213, PFNGLUNIFORMMATRIX2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<214, PFNGLUNIFORMMATRIX3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<215, PFNGLUNIFORMMATRIX4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<216, PFNGLUSEPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<217, PFNGLVALIDATEPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<218, PFNGLVERTEXATTRIB1FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<219, PFNGLVERTEXATTRIB1FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<220, PFNGLVERTEXATTRIB2FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<221, PFNGLVERTEXATTRIB2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<222, PFNGLVERTEXATTRIB3FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<223, PFNGLVERTEXATTRIB3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<224, PFNGLVERTEXATTRIB4FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<225, PFNGLVERTEXATTRIB4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<226, PFNGLVERTEXATTRIBPOINTERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<227, PFNGLVIEWPORTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<228, PFNGLREADBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<229, PFNGLDRAWRANGEELEMENTSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<230, PFNGLTEXIMAGE3DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<231, PFNGLTEXSUBIMAGE3DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<232, PFNGLCOPYTEXSUBIMAGE3DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<233, PFNGLCOMPRESSEDTEXIMAGE3DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<234, PFNGLCOMPRESSEDTEXSUBIMAGE3DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<235, PFNGLGENQUERIESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<236, PFNGLDELETEQUERIESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<237, PFNGLISQUERYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<238, PFNGLBEGINQUERYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<239, PFNGLENDQUERYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<240, PFNGLGETQUERYIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<241, PFNGLGETQUERYOBJECTUIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<242, PFNGLUNMAPBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<243, PFNGLGETBUFFERPOINTERVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<244, PFNGLDRAWBUFFERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<245, PFNGLUNIFORMMATRIX2X3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<246, PFNGLUNIFORMMATRIX3X2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<247, PFNGLUNIFORMMATRIX2X4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<248, PFNGLUNIFORMMATRIX4X2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<249, PFNGLUNIFORMMATRIX3X4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<250, PFNGLUNIFORMMATRIX4X3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<251, PFNGLBLITFRAMEBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<252, PFNGLRENDERBUFFERSTORAGEMULTISAMPLEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<253, PFNGLFRAMEBUFFERTEXTURELAYERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<254, PFNGLMAPBUFFERRANGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<255, PFNGLFLUSHMAPPEDBUFFERRANGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<256, PFNGLBINDVERTEXARRAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<257, PFNGLDELETEVERTEXARRAYSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<258, PFNGLGENVERTEXARRAYSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<259, PFNGLISVERTEXARRAYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<260, PFNGLGETINTEGERI_VPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<261, PFNGLBEGINTRANSFORMFEEDBACKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<262, PFNGLENDTRANSFORMFEEDBACKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<263, PFNGLBINDBUFFERRANGEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<264, PFNGLBINDBUFFERBASEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<265, PFNGLTRANSFORMFEEDBACKVARYINGSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<266, PFNGLGETTRANSFORMFEEDBACKVARYINGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<267, PFNGLVERTEXATTRIBIPOINTERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<268, PFNGLGETVERTEXATTRIBIIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<269, PFNGLGETVERTEXATTRIBIUIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<270, PFNGLVERTEXATTRIBI4IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<271, PFNGLVERTEXATTRIBI4UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<272, PFNGLVERTEXATTRIBI4IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<273, PFNGLVERTEXATTRIBI4UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<274, PFNGLGETUNIFORMUIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<275, PFNGLGETFRAGDATALOCATIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<276, PFNGLUNIFORM1UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<277, PFNGLUNIFORM2UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<278, PFNGLUNIFORM3UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<279, PFNGLUNIFORM4UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<280, PFNGLUNIFORM1UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<281, PFNGLUNIFORM2UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<282, PFNGLUNIFORM3UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<283, PFNGLUNIFORM4UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<284, PFNGLCLEARBUFFERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<285, PFNGLCLEARBUFFERUIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<286, PFNGLCLEARBUFFERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<287, PFNGLCLEARBUFFERFIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<288, PFNGLGETSTRINGIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<289, PFNGLCOPYBUFFERSUBDATAPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<290, PFNGLGETUNIFORMINDICESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<291, PFNGLGETACTIVEUNIFORMSIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<292, PFNGLGETUNIFORMBLOCKINDEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<293, PFNGLGETACTIVEUNIFORMBLOCKIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<294, PFNGLGETACTIVEUNIFORMBLOCKNAMEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<295, PFNGLUNIFORMBLOCKBINDINGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<296, PFNGLDRAWARRAYSINSTANCEDPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<297, PFNGLDRAWELEMENTSINSTANCEDPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<298, PFNGLFENCESYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<299, PFNGLISSYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<300, PFNGLDELETESYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<301, PFNGLCLIENTWAITSYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<302, PFNGLWAITSYNCPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<303, PFNGLGETINTEGER64VPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<304, PFNGLGETSYNCIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<305, PFNGLGETINTEGER64I_VPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<306, PFNGLGETBUFFERPARAMETERI64VPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<307, PFNGLGENSAMPLERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<308, PFNGLDELETESAMPLERSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<309, PFNGLISSAMPLERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<310, PFNGLBINDSAMPLERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<311, PFNGLSAMPLERPARAMETERIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<312, PFNGLSAMPLERPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<313, PFNGLSAMPLERPARAMETERFPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<314, PFNGLSAMPLERPARAMETERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<315, PFNGLGETSAMPLERPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<316, PFNGLGETSAMPLERPARAMETERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<317, PFNGLVERTEXATTRIBDIVISORPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<318, PFNGLBINDTRANSFORMFEEDBACKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<319, PFNGLDELETETRANSFORMFEEDBACKSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<320, PFNGLGENTRANSFORMFEEDBACKSPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<321, PFNGLISTRANSFORMFEEDBACKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<322, PFNGLPAUSETRANSFORMFEEDBACKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<323, PFNGLRESUMETRANSFORMFEEDBACKPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<324, PFNGLGETPROGRAMBINARYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<325, PFNGLPROGRAMBINARYPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<326, PFNGLPROGRAMPARAMETERIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<327, PFNGLINVALIDATEFRAMEBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<328, PFNGLINVALIDATESUBFRAMEBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<329, PFNGLTEXSTORAGE2DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<330, PFNGLTEXSTORAGE3DPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<331, PFNGLGETINTERNALFORMATIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<332, PFNGLDISPATCHCOMPUTEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<333, PFNGLDISPATCHCOMPUTEINDIRECTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<334, PFNGLDRAWARRAYSINDIRECTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<335, PFNGLDRAWELEMENTSINDIRECTPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<336, PFNGLFRAMEBUFFERPARAMETERIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<337, PFNGLGETFRAMEBUFFERPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<338, PFNGLGETPROGRAMINTERFACEIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<339, PFNGLGETPROGRAMRESOURCEINDEXPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<340, PFNGLGETPROGRAMRESOURCENAMEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<341, PFNGLGETPROGRAMRESOURCEIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<342, PFNGLGETPROGRAMRESOURCELOCATIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<343, PFNGLUSEPROGRAMSTAGESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<344, PFNGLACTIVESHADERPROGRAMPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<345, PFNGLCREATESHADERPROGRAMVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<346, PFNGLBINDPROGRAMPIPELINEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<347, PFNGLDELETEPROGRAMPIPELINESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<348, PFNGLGENPROGRAMPIPELINESPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<349, PFNGLISPROGRAMPIPELINEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<350, PFNGLGETPROGRAMPIPELINEIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<351, PFNGLPROGRAMUNIFORM1IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<352, PFNGLPROGRAMUNIFORM2IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<353, PFNGLPROGRAMUNIFORM3IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<354, PFNGLPROGRAMUNIFORM4IPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<355, PFNGLPROGRAMUNIFORM1UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<356, PFNGLPROGRAMUNIFORM2UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<357, PFNGLPROGRAMUNIFORM3UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<358, PFNGLPROGRAMUNIFORM4UIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<359, PFNGLPROGRAMUNIFORM1FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<360, PFNGLPROGRAMUNIFORM2FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<361, PFNGLPROGRAMUNIFORM3FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<362, PFNGLPROGRAMUNIFORM4FPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<363, PFNGLPROGRAMUNIFORM1IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<364, PFNGLPROGRAMUNIFORM2IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<365, PFNGLPROGRAMUNIFORM3IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<366, PFNGLPROGRAMUNIFORM4IVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<367, PFNGLPROGRAMUNIFORM1UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<368, PFNGLPROGRAMUNIFORM2UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<369, PFNGLPROGRAMUNIFORM3UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<370, PFNGLPROGRAMUNIFORM4UIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<371, PFNGLPROGRAMUNIFORM1FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<372, PFNGLPROGRAMUNIFORM2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<373, PFNGLPROGRAMUNIFORM3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<374, PFNGLPROGRAMUNIFORM4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<375, PFNGLPROGRAMUNIFORMMATRIX2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<376, PFNGLPROGRAMUNIFORMMATRIX3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<377, PFNGLPROGRAMUNIFORMMATRIX4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<378, PFNGLPROGRAMUNIFORMMATRIX2X3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<379, PFNGLPROGRAMUNIFORMMATRIX3X2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<380, PFNGLPROGRAMUNIFORMMATRIX2X4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<381, PFNGLPROGRAMUNIFORMMATRIX4X2FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<382, PFNGLPROGRAMUNIFORMMATRIX3X4FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<383, PFNGLPROGRAMUNIFORMMATRIX4X3FVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<384, PFNGLVALIDATEPROGRAMPIPELINEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<385, PFNGLGETPROGRAMPIPELINEINFOLOGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<386, PFNGLBINDIMAGETEXTUREPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<387, PFNGLGETBOOLEANI_VPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<388, PFNGLMEMORYBARRIERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<389, PFNGLMEMORYBARRIERBYREGIONPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<390, PFNGLTEXSTORAGE2DMULTISAMPLEPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<391, PFNGLGETMULTISAMPLEFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<392, PFNGLSAMPLEMASKIPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<393, PFNGLGETTEXLEVELPARAMETERIVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<394, PFNGLGETTEXLEVELPARAMETERFVPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<395, PFNGLBINDVERTEXBUFFERPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<396, PFNGLVERTEXATTRIBFORMATPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<397, PFNGLVERTEXATTRIBIFORMATPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<398, PFNGLVERTEXATTRIBBINDINGPROC>::Stub),
+    reinterpret_cast<GenericProc>(&LazyProc<399, PFNGLVERTEXBINDINGDIVISORPROC>::Stub),
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+};
+}  // anonymous namespace
+
 void LoadGLES(LoadProc loadProc)
 {
-    glAlphaFunc       = reinterpret_cast<PFNGLALPHAFUNCPROC>(loadProc("glAlphaFunc"));
-    glClipPlanef      = reinterpret_cast<PFNGLCLIPPLANEFPROC>(loadProc("glClipPlanef"));
-    glColor4f         = reinterpret_cast<PFNGLCOLOR4FPROC>(loadProc("glColor4f"));
-    glFogf            = reinterpret_cast<PFNGLFOGFPROC>(loadProc("glFogf"));
-    glFogfv           = reinterpret_cast<PFNGLFOGFVPROC>(loadProc("glFogfv"));
-    glFrustumf        = reinterpret_cast<PFNGLFRUSTUMFPROC>(loadProc("glFrustumf"));
-    glGetClipPlanef   = reinterpret_cast<PFNGLGETCLIPPLANEFPROC>(loadProc("glGetClipPlanef"));
-    glGetLightfv      = reinterpret_cast<PFNGLGETLIGHTFVPROC>(loadProc("glGetLightfv"));
-    glGetMaterialfv   = reinterpret_cast<PFNGLGETMATERIALFVPROC>(loadProc("glGetMaterialfv"));
-    glGetTexEnvfv     = reinterpret_cast<PFNGLGETTEXENVFVPROC>(loadProc("glGetTexEnvfv"));
-    glLightModelf     = reinterpret_cast<PFNGLLIGHTMODELFPROC>(loadProc("glLightModelf"));
-    glLightModelfv    = reinterpret_cast<PFNGLLIGHTMODELFVPROC>(loadProc("glLightModelfv"));
-    glLightf          = reinterpret_cast<PFNGLLIGHTFPROC>(loadProc("glLightf"));
-    glLightfv         = reinterpret_cast<PFNGLLIGHTFVPROC>(loadProc("glLightfv"));
-    glLoadMatrixf     = reinterpret_cast<PFNGLLOADMATRIXFPROC>(loadProc("glLoadMatrixf"));
-    glMaterialf       = reinterpret_cast<PFNGLMATERIALFPROC>(loadProc("glMaterialf"));
-    glMaterialfv      = reinterpret_cast<PFNGLMATERIALFVPROC>(loadProc("glMaterialfv"));
-    glMultMatrixf     = reinterpret_cast<PFNGLMULTMATRIXFPROC>(loadProc("glMultMatrixf"));
-    glMultiTexCoord4f = reinterpret_cast<PFNGLMULTITEXCOORD4FPROC>(loadProc("glMultiTexCoord4f"));
-    glNormal3f        = reinterpret_cast<PFNGLNORMAL3FPROC>(loadProc("glNormal3f"));
-    glOrthof          = reinterpret_cast<PFNGLORTHOFPROC>(loadProc("glOrthof"));
-    glPointParameterf = reinterpret_cast<PFNGLPOINTPARAMETERFPROC>(loadProc("glPointParameterf"));
-    glPointParameterfv =
-        reinterpret_cast<PFNGLPOINTPARAMETERFVPROC>(loadProc("glPointParameterfv"));
-    glPointSize   = reinterpret_cast<PFNGLPOINTSIZEPROC>(loadProc("glPointSize"));
-    glRotatef     = reinterpret_cast<PFNGLROTATEFPROC>(loadProc("glRotatef"));
-    glScalef      = reinterpret_cast<PFNGLSCALEFPROC>(loadProc("glScalef"));
-    glTexEnvf     = reinterpret_cast<PFNGLTEXENVFPROC>(loadProc("glTexEnvf"));
-    glTexEnvfv    = reinterpret_cast<PFNGLTEXENVFVPROC>(loadProc("glTexEnvfv"));
-    glTranslatef  = reinterpret_cast<PFNGLTRANSLATEFPROC>(loadProc("glTranslatef"));
-    glAlphaFuncx  = reinterpret_cast<PFNGLALPHAFUNCXPROC>(loadProc("glAlphaFuncx"));
-    glClearColorx = reinterpret_cast<PFNGLCLEARCOLORXPROC>(loadProc("glClearColorx"));
-    glClearDepthx = reinterpret_cast<PFNGLCLEARDEPTHXPROC>(loadProc("glClearDepthx"));
-    glClientActiveTexture =
-        reinterpret_cast<PFNGLCLIENTACTIVETEXTUREPROC>(loadProc("glClientActiveTexture"));
-    glClipPlanex   = reinterpret_cast<PFNGLCLIPPLANEXPROC>(loadProc("glClipPlanex"));
-    glColor4ub     = reinterpret_cast<PFNGLCOLOR4UBPROC>(loadProc("glColor4ub"));
-    glColor4x      = reinterpret_cast<PFNGLCOLOR4XPROC>(loadProc("glColor4x"));
-    glColorPointer = reinterpret_cast<PFNGLCOLORPOINTERPROC>(loadProc("glColorPointer"));
-    glDepthRangex  = reinterpret_cast<PFNGLDEPTHRANGEXPROC>(loadProc("glDepthRangex"));
-    glDisableClientState =
-        reinterpret_cast<PFNGLDISABLECLIENTSTATEPROC>(loadProc("glDisableClientState"));
-    glEnableClientState =
-        reinterpret_cast<PFNGLENABLECLIENTSTATEPROC>(loadProc("glEnableClientState"));
-    glFogx          = reinterpret_cast<PFNGLFOGXPROC>(loadProc("glFogx"));
-    glFogxv         = reinterpret_cast<PFNGLFOGXVPROC>(loadProc("glFogxv"));
-    glFrustumx      = reinterpret_cast<PFNGLFRUSTUMXPROC>(loadProc("glFrustumx"));
-    glGetClipPlanex = reinterpret_cast<PFNGLGETCLIPPLANEXPROC>(loadProc("glGetClipPlanex"));
-    glGetFixedv     = reinterpret_cast<PFNGLGETFIXEDVPROC>(loadProc("glGetFixedv"));
-    glGetLightxv    = reinterpret_cast<PFNGLGETLIGHTXVPROC>(loadProc("glGetLightxv"));
-    glGetMaterialxv = reinterpret_cast<PFNGLGETMATERIALXVPROC>(loadProc("glGetMaterialxv"));
-    glGetPointerv   = reinterpret_cast<PFNGLGETPOINTERVPROC>(loadProc("glGetPointerv"));
-    glGetTexEnviv   = reinterpret_cast<PFNGLGETTEXENVIVPROC>(loadProc("glGetTexEnviv"));
-    glGetTexEnvxv   = reinterpret_cast<PFNGLGETTEXENVXVPROC>(loadProc("glGetTexEnvxv"));
-    glGetTexParameterxv =
-        reinterpret_cast<PFNGLGETTEXPARAMETERXVPROC>(loadProc("glGetTexParameterxv"));
-    glLightModelx     = reinterpret_cast<PFNGLLIGHTMODELXPROC>(loadProc("glLightModelx"));
-    glLightModelxv    = reinterpret_cast<PFNGLLIGHTMODELXVPROC>(loadProc("glLightModelxv"));
-    glLightx          = reinterpret_cast<PFNGLLIGHTXPROC>(loadProc("glLightx"));
-    glLightxv         = reinterpret_cast<PFNGLLIGHTXVPROC>(loadProc("glLightxv"));
-    glLineWidthx      = reinterpret_cast<PFNGLLINEWIDTHXPROC>(loadProc("glLineWidthx"));
-    glLoadIdentity    = reinterpret_cast<PFNGLLOADIDENTITYPROC>(loadProc("glLoadIdentity"));
-    glLoadMatrixx     = reinterpret_cast<PFNGLLOADMATRIXXPROC>(loadProc("glLoadMatrixx"));
-    glLogicOp         = reinterpret_cast<PFNGLLOGICOPPROC>(loadProc("glLogicOp"));
-    glMaterialx       = reinterpret_cast<PFNGLMATERIALXPROC>(loadProc("glMaterialx"));
-    glMaterialxv      = reinterpret_cast<PFNGLMATERIALXVPROC>(loadProc("glMaterialxv"));
-    glMatrixMode      = reinterpret_cast<PFNGLMATRIXMODEPROC>(loadProc("glMatrixMode"));
-    glMultMatrixx     = reinterpret_cast<PFNGLMULTMATRIXXPROC>(loadProc("glMultMatrixx"));
-    glMultiTexCoord4x = reinterpret_cast<PFNGLMULTITEXCOORD4XPROC>(loadProc("glMultiTexCoord4x"));
-    glNormal3x        = reinterpret_cast<PFNGLNORMAL3XPROC>(loadProc("glNormal3x"));
-    glNormalPointer   = reinterpret_cast<PFNGLNORMALPOINTERPROC>(loadProc("glNormalPointer"));
-    glOrthox          = reinterpret_cast<PFNGLORTHOXPROC>(loadProc("glOrthox"));
-    glPointParameterx = reinterpret_cast<PFNGLPOINTPARAMETERXPROC>(loadProc("glPointParameterx"));
-    glPointParameterxv =
-        reinterpret_cast<PFNGLPOINTPARAMETERXVPROC>(loadProc("glPointParameterxv"));
-    glPointSizex      = reinterpret_cast<PFNGLPOINTSIZEXPROC>(loadProc("glPointSizex"));
-    glPolygonOffsetx  = reinterpret_cast<PFNGLPOLYGONOFFSETXPROC>(loadProc("glPolygonOffsetx"));
-    glPopMatrix       = reinterpret_cast<PFNGLPOPMATRIXPROC>(loadProc("glPopMatrix"));
-    glPushMatrix      = reinterpret_cast<PFNGLPUSHMATRIXPROC>(loadProc("glPushMatrix"));
-    glRotatex         = reinterpret_cast<PFNGLROTATEXPROC>(loadProc("glRotatex"));
-    glSampleCoveragex = reinterpret_cast<PFNGLSAMPLECOVERAGEXPROC>(loadProc("glSampleCoveragex"));
-    glScalex          = reinterpret_cast<PFNGLSCALEXPROC>(loadProc("glScalex"));
-    glShadeModel      = reinterpret_cast<PFNGLSHADEMODELPROC>(loadProc("glShadeModel"));
-    glTexCoordPointer = reinterpret_cast<PFNGLTEXCOORDPOINTERPROC>(loadProc("glTexCoordPointer"));
-    glTexEnvi         = reinterpret_cast<PFNGLTEXENVIPROC>(loadProc("glTexEnvi"));
-    glTexEnvx         = reinterpret_cast<PFNGLTEXENVXPROC>(loadProc("glTexEnvx"));
-    glTexEnviv        = reinterpret_cast<PFNGLTEXENVIVPROC>(loadProc("glTexEnviv"));
-    glTexEnvxv        = reinterpret_cast<PFNGLTEXENVXVPROC>(loadProc("glTexEnvxv"));
-    glTexParameterx   = reinterpret_cast<PFNGLTEXPARAMETERXPROC>(loadProc("glTexParameterx"));
-    glTexParameterxv  = reinterpret_cast<PFNGLTEXPARAMETERXVPROC>(loadProc("glTexParameterxv"));
-    glTranslatex      = reinterpret_cast<PFNGLTRANSLATEXPROC>(loadProc("glTranslatex"));
-    glVertexPointer   = reinterpret_cast<PFNGLVERTEXPOINTERPROC>(loadProc("glVertexPointer"));
-    glActiveTexture   = reinterpret_cast<PFNGLACTIVETEXTUREPROC>(loadProc("glActiveTexture"));
-    glAttachShader    = reinterpret_cast<PFNGLATTACHSHADERPROC>(loadProc("glAttachShader"));
-    glBindAttribLocation =
-        reinterpret_cast<PFNGLBINDATTRIBLOCATIONPROC>(loadProc("glBindAttribLocation"));
-    glBindBuffer      = reinterpret_cast<PFNGLBINDBUFFERPROC>(loadProc("glBindBuffer"));
-    glBindFramebuffer = reinterpret_cast<PFNGLBINDFRAMEBUFFERPROC>(loadProc("glBindFramebuffer"));
-    glBindRenderbuffer =
-        reinterpret_cast<PFNGLBINDRENDERBUFFERPROC>(loadProc("glBindRenderbuffer"));
-    glBindTexture   = reinterpret_cast<PFNGLBINDTEXTUREPROC>(loadProc("glBindTexture"));
-    glBlendColor    = reinterpret_cast<PFNGLBLENDCOLORPROC>(loadProc("glBlendColor"));
-    glBlendEquation = reinterpret_cast<PFNGLBLENDEQUATIONPROC>(loadProc("glBlendEquation"));
-    glBlendEquationSeparate =
-        reinterpret_cast<PFNGLBLENDEQUATIONSEPARATEPROC>(loadProc("glBlendEquationSeparate"));
-    glBlendFunc = reinterpret_cast<PFNGLBLENDFUNCPROC>(loadProc("glBlendFunc"));
-    glBlendFuncSeparate =
-        reinterpret_cast<PFNGLBLENDFUNCSEPARATEPROC>(loadProc("glBlendFuncSeparate"));
-    glBufferData    = reinterpret_cast<PFNGLBUFFERDATAPROC>(loadProc("glBufferData"));
-    glBufferSubData = reinterpret_cast<PFNGLBUFFERSUBDATAPROC>(loadProc("glBufferSubData"));
-    glCheckFramebufferStatus =
-        reinterpret_cast<PFNGLCHECKFRAMEBUFFERSTATUSPROC>(loadProc("glCheckFramebufferStatus"));
-    glClear         = reinterpret_cast<PFNGLCLEARPROC>(loadProc("glClear"));
-    glClearColor    = reinterpret_cast<PFNGLCLEARCOLORPROC>(loadProc("glClearColor"));
-    glClearDepthf   = reinterpret_cast<PFNGLCLEARDEPTHFPROC>(loadProc("glClearDepthf"));
-    glClearStencil  = reinterpret_cast<PFNGLCLEARSTENCILPROC>(loadProc("glClearStencil"));
-    glColorMask     = reinterpret_cast<PFNGLCOLORMASKPROC>(loadProc("glColorMask"));
-    glCompileShader = reinterpret_cast<PFNGLCOMPILESHADERPROC>(loadProc("glCompileShader"));
-    glCompressedTexImage2D =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE2DPROC>(loadProc("glCompressedTexImage2D"));
-    glCompressedTexSubImage2D =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE2DPROC>(loadProc("glCompressedTexSubImage2D"));
-    glCopyTexImage2D = reinterpret_cast<PFNGLCOPYTEXIMAGE2DPROC>(loadProc("glCopyTexImage2D"));
-    glCopyTexSubImage2D =
-        reinterpret_cast<PFNGLCOPYTEXSUBIMAGE2DPROC>(loadProc("glCopyTexSubImage2D"));
-    glCreateProgram = reinterpret_cast<PFNGLCREATEPROGRAMPROC>(loadProc("glCreateProgram"));
-    glCreateShader  = reinterpret_cast<PFNGLCREATESHADERPROC>(loadProc("glCreateShader"));
-    glCullFace      = reinterpret_cast<PFNGLCULLFACEPROC>(loadProc("glCullFace"));
-    glDeleteBuffers = reinterpret_cast<PFNGLDELETEBUFFERSPROC>(loadProc("glDeleteBuffers"));
-    glDeleteFramebuffers =
-        reinterpret_cast<PFNGLDELETEFRAMEBUFFERSPROC>(loadProc("glDeleteFramebuffers"));
-    glDeleteProgram = reinterpret_cast<PFNGLDELETEPROGRAMPROC>(loadProc("glDeleteProgram"));
-    glDeleteRenderbuffers =
-        reinterpret_cast<PFNGLDELETERENDERBUFFERSPROC>(loadProc("glDeleteRenderbuffers"));
-    glDeleteShader   = reinterpret_cast<PFNGLDELETESHADERPROC>(loadProc("glDeleteShader"));
-    glDeleteTextures = reinterpret_cast<PFNGLDELETETEXTURESPROC>(loadProc("glDeleteTextures"));
-    glDepthFunc      = reinterpret_cast<PFNGLDEPTHFUNCPROC>(loadProc("glDepthFunc"));
-    glDepthMask      = reinterpret_cast<PFNGLDEPTHMASKPROC>(loadProc("glDepthMask"));
-    glDepthRangef    = reinterpret_cast<PFNGLDEPTHRANGEFPROC>(loadProc("glDepthRangef"));
-    glDetachShader   = reinterpret_cast<PFNGLDETACHSHADERPROC>(loadProc("glDetachShader"));
-    glDisable        = reinterpret_cast<PFNGLDISABLEPROC>(loadProc("glDisable"));
-    glDisableVertexAttribArray =
-        reinterpret_cast<PFNGLDISABLEVERTEXATTRIBARRAYPROC>(loadProc("glDisableVertexAttribArray"));
-    glDrawArrays   = reinterpret_cast<PFNGLDRAWARRAYSPROC>(loadProc("glDrawArrays"));
-    glDrawElements = reinterpret_cast<PFNGLDRAWELEMENTSPROC>(loadProc("glDrawElements"));
-    glEnable       = reinterpret_cast<PFNGLENABLEPROC>(loadProc("glEnable"));
-    glEnableVertexAttribArray =
-        reinterpret_cast<PFNGLENABLEVERTEXATTRIBARRAYPROC>(loadProc("glEnableVertexAttribArray"));
-    glFinish = reinterpret_cast<PFNGLFINISHPROC>(loadProc("glFinish"));
-    glFlush  = reinterpret_cast<PFNGLFLUSHPROC>(loadProc("glFlush"));
-    glFramebufferRenderbuffer =
-        reinterpret_cast<PFNGLFRAMEBUFFERRENDERBUFFERPROC>(loadProc("glFramebufferRenderbuffer"));
-    glFramebufferTexture2D =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTURE2DPROC>(loadProc("glFramebufferTexture2D"));
-    glFrontFace       = reinterpret_cast<PFNGLFRONTFACEPROC>(loadProc("glFrontFace"));
-    glGenBuffers      = reinterpret_cast<PFNGLGENBUFFERSPROC>(loadProc("glGenBuffers"));
-    glGenerateMipmap  = reinterpret_cast<PFNGLGENERATEMIPMAPPROC>(loadProc("glGenerateMipmap"));
-    glGenFramebuffers = reinterpret_cast<PFNGLGENFRAMEBUFFERSPROC>(loadProc("glGenFramebuffers"));
-    glGenRenderbuffers =
-        reinterpret_cast<PFNGLGENRENDERBUFFERSPROC>(loadProc("glGenRenderbuffers"));
-    glGenTextures     = reinterpret_cast<PFNGLGENTEXTURESPROC>(loadProc("glGenTextures"));
-    glGetActiveAttrib = reinterpret_cast<PFNGLGETACTIVEATTRIBPROC>(loadProc("glGetActiveAttrib"));
-    glGetActiveUniform =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMPROC>(loadProc("glGetActiveUniform"));
-    glGetAttachedShaders =
-        reinterpret_cast<PFNGLGETATTACHEDSHADERSPROC>(loadProc("glGetAttachedShaders"));
-    glGetAttribLocation =
-        reinterpret_cast<PFNGLGETATTRIBLOCATIONPROC>(loadProc("glGetAttribLocation"));
-    glGetBooleanv = reinterpret_cast<PFNGLGETBOOLEANVPROC>(loadProc("glGetBooleanv"));
-    glGetBufferParameteriv =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERIVPROC>(loadProc("glGetBufferParameteriv"));
-    glGetError  = reinterpret_cast<PFNGLGETERRORPROC>(loadProc("glGetError"));
-    glGetFloatv = reinterpret_cast<PFNGLGETFLOATVPROC>(loadProc("glGetFloatv"));
-    glGetFramebufferAttachmentParameteriv =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVPROC>(
-            loadProc("glGetFramebufferAttachmentParameteriv"));
-    glGetIntegerv  = reinterpret_cast<PFNGLGETINTEGERVPROC>(loadProc("glGetIntegerv"));
-    glGetProgramiv = reinterpret_cast<PFNGLGETPROGRAMIVPROC>(loadProc("glGetProgramiv"));
-    glGetProgramInfoLog =
-        reinterpret_cast<PFNGLGETPROGRAMINFOLOGPROC>(loadProc("glGetProgramInfoLog"));
-    glGetRenderbufferParameteriv = reinterpret_cast<PFNGLGETRENDERBUFFERPARAMETERIVPROC>(
-        loadProc("glGetRenderbufferParameteriv"));
-    glGetShaderiv = reinterpret_cast<PFNGLGETSHADERIVPROC>(loadProc("glGetShaderiv"));
-    glGetShaderInfoLog =
-        reinterpret_cast<PFNGLGETSHADERINFOLOGPROC>(loadProc("glGetShaderInfoLog"));
-    glGetShaderPrecisionFormat =
-        reinterpret_cast<PFNGLGETSHADERPRECISIONFORMATPROC>(loadProc("glGetShaderPrecisionFormat"));
-    glGetShaderSource = reinterpret_cast<PFNGLGETSHADERSOURCEPROC>(loadProc("glGetShaderSource"));
-    glGetString       = reinterpret_cast<PFNGLGETSTRINGPROC>(loadProc("glGetString"));
-    glGetTexParameterfv =
-        reinterpret_cast<PFNGLGETTEXPARAMETERFVPROC>(loadProc("glGetTexParameterfv"));
-    glGetTexParameteriv =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIVPROC>(loadProc("glGetTexParameteriv"));
-    glGetUniformfv = reinterpret_cast<PFNGLGETUNIFORMFVPROC>(loadProc("glGetUniformfv"));
-    glGetUniformiv = reinterpret_cast<PFNGLGETUNIFORMIVPROC>(loadProc("glGetUniformiv"));
-    glGetUniformLocation =
-        reinterpret_cast<PFNGLGETUNIFORMLOCATIONPROC>(loadProc("glGetUniformLocation"));
-    glGetVertexAttribfv =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBFVPROC>(loadProc("glGetVertexAttribfv"));
-    glGetVertexAttribiv =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBIVPROC>(loadProc("glGetVertexAttribiv"));
-    glGetVertexAttribPointerv =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBPOINTERVPROC>(loadProc("glGetVertexAttribPointerv"));
-    glHint           = reinterpret_cast<PFNGLHINTPROC>(loadProc("glHint"));
-    glIsBuffer       = reinterpret_cast<PFNGLISBUFFERPROC>(loadProc("glIsBuffer"));
-    glIsEnabled      = reinterpret_cast<PFNGLISENABLEDPROC>(loadProc("glIsEnabled"));
-    glIsFramebuffer  = reinterpret_cast<PFNGLISFRAMEBUFFERPROC>(loadProc("glIsFramebuffer"));
-    glIsProgram      = reinterpret_cast<PFNGLISPROGRAMPROC>(loadProc("glIsProgram"));
-    glIsRenderbuffer = reinterpret_cast<PFNGLISRENDERBUFFERPROC>(loadProc("glIsRenderbuffer"));
-    glIsShader       = reinterpret_cast<PFNGLISSHADERPROC>(loadProc("glIsShader"));
-    glIsTexture      = reinterpret_cast<PFNGLISTEXTUREPROC>(loadProc("glIsTexture"));
-    glLineWidth      = reinterpret_cast<PFNGLLINEWIDTHPROC>(loadProc("glLineWidth"));
-    glLinkProgram    = reinterpret_cast<PFNGLLINKPROGRAMPROC>(loadProc("glLinkProgram"));
-    glPixelStorei    = reinterpret_cast<PFNGLPIXELSTOREIPROC>(loadProc("glPixelStorei"));
-    glPolygonOffset  = reinterpret_cast<PFNGLPOLYGONOFFSETPROC>(loadProc("glPolygonOffset"));
-    glReadPixels     = reinterpret_cast<PFNGLREADPIXELSPROC>(loadProc("glReadPixels"));
-    glReleaseShaderCompiler =
-        reinterpret_cast<PFNGLRELEASESHADERCOMPILERPROC>(loadProc("glReleaseShaderCompiler"));
-    glRenderbufferStorage =
-        reinterpret_cast<PFNGLRENDERBUFFERSTORAGEPROC>(loadProc("glRenderbufferStorage"));
-    glSampleCoverage = reinterpret_cast<PFNGLSAMPLECOVERAGEPROC>(loadProc("glSampleCoverage"));
-    glScissor        = reinterpret_cast<PFNGLSCISSORPROC>(loadProc("glScissor"));
-    glShaderBinary   = reinterpret_cast<PFNGLSHADERBINARYPROC>(loadProc("glShaderBinary"));
-    glShaderSource   = reinterpret_cast<PFNGLSHADERSOURCEPROC>(loadProc("glShaderSource"));
-    glStencilFunc    = reinterpret_cast<PFNGLSTENCILFUNCPROC>(loadProc("glStencilFunc"));
-    glStencilFuncSeparate =
-        reinterpret_cast<PFNGLSTENCILFUNCSEPARATEPROC>(loadProc("glStencilFuncSeparate"));
-    glStencilMask = reinterpret_cast<PFNGLSTENCILMASKPROC>(loadProc("glStencilMask"));
-    glStencilMaskSeparate =
-        reinterpret_cast<PFNGLSTENCILMASKSEPARATEPROC>(loadProc("glStencilMaskSeparate"));
-    glStencilOp = reinterpret_cast<PFNGLSTENCILOPPROC>(loadProc("glStencilOp"));
-    glStencilOpSeparate =
-        reinterpret_cast<PFNGLSTENCILOPSEPARATEPROC>(loadProc("glStencilOpSeparate"));
-    glTexImage2D     = reinterpret_cast<PFNGLTEXIMAGE2DPROC>(loadProc("glTexImage2D"));
-    glTexParameterf  = reinterpret_cast<PFNGLTEXPARAMETERFPROC>(loadProc("glTexParameterf"));
-    glTexParameterfv = reinterpret_cast<PFNGLTEXPARAMETERFVPROC>(loadProc("glTexParameterfv"));
-    glTexParameteri  = reinterpret_cast<PFNGLTEXPARAMETERIPROC>(loadProc("glTexParameteri"));
-    glTexParameteriv = reinterpret_cast<PFNGLTEXPARAMETERIVPROC>(loadProc("glTexParameteriv"));
-    glTexSubImage2D  = reinterpret_cast<PFNGLTEXSUBIMAGE2DPROC>(loadProc("glTexSubImage2D"));
-    glUniform1f      = reinterpret_cast<PFNGLUNIFORM1FPROC>(loadProc("glUniform1f"));
-    glUniform1fv     = reinterpret_cast<PFNGLUNIFORM1FVPROC>(loadProc("glUniform1fv"));
-    glUniform1i      = reinterpret_cast<PFNGLUNIFORM1IPROC>(loadProc("glUniform1i"));
-    glUniform1iv     = reinterpret_cast<PFNGLUNIFORM1IVPROC>(loadProc("glUniform1iv"));
-    glUniform2f      = reinterpret_cast<PFNGLUNIFORM2FPROC>(loadProc("glUniform2f"));
-    glUniform2fv     = reinterpret_cast<PFNGLUNIFORM2FVPROC>(loadProc("glUniform2fv"));
-    glUniform2i      = reinterpret_cast<PFNGLUNIFORM2IPROC>(loadProc("glUniform2i"));
-    glUniform2iv     = reinterpret_cast<PFNGLUNIFORM2IVPROC>(loadProc("glUniform2iv"));
-    glUniform3f      = reinterpret_cast<PFNGLUNIFORM3FPROC>(loadProc("glUniform3f"));
-    glUniform3fv     = reinterpret_cast<PFNGLUNIFORM3FVPROC>(loadProc("glUniform3fv"));
-    glUniform3i      = reinterpret_cast<PFNGLUNIFORM3IPROC>(loadProc("glUniform3i"));
-    glUniform3iv     = reinterpret_cast<PFNGLUNIFORM3IVPROC>(loadProc("glUniform3iv"));
-    glUniform4f      = reinterpret_cast<PFNGLUNIFORM4FPROC>(loadProc("glUniform4f"));
-    glUniform4fv     = reinterpret_cast<PFNGLUNIFORM4FVPROC>(loadProc("glUniform4fv"));
-    glUniform4i      = reinterpret_cast<PFNGLUNIFORM4IPROC>(loadProc("glUniform4i"));
-    glUniform4iv     = reinterpret_cast<PFNGLUNIFORM4IVPROC>(loadProc("glUniform4iv"));
-    glUniformMatrix2fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX2FVPROC>(loadProc("glUniformMatrix2fv"));
-    glUniformMatrix3fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX3FVPROC>(loadProc("glUniformMatrix3fv"));
-    glUniformMatrix4fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX4FVPROC>(loadProc("glUniformMatrix4fv"));
-    glUseProgram      = reinterpret_cast<PFNGLUSEPROGRAMPROC>(loadProc("glUseProgram"));
-    glValidateProgram = reinterpret_cast<PFNGLVALIDATEPROGRAMPROC>(loadProc("glValidateProgram"));
-    glVertexAttrib1f  = reinterpret_cast<PFNGLVERTEXATTRIB1FPROC>(loadProc("glVertexAttrib1f"));
-    glVertexAttrib1fv = reinterpret_cast<PFNGLVERTEXATTRIB1FVPROC>(loadProc("glVertexAttrib1fv"));
-    glVertexAttrib2f  = reinterpret_cast<PFNGLVERTEXATTRIB2FPROC>(loadProc("glVertexAttrib2f"));
-    glVertexAttrib2fv = reinterpret_cast<PFNGLVERTEXATTRIB2FVPROC>(loadProc("glVertexAttrib2fv"));
-    glVertexAttrib3f  = reinterpret_cast<PFNGLVERTEXATTRIB3FPROC>(loadProc("glVertexAttrib3f"));
-    glVertexAttrib3fv = reinterpret_cast<PFNGLVERTEXATTRIB3FVPROC>(loadProc("glVertexAttrib3fv"));
-    glVertexAttrib4f  = reinterpret_cast<PFNGLVERTEXATTRIB4FPROC>(loadProc("glVertexAttrib4f"));
-    glVertexAttrib4fv = reinterpret_cast<PFNGLVERTEXATTRIB4FVPROC>(loadProc("glVertexAttrib4fv"));
-    glVertexAttribPointer =
-        reinterpret_cast<PFNGLVERTEXATTRIBPOINTERPROC>(loadProc("glVertexAttribPointer"));
-    glViewport   = reinterpret_cast<PFNGLVIEWPORTPROC>(loadProc("glViewport"));
-    glReadBuffer = reinterpret_cast<PFNGLREADBUFFERPROC>(loadProc("glReadBuffer"));
-    glDrawRangeElements =
-        reinterpret_cast<PFNGLDRAWRANGEELEMENTSPROC>(loadProc("glDrawRangeElements"));
-    glTexImage3D    = reinterpret_cast<PFNGLTEXIMAGE3DPROC>(loadProc("glTexImage3D"));
-    glTexSubImage3D = reinterpret_cast<PFNGLTEXSUBIMAGE3DPROC>(loadProc("glTexSubImage3D"));
-    glCopyTexSubImage3D =
-        reinterpret_cast<PFNGLCOPYTEXSUBIMAGE3DPROC>(loadProc("glCopyTexSubImage3D"));
-    glCompressedTexImage3D =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE3DPROC>(loadProc("glCompressedTexImage3D"));
-    glCompressedTexSubImage3D =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE3DPROC>(loadProc("glCompressedTexSubImage3D"));
-    glGenQueries    = reinterpret_cast<PFNGLGENQUERIESPROC>(loadProc("glGenQueries"));
-    glDeleteQueries = reinterpret_cast<PFNGLDELETEQUERIESPROC>(loadProc("glDeleteQueries"));
-    glIsQuery       = reinterpret_cast<PFNGLISQUERYPROC>(loadProc("glIsQuery"));
-    glBeginQuery    = reinterpret_cast<PFNGLBEGINQUERYPROC>(loadProc("glBeginQuery"));
-    glEndQuery      = reinterpret_cast<PFNGLENDQUERYPROC>(loadProc("glEndQuery"));
-    glGetQueryiv    = reinterpret_cast<PFNGLGETQUERYIVPROC>(loadProc("glGetQueryiv"));
-    glGetQueryObjectuiv =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUIVPROC>(loadProc("glGetQueryObjectuiv"));
-    glUnmapBuffer = reinterpret_cast<PFNGLUNMAPBUFFERPROC>(loadProc("glUnmapBuffer"));
-    glGetBufferPointerv =
-        reinterpret_cast<PFNGLGETBUFFERPOINTERVPROC>(loadProc("glGetBufferPointerv"));
-    glDrawBuffers = reinterpret_cast<PFNGLDRAWBUFFERSPROC>(loadProc("glDrawBuffers"));
-    glUniformMatrix2x3fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX2X3FVPROC>(loadProc("glUniformMatrix2x3fv"));
-    glUniformMatrix3x2fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX3X2FVPROC>(loadProc("glUniformMatrix3x2fv"));
-    glUniformMatrix2x4fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX2X4FVPROC>(loadProc("glUniformMatrix2x4fv"));
-    glUniformMatrix4x2fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX4X2FVPROC>(loadProc("glUniformMatrix4x2fv"));
-    glUniformMatrix3x4fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX3X4FVPROC>(loadProc("glUniformMatrix3x4fv"));
-    glUniformMatrix4x3fv =
-        reinterpret_cast<PFNGLUNIFORMMATRIX4X3FVPROC>(loadProc("glUniformMatrix4x3fv"));
-    glBlitFramebuffer = reinterpret_cast<PFNGLBLITFRAMEBUFFERPROC>(loadProc("glBlitFramebuffer"));
-    glRenderbufferStorageMultisample = reinterpret_cast<PFNGLRENDERBUFFERSTORAGEMULTISAMPLEPROC>(
-        loadProc("glRenderbufferStorageMultisample"));
-    glFramebufferTextureLayer =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTURELAYERPROC>(loadProc("glFramebufferTextureLayer"));
-    glMapBufferRange = reinterpret_cast<PFNGLMAPBUFFERRANGEPROC>(loadProc("glMapBufferRange"));
-    glFlushMappedBufferRange =
-        reinterpret_cast<PFNGLFLUSHMAPPEDBUFFERRANGEPROC>(loadProc("glFlushMappedBufferRange"));
-    glBindVertexArray = reinterpret_cast<PFNGLBINDVERTEXARRAYPROC>(loadProc("glBindVertexArray"));
-    glDeleteVertexArrays =
-        reinterpret_cast<PFNGLDELETEVERTEXARRAYSPROC>(loadProc("glDeleteVertexArrays"));
-    glGenVertexArrays = reinterpret_cast<PFNGLGENVERTEXARRAYSPROC>(loadProc("glGenVertexArrays"));
-    glIsVertexArray   = reinterpret_cast<PFNGLISVERTEXARRAYPROC>(loadProc("glIsVertexArray"));
-    glGetIntegeri_v   = reinterpret_cast<PFNGLGETINTEGERI_VPROC>(loadProc("glGetIntegeri_v"));
-    glBeginTransformFeedback =
-        reinterpret_cast<PFNGLBEGINTRANSFORMFEEDBACKPROC>(loadProc("glBeginTransformFeedback"));
-    glEndTransformFeedback =
-        reinterpret_cast<PFNGLENDTRANSFORMFEEDBACKPROC>(loadProc("glEndTransformFeedback"));
-    glBindBufferRange = reinterpret_cast<PFNGLBINDBUFFERRANGEPROC>(loadProc("glBindBufferRange"));
-    glBindBufferBase  = reinterpret_cast<PFNGLBINDBUFFERBASEPROC>(loadProc("glBindBufferBase"));
-    glTransformFeedbackVaryings = reinterpret_cast<PFNGLTRANSFORMFEEDBACKVARYINGSPROC>(
-        loadProc("glTransformFeedbackVaryings"));
-    glGetTransformFeedbackVarying = reinterpret_cast<PFNGLGETTRANSFORMFEEDBACKVARYINGPROC>(
-        loadProc("glGetTransformFeedbackVarying"));
-    glVertexAttribIPointer =
-        reinterpret_cast<PFNGLVERTEXATTRIBIPOINTERPROC>(loadProc("glVertexAttribIPointer"));
-    glGetVertexAttribIiv =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBIIVPROC>(loadProc("glGetVertexAttribIiv"));
-    glGetVertexAttribIuiv =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBIUIVPROC>(loadProc("glGetVertexAttribIuiv"));
-    glVertexAttribI4i = reinterpret_cast<PFNGLVERTEXATTRIBI4IPROC>(loadProc("glVertexAttribI4i"));
-    glVertexAttribI4ui =
-        reinterpret_cast<PFNGLVERTEXATTRIBI4UIPROC>(loadProc("glVertexAttribI4ui"));
-    glVertexAttribI4iv =
-        reinterpret_cast<PFNGLVERTEXATTRIBI4IVPROC>(loadProc("glVertexAttribI4iv"));
-    glVertexAttribI4uiv =
-        reinterpret_cast<PFNGLVERTEXATTRIBI4UIVPROC>(loadProc("glVertexAttribI4uiv"));
-    glGetUniformuiv = reinterpret_cast<PFNGLGETUNIFORMUIVPROC>(loadProc("glGetUniformuiv"));
-    glGetFragDataLocation =
-        reinterpret_cast<PFNGLGETFRAGDATALOCATIONPROC>(loadProc("glGetFragDataLocation"));
-    glUniform1ui     = reinterpret_cast<PFNGLUNIFORM1UIPROC>(loadProc("glUniform1ui"));
-    glUniform2ui     = reinterpret_cast<PFNGLUNIFORM2UIPROC>(loadProc("glUniform2ui"));
-    glUniform3ui     = reinterpret_cast<PFNGLUNIFORM3UIPROC>(loadProc("glUniform3ui"));
-    glUniform4ui     = reinterpret_cast<PFNGLUNIFORM4UIPROC>(loadProc("glUniform4ui"));
-    glUniform1uiv    = reinterpret_cast<PFNGLUNIFORM1UIVPROC>(loadProc("glUniform1uiv"));
-    glUniform2uiv    = reinterpret_cast<PFNGLUNIFORM2UIVPROC>(loadProc("glUniform2uiv"));
-    glUniform3uiv    = reinterpret_cast<PFNGLUNIFORM3UIVPROC>(loadProc("glUniform3uiv"));
-    glUniform4uiv    = reinterpret_cast<PFNGLUNIFORM4UIVPROC>(loadProc("glUniform4uiv"));
-    glClearBufferiv  = reinterpret_cast<PFNGLCLEARBUFFERIVPROC>(loadProc("glClearBufferiv"));
-    glClearBufferuiv = reinterpret_cast<PFNGLCLEARBUFFERUIVPROC>(loadProc("glClearBufferuiv"));
-    glClearBufferfv  = reinterpret_cast<PFNGLCLEARBUFFERFVPROC>(loadProc("glClearBufferfv"));
-    glClearBufferfi  = reinterpret_cast<PFNGLCLEARBUFFERFIPROC>(loadProc("glClearBufferfi"));
-    glGetStringi     = reinterpret_cast<PFNGLGETSTRINGIPROC>(loadProc("glGetStringi"));
-    glCopyBufferSubData =
-        reinterpret_cast<PFNGLCOPYBUFFERSUBDATAPROC>(loadProc("glCopyBufferSubData"));
-    glGetUniformIndices =
-        reinterpret_cast<PFNGLGETUNIFORMINDICESPROC>(loadProc("glGetUniformIndices"));
-    glGetActiveUniformsiv =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMSIVPROC>(loadProc("glGetActiveUniformsiv"));
-    glGetUniformBlockIndex =
-        reinterpret_cast<PFNGLGETUNIFORMBLOCKINDEXPROC>(loadProc("glGetUniformBlockIndex"));
-    glGetActiveUniformBlockiv =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMBLOCKIVPROC>(loadProc("glGetActiveUniformBlockiv"));
-    glGetActiveUniformBlockName = reinterpret_cast<PFNGLGETACTIVEUNIFORMBLOCKNAMEPROC>(
-        loadProc("glGetActiveUniformBlockName"));
-    glUniformBlockBinding =
-        reinterpret_cast<PFNGLUNIFORMBLOCKBINDINGPROC>(loadProc("glUniformBlockBinding"));
-    glDrawArraysInstanced =
-        reinterpret_cast<PFNGLDRAWARRAYSINSTANCEDPROC>(loadProc("glDrawArraysInstanced"));
-    glDrawElementsInstanced =
-        reinterpret_cast<PFNGLDRAWELEMENTSINSTANCEDPROC>(loadProc("glDrawElementsInstanced"));
-    glFenceSync       = reinterpret_cast<PFNGLFENCESYNCPROC>(loadProc("glFenceSync"));
-    glIsSync          = reinterpret_cast<PFNGLISSYNCPROC>(loadProc("glIsSync"));
-    glDeleteSync      = reinterpret_cast<PFNGLDELETESYNCPROC>(loadProc("glDeleteSync"));
-    glClientWaitSync  = reinterpret_cast<PFNGLCLIENTWAITSYNCPROC>(loadProc("glClientWaitSync"));
-    glWaitSync        = reinterpret_cast<PFNGLWAITSYNCPROC>(loadProc("glWaitSync"));
-    glGetInteger64v   = reinterpret_cast<PFNGLGETINTEGER64VPROC>(loadProc("glGetInteger64v"));
-    glGetSynciv       = reinterpret_cast<PFNGLGETSYNCIVPROC>(loadProc("glGetSynciv"));
-    glGetInteger64i_v = reinterpret_cast<PFNGLGETINTEGER64I_VPROC>(loadProc("glGetInteger64i_v"));
-    glGetBufferParameteri64v =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERI64VPROC>(loadProc("glGetBufferParameteri64v"));
-    glGenSamplers    = reinterpret_cast<PFNGLGENSAMPLERSPROC>(loadProc("glGenSamplers"));
-    glDeleteSamplers = reinterpret_cast<PFNGLDELETESAMPLERSPROC>(loadProc("glDeleteSamplers"));
-    glIsSampler      = reinterpret_cast<PFNGLISSAMPLERPROC>(loadProc("glIsSampler"));
-    glBindSampler    = reinterpret_cast<PFNGLBINDSAMPLERPROC>(loadProc("glBindSampler"));
-    glSamplerParameteri =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIPROC>(loadProc("glSamplerParameteri"));
-    glSamplerParameteriv =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIVPROC>(loadProc("glSamplerParameteriv"));
-    glSamplerParameterf =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERFPROC>(loadProc("glSamplerParameterf"));
-    glSamplerParameterfv =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERFVPROC>(loadProc("glSamplerParameterfv"));
-    glGetSamplerParameteriv =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIVPROC>(loadProc("glGetSamplerParameteriv"));
-    glGetSamplerParameterfv =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERFVPROC>(loadProc("glGetSamplerParameterfv"));
-    glVertexAttribDivisor =
-        reinterpret_cast<PFNGLVERTEXATTRIBDIVISORPROC>(loadProc("glVertexAttribDivisor"));
-    glBindTransformFeedback =
-        reinterpret_cast<PFNGLBINDTRANSFORMFEEDBACKPROC>(loadProc("glBindTransformFeedback"));
-    glDeleteTransformFeedbacks =
-        reinterpret_cast<PFNGLDELETETRANSFORMFEEDBACKSPROC>(loadProc("glDeleteTransformFeedbacks"));
-    glGenTransformFeedbacks =
-        reinterpret_cast<PFNGLGENTRANSFORMFEEDBACKSPROC>(loadProc("glGenTransformFeedbacks"));
-    glIsTransformFeedback =
-        reinterpret_cast<PFNGLISTRANSFORMFEEDBACKPROC>(loadProc("glIsTransformFeedback"));
-    glPauseTransformFeedback =
-        reinterpret_cast<PFNGLPAUSETRANSFORMFEEDBACKPROC>(loadProc("glPauseTransformFeedback"));
-    glResumeTransformFeedback =
-        reinterpret_cast<PFNGLRESUMETRANSFORMFEEDBACKPROC>(loadProc("glResumeTransformFeedback"));
-    glGetProgramBinary =
-        reinterpret_cast<PFNGLGETPROGRAMBINARYPROC>(loadProc("glGetProgramBinary"));
-    glProgramBinary = reinterpret_cast<PFNGLPROGRAMBINARYPROC>(loadProc("glProgramBinary"));
-    glProgramParameteri =
-        reinterpret_cast<PFNGLPROGRAMPARAMETERIPROC>(loadProc("glProgramParameteri"));
-    glInvalidateFramebuffer =
-        reinterpret_cast<PFNGLINVALIDATEFRAMEBUFFERPROC>(loadProc("glInvalidateFramebuffer"));
-    glInvalidateSubFramebuffer =
-        reinterpret_cast<PFNGLINVALIDATESUBFRAMEBUFFERPROC>(loadProc("glInvalidateSubFramebuffer"));
-    glTexStorage2D = reinterpret_cast<PFNGLTEXSTORAGE2DPROC>(loadProc("glTexStorage2D"));
-    glTexStorage3D = reinterpret_cast<PFNGLTEXSTORAGE3DPROC>(loadProc("glTexStorage3D"));
-    glGetInternalformativ =
-        reinterpret_cast<PFNGLGETINTERNALFORMATIVPROC>(loadProc("glGetInternalformativ"));
-    glDispatchCompute = reinterpret_cast<PFNGLDISPATCHCOMPUTEPROC>(loadProc("glDispatchCompute"));
-    glDispatchComputeIndirect =
-        reinterpret_cast<PFNGLDISPATCHCOMPUTEINDIRECTPROC>(loadProc("glDispatchComputeIndirect"));
-    glDrawArraysIndirect =
-        reinterpret_cast<PFNGLDRAWARRAYSINDIRECTPROC>(loadProc("glDrawArraysIndirect"));
-    glDrawElementsIndirect =
-        reinterpret_cast<PFNGLDRAWELEMENTSINDIRECTPROC>(loadProc("glDrawElementsIndirect"));
-    glFramebufferParameteri =
-        reinterpret_cast<PFNGLFRAMEBUFFERPARAMETERIPROC>(loadProc("glFramebufferParameteri"));
-    glGetFramebufferParameteriv = reinterpret_cast<PFNGLGETFRAMEBUFFERPARAMETERIVPROC>(
-        loadProc("glGetFramebufferParameteriv"));
-    glGetProgramInterfaceiv =
-        reinterpret_cast<PFNGLGETPROGRAMINTERFACEIVPROC>(loadProc("glGetProgramInterfaceiv"));
-    glGetProgramResourceIndex =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCEINDEXPROC>(loadProc("glGetProgramResourceIndex"));
-    glGetProgramResourceName =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCENAMEPROC>(loadProc("glGetProgramResourceName"));
-    glGetProgramResourceiv =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCEIVPROC>(loadProc("glGetProgramResourceiv"));
-    glGetProgramResourceLocation = reinterpret_cast<PFNGLGETPROGRAMRESOURCELOCATIONPROC>(
-        loadProc("glGetProgramResourceLocation"));
-    glUseProgramStages =
-        reinterpret_cast<PFNGLUSEPROGRAMSTAGESPROC>(loadProc("glUseProgramStages"));
-    glActiveShaderProgram =
-        reinterpret_cast<PFNGLACTIVESHADERPROGRAMPROC>(loadProc("glActiveShaderProgram"));
-    glCreateShaderProgramv =
-        reinterpret_cast<PFNGLCREATESHADERPROGRAMVPROC>(loadProc("glCreateShaderProgramv"));
-    glBindProgramPipeline =
-        reinterpret_cast<PFNGLBINDPROGRAMPIPELINEPROC>(loadProc("glBindProgramPipeline"));
-    glDeleteProgramPipelines =
-        reinterpret_cast<PFNGLDELETEPROGRAMPIPELINESPROC>(loadProc("glDeleteProgramPipelines"));
-    glGenProgramPipelines =
-        reinterpret_cast<PFNGLGENPROGRAMPIPELINESPROC>(loadProc("glGenProgramPipelines"));
-    glIsProgramPipeline =
-        reinterpret_cast<PFNGLISPROGRAMPIPELINEPROC>(loadProc("glIsProgramPipeline"));
-    glGetProgramPipelineiv =
-        reinterpret_cast<PFNGLGETPROGRAMPIPELINEIVPROC>(loadProc("glGetProgramPipelineiv"));
-    glProgramUniform1i =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM1IPROC>(loadProc("glProgramUniform1i"));
-    glProgramUniform2i =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM2IPROC>(loadProc("glProgramUniform2i"));
-    glProgramUniform3i =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM3IPROC>(loadProc("glProgramUniform3i"));
-    glProgramUniform4i =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM4IPROC>(loadProc("glProgramUniform4i"));
-    glProgramUniform1ui =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM1UIPROC>(loadProc("glProgramUniform1ui"));
-    glProgramUniform2ui =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM2UIPROC>(loadProc("glProgramUniform2ui"));
-    glProgramUniform3ui =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM3UIPROC>(loadProc("glProgramUniform3ui"));
-    glProgramUniform4ui =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM4UIPROC>(loadProc("glProgramUniform4ui"));
-    glProgramUniform1f =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM1FPROC>(loadProc("glProgramUniform1f"));
-    glProgramUniform2f =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM2FPROC>(loadProc("glProgramUniform2f"));
-    glProgramUniform3f =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM3FPROC>(loadProc("glProgramUniform3f"));
-    glProgramUniform4f =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM4FPROC>(loadProc("glProgramUniform4f"));
-    glProgramUniform1iv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM1IVPROC>(loadProc("glProgramUniform1iv"));
-    glProgramUniform2iv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM2IVPROC>(loadProc("glProgramUniform2iv"));
-    glProgramUniform3iv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM3IVPROC>(loadProc("glProgramUniform3iv"));
-    glProgramUniform4iv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM4IVPROC>(loadProc("glProgramUniform4iv"));
-    glProgramUniform1uiv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM1UIVPROC>(loadProc("glProgramUniform1uiv"));
-    glProgramUniform2uiv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM2UIVPROC>(loadProc("glProgramUniform2uiv"));
-    glProgramUniform3uiv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM3UIVPROC>(loadProc("glProgramUniform3uiv"));
-    glProgramUniform4uiv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM4UIVPROC>(loadProc("glProgramUniform4uiv"));
-    glProgramUniform1fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM1FVPROC>(loadProc("glProgramUniform1fv"));
-    glProgramUniform2fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM2FVPROC>(loadProc("glProgramUniform2fv"));
-    glProgramUniform3fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM3FVPROC>(loadProc("glProgramUniform3fv"));
-    glProgramUniform4fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORM4FVPROC>(loadProc("glProgramUniform4fv"));
-    glProgramUniformMatrix2fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX2FVPROC>(loadProc("glProgramUniformMatrix2fv"));
-    glProgramUniformMatrix3fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX3FVPROC>(loadProc("glProgramUniformMatrix3fv"));
-    glProgramUniformMatrix4fv =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX4FVPROC>(loadProc("glProgramUniformMatrix4fv"));
-    glProgramUniformMatrix2x3fv = reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX2X3FVPROC>(
-        loadProc("glProgramUniformMatrix2x3fv"));
-    glProgramUniformMatrix3x2fv = reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX3X2FVPROC>(
-        loadProc("glProgramUniformMatrix3x2fv"));
-    glProgramUniformMatrix2x4fv = reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX2X4FVPROC>(
-        loadProc("glProgramUniformMatrix2x4fv"));
-    glProgramUniformMatrix4x2fv = reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX4X2FVPROC>(
-        loadProc("glProgramUniformMatrix4x2fv"));
-    glProgramUniformMatrix3x4fv = reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX3X4FVPROC>(
-        loadProc("glProgramUniformMatrix3x4fv"));
-    glProgramUniformMatrix4x3fv = reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX4X3FVPROC>(
-        loadProc("glProgramUniformMatrix4x3fv"));
-    glValidateProgramPipeline =
-        reinterpret_cast<PFNGLVALIDATEPROGRAMPIPELINEPROC>(loadProc("glValidateProgramPipeline"));
-    glGetProgramPipelineInfoLog = reinterpret_cast<PFNGLGETPROGRAMPIPELINEINFOLOGPROC>(
-        loadProc("glGetProgramPipelineInfoLog"));
-    glBindImageTexture =
-        reinterpret_cast<PFNGLBINDIMAGETEXTUREPROC>(loadProc("glBindImageTexture"));
-    glGetBooleani_v = reinterpret_cast<PFNGLGETBOOLEANI_VPROC>(loadProc("glGetBooleani_v"));
-    glMemoryBarrier = reinterpret_cast<PFNGLMEMORYBARRIERPROC>(loadProc("glMemoryBarrier"));
-    glMemoryBarrierByRegion =
-        reinterpret_cast<PFNGLMEMORYBARRIERBYREGIONPROC>(loadProc("glMemoryBarrierByRegion"));
-    glTexStorage2DMultisample =
-        reinterpret_cast<PFNGLTEXSTORAGE2DMULTISAMPLEPROC>(loadProc("glTexStorage2DMultisample"));
-    glGetMultisamplefv =
-        reinterpret_cast<PFNGLGETMULTISAMPLEFVPROC>(loadProc("glGetMultisamplefv"));
-    glSampleMaski = reinterpret_cast<PFNGLSAMPLEMASKIPROC>(loadProc("glSampleMaski"));
-    glGetTexLevelParameteriv =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERIVPROC>(loadProc("glGetTexLevelParameteriv"));
-    glGetTexLevelParameterfv =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERFVPROC>(loadProc("glGetTexLevelParameterfv"));
-    glBindVertexBuffer =
-        reinterpret_cast<PFNGLBINDVERTEXBUFFERPROC>(loadProc("glBindVertexBuffer"));
-    glVertexAttribFormat =
-        reinterpret_cast<PFNGLVERTEXATTRIBFORMATPROC>(loadProc("glVertexAttribFormat"));
-    glVertexAttribIFormat =
-        reinterpret_cast<PFNGLVERTEXATTRIBIFORMATPROC>(loadProc("glVertexAttribIFormat"));
-    glVertexAttribBinding =
-        reinterpret_cast<PFNGLVERTEXATTRIBBINDINGPROC>(loadProc("glVertexAttribBinding"));
-    glVertexBindingDivisor =
-        reinterpret_cast<PFNGLVERTEXBINDINGDIVISORPROC>(loadProc("glVertexBindingDivisor"));
-    glCopySubTexture3DANGLE =
-        reinterpret_cast<PFNGLCOPYSUBTEXTURE3DANGLEPROC>(loadProc("glCopySubTexture3DANGLE"));
-    glCopyTexture3DANGLE =
-        reinterpret_cast<PFNGLCOPYTEXTURE3DANGLEPROC>(loadProc("glCopyTexture3DANGLE"));
-    glBlitFramebufferANGLE =
-        reinterpret_cast<PFNGLBLITFRAMEBUFFERANGLEPROC>(loadProc("glBlitFramebufferANGLE"));
-    glRenderbufferStorageMultisampleANGLE =
-        reinterpret_cast<PFNGLRENDERBUFFERSTORAGEMULTISAMPLEANGLEPROC>(
-            loadProc("glRenderbufferStorageMultisampleANGLE"));
-    glDrawArraysInstancedANGLE =
-        reinterpret_cast<PFNGLDRAWARRAYSINSTANCEDANGLEPROC>(loadProc("glDrawArraysInstancedANGLE"));
-    glDrawElementsInstancedANGLE = reinterpret_cast<PFNGLDRAWELEMENTSINSTANCEDANGLEPROC>(
-        loadProc("glDrawElementsInstancedANGLE"));
-    glVertexAttribDivisorANGLE =
-        reinterpret_cast<PFNGLVERTEXATTRIBDIVISORANGLEPROC>(loadProc("glVertexAttribDivisorANGLE"));
-    glMultiDrawArraysANGLE =
-        reinterpret_cast<PFNGLMULTIDRAWARRAYSANGLEPROC>(loadProc("glMultiDrawArraysANGLE"));
-    glMultiDrawArraysInstancedANGLE = reinterpret_cast<PFNGLMULTIDRAWARRAYSINSTANCEDANGLEPROC>(
-        loadProc("glMultiDrawArraysInstancedANGLE"));
-    glMultiDrawElementsANGLE =
-        reinterpret_cast<PFNGLMULTIDRAWELEMENTSANGLEPROC>(loadProc("glMultiDrawElementsANGLE"));
-    glMultiDrawElementsInstancedANGLE = reinterpret_cast<PFNGLMULTIDRAWELEMENTSINSTANCEDANGLEPROC>(
-        loadProc("glMultiDrawElementsInstancedANGLE"));
-    glProvokingVertexANGLE =
-        reinterpret_cast<PFNGLPROVOKINGVERTEXANGLEPROC>(loadProc("glProvokingVertexANGLE"));
-    glRequestExtensionANGLE =
-        reinterpret_cast<PFNGLREQUESTEXTENSIONANGLEPROC>(loadProc("glRequestExtensionANGLE"));
-    glCompressedTexImage2DRobustANGLE = reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE2DROBUSTANGLEPROC>(
-        loadProc("glCompressedTexImage2DRobustANGLE"));
-    glCompressedTexImage3DRobustANGLE = reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE3DROBUSTANGLEPROC>(
-        loadProc("glCompressedTexImage3DRobustANGLE"));
-    glCompressedTexSubImage2DRobustANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE2DROBUSTANGLEPROC>(
-            loadProc("glCompressedTexSubImage2DRobustANGLE"));
-    glCompressedTexSubImage3DRobustANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE3DROBUSTANGLEPROC>(
-            loadProc("glCompressedTexSubImage3DRobustANGLE"));
-    glGetActiveUniformBlockivRobustANGLE =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMBLOCKIVROBUSTANGLEPROC>(
-            loadProc("glGetActiveUniformBlockivRobustANGLE"));
-    glGetBooleani_vRobustANGLE =
-        reinterpret_cast<PFNGLGETBOOLEANI_VROBUSTANGLEPROC>(loadProc("glGetBooleani_vRobustANGLE"));
-    glGetBooleanvRobustANGLE =
-        reinterpret_cast<PFNGLGETBOOLEANVROBUSTANGLEPROC>(loadProc("glGetBooleanvRobustANGLE"));
-    glGetBufferParameteri64vRobustANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERI64VROBUSTANGLEPROC>(
-            loadProc("glGetBufferParameteri64vRobustANGLE"));
-    glGetBufferParameterivRobustANGLE = reinterpret_cast<PFNGLGETBUFFERPARAMETERIVROBUSTANGLEPROC>(
-        loadProc("glGetBufferParameterivRobustANGLE"));
-    glGetBufferPointervRobustANGLE = reinterpret_cast<PFNGLGETBUFFERPOINTERVROBUSTANGLEPROC>(
-        loadProc("glGetBufferPointervRobustANGLE"));
-    glGetFloatvRobustANGLE =
-        reinterpret_cast<PFNGLGETFLOATVROBUSTANGLEPROC>(loadProc("glGetFloatvRobustANGLE"));
-    glGetFramebufferAttachmentParameterivRobustANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVROBUSTANGLEPROC>(
-            loadProc("glGetFramebufferAttachmentParameterivRobustANGLE"));
-    glGetFramebufferParameterivRobustANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERPARAMETERIVROBUSTANGLEPROC>(
-            loadProc("glGetFramebufferParameterivRobustANGLE"));
-    glGetInteger64i_vRobustANGLE = reinterpret_cast<PFNGLGETINTEGER64I_VROBUSTANGLEPROC>(
-        loadProc("glGetInteger64i_vRobustANGLE"));
-    glGetInteger64vRobustANGLE =
-        reinterpret_cast<PFNGLGETINTEGER64VROBUSTANGLEPROC>(loadProc("glGetInteger64vRobustANGLE"));
-    glGetIntegeri_vRobustANGLE =
-        reinterpret_cast<PFNGLGETINTEGERI_VROBUSTANGLEPROC>(loadProc("glGetIntegeri_vRobustANGLE"));
-    glGetIntegervRobustANGLE =
-        reinterpret_cast<PFNGLGETINTEGERVROBUSTANGLEPROC>(loadProc("glGetIntegervRobustANGLE"));
-    glGetInternalformativRobustANGLE = reinterpret_cast<PFNGLGETINTERNALFORMATIVROBUSTANGLEPROC>(
-        loadProc("glGetInternalformativRobustANGLE"));
-    glGetMultisamplefvRobustANGLE = reinterpret_cast<PFNGLGETMULTISAMPLEFVROBUSTANGLEPROC>(
-        loadProc("glGetMultisamplefvRobustANGLE"));
-    glGetPointervRobustANGLERobustANGLE =
-        reinterpret_cast<PFNGLGETPOINTERVROBUSTANGLEROBUSTANGLEPROC>(
-            loadProc("glGetPointervRobustANGLERobustANGLE"));
-    glGetProgramInterfaceivRobustANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMINTERFACEIVROBUSTANGLEPROC>(
-            loadProc("glGetProgramInterfaceivRobustANGLE"));
-    glGetProgramivRobustANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMIVROBUSTANGLEPROC>(loadProc("glGetProgramivRobustANGLE"));
-    glGetQueryObjecti64vRobustANGLE = reinterpret_cast<PFNGLGETQUERYOBJECTI64VROBUSTANGLEPROC>(
-        loadProc("glGetQueryObjecti64vRobustANGLE"));
-    glGetQueryObjectivRobustANGLE = reinterpret_cast<PFNGLGETQUERYOBJECTIVROBUSTANGLEPROC>(
-        loadProc("glGetQueryObjectivRobustANGLE"));
-    glGetQueryObjectui64vRobustANGLE = reinterpret_cast<PFNGLGETQUERYOBJECTUI64VROBUSTANGLEPROC>(
-        loadProc("glGetQueryObjectui64vRobustANGLE"));
-    glGetQueryObjectuivRobustANGLE = reinterpret_cast<PFNGLGETQUERYOBJECTUIVROBUSTANGLEPROC>(
-        loadProc("glGetQueryObjectuivRobustANGLE"));
-    glGetQueryivRobustANGLE =
-        reinterpret_cast<PFNGLGETQUERYIVROBUSTANGLEPROC>(loadProc("glGetQueryivRobustANGLE"));
-    glGetRenderbufferParameterivRobustANGLE =
-        reinterpret_cast<PFNGLGETRENDERBUFFERPARAMETERIVROBUSTANGLEPROC>(
-            loadProc("glGetRenderbufferParameterivRobustANGLE"));
-    glGetSamplerParameterIivRobustANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIIVROBUSTANGLEPROC>(
-            loadProc("glGetSamplerParameterIivRobustANGLE"));
-    glGetSamplerParameterIuivRobustANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIUIVROBUSTANGLEPROC>(
-            loadProc("glGetSamplerParameterIuivRobustANGLE"));
-    glGetSamplerParameterfvRobustANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERFVROBUSTANGLEPROC>(
-            loadProc("glGetSamplerParameterfvRobustANGLE"));
-    glGetSamplerParameterivRobustANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIVROBUSTANGLEPROC>(
-            loadProc("glGetSamplerParameterivRobustANGLE"));
-    glGetShaderivRobustANGLE =
-        reinterpret_cast<PFNGLGETSHADERIVROBUSTANGLEPROC>(loadProc("glGetShaderivRobustANGLE"));
-    glGetTexLevelParameterfvRobustANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERFVROBUSTANGLEPROC>(
-            loadProc("glGetTexLevelParameterfvRobustANGLE"));
-    glGetTexLevelParameterivRobustANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERIVROBUSTANGLEPROC>(
-            loadProc("glGetTexLevelParameterivRobustANGLE"));
-    glGetTexParameterIivRobustANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERIIVROBUSTANGLEPROC>(
-        loadProc("glGetTexParameterIivRobustANGLE"));
-    glGetTexParameterIuivRobustANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERIUIVROBUSTANGLEPROC>(
-        loadProc("glGetTexParameterIuivRobustANGLE"));
-    glGetTexParameterfvRobustANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERFVROBUSTANGLEPROC>(
-        loadProc("glGetTexParameterfvRobustANGLE"));
-    glGetTexParameterivRobustANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERIVROBUSTANGLEPROC>(
-        loadProc("glGetTexParameterivRobustANGLE"));
-    glGetUniformfvRobustANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMFVROBUSTANGLEPROC>(loadProc("glGetUniformfvRobustANGLE"));
-    glGetUniformivRobustANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMIVROBUSTANGLEPROC>(loadProc("glGetUniformivRobustANGLE"));
-    glGetUniformuivRobustANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMUIVROBUSTANGLEPROC>(loadProc("glGetUniformuivRobustANGLE"));
-    glGetVertexAttribIivRobustANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBIIVROBUSTANGLEPROC>(
-        loadProc("glGetVertexAttribIivRobustANGLE"));
-    glGetVertexAttribIuivRobustANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBIUIVROBUSTANGLEPROC>(
-        loadProc("glGetVertexAttribIuivRobustANGLE"));
-    glGetVertexAttribPointervRobustANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBPOINTERVROBUSTANGLEPROC>(
-            loadProc("glGetVertexAttribPointervRobustANGLE"));
-    glGetVertexAttribfvRobustANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBFVROBUSTANGLEPROC>(
-        loadProc("glGetVertexAttribfvRobustANGLE"));
-    glGetVertexAttribivRobustANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBIVROBUSTANGLEPROC>(
-        loadProc("glGetVertexAttribivRobustANGLE"));
-    glGetnUniformfvRobustANGLE =
-        reinterpret_cast<PFNGLGETNUNIFORMFVROBUSTANGLEPROC>(loadProc("glGetnUniformfvRobustANGLE"));
-    glGetnUniformivRobustANGLE =
-        reinterpret_cast<PFNGLGETNUNIFORMIVROBUSTANGLEPROC>(loadProc("glGetnUniformivRobustANGLE"));
-    glGetnUniformuivRobustANGLE = reinterpret_cast<PFNGLGETNUNIFORMUIVROBUSTANGLEPROC>(
-        loadProc("glGetnUniformuivRobustANGLE"));
-    glReadPixelsRobustANGLE =
-        reinterpret_cast<PFNGLREADPIXELSROBUSTANGLEPROC>(loadProc("glReadPixelsRobustANGLE"));
-    glReadnPixelsRobustANGLE =
-        reinterpret_cast<PFNGLREADNPIXELSROBUSTANGLEPROC>(loadProc("glReadnPixelsRobustANGLE"));
-    glSamplerParameterIivRobustANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERIIVROBUSTANGLEPROC>(
-        loadProc("glSamplerParameterIivRobustANGLE"));
-    glSamplerParameterIuivRobustANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERIUIVROBUSTANGLEPROC>(
-        loadProc("glSamplerParameterIuivRobustANGLE"));
-    glSamplerParameterfvRobustANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERFVROBUSTANGLEPROC>(
-        loadProc("glSamplerParameterfvRobustANGLE"));
-    glSamplerParameterivRobustANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERIVROBUSTANGLEPROC>(
-        loadProc("glSamplerParameterivRobustANGLE"));
-    glTexImage2DRobustANGLE =
-        reinterpret_cast<PFNGLTEXIMAGE2DROBUSTANGLEPROC>(loadProc("glTexImage2DRobustANGLE"));
-    glTexImage3DRobustANGLE =
-        reinterpret_cast<PFNGLTEXIMAGE3DROBUSTANGLEPROC>(loadProc("glTexImage3DRobustANGLE"));
-    glTexParameterIivRobustANGLE = reinterpret_cast<PFNGLTEXPARAMETERIIVROBUSTANGLEPROC>(
-        loadProc("glTexParameterIivRobustANGLE"));
-    glTexParameterIuivRobustANGLE = reinterpret_cast<PFNGLTEXPARAMETERIUIVROBUSTANGLEPROC>(
-        loadProc("glTexParameterIuivRobustANGLE"));
-    glTexParameterfvRobustANGLE = reinterpret_cast<PFNGLTEXPARAMETERFVROBUSTANGLEPROC>(
-        loadProc("glTexParameterfvRobustANGLE"));
-    glTexParameterivRobustANGLE = reinterpret_cast<PFNGLTEXPARAMETERIVROBUSTANGLEPROC>(
-        loadProc("glTexParameterivRobustANGLE"));
-    glTexSubImage2DRobustANGLE =
-        reinterpret_cast<PFNGLTEXSUBIMAGE2DROBUSTANGLEPROC>(loadProc("glTexSubImage2DRobustANGLE"));
-    glTexSubImage3DRobustANGLE =
-        reinterpret_cast<PFNGLTEXSUBIMAGE3DROBUSTANGLEPROC>(loadProc("glTexSubImage3DRobustANGLE"));
-    glGetMultisamplefvANGLE =
-        reinterpret_cast<PFNGLGETMULTISAMPLEFVANGLEPROC>(loadProc("glGetMultisamplefvANGLE"));
-    glGetTexLevelParameterfvANGLE = reinterpret_cast<PFNGLGETTEXLEVELPARAMETERFVANGLEPROC>(
-        loadProc("glGetTexLevelParameterfvANGLE"));
-    glGetTexLevelParameterivANGLE = reinterpret_cast<PFNGLGETTEXLEVELPARAMETERIVANGLEPROC>(
-        loadProc("glGetTexLevelParameterivANGLE"));
-    glSampleMaskiANGLE =
-        reinterpret_cast<PFNGLSAMPLEMASKIANGLEPROC>(loadProc("glSampleMaskiANGLE"));
-    glTexStorage2DMultisampleANGLE = reinterpret_cast<PFNGLTEXSTORAGE2DMULTISAMPLEANGLEPROC>(
-        loadProc("glTexStorage2DMultisampleANGLE"));
-    glGetTranslatedShaderSourceANGLE = reinterpret_cast<PFNGLGETTRANSLATEDSHADERSOURCEANGLEPROC>(
-        loadProc("glGetTranslatedShaderSourceANGLE"));
-    glBindUniformLocationCHROMIUM = reinterpret_cast<PFNGLBINDUNIFORMLOCATIONCHROMIUMPROC>(
-        loadProc("glBindUniformLocationCHROMIUM"));
-    glCompressedCopyTextureCHROMIUM = reinterpret_cast<PFNGLCOMPRESSEDCOPYTEXTURECHROMIUMPROC>(
-        loadProc("glCompressedCopyTextureCHROMIUM"));
-    glCopySubTextureCHROMIUM =
-        reinterpret_cast<PFNGLCOPYSUBTEXTURECHROMIUMPROC>(loadProc("glCopySubTextureCHROMIUM"));
-    glCopyTextureCHROMIUM =
-        reinterpret_cast<PFNGLCOPYTEXTURECHROMIUMPROC>(loadProc("glCopyTextureCHROMIUM"));
-    glCoverageModulationCHROMIUM = reinterpret_cast<PFNGLCOVERAGEMODULATIONCHROMIUMPROC>(
-        loadProc("glCoverageModulationCHROMIUM"));
-    glMatrixLoadIdentityCHROMIUM = reinterpret_cast<PFNGLMATRIXLOADIDENTITYCHROMIUMPROC>(
-        loadProc("glMatrixLoadIdentityCHROMIUM"));
-    glMatrixLoadfCHROMIUM =
-        reinterpret_cast<PFNGLMATRIXLOADFCHROMIUMPROC>(loadProc("glMatrixLoadfCHROMIUM"));
-    glLoseContextCHROMIUM =
-        reinterpret_cast<PFNGLLOSECONTEXTCHROMIUMPROC>(loadProc("glLoseContextCHROMIUM"));
-    glBindFragmentInputLocationCHROMIUM =
-        reinterpret_cast<PFNGLBINDFRAGMENTINPUTLOCATIONCHROMIUMPROC>(
-            loadProc("glBindFragmentInputLocationCHROMIUM"));
-    glCoverFillPathCHROMIUM =
-        reinterpret_cast<PFNGLCOVERFILLPATHCHROMIUMPROC>(loadProc("glCoverFillPathCHROMIUM"));
-    glCoverFillPathInstancedCHROMIUM = reinterpret_cast<PFNGLCOVERFILLPATHINSTANCEDCHROMIUMPROC>(
-        loadProc("glCoverFillPathInstancedCHROMIUM"));
-    glCoverStrokePathCHROMIUM =
-        reinterpret_cast<PFNGLCOVERSTROKEPATHCHROMIUMPROC>(loadProc("glCoverStrokePathCHROMIUM"));
-    glCoverStrokePathInstancedCHROMIUM =
-        reinterpret_cast<PFNGLCOVERSTROKEPATHINSTANCEDCHROMIUMPROC>(
-            loadProc("glCoverStrokePathInstancedCHROMIUM"));
-    glDeletePathsCHROMIUM =
-        reinterpret_cast<PFNGLDELETEPATHSCHROMIUMPROC>(loadProc("glDeletePathsCHROMIUM"));
-    glGenPathsCHROMIUM =
-        reinterpret_cast<PFNGLGENPATHSCHROMIUMPROC>(loadProc("glGenPathsCHROMIUM"));
-    glGetPathParameterfvCHROMIUM = reinterpret_cast<PFNGLGETPATHPARAMETERFVCHROMIUMPROC>(
-        loadProc("glGetPathParameterfvCHROMIUM"));
-    glGetPathParameterivCHROMIUM = reinterpret_cast<PFNGLGETPATHPARAMETERIVCHROMIUMPROC>(
-        loadProc("glGetPathParameterivCHROMIUM"));
-    glIsPathCHROMIUM = reinterpret_cast<PFNGLISPATHCHROMIUMPROC>(loadProc("glIsPathCHROMIUM"));
-    glPathCommandsCHROMIUM =
-        reinterpret_cast<PFNGLPATHCOMMANDSCHROMIUMPROC>(loadProc("glPathCommandsCHROMIUM"));
-    glPathParameterfCHROMIUM =
-        reinterpret_cast<PFNGLPATHPARAMETERFCHROMIUMPROC>(loadProc("glPathParameterfCHROMIUM"));
-    glPathParameteriCHROMIUM =
-        reinterpret_cast<PFNGLPATHPARAMETERICHROMIUMPROC>(loadProc("glPathParameteriCHROMIUM"));
-    glPathStencilFuncCHROMIUM =
-        reinterpret_cast<PFNGLPATHSTENCILFUNCCHROMIUMPROC>(loadProc("glPathStencilFuncCHROMIUM"));
-    glProgramPathFragmentInputGenCHROMIUM =
-        reinterpret_cast<PFNGLPROGRAMPATHFRAGMENTINPUTGENCHROMIUMPROC>(
-            loadProc("glProgramPathFragmentInputGenCHROMIUM"));
-    glStencilFillPathCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILFILLPATHCHROMIUMPROC>(loadProc("glStencilFillPathCHROMIUM"));
-    glStencilFillPathInstancedCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILFILLPATHINSTANCEDCHROMIUMPROC>(
-            loadProc("glStencilFillPathInstancedCHROMIUM"));
-    glStencilStrokePathCHROMIUM = reinterpret_cast<PFNGLSTENCILSTROKEPATHCHROMIUMPROC>(
-        loadProc("glStencilStrokePathCHROMIUM"));
-    glStencilStrokePathInstancedCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILSTROKEPATHINSTANCEDCHROMIUMPROC>(
-            loadProc("glStencilStrokePathInstancedCHROMIUM"));
-    glStencilThenCoverFillPathCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERFILLPATHCHROMIUMPROC>(
-            loadProc("glStencilThenCoverFillPathCHROMIUM"));
-    glStencilThenCoverFillPathInstancedCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERFILLPATHINSTANCEDCHROMIUMPROC>(
-            loadProc("glStencilThenCoverFillPathInstancedCHROMIUM"));
-    glStencilThenCoverStrokePathCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERSTROKEPATHCHROMIUMPROC>(
-            loadProc("glStencilThenCoverStrokePathCHROMIUM"));
-    glStencilThenCoverStrokePathInstancedCHROMIUM =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERSTROKEPATHINSTANCEDCHROMIUMPROC>(
-            loadProc("glStencilThenCoverStrokePathInstancedCHROMIUM"));
-    glBindFragDataLocationEXT =
-        reinterpret_cast<PFNGLBINDFRAGDATALOCATIONEXTPROC>(loadProc("glBindFragDataLocationEXT"));
-    glBindFragDataLocationIndexedEXT = reinterpret_cast<PFNGLBINDFRAGDATALOCATIONINDEXEDEXTPROC>(
-        loadProc("glBindFragDataLocationIndexedEXT"));
-    glGetFragDataIndexEXT =
-        reinterpret_cast<PFNGLGETFRAGDATAINDEXEXTPROC>(loadProc("glGetFragDataIndexEXT"));
-    glGetProgramResourceLocationIndexEXT =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCELOCATIONINDEXEXTPROC>(
-            loadProc("glGetProgramResourceLocationIndexEXT"));
-    glInsertEventMarkerEXT =
-        reinterpret_cast<PFNGLINSERTEVENTMARKEREXTPROC>(loadProc("glInsertEventMarkerEXT"));
-    glPopGroupMarkerEXT =
-        reinterpret_cast<PFNGLPOPGROUPMARKEREXTPROC>(loadProc("glPopGroupMarkerEXT"));
-    glPushGroupMarkerEXT =
-        reinterpret_cast<PFNGLPUSHGROUPMARKEREXTPROC>(loadProc("glPushGroupMarkerEXT"));
-    glDiscardFramebufferEXT =
-        reinterpret_cast<PFNGLDISCARDFRAMEBUFFEREXTPROC>(loadProc("glDiscardFramebufferEXT"));
-    glBeginQueryEXT = reinterpret_cast<PFNGLBEGINQUERYEXTPROC>(loadProc("glBeginQueryEXT"));
-    glDeleteQueriesEXT =
-        reinterpret_cast<PFNGLDELETEQUERIESEXTPROC>(loadProc("glDeleteQueriesEXT"));
-    glEndQueryEXT   = reinterpret_cast<PFNGLENDQUERYEXTPROC>(loadProc("glEndQueryEXT"));
-    glGenQueriesEXT = reinterpret_cast<PFNGLGENQUERIESEXTPROC>(loadProc("glGenQueriesEXT"));
-    glGetQueryObjecti64vEXT =
-        reinterpret_cast<PFNGLGETQUERYOBJECTI64VEXTPROC>(loadProc("glGetQueryObjecti64vEXT"));
-    glGetQueryObjectivEXT =
-        reinterpret_cast<PFNGLGETQUERYOBJECTIVEXTPROC>(loadProc("glGetQueryObjectivEXT"));
-    glGetQueryObjectui64vEXT =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUI64VEXTPROC>(loadProc("glGetQueryObjectui64vEXT"));
-    glGetQueryObjectuivEXT =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUIVEXTPROC>(loadProc("glGetQueryObjectuivEXT"));
-    glGetQueryivEXT   = reinterpret_cast<PFNGLGETQUERYIVEXTPROC>(loadProc("glGetQueryivEXT"));
-    glIsQueryEXT      = reinterpret_cast<PFNGLISQUERYEXTPROC>(loadProc("glIsQueryEXT"));
-    glQueryCounterEXT = reinterpret_cast<PFNGLQUERYCOUNTEREXTPROC>(loadProc("glQueryCounterEXT"));
-    glDrawBuffersEXT  = reinterpret_cast<PFNGLDRAWBUFFERSEXTPROC>(loadProc("glDrawBuffersEXT"));
-    glFramebufferTextureEXT =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTUREEXTPROC>(loadProc("glFramebufferTextureEXT"));
-    glDrawArraysInstancedEXT =
-        reinterpret_cast<PFNGLDRAWARRAYSINSTANCEDEXTPROC>(loadProc("glDrawArraysInstancedEXT"));
-    glDrawElementsInstancedEXT =
-        reinterpret_cast<PFNGLDRAWELEMENTSINSTANCEDEXTPROC>(loadProc("glDrawElementsInstancedEXT"));
-    glVertexAttribDivisorEXT =
-        reinterpret_cast<PFNGLVERTEXATTRIBDIVISOREXTPROC>(loadProc("glVertexAttribDivisorEXT"));
-    glFlushMappedBufferRangeEXT = reinterpret_cast<PFNGLFLUSHMAPPEDBUFFERRANGEEXTPROC>(
-        loadProc("glFlushMappedBufferRangeEXT"));
-    glMapBufferRangeEXT =
-        reinterpret_cast<PFNGLMAPBUFFERRANGEEXTPROC>(loadProc("glMapBufferRangeEXT"));
-    glBufferStorageMemEXT =
-        reinterpret_cast<PFNGLBUFFERSTORAGEMEMEXTPROC>(loadProc("glBufferStorageMemEXT"));
-    glCreateMemoryObjectsEXT =
-        reinterpret_cast<PFNGLCREATEMEMORYOBJECTSEXTPROC>(loadProc("glCreateMemoryObjectsEXT"));
-    glDeleteMemoryObjectsEXT =
-        reinterpret_cast<PFNGLDELETEMEMORYOBJECTSEXTPROC>(loadProc("glDeleteMemoryObjectsEXT"));
-    glGetMemoryObjectParameterivEXT = reinterpret_cast<PFNGLGETMEMORYOBJECTPARAMETERIVEXTPROC>(
-        loadProc("glGetMemoryObjectParameterivEXT"));
-    glGetUnsignedBytei_vEXT =
-        reinterpret_cast<PFNGLGETUNSIGNEDBYTEI_VEXTPROC>(loadProc("glGetUnsignedBytei_vEXT"));
-    glGetUnsignedBytevEXT =
-        reinterpret_cast<PFNGLGETUNSIGNEDBYTEVEXTPROC>(loadProc("glGetUnsignedBytevEXT"));
-    glIsMemoryObjectEXT =
-        reinterpret_cast<PFNGLISMEMORYOBJECTEXTPROC>(loadProc("glIsMemoryObjectEXT"));
-    glMemoryObjectParameterivEXT = reinterpret_cast<PFNGLMEMORYOBJECTPARAMETERIVEXTPROC>(
-        loadProc("glMemoryObjectParameterivEXT"));
-    glTexStorageMem2DEXT =
-        reinterpret_cast<PFNGLTEXSTORAGEMEM2DEXTPROC>(loadProc("glTexStorageMem2DEXT"));
-    glTexStorageMem2DMultisampleEXT = reinterpret_cast<PFNGLTEXSTORAGEMEM2DMULTISAMPLEEXTPROC>(
-        loadProc("glTexStorageMem2DMultisampleEXT"));
-    glTexStorageMem3DEXT =
-        reinterpret_cast<PFNGLTEXSTORAGEMEM3DEXTPROC>(loadProc("glTexStorageMem3DEXT"));
-    glTexStorageMem3DMultisampleEXT = reinterpret_cast<PFNGLTEXSTORAGEMEM3DMULTISAMPLEEXTPROC>(
-        loadProc("glTexStorageMem3DMultisampleEXT"));
-    glImportMemoryFdEXT =
-        reinterpret_cast<PFNGLIMPORTMEMORYFDEXTPROC>(loadProc("glImportMemoryFdEXT"));
-    glGetGraphicsResetStatusEXT = reinterpret_cast<PFNGLGETGRAPHICSRESETSTATUSEXTPROC>(
-        loadProc("glGetGraphicsResetStatusEXT"));
-    glGetnUniformfvEXT =
-        reinterpret_cast<PFNGLGETNUNIFORMFVEXTPROC>(loadProc("glGetnUniformfvEXT"));
-    glGetnUniformivEXT =
-        reinterpret_cast<PFNGLGETNUNIFORMIVEXTPROC>(loadProc("glGetnUniformivEXT"));
-    glReadnPixelsEXT = reinterpret_cast<PFNGLREADNPIXELSEXTPROC>(loadProc("glReadnPixelsEXT"));
-    glDeleteSemaphoresEXT =
-        reinterpret_cast<PFNGLDELETESEMAPHORESEXTPROC>(loadProc("glDeleteSemaphoresEXT"));
-    glGenSemaphoresEXT =
-        reinterpret_cast<PFNGLGENSEMAPHORESEXTPROC>(loadProc("glGenSemaphoresEXT"));
-    glGetSemaphoreParameterui64vEXT = reinterpret_cast<PFNGLGETSEMAPHOREPARAMETERUI64VEXTPROC>(
-        loadProc("glGetSemaphoreParameterui64vEXT"));
-    glIsSemaphoreEXT = reinterpret_cast<PFNGLISSEMAPHOREEXTPROC>(loadProc("glIsSemaphoreEXT"));
-    glSemaphoreParameterui64vEXT = reinterpret_cast<PFNGLSEMAPHOREPARAMETERUI64VEXTPROC>(
-        loadProc("glSemaphoreParameterui64vEXT"));
-    glSignalSemaphoreEXT =
-        reinterpret_cast<PFNGLSIGNALSEMAPHOREEXTPROC>(loadProc("glSignalSemaphoreEXT"));
-    glWaitSemaphoreEXT =
-        reinterpret_cast<PFNGLWAITSEMAPHOREEXTPROC>(loadProc("glWaitSemaphoreEXT"));
-    glImportSemaphoreFdEXT =
-        reinterpret_cast<PFNGLIMPORTSEMAPHOREFDEXTPROC>(loadProc("glImportSemaphoreFdEXT"));
-    glTexStorage1DEXT = reinterpret_cast<PFNGLTEXSTORAGE1DEXTPROC>(loadProc("glTexStorage1DEXT"));
-    glTexStorage2DEXT = reinterpret_cast<PFNGLTEXSTORAGE2DEXTPROC>(loadProc("glTexStorage2DEXT"));
-    glTexStorage3DEXT = reinterpret_cast<PFNGLTEXSTORAGE3DEXTPROC>(loadProc("glTexStorage3DEXT"));
-    glDebugMessageCallbackKHR =
-        reinterpret_cast<PFNGLDEBUGMESSAGECALLBACKKHRPROC>(loadProc("glDebugMessageCallbackKHR"));
-    glDebugMessageControlKHR =
-        reinterpret_cast<PFNGLDEBUGMESSAGECONTROLKHRPROC>(loadProc("glDebugMessageControlKHR"));
-    glDebugMessageInsertKHR =
-        reinterpret_cast<PFNGLDEBUGMESSAGEINSERTKHRPROC>(loadProc("glDebugMessageInsertKHR"));
-    glGetDebugMessageLogKHR =
-        reinterpret_cast<PFNGLGETDEBUGMESSAGELOGKHRPROC>(loadProc("glGetDebugMessageLogKHR"));
-    glGetObjectLabelKHR =
-        reinterpret_cast<PFNGLGETOBJECTLABELKHRPROC>(loadProc("glGetObjectLabelKHR"));
-    glGetObjectPtrLabelKHR =
-        reinterpret_cast<PFNGLGETOBJECTPTRLABELKHRPROC>(loadProc("glGetObjectPtrLabelKHR"));
-    glGetPointervKHR = reinterpret_cast<PFNGLGETPOINTERVKHRPROC>(loadProc("glGetPointervKHR"));
-    glObjectLabelKHR = reinterpret_cast<PFNGLOBJECTLABELKHRPROC>(loadProc("glObjectLabelKHR"));
-    glObjectPtrLabelKHR =
-        reinterpret_cast<PFNGLOBJECTPTRLABELKHRPROC>(loadProc("glObjectPtrLabelKHR"));
-    glPopDebugGroupKHR =
-        reinterpret_cast<PFNGLPOPDEBUGGROUPKHRPROC>(loadProc("glPopDebugGroupKHR"));
-    glPushDebugGroupKHR =
-        reinterpret_cast<PFNGLPUSHDEBUGGROUPKHRPROC>(loadProc("glPushDebugGroupKHR"));
-    glMaxShaderCompilerThreadsKHR = reinterpret_cast<PFNGLMAXSHADERCOMPILERTHREADSKHRPROC>(
-        loadProc("glMaxShaderCompilerThreadsKHR"));
-    glDeleteFencesNV = reinterpret_cast<PFNGLDELETEFENCESNVPROC>(loadProc("glDeleteFencesNV"));
-    glFinishFenceNV  = reinterpret_cast<PFNGLFINISHFENCENVPROC>(loadProc("glFinishFenceNV"));
-    glGenFencesNV    = reinterpret_cast<PFNGLGENFENCESNVPROC>(loadProc("glGenFencesNV"));
-    glGetFenceivNV   = reinterpret_cast<PFNGLGETFENCEIVNVPROC>(loadProc("glGetFenceivNV"));
-    glIsFenceNV      = reinterpret_cast<PFNGLISFENCENVPROC>(loadProc("glIsFenceNV"));
-    glSetFenceNV     = reinterpret_cast<PFNGLSETFENCENVPROC>(loadProc("glSetFenceNV"));
-    glTestFenceNV    = reinterpret_cast<PFNGLTESTFENCENVPROC>(loadProc("glTestFenceNV"));
-    glEGLImageTargetRenderbufferStorageOES =
-        reinterpret_cast<PFNGLEGLIMAGETARGETRENDERBUFFERSTORAGEOESPROC>(
-            loadProc("glEGLImageTargetRenderbufferStorageOES"));
-    glEGLImageTargetTexture2DOES = reinterpret_cast<PFNGLEGLIMAGETARGETTEXTURE2DOESPROC>(
-        loadProc("glEGLImageTargetTexture2DOES"));
-    glGetProgramBinaryOES =
-        reinterpret_cast<PFNGLGETPROGRAMBINARYOESPROC>(loadProc("glGetProgramBinaryOES"));
-    glProgramBinaryOES =
-        reinterpret_cast<PFNGLPROGRAMBINARYOESPROC>(loadProc("glProgramBinaryOES"));
-    glGetBufferPointervOES =
-        reinterpret_cast<PFNGLGETBUFFERPOINTERVOESPROC>(loadProc("glGetBufferPointervOES"));
-    glMapBufferOES   = reinterpret_cast<PFNGLMAPBUFFEROESPROC>(loadProc("glMapBufferOES"));
-    glUnmapBufferOES = reinterpret_cast<PFNGLUNMAPBUFFEROESPROC>(loadProc("glUnmapBufferOES"));
-    glGetSamplerParameterIivOES = reinterpret_cast<PFNGLGETSAMPLERPARAMETERIIVOESPROC>(
-        loadProc("glGetSamplerParameterIivOES"));
-    glGetSamplerParameterIuivOES = reinterpret_cast<PFNGLGETSAMPLERPARAMETERIUIVOESPROC>(
-        loadProc("glGetSamplerParameterIuivOES"));
-    glGetTexParameterIivOES =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIIVOESPROC>(loadProc("glGetTexParameterIivOES"));
-    glGetTexParameterIuivOES =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIUIVOESPROC>(loadProc("glGetTexParameterIuivOES"));
-    glSamplerParameterIivOES =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIIVOESPROC>(loadProc("glSamplerParameterIivOES"));
-    glSamplerParameterIuivOES =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIUIVOESPROC>(loadProc("glSamplerParameterIuivOES"));
-    glTexParameterIivOES =
-        reinterpret_cast<PFNGLTEXPARAMETERIIVOESPROC>(loadProc("glTexParameterIivOES"));
-    glTexParameterIuivOES =
-        reinterpret_cast<PFNGLTEXPARAMETERIUIVOESPROC>(loadProc("glTexParameterIuivOES"));
-    glTexStorage3DMultisampleOES = reinterpret_cast<PFNGLTEXSTORAGE3DMULTISAMPLEOESPROC>(
-        loadProc("glTexStorage3DMultisampleOES"));
-    glBindVertexArrayOES =
-        reinterpret_cast<PFNGLBINDVERTEXARRAYOESPROC>(loadProc("glBindVertexArrayOES"));
-    glDeleteVertexArraysOES =
-        reinterpret_cast<PFNGLDELETEVERTEXARRAYSOESPROC>(loadProc("glDeleteVertexArraysOES"));
-    glGenVertexArraysOES =
-        reinterpret_cast<PFNGLGENVERTEXARRAYSOESPROC>(loadProc("glGenVertexArraysOES"));
-    glIsVertexArrayOES =
-        reinterpret_cast<PFNGLISVERTEXARRAYOESPROC>(loadProc("glIsVertexArrayOES"));
-    glFramebufferTextureMultiviewOVR = reinterpret_cast<PFNGLFRAMEBUFFERTEXTUREMULTIVIEWOVRPROC>(
-        loadProc("glFramebufferTextureMultiviewOVR"));
-    glDrawTexfOES  = reinterpret_cast<PFNGLDRAWTEXFOESPROC>(loadProc("glDrawTexfOES"));
-    glDrawTexfvOES = reinterpret_cast<PFNGLDRAWTEXFVOESPROC>(loadProc("glDrawTexfvOES"));
-    glDrawTexiOES  = reinterpret_cast<PFNGLDRAWTEXIOESPROC>(loadProc("glDrawTexiOES"));
-    glDrawTexivOES = reinterpret_cast<PFNGLDRAWTEXIVOESPROC>(loadProc("glDrawTexivOES"));
-    glDrawTexsOES  = reinterpret_cast<PFNGLDRAWTEXSOESPROC>(loadProc("glDrawTexsOES"));
-    glDrawTexsvOES = reinterpret_cast<PFNGLDRAWTEXSVOESPROC>(loadProc("glDrawTexsvOES"));
-    glDrawTexxOES  = reinterpret_cast<PFNGLDRAWTEXXOESPROC>(loadProc("glDrawTexxOES"));
-    glDrawTexxvOES = reinterpret_cast<PFNGLDRAWTEXXVOESPROC>(loadProc("glDrawTexxvOES"));
-    glBindFramebufferOES =
-        reinterpret_cast<PFNGLBINDFRAMEBUFFEROESPROC>(loadProc("glBindFramebufferOES"));
-    glBindRenderbufferOES =
-        reinterpret_cast<PFNGLBINDRENDERBUFFEROESPROC>(loadProc("glBindRenderbufferOES"));
-    glCheckFramebufferStatusOES = reinterpret_cast<PFNGLCHECKFRAMEBUFFERSTATUSOESPROC>(
-        loadProc("glCheckFramebufferStatusOES"));
-    glDeleteFramebuffersOES =
-        reinterpret_cast<PFNGLDELETEFRAMEBUFFERSOESPROC>(loadProc("glDeleteFramebuffersOES"));
-    glDeleteRenderbuffersOES =
-        reinterpret_cast<PFNGLDELETERENDERBUFFERSOESPROC>(loadProc("glDeleteRenderbuffersOES"));
-    glFramebufferRenderbufferOES = reinterpret_cast<PFNGLFRAMEBUFFERRENDERBUFFEROESPROC>(
-        loadProc("glFramebufferRenderbufferOES"));
-    glFramebufferTexture2DOES =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTURE2DOESPROC>(loadProc("glFramebufferTexture2DOES"));
-    glGenFramebuffersOES =
-        reinterpret_cast<PFNGLGENFRAMEBUFFERSOESPROC>(loadProc("glGenFramebuffersOES"));
-    glGenRenderbuffersOES =
-        reinterpret_cast<PFNGLGENRENDERBUFFERSOESPROC>(loadProc("glGenRenderbuffersOES"));
-    glGenerateMipmapOES =
-        reinterpret_cast<PFNGLGENERATEMIPMAPOESPROC>(loadProc("glGenerateMipmapOES"));
-    glGetFramebufferAttachmentParameterivOES =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVOESPROC>(
-            loadProc("glGetFramebufferAttachmentParameterivOES"));
-    glGetRenderbufferParameterivOES = reinterpret_cast<PFNGLGETRENDERBUFFERPARAMETERIVOESPROC>(
-        loadProc("glGetRenderbufferParameterivOES"));
-    glIsFramebufferOES =
-        reinterpret_cast<PFNGLISFRAMEBUFFEROESPROC>(loadProc("glIsFramebufferOES"));
-    glIsRenderbufferOES =
-        reinterpret_cast<PFNGLISRENDERBUFFEROESPROC>(loadProc("glIsRenderbufferOES"));
-    glRenderbufferStorageOES =
-        reinterpret_cast<PFNGLRENDERBUFFERSTORAGEOESPROC>(loadProc("glRenderbufferStorageOES"));
-    glCurrentPaletteMatrixOES =
-        reinterpret_cast<PFNGLCURRENTPALETTEMATRIXOESPROC>(loadProc("glCurrentPaletteMatrixOES"));
-    glLoadPaletteFromModelViewMatrixOES =
-        reinterpret_cast<PFNGLLOADPALETTEFROMMODELVIEWMATRIXOESPROC>(
-            loadProc("glLoadPaletteFromModelViewMatrixOES"));
-    glMatrixIndexPointerOES =
-        reinterpret_cast<PFNGLMATRIXINDEXPOINTEROESPROC>(loadProc("glMatrixIndexPointerOES"));
-    glWeightPointerOES =
-        reinterpret_cast<PFNGLWEIGHTPOINTEROESPROC>(loadProc("glWeightPointerOES"));
-    glPointSizePointerOES =
-        reinterpret_cast<PFNGLPOINTSIZEPOINTEROESPROC>(loadProc("glPointSizePointerOES"));
-    glQueryMatrixxOES = reinterpret_cast<PFNGLQUERYMATRIXXOESPROC>(loadProc("glQueryMatrixxOES"));
-    glGetTexGenfvOES  = reinterpret_cast<PFNGLGETTEXGENFVOESPROC>(loadProc("glGetTexGenfvOES"));
-    glGetTexGenivOES  = reinterpret_cast<PFNGLGETTEXGENIVOESPROC>(loadProc("glGetTexGenivOES"));
-    glGetTexGenxvOES  = reinterpret_cast<PFNGLGETTEXGENXVOESPROC>(loadProc("glGetTexGenxvOES"));
-    glTexGenfOES      = reinterpret_cast<PFNGLTEXGENFOESPROC>(loadProc("glTexGenfOES"));
-    glTexGenfvOES     = reinterpret_cast<PFNGLTEXGENFVOESPROC>(loadProc("glTexGenfvOES"));
-    glTexGeniOES      = reinterpret_cast<PFNGLTEXGENIOESPROC>(loadProc("glTexGeniOES"));
-    glTexGenivOES     = reinterpret_cast<PFNGLTEXGENIVOESPROC>(loadProc("glTexGenivOES"));
-    glTexGenxOES      = reinterpret_cast<PFNGLTEXGENXOESPROC>(loadProc("glTexGenxOES"));
-    glTexGenxvOES     = reinterpret_cast<PFNGLTEXGENXVOESPROC>(loadProc("glTexGenxvOES"));
-    glAlphaFuncContextANGLE =
-        reinterpret_cast<PFNGLALPHAFUNCCONTEXTANGLEPROC>(loadProc("glAlphaFuncContextANGLE"));
-    glClipPlanefContextANGLE =
-        reinterpret_cast<PFNGLCLIPPLANEFCONTEXTANGLEPROC>(loadProc("glClipPlanefContextANGLE"));
-    glColor4fContextANGLE =
-        reinterpret_cast<PFNGLCOLOR4FCONTEXTANGLEPROC>(loadProc("glColor4fContextANGLE"));
-    glFogfContextANGLE =
-        reinterpret_cast<PFNGLFOGFCONTEXTANGLEPROC>(loadProc("glFogfContextANGLE"));
-    glFogfvContextANGLE =
-        reinterpret_cast<PFNGLFOGFVCONTEXTANGLEPROC>(loadProc("glFogfvContextANGLE"));
-    glFrustumfContextANGLE =
-        reinterpret_cast<PFNGLFRUSTUMFCONTEXTANGLEPROC>(loadProc("glFrustumfContextANGLE"));
-    glGetClipPlanefContextANGLE = reinterpret_cast<PFNGLGETCLIPPLANEFCONTEXTANGLEPROC>(
-        loadProc("glGetClipPlanefContextANGLE"));
-    glGetLightfvContextANGLE =
-        reinterpret_cast<PFNGLGETLIGHTFVCONTEXTANGLEPROC>(loadProc("glGetLightfvContextANGLE"));
-    glGetMaterialfvContextANGLE = reinterpret_cast<PFNGLGETMATERIALFVCONTEXTANGLEPROC>(
-        loadProc("glGetMaterialfvContextANGLE"));
-    glGetTexEnvfvContextANGLE =
-        reinterpret_cast<PFNGLGETTEXENVFVCONTEXTANGLEPROC>(loadProc("glGetTexEnvfvContextANGLE"));
-    glLightModelfContextANGLE =
-        reinterpret_cast<PFNGLLIGHTMODELFCONTEXTANGLEPROC>(loadProc("glLightModelfContextANGLE"));
-    glLightModelfvContextANGLE =
-        reinterpret_cast<PFNGLLIGHTMODELFVCONTEXTANGLEPROC>(loadProc("glLightModelfvContextANGLE"));
-    glLightfContextANGLE =
-        reinterpret_cast<PFNGLLIGHTFCONTEXTANGLEPROC>(loadProc("glLightfContextANGLE"));
-    glLightfvContextANGLE =
-        reinterpret_cast<PFNGLLIGHTFVCONTEXTANGLEPROC>(loadProc("glLightfvContextANGLE"));
-    glLoadMatrixfContextANGLE =
-        reinterpret_cast<PFNGLLOADMATRIXFCONTEXTANGLEPROC>(loadProc("glLoadMatrixfContextANGLE"));
-    glMaterialfContextANGLE =
-        reinterpret_cast<PFNGLMATERIALFCONTEXTANGLEPROC>(loadProc("glMaterialfContextANGLE"));
-    glMaterialfvContextANGLE =
-        reinterpret_cast<PFNGLMATERIALFVCONTEXTANGLEPROC>(loadProc("glMaterialfvContextANGLE"));
-    glMultMatrixfContextANGLE =
-        reinterpret_cast<PFNGLMULTMATRIXFCONTEXTANGLEPROC>(loadProc("glMultMatrixfContextANGLE"));
-    glMultiTexCoord4fContextANGLE = reinterpret_cast<PFNGLMULTITEXCOORD4FCONTEXTANGLEPROC>(
-        loadProc("glMultiTexCoord4fContextANGLE"));
-    glNormal3fContextANGLE =
-        reinterpret_cast<PFNGLNORMAL3FCONTEXTANGLEPROC>(loadProc("glNormal3fContextANGLE"));
-    glOrthofContextANGLE =
-        reinterpret_cast<PFNGLORTHOFCONTEXTANGLEPROC>(loadProc("glOrthofContextANGLE"));
-    glPointParameterfContextANGLE = reinterpret_cast<PFNGLPOINTPARAMETERFCONTEXTANGLEPROC>(
-        loadProc("glPointParameterfContextANGLE"));
-    glPointParameterfvContextANGLE = reinterpret_cast<PFNGLPOINTPARAMETERFVCONTEXTANGLEPROC>(
-        loadProc("glPointParameterfvContextANGLE"));
-    glPointSizeContextANGLE =
-        reinterpret_cast<PFNGLPOINTSIZECONTEXTANGLEPROC>(loadProc("glPointSizeContextANGLE"));
-    glRotatefContextANGLE =
-        reinterpret_cast<PFNGLROTATEFCONTEXTANGLEPROC>(loadProc("glRotatefContextANGLE"));
-    glScalefContextANGLE =
-        reinterpret_cast<PFNGLSCALEFCONTEXTANGLEPROC>(loadProc("glScalefContextANGLE"));
-    glTexEnvfContextANGLE =
-        reinterpret_cast<PFNGLTEXENVFCONTEXTANGLEPROC>(loadProc("glTexEnvfContextANGLE"));
-    glTexEnvfvContextANGLE =
-        reinterpret_cast<PFNGLTEXENVFVCONTEXTANGLEPROC>(loadProc("glTexEnvfvContextANGLE"));
-    glTranslatefContextANGLE =
-        reinterpret_cast<PFNGLTRANSLATEFCONTEXTANGLEPROC>(loadProc("glTranslatefContextANGLE"));
-    glAlphaFuncxContextANGLE =
-        reinterpret_cast<PFNGLALPHAFUNCXCONTEXTANGLEPROC>(loadProc("glAlphaFuncxContextANGLE"));
-    glClearColorxContextANGLE =
-        reinterpret_cast<PFNGLCLEARCOLORXCONTEXTANGLEPROC>(loadProc("glClearColorxContextANGLE"));
-    glClearDepthxContextANGLE =
-        reinterpret_cast<PFNGLCLEARDEPTHXCONTEXTANGLEPROC>(loadProc("glClearDepthxContextANGLE"));
-    glClientActiveTextureContextANGLE = reinterpret_cast<PFNGLCLIENTACTIVETEXTURECONTEXTANGLEPROC>(
-        loadProc("glClientActiveTextureContextANGLE"));
-    glClipPlanexContextANGLE =
-        reinterpret_cast<PFNGLCLIPPLANEXCONTEXTANGLEPROC>(loadProc("glClipPlanexContextANGLE"));
-    glColor4ubContextANGLE =
-        reinterpret_cast<PFNGLCOLOR4UBCONTEXTANGLEPROC>(loadProc("glColor4ubContextANGLE"));
-    glColor4xContextANGLE =
-        reinterpret_cast<PFNGLCOLOR4XCONTEXTANGLEPROC>(loadProc("glColor4xContextANGLE"));
-    glColorPointerContextANGLE =
-        reinterpret_cast<PFNGLCOLORPOINTERCONTEXTANGLEPROC>(loadProc("glColorPointerContextANGLE"));
-    glDepthRangexContextANGLE =
-        reinterpret_cast<PFNGLDEPTHRANGEXCONTEXTANGLEPROC>(loadProc("glDepthRangexContextANGLE"));
-    glDisableClientStateContextANGLE = reinterpret_cast<PFNGLDISABLECLIENTSTATECONTEXTANGLEPROC>(
-        loadProc("glDisableClientStateContextANGLE"));
-    glEnableClientStateContextANGLE = reinterpret_cast<PFNGLENABLECLIENTSTATECONTEXTANGLEPROC>(
-        loadProc("glEnableClientStateContextANGLE"));
-    glFogxContextANGLE =
-        reinterpret_cast<PFNGLFOGXCONTEXTANGLEPROC>(loadProc("glFogxContextANGLE"));
-    glFogxvContextANGLE =
-        reinterpret_cast<PFNGLFOGXVCONTEXTANGLEPROC>(loadProc("glFogxvContextANGLE"));
-    glFrustumxContextANGLE =
-        reinterpret_cast<PFNGLFRUSTUMXCONTEXTANGLEPROC>(loadProc("glFrustumxContextANGLE"));
-    glGetClipPlanexContextANGLE = reinterpret_cast<PFNGLGETCLIPPLANEXCONTEXTANGLEPROC>(
-        loadProc("glGetClipPlanexContextANGLE"));
-    glGetFixedvContextANGLE =
-        reinterpret_cast<PFNGLGETFIXEDVCONTEXTANGLEPROC>(loadProc("glGetFixedvContextANGLE"));
-    glGetLightxvContextANGLE =
-        reinterpret_cast<PFNGLGETLIGHTXVCONTEXTANGLEPROC>(loadProc("glGetLightxvContextANGLE"));
-    glGetMaterialxvContextANGLE = reinterpret_cast<PFNGLGETMATERIALXVCONTEXTANGLEPROC>(
-        loadProc("glGetMaterialxvContextANGLE"));
-    glGetPointervContextANGLE =
-        reinterpret_cast<PFNGLGETPOINTERVCONTEXTANGLEPROC>(loadProc("glGetPointervContextANGLE"));
-    glGetTexEnvivContextANGLE =
-        reinterpret_cast<PFNGLGETTEXENVIVCONTEXTANGLEPROC>(loadProc("glGetTexEnvivContextANGLE"));
-    glGetTexEnvxvContextANGLE =
-        reinterpret_cast<PFNGLGETTEXENVXVCONTEXTANGLEPROC>(loadProc("glGetTexEnvxvContextANGLE"));
-    glGetTexParameterxvContextANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERXVCONTEXTANGLEPROC>(
-        loadProc("glGetTexParameterxvContextANGLE"));
-    glLightModelxContextANGLE =
-        reinterpret_cast<PFNGLLIGHTMODELXCONTEXTANGLEPROC>(loadProc("glLightModelxContextANGLE"));
-    glLightModelxvContextANGLE =
-        reinterpret_cast<PFNGLLIGHTMODELXVCONTEXTANGLEPROC>(loadProc("glLightModelxvContextANGLE"));
-    glLightxContextANGLE =
-        reinterpret_cast<PFNGLLIGHTXCONTEXTANGLEPROC>(loadProc("glLightxContextANGLE"));
-    glLightxvContextANGLE =
-        reinterpret_cast<PFNGLLIGHTXVCONTEXTANGLEPROC>(loadProc("glLightxvContextANGLE"));
-    glLineWidthxContextANGLE =
-        reinterpret_cast<PFNGLLINEWIDTHXCONTEXTANGLEPROC>(loadProc("glLineWidthxContextANGLE"));
-    glLoadIdentityContextANGLE =
-        reinterpret_cast<PFNGLLOADIDENTITYCONTEXTANGLEPROC>(loadProc("glLoadIdentityContextANGLE"));
-    glLoadMatrixxContextANGLE =
-        reinterpret_cast<PFNGLLOADMATRIXXCONTEXTANGLEPROC>(loadProc("glLoadMatrixxContextANGLE"));
-    glLogicOpContextANGLE =
-        reinterpret_cast<PFNGLLOGICOPCONTEXTANGLEPROC>(loadProc("glLogicOpContextANGLE"));
-    glMaterialxContextANGLE =
-        reinterpret_cast<PFNGLMATERIALXCONTEXTANGLEPROC>(loadProc("glMaterialxContextANGLE"));
-    glMaterialxvContextANGLE =
-        reinterpret_cast<PFNGLMATERIALXVCONTEXTANGLEPROC>(loadProc("glMaterialxvContextANGLE"));
-    glMatrixModeContextANGLE =
-        reinterpret_cast<PFNGLMATRIXMODECONTEXTANGLEPROC>(loadProc("glMatrixModeContextANGLE"));
-    glMultMatrixxContextANGLE =
-        reinterpret_cast<PFNGLMULTMATRIXXCONTEXTANGLEPROC>(loadProc("glMultMatrixxContextANGLE"));
-    glMultiTexCoord4xContextANGLE = reinterpret_cast<PFNGLMULTITEXCOORD4XCONTEXTANGLEPROC>(
-        loadProc("glMultiTexCoord4xContextANGLE"));
-    glNormal3xContextANGLE =
-        reinterpret_cast<PFNGLNORMAL3XCONTEXTANGLEPROC>(loadProc("glNormal3xContextANGLE"));
-    glNormalPointerContextANGLE = reinterpret_cast<PFNGLNORMALPOINTERCONTEXTANGLEPROC>(
-        loadProc("glNormalPointerContextANGLE"));
-    glOrthoxContextANGLE =
-        reinterpret_cast<PFNGLORTHOXCONTEXTANGLEPROC>(loadProc("glOrthoxContextANGLE"));
-    glPointParameterxContextANGLE = reinterpret_cast<PFNGLPOINTPARAMETERXCONTEXTANGLEPROC>(
-        loadProc("glPointParameterxContextANGLE"));
-    glPointParameterxvContextANGLE = reinterpret_cast<PFNGLPOINTPARAMETERXVCONTEXTANGLEPROC>(
-        loadProc("glPointParameterxvContextANGLE"));
-    glPointSizexContextANGLE =
-        reinterpret_cast<PFNGLPOINTSIZEXCONTEXTANGLEPROC>(loadProc("glPointSizexContextANGLE"));
-    glPolygonOffsetxContextANGLE = reinterpret_cast<PFNGLPOLYGONOFFSETXCONTEXTANGLEPROC>(
-        loadProc("glPolygonOffsetxContextANGLE"));
-    glPopMatrixContextANGLE =
-        reinterpret_cast<PFNGLPOPMATRIXCONTEXTANGLEPROC>(loadProc("glPopMatrixContextANGLE"));
-    glPushMatrixContextANGLE =
-        reinterpret_cast<PFNGLPUSHMATRIXCONTEXTANGLEPROC>(loadProc("glPushMatrixContextANGLE"));
-    glRotatexContextANGLE =
-        reinterpret_cast<PFNGLROTATEXCONTEXTANGLEPROC>(loadProc("glRotatexContextANGLE"));
-    glSampleCoveragexContextANGLE = reinterpret_cast<PFNGLSAMPLECOVERAGEXCONTEXTANGLEPROC>(
-        loadProc("glSampleCoveragexContextANGLE"));
-    glScalexContextANGLE =
-        reinterpret_cast<PFNGLSCALEXCONTEXTANGLEPROC>(loadProc("glScalexContextANGLE"));
-    glShadeModelContextANGLE =
-        reinterpret_cast<PFNGLSHADEMODELCONTEXTANGLEPROC>(loadProc("glShadeModelContextANGLE"));
-    glTexCoordPointerContextANGLE = reinterpret_cast<PFNGLTEXCOORDPOINTERCONTEXTANGLEPROC>(
-        loadProc("glTexCoordPointerContextANGLE"));
-    glTexEnviContextANGLE =
-        reinterpret_cast<PFNGLTEXENVICONTEXTANGLEPROC>(loadProc("glTexEnviContextANGLE"));
-    glTexEnvxContextANGLE =
-        reinterpret_cast<PFNGLTEXENVXCONTEXTANGLEPROC>(loadProc("glTexEnvxContextANGLE"));
-    glTexEnvivContextANGLE =
-        reinterpret_cast<PFNGLTEXENVIVCONTEXTANGLEPROC>(loadProc("glTexEnvivContextANGLE"));
-    glTexEnvxvContextANGLE =
-        reinterpret_cast<PFNGLTEXENVXVCONTEXTANGLEPROC>(loadProc("glTexEnvxvContextANGLE"));
-    glTexParameterxContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERXCONTEXTANGLEPROC>(
-        loadProc("glTexParameterxContextANGLE"));
-    glTexParameterxvContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERXVCONTEXTANGLEPROC>(
-        loadProc("glTexParameterxvContextANGLE"));
-    glTranslatexContextANGLE =
-        reinterpret_cast<PFNGLTRANSLATEXCONTEXTANGLEPROC>(loadProc("glTranslatexContextANGLE"));
-    glVertexPointerContextANGLE = reinterpret_cast<PFNGLVERTEXPOINTERCONTEXTANGLEPROC>(
-        loadProc("glVertexPointerContextANGLE"));
-    glActiveTextureContextANGLE = reinterpret_cast<PFNGLACTIVETEXTURECONTEXTANGLEPROC>(
-        loadProc("glActiveTextureContextANGLE"));
-    glAttachShaderContextANGLE =
-        reinterpret_cast<PFNGLATTACHSHADERCONTEXTANGLEPROC>(loadProc("glAttachShaderContextANGLE"));
-    glBindAttribLocationContextANGLE = reinterpret_cast<PFNGLBINDATTRIBLOCATIONCONTEXTANGLEPROC>(
-        loadProc("glBindAttribLocationContextANGLE"));
-    glBindBufferContextANGLE =
-        reinterpret_cast<PFNGLBINDBUFFERCONTEXTANGLEPROC>(loadProc("glBindBufferContextANGLE"));
-    glBindFramebufferContextANGLE = reinterpret_cast<PFNGLBINDFRAMEBUFFERCONTEXTANGLEPROC>(
-        loadProc("glBindFramebufferContextANGLE"));
-    glBindRenderbufferContextANGLE = reinterpret_cast<PFNGLBINDRENDERBUFFERCONTEXTANGLEPROC>(
-        loadProc("glBindRenderbufferContextANGLE"));
-    glBindTextureContextANGLE =
-        reinterpret_cast<PFNGLBINDTEXTURECONTEXTANGLEPROC>(loadProc("glBindTextureContextANGLE"));
-    glBlendColorContextANGLE =
-        reinterpret_cast<PFNGLBLENDCOLORCONTEXTANGLEPROC>(loadProc("glBlendColorContextANGLE"));
-    glBlendEquationContextANGLE = reinterpret_cast<PFNGLBLENDEQUATIONCONTEXTANGLEPROC>(
-        loadProc("glBlendEquationContextANGLE"));
-    glBlendEquationSeparateContextANGLE =
-        reinterpret_cast<PFNGLBLENDEQUATIONSEPARATECONTEXTANGLEPROC>(
-            loadProc("glBlendEquationSeparateContextANGLE"));
-    glBlendFuncContextANGLE =
-        reinterpret_cast<PFNGLBLENDFUNCCONTEXTANGLEPROC>(loadProc("glBlendFuncContextANGLE"));
-    glBlendFuncSeparateContextANGLE = reinterpret_cast<PFNGLBLENDFUNCSEPARATECONTEXTANGLEPROC>(
-        loadProc("glBlendFuncSeparateContextANGLE"));
-    glBufferDataContextANGLE =
-        reinterpret_cast<PFNGLBUFFERDATACONTEXTANGLEPROC>(loadProc("glBufferDataContextANGLE"));
-    glBufferSubDataContextANGLE = reinterpret_cast<PFNGLBUFFERSUBDATACONTEXTANGLEPROC>(
-        loadProc("glBufferSubDataContextANGLE"));
-    glCheckFramebufferStatusContextANGLE =
-        reinterpret_cast<PFNGLCHECKFRAMEBUFFERSTATUSCONTEXTANGLEPROC>(
-            loadProc("glCheckFramebufferStatusContextANGLE"));
-    glClearContextANGLE =
-        reinterpret_cast<PFNGLCLEARCONTEXTANGLEPROC>(loadProc("glClearContextANGLE"));
-    glClearColorContextANGLE =
-        reinterpret_cast<PFNGLCLEARCOLORCONTEXTANGLEPROC>(loadProc("glClearColorContextANGLE"));
-    glClearDepthfContextANGLE =
-        reinterpret_cast<PFNGLCLEARDEPTHFCONTEXTANGLEPROC>(loadProc("glClearDepthfContextANGLE"));
-    glClearStencilContextANGLE =
-        reinterpret_cast<PFNGLCLEARSTENCILCONTEXTANGLEPROC>(loadProc("glClearStencilContextANGLE"));
-    glColorMaskContextANGLE =
-        reinterpret_cast<PFNGLCOLORMASKCONTEXTANGLEPROC>(loadProc("glColorMaskContextANGLE"));
-    glCompileShaderContextANGLE = reinterpret_cast<PFNGLCOMPILESHADERCONTEXTANGLEPROC>(
-        loadProc("glCompileShaderContextANGLE"));
-    glCompressedTexImage2DContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE2DCONTEXTANGLEPROC>(
-            loadProc("glCompressedTexImage2DContextANGLE"));
-    glCompressedTexSubImage2DContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE2DCONTEXTANGLEPROC>(
-            loadProc("glCompressedTexSubImage2DContextANGLE"));
-    glCopyTexImage2DContextANGLE = reinterpret_cast<PFNGLCOPYTEXIMAGE2DCONTEXTANGLEPROC>(
-        loadProc("glCopyTexImage2DContextANGLE"));
-    glCopyTexSubImage2DContextANGLE = reinterpret_cast<PFNGLCOPYTEXSUBIMAGE2DCONTEXTANGLEPROC>(
-        loadProc("glCopyTexSubImage2DContextANGLE"));
-    glCreateProgramContextANGLE = reinterpret_cast<PFNGLCREATEPROGRAMCONTEXTANGLEPROC>(
-        loadProc("glCreateProgramContextANGLE"));
-    glCreateShaderContextANGLE =
-        reinterpret_cast<PFNGLCREATESHADERCONTEXTANGLEPROC>(loadProc("glCreateShaderContextANGLE"));
-    glCullFaceContextANGLE =
-        reinterpret_cast<PFNGLCULLFACECONTEXTANGLEPROC>(loadProc("glCullFaceContextANGLE"));
-    glDeleteBuffersContextANGLE = reinterpret_cast<PFNGLDELETEBUFFERSCONTEXTANGLEPROC>(
-        loadProc("glDeleteBuffersContextANGLE"));
-    glDeleteFramebuffersContextANGLE = reinterpret_cast<PFNGLDELETEFRAMEBUFFERSCONTEXTANGLEPROC>(
-        loadProc("glDeleteFramebuffersContextANGLE"));
-    glDeleteProgramContextANGLE = reinterpret_cast<PFNGLDELETEPROGRAMCONTEXTANGLEPROC>(
-        loadProc("glDeleteProgramContextANGLE"));
-    glDeleteRenderbuffersContextANGLE = reinterpret_cast<PFNGLDELETERENDERBUFFERSCONTEXTANGLEPROC>(
-        loadProc("glDeleteRenderbuffersContextANGLE"));
-    glDeleteShaderContextANGLE =
-        reinterpret_cast<PFNGLDELETESHADERCONTEXTANGLEPROC>(loadProc("glDeleteShaderContextANGLE"));
-    glDeleteTexturesContextANGLE = reinterpret_cast<PFNGLDELETETEXTURESCONTEXTANGLEPROC>(
-        loadProc("glDeleteTexturesContextANGLE"));
-    glDepthFuncContextANGLE =
-        reinterpret_cast<PFNGLDEPTHFUNCCONTEXTANGLEPROC>(loadProc("glDepthFuncContextANGLE"));
-    glDepthMaskContextANGLE =
-        reinterpret_cast<PFNGLDEPTHMASKCONTEXTANGLEPROC>(loadProc("glDepthMaskContextANGLE"));
-    glDepthRangefContextANGLE =
-        reinterpret_cast<PFNGLDEPTHRANGEFCONTEXTANGLEPROC>(loadProc("glDepthRangefContextANGLE"));
-    glDetachShaderContextANGLE =
-        reinterpret_cast<PFNGLDETACHSHADERCONTEXTANGLEPROC>(loadProc("glDetachShaderContextANGLE"));
-    glDisableContextANGLE =
-        reinterpret_cast<PFNGLDISABLECONTEXTANGLEPROC>(loadProc("glDisableContextANGLE"));
-    glDisableVertexAttribArrayContextANGLE =
-        reinterpret_cast<PFNGLDISABLEVERTEXATTRIBARRAYCONTEXTANGLEPROC>(
-            loadProc("glDisableVertexAttribArrayContextANGLE"));
-    glDrawArraysContextANGLE =
-        reinterpret_cast<PFNGLDRAWARRAYSCONTEXTANGLEPROC>(loadProc("glDrawArraysContextANGLE"));
-    glDrawElementsContextANGLE =
-        reinterpret_cast<PFNGLDRAWELEMENTSCONTEXTANGLEPROC>(loadProc("glDrawElementsContextANGLE"));
-    glEnableContextANGLE =
-        reinterpret_cast<PFNGLENABLECONTEXTANGLEPROC>(loadProc("glEnableContextANGLE"));
-    glEnableVertexAttribArrayContextANGLE =
-        reinterpret_cast<PFNGLENABLEVERTEXATTRIBARRAYCONTEXTANGLEPROC>(
-            loadProc("glEnableVertexAttribArrayContextANGLE"));
-    glFinishContextANGLE =
-        reinterpret_cast<PFNGLFINISHCONTEXTANGLEPROC>(loadProc("glFinishContextANGLE"));
-    glFlushContextANGLE =
-        reinterpret_cast<PFNGLFLUSHCONTEXTANGLEPROC>(loadProc("glFlushContextANGLE"));
-    glFramebufferRenderbufferContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERRENDERBUFFERCONTEXTANGLEPROC>(
-            loadProc("glFramebufferRenderbufferContextANGLE"));
-    glFramebufferTexture2DContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTURE2DCONTEXTANGLEPROC>(
-            loadProc("glFramebufferTexture2DContextANGLE"));
-    glFrontFaceContextANGLE =
-        reinterpret_cast<PFNGLFRONTFACECONTEXTANGLEPROC>(loadProc("glFrontFaceContextANGLE"));
-    glGenBuffersContextANGLE =
-        reinterpret_cast<PFNGLGENBUFFERSCONTEXTANGLEPROC>(loadProc("glGenBuffersContextANGLE"));
-    glGenerateMipmapContextANGLE = reinterpret_cast<PFNGLGENERATEMIPMAPCONTEXTANGLEPROC>(
-        loadProc("glGenerateMipmapContextANGLE"));
-    glGenFramebuffersContextANGLE = reinterpret_cast<PFNGLGENFRAMEBUFFERSCONTEXTANGLEPROC>(
-        loadProc("glGenFramebuffersContextANGLE"));
-    glGenRenderbuffersContextANGLE = reinterpret_cast<PFNGLGENRENDERBUFFERSCONTEXTANGLEPROC>(
-        loadProc("glGenRenderbuffersContextANGLE"));
-    glGenTexturesContextANGLE =
-        reinterpret_cast<PFNGLGENTEXTURESCONTEXTANGLEPROC>(loadProc("glGenTexturesContextANGLE"));
-    glGetActiveAttribContextANGLE = reinterpret_cast<PFNGLGETACTIVEATTRIBCONTEXTANGLEPROC>(
-        loadProc("glGetActiveAttribContextANGLE"));
-    glGetActiveUniformContextANGLE = reinterpret_cast<PFNGLGETACTIVEUNIFORMCONTEXTANGLEPROC>(
-        loadProc("glGetActiveUniformContextANGLE"));
-    glGetAttachedShadersContextANGLE = reinterpret_cast<PFNGLGETATTACHEDSHADERSCONTEXTANGLEPROC>(
-        loadProc("glGetAttachedShadersContextANGLE"));
-    glGetAttribLocationContextANGLE = reinterpret_cast<PFNGLGETATTRIBLOCATIONCONTEXTANGLEPROC>(
-        loadProc("glGetAttribLocationContextANGLE"));
-    glGetBooleanvContextANGLE =
-        reinterpret_cast<PFNGLGETBOOLEANVCONTEXTANGLEPROC>(loadProc("glGetBooleanvContextANGLE"));
-    glGetBufferParameterivContextANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERIVCONTEXTANGLEPROC>(
-            loadProc("glGetBufferParameterivContextANGLE"));
-    glGetErrorContextANGLE =
-        reinterpret_cast<PFNGLGETERRORCONTEXTANGLEPROC>(loadProc("glGetErrorContextANGLE"));
-    glGetFloatvContextANGLE =
-        reinterpret_cast<PFNGLGETFLOATVCONTEXTANGLEPROC>(loadProc("glGetFloatvContextANGLE"));
-    glGetFramebufferAttachmentParameterivContextANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVCONTEXTANGLEPROC>(
-            loadProc("glGetFramebufferAttachmentParameterivContextANGLE"));
-    glGetIntegervContextANGLE =
-        reinterpret_cast<PFNGLGETINTEGERVCONTEXTANGLEPROC>(loadProc("glGetIntegervContextANGLE"));
-    glGetProgramivContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMIVCONTEXTANGLEPROC>(loadProc("glGetProgramivContextANGLE"));
-    glGetProgramInfoLogContextANGLE = reinterpret_cast<PFNGLGETPROGRAMINFOLOGCONTEXTANGLEPROC>(
-        loadProc("glGetProgramInfoLogContextANGLE"));
-    glGetRenderbufferParameterivContextANGLE =
-        reinterpret_cast<PFNGLGETRENDERBUFFERPARAMETERIVCONTEXTANGLEPROC>(
-            loadProc("glGetRenderbufferParameterivContextANGLE"));
-    glGetShaderivContextANGLE =
-        reinterpret_cast<PFNGLGETSHADERIVCONTEXTANGLEPROC>(loadProc("glGetShaderivContextANGLE"));
-    glGetShaderInfoLogContextANGLE = reinterpret_cast<PFNGLGETSHADERINFOLOGCONTEXTANGLEPROC>(
-        loadProc("glGetShaderInfoLogContextANGLE"));
-    glGetShaderPrecisionFormatContextANGLE =
-        reinterpret_cast<PFNGLGETSHADERPRECISIONFORMATCONTEXTANGLEPROC>(
-            loadProc("glGetShaderPrecisionFormatContextANGLE"));
-    glGetShaderSourceContextANGLE = reinterpret_cast<PFNGLGETSHADERSOURCECONTEXTANGLEPROC>(
-        loadProc("glGetShaderSourceContextANGLE"));
-    glGetStringContextANGLE =
-        reinterpret_cast<PFNGLGETSTRINGCONTEXTANGLEPROC>(loadProc("glGetStringContextANGLE"));
-    glGetTexParameterfvContextANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERFVCONTEXTANGLEPROC>(
-        loadProc("glGetTexParameterfvContextANGLE"));
-    glGetTexParameterivContextANGLE = reinterpret_cast<PFNGLGETTEXPARAMETERIVCONTEXTANGLEPROC>(
-        loadProc("glGetTexParameterivContextANGLE"));
-    glGetUniformfvContextANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMFVCONTEXTANGLEPROC>(loadProc("glGetUniformfvContextANGLE"));
-    glGetUniformivContextANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMIVCONTEXTANGLEPROC>(loadProc("glGetUniformivContextANGLE"));
-    glGetUniformLocationContextANGLE = reinterpret_cast<PFNGLGETUNIFORMLOCATIONCONTEXTANGLEPROC>(
-        loadProc("glGetUniformLocationContextANGLE"));
-    glGetVertexAttribfvContextANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBFVCONTEXTANGLEPROC>(
-        loadProc("glGetVertexAttribfvContextANGLE"));
-    glGetVertexAttribivContextANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBIVCONTEXTANGLEPROC>(
-        loadProc("glGetVertexAttribivContextANGLE"));
-    glGetVertexAttribPointervContextANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBPOINTERVCONTEXTANGLEPROC>(
-            loadProc("glGetVertexAttribPointervContextANGLE"));
-    glHintContextANGLE =
-        reinterpret_cast<PFNGLHINTCONTEXTANGLEPROC>(loadProc("glHintContextANGLE"));
-    glIsBufferContextANGLE =
-        reinterpret_cast<PFNGLISBUFFERCONTEXTANGLEPROC>(loadProc("glIsBufferContextANGLE"));
-    glIsEnabledContextANGLE =
-        reinterpret_cast<PFNGLISENABLEDCONTEXTANGLEPROC>(loadProc("glIsEnabledContextANGLE"));
-    glIsFramebufferContextANGLE = reinterpret_cast<PFNGLISFRAMEBUFFERCONTEXTANGLEPROC>(
-        loadProc("glIsFramebufferContextANGLE"));
-    glIsProgramContextANGLE =
-        reinterpret_cast<PFNGLISPROGRAMCONTEXTANGLEPROC>(loadProc("glIsProgramContextANGLE"));
-    glIsRenderbufferContextANGLE = reinterpret_cast<PFNGLISRENDERBUFFERCONTEXTANGLEPROC>(
-        loadProc("glIsRenderbufferContextANGLE"));
-    glIsShaderContextANGLE =
-        reinterpret_cast<PFNGLISSHADERCONTEXTANGLEPROC>(loadProc("glIsShaderContextANGLE"));
-    glIsTextureContextANGLE =
-        reinterpret_cast<PFNGLISTEXTURECONTEXTANGLEPROC>(loadProc("glIsTextureContextANGLE"));
-    glLineWidthContextANGLE =
-        reinterpret_cast<PFNGLLINEWIDTHCONTEXTANGLEPROC>(loadProc("glLineWidthContextANGLE"));
-    glLinkProgramContextANGLE =
-        reinterpret_cast<PFNGLLINKPROGRAMCONTEXTANGLEPROC>(loadProc("glLinkProgramContextANGLE"));
-    glPixelStoreiContextANGLE =
-        reinterpret_cast<PFNGLPIXELSTOREICONTEXTANGLEPROC>(loadProc("glPixelStoreiContextANGLE"));
-    glPolygonOffsetContextANGLE = reinterpret_cast<PFNGLPOLYGONOFFSETCONTEXTANGLEPROC>(
-        loadProc("glPolygonOffsetContextANGLE"));
-    glReadPixelsContextANGLE =
-        reinterpret_cast<PFNGLREADPIXELSCONTEXTANGLEPROC>(loadProc("glReadPixelsContextANGLE"));
-    glReleaseShaderCompilerContextANGLE =
-        reinterpret_cast<PFNGLRELEASESHADERCOMPILERCONTEXTANGLEPROC>(
-            loadProc("glReleaseShaderCompilerContextANGLE"));
-    glRenderbufferStorageContextANGLE = reinterpret_cast<PFNGLRENDERBUFFERSTORAGECONTEXTANGLEPROC>(
-        loadProc("glRenderbufferStorageContextANGLE"));
-    glSampleCoverageContextANGLE = reinterpret_cast<PFNGLSAMPLECOVERAGECONTEXTANGLEPROC>(
-        loadProc("glSampleCoverageContextANGLE"));
-    glScissorContextANGLE =
-        reinterpret_cast<PFNGLSCISSORCONTEXTANGLEPROC>(loadProc("glScissorContextANGLE"));
-    glShaderBinaryContextANGLE =
-        reinterpret_cast<PFNGLSHADERBINARYCONTEXTANGLEPROC>(loadProc("glShaderBinaryContextANGLE"));
-    glShaderSourceContextANGLE =
-        reinterpret_cast<PFNGLSHADERSOURCECONTEXTANGLEPROC>(loadProc("glShaderSourceContextANGLE"));
-    glStencilFuncContextANGLE =
-        reinterpret_cast<PFNGLSTENCILFUNCCONTEXTANGLEPROC>(loadProc("glStencilFuncContextANGLE"));
-    glStencilFuncSeparateContextANGLE = reinterpret_cast<PFNGLSTENCILFUNCSEPARATECONTEXTANGLEPROC>(
-        loadProc("glStencilFuncSeparateContextANGLE"));
-    glStencilMaskContextANGLE =
-        reinterpret_cast<PFNGLSTENCILMASKCONTEXTANGLEPROC>(loadProc("glStencilMaskContextANGLE"));
-    glStencilMaskSeparateContextANGLE = reinterpret_cast<PFNGLSTENCILMASKSEPARATECONTEXTANGLEPROC>(
-        loadProc("glStencilMaskSeparateContextANGLE"));
-    glStencilOpContextANGLE =
-        reinterpret_cast<PFNGLSTENCILOPCONTEXTANGLEPROC>(loadProc("glStencilOpContextANGLE"));
-    glStencilOpSeparateContextANGLE = reinterpret_cast<PFNGLSTENCILOPSEPARATECONTEXTANGLEPROC>(
-        loadProc("glStencilOpSeparateContextANGLE"));
-    glTexImage2DContextANGLE =
-        reinterpret_cast<PFNGLTEXIMAGE2DCONTEXTANGLEPROC>(loadProc("glTexImage2DContextANGLE"));
-    glTexParameterfContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERFCONTEXTANGLEPROC>(
-        loadProc("glTexParameterfContextANGLE"));
-    glTexParameterfvContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERFVCONTEXTANGLEPROC>(
-        loadProc("glTexParameterfvContextANGLE"));
-    glTexParameteriContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERICONTEXTANGLEPROC>(
-        loadProc("glTexParameteriContextANGLE"));
-    glTexParameterivContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERIVCONTEXTANGLEPROC>(
-        loadProc("glTexParameterivContextANGLE"));
-    glTexSubImage2DContextANGLE = reinterpret_cast<PFNGLTEXSUBIMAGE2DCONTEXTANGLEPROC>(
-        loadProc("glTexSubImage2DContextANGLE"));
-    glUniform1fContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM1FCONTEXTANGLEPROC>(loadProc("glUniform1fContextANGLE"));
-    glUniform1fvContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM1FVCONTEXTANGLEPROC>(loadProc("glUniform1fvContextANGLE"));
-    glUniform1iContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM1ICONTEXTANGLEPROC>(loadProc("glUniform1iContextANGLE"));
-    glUniform1ivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM1IVCONTEXTANGLEPROC>(loadProc("glUniform1ivContextANGLE"));
-    glUniform2fContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM2FCONTEXTANGLEPROC>(loadProc("glUniform2fContextANGLE"));
-    glUniform2fvContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM2FVCONTEXTANGLEPROC>(loadProc("glUniform2fvContextANGLE"));
-    glUniform2iContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM2ICONTEXTANGLEPROC>(loadProc("glUniform2iContextANGLE"));
-    glUniform2ivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM2IVCONTEXTANGLEPROC>(loadProc("glUniform2ivContextANGLE"));
-    glUniform3fContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM3FCONTEXTANGLEPROC>(loadProc("glUniform3fContextANGLE"));
-    glUniform3fvContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM3FVCONTEXTANGLEPROC>(loadProc("glUniform3fvContextANGLE"));
-    glUniform3iContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM3ICONTEXTANGLEPROC>(loadProc("glUniform3iContextANGLE"));
-    glUniform3ivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM3IVCONTEXTANGLEPROC>(loadProc("glUniform3ivContextANGLE"));
-    glUniform4fContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM4FCONTEXTANGLEPROC>(loadProc("glUniform4fContextANGLE"));
-    glUniform4fvContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM4FVCONTEXTANGLEPROC>(loadProc("glUniform4fvContextANGLE"));
-    glUniform4iContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM4ICONTEXTANGLEPROC>(loadProc("glUniform4iContextANGLE"));
-    glUniform4ivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM4IVCONTEXTANGLEPROC>(loadProc("glUniform4ivContextANGLE"));
-    glUniformMatrix2fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX2FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix2fvContextANGLE"));
-    glUniformMatrix3fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX3FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix3fvContextANGLE"));
-    glUniformMatrix4fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX4FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix4fvContextANGLE"));
-    glUseProgramContextANGLE =
-        reinterpret_cast<PFNGLUSEPROGRAMCONTEXTANGLEPROC>(loadProc("glUseProgramContextANGLE"));
-    glValidateProgramContextANGLE = reinterpret_cast<PFNGLVALIDATEPROGRAMCONTEXTANGLEPROC>(
-        loadProc("glValidateProgramContextANGLE"));
-    glVertexAttrib1fContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB1FCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib1fContextANGLE"));
-    glVertexAttrib1fvContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB1FVCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib1fvContextANGLE"));
-    glVertexAttrib2fContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB2FCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib2fContextANGLE"));
-    glVertexAttrib2fvContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB2FVCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib2fvContextANGLE"));
-    glVertexAttrib3fContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB3FCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib3fContextANGLE"));
-    glVertexAttrib3fvContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB3FVCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib3fvContextANGLE"));
-    glVertexAttrib4fContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB4FCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib4fContextANGLE"));
-    glVertexAttrib4fvContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIB4FVCONTEXTANGLEPROC>(
-        loadProc("glVertexAttrib4fvContextANGLE"));
-    glVertexAttribPointerContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBPOINTERCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribPointerContextANGLE"));
-    glViewportContextANGLE =
-        reinterpret_cast<PFNGLVIEWPORTCONTEXTANGLEPROC>(loadProc("glViewportContextANGLE"));
-    glReadBufferContextANGLE =
-        reinterpret_cast<PFNGLREADBUFFERCONTEXTANGLEPROC>(loadProc("glReadBufferContextANGLE"));
-    glDrawRangeElementsContextANGLE = reinterpret_cast<PFNGLDRAWRANGEELEMENTSCONTEXTANGLEPROC>(
-        loadProc("glDrawRangeElementsContextANGLE"));
-    glTexImage3DContextANGLE =
-        reinterpret_cast<PFNGLTEXIMAGE3DCONTEXTANGLEPROC>(loadProc("glTexImage3DContextANGLE"));
-    glTexSubImage3DContextANGLE = reinterpret_cast<PFNGLTEXSUBIMAGE3DCONTEXTANGLEPROC>(
-        loadProc("glTexSubImage3DContextANGLE"));
-    glCopyTexSubImage3DContextANGLE = reinterpret_cast<PFNGLCOPYTEXSUBIMAGE3DCONTEXTANGLEPROC>(
-        loadProc("glCopyTexSubImage3DContextANGLE"));
-    glCompressedTexImage3DContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE3DCONTEXTANGLEPROC>(
-            loadProc("glCompressedTexImage3DContextANGLE"));
-    glCompressedTexSubImage3DContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE3DCONTEXTANGLEPROC>(
-            loadProc("glCompressedTexSubImage3DContextANGLE"));
-    glGenQueriesContextANGLE =
-        reinterpret_cast<PFNGLGENQUERIESCONTEXTANGLEPROC>(loadProc("glGenQueriesContextANGLE"));
-    glDeleteQueriesContextANGLE = reinterpret_cast<PFNGLDELETEQUERIESCONTEXTANGLEPROC>(
-        loadProc("glDeleteQueriesContextANGLE"));
-    glIsQueryContextANGLE =
-        reinterpret_cast<PFNGLISQUERYCONTEXTANGLEPROC>(loadProc("glIsQueryContextANGLE"));
-    glBeginQueryContextANGLE =
-        reinterpret_cast<PFNGLBEGINQUERYCONTEXTANGLEPROC>(loadProc("glBeginQueryContextANGLE"));
-    glEndQueryContextANGLE =
-        reinterpret_cast<PFNGLENDQUERYCONTEXTANGLEPROC>(loadProc("glEndQueryContextANGLE"));
-    glGetQueryivContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYIVCONTEXTANGLEPROC>(loadProc("glGetQueryivContextANGLE"));
-    glGetQueryObjectuivContextANGLE = reinterpret_cast<PFNGLGETQUERYOBJECTUIVCONTEXTANGLEPROC>(
-        loadProc("glGetQueryObjectuivContextANGLE"));
-    glUnmapBufferContextANGLE =
-        reinterpret_cast<PFNGLUNMAPBUFFERCONTEXTANGLEPROC>(loadProc("glUnmapBufferContextANGLE"));
-    glGetBufferPointervContextANGLE = reinterpret_cast<PFNGLGETBUFFERPOINTERVCONTEXTANGLEPROC>(
-        loadProc("glGetBufferPointervContextANGLE"));
-    glDrawBuffersContextANGLE =
-        reinterpret_cast<PFNGLDRAWBUFFERSCONTEXTANGLEPROC>(loadProc("glDrawBuffersContextANGLE"));
-    glUniformMatrix2x3fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX2X3FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix2x3fvContextANGLE"));
-    glUniformMatrix3x2fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX3X2FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix3x2fvContextANGLE"));
-    glUniformMatrix2x4fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX2X4FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix2x4fvContextANGLE"));
-    glUniformMatrix4x2fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX4X2FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix4x2fvContextANGLE"));
-    glUniformMatrix3x4fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX3X4FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix3x4fvContextANGLE"));
-    glUniformMatrix4x3fvContextANGLE = reinterpret_cast<PFNGLUNIFORMMATRIX4X3FVCONTEXTANGLEPROC>(
-        loadProc("glUniformMatrix4x3fvContextANGLE"));
-    glBlitFramebufferContextANGLE = reinterpret_cast<PFNGLBLITFRAMEBUFFERCONTEXTANGLEPROC>(
-        loadProc("glBlitFramebufferContextANGLE"));
-    glRenderbufferStorageMultisampleContextANGLE =
-        reinterpret_cast<PFNGLRENDERBUFFERSTORAGEMULTISAMPLECONTEXTANGLEPROC>(
-            loadProc("glRenderbufferStorageMultisampleContextANGLE"));
-    glFramebufferTextureLayerContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTURELAYERCONTEXTANGLEPROC>(
-            loadProc("glFramebufferTextureLayerContextANGLE"));
-    glMapBufferRangeContextANGLE = reinterpret_cast<PFNGLMAPBUFFERRANGECONTEXTANGLEPROC>(
-        loadProc("glMapBufferRangeContextANGLE"));
-    glFlushMappedBufferRangeContextANGLE =
-        reinterpret_cast<PFNGLFLUSHMAPPEDBUFFERRANGECONTEXTANGLEPROC>(
-            loadProc("glFlushMappedBufferRangeContextANGLE"));
-    glBindVertexArrayContextANGLE = reinterpret_cast<PFNGLBINDVERTEXARRAYCONTEXTANGLEPROC>(
-        loadProc("glBindVertexArrayContextANGLE"));
-    glDeleteVertexArraysContextANGLE = reinterpret_cast<PFNGLDELETEVERTEXARRAYSCONTEXTANGLEPROC>(
-        loadProc("glDeleteVertexArraysContextANGLE"));
-    glGenVertexArraysContextANGLE = reinterpret_cast<PFNGLGENVERTEXARRAYSCONTEXTANGLEPROC>(
-        loadProc("glGenVertexArraysContextANGLE"));
-    glIsVertexArrayContextANGLE = reinterpret_cast<PFNGLISVERTEXARRAYCONTEXTANGLEPROC>(
-        loadProc("glIsVertexArrayContextANGLE"));
-    glGetIntegeri_vContextANGLE = reinterpret_cast<PFNGLGETINTEGERI_VCONTEXTANGLEPROC>(
-        loadProc("glGetIntegeri_vContextANGLE"));
-    glBeginTransformFeedbackContextANGLE =
-        reinterpret_cast<PFNGLBEGINTRANSFORMFEEDBACKCONTEXTANGLEPROC>(
-            loadProc("glBeginTransformFeedbackContextANGLE"));
-    glEndTransformFeedbackContextANGLE =
-        reinterpret_cast<PFNGLENDTRANSFORMFEEDBACKCONTEXTANGLEPROC>(
-            loadProc("glEndTransformFeedbackContextANGLE"));
-    glBindBufferRangeContextANGLE = reinterpret_cast<PFNGLBINDBUFFERRANGECONTEXTANGLEPROC>(
-        loadProc("glBindBufferRangeContextANGLE"));
-    glBindBufferBaseContextANGLE = reinterpret_cast<PFNGLBINDBUFFERBASECONTEXTANGLEPROC>(
-        loadProc("glBindBufferBaseContextANGLE"));
-    glTransformFeedbackVaryingsContextANGLE =
-        reinterpret_cast<PFNGLTRANSFORMFEEDBACKVARYINGSCONTEXTANGLEPROC>(
-            loadProc("glTransformFeedbackVaryingsContextANGLE"));
-    glGetTransformFeedbackVaryingContextANGLE =
-        reinterpret_cast<PFNGLGETTRANSFORMFEEDBACKVARYINGCONTEXTANGLEPROC>(
-            loadProc("glGetTransformFeedbackVaryingContextANGLE"));
-    glVertexAttribIPointerContextANGLE =
-        reinterpret_cast<PFNGLVERTEXATTRIBIPOINTERCONTEXTANGLEPROC>(
-            loadProc("glVertexAttribIPointerContextANGLE"));
-    glGetVertexAttribIivContextANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBIIVCONTEXTANGLEPROC>(
-        loadProc("glGetVertexAttribIivContextANGLE"));
-    glGetVertexAttribIuivContextANGLE = reinterpret_cast<PFNGLGETVERTEXATTRIBIUIVCONTEXTANGLEPROC>(
-        loadProc("glGetVertexAttribIuivContextANGLE"));
-    glVertexAttribI4iContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBI4ICONTEXTANGLEPROC>(
-        loadProc("glVertexAttribI4iContextANGLE"));
-    glVertexAttribI4uiContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBI4UICONTEXTANGLEPROC>(
-        loadProc("glVertexAttribI4uiContextANGLE"));
-    glVertexAttribI4ivContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBI4IVCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribI4ivContextANGLE"));
-    glVertexAttribI4uivContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBI4UIVCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribI4uivContextANGLE"));
-    glGetUniformuivContextANGLE = reinterpret_cast<PFNGLGETUNIFORMUIVCONTEXTANGLEPROC>(
-        loadProc("glGetUniformuivContextANGLE"));
-    glGetFragDataLocationContextANGLE = reinterpret_cast<PFNGLGETFRAGDATALOCATIONCONTEXTANGLEPROC>(
-        loadProc("glGetFragDataLocationContextANGLE"));
-    glUniform1uiContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM1UICONTEXTANGLEPROC>(loadProc("glUniform1uiContextANGLE"));
-    glUniform2uiContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM2UICONTEXTANGLEPROC>(loadProc("glUniform2uiContextANGLE"));
-    glUniform3uiContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM3UICONTEXTANGLEPROC>(loadProc("glUniform3uiContextANGLE"));
-    glUniform4uiContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM4UICONTEXTANGLEPROC>(loadProc("glUniform4uiContextANGLE"));
-    glUniform1uivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM1UIVCONTEXTANGLEPROC>(loadProc("glUniform1uivContextANGLE"));
-    glUniform2uivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM2UIVCONTEXTANGLEPROC>(loadProc("glUniform2uivContextANGLE"));
-    glUniform3uivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM3UIVCONTEXTANGLEPROC>(loadProc("glUniform3uivContextANGLE"));
-    glUniform4uivContextANGLE =
-        reinterpret_cast<PFNGLUNIFORM4UIVCONTEXTANGLEPROC>(loadProc("glUniform4uivContextANGLE"));
-    glClearBufferivContextANGLE = reinterpret_cast<PFNGLCLEARBUFFERIVCONTEXTANGLEPROC>(
-        loadProc("glClearBufferivContextANGLE"));
-    glClearBufferuivContextANGLE = reinterpret_cast<PFNGLCLEARBUFFERUIVCONTEXTANGLEPROC>(
-        loadProc("glClearBufferuivContextANGLE"));
-    glClearBufferfvContextANGLE = reinterpret_cast<PFNGLCLEARBUFFERFVCONTEXTANGLEPROC>(
-        loadProc("glClearBufferfvContextANGLE"));
-    glClearBufferfiContextANGLE = reinterpret_cast<PFNGLCLEARBUFFERFICONTEXTANGLEPROC>(
-        loadProc("glClearBufferfiContextANGLE"));
-    glGetStringiContextANGLE =
-        reinterpret_cast<PFNGLGETSTRINGICONTEXTANGLEPROC>(loadProc("glGetStringiContextANGLE"));
-    glCopyBufferSubDataContextANGLE = reinterpret_cast<PFNGLCOPYBUFFERSUBDATACONTEXTANGLEPROC>(
-        loadProc("glCopyBufferSubDataContextANGLE"));
-    glGetUniformIndicesContextANGLE = reinterpret_cast<PFNGLGETUNIFORMINDICESCONTEXTANGLEPROC>(
-        loadProc("glGetUniformIndicesContextANGLE"));
-    glGetActiveUniformsivContextANGLE = reinterpret_cast<PFNGLGETACTIVEUNIFORMSIVCONTEXTANGLEPROC>(
-        loadProc("glGetActiveUniformsivContextANGLE"));
-    glGetUniformBlockIndexContextANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMBLOCKINDEXCONTEXTANGLEPROC>(
-            loadProc("glGetUniformBlockIndexContextANGLE"));
-    glGetActiveUniformBlockivContextANGLE =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMBLOCKIVCONTEXTANGLEPROC>(
-            loadProc("glGetActiveUniformBlockivContextANGLE"));
-    glGetActiveUniformBlockNameContextANGLE =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMBLOCKNAMECONTEXTANGLEPROC>(
-            loadProc("glGetActiveUniformBlockNameContextANGLE"));
-    glUniformBlockBindingContextANGLE = reinterpret_cast<PFNGLUNIFORMBLOCKBINDINGCONTEXTANGLEPROC>(
-        loadProc("glUniformBlockBindingContextANGLE"));
-    glDrawArraysInstancedContextANGLE = reinterpret_cast<PFNGLDRAWARRAYSINSTANCEDCONTEXTANGLEPROC>(
-        loadProc("glDrawArraysInstancedContextANGLE"));
-    glDrawElementsInstancedContextANGLE =
-        reinterpret_cast<PFNGLDRAWELEMENTSINSTANCEDCONTEXTANGLEPROC>(
-            loadProc("glDrawElementsInstancedContextANGLE"));
-    glFenceSyncContextANGLE =
-        reinterpret_cast<PFNGLFENCESYNCCONTEXTANGLEPROC>(loadProc("glFenceSyncContextANGLE"));
-    glIsSyncContextANGLE =
-        reinterpret_cast<PFNGLISSYNCCONTEXTANGLEPROC>(loadProc("glIsSyncContextANGLE"));
-    glDeleteSyncContextANGLE =
-        reinterpret_cast<PFNGLDELETESYNCCONTEXTANGLEPROC>(loadProc("glDeleteSyncContextANGLE"));
-    glClientWaitSyncContextANGLE = reinterpret_cast<PFNGLCLIENTWAITSYNCCONTEXTANGLEPROC>(
-        loadProc("glClientWaitSyncContextANGLE"));
-    glWaitSyncContextANGLE =
-        reinterpret_cast<PFNGLWAITSYNCCONTEXTANGLEPROC>(loadProc("glWaitSyncContextANGLE"));
-    glGetInteger64vContextANGLE = reinterpret_cast<PFNGLGETINTEGER64VCONTEXTANGLEPROC>(
-        loadProc("glGetInteger64vContextANGLE"));
-    glGetSyncivContextANGLE =
-        reinterpret_cast<PFNGLGETSYNCIVCONTEXTANGLEPROC>(loadProc("glGetSyncivContextANGLE"));
-    glGetInteger64i_vContextANGLE = reinterpret_cast<PFNGLGETINTEGER64I_VCONTEXTANGLEPROC>(
-        loadProc("glGetInteger64i_vContextANGLE"));
-    glGetBufferParameteri64vContextANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERI64VCONTEXTANGLEPROC>(
-            loadProc("glGetBufferParameteri64vContextANGLE"));
-    glGenSamplersContextANGLE =
-        reinterpret_cast<PFNGLGENSAMPLERSCONTEXTANGLEPROC>(loadProc("glGenSamplersContextANGLE"));
-    glDeleteSamplersContextANGLE = reinterpret_cast<PFNGLDELETESAMPLERSCONTEXTANGLEPROC>(
-        loadProc("glDeleteSamplersContextANGLE"));
-    glIsSamplerContextANGLE =
-        reinterpret_cast<PFNGLISSAMPLERCONTEXTANGLEPROC>(loadProc("glIsSamplerContextANGLE"));
-    glBindSamplerContextANGLE =
-        reinterpret_cast<PFNGLBINDSAMPLERCONTEXTANGLEPROC>(loadProc("glBindSamplerContextANGLE"));
-    glSamplerParameteriContextANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERICONTEXTANGLEPROC>(
-        loadProc("glSamplerParameteriContextANGLE"));
-    glSamplerParameterivContextANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERIVCONTEXTANGLEPROC>(
-        loadProc("glSamplerParameterivContextANGLE"));
-    glSamplerParameterfContextANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERFCONTEXTANGLEPROC>(
-        loadProc("glSamplerParameterfContextANGLE"));
-    glSamplerParameterfvContextANGLE = reinterpret_cast<PFNGLSAMPLERPARAMETERFVCONTEXTANGLEPROC>(
-        loadProc("glSamplerParameterfvContextANGLE"));
-    glGetSamplerParameterivContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIVCONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterivContextANGLE"));
-    glGetSamplerParameterfvContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERFVCONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterfvContextANGLE"));
-    glVertexAttribDivisorContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBDIVISORCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribDivisorContextANGLE"));
-    glBindTransformFeedbackContextANGLE =
-        reinterpret_cast<PFNGLBINDTRANSFORMFEEDBACKCONTEXTANGLEPROC>(
-            loadProc("glBindTransformFeedbackContextANGLE"));
-    glDeleteTransformFeedbacksContextANGLE =
-        reinterpret_cast<PFNGLDELETETRANSFORMFEEDBACKSCONTEXTANGLEPROC>(
-            loadProc("glDeleteTransformFeedbacksContextANGLE"));
-    glGenTransformFeedbacksContextANGLE =
-        reinterpret_cast<PFNGLGENTRANSFORMFEEDBACKSCONTEXTANGLEPROC>(
-            loadProc("glGenTransformFeedbacksContextANGLE"));
-    glIsTransformFeedbackContextANGLE = reinterpret_cast<PFNGLISTRANSFORMFEEDBACKCONTEXTANGLEPROC>(
-        loadProc("glIsTransformFeedbackContextANGLE"));
-    glPauseTransformFeedbackContextANGLE =
-        reinterpret_cast<PFNGLPAUSETRANSFORMFEEDBACKCONTEXTANGLEPROC>(
-            loadProc("glPauseTransformFeedbackContextANGLE"));
-    glResumeTransformFeedbackContextANGLE =
-        reinterpret_cast<PFNGLRESUMETRANSFORMFEEDBACKCONTEXTANGLEPROC>(
-            loadProc("glResumeTransformFeedbackContextANGLE"));
-    glGetProgramBinaryContextANGLE = reinterpret_cast<PFNGLGETPROGRAMBINARYCONTEXTANGLEPROC>(
-        loadProc("glGetProgramBinaryContextANGLE"));
-    glProgramBinaryContextANGLE = reinterpret_cast<PFNGLPROGRAMBINARYCONTEXTANGLEPROC>(
-        loadProc("glProgramBinaryContextANGLE"));
-    glProgramParameteriContextANGLE = reinterpret_cast<PFNGLPROGRAMPARAMETERICONTEXTANGLEPROC>(
-        loadProc("glProgramParameteriContextANGLE"));
-    glInvalidateFramebufferContextANGLE =
-        reinterpret_cast<PFNGLINVALIDATEFRAMEBUFFERCONTEXTANGLEPROC>(
-            loadProc("glInvalidateFramebufferContextANGLE"));
-    glInvalidateSubFramebufferContextANGLE =
-        reinterpret_cast<PFNGLINVALIDATESUBFRAMEBUFFERCONTEXTANGLEPROC>(
-            loadProc("glInvalidateSubFramebufferContextANGLE"));
-    glTexStorage2DContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGE2DCONTEXTANGLEPROC>(loadProc("glTexStorage2DContextANGLE"));
-    glTexStorage3DContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGE3DCONTEXTANGLEPROC>(loadProc("glTexStorage3DContextANGLE"));
-    glGetInternalformativContextANGLE = reinterpret_cast<PFNGLGETINTERNALFORMATIVCONTEXTANGLEPROC>(
-        loadProc("glGetInternalformativContextANGLE"));
-    glDispatchComputeContextANGLE = reinterpret_cast<PFNGLDISPATCHCOMPUTECONTEXTANGLEPROC>(
-        loadProc("glDispatchComputeContextANGLE"));
-    glDispatchComputeIndirectContextANGLE =
-        reinterpret_cast<PFNGLDISPATCHCOMPUTEINDIRECTCONTEXTANGLEPROC>(
-            loadProc("glDispatchComputeIndirectContextANGLE"));
-    glDrawArraysIndirectContextANGLE = reinterpret_cast<PFNGLDRAWARRAYSINDIRECTCONTEXTANGLEPROC>(
-        loadProc("glDrawArraysIndirectContextANGLE"));
-    glDrawElementsIndirectContextANGLE =
-        reinterpret_cast<PFNGLDRAWELEMENTSINDIRECTCONTEXTANGLEPROC>(
-            loadProc("glDrawElementsIndirectContextANGLE"));
-    glFramebufferParameteriContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERPARAMETERICONTEXTANGLEPROC>(
-            loadProc("glFramebufferParameteriContextANGLE"));
-    glGetFramebufferParameterivContextANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERPARAMETERIVCONTEXTANGLEPROC>(
-            loadProc("glGetFramebufferParameterivContextANGLE"));
-    glGetProgramInterfaceivContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMINTERFACEIVCONTEXTANGLEPROC>(
-            loadProc("glGetProgramInterfaceivContextANGLE"));
-    glGetProgramResourceIndexContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCEINDEXCONTEXTANGLEPROC>(
-            loadProc("glGetProgramResourceIndexContextANGLE"));
-    glGetProgramResourceNameContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCENAMECONTEXTANGLEPROC>(
-            loadProc("glGetProgramResourceNameContextANGLE"));
-    glGetProgramResourceivContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCEIVCONTEXTANGLEPROC>(
-            loadProc("glGetProgramResourceivContextANGLE"));
-    glGetProgramResourceLocationContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCELOCATIONCONTEXTANGLEPROC>(
-            loadProc("glGetProgramResourceLocationContextANGLE"));
-    glUseProgramStagesContextANGLE = reinterpret_cast<PFNGLUSEPROGRAMSTAGESCONTEXTANGLEPROC>(
-        loadProc("glUseProgramStagesContextANGLE"));
-    glActiveShaderProgramContextANGLE = reinterpret_cast<PFNGLACTIVESHADERPROGRAMCONTEXTANGLEPROC>(
-        loadProc("glActiveShaderProgramContextANGLE"));
-    glCreateShaderProgramvContextANGLE =
-        reinterpret_cast<PFNGLCREATESHADERPROGRAMVCONTEXTANGLEPROC>(
-            loadProc("glCreateShaderProgramvContextANGLE"));
-    glBindProgramPipelineContextANGLE = reinterpret_cast<PFNGLBINDPROGRAMPIPELINECONTEXTANGLEPROC>(
-        loadProc("glBindProgramPipelineContextANGLE"));
-    glDeleteProgramPipelinesContextANGLE =
-        reinterpret_cast<PFNGLDELETEPROGRAMPIPELINESCONTEXTANGLEPROC>(
-            loadProc("glDeleteProgramPipelinesContextANGLE"));
-    glGenProgramPipelinesContextANGLE = reinterpret_cast<PFNGLGENPROGRAMPIPELINESCONTEXTANGLEPROC>(
-        loadProc("glGenProgramPipelinesContextANGLE"));
-    glIsProgramPipelineContextANGLE = reinterpret_cast<PFNGLISPROGRAMPIPELINECONTEXTANGLEPROC>(
-        loadProc("glIsProgramPipelineContextANGLE"));
-    glGetProgramPipelineivContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMPIPELINEIVCONTEXTANGLEPROC>(
-            loadProc("glGetProgramPipelineivContextANGLE"));
-    glProgramUniform1iContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM1ICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform1iContextANGLE"));
-    glProgramUniform2iContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM2ICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform2iContextANGLE"));
-    glProgramUniform3iContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM3ICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform3iContextANGLE"));
-    glProgramUniform4iContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM4ICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform4iContextANGLE"));
-    glProgramUniform1uiContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM1UICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform1uiContextANGLE"));
-    glProgramUniform2uiContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM2UICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform2uiContextANGLE"));
-    glProgramUniform3uiContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM3UICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform3uiContextANGLE"));
-    glProgramUniform4uiContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM4UICONTEXTANGLEPROC>(
-        loadProc("glProgramUniform4uiContextANGLE"));
-    glProgramUniform1fContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM1FCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform1fContextANGLE"));
-    glProgramUniform2fContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM2FCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform2fContextANGLE"));
-    glProgramUniform3fContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM3FCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform3fContextANGLE"));
-    glProgramUniform4fContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM4FCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform4fContextANGLE"));
-    glProgramUniform1ivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM1IVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform1ivContextANGLE"));
-    glProgramUniform2ivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM2IVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform2ivContextANGLE"));
-    glProgramUniform3ivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM3IVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform3ivContextANGLE"));
-    glProgramUniform4ivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM4IVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform4ivContextANGLE"));
-    glProgramUniform1uivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM1UIVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform1uivContextANGLE"));
-    glProgramUniform2uivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM2UIVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform2uivContextANGLE"));
-    glProgramUniform3uivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM3UIVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform3uivContextANGLE"));
-    glProgramUniform4uivContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM4UIVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform4uivContextANGLE"));
-    glProgramUniform1fvContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM1FVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform1fvContextANGLE"));
-    glProgramUniform2fvContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM2FVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform2fvContextANGLE"));
-    glProgramUniform3fvContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM3FVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform3fvContextANGLE"));
-    glProgramUniform4fvContextANGLE = reinterpret_cast<PFNGLPROGRAMUNIFORM4FVCONTEXTANGLEPROC>(
-        loadProc("glProgramUniform4fvContextANGLE"));
-    glProgramUniformMatrix2fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX2FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix2fvContextANGLE"));
-    glProgramUniformMatrix3fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX3FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix3fvContextANGLE"));
-    glProgramUniformMatrix4fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX4FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix4fvContextANGLE"));
-    glProgramUniformMatrix2x3fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX2X3FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix2x3fvContextANGLE"));
-    glProgramUniformMatrix3x2fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX3X2FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix3x2fvContextANGLE"));
-    glProgramUniformMatrix2x4fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX2X4FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix2x4fvContextANGLE"));
-    glProgramUniformMatrix4x2fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX4X2FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix4x2fvContextANGLE"));
-    glProgramUniformMatrix3x4fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX3X4FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix3x4fvContextANGLE"));
-    glProgramUniformMatrix4x3fvContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMUNIFORMMATRIX4X3FVCONTEXTANGLEPROC>(
-            loadProc("glProgramUniformMatrix4x3fvContextANGLE"));
-    glValidateProgramPipelineContextANGLE =
-        reinterpret_cast<PFNGLVALIDATEPROGRAMPIPELINECONTEXTANGLEPROC>(
-            loadProc("glValidateProgramPipelineContextANGLE"));
-    glGetProgramPipelineInfoLogContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMPIPELINEINFOLOGCONTEXTANGLEPROC>(
-            loadProc("glGetProgramPipelineInfoLogContextANGLE"));
-    glBindImageTextureContextANGLE = reinterpret_cast<PFNGLBINDIMAGETEXTURECONTEXTANGLEPROC>(
-        loadProc("glBindImageTextureContextANGLE"));
-    glGetBooleani_vContextANGLE = reinterpret_cast<PFNGLGETBOOLEANI_VCONTEXTANGLEPROC>(
-        loadProc("glGetBooleani_vContextANGLE"));
-    glMemoryBarrierContextANGLE = reinterpret_cast<PFNGLMEMORYBARRIERCONTEXTANGLEPROC>(
-        loadProc("glMemoryBarrierContextANGLE"));
-    glMemoryBarrierByRegionContextANGLE =
-        reinterpret_cast<PFNGLMEMORYBARRIERBYREGIONCONTEXTANGLEPROC>(
-            loadProc("glMemoryBarrierByRegionContextANGLE"));
-    glTexStorage2DMultisampleContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGE2DMULTISAMPLECONTEXTANGLEPROC>(
-            loadProc("glTexStorage2DMultisampleContextANGLE"));
-    glGetMultisamplefvContextANGLE = reinterpret_cast<PFNGLGETMULTISAMPLEFVCONTEXTANGLEPROC>(
-        loadProc("glGetMultisamplefvContextANGLE"));
-    glSampleMaskiContextANGLE =
-        reinterpret_cast<PFNGLSAMPLEMASKICONTEXTANGLEPROC>(loadProc("glSampleMaskiContextANGLE"));
-    glGetTexLevelParameterivContextANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERIVCONTEXTANGLEPROC>(
-            loadProc("glGetTexLevelParameterivContextANGLE"));
-    glGetTexLevelParameterfvContextANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERFVCONTEXTANGLEPROC>(
-            loadProc("glGetTexLevelParameterfvContextANGLE"));
-    glBindVertexBufferContextANGLE = reinterpret_cast<PFNGLBINDVERTEXBUFFERCONTEXTANGLEPROC>(
-        loadProc("glBindVertexBufferContextANGLE"));
-    glVertexAttribFormatContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBFORMATCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribFormatContextANGLE"));
-    glVertexAttribIFormatContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBIFORMATCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribIFormatContextANGLE"));
-    glVertexAttribBindingContextANGLE = reinterpret_cast<PFNGLVERTEXATTRIBBINDINGCONTEXTANGLEPROC>(
-        loadProc("glVertexAttribBindingContextANGLE"));
-    glVertexBindingDivisorContextANGLE =
-        reinterpret_cast<PFNGLVERTEXBINDINGDIVISORCONTEXTANGLEPROC>(
-            loadProc("glVertexBindingDivisorContextANGLE"));
-    glCopySubTexture3DANGLEContextANGLE =
-        reinterpret_cast<PFNGLCOPYSUBTEXTURE3DANGLECONTEXTANGLEPROC>(
-            loadProc("glCopySubTexture3DANGLEContextANGLE"));
-    glCopyTexture3DANGLEContextANGLE = reinterpret_cast<PFNGLCOPYTEXTURE3DANGLECONTEXTANGLEPROC>(
-        loadProc("glCopyTexture3DANGLEContextANGLE"));
-    glBlitFramebufferANGLEContextANGLE =
-        reinterpret_cast<PFNGLBLITFRAMEBUFFERANGLECONTEXTANGLEPROC>(
-            loadProc("glBlitFramebufferANGLEContextANGLE"));
-    glRenderbufferStorageMultisampleANGLEContextANGLE =
-        reinterpret_cast<PFNGLRENDERBUFFERSTORAGEMULTISAMPLEANGLECONTEXTANGLEPROC>(
-            loadProc("glRenderbufferStorageMultisampleANGLEContextANGLE"));
-    glDrawArraysInstancedANGLEContextANGLE =
-        reinterpret_cast<PFNGLDRAWARRAYSINSTANCEDANGLECONTEXTANGLEPROC>(
-            loadProc("glDrawArraysInstancedANGLEContextANGLE"));
-    glDrawElementsInstancedANGLEContextANGLE =
-        reinterpret_cast<PFNGLDRAWELEMENTSINSTANCEDANGLECONTEXTANGLEPROC>(
-            loadProc("glDrawElementsInstancedANGLEContextANGLE"));
-    glVertexAttribDivisorANGLEContextANGLE =
-        reinterpret_cast<PFNGLVERTEXATTRIBDIVISORANGLECONTEXTANGLEPROC>(
-            loadProc("glVertexAttribDivisorANGLEContextANGLE"));
-    glMultiDrawArraysANGLEContextANGLE =
-        reinterpret_cast<PFNGLMULTIDRAWARRAYSANGLECONTEXTANGLEPROC>(
-            loadProc("glMultiDrawArraysANGLEContextANGLE"));
-    glMultiDrawArraysInstancedANGLEContextANGLE =
-        reinterpret_cast<PFNGLMULTIDRAWARRAYSINSTANCEDANGLECONTEXTANGLEPROC>(
-            loadProc("glMultiDrawArraysInstancedANGLEContextANGLE"));
-    glMultiDrawElementsANGLEContextANGLE =
-        reinterpret_cast<PFNGLMULTIDRAWELEMENTSANGLECONTEXTANGLEPROC>(
-            loadProc("glMultiDrawElementsANGLEContextANGLE"));
-    glMultiDrawElementsInstancedANGLEContextANGLE =
-        reinterpret_cast<PFNGLMULTIDRAWELEMENTSINSTANCEDANGLECONTEXTANGLEPROC>(
-            loadProc("glMultiDrawElementsInstancedANGLEContextANGLE"));
-    glProvokingVertexANGLEContextANGLE =
-        reinterpret_cast<PFNGLPROVOKINGVERTEXANGLECONTEXTANGLEPROC>(
-            loadProc("glProvokingVertexANGLEContextANGLE"));
-    glRequestExtensionANGLEContextANGLE =
-        reinterpret_cast<PFNGLREQUESTEXTENSIONANGLECONTEXTANGLEPROC>(
-            loadProc("glRequestExtensionANGLEContextANGLE"));
-    glCompressedTexImage2DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE2DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glCompressedTexImage2DRobustANGLEContextANGLE"));
-    glCompressedTexImage3DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXIMAGE3DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glCompressedTexImage3DRobustANGLEContextANGLE"));
-    glCompressedTexSubImage2DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE2DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glCompressedTexSubImage2DRobustANGLEContextANGLE"));
-    glCompressedTexSubImage3DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDTEXSUBIMAGE3DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glCompressedTexSubImage3DRobustANGLEContextANGLE"));
-    glGetActiveUniformBlockivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETACTIVEUNIFORMBLOCKIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetActiveUniformBlockivRobustANGLEContextANGLE"));
-    glGetBooleani_vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETBOOLEANI_VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetBooleani_vRobustANGLEContextANGLE"));
-    glGetBooleanvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETBOOLEANVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetBooleanvRobustANGLEContextANGLE"));
-    glGetBufferParameteri64vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERI64VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetBufferParameteri64vRobustANGLEContextANGLE"));
-    glGetBufferParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetBufferParameterivRobustANGLEContextANGLE"));
-    glGetBufferPointervRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPOINTERVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetBufferPointervRobustANGLEContextANGLE"));
-    glGetFloatvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETFLOATVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetFloatvRobustANGLEContextANGLE"));
-    glGetFramebufferAttachmentParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetFramebufferAttachmentParameterivRobustANGLEContextANGLE"));
-    glGetFramebufferParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetFramebufferParameterivRobustANGLEContextANGLE"));
-    glGetInteger64i_vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETINTEGER64I_VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetInteger64i_vRobustANGLEContextANGLE"));
-    glGetInteger64vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETINTEGER64VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetInteger64vRobustANGLEContextANGLE"));
-    glGetIntegeri_vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETINTEGERI_VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetIntegeri_vRobustANGLEContextANGLE"));
-    glGetIntegervRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETINTEGERVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetIntegervRobustANGLEContextANGLE"));
-    glGetInternalformativRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETINTERNALFORMATIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetInternalformativRobustANGLEContextANGLE"));
-    glGetMultisamplefvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETMULTISAMPLEFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetMultisamplefvRobustANGLEContextANGLE"));
-    glGetPointervRobustANGLERobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETPOINTERVROBUSTANGLEROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetPointervRobustANGLERobustANGLEContextANGLE"));
-    glGetProgramInterfaceivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMINTERFACEIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetProgramInterfaceivRobustANGLEContextANGLE"));
-    glGetProgramivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetProgramivRobustANGLEContextANGLE"));
-    glGetQueryObjecti64vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTI64VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjecti64vRobustANGLEContextANGLE"));
-    glGetQueryObjectivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjectivRobustANGLEContextANGLE"));
-    glGetQueryObjectui64vRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUI64VROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjectui64vRobustANGLEContextANGLE"));
-    glGetQueryObjectuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjectuivRobustANGLEContextANGLE"));
-    glGetQueryivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetQueryivRobustANGLEContextANGLE"));
-    glGetRenderbufferParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETRENDERBUFFERPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetRenderbufferParameterivRobustANGLEContextANGLE"));
-    glGetSamplerParameterIivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterIivRobustANGLEContextANGLE"));
-    glGetSamplerParameterIuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterIuivRobustANGLEContextANGLE"));
-    glGetSamplerParameterfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterfvRobustANGLEContextANGLE"));
-    glGetSamplerParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterivRobustANGLEContextANGLE"));
-    glGetShaderivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETSHADERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetShaderivRobustANGLEContextANGLE"));
-    glGetTexLevelParameterfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexLevelParameterfvRobustANGLEContextANGLE"));
-    glGetTexLevelParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexLevelParameterivRobustANGLEContextANGLE"));
-    glGetTexParameterIivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexParameterIivRobustANGLEContextANGLE"));
-    glGetTexParameterIuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexParameterIuivRobustANGLEContextANGLE"));
-    glGetTexParameterfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXPARAMETERFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexParameterfvRobustANGLEContextANGLE"));
-    glGetTexParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexParameterivRobustANGLEContextANGLE"));
-    glGetUniformfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetUniformfvRobustANGLEContextANGLE"));
-    glGetUniformivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetUniformivRobustANGLEContextANGLE"));
-    glGetUniformuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETUNIFORMUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetUniformuivRobustANGLEContextANGLE"));
-    glGetVertexAttribIivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBIIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetVertexAttribIivRobustANGLEContextANGLE"));
-    glGetVertexAttribIuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBIUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetVertexAttribIuivRobustANGLEContextANGLE"));
-    glGetVertexAttribPointervRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBPOINTERVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetVertexAttribPointervRobustANGLEContextANGLE"));
-    glGetVertexAttribfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetVertexAttribfvRobustANGLEContextANGLE"));
-    glGetVertexAttribivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETVERTEXATTRIBIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetVertexAttribivRobustANGLEContextANGLE"));
-    glGetnUniformfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETNUNIFORMFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetnUniformfvRobustANGLEContextANGLE"));
-    glGetnUniformivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETNUNIFORMIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetnUniformivRobustANGLEContextANGLE"));
-    glGetnUniformuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETNUNIFORMUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glGetnUniformuivRobustANGLEContextANGLE"));
-    glReadPixelsRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLREADPIXELSROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glReadPixelsRobustANGLEContextANGLE"));
-    glReadnPixelsRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLREADNPIXELSROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glReadnPixelsRobustANGLEContextANGLE"));
-    glSamplerParameterIivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glSamplerParameterIivRobustANGLEContextANGLE"));
-    glSamplerParameterIuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glSamplerParameterIuivRobustANGLEContextANGLE"));
-    glSamplerParameterfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glSamplerParameterfvRobustANGLEContextANGLE"));
-    glSamplerParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glSamplerParameterivRobustANGLEContextANGLE"));
-    glTexImage2DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXIMAGE2DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexImage2DRobustANGLEContextANGLE"));
-    glTexImage3DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXIMAGE3DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexImage3DRobustANGLEContextANGLE"));
-    glTexParameterIivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXPARAMETERIIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexParameterIivRobustANGLEContextANGLE"));
-    glTexParameterIuivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXPARAMETERIUIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexParameterIuivRobustANGLEContextANGLE"));
-    glTexParameterfvRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXPARAMETERFVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexParameterfvRobustANGLEContextANGLE"));
-    glTexParameterivRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXPARAMETERIVROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexParameterivRobustANGLEContextANGLE"));
-    glTexSubImage2DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXSUBIMAGE2DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexSubImage2DRobustANGLEContextANGLE"));
-    glTexSubImage3DRobustANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXSUBIMAGE3DROBUSTANGLECONTEXTANGLEPROC>(
-            loadProc("glTexSubImage3DRobustANGLEContextANGLE"));
-    glGetMultisamplefvANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETMULTISAMPLEFVANGLECONTEXTANGLEPROC>(
-            loadProc("glGetMultisamplefvANGLEContextANGLE"));
-    glGetTexLevelParameterfvANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERFVANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexLevelParameterfvANGLEContextANGLE"));
-    glGetTexLevelParameterivANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTEXLEVELPARAMETERIVANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTexLevelParameterivANGLEContextANGLE"));
-    glSampleMaskiANGLEContextANGLE = reinterpret_cast<PFNGLSAMPLEMASKIANGLECONTEXTANGLEPROC>(
-        loadProc("glSampleMaskiANGLEContextANGLE"));
-    glTexStorage2DMultisampleANGLEContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGE2DMULTISAMPLEANGLECONTEXTANGLEPROC>(
-            loadProc("glTexStorage2DMultisampleANGLEContextANGLE"));
-    glGetTranslatedShaderSourceANGLEContextANGLE =
-        reinterpret_cast<PFNGLGETTRANSLATEDSHADERSOURCEANGLECONTEXTANGLEPROC>(
-            loadProc("glGetTranslatedShaderSourceANGLEContextANGLE"));
-    glBindUniformLocationCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLBINDUNIFORMLOCATIONCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glBindUniformLocationCHROMIUMContextANGLE"));
-    glCompressedCopyTextureCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOMPRESSEDCOPYTEXTURECHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCompressedCopyTextureCHROMIUMContextANGLE"));
-    glCopySubTextureCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOPYSUBTEXTURECHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCopySubTextureCHROMIUMContextANGLE"));
-    glCopyTextureCHROMIUMContextANGLE = reinterpret_cast<PFNGLCOPYTEXTURECHROMIUMCONTEXTANGLEPROC>(
-        loadProc("glCopyTextureCHROMIUMContextANGLE"));
-    glCoverageModulationCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOVERAGEMODULATIONCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCoverageModulationCHROMIUMContextANGLE"));
-    glMatrixLoadIdentityCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLMATRIXLOADIDENTITYCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glMatrixLoadIdentityCHROMIUMContextANGLE"));
-    glMatrixLoadfCHROMIUMContextANGLE = reinterpret_cast<PFNGLMATRIXLOADFCHROMIUMCONTEXTANGLEPROC>(
-        loadProc("glMatrixLoadfCHROMIUMContextANGLE"));
-    glLoseContextCHROMIUMContextANGLE = reinterpret_cast<PFNGLLOSECONTEXTCHROMIUMCONTEXTANGLEPROC>(
-        loadProc("glLoseContextCHROMIUMContextANGLE"));
-    glBindFragmentInputLocationCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLBINDFRAGMENTINPUTLOCATIONCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glBindFragmentInputLocationCHROMIUMContextANGLE"));
-    glCoverFillPathCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOVERFILLPATHCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCoverFillPathCHROMIUMContextANGLE"));
-    glCoverFillPathInstancedCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOVERFILLPATHINSTANCEDCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCoverFillPathInstancedCHROMIUMContextANGLE"));
-    glCoverStrokePathCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOVERSTROKEPATHCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCoverStrokePathCHROMIUMContextANGLE"));
-    glCoverStrokePathInstancedCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLCOVERSTROKEPATHINSTANCEDCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glCoverStrokePathInstancedCHROMIUMContextANGLE"));
-    glDeletePathsCHROMIUMContextANGLE = reinterpret_cast<PFNGLDELETEPATHSCHROMIUMCONTEXTANGLEPROC>(
-        loadProc("glDeletePathsCHROMIUMContextANGLE"));
-    glGenPathsCHROMIUMContextANGLE = reinterpret_cast<PFNGLGENPATHSCHROMIUMCONTEXTANGLEPROC>(
-        loadProc("glGenPathsCHROMIUMContextANGLE"));
-    glGetPathParameterfvCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLGETPATHPARAMETERFVCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glGetPathParameterfvCHROMIUMContextANGLE"));
-    glGetPathParameterivCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLGETPATHPARAMETERIVCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glGetPathParameterivCHROMIUMContextANGLE"));
-    glIsPathCHROMIUMContextANGLE = reinterpret_cast<PFNGLISPATHCHROMIUMCONTEXTANGLEPROC>(
-        loadProc("glIsPathCHROMIUMContextANGLE"));
-    glPathCommandsCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLPATHCOMMANDSCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glPathCommandsCHROMIUMContextANGLE"));
-    glPathParameterfCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLPATHPARAMETERFCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glPathParameterfCHROMIUMContextANGLE"));
-    glPathParameteriCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLPATHPARAMETERICHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glPathParameteriCHROMIUMContextANGLE"));
-    glPathStencilFuncCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLPATHSTENCILFUNCCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glPathStencilFuncCHROMIUMContextANGLE"));
-    glProgramPathFragmentInputGenCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLPROGRAMPATHFRAGMENTINPUTGENCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glProgramPathFragmentInputGenCHROMIUMContextANGLE"));
-    glStencilFillPathCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILFILLPATHCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilFillPathCHROMIUMContextANGLE"));
-    glStencilFillPathInstancedCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILFILLPATHINSTANCEDCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilFillPathInstancedCHROMIUMContextANGLE"));
-    glStencilStrokePathCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILSTROKEPATHCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilStrokePathCHROMIUMContextANGLE"));
-    glStencilStrokePathInstancedCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILSTROKEPATHINSTANCEDCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilStrokePathInstancedCHROMIUMContextANGLE"));
-    glStencilThenCoverFillPathCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERFILLPATHCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilThenCoverFillPathCHROMIUMContextANGLE"));
-    glStencilThenCoverFillPathInstancedCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERFILLPATHINSTANCEDCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilThenCoverFillPathInstancedCHROMIUMContextANGLE"));
-    glStencilThenCoverStrokePathCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERSTROKEPATHCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilThenCoverStrokePathCHROMIUMContextANGLE"));
-    glStencilThenCoverStrokePathInstancedCHROMIUMContextANGLE =
-        reinterpret_cast<PFNGLSTENCILTHENCOVERSTROKEPATHINSTANCEDCHROMIUMCONTEXTANGLEPROC>(
-            loadProc("glStencilThenCoverStrokePathInstancedCHROMIUMContextANGLE"));
-    glBindFragDataLocationEXTContextANGLE =
-        reinterpret_cast<PFNGLBINDFRAGDATALOCATIONEXTCONTEXTANGLEPROC>(
-            loadProc("glBindFragDataLocationEXTContextANGLE"));
-    glBindFragDataLocationIndexedEXTContextANGLE =
-        reinterpret_cast<PFNGLBINDFRAGDATALOCATIONINDEXEDEXTCONTEXTANGLEPROC>(
-            loadProc("glBindFragDataLocationIndexedEXTContextANGLE"));
-    glGetFragDataIndexEXTContextANGLE = reinterpret_cast<PFNGLGETFRAGDATAINDEXEXTCONTEXTANGLEPROC>(
-        loadProc("glGetFragDataIndexEXTContextANGLE"));
-    glGetProgramResourceLocationIndexEXTContextANGLE =
-        reinterpret_cast<PFNGLGETPROGRAMRESOURCELOCATIONINDEXEXTCONTEXTANGLEPROC>(
-            loadProc("glGetProgramResourceLocationIndexEXTContextANGLE"));
-    glInsertEventMarkerEXTContextANGLE =
-        reinterpret_cast<PFNGLINSERTEVENTMARKEREXTCONTEXTANGLEPROC>(
-            loadProc("glInsertEventMarkerEXTContextANGLE"));
-    glPopGroupMarkerEXTContextANGLE = reinterpret_cast<PFNGLPOPGROUPMARKEREXTCONTEXTANGLEPROC>(
-        loadProc("glPopGroupMarkerEXTContextANGLE"));
-    glPushGroupMarkerEXTContextANGLE = reinterpret_cast<PFNGLPUSHGROUPMARKEREXTCONTEXTANGLEPROC>(
-        loadProc("glPushGroupMarkerEXTContextANGLE"));
-    glDiscardFramebufferEXTContextANGLE =
-        reinterpret_cast<PFNGLDISCARDFRAMEBUFFEREXTCONTEXTANGLEPROC>(
-            loadProc("glDiscardFramebufferEXTContextANGLE"));
-    glBeginQueryEXTContextANGLE = reinterpret_cast<PFNGLBEGINQUERYEXTCONTEXTANGLEPROC>(
-        loadProc("glBeginQueryEXTContextANGLE"));
-    glDeleteQueriesEXTContextANGLE = reinterpret_cast<PFNGLDELETEQUERIESEXTCONTEXTANGLEPROC>(
-        loadProc("glDeleteQueriesEXTContextANGLE"));
-    glEndQueryEXTContextANGLE =
-        reinterpret_cast<PFNGLENDQUERYEXTCONTEXTANGLEPROC>(loadProc("glEndQueryEXTContextANGLE"));
-    glGenQueriesEXTContextANGLE = reinterpret_cast<PFNGLGENQUERIESEXTCONTEXTANGLEPROC>(
-        loadProc("glGenQueriesEXTContextANGLE"));
-    glGetQueryObjecti64vEXTContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTI64VEXTCONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjecti64vEXTContextANGLE"));
-    glGetQueryObjectivEXTContextANGLE = reinterpret_cast<PFNGLGETQUERYOBJECTIVEXTCONTEXTANGLEPROC>(
-        loadProc("glGetQueryObjectivEXTContextANGLE"));
-    glGetQueryObjectui64vEXTContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUI64VEXTCONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjectui64vEXTContextANGLE"));
-    glGetQueryObjectuivEXTContextANGLE =
-        reinterpret_cast<PFNGLGETQUERYOBJECTUIVEXTCONTEXTANGLEPROC>(
-            loadProc("glGetQueryObjectuivEXTContextANGLE"));
-    glGetQueryivEXTContextANGLE = reinterpret_cast<PFNGLGETQUERYIVEXTCONTEXTANGLEPROC>(
-        loadProc("glGetQueryivEXTContextANGLE"));
-    glIsQueryEXTContextANGLE =
-        reinterpret_cast<PFNGLISQUERYEXTCONTEXTANGLEPROC>(loadProc("glIsQueryEXTContextANGLE"));
-    glQueryCounterEXTContextANGLE = reinterpret_cast<PFNGLQUERYCOUNTEREXTCONTEXTANGLEPROC>(
-        loadProc("glQueryCounterEXTContextANGLE"));
-    glDrawBuffersEXTContextANGLE = reinterpret_cast<PFNGLDRAWBUFFERSEXTCONTEXTANGLEPROC>(
-        loadProc("glDrawBuffersEXTContextANGLE"));
-    glFramebufferTextureEXTContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTUREEXTCONTEXTANGLEPROC>(
-            loadProc("glFramebufferTextureEXTContextANGLE"));
-    glDrawArraysInstancedEXTContextANGLE =
-        reinterpret_cast<PFNGLDRAWARRAYSINSTANCEDEXTCONTEXTANGLEPROC>(
-            loadProc("glDrawArraysInstancedEXTContextANGLE"));
-    glDrawElementsInstancedEXTContextANGLE =
-        reinterpret_cast<PFNGLDRAWELEMENTSINSTANCEDEXTCONTEXTANGLEPROC>(
-            loadProc("glDrawElementsInstancedEXTContextANGLE"));
-    glVertexAttribDivisorEXTContextANGLE =
-        reinterpret_cast<PFNGLVERTEXATTRIBDIVISOREXTCONTEXTANGLEPROC>(
-            loadProc("glVertexAttribDivisorEXTContextANGLE"));
-    glFlushMappedBufferRangeEXTContextANGLE =
-        reinterpret_cast<PFNGLFLUSHMAPPEDBUFFERRANGEEXTCONTEXTANGLEPROC>(
-            loadProc("glFlushMappedBufferRangeEXTContextANGLE"));
-    glMapBufferRangeEXTContextANGLE = reinterpret_cast<PFNGLMAPBUFFERRANGEEXTCONTEXTANGLEPROC>(
-        loadProc("glMapBufferRangeEXTContextANGLE"));
-    glBufferStorageMemEXTContextANGLE = reinterpret_cast<PFNGLBUFFERSTORAGEMEMEXTCONTEXTANGLEPROC>(
-        loadProc("glBufferStorageMemEXTContextANGLE"));
-    glCreateMemoryObjectsEXTContextANGLE =
-        reinterpret_cast<PFNGLCREATEMEMORYOBJECTSEXTCONTEXTANGLEPROC>(
-            loadProc("glCreateMemoryObjectsEXTContextANGLE"));
-    glDeleteMemoryObjectsEXTContextANGLE =
-        reinterpret_cast<PFNGLDELETEMEMORYOBJECTSEXTCONTEXTANGLEPROC>(
-            loadProc("glDeleteMemoryObjectsEXTContextANGLE"));
-    glGetMemoryObjectParameterivEXTContextANGLE =
-        reinterpret_cast<PFNGLGETMEMORYOBJECTPARAMETERIVEXTCONTEXTANGLEPROC>(
-            loadProc("glGetMemoryObjectParameterivEXTContextANGLE"));
-    glGetUnsignedBytei_vEXTContextANGLE =
-        reinterpret_cast<PFNGLGETUNSIGNEDBYTEI_VEXTCONTEXTANGLEPROC>(
-            loadProc("glGetUnsignedBytei_vEXTContextANGLE"));
-    glGetUnsignedBytevEXTContextANGLE = reinterpret_cast<PFNGLGETUNSIGNEDBYTEVEXTCONTEXTANGLEPROC>(
-        loadProc("glGetUnsignedBytevEXTContextANGLE"));
-    glIsMemoryObjectEXTContextANGLE = reinterpret_cast<PFNGLISMEMORYOBJECTEXTCONTEXTANGLEPROC>(
-        loadProc("glIsMemoryObjectEXTContextANGLE"));
-    glMemoryObjectParameterivEXTContextANGLE =
-        reinterpret_cast<PFNGLMEMORYOBJECTPARAMETERIVEXTCONTEXTANGLEPROC>(
-            loadProc("glMemoryObjectParameterivEXTContextANGLE"));
-    glTexStorageMem2DEXTContextANGLE = reinterpret_cast<PFNGLTEXSTORAGEMEM2DEXTCONTEXTANGLEPROC>(
-        loadProc("glTexStorageMem2DEXTContextANGLE"));
-    glTexStorageMem2DMultisampleEXTContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGEMEM2DMULTISAMPLEEXTCONTEXTANGLEPROC>(
-            loadProc("glTexStorageMem2DMultisampleEXTContextANGLE"));
-    glTexStorageMem3DEXTContextANGLE = reinterpret_cast<PFNGLTEXSTORAGEMEM3DEXTCONTEXTANGLEPROC>(
-        loadProc("glTexStorageMem3DEXTContextANGLE"));
-    glTexStorageMem3DMultisampleEXTContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGEMEM3DMULTISAMPLEEXTCONTEXTANGLEPROC>(
-            loadProc("glTexStorageMem3DMultisampleEXTContextANGLE"));
-    glImportMemoryFdEXTContextANGLE = reinterpret_cast<PFNGLIMPORTMEMORYFDEXTCONTEXTANGLEPROC>(
-        loadProc("glImportMemoryFdEXTContextANGLE"));
-    glGetGraphicsResetStatusEXTContextANGLE =
-        reinterpret_cast<PFNGLGETGRAPHICSRESETSTATUSEXTCONTEXTANGLEPROC>(
-            loadProc("glGetGraphicsResetStatusEXTContextANGLE"));
-    glGetnUniformfvEXTContextANGLE = reinterpret_cast<PFNGLGETNUNIFORMFVEXTCONTEXTANGLEPROC>(
-        loadProc("glGetnUniformfvEXTContextANGLE"));
-    glGetnUniformivEXTContextANGLE = reinterpret_cast<PFNGLGETNUNIFORMIVEXTCONTEXTANGLEPROC>(
-        loadProc("glGetnUniformivEXTContextANGLE"));
-    glReadnPixelsEXTContextANGLE = reinterpret_cast<PFNGLREADNPIXELSEXTCONTEXTANGLEPROC>(
-        loadProc("glReadnPixelsEXTContextANGLE"));
-    glDeleteSemaphoresEXTContextANGLE = reinterpret_cast<PFNGLDELETESEMAPHORESEXTCONTEXTANGLEPROC>(
-        loadProc("glDeleteSemaphoresEXTContextANGLE"));
-    glGenSemaphoresEXTContextANGLE = reinterpret_cast<PFNGLGENSEMAPHORESEXTCONTEXTANGLEPROC>(
-        loadProc("glGenSemaphoresEXTContextANGLE"));
-    glGetSemaphoreParameterui64vEXTContextANGLE =
-        reinterpret_cast<PFNGLGETSEMAPHOREPARAMETERUI64VEXTCONTEXTANGLEPROC>(
-            loadProc("glGetSemaphoreParameterui64vEXTContextANGLE"));
-    glIsSemaphoreEXTContextANGLE = reinterpret_cast<PFNGLISSEMAPHOREEXTCONTEXTANGLEPROC>(
-        loadProc("glIsSemaphoreEXTContextANGLE"));
-    glSemaphoreParameterui64vEXTContextANGLE =
-        reinterpret_cast<PFNGLSEMAPHOREPARAMETERUI64VEXTCONTEXTANGLEPROC>(
-            loadProc("glSemaphoreParameterui64vEXTContextANGLE"));
-    glSignalSemaphoreEXTContextANGLE = reinterpret_cast<PFNGLSIGNALSEMAPHOREEXTCONTEXTANGLEPROC>(
-        loadProc("glSignalSemaphoreEXTContextANGLE"));
-    glWaitSemaphoreEXTContextANGLE = reinterpret_cast<PFNGLWAITSEMAPHOREEXTCONTEXTANGLEPROC>(
-        loadProc("glWaitSemaphoreEXTContextANGLE"));
-    glImportSemaphoreFdEXTContextANGLE =
-        reinterpret_cast<PFNGLIMPORTSEMAPHOREFDEXTCONTEXTANGLEPROC>(
-            loadProc("glImportSemaphoreFdEXTContextANGLE"));
-    glTexStorage1DEXTContextANGLE = reinterpret_cast<PFNGLTEXSTORAGE1DEXTCONTEXTANGLEPROC>(
-        loadProc("glTexStorage1DEXTContextANGLE"));
-    glTexStorage2DEXTContextANGLE = reinterpret_cast<PFNGLTEXSTORAGE2DEXTCONTEXTANGLEPROC>(
-        loadProc("glTexStorage2DEXTContextANGLE"));
-    glTexStorage3DEXTContextANGLE = reinterpret_cast<PFNGLTEXSTORAGE3DEXTCONTEXTANGLEPROC>(
-        loadProc("glTexStorage3DEXTContextANGLE"));
-    glDebugMessageCallbackKHRContextANGLE =
-        reinterpret_cast<PFNGLDEBUGMESSAGECALLBACKKHRCONTEXTANGLEPROC>(
-            loadProc("glDebugMessageCallbackKHRContextANGLE"));
-    glDebugMessageControlKHRContextANGLE =
-        reinterpret_cast<PFNGLDEBUGMESSAGECONTROLKHRCONTEXTANGLEPROC>(
-            loadProc("glDebugMessageControlKHRContextANGLE"));
-    glDebugMessageInsertKHRContextANGLE =
-        reinterpret_cast<PFNGLDEBUGMESSAGEINSERTKHRCONTEXTANGLEPROC>(
-            loadProc("glDebugMessageInsertKHRContextANGLE"));
-    glGetDebugMessageLogKHRContextANGLE =
-        reinterpret_cast<PFNGLGETDEBUGMESSAGELOGKHRCONTEXTANGLEPROC>(
-            loadProc("glGetDebugMessageLogKHRContextANGLE"));
-    glGetObjectLabelKHRContextANGLE = reinterpret_cast<PFNGLGETOBJECTLABELKHRCONTEXTANGLEPROC>(
-        loadProc("glGetObjectLabelKHRContextANGLE"));
-    glGetObjectPtrLabelKHRContextANGLE =
-        reinterpret_cast<PFNGLGETOBJECTPTRLABELKHRCONTEXTANGLEPROC>(
-            loadProc("glGetObjectPtrLabelKHRContextANGLE"));
-    glGetPointervKHRContextANGLE = reinterpret_cast<PFNGLGETPOINTERVKHRCONTEXTANGLEPROC>(
-        loadProc("glGetPointervKHRContextANGLE"));
-    glObjectLabelKHRContextANGLE = reinterpret_cast<PFNGLOBJECTLABELKHRCONTEXTANGLEPROC>(
-        loadProc("glObjectLabelKHRContextANGLE"));
-    glObjectPtrLabelKHRContextANGLE = reinterpret_cast<PFNGLOBJECTPTRLABELKHRCONTEXTANGLEPROC>(
-        loadProc("glObjectPtrLabelKHRContextANGLE"));
-    glPopDebugGroupKHRContextANGLE = reinterpret_cast<PFNGLPOPDEBUGGROUPKHRCONTEXTANGLEPROC>(
-        loadProc("glPopDebugGroupKHRContextANGLE"));
-    glPushDebugGroupKHRContextANGLE = reinterpret_cast<PFNGLPUSHDEBUGGROUPKHRCONTEXTANGLEPROC>(
-        loadProc("glPushDebugGroupKHRContextANGLE"));
-    glMaxShaderCompilerThreadsKHRContextANGLE =
-        reinterpret_cast<PFNGLMAXSHADERCOMPILERTHREADSKHRCONTEXTANGLEPROC>(
-            loadProc("glMaxShaderCompilerThreadsKHRContextANGLE"));
-    glDeleteFencesNVContextANGLE = reinterpret_cast<PFNGLDELETEFENCESNVCONTEXTANGLEPROC>(
-        loadProc("glDeleteFencesNVContextANGLE"));
-    glFinishFenceNVContextANGLE = reinterpret_cast<PFNGLFINISHFENCENVCONTEXTANGLEPROC>(
-        loadProc("glFinishFenceNVContextANGLE"));
-    glGenFencesNVContextANGLE =
-        reinterpret_cast<PFNGLGENFENCESNVCONTEXTANGLEPROC>(loadProc("glGenFencesNVContextANGLE"));
-    glGetFenceivNVContextANGLE =
-        reinterpret_cast<PFNGLGETFENCEIVNVCONTEXTANGLEPROC>(loadProc("glGetFenceivNVContextANGLE"));
-    glIsFenceNVContextANGLE =
-        reinterpret_cast<PFNGLISFENCENVCONTEXTANGLEPROC>(loadProc("glIsFenceNVContextANGLE"));
-    glSetFenceNVContextANGLE =
-        reinterpret_cast<PFNGLSETFENCENVCONTEXTANGLEPROC>(loadProc("glSetFenceNVContextANGLE"));
-    glTestFenceNVContextANGLE =
-        reinterpret_cast<PFNGLTESTFENCENVCONTEXTANGLEPROC>(loadProc("glTestFenceNVContextANGLE"));
-    glEGLImageTargetRenderbufferStorageOESContextANGLE =
-        reinterpret_cast<PFNGLEGLIMAGETARGETRENDERBUFFERSTORAGEOESCONTEXTANGLEPROC>(
-            loadProc("glEGLImageTargetRenderbufferStorageOESContextANGLE"));
-    glEGLImageTargetTexture2DOESContextANGLE =
-        reinterpret_cast<PFNGLEGLIMAGETARGETTEXTURE2DOESCONTEXTANGLEPROC>(
-            loadProc("glEGLImageTargetTexture2DOESContextANGLE"));
-    glGetProgramBinaryOESContextANGLE = reinterpret_cast<PFNGLGETPROGRAMBINARYOESCONTEXTANGLEPROC>(
-        loadProc("glGetProgramBinaryOESContextANGLE"));
-    glProgramBinaryOESContextANGLE = reinterpret_cast<PFNGLPROGRAMBINARYOESCONTEXTANGLEPROC>(
-        loadProc("glProgramBinaryOESContextANGLE"));
-    glGetBufferPointervOESContextANGLE =
-        reinterpret_cast<PFNGLGETBUFFERPOINTERVOESCONTEXTANGLEPROC>(
-            loadProc("glGetBufferPointervOESContextANGLE"));
-    glMapBufferOESContextANGLE =
-        reinterpret_cast<PFNGLMAPBUFFEROESCONTEXTANGLEPROC>(loadProc("glMapBufferOESContextANGLE"));
-    glUnmapBufferOESContextANGLE = reinterpret_cast<PFNGLUNMAPBUFFEROESCONTEXTANGLEPROC>(
-        loadProc("glUnmapBufferOESContextANGLE"));
-    glGetSamplerParameterIivOESContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIIVOESCONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterIivOESContextANGLE"));
-    glGetSamplerParameterIuivOESContextANGLE =
-        reinterpret_cast<PFNGLGETSAMPLERPARAMETERIUIVOESCONTEXTANGLEPROC>(
-            loadProc("glGetSamplerParameterIuivOESContextANGLE"));
-    glGetTexParameterIivOESContextANGLE =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIIVOESCONTEXTANGLEPROC>(
-            loadProc("glGetTexParameterIivOESContextANGLE"));
-    glGetTexParameterIuivOESContextANGLE =
-        reinterpret_cast<PFNGLGETTEXPARAMETERIUIVOESCONTEXTANGLEPROC>(
-            loadProc("glGetTexParameterIuivOESContextANGLE"));
-    glSamplerParameterIivOESContextANGLE =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIIVOESCONTEXTANGLEPROC>(
-            loadProc("glSamplerParameterIivOESContextANGLE"));
-    glSamplerParameterIuivOESContextANGLE =
-        reinterpret_cast<PFNGLSAMPLERPARAMETERIUIVOESCONTEXTANGLEPROC>(
-            loadProc("glSamplerParameterIuivOESContextANGLE"));
-    glTexParameterIivOESContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERIIVOESCONTEXTANGLEPROC>(
-        loadProc("glTexParameterIivOESContextANGLE"));
-    glTexParameterIuivOESContextANGLE = reinterpret_cast<PFNGLTEXPARAMETERIUIVOESCONTEXTANGLEPROC>(
-        loadProc("glTexParameterIuivOESContextANGLE"));
-    glTexStorage3DMultisampleOESContextANGLE =
-        reinterpret_cast<PFNGLTEXSTORAGE3DMULTISAMPLEOESCONTEXTANGLEPROC>(
-            loadProc("glTexStorage3DMultisampleOESContextANGLE"));
-    glBindVertexArrayOESContextANGLE = reinterpret_cast<PFNGLBINDVERTEXARRAYOESCONTEXTANGLEPROC>(
-        loadProc("glBindVertexArrayOESContextANGLE"));
-    glDeleteVertexArraysOESContextANGLE =
-        reinterpret_cast<PFNGLDELETEVERTEXARRAYSOESCONTEXTANGLEPROC>(
-            loadProc("glDeleteVertexArraysOESContextANGLE"));
-    glGenVertexArraysOESContextANGLE = reinterpret_cast<PFNGLGENVERTEXARRAYSOESCONTEXTANGLEPROC>(
-        loadProc("glGenVertexArraysOESContextANGLE"));
-    glIsVertexArrayOESContextANGLE = reinterpret_cast<PFNGLISVERTEXARRAYOESCONTEXTANGLEPROC>(
-        loadProc("glIsVertexArrayOESContextANGLE"));
-    glFramebufferTextureMultiviewOVRContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTUREMULTIVIEWOVRCONTEXTANGLEPROC>(
-            loadProc("glFramebufferTextureMultiviewOVRContextANGLE"));
-    glDrawTexfOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXFOESCONTEXTANGLEPROC>(loadProc("glDrawTexfOESContextANGLE"));
-    glDrawTexfvOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXFVOESCONTEXTANGLEPROC>(loadProc("glDrawTexfvOESContextANGLE"));
-    glDrawTexiOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXIOESCONTEXTANGLEPROC>(loadProc("glDrawTexiOESContextANGLE"));
-    glDrawTexivOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXIVOESCONTEXTANGLEPROC>(loadProc("glDrawTexivOESContextANGLE"));
-    glDrawTexsOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXSOESCONTEXTANGLEPROC>(loadProc("glDrawTexsOESContextANGLE"));
-    glDrawTexsvOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXSVOESCONTEXTANGLEPROC>(loadProc("glDrawTexsvOESContextANGLE"));
-    glDrawTexxOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXXOESCONTEXTANGLEPROC>(loadProc("glDrawTexxOESContextANGLE"));
-    glDrawTexxvOESContextANGLE =
-        reinterpret_cast<PFNGLDRAWTEXXVOESCONTEXTANGLEPROC>(loadProc("glDrawTexxvOESContextANGLE"));
-    glBindFramebufferOESContextANGLE = reinterpret_cast<PFNGLBINDFRAMEBUFFEROESCONTEXTANGLEPROC>(
-        loadProc("glBindFramebufferOESContextANGLE"));
-    glBindRenderbufferOESContextANGLE = reinterpret_cast<PFNGLBINDRENDERBUFFEROESCONTEXTANGLEPROC>(
-        loadProc("glBindRenderbufferOESContextANGLE"));
-    glCheckFramebufferStatusOESContextANGLE =
-        reinterpret_cast<PFNGLCHECKFRAMEBUFFERSTATUSOESCONTEXTANGLEPROC>(
-            loadProc("glCheckFramebufferStatusOESContextANGLE"));
-    glDeleteFramebuffersOESContextANGLE =
-        reinterpret_cast<PFNGLDELETEFRAMEBUFFERSOESCONTEXTANGLEPROC>(
-            loadProc("glDeleteFramebuffersOESContextANGLE"));
-    glDeleteRenderbuffersOESContextANGLE =
-        reinterpret_cast<PFNGLDELETERENDERBUFFERSOESCONTEXTANGLEPROC>(
-            loadProc("glDeleteRenderbuffersOESContextANGLE"));
-    glFramebufferRenderbufferOESContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERRENDERBUFFEROESCONTEXTANGLEPROC>(
-            loadProc("glFramebufferRenderbufferOESContextANGLE"));
-    glFramebufferTexture2DOESContextANGLE =
-        reinterpret_cast<PFNGLFRAMEBUFFERTEXTURE2DOESCONTEXTANGLEPROC>(
-            loadProc("glFramebufferTexture2DOESContextANGLE"));
-    glGenFramebuffersOESContextANGLE = reinterpret_cast<PFNGLGENFRAMEBUFFERSOESCONTEXTANGLEPROC>(
-        loadProc("glGenFramebuffersOESContextANGLE"));
-    glGenRenderbuffersOESContextANGLE = reinterpret_cast<PFNGLGENRENDERBUFFERSOESCONTEXTANGLEPROC>(
-        loadProc("glGenRenderbuffersOESContextANGLE"));
-    glGenerateMipmapOESContextANGLE = reinterpret_cast<PFNGLGENERATEMIPMAPOESCONTEXTANGLEPROC>(
-        loadProc("glGenerateMipmapOESContextANGLE"));
-    glGetFramebufferAttachmentParameterivOESContextANGLE =
-        reinterpret_cast<PFNGLGETFRAMEBUFFERATTACHMENTPARAMETERIVOESCONTEXTANGLEPROC>(
-            loadProc("glGetFramebufferAttachmentParameterivOESContextANGLE"));
-    glGetRenderbufferParameterivOESContextANGLE =
-        reinterpret_cast<PFNGLGETRENDERBUFFERPARAMETERIVOESCONTEXTANGLEPROC>(
-            loadProc("glGetRenderbufferParameterivOESContextANGLE"));
-    glIsFramebufferOESContextANGLE = reinterpret_cast<PFNGLISFRAMEBUFFEROESCONTEXTANGLEPROC>(
-        loadProc("glIsFramebufferOESContextANGLE"));
-    glIsRenderbufferOESContextANGLE = reinterpret_cast<PFNGLISRENDERBUFFEROESCONTEXTANGLEPROC>(
-        loadProc("glIsRenderbufferOESContextANGLE"));
-    glRenderbufferStorageOESContextANGLE =
-        reinterpret_cast<PFNGLRENDERBUFFERSTORAGEOESCONTEXTANGLEPROC>(
-            loadProc("glRenderbufferStorageOESContextANGLE"));
-    glCurrentPaletteMatrixOESContextANGLE =
-        reinterpret_cast<PFNGLCURRENTPALETTEMATRIXOESCONTEXTANGLEPROC>(
-            loadProc("glCurrentPaletteMatrixOESContextANGLE"));
-    glLoadPaletteFromModelViewMatrixOESContextANGLE =
-        reinterpret_cast<PFNGLLOADPALETTEFROMMODELVIEWMATRIXOESCONTEXTANGLEPROC>(
-            loadProc("glLoadPaletteFromModelViewMatrixOESContextANGLE"));
-    glMatrixIndexPointerOESContextANGLE =
-        reinterpret_cast<PFNGLMATRIXINDEXPOINTEROESCONTEXTANGLEPROC>(
-            loadProc("glMatrixIndexPointerOESContextANGLE"));
-    glWeightPointerOESContextANGLE = reinterpret_cast<PFNGLWEIGHTPOINTEROESCONTEXTANGLEPROC>(
-        loadProc("glWeightPointerOESContextANGLE"));
-    glPointSizePointerOESContextANGLE = reinterpret_cast<PFNGLPOINTSIZEPOINTEROESCONTEXTANGLEPROC>(
-        loadProc("glPointSizePointerOESContextANGLE"));
-    glQueryMatrixxOESContextANGLE = reinterpret_cast<PFNGLQUERYMATRIXXOESCONTEXTANGLEPROC>(
-        loadProc("glQueryMatrixxOESContextANGLE"));
-    glGetTexGenfvOESContextANGLE = reinterpret_cast<PFNGLGETTEXGENFVOESCONTEXTANGLEPROC>(
-        loadProc("glGetTexGenfvOESContextANGLE"));
-    glGetTexGenivOESContextANGLE = reinterpret_cast<PFNGLGETTEXGENIVOESCONTEXTANGLEPROC>(
-        loadProc("glGetTexGenivOESContextANGLE"));
-    glGetTexGenxvOESContextANGLE = reinterpret_cast<PFNGLGETTEXGENXVOESCONTEXTANGLEPROC>(
-        loadProc("glGetTexGenxvOESContextANGLE"));
-    glTexGenfOESContextANGLE =
-        reinterpret_cast<PFNGLTEXGENFOESCONTEXTANGLEPROC>(loadProc("glTexGenfOESContextANGLE"));
-    glTexGenfvOESContextANGLE =
-        reinterpret_cast<PFNGLTEXGENFVOESCONTEXTANGLEPROC>(loadProc("glTexGenfvOESContextANGLE"));
-    glTexGeniOESContextANGLE =
-        reinterpret_cast<PFNGLTEXGENIOESCONTEXTANGLEPROC>(loadProc("glTexGeniOESContextANGLE"));
-    glTexGenivOESContextANGLE =
-        reinterpret_cast<PFNGLTEXGENIVOESCONTEXTANGLEPROC>(loadProc("glTexGenivOESContextANGLE"));
-    glTexGenxOESContextANGLE =
-        reinterpret_cast<PFNGLTEXGENXOESCONTEXTANGLEPROC>(loadProc("glTexGenxOESContextANGLE"));
-    glTexGenxvOESContextANGLE =
-        reinterpret_cast<PFNGLTEXGENXVOESCONTEXTANGLEPROC>(loadProc("glTexGenxvOESContextANGLE"));
+    for (size_t index = 0; index < kProcCount; ++index)
+    {
+        *kProcs[index] = loadProc(kProcNames[index]);
+    }
+}
+
+void LoadGLESLazy(LoadProc loadProc)
+{
+    // loadProc may load from another library than the last time.
+    for (std::atomic<GenericProc> &slot : gLazyProcSlots)
+    {
+        slot.store(nullptr, std::memory_order_relaxed);
+    }
+
+    gLazyLoadProc = loadProc;
+    for (size_t index = 0; index < kProcCount; ++index)
+    {
+        *kProcs[index] = kLazyProcs[index] ? kLazyProcs[index] : loadProc(kProcNames[index]);
+    }
 }
 }  // namespace angle
@@ -419,6 +419,7 @@ ANGLE_UTIL_EXPORT extern PFNGLVERTEXATTRIBFORMATPROC glVertexAttribFormat;
 ANGLE_UTIL_EXPORT extern PFNGLVERTEXATTRIBIFORMATPROC glVertexAttribIFormat;
 ANGLE_UTIL_EXPORT extern PFNGLVERTEXATTRIBBINDINGPROC glVertexAttribBinding;
 ANGLE_UTIL_EXPORT extern PFNGLVERTEXBINDINGDIVISORPROC glVertexBindingDivisor;
+ANGLE_UTIL_EXPORT extern PFNGLBATCHCOMMANDSANGLEPROC glBatchCommandsANGLE;
 ANGLE_UTIL_EXPORT extern PFNGLCOPYSUBTEXTURE3DANGLEPROC glCopySubTexture3DANGLE;
 ANGLE_UTIL_EXPORT extern PFNGLCOPYTEXTURE3DANGLEPROC glCopyTexture3DANGLE;
 ANGLE_UTIL_EXPORT extern PFNGLBLITFRAMEBUFFERANGLEPROC glBlitFramebufferANGLE;
@@ -1161,6 +1162,7 @@ ANGLE_UTIL_EXPORT extern PFNGLVERTEXATTRIBIFORMATCONTEXTANGLEPROC glVertexAttrib
 ANGLE_UTIL_EXPORT extern PFNGLVERTEXATTRIBBINDINGCONTEXTANGLEPROC glVertexAttribBindingContextANGLE;
 ANGLE_UTIL_EXPORT extern PFNGLVERTEXBINDINGDIVISORCONTEXTANGLEPROC
     glVertexBindingDivisorContextANGLE;
+ANGLE_UTIL_EXPORT extern PFNGLBATCHCOMMANDSANGLECONTEXTANGLEPROC glBatchCommandsANGLEContextANGLE;
 ANGLE_UTIL_EXPORT extern PFNGLCOPYSUBTEXTURE3DANGLECONTEXTANGLEPROC
     glCopySubTexture3DANGLEContextANGLE;
 ANGLE_UTIL_EXPORT extern PFNGLCOPYTEXTURE3DANGLECONTEXTANGLEPROC glCopyTexture3DANGLEContextANGLE;
@@ -1572,6 +1574,10 @@ namespace angle
 using GenericProc = void (*)();
 using LoadProc    = GenericProc(KHRONOS_APIENTRY *)(const char *);
 ANGLE_UTIL_EXPORT void LoadGLES(LoadProc loadProc);
+
+// Makes each core function load itself with loadProc on its first call instead. Extension functions
+// are loaded right away, so that they are null when loadProc doesn't find them.
+ANGLE_UTIL_EXPORT void LoadGLESLazy(LoadProc loadProc);
 }  // namespace angle
 
 #endif  // UTIL_GLES_LOADER_AUTOGEN_H_
@@ -71,8 +71,21 @@ bool StabilizeCPUForBenchmarking()
         success = false;
     }
 #if ANGLE_PLATFORM_LINUX
+    // Use the first CPU the process is allowed to run on, so that processes started pinned to
+    // different CPUs, as by perf_test_runner.py --sweep, keep running in parallel.
+    cpu_set_t allowed;
+    int cpu = 0;
+    if (sched_getaffinity(getpid(), sizeof(allowed), &allowed) == 0)
+    {
+        while (cpu < CPU_SETSIZE - 1 && !CPU_ISSET(cpu, &allowed))
+        {
+            ++cpu;
+        }
+    }
+
     cpu_set_t affinity;
-    CPU_SET(0, &affinity);
+    CPU_ZERO(&affinity);
+    CPU_SET(cpu, &affinity);
     errno = 0;
     if (sched_setaffinity(getpid(), sizeof(affinity), &affinity))
     {
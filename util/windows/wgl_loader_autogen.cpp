@@ -10,6 +10,8 @@
 
 #include "wgl_loader_autogen.h"
 
+#include <stddef.h>
+
 PFNCHOOSEPIXELFORMATPROC _ChoosePixelFormat;
 PFNDESCRIBEPIXELFORMATPROC _DescribePixelFormat;
 PFNGETENHMETAFILEPIXELFORMATPROC _GetEnhMetaFilePixelFormat;
@@ -43,55 +45,82 @@ PFNWGLSWAPINTERVALEXTPROC _wglSwapIntervalEXT;
 
 namespace angle
 {
+namespace
+{
+constexpr size_t kProcCount = 30;
+
+constexpr const char *kProcNames[kProcCount] = {
+    "ChoosePixelFormat",
+    "DescribePixelFormat",
+    "GetEnhMetaFilePixelFormat",
+    "GetPixelFormat",
+    "SetPixelFormat",
+    "SwapBuffers",
+    "wglCopyContext",
+    "wglCreateContext",
+    "wglCreateLayerContext",
+    "wglDeleteContext",
+    "wglDescribeLayerPlane",
+    "wglGetCurrentContext",
+    "wglGetCurrentDC",
+    "wglGetLayerPaletteEntries",
+    "wglGetProcAddress",
+    "wglMakeCurrent",
+    "wglRealizeLayerPalette",
+    "wglSetLayerPaletteEntries",
+    "wglShareLists",
+    "wglSwapLayerBuffers",
+    "wglUseFontBitmaps",
+    "wglUseFontBitmapsA",
+    "wglUseFontBitmapsW",
+    "wglUseFontOutlines",
+    "wglUseFontOutlinesA",
+    "wglUseFontOutlinesW",
+    "wglCreateContextAttribsARB",
+    "wglGetExtensionsStringARB",
+    "wglGetSwapIntervalEXT",
+    "wglSwapIntervalEXT",
+};
+
+GenericProc *const kProcs[kProcCount] = {
+    reinterpret_cast<GenericProc *>(&_ChoosePixelFormat),
+    reinterpret_cast<GenericProc *>(&_DescribePixelFormat),
+    reinterpret_cast<GenericProc *>(&_GetEnhMetaFilePixelFormat),
+    reinterpret_cast<GenericProc *>(&_GetPixelFormat),
+    reinterpret_cast<GenericProc *>(&_SetPixelFormat),
+    reinterpret_cast<GenericProc *>(&_SwapBuffers),
+    reinterpret_cast<GenericProc *>(&_wglCopyContext),
+    reinterpret_cast<GenericProc *>(&_wglCreateContext),
+    reinterpret_cast<GenericProc *>(&_wglCreateLayerContext),
+    reinterpret_cast<GenericProc *>(&_wglDeleteContext),
+    reinterpret_cast<GenericProc *>(&_wglDescribeLayerPlane),
+    reinterpret_cast<GenericProc *>(&_wglGetCurrentContext),
+    reinterpret_cast<GenericProc *>(&_wglGetCurrentDC),
+    reinterpret_cast<GenericProc *>(&_wglGetLayerPaletteEntries),
+    reinterpret_cast<GenericProc *>(&_wglGetProcAddress),
+    reinterpret_cast<GenericProc *>(&_wglMakeCurrent),
+    reinterpret_cast<GenericProc *>(&_wglRealizeLayerPalette),
+    reinterpret_cast<GenericProc *>(&_wglSetLayerPaletteEntries),
+    reinterpret_cast<GenericProc *>(&_wglShareLists),
+    reinterpret_cast<GenericProc *>(&_wglSwapLayerBuffers),
+    reinterpret_cast<GenericProc *>(&_wglUseFontBitmaps),
+    reinterpret_cast<GenericProc *>(&_wglUseFontBitmapsA),
+    reinterpret_cast<GenericProc *>(&_wglUseFontBitmapsW),
+    reinterpret_cast<GenericProc *>(&_wglUseFontOutlines),
+    reinterpret_cast<GenericProc *>(&_wglUseFontOutlinesA),
+    reinterpret_cast<GenericProc *>(&_wglUseFontOutlinesW),
+    reinterpret_cast<GenericProc *>(&_wglCreateContextAttribsARB),
+    reinterpret_cast<GenericProc *>(&_wglGetExtensionsStringARB),
+    reinterpret_cast<GenericProc *>(&_wglGetSwapIntervalEXT),
+    reinterpret_cast<GenericProc *>(&_wglSwapIntervalEXT),
+};
+}  // anonymous namespace
+
 void LoadWGL(LoadProc loadProc)
 {
-    _ChoosePixelFormat = reinterpret_cast<PFNCHOOSEPIXELFORMATPROC>(loadProc("ChoosePixelFormat"));
-    _DescribePixelFormat =
-        reinterpret_cast<PFNDESCRIBEPIXELFORMATPROC>(loadProc("DescribePixelFormat"));
-    _GetEnhMetaFilePixelFormat =
-        reinterpret_cast<PFNGETENHMETAFILEPIXELFORMATPROC>(loadProc("GetEnhMetaFilePixelFormat"));
-    _GetPixelFormat   = reinterpret_cast<PFNGETPIXELFORMATPROC>(loadProc("GetPixelFormat"));
-    _SetPixelFormat   = reinterpret_cast<PFNSETPIXELFORMATPROC>(loadProc("SetPixelFormat"));
-    _SwapBuffers      = reinterpret_cast<PFNSWAPBUFFERSPROC>(loadProc("SwapBuffers"));
-    _wglCopyContext   = reinterpret_cast<PFNWGLCOPYCONTEXTPROC>(loadProc("wglCopyContext"));
-    _wglCreateContext = reinterpret_cast<PFNWGLCREATECONTEXTPROC>(loadProc("wglCreateContext"));
-    _wglCreateLayerContext =
-        reinterpret_cast<PFNWGLCREATELAYERCONTEXTPROC>(loadProc("wglCreateLayerContext"));
-    _wglDeleteContext = reinterpret_cast<PFNWGLDELETECONTEXTPROC>(loadProc("wglDeleteContext"));
-    _wglDescribeLayerPlane =
-        reinterpret_cast<PFNWGLDESCRIBELAYERPLANEPROC>(loadProc("wglDescribeLayerPlane"));
-    _wglGetCurrentContext =
-        reinterpret_cast<PFNWGLGETCURRENTCONTEXTPROC>(loadProc("wglGetCurrentContext"));
-    _wglGetCurrentDC = reinterpret_cast<PFNWGLGETCURRENTDCPROC>(loadProc("wglGetCurrentDC"));
-    _wglGetLayerPaletteEntries =
-        reinterpret_cast<PFNWGLGETLAYERPALETTEENTRIESPROC>(loadProc("wglGetLayerPaletteEntries"));
-    _wglGetProcAddress = reinterpret_cast<PFNWGLGETPROCADDRESSPROC>(loadProc("wglGetProcAddress"));
-    _wglMakeCurrent    = reinterpret_cast<PFNWGLMAKECURRENTPROC>(loadProc("wglMakeCurrent"));
-    _wglRealizeLayerPalette =
-        reinterpret_cast<PFNWGLREALIZELAYERPALETTEPROC>(loadProc("wglRealizeLayerPalette"));
-    _wglSetLayerPaletteEntries =
-        reinterpret_cast<PFNWGLSETLAYERPALETTEENTRIESPROC>(loadProc("wglSetLayerPaletteEntries"));
-    _wglShareLists = reinterpret_cast<PFNWGLSHARELISTSPROC>(loadProc("wglShareLists"));
-    _wglSwapLayerBuffers =
-        reinterpret_cast<PFNWGLSWAPLAYERBUFFERSPROC>(loadProc("wglSwapLayerBuffers"));
-    _wglUseFontBitmaps = reinterpret_cast<PFNWGLUSEFONTBITMAPSPROC>(loadProc("wglUseFontBitmaps"));
-    _wglUseFontBitmapsA =
-        reinterpret_cast<PFNWGLUSEFONTBITMAPSAPROC>(loadProc("wglUseFontBitmapsA"));
-    _wglUseFontBitmapsW =
-        reinterpret_cast<PFNWGLUSEFONTBITMAPSWPROC>(loadProc("wglUseFontBitmapsW"));
-    _wglUseFontOutlines =
-        reinterpret_cast<PFNWGLUSEFONTOUTLINESPROC>(loadProc("wglUseFontOutlines"));
-    _wglUseFontOutlinesA =
-        reinterpret_cast<PFNWGLUSEFONTOUTLINESAPROC>(loadProc("wglUseFontOutlinesA"));
-    _wglUseFontOutlinesW =
-        reinterpret_cast<PFNWGLUSEFONTOUTLINESWPROC>(loadProc("wglUseFontOutlinesW"));
-    _wglCreateContextAttribsARB =
-        reinterpret_cast<PFNWGLCREATECONTEXTATTRIBSARBPROC>(loadProc("wglCreateContextAttribsARB"));
-    _wglGetExtensionsStringARB =
-        reinterpret_cast<PFNWGLGETEXTENSIONSSTRINGARBPROC>(loadProc("wglGetExtensionsStringARB"));
-    _wglGetSwapIntervalEXT =
-        reinterpret_cast<PFNWGLGETSWAPINTERVALEXTPROC>(loadProc("wglGetSwapIntervalEXT"));
-    _wglSwapIntervalEXT =
-        reinterpret_cast<PFNWGLSWAPINTERVALEXTPROC>(loadProc("wglSwapIntervalEXT"));
+    for (size_t index = 0; index < kProcCount; ++index)
+    {
+        *kProcs[index] = loadProc(kProcNames[index]);
+    }
 }
 }  // namespace angle